@@ -0,0 +1,181 @@
+import asyncio
+import concurrent.futures
+import threading
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Set
+
+from organizer import DEFAULT_SETTLE_SECONDS, DEFAULT_WORKERS, MoveRecord, Organizer
+
+
+# Move records buffered for events() before workers wait for a consumer.
+DEFAULT_EVENT_QUEUE = 1000
+
+# Pushed to the queue when the organizer stops
+_CLOSED = object()
+
+
+class AsyncOrganizer:
+    """Runs an Organizer inside an asyncio application.
+
+    Every root shares the organizer's readiness tracker and worker pool;
+    moves run on those threads, never on the loop. Blocking calls
+    (scheduling watches, shutdown) go to the loop's default executor.
+    Every move is put on a bounded queue that ``events()`` reads. When the
+    queue is full the oldest record is dropped and counted in the
+    ``watcher_events_dropped`` gauge, so moves never wait for a consumer.
+    With ``block_when_full=True`` the worker that finished the move waits
+    for room instead, which holds back new moves until events() catches
+    up; only use it if events() is read for as long as the organizer runs.
+    Moves are queued from start(), so none are missed before iteration
+    begins; pass ``queue_size=0`` if nothing will read events().
+
+        async with AsyncOrganizer() as organizer:
+            await organizer.watch(Path("~/Downloads").expanduser())
+            async for record in organizer.events():
+                print(record.src, "->", record.dest)
+    """
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, settle: float = DEFAULT_SETTLE_SECONDS, sniff: bool = False, queue_size: int = DEFAULT_EVENT_QUEUE, block_when_full: bool = False) -> None:
+        self.workers = workers
+        self.settle = settle
+        self.sniff = sniff
+        self.queue_size = queue_size
+        self.block_when_full = block_when_full
+        # Records dropped from a full queue; only the loop thread changes it
+        self.dropped = 0
+        self.organizer: Optional[Organizer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional["asyncio.Queue[object]"] = None
+        # Deliveries waiting for room in the queue; cancelled on stop
+        self._waiting: Set[concurrent.futures.Future] = set()
+        self._lock = threading.Lock()
+        self._closing = False
+        self._stopped = False
+
+    async def __aenter__(self) -> "AsyncOrganizer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        """Start the engine threads; roots are added with watch()."""
+        if self.organizer is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._closing = False
+        self._stopped = False
+        self.organizer = Organizer(self.workers, self.settle, self.sniff)
+        self.organizer.metrics.gauge("watcher_events_dropped", "Move records dropped because events() fell behind.", lambda: self.dropped)
+        if self.queue_size > 0:
+            self._queue = asyncio.Queue(self.queue_size)
+            self.organizer.add_listener(self._publish)
+
+    def _engine(self) -> Organizer:
+        if self.organizer is None:
+            raise RuntimeError("AsyncOrganizer is not started")
+        return self.organizer
+
+    async def watch(self, path: Path, rules: Optional[Dict[str, List[str]]] = None, move_unknown_to: str = "Other", quiet: bool = True, sweep: bool = False, **scope) -> None:
+        """Add a root (or update its settings); takes the same options as Organizer.watch."""
+        organizer = self._engine()
+        await self._loop.run_in_executor(None, lambda: organizer.watch(path, rules, move_unknown_to, quiet, sweep, None, **scope))
+
+    async def unwatch(self, path: Path) -> bool:
+        organizer = self._engine()
+        return await self._loop.run_in_executor(None, organizer.unwatch, path)
+
+    async def apply_settings(self, settings: Dict) -> None:
+        """Bring roots and rules in line with a settings.json-style dict."""
+        organizer = self._engine()
+        await self._loop.run_in_executor(None, organizer.apply_settings, settings)
+
+    def stats(self) -> Dict:
+        """Snapshot of the engine metrics; cheap enough to call on the loop."""
+        return self._engine().metrics.snapshot()
+
+    async def events(self) -> AsyncIterator[MoveRecord]:
+        """Yield a MoveRecord for every move (or failure) until stop()."""
+        queue = self._queue
+        if queue is None:
+            raise RuntimeError("AsyncOrganizer is not started or was created with queue_size=0")
+        while not (self._stopped and queue.empty()):
+            record = await queue.get()
+            if record is _CLOSED:
+                # Leave it for any other consumer
+                queue.put_nowait(_CLOSED)
+                return
+            yield record
+
+    def _publish(self, record: MoveRecord) -> None:
+        # Worker thread: hand the record to the loop and wait until the queue took it
+        loop, queue = self._loop, self._queue
+        try:
+            if not self.block_when_full:
+                # Never wait: the move is done whether or not anyone reads it
+                loop.call_soon_threadsafe(self._put_latest, queue, record)
+                return
+            if self._closing:
+                loop.call_soon_threadsafe(self._put_nowait, queue, record)
+                return
+            future = asyncio.run_coroutine_threadsafe(queue.put(record), loop)
+        except RuntimeError:
+            # Loop already closed
+            return
+        with self._lock:
+            if self._closing:
+                # stop() already cancelled the others
+                future.cancel()
+            self._waiting.add(future)
+        try:
+            future.result()
+        except (concurrent.futures.CancelledError, RuntimeError):
+            pass
+        finally:
+            with self._lock:
+                self._waiting.discard(future)
+
+    def _put_latest(self, queue: "asyncio.Queue[object]", record: object) -> None:
+        # Loop thread: make room by dropping the oldest record
+        if queue.full():
+            try:
+                queue.get_nowait()
+                self.dropped += 1
+            except asyncio.QueueEmpty:
+                pass
+        queue.put_nowait(record)
+
+    @staticmethod
+    def _put_nowait(queue: "asyncio.Queue[object]", record: object) -> None:
+        try:
+            queue.put_nowait(record)
+        except asyncio.QueueFull:
+            pass
+
+    async def stop(self) -> None:
+        """Stop watching, let queued moves finish, then end every events() iterator.
+
+        Moves that finish after stop() is called are delivered only if the
+        queue has room; nothing waits on a consumer any more.
+        """
+        organizer = self.organizer
+        if organizer is None:
+            return
+        with self._lock:
+            self._closing = True
+            waiting = list(self._waiting)
+        for future in waiting:
+            future.cancel()
+
+        def shutdown() -> None:
+            organizer.stop()
+            organizer.join(timeout=10)
+
+        await self._loop.run_in_executor(None, shutdown)
+        organizer.remove_listener(self._publish)
+        self.organizer = None
+        self._stopped = True
+        if self._queue is not None:
+            # A full queue has no waiting reader; events() sees _stopped once it is drained
+            self._put_nowait(self._queue, _CLOSED)
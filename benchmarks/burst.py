@@ -0,0 +1,271 @@
+"""Burst ingestion throughput and latency of the real watcher pipeline.
+
+Writes a burst of files into temporary folders from a separate process while
+start_watchers() organizes them, then reports files/s, write-to-move latency
+percentiles, CPU time and peak RSS of the watcher process:
+
+    python benchmarks/burst.py --files 5000 --writers 4 --json burst.json
+    python benchmarks/burst.py --files 5000 --compare burst.json
+
+Each run happens in a fresh interpreter so RSS and caches do not carry over.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+
+CHUNK = 64 * 1024
+UNITS = {"": 1, "b": 1, "k": 1024, "m": 1024 ** 2, "g": 1024 ** 3}
+
+
+def parse_size(text: str) -> int:
+    text = text.strip().lower()
+    unit = text[-1] if text and text[-1] in UNITS else ""
+    return int(float(text[: len(text) - len(unit)]) * UNITS[unit])
+
+
+def parse_mix(text: str, convert=str) -> List[Tuple[object, float]]:
+    """Parse 'value:weight,value:weight' (weight defaults to 1)."""
+    mix = []
+    for part in text.split(","):
+        if not part.strip():
+            continue
+        value, _, weight = part.partition(":")
+        mix.append((convert(value.strip()), float(weight or 1)))
+    return mix
+
+
+def plan_files(spec: Dict, roots: List[Path]) -> List[Tuple[Path, int]]:
+    """Deterministic (path, size) list for a spec; the seed makes runs comparable."""
+    rng = random.Random(spec["seed"])
+    sizes = parse_mix(spec["sizes"], parse_size)
+    exts = parse_mix(spec["exts"])
+    files = []
+    for i in range(spec["files"]):
+        size = rng.choices([s for s, _ in sizes], [w for _, w in sizes])[0]
+        ext = rng.choices([e for e, _ in exts], [w for _, w in exts])[0]
+        files.append((roots[i % len(roots)] / f"burst-{i:06d}.{ext}", size))
+    return files
+
+
+def write_files(files: List[Tuple[str, int]], writers: int, speed: float, out: str) -> None:
+    """Writer process: write every file, then dump {path: time the write finished}."""
+    done: Dict[str, float] = {}
+    block = os.urandom(CHUNK)
+    lock = threading.Lock()
+
+    def writer(part: List[Tuple[str, int]]) -> None:
+        for path, size in part:
+            start = time.perf_counter()
+            written = 0
+            with open(path, "wb") as fh:
+                while written < size:
+                    n = min(CHUNK, size - written)
+                    fh.write(block[:n])
+                    written += n
+                    if speed > 0:
+                        # Pace to speed bytes/s per writer
+                        ahead = written / speed - (time.perf_counter() - start)
+                        if ahead > 0:
+                            time.sleep(ahead)
+            with lock:
+                done[path] = time.time()
+
+    threads = [threading.Thread(target=writer, args=(files[i::writers],)) for i in range(writers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    Path(out).write_text(json.dumps(done), encoding="utf-8")
+
+
+def peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return round(rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def run_once(spec: Dict) -> Dict:
+    """One measured burst; runs in its own interpreter (see main)."""
+    from organizer import start_watchers
+
+    base = Path(tempfile.mkdtemp(prefix="watcher-burst-"))
+    try:
+        roots = [base / f"root{i}" for i in range(spec["roots"])]
+        for r in roots:
+            r.mkdir()
+        files = plan_files(spec, roots)
+        rss_before = peak_rss_mb()
+        journal = base / "journal.jsonl" if spec["journal"] else None
+        organizer = start_watchers(roots, quiet=True, workers=spec["workers"], settle=spec["settle"], journal=journal)
+        moved: Dict[str, float] = {}
+        failed = [0]
+        lock = threading.Lock()
+        all_moved = threading.Event()
+
+        def on_move(record) -> None:
+            with lock:
+                if record.error is not None:
+                    failed[0] += 1
+                else:
+                    moved[str(record.src)] = time.time()
+                if len(moved) + failed[0] >= len(files):
+                    all_moved.set()
+
+        organizer.add_listener(on_move)
+        cpu_start = time.process_time()
+        wall_start = time.time()
+        done_file = base / "written.json"
+        writer = multiprocessing.Process(target=write_files, args=([(str(p), s) for p, s in files], spec["writers"], spec["write_speed"], str(done_file)))
+        writer.start()
+        writer.join()
+        finished = all_moved.wait(spec["timeout"])
+        wall_end = time.time()
+        cpu = time.process_time() - cpu_start
+        organizer.stop()
+        organizer.join(timeout=10)
+        written = json.loads(done_file.read_text(encoding="utf-8"))
+        latencies = sorted(max(0.0, moved[p] - t) for p, t in written.items() if p in moved)
+        last_move = max(moved.values()) if moved else wall_end
+        elapsed = last_move - wall_start
+        return {
+            "files": len(files),
+            "moved": len(moved),
+            "failed": failed[0],
+            "timed_out": not finished,
+            "bytes": sum(s for _, s in files),
+            "seconds": round(elapsed, 3),
+            "files_per_s": round(len(moved) / elapsed, 1) if elapsed > 0 else None,
+            "latency_s": {
+                "p50": percentile(latencies, 0.50),
+                "p95": percentile(latencies, 0.95),
+                "p99": percentile(latencies, 0.99),
+                "max": latencies[-1] if latencies else None,
+            },
+            "cpu_s": round(cpu, 3),
+            "peak_rss_mb": peak_rss_mb(),
+            "rss_before_mb": rss_before,
+        }
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+def git_revision() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "describe", "--always", "--dirty"], cwd=REPO, capture_output=True, text=True, check=True)
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def summarize(runs: List[Dict]) -> Dict:
+    """Median of each headline number across runs."""
+
+    def med(values: List[Optional[float]]) -> Optional[float]:
+        values = [v for v in values if v is not None]
+        return round(statistics.median(values), 4) if values else None
+
+    return {
+        "files_per_s": med([r["files_per_s"] for r in runs]),
+        "p50_s": med([r["latency_s"]["p50"] for r in runs]),
+        "p95_s": med([r["latency_s"]["p95"] for r in runs]),
+        "p99_s": med([r["latency_s"]["p99"] for r in runs]),
+        "cpu_s": med([r["cpu_s"] for r in runs]),
+        "peak_rss_mb": med([r["peak_rss_mb"] for r in runs]),
+        "incomplete_runs": sum(1 for r in runs if r["timed_out"] or r["failed"]),
+    }
+
+
+def compare(summary: Dict, baseline_path: str, tolerance: float) -> bool:
+    """Print the change against a saved result; False if anything regressed past tolerance."""
+    baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))["summary"]
+    ok = True
+    # (key, True if higher is better)
+    for key, higher_better in (("files_per_s", True), ("p50_s", False), ("p95_s", False), ("p99_s", False), ("cpu_s", False), ("peak_rss_mb", False)):
+        old, new = baseline.get(key), summary.get(key)
+        if not old or new is None:
+            continue
+        change = (new - old) / old
+        worse = change < -tolerance if higher_better else change > tolerance
+        ok = ok and not worse
+        print(f"{key:12} {old:10.4g} -> {new:10.4g}  ({change:+.1%}){'  REGRESSION' if worse else ''}")
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=2000, help="Files per burst")
+    parser.add_argument("--sizes", default="4k:80,256k:15,8m:5", help="Size mix as SIZE:WEIGHT,... (k/m/g suffixes)")
+    parser.add_argument("--exts", default="jpg:3,pdf:2,mp4:1,zip:1,bin:1", help="Extension mix as EXT:WEIGHT,...")
+    parser.add_argument("--writers", type=int, default=4, help="Concurrent writer threads")
+    parser.add_argument("--write-speed", type=parse_size, default=0, help="Bytes/s per writer, e.g. 20m (0 = unthrottled)")
+    parser.add_argument("--roots", type=int, default=1, help="Watched folders the burst is spread over")
+    parser.add_argument("--workers", type=int, default=4, help="Watcher worker threads")
+    parser.add_argument("--settle", type=float, default=1.0, help="Watcher settle time in seconds")
+    parser.add_argument("--journal", action="store_true", help="Record moves in a journal, as the GUI and CLI do by default")
+    parser.add_argument("--runs", type=int, default=3, help="Bursts to run; the summary is their median")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the size/extension mix")
+    parser.add_argument("--timeout", type=float, default=300.0, help="Seconds to wait for a burst to be organized")
+    parser.add_argument("--json", dest="json_out", help="Write results to this file")
+    parser.add_argument("--compare", help="Earlier --json result to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed relative regression for --compare")
+    parser.add_argument("--single", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        # Child mode: one run, result on stdout
+        print(json.dumps(run_once(json.loads(args.single))))
+        return
+
+    spec = {k: getattr(args, k) for k in ("files", "sizes", "exts", "writers", "write_speed", "roots", "workers", "settle", "seed", "timeout", "journal")}
+    runs = []
+    for i in range(args.runs):
+        out = subprocess.run([sys.executable, __file__, "--single", json.dumps(spec)], capture_output=True, text=True, check=True)
+        run = json.loads(out.stdout.strip().splitlines()[-1])
+        runs.append(run)
+        lat = {k: "-" if v is None else f"{v:.3f}s" for k, v in run["latency_s"].items()}
+        print(f"run {i + 1}: {run['moved']}/{run['files']} files in {run['seconds']:.2f}s  {run['files_per_s']} files/s  "
+              f"p50 {lat['p50']} p95 {lat['p95']} p99 {lat['p99']}  cpu {run['cpu_s']:.2f}s  rss {run['peak_rss_mb']} MB")
+    summary = summarize(runs)
+    print("median: " + ", ".join(f"{k}={v}" for k, v in summary.items()))
+    results = {
+        "revision": git_revision(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "spec": spec,
+        "summary": summary,
+        "runs": runs,
+    }
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    if args.compare and not compare(summary, args.compare, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Cold-start import time of the headless engine vs. the GUI module.
+
+Each sample runs a fresh interpreter, so nothing is cached in-process:
+
+    python benchmarks/startup.py --runs 10
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+
+TARGETS = {
+    # What `python organizer.py --path ...` loads
+    "cli": "import organizer",
+    # What `python gui.py` loads before the window appears
+    "gui": "import gui",
+}
+
+
+def time_import(statement: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", statement], cwd=REPO, check=True)
+    return time.perf_counter() - start
+
+
+def loads_tkinter(statement: str) -> bool:
+    probe = f"{statement}; import sys; print('tkinter' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", probe], cwd=REPO, check=True, capture_output=True, text=True)
+    return out.stdout.strip() == "True"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Fresh interpreters per target")
+    parser.add_argument("--json", dest="json_out", help="Write results to this file")
+    args = parser.parse_args()
+
+    # Baseline: interpreter start-up alone
+    baseline = statistics.median(time_import("pass") for _ in range(args.runs))
+    results = {"python": sys.version.split()[0], "runs": args.runs, "baseline_ms": round(baseline * 1000, 1), "targets": {}}
+    for name, statement in TARGETS.items():
+        samples = [time_import(statement) for _ in range(args.runs)]
+        median = statistics.median(samples)
+        results["targets"][name] = {
+            "median_ms": round(median * 1000, 1),
+            "import_ms": round((median - baseline) * 1000, 1),
+            "loads_tkinter": loads_tkinter(statement),
+        }
+        print(f"{name:4} median {median * 1000:7.1f} ms  (import {1000 * (median - baseline):6.1f} ms)  tkinter={results['targets'][name]['loads_tkinter']}")
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
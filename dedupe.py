@@ -0,0 +1,193 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable, List, Optional, Set, Tuple
+
+
+# What to do with a file whose content already exists in its category folder.
+DEDUPE_ACTIONS = ("skip", "hardlink", "move")
+# Folder (under the watched root) that the "move" action sends duplicates to.
+DUPLICATES_FOLDER = "Duplicates"
+# Bytes read per hash update.
+HASH_CHUNK = 1024 * 1024
+
+
+def file_digest(path: Path) -> bytes:
+    """Incremental BLAKE2b of a file, read through one reused buffer."""
+    h = hashlib.blake2b(digest_size=20)
+    buf = bytearray(HASH_CHUNK)
+    view = memoryview(buf)
+    with open(path, "rb", buffering=0) as fh:
+        while True:
+            n = fh.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+    return h.digest()
+
+
+class HashIndex:
+    """On-disk cache of file digests, valid while a file's inode, size and mtime are unchanged.
+
+    Also holds the size of every file in the category folders in use, so
+    finding same-size candidates is an indexed query, not a dict in memory.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS hashes ("
+            "path TEXT PRIMARY KEY, ino INTEGER, size INTEGER, mtime_ns INTEGER, digest BLOB)"
+        )
+        self._db.execute("CREATE TABLE IF NOT EXISTS sizes (folder TEXT, name TEXT, size INTEGER, PRIMARY KEY (folder, name))")
+        self._db.execute("CREATE INDEX IF NOT EXISTS sizes_by_size ON sizes (folder, size)")
+
+    def digest(self, path: Path, st: Optional[os.stat_result] = None) -> bytes:
+        """Digest of path, hashing it only if the index has no current entry."""
+        st = st or os.stat(path)
+        key = str(path)
+        with self._lock:
+            row = self._db.execute("SELECT ino, size, mtime_ns, digest FROM hashes WHERE path = ?", (key,)).fetchone()
+        if row is not None and tuple(row[:3]) == (st.st_ino, st.st_size, st.st_mtime_ns):
+            return row[3]
+        digest = file_digest(path)
+        self.remember(path, st, digest)
+        return digest
+
+    def remember(self, path: Path, st: os.stat_result, digest: bytes) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO hashes (path, ino, size, mtime_ns, digest) VALUES (?, ?, ?, ?, ?)",
+                (str(path), st.st_ino, st.st_size, st.st_mtime_ns, digest),
+            )
+
+    def moved(self, src: Path, dest: Path) -> None:
+        """Carry src's digest over to dest, if src was hashed and dest is the same content."""
+        try:
+            st = os.stat(dest)
+        except OSError:
+            return
+        with self._lock:
+            row = self._db.execute("SELECT size, mtime_ns, digest FROM hashes WHERE path = ?", (str(src),)).fetchone()
+            self._db.execute("DELETE FROM hashes WHERE path = ?", (str(src),))
+        if row is not None and tuple(row[:2]) == (st.st_size, st.st_mtime_ns):
+            self.remember(dest, st, row[2])
+
+    def forget(self, path: Path) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM hashes WHERE path = ?", (str(path),))
+
+    def set_folder(self, folder: str, files: Iterable[Tuple[str, int]]) -> None:
+        """Replace the recorded (name, size) pairs of folder."""
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.execute("DELETE FROM sizes WHERE folder = ?", (folder,))
+                self._db.executemany("INSERT OR REPLACE INTO sizes (folder, name, size) VALUES (?, ?, ?)", ((folder, name, size) for name, size in files))
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def add_file(self, folder: str, name: str, size: int) -> None:
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO sizes (folder, name, size) VALUES (?, ?, ?)", (folder, name, size))
+
+    def forget_file(self, folder: str, name: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM sizes WHERE folder = ? AND name = ?", (folder, name))
+
+    def names_of_size(self, folder: str, size: int) -> List[str]:
+        """Recorded files in folder with exactly this size."""
+        with self._lock:
+            return [row[0] for row in self._db.execute("SELECT name FROM sizes WHERE folder = ? AND size = ?", (folder, size))]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class Deduplicator:
+    """Finds an identical file already in a category folder, hashing only when sizes collide."""
+
+    def __init__(self, index: HashIndex, action: str = "move", folder: str = DUPLICATES_FOLDER) -> None:
+        if action not in DEDUPE_ACTIONS:
+            raise ValueError(f"Unknown dedupe action: {action}")
+        self.index = index
+        self.action = action
+        self.folder = folder
+        # Category folders whose sizes were recorded by this process; listed again after a restart
+        self._seeded: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def _seed(self, dest_dir: Path) -> None:
+        key = str(dest_dir)
+        with self._lock:
+            if key in self._seeded:
+                return
+        files: List[Tuple[str, int]] = []
+        try:
+            with os.scandir(dest_dir) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file(follow_symlinks=False) and not entry.name.startswith("."):
+                            files.append((entry.name, entry.stat(follow_symlinks=False).st_size))
+                    except OSError:
+                        continue
+        except FileNotFoundError:
+            pass
+        self.index.set_folder(key, files)
+        with self._lock:
+            self._seeded.add(key)
+
+    def find(self, src: Path, dest_dir: Path) -> Optional[Path]:
+        """An existing file in dest_dir with the same content as src, or None."""
+        st = os.stat(src)
+        if st.st_size == 0:
+            return None
+        self._seed(dest_dir)
+        candidates = self.index.names_of_size(str(dest_dir), st.st_size)
+        if not candidates:
+            # No file of this size: nothing to hash
+            return None
+        digest = self.index.digest(src, st)
+        for name in candidates:
+            other = dest_dir / name
+            try:
+                other_st = os.stat(other)
+                if other_st.st_size != st.st_size:
+                    self.index.add_file(str(dest_dir), name, other_st.st_size)
+                    continue
+                if self.index.digest(other, other_st) == digest:
+                    return other
+            except OSError:
+                # Removed or renamed by the user since it was recorded
+                self.index.forget_file(str(dest_dir), name)
+                self.index.forget(other)
+        return None
+
+    def added(self, src: Path, dest: Path) -> None:
+        """Record a file that was just moved into a category folder."""
+        try:
+            size = os.stat(dest).st_size
+        except OSError:
+            return
+        self._seed(dest.parent)
+        self.index.add_file(str(dest.parent), dest.name, size)
+        self.index.moved(src, dest)
+
+    def link(self, existing: Path, dest: Path) -> None:
+        """Make dest a hard link to existing, replacing the placeholder at dest."""
+        tmp = dest.with_name(f".{dest.name}.link")
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        os.link(existing, tmp)
+        os.replace(tmp, dest)
@@ -1,81 +1,50 @@
-import json
-import time
-import shutil
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional, Set, Tuple
 import base64
 import os
+import threading
+import time
 
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from organizer import (
+    CONFIG_PATH,
+    DEDUPE_ACTIONS,
+    DEFAULT_RULES,
+    SAMPLE_FILES,
+    MoveRecord,
+    Organizer,
+    SettingsWriter,
+    build_parser,
+    compile_rules_text,
+    folder_options,
+    journal_path,
+    load_config,
+    parse_conditional_rules,
+    resolve_settle,
+    resolve_workers,
+    run_cli,
+    start_exporters,
+    validate_rules_text,
+)
 
 
-CONFIG_PATH = Path(__file__).with_name("settings.json")
 ICON_PNG = Path(__file__).with_name("watcher-icon.png")
 ICON_ICO = Path(__file__).with_name("watcher-icon.ico")
+# Bundled base64 PNG icon; read only when the GUI sets its window icon.
 ICON_B64 = Path(__file__).with_name("watcher-icon.b64")
-
-# Optional embedded base64 PNG string for the app icon.
-# Paste your base64 PNG data between the triple quotes.
-ICON_BASE64_DEFAULT = "iVBORw0KGgoAAAANSUhEUgAAAuQAAALkCAYAAABHpCBlAAAACXBIWXMAAAsTAAALEwEAmpwYAATcPUlEQVR4nOz9d5RkSXbeCX5m9oRrD60jI7WqzEpRWouWQDUaaAV0o4GBIkCguRgAxMwswQV4hrsHSy453HNmd4bAAHNAYsABKBaKIEA0WlZXVVd3iazUWkRmhpau3Z8ws/3D3nMRGZmVVd3VXtV1f3WiMsL9+VPufu3ad6/dy7TWIAiCIAiCIAiiO/BunwBBEARBEARBvJ8hh5wgCIIgCIIgugg55ARBEARBEATRRcghJwiCIAiCIIguQg45QRAEQRAEQXQRcsgJgiAIgiAIoouQQ04QBEEQBEEQXYQccoIgCIIgCILoIuSQEwRBEARBEEQXIYecIAiCIAiCILoIOeQEQRAEQRAE0UXIIScIgiAIgiCILkIOOUEQBEEQBEF0EXLICYIgCIIgCKKLkENOEARBEARBEF2EHHKCIAiCIAiC6CLkkBMEQRAEQRBEFyGHnCAIgiAIgiC6CDnkBEEQBEEQBNFFyCEnCIIgCIIgiC5CDjlBEARBEARBdBFyyAmCIAiCIAiii5BDThAEQRAEQRBdhBxygiAIgiAIgugi5JATBEEQBEEQRBchh5wgCIIgCIIgugg55ARBEARBEATRRcghJwiCIAiCIIguQg45QRAEQRAEQXQRcsgJgiAIgiAIoouQQ04QBEEQBEEQXYQccoIgCIIgCILoIuSQEwRBEARBEEQXIYecIAiCIAiCILoIOeQEQRAEQRAE0UXIIScIgiAIgiCILkIOOUEQBEEQBEF0EXLICYIgCIIgCKKLkENOEARBEARBEF2EHHKCIAiCIAiC6CLkkBMEQRAEQRBEFyGHnCAIgiAIgiC6CDnkBEEQBEEQBNFFyCEnCIIgCIIgiC5CDjlBEARBEARBdBFyyAmCIAiCIAiii5BDThAEQRAEQRBdhBxygiAIgiAIgugi5JATBEEQBEEQRBchh5wgCIIgCIIgugg55ARBEARBEATRRcghJwiCIAiCIIguQg45QRAEQRAEQXQRcsgJgiAIgiAIoouQQ04QBEEQBEEQXYQccoIgCIIgCILoIuSQEwRBEARBEEQXIYecIAiCIAiCILoIOeQEQRAEQRAE0UXIIScIgiAIgiCILkIOOUEQBEEQBEF0EXLICYIgCIIgCKKLkENOEARBEARBEF2EHHKCIAiCIAiC6CLkkBMEQRAEQRBEFyGHnCAIgiAIgiC6CDnkBEEQBEEQBNFFyCEnCIIgCIIgiC5CDjlBEARBEARBdBFyyAmCIAiCIAiii5BDThAEQRAEQRBdhBxygiAIgiAIgugi5JATBEEQBEEQRBchh5wgCIIgCIIgugg55ARBEARBEATRRcghJwiCIAiCIIguQg45QRAEQRAEQXQRcsgJgiAIgiAIoouQQ04QBEEQBEEQXYQccoIgCIIgCILoIuSQEwRBEARBEEQXIYecIAiCIAiCILoIOeQEQRAEQRAE0UXIIScIgiAIgiCILkIOOUEQBEEQBEF0EXLICYIgCIIgCKKLkENOEARBEARBEF2EHHKCIAiCIAiC6CLkkBMEQRAEQRBEFyGHnCAIgiAIgiC6CDnkBEEQBEEQBNFFyCEnCIIgCIIgiC5CDjlBEARBEARBdBFyyAmCIAiCIAiii5BDThAEQRAEQRBdhBxygiAIgiAIgugi5JATBEEQBEEQRBchh5wgCIIgCIIgugg55ARBEARBEATRRcghJwiCIAiCIIguQg45QRAEQRAEQXQRcsgJgiAIgiAIoouQQ04QBEEQBEEQXYQccoIgCIIgCILoIuSQEwRBEARBEEQXIYecIAiCIAiCILoIOeQEQRAEQRAE0UXIIScIgiAIgiCILkIOOUEQBEEQBEF0EXLICYIgCIIgCKKLkENOEARBEARBEF2EHHKCIAiCIAiC6CLkkBMEQRAEQRBEFyGHnCAIgiAIgiC6CDnkBEEQBEEQBNFFyCEnCIIgCIIgiC5CDjlBEARBEARBdBFyyAmCIAiCIAiii5BDThAEQRAEQRBdhBxygiAIgiAIgugi5JATBEEQBEEQRBchh5wgCIIgCIIgugg55ARBEARBEATRRcghJwiCIAiCIIguQg45QRAEQRAEQXQRcsgJgiAIgiAIoouQQ04QBEEQBEEQXYQccoIgCIIgCILoIuSQEwRBEARBEEQXIYecIAiCIAiCILoIOeQEQRAEQRAE0UXIIScIgiAIgiCILkIOOUEQBEEQBEF0EXLICYIgCIIgCKKLkENOEARBEARBEF2EHHKCIAiCIAiC6CLkkBMEQRAEQRBEFyGHnCAIgiAIgiC6CDnkBEEQBEEQBNFFyCEnCIIgCIIgiC5CDjlBEARBEARBdBFyyAmCIAiCIAiii5BDThAEQRAEQRBdhBxygiAIgiAIgugi5JATBEEQBEEQRBex3ukDMMbe6UO8R3AA3ANgDEAVwHkAC7ff/KmngF/4BeAHfxDo6YEAsAOAAnAVgPrCF4Df+Z1o42FY4hDu2zcM4FN4/dwPI5T/FsD/BECh93/8TfT+kx/D0k/9JCp/9CcAgInf/Jc49IVfx97Xn8eZwQz+9qH7AQB7gwCH1gvYdfY0Vhp1/OWDD2G+rx8MwDYABwsFjJ04gbHpG1jM5fEXjz+KmcEBAMAogCkZIF9dw8DyCrKrBVhhCLvhQ9R9iCAAlxJMKzAlAaXAlG77V5sL1EC63sBaPos/feYpdmVifOOHiG/yu2p7TE8Baieg5wBcB1A3u0WuVsfHXjmGbXNrmOkbxolDO3FutA9+9Hy27uGHXjmLwVQCpx/Yh9cA1K/O4sC/+2tUtu1E8cED2P/6SyjPfAuvN65D/9lLwImZN3vzDR8+BPz4Y0C1AOz/EPD0TwNf/Y/AF/8A6OsDvn4O+NvjZtuPfhT4D/8ByOWA89PAj/0GcPIlAEMANDIZgS1bHKR1AqXsGm4ceAP1z38IePa3gHUGqAGgfy/wO78H8T//v5HfsQNyaQnF1167u3N9D7MNwE4AEp0fio2EAPom+zB2cBx8YQHhjWXAApIKWHeAL28D5pYBnAdGnn4Yzn/7C5h97keRvLaCkedfg/jgp1B86StY/MUfhq5V39pJJhLAN74BZLPAk08Cy8vNp+596il87Bd+AUO+j2PDw/jTp59GNZkEB5AAMFXW2DHfQG9xEa4uAUkXjGkgCMFlCPgSWgJaWKhl+1DsG8XpPgvTSbP/fdem8Ymvfg2ZegPVZAKKcyjLQpBKI0hmsLRjG27s2oaLnGP14kXgl38Z6OkBfv3XgQcfBL7yFeATnwDK5db1/NIvgf/rf43tMF/IK9H9b4dJiX1f/xtYv/97OPdXX0FQq4OLFHK5B+B8/GegPv1D4GN98P7ur1H+Fz8Htb646a1LpdOY3LoV2WIReubuvnsC5rNwHcDym2z7XuPhH/9x9Pz3/z1ePHwYld/5HeALX+j2Kd2eH/9x4I/+COAcWUjsDyvYe+Yihs5dQU+9jtf27MF/fvhhSM7RX67j2ePT2DozA+ato6dcxBt7d+LPn3kSoSWQ8STunS1jslJDUtWQqFaQqBZh+TXwIIAVhEg26njhwH72d0ePMADYPjunP/X153V/sYSqmwC0NoYfgPlFQzOGTKOOmeFB/NnTz/C5aHwDIIA6B2aiweoNDfyy3lnbro6U/w99PLsHl1KtS003Gvj4Sy/jnuuzWBoYwumnHsUJr4rCH/wB5J695jsEYKru475CDadGe3BpbhY9/+u/RuLieQTZHpSLAn4xBGyGR55+CEMffxbPb5tEIeGCyxBjb7wCVC5jbopBeVeAq+eB62Xgzy8AX7rSee//5ePAf/d5AE8C//Ivgf/hH5vHP/As8Gd/iqmZEnb+6z9GotDA9MkXcObUV9+hD8F7F631m2/0HfCOO+TE+4cQgM85pOsCySS3kr5lh4FtM+HaEAnLtl0hZYJB2UxKl0nlMKUdKGVBKc6UZpFDrm3LQtZx2eHlFTbAuU74fghAasYCzVgIDgXOQm3bVSVETYGHigsvcOyG5zhe1rJ0CDP1aXT1rhAEQXxfwdDmxnYLzRhC24FKKHCtmaWkbUs/YQttxppQupZj2VO+7z4+M+vWHSexdXklkXFdYWcyKmXZqs0hZ4CGhtaaMW1ZVtgjrPDo0mI4LkOZCIJQ2W5ZW35Nw4NiOpCs12vwTwaDGPFUwpWhLWGmfreBMUApoFZn8DzgXXAPiXcX5JATbweuAcaghSUlByCcMLQSnCcSgZewq1VLl0o5v1TMqzBMhA0/79f9HA+CPJcyz7RKMiWzUCrDlE5DqRRT2oLSPHLIFQCGep3tfflb2Kd1qBnzwbkHwWuasxoEC2BbDZl0l6STWNHc8nUiUQ5yuWKQzdaKAwPlpXy+lmTMy2rtNwDpWVZoh2HIoIOWFn/XRjFW6cmIEgTxnoE5DuA4xnD5vvlph1vmBwBUaH7usDt8b20hbzsm41pzR4ZWaAnhBkHCbdRSolJNSVlLBrVKmlVLvYFXy/MgyDGpslqHqZ6LFzNPnDmX4aHMa6176xyJuoaCrvvQmkHH+9cM0EozFoDBh1evHVxZbhxizNdC1MOkOyMTzjI409q2GtJ2q8r6iYbfk6qsD9UqzC4VIHqrtgoRWJa0QxlyrUNtgkUaSisIiyGfF0inNW4NIsXQWPM+hRxy4q4JAUjOLTuZzPPe3pF+xid/8PKVwdrMza2274/ZUg7zRi0na2VdmJu3b84t2GEQCK9Wtxu1uuPVarbvNWwppaWktABYYLA4mMXBmJKKaanANNORCMOsMITQUmnGFeNcMSFCzhEywRUTXErOPGE7nptMqnQ2F2T7+4N0b1+YHR4O+/r6gn2pVE257mLI+XwgxJoVyrkesPOqr/+mSKYbnrAC700MHwulJYrVJK97ARga6EygiQeM2xlXgiCIrpH/mZ+B89M/jTWtEf6bfwP8/u93brD7YWDPowDjwMWXgbPP32l3esO/QMthvlOGGLB5euHtYZzxREo4qUyfZQUT3LGGdte9rT/56rHxwBaTbsMbSFV9q7ywaC8vzIm1el00KiWnXqs49WrVbjTqVhCGgvmBbUlpM6VszbkjLUsopbVWSjVNuQbTWgHQmnGuwJjiDNKBlhZjSnMuQ4Yqs4TnJFwkU2mZzfeFmeyQyg8PhEPD6eAjfXP1IJNbBticFGLNDuXKgFI30d8346RSxdD31r2hAU9/7nMhEonNr1lKzosFNywUVN1OeFIljbJOvC8gh/z9yW1n4AHn0LYFnUikkr7Xs61STli2PZKu1kYGGBPuwkK2cO3qUGlxeUxX6xOJanko43nblFYjgQx4xfNQ8wOsVaooVKvwZYiG76Pe8NAIfPhBAKlUJIEbTYJF/8XhQ65bBqg9Z4sxBsYZGOMQnJkIoJQQnMNxXaSTSeRSKaQTCfSm08gnU0gnXDi27THwJUeqQui4c/N9fReQ7plR6Z7qaEaVhRhdVRKFmuOs99T8QlqzSug4NRk52WE+g+JDB1DtH2UqVJz7gS2qVSCsBzh0L7OyO3VmaR7B3Cyqlcod7y9BEMT3ktTBg0g+/DCKAMJXX711g+EdwMEPAaEEelLApAO4Eph3gOMAAsCYNAfARQDntJ0bALKTCJkLXbwBlOcApGFMXg1oc77Z7t1I7NiBgStXlT+1DYuRg6nBoCwbsG1bWHaKJWD3Sjmyd3FpbC3pOoPzK0l980bf4s2bI151bSz0vWG7Ud2WbNTHk1L2hNBimWmsVspYK5TRCENUPQ/VRh21RgOe70MqCaVhJhuMgTMz1iipoJUCY23GWkcBU8bMDIMBjHNwzqOxJjR3wbaRTCSRTaeRTl5FTzaLfCqFvmQSScsOJFCwlC5Iy1q+mcnMsHRuRmRyhWzSnt9j7VryevvqoZRFvbJa8DivDmlRgG3XlFkcpIuPPa7GhgblcLmOm1fWealSBtKuSa8hvq8hh/z9B0NrjdNm33AbQK5h27tSnrf/qbNn+lkon1LV+hOVcsVeXlwMZhcW2PLioiiWiqLR8FgYhkIzMA0NpTWU0shkc8jk89BawUppZDlHjnEIISAEB+PM5ItoQCkFKA3BBSwm2gRobU5QG2PZsaCCtbZQWkMrBaUUaoGPYq2O62sFhEGAMAggw9BWSo3KMBxxbWd3Tz7/xNDAoBoYGNDbF686D46OLgvHPavc5MnQSp5icG6uDPddBbDMgboc7pOrn/lgQ5a1cK7OpnkoU6xakbBVCf/w14Nk3369+9/8Ptb+5I9x+fz5trMjh5wgiO4iYaKbtzVGfh0oLgNrBeADjwE/+qtAmgN/EQA/C2AdMK5CBsA/B9hvILXtINj+n0HJGYU+9vsap/6jNgULNIDLQCuZWrPP/pge/Me/iade+BbWHBt/w1j7udhgmABjO+uu2zOxvPLM6NzCRxoNf2B9bQ3ri4vszOwsW1lZ4aVyWdQaNa6U4gA44xxgQCaXRzafh7ZtaMtCIp1GknNwIcC5gBDCiDnRRIAB0EoDupmr0pYVr6NM8vjk49NsBQaU1tBSIgxDrAUhFpeWIIMAMgghg8CSUvbJMOwVnG9NJdNH+3r71MDAgBqbv8l3XzhfSaYzC8J1z/mCn1bCmq4Oj51bmpy6HoRYR2+flJ/7nDdy4xoOfuNlVlt81Sn5K0DapaVQ7wPIIf++I7YgVZh6AooHjRXNmdD7PvJDyK7WNHdEWN5/AGXGuJdKZbZXq6Mfu3Bxe8IS+9LF4jaxOJ+6efnS0PrVq4Pe2mrGkXok4SZzNT/AWq2WrPg+Kl4DfhBAQQOODW5ZEILD5gKMcViOC8kFNATAYFQGLsCEADhvGTqlAaYArqHBIRlrKeax060BrVVTwWj65W3ZjFopaCmhlIa2GbQGGBcQlg2uFI+0dVicQzOOQqmIRrWC4swMEkKMacb7LcvZ4/b0PpYYHCrkq/uKBxrrpQnXnSk7zlk7k7oahNbMSkqULj7+UGXhge1ayzJw4CFYCyWRr9eStQ9/MMTP/ULDuVZWgi2ivq0CWGOAHAe0ApwlwFtAtKCHIAji3YHWgJaA6wDprHksA7SpI4bdPwg8YoFLH5ylgdwE4A7AbDlv4aEPaPzYL4U7i9Vg6vI0RLWIc/fdh6rrMGvHTnvf2lo/u3BpXHNsTzdqu5Ll9eHw/IXh0+cu9RSKxRRvBJN58C1KSlb0PBR8D6VGHZ7vw2caPJmEJQS4EBC2gBAWhGXBg4mg8ug5FjnkjBl7b8Qf44QDMCo4i1RwGOU8vlYVjTVa61gSim8StFZQGtCcQwoBrQBY2ijw3AK3bMalFrbWEJxDWJbdCEMsryyjtr6KuZMnU5zxIc75FieVvDefy6/ndu1eHti1tP7kYO9qMZe5EmSyZyfr3kV3cnzV/3s7PWd6Tj98/jwm8ymshZHiT3xfQg759wUagGRMSq5VqLWC4rkxJAfuR7XI4PWYsk17PvgD/MDgFldUV5MXhid6ZxZnJ2ulwmTv3LW9+19/7R5Ly4eLlfLwzMoyri8uYHZ5GWuFIhQXSOd7wC0blmXDsW3Y6SyStmUMom0ZFYJzcC7AOUfgB/A8DwCD1hpSaigpEQYS7f402n5XyhhB3lQzOrXyjSWHGABwBvBW2ouwXVhuEsm0iZlyziG4UUpsIaC1hu81UK/XsVarYaa4hmqlwsMgSHJgqieTmRrs68Hu5RlsOTOCCcdZU7Z9wk8kj1mDg+d6t2+dWdi7ew4925f7gXoNqDC1hpW+Pqvw9OMKH3kO6TcCBn2BNQ7PaM33aFOID8CJvwNe+D+BIHgnPgQEQRDvLPfcC3z+APTX/n9MvX6Nadan7ewO7Uw+h0axwuUHPqzZr30B29cbePLkeccpLyXSu7fmzhRKw+WZm2P95y/s3Fcp7rSDxhGvXttfqFSyswsL/NrCPJZX19CQCol0BhBG5LEsC46bQCqbQ95x4DgOhCUigYeDMY5Go4FqvRb9bcYMpQEZSGhtFqhqrSNVHB0DT6ycc9YMuRqHPC6BGI05jLGmIBS/hgkLtu3AZSlwMHBwcMbBOYPgJmNHKgXf91FvNLBcKaNSLsOr1wEZ9mQSiZ6+fB5b11Ywee0yBjMZTDrutdASL6t06tjK5MS09eyR6f0Hds5/ICnrPqzqgtR+5yRB8ajGqTb/SkBJIwA1r4h4r0AO+fcFHqALwqok02GtrJX2K7t+9AfUyH97EK9btqqOD8LXmvnFSiYI5X4GfnTnys0n+29cPLBw7XLq9YvnU4uLC4lSpZz2whCwLNhJF+mBAfRMTMAPJGq1BizLRiKRgG3bsGy7aaSkVPD9EEopqMjoCW4Mk0lhUVBSQisVpehFBo1HKSycg4EhgEKoFJrSRRsMDJy3HosNr9YasZ3V0VJQSNVMc2GRQWaR8g4AmmnAtpDI55HM59CvFFQYIgx8qCBAKZB44/JVnLh8BSoM8pyx+x3X3b9lakswtby/9EOLC3Oif+ClmuW+OLN7+7Fzk5NrZ37h5wt+JgnuK6ZXC662VrnGWgB4b1YOmyAI4r1BVEuWlXxXLxeFRlFOfvwDwdCHPinPcnil4V6zWaHsekE4Bc73Hr1+8+ltFy8/ULhydeDkuXO5hfk5u1wqpQIZJrkluJVwYWUyGO/tRagAzw8BLmA7DizbhmVZxgEXHAoafhgibHgI/AAyDMGFgOXYABgQiTrNiGrTHTXRUS6MEy+VgtSq5Yw3xxsVjRNReguP0lraUl50M8cFADSUitIuIzPPozFOMQ0/CKG0huXYyA8Oom9oqBXNDQKowMf00hKm5+egggBM6QmL84+OjI4+tWXf3trHgrDan+95wwJ7vpzJvsBc52p8rhpgOghdBL6A4gFkDfDLQK0AeHUdnZCp8EK8JyCH/L0PQ+oAU3t+nF39QF8Q9u3Weobr3KccbD2402FQk7Javqf3/M3diQtXey+cPbttfWl+l9uo7kIY5BfLFcwXCihWKqiHIbQl4DoO7GQKIpWG5SYhXA1hJ4zx4gIaQBCG0FpBSmUWyERfec54m6NuHuSagTEBcBGdcHTiGmCRcm6sh0ZsRTr1cYPWusMwxuq7bnriZqEQN5I54nxA6Eh9jwymZgATZjJgW8IsENWACkMEnofA89Co1eB7PmTgCQ6ddQI/q6enUV9fw+Drr+/PJdM7WE/fgcFD911zjh6+NjTYO+819IWwXr++PpWuryR3KrB+AAOtC5CBQKPMUS9JBPV4dvLd+yQQBEG8czDT2IGx0qP3QB4cCZHY4rsPjunhfRlhAz21Rm1X4ur0vpGrM6Pz5y9MLc/fmHRLhXu51xifr1Qws76OQrmMuu8DlgXXspCybIhEEtxx4YCDu6GpRBg5ykHkwOogEneUgpZG5ImVDqW0aY7FGBh4lBeuOxr/sGjNpoYZL1h0DAWANdcodUZiY99bI0qLRFvZciDeYZxX2ToOzDijGIMWAtriYFYUUWYmYT0MAoSNBhpawwtDeEEIyNB2uOhjq6vQJ0/Bu3ARhVR6qprN7rRHxh7ONWpX7ldeuT44eEkqdbExPrW0bA/WkQ2AYCuDfUhgoMLgzAF7l7WjNJhi8CWgDzswLfKoINi7FXLI36vYNmCsAsf+R5j6qS/ouR+Gj0nNGVSqUYPDzq7vefD8y0+k56c/U67VH5hfXsbpixdx5do1eEGAdC4HN5FAKpvF0GQfnGQC3LYhtYYvA3iej1KpDNsyq8qVUgiCAGEYIggCSClNigkXsCwLtmXBtm0IbiEMAgRBAMa5USaY+TGLZ4zRU5FRNSvhNSA4mGCREx2Xhu2c3GuYNBQdhyZV7JCbvzkzKSycmZBh5Jc3nXYFIFTSVHpRCmEYmHBjlFMobBspx0EmnwdjJiOGRYpLuVDA6ZlZ1CoV2FxsG+zr27ZzcR67Lp+t7e3rv+T0j/3twviWvzt5cPu1Su/4SqDGVahVyDhCBUjYCY5Mnw0uFBJRgqYm8ZwgiHcfjGlwW5tqKA4DfAAMAinG9eNHNOsDNLTrgznWYnny6LHX9vffuPapMPQ/ulYs5M9euYzT586hWK0ikUpBuAm4qRRywyMYTCRgOQ4AhlApBIGPUq0GzgQSjgutjcMqlUQopXHCI0HGFAYQsF0HQojIjoeRYMSbqSvG9utmuooZc0LjUEfGvZn+EY8RmxQP0IwBTDfHu3iiECvn0WYdrwEACA7Xtk0DozBEw/PRUGZtpmAMluAQjoNcImHGLa0hANhCoF6tYnplBSfW1yF9vzeTSj0xMTryxJ6lOf3glUthT1//82v9A396+sGjL62ObrtqKXAfCHgPQr0HoX7CjKDp6HQCABr/BcAb0V/EuxFyyN+r/PzPAEce1lh0JPbdA+txsHuT0HvXVw4n1mc/HF5ZOLT+xsWt1y+cGqguzY/6jMGDRsA4RrZNQWpjaBk3i2B8pRA2PDA/hGbMpIEoAUswaKlRq9YRr43nYEg4rjFGPHaczcJL3/ehtMkd55xFTrBRp5VWzVY82uzILAAFj9e2t4wljGrdXP3ebiM7FIz2JyMHVzGTlgKjfrTCmBrgxuCBiaaRN2FH4xgrBkjGwLVREVjUXU0pCWXZyPQPINPXZwwq47ixsIDZ2dkkZ2xPvm8w379z9+Nb5nfpndu3varc5H9pWOXT07nU8unRe1Df9WCAnqEAfh3onzSn7NPieYIg3n0Mb6ng/n8wi2vJXpzZMwyE0JhEyHYB+9PAnlJ9Irk8dzSzuvZMeGX66PSxY9ljVy6NNwI/X9MKdQBuTx59PT1AtNjSdlwI24G2bISaG8c7VAhCBRVqKB2gLqNUEs5gCw7HtoC4Mkss5miNUEmEMjTrhCzRXGckVdhyqjcW5uKIFnQytOoGsFaRlVgDalv8GWOJKMLL293vllLeHJbaxiclpflTKbDovAENGalDSgNSRgXPlAZjgMU5FGNwczn0J5NgWsMSHFWpcPLceXbu3Hk7nUo/kBkbG7Znrv/UY/v3vpHu7/u6ZsGpGwl77vXJXZVSIkUy+HsQcsjfqxw4DGfPYTG0grSdDscTYmFq++tXekePnXkyWLn5kfm5m1M3Fhb5fLGMgu+DOzacRAJ9fX3o7ekF5xwNz0cYSgRBiDCUUKY7PRgzeXZMMAgmoBAiDEKzWEVwcMYgory+OJynlEIo0VSeOedRikpshNqMWNtCGcaZUc8BSCWhtQJvM5Sx1WRR6LHpekeKN2faSAEarZQUzaO1O7qZRxgv0mGaNctd8egQKnbrI2MvtYrSAXXzdVoDluMgmU7DjfLn/UYDxUIBxWKReY1GIl2ubJ2olbduv3kVo/35rVYuOTQ24FzM7955PtC5y0ujW6/pyYPFNUA166wEHoPfAHxPv0mHPIIgiO8Z+YEGDv3AHGrDAmcmh9EPsDS8oUSlvG3P6ZXRrScuHA5uXjpaX55/YKGwOnxleQlzhXUESoPbNjI9eeT6+yBsB4FUiM2qBBCGZgGi1ipSrxm4sKGVhFIyilha4CwqWxiLO0pHKStmTZJZJ9SpcrcqpLQW+zPWKmHY1MVjnxux0h1HWdv21bEAFB0LRzvqr7TtsD2lRYZhc90UZwyCWZFYZF4TKuOMt19HQ4ewLA43m4Ft2eCcQ8oQtWoVa4UiKuUyWKGQ7y+XDo7N3ETqxOs77f6e7YMZfiG1dcu5Mpwz8xNbL3EdFhpu0qsIK9qzRKyVE+9OyCF/D5MNPfvZlZuTe88u/Del5Zkfu3TyVP6vT51019ZWLV8plshkkR4cRG8qCc04QmlyvteLpWgPDDpKDeHcghCt3GwAUY1wCcYYXNdpigUmP1xCxqHE6CWMMdiOHWWlRAs8mXF921OlY7PVDCXCNGhQWpkar2AQUS5gk2buSfs+0AwddhjYtjU6rP3AiBWZwBjAOLQZLfaJr81MIFRHWDLOi/fDEJ4fAFqBAUjncujp6zdGMwhRr9dxfHER3758YVSo8BOH9+12D7D89Y8WX/6qGr/2VzdGRl59fnRqeT6ZiZb/Kw4lOVQYRgcmCILoOjLgqK66KPc4EIB4aK6SO3T9xgcwe/nTK9NXj7x25uzojZs3dKlcsq2Ei1Qmg7EtU+CObcYbpRBKCT9smLQXGEW43RHmMDZYWJbJ/NYKWoVR7jZDKCWCMDKV7TadMdiWEUZMykpLEOZRQYHO9UZxpRUVLfhUzTRGwTh0+1gTs2F9j5QKkJHY1N5RCK2JQAfNYSQSneKJBdAsdtCq4gJwzqLxSUKDIZAKXtiIorcalu1gcHQUQ+PjCMMQfqOBBd/H1XMX+rxi4andUxMfOBzYy88G3zzuTEz/1cJA31df3r57eiXXG+k/ijWVJuJdCTnk7y6MpLxJVQ4NoAhgol5Pf3B5dVtK8AcxM3N09fmvD3772rUjygun5tbWUKrWEVquKReVSsN2k7As1xhDFULGjnKkGsRhO9ZuXW75vsaGrS31I1IgVNOgsNZLm4azzWZ1hA5jNaJDYzCVVKJVNFqzjS9qqvGboZnZQ3zceDHnxhPQsTSuW1573AiipXu058oYY8sQp8rEqnmURxjVVmecgykNzQVCJqDthNA6TF2dXUax+OJkyhY/MDw1sS938MD5p3ZXLqzu3f/1Yi77xqUHPhCuj22Rg+k0gvU/YoUvn9kkSYcgCOIdouEDhSrDetVG3VcwtVQgLVsgmc4/UK4dGjp+6mHn1VOTl8+eP+oXlvetlQvZpWqFhRoQyRSYbUMLG+A2uDDrkEw977Z1lW1CSbSuEgyxMhzZU6YBzm+xfi17Hg8ErGWmIzHI7LOtj0V76knbMVsDVMu51xsP2OmLRymWrCNKe6uFbu03vmDeVN5ZFAmITj+6Ka1xNx7zTLqOZgxStwQiZu4UFMySVcY5IAQk52BukjsZnVitBjh14txw/uzFx3oH+kbdHdufOLJeWdm778CrpWTya+dyR2dm2BSAXg7UeHRiVAXsXQQ55F0j/g7kwS0NlpBQiQR0ucLgecwU7lYAAyxA5OuNXJ/rZKfm5u/d9crrj/cWCz9yZebmni+99ipurKwglckhlUohOzCIXjfRDHMppeA3gsghl2AaEFyg3f1E9Ntm+iyLlGmlOn3EeFFls35r7CzrVsWVDsc7tshot3Wd0wAWOdWxEtJWPGXTc9Md/295/x3Gtd16RqFCxkVbanp0Xbfkpcf2PvpdtQKRcY1ZaAYVKnhhq9GPZdnI5vKw+/tgCY6VlSVMX79hh34wPr60On7PevXhPRevz+1cWt6x9MADf+UN77yE0V2ro0ChcPS6LIz+DXPm58GHR+BFDS0IgiDeIZjoz2m2ZwxhIQW7PyNSQeB6tp1JVCrbKsW1vVMXFj7mzl1/9rXz53Lnb9wUDalg2Q56e3vQPzAELrhp3BMECAIJqYEgGnu4ZRn9Ay3BxJjq2J7GIU/dVhClbYSIo5ObnHi8UBNoLeI3T6Bpz299XeSscw3WMfq1Z4Pf5kY1q3dt/myHoM7ix1qpMErrWweytqhze53z6EEwsGi8RjMq3Xwp43DdJHKZHBK2g0qphMvLS7xaKedSN+YOb1taP3zfcgG7b9w4WRkd7rf33vctjB6dr9prxUpPphZs26rta9MaY2MIhICWlHbebcgh7xp1AD0AnoM7EMI9vITqfQ/K4OxFhj//c45SCWh4Eoxjjxc6T56+cHBQBT9TvHzx2RPffk1cu3ihf71ahdvbg9EtU5BSwbZtMMuKnG8FqbTJ24tbe+l2J3kj+o4Pb9TPN266MU38LaNbTj7bzPu+mx1s+K0z4th8FJtfQevZ1kv0JlttkOk3WGEzFmj4UkFCI9vbj1Q2Z8op1mo4dfUqv3j16sjozZufGT937uknp7aeqe3Z/Vdn9u//z1c//ak1dviw2r+wDt7fj5PJJCirnCCIdwgGgOcf2amdX39OLfihP1lYs588eW57n9/4XOPGjY8unrmQPnPp0vB6oZAVySTPDgyCNxom/cJxEGqAhWasaS7yj9TqOPOvVYX2VtGj/UQ6rS/b5HlDxys3E5He9LJ1szTh7V74piPQWx2idGuo2Oz8GdDMLd9sahCnTnYMPdEWoVLwwhBWIoHeoWGk8z2QvoflchlfP3US/TPX9/QPD//aluvzK3vuPfDC8vbR/+3VT/7EuQuP/hAmymW4g/24kM5CFq9sdubx8E8q+vcAcsi7RgjTm3g3bFESbq4u6mMjCqOTCiMjsmfPTgzduy+XLhaPbL984n7xwksPLBZWn76+uDB8aWUNs6urYK6DbDoDO5GA53lNoxYqBR0349GtLzMiFWFTteE2f9/eRG7+uu+E72T/GxNg7uY4bINfvvH4d0ri6XyGQ2/YkVJmcahtW3CSSbiJBBq2jUqpyErlsl25cKGvOj/X5wwOTuamD472razs2nfo0DfZvfdeHr8XN1aAemuPigEVCygqwJUmypgEYG9y1gRBELciAeS378bgxz6NhaRAJeVqCEuqZ59ELgl3MMmmdl+bfWjwW68+pWZnP7w0Pzt5eW0Ns2vrCBlHfzoNO5lEMlrUzoSFoJmXrYG4BwVMrvh3a0XMmynXd8NGR/a7sc+3d/Tb82aWfDMpjYFBhhJhKGFbFhLpNNLZDMIwQL1awVqxgNXp625+fmELZue2bLt5bUtqx7b03oce+UrvPfun08D5VaDAAMha3QqqdTtcLzLG0uHIxCE/paROhUIHFQ0dmhOwPIn17WnM39cPjE4C15eAr34JKNcBjMLkhFYAFO762gkDOeRdI07fKkHaoZC2k9ArqxIf/EGJX/olTHAePjR35aGJl1/5h7Mvv/Ls8xcvOLOLi/CkQr6nF9t2bEcinYYvFYIgNGFBraGgTTmlyCkH0NkaGOhYOd587DZ/axZ1HmvbIIrG3WLkNnrxHfts36A9FaXdj72NSN+5jw2HaeXHvDkdm0YVV+5omjffacv5Zs3f20OtUcYgtNao12oANBzHRjqdQj6XRqPeQGm9gJlKBctz86lRz3tk9NrVRx751rfOZnbt/k/LB+//8o3t244zWzfAWQgmwETeAgaUtvslQg1YHAAH1TEnCOLNiKubTD78FI7seggvjKVRyToAIEJA5orF7Y+/+OKPOidOfPbM/Pzey9emsbRegO0mkO7rNe3sNYNSEpZtNdMqpIo7MGuzKDHOj2Yw5ukOKR7ttGsjG9X0jS95M+Hm1nFno3XXzejnZkHUTp3m7gSPOws2nbu57R7fxHfd7HWMAVJphGEIraTppeHYSCWTSLoOUskEysV1lCtVvDa/gMul8kDv+Ut/b//pCz908MCBr1x/+qk/ujk19RUGaGHbrp1NZUS9LgYmdlX7Ju71tzOO/lWF8nUJWQO40Eh5Hk49tAUL/+wo9NRTwOtvACdfA8oBgP0AHADXYVa9kUP+ViCHvGtwC2gwYFFWn/iIX/2tn/PRN4RtWkw+dO3KB1Nzs/eVT5x44PWTZ/bNXb/hrHk+rEQSyWQKqXQGXDjw/TCqxSo7CnTEaRPNtGpmcqU3K9e0GW3p3t/x96k9n7vdCd+YNLJpCPE75JZdxvfjttZ7E26xgu1mnGGzpBalAcuyYFkMnANB4CMMQ9S8BuxoAWgynQLnprjKWrkCr1RBYW5xamBu4fPbffnxZ3zvr7cm03/4zV0TlxdHBvWBX/6Fem3lk+zylgyQywHHTwB/8afATAnI3fUtIQjifYywHVhJgYbrIBt46Q/MLu7pWV35gcbF8x+afuWVyflLl8bmGx48pZDM5ZBMp+EkTZUu3wsAmIooQJQWGYYANDgztrCZEMg5eNvC+duyYbkP2+yJu+E2h7ldNPg7iyve5tWbzhTe2YFNw0yEbNuG1hqe78HzGhBRAyXOGRLpLCzLQRgE8JVGqVbDiVOn+i9evfrB0bW1A48+8siXD2fzf8m2jb429Cs/sXiYqdz837zmvvjHL/b4VY9LmQqEdqtccMWYggUFbrtAKtm6xmbOqgVTm2KTqjXEm0IO+TtPm2vrA6gCCHjf7t1CjG7RK9X7VOLpB9nQrt19Ahjd9/prH9vy5S/9yMLZ8wcvzM+nFmpVBFwgm+tBLpOB4yagFOAHIQIvgI67jUVdzFr5063FMLp1Am/r5DWL2tm3SdObKeqb5sjdJfF5btSsb2fP7ybt5k6ve6fNhSn7aEpZWZYFKSX8qN67bVmw3BQsJwkpQ/iNOlY9D7Nra+lMubwTnod9s/P5nYPjbL16z0vpndvP7/rhx+dmE9y7nIr2n+dc/dl/Enq9pDDI5R1vFkEQ71c6pBU/DBHWqmK4ktiSmLvy2O6vv/CIvHr5o2fnZ7efXVjAUrUGN5lCpqcHmXwPuGWb0oW+D6mk6YQJUwVFKgWpFUx1rKgKiBHLwZkAuCll+1ZojgPs1sc3+/3tWjyFzddGte/z7brSm6V7vtM0yykqQIYSvlIQnCHhOnAdF66bgAwlAt+DL0MslcuWv7Iy1KjXh/ZfuTo0MDrWn/vws/cMPfDg+W3AlfnH/bUbc+tiTIZ8/GbdvvLlWcsrer6TtBDCg6xWgFIFGERr3QAUTJ3zOPpPvFXIIX9nib/zOlp+AaAgANe+5wv/EKlf+Xzw5arG9vmF3If/9itPq+W5X164dOGpF69Ne7Pz83bF8+Bmssjn80imTBPcMJTw/dC08YWp42q6j7Xm/bqVON5yxtvqpLbXZr2dQbqlpCp781QX/SYyd3P/uvPv+KAbJxC3bLPp/jbRVG5nCdsuUAKmxFbbc28h6+WOz3LBEIQ+6vUGLEvAdmw4lgsNU3ddaSCImidx20HCtpFIK9hOAl6lipcvXsHlpbVtU1unfvVAdeUH718u/MXC8L1/UtqSvYTIIYfSQodBBr7fYIFVpyU3BEFsgMHIlVErSKDhOhCqMvqxN07+Rv3ca587d/GSunDxfHqhsA7hJNA/MopsPg/uOAilRrXegOd5kErBtkyqioy8bqVVs7EbGDdNe7RqtrdnjEGHrZSNDtu5qSE1D+qN297pJW+XTcaat3ecW0eNjlh1R6rm23fR48jDrYdkkFpCSQnLspFwE0AC0NI8Bph65owxKGgoIaAA9I+OQQC4sbSIK6+9OtjX2/vpx4PG5/uX1k98MzXw2/9lcvwvz/7m59WPplz28BfPJGZf/BO3KldZIsx5HApMUirKO8H72yFPJoGhIcC2gTcr+aM1ICVEfz/c4REkmEC4XEV5vgDtrSOvihgqV5AOQ4Qwy+2KgL4JIHj2KeC5TwAYwND0mtxZXJPFowewCvQ+ZRUe2XLzzJPeCy89vHD98uEb6ytYZ9wNXBfJTAaJRBLctuHJEFIBKlRRFzLWTEURUWdNjagFvNbNiiUx7A5Sc5zWEv15W4Xgnf4KvuXskbepQehNfuu4CXe/g86wQfy0VrAEh20lYRpdKIRKgzFh3qco70/J0DRTEsKUS+zrRyqdxcryMmZWllm1Wk77szMHt86tZLMHSofvr2/7z319ia8e2711ju/YFoz90i9UVV3KZfsa1M1/AZSrb+t+EATxHidqnoPHHgP+yT8BLAt96wW9Y2U9LOw/gAaQevT6jX07FtcfzMwuP3zjpa998Ma5E5l5rbHuB3DzPcj29CKZzkAzhprno+H7gGawE0kkhYAMAzMOslZE1ggpRjVXTHa0nW9GaVXLKb8zrZHnzmPBZjLSW2NT5/aOp7nx0bcx9jRFs9ud/8Z93nptt6j4UaoIa3bNNtqf0kb4QbSWKa5jDi7AwMBsB0xw2JkMAiVF1Wukzx4/jsry2v700OSvjt5/35an0vu/9npq5NLFI1P14H98zlo8MaNLtRpGeID1+1MUkX0HeH875Ok0sH07kEoBvn/nbbUGPA/Wnt3IHD6CPJJonFlE5bUrQPkqeuQ09jYaGA5DNAAkADYL45SvPvkM8A9/BQAwsbiEp65dc/56xxhfnZ179KNf/NI/CI6feOrbC3Opm8vL8LVCrrcHPZksLNeBUgqNhoeGF0DD1BC3uAATrKViR9/zuImA0gpQrKPNL2A6mAGIOn9tSA2J9tGR1/0d3dwN+dptU/w3E7Df0v7fxo423La3eAZvvo3WCsIScBwLMgwQBAGU0mBMRhMnDimjzm/QUEJDagY7lUA6lwIXFoprqyiUy3hlZtaaqdd23ltd3bn35tS2sZHJ3jWmXyju2nZm/Bc+31gGdGP1HFN/8AcaFXLICeJ9iZRArQbce6/5ATC4WsCjV2fFpakxZ3lp+f6HXvz2J7MXL3z8YnF127dOncLM6hp6+vuR6x9AOp+DsG34oUS1WkPD86AU4DgOXMeBZVnwtYaUkeMfjRWc8WbBgI50w7YW9m9vILnzizZ1j+92ALmL1Mo3PeXv6MVvfePbiWOaIYpSWCZRRJpFtqYLqHl/VNScM25pJ7gFP5TQYYhsbx96evsQeg3cWFnB7OlTyW0jS08eKa2O77tyZeLPn33iby4f2Pvqwz/7SG3uyoq6Mn2TbRuVWmVrVLf8HeD97ZBHqjfC8K4VcsgQCAIoWFDR67SSYErDgoYDkw7hASIH4ClAngT05Wg3nmVbUvFtHz19/u/duHbls8e/+XJubno6WYZGsiePjOsgVAp13wcLZORoo7mQhkXhQWgGphWUkgBn4JpFtcdVFErkEBsuwXQza9Vg7Zir604HvfWizR683T1qGeaNL++sQXvrPnXbZGDTyN7t7Hqb1MFav97uBJv7V7FRbrsXG3WZ2+5mY73EzhMBY0AY+gj8Bizbgu24cMAQhAF836yG51wg4boAY1BSIfACLJaXwMAw0NeLsclJ+PU6VhYXsVgo4JsnTmJlvbB/p5Zf+OBx69FAq/9Y3b71b8uWKIeqkdBV5aHBOmdaBEG8b/E5R12r3NFLV36ourzwufUrl/a/8OorE5fnZpEeGMCOvfsAS0BzhkqtjrpXQBiGEMJGIplCwk1AK4VqpQLP85BOp2BZoumUG2c8KqUbKbXNal5KdRQaAHDXC/eZZnccdtqrcTfHsLeo5sRpMZsWc7mLsebWc2rbrClCxU3uNukEuvkr73TKtzwfj5MmEtG5iRHfWh1LpZSQWkWRc5PmEr+PCceB5SaQzGRRK5VwdX4RlVJ1YqJY/NyjQv3II0z9+ez+Pf+8Cr6Gim/zmgqRUIrd2lCV+A4hh1yp1s+bbas1EEroIICGgJYBoCUsreBrjasamIP5kI4COtnTwyqPPKKrjz4CAHwyCLJbZ2YeLV+98jFx4dwPVi5fmri6toaCCpFMpWGlUuCWhcDzjYqtJBCF/Rhj4FxEzrhJTVFKAjAr3BnnxjhFi2zilsDxuWulIZUGZ60FjVFE6xbjt5kx3BhouxtuG+TbzAhGD29ugDtz6NoXZN6aMNKJ3vBLZ35iR2beW+R2Z9sGY6YeuZSABrQCBOPQ3LyXHCYxX4PB4gKBNvmZfijhagCWhVQ+D82AhlfHxcUFp+h7O3ZeuTwysbI8kvKePFQ7uPfPCtnxY9bjn+XrPZL7CDRCrSmcSBDvT7jWbMj39Z611aOZteUf8k+d/OHZ8+eOXFpbw7XiOnzXQU8+BzebhRcECGWIQCpIqaG1ceI4mGnQpjSYitrbR+OIVq10lWaHTR2PQ62ukloZYeg7upZNHrtdFPc2Os6tj91m0GgfZ2LJhbdtG4+XGyPJG4916/h5u1Hqu2Gjo/fFvGMbTtao5wwMmqPZCdWUQRbQMKmTXhDA4gx2Mok05wjqDSw26m55+sq4s76KiWr5swP1WjjVM/En9pbBU7a1jrJXYdoFR9v6BOI75/3tkH+XsAF4AM6itcb4KUCG+/fjxd//fdTGx5HxvOyzx44/NPH66z937vr0J89dvMgWi0Wk83kMDQ5CWDb8wIfX8MAYhxBWZO+isF8zL888JnUIpRUE42ZxYDQjFoic8rZ0FRWFsEwMizdbv3ekrMS/tD/RJW6npGz2+J2UjFs3jxV83ZY+s9Gktxztze7J7bP62h7RGpZlQQgLQRCgUW9AQ8MWNhzbAecCUmqEQQilNbgQcBwHiUQCUoXwAx+LixVoLZHNpDEyMQ6mFZYW5nHm6lV20bIyR1Xw+GNMPT6Vcpi/Y/uloQ/+c+sKpoOb+kYDQSOEQzaSIN5nMADaljL18MXLw0cvXPpMbWX5V799+mTi9bNnEXKOwdFRDI2NoVyrYbVYgFIanHNYloVcPmHU1EAi8H2EngcRRfKSiYRRVcPIZsVVPRCPT2gTgszJ6E07HX+X+C6Ztw7rvyGlsuPcozzs28nxd77Su3lO41ZX/s7qOWsb6JRSZkLEzBimVOs94YLD4haEjqLAjMHiDJpZJmob+Ai0hus4yOTzSAwMoFosYm15GV+fm8WWF1+cPLKy/BuHPvKRzPChA7+5slbSRQ9gCSvQpnQcDTbfJcgh/+4jNGNi9ad+Kiz+g3+gasPD2Nvwjjz48rc/1XjhhQdfPHXi6Hy9wepKIZnvgbZteFKBIzQiPTMz3U7jEIcBNbSW0LEqLkz+ntLa5HPFr2GRm9lWWYVHCjq0UWw5ixzzSILQWker5I242nToo5QZhU0aKbSxUU1HlM9ubFinoY7V23iiobQyOdYbct474om3CWMKEa/8l1CReqO1MtvE0QUe/2vugY7VGxapBWgtiDFBk9bNj1/bUaGmXeqPbaJud+RZtA8JrTWEMLE9zpjJ79MMiKIV8VVpGUJp3rw93DILdaXWqPk+mNawEknk+wcglcT1+QVUvvxlTBUKPzH5+BMD7sTkX+nx8Rdv2oMh1CmGsCpgyvp8J7yVhCWCIL73MOF5OdFo8IDz9Uml8k+cOv1o+tgbP3Lm5MkfnFlZcRbW15Ho6QGzbTDXRblehyelGWs4InvMoKVJZ+QasKKvvtAAUxrgcSqHSUthaFvDhFbKhNIqlmEBzszfTUexuXXzbxaldBh0SzwCOlvFN+XpTp94YzN5znFLAQPzUt0RMQbrDCKaQgnxxhsc4Sgdx7JscM4hpYKUEkpHY07z2EYYi8exlryjm1Ft2YzEx1HvlpgWXxRnvE2Ia2vu1yxtGOWIw0ym4vGpKVhFY018geZ+tq7JVPsy4xgHixZ6mnHYDwOzkW0jlc+DuS6Knocz58+jN/R/JH/9cu7IUO/XUnt3fW1xavtNDWiEgYDWb6aU01hyF5BD/p3CABYEnPkNpqWUDuO6956Duv65H1e4//7kWL2+956XXv65oS9+6bPPnznde3Z5iduZDHoHB5HMZFCp1xBIBa7Ml4hvkGI7wmiRsdNMN0NRZsG7qXndnMEzNB3IlnLRrg+3apY3mwXpaNEH0wDjxojy1ow7tlZaobVqPj5BbFSajUPP286D83Yj3GkcuOIdK/Fb/i5rnnO7Ed94cBVdD2/m45hwnG6z3Epp6KgSgQCHhbZjcm0qBbAo14+Za2SIDBZaOYAsMtw6PnttzqBd1TABCAUZGkMuhN1KE9LarEMAg4gnPNBQUpmJQmRHLdsMiaEM4QceAA3XddCXGYGUEuurK5i5MYNqrbolsbL82aGpLT1bHnw8d++e/ceuJUdvllNWFQCD7wO+bxYYtEa/uzWKb2VbgiDeaSYnwaem0FMuglcrCHJ5VA4f8t2h4b49DW9i95lzD0x8+SsfuXDxwtOnpqeH1hoNJPN59I2MAFzACwOUqlWzxki0hn+tNWTU8ZkBEG1OtNYKWgKasaiiSictT0u3hgoWLSjcJElbs5ZQ07TR2jjzOnacY2c87qjZJoSwWOnVxik1Y0M8ZiFyXKNzR8shb44fLB5L28cx1jzxpqCFtrEq9ue1AoMGFwwMopnSEgtA5lCymQHLYmc72jfnAk01PL7OtuoMcXoqg6mU0lzj1GaJmY51tEi4i8Z4HR2npeS3CV9tdXHbL5tzDiGMP621gu/7CIMQlmUhmcvBTWdQq1YwXSlj6bXXJ7deu/KjI3t2TW1zsn2HB3a8eKUH54o9uQoefphh+RRHtaZNa7wMgAkAywDq8cmQw/4mkEP+nRArC57nIPAtZov6rg/9oDzys39fXXrsSaDR2P/xb7z0eytf/drR/3r2jCw06jzb24tkLgfbdREoBTARdXTkMHUN2x3ptkDYBivY+hKbL3VneK3tFNseVjDGyhaWUcqbM21zLVxwcESGN34tY82FO0orSC1bKTRMA5pFqkB0aGUMiWMJuLZl1G+tNpTDimf8xgkW3EQFwjBEGIZtq/Zj49TKo29eLzPqS73RQCglLGHDcSxYlgXGzcdaatPF1A8CKBnA931wAG4qDYsJBEFgFrsoDYHo+jkHZwKKq/hNaCrn0TDQ2RU1UsZ5dE0sGrR0UzWKjWJzdy2JR7feIGNwdXNiBAmouFYuM2+eVAph1Jwjm++B47iohD6OTV/L9a6sfHpftbbjw8XVv/rq0aN/fCwxcAkA4NcdNBoMSvlgrF0quRvDR9XNCeLdxGc+A/sf/wbuP/YtjBRWcHP3Xj2992AdIXc/8Oprv9Z44YWPfv3Uqdzy2mqqrjVyff1wUmloxqGgAcEhYAEKzZQShpaTx2IbfcuBb33kTsTGJa7sZcy/bopK7U5vMzob2TbbcZqikhHYI1U+1lviNVSSAVH6jBAiUu7jC4pPu2XuOoQgBeg2JT5eGMmiEsLxuMPbIqS1ag2+70PYFizbgmU5EFwA0VgUSgU/CBAEIYIggFYawrKbNdmFZZnfI11fRdFqUxHFjMM8uh8sGi/NRCMW3aKxhsdjJprVVKKs/w6B/3YLSdltfm+fxKjYP9AK3LaRzGQQMuBmpZoonb/wxAFmbftItf7Q1x9//H9+effel/Hv/p3GP/5fOf7F/84BVwL7NPA4gK8CeAO481jCYOrla7zPOwqRQ/524RysWmNsdoHVH31UJT7wM/7hs+fV/h33oO+ee12+tv6Ryuk3fm71a9/Yc+nUKSzWaiKVyyGdSUNxjkBKqNCkjjAmwLQp3N8yZd/9iaLx+TSCMIhm3+YLz6N27owhSh9RLWOlBZSSCFUYzaYtCNeCxVvlrpoo3VQ0fM9DtVwEtAnvyVBCSuMgq+in6fDz2Jx0RgfM77rNmMdKiklNAWdwEy5sxzF597ZtjF6Uv80EB+MMQnBYlot0OgkojdAP4QW+GQhi5Z2zaMFn+3+x8s+iCUek9qN1Tm0ifKzjbxL2vNs3qG1Aif6OPXIFQEoNzjWYxWA7Ljjn8Boc69UaVpbXOCuWD95TbyTv53bWfeSR//BKOnFi9LnnvCnfT1965RU3CIJgy4MPhpZto7q2hpUrVyDfrNwnQRDvHtJZ8P4B9O6YQq8/ipU9h3CPYk/ljh/7+eo3XviBiy+/3HdlbRUilUSmpwdOMoUQDA3Ph+YcJiuOgRmZuZmiYpzy9kzodiN8Z1u2caRq/1sphTg8y5huKsKxfY0FKMZgUvsYQ6jCtsgrosWIUTQ4EnBsYcFyjbrbqDdQrZSNPZcmzz0IAoRhGKUyqqZdjUUgNBXyyL63G/LmONRK+UQk2AjLAhcClm3Dtm0I24ZlWeCCg3ER9Z9wwdJJaI1I9Il0kMjJNbuOShTHVdHaBCpTttAcV3A0u6DqaFzm8boxM2BD6Y1R5/b3QLf9f+O7yVpyeVt6jNYmHUlpQDMObtkAACeXA/wGm1lZFXjt1SlWrvTsB7NyTz/1hxd7e7829/lPVbwa5/jzP2eYXQZwVPc88GFYuTTWv30MslIDBzAZnc/N1nnFEv77Wh0HyCF/68Sf5iCEdiyOraMCn/4RqX78Q/Lel17G1sX1wdmb0w/lLl/4HyrHX3vs+ZkZlHwP2d5e9PT0QnOOUrWCIJRgXMB1bDCY0ncsDplh4xKRWz+nm5nIN3cB45l8aJxJziE4AG7SU8yU2+wldtg5AKVMaUdwwBIMlhAQQpjSVlJChWFU+1yDa2NApNdAUK+ZNBzGwLWGxRhszqGaEkYrRMc5R8Jx4dh2ZKh0s56qlDJSshWkNMcMlASDQMqy4TguwjAwbYEbDXNtgkFYArbtwHETcFwHrmNDa4bA8xHI0KgVPIpOcNZy/JXqmM4blYS33cWoskDTjqjOt0nH/9vwjmzQpuPOpk0VHJHxjUOf0eYqHsS0hgxDMLQGFjeRAjRDyQ9wobDuVE6f2fd0uTZ6T62WOf/4Y/+fsf37z+0aHg7Xg8DxXJdNbdmiUvm8mj9/HoWbN8khJ4j3BgwARzqhNaDq5RrqlXVbzE/v2HH60q/gyy9+4sUrl3C5UAAsGz29/cjm8wiVgtfw4Pk+uCXA25Rkptt+No45bdpIrLQawWKzUWZzP0pDR2uPWDONgrU9h6g+dqyAc84htUKowsgut9Rpk9IXjTGcwRIcsGwwZUEHPrTvN9NQmJSwosmFbTx9cMYguIiioEakidX7ZmRSt3LY4/FGK20casaQchNwHAdSKoRSIghD+PW6OVdLwLIsOK4Lx7ZgWwnjuHMGPwgRSgWpQsi2Dpc6vgXR9cfquVQa8QjUig7DbBxHDpoBVg7O2tMo0YzEtnfX3uwdYrrNHW4OQuYPpaPKOlHEgAsLyVQSXCfRCHxMF0tYP3su/7Tnf+qBuj+ee/hp/417t371yj/9OalXVhn+/XEGlGTfY48htX0SlbNXISs1CAA7o+OvAKi1ToeisSCH/G1gHLdgbikZTA0L/bOf9vHwYQnft6XSI261/NnU6uJPHn/j1d3nL12CTCSQ6+tDJpOFZhy1RgNewwePnHHHsiPVOIwWGALtc9y4julbmTy2m8x2H1FDgwlu2rhHiyk1gFBKsGaKsXEKRTQr1lojkU4hlUpAa2WcWd9HtVJGrVpBo96AV6+bNr1ag2tzDf19fRgdHIBjO0gnk8ikUshkMsim03BdF8lEEq7rmnsQqQyum4Bt2U2jGP8EQdhMZwnCEGEooQH4QYCV1VWsra/BC3yUymWsF0uo1qoo16qoBX5kTI0DqwEkUmkMDY2gtyePMKoYoCIHO44OAHHqiLlxWvPWwlBmjKRJU4wWNulIaYiUe5OHvmGBavN90B1vUKdywdr/MJ8FzhAv9I0HCh1VRmDclBfjlsDY5CQa5TIW1tfY3xUKvbuV+siPazivPvHo//6X/f3ffPyXf1n2/u3fZha+8pUEXLcqkkkPm5wfQRDvQnozHE8fdvDIwUADyrMEBiu1p4ZPXfzC2a9+46lT334VDdtCtqcHbjKFRCqFUGl4QQgNwLFtsGhxeVOVRpSmgs40lVi9bhcKgDuNQC1Hrn1bxhhsS0SmUTfX/cXHNfkZMMpsXOVXMLiODW6ZogMcDCqU8KUHL/BRrVTQqNXgNxpQngd4Pnr7BzA6Pg7HdpBKJpFOp5HP5ZDP5pBMJpFKJeG6TlT5yqSPJBIJuK5jUkWUajrkYRiaSG403khpuo+GUmK9UMB6sQjP81AqlbBeLKBcraJUKaNWbiCIxhPGGaRUSCSSmJjcgnQmi0qtDqVMXkZcYMCkuuimJ2rKGEcpmZxHuehGvrIEh7CEyeWXKopYMwhhgWseOfrxjKf9vYjf3da4054+araIJz7tL42mUjxKh+FAreHB4hpjW6ZQL5exPLuAr544iX1+eOg+hf9XPvOBfyGG+v/4xv/yq6hPfA34V99iuriqdSg70mc8ACMA7gNwEcDibT9X7z/IIX+LSM9j8H1rdM8OOzx4UFcevjcUjrD2XJs7kCqWf2jh+tXPXJi+dmB6ZgZVzpFLp+EmU5BKo+bV4fsBOLeME8oFlDQdsxCp0YzdPvfru0Hz+8bNohSgpURD66j6ioAlLAhhFh5KP0CxUoYMfYR+ABmGkGEIAY284yCRzSKVSCKdTCLlurC4wNapLdi+bRsSjotMMolMKolsOoNM5JCnksYhdxwbdmQoLcsy+dexYxuvTI8UchUp5DIKg/qBj8WlJaysrSEIQxTLVawWCiiUSlhdX0OxVES5XEaxXEa9UUe93kAgFSprqyjxdYBxcG6OKxwLlmUmBwyA1OY4JuQpARnnGEYr49tvaAcbl7du/h5s/ngrRGp6DxllydQuNw6/ybVUUZ6hqVsuLAuW4yCRzqBRreHm+hqsUye3jnv+Z4a1wtrTT+pif/+JwjPPFJZ9v0e/8DzKL74I2WjcNp9cAEiildjXbThMfa063h3nQ7y3iD8zWQD1TAa1QwehensBz/venghjpueFDM2aoXaPNy5NG/fFiJ2m9SLHoX0cf/+zKvHAg+G2Yik73gifwfTsz8+ev/YDF06fETO1KvoGhpDJ5yEsC76U8D0fSsN0DbaFsS9KQUl9izN+J97u960ZcYzsuFkQieZCmngBabwgXwiBMAzhV2sIIrurpGxWELMYx0AqBTffg6SbQCKy1VvGx7F96zYkE0lkM2n05LKRQ541DnkyAcuxYQmrqYo7rgPbto29bXPIVdTQSDadcd0UrVZW17C2to4g8FGqRmNNoYDl1RUUSkUUSyUUS0XU6jXU6g34oUR5ZQWFlVWTGB3lxxsV3QUXAkoDoVIIo74iWsP0qBAmrToWeKTWzTQVqc25KakhmtFbiU2jsnd8f3THaNVcxBsLVMqo6JybijSe78ODQq6nF+l8L+o1D7PlMuS5M8m8Cg9NAb/42LMfVKmxga+c+cwTy/68YHqc22zlOmOhDBGlpfgAHACjMM65B6CM93nyeAQ55G8RFUqLu25i7MNPwt21UxYAZ9eVGzvue/34c3Jl4aePT09vO3b+ApK9PdgyPm4c8UYDjVoDUkq4totUKgnOOVQYIgxM+ogJz0Wmb5OC2/o2prM5D34zET363sVOZlx7ljMOzRgUjNEzKScaXCpwzWELjtJaAQvzNwEpkXSNCtGfy2FoaAiDA4OYnJjAyNAwBvv70ZvLwbVtDA8OYWhgAI5lwREcVqz4onPNTbtKq9sf4/HjAoAd3ZLOfDgNYPvwYPN3XwHVRoBavYZCqYS14jrW1wtYXFrE2toaKvU6bs4v4JXjb2BucQGJlGlT77gu3IQLkTKd6LhlwYIZHEIJBJCQMlo8055O0pZzaYQJ1hxg4m02viW67b3YSDNPPpJM4rqy8U+s7pi8TDQXCmkA64V1JGwHfUNDSCQSWC2V8DcXLmSeYey/+aTG2J889fg/vjk2doz95E8W9Je+BFy60sob2oTYYCbxnddO/G5gAygAmMW743yI9xaxCjkEwO3rw9Uf/Sy8/fuB9fXunJBut2K3/tpRCqNe55iYYHjiiXAnYD11+cy9k7NL/935C9ef+OK3X4EUFiantkK4CWjG0AgC1BselFIm15lZZlJvrHxkf+P1L/qWw9/aPI1Fv22S/8A2NyAm91shDE3aR7NaCo/X2jSztyEYg8U5bCEA30etUoHXaCAMA6hQwuIc+WwWQ/292L51K6a2bMG2qa3YMjqOXDaLfCaDhOvCtmwkXRsJR0BElq1jrGk7u+Y1MgZs6Mtxy/2PLnlrf3/TpocAGn6AWr2OQqmEQqmI9cI6lpaXsba+jmqjjvnFRXzz269genYOqWzWCE6IopuWZSKt0KbCWnQ8BZhOztE6KLN41eTCMybMglMhmtFYFRVX0Kz97NtNe0spv+W9jiIXcRPB1i7apXQV9ycEA0cQSiwuLiOXTqNnYABCCKwtL+Hvzp/HE5b1xIMu35N49KlfUQ+O/PuTf/RJKzh+0VF/eMzSCjXEGTow4koDJp88AeAYgMomn6P3G+9vh1xLQNaBUAHhHYZ5zgAvYJhfEsmD91qp555Tp3btrA6GMn3/tRv7Js6c/2z54rlPX5yeHr94cwZKWGBWlAsdJXsxxuA4LlzHgSVEc+GJkmFUi9RCFE+MDrqZU9e22GRDusGdVPXmPqKIFo/CZVJFi0nAYFs2bC4gInWgViqhsLqO4toqejIp3LNtBzKpJPp68xgcGMD42BjGR8cwODiIkYEB5NNppJJJJFwXFudwLQs257CxmUFsO7c2e9FaaLqxbm3st2+WAtLaJi2AnrSDMO3A68uj4Q/D8zxUa3XUGg3UfB+Lq6u47+hhXJ+bR6FcxsLSMmbn5rBeXMfa8hLAOGw3gXQ2i3Q2g3QmAw2Gaq1mUnsYb+WQ61hliM+hFW4017ZJWhy7gybF4nXyunlxcYpLHFZsry/LANhuAgoaxWIBMpAQmQwy+R5wxrG+vIQ3zpwVOxh/7HEl/5/nPvzB3z2eSf/F+HM/gdSVop4++TyCRhU804OeH/lFqEoRhb/83eabIvDuUcgFNu/aRxBvBQHALpTB/uJ54IULQKP2pq/5rhIEsNNpTO7YhcT4EEquBtcadcfCaj6JRDqJVL4HpYkJ+PmcUdJtK0wxBzsbHA/dnP5k//kLv3ru1OnDx86cRbXhITuQg5NKIYhymzVjcFy3eUilTDk7DdXKXGgvWg1sMK1tbmxTCLmditDSVDbaCcE4bMuKxjo/su0Crm3DjdTtwPNRKZdRLhVRKZWQtG2MDA5geGgIffk8+vr7MT4ygvGRUQwPDWF0aAh92Qx68z3IZTJwbQt2lBMvNrmM9vGhHRmlKkYJGfG609a2m6TzxdY8tkN514F0HYzmc/DCETR8D7VaDY2GB0+GWC0V8eCR+3B9dhbFahXzi4uYmZvF6noB80tL8KUEEwLJTAbpXB7ZXB5MCJQqZUArWMKBZgx+lEIDDdiWKZ3ILGYWsGoNJW9noVvjxOZbtFKTmgWG21OUNCKF3vyRSqbAOFAsFbFWKqEnm0W6pwfM4lien8eZK5cgv/hfe/ZV67/58LPP9vHJsd+bPrK7MjvzmIu/+CPZtwpsA5CHaaCI6Nh5AAcBXAWlr7y/HXKRBNLjQCoD+HcIXUoFZDgwsYPLZ56SjX37pASSY9euH935xsmP18+c+ZHjVy9tvzB9HQFjGBwZgWJAvVIzlT/A4dquWVAiOKQMzcJKpiBs09hGM33LrPz2xMl3bw2TBcE6lVcAkBpSmnxrJhW40rC1wFCuF72WgwN7d+OJxx7CQH8P+nry6O/rw2BkMDOOg0Qz9711VjIKeYXR2XLW5mS2VUxpwqI6tIjLU7XXHmdxLk9zWxMOhQlpag3GhWkKIQABhhRnSCdcsIQL5HPmnADU9U489sD9WCmVMLe4iBszMzh74SKuXb+O6Rs3sLK+Di8IIOs11LVC2GjAdlxTVsuymuE8rdBsR4zoseZp3jYR5M6Y9yZy5qNSWG2rd+KNWlaTcZP3DsCyHCilUPd9iFQKiUwG2TDEteUVlE6eyjxXb3zkkMX52mOPL+x45CMnEnNBvRqU9dyNE2D3P4H8Z76A8PwJ45DH72HbT7eJezQTxHeCBBCWSsDXvgITd/lef6rqsJIDGLuvgez+PVjMKlhKYT3tYm28Fy560dvTCy+fh8znkYZRE7eulQefvHTlSP/J4z9z7dSxJ751+hQWyhX0j44imctDAcZuSZPCZttxExvZzIWOTUcsbihscMCifzfTWtuffytwAExwCOY00zJ1KFH3A6gwgPQDaCmRTSSR4gJTY6M4uH8fxoaGjCM+OootW7ZguL8fOcu6xWHZ7JxNxk+UGw7dtKvt5XmhTYoIA6BYXDEstqsbvNJIJgnDsDnWCNGqDuYyhoRtI2/bQDrTfKkE8Pi9h7HmeZhfXMS1G9dx9sIFTN+4gSvTN7C0toZqw0MIBu15qBUKYJYpScxtDh1KI+gpmCpsUkMyBduywIUFBg4ZBFA67KgpfzcYJ71D/mlz31t3tz2NUlimsozr+Kg3aihVquA9eWR7eiFsC3MzM/jW6VMOLxXv2c3kTx/9yEeW1cjoi7XdW+btew5g2/Wb2A0JH+C++WyoAMYJ3QmTukIO+fuZRA8w8jCQHQAadwiYlOvA1KDGZx8JGvcf0Eta2x8+d2H3fSdOf7y+uvKj5+Znt1yZnUVdhsj39yPbk0exVIJXbyDNBSwmgGgBXhAEADS4MPlktm1HCoIHoC1s1CYdt+quxKp5KyTVsb46Tgu5neXUrfwwyzX50tAa9UoVpfUCymsFsECiN5vD3p27cf/hI9izfTt2bZvEQG8GuUwKqYQDO0p3iWu/hhpRbmJUjQUMlmXBskR03Kjhg26d68bKJQDAwW/RYljc+aAjNsqad4KLlhqtpIYKtXGIOQe4WVHfHryzGUPWEkjkcxjOpHFw21Y8cvgQ5pZWcO3mTVy4cgXTN2/gwpUrmFtYxOz8PNxkCuO7d8PNZBCGQduNjnfcCgcqBrC4ZGSber55n9O2DD7dUsEFN5VWpI4mKcrUKwDn0AxQTEcDDVCrVqA1kM/loZVGrVrFeqGIlOOip38AgnE01gv4yrVpHHj+xWc+15C/M2eP/9+XBkb+/L6f/b/CPdCPa9sn4a8MQn/x6m0+OATx/QQHkAbg4ns/3RTQSCNwHASuQGhxQClIYepZy6g0ns1NytiWdaBn5gYm5q7dP1Er/9OLV84/8M3Tp7FSLCHf34+R8Qn4SqFQrprqHFoD0qQkxospja0VzfVJWqumQt4ZWW1J3c35v24fd26TcneLyB7tW0nUPYmEaxb2W5aAV6+juLaO1ZUV1KtVJB0XW7dM4d4DB7Br+w7s37kdYwP96M/nkEunTK6448CKFuWH0d6VVNHidhZFz1pRVc5M4x7NRXN8ZNAwbRgQbQOTIhNfJ7v1/FsXZeqC2/F4Fj2mo86bcSPMZqfOtnFNAOh1HKRHR7F1aAj37bsHq6Uyrs/P48r165i+eRNnL13C9M0Z3Lh8HuAc47t2QbgJePWGORznsC2T784UoKUZ94QQUKHcPBLbvJRb3WwwRBH2VppMR9LOhvfXZJAyeI0GgiBAJpODbdsolYtYXV9DPpdFT28fhpXGytwsXpmZQe0bzz9wVKv/76O7tv32Ljf9u/i1fxTqbL/2/sMfMgCObQ7uITr2u0X46Tbvb4fcTgG9U0B+FKgXAa6Aag0o1tARi2swAZ1lGB4LcwD2zC317716/VPBmdOffePm9ZHppSVIy0LP4BCSmTTqngcVKlhMRAX+zSIdHuWrxdU8pJQQlkCr31gbG1LAWFs5vFaciUVG1jiEzdrZTTW5We3V7F1rM8NNOKhWqlhcXIRXr0OAozebw459+7FtYgu2jI1j/64dOLBrOybHRtCfdsFgPiyd82c0F71ohqh0ogkcWu0VY1iHiWtd3y1Rwc6UjVuDhrdqNc0KAcw4yTpudRnbFt0prltmYyQsy6gRAAaTSWwZGsLebVtxaO8eLKyt4szFy7hw6RJmbs7g5vwclleWEK4sI53JRGUUXXArGkRVW/32yDHn8T1/M12p7WmtFKQGuCVaEQx96x7apiiwhKliEPomCCiEiJqAAF4QwkmmIBiD7wW4fuqMFd6YOTR4/5PP7Drw2Jny+MHr9v4RD/0OdFEBQQCC+P4nNj5vL9L4ncER9as35UyZNpVm2yJrDKZlvQUgyYADtcpHMxfP//ypi+f2vnHuLFaqVfQODyPX24dqw0MjCEzDMCEiR1wjDIKoG6eI1gmpqKGZcWLjWuAdgcfYkG9unFvWdxMfvv0Jxsy4YAsLmUQCYRCgsLpqqnGFIVzLwpbhEYwOj2BifAwH9u3F/t27MTk6htH+fqRs0VxQ3tx123GbKRYsFjHaTmOD0H1bdX9jeuCb2WqGKCyKpsNtRHXWVN1bd641miul4ABI2DZg2+hLJDDZ34cdE2O4Z9dOLK8XcO7yFZy7dBmXr17D7MI8Kl4Dq3PzaHg+3EQC+d5epDMpKKXQ8DyEQQCtddQEr1VSsv1mNe/XrW9jfPcQ14QHTAqPGUI7u5TG0RQGmIIKUkEwYUo2J5MIZYi654GVy+C2hZ7BQTSqVdy4fh3hysrwfY889NkHnnimurBlx19c+tm/t3ZjKAv/L/6M6ZtzjGEAQA0Mphzi8u3v/vuG97dD7tWA5WtAowQ0qoDiQDoFjKYAtFRPJCEwkBBw7HBPtTLxzBunng0uX37u9dkbE6euXIGybAyNjSOVycALAhQLBQjO4SRsgMXduHSzU5fSCkFUwq9Z1J/FineEjpw6HjUFiBZxdKQsAICK2rszFgeYmipGZC+i/WkwLSEkIAIG1Gvg9ToSUmJ8eAiHDxzEA4eO4P4jRzAxOoKBpICDZunTDsNmFp4YxduI0VHeNO9UvNtnFKx5MhtDYu1bxs142hSa9l1thCFSB8zx+cYs402MkYZpsIN4AhHhABhOpzC0bSvUtq04vHcfbiwsoFAu45Vjx/C3X/oS5haXkBDCLLJpKGghwCzbLMDhHCFjpoRl1D0NsbGEUSTapxGt/7cmH3GZR85gOsB1XARre50ZRZlmSDpJaK1Rq1XNRCORhBVVKyhVy0i5CWR7e2GDY+baVZw4dQof6et57ODo8GLFGvy6rmdOgPdVolnTxlHptuMZQRDvCEwDkCYYJqyqt1utL//07PWLn/jGsWNYKpUxPDaGkcktCLXGzOwcFAA3WpDOwCCDAKFUgJbN9UKAsZXxRL/Ven7j0dEhBG32dDu67f/GButIHDILFQWAwPcRVqrQvo/+XA7bt07h4P79uP/IUWzbuhVbhgaRsURzihRXX4l13+bYBxbZRgazanMzpef2Z92+6caXbeq3brzWSHAxhzb3Ne5uvdletFaQYQiAgdm8uZBUA8jYNtKDA9g+OIA9U1vw0JEjWC9XcPb8ebz08ss4eeYsiqhAQcMKfFhhYDp7y9Cch+DNSLDWcb33aILC297GTWZPOnIQODMRXRVNNIBIWGu7jo61XNyUoKzUKrBtG8lEElKFaHh1rKyuIZtOobe3H4MDQ5ibnsa3Ll9Burfv0fzYtoRa9+vFZx77L1ceO1quralQ/59/JoABBszpjmrk73Pe3w756k3g+f/DfLkDCyhmgZ/+LPCLnzBBlWrdbKe0n7Qtfq+VwIELlx+vXj7/j86eOLb70twsEj09EI4LyRjqng8pJWzbBmMaipkC/5rHH2zVtDKCC3C0alXrKF3D5A2rZqMAS1gIpYTn+wilBOcCtusCMLVOZRDCEhZsx4aGRigDhFFNc9s2HcWYUgg9DzIMsDg3i8LyMkaHhvH4kaPYt2s3Duzbh6nxCYwO9GMgn0PC5s0wUqtVcSvVhMdVUPSdDdmbtzdqPaYRF27SiF3r2EC3u6/tv2oAiBzX9kWuG1X8jcfmvGWg9Sav4QB6kwkkJicgtcbk4AAO792Lsxcu4tS5czh38QKmZ2cQaCCVy6F/aAjpfB4QApV6HaVSCaEfwHVc2LbdVLFNSFmBczRr7EKZEHIcWuZMABqQSjZnVM2WyDpus2G6qnLNoKXJNXcitR/KLPQxCooNBY2a74EDSPb2YNCx2bFz5w5WPOk+9Piz2yec3X9wSeMl6SmL+aEFs/g9viUWzCe269FEC+93Y0V8PxO7UyIMHeF5oizs2mS1/tihUy//P6a//MUHTpw4BZZKYSifh5NKoVCpQGoNy3WNY8ij6ksAwAFucUDHCmgzzAoN09nRCEPCpFBqBcFNF0qtAClDIyBxAds23zoZSoSBaaZm2w4YMx01w9CMNZYlYFvCqO9SgmuN9eVlnL9+HblUCgf27cOenTtx+MAB7JjagsnREQz39SGZTCLR5tR22vzWg5pvrtq3P3Rr3HTjhrrt+VYn5lv2usGHbd5BYUV7aSnSna+OHV4NxnRUBSsWVtrPrvOIWceBO9CPif5eTPX34v69e3Hm/AUcO3kSp8+fxaVr17A8exPKEkj39CLb0ws3m4ZmDHXPg5QBEET1yi0By3LARRQpCQMj8nBT4ldrwI+awQkhmpHcZnRG36Y8RPQgF3ENdYUw9KGhYXEB5ibBINBo+PAZQzKbx9jWHTh24TLWK97+D33ww781uL7XqU6M/iH+1T8NsHULx//0v1jw1iRoeVCT9/cY51WB+YvRHxxACmBVYMdQ9Fhvc9OEF2QOX579UM8rr/7M66dP7rt08yYqYBgc6AGzbIR+COn5QKRCmNlw1AiBtVqq60hzjhfvKbRUima6A+cQUTjJ9z0orcEZ4NpOVMFDQyoJrRkcxwHTDGEQQmoJJswKe84BpULUa1VIzwOXEjYDRvp6sGNoCEcPHMAHn3wSh/bvx7bRMTgbrFIotSmFyyPzpnUzRNjklkovm8urbwWT7XdrLvlteRsH2bA+tO3YrbNPcIa044ABGBkfx8Hxcdy3Zzde27ENb5yewrGTpzCzuIhCtYpqoYB6vQ7uumC2jWQyBZ3Q0KFZcBpI2TySSSeK6tzGEQawppIVd2Ez59M6Qd38H9oiAaZVNKBN51QgqqVrjhenQzWkWaHvpEw9+OlLl2x+7dL+XRMj44OXxtZ3C2dJjPUsFw/trYlvPODI6RMh4L0rVPH4SoswZQ/JchPffzAwKRlv1Nn6tknP2ro1t7fu3bf7zOmfKH39i49feOM1frNaw8TkJNxUGn4gTVokGGzXjZawaGgt470ZFRlG4NEbnEatjX03Jr2V8yxlKyXDsljkdEsoaYQkN6rcEgR+s0KXbduwbAtam0ougecBMoTDGLKJBPbt3ImdU1N47MEHceTgQRzasxsDmVRnOkpcjQxoKvi33J/bRDujYWnT5+PXdlw7WgrxHV50x111jh2bm0kdBbM5j3p9xNfXNllg0ctNSoupadXX34ut/b3YMz6Ce7ZP4cTZHXj59ddx5cYNzK+voa4VGtUyPBmAOQ6YEHAcGxBmESu0RhD4EEq0xDPARE1YCMZEc21X65w6pysbr6N51SzyAaI1UyqqTBdX0wEAzzNpjwk3iZ5kGotLy7hw9Upi1+nj+3onRz//gGMvXRgeeLn0Y58q4HrBxhf/E8PylfY7/CYxmu9v3t8OeQeRQ47Eps/2+I1x6/Lpf7R46vX7L83MQrkJ9GVzYJbVbFbDYVI5lArBBDM/TecqlpN55Ji3YkTti23iBgkcQOj7aDQaYIwjmUwhlUpBM6DWaCAMJTi3kEgmEXgBqpUalFZIplwk3QQ416hUPJTX16E9D72ZNPryeTx8+CiefPhh7Nm+HUM9PehJJlvOeJul4EwDLJo8cJNZtlnnyQ7awmNxbt+bOejthkCY4aH5+G00kY5SiW9Km6G/87ncWuldNkO6xlke7e/Hs488invvOYD777sPx0+fwavHj+PEuXNYXFqG5BwDI8MYGR+D6yZRKVVQq9eMIhENXkIISGnKgMkwBGcMjm3DtRwAzAx+bfe5M81lM4UoHiVaxjW29E2rFiVTBkoh1BqDY2OwNdhrV672HPri1z72iXKjfu4jT/zxuU98+Fx+Jsyu/fm/Emr65QCtNVRdg0cnsQzjlBPE9x9Gc2WM2di61Wts3Zp/7MWX/onz13/98b87exYlxjA0PAzhuAiVkXSE7UDEymbcMr5tf80v7UapOSKI1py0IngKvu+BAbBtx7SIVxL1eh2BH8C2HSTTKYRBgEq1Ct/3kUgkkE6n4Dg2GvUaasUi6tUKXMuCcBwcPngQH3j6aezdvh0D2RyGBvqQT7rNRYRMa2gZN6RDW+rmXd+2lkfeJhXdUczRiFI/N6RjxC/chI3D423PJU7dYbc8YR7fUH6rva67VnEUw6SG5NIp3LtvD7Zv24pDh+7F2cuX8eqp03j99GncWFhAcX0dTiqFTD6PTDYLyzEVdby6h4bXMDn8tg3XdcA4Q+iHCIIQwrKRzWbBGIcXbXfLuN5c8Lv5XYzXHrCo70a8fq05yWEMgZQIQ4nRiUko38er0zfwyBe/9KEPlqtTxWee/L+UDu78Ev7on0n8UhH43d+Ji2jFAZKuR2S7BTnkd8GD64VnDr3y6i/OfuP57ZfPn0VVKmQHBpBMpdHwfVMOCboZymKCNxdWxk4Ri+rhMR0HytrSKbQG54CTSEBLCd/3YEWdK1030VwA2mg0gCg0mUgkoDTDerEAxhhS2RRcxwaDhlevolwsoF4pA1JianQURw8cwL379+PBQ4ewY3wcfek0LEQLZ7SOZtcAOG+WQ4zLI4K9efdJAGiL5CG++JaTe3tr17oXG+KPscyw4eW3pKK3v+bW3d/+dPUGhzeyym0VGqFhWhqbygcCPbaFdH8f8tnDmBobw9aprRgbn8S5CxdxY24WjVodC1emkcxkkcpmkXAcMAaEoYzSUDSEJcC4i8CPaslCQ3EzFdEyvmcbG1q3LjA2lG81OBArItl8Ho1yGeevXIFbre15sK/nuYnhvtesXUcuzvz9j8irmcvc+68Nh3O7zqJw5/ccZpoelWdnsTY9jer3/gwI4h1DcwYeBLBLNViVapLt3aGDD36gsX1oeOi+b7/60crXvrb72rHXsVAuI9Xbi1Qma5xxFUKDRcora+X/ao1WbfHNex3ETqcGg2ubMqmhH4C7DLZtRXYqQBAGkHHlDs6QzmbBucBqoQBojWQmjbzdA84AGfhYWltBrVSCCgIM9fVh944d2LVtKx4+cgT3HbwHw/194EojEVVEQXQeULE/3RpnNqrQHefe/trmY7Hqozdse3vrGGe/dO5TA02n+NYBplMNZ7e+tumUIkrp6LwQ1jzP9l3rzr91FC2QJvrgCgE3nUJq5w4MDw1iZHQMA4PDOH3+HM5dvoyVYgHrCwuoFYvI9/QgmUohmUpAWByNRsOkEwkOx3GQTKdhyxBKKlPTPD6VDZOSdmlad5xy6xkGFovlbQJQxw2B0ibym87m4NdrWF5YwPHTZ+BpPfGILT7e9+zTC6/29p6Vv/arErksx7/9t8DSUvSpeP9CDvkdEADy9frgtlde+Xz2r/7mR18+dw43anX0DAwgnUoB0Ah9Dwom305F5aZsy2624N34adUbv4zN302YMZAaQRCAA3CcBETChh8EZgFoEESVTOKmxxpShXASDhIpFxYD6uUyyuvrCBoNDOd7sG1yEg8dOYIHDx/Cod17MJHLtpU5ir6ASjWNAG8vqA00U2Q2qQNzC2/VQWy/DaZVfHP6Eq0cjXZ616rJncXcN91Lm4JhjE1khrWZEAEMOkoNGXAcDExOYKx/AFu3bMGVa9fw+vETOHHqDK5MX8NaqQw1OIhkJo2EbSMUAoEMIFUILhi4JWBz1xhHZTqobjox+Q5p12Ti99CyLTBLwAsDXFpZQur8+Z17mf2Jbclcyb5n17HcT/xIUBhJW8HZM5YqFgPubh41eidhnMNKJOBBozA9/T0//neJuxLX3sa2xHsZDbBQIsxlUB4bhfQ9eDu3i57tO+wDly5+YMdf/eef/sapkxNnSyU46bRxiC0LXrUKrTls24kUVW0EHh1/u+8OBpiGPXEZXm26R2omoMMQQRiAKVPPnAsBYZuOkdVGDa7joDedhOs4aFQrqJSKqBeLyDgOxiYn8MChQ3jw8GHs37Mb28ZGkbWEqfYerTmKZVDEaSO8parqt2H2Nh0aNjjo7V+t1nAS37e217SHXjd+GzeKTZ0vbPvZ8KKOc9Adr+q8EPOjlI46MUeiHWNwhMCW3l7kMlkMDAzinl078fqJkzh59iyuXJ/GSrGAUhhC9uSRyeXgui4Y42h4DUglESoJ13Fh2Q6CIIDn+YBSsKw3c/9aUdbN8vrv8DJomOpBXDDYrg0n4WK6UkHj4gX3I1p98ohtVWYee/R3Z3fvvq5/5me19bVv2NbSkuIDo3enjkf3x68UEdS/f+QacsjvwJZCcctzbxz/zOpXvvbAX585jYpSGBgcRK6/3zSZqddN2oFlgXNuHGnBYdm2acYQhG2LNnHrzDiCwTh98f6gzRczlNKsXOcmR4vzqMyeVCiXyxCWwNDwEGxLoFouYXVtFeX1AiwwTI2O4fGHHsIjDz6II/v2YjCXRtZNIAAQhgoWM6UJ4+YzjEUdwMSGCUTUrEfr2JjdIXUlVpYjZZvdTsreaM/Mi5qtgM3LTZ1y3l67ijU3NYPaRtmEoW2D9rvLNrGAHbvsfB3rtMZCCCREpEgpDV+GCBiHbQmkky7u2T6FPVMTmBgeQS6ZRcp1cfrCOawtLSLj582iz4QDL+So1uvw6nVwy4LtuHAcB0oq+EEIBsDiou1cb2f1YqW81dphU0WsTelvD9E2vAaEEBifnEStWMD0zevZ4Vz2p/ovXgoTlnvuoT17KnXlW9++cCKzVlquJ/J9jU12/47COINgAXh4h4Zd737iee/dDDLxmGcWBRDfv2gNq1ZHdeskrn/mGfh9+frwypr7sTNnt9pf/9pTL1688OhyvYHe/n5k+/sBIVD3PARBYBbscWaiskqZakxMd6Rc3OrYRsqGbkkqQWhSVlzHAeccfhggDEP4YQDNAMexjW1SyixSD0Lkc1kkE0mEYYhKsYhKcR1BvYH+bBaH9+3HfUeP4PH7j2LH+BhyqRQ4GPxQQUZjDWvaLbQ1p+Mtu64ilTmyVXcZl70VM6BuuP7OxzZ2hWaMAeIWt/M2bBh8YvFq40C18fd4u+Y4pm85HBdmvA/DEL7nIZASXFhwkwm4toWd48PYOjqIyZFhjI2M4OzFC3j1xHFcvn7DpKoohUw2h4TrgFsc9XoDXsNHGMrmYtx4VtIpsXWanHhUiT9LTW28/b6ytiEzfl37HEcr1L0GLMExMDKESsFBtd4Qr8zNjO1+/djTP8L4+a9/9EN/e7qnd3Hg/sfd3syEcia21pr35g5wywYYw+y3v4Tls6/dcdv3EuSQN5EMKFk9tZVwfKUIkU1j4uz5B/k3v/m5uTOn752rVtDT349UPgfGOerVKuqNBoRlmQY70YK8UIammUvTA283Q4YNLm/zXyUlLGEZoxeE8IMAPEpdMU6+hAxNRMcWFizBgDBAtVJCcW0NjUoFQ7k8dm/fgccffBBPP/Iwdk1NYtg1dcRDqRBq44x3hO3aC6l2nFesVmtAyWaznTeFMWPwVFsOenvaS4cx6/y1fbHP7Wg3Ei2l36wo10rBtmyj7GuTbqK1KU/1dg08g1m4YkQUBa5h3melYFkC/VFNc3fXDuSSCRzavwcvvfoaXjt5AvOrK1hfXoJwHLjpJJKuAy9gCJWCDANYlumohzcxQLe5E3g7vlu13kDSdTA0NooVwbG2vITjZ0/iQMJ9elsi+cvJnWP/ftaZPLVQeDS7sj6ApBuXxfruKfdvCuPgMoVK8C7u3VYuAzt2AL/yK0B5HUhlgWQSeOEF4KtfBTZ/c+Li1xrlMtjBg7B/+ZcxdP6C7G/4UKUitu/dA61U1ISqhYbppOELBiSSYH4KQoWcpVwz1woCxsKQQ4TQIbTmtkTSVTLFoOy3eY1hyLC+bsGy3hXVdt77MEApxkvVVKi08vt762kA++pyy8TZ81+4fOLEc5fn52GnMsjle2AlEqg2Gqj7PrhodeBU0nSaFJx3fCvf3BoYpTbwAwghkEwm4YcB6vW6qcYRNaxjgkeFAxAVFLCRS6cR+j5WlpZQKRaQTSSwZ2orHnvgATz18EPYMbUFU4MDyETN2qTWkMyMgLcEOjeKLIjselOpZremldwGs5A9asbGWadodBvx6O0l4bX2JcPQLKhnZkE9b2sytJk+fssDum183bhZVGEtnrhoxgGlYXGGhLDABJDYOoW+XA73HbgH26e24vmXv4nz166gVCyiWiqb3PJ8HsmEC+b78HxTCtO2bQjbNuma8m6yQ257NbfdPJaHNDPNEMEZ3FQSSZVFOQxwaWkRiXNnDj6WTv387i2TBTG59S93//RPMP2tM87ymRsaUvosk5aIKpdB3XqewnEBxrF64fjdndd7BHLImzgM2GIN6Wzw8OVZa1zW7l959ZUffPXs2X2zfgO5gX5kenoBLlCp1VCr16E1kBC2SVeJFmRqreEHgVEjWCvxYaOO2coQbsmYgnM4jg3XTaCmavB8HwJm4Q1nAjKIyio6DvLpDLQKUFhchFerIum6GB+fwH0H78XD992Hx44ewc6hgY6adUGkwtqufYvBak0LOqcP7SI3A1oz5Ha1Gqw1846uWCmJUCqj8GvdagnffqwNJZZaeWmtUJlGZ1KZaYPMmvlr7XXSQxk2my0JGOVIKRU57uxW47xBSG8OCJtsFA8qgjPA4lCBQhAEYIwhiCYpuXQS9+/ZiaN7dmLXzl2Y2jKB51/+Jo6fO4vK+iqkzKJ3aAjMsdHwTRoSZxxcWJFT3nYyd6Qt9Nn23txyTe1704iu30ReQqnAbRu53h40ahVcXlxC+tzpHdtHhn5teSBbvFjZcnWu90N+fXXKK1YvMSPDbZguvdUqBW8FJgCVAYJL79wxvhO0BopF4N6twCO/3fmW/d7/Brz0EqwgUFYqDWiFQAhIzpmlNBelokYqJb1KBUgkkPyt38LOuSUcunyNJ0vrXFSKXAY+C/yAc615IghENZm0Er5vJwREqiYTrNRIqlIhGaiSq32bA5qxUHKuQs58ybRkCsIKwXjd4qmayxJlnlYNZTtwgiBkpiP7xq9Z/G/8O+A4DJOTFrJZ1SzjQXwHaEAIIQd7U95gbwMAHlqu5o986/gPzF248Plr6+uDUthIZzNgroNqo4FaowGlNRJuApbtNBdCxnavuRbmNgHJmPhpDaNGM8Ei515GC/44bMe0R4/VWVtYpssmF0AQoFEsQtdryLsuDuzZgycefhgfffop3Lt1KuqYGXVdDKXpbilEK0Wk/UTQGndaLl9rUGGdm5lxpul0847rVEojVApgANe8Y3FoR0JJp3zbPJWNskbsJseOfXtt9HhEV0rBD/ymCeRRBLWVSd52qbd7M5pH2/gUM2UoOQdsG0pryKgqTshNsYSkY2PnyBB2jwxhbHgAw8OD+PrLL+O148cxu7CA0uoqHMtCIpVCwnaMGCejtVCRUh4ov7UmtnknbnOamyjom10f2/C8ZgyhVqh5HrgQsDNpFCtlXC+sp3vnZh8bOn7y9LZE+oLz4KGFa7CC4pWZJJiQAr7E/HXznm8yznDLXINfKdzuDr8neT875PEk2XzLx4eA/9tv+uqZD0MW1lwsLf5YZfbGj9+cm7FDy0J/fz/ABeptlU9s2yixMlJLbduG1GbRBGeWqSndTmSYYhGAo9MoSKngeT7CUDVrhVq2qb4RBr6pN+3YSKdScG0bxbUK5q/fQE82jUP3HsKD992HR++7D1tHhzHW0wOugUbDBzTg2gKuZYF1KCodrYTQcnNjYxiH2LhJZYmNnDY55zJqlMCFgBAtJ18DUQ110fGFjScHCqZyRshY1HpYGRVeKkDKpqOuGTONC6JzsCwbCZsjCVMqKj6WOV8O23IhhIzKeJlnYkPZ3s648/3Y8ECboWy64lpDy8Ck0HABwTlc24YtWvczbp9sRa/fs2UEmdSzyGRTAAfOXbiA9XIZRcZgp1KwHAecm3um44WTCm0r8TeHbRg+9IZ/2eZ2tWMr2zKf05X1NSQcB/mBAXi+j5nVVbz07W8njwTqw7sfTl4//ev3/E39L9Y8/JvXHWgWIJ9RyKVbBtLmzXr03100wGzA7TXddN9rPPccxMQk7lkqYe/8AkR5Bd/avQPXxib1PTPL4a6rV6CFxLd27MAsgCoAX9gQiVQiGfgjtpbDMvR7Ldcd2h6E4589dnwwcKwJ7vt9XsPTslBlKNWEblRFuVYS1UadSSXN5A6MWVGKm2M72k5l5UA6Gz6cToQPJC0F27GHfH8hn0pdsJKpEue8JDlbC4S1yJKpJZ1MrSjbKTYAGQLAxITCb/92HTMzQK3ZwIOh1cNF4z2ZZmMBsPG9i/rEx1niOtcvaj/7XL326WcrADC2tvhzqesXf+XUiRM9y6UKegaHIFwHdS+A5/vQjMF2E+CWZcaaQEIIAQbRLKN6t8RWzeQZM3ieh1CGsG0LiWQCQgiEYQDf9806JjeBhOPCr1VxfWYGFoAdU1PYv3sPnnjoIRzZvw87xkZgw3wYlNJQYdxHY0O5QnbrebQ/yCIZnenO1BEZyqi5ngITHBazmvacARCCQ4hO+97+oWyOOYxBImp57wdQUQ315jZNscmMNa5lI8kBm7UmGhomimtZNrgwH/94H3F6J4u6VW+85o3X3l7aoblGK+r6zBhrNq7jiLqBMmZmylElrrifxlhPD55+8AH09vSit7cPr71xDJeuXcPa8jKcVBLpXB6ZZBKaCyPGhMZfiTtxasAIiNH5tIuELckw8hOix+4cYWglUnLGoZRCpVaDbQk4joOegQF4tRrOXLqIwVT6J92tU8mvTY3/1sWDu28Efz/po39Asr/9r8A/+2fA/DyQz996hCjVqb62dMczea/xfnbI44kwx9gY8KOfVvjkh5AeGJ7IfvniD82cPf3BC1evug0NuMkUmO3ACwL4MoRmDG4iAVvYUDJE4JsqK07KBdMKXsOIT+wufZV4GyEElDKLOoVlwbGM4QkCYzwc2zFVO6TE0tISgloVuyencN+9B/Dsk0/ggaNHsWtkCAIAUxpeEEJLFYU1GRiLBTDeduzNZ/RNBzZaxW/MRUtV180fDnDRTEmJ5bWGVKgFAUIp0fB91D0P5VodhbIpBViuVlGt19HwPPgNDyoMoYMwcshV2/4BcA4hLKRSSfTkcsil08glE3AFhwoD9OayGB8eQT6bg225iKu7a327oODd0BFf7LxfSoODNeu5tiv48e8ZzrFnaBDOIw8jnU7h2IkTePX4cdxcWEC9WISdTCKRzkAIbuq9KwWt2V1/Zt4W0c2wXbO4Z71QRG9PDvlsBv3Dw1iencXxCxcxxu2nR7aNl3YeGbg0fSR7onb1gOX3OqEqrADnp42rphhQ8YBARWULvptwgEnACoG1M9/lfX8PGJ8AH5vAWFni3hs3YS9cw8VdWzE9tQ0jBY0DN284dnG+t+Ek+pMrq2M5z+sduDGTX794qXdhaWEorJSHGEOP0mrQ9vzxVL0xaEMnJQDpBSj7HirSh6cUGl4Ar+FBKd1cb2IcFAFbCFOpgTNkhIUUt2FzYN11GzPJ5BoYrwrOi8y21q1kYtHO5ZdFJr+ettj6zoSopF13ftW2Z/nevcWgt3e9urhYWwVUY2hI44d/WGJ+XrNkktmlEoJ77+32Xb8rjEOlkEcFEh6C71lRh3ginRSBswtX7jlQyTI4+2bmj7Djx37gytkTW2aXlqBTKfTlsvBDicDzoDTgOA5sx4EKQwS+Dx1KuK4LiwtIKd+WveCCt1RewU0uedThNwgCuNH4YzGG6vo66uUykoxh3/bteOqxx/DQ/Q/gyN7dGEgmIBiDH6VUAMbRNN2b786YsfZ/jRLTekCbPzUDdNTcxnQENSgAdaVQDwIEUpmxxjdjTblSQa3RQLVeQ91roN7w0GiYBnlBowEVmJQwpTVCbcpJci7+/+z9Z6xlyZqeiT0Rscz2x5v03ttKW1kmy9tr2pLsZpNDrwHBgUgBxEiQBGowEEfAjDCAfoz+aCgJM6JIqGnaXVfe26yqNJXe2+PttstF6Eestfc+J7Puraq+1bzdd6KQmaf2OWeZWLEivni/93tflOOQ8/OUi0XKxSI9xSI5xyFuNakU8qxZtZKB/l5yntu2mu+Gth6UqPhF3SC6v8iGStIp8JTKBqAyrbPKNjpholFCsK6nQs/+PfT39bB57Rreev99Tp07y1y1St0YKgMD9hkLSdBlYPjzrkdAew2Frn3fN5juhZQkWhPGMUYYXC9PZaCfRWO4Oz7O5XNnC9HIyBOyv/85sWP7v1/cuXEegMESjF2HxUVY/KsVdP+89usekEvA5Z/+04T/8r/UAOUbN47337jwvz975tTqa5PT9I4Mg+NSqzdIDCAUvu/hex7CGOIoVeAQpEUidjEURmK6dUcfmKLKZhwAWySojSHRmnyxiJSKRq1GGAQoIch7LkpAdX6BO9eusXJwgN/53vd44cknWDM6ykBPCQzUWyEmSnCUIJ/3LHpgIAxagMHzfTJ8vrNX76Dby93HtLGKMVJKhJQYFEIpVFf9YZz+CQwEcczE1DRjExM0goDZhUWmZ2eZnJ5mfGqK+YUFpufmmF9YoN5o0mw0SKII4gSRWDzDYCdgpFUk8VyPUrFAf7lMuVDAl4KcUvSWSxzct4+Hjx5m68ZNeKqATlFtm+rL0AbZhvMeHGo/OGFni4wESrmANWSyGvAST7rt3uoGaAwQpX9WDA3x3COPsGXjRvr7+nntrbe4duc2zcUanuPjSRclJLGObPpQWfvr5WnUpbJTnTMtT7mapT/wwJUg4/Qbo62CjzHky2WKlQrzrSkuVRdU/vSFfU8vxM9d2XS49fH/+qXr0xvQ+s2P4fTr0KhDJOH8FNQDy/P7pTYPqzp+AczsL/nYfzHNGENrfo7q2D3cmWmidasAVDA9WZqZHF9XWpjYc/DOraP7g+DxoNnYuLgwX7xz53Z05do1OTM7i1BKhHEikiSRNsEjUa5rMytpjUSWNfI8HymkLdAGm72KQquepOMO31VbSc9Ws+k36rVRASaX88n7vu6pVBgcGDD9AwNm7fS4Wnfzmt5dLH4e+Lm3Ez93IxgaPHN3dPT6e1E0O7ZnT4v/8X9UaG0k6JIxpuW6NPnVh8ljwCdmHbM4wN2/sDNnPbM/0eKppOqPsJnGgRffePe/uPTBe3u/uH0Hv1zBKVrjn0hra/riOJZigJVOjSPrXSCFnYtJecztOeBrIhBJYmVYtdH4ro/jurRaTaJ0ralUKnhK0VisMjsxQV4Kjuzby7OPP86BvXvZtG4t/YU8CdZkiMSAYwNx6WY8k/Rk3dwTMjR4eb/Yn7FOonbOFWnG0q41akmFdIydXwNjmJid4974OPVWi9n5eWbn55mcnmZyaor5xUVm5uZYqFWp1erU6w3iKLTBeGpDH2tNYqwqiErfp0I+T7lQpJTLUcrlyLsuecdhx+ZNHD18iD07tzM0OIAjrfCApUTKZV2/XPR3+dvR6YduWUSR1RTFiRV5EAIprSmTEDYjgLDZiDAI0ICfz1N0XXavX8eakVF6ymV8x+Hk+fNMzM9ZWcpEI13PeoxIueQKOpnVrutYcgdpXViKoBuxtCbLZD+bIkp2cyUsNQqrDCSkpRb5SuIXC/ilMmfn5og/+2z4CSP/yYBU5k92bf9/PaCjfm3adx+QP9b3nZ/iW7dmDRCCLf1REfyD4xNb17z/3rMnT3yy+ub4ONpx8QslIm2Imi3L9U2L+6I4RgFKObiuDdSiMEzpGw5GC7sA0iXn1B5mXRNS19AzwnLToihCpccKwwjP8yj6HkkUMj1tlVR2bNnM9599hh88+zT7tm1u8/e0MfiOwqRun5lTF5g2otuBIjrJJ5EFn93NZHbvoo2KdycTs1TffBAwMTXN7Xvj3Lh9m6mZGa7dvMm9yUmLWkQRzTAkiGJaUURkdJvvHRuD9n1wXERiA3JhrPWzcFJVGaOJtKYRJ5hqjYXFGrMTYxAFPHb0KL39/fT09FrNdiBJUS+7ORJ0knHct2Dd92h+bhNW1UBxn37r8n4TgBI2vTmQz1NYtw7/uWfp7+/ntbfe5MSp0yzOzJBUIio9feRcjyjl+CGE1YNPNxZtl9TsnDp1gJUp6Sn9/oPuQdx3g9bVVUhJpaeHJImZn1+gVCxQ7O0FA3dmZil+eXb1007+H5Ue2jsZbOCctr8qMKHBhBaySppAE5Jf9jQS2+Pyl1phBZnLo3r7yl5U3XR8eubRjXMn9nH+infx4oXexsTdYbEwv0a0ghGjpBMqKRomUZFO8IoljBBgtB3JWTF1WjwmlbKLv5AYKYllSg0zqQOfkBip7LjQCuE4yMTSy9AG33WFVyoKjEECSqBaScLk7BxzC/OM3b5FwXFRUu42Sg1rqWZHt22dHtm/f/q5wcGF2sjol0n/wIlmqXBxQsnqHaDBXxz548/bBOBi/qLRKAEonjuWeH//d+QWEYo9b53ZF1698tytGzeGp+tNVq9bi3EdGmFon28aNMVRZCl9Jq0nSucFi453Zu3lm/juU3fglnQKFAIjst826CQmaDVQUlLK5xHGMD81zcz4BP2lMo8fPcJLTz/J0f376SkVKXseDvZNtUFzd9F+14Usoal0X80yKCQNBjWWpihS4YHuMaWBWhwzs1jlzoRdayZnZrhy4wZ37o3RiqI0GxvSCgKCKCLWdu1I0j+xlBjloqSDRLflI6Wg/a5pKQmEQLda1OoNokYDxxjWjIywY+tWyj09FMvlduFlRnVpB+ZApkv+YKWx7s7pfjZdKV0beaMMXZP40j61FHNlNb/TTUzBcSiWHR4/dJBioUBvfx9vf/QR41PTNOoNyn391u8EQRRbTXs7l4i0ztS0efPpbSBM5z6SrO7rKwyZsm91jwMhBI7joo3dBIZhhHJcKr29zE1Nc+/eWH6sdOGhkTXrDhwbGP3D86O91Xnnlw3y/OVo3/2c9I9/7zs/xbdqiYGwZRBo9m1ntNZaefj9D/6z+bffefadq9cIhKDU24NJA0IjOmohRidWF1wqPNdWvhNDlIQYwHMd+3plZg0GEFmaqeNuZVv6UqYFJNrYorugFeA4DkoKXEeBTqhXqzhGs3XdGn77Bz/kr33vJdb29+Jnt5RGTb7b4W6bRGMSe26pnE4wvlwasOut0l2AvhECI0ELYSUTjaXU1JtNpucWmJ6d5dadO9wZG+PGzVtcu3mTyZkZxiYmWazXQUqk66JcD9f38QsF3JyPXyxR9HyU66IcB4WAJEZqjascpCMxAuIkSScJiIOA1uIiQbWKkJLRlas4dPAQhw8cZOXoCnwhibEWwiJDkcQy6HpJWxadP2AREQ/421G/+LXJNi5hEmOMoaAc9q1ezdDQED2lIp7rcf7SZUvhQVKs9OD6Ps0wRKfovs5kuVIzqKzYyZESgc2k2HXs64ZC9ueSOMFxHQrFAvV6nXq9jgBK+Tz9Q0PcbTS4MTHmnb91dZOeuHNspdn640CoqTpSo5HExpAoY5Fsw9fTxvkmzUv//CqGeAKMEUJriTGkxolGAAWtVb4ZFI0wvbkw7FP3Jvomb13fKmbHdvWenXth7fT0tsvj97h+5y6Tc/PUWi20EHj5HPligVK5QrlvgJLv22fbLk6zOJUmjbHJlm9bf2DiFP1O1367nncQRutTkhZea4PjOHiuA6nST5IkhEFIq9lksdnk9vSM5S7HcYkkKZlEb9w4Ps6+sXFW9/ayqly53CyUfmI27jg9tHXrLW+gMOcV/PHYiFnX91qhkr/S5h4ZkPAXUqEqBKxeDaUSNBqCPzhi8r+3unD8vS+O97z1ycsfXr86PBlFFMsVnFyeUGuiWOM46YZca+I4QRiDoyTKsXUnWmuMXnYHIgNW6NiiiwdoSwnLU0ZY4EOTYJLYcsalRAG1uTlaC1V6C0WefuxRfv83f8jBrVvpKeTbYzFKwQIprIdGJ6b8xZ4VWTO6sxYJadrAjwYiDFGiqbcCZherzCwucOfePe6M3ePazZtWg3tmhrvj48wtVNEYhHJRyjqFerkcnu+Ty+dtQazjtuuaXGkDfmMsOp5Am/IFEIUhUb1O3GhBnFDO+ezZu4ejR4+wccNGegslBG1yJBlZZUlw2laLsR3T/Uzac7FObOy9ZJ0yaXZdIF2ns8FpL1fp8bAbNAwYDXEQkQCu67CmUqZy5BA95SK+7/PRp59x6fp1FqdnGBxdgZ/PgzE2M5Bm5WUqMywMqUKawZHKrj+JHWsSgV62kC5PyixJ0KYyxgidxk/QaLbwlEOhXCaJYhr1Bp/cvsPRM2cPPDW86jfmRg+8Mu84k12o168NYv7dB+R/87/+zk/xzZqwL0o9hDDWSBHucfLsvnJu9O6l84/fmZ5eIzyXYq6Ak8vTCkO0FrjSSd8rg0S2ebNRnLqLC4uWI+zgFWRpJY1BgwQllTVgSCUB7e48reRW9nvKcWwhpwBHSfLFCvX5OSZmZxFxzMG9e/nes8/xxJFDrBkesEiJsWislDaN1f1y2eu0eqLd6acU/raGNFLiOE4bJU8STWIyUE7iCJseDIHpRpPx8XHOnj3L51+c5MKlS9y5d49YG1zPx83lMJ7PyNq1DAuBkSJNcomUgpL2nZAkBusmllbkJ1GEIwWlooeJExrNBs1Wi1KxyFB/P4tByNzsHAtTU+zeuoXf+f73efHpJ9m0Zk17kZDYCvWlQfSy1pacgi5IomvysFxukS5wS49hHjw9dAfxXfsblU562Zl6PI8nHnmEXL7Im2+/zStvvMnY7Vts2LyVYm8vQkqCKKIRhkRJyhV1HYKW1SFWQL5UQgLVWg2EQHmefXLLUHLR9T9tFMYIO8kCYSvEcR2KpSJhq0W92WwH5Y35Bd758gyP9PQceaa3/w/+5MjB/991Ke9Qbbgs1mKEn7QrWX9dWlrTIOPYlUGY07E2sSE0EPQAO5tBfseXF/evmJ9/qRU1H7l9/vzI6fPnKgvzc25jfr5skgSVy+GWyoz29Vk0kPQdlQIhFbGQtiYlRdi0MbZQrq1IJNvoqbSzDNn22xYfm3aGCOzrZjLZ0TQ4C4KAZqvZGafa2MLBfA4351Pp67XcWAFonW7qE764dp1PghYm0Wt9P//7q9af/eubdu+ee2LNqpvO4MjPJis9r1zesPrahUqx1ZX1hl+jBfW+JiX8s38Gf/fvGiYmYtatg1ZQUo25fzQ9fvOH569cptg/wPDgELVGg8jYDZMFflIjL6XayKXW2UwHkKl6mHTjlRYTpjKAJg2WMwSUbAwIQxBZvXHf91JpWE2lVCQJAuanp1mcnmX18AiPP/wIv/3i8xzZtxdHCBu4klbzGkMUR3ajkII92XiVKZWju4nssmV67dpYYzRj1z9bpmpbAlTjhOn5OS5cusLJ06c5d/ECF69eZb5aJdLaBty5HH0jI/SOjKbvU+qSmd63vWe77sSJBXikMERZQaNOCKKAMEnwfI98Po+nXMIgpFarIcKYvkoPuzZv5nsvvMCTjz8KRpNgkG01GAuQiGxdEdn7Zu/F0idtH1tvDbvWJkbTCgIEgkI+T7dSmYktsCSVahd3LsGO2oCNBZ2ENCgJQtsNQpiug4d27aKYzzPUP8C//sN/x5lz5ykWihQKBYq5PGES02i1iMIIz/NxPJckjIgiG9fkijkcx6HeqFshCiXbcYQRXY6wXS98FkeL9DrjJCaIA/LFIvlcjoX5eVphTM716Ontoy4Ut8fH2Xz7+rFN8xO9LtxBqklsfJrtn38t5pDvPiB/9VesH8ME8gr2DMKQB2A2jt89tPXyxb/13o3rG+7Uqoh8AZXzEUqhoxgQqWxfusNN/zakbpzpe5RNQJZmkGlwCxDKLq5ao7Xp0BCArDxFJ1a7PEkR4VzOx3UUzXqNhbk5PGDPnj385ksv8uxjj7G6t4LCAv3GpAL+Mq3GNl1JsCXvspUjTOIkVQtROMYibUli2qicdCQ5Yaf9RqKZqtW5MzXF1dt3OHvxIrdv3eLO3dtMTU8zP79Ao9VCOS45pSgKget5eDkf4bgpopcGFqSZV93ZmesMIUnVWhIMc9UqCLuYeLkcxhhmZ+dYnJnBkYotmzbzwrPP870XX2LbqtH2W9t9n53W9Z020mA6acH2DJg+vy5FLQMktoNRjuw69tcc01ojjX3eOklAKXwhWJPP4+/fR2+phETyxjvvsjg9Ta1WpdTbi3JdPNdBm4QoiTDCIB2JJz3QmiiOESmnH2H5hg8SZ3kA4A+QbgqxWsSuHQdgDadibaxNdxRzZ3aWiXPn9q16f8Vf31Iun2z0996Z/Lu/qU3e1Vwag3/1GsxMAH8JlVC6mwCTgIgRnsDxW2gnIhExWf2zlEHgqHoNFYTR4ro1oX48jlevHdQ7cskgtyeOVKJgc+/NW9vMhyc2jd+8eagatdbfq84zWV2gFoY0wxClHIqOg5vL28BcWUqW1oZIJ8RxRBLHdni2tfuFdXYle03SIH6JGoNsi90YCdKoLiKD/R0b4OsUDLBfS2kpWG1VIpHVQ1iVFtWFGNZqdarNBYLYQKJ9XzeH5I1r6JmpkdlCcXO50rtCrFy1e92xw7P92zafnTPms7lS5ep0sdicdiRROgidVst3Wk2BMRG/LrrmK1dCfz/095vRRqO04+zZxxuXLm69OTFOrRVQdj0czyesVkmM9ZiwrbPeLDdje9AMlG37u+Vks8DQcoQ7KK3juIBuI+PSokc0FqsEizVWDA3yzOOP8RsvvMiBHdsopsG4TgNPmR5XpbrfS4CA9HzaGGucJ21dFdKuVUls2gnaTLUKKYgNVIOQ6WqVa2P3OHPhAleuXuPa9etMTE8xX62yUKsSxjHCccn7OYRUOLk8juta0MeIdiGiDVrtUmzBFitQYDNNGqRBOQqtnPbcF8caYWLqtRpBvUlvocSBfQ/x4lNPcmTXLspAKGT7/RKmvb9orwzdT6qtVS4F4BDHmmbYwkk15f1cri33a0iz0xmwLkVHf6E7GId2Wq4dwwtbx2Q3YIZYJyhtKDgOu9euo5DPE4cROT/HrXtj3Ll2jf6REZTn4jqOBQeF9e2QSuF6NiaJEltnIKCt6vJNmnIcfCVJdIxCIFE4yiXWVuih6Odw83mcQoFrd2+j3nlz3fCK4YMHHPez8Ae/0bj72qvJ3PjYrw3q890H5P/ij7/zU3yjNt+ClWX4r5+CobUAjro7/sPwyrW/Pz8/n2sKQdHPYYStDpaZc+ISikeXVKB4sFeiSWkWKnW/TFKjjyRF1EW6GJIeWuuEOJU6dJXCd12SKGJuagoHw54d2/mt773MC48/znC5SBwnNMOIou+jpEXiRVuDtXOVS8OyFJUIIxxXoBwHIR2MtoFnEGmMtOk8IwTz9QZX797jzOUrnLt6jZNffsmZc+eYm53F831GRkcZXbeeXD6X6pxarVMDRNpgwpBuL8mMOa9Np78yVF6kaE0SJyzMT+M4Dv19vRQLBerVRcbu3MZEIbs2buTJY4/w8jPPsGndalzsqv5gj7WvCkkFGN0uws1mNY01s8goL0JIW1xlTKpv+/OH1pKzpcex+6O0MDaxaYxACvoKeR7eu5u8n8P3fX7y6ivcmZrESEGhXMb3fYzwaAYBQRCTLxQsmhXHNOsN0IZ83qaP48w44QG3+6AeMNkmoS1bKfFcKyQZRjGO45AvlxgcHuZW0EScPrX9UK74ePmpJy/9x3/y+3eNEIbPL8O/+xhmbvCXPiA3COkIE3uImqtc7TlxlBOJcQLACHKeE/f2+U6pB0cbHVV8qQ9uK/ci5N4btx7uf+fD3w5v3Xru2ti9Vedu3+bm2BhBEtEzYL0LeiQMui5SOmgDUZLQaFmesFQSIUVqYx6TuQcqY+cWlRa0CSHTecKkUqGma3PflcnJirU6+8x0A5yQpHKllp6q2hQ8oH1snWgi7LXItEBdKoVwXCoDA3iuZwPGlEJ3fmpG1Bavug7sWzs6uu/owjQHL2262nT9f1PfsOntK1u3XDkxUF6YzOcWBZiwVMrpvgFJT4+m2dL3mRH8FW8PXb322JE33vrbJy5cXHGt0aR3cBDhKOrNRjvrAR1gQRjzgHmtCxQQnZ826TxgTLcTZsckJ3NcxoCX82xRd7OFoyx9I6w3MVHIyGA/Txw7xm+//CKHd+7EUQ4ztSblvI+jBElqEqeERDrLNg8pNVOk12PdRR0bkJM5UGuSxOqge56DEVALAsYmZ7l85y5Xx+7w2ZnTfHziBNdv3CAMQnoHBxlaMcKmtasxCMI4JowsBzrShiAI2+uLLZDMeq0NU7clZQ2QpMG5AJTrkZNWLz2OQuJGTNxq0VMssm3DRp569BGeefwxenxJE4v0KzKOu26f5X6GRSrdb7ASyEKCsEowjmuQrmvXQtNxqM5+1RHiPilH2kfPNs8ZoGR/UUisZKSQKGOz3/OtAMd12b5iBaXf/A16evv4n//tv+HLixfxXId8pYJfKODkfMLEChb4nofruMRRTKtl3T9930NIRWZF0B1ZLOtmey3ppkJJaTM8wq5VYauF7/pWmScIQRtyrsfIqlXcvXOHu++9535fqe89++zzd27/k3/6J285bnPu//2vfm1miO8+INe/Yn2pjf3jeIyCf+TLU1srJz7ZcfLy5dz04gKJFIhUbtBkVsPLA3LRoSB0B+Pd9AaNBp1K92kBFtdqL7BKOXY3awxJbDnpYdCiXC4z2N/P4sI80xPjhI06+/bt4zdeeolHHnqI0YqlK2gB0lU2TSUyJN5elcCiZ5kOaKf226CUQy4v0YkhbEUYLCLuuBLPdYmBmoFrt+/wyWcn+OSLk5y6eIm5WoN6q4XwfUbWrCGXy+P5Pq0ooRHV2ilTkfL/TPuM3X1kOh9291n2cbqJ8T0fL9256zimVa0S1GsM9/Wzb9dunnnyOHu3b8aH9pSUBcF2lv05Yy794TiICcMQ5Vluu8SmMxdqTebmF8jlfUaGBym4diFJjN1kWHSoy2ioO/DpOk0W9AqRTkik6gDGdKm0SHZv3UQQPYvRmtfeeYe701PESUypvx/P84i1lY2MUl1glZlipMGaNsa6qHaNvWyoLsOtsl7CGG2RGJEVvIrUCTYmDEJcpfBcl3JvL5N3bnPjxvXS4xs2/pPhsKmF4f+CINU9bDhQ05D7JSOdIbao89tRkR3AB1rQTrE/oFnIShsPUMXefGue0fATNdTK7ztgBlaWCV79N4I+4/Iv/paafPIHzfy+o/HGQpnNCws7Bq5c+YEzO/vQ/Nnzuy+dOjs4Pzk5UIsimkCur5e8knieZ5+AUMQahElIEisBZk2zBI5xLE1NOWltgl1gjdYkcUIYBenGKXvPVUdhRSpEikJqo9sUtQxdby/aEhRW+UkL3Z4vLOUgTaVDisan84WxCFkcBSTa4Pg+Xi5HrA1B0MIkCUYpSgMDFHsqiCQhBs5cuszZ8xdWtKLo9/c/8shvHBXJ1a03nTc+Wr/uJ5+sWnnlwuHHFuTqTUL/g0nBf/svBX/6U4iiX7FF4pfWBGmtfQ7MamCg3tg9MzHxwo07t93FZouBkVGMUgRhhFCOlaw1nTHb/XX3utM9qm0gmErkmc5n3Z4TGUKcIeRhEOI6ikIhT9CsU61WiRpNVg0P8+jBQ7z8zLOW7qAUUZzgKktBSUM/MghEIEiSiCSxpnOZ9TsCpBLk8z5xnNBotlInUAfXc/H8TuHg+NwCn5+9yGcnT/Phyc+5NTlGLbD1FQMrV1pKpeuhpaTeChDKsdnWtOYq6UL+s3lOmG5XjazTOnUVjqOI0SzWaniuQ6lYwJOS+sIC81PT+EKxY9tmnnvqKY4d2EefL3Gw60DbKMjQAWnagcLSx69SKclWK0AoBVKRyxdwXJcwSbhzb4wwjhkcGKCvWMBXilZsSNJsVRzbTXpmFJRlOgTZ+91pdoNuZRCVlHiOwMQJ0mgUktV9PTx59DDohD/66U85c+EC1bkIKQW5YgkQBNoa1mllN0xGpGms9JlmSk7LWycjk/6/BeqJwtA+PyUJIyvs4PkeSkq0sgBFAhRyeYTrUZufc+bHx56q3blzS28uvsU//+dNjhyE//a/ldy4Ad92UfhL0n4dZQ/tTOI6yQC19YcuXvx7F06ePPzFjRto18UrFGj7hGU5JNMJZ+7bGS5rWcoqo69onaRc8RTxcixFwMqUpTSWJEFg8H0Pz1EkYUB1dhYf2LN3D7/x4gs8/8RxVpRLeNgB7CqJUNmE2zEnyNoyfKB9cdaDJ5Pzw+7alSQCGmHI9bFxLly/xacnv+CT1GBgemERv1AkXyrR09dPqVRESocwCGi1GtYISSmclD5hHSgz+1+x9ALSixJk60tnIo2CACkVvb29SGMIGw0W61V0ELB+1UqOHjzIC08dZ//6dTZ1aKOUr2GDvPypKYywKdWMiBQB1++N8/npM1y6dJlSqcJD+/ezfs1KRgd6yaUFtrZw9sEjIBsfOrtHaVH2bBHoLn3U2qAl9AjB4S2bKHg/QDgOP339NWZri9QX5ij19VmpSyVpBQGtQOM5ViFAKJFSgJYnSX9xyxA0KaUdm9pmcrTQJImm2QpACrxCHr9cJqjV1NVrl4fcL08/smmgb9OtVSsvtnJ5U1qx3nNvtxI90vfLCcgzGlepnziZo3HnLkmr8Qt+6f42D4wBJWhnUJYszmnTgKsjXGKitZuYGS1we7xlCqs3KvXIThk7cwmjw6Hze/+ESmnj4MZ6vHn72Nyq0RMfPxN8+O5TY/fG11+emMyN1esExuDnC+SLRSq5PEJZGUId2yDcpq6FRcWliyO0/b7WECcgU75vV0CO1gij05S46ChPiHSDq20g7ShB9hbYzbAGI9qFYVnLEHfb1TotDEzXt5SLKmWqgaHTaCMNAoyQxNoQJVZ6TxiD5zoUikVcJe3GuVHn3uIitbm5gg6DTcUvPqdUr24uS7lm60P718aPPfrBYt/gmblNW2/NbNoa6Tu/Z5hqiuSS4+j5RQMk33Aof+umgRxQxirEfEfcGfsAHGX6IHdkqrbVv3Tt4Jnbt9yJxQVEoUixUmahbnWyC8WSvbY4K6D7+q3bPl6mc86DurL9mdaWpoUhqjeRUcJI/wBPPHyM33zueQ5s2UxZKephgEBS8D1EuonrLpTvYl92Hb0z32abACNAS4nj2DFWj2PG5hYYm5zl5Jkv+fTECc5fvsLlWzepRwHl3l6GV4xQLBVBSpqtFq0oJAhClJMaqQlhVcCWgH5LVxzRWXLIhP4M2HFtRHp9Gmk0URAQN5t4GHZv3cSLTz/J048+wqbRIZJEY6TAQTxwLlnyLLp7QzgkOqLRaOD4OQolHx/BXL3OqUuXef+DD6nXG+zctYvtWzezbvUqcr5PvoseYjMbmU9F57lm+QBtMhNdA6kKnMCCNznHctXDJMFXim2jIwy+9CKOUiRhyPW7d6jPzwEGN5fHd635YZxEti4g9TQwUmJpuF9v75xdY5LECC1wlG/7O0lSUQHrCJvohChJCOKIYqWMgxbXJifxvzxzYLRU+X7+0EN/xsjgBNeuGf71vxaMjX2t8/9lbd99QP6L8vx/0c1WQSiETOIkWV+tN/5gem5+uNpoMrCiF6dQIE7iVBbJBs3SZPhjBleYdrxuN94dmNQiGqZdvNkOyNPFMHOuinWCTuwfjMZRikqpTNRqMXbrFkGjwZ4d2/iNl17mmcceYaRSBqzuqicyeaXlldvLbpPOS5teHlEcEQQhjufi56y+bQRM1wMuXL/GWx98wCeff865y5dYbNRx8jnWbtpIsdyDMRDH1oxE6yDl4Sn8TOscCMPQFh8qa7CwlOqTXtt9H9nri8IQ13EoVcoEjQZzc7PU5uZYPTrMwwcP8PKzz3D4oYfwPI8AQ5LEbQm4X4iMs3SiVK6HpxxrhgEstkJOnjvPH//4x3xx8hSFQpEbd2+zb89eDu/fy5a1qyi6Llp+9XTcHfYLIZGqk8czqZxhluZNsGhLIMDxfXZt3cRU9REmZ6f47ORJJubnUK5Lub+Pkl8giiyijzZ4ro8jJXEU34+WLblTln03DXjbWRVpqQw6IYkVmC5EJ7U6HhoeJi4W+fjmLba//saaHyjnpVd/8EJ0enjg2ornHnHKGzaYqOeXRFlJx4o7MEp98ho3/+hDktbMNz7MFDbI2g4M8ZXBlgEioZNIgJgd3WYmTJ+IJ0543r3rOTfeLs0//Jd1RtclQ8DjX549uOvU6b/XaLUeO3/u7KozX34Zzy8sKq0cipUKPZUevHzBqhFFMUkcWUUHpVLTJ8vddx2rKmQEqQlLaN3zojAdJ3Zz7SibWfF8v51Ry7Tj4yQhihKb4ZGCQsFHSlsDoFPnW7tIp10qltKtdEZXwiClstrRQpG5xnaoTIqcm8N1PII4oh4EIGw2RaUc4iCOCUJb9IkQFHt66O/vx5GSsdkZbnzwQa5SLOzd3qgffGJ+frbS2///OLNl87/60e6dN5q/93ciHjou+Af/vc/cnMamRb7zZiN/6AfywA2g+t2dSuP55GDFqhMf/I2xzz45dHViAuN6lHt6kI5jn38SpxSINOhdcohuZPwBZ7CRH/Zv0X63Ic2Udq0RWUAnpUDHMfV6nSQIGOnrY//u3Tz76KMc3L2LspTUw5DqwiLFfJ6CZ7OnYAM9CXa8mqwWwe0UH6YXlSQxzVaAdFxyuXz7+hvA1bFJ3v34Uz774iSnz55lem4eIyXDq1aRKxaQroOREGlNFIaEYWSLGNOCfW2y83fUy7ImDG3JxKUAdqcHk8Tqe5eLBRQQNVs0FhZwjWH96lU8fuwYjx89wqqBPrSBVjNA+i6O27WmpZnKzqO4/zkJUi52FOPkJE56RTfu3OVnr73BT195hVq9zqE7d7h55w6HDx1g184d5PN5K1LgOFbS0CQYNEaLdh+0z2usGo2S1gzMdPWLlAITC6IwpOEYlOcwVMhxZN8eJqen0O++y/krV6gZKPUJ8uUyYRQSRTFaGxzXS2Wcs3FkdVa6n/T9A7KdkGiLXxijUWnWUBuD0TYozwC8xVqVUrFAb7nEvUuXKF+6tGHHxg1/tzx+d4r16/+E/+6/M4yOGv75P7/vjH+V2ncfkP/3P/zOT/HApiTUWzBXteYJ6QRFQqxc1B5ZG97w+oUDF0+dKd6cnUXl8uRKJYTjEtYbNqgWZklAu4yUYP954IZDLAmRMq5mJlcVJ0lavGVwlCLv562tvdHU5ueozs2yfdMmXjj+BMcPH2Lz4CASyz01GJv66j5biqxlaFc2GXdfqpU2MmghcHyXnGsf/UIYc+HWbU6cPsOJU6c4cfokd8fHqUch5b4+BkdGKZbKRFFMEISEUdhlu2vvMo5j4thuQhzHoVwutwODTi/84ryC77oopQibDarzs0TNBpVinn07d/DcE8c5vGsnw75HTLrzNhph1FekC+9/YgJBbDStsIEUCs/zUcBYtcbJs2d5/YMP+OT0GW7dvUexWMQ7fYpLN65z9eY1nnniCXZv30pPoYC/5Jnfn6a87wraC8b96Ermm1oCDm7bSvjSS0gpeeejD6kvLiKkoNLXT951rRJNOjHG6TgSqVlTt91xN5Wxc+pMPzZL22aGTzrVvk9QSuL7PkEUEMcJQRBQLhZRhSK3azcYvn1rW/HO7b/fNzlzVazfcG32rz/WqC40hMm70JeHgmN3Gd+25SwJSf5Pf0j0h/+WeH7qWx8q9HIsbNuDOzBMUp1n4folqrNTS7MUwO2kzMVgnRmelXlvy6Cn/sHfjye2bai5q1axw+8trp1rPF2ZHnup9sorB995590tkeP0TzWbNBLt+D09+PkiuUIBHIcgiYlTfndG3RJCIB2nvUgGUQhx1EajLZfb0tqkEKnUqULQceOz/8bEic24RZFNK8c6IQhjavV5MnQse5dEqujUociptiKD57q4jmsL7NJi8nafpDS6LGjXUUScUpyctAi1wzvvAhwwljaXpaKFANcjllIstAL3xsVLJBOTvYN9fb9VmZzc8L1m8+r8rn1/sji05iP9f/q79YV72plrJH5YI46kmzyIOf3LbgYoSMWO4c1QGYI4/NbHkmnW4MaThxl7bD+EMbRaRnieWTc4yt5PvtgSXDj70r07tzYvtlr0DA6RL5UtGqkTSwfRug2kyCywER0IulOgL7qmnexD056Tpehyj+wKzkSqvKUA33Wp1uvMTkywamiIRw8e4vknn+DRffuoSGnHcZJQLBTIeba+RJr7nSgzKlVbyi+jxljSJsr1LfCBdRW4MT3N6QsXOXHyNB9/9gU3b99mbqGKm8vT29dLoVy0Aaa2mRiEXc98P2d30ElMFEd2DZIS5XSyzd098vPWGwGEQYBwHIaHhgibDaamp6jPzbFj00ZefOpJnj/+GJtXr0RpjYljcp7bph4ujfI7EEh2xkz2URtNGNSJkoRCuUK5WCSIIq6OjfOzd9/jrfc/4NLNmwCcu3KVa7dvc+naFV587jl2bt1MyfcZ7Oul7OUwSLtZNjrdPHfdj0iLs6VE2y1d1/3b8eA6Diat/DYCNq9dw/effookCqlWq4xNT1NfnMdxHRyp8Fxhx4DRiJQ3/qAw6EFvaTfw5aQbhCAF6Xzft/GP1tbkKlWWi6PQ1sZISawUs4166fbNG8dWnb+8e1//8I8uVwpJo1zODvsgMsCfY+H51WnffUC++T8RQq4TyJehsuq+oDkXxerhjz77fvG19374R1+e9+bDiL7+fhzXI07TX1onGJlydjMB4K/T0uGSpdFkl+SUgXYxFlhJQddV+DkPx8Ds9DQmDNi8dg0vPvUkLz5xnE3DQ3hYVq1Ao8g0XtOtguieHu9v9iW2ibwYEI7CkQ5NY7g9McX5a9d5+6OP+eTzz7hy8wZz9Rp+scDg8Ep6+wcpFIroJKHVahEGYdv5UqYKDMZYp1KtNUopq3Hs+cRxTBC07kPuv7rbrLKMiWNmJseJmk1G+/vZsWUzLz71JA/v38+Knh77syZGolOkdzkdJXsI7R7o+tum8cNEIx2FBhZbAZ+cOcOrb77JJ6dPUU1i+letJJ/LMddscv3ePW7eucPt27d55vhxHj50kFVDQ/Tk/Cz0ecD5H3B/XVFy9gQdkXLKDbSkYLhU4vFDB4nDkEazyckvzzA/t4BJoFAuU8jlCCK7GCWJaQfzy3tYPGi6Sj+36drUES/JClstD1QIB9d1cI1LHEdEYUSgQhwMfjFP1STOxXt395Tv3Nu7ef2GH9/csSIJwQ6wmRbUY6u/+W2bV7AXfO4LuPDRtz8OoH2f6s6H8LbuRty9ydT8LHOz9wX4gihvaI6Knfkhv7x7i+M99mRLFEt+pd5ct/ezz/dsPHf292dnpr9/+pNPnM+vXydfLFPq6aEyMEi+WES5LnFK82kFAUmqfKKUIk60zYiki1IcZ8GE3bx6rovrZgG4m4IAYIzdsMdxRBxHaJ3YZ5VeskhtyT2lSIAgiTHatGs4hBRIlfkJWf16HScWMdcG7TgY17MFokmqRy1T0yGpEK4DqZNjnMREafraUR1pVJ2m+k1KG7PF0am+dxSB0XilIvlSkSQMmVlcZPzOXZkbn9i6bX5h6/6798h9fnntwrad+eCxHXfORoWp6c8Wwpwk8qNFAvR3LsESADmp2Dy6heGVOwmD2rc+ltsKEUlC6/u/y9jfeK7zDWPEoRNnNm5+6+0nTl+9tPHG4gJePkelvw/pucwtLACQ8/0UhdSI5eHdslfqvtmmDdiKVArTzi/aZLK72TqU8ruNtq7NUURfscihfft5+amneXT3Lir5PIG231dAvlBI6ZAalmRds3N2RUSJTQhYDR8Q0sFXisgYJubnuTU1wfufnuCDTz/j3KXLTM7NoRyP0uAAxUovuUIeYwytZsMKIOgEISSu6+KkZmzKSBJke+4VJpUXFEuv6edNyYYU5ReQhAFhvYaKY9aMjPD44cO89PRT7Nu4CRdoBC2UEBRz+c5vf+UUt7RnNIJWFKOkolgsYoBzt+/wZ6++xqtvvcPtySkKvf34+TwtY7hz5w53JyeYW1xg/66d7NyymQN7d1NcsaataqPbcUhn3cncwe2oMUvXXGOLPV1lQYE4SQi0puy57NuwnuCJ4zSCgA8+/oRbE2PU5udsoafnI5KEMInRcYLj2Pnpa8dBaZNKWRAyFazICnyti3ZixS2UwjEOYRSRhCGl3h7COOLk1Wvq0Z5TB58cWfn4xIFdnze83KJFWhONyhmSIOuDr7cI/yVo331A/tL/4Ts/xX3NGJich7/2BPw3/wjyfvtbAujBOFGz/uRsdf7haqOOyvkUiyW7YGrLTzOxlTR0XJui6eapdbujdX1I92ZNa7tLlUq1+d1aa4wAx3WR0mvLFOkkodFsMjV2jw0rV/LCc8/y7JNPsHHtGhzsfsABhLJSVaSmDstnBtl9LcKmylppUYXrebZyO/25C7du87P3P+DjL77gi7NnmV1cQCvF6Jo19Pb346Ua7GMTE8RhTC5Nnbuu20bgM1kpqdz2ecMwotFottHyB7UH6f1n2a1m0GJmaoq+cokdW7fw7BPHOXbwEP3FUvrWJQitrWat7E7Fd6cOH4Rgpw4uUpLL5UEqqonm9MWLvPX++3x26jTztTpDK1ZQ6e1BOQ7NmqXszN2+xb//n/8nJq9fw3Uk7qGDlFesXHLWrzr7/Rv4zLoj/Tw1/AHrulhQikP79zFbq1Gt1/n05Ekmx8cYVZJybx9SKur1FnGcpHbE2VyU5XJMhzeZfstgSzCzlcqYJD2tLfIVSMIwII5jlEz71XHQiSYIWkTC0DcwQNho8OXlSxz+8MN9/X39j09t3vh56PuL1EL4F2/An1yEkeIDn/nXajIt07197tsfI23CGEQcIoMmIgxSd9OlPwI4tBqKZt2MP/JIK3zhuXAU9M6JqX1bTp76g+jGjafePXlyz7nLl1UsJRu3bkc6DsJxQUgaQUjSbGGwOsp+LmezDXFsedaAcRycNGKQUuF6KWVACOukazRCg+s4RGHE5NQktdoiYCynNYpskCasnKjv+RRLRfLFAp5yyJXKFPLDtkgqMe15Jo4tkh4EgdUdb7ZotQKiOCFqtohaLUAgUvOUYrlMqVwmny/gpUXVWTYvk0pNIgsLZMFBtjiL7kJSY3XQbZbA4Po++UKRfKFAbX6ehZlZTl29xtj0DNuqtd/d6LNtWFd/fHfv7n/XemzwzLqb0xTqV5k3MUkn3nvQrvvPP0bSf6MkohW3iOJv7wybxAEy0SQ6XvK5AFEifprq3Peu37yZX2g0qQwO4fk+zSim2WpRzBco+HnryGl0Bx3P/hZZB3TnXbv+7UxxKRKeAkBat2tMOlQWSIKI6bExKn6OA3v28dzxJ3loz17yBZ8kSQhS5RXfdRDCpGj3UiDInly0bd5NktixKiXKdS16nf7sxPQ0b5/8nI8//4KPv/iCsalpmlFMubePnr5+cqkb9uJilTiOyPkuru/hGisDHIYhjWYDIQSe75PP55BS2ixeFBLHOnVk7uqHTFHFdPrS9pXNGFTKFbROuHX9OmG9zrrRUZ585GFefOZpNoyuwMeCJUIY5JL1anmOYMmzbn9lwwGFXyiSSzMEl+7e5ZV33+W1t97mxt17lPv7GSqVbEF9GLK6WKA6P8frb7/NjWtXiF94npUjw6weGcUTEictrBRLHnoHoe/8//LrJXUNt94mMnMYFYK9O3fS0Jowiph/Z5E7U1MYKSn2uXiuS5RKHzqO2wYV28WkZumZl3eEBqI0g2aEsBndMLQBeNtd2D4j13Gte7dOKPf20lpc5Nb4OHsn7x1b0Vq8I+EG+eFFeg9KEmlwaoaFC6Dj72Ru+E/VvvuA/PMPv/NT3N8MMAlXR+5biNdGsbfn6o0D1QvnN90du0siJMVCEcfzaNTrJFpbjqdMF/X2oM64AB1frp+HTLed8rALZJJWgwupbCW6kyIVUUS1XoMwoL+3l2NHjvDSs8/w0IaNlEgLBLVJJ+k0EBeizRGVUrXP06bltN9V0SnUEvZX79ZrnL16jbc+eJ+33n+fyzduUmu16Onvp9TTS7FcRiqXMIxpNUPiMEYIbDEOlsOapIYwon1KkQbnuqsKOwsQ788wdRYW0fnbGOq1OmGzSblYZPf2HRx/5BEePXyYTUOD9gkkEVpHON0V5+0b/qpMQeccNuwVFKRiql7nxIWLvPr2O7z94Qfcm5xC5QtUSiVEPk8YRzSSGCeXxyuVCaREuw5ePo/rOO1i0PvPRAdFSAOUpd9ces1KSDAJSZIQp9X063p6ePTQQeq1OouLVc6cP0+rVsf38niFoqUgaMvJs2npzim6e6F73haASYeHreM0GGFwle3LOLYbwySR7YJP6Sji2KYSS+Uy1Sjk7tQkBy6ef3bVth2zq0ZW36j6/mKSJHD1Ntz7Eu71PuAZfN3mplc69+c4RtYMItGIqGGzZUNPQfIsuBJqV6EwZTi00fQOr4jWmp7EGx6gR7Nq7fTU06X33vvexOtvHr01M73y6sy0txAE9A4Mkav0ECUxsTYp17oTJJlU7hNjcFOetTVcsfQPKQWOo1DSs7IbcUyr1aRRrRK2WiRRiCslxXye3sFBXEeR83yK+Tz5fJ5SoUCxVKRQyFMqlykUCvieRz6XI5fP48hO2j4LyMMwpNFo0moF1Gp16o2GVRJaXGRufoEgjm1BVRDQaLZo1uvMLMwTG4u2uzkb/Hi+j+Moi2il81qmbmFhd8jKCE06P5kUIYy0JgkCBOCVyvQ6Ls1ajYlWi+b5s/7M7PTe1YMrSr1BfeWTR/e9k6/PvhH05+7ufPJJbrzxGnNBy6jv/8BURlaSu3CJ6c9PkNQXvjFS99XDxLQLXPX9m7av3XRahNt9WaUwZv2dsQHv5s3Hxibu7ZuZmwPfp9hTIcHQCkMbjLg2+LF1BLqtmpIhngZLM1hepNtNTBTL5oDuJqSwmSthvQfiMCSJYzZuW8cPv/c9njp6mNGCTxDGhFGEqySe5yAUhDpM1xGVPtEMf28f3fahBlJNcZkGW3NBwO2xMT74/HPe+PADvrxwgbGZadx8gXy5TK5YIhGCVhTZNUWk3PZ0TCHSOUsJJCk1Ly0stf1tEJmPhVh2TQ/4ujuc9l2PJIqozs3RXypxeP9+XnzqaR7et48cgljHhJFVnFJCECdBqtmvloXCDz5r9nwKyqGRJNycnOC1D97nlbfe4ty1qwg3x0BvH8p1CaKIIEno6+1FCLh+6QK1Wg2UQjj2nlOjka6McBeo85VxSDYaNJkOoT2KphVZ8LHi5zi4cSPBM08xX69Se+99ojAkaDTIlUq40j6En085vb+1xywWofd8299RFNmNleuiHEkYRYRhiFQSI4R17vZ9tFLUooh7E2MrKlcuH9+8dtUfB8W+GzPPfF/glQ1jp+GDq5Ya9leo/QWorAx+96e4r2WDp8Lywbp2bGL3/o9P/PZHn59cc3lmhnyKClklhFRezGTqGFbztzPLmg4Q3o52xAP2Z6LLJMiiRYnJgniNNgISg0liojBgcWGeiu9z9PAhnn/mabZu2EA+NckRWiPShULrlDPsOGk6MuMGPqAHUkTfy1nptYbW1MKQ9058xh//5Md89uUZphcWCA0MrlrJyOgKHNen0WwxOztPGEQ4yqGcL6VasZooConisE1zcBzHmpCk6SeTFt3kXIt0mi4FkCWV+N1fkyHmmurCInlH2eKi449zZP9+VvT1Wf68jtFRiDAJ0vfai1b3cX7+lCGyqQkNXLh1i5++/joffvYZ96amUbkcfrFAK4lozs0RtFpEQUDOcRhavZqdO3bw4hPHeWjvXgb6+rs6ugueyrYfy+/bGERbU9bQyUGbdLMkMVFMHCcYBTiKVf39PP7wUWZm56jXGkzNz1FbWKTH9XClBNdNTy0619HVAUtAlK4rzPrbTvKdTI+UwurYk5pDYLMq4KKTyP6coxCey736Yl/x7sRju26Ha6NBblwSAkQB6MW+c9+2ecv+/SW0OFVp2fh3YNPDtmNu/RSGT8L/+W/HK9f18MJP3xF6drIc/tFPvj80P/lfnT7x6eg7J0+x2GxR7u9n/aYtoBT1ICAIQ2KtcZSD53p4SmGMLTyLwggpsDq+nkcYR8RatxEtk6RoEWDiGKIYEcfIOCZsNOnr7eXg7t1sXLeWQs5noK+P0eFh+nt76e/tpVQq4vm+dW9t88KxaispdzgLlwyQaFswFUUxrSAkCO3mqt6sM79Ypd5sMjU7x/jkJFdv3ODazZuMTU4wMzdHYAxJ6OGYBAfrHqmMtfgWQrTpJIkxkG5GhASENVEzthKeMAxptVpIKSkXiwysWIEE5mdnuXPzJrfOnvNGR2e3H3XF9kNj48/dq/SVFzdt/X8+unlr5M3OJR9fPIv3v/vfsuLQYYb+9R8Tz/03zH7xyRLO8K9q2zg5XXrm0y/2LZw5teH89CR4HuXeHtycT63ZIowCfN+32Q1ti/vJ5o50jTHZH+jikNtmzPIA3FI4MtSRlL5g6YUWTGk064goZt2aNbZw8djDrC4XiRJNq9G0NU1FS89ITEisY2veIxSZPGb6oNtntRt8gePZeTkEWlpz6tJlXn3zDT4+eZI7k5NUmw16Bgbp6R8A5dBoBiwsLJAkhlwuR6FQREiPVtAkSjqbI9d1rFGfkOhEEwZhu16qXcDataZ0UzaWr40ZPNOs15FGs3JwiId27+aZ48fZs3kzZQQtLGVHJDFOoYAEwigER7SpIcvbcldkITrF5FfHx3j1vXd44933uHLrFk6hQKm3HxyXuXqdRqNhQa96g3wux459+zmwewf79u5ldHQUhUKLBI25T3nnqzYHS3+iE7jbeCQhDgOCOKYuJX6hwMH9+5iam2V+bp7zV6+yWK3iprUmUipr5Jf2d7ZuPGjzl20il/SNlLhpliAykaXNGYOSCmMgiWKSROD6Ho7jEsQxWknKvb3cWqySP3lq6Gi+sLfQs/bST3/n2Un6hwzvCDjx7yH8C6kD/wtrv3ayhwXMzmIU/PW5memRuXqdjStGUa5DGEa4jts2hlFSghFtCb/MpeqrlgE7ODvfbU+WqduWNALpWAe9JEkwicGRUPR9Atelr6fMU8cf45HDh8lL+9KLRKOj2AZLji3SSpKEOAgQ0qqYdEtQdV9MrC3fzE+ve6HV4u2PPuSPf/Yzzly4QD0M6RkaQnguystRbwWYZmiVOwTWAEQ6uMohiWOCKEAIW4SaFQvpNMDIiseyDFZW9ElqZtKZNFIUretSM86bRFBdWKBneJCnHn+M5544zuqBAVxHEpoEVwKuAp0qzLRRlHTxWobbdI7f+VdiC1AvT8/wxnsf8PZ77zMxN0uhXKZvaIhAa2qtltXJzfsoKRi7dYue3Aaefe5Znn7kGKMDA+RUOkHFcdtgpbNTS68knZXb4dGSDYlZgqKLtOhGYdOIsYG867J51SqOPfQQd+/e450PP2Rufp5CqYTj53GUIghDTMontn2vl06S7RXctJF0izIppLEqNVEUEqe4Vy6Xw1GKRr1BGIc4rpOqdwhaYYh0HCq9fdyenUed+ry4q2/lnundz1y6JOU4oiUgVlCOrcDjt0EbM2rZLzEgz5qFhuyfeqCYqUuCOFK+Lwul0vr85OTfuX7t6t9699yX/Tfu3UN6HkN9/RQqFYyQBFFMlGik4+ACGKtbn0mWgi2UE/YFIA4CPM8ln/MxRlOv15mZmaU6O4eOYyrlMiuGR9i5Zy+rRkYYHhhgxdAgq1etYLi/n5zjUMzlKOVzeL5ng/xU3aKtg5zdW2owdt/4lwLjuRjPJSnmrasvVrowiGLiJKERBNRaLaYXFpiYmWF6bo47Y2OMTU5w+85tbt+9y/S9uzQaTVzXo9JToaevz6pmuC5hZFHVOI7RMi04FyKl6tkF3M/l0VrTDEOi2VlcpZCOYnT1asIgwBjDiVOnuHL+3NpDjz76X+ze91B5Ltb/0+7v/8ZY3/e/z9l162gF2vpDLC9Y/xVuJcyGgbD58sXr19devX2XfG8vpbIFier1OrHWlEoVtNY0gjo6TlBCgPw6m422OG/bE0GngZJOEWOTBuYyrTcAWJydhTDk+888zYvPPEN/wRZLoiGfz7XVspLEotYZVSEL7u8LwoSlwyWiY3sfAJdu3OSN997nZ2+9zdj0NPlKhVylB+V6BFFspT7BqoloO07iJEKkKiIy21QIkWYHzBIFICDdaKj0Prszs52gvJ1tMJZy47oOjpRcPvcljtH8xve/z2+9/BL7t22hUirRMAZH2HXZxIo4CtP5uUPV7JyFNlhtln0jA2Zmk4QTX57hR6+8woWr1zCOx+DoCnBcFus1Em3o6ekl77tc+PIMOSX5re+9xA+fe4Z9W7cy2FshMTFhs4nvuinYtXwEcP91ZT/Tlja1oJB19ZXkczkcbag3mxBGlItFDu7aw/jEJHfHxxmfmiZXKFCo+CjlUGs2bGG3dDqxjch2ip0MRTYXdgskWiGCCFc55AsOcaYYhjU/KuRzRIkVuYgiWzvgOi5DI8OMXb5KfPJUad+69ccHdu69yOE1P6UvD4vrwVkqbvFXof3aBOS+QayJY9e7em3bqfPnRuaDFvlKBeX5bSTJ9TwwJuXy3X+MzkfiAV8tbdnnWlseuVTSOpxhd/xxGBDWWyRJwuYVqzh+5DDHd+1jpXJopJw9KbCTs63Oop0eTLR10UNiEiunR+r2l1geC0ZJIiNoxAnX7t7l41OneOXNN/ns9GkiwC+XKVV6ka5DGNmizTiyVBTlWMk1hQKscZGOE5TbSUdm0mrZblmmBT9WuSMLlq1mrUi1jTPNdYsMy3TTY2jVq+gwYNvGdTzz6CM8+cjD7FgxioNVltFagxIo6XTytG2ELA1Psixe+pExnYUpmzcS4OLYPf7DT17lR2+8weTCAsZ18YpFqwaAxkusQRNxQt5x2bhqFY8dPMizx46xa2SkHdjbBcAWVxqj2vrO9tJEGo+aNp/z/gG1bCKV0pqCAFFqHNTnKA7v2slCtUatVuPjL75gbmqa3pERvEKJRhDY5+LYYi0hReq9bM2WMnMoIyy1CSwnWGUoJoJYJwgjkCrd3GV/jEDH6UQOJInG9XI4Xo7JuSrO9WsD+1Z98dfLE5vHGNj0H9i2VfDWLYfwTIwJsPSTb9oyY5zJb/G7X9Gybm5hIwWQbFmtnX1N2VfyCn237h24dfnyS+b61d+9fuvGxivj4zQTTaWvj0pvP9L1aLXseypJsxmAwRYzx9pyft20oFkBpAtLdaGBMYlVUEo0vb5P79AQ/ZUe1q9dw9YNG9i7ayfrV69h9aoV9BbzeNjtyIOQsK+TpH7Q7Wd7ETfduOYdB7L6jpLl/CerVtICWgamFha4N36Py9eucP7iRe7evcftu/dYWKwRJQmtxUWa1RrScVCej3RcPKXQCLtRzd5NY4Mmz/fQSUIUBjQbTWJHUSwWKPf2oJOEarXKxPwskwuzYuD8lzty6H/cKFUKq7dt+9OR7TvOXRsabixOzQmqVZcwTOiAj9m+5OsLJH93TQKuxopAeUChXts+Oz3+/Zna4toWklKuANIhSguzJRIlBEkcpwVuVls7Cy07HpC/oKXBd0aNEkoSxREIyOd8pBDEzSbNWo2K57Fj+3ZeOn6cw+vWEmHBG1uj4LZrA2yZkkQJN+1YgyKji1jUHCGtGo8QGEeSCBiv1vjiwkXe+fBD3nzvPa6PjWMch0IubyXvsG7AAFI61jzLWIlEHSd2rnIkpGtP1hEaYzMI2rR1+TM3UoRpJxfaHHrSNUBrXEfhOnbdajUaVOtVSp7L/h3b+Y3nn+f5o4cpAfUoJgoiPN/FkS7GlcRhC5BI5bWBKClkm5/fFm1g6TsqgPFGndc/+ID/8NOfcunWbeqJplwuIHwfIR1UnJAEIVGzgYoUZd9n1+aN/OC5Z3n26FFK6fGCJEqLvTWJSTDGypRK0THhE3Sj9N3AYCqNLDLIytKPHCVwFDQbTZIowjWGLaOjPHn0KOP3xqjVGszMLSCkQ6Gn10pAp8dUSln338SuU1LZzEU3CGMxKkGmoZ4kBuVKlHIBiU5iDKkQhLJBfqwTtLZAgZfPkcsX0I7DbLVaunPt2lPJ4syp4V1b35yFVtxXZBm5/69E+7UJyCutVs+Tl2/smnntzS0/ff99in19rFi1mjB1ydTGIFOOpJQy5UnTMdJYdrxfIHltJ9fUbc9xHKSjqFUbuI6iN1+iGYYszC8SLCzw7MFD/N4Pf5OVo6PEdBZjIQXCdZdgv0o5bTUFkxiSIEK5CqRDEIYEcYL0PPK+1Q6+cm+cP37lVV55/Q3GZ6ZJHC/liTu0miG0ojTItCgt2fmNISEmSX3pXc+zE38WaGID6gwVN4nGtIvXpA2kkxjP81DKTQPywKIgxuB4Lo5MC1qr80SNOn/7t37AP/yDP8BXklAnSKms1JSxPydSZRcwbVS8k8+l4worBYnWRLG2RkzKKszcnpnmzY8+4t/96Z9we2qajVu30YxC6q0mUzPT9PT1UCmVuHtrlsb8PMXhYX740sv8tZdfZu1Avw3qo8gGIlKhBDSDAB3F5HO5NoKS6JROhK0Jt3rkXQtrFrCkRTrd40sAjrCFlwkOI+UiDx/YS6tVY2p2io9PniZXKZMrV2wmJEnQiSHnODYI19bynHQCj+MEjMDzXIzGFuZpY9FGLPJjJ3Ornx3FMUIKXNdNObUZPcmmLo224ytGlKfm5o6bidmPhlZv/g9z/+BJHdfPGf7n/zuEc1iF52/boj/H735FM0CEIETxNw9Gg7+/M/fyzakDxZ+98/dOfPTBb16/drUnkoLhlSupSEmz2aIRtJBRjDHgSIUyJp0rdBoQ0N4EGa3RIkEJadHIOGZscoJ6tUp/Tw8rh4fZsXs32zdvZt+uXWxcs4bBvh4q+RxKCBwhUWlAkW0e23rh6UZeCGtXrrrGDemCZ7//gCSyoU1fo+tVaXOTEXYDj33vfQErK2VGi1vYvm4Nx48eptFocfnqNU6d/pJzly5x5tx5Jian0ErSOzxM7+AgfjFPrC0v2gacNgvkSmsqopREeh6+66QbQmEzMZGlRaxau4aC6/HlzRtcGRtbt3/Pnv/jcLG0pbli9H9I9JozQso6xlSwMtaZW5ST/gn4zrx9vnZzgEooqCloPgqM3p1cf/7a9c2RnxODq6zaV6PVQjkOeT9PojVBEKCkxPX9Nqp6H5d9CTXFhl9txSSyZ2lIjLZrg6MIW00816VSKhE2m0zPLzB99y6PHznM3/+932Pf5s1kYa+SoLqMaEjf92x8tA3cBOgkJoliXE9glCRMLPJqhN3zfn7hMv/2P/4RH372GbPVKgMjozi+1Z7OaCiyraNtrLRhele0gZv2hSwJMmWWEbXfslN+KpRg0gyBENZt1iSaJIkxOiHn5Mi7LmjNzNwsYzdv8rs//B7/+B/+PdatXGWpFIAjJa60xdb2HArPy5PhvrrrPUxiq4Tkej7C6TyZLEAOgPO3bvP/+ff/gU9On2LNxo0UDbRaEdNzc/T19tPX28fU+Djjt2/j6ITnnnyCP/jd3+bIzp2UsDs7o2NcAbl8kSiOCYIIjcBzwHMcmwnH4LX1vrvpSmmfppKn3Tn87GmXi0Xbb9j85KaVq/j+c88xNTPHn77yKotS4ubzNoZJ5xHXda0vRhCQy+VQjiKOWxitU08Dy/lHZHQmCdIi5Tq0c7ty3XS8QxRFgMGRtvZECIlJDI1ag/6hIWQYqjM3b/Ru+PTM1udW7hh5d13v7VuO1HRSsf9LQP7127fXdv32zQCB8IlNBcM80JMkw2sX5/9Wc37u6YVmi9ygwvE94mYrjY+67HeXTHZfcfif/4Hl7CGsbnAS4WiB51mR/7DZJGm16C8VGRoZ5di+/exat1RRhXTBXP4iQQcBEEKkdJuQqNkER5Er5BFKsRDFfHntBh989jnvfPwp1+6NIV2XYrmEUC4mNShqKyWIZamujp89Ig2yTdYxJkV8HwDeZLt1k06ebs4HY2jUaugkIee7VIpFgmaD6vwccRiwYqif3dse5omHj7CuVCZEo0wnNQ8C0k3I0pN2CoAy23CjDXEQk2BtnD0laCUx16cm+cmbb/KjV19nvtFE5fLM1WpIR5HL5a2VchBSm5sjajRYOzrK44cP8/yjj7J/3doOTUAI4tByYh3Xw8/laQURs9U6k1NTRGHIhrWrqZRKxEknlbekZZ39IPArTZlmqJREsLJc5uCePZy9eJmbt+/SqtVY8GbxCwWUcYjjOK0ftehkrDUqnYgVkGhb4IewgbY1mMlUE7pPnSFAgsyEJmtJlCCQONLB8XK04oibU5OMnrmw+ujA6s2f7F05Nvnkygb/31Y6OP6TcPsEZK+RSJACsxg6Zm7BM08EIYeIiYl2bzXrD9wbfz5+5Y3nzrzxzvE781MVk89TLJWIpUxdVCWJBqOTNOWbZToy50xQjsJRKWtba6KgRbXeor6wiNEJK/oHWLNnNyuGhtm+eQt7d2xn3aoVrBsZpsf3l6DgRmfmUdn7aL03jRQYYXMn7UJxY1PRSVo0KtOCPWuI0kVmEV2XzdKPs29q7D3q1BFUpCo7jnTodUuM5kvoAVg7MMzWteu5PTbGyXPnOHvpEldu3mRiboGZyUm0msHJ5fBy+fR9ckjihLAVEjSbqIyWJW2msFlvIbB1KIV8zro3BgFhSpG7dW9Mun7h2QHf9x+R+meXV65+7eRTj9yeX/Uvo/yP/lR5r7/my7t3iSBUqYjQN23ZO+2GCW6tRdKsf4ujpMdqBolMkkaiTdMFf9PY5E595tTOc1euiAjwKxUrLdmeu22NktZWrztTQTFddR3AV0yzZslXWUZCpnJyOors/CQlSRjSWFxERBGrhod4+MBDPHboECt6epCAkwZjS/CC9lhjSebRaG2zRK6LSVF5qax84GwQcObiVX70+pt8dPIUc80muZ4eRC6HUcoCKtlas3Sl6Zyie640GZ6b/s6STlk6eWptQAryxQI60dRrNZI4ppjL0d/XTxyETE+MU19YJO86HD92jJeeeZqDu3aRQ+Bm50/7YkmxbJsSagudkyii3ly0Phaunxahkhbk26utAe998QX/8ac/4drYPSIpma838PMF/GIBT1u64NzMNPX5OQbKJbauX8/3n3uWp44eoZzShkyqepUkMc1GA6kcXN8WcN8YG+fuvTHWrFvPisE+Ym3Sje7SkdLJ0Ir7WZ6mI4dotAal6Mvl2Ld9Bw8fOsSFy1e4OTVFdWGB3v4BYgxBELSzDUJIe+86leBNN946NT1USnU9JQvmGbJ6l4zm2fVg0+XSSec5Y8D1chgDU9VFNty+tXn9zWtPnVx34FVU4S4MSVgw/2nqFL+b9p0H5AW357s+xf3NGJI4dHIqb/KIuAysbLZGqpMTT7eicKh3YMBqjmcWxUpiUsMUozO+WXaoZbqeX7MJIeykJayiglSSfM4nbLaozs/jas3mDRt54shRjj60H4+uSUF0hunyNFjnHu0HwlXEgabZalHqqZBTijpw/voNXnnnXT48cYLrt2+RKxYpVCq4vk8Ydpn7tA/W/e+y7uzeoXz1Hbe/0thgJZPEsk5rAZ5S5F2PnOvSWgyJW01K+TyPHjrEb33vZXZt2EBIgoNFKdr3LJZaBi/pCZ1emxJtqkqYJEhlbZo1cG1ikjc//IA/+vFPOH3hIqs3bqEoJFMzsxTLJUqlIq6jmJoYp76wwIqBfp557DG+9/TT7N20EaerZ6SURKFNVwoXFIJ6FHHm4kXe//Ajmo0WL77wAkcO7LlPiov2hNi5/qWLr/2htste+pCV67Jm5UqOHjzAnfFxPjp5mrmZadZUNuAIh2ZK6xHGXp9ObFoz44Dr2BCEgUXm8vm2rvV9F5GlNbOgIE3/am0II5tJcXI5/HyOsJ5wc2aa1WfO79g7tOp7F9ev/JPJ4dx1PCRNoPANUQsBIgYZLu+Ur98MCJ3mup1yxb5L+ZLrbqv44pm+kEOQQ5c2nj79/Oifvv6fv3Xi4+0XxscKhZ4KQyMr8PJ5ZuZmLH0tdcakjVLbgmXpWEoAInXTTNVNwjAgajbRUYinJEODAxx/zKoEDfb1smndWlb29uBjF3yNzaSQIuDtIjWZIohtw6dOIrh71GQa4taERZECUraYsv3zYkmwtfQdsk0abS1c0uDeJIZESoxStoAzLRMdLBQY3LiRvRs38tD+/Vy+do2T587x6clTXLx+ndsTE4RRhNSavOva4NtRaCUIooTEZChsqscexZbi4zi4rker2aRWq9M3MIASMLlYpXHxwtCmWvXlA2P3VpknHpdnDx34j2xeN6E3b6QeBK7XaEZetRrHUhKnffVNWhIHRH6J2kAZf7QXdIlMZ/2bNhGEiU503a1UKCZxX/7yxZenL50/NjY1hVMoMlSu4Dl2TMWpKZwQIi2WNG3KyrfZWLSL7F3HFvGGIbmUqrK4uEh1bo6BYpEje/fx6OGjDPf0YAV0Lalg6by6dEWA9j60HfgKpZbAkrNBxOfnLvKjV17l7Q/fZ6FRp39oiGJPD41m02bdsuzpz7uPb3Hv9v4BI3CUS6xDwjBEGI2rrGrRXK3K/PQUcSvg4JHD/N7v/BaPHjrYDsYzxaxl9fnpl9kmAiSSBFuo7Ht5VGquZwNy+2szrRaX7tzlP/74x/zZq69QHhxkeNVqFqs1hONRyBfxHIfZyWkWZmYoui5H9+/nxaee5MlDB+lVkthAGEcIo5GORxQbGkFAqeSBlMy0Wrz10cd8/MmnHDt2jCcee5S+cpmiq9LCy/SO2rFLphWXFWMuHWUCCwhoEoxS9PkeB/bs5ta94/z0nXe5OTlJqVzGCIkwhiRKrCKKI9MsrKVGKsfBUYowSBkHUnaOT7bfyq7nK6y/smSe6MRQMZZK15qb2mbuXPlNjwNXUPm70G9gyFjP3b8a7TsPyA+t3Pddn2JJszsrLbg77t/rW6lvSxnvBTZcn6xcOX1G3ZoYp1Ao4Ka2rRlFJUMHO85mgsxZE/jGQXnK3m0jywKbvm1FEY1qlb5CgfVr1/DIw8fYtHH9fXmX7KXpBreW4gqdzx3XtXJ8rksITM4v8sWZM3zw0Ydcv3WbIIoo9/VbOccM4RYdoPsBndhZlLL77kJUlxtVZJ+1kQ6j8XI+QkoWFxaIo4hCzqenVEQZw/T4Parzc/SWyuzfs4cnjh5j1/pNDBWKKWqVvqwZB3zZPS/5SqQFpBlvHJCeg+fYhW6sWuPjU2d49a13uHrjFiiPME5Qvku5XKFcLiKNYWFmloWZWcp5n707d/DEw0fZv207PYVCasDT2ZQ4nksiBKGxEnfj83N8fPokf/bqq1SrNSIpKZWK7N68HiHtJJ4h2Bma3+nWFJWWsmuMdRYBg0UMej2P7Zs28dC+vVy8cZOZO3chjkmMIQqtzX3O83Fdl1bQIooiDAbPc9uKH1k63HQ98/sepVn6YXsiT01gpLRFelGzxczcHPX5ud1e1PoNBSfIieusEJIeEtbxzZKJHriTUL4EKv7mJaESaIFZhLCyfY8e2H9URBE5tWWd0/9bLwbX1q+JB4LWit8+f/ZvtH70s7/x4w8+3r0QBF65r5d8sUgUh7QWQ0xicJUNKC38aCU/dar9L5XlTAqsc2GrXqdRrbEwN4MrJKtGV3Dwkf0cOXiAPTt2sGHVKL4QFD2vzYqNUkUnK98pQDpLbyR9AFprYm0lMS1SaoslVUrd8pWHRrcRKjvGusKrdvarI3tqpUuNrWdJsyFKKpSrlgWi2WbEFveFGrSQCMelL5dn35bNbNm4gQP7H+LzU6d596OPOX/lMnPVKjONBl4uR6FUxs/l8d2irW9JNEliaRXFYsluZFIFGMdx6O3tx3UUUdDCCMHY9DSNRj0nTXJ042Bv9fdNsvjmnr2vX966deLmf/VfVXNPPEH/p58ylctR9X2U+bqDzTZjNEIqak6OoYEVrB5cYeUHk2/OfonSDfGakX5WXbgx7E1OPdMIg22ZGpVVlDBpP6RAUPrOtwsVTZYV/QZrTQbeSDs2iC1Nw3NdTBTRWFwkaDbpX7WKAwceYuumTW2AYemr3j33LMucZceXDomOiaIIqZw2zeXKjeu88dabfPjJR4xPTlLs7cVxXVvMt/RS75sO2jFwFwi1dJOw/AjZpx1BYmUNPWg06iRJjO+75FwXV0lmp6eYm5rCl5JNmzdz/NgxHj14gLWDAx2ENj2QkpZa0b2+dZ8xCzrL5UpakwOxrUjFUVZd5trde7z+1tuc+PwUC9UGud6EQqFEj1Dkc3mEMdQWF1mcm0EmEevWr+XRI4d44tgRVg30o4E4ilDCrusGkK5HuaePvOOyWK/z4eef82evvMLnn5/kzsQUvu/zwpPHcVA0TYZNpS+8tt6dMq1P+KpmBQ80cWJwPYe1q1Zy9PBhLly/zs1792hUqxbh9/2USpe055Vs7HYWlkzNRXfB8V+/GTrHk9Ii/GEcs1Bd7KnPTh9dk0Sj0zLhHrNxwqT5dgICv5rtOw/IF4M/v8nHN2maBMe4rEzycZVSFAjJYBhtGrx04fDnZ84UJmanqaxcbaUDu6zmu4Nx+OYB+PKWxJYbp9KCTiklcRAQNhooYM3KlezZto0ta0bJA2EmYZj+/lcF4lkTwiIWQRRZVZR8HiMlNyanef/ECd56910uX7lCjKBQKpHL59EGoij+hTHSN/n+g66tjegbTRIFOEJQKeTxpaQ2N8f03TF6SyUO7dnDS88+yxMHDzJcKFjUJoUqtE4nwHZB64OvRKSbhyQtJtVC4CpFDNxbWODtjz7hP/7kJ5w4fYZEKkZWjxLECb429Pf2opOI+ekZ5mdm6CsVOHb4AN979jke3/8Qo4UCkU5oJTF5x0VoG9Aq1xYnVYMWN8bGeOeDD3n30xOcu3aNRqOJee01Kv195Cpl1o1ap9UMHFie7cgyAA9qdgGzGyEH2LR6FY89/DCXrl1jZm6O2vycNZ5x3XYxnVCd1HeSJBgcHEe1OeFJknyz+TGFNjKJvTiOcR1bjBVEETOz0+7CxNj+kfHa4L2tW6n+b/6hNj/5I8OXtyDH/dWJX9VckE3IG1sO+nVCou5pWIKT4kIJfWuJ1h+WgwuTeb1qZXB1/ZrGChhd99kXv6N+9up/duPDDx66MT/PwOgoPb29JIn1A0gSjSNdpFCkPAKMSOcFrEyX73pgtKVc1WtEQQtPOaxfuZItGzayZ/tOHj16hF1bNjNYyJFPu1CbTomDgA7/XGQa/qa9YWsbu9i8MCJd/LNAPLNGt/etcOWD39nuTXv3v7YIXLXPC3SpMdCmLNlNR4YeGoTRiCTBU4py6lw4smkja/v72bhmTUpluciZ8+cZm5qitrBA38AgPT09eLkcQRjS0gHGCFzlWrfZ1MBICQevkEMnln+ey+WJooh6HHL25i1kGB7ZODGp9oZRITh86E9urV49E+zaZdy5uaLu6WmFxWLifFMdcTuJEtYWCNasZOGhI6hCER1+c4MgLa2O8qbxydzK06c3j50+tWJ8YZ7BwUFkLo9U0lqGxzFa67ZjIXQ25X+uNadrY+86LgpBEIZErRYDPRX27NjO4X37WDs0kA3t+5DSrzx09oWwmzItDK6UVOOYmxOT/PTNt/jZG29wZ2ICr1hkYGiQIE6o1+ttY7yvOmaWibs/Wl+ete0+xrLjCbt5bTabOErSUy7hKUlzcZGpe2PklWL/rp08/cRxvvfEE6zv77OFBzrpGCel4gPtDc6SK+ngy1IIHMfDGENsEhJhC3ND4Oz1G/zotdf56RtvcG9qioGRkZTgJujr6yMKQxZmZqnOz+ML2LlzB88++STPPnqMjX29SCCIbAGnkh15UUfYotSFMOTd02f4Dz/+CR9+9jmz8ws0Tp9iYGSIQqXM0X17GC4USLCGPEmS4EqJqzpI9QPjCSFAKTBWelMbGC4WObBrJ+f27+PqrZuMT88ghKBSqdAIWrYeIJ2n2ls506VQR6eY9OtH5OmKpw1JCrQJKVM9dsXUwgI3rl7tHTl5av0OL1+c/Ft/p5lMzxmKf556pV+t9p0H5CfH/+S7PsV9zRW+8Z1nWvT0IoTEm7t3yNy9+szczGSlEcUMep61LE/0UtS5KyCHDFn6ppOk3bnHaeDjug6e72F0QnVhHh2GjPT3s3/XbnZu32arzLGawU7Kx7NH6f53KWqRAsfEWlNvBVa/U0lmg5Avzp7lZ2+8wdkLF0Ap+vv68ItlNIJGEBAlCarbQfMX3l4nilgCQAnR/d0lhxMC4jBAYCjkfHKuiycFjcUFGosLFByHPdu288xjj/Po/v2sKpXaVVkSa+muU6MII4RF+r7qOUjrSBcnMVpYtFEC4wsLfHzqND967VU++uxzImDFmjX0Dwxy++4YSZLguy4zc7MszsziYnhozy5+88UXeWT/Q4wWS4QYWq0mItFQcCw/2xgcoJEk3Jma5rV33uXVt97i3uQkuf4+vJ5ebo2P8+a77zE4OMixgwfYsGolvhSpY2MnPZql5bp7emlepPN1CBSlZOuG9Rw7eJAbt25x/uo1RC5Hb2mYIAxtvUJsC2QymU6trQKB67pWmk7rjjqB6d483ffE2/9nx7GbUjNCnEI+rYLPM1mvc/vGDbnjy7PDzrNH1dv/q/+bjs8k8Ef/w4Of189pJr3PpfX6X926eymxAbmoQDLVVLSiCms2DYiFLZvELa0rv/vlmd9d99Of/ud/+vHHWyYWFxgYGaZ3YADpOITVOkbbgNtxHXRiiGNLezKkaDIGJ9UaiKOAsFGnVV2kUiiwecMGDu1/iGOHD7Nl4yZW9vfgYSfXCFJ+eJpCzpxQM56osR4FURKnngcgUllAmf1cKuCjSfnCy3jGetn/dzpo6WhashEUtvjKYOziHceYJEGkSKFKkXghFY5wcLLCNWPtt5uRQTpWenXd0CArhgbZt2sXp86e5SflMh9//jm3x8do1hbxXYecACkMSkmSxBDFiZ1PpES5HghFGEaEYQt0gp+znP4gbDEzOcmn165VJpqNpx5B0++7zX976MhroeMsmCgqi2o1lmGYyG+IkGetVK+zaAS3esto14Wi/4t/6Sva6ol4XXnizv7Pzp0rTS4sMrRqNRFWNjRTU5Ht4nTuk/Fbvgb94iba80kcJ+0C0TgMiFotCp7Pzm3bOXLgAGtHh/GAWkqPcdvr2/3nawNTaYSq2wGWQDouMXBtfJw33nmH1955i+t3blPs6WV45UqK5TKNmTlazRaFYiG9ryVH7778DiItTHsuuj9o7M7+pHzorg2z9cFIcJRDzvdIWi1atRpBvcqWLdt4+vhxfvjM02xfucKuNUkCcWrmpVQ7GL//CtMg0WRBOSA0idFEBoQS1IHbk9O8+d4HvPL6m1y+cZOeoSFWr1/HxOQkcRTjKpdafYHq3Cxxq8XuHTt4+dlnePbxx9m2coWV5kkdhXO+D8IG1UhFgq1ifvfkF/z7P/tTPvzsM1paM7J6NWEQcvLceZsNdR2eOXTQouyJtuf1PH6urU97v2MlCI2xyluOUgyWSxzas5uL167x9vsfWLllY+sIJLSLQUkDZ601CTZjISSpoABfKx5vb8y6/tUmNXcTgnyxyHy9zpXr19WaV97Yt+KlFx6S/9d//imu++3tdX8F219NlZWch/qbLzLyOy+wfUGKnpuz+5rV+UdjrYVwXaRyII7Q6eTYLqZZkuIV7a+/UWsPJt0erBJrG1uft8HolvXrOXrwIXZv20YxLQSRwqJR3QvmkrZkDktHuZI4OR/f82jFMecuXeTdjz/i7IULVOsNCj29OH4ejU352PXvqyHL7pfWpBN1+1Ve8kaLB/5O+7sCWq0mGMPo0BCOgPnpaabu3aOSy3PkwEN87/kXOH70KCO9vQDtIk6RBqoqRQ87RSlffdVJ+seVDkYIGsDJixf50WuvceL0GZo6YeWatQjPZ2axRrFcRmjN3PQ0UxMT5JVi17btvPjEUzx+6DBD+QJxEtOo13AdBz+XSyNoiXQVEpipLnL64gU++PxzvrxyFa9YYGjNGnzXZ+z2HS7fusUf//jHBM0G/hPHWT08hO86xNDOzGRqGUvvbilEYx+DsYG261GSkn07tnPq/HbOX7oMcUIxlwMBzVZAGFhrYuU6qT66DaKz6vdOtuEr8ZJlvWt/xHEUUWit2D3fw3Fd8qUi1VaTu7duOWsunN4/uGvTHlYMfolS38o+LQIW6HA6v6ppLIpexkoEWkoRUVgcoLbhURMXtyndaKkPn3pkZtvWgTW//elnzxc+/OB3PvvyzO6J2RkKgwMMr1zBQq1Oa7GKoxSu66GkNdwyxiqpRKHlOefyeTxXEYcBs7PTVOfncIVhuK+Phw8c5NGjR9m3YwfrVoxQ9nMIbSxH2lW4UqKzh7ysFiJJ61WQlv9qRR9FW8vP0NmcRNgsWvYMojAkTm3Fg6wmJH1nMklRpWxmxHVdfM/+q5SVNHUR5AAHu4k1ntNGwgHLFTUWNRekNR3pXOkohRTGGnoEBum45DzJ6nKR0t7dDPVUOLR3L+98/BEnzpxmdmaKmZkpipUeSj295PIejUaLONFI6VDIp8V49QYCjaOsSpLn+OScIvlKmYWZaa7fvcuKUumRDRcutr6vTRSsW/9e64c/XBQff+w4t27h5PMBiYacBwMV8N2UqP/zm5MDVfK/PpD3c1oes9ULWg/Pzk5V5poB/TJV/Egzpq7b0bPONsjAEsraNzU9yp6bThI8x8eVgvmZeZJWkxUD/Rw5+BBHDh6gp1gkNIYoCKyqi1KdF7zr3pd0Q1c9VQx4KUByZ36e9z/9hJ+89hoXrl5F5Xx6BvpRnstCdRGNxs/n7GjW93dtVieVbSayH7gf5un6RECWcmtTXIQgjiJ0ElMulsi5imZtkYWZGWgFbFy31tZyHD3C6oEBAOvtIQSea8k7ois1belcuv2uZnG6EbYiI9YxQauJdFxcN4cDXB0b59V33+O1997l+r17+OUyXqFIK0rIl0okUcTMzDSzk+MInbBh9WrrtXH8cTYMD6OAZrOBktbBUghBK44Io5BKvsRCs8mnly7yJz97hXc++ZQoMfQOj5AvljBa02w2OHHyJMOD/fRUyqxZuYK+Uolc+q4uf6aZAlj3fVuwQCKNptVsolxLddy6cSOH9+/lxvXrXL97j4X5edxcSo/tqoVw0sLdOK3fsjz2ZMm5f/Go7mInmAyssLSnXCHPQq3KzNyskrXF4+UovCyMOU0mZvtXpP1VDMiF9pUY+50devNjjth/orrOOXV1062pCeHkfAqOi8YWRC3nh3dPhN088m/jCifTCmNjbFFj3GoRBwGjoyMc3r+P/Zs3068kzSRGG3Czn+frrQtJet0Fz6OaaM7euGmLOD/5hPnFRfxigUJPBQ1td8FsJ/ttWxacf0U5RrvZDUZalGkSgkaT6uwsnhTs3bGN33z5ZZ579BFW9fYQawgiW4CT1p90AseuYPyrnoAFbSRSCbSQTFYXOX/9Oj96/XXe/eQT5mpVegYHKQ8MsFhtUF1cZLC/j7DVYn56moLjcHjfHl5+9hleePhhVuQtZ7wRthA6wXVyOK4HiUYoSUNrbs0v8PaJE7z6zjucuXSJWpIwVChS6Osn5/kMGbh58TxvvPE6Zd9l15bN9Pf2UE6LgNph8IOysV9xk3EYYQw4nsfOTZt45MABzpw+zc2JSeqLC8hcLg2aA4SwmRnHSRV4oghHWUUQJTqI2jdq6QKYWYxL36NYLjLXrDM2MeaLO1dfLM1O3BArBi8iVUwnpvzaTfP1Z9cYO3kltAPyJFyxisbf/gfoyoiRTl16a3rdtVNjj+x4591/+OknH+/7YmICr7eXysAgWkpaoXXeVPkCGXUkjq2zrhQSLUBIuygbnRC2GjSqi+SkYOv69Rw9cIDnn3qaPdu3M5KqpkTa8qKJk/a7Jru5KqLTl7boW7T/PzKGIAppRRFBHNMIAuZrNaqLVeYXF1mo1mg2GtQbDYJWQJTaToeprnW2eZVpYahyHPzU2TOf88n5HlIKKuUSgwMD9Pf00VMs4StF3rcbe991yWXoubGBsUiDskxjXSDSzaRF05IoAhxcVzFcLDK4cwe7d2xn/bo1DA708enJk1y6cZPG4iKe55NXjr1GZdUWlONgdEyiTboRl8Ra2/S9o8iVStZiu97g3MSU75w8dWzr5JSkp09f3LHjz+rz83I6lxPFXM4G4TOLcPY6LNTB+8V6+KrVojEBppmHQgHCr6kMliQIx6F/7TD+ikFaBvxabXez1Xy4FcelIEnsdcc2UHFSrXoppTVASd2NHwQKfZtmh5Z1hK0tLNCTz7F140YO7dvH1pERu7GLYqvG8bWP2pmkhJSEwGy9znsnTvCT117j8y/PEBqbfSxUemiFEQuLi+RyefJ+jii2sqFff6+Thendd/XVP5FlGh1H4LsOSRiwMDtN3Gyyec0annr0EV5+5ll2bd2CI6AZxQjAkdlauDwfSFvUwS49ov2ffVEtpcNRDqHW3K0u8sYH7/NHP/kxZ69cJVGK4ZFRjHKYX6xRLuYJwwbT4+MonbBzy2YeO3KE7x0/zu7UtbYVttBhgJvLWbAQOya0dJjXMScuXeRPXvkZb3/wAeMzs6xcu5ZipRdjBDnPZy4MuX37Nq+/8w7lUpHnnnqKvq3b8BwHozWR1rhLfDLSns1uKd0wKsex8x3YbBmwuqeHI/v2cu/uXRbeeIubY5MMjo6SL5dtliCJEUbiedbMLat5aY+vb7LJTYMfmVH2TFbsLHD9HNJ1abaacm5hfm1xbu7oUKvVd9vzFv/qMMj/agbkMgF1teCFPvRsH/ts98Tlz4evT0ziFvJ4Xg6dIhOdl/p+mkp3GnH5z/zcls4QrmsXAh3HNMMAE7QoeC7rVq1ix5atllMG1Kp1cq5LrpjKUiznEpplx4YlBZQecOvuHd5+/z0+OvEpkzMz5CsV8uUK0nFpNhq24Egp6xlDt57+12tZkY39LbnsspYfyy7g5UIBaTQzk1PU5+dwMezatpWnjz/B0UMHGe3tIQaiILQpMNW1RKivWi7SdH3WR0JghNNGFBejkHPXrvKT117no08/oRmG9I+MUOzpo94MCKIIIQXNWp3G/BwkMdu3buX5p57i2ccfY01/H4kxBEEDhaFQKlk+sdHta5qvNvjgkxO2qObsWepRxMDICLliiVqzSa3WIJ/PUfBzVOctz7vearZVSpSgc68P2n2ZZV+nYa3QdqFVQA+wY9MGjh58iKk33uTO7VusWLuWXD5v5fCSjqNdVsiphUDL+ylYbfSiG8ZIz9td3GSSNChzVBvtdX0fpCSIIidJ9EYMB2kTLNpiIt8+wvg5TQPV5R8OldC/vQ82r9PFxQY/uHjpwIpPP3nhi5s3H7owO+MLx2XF6jUEScLde+P4vm/VAxJDGEagUyRMSpRy8JRVEQiaTVqNGjoKKOVzbN+wnuNHj/Lk44+xd9OWlI9qiIOQJIrxXYdi3iflrpFJ2RkpUalhhsZmxRIs+t2IE2YXF5mamWFqbo75xUWmpqa5ffcuk5OTjE1YS/t6s0mz2WxzkdsFW6QoqTZodBsBU46ynH/XxXUVSZKwYnSYLZs226C8t4++nh5GBgcZHhxkaGCA4Z5eCo7VC19ieAWWZ25SU5tUJQUhSOKEqBlilES4ipwUHNqzh3yxyNDQEO7b73D55k2q87NEcUy+WMLxPJLEELRagCCXz2GSGLCFn60gJA40ruvQMzAAPT0szszw5dWrvSBeWP/FqRs9Rn7S2LZ9YvHgwaAeBJDPwydn4V/+GXx5Acp9v3gwGTDqU4z3h99sG1ltIPsr7P1nf42tv/kE89XmQN+t2+unqtWy8n18I21tgu6AO9DZ1GbBuJNSCONUjeSbZGXbxJK0QDhJNHGrRRJG9I8Ms3XjRlb096GAyFg6Qd7J3b8GfEUMbKcDgZECD5hqtjh75Spvf/ghZ86dwyjF8PAwfYNDNFoBjUaTOE5spklk+R6z5CRLQu6vdavdK1AmkZA1Tc5zUcIhDlrU5udo1WusHBzk4YMHeP7pp9m7fTuuMTTrTYQ2VIoFK0tsdAeMw7QDVbtBetA6aVDKIZ8voYTgbnWR9z/+hFffeovzV66QCMnA8DC5QpFGKyBotfAlNGs1omaLtWtW8eiRIzz75BNs3riBBIh1jEliHClQwubENAJPOgQKTl28zM/eeYePPj9JLQgYGB3BL5asEksYWpBEGKTjMDk1yeXLlzm0b5+l5ChFKwgwSYJTKNoMGss057HjMQwCXGNwcz6FfL5dZ+AAKweHOPzQQ5w6d57zV64QBb0UyiWUkoSxQZsYKTyEozCJbMdWbZniZevcAz1cUjfprHBdGJHWQKWFzlLi5nLEQYubM7Nsun6j5/F16wZP5PM3L7jfxoTuV7N95wF5mZXf9SnSZnexAXdMgImxknPDpdrUY5fHb6+9NzPDwEorbRZHiX0Zu367GxHvRiu+aRqxjScoS23QcUKr0cDRMStHRti/axe7tm5lsFREdPN5yVJjv/A2UzqJXcjrwNlrV3n/k0+4fO0GrTihr1Sy8oaJfbmFVFajNrZOnmKJPmj7zF0IeBd1Jg3iu3l9y2PG5UfCGIvG6YSx2RlEHLN1+zZeev55XnjqSdYO9NsFItFWx9lYwwlr7bv0ytrHN3ayMkZbPdMURc8KXxpxzLmrV3nzvfd46/33uXnvHr3Dw/T095MIxezUDPlcnp5ikdnJCZwkYufmjTz/9FM8fewYa3oqSAy1ZgNHguflkMolaLYwGPx8nplGiy/OnefdTz7h09OnGZuZpXdkhErfAEgrMdasNxjo7aNYqbBy40ZWrVlDpVTCUR10/EFtCWdzWZMSPNfScYzWICXrhoZ44pFjfHH+PJeuXiVqDVMsFsH3CaOYONEdR0Bp+3XpmF6aeWif9asvEJkaBhljnTutLm4O3Wxwa2qS0oXzpb39feWrzz5bmy8UEtKA/ee2QgHm5+EP/xDOn//5P7usLUNGBI4ylHOMAnun721ecfni35k5c+YHF25c82taU+ztBcfq7jqug+M6GG0pPa7joTzHLgLamlzliwVazTqLc7M0aousGhni8P6HePrYMQ7v2smm0VGKQL1lNbU9+6AsZ1anqkQpCiekaPP6wSL89TDi7vQ0t8fGuHbrFtdu3uTu2DizCwtEOqHZaFKt12kGAc1WiyiyVBoNCNcGwjKVhcjk+rRO0gUx5SZrQytKUNogI4EQhnBiiqlqHc9xLCXLcegplRkdHmLVipVs3rCBlSMjjI6MMtzXS5/vk8ueY1aIqNMARhu7YU0SZOqkKBKBKxU5qdi/fj2DxRJ9lR5e/+ADTn75JbMzM0gE+VIFx3VoNkMSY1BKoXWCI6wxTRzZjZJB4Hk+vp+nulBlZrHOlZu36SlVvjfU2xvt7av8q7hSPjmVz9vx7DjQqAOzUP06WLDCsnTnySpZvl5bxMwMcq0nR09fb3nztZu7Zi+cX3X5zm1ULkc5X7SCVlKg0mNmCivZe5kVd3ZvoLs3QV+nZUphjpJEzQZxs0GlWLBFxjt2MjowiAB0FFrTliyA+boYk7ChkgRu37vHa+++wwcnPmV6YYHhlSvpHRyCVEFMI8gXigghiML4Kx1nOxSUZd/MPr5vU9D5vlkW3DlSooRhvrqIDlusGhriiWPHeOHpp9i5fj0VIBICJ30WWZxtj3t/mrJbBYu0UFEbK3YvlYMrYLxW5YPPP+dPX32NT06eohlF9AwOkSuWaEWhXTNch9rCAiKK2LR6FY8fOcpTDx9j94YN9CtFGEfo1IXT8X2EEiSpE0kA3Jia5Mdvv8mfvfYak3Pz5MsVevoHaIWpeZtni0uDVkASR6xYu4od27exYngYV0qaQQDaqkZZ/4yIOI7xfH8pACZsViqlyeNKm6GKogjlugyUyuzbsYNd27Zx8sxZTJIQtloo37O+ApnsbjoOM3rWEnrsA8aawbSj8+X7wfbqlGYRY61xcz46LnJ7dpryxQu9u1ev2nN9YOA2g4O/RGvn/7TtOw/IK6z5rk+RNrsoNYm1HOmlKV1yMauU0Y/Wm401i406/UIilCIJ4vYObjkl5c9DU+luxlhUUipBFAZ4UrJt02b279rFqqEBPCyqls/5OCnX13QFSl9xi1a/GPvgGmHIhTt3+PDkaS5eu04zSSj29OD4OYIkoRmESGWLw7QBhG5Lof3yW2aqYK2Ng0YTEUf4ymHjhvU88+STPP/Y4+wcXUEIBGkq3PUc62gaxdb2GbFskuxCV2yen2waNQYcAbPNJhdu3uDVd9/hrQ8/4s7kJCpfoNTbh3AcgkaLOArB83CEg0pitq5fxw+ee45nnniczSuGSQzUmw20jnG9PFI5JElMbDRBnLAQN/jk1Bl+9PobfH72LLVWSLmvn0K5DEqRpMh0HIbMTk6wYWSY/UcP8+TRw6xftZJizutkQB6UhjWdFOJ9t28EfqakojVaSirFEg/t3s2ebdv4/MyXmCQhaLWQKTXFGIgy3qrjphQETZK6qX1jGU+dIIRVcEi0IQhDPNehUCwSY7gwMcG2Eyd6Hqn0bEsefnj25Msvf31uX70Op05944B8WROsHjH4Lg/NL+44+vYHv3vjyuWXvxi7OzhTrVLq76fc10+90QQhKeSLaK2JohCdbvCko0AKdGyJMFHYIgqaKAzrV67ksSOHef7JJ3h0715GC9ZyvhFFhK2AvOfj5137jsapmo2jrIthioi3koRGFDNXqzExPcO9yUkuXL7M1Rs3uHztGrfv3GVmfp4wjvByORzPw8/lcH2fXKWHSi5nHW5THrIUok0y78QPGp1KVGqTqah0MElHKprNOvML8wStFmH6RxhDpVxmsK+fNStXsmJ0lPVr17Fl02bWrl7FquEhenI58q6Dn6KxWmu0iRGxtm6jjrVTR4BOErSUFB2XHStWUDl+nEqlTMH3+eTkaVphSKtewysUEdJuHJIkwpgEI62LrC0sVSSJJghjJIpcoUygYabR4Nr1a6vdfO4PDqBv5XQy8frQ0GzV9wOExPoO5rFSP7946NAm5WTY4NdpDloMiJtrNhh3cKBnW9g6MHvl6urL16/Tv2Il+UKJMIwtpU7S3ixBZqKilhRyfjsRAdoFukoIms0WOgxZu2IF+3fvZtvGjfSWSpbimL77S0jbP6dHsulWCEmEoYrgi0uXeO+jj7k7Pkm+VKZ/cBjpuMzXqgRRjOO55DzrdRHHMa5S7aLCJai4WHquB3zM8tzscrAqk8fVkQ1s41aLkf5+jjz0EC8+8zRH9j9EXkgibN/7rkum9K4x98kbZl2/5DQ61fw3BuEoWlqz2Ap458Tn/NFPf8onJ09SD0P6R0cpVCoYYQhaIVLYotl6rcb6kRGefPQYTz76CHu3baPi+yQYjI6RxqLuynXTWhFDhOHCzZu8+u67vPrOe1y/e4+e/gGKPT1I1yNqtHBdiesoqnNzSDSbN2zgxeee5XvPP8+mlatwhSCMYnKua5WhsMpvSRxjvEx9vTN+3JTapZPEzoMpXSSSEl8pVvT1s3/XLk6dPcflm7dYnJ+nf3gI33EI2nVKsq0EldHc4IGx+Fe0TgZJGDtmlFRoYdVnPM/H7VGMX7/OvWvX+vbt2PGwV69f+F8C8m/QzF+QRqQhQdNi9MnfZuQf/TXRym00G7+8vbLoutsihasDy6O2k1+a0k0HTzeXrzv9+22C8ixcjKIIpSQ5xxY7IGDNqlWsXbkST1gL5aAVUC6XrCRiotNiiHbJ5n0Hzhb2bMkIGg0+P3mSL06fZm5xkVJPj0WEtaHesDSJQqWCTl8Ya2OviFOr2rTjll58dg9d386mxOzaLBHBtNGfNnphrFuY5yjG79whqNfYvnkjzz7xJMePPcKq4ZElJicCLKImJMpxrQZs+5yi3ZdZsI/MXBENichSojAzO/v/Z+/PYuw69jVP7Bexpj3mzpnJKTkPIkWJlKhZpCRq1hnvvXXLXYWCbfjBcNuAu54acMOA3UAbttEPBgwbfmi33Q+ualTdGs45OpopSqRmauIgjuI8JJlz7nmNEX6ItfbeSSYlUufo9j3XDoBS5s6919orVqyIf3z/7/99HPr0c/Yf/JgLV65S7h/ELRaJ4oR2tYqQFqPDw8xNT9OYuslYfz/PPPkkr770EuPDA0atpl4nZ9v0FcsgJL7v02q1GRzoR0Qx5y5c5s339vP7d94msWyGx8aojAwzX68xNzNDoVCgr1QiJyWXvj/LlhXLeeG5Z3n0/u2MVSoGSdAanepPm2BKk1UN9aKnvTNZHEUoleA4LrZtpYoaGgfBcKHEfZs2cd/mTczWGtSrNSzXwcsXjFOiMmhfJlmYJAbVXBT8p+e5HSfqpsPBTM52WhAYhj5BkqSa5DlsNHM3b7Bw/frQ1smp3blW+zKDXLzjQ/LnbQaW+d/+T0XxX/4v1cb+Ilsu3XiJZv1ffn/+XOXazAzF/n6KfRWEtAmTAK1iLCmJY4VtOeRzBVrtNvV6nUKhQKGQR8URU5M3iIM2q0aX8dtfvMqvX3qR0Uo/lULRjGOtcaXELRaxpCmQU1FsxqVjd6zAJUY9ZmK+ytnz5zn8zTccP3mKy9evMV+rgZRIx6EwMEBhcNAoB3XqJ9KskZQoYazKgyRIU+waoQ36mj4Zi9QizFhRPXOZJiBGS0mxUqFYrkBKnxDpRlopzfkrVzlz/gK5r75hdHiY0ZEhHt21i8d27WLN+EqWl42xjJAS7bpIK3Mv7e4ojeRpZApwXZeRgUH2PLybUrGMm8vz0WefcXNykuLAAIMjI2hh0Wg0TRAuBEEYoKXEcb1U3ScmDEI8y6Kv0o+II85cvcaNubn8L/orrz68fGxONZvvfrlly7Ublv1jZS63DSHTFoWNd9G0DdoB2hYUPcser8/NDczeuMnw6jW4+TyN5hxS2liW4Y5nSLiVygFmUqQAdpq9uZd1x8zV5ntLTIGjTBKWjy5j45pxxgYHyGGMa/Kuh9BGAz8r0L3zgVO7eEwBdRCEnLhwkW+PH2dybo5cqUixUiHWmlatTqPt43k5Y84TJ11t+14t8nT/uNS96WRgtRm3ljRShIkWHe+3ztjucbV1LAu/Ucdv1rGUYsP4OE/s3s2WdespCWnGdJKgkhjXspEIkjg215+qKKX38pZepROMayGxbFN/U6/V+eLIMf7dH17no8OfIz2PFWvWUKhUaLZ9wlabQr6A32rTqFbRYcimdWt4ad9z7Ni4gUpKy1JC4DguQikUmkgrbGGC4lYS8f7HH/P//lf/mprvs3z1OP1DI9TqDeozM5TLZTzXI2i3uHr5EmtXLOOXr73Ka889y4bxNbgYFZp8LmfAPjQqSrBts5lHm+dcStEde65R4YriCDeVaXbSZ1FiqLHrVq9m29YtfH/xItVqlaGRIVzXI9GaRrOFZVkUcjlD11VpNrub4mbxc7ZoBC8aC8aIzbwqHRshIfB98iWXQj5Hq92itrBQspXaZAsxcudB/JfX/tEE5IpYRITW6OqV8UMPPijidlhsnzq5/MS5k6VqGFEYHkbLrtpIxm26VXf8VqWVXn3ypYL12yY1YV6zLEkcRczVani2zZb169i1YwfrVq82xWhpAZMUJib7QaqK+arEKjFuWcLonp6+epX3DnzAyTNncItFCuU+hO3gB2GHmmIE+juHWfRI3O2aJYQJIKNsgXVchGUbw5DUkt11HFxLkgQ+89V5Ir/N6rEx9j29l1f37WPz2rWUpEWcIkFSSITsUoKEJbp8MSSJilEqwbIkljC8ZaNKoI1ahDAFZ+dm53nzo0959+Ahzl66jHZdCv0DWK5Ls9k0Fr4izTf6AWOVfn754gv8dt+z3Dc8ABi03pLS9HGisG2J7bo42iSyvzp9hn/zH1/nw88+x0+0MT2ybRKlcV2XMAxo1WpIYKBY5LGdO/nl88/z5EMPsbJY6PRjpmfdzVKk5Yg/cCfMPeveOSkEKg2ecsCu+7ZxZvdl/vD2u8xOTbFs5crUgMYE39JKi5eURmiT2v1h1Zpbm/muljRHjVK97sxFTVgWWBY136ddrS7PNRr7nDj+Fn7WgHzxMBZC8sBrUf/AwwOP3bz8tProwC8++fKLyvXZWexigVJ/P1oKWn47vRqJUuaaLMtK0+eGb23bFr7fwm/UUUGb7Rs28urzz/OLZ/fy4IqVRjcgRZ6lEGbBSzelSoO2Up1waahUN32fSzducur77zn23QkuXr7M+UuXmJqfp9luoaVFrlCk4OUo5vO4rou0LBKlTZo84xujTQGryuzWzYInNFhYWL0BeY+5kNZ0NnGQUSIktusghZFZTetKDQ/cD2i1fZqtFnG1xvTCApcmbnD1xk2+PXacdeOr2HHffWxYs5Z1K1cwlM8bmbP0ZqjEjG8DbmgT8CcK15Ks7KtQ3rUL13YoeXkOfPop1yYnqQpBoa9CIe8ZyckoIo5ipO1gOy6GgGOKbYUjU4t4RWzbLDTq3teffPr0Tt+v3//gA1NXt2xp3LCYN2S+mgD3LqJbgSERRRhk3ePuAnPX/JM2Iap/furGI2EQrLYLBXQ6P3VuAkuvF9n97UXHfyggv+096eOsE0WUhCRhSMFx2LxhPVvXb6DPdc1ISJFPoeRtdM3bugIIVWwcl1MN/KlqldfffZdDn39GiKbY30+uUCSIE4IwwuyLzXuTtIBVStntgx9ondlNaxzbxrZsWq0WftjC8fK4Xg4hJX7gk6gE17bJex5CJYTNBrWZGXKW5LGHH+K3r7zKo7t2snJouFPtJNDYogu2ZcZ4i/qxF4zqcPxBCDMnaKAahBw6eoy/e/2PfPLl19T8iGUjy8hX+gzYl54rCQPqczN4SvP0Iw/zV6+8xKPb76NfSiKl8MMIaVk4rguWNFr/6Qbo4vQ07x46xB/fe58bs/MU+/vximUSDY7roJWHThLmpiaJ/TZrV4zx2vP7+NVLL7F9zdqO74HxG7OywAGhjEwptrG2vxX2y+gmWQQthfHzyIarDaxdtYqHdu7k6yNHmVlYoN1qUUqLwasLVZMls2zCwMg3OrZtnl197zGgmZPS+EuZ+6CFcd528gWQsq82P7/TbbXGh4EC4MT3tp3+Se1njpj/ERV1CgGWo2rTMRPfyVKxtOzm9MXRrz7/TIQoVqxeTaQSoig2aFLPA3lrwQ10+U/ZhGnO0HXvvBXp6H7WcEU9z6Me+kxN3mTD2HIe2fUQ923aSJ8wlJN8zkPrFBFRymiAAllhQ/ey0mdKa8JEIW2z+F2ZnubwN99w7NQJWoHP8rXrENKiHQSp5JpjFvbETCx2ylM031F3ueG9XbgESKDJ+sbwuJQGxzXBi05Eiq6B5brGkCeOqM3OMb58jFefe47n9+5l89r15KQwgUGS4EqrI2t46+mzaSJJEuI4QgrXVEKi0zRogrRtbCGYaQe8/eFBfv/mm5y/ehWnWKQyMgy2TRjFCASe7ZAEAc1anbH+Cnsfe4y//sVrPLBuLQEG/XEsC6tQIPB9Wu02uUIB17Kw8jlOX7zM797Zz9+9/jradrjvgQeotdosNJvUWzcYHBqkv1hiYn6e2PdZPzLMP/3tb/nVc88yVMgTKyMP5zo2UshU069rmtDL21/U8Z0R7XSqJE3nmElfYwK+NeOruX/rFt54622Cdouc6xp30NQKvZMIUQrSQEkLFp3z9sW5+0p2P2zbFASGYYiQAttxEJZMK+2NXq6QVr9SyQNaqeW3HfLP3wRS6hTq0XgeOdg4/MWRf3ns7f3Pfvjdd4yuXMXI6DKUkNQbTaIoppAWN6lEGfqNTmgHPrZrG2tzNLWFeRK/zdoVK/nVSy/wt7/5DcvzeVoaRBJjqdTuIy1oVInhdWspEJYkBtpKMecHfH3qFJ9+8QUHP/mYU2fOECUJpXIfQ6OjrCj3GR30KE7VOGIiP+hc3q15/ex+GY6rBZhaEKm6CGOWwdKLRlRKBROpkZaGKE4AoziRFVkJQFg2fQODVAYGO1kxS0ouXZ/g6yNH6C+VeGDbNh5+6CGeffppHtq+nbJjk+/o3idIDY5lCj4tZcZeEESEWlHOeTy2434G+gcQlsXr777D7MIsiYpZtnwFkUiIQpUitBql4s78JW3bZAbDCBVHjC5fjqUS8eXJ75ym39rx4upVT3uoq0h7Hlm2oKKRffe2Rvc8Mz/ewgRyYLu0/cbQ5UsX71O2FCPj4ySZfJxtg+46PpP2ae/vGWc8Qyvv1gtDp6lJmdaW+IGhHg3397Nh7RqWL19mNgZagUpIZYO6SludVNnipjDjQyOwXJs2cO7KFT767DPOXbzE+MaNOK5rCpLjGNt2cFyzDurEbBJ1olBLVu+lp86uL530TSAMtuWYtbPRxPdDLNtkBi3LotVOiKMIz5K4roUOYhYaNaRWbBhfw2svvsgr+56jaDvYWhPGEVYaWEqr656VFdGqNDWoSYujRabsERMnJnNrO6Z/2krz6bfH+A9vvsOnX39DoGHl2vV4pSLtIKbVauJ5Lo4ladaqiDBg/Zo1/JNf/oIXn36avDTzQhQnRp1H9mwXhNkOzgU+H3/zNf+vf/2vuTo9w4b7thFpTdMPqDabDA0MUMrlmJqYYO7GDYYrffzihRf4T377GzatWm1qoAKjPS+FRCdmQ4zSPZmzLrAIusMl19qY8Fk9Y8MUtZrNvEIwUCiwcXycrZs3cuXmBI26UXPzcvlUNclseoI0IHcd1+T0OxSpO684vc0SRjZRoYmShESA6xpju1Y7om9gEM+2mbh5c7BvamHl41uxiYj5SWK799j+0gNyi78feo9FpG0a0bmVRRZ2bZPPTEyNFeoLY612W+qcS952SGJhdms/YRu11KS4VBEoWqOl2W1KQEchlXKJVSuWU8mlhhNKpZa2mELGzrGX9k7LUoeWbSOEoKU1R0+e5Msj3xImimK5D8t2U7dKOnJqGmFSbhm6n6bQSRbXqZszLz5fZ5EWgiiODcrleUjLIopjglYLS0rKfSWEhrDts1BdQIc+y4YG2PPE47zywgtsXbeWvvS8xn1T3OEqjd1vrBStoIUAPNfDtkyhne/7CCHJF4vYUnJ5epYDn3/B+x99xMXr17ELBbAsmn6IsBLyrkvedanOzRE2mlTyeZ598kn+9le/YGMqNyVVYlwQtVkMhWXhuS6uZdEIIo5duMQf3n6XDz/5jEKlgpIWcwtVsB3K5TJCaIJmk1a9jogitq5fx76nn+LJBx9kvFQ0Jgloo0zSyxNN9ccXh023T1eapcHs7jQpqLgea1atYsPaNcxWa8RRZJz6pIVlqY50lMRkOrquc7cfs/dL9Cr5QNd8pqNug9HrFUIiLBvLcc3i0W6tHA6ioa1ApRljx3GnCHmp5vR5+PWA72PF3B3ftUQbGdH8Z/8Z7NypRbWW7Bpb6Wz54KNtF7/8ctvNWk2WBwexc3naUUQUJ1iWhW07qCR9/pWmFTYRlsTxHGzLSEY2alVsodmyZTN7H3uMvY88wjIT7BMDUloYbWVFHERGQ9x1sFOEKwSuz83x7YkT7P/kU748fpxWGDBfq+GVyxRcl3yhAK6Ln8SoJDaW8pkyQXonuuF4Bzno3Kgl9s3p63cwCMqOpE1QDiYQSA+8+H1ZQZvoymMmyiCitueSRBHnrl1naqHK6e+/5+EHH+DB+7bx2H1bWT04AI5tHITDCEkq5yoElpDYSiOUpuI43Ld2Da8+9yyJSvj0q8NcuXmT2alJ8sUSuZxHEEbEqa4xwtCukLJjjCSkQcwSFMLN0QrDtdVr1/7Jtq++OR31jRw98X/+n9t+rR3hWGa+zXlQLhq1JLVELxXy5vX/y38Lv/s7oERXMOhOraalRu24epXxc/Zoe74q62gs1zj5ou4dGbyb1l1rzO+WJVGpGlC5UGDj+nWsXT1Of1q8KRKVSslhol6lu7Kytx3bjCPLsrAsGxv4/to1vj12jGqzhe3lwLKNY6cy7sjIriKJ6DnQ4rlNL5pPsveKFBwzhlTCUD0aLTw3R2G0RBTHNOoNEpVgOzblYgEJNKoL+NUFWrUqux/Ywd/++lc8tXs3wylfWiUJYDJYnfW151HKzknqkG0ogxKlYhM0y8ybQFD3A749e463DnzAV8eOo1Kwqxb4uEJTKBapVCpU5+aoz89hK8UjDz7IX7/yCk89vIt+x6bVbiMdh5xjo6RZ5/wwIucak6XJRoO3Dx7kd2+/Qz00nhMz1SpuPk+ukCevcwTtNtV6jWZtgZVjozz+0EM8v/dptq1bi4MJ5mzbRWhhFIrCiJznYntmHCRxjAoVtmOn9NMuSp7dLdETGaRLlOGDS0EBGBkeYvWKFfT3lbk2OYXfamI7bupxYDJXVlY308ka3Bpt/HAAZhJKhsojMwdV3dVPdzyPKEm4MTvHxjNnBvIrV6/4evnojcmCE+X+PoLyn7H97AF5c89LP/cpTItiLRrteG7XI8wMD1mP3pzcngv8+5QwMsBaASn14e58ALutt1p4KcS829JdoDL8SZQi73msXrGC9WvWUMrnO8fIVCu6skt3blkwZAtBW2uuTU7x8Rdf8u3R4+SKJcrFEkrrFA03O3uyB6KHXpOltRPugbIizIOQqOxBtmi2WiSJopDPUyoUCNs+1XoNv1FnfNkydu/ayS9efInd92+nmJ5Hpahip4I9W+2zhaLTsrS6jW05oDVxHJNoTSnnoYTk+kKddz/+lN+99RanLl4gFIL+SoVQa/woRCiDpEitUUHAaKWPXdu388t9z/D01s2ptXBs+HvpJkZpQ4URlkUAfHvuPH/cf4A39u/n+vQ06zdtph1GLNTrVPr7KeZzJHHIzMQsOgzYtHYNrz2/j9eee46Ny5eZ8rBUKlBmKFWaFYh6JM+6W7F7bwJTtrZyeJhHHtzJ5OwcN+cXQAhypTKWtAjjGBUlprBTCuMYeU/nMDcrUcZ1zbIsU8eQpEVJrovtuuTLZdpKcfn6BIMXLo/uGl5VmrVkK7Cksn7AnMVJAC2RW++D82dhaPjHKTWzs5r774e/+RvYuhWhtdhx+OtXxz448LevHz3S11AJy1evxk8UrSAgSRSlQhHXcvHbfvqwpSi5JXFthzgyRYZx22fTpg288txzPPf449y/dk1KAQI7I7PqLBHe3aC0leLm/ALXJic5fPQoHx8+zMeff8bMzAzlFSvoHxpicGwMmVKdwiiiHYYkKkWiUqWUTGXIIN6Lt669Ac291bfc/rTfFvCnP2eP5SJPBqUp9fUzPDJK0PaZn59lYnqay9euceb8BY7fd5bJZ/bw+EM7WdbfT5/nGV+BdBGVlska2loaHWzbomJJntixnVzOpa+Q460D73Px+gRCKSrDo+A6iEgQRbH5QumGxdAtNNKyCJMElGJgdBmxRJz87rv1jwnnl0/s2XP94iuPfOnnc/PZNcg4wmo174gKk/fMvP3kw6jv56GcB/tHAvJ2iCzn2eFHG1eeOLn14MKcXY0ThOd0qEI/pd0K/tx6r7PfNd35RamEoNlgw/r1PPTgTlaPjWJjMqukWQ4QqUpVkgID4raFJ1GKSBk3Z4kh/hw+dowPP/6YRED/yHBH9cLIq6bFlcKMsZ92xZ0LJ4pi/CCkWCxRKJWYX5gn8H20VlTKRRzLMnKy83PkLMGWDev41Usv8puXX2HY8xCkLtla40hpspLZLlb0ju10IyAMUJHJM5pMl8RzjCZ3S8PnJ07xh3fe5eDnXzBZXWBwbAzStUZhMkBaK1q1Ko5SbFm/lt+8/CJ/9eorDEmJjmNUFBk6m20jbRudKPxU6/va/DyfH/+Of/fHN/n8229ZsWYN5VyeWqOJlfMMwKI1kzcnaVcXGB2s8MKep/n1iy/y8Jat9AGBTgwFTVrGpTMximo6nU+y18CY8C31CPzQvcvmiz7XY/PataxdtYqbU9O0G03cXJ6cl0OntFbHccFKayNuS8PfTVMpkGgyxGSKNNq4mTueh99ocPXmJOvOnlnVv2H9tqmRvupNnOpfOufjZ//68//2//hzn8K0rFptZAgRx67VaN4nomhLrLTR7hDCIBbpYnwvMHkvb+9Ojp4dKkh69CjV/+wrlVizaiVrVq8in8sZcC5JjNZmR96qhyKQ8dV7g/30/xZQbzY5f/ESp86e5cbUNKs3biKfLxIqRRQnaQY/LRjqQTVlZ3m/td7pTv2QXnOaRrRtx0ghxcZoxk13+8RJp6gm7zhs3bSZF555lge2bMGjh34SRbjSMmn+3vvVc31gVCAK+YJJuWlNEPgkWpMvFJFSstBocPjbbzjw8cec+P4skWWR76sQa2OaU/I80Aq/VsVvtijmPB5+4AFeee457lu/oXNlVqp7GoYRWkhs18ORkkYcc3l6loNffc3BL75grtEgX+6jHUVoKSmVShTzeVQYUp2fw6/XWDU6wmMP7WTv7t1sGV+NQ2pcIwUqjom1xkpRiURr5qsLxEqZ4hzHxRKiU6h769x1JyTbFOGZ3/pyBTatW8fo8DCXrl1H2BZeodihIyQph1XQLRpe6r7feu7ep8QEQoauLTSpkofqbJ4KhSJtv8WFq1d56NR3y/Krlo9/t2nDhYmC6+d/YBMgJOjRPsL/zX8O/+v/VUdW7wdbkoDrQuq8p0G0GvVfzcxM/WJqdg5RKtDvuqi2j5AS13LQymj+yrQGQwiBnS8gbYN2+60WKooZ6Otjx5atPPrgg6wZHTGczKz4FlChWRhwLBzPRUhBBFyemuKzb49w5MR3fPbVV1y5cQO3r48Nq1ZheZ4pdBLCGDUlRqfZsm0cmcl+aqP1nj0Suje8Wepe9ahE3B5XdY7RbWkQctfTXnc0SCnwg4AgCHAch4HBYfoqFZqNBs12my+PHmHixgRHjx/n8YcfYs+uXawdHsKxDRc+jg2NQQqJSOK0qM6lLC22rFxF8Oij3JiYYOrmJFG7TRQEuPkC0rKRMjTZg7Q/tDbZG4QJHqXWFMslGgsLnDx/gc0Dg78pNx+IhFZngU5Abh87Q/G/+VfI+Sq6VLz9aoMQpKD5m1fxP/m/Q9s34+yHmuNAEEh97coG/9AHmxfmF+wgjMgVS2aW1XfKef5Iz4vb14M7vc+4GytUFBEFAUMD/WzauIFKqQTQKWA0PgoiVd+5FfvvzsOJVoRxTM62CYHpWo3jp89w4sxZ8gMDi1Wl0g2q0Iu3jtlsswhqMnvOJeeYjLaitcBxPCzbRSlNo14naPt4jkOh4FHO52k1atTnZ1FBwNpNG3luzx4e372bSmbMlSTEYYCdGk519qLZMyLSdVsDWhiOfPqljH66xnE9LCFphxFnr13n/Y8+4v2PPqLqBxT6zFrgFAsM9ldwbJtGdYGZ6Sliv82OTRt56bnneOT+HfRlgIsU5DzXFNYrg75blsSWgoUw4uiZc3xw6GPOX75MBPhK4+Ty9Lseec9DJzH1RoN2o0ZfPsf9mzbz7OOP8/jOnZRsmwRwhYVOEuJEkSCwXRc3Z/w9WmFEvV7Htm2KaX1DRnzMwEkD4vXelcU/Z694ts3a1atZu2o1R4+foBUExEGIVygRJglhEOA5DkIa8Qhxl4penansljlLpIkcnSiTtZXgeR7Nep3p2Rmatfmx4STaINFHMEbPf9HtZw/Ix8f+fotgQ6BvMizJhebGZtAugzATu5DoJDYct3sqajPtVie1W4twst+NHBnUa1UsrRhfsYKtGzeweiRd3Bfxzpf+HroHxVE6W3hN0DY5X+XYyVNMTE6jpI2wbZQwDmwq6Vr+ZuGUECAznWK92KflTr2wCJXTYDkW0pa0/bZJg+VzFHM5pIbZyZs0azXK+Ty77r+fl597hkd23M9YqZgWpWlIwBamyOeOaVKtO+lLKYzyTRTHKCGN8YOUzDabHPrmW/74/vt8ffwYjTCkPDyMW8jTjkI84WBLQbveorlQpWhZPLzjAX750ks8tuN+lvVXUs6j2Z4kYBQupLE4D4Fzk9O88+Eh/vjufs5cuEhlaIhy/wD1RoNcLkdfqUgU+MzPTNOq11g5MsLze57ml/v28fCWzZSAlh+SaCh4LnGckKiEvG2DgPlWi8+++ZZGq8F9W7cyvmIVA8ViWt65tCQi9GKct/+9mFocr16+nC+++prID0niBIHh9JkMoEbJOyDVaeSd0tqXHAtZEN9B5LQwk3+iwTZUolqzzuVr19g+cW35QLO+PtLqOuC35Y88b5Y0wXUaYN9LWx4E/du/P7e3dfiL7ZcuXADXwfI8/NgUINu2g2XZ6CghSSJsaZtMkoBSqYRKYmrVBZrVeZYNDrB75072PfkED2zYwKBr+PvmHqbXLoXhoNpmAZtp+5y9fJWDn3/Oh599wsWrV5haWMD2PMp9FQrlMlESE8YxcRx3jyUltlERTwO3tL+78csSAfnS27W7Exj7KTmY7lF1+oOOExzHwfHy9DkuDbvK/OwcR8+cZeLmTSZuTlKv1Xjwvq08uH49A8Ui0rGMLrsARxqlIJXKQo4Wizxy/w5qtTphEHD42HGmJq4zuGwsVQuy0JEmTpJuL4ieQlUpsT0Py3Op16qcPn/eGv/qm/t3lQfXnt629dI1L9X/bzSxv7+ENT2HqpRv751W26g4/TqBSt78u5uWJJY3fW2HaNZ3Vht1JwBKtk2MCTB/eq//cBNCdMZIEseLsrGbN6ynUiwSa+MSLVI6AWCoKr0P+i3YlBSpKZYQTLdbnDx3jpPnzzE1v8Dq4SGcXM7wyzPqUPq5DmrfWR/vGfZCp1lKaVk0mk1838dxLPorfRTyOfx6ndnJm0StFhvGV/HcU0/yyrN7uX/9BtzOURR2mhEQ2XqjU0rGrbSa7BMpNUoLo39vCUEjCjny/fd8+NnnHPj0E65OTdE3MkK+UqHebJK3HfL5HEG7xcLsNI2FebZv3Mhrz+3jpb172DS+mkTFtKMYWxhZQY2ZN8GUEjWiiC+PHucP77zDR18cph5GDI0tJ0oSo/hVKNBuNpmfmcGv1xkolnhi105e3rePp3buYsC2SbRBoi3LMdS3JEY6Lq5tkWjNhSvXOHfpMs1Gg62bN7J944ZUqe3ehIiy9+Zsi/Xj42zZsIHhgQGuTE4RBAGlvn5ipYjjGM9xUzlPFs1tS3T+Hc4lOs94ti6ByQKpRODk8iAsms0Wcbs97upkh9C8C9y8h0v6B9l+9oD8oSN3aUP8Z2rKdbGbwVB8c64y06pjObaxPkd0zSz+xFlyKe54FpTbto1EU69WqRTzbN64kY2rxynTtS20s8lxqfRphhxr3a3UtyQJ4APnr17jyHcnaEURw8uWGYpFYAT/QXSR9XQ2NOYk5vdbUfy7bRqdUmKM6km5WMQRgna9zsLMNOV8jl3b7uO15/ex97FHGS2XDDIexyZ1mMka3hbtpTlDrc2CbYjOaOgEMblcDikltTjmk2++5T+88SZfHzvOQrtN/8gITrFoapW0QoUBYaJoVqsUHIftGzbw8jPP8MyjjzDgOeg4JggDpPSwUmk523HR0jJ9e2OSA59+wRvvvseJVLmmMjxMvlCg1mggtEKohPr8LEGjxnBfmX1PP8nfvPoKD23dQsm2CZKEKAoN6q2NtmyMIJaCehDy3ffnePP9A8wtzFNt++TzRYaLRbOA/+h9SLvtltcd22bV8uWsWbmKSkodicIQy3GxbRuhNCqO0XFiinhuHXLp/+UiSHzxicyYSRc0KZBaIhKFUgmJUniui9IwX6vR9tvLh9DrBXzNz4xabL509fGn3v/gPz34xeFt31erDK1cgbJtWm0fy3awbMsUmXW4JuY7Z5cXhwFBs0bBttm+YSOvPLOXJ3bcz5DrmHEYJ6C1Ma6SAsvzDJIax8w12nz93Xd8fPgLPvriC85cukikNX1DgwyNjCCERRBGRHHctbcn46GbjF2SZu1MgPVj+RF9y8/3QhC4u/fe6V0GRDAFW0YT2KFYyNM3MIiwbOanp1loNDhy8gTNZoNTZ85Sff559jz6KEVb4lpplk9aRhEkDFFK4bkOA67LMw8/jG3bNNoBHx7+inatjlYKN59DCoUQWf2u2UwbZRIQUhInmlyuyMCg5vTMLP4XXw68UBx4tVipzF9bv/oogHYdVH/FjNm+0m3XJ/I5A2ZEqanJXfRTOoYcnSSb4ihaF4ShThwHadkIlRWz/flbRpMyYAuE7TZSKVaMjbF+zRqWDQ3ikRaJ3vo9RKqM1KFKpgF0+mfLkoZuBNycm+fwN98yMTljKHC22wmQsnW0k31OO0WrtLolqzXJNk5Zp2Vfo+d6FrkEpwh2FEYkUURfqUDeddFRyOzUJFGrxdoVK9j39B5efuYZto+voQT4KKRW2Aik43bXFuiqW6XXr7TuUMIQRg42ihMcz3yuDRw9f54/HnifQ598zsXrE/QNDVGuVLAch1zOQ2hNu95gfmYaHYZsXL2al559hlefe47NK1bgSUm9UTMF4I6LdmwQpqBeAQtxwvFzF3j7g4Mc/OQzJhfmGV21isHRUabnZtFKIZSiVavh12oUHJtHdz7IX736Kk/tfoiVpRKB1iRhaKiZKeCmpQTbgEuTtSYffHGYzz77DCEFbiHH/Rs3LLoV3Vige3N6IbtF9wlTcDnieqxdtYrVK1cyNT9P2G5D6nqayUrrtG/vMdAwZ5UShFFrMjx0kdItM8plOoZtG630qI7iLbbWZTAiDX/J7WcPyEen/iSzj3tu0s05SbM2WL951Z2pNxG2oVuITpWa0e6915bt/DMjh1uDcaBjyiKUwm82GcznWLd6FaMjw2mFteEtWz1Wr73LqlkERKoqLA13O1FG5ksp5uoNzl28wOlz54gSxcDQEDGmKjz7bh11mCTlqaeShSbuXew+ejeLtBCCMIyIVYzrOBTzefKOQ31+nurMNCKO2Lx2K/uefopHH9jB8kql89lcGgz1qLD1Hrinc0UnKFFK0fZ9lBB4+TyulCw0m3x55gzvHvqIr48dp+b7lAYGKPVXqLfbKKEpF4u0Gg3qc3PE7Rab79/Bay++yO4d9zOUSwt9RI/aDBItLFxpEQLzrYBPvznCG++9x+lLl3BKRZaPjxPEEcHCPEOD/SRBwOz0JNXZGZYNDfDk7t28tu85Htmxg5wUBGFI2/fJeV7HQMd2bGS6oboyOcXn337LZ19/xUKtRv/IMA9s2warVrE4YdhFPn8M89QYZ7WhQoFVK1YwNjrKtdkZgtAnZ9k4npHE8+OYRCVptf1i/PWW9bDzWm98LoVMF2PdMSFRUhoqSJzguTZaSlSi0HEyaik1zt25svyklk+0eGghZO3Zq5u/v3TpqfkgKLvFIo6XIxIaIm1MJRJNGAXkHBcnleQyRVySVrNOu1HHUpp1q1fx6AM7eGjLZlaWSiRaU6/XEUC5WMZybNMXmZxhrcEnXxzmrQMHOHH2DNPVKoVKP7lSkXyphLRtfD8gCiOkkHi2i2VbZoOAsTg3EpKpVpewUmOsrOlFS+StU5ZxT7z1nbe86bZprmc0/egc2HN2rVMtbYswhND38f02fuBTLOQoFIsU83mSwCcKfM5fvsKli5eo1xuoJOaxnQ+yolw26h1aE6kk3eQnxInAtWxGymUe3bGDs+cvcPXGJNPVKu16HSkEbs5DOtIUiqbZFp0YMEOhCOMA17Ep9VeYnZ5iemZqeTg//b9YHrTmNsPRy5jM6Q9eresAAu937+BMziD/2W8Qo7dnbASmBicA2oADVhwGg34Uoi1LCGmCXYlEsTgjebftVopKb0a3k5lNn0GBpt1uUbRs1qxcyfjy5RQxc24iJU7qPXHbsdLAVCVJKtOZIedmXoiB69MzHPnuBNVmk8HRUSzbIU5dGdGY/E4vbTM1pcq+X3as3r5b6udsLhIWBFGI8n1yOZf+/jKlQp6o3WRheprG3BzjK8YMMv7MM+zYvAVXmrnVybT45e393ckYp2tgEicphcpQ8KS0cDyJa0laKuHq/DyfHT3CocOHOXXpAk6+xMrxcRZqdcJWi+GREZr1OpNXrjI3PcV9Gzfw21df4dVnnmHT+OqOtn85b2iDiUpoBQG242JbNhZw5sIF3nx3P599+ZVRUBkZxXE9wiCkXCwRRSFTN25Sm5mmz3O5f9MmXti7lycf3c1gPk+oFIHvk3MdY8QXhkjbNlKKwI16g8PHjvH+Jx/z2Rdf0F8us/vRRwnSvs/MmrrB+A8XhGdvNtpOMNxXYdXy5Zz8/hz1hSpRGCGExLZsUz+BWuSKmh2pN94RdH9ZjKKn2fKObn+mRCRQOqXlWhZe2g9ho7l8WZIUE37GBefvqf3sAfngzIWf+xSLmp3L9zWarZWXJ67kpxaqyFQyCaWxhOQeSJR3bEtKInY0yjE600lCuVBgw5q1jA4Nm4GYFpt02i0IuYZusU06erXWpkBQKSZu3OTM9+e5cvU6xYFBCsUy9XYTlURk2uciq35P/9mWnU5IP/G6U2RdJQleySic1OYXmJ+axBXw4LatvPb88zz/xJNsHBvDwxSYCAS26EFjb0tNZKhJivSk60GizG7fdRxzrjjm0xMn+eN773Poi8PcXFgwGrjlEmQ6qXFCEob4tRo5KVi7eTOvPfccL+/Zw5rhITNhxcbG2XEcozQhJKQubpemZvjq+Ane2n+Ab0+cIBaCobEx8qUSc3PzxIFPXyFPvVGluTDH6EAfzz/5BL96+WUe3b6dohQESUyUOtM5tm0qzYXGlpJ6EHDiynU++PxzDn7+GZenpmi3Wxw9dYpz166x6/4dWICzJEJ6B6OonmZjFuDxsTE2btjAbKPBbL2B5xVM6laYgiV9y3i7u5YiaFIafd4k1bRNVRjiJCGOY7TyDDJo7JxX2lG4fUSKykwT1Lk0k/hD1JUowRnIUx7vx7LED5ZdV4GBOC7uunlzS3LqxM4Pz54u+yqhr3/AOG4KiW2LNIWbPnMpSqa1wnU9BILZ6SmsOGbdyhW8uGcvL+/Zw/qhIQRmQ5tR0IRluLqhVsz5bc5dm+DwkWMc/OQTDn97hEbgk++rMDAygpNzCeOYerOF0EaXN8tUCS0gAU2qspQGNUKKDrf9T3UI/jmaEII4johjwwn1cp5R2AGiyDi45j0Xx7URlkWr1aZaq/Hx4S9IVEK11eLpRx9lpNKHm4IGmYRhpjUshGB5Xx8v7dlL3Q9594MPuDQxgW9J3JyD49hECen8LVPHSUCZIj7Lkji2S6FcIYhCcezUd33jG9Zu27ly5epqX2liUkoTt1lWIhzvdqmt9LlwJ2bQBz4htCOSVSOIpr/obXEQUBwYYMOOB3HGx4kXFgbV9ExhptnEcl2k4/zUmfau7sOtv1saGlWj4LNx3XrWpj4EKv277Thp0bDRsV90HL14ToiTBJGaE80nmu8vXebYqVPUo4gV42sIwpAwMprj0M0S3wsFtBc01bf832xUTbZ3cGCAcqFA2GoyOzlJUK8xPjbGS3v38uuXX+bhzZspS4mfJMSA1xFeWGKtE73LkPmbqYERWJZI52qBD5y6dp1DX37J2x8e5PSFC4RApdKH5blGxz2I0WFIc26OuNFkzegyXtrzNH/9ysvcv3o1OQRNZZSBHMtOr88gu8KyWYhiLk9M8ub7H/Lehx8yMTPbycRGqZpYsVSgPt9gfnKSsuewe8f9vPjMMzy3+2FWFQomWx4EqNgU1VuWRWwleK5DmCRcXqjy6ZGjfHjoI744dpyrN29S830uXJ/g6lyV0UqZkiXv2SFGq5RSKWGo0seGtWvp++Zbrt68SRgEOLk8ruNCmlGXqSnRvTal01VPmHPSqcFSxIkBIKW0KPdVqAU+09ev58dmquXR4gBu9WdNyMKy/p/18D97QG7cAv/+mq2SMpE/trAwl6s1GuQHhzsOabKza7+3QXIrb3yphTN7PUldwQr5HGPDw4yNjFJKzRkcy+4G5L1FjZ0TZQfr/k9aFhYQKcXE5E1uTE4SKYUSAqMUmxWmdI0ZejcKZgbMUPxsx7oYfeu5iqUuHseysW0LR9oErRaz05Mo32fThg28+OxzvLhnD+tXrMDFVPVLlXRlttJjmHm/yyHXGU2FtFDQEoRxQqwUXj6HKwQLccw3J07y5oEP+OiLL5ieX6DYP0Cx0oeWkma7ZbIfStFcmEdEIRvXrOXlfft4cc/TjI+YYLwVxug4MlrgaRGMwKB1c80WXx37jtffeYejJ06A7TAyOkKuVKLWaIAA25bUqvM0qwv0FfI8svNBXtn3HE/t3k1RSoIkwffbqWFFAZUo4kSlhVRwbaHO/o8+Yv9Hh7g6cZ3CwABOscjk3BxnL17k6vQ0KwYGyKVGCotTzFlQfiumdPvdGqj0sXZ8nKOnTtNuT1Mx5MmUny9TpTOZGq3o21bGH1pWO6hX5/1psJoqDMRJgnRsCqUSkVaIZmvN9kRU2qfnufC7E+Yz7g8UbNYCvF3LGVtexrPsH5SUHQQGVbysUJ148fKNC7uvTE7SPzLKQKlIs91Guo4ptmo0EQgKuRxJHBMkIbYtcVwbFSf47RbLKhUe3LaNZ594nAfWjqOBJDL0nr5CsaMrLoBZP+C7c+fY//EnfHr4K65M3CCQksGxMcr9A9iuSyvwqdbqhEFIpdSH53nEUUwcxYSh31HeyKzTbdtZlLHKUv6LbkzvT+LWv3QTyz/yJC9uS73hjsWDkiAMiOOYfD5Pua9s1BziGN/3aTZbtJpNPNvGcRyGx8YYHR1l8vo1Pv36S9qhTxAGPPXoo6wcHqaUmklJMlssc82RhgfWr6W65xkuXbzM9Nws7TAgiSKEbTIIOv2elpTopJuxiaOYdqIYHB4majX58sxZ3L5P1m5evuqp4tOPH8J1J4AcSRLoKLwjYK6XLyOamaD+X/wXJLU5gxT0NqWw165l3X/1f2JtvuxWL19aWbtytXijUcf1PITjGoqU5hYuxp+/ZXVB7VYbCgVWLB9jcGgoM1JON84pUJRJFArRkSjUKTKerWcqMeoqSmsmpya5ePkyMwsLyEIRx/VohyEqVqloQFqkm56r4xzbs8beus6KWwax6HSRoWcqoRGWxBbm+Y3DgJnpaeoLVZYN9LPnySf45UsvsWv7dsqWRahMMastBNh2d8PfOY9eNM4zR1PLkiSY4lZpGR1wX2sm5ub55OtveGv/fo6fPgOux9jIKJ6XZ2Z2FtdxkI7DzI0bNOfnWTkywjNPPcGvX3iBrWvW4AGh1tiY7IXO5llLYls5Ygzl9N0DH/L+wUNcn5yiUKlQHhrCsm2COCaOIoJWi7DZIGdJtm5Yz769T/Pc00+xamSECJOR1Mq4lArM3Ox6Bhueb7f58sgR3j5wgG+Pf0c9DCmOjGK7LhMzM5w+d47i9q30FYsokzLo3JIlR2vPiyKbm6SkWCyyauVK+isVlDKGcXYuj+04RKnCXK/GeXbcu3kSuhr92ZY9zX4ICy0UcZSAEBRLJRb8NhOXLlkrz10dKEWeEzXr0V2c4qe3v/SA/PzQxp/7FADpA22xOqn3ebOTK5r1Wr4VBFRc16Su47jLG7vHkLy3YEX2TGC9NJYMhQjCEBFHDPYPsHZ8nNGhQTpejVIuRshvLTLJAlcpOgG7kxoG1Votzp2/wM3JKYrlvm5xDen7TWib7vzT7yXSq025WJ3NxB0fjZ4dQScmMIU2tmMThSGteh2pFGvXrmXvk0/yzGOPs3XVKmOv7LeJk5h8Prd4d5zNk6KL9WYuhAKDUggEYRIRK0XBdWiphJMXLvDuwUMc/PRzJmZmcYpFigMDqeOqQeyKnoeOI4JWk9UjIzz18EM8+9ijbFu1CgtottrESUIh5yFtu6NmooBqq82xk6f58ONP+Orboyy0WlTGxiiUKzSDNvPzcwwPDeLaHtPXrlJyLB5+4H5e2vcsu3fcT0FKojgiCHxcy8J1XLQ26AWWBcLl0swsH376KZ98eZhTF86TCMGyFcsJfJ/Zmze5cOUqV65eZaRUMouKpjNJLlZEET0/dRce3dO//X19rF61Gi/nEQYBEkMpSZRaJLF4h6m385esfxYNh97v1DOejBufJkpRi0KpSN33mb9+XVZu3sgNzEmopxPsUgQ/IQzPdbJFONtmUukOwndry+Q6t8wv5O4/c3Zrcu7cSwu16g5t2yRSdiTe0KlZT5TgOg6e69EIA6I4xMuVieOIsN0m77lsWreO3Q8+yPplI+baE23Mp1SCxNBUEoz825nrV/ng8Oe8+8lHnL90BdvLMTAyQrmvj1hpatUabb+N53pU+vqJw8ikqqWF5dhIx+5IkWZ9qTLOZWrkZDj+2f1ZnD3rbYuyJvqWeYRbcMIlgnhuee9SP3cOrxWu6+B6Zny3222yOUIoQw3SymxCpUjAtnFyLuXBQaqz03z85Ze0Ap8ojtj31NNsGR3tkDmStC4DBJY0UnvjgxUe2LqNq5M3+f7qRVrNJrZK0ufXZBpsjDqG0oA0mZooiSn3lUFo5ppN6rNTj/XPz0a7681ZN5YT84VSUD95NIpPXUdkPONb+8KyUX4L1W6YF5bQEm9ZNl+sWomulErr5mfGbkxcz89Wa0Z1x/aMm2oqQSuXOMef2rKCygQQKkEKKBUKjA6PUCmbgtXbyG7SqAlljpBKG0KcoWAaeqNl2x3w5+Kly1y6fIUEI4oQpbKTiMxmKp2FzA6JjDeuzePXMd3prkw6w4ZIv2D60dQzI/3dchxsIWm3W/j1OtWFeQYGKux++CFeeHYfD22/nz7LIooigjDEc40ZT7f1RpCk91h31lOzXxCAoVNaQhAAk9VqWg9ymBPfn6MZRYwsX8HQ6DKT8ZmZZXhgEBLF3NQUQ8UST+3ayW9feJ7HdtyPi6GNqCQhn88RRxEN30e6Np7tYQGXbtzk4Kefsf/DDzh/6RJOoUipfwBpO1RrNWOsI6A6P4cjBZs3bWTPE0/w+M5drBoawgXCyAhTuJaFZXXrsiQw22jwRSq5+s1333FjdpbSwAAVL0fYanFtcpKTZ8+wfd0aKBbT3lq8ne8dNbfgg2a+T18t5gusXL6CocEhg4pna4K0OxufpTN+t2cvbn3ZOHuajaOU0vgnJAlaZgyA2JgvFvI0ZurM3LhhbZ6cGKlvWDtweO2yKSUl9o8pJP0DbT97QH6jsvrnPgUASkgibAZa1waKKl4RtJq5MI7JFfJoJH7Lp7MN/Ilz5FLWxh1lldQm2Pd9CANWjwyzce1aBsplI8eklDEpyHalS0zUurNh6OGAW7aZMGbnOHLiJNdvTjI0OgauayyL09jamEsnxpExzQYYcweLJDZSY5ZjCrPuFbCxpMQRgoX5BQgDNqxey749T/Has8/wwFpjSpAoRZxEqSOcuh1ZEtmUbDYdmYFRtj0yBhPCuCoCx85+zxvvv8+Bjz/i6s1J8ikyLl3HFNoJiS0k9fkFHK1YM7acfY8/zmvPPMuO1auxMRJYKkmwRerOJgQxJi6crNX56ruT7D/4EZ99/TULrRa5ktG+VZAWyWpC30eiyEnB7gd38De//CVPPPwQy/r6CaOAKAywBORcs8CHUYiwJIHSTE/P8cb+A/zh3Xe4NjNFLCReqWBkGtG0ooiJySmuT05x38aNDOXztw3NH8XY0qBcCCiXSqwcW0be8VBRguc4aK0IwxBbWmBJYmXUBIS4y2GQLmhGR96MqUSlaJplIVJVoSQxQX++UKDabDJ5/Zocm7qZy+mKw5DQaOIlZxuVmM3LqpWED6xg1v6xcjron5tfvuLU6QeOHflmw+XpGQaGhxGuazbD0ih6GLt2G8eyU5MQ4zbq2BZzMzOErTYbVq9mz+OP8cgDOxgaGAANiR8itDLBszDUmZaO+fr0Kd48+CGHjx7l4o0bRJZFsdKHVy6jpIXvt2j5PnGUUMjb5LwcjTAmimKEkxZ7C4G0rM6GRmnV8SToLX77oempZ+a5/Vb9aM/9xJYGa9KyCFPaglYGpXYsG8e2002FQWHDOAYBhb4ySismrl3lm+PfIaQgEQr27mV5ZYiSZZlQLlFGpi699f19FZ5+ZDez9QUWmjWm5ueIVEJ5YKDrkiwz+UoQ0sJGkChBlCgSoNDXR9X3vYnvz+7eOL7mgfjytcMHLp+tta6c1TTvyYLq1iYi29JXlw2zopgrbGg3R6tTk/nZhQUGli/Hch0zBcZpQGAb7uufAyW/VclEa4WlFH3lMivGljE2MkTRsdL5QBjAuEdPVYpupq3jFCwESWzuXcY/brR9zpw/x9Xr1ymV+yCfpx0ERgJXSNPnnTBO9Wz8RJrySDeZGqwfLY/tNqW12UDbDrM3b9CuVRkol3n6sUf59Ysv8OQD2+h3LEJt1GOkUqZmS1qkRiPp96CzvhqbeDo1nmYzkhhwDMM/vz4/z+dHjvDOhwf56thx2kpTHhqhWBkgSkwdl+u4NKpV7ChitK+PvY88wl+98jKPbdtqsqRRQhwlSDQqTkymXGscy6ENXJ+Z5p2PDvHmu+9y5sIFsG0GR0awPY8gjkmiyAAASYhfr7F900Z+8eILPPXQw2xaswY3NcUSWQ2PbTJsCdrUpwFfHDvG795+m6NnvzdKT4W8ET5wXWZuxly9Mcmp788z/WSDdSPDnVt210NTdDdURcti+bJljA4PUSzkjT9FYrj5JvOd5b/uFhe/tXXBTrQkjCLDFnBskthkHVzPZTaMYH7Wsmszwy1b9Z9d1v/340T5M7WfPSDPqb8HlRUBSkmkUpat4kEhqCRJYmsNrusSJ1m1Lneti7no8L08755JMXs9S9MppUzRWBTSVy4zOjRIPjVS8f2AgudhWb1ct8VN9qTcVJKgMMFjoDUzc/Ocu3CBmblZVm/aTIyk0WohhErtpTVadrFvy7I6zp4KEzALJVLkuou8dk7ZC7Vmf9fpJJ7EhFFIY36ekf4+dj1wP/ueeIKdW7eSw9CS4jDEc3NIAToV8Zcpn6zbMrUWs2GwLcukm1VCEMV4rkeSJFyfmeKDzz7l7fff58b0LOXBAYbHluPHMc1mC8d1KOYLEEdcP3+OsUqFJ557ll88v4/d99+PDcaKPEj73HZSe/c0RQtcmpjgvUMH+ejzL5icm2NwdBTh5fDDkDjwyXkuleIYE1ev0Ap97lu3hpf3Pc+LzzxHSVr4oU+rUaeQz5PLG/ujaqNOq91m2cgIoR9x/soV3vvwAz758jBrNm9i+erVhDrBD0MWqobW0A5Cmm2fZpCaTCDSRayriGN6bhEm2jM2u3u7nOPQXy7j2RJLaLycS5AooijAzhfR2pgsCcvIWC4qp8iApM65Fo9SnQZBlrRIEiOxKYXEsiUy3fQhwLIt2u02tXqd0SSUshDZDPoGaLaWKODwQ2PC8sIaWLvstj8v1VzHHgnDYPWxkye9yYUF1m7dShAnhHGM61rEUYxONMVCEaUUzUYD13PJeUUEmtrCPFYcs3n9Oh7ZuYPx5aPkLEnUNsoOtmtjuQ6hNsWA1Xab/Yc+4t+//gY4LpWhIZxcHoWg3mySRDG2bVMqltBKkcQJszOz2JaN67pmXohMJjWrP8nUCMDQ0qQ0sphJD4J+t+1nC8Sz4wtj+KHCAJEuhDKDODuF4tI40gJRooiiNo5tkS+X2XTfNuampjh64iRRFGEheWXfPkp9/SAshFCdQRzHUPA8dm7fxPXZG5y8cJaFepVWEuM4NjqOieIodZ81BbJaKWzbxrVdGo0GQegzsmyMhaDNV19/Yz21dt0G78zp9Y3P3zlGGCbQecB+Sst4V7EAR8Qq32w0rWarRX9KG1RJTJLW0Vg/6vZ596137VFKdYKzwUo/K5evoL+vD4/U1RnMupiozponhSlI1ilSnKH3SWJqhGzXfLbWbHHt5iQL9RrlSh+RkERhhC3ocvd1VrKqu1m6lKZoPD9IESbds6rQM6Gk1yK76DhaI9FYQhO0WjhCsm3zZl7au5dnn3iMim0TK6Ms4jpuKl/L4mAcOmNJa1M4LYTASX0glEoIoxjLdtApHe37y1f48NPP+OzLr5ipVhlbPU6uVCaIIqYmpykXCqwcG+Pkt0fIacVLzz7D3/z6Fzzz+GMU0/XcFgaxjeOIRrOJtG2KxRI2MDk9zaHPPuP1t9/h2MkTlAeG6BsewSkUqNYbaK3pr/Tht5q0my08Idm+aRP7nnqK9ctXULAsosDHtWzcNMuWgQUOgmaScGVqikNffMGhzz6njSBf7qPQ14eTy+O32zRbbZrtNtOzc0zOLtBanyUse2ePDDK74wDs/LOFYKBUpFIskXNzuJZFrFUn1uqaKd6LWVS2oepi9tKSoARJHKEwXHJI5Tlt4wocBpEkigtCqxKYRMJdn/IfWPvZA/KL6nbN1z93UwlYRUluuZOE05Mr9Mlgp2M7/a7nmQUDwJJdVOBPPeEtCLnSGqkUOc9jQSla9RrD/RXWrlxJLuVK2raVvk/fVV2dQqBSBPnqzZscOXWSVhzhFgr4QYCwHVP8lh5PdLavoqO/amqgzDVnsmWZ5bKTGvQEQYDGLGhCClRi0E/H8XBdF5Ri5uYEjbkZ1q1exSvPPce+PXvYuXkTmXhYQobG2ykDQXVoDl3DAd1J19tSgLCM45s2/EHLcZHAlbk5fvfWW7zx/gFuzM2Tq1TIlftohSFaCHJeDtexmJ+8SWthno0rV/GL557lVy++yENbthgeexwbyTTXBSmIMYi9KwXtMOTry1f5u3fe4/1PPmNydo5csUSuVDL8vHYLjSZWMUKAk8Rs27iJf/bbX/PSE0/Sn/L0EZKc6xmESScIYePk8ggkc3HCR19/zb/6d/+Rb06fximVsbwcwrLRYUIQhriex8jYcqamZ/jm2HEe3rULlaIWZoCk8Fa22v3ImNGYmWiwr4/N69Zx9sIFmrUqkZTYrp1Wp5tjL6L3L3GcJU/V+VC2mGMWQm1MNpI4xpaSnFdgYW4Oa+KGe9/U1Ip8n9OPo6cAza0KCFrDYAU8CYf+CG9PQJham2cPid+GYom+V34LG7fSAqJqdVdtcvIXfhAOJqnOumVZWIlGRQlSGyQazGYxM8tS6bPpSsG6tWt46pGHeXDLZsqOnT06CMdG2BZJ2k9nr13nvY8O8fEXX7FQb1GoOBRsD1saxQmdqLTwKAUIpURjaiGwupv23mKynzuA/jlbD/iIyXbpzh8yyrSRl9XESmFpG9txKFYG0MDRU2cMpUhpfvX0HtaNjqIchyRWECviGCxb4lnw4KZNPPXoY0zPzXL64gXqCwsUyn1Y+QKNWhNbaPK5fMpIMDxWKSWe5yGFZn6+SRQEOXXlym9WDQ9d3/6b35449+knSfP69T8Frs6cVJAwaAXBhqjd7gvDkEw/GQyN509tvZRI6HJrhRB4Xo52s4HfbLBmZITN69Yx2FfuhP8i+69cDCh1iIS6KwMoU3MqIQT1OObKzZucvnCRyZlZxjcOYCPT7NPthce65753gm/dcx6M5r5EoOIErdP6Ccc21JYkSdWfJMVCnub8HBOTkwyVSjz95BPs27uHZ3Y+yEi6XkWJMhQwK9UZ19191a0UCzAbJNnpA6NWJCwb27KZ8X2+Onma//DmW3zw8afMt5qUBoZwcgVipYmjhFK+QNBocmV6horn8cSuB/nNK6/w6I77O8E42mSRldIk2tBuCrkcWimuVmu8cehjfvfWW5w8ew7h5clXKiSWpN1sIlKZSa0SarOzDBTyPPfMM/zNa6+xfXwNeSCOQ3QcG88MYaPS+2AkdeHbCxf596+/zoeffko1jHALRTwvj5Q2YRCitaavr8x0rcrl69e4NjVJNYgY8pyO06hl3cWspLtjUmDWmy3r17Fp7TgnL1wgsmwGR0YJMQ7EcTbG7gop77lr2bOjtMn4awP0aKFJkshQe6zUkVSBI5Rr+f4mKwxXAUd//EL+4bafPSC/pG7XfP2ztxC8fli1GuJADAXN9nLXdnA8jyCKUEIiUjnCzi79XqbkWxGrNFBeVMgpBF6xiBSCsO3TXyqzbHjYUAWAnOOSJEazuaND3nvIW3+RsjMwr9+4wcnvv8crFxkcHabWrOPlCjiuk349E8DpzsWlKhUZj0pKLNdN1SZUh9dnPtuTKE8rmrU2Gwg7TVEHjQauVjzz+GP887/+LeuWr6DPtgkUONJMRogMDddIx+lJw6fc9c7xQdqmCDVOkR5S6aqJRoNDX3/F6/vf4+yliwwOjzI4NEykYGp2hpyXp5wvoMOY5uwcVhTxy+ef53/2P/qnrBkZIWdZ+IEPKjEGD45DEBr9Z8d1UcDZqRn+7s23eP29/UzOzVMq91EZGiIWgiQxQThJQtBsgYDtG9bzNy+/zN88t4/BUolW0MKzHeyUVx+EIUEY4XjGhbQZNzl17Hv++9ff4Hf791MaGGDDtm0kKqHt+wYhdGzK5T4Gy/18f/Ik3xw/ztTcAtG6NTidSLkDG6VDridU1l0H1gzPzpKEpXyOrRvWc+zUSc5du4bI56kMjxCGkeGSp1kJYUrZzeHSc6il4v4sUE3lErXWaYFN+j1SWSqtFbbt4OU8WmGAnJnxrKnZNWU5MOShbwA4tz1GglCFBJeuwt/9P+CbbyF/y8PQAtHv4q3exMDGrVjg6uvX75+4dm283F9BRUWCIEolxSyiwKBnjuMYJQKl8NKNU6vZZGF2jpXDIzzz+GM8tH0bw65nLNg1Jmvg2AhL0NaaapTwyTff8m9+/zoz9Tpjy1eZjXICQTsAYSQn3bRYVcUxaBPgeK5rqFiZXvZSfOWeYD3p4Srfa8B+Dxnnn3wsY8udmkwlGiW6RePZKBTp5kwIOhuiIIhotQPKxSIr+iqcO3OKIydOIoVkpDLA2PP7zCIkBXGUdBSmEmDF8uU8/tAuzpw7w+VrV6nOz5MrlCiUy9SqDRK0CVIQhEFAEAUUykWkk6NZr5FoEFLajempFaN7nt39+L/8zx3l/d/C4/+f/0575XLnO/a2yLaJbfv2OT9rk5OK4WFwHEQUDcrQ3yC1KtOp0TAPjG1bPYe49/i/1wH61rFjWRa5vLnGarVKee0axleMUUgpJ534ePHuqXNvEMJw71Ok3LbtDu5fb7a5MjnN9elpGs0WUkuDfqJ76p90d3rq2d1rMkfVbONmVhlDDjEuxZ29diZf2bPBlyjCVpOwXmPHQw/yN6+9zKMP7mJl2SiL6NBQImzHTgedXnR93a/XNepzHMecRSszZoVE2BY14NilS/zu3Xd59+AhZqs1RlaspDI0TMv3CcM2lhAMlPuYWqhSn5nhpb17+Bd/+7c8uutBRsqZ26v5DlpAmLr45vJ5pBBcXajy9qGP+A9/fJMjJ09g5/MsGxvD8lyaQUCrHVAqFUErgmaLvG3x0P3b+Bf/9J/wxMaNaCCOQpO1S0G2GDp1ALUoYmJ+gT9++CH//euv0wgjlq8cNyIWWhMFhl7meR6DAwPM3phgZn6Wm9NTVBt1BrzBNJGhjXlglvHvHYc9P+hUHCJ7TWlYv2YN69eMc/ibr4ldl5Xj4yRaEQcRSqseh/Bu6zi29sTovaIFApnKuqbeJ4DrGHfYOI5wXBcpLKIwNhsgabl2GG2SYbQS+Mskj6ftZw/I/76aA3IURClRThDHxMpYAShtCocSle7OMzT5HlqvTBT0THg9/8DsNAVGWi/vuuRsm2zjaZCEuz+zsTs2P0dJQjsMCRNTlJOZu2Qp7wyJWDrh1A3sNMaURAoI/AClErxCrkM5CIMAKS1KxSJSWtRrNSavX2ekXGLPc3vZ+8QTrBwdJW9Z5phJAlreImcnupO0Smi3Wghpkc8XsG3HOHBGxs5Z2FY62cNCq8X+Q4d48733aAUxhXI/kYL5Wh03l2NgYICg5TNz8yZBq8HowABP7NrJC8/sZeXYGI1aFe255F0PMJSVdrOJ5bjkXIO+Hzl/gd/tf59Pv/yKRtuktbVl4ccxMknwch62JZifmUIFPqNjY7yybx8vP7+PfN4493mOKRImlYK0pIVt21gIqq02R0+f5fdvvsXn33xD3/AQ5YHBVJ877tCcREobSpQiShIavs/03Cz1KGHQWRpZuxOiTc/rEmNtXHBdvJSzrHomUJEWHwvdXc86Q+Su5UCzMaY72v5aZOtiqm1s/olA4d6nfHtIVxddAxiULOfl+fLYIT4++DpMXIYitxd+tkC7MO259IH3yJkzG8LTp4fPzc8RaHDzeRwjtYhOFFaqu6+VkTyUlkXOy6FRhH5Au9FgbOsmdm7fxmilnyw26DzZ0mxsgiji8LdH+Oybb1hoNEm0RGPT3b7q7nywxM1ZjAfdRd/+KZjt39ex0/jntqxK5/rTDB1mgc0KyKNUBjKOPfoHR4jbLa7fnOLgZ18wXOnnsW1b6CsUCaSFJUBaZi4rACtGR9m4Zi3Lhke4MHGDdquNlyuSyxfQicmGGQdgM6aiKDJ0rXyeQrkPkoTJmVmca9fcYENxYOvzLzXXjq/FcpxFga6dGM2qb+/bwPn1qyGI04rRW1oQwOAgrFkDM9O20CovhbCs1OzJbEruXcmr05e3oOK9r2WiAlnApVLpTM/1KOTyuD3zcO+QXLTm6Nv/IHqC6jCJaYeBUeCwnQ74JLP7murf96Lit19E9zuYZSAh0ZpEpwotUuAHAbEycpX5fA6h4ea16xSl4Pm9e9j7+BOsW7mCvtRp1VJ0FIpu7y/Ryfyp9Lm3pOxsuIwxV4jjOqYYEvjmzFnefO99vjl2nFhIVq1dh3Q9Wu02bT8wdEoNk9ev4wnBU48+ysvP7+PhB3cwUOhxcdWGkx5rjbDMemYDM80WXx47wTsHPuTshYv0DQwSC2j6Pp6ASqWfSkUwNXmD6swMfZ7Hnscf5W9+8Qs2rFgBgN9uGeWuXA4NRFoRJTFOqkJ1bW6Of//Gm7x94ADadSgVy+DYmDIyQ+MxNWumT7Qwymz1Ro1mswlDg+k9NetRFid0wp1b+lqkO6fs1tsCXCnTAlOLWJM68naz9N1bZuoXMvhocTajN4rqsp1uHVO6d1yl/0mfYSm0zqO1d9sA+QtrP39A/kP6ZX+upsAJkCNV8rlqy53328SpQYFSBn1K4iQdJHdfZHK3LZvYkyRBSkmhUKBcLpHP5RenC4VcPDn+QLMsgUqRonrKyQ1Dk5K17S41JEMklgjD79g0gjiljxgJK0GiEmzLwrEcLDSN1Jij7Lo8vfsR/tlf/4YHtmxiyMuZBFSil9j7psfPqCrCmMEvpvhIklQZwMZc39XZOb46cYI/vrufz7/+lr7hYfLlPjO5KkUSx3hejtBvE/otSp7H3ice5z/57W/YnVJnAtXV1NXp57QQ5F0XP1FcnJzmd+++z3988y0mFhawiyWKlQpJmupGKaLAhyTG0rBufA17H32EFx57nA0Dg4RakWiNJW3DZ1PG7N6xHRJgLgz5/LuTvPXefj74+GMmF6qMb9yEVygYBYjUblpKiSXMQhGnkqBhEHJzcpK5hQUGR+7dPj5rEsjZNuVCkVK+YIottWF6ZoZWf46WBd9mDk+DMNGjza81QmlbBtFgPNBXbq1IC4h6Ahxp2ySVCuE3n8BXZ4yjwyi34xshkiISz4otGNlw6dK+U9+f3Xx5cpLiwIAJzBBEcYxOx3CG5KqUW+w4Ns1Gndj3KXo5tm3azO4HdzLU19dzUXQK4erA8ctXeOPAAT7/6itCBdLxFgXZi4OcJV/9/zdM11iWTRTHJElCpdKH8lxmb97k0KefYQtBqVjkkfu2IGyBlcYFSmksKRgqFNi5bTunzl9gZqFK0Gzie3mKuSJhrAj8AEumRey2TRBFSBSVchlR6SOo1bkwcZ3k9Kn+1f0D2/KPPDzvv/JSM4zjRZtVWxnUNx6sQKnwQ5fUbX5QEIoRW1p527LTzW4636XZxtuK2++x3bHeKQ3ItVIU83kq5RKOzKzl7uK4MkPg9SKJ2qbvs1CtoQDX8zCzXHrK7D+3nODW2PzW82cSiMIytM0k9EEIPMtkYRM/JAp8Er/Ntgd28E9/8xt2bd3C6uFhcilnOGVaLnHsLjIvhdVdkVIUOY4ioiTG6IK7NJOE85M3eP39/bz17n6q7QC3UCRXKJriypR6GgcB7XabsNFg54MP8Le/+hV7HnmIVZVy98xpHUiiTRCZgUs32z4ffHGY37/xFt9+9x1+HLGsb9QE1Bh+dRJHxGFEfX6eguPwwLb7+OWLL7LviScoCmGcgUl5/tl9VSZwjYHzU9Mc+PRT/vD2Wxw/+z2r1q3HK5ZBmGNr3VVVQ5O6bJuC38mZGWbm51Djq829lZlN0I+sD0KY+CntYgtwXYdcLofruoSpc3MmdNGpGP0Jy85SYyg7kKKnAMQE/5ZADwt05d7P9A+r/fwB+Z+vpuUHm9Ra56ptT89X3Wa7bWzRU5MDnQYCmWPlvbZsIliquLPXGMHI/kjy+TylUplc/paAvHdm+5E1XKbBuA/MV+tUq1XiOMZ2bGzbSdH/7CCLJ32TDlr6KchkEY3QvjGDSEKjwlIuFLGF6DhelnN5Hrh/Oy8/+yy7tm1jqJBPdYPNhL7YWRAySoPZmJggMJdb7J2lBcbQxzbV8tW2z9ffneSdDwySEGkIopiCl6OQaqtGYUijWiUJfJaPDLJ1wwZeeGYPD++4nyKmnwb7Kwg0SRylfEebfME4pV2amebdA+9z4KNDXL5xg2L/ALliiTCKcT0jmxUFPtX5KiKJWTY0xFOPPcqLzz7DyhXLFxVCaW2kLTUSJ++BgNl2m2Pfn+PdDz/k88OH8cOQwaEhvDSFHMcxSYqQZ2heRhWStlHdWFhYoNGoQxaQZ0Gv7g6WLthw50yLIyWlUpFCsWDURqIEVIqViDsOiyWbXuoXQbrZSnWN6RaMZdelNKASpxC0R8+OjVb+w7b7AJC9EnJZceP9a6GMmWGXUpBVSBQuiFjDaByGT9eqtfULtTrlkVFsx6HdbhukNEW4tRQdpMbIkSrajYaR61y9im2bN7N6dIw8mZRihrCZZenClasc/Phjvvr2W6ZmZhleNoZ0jaHUUkHHzwlu/0NpP+V6k9RcKZfLEcURUWj4rCItOJ+cnubbo0fZsHYtw4ODrEmlJ5PEzCHCtbFtmw1r13Lfpk2cPHOWKzcnadUbFPMlHEvia4VSAmlbxtE4Dk02SmgcL0fo+Ny8eYOh61eHB+vzjxwp5S4eHBv6PgISrbszZ4YKTguYB5ZhSLI/1JQuEqvllrAso6KTcmWzgFxk2YJ7a72Oyr20plt9MFRinsFisUilUllEwely+5eeKTIDuTiJsS2JTEGCeqPN7NwsiVZG5hKT8dKZWR23LF8aFv2BW5Y00UVMpWURBAG+71MplykXiyRRzNTkJJHvs27FSvY8+hiPPbSLNcPDuOmxEp0GZEJ0s6+iS3PIlHeEBZa0kNKk2RKl8EOjzuHmPARw4cYN3t7/PgcOfsy1yUlGVq7E9nLML8xj2Tb5QoG86zHdqBO3W6xcNsrTjz3Gs08/xVjJ64jWoLRRSUKjhaGXCmC22eTI6TO88e67fPjpx+SKJQZHR4i1ws15FBwHrTWzU9NUF+ZxBOx+8EF++dJL7L7/fkrC1H5Jy6aQt9GJ8TBIhDAghtZUfZ/DR47w/ocHuTE5jZcz2WfbtowmeKa0loo6GOqcxrFtJJqZmRlm5uY6/godgKWz47pDE1n+q3uHPc+jUCiYWCsOzHOL+JMAoF7UPCsJ7c34GIpk+rqUCEtKjSporQZ/0gn/AbWfPyDf+rOfwRSuJEo4QdtJ5mt2s9UCYVzKzKOcqhmkKXvdUwhyNy3jwvVGM7dKH2aBqJWK5vf1lSmkk8CiY932+TvvEJSGhh8yNzfPwsKCMc1xva70XEdb/JZz3PYgiEXHVEphOw5WqueqlDaWvlIStdvU5uZwtGb7pg389S9e5fmnHmeokMdb+pC3NU1XLcKoyogO2q0wBRpSwFwr5OjJM3xw6GM+//Jr6kFA/9AwWkikZWM5LiqKaNfr1KsLDPaV2bl9O/ue2cNjDzxAHxClaHXe9VCJKaYTtkvedVFac3Fmjv2HPubN9w9w8eo1in2GM64dl7YfGLkmEpr1Bq16jbHBQZ54ZDcvPrOXbevXU/RcwiTGSSeYRCmk7aQOqFBTimNnz/HGe/t578MPuT45xdjqVZQGhmiHEXEQpIWFKt0QphupVPvXcRyklDQaTZqt9k+SfuidIgVQKpYoFkupqkqU6rpmG7XFt66XjbV4qv2hs7EoHWkmdZPU7mjQam2LJB5B6/7sk2oJtHDstV8ypgMu/zf/LfNfnl7MIReAjxI3iIeaAeuJRuJabVej1epXWhvnPClMcWWKJCVao+MIgeGP2rZFEkfUa1Uq+TwP3r+DLevXUzRdYazAAVsa57o28M2J79h/4ADXb07i5vPkikW0kERx0umj2xRqspa+/qPO9H9BrXf71+WQih+lOWVBpG07pm4ETcv3sYG+wQFIYm7MzPDewYOsGh5i08svAsZcTGPqE3KWxarhYbZu3MSalSu5MTlFs1ZjcGAIaTmmmM5gpFip26nSiiCK8GwT0DeDgLDdWl3S6pex5JgP35tLWMIRVoMdQ18bbAWRMrUVvfdTSfBdcNpxMQyDCik6r9JAXOsukvinbtaWcufMHtrsuTYZ2bKp5SGlDWQB7A80E2wrdKourYBavc7M3CxxEpu6G61N/YoQHbpK70WJ3o7p0cNfNDbS7pDC1CZ5nksu5yG1pt6oEzQbjPQPsG/PXp7fu5eVg13vDkUXRJKW6AIaZP+6m+kkSUAYjr3SxvXZch3yjoNWmoszM+w/+DFvvPMel65fp1ipYHu5VLFEU8znsZEszM7i12usXraMV194kRefeZplJQ+PLjiX6d4Lx8aRBnme8X2+PnWKDz7+mG9PnqARBvSNjuDmczR9n5xdxLFt6rUqCzNTiCThgYd28trz+3jmkUdYOTxMAsRhaK7TttN5zVBNHWCq2eSjr77hj2+/w9dHjmJ7HitHR5GW3anRygohOyZN6fPkeh4yiZlfmGdufp5EdzeNnRt3jy2fy1MslYyAQlqzQyqNqZRektH0p7dM956U9QBBFCKjsNRnHt/4x/bS/1Dbzx+QL//ZzwCACJW0JwIvbDbtRqsFUuCkHDhIRebFvaOEd9s0EIYhQgrK5TKlUplumeM9HghAGA3VRqPO7OwsCwsLOMWisUKW0lARMorGDxwuS0Xpzo7TDGJNag4hTD9ZAtqNBnG7Tclz2bZ5M79+/nleeHgnKwsFU0zCnVKGna9s+MRSpsV+6QSBCWRjrRHSwhKC2ZbPNyfPsP+Dg3x0+EtuzM5RGBykr3/IBNXCIOPtRp0o8KkUc+zcvpUX9+5h76OPsaZcJtAJSRwhtCaOTdGQFgLPcYmBq7OzvHPwEH94622+O3sW4biMji1H5nL4seH7+60mcdCm3WwwOjjA47sf4pVnn+HR7dspAHEqsea4Dkob5QjHcZFCUEsSvj19hj++/z4HPvqIy9cnKFQqVAaGcPMF6q1ZwiTuIkSyu3BoLZGYtLC0LWqNGvVm894D8myFzBZfISgVS5SKxc4GJeP23j42fmrAkIWlixddM2jBuIJKTyq1Rih1Ry1DCaxcsY4N//w/Zf6Nj5nntImIe4/q5pR44MF4G8pae/bUqpuXLw1Xg4B8qZjSn8ym1KgICaI4QicKR1rkcjlsKYn8NmG7zcDoKI/s3MmG8TWAQXCTHkfVhSDg/MQEHx3+kq9PnMDrqzA4OmpMuKIYdPyjQc4/9nYvYyYrBI6TGGlZOK5Ho15HS0n/YD+2EFRnZ/nq2FHWr1vLzkcfZdVAJd0cGVQPFEUpWb98jG2bNnHm7Dnmr08Q+m2cfCq1mCQp7KKwHYtYCfyWj5XLmfnSdvDjOF+rVR/vaza3jMDr89yBTSnNuCwFUE5AKrCSGCuVMQTQUhLkbcoLrdJ8tUaIxnJd8521Mo6TMnOx/Knqinfo0wx1T1F0KQT5fJ5CvrBIUvNugqwsIM9aBMwtzDM5NUmsEtycZ5DpTvHk0pyUJU+hMR0ppTlHipzmXJeC56LjmFqzit9osHZsjCcfeZRfvbCPnevWdIzBtO6d10jlG+msaGl+DktItIREGblJlDB8ZiHI2Q4xcHlunnc+PMjv33qLE+fOYZf7OlK6CLNm21LQrC1Qm51l9dgYrz73HH/16ss8uGoZsdYGpcYAWrFSJELgSIsEmA8Cvjp5gtff38+nh79ktl5n2cpV2Kk8quu66CSh2WpRnZ2mL+dy36ZN/OqVl3npqadYPTCIBQRxjEgziUmS6u1Ls3G80fb5+Jsj/O7NN/nk8GEaYcj42HL6BgaYr9WI0z42q/1iEE6jcXMeMpYsVKvMzM0RRDHKde4hDhedns+O73kepWIRL5dDNBpGGMFy7jQq7qr1Krncdnq6lBVJVjyuabR97GbTHQ+iXOI4DTsIfvL5f7Dlf16a+j+aok4BtiWUl0SB0/INZcVKpQYNeJaSLdRP4zT1nKezI++8ZraDRLEJvgqFAvlcDhs6gazSWUHpjxw8pdiIVEYp8AOazQbtdhu7UOimgrJgvPM9Fpurd8P0Dp5lHiQpsaWFH4VopSgVSziWRdRuMT8zQ8Gy2LppE6/te559z+yl0mc4cxa3o4JdlGLxRUiZSVLpFBnXKCGwLbtjf33+2jU++OQTPv3qa6YWqvQNDaNsBz+KqPT3EwU+C9NzLMxOM1gs8MB9W9j39FPsfvB++gsFIiCJAjzPIYkiavUarpenmNJUrk5O8c6nn/LmgQOcPn8et1ig0NcPjk292URaNsVCnvm5GRoLc+Rsi53bt/PaCy+wbd26DoJqCcOPTiLVkcwSQtAGrs3O8+HnX/Dhp58yXa0yvGI5gyOjtMKA+VbL3POOzTTpYqINzy5FeG3HASGp1uvUm42OG2VnXBkeyNJDVmcLszKIlDQSm/lczhQCaYMyyvQ4Oj1/ByUXncPc3fSpu1s7SBd+LVN0XKcLvPnetrAsGzEkYXipQ3nAamAE8ImMNOXiJgCbf/q3kfg//FdyKGyu8D44MH7y7BmrGYZUKpVOVsp2TcYiSRITZMfGjMeyzBiMowjbkgwN9LN65UoGK4Y7nsSGI2NZJsU9tVDlyyPfcur890RaMdjXR75YJAgjE7jTLYi9tV/uHAH9eQOy/6Fa12ExDUrRXUR00cTQ/dlKlUaarWZHgcfKJFmVxs7ncIt5qtUq350+zYFDB3nxySdYPzKClhattk8YxzjlEgPlPtavHmd4oJ9L164RRwHSNRtjbYmOyZJjO8gkod1uEUpJ3nUplkv4SnHx+nVGJq5WHl43XvzEzYd1IZe02dYCEmkUpAYiTX+zRjFoGt1zDcq2RBgVbVmdz8/Uq/gqQTq2UX3Rxpgoe947lqT30tdiKYfDxWh5p/jTsnAcx+hs9449ITo88TvmYnUXnNKYGv1mo0F1oWqs2VMQAqFNlqDnQKIX/tcdqOe27yyFJEli43+AoJDPkXNsbl67Tn1mlkqxwJMP7+Zvf/UrtoyvNiCWTjcyOkVb6SLj2dOks7lIpK6hQiIshzhOjFOy7eA6xvl1YmaWg58d5vV33uPEme8p9g9SGh5GOA7Nep2+vjLDQ0NMXLnC9I0J8o7Lk7sf4TevvsraZUOGTReE2K4pBI7C0BjTOC4OgoUo4ty1q3z61dd8evhLzl+5wvDYGMvXrOH6xHWkSlg2Mkptfo6pGxO06w0efehB/uZXv2TP7kdYNThElERoKcmldK4oDGn7Pq7n4doWAfDV0WP8/o03+eboMRIhWb5qNcJxqDWbaQF7GgWkc3CWjVU6QWCysQJNs14zmYkoJHEdbBZPYT82XHUKfAE4PRxyKUSqQa65NbNzLy3bUHaowCkavsiVQxkqVTbGm3FIYWbBWn7phqctuyGjn0mK/L61P89x0/aPJyDX2rKTKN/2m06z3UKltAcTsKRvulNg82doOl34XUtSKpXwerjTHc5T7yC9w3jN3iswO3Hf92k1WwRBQJ8wBZ1JopecsO9wxEUnzGK8DO/QKNqtNn6tjlSaLZvW8erzz/P8E4+yYaCSmgqZAqvO4XqzlD2Hz0CRbmFNOoFKowfrCEEtDPl+4ibvHPyIDz/5jEvXr4PrURoYwk8S4kQRhRH1hSqNao28bbPjvi28+sI+nn7kEdaNjOEAWoVYElMEJiXCtvHSFOtsu8X+w4f53RtvcfzMGXylGB0ZwfI82n5AEieGfxmG+PU6A6UyD26/j1f37eOpXbsYyuWQaII0kHMd0+fCkiRC4AMnLl3mw88P88Enn3J54gaFvgr9o8vwSkXmp6bx2wHFQjE1e0oxHW1S66Y41EwyjueA0ixUq9TqjZ+GkN+SR87nckZZJL05lmWlaGO6gP3EFJEmG3c9gUE2LFIWjpJguy7SsWm02+D7fQMYJkoMzNBFN4oYmq52BOX/yf+Yfj8if+igcYcZHBRyZiY3vW5tkoyPi9LZU5vE5Wtbr1y64rS1YGBohIjU6EhIEyCKVFITUy+SqITQ9wnabYYqFTauXcuqFcsp0UXgZLqJaQNnLl7grQMfcOHqNQaXLcMrFAkTZVArbcbazzaB/MW0u162EVqbMZEoIm30g+1U8agdhsZAwnYoDPZz6cYEv3/7bVYvH2P9yAhg1DmiMCTRmv6+MhvXrWXNypWcPnceFSeEYYiVSlpqpUmSmIJnaEqtZjM1rxKUimXarQbfX7zEY5cuDa7eft+YMzQ2ib10QA6puY42G8ei7RJYmuuupGVL+uPE2hQ0K/HcVOn6/ByBTnA8xwS1KknBl64B208NTXrN5259PatHcV0X13Gw0o0/cIfQeImWrQVpljVOEmqNBrPz88RSGBpguskAFtOwFm1M73zGrARGCrAsSdhu05pvU5udYahU5olHHuHVfc/yyH2byaVH6RTbpnxx0bP0ZCAE6FQqMftblv0VCMsi79iEScLlhRrvfvI5b7y3n2NnvicUktGBQaTr4YchtuMQhxGzk5PMTk0y2NfHk7t389rzz/LAmuUGTItiXGmhE0UsAMvCs20SBA2tOXb+PPs/+ZiDn3/OlRs30I6D9HJEWuHlC+gkodVoMDs1hU5iNm9czwvPPssLTz3F+MAgLhAgsBFY6cVKabI/rm0x2/Y5cvYcf3j7XT767HNacUzf8DD9wyPUWy3a7bbJEJq9UwcQ0+lYUcrkjzzbQmiLVqtFtV4nCAJUsfgnZErBte0OACmlNLQhy8zwXaT7JzwBvUNqiS+XFXka5+OEVhCSazWsSqvmaiGMi3CxhLRtQ+H5C2n/aAJy0EKq2I1C32n5ATKXw5Zi0aDoGivc45F7UyhLoOMZohGGEW4+Rz6fN9qutx2nG892inVuf9cimaswCglTNNu2jYJEEASmuORH6CqLj5rtng1q6tg2KEXc9mnVa8g4ZtO6Nezbs4fn9jzF2rFl5jMpbxYhe76sWHRcoFPseVtLEWaVBrJnrk7wzgcfsv/DgyYYdxz6BgexXRdPKZJ2i/nZWVq1eQqezea1G9i352n2Pv4460aW4QKKCCk1lrBJlEZLi0KxhJQ2E9Uqn337LW8dOMCREyeJpaB/ZIRcqUQrCGm12yZwDyP8wKecy7N7x3Zee/EF9jz0EMtyORJMYamOI6RwkbbsPCmNOObq7BwffH6YN959j+8vX8YtlegfGsbyPOqtFrFKENbidEjG48sCR8Ozk8YxLo5otZq0/faSY+KH7nEXre6+z3Edw+nLUDQpEYmhrnQkzno+kKWBf6iJlOultOoUAeneBbGz2ZW4Xg4Exr65WnXug7yA9hQw23NNERAR47ouQ3/1T7BWr0P87/93cPo0wrKEpbVsFYuqCrZUbI7D6L5as2lb+SK5fI4kCAyVhAStEkSKFmLbKY0pptlokPgtNq9Zy7YtmxkoGf1grcCSNtK2iYBrNyc5cvw7vjl6lGaSsHHDRhrtIHXDlelCeYeJ4y767y++dbkCXYQ0u+o7XLxxRzbp+iQxAXQun0dKQbvdJokjLCkYHF3G3OQNvj1xnGNnT/PYw7soWA7SsbHSYuiCbbNy2TI2jI8zNjxMNQiNE6/rkunxq8xExJI4jp3WC4GXy1Fr1JiYnKRx48ZYpVZbJ/pHFrCdxg9es4ZECIJ8iev5El8WIRIwEEZy7fUbFbEwU5xfWDDW6vl8Fk12sih381zd3s3puvAjwbgmDdpct1OH0jnGj4Xkorse9MrTJSqh1W7TbDWxSiVsx06fL277Lt2NRpp9W+qMGtAq1dC2cYSgWavSmJ+nlMvx2MMP8ZtfvMbu+7eTI90kK42VBttGpevWQ2ZUndsDvVhptLCwXRsBTFSrvPfxZ/zurbc5duoUwnUZG1uGnc/hxxFhEJL3PBr1KrML8xRsh6cfeYS//fWv2b39PiTgt30sISjkPKIoJEk0tuuCECyEARdvTHDgs0947+BBLk1M4JbKDA8OoIVkenqWSl+ZqO0zNTlJ2G6zZd1aXnz2WZ5/+mlWDg4jMMXFXlqQq5RR85KWkdNtAkfOnOf3b7/Nx198wUKzyfDy5QwMD4OURpQhUV0jKmEAGBAdACjrMyENkd8PfVotA/L1ilplG50lA6Ql0iyaTGnFxXVdLDtTxOnmzX86Tr70V+j9JwSmiD8RhHFEoiIhHSzh2CTNJq0bs0vq+P9Jbd3KP9+xlmj/aAJyAVJqbBUnVhiF5HI5hBSpTbvZMSYqSR357jki7waeqUvWUi1JpYpc18WyeiaTJSaPO5+ruwGAtJI+UekEbHWLV6SFlKLLAbzlQVnqUTCou0HFXdcBCc1qA5HELB8dYe+TT/LsU0+ycngoRaEVVkdJpedB7QX6b0FlssLHTPooowqF2lgUf/DRR3z02WdcuHIVbVmUBwZwCgWjz5rL4VgWs/M3cbRi/dr17HniCZ54aDcrBobSQh/d1QcWqVKCtHCExUyrzeHj3/Hm/g84euI0uA5DQ0MU+voIk8QoCtgSx7IIEh8bzeZ1a9n7+OM8/uADjA8OIIA49BGaDsocqQSRIqkL7YCvjh7n4Kefcub8ebRt0z8wBLbF3MICzXaLYrFIPl8gDmNEWhSle+6TSbGajrPS8RTFMVEUd/hxgqV5oAJuow5lx8vugZMWs2WpS8uyIEyMTn6mBHGvLVvEdU9BTQcd111US2tc1wOVMNeos+zarDs20SyeGC22L9p3JnBYQPuBB5j7r/9r4v/yv0T+m3+jFPiNiQks0LaQmy0ltgmQho9vmUVIR6YwU1s4QiJtG2kJSBJUFOH7bXQQsnxsjI3r1lJMZdSSVF1CSKgnijMXL/LdqVPUGg28SgUvn6faDojihJxr0xUsVd1NVdqPutPzt96cLEz5Rx+uL9mSxEig5b2c8VIIAqN4lVLtEm1wTSfnIRyX2sICJ8+e5fiZ02xfv4GBXAFLSuyUuztcqbB+fJwVY8tYuHiRKFJIq68DTmQIndDgWY7JkiQJjmWjEWazvFBb7dbbm4TS3/3U6xJKOU67Xfar1UKtVkU7Nq5to4VEYwIqUuOtey1q61Xsyn7PAJ/ef6TPte262HamqX7361ono2QZqUCVztthGND2fQqlolGAiiK08W67bQ3T0DPx0xnmmeI0GkSaXRXScP1VGOJZFg/efz8vPvcsD2/bxlChQBgbZRBbCAOAdJ6vLkzaoYuJ2wV3jd+IoRjawFwQ8O2p07x36EO+On6UUMP4qpXk+/qYnplFWJKc5xCFAa2FBawk4fHHH+c3r77Crq2bKDkufjvAtR3cNOsmLAtpmexbG7g8Nc0nX3/Dwc8/5/SFi2jbYdnKUYaGR1io1ViYnaWvWKTdaLIwNcOqZaM8/ehjvPrMs2xftx6tDb3GFoK8lycKAsI4QjoeecsijBNOX77C/o8Oceizz5ian6c8OEixv58gSWjOz4MQhr+tu0CeobWyqD4ATNZGI4iimCAIiKLImDWJ7tbqblovEGhcyG1c1xizmUyp7jrE/oSpbymFoA5Nl+4apAQISyK1Ik4USinhCikqleXcPPoRX/8//6/Url/F66vc+5e4U/vssz/fsZZo/2gCckBKKSyVJCKKInLC2GfrJO5Y98ZxnO7q/pz7NjoTZnZ813UXWSdL0nTfXQzOzN0PzPjL7OaNWkEakMcx0japOaHNZ7Jiju4pblFf6SkCkkJCkhAHPkGjwfiKMfY9/SQvPbuXHRs3pN4spvZedKg2tyC+PddmznaHvkHQjmLOXb/B2x98yBvv7efitevEWtM3PIhXLKaIdAAoVBBAGLBu7Tj7nn6SF55+mvvXrzMV7lqhVJTSQMzkIi1JgqShEj4+cpR//+ZbfPH1N8w3G4yMjeEVC8Qo4iTCdR20lCzMzFCwXbZv2sQLz+zhlaeeZG26CfEjUyRqpfc0wSwmFnB+Zpb3vzjMuwcP8t3pM8RCUiyVsTyPII4J48jIQVqmEGcR31p0g4ZsYjHFnWbhipOEWPUyqe9ywAgJQi+ioYjUHCfrf4TZuCVKdZCle34CsuCbxUU9pN/SSH4KEBau5yHCgNl6g+GZeWew2ioGg/n52JY/4KKWELkO9fvuI3n5ZcTVq1omSZDbupWRZrNsLyysCVRiuV4ebdkksUpRbmuRmkAcx1hCYkuB7VhorUjiiLFlI6wdX43nOB0kTjqSAJiYnuajzz/nq2PHyFcq5PsHaLR9tNbYVqZt/P+7gfVPbZmqENDxTzDzmfEIsFwHISV+nGDn8hQrFb797jv2H1zGstERRnIFpOMQhCGe61K0LdatXs2qlSs5dvYsEeA4FkFkbMUdKY1EHDGu4xiKQRDh5vNI2yGME0Q72Oz4wcNCq3fu9jp69l4AWGjHjuNi1Gh4tVqVYv8AnuOa+g+RqnqlahN/SluKlqjTuhyRgh2u6+K4TlrUfA/HBhCp0EH2mtImWAtD8rob2HXLJ3s+2/Nzd55bPK8IjKykIyQqjpifm6XoOWzftYtfvPACzz7+OEPlsjlGkhhTqB8ttLoFrU/t6hUC25JEwIwf8PFXX/Ef33qLL44dox5HDI+NIfNmno6VIufYWFozMz1JybHZtfNB/uqVl3nu8UcYsAw9JdAKW4Do6XOEIATOXL/G/k8+5v1DH3Hi7Dm041Dsq2B7Ln4QYElJ3ssze3MKHfhsHB9n3949/PrFl3hgzTgFwE/SDYdKCIOWQbotG891aGo4fvESv3/rLf743n4mZubIV/oZGBkl1hq/7ROlrpWWlRnVpWo0jvFfUYnqrDsCiZVSLlWSdDLvRi7SusuZrcs26G2WZZmAPPVH+blbz97PzPtSpPrnNuQdMTE2yzlxnBvffEE0W/35v9Cfsf35XXL+h2sClDAmASk6kcpg9eq5/pyLqkoVLX4IRf8pLQvkes1XMl3sTpzcQ6sRwtAJMrRVgXEJFWBLgWtbxH6boNkgZ1ns2LKFfXv3sGXNGjxMsVuSuo7qJEEnJo7qpkvv3IdGUcRCC9lRMbg5N8fnX3/NoU8/4+zFiyjLYnDZKJWBfhSaMAyQQKtWJWzWGRsc4NGdO3nq0UfYsHIFeUDrmCgOUYnhpwlhmfQkkkYYcuriZd7/5FM+/fJrar5PX4qMt4KAarUGGjzbwdKa+vwcg+UCzzzxGPueeIxNY6MIy8IPQ1QUknM8pGXRCvzUWAcC4MtTJ/mPb/yRr44cJVKaFatWUSiWaLVb+L5PvpBnaGgIpRWtdjvtD5kGyNK4x6VjQylFHJtiJ52a99y64dHpffsps1xWi6DTgxnd4qQzRu/1iMaFkM7GLhsFt8n7CYHlOCAtmn5AFPt514oHpNBF0gwnP+ZO8C/+Bdb+/QwdOsQD//yf8+iVK0Pe5cv5+TDCyeWQtk0YR8RJjGXZFHIFcq6L1oog8An9EK00tuWYwivHpq9Uoq9U6m5UUtSr1mxy/tJFjhw/zo2pKcZWrKTcV2F+fgG0wHNzHXTGoHP0pPzp9EHHSvwfa8vYKXc5cAQYk6ZUezqJEzzH0KiiOEKjcVwP23FptdpYrsPgsmVcvXGDr44cYXp2lkwrvNlu0mi3SICBgQGGBgZI4pg4jlKzE3NvbNs2ykJBmC5sXWlY23aMOye6QhxvQpP/ga//Q11ABXKuoC9RKh9GhjNuWZZ5vjETb0f+815PwmLaSgcRv/W7pOuMnWbDrHtcybsEsy4LWwvjpqkSUwTY61B9p5qlRc+A1OafmSgMb1wIRJKQ+AGthSrLh0d4ed/z7H3scZZV+mk2GjQbDTzb1OpIK7tz2TfM+rE3K5d+FwUq0SRKE2uNDdRabY6cPsPr777Hh598QjuJWTk+zuiyZVRrdaamp/Ay74l2k6BRZ8OacX7z6is89sAOBmwbJYyufSGfQyUxQeATpdKqITATBnx1/DjvHzrE8TNnSCyLVWvW0j84RLPZ5vr168RBxEC5zML0DCXH5eV9+/jrX/ySXdu2IjyPBGPiVsjlkdKi0WiCMJr9Arh09Sr7P/yQN997j+8vXaZvaIixlavwigUarabZNOULRnAgjjtjwkhEdjduQKoB340fNEaWOE4yL4nee9khhNzVOJKkYz991jP62J9uQndr3LZ4nl30XAjzvW3poPKSo5zi+OhRojuXiPyDbf94EHKtLRHFeUtrL1NXyVyjjKNZ6nr1pwTK4vbq996AX0hp0oh278SSmbaZ1J0JjAxSLaylvsstg5DU3dGySBLjdtfhaimN5zgEfpu275MvFvHyebTS+GGQGuQY9zhbCAq5HLYQRL7P3M1JynmPfc/s5a9ee5UHN26ikst1NJmtLAgRAqQNwnDXtdbkPK/Tjeah76LoShkdYc82knQ3G03e++RT/u3vf8+p8xfQjkPf0BDCdWm0Wji5HHnLwm80mLx+jZVDg/zml6/xyxefZ8ua1eRtmyiJcS2JsB1T6JUYKo2WBhE5ev4Cf/f7P/DRl1/R0oq+kRGkZbFQq+G4Lv2VCpYQXLlwAeX7PPbQTv7qlVd4/onHWbds1CzmOk3pWRZxGKKkwPFy5Cybm40mn586yZsHDnDy/HnqbZ9SZQA7lyMKAhLf0BhSuV6kNI6P3DK5Ka0htZHOqCRKSrPp+YFF76e23jTfn+VYpJStDA/rCRyMS17XDEZJSStJUPWFTSO1mZd3qYF/P4x1rjjTLCY5JwyKrgoEuoWNhU0IhKRLreOgHQcfyGnNqBCyvbAgZ2pVhG0jpU0SJ6lbbFpxnyToRGEJC8d2EAiajQa2ZbFyfJyVy8coFfJYwhhvZGnaqelpvvj6a2arVYp9fURxAtLGdgzvWQpwLNu4jOoumUj3yK10iCs/MUX7D71l1IQuaecuP6dNUSe9AYLWCKSxl8+qe4U0xbhSECSKa5NTfHXsOKuGRlk/PJLSDw1paNnIMCuXL8e2JLEfmA16mp5PkhjbtgBJGIRIIXFdh0QlIAWFYpl2GNGaX6iMJUlUxxivLWoOqAIERQgsSGJo2zAYRfazU+1CNNRXGxYiPxLHz8xa1kNevojSwrgo247ZgAM6TlAWJhBC8EMgxlLNusXkJ8uSdjb0GWqbbgQWIdNCdBM6d1ru0s266BnDnU18SkEz03qXzqBSJ2rbsk1ApxKTcbbsjvycjs2m35ESxzJ0o6mJCRLfZ8fWLfz2lVd57rHHWDU8bAq7vRxuajJ367Vmpjb0BF7ZQNRJQhJrYg22YyEsQyP55vRZ/s0f/sDBz7+gGoQsW7USr1ik3mqhtKaQy1FwHCauXCZpt9i9437+yS9eY99jj7JycAALDLVP9jgPY6g9NjC5sMC7X3zOf3jrLb45eRLpeVQqAyAlUWj8DyqlCrW5eRbabVaNjvLS3r28tu95dqwdp0jPPAcmmNaCfKFIPp8nUorr8/P84b39/Ns/vM7N2Tn6R0fIlUsEKiFph7i5HFEUEQRB6h9idWWGb2kyldtVSYxSCXGSQM97F+f+0r6/JRveM7KANOhP1/sMAFQ99607rm73b7mbtsg8rwNyWkiRmlRlWdqUiiyQaGkhk8RyfN+FpsTyVSqS/xc1I//8AfmxY/f2/jiGXA7WrIFi8e4/p7XUcexKsKzUoVP9f9n7z2C7jnRND3wyc5ntj4UHCIAASAL03ntvyt1763bflnqkUIxiFDGaHo0mQr80mgj90EQoQqFRzPzoUMwPmZhutbm3HB0IEgS99wYg4f05OH77vdbKzPmRufbeB44gq+oWb09l1SEODvbZe5lcmd/3fu/3vp4za7X7vm+c8Ae8R/2JLYbk/s4aTpLLTSo8x8qq89MG+pzfob8j3CKRZRqsky/S2iEZeI63kgL8OVuG1LasS0SUdI1paadDY36Bahxx2w3X81fPPM39N99MDGRWo62hKAOk1lhrnKaol1q0Js/A/XX1KJD1i5YQEoPESocknFpYYM+77/Or51/koy++gChm1arVFMplumlC0us6aa0sJe00WTMxyj233szTjz7MnVdegQLavS6ZNcQy9g+g2xisVLSyjAOnTvP8nj28+NrrzCwtMb5qFaXRUZIkodvpuIYna8m6XUynw9rJSf7yqaf4q8cfY2Wp6O8PSOOMRaxQJDoBFWJVwByWt/d+yb/69a9599PPaGeaUm2EYrVKqrWX83KNZBhN2uv1pQaX80cF1vjA288VJSWZEEMLzh+mYOW3trP43o7CNaz+8L3G0Dzvu1Xm3FZyWVHIfLJkpKRjLAszU1s7+776q3Wlgl4RFr4KDxxdIQvFrLF6RfP4aKEhYyuKJo1GCJNVMuqEUqZdoCCQNaXMqm63XG61dhxfWFg532whwwChQl/xcQGw0do/G854JAwD0JrGUp1KGLJpw2WsWrGSWAwClxzpPTZ9hk+++IJeljE+uZJOLyUUAcW4QKfdweoMFYcMnEmHLsn3vYb/wMdwenmxc+9f46FNGmsxXvNZ+gqeq8IJVBiAFKQ6I65U6GQZn375Bddu2crlkysoxsX+mlYpxExOTDBSq1FPZskSF95Ya0hT7apbEjpt9+yrICTTKRYolIrMdbpUp6cqVy8u3lwql5PDjWYZrFACiUVl81ZGTatGlowaFzYqZjYgDMTo4nx18tSJ8WzT6pm0Em1oHDn8VLPZvKxYrWKkJEk0AY7ioWTg9hjRfxIv/RoPJb753/OK6HDjZh6s5FKfvz8e6YYSDvzxOGf/3oEDLASiHyTlwZfGYq3OZcdRSEIhMGlKs9PBJgmb1q3jF089zS8ee5TLJibQWJIsoxRFTinLmn7wNmgQH5KPXMYh9nuosKAURgkWuz32HTnGs7tf5ZW33mK20WBs5UoqIyMkWUaz1aQQxQRS0m01CHTGto0b+atnnuGnDz7IZeNjgAOTpOOKuo+TyjlgKsU8lrf2fs2vXniRDz79jK61rBwbp1As0W53MNoQyoCCCqi3O8TAw3fdzS9/8hTXbr+CmgcDhOfkW2udVLKUrhKHo8LsfO01/u1zz7P34CHWbtrI+OrVdJKURruFMVAsueeh2+k6gzopMNlgfT47gcuvmTamrziipOp7N3zfSdK/P2KgiZ+lqausCAGeq+5ffenvn39MH+jxwTge6BISgYs1+pmE8JKXUqBSLWl3Q4FQiNAMoa//YJbqP35A/stffr/Xz87C9u3w3//3cOutl/577uYYRG7mO8SUFXy/iXfOe5/bt95HEvwEN37B0JlrmMgy3T+sYeRB5hPoAtCFEPTnkUNbnbqJ9rSRHKXPzXeazQblcpFqbQWLjTrz83OoIHDobrGE0Zo4DImVIm13mJ2eprkwz2MPPsC/98u/5tqt2ygAKW7iqzxokQIhFAiXxWttiELXCJr5EpmSEhUEzl0sy5BKEipBCJxuNHjns8/5zQsv8MU3+xhdtYpSrYaKC9SbTYIwoFat0ul0nRxU2uOXzzzNP/75T5moVWkmCbUoohTHWJ2hs8xr4krCMMIAZ5bqPPfyy+x5621UsUAR6GQas1SnUi4xMTlBY2mRuenTyDTj6quu4rEH7ueGq68mDEIa7S6l2DXgogQ6yTBZRhgVsIFiPu3xwZdf8sLLL/PJV1+z0GhRGRmlVK6hwpCk5yg0QeCqIlYY0jRxRihIwiDGtaPlpefBVM3nkNbGaZIL6fjQDF7T36DOorN818jLvWcrNsg+h50fjJyfZcA39InDB+42nlQbTszMRdHHH++IDx78zyWia9udICrEtjBSNetKBR1ESgQgJpSyVxZKOi6WtHTImJVK9SpBEGbNxmhncWGiZS0yjBBB5FA5aftVACkFWJ9sGIPVGmMtSikKcUwhilyjMp6nJwRNYGZxkcVGg1a3iyyUUGGIlMpRXoIAqw0mGyp9emQ8D04H1yFXmvgHs/Z/r9G/w8vm4flD82Fg9pxp6x7h5VQsH21bKwjCCCMl8/UGC406XQYcp9S/NApDRkdHmWk2yTKn3yzAay67Jn4VKDcPjcapiSisECxkGaunzqze9skn/9n2gwf/vUazFWBtJC1VjKkk3SzodRJrdCKzpCe07wtKOx11vFFXyfsi6xkdJvX6xOyZMxgpCeMCKEmSZu6zw8A5dxpDmn3/svnZ1bLzKa/kfhRpmvrmvMHF7qOcF8nv8yZw079bgkC6ZDYMw8E+Ixw/WyEpFGLSxClViUARxhGhUnR6XTqdhFApKsUipTiENGVxbonZ01Ns37KVnz75JA/edSeXTThdbyyE0q2NaZZhtfamdwppcT+zhigM3DzxG6nxCYhUrooVAg1jOXjyFL97aRdvvPceIo5ZPTJCoVKi2W5jMRSLBcgMCzNnaNfr3HHdtfzy6ae585abWTE+1reRz3usrHFVTxUGBFLSs5a333uP3zz/AvsOHaJQrbJiYoJemrG4tITJNJViCZFpTk8dpxrF3HH99dx3x11s23g5oR2oUvnTdvM9irzbLBw5M8Ou19/gX/ybv+XAiROs37yJ2sQEqTH+PJz7cJKmYC1xHCF9tSCfE2fPn2GBCCny/ibHJ1dSnBUX/aDuIqcMo7V358b3Ejmnzu+5dV3SGGDz9BM4t7A7PjlkxjvA/MPRO/Tjjx+Qf/vt9/+dQ4eg0/nu1y0fBikypDTDihN/zO1xGdfPcxW11nQ6nT5yCj5A6iOMIHN0/OySYp5K9H8mnDyhAJNlgwCdYaqMRwuMQSlJEAYIH9gp4STHQiHR3S5TJ49TEHDfHbfzF08/xf233UpFScBgsoRABYQOgnYHJmQ/A5ViqJTUl0B052ssCKkIlXMtW0xTdr3zLv/6t7/jy337SKSgVqtBFDkHuDhEWEu30WDmzBniIOD6667jyQcf4J4dO6j3OijrEPrASyYmWjuOWhiigQNnZtj93vvsfvsd9h89ysiKFRSqVayUrhFPCKw2tJfqmE6X1ZMTPHbfPfz1M0+zemycUhCQGZ/kGJdQWGOQYYAMFPPtNh9+s4/nXn6Z1997j9lGg6hSpjwyShhFZKlTjQBLGDjFm8wr4gRKoUQwfFPPPxGFa0aR1hLHsZMq7E+JoV+4WOnZl3TdJuyGdh3n5KYZZ6Mlf6ynIi+CGpzpUXl0hK418tDRo6U4y0rKaNd8F0jiQBHlZWGsUxoIAkphSOjlzjJhEaUySRBw9PQUzTSlWCwjpEIb46vXLjSWvrnV+mqSzjJ0khJVq4yOjDBSLhPiegEErol2anGJg8ePc/rMDK1ewki5ShBFTgEkywikwiLIkuSs63e+8/7Dbzw/pvGHPsccgc3r2zkPvFgqY7KEYydOcejocebqS0xWa8QejVVArVJl3eo1nJ6fp9vtEsZeAxlXxbBioEefeTt1GShCInrWcvzokXLrxInbysYgdYa3nnGmPxgSo0lTTVdrelZjrCG1lh7Q63RJUo0uxJgwIi5XCOIIYwVZlqCUq3Bqj+L+0NF/fs/ik4OnswiBNoZempIkDhiwSl7yDfKek7gGW7deKqmIw5hCHCOF9DboDqXG4hpm80qUp2YihdsmpCUMJIESWJOxODuD6Xa58vLN/OSJR/n544+xZfVKFNDqdomCgDjwljTC0Q/7NAf/eYNg0v0gzTJvPOMoMhb3PH91+Agv7HmdV95+iwPHjzG2ciXFcpkgikh0hkk1JktpL9URScKm1at4+J57ePLBB1lZrbi+KcB6UzFjjAOXwgAhJPUk4eP93/J3L77AnrffxgQBca3mKJM6Q0pBqVjEJAm9RguZpdx04038xTPPcNt1V7OqHHrlLNfra6zpV4oC4WiXx+YXeH7P6/x25y6OnJ5yUrorJtFC0O46meM4jpBK0Wq1UEJSjGNXnR5qOAV8Fdv2v4fB8yuFJAzD/n4j5bnSkt81cpUfcFWrLMtIksQDdX+8iGsYBDnfyIS2Sgi9mU22s7CFaRNwERWBH+X4cXLIjYHmxSVizx3CWCkTIWSmhHu4h5vagCFO2h/4eN2bE4bOHKLb7fZRZPzn9/m84iz1kwu8Fzgucr+L+myOsbVOEqxYwuiMRr2OiiOqlaorYVqLMBopBEmvQ9JsYns9rr3uOv7Dv/kbHrjtFkaVJLGGLO0hjOPfCpUvGB7Ft56HllNULAQq7HO8kix1i4s/99ONBp988w2/3rmT1955m7EVK1ixYiVGCDrdLlJKRqtV2o0mjaUlSFOuv2YHf/3Tn3DDFVcQAbU4dginzkiF6wHQCIIgoqct0406e955j9+99BJHT08h4gIaJ/8UxTHSWtJOh3ajgTKGTRs3ctuNN/DgHXdy1cqVfQ5sVIhdl75HmYIoRHgVjq+PHWPXntd58/0PmV5YpDa5gmK1hgqifpd6pl3QJhAYbTGZIwpFYYwUijTRfWQxR07zUl+uQKG1RgHlcplSsTCkWnNh9BGRo+eAceV6O/TvaZaSpenAqc/PO+spHj80qLr477mAygrvwhiE1EplsiSh1WpS9+o1gVKQZWTaXfPUZC4Y85QGnSaubC4VaZYSFQoUyhVSY5BhhA0kGtA6RXk1GYEFMaT0YAUYS5akREHIxOgY1aKjJ1nj6sWpNhyfmuLwiRMsNpuYIESFbsPLMk2WpIRxEYQks/6iCTsoLgyXzIYXmX8XRw5QcvZZfleYftY1ySft8GTtlxDdj+JCkV4z5fTUGQ4dPsLpqWmqcYE4jtHGEknBSK3K2tVrKB8+zMzSEkEYIYPA9wtZl8hJOeBZ45r0IuVQ+ZOzM3w+NU3S7bp+Hy+jmdPG8gb6XLfZCs8hDkMyH/gWw5C4WEAph+DqzCWbSIm2kHkUs2+o9j3nxzAVsu+6OCyFKF3AnPV6viKbwfewLPfT2T0PXqFFBpJCqUCpXEL7yqiw7rOsNnQ6XQTOLl2FTotLZ5pAKcJikUBIbJbRS3q0G3U2r1nLTx5/gp8/9ig71q8FoNXtkXS6hMUiwvdCKaXAa2fnQ0qBsAN3C2MsmW+sVGGIQbCYJpyam+OVd95i52u7OTk7Q1AuYaOQRGeQuEb+Xq9Ht9XCdjts3bCB+++8iwdvv511I7X+J0og827bmdbEKkYLt9Z8uO8b/va5Z3nj3fdYaDZZt3EjWgUs1ZsoJSkXShRVwPxigwjB9iuv4vEHHuT+O25ntOD3cpvTRiypdgG/Ctwqf2x2jjc//Jjndu3i82++YWLNGspjY9hA0Wi26KYZYRwTxbFrzM8yTz900qE5GNNP3oz1oYZYHvv478MoohgXiKO4313/w2apS2SSJOk3bv+xhlt3TX/xzU2QciqTAFKZWWWluWZxmy3OXcue4igNGoSVyh/tuP7Q48cZkM/Pwz/7Zw5d/2f/zNd4vmMILEIZoZT93tyo7xpDnLb+x/VpJcKjC7JvH5trfP6+W7QQwqtE5Dzuwc+tBSvwvHjlHDW17itplIolAilp1BsszpwhBm689lp++tST3H79tUxUKiQWMJpIKpQK/HvZZdk2Og9GBFknxVpLWIoGD7+UBNL16i8kPT746kt+++JOPt+3l7BSIa5WsYGi0+m6zDwISLtdlubmXDB+9Q6eefRR7r/1ViZGarTShEIQOhRUZyRpivBlYSkEM4067338CS/t2cNHn3+OLJepjY2hcQt7ICVpr8vi3Cxps8mGFU5f/amHH+LaK64AcKi057p1e11Hx4ljwjCgl6Z8eeQoL766h7c/+JAz84sUylWK5QoISavddvQhY1x51183a1zwnbsG2rMEiPOqjQXw/HHZ32QF5VKJYqHYN1gajvfgwgtlzulnqO8gSRJ6fv7ZfF5YM0hG86Dcf8glzVN7bjFzWNZxOOXwDAS0tQ6hUAFBMSBQbq5kOsOkrpoTKVfil1I6alKSEEgFxtLudhBSERQKBFIRRLFraEo0Js0Qyi6ryrtzctgf3rkxCAJqtRpxFLvr5dGkzGimpqc5MzvraBCFmCAOsTjkUXt5PkfzGZTM+13+Q3do8N3ZIeu/K5j5hWaIOOdvw1XBwUsGyejAEG1o7tjBvwdhiEGy1GwyNTPDzNwcm9euhTgmyzIKUUilXGR83EkNJr2ECk57P8tVhLQLoA3OGEXgG9WlIstSkIqxVSvB2EHfhoBcEcmLKPd/bsWAiBT5KqQKQoyxdNN08Ex57qw2DqmXFy9tXXScj7Li0OGBcpi11iOTqW92c8Nglzsmn/Pm9HnZRhusNH0VqEKhSLlYpp6mZEnW1zjPm6CjKKJYLNJJe67HAkupVCQKFJ1Wk3azSWAMqyYmuP3mm3n4/vu5YuNlDqhKMow2rpHT+yRkHmGWvhrlL7lTz7HufqRZSpImLqkKIgSuR+nYmWne+uBDdr/5JvuPHaU2NsFYrUYnSVxlxBpiJem1WiTtNqvGx7jn9tv4+ZNPcPXlWxxi7XnP0iP0KghQUUQhDOgkCV8cPsLvdu5k157XqPe6Tj4xjEi1RknJaG0Em6QszM7Sa7e4/oqr+MXTP+GBu25jtCB8k6izeHcMDifHGklBagwnGk3e/uQzXn7jDfYdOkRiLCqOSa2l1WyRGUMYOffZNEsxWUYhjhwNL45JupAkbl92VDyJtZq8apg3QUovDWi1JgpCCsWik2dmOZMgl5A9pyw7/K1/jcARQ3q9HkmSoI32fXQC83vwE3KVvFyEw9qBYEK+xg8rAGHcuUskGGl78w3GN2/lnv/qvyJpt1Bh9IOO408xfpwBeZrCwYNc9q//Nddefjl777uPQ6Oj3/FLQluhEiGDTPUb1374gngpY7ikKKV0KE6S0Gq16Ha7fSRWSoG0Q4v8JQ4pJXEhplKpUCiVEGLA38Znv8Zap5MtBN1ej8xkzhhGWGzSozE7g0xStm69nF88+QQ/e/gh1tSqzr46TYmkcPJk/Ycw5ymeFanlJ+OjLQfO2j6HfL7X44Mvv+B3u3ax+623aCYpK9au9WikJgxDClGE7nWZOzNDYC3X79jOE48+wtMP3MfGiXGsNXRTDTi0y0rpDJA8CnVscZE973/ggvEvPqedJFRrNQrFIvgAt9Ns0Fpawva6rF+xgvvuupOnH3yA2668gkoYklqDwKK1JjWG1DughqFzbPzi6DF+u+sVXnx1D8enp5GFIpXaKBaXaHW7PQSCUAXeDRCscc2wQgoUDmF1Ml3LE8mBIZD7EhZ0kkEYUKtUqZTLF3Y8vchwgc5A1afV7tBqtwc80RxZox/7/FGHq07hpMIA5XmSym96Usu+4UsQBgRR6IJeY7CZdgG5NQTdDsY6tN1K6RuMFVaYwaKcf5gfEvqfZTJNoAKq1SphFPpjc8FVO804fPwE0zOzRMUihVIFpQK36VlXqjcm8823op9k/Hn8McYAaZfSUe4yA7Pzi5w8PUXnyivdq3wiWQgjapUqQRCSeLMhpZyLcaZTtDUEeTeglC5BBoSvzgRhSLFWQ6mgTwUZTCG/rpoheVfhuOiZ1o4CGARkmXMeTdO03wiZc4+NxVXOHAT9+10Z38w5zA+GvLfIkiaJW/ezFGz4/faYvMJmLFJBIKFWLjM2OkZj5gzdbodqOeivWSp0zrYG97k6TQnDkEhKpNZ06kvobpfVK1dx16238rOHH+GajRsoAD3t3HSjICD2vUjWf7ZFnMN3z/dWbQ2p0Q5wkaEDUYAjZ6Z4/f332fnKq3y2dy8pEJVLFMtlUt9kqHs9mr0uIk3ZuGoV991xOz99+GFu2LSJSA6UQcD3H3i6YyAEbWv58NAhnn3xRXa+upvTs7NMrFlDbWycRqtFGMVUSwXINPW5OZJGk+2XX85PnniMJx68l82jFU+DsU5Vy1oMwicfrsfmZL3B2x9+ym9efIn3Pv6ITqaZWLMWo5STb00zooKT4M1SJ/MpcSpngVKkaeqUbsRQwjt0/aSUGOucthWQ9RJsmlEplxmtjhBHMcM2cZeKkudmfxpIsoxOp0O313WUTyldAvv3tFgaT9eVjgtsUqF00m3bcN0qLr/pOmQU9Tn2/xDGjzMg9+ORd97h//k3f8P/7Z//c/6Hf/pPL/paK4TOlEwIVKqU7JfncxOTPxhifh60HNwkViogNV1arRbtdpsU9yBIKZHfhyqQl2WEpBAXqNVqVKtVQJBlKXlTqLEusHQyi8plqBZKUYxJEtqNBlmnzbbLNvLIvfdx/623cNnoCF1cYB9gzwrGwXNRBiVTKR0UbyxhHPrjEySpJhOWgpI0koR9R47wyltv8+5HH9NKU6oT41RGRphfWEACY9URdJJQX1yiPjvLDTt28ORDD/Lo3XeyaXKSrjGEQlKOChhryNwOShgFWGBJGz748ite3L2bjz7/nMQa1m+8jFaakqUJ4xPjtFotGgvztBYXuWzlSu697TYev/8Brtm+HRko17hjIZAB3bRNs92mUCxTKLgO968OH+G5V1/j1bff5tjp00SVCuXaCDIMabbbvtSoXDAeuGA8yzKMznBax27zShJnuBAEilyJRsrBNR6WFkvTFAJFtVymUiotD8hzmhPLUYz+EDgOpx1SXwDanTadbsdVDDxVJZfF6r+bGLw+//PC8/M7KAl22Vv6nxkGfciuupOlmd8EfUDtaQVJkrjmMmORFrQ0fetsKRyqlGUGdIYKPGKipOspyPs3+sGTs51WSnm6AsRh5IJ8HPdVA0utDqempqk3mhRLFeJCAesTNYElUNJRgaxFSoYUVobOcliUu09bOaeWdsGr+g9vDKG2nH3uy7893+YuBGdVjoZQLj+MsQgZUiiW6fZSZubmaXV7AH25VwEEKiBvorc5LUXm66L280BirSCzGdoYlDbO7Rgx5AFgsf4+ukc1/375Op838Gc2RSfaBUOZf+5D5foNLH3/hihQICxpqjnPk3tJ43zNnf19zCeWxhjSJKHXSzBeNSpPxF1F5yJtejkY6l8ggXKpzOhIjeNnzpB0eohSFYmT+VShk5DstrokaUKoAsrFAsIauq0WSbvDRKXC1VdcwZMPPcQdN94IQEdrhNbEUeiqsENVOiWVp9ade5xufXQqJFEYIX0wPttq8NGXX/L6O+/y1f79aCFZuXIVmTYs1euuWq0USVfTWaqzbmKcO268kWceeZRbrrm2H/u7JkeFtpbUGGxetQT2Hj7Ei7tf4aU9ezg9P8/qDRsoj4yQZppOu8NkqUK1VObE4cMszc6xbnKSh++7jycevJ/JapEUyJKMKHBc9yTTSN9rZIGZdpfPvz3Ea+++x/sff8rU3AIbLt/MqnVrmZ6doZelRJ7nnemMNO25ym4QghR0kx7dTs+ppQTeFMrzOIQUg5jHz2chpas2pykjlSpjIzXiMFxOWcmr/vn8O3dG+n8f3Kmkl9DpdEiTFGvxvRzutbkm+e9NFcDFcX2GgP+S0I/HlFIQhKYXBBlKkRpDd24ul7P5/Q8gH5dd9od7r/OMH3VAHgLVdpsoSb77xUJYGwY9EQaZkq4RcJA3wu+zMS4rj5B/6zPrPNCxDqXRWUa9XqdRr9PNMko+4DX9UtClDykdL3p8fILJyQkavZReLyGOi4PynghIM421mmIcE0qJNIa5mWlskrB142X85LFH+dljj7FlnePxhdCnONhMOyMEJfvlIaONKw9J1zyEz0JF4NRIrIYwcAosPWDfkaO8/PobvPX++0zNz1MZGwOlWFhapOi5hZ12i7nTpxFpxjVXXMnTjz3Go/ffx+UrJgkAaVwzpLDWodBKEccxIXByqc67eTD+xecsNJsUR0Yoj9QQ3S7aWnrdNouzM3QbDSaqVe665RaefuwxbrjqCsbDAGMBPaA4SBUQF4pUCgW6WnN4boaX3n6bl15/nSMnT2GDkFK1howix4mWAUGQS1K6hSaXntS+AUsal+AoGfYd0s43LEMbfJIg4phatUalVPoOx5xzh/DNjAzN0WazSbPZdN30MtdB9k/CWXFUTn3qF0TOkzjmy/QgaD9fcDr4xUGy6JJHJSXDCZ6SynFrhSCzmkxnaOMsz5Vw7poDpMelKMYYtMnQJu8LsX2nU2H7nAGwA5lPo31AHkUE3hdA4ubswtISJ06fZrFeZ2L1GlQYobVBa0fZCpQEr6kshpIpv3Ndwo0ZusqX6qbzD20Mo8pn/zCvLy+Lv4fMZsiDzeXXxhiLVAHlSoVeknBqaoqFpSWytWv6WtVCDKp6eQNz/nOXwQk/pweqEVprMpxLswCyVPuGNzGkqTzQVRZyWG/fH7F18zfvhQik7FMdZP93ctOVDCF+WCBgz9pnhnW5h9eUvELU7fVot9uYkarng5/rl3G+0T9X/+hGwOjYCJMrVqAOHiTpdvuqIxkGYw1J6qoChTimVIiQWJbm5kjaLSaqVe6+9VaeeOghrtuylQrQ8wtK4PXSjW+4dhUN5emR+ckODsxJ7FpnVy8cOBUCJ+bnefPjj3h+9yt8/MUXdDJNdXSMuFSi0emg05RSFNFuNDDdLmOVKnfddhs/e+pJbty61cn7Zpnb84TzytAAUlAQgkaS8M2pkzy3Zw+733yLU7NzxOUKldERUm3ppSnlUomk02V6scHSzCyb1q7liYcf4pF772bTxBhJlpGlKSqv3gnHzw+VJLGW+XaHtz/+jBdffY33P/mU+VaL8ugYUbHsdNWj2HH4jabRqGOtk2yO4tgnok5e1uKpdkHgQSCLEGYZAOlwDYESgqTbIzCa8bXjrJicJA6c+EPecPrdE9P/x6+BAkdXabZaJF5+VCnVdww9X5L1Q8eyBDlHrSz93rxQSkQcmaRcToOJCZbef5/j//Jf0p2eJvhDcsj/l//lD/de5xk/6oA819K+7NgxKs0m7VIJcyGlAyGMDaNEBFGmPB/tj1meH9b7zDcEZ96jaXTaLCwu0mq1KFQqzuL+UoJxQR+dFtaZyxQjxapVK1mzZi3NY8fodLsUCiXAoZ5CKTLtZKPKxSrKahqLi6TdLhvXrOHpRx/hLx99hGs2bcQAnTQjVm4jsVK55j8xpHHrQdllKIt1nGinYeqCcgl0koQjU2fY/dbbvPLGGxw+dYqgVGJkYoJmt0Oz2aZaqUGSMH/mDL1Gi2u3beOnTz7OTx5+kCtWr0IDXZ0RCIHENakYYwmUK4k1jeW9r/fy6+df4P3PPmWx1aI04nXAjaZQLNDtdJg/c4b20iKrxsa4+dpreeKhh7jzxhsZlb6hJvOsX2nRNkUFimIQkQB7T59i9zvv8PyePew9fJi4XGZsZIy4WKSXpKSZ4yIHobuPSZqSZZ4zLgVKKIyxPjD3evNw3k2x/zO/kBhjCMOQifEJatXaD5iHbuLkFUJtbT8hFJ4SIiT0282FWB4kfY9xoV8TZ7/A5559xXNrfbzsNsFcWtNxGo1XoxgERUa735FSIJWvdBk3L/Dv4fSQLQYzSGI8X1Lkx6I1AteHkd8TiZPGnFtY4MzMLO12h1WBMxZJPNdeSeWfD903nsmP7Xzp/ZBH0J+HH3myB0MBLee7Tst/mhmDCALK1RG67SYnT00xO79Iz0LfR024xNi5YvpGL2tchSVHYPPhmYLWo+nCU0uMr1ANhvD/94orQ8HvObKDQqCw3tvBIY/aGqIoIJACm6akadIPRM/NTC5y3YYpKSxfQ5btIdb2ZUybrRaLS4volZMQhpc8GXNlleFfGB+psXblKqIgJE0SdzX8mqGt7ZvkFIoFAinpNOt06g1GSkVuuf4Gnn7kUe697TZGw5AEQGsC4WT23GEbl3xLV/3KVaCGJR2x3u+CgUFSxxjmtebDr7/mhV0v89YHH7DYbrN6w2UUayP0vDqKo71lmF6PsUqJm6+5hqcefpg7r7+BEo6zTu5PIp0zKdI18KbA3pMn+N0ru3jxld0cPn6S6tgY5ZERMmvpdDtYA+VSiYWZWbqNJutWreLJRx7mL595iisvW+/udJr5IFzhwn3pexpgut7gs2++5blXdvPqW29Tb3epTUwysXIFqTHMzS+gAkUYRqRpQpr0kEJQKpcJwsA1t6YZ1kIQxqggdImgjz2ktYP1Ma/OCtcjliYJQsDqlatYtWLlcvAnBzXgIvNnuXGQATrdDq1mk8QrUSml6KXaiRWogO8z9y91DFLnQUNrKCSiUDTJ6KiWhQKNTpdD//ZvSWZn/qCf/f/XAXkLd9P/0//mv2Hs4EH+i//2v+XU2rUXeLWwVobaysA4fik+mMRrav9hFIJzdA7ORUDzxaPX69Futeh2OlhvbjRcvbnYepkH+FI4l7cIGBsfY3LFCg4eP0Haa5M3dWpXI3WNKKG7lfV6ncW5WVaOjnLP7bfz+EMPccXmze5zjSUwlixN+r8ThAPeYV97NfAJhMXRMZDIIKDb62GBuBiTAVNzi7zzwYe8/d57HD91ChlFlMbGyYwligqomqLXabM0PUN9do6tGy7j0fvv44kH7uPKdeucLXajiRA4So519IRisUikJM0s4/N9+9jz5ht89tWX1NttKmNjlGs1ejpjYXGe8fExTJYyPztLOYzYsW0bD9xzD9dvv4piH3xxDVZKOJfFXpIShRFCWE4uzvP2px/x8puv883Rw1CIqEyMUyhVSHopaabRmaMCZV5iqpf2QEAYxwReqjBJUox2XfpCOAvtPBBwBTfAUyCcBrNDiqVSrgoyMU51OJMfjmj6GPVg/tnzzD9wXM16s0mr1QIpvPqERPiIfDjR+q4hzvM32//e21mf9Vrrg2clpdczxktzWfcwG02G2zyN0a6SoCRRGDpjJuOQOIEzGJGejhOIACFdAtSnJhjdtynPVWvMMB/YgkQQqKDfvCeApJfSaLRptTokWdantxnfjGswWJPLfboAwmUYavl18YG4GLpNrulzGHP6w5g9/ZjGsnM+a9j+PLH9qkyfZZEjbPl7MEC9bF7ZtiClIogLtBYXmF2Yp9l2zW25+zF4hNyXo3M1qJyilDela2sQ1q2jjjNlvAuYJZAKg8JiXfUsRxWta5QWZhCMu/XWOK+FPFkzTpbVCEG310EgCAKH+FrlkHsB2NzX4XtuPjngk8sfyj4aL3zDqFd+UYp2u83S0pKTAvUfJcXw83r+O+XcohUiR74ElIslJsYnCILQn+9gvXBrVbGPmnc6bZqNJnEYsm3zZu6+/Xau276dShi6SkGWkSsg5UcipXvW+wZ6AkzmQZhAIaRz2EbkrsAOS1hqt/nim2954+132Lf/AI1Wh7hSpVytYYR0RlBKIZWrEFdLJa64/HIeuPc+rr3qKkKg3e1AllEulhEqN3Fy6HFmLacadd7/4jPeePcdDh4/SlAssWLdarSFqdPTxHHRNVJ2erQbLUbLFR66/0GeePhhNq9djbDQ6SUU4whp3fpmrEUG7jyamebQ8eN88PGnfP7118wt1SmPjjG5ejWVWo0zszPMLy25hs2C61WolsoEgSSKC/S6PTrdrtuPleu1aHed8k0YOoOgXH45R4+tAaHcfEqzjChUTExMMDY62kfHja8yivzBvNCMsXlS6v6uLXS6rjqTDpt+5TGMHDzrf8jhvDnzmMWBN0pJKMRk5bKTSYijf5AoyY86IO/3BWQZV77xMdH/5wNYfRWoFjy+FdYPEEWL0BqVWSuNtAbjoRHrF2m8k+UPisr9Dr/sV4XwDlLurkspCaMIIR2HuNXp0E2SPsJhcZNHwJAU1vk+a1CeETh6yWilzOT4OEoK10SklJe7sxiriYIIKWF+YY6s1WLV5CSP3n8/v3z6KW647DIiHIctEJJAKrSx/WJS7gSan1NexswbbvrKAdZgZY5MweGpM7zy5ls8t2sXn+79GhtHlCo1wiim1e1SLpcoBEVOHT1K1mhxxebNPP3wIzzzyCNsXb3aXTMLYa4OYgzaS1hEgaRtLJ8dOsqvX9zJzt27mas3KY6OUB4ZoZdmaGvc4tju0G7UiQRct+Mqnnz4Qe695RY2j425DTF/YGWexEAYRmgZMNVY4qW33+Tvnn+eL7/ZT9fC2MpViCjyaOnAUMft1O4GSSFAOak0ay3auMYdKX1ZNnPomzOryW/rwDnTWqfW4LjNkigMWDm5gtFysT9Xlm3il1hcMUAvTWl12rS6HTKtUbiSvLbuGJX4/dap7zqk4UVd4BZmRx3Jr6MLVqwxLmmR0kt4+XlgheuWz6+CyYO6AVLnpNg8mp4nLtL9DJ036Vnne44gDKNl7rdpmtJut+n2ep6eJTy9YOAlkHg1AuHVX/Jn45xz/fNYPi52US6CvA2/QEpn7NPqdDgzO0ur22WYiS2lcI3ASpI3Peb3TQQKpTwVwTgviDAIUYHEovvrG9Jbdlnr9cfxgMCw1sdQQp2vBdLVSbRxc0sq10ti/M+0dVSDMFSDU/sBe4709I5hHnkftffVtZxa0+l0WGo2yfQgIL8U4AeB7+8w2MwiQ0m5WGB8dBQlwPSc4pFQbp3L0oyoGBNHIc3FRTpLS0RScNP1N/D0ww9y9y23sGF83FW9hHDGM0PVo9zgTA5LHFpcku3/3dEdnGqUr4Ew12zy8Zdf8vyul3n93fdYarUZmVxBaWSEVqeLlZIoCOj1evS6bWIpuem6a3nm4Ye5+6abWF2r0Ut6fVqkRXurDdewnQFH5ufY+fpr/N3zz/P1gYOYMKQ2MUE3zUjTzFEcwxDd6zIzdYbxao0H7ryTZx55iFu2O3O9JE3QuTKTkP25JIQiAb46cIAXX32VN9/9gJPT01T8fmaAhXqdTBuKhYIHcoxbC/PqRJr6xl2ICk73Ps0yjHX00UApstSQaVdFtBbv4OoQ80ApdJqisYyPjjI+OtLfM6x2QIQYXrzPN2ewy+KZRGtHz8kydK8Hceyafq3xvW1hH8n+YUNwNsLep5WRP7vWV2MlslCyCZiZ0weYfuU36F73B37un278qAPyZePYIvzfdwEfwEQRsf6XiPU1SFJMFBJoY0yiMww6VK6Bz1jT15Fdjih+v8Dc+kVw2cLovnEbtS95ueDCZa6dbo9mu+M0jMkrQhee9P0FVNCHlPJXVYtFJkZGnMFPmjokzvOopHRGDFkvpV2vs3p0lHtvu42fP/44d1x1FRboZU67VHnTm0B5GaBlZSpn8AAuGHf8XJd5G2tJM00QhRghmEk0b3/6Gc+/8jKffP0VLa1ZtWYNQaFIojU6zTC9FCsEvUaTy1as5MmHH+anjz/GNVs3ozVkmSUQUCqXvKOd4/UROHTl68OHeeGVl3n5NcfpXrFmHaPjE0gV0lxYolCIGalWODN1CrKE6666kicevJ/7bruNNaNj3vYCjDZOeSNwZWptXVPnyfoib372Cc/tfpUPP/8CEUWMTqygUqvRaLbRmSEOQ4QSKGeK3V9ohZRYX3VJ+/QVQRiFhEFIapO+lbGTGnQBY06jEsKZkKA1pThicmSEydEaJc7D57N4BPD8kfTwfq+BTrfLQr1Oo9UGofpJg8kVDcQwfju8Ww4WuvM9GxdVLBp+vcgXS4NOteN8e86tULLf6OOKBMJVY6REG43RA3w1/yNXWO/LRvpytjADfNX6+Ws95toPYqyTvRvSywAgy1J6vZ7jqsv8mAbPnPESlgGOv2qXbQPnOedzLsUAyf13ZVw8EfuONM36pXLZv9v+XrscJ/GVF+sCnFYHuknq0F81qDaIPAET9P3VXfDh5oq2FqtNP5FyDaE5zWmA3g8HrxfbEvKmbdcPocmbQYWUBFHkuNHWkKYZBkuxWEQIQZZk3xkcX+oYps5gvcxrFNLudphfWqJrBmoS+Wde8Hk2fi+Sy5+PQhQxVqtQKRYc4moN1rqmTgToLKWrU+qLCxSFYNtlG3niwQd56uFHmCjECGPo9noUopBCbvzjj9nkT9JZF0NKlyDpzMmNGulM7TIgAb48cpRX9rzB62+/x7GpKVasWcPKteuxQcDR48dQSjFWq9JaXMCmCSvXrOH+2+/gsfvuYzQM0WlCr9OhVioShyFZkroET7krdHR2lj3vv8+vnnueDz77lNLYGGtWriIulThz5gwSGK2OQJrRbbWIMNx2w3X84qknuXHbZipAB1/ZQThVD+mSNYGgYS3Hpqd59d132f3GGxw7eZqwXGHlunUk1rLUqNNstahWq4yOjpIkXax2YgFaZ6464RvgoyiiWCjQ7SV00pQ4LlCIYsg1uv2Nt0P/A68+BRTCgPFalWrZCwhYcDKJYlDKGiB0y5/snL7q72pmDPVmi3qrBcqpoeX7zPC7nDv5vuNpsDlQ6J9rO0xSGUrM3Ybgkm4lseWKWTI6O/i//r+p/4//A7IrHONeCaPNsJLSj3f8wwnIcQgWKFSvx+qdH1JZOIpeSlizaQUb1o5STK1pKmlr1RrNpUV6aY9Cueqs3bXpW5Nb+/0WyDz47t/PIf54H+HzSIUxhpJvMJmanWfTZRupRX5uSQlak2mHcoucV9c/RdvnYaVpitWuIW3lyAgbV69GeWmpNE1IEBgpqFUqLMzOsjQ7w0SlzN233cpPnnica7dcTgCkXoEi8lrP50k6zz1fIQkCZ7KRZAYjcLw2IZheWGTnux/wt88/zydf70UUSoxVKhgV0Or1UEHAiokVLExPMzM3y4rRMR645y4ee+B+rti4nhBIs4RUGwgUgQywwpKhKYVF2lnGNzNn+N0ru/jtC89zamaGscmVjK1YgRGSbrfH6OgY1qTMzc5w6vBhrt1xFf/kL/+CB26/g7Wj4+i0R89qimGMVb6EJvJFXtAC3vryK/7Xv/0V+w4cIC5XqY2NQRDQbDb9gmHpdrtO/1o6RWHTnzQuw7PGIq3sNyjmPFW3WUqkFCQ9pwdeKJQwGNI0IYoiOq0Ws0tLrBwd5YZrr2a8VnWatV4v3JX3hxfJwVzMb53Ngxn/Mg00eynfHjrC8dNTTKxbhyyWSFK9vC8AlqldnDcBOGuKDP9kmPzlEt1lvz44Ph90C5zqkcEgrG+i83PR2Sv75klLf+Mx1vaTnvxNla9MZFqTGWeOIbw+v8FXrKRDpgwWijFWQr3ZIEl64FWC2u0O9foSQgjiOOwnENLPfZTTmDYGPGuWPKtfHpjb/nkOrpLsb4J/uJamP/1YDhFcaPkYRNbCAwvirJ8PXjl4r7xIZy2uGoELoMMwQChFo92i2W5THnEV0cwaut0u2hpUFDp02rp+GqMtQmcoATbnimuDtk49xwpX0bLG9sGPvj4/XpaOwfru4psBMu2ACq/WIly1B0SfgiGV74/wVaEfOgOG+5LANaUON2tmWUpciIkmJ1hstTh47BiLrRYbPOKq8ptkh9IBwRBf2zWDu6ZlP++BUhyxdsUkV2zayJFjx2i1m2RCEBZiVo6NMTt7hqNHDhMYy/XX38iTjzzC3TfdxMpCjAC0wXkz5FQdBKnOyIxTAwtyKdjzTCAh3A6fakshlLSThK+On+R3O1/m+Vd2s9hqM7pyFdWJSRqdDkmmmRifIEsTGkuLtJt1rt66hZ89+SQP3HoLk2HozY2gViqh8H0EQUgsJT0LC6nm9Q8/5l/9+td8eeAAcbXmgn0paTSaRGFEMYoIgEMHD1KNYh69717+4qknue2a7dSKsWOJG+OafIVz+dVIP5fg5IkT/Orl3ex+401Oz8xRqFaJyxWSLEVbS6gE5VKMFMYF4152FSsQwqn1IHzjsHCqVNYY4iBACdBJD52lbj0LA4QSGCuQOF55liUkPUO1WGDj6jWsX72a0VIZ5RPYvDGZPjAhlq3jg/vjeP/gAvwgCvnq22/48ptvmVy7lh6wVK8jhKQQxb7nTAzeNp+E5xnDEhzWfyOkdAi+pS8M4N7THXcgJUI7Y7lqHLNQLGYHrE0aSwtUDfFVm4NgolhMFxORfHWkRaOdnfezf0zjx0hwPAuKyofE9YFXkali7POjrH3xA1bt+ZzKqVlQymptdaBCXSgUHAqWJH31kMwYxwH+IWlSnq0NjXzi5AsnOEMWFQQUq1XOzM1z8PgJWunQJLjAmfXf0zo0XihHtTEeXRmvVNiyfgOXrV5NqVTqW/sGgaTdrJN2WqwYqXHnzTfz9EMPctf117GyWCSzFqudCc45ZkmDZ88FMCZzyGDf7lmAdyqTSmGl5EwvZfdnX/LbXbv44PPPaWQZxdFRKuPjoEK0gSxJSdptus0mtbjAI/fcy188+RQ3Xr2dkShyVsOAkGCFxuI2GhVGTrHl9An+dufz/GbnTr49epSwVGJy9WpUVEAbxzcMhKLbaNNdanDFli08/fDDPHjXneyYWElNSkKjsVmCNRkIw7Ac+Fy3y54vv+Dvdr3Mmx99ynyrS3V8gmK1hrHQabcRUhB6ibUcY+gb3VjbXyQcyiQIvA68k/pz9sH5Bq68qoibL05nOQhCkiShvrjAqslxrrnqCkY8XUUY43a1/rwaulEXnDhu4e9pw+zCIsemzrC41CSIiwRh1Le7HgrHL/xeF/6Qoa9LHH4uC8+TMRZHffLoqAukdF8thbwkn4dxLotd9uy5pMI6RAjrqSqOVuXYST4Yl4IgDtFWU2/W6Q0pNSVpSqvb9bQip+yD8V9DfF0Xz+TJw8VDq8GVybGoH+PS+vc7BN81e5e/Ik9nBBqBRilnMtLpdul2B+XnTGuarSZpliAjhfEKIPkzZz0lT7lCtivfe7MnbY2vlFlv1HL2EQ2rmeTzzA0XzLq/S6W8K+eQlCgCJQICEWC9AtMPHec0Ovqf5cM1g0dUyhVmFxbYe/Ag0wsLdBnE4SY/weGT9H/Pn7NB1detcUVg7eQE27duYd3qVXS7bYzVFAoRSbdF0qpTjgKuuWIrj91/H4/ffy/b160hAmxqEMYSBw7EMEBqrNuH+ncXb7p19pW3uFw4QIURbeCzw0f5N88+z3Mv7+bY9AxRpcrYylVYoUh842AYSLqtJt1mg+1bt/CLp57k548+yo61awkBqTWBEMRh5Ncg23+2T9frvPr++zz7ym4+/PIrutoyMrkSFRfItCH1vUY2SWnNLzBaLHL3zTfxj376Ex669RZWFJ0KmLEGZXO1J5zxWxDQM4ajzTY7P/iEF159ja8OHCSTkuroKFGxQKfXIU17SAmFOHTUpyz1jcpuTuUuskK4L2txDcNGEwUSZQ0mS90+j5NxNNZgMCAhDBUmy6gvLDBSrrB961Y2rl5NNZ+xedVefMce42aJT+Rc+NxKM/YdOsyh48cpVWuUKlV6eXOnDAaR9Q8Z/lDypdlaATYHRnwPhRAYrbFeqCLDmIaQKZtuYuV11zC5YYstlorW6BSsuZQT/JOPHytCfpHIwTXFZZUipibIeoJ3rtpEsGOLfejQgq7JyBiTOcdKhDfSEYgcvRTCmUZ8j3E+tYxhlZU8oJBSEEUxCMns3DwnT52m54Nqx1E0jv8Y5Jd9CL0gRxPdkEr2kaMIWDE+zjXbt3NyYYEeljhyXfBHjx1jxUiNe2+7lfvvuIOrr7iCWEoywBpDIHOd8eEruHwYo9G+YUmp/CEQaOuQ8UDAorW8+vbb/Ob5Fzl47BiFSpVquQzeTlopRSGKaC4tMHviOGOlEnfecgtPPvIQN15zNZEQdNMEqzWFqOCdyzQZlgBJIODI/Cyvvf8ez760kyOnT7B6vaOpCBXTaDRQoWt0WZpfoLEwz6qxEf7p3/ySpx9+AJllLCVtalGRaqmE1hlZlmClQgZOb7ULHDh5kr/73bO8/9EnlEdGieICQoW02h16vZ7jr+blac9LNdZ4NuPZ82a5tGbefS78NcVYwjDCCkGn2wMliKMAgeO0lwoFRqtVRsoVYnkJgofnXdtE/7BanQ4zc3OOKx7HJElKrjjkkoSh3zlnp86x3+96Ns49iLP3+2VvcZ5F2Z79ueLslwzRTsQQlurREYHwluX0S5bgaDnGWkLyIB20yUiztN/wxtDxaeNKwjkFwHiag/bPu6MnuUziYk/Q4JyHawfnXIR/uOOCh3+R8/ohuAdu3QuUl2PTGTrv/Rl6S6017U6bXuo2f+sDrRz5dbnxoPHZob8DNSyBX2tF3rDp5qTIayv2bNlAe9afgz1h2bwYmuv95+h7XofzNWqf/2eeN28N9WaTmbk55paWaAMV8Noe56rODHov3POfo6MWl6gEIqBSKLB6cpKJ0VGmFxcpFQoUo5Bv9+0lkoLbb7iBu2+5lftuv40142MEeKqd8OmocHQCbQ2ZThFSuX4MQOsMnWmHogeqnz1Yv6+H/lz3HT/Fztfe4vldLzM1N8eGTZuojI6RGMPS4iJjY6NEUcDM9DSzU6dZs2Kcpx5+mJ8+9jgrfXO8sY52KC2gteN1B07tZDHN+GL/QZ596SW+3LePkfEJolIJwpDZ2TnCMKBULGLTjMXZOWSa8tBdd/FXP/kJ1121nUoh9j1uxqUZEtfYiOtZAFjodvntizt5/uVXWKjXKZZLRIUCVkrHu9aZ9/lw1CoHmuW9A+dOn7zikE+HXGFEKen13F3vROYTTyEEcbFIt9djaWGRibWr2bRhPePVqn+nfmQC37nuD14icIIb07MztLodNNY1l0YxcVzwa6n2SkHnJl6DvebsMxy8v3An6NZ3O3hmQXpeve838CBrlmUk3bZASrZd/zgbD/R6Zz79gBP732Z6pi1wsa7FmYv+aMePMiCvgv0LsP8xTrWKc3ZAi+52oa7DsCdj20s7XdDJ5WMdeWhlUiwUCIMAkbmGTikEViqsNs6g5w+4Pw53wgshKRRiUIqpEyc4cOgwS40mesUo4OIJATn5yS1EZy22xpdlpBKIIMBikQgmR2pcu/0qvjywnw+/3ouMC1TLZWpByA3bruTRu+/llmt2sGliwpUrM2eTK4LgvOie9QijA/8lSjlTGwcUGhAOgZfAYqfH+3u/4dmXXuaNd95BxDGFWo2wENPJNMJowiCgl/ZIux2UNdx87bX8xTNPc9OO7Yx7ZzIjpUc8/TosJApBD5haWODXO3fyty88z9TsApXqGJXqCElmsLpHGIVondFqNFiYnWXdypU8fN+9PHTHXexYuY56r03oKUl4tDQxhiiIAMlS6syLXnrtNd754APOzM2yat16Yt+NbVLTl4eyxqJzewPj769S5yxZbtE4O60azAtrXSXD4Fw+40JEHIRkSQ+TplRKRdatXcu6tWsphGH/PcU5H3K+xdL2/y2/vfV6naMnTtDt9YgKhT5XPNfBH7bc/n3GUA3ljzKsHXT+Qx6QuGYva5xmvpIK7bm8+UFZO8RfzKlfWebR1HTZB1g7qJYNO36e78r0G+nOPs7zHrz/nR926n8eQ9XIfonaLRb9lyRZxvzigpvncTQUxAwk34zJ+tUO16Ru+rr0OfCR9w/Ysx5iO7TjnL10/n2nVudDyF0zpz83Y+l0u8wtLjA7N0er3aZcKi0/Vp+4Wh81O5DTURKNNo5yJ72nhoKClGzbtInLN17G19/upzk/T2A0vcU6GzZt5M4bbuTB2+/kuq1bKfrGda0NCidTmh+yxFUPpfRt2p6WFng1FNcoqn0viVOm6lk4PDvLs3v28Owruzg9N0uxVqE66dS70iRzfU06Y2l2kZOHD7Nl0wZ++bOf8Ni997F5ZDQnmfWVl3JutZRuje0AH3/9Nb/b9RLvffIJ0wvzjE6uQAYhVjgPAqu1c2ZuNIgEbN2yhYfuvY97br2VWuQAHoObn67y4qprURAiEZxeXOTl995n56u7+eyrrwgKBQrlEnGpiAEyqx21KDcjuuCaPHT//X+Xp/q2v38b6AfkFksoJKFUdHRGo1FncmIHV115pQPSLvJRw+v72QlBHq80Ox3vEbDo+qh0RiyLSCXJEictKZWvDJ8veT1rLPucofUYvw/0m4P93LfgvSkMVikolZksxM2tUFqviu3QlsqtlrbClHojwUjWzJo639Mn1mxFycuYOynRo1W4cgzWVODadTAWwr/63+C99y9ytH+88WMMyG0F+I+Au/P4pAwn5YjNWgJMgpAQT45ht5VEPRFhWisnRRABFINyGKnI63PqxGvTCkJf1s675v+gB5yjM0AYOc3jeqPF8ROnODU1TWPTesp9gzL/WOVlO7U8BLPWmUoEvkkif305DNm6cSNrJidpzM+RWVh1xVVcfe31PHn/g9x1/Q2smxglxuvFWuMRW//evhw/QHDdcSslnEZzXzHELS5KulTSAB9+s49fP/ccH3z6KUudDmPlMjIIyLR2yVGWYtIe3WaD0VKJzdu28ZPHH+GBu26n6p0RBY5baKwl9Tq0Vjjt14NTp3n7o4/42+df4KMvvmLjli1UqiNkqe5TSEqlMp1Gm7TdZqJW5b7bb+MXTz7J5avXEADVuEiAcB3eRpMZCyJAyoDFbpdvjh7mhd27een1N5lfXKRSrTqHTutslqUQBHGMtTjbZbTnb/ry2PnvPBfFlIVLboxHzgLp7OLrjQY2y1i9YgXbLt/MhrVrCcPQI61i+RsM38P8R8PoydA/Tc/Ns//AAbpe5UZK4X1S5LLNPEeg/1Tjoguzfz7PeY0YltNylBKtvRb8Wc8PeHOfMCTJUuYXF5dRHnJqjMBdDyllvz+gzxv+DorKuQf+3ef25/HdwxiLEc41sa+WZ5df11a3x/TMDJ1el2KphFKDgFzkCI61A+WdfkEof3CGIg+RBwDfHRD9WIcKQtJMc2pqivmFeVaXSn3Qoz98wiryJN7/0BkYOUUTh5M71Hzzxo1csflySsFrnJiaJsw029Zt4L7b7uCOG25ix4YN1HwlNtWOqiICMfTcuM/qq2hZ4+V8hVdZcX1dmTUoVP+Y9p04wa633+E3O1/k6wP7mVy9mur4OFpAO+/RKsS0G3U69TorR8d48oGH+ff/4i/ZMDHubnWaYZVvvvfNq9ZLKM51u+w/cZznX3mF3W+8QaPXJSqXHf1Ia6Rw9JFOs0nSbKG05torr+LxBx7g7ltuZLIQLVP8yelQmYVCHJEhmG23eOXdd/jVc8/xzYEDJNo5dkZxjFQBadJDG9untgjAZNpJZV503VkeKg/CXGeEaBjIGCqlCMKQLEvJkpRCFLNpw0a2bd1GsVAcep/zodiDsRwcGvyt0Wxy9NgxFpeWyDmheSC9bK+xgyM99zwu8Jk+gcQyoAHh4pccn7L9PEsgwsCqSiVbGxezHVCaLwe2OVmKR1aOZmNrH0jrJuPway+Y9uw0IBhfvYUouJvFUwo9sg5u3Qy3rIVntsIE8NXnfw7ILzAsYP+nm+7i/zVyG7N7FDRPCxGPsuLua23yj29IvtQ6ERNVrtC6MDkztyqaOjOWWVey0zojTRNsYFFCDaTvzMUnxNljWXc7+cK2/MHJVR2kFMhAYYWg3mpz4tQUi0sNKmNV18RpBu9hLCi/KQymXR6gu4fOmNyoRDAxNsrk6AixtZg0Ze3EGI8/8AAP3nk76yZGKUrnaJgkKYFUhKEr6+dIk1ByKHjJg7KBWXtmjUMXgoBACBaTlMPHT/LS7j3sfvNNMiHYuGULBkuinctksVKh026zODdL1umy/dpr+MVPnuG+O3wwrjNSaykEIdZYEp3S05o4igDLQrfLe59+xq+ee57DJ05SGR8nKpXRQC9NiOMYgG6rRXNhgZFKhdtvvpknH3yA67dtIQoUHa0pKIXCkmpDkmauTBpFSGB6cYH3P/6EN999j8MnjlObXEFcG3GmRN0ORmuKhRJh4LrE0yRxiEogUUpgpT1voOhCwfPhFrmxh3ROgtYQByGFMERYQ7vRoBgo1q9by+b161kRx30TrAGH+jyB+NC3Q9LBbq4D0/PzHD9xgm6aUiiVnESl7wP4rhl/8bDDnvcF+Vr5g0OW4VI6roTqHyMGyP8wig1Wa6x1iVKfBCzdop9z0/OFWypF0ktZXFyi0xtwyPNGbOHRVJG7LUrpmgJ9kDZItM9Nuv506cy/u8PigQo54PHL88yuVqvN3Nw8SZJQrFZd81euQS7EsqfS5cLGu3J61BTIfJKcc8b7Slo5Wj408sqS+a4J/weYFMsTZy6cOPsAGyGo1GpEhSKnz8wwNzePXLfeFxXE4FgFCN+Y7H+tDxDlgZ2Lg1ylcKxcZs2KFYyN1Ni//wC2UuXBhx7imcee4MotW6j4NTrppSgrfDVVLDu+/gUZrl745tdempJpSxAGREqSGsOZdpvX3nuff/PrX7P34CEK1Srjq1aSGcPc7CxBGFKMYqSA+vw8Y5UKjz/0ML948nHW+2C8l2aEOEdWayxpmrkGe09VOXDiBL/b+RKvvvUmM4sLrFq3ntDTOgwWaQ3SCnqtFqQJl61Zy4P33s0zjz/KurExh0J77wIhhFOO8c2qIYLZRoP3P/+Mnbt38/HnnyOLZVatWYMIAlQYDnrZsH4NEv17ma81ffGFC80RIFfFQoDBOQznakNIQRSFFKKIxsIiaS9h1YoVXLZhAysmxonCoL9/WIY55OcOMfSZw+SWVrvFyVOnaLXbhFHkKITW9XfkiVdfUcsOlFku+AEX/Qd/pN4sCgPWn6sIAoKoIMIwDqvaVkvQfv2qdW0lH2r/rBbRvm4HH6pMmEOfKWanATJjNNr0sCiwbUia0GpAVwPqgtfi72P8iQJyCZRx7Oj8Nvv87ubNtO/ewm91xmJWYIoxfiNL0SGzSqz95cZkulexycYa5oEdTIyVyje0GxvGF+fXbJlbuHLl6amrZ06dvG2p08ZKSRzFrhxnrTch+eEXur8oD3FRc3St79hpvfU2gmK5QmI0X337LTfu2MZlY1XyvgSddx/nD9A5lydfSH1pHWc/vnpykqu3buWma67BCsH9t93Gg3fexpVrV7kraJz+p8odDvOGdr8A5Czl/BxyN7gsS0m0xirH9QuBpTTlo7372LV7Ny/u3s2ZhQUmV6+hUK3S7LQJI0cJ0GlCc2kB3euy44qtPPPIwzxy5x1cPjaKNobAOu1razS9JCUxhiAKsVIxtVTnrY8+5lcvvsR7n32BLJaYXLWKTqpRmSUKI8LQad7Oz8xQLRa566Yb+fmTj3PfTTcwGYUkxvoEy5Jp1+gjpSKOY1Jr+ebUKXa+/jovv/Y6B48fR4QRYaGIVIper+ful+eM5jbcfeTU3eQfhCYL6VVWkgRrDeVygUAJuq0WvVaL9RvWcf327Wxa4xD+FN8c5D/TvQkX3OTzfxJAai1LScqREyc4evIE3SSlUBsB4SoGrjStfcVkkID92IYd2sSFcnPeCve8hL4Z1nhOv9a50dH53sj9QxiGJGnCmZkZ5ut1wHNdpXR8TYAhdRXvFTsI0vKGPv9+P86r9u/WcBUlOdjQhSvrK1/+7gLzi4ucmZulmyTUCgW09XTAfjK7fGRaI4316h8uiMqDRKBfMcl7Cc6bfP4Rz/mHDIv1vS1QG6kRAPsPHmT/kaPcct11FMHxmnXm9gM5AGOsrys5feqg32OkhOs3UUAMbFm/ntuvvwHbS9mwdi1PP/wQ991yI4F7a7LMgLYI7/yc71n9Rlgf6OX7bm7Gk2UZqXHV4UBJEuDg7Bxvffghz73yCvsOH0bEMROrVzt6hzEEgSJUkm6rRdJuM1apcN/tt/FXTz/ObVdf5QjCfu8NpcRq2/eRIFDUtebgqZM8t+dVnt29m8OnTxPXRgjKZVQYIk2GsJas16Pd7hBay7YtW3j0gft56r57uXxsDPDoM4IszTDCIoOAWAZYYD5JeO2zz/i73/2Gdz76kLbWjBWLFMolEm0wOM6/yQEX6+mh/Wn4w3R5jLXOOEsEDhDUA6GBhdkZCkJyww3Xc/WVV1DzAFdmrFcRvcgmc56h/b2fnl9g/8FD1Jst4mIRFYQYa8jSXNTg+za127O+83NGij6LzSUF3lfGc8njUgmCgKMzM4T7D9y2thD/X24cHzmiAg5ftnnziYObN011amEv+Q//g6y4dSvr04CRWRPVj5wR2ElHodAZZD0wGXAJvVx/xPEnCsgVsAKo4UIR/J8JPPUES//1P+K/o8V/x2XARlb+838RXXPsqNrwn9ydfXHZZWafpdxtUtj+0YHrtn/78T2FbucmLcS13SxZPz11OppvNrBSUiw6lQmjDZnX1c6Rl+87EYdHjpAPc3Jz/mqWZSAktZERJJL9hw5x9PQUt+24wvHOrCXLDEEecAwdRY6Q9nmP/c8zBEJRCwJ2bNvG4w/cT6Va49YbbmDDigkATGaccYCEKIr65+ecISFHXK11wZmUyvObLd0so5skxMUSFmgD3xw7xqtvvsHzr7zM0ekzrFy3nrBYotnpkKQp1WqVKAyYPn0a3e1y2erVPPnwQzzx0AOsGqk5Td5eh1Ico7x+epYmWCkJgpC5bo+P9u7jdy+/wnuffkamAlatXEV5ZJSp06eJgoBypYJOEnrtNsparr9qu1ORue4aVhQLtDTEno6UZdpptPvGWgOcWqyz+623ef6lXew/fhRRKLJyYoIky2i2WlggCJxWrNYGnfUAP0eGaB6XMpYh5R6BEtJJ/bkyaETa7dJuNIiVZOO6tVx9xRVMjI87hNtqlLX0a+75vT/P+izO+kqyjNPTU5w4dZKl+hJEBZcs4eTXtDFYbXwDkfXHetb8t8v+8J99/vO/1C3jh7yub1gihZexc0lWKS74HgFXZtdZ6pt8RJ9mkq/cOVIexhFZkjC3sMD07BxLFkrC3fO8sdqYgWZ5rmE9cP38/fn2fx6XOMRZf/ohGdwvCzSNYX5xgXqzSZY5e26TOQ1mtx5z1rJuMWmGkopioUBgHTqbGI0VzoDmwseUB7AMykH9dz330P8QY3g/yf/e/8yzjsElIVAoltG9LsdOnOTbw4eZmp9n3fg4MYIkTYkC5z+BHEZi3Xu79c+9r/QN4PmnrJuc5P7b72DD6rWsnBjjuiucAY7GxdzCuoBaDYE/WIP1Blv5zXB5kttztc7opSnWI8YpcGx+njc/+YTf7NzJ599+Q3VygtGJFYRxzNz8HGEQMFKrkXa6tFstTLfLzXfcyc8fe5RrNm+kADQ7CcUoIApdo2iaZWTWEhUi2tay/+Qpdr3xOi++/jqHp6cojI6yYu06uklKt9MhEBJhNFmvR9ppsXXDeh69715++uhj7Fi9hgx8IuLOKzWObhMFjmpYN4b3vvyC3+x8gT1vv01HG9ZethGkopekTn5Yucq5kBLhZcMdIIR3dj4rMfST67tWIIujqbrL7MUgjMGmGe16nRWrVnHrDTdwxaZNTnZYu6bPQCpfQc/TgPO4mQ8dhwQSa2kJwfHpMxw9eZJOt0uhVEGpgNRTXgNvkDeYx6JPPfkuCXLIH7VcMtGv6cIlLw4l99UcAcVKGas1e48fx7z19nXbTpy89j6lTlnUO72o9E5n3Yo3C2uu+Mb+s/9zZ93//j9N7vzyhDjzb38bT534TFpInRTRj2f8iSkrw4hG/meAy8/7hXZx5smHOrrX0aPr1nNLa3H7rUePPLWqzQ2LH35y1btv7B5p1ZcmTRxVM6VUK03pphkqigijYLAwCDEAB8W5ZclLOtrzLI45Qp4rrWRZBlJSqpTRvZRjJ09x9OQpFrRlRDmb3uEGjvwKWOj/PO9OtjY3thh0Ja9ftYq7b7uN0ZERNq5dSymOQGtMmjrb4NwhLi/i54mDHUJV843Lf6YMAgpKUQlDlno9vjp2jJ179rD77beYXligPDJCbXycerNFN0moViskvS4LM3Vmz5xh26ZNPP3oIzx8151sGh9352U1xShEWovxKheFYhEbhGTAZ3v38rudO3nvk09opSmr1m8gBRaW6oxNTECWsbi0xML0FCOFAnfcdCPPPPE4d916KxNeIlBq079WOs2QgSIqOHewo2dm2fX2u7z06mt8vf8ANgwoj5QQgSLp9ci8bFgURlhjnVGMcQY2oQrRWtNLen10brh0Nxjn25YtVnqkT7tVN29q6jSbdJoNxmpVtm3ezOWbNjHqG2wCJFKcJXN2wZmYSzEKj1RlnDo9xdTMDIkxxEp6+au8ajJUzhd+wbPDx3zhMcxUvJThyt6X/tpln2UdqoWruiKlIE01OkuJwoByoYTA0mg2SNK074w7HKgIrz0tLMRxTDdJWFhaYtrbUoejIwRRSBQ6cyydaXSmkb4HP18vBIPAKLfw/vP4Iw6fIwopHZLqf6akIo5iotjdr6V6g7nFBZI07YMZ+e2XwjsMe+ogUmKNIcsS4qhApVhECYlptbCJq46pYFh9aDDO4b/+PU2ASwnEh90Sc0OyLOkxt7DA8VOnOH1mhslKhVIUnSPZ2e/D8I7LZ5+Y6Ic7MFIuc92Oq7lq21Zq5QLjNafOQeZ9DciNvQZHg4BB75KnSnqpPKM12oIMI8JAkQKz3R7vfPo5L7zyCp/v+4ZuZlhZG3V0wmbTJw+WrNtlfvoMpSDk2htu4KePPsxdt9xIOYqwQDEKCIXEZoYkc+olUeyaL4+cPMGu11/jxT17OHD8OMWRESpj41gpnUwfliCQLC3MQ9Jj9cQED913H888+iibJifddctSrFfC0mmKUIo4iIiUYr7V4r19e3nulVd475NPaWtNaWSUsFSk203opamjggqBkLlLqVtfpMlBwvwGMQBHlhVKL7So+iDaz/f8TdLU0S6FMayenOTaq69m7apVCHJR1rMR7IH2+Ply4/z71BhmluqcOH2a+YVFtLWUix4AypwTbg4oOtlP20e3L2VYlj9zyyk93sUVgbGuohlGETpJqLdafLV3H8cOHBR0OqvjOH5wdO26q9fS/eufpJ2v52rV3xKMvkZtdOHg/+EvGydWXa74r98xtOr9+/FjGH/CgNyFFMspK3lRcgloCSjaECuijavF6jTdVJo5c83oW28/xQcfPNSyZuOh01OFfUeOsNhuI8IAFQbEpRLFcgUVhgjhZA+NxTtn+Y31j5EU+UjHNRVCXCrR1S1mp6f55uBhDhw5xvYNaxmLQkyfknL2FXGTzWnnukcj5zzilU/Ga1Wuu/JKCmFIHDjeVq4e4Dhprv/beD64EE6LVwj6jaT9B8a6Twy9i10H+PLECZ579VWe37WLg8eOMzY5SXVsgkQbNHhuWsD06Rnq8/OsXTHJY/ffxy+eeJxt69Y5XVajCaTTIs2SxFFkghAVhJxpt/n60BGe3fUyb7z3PovtDrXJlZRHxliq18nSHuMjIzQ7HZbm55HGcsOOHfz1z3/KAzffzLpamdQYemlGIARo4wx6lCSOIzJjmWt1ePXdj/jdCy/y+Tf76GrL+IpxZBzR6iUuCfGyYcNcTSGcEYdrEnNcuEC5bF8bc8mLisBJfhnjnGKlgKTXpdduEUnBjiu2cfN117Fh5UoK4PsExHn5shf7jPzVC+02Xx/Yz4mpKcIoIowjUA6FoX9ezmXwH8zwKHmmM5I0pVAoMDE+ThyFdDttms0eYRggpTODgUHCYYwGK4jjAr1mi4WlJY6fPs307CxjIzWKxRKVSsU10lqvFy2AvBE6H8Plqz+Pv5ehfPKaZSlSCkrFEtVqlVKpgAVOT01x/ORJV6IPgkEbgXAUjEFzp9dLtoY0TVHFEmMjIyjhjKXmGw0y69yHVY64/WlP/XuNPogDLhCTgsxaTk5Ns+/b/axbsYKxiXGkcjSGC3JxLjIKUcTalSsIpSBSzv00097AC1/MU2dDFUN7m3XoK77amxrtlLUCF9hO1+t8vPcbXnhlN29+8BE9o6mMjqKiiF6SkCUJpTgmbXeot9qE1nLLNVfzF08/xUO33MSKOKarHR0zUtJXiTUaSyEK6BrDVL3JK+9+wHMvv8IXB/aThgErVq5EBCGtdhujNaEUrik1y1i/ciX333EHT993P9euXU+GJUl67pR8Zd0I71OhJD3go2+/5VcvvMDr777L1Pw8k6vWEBaLtDo9tMWtxYNydx8MyYPXYFgJ6HvGJg5go7+fgbs3aaeLsJaNa9Zy87XXceWmTYwLx0MIcnAS+lG/Ofs9l/2NfprWyzIOHD7MgcOHafV6BFFE5MUQQPQpUE4Ry1yUn36xc3LvNjSnlv3LYMggAGvRScZCu81sr0e70VShFBOTjaUJ0Vhky959V0+WihNq3eXXNrbuOF5+4PrdhSfCY/HOqbB7pGF73Ux/78bCP9L4ETZ19nEPESCZRAS3zM6PXX1g7xPy+Kn/7Ou3377y408/S5vtVhCXK4yvW8eEUo6X7buWpf97L00ckiKEs072JfvcpuCSjygv853FGV8mQ8XQdPFlKaQks4aTU6c5cOAAGyZGmYhGkEEwmKN5iZ4h4F5Arp0r8s83xml7CkGlUOhrcVpjnASWCr2cogvENdbryg7CvJx3GwQhxjeXECgUgo61HJ2d4Z1PPuGd9z/g4LET2DBi5dr1GAQnT51iZGSEWqVM2uvQadSpFmIevOcunnrwfrasWYNNE5aSHiOlMgqJRZNqjfAd321r+Wr/QX770ku88e57tJPMUWHKFVqdDkopYqVoNZoszswitWbHVVfyxEMP8uDtt7G2UiExhm6zTRgExMUCac8pbYRxCAJm6m3e+fBjXnn9db49fATCkJUrJilUq9Q7zvGvUCgQqACMJUuzvpFIoJTTQPaBehAEhFHkTC7S1EmwXRKC7e+rT37AknQ6CK2ZGBvjuh072L51C6XANddkWYoKwz6qdLGNU+Qf7OdcB5iam+fbg4eYnZ+nWC6jPE8wp184mpDyqMVA4/Y877zs22EQ/fs0cF54+fyO98iTT38ZjDFkWUaWZcRxzOhoDaUEZ2bO9DV/ZZ+mkB+gb/CTLiCXKqDdbDE7t8Ds4iKZ1sTFIuVqlUJccJsh/dvl9qehJM0d1lkX4c/jjzqsdTSrIAio1qqMjNQo4qCaU2fOcGpqGguEYTi86PbL/cZqAhViJWSpM+sKlKJarRAIRb3VBGu8q671Trein9CJs3gCeaPn38fdHwYJzh7n0Kc8VcsYi1QBpXKFpUaTfQcPct01O7h8YtyBNPgd1fiK3Tn9EP1XLPuZ1ZqslyDCkECF3ilXXNDzanndF/c8+4KtAYx0SRNA08I3R4/z2ltv88mXX9DqdZlcs4ZipUq700EJSaXorO7PzM7TazS45sorePS+e3jozttYVS73HUmVR1FTk2EkBGGEAKabLd54/z32vPUmh0+eREQxY+PjqDCi1enQbjYpxjGhFATWsmpinFuuv55HH7ifbZs3kwGtZh2FoFJySiwWUFGIFIJWlnHg1Cne+OB93v/kE2YXF6mNjrFi9WqWmk3mZueo1moU4kK/P0l7GU+Zgz/eJ8TFE/nVW77e5EH3eedfDjb6uSstSKGcEZoQXHPVdm694QZGi3H/5co7iA7fqrMReAs+8bL+/rnegm6WceDIUY6dPIVQiqhQdCZISYa1bs+0HsxiWTB+dnC9fMb01efE4DW2/2y6V+TUHnAJjpvPwiHlcUy5VCYKQ6zRJJ023Xab9w4c5MODB8ojtepjN1wx/9MrIjN/++za/3zlFZP/c/u/vKVy8FeH0tNHsi6puRTtgz/6+BEF5BZHUxkHrgaEWZ9mY/dMHbmp8tEnDx1+950npk+c3HhmfhETRqEoWmShgAgjh5R4rinGmTtoozEmt6IPXED+A2GQYXrK2Y2dZw8xFIxb5eztp2dnOHDkCDdfdzWMjoBYHuQPfvds+xnhf+6PQ2f0NUfzbmYpEUr1I7W8zjBA14cQYN/YY3HSg9paYhGQASfm59n52uv87sWd7D98mLhSZXRykla3hzaGUqlEGCgWZmc5ffw4aybHefT++/jp449x7bZtBNYgsMRh6CyKdYY2GhkERFFMBnz17X5e3LOH1959jxMzZyiNjkGg6GUZSZJQLZWwScKJw4eJBdx8zTU8/fgjPHbvvazy2roYQxSGBEr1VyrlGyibqeGTr7/h1887tKKLZcW6dcS1CvP1JTIspVIFNcTT1N7hLJfnStO0f0+CIMBaS6q1p1IM1RDPO1H6/+nzkaNQIbWm0+shrGVybJTrd+xg+8ZNqPyeWuM4duLCpbNlYbpf6ATQyTJOTk/z5d69nD5zhnUbN2JVQGaMK4/6AEN5JYosS7yGsRq82dn7/PLpt3z4uUt/cTznn5e/x/cYbi1ezmPMsowsTSkUYkZGR7DGufNhtNOn5dzH2jXmSgqFAkIp6s0mS80GHU9VKgRQq1WJvPa7lHLQeOb/zI1m/jz+Pod/Jg3gq1PlUomR2ggFoAFMzcxwenoKbS1BoeD0rLPcUyFH5rz8oTeAM96tuFQsUYwLLNTr/ebCgQzuUBbqn91+IN6PlL4f0nfRMx3qQxreCy4WkOe/57/p01EyY7FCUqxUmF9a4ouvvuKu227hussv77uh5PS5fo9E/tyf96PcZygpHe1Q5gSHoetwnkdjEHItD7oMTpJPSoUSkg7w6dd7efbFnbz6lqNFjkxOEhWL/cpiqVSALOPU0aMorbnpmmv4xZOP89R997CiVMJaZyHvnmG3RlshiMIAheB0vc7r773Pb158kQ8+/5yOsVTGx4nLFZqtDoGS1MplOs0m7WaTiWqFe+6+i1888Tg3XHEl1TCi1+0QBoFrErXGNbFKp+3dA748coTf7tzJ87tf5dTMHKWRUWrj4yw2m/SSjGKpDAjfcJnTUPNrGzhZXQNZpp33iO9dMrmaiF/Z+uvbcEzrfyiwjn4inIKbEFCMItpJQjfLuO7qq7nz1lupRFG/pyg3g8rHhaOZHJRxL86AmaUlvty3j8PHjmIkRMUCUiqStI2UAXEUk3jn0ND7qJxNezw39AfEICVY1kdhB30hAtFPnsH3/3jsXgUhCOn14CUyLhKrgExA0mmJpU678NW3e5mrz4+N1xf+T2vvu7tmbtn0t7JSWzDvnAjnrVJpPTEQX+xy/NHHnyggz4PvzP+J/z4ViBGrGJWjULzq8IG717y5+68OfvDho+/v+3btXLNFZWSU1WvWMhEETuIuSbHa0RDSJENKCALVb1yJgsAZ7EjpbFaNOf8adLGjHQqczzZXOQcp91/auCa6crnMUqPBvoMHOHp6msvXrCbEZXeZ1v2mQqDf7X7uWpe/r+xzqow2GKOdput5kFUpAo/8mX7Dh/JBp/UJhRGCDDg8M8Oe99/n2Zde4pMvvqBUq7F67XqK5SonT50ikJKJsTHqC/PMT08RWsP9d9zBf/DLX3LNZZdRVIr5+hJVv+FlWUqaaYwQFOKYlrEcnDrN86+/yctvvMXU/AJxuUKpVqPbS0htj1BJbJaQdlrYXoftV+/g5088xuN338WWiXE61kKSIq0lLkS4RkyLDCVWQiPTfPDFVzz70i7e+uADZpYWWb1xI8VKhcRYGq0WhXKJcrlE0u2RpqlDi/AmG8K5cg6qCG7BzGWclMqt1IfvyvIcf7haK4VrdlI4zqFJekyOj3HNlVdy5YYNFIGe5zoHOYw0HBucZ5KeD2M4PX2Gfd9+y/TMDL00hSDwmvJ4zp3tB/B5AqKEGnDJL3HkyLzNEba8QnNWlej3HX2ddOjzXa2/TsW4gBwbJw4jkl4XMCglyPTye5Gj3c5ePCQuFpmZn+Pw8eNcf921VKKIkdoIo6OjQ5q89JteLXxnYPTnceljOcf/4tfUcfc1WZYQRSGjo6PUamUsMLvU5OiJk8zMzqGCgNDLheZz2RoXjOPXOywu0TWWYlRgfHSsD9xIKZHqD0PhGjRJysEzcZ4qy3CgkVdac1O5/O/fZ/Qrn15BrFiusNBscOTEcb49eIibdlzN6pEaofR9FXiqyTn34OyVxYMKShCpsP+jgQGeWP6rF7ilFpYBRKEQLGUZ3xw7zou7d/Pynj2cmp2lODbGxIpVLmHOMkc9THp063V6rSY3XXMtv/zZT3n6rjtYMzGOttDt9cAYROQC3p7OiKMIi2AmTXn1gw/51bPP8dHnX9Do9ZhYvZqoUiWzgqyXUiwXCUNBvd2iIAVXbdrE4/fdz73XXu8oH0kXrTPKxSJKKrenGe8SDnx56CC/e+UVfrvzJfYfO8bkmjWMTq6AIGBxdo4wjKhUqvR6XbI0IwzCwVwgF26QaJuR6cz5pfTngRggxpZ+c32eYA6CVX/t3WLn1mVjSJOEWClWT0xw3far2DIxQoJTqxHGIkQexg6BTBeYYDkVReD4/t8eOsyBI4eZX1piZMUKVBihrSVNU8LQCWYM+jikV036/vM6Bw5zik+OVQk7xEYYmpMycI7hna6Tt42jkEK5QqlSJk269LodphYXOPHNt2LDocM3X376dLH2s5/NX37ZyvcLD452Pziq5hcKcas/cf9E409EKjVAHZgB5vzXrICZgCijAKUnjx77+cbnn/0/7nru+ac+OXBwTVipsXHLVqpjYyzU6zTbHZIsI9WG1DdmCQGBCghUSChDIhU6G1tjSXsJSS/pNx58n+ihr3oyHCD0szSzbNEFrwWeOqv02vgo7W6bfd/s46u9e5maWwDACtF39/Jv5DcU4xf1QcAkACEVQRCivNtYoAJCFWK1U9AYTGP3P+nfM+0lpEkyeF9AC0EUhkRhSEtrPvjsM37z7HPs+/YAcanM6rXrQUhmZ2cpRDEjlSoiyzh15Agqy/jZE0/wV089xdWXX04chhhrqRZiokD1y80oRRBFKODE6VM8t+sVXn7jTU7OzFIdH2dschKLo2vESjJSrrBw5gz1mTNcs20bTz/8MPfcfjsrx8ecCkmSYHWG9IiBtpbUGpSEdrfLZ9/s59/+7nle3P0KXWtYv3kz45OTLNSXmJ2bo1YbIQ5jOu0OWmdDTm7guP/uXjgOuerfW2GtR+BV/94azye3DKQm+7bcfp4oKYgCZwLRbNRJOm22bLyMu++4g0nfKJT0ulit+5bJGIPVmb/xYtn2OIwE66F5ceDQQT7/+iuKlTLjkxPOAEdAEDpN9Uy7BdF404soDAcd8Fxo7bHnfOXNkybTBCqgEMfOnMcnljnyZsx3L8AX/NyhzT5PJvJAv9VqIRCsX7+BOIxozs5htXHUo6EgSEpB4DmqS/U6cbHIpssv58ixY7z6+utMzc0DUKnVWL9+PWNjo3Q6HZeoKEWSJC5Zw1Ei8irJn+kq338Mr5E59SjfqJWnhg2vqVJIotBxUJNuQhQXGJ+YoFws0AFOnDrJoaNHWFxapFypEMUxvW7PK0tIksRtxqF/D6wLQDCWWrXK+nXrsNowPzdHFIUUi67qpv0z7Q8aGFSB8mGxy+Ri8y8hhJNb9RQbcjDGvQnaPxtBECyjOwaBExzodrsI4SQ6h9eS4a/zgT55gj0I6iEuxIRRTDdJOXTsKMdPHHfrF4By3O1zkhAfcC3fEPOVxg7+sPnxaMAMLUjW+wG43ieBCyiNcdc11U6WNk8GTpw8xQsvvczrb73D/FKdlavXMjI6TqvdIUlSSsUiY2MjTB0/ypmjh9m+bSu/eOYpHn/ofsYnxt36pzVRGFAsFtz1x5IJCIVkqdnkrY8+4t8++yxvvPsuRinWXbaRkdEJWvUWnXqTyZFxpLYsTk+T1OvcsP0q/v1f/pKbd+xAAWnSQwlBpVRCSeXWT6koRDFIxemlRXa9+Ra/e2kXM/UGk2vWMja5gnqrzdzCIqOjo5RLJXrdnrsuQvb7vPK9xHhFNuv3FxUov7YbL/Xn4oM0y0h1hhUgA0UQBk69S1uHrFuLNZoscaCWsIbjhw9TKRR45IEH2XbZ+iGQSBAG0lN8zEAzHFfttMbNV+P7BFxQPNDkOjM3y7eHD7PYaKKCkEJcQAhcQiEGz4Obm/SFLs5Gxi9UB+5PKa3BGOcdg/D7onEVAHxC42UPsbgeMgaoee4rkGQpzU6HTpIQxDErV69m9bp1LErJVx99vO3Q//Q//z/iXz3/f92yuLStdOt6xZbIHUamL+wF+EcefxqEvFyBB34Gm65yguzg3Hq0SSeu2FHafujgXbVXX/2bk3v2PH7g8CFRHJ9g5eioo6akKamBVGuk9aV3f3fdQ+8nVpa5AF2ESCSBsCCGOup/wP56aQjGgDYSSEWoFBrLzPwCX3/zDYeu3s7KsRFKUjrU3piBWedF0Aagb6qAxbnQ+SCOPJPMUVBj3EPHQGsc/4DnJSgNnJyf5/0vPufZXS/zxTffkArByPgESEXaSzGpoVIuk3Y6LC0tMl4uc9fNN/EXTz/N7ddeS004TV+L7SMpFkeNKQYhqTEcXFzihfc+4KU33uTbY0fJpERGkbMpThJCpRBakzQb0O2wadUqfvbYIzz90ANsW70SAfSShFA4hzeXdTsFDulLhx9+s59/9evfsXP3q0wvLLB+82Zq4+Mk2pBkLngOgsA1amaZDx5lv+Tnb+5Ad9xfb2MtSJep5zJ7KlQ+EPc6wD6I73eDa40xGVaCMIrW4hI26bF5w3ruue027rjpJsZrNRJjsFmGCMP+fR3wl5dPApsfC/TRNAM0jOXTr/fy0SefUhgZYWR8gswnFzbzSKBwyj7WDJX1fwDwO1BocXbbVuY9FZ6XbgzmAlWkSx52wIl1Jh0ucCGKaLdapL0ek2NjTIyPoeLYJ52DMryxTv4zv7/aZIRxTCEMWWzU+ebIYQ6dPMlVmzYyXqtw2foNjI2OM7s4T2Ytcbns9K7Pg14OVwP+PC59iOHnw488sF0mi+YTr0AF9NIW83MzrNq8la3btjJeqzHXavH5V19y9PgJkiwjjGKIItJONy9ODX2GwBrnuGu1ZqRSZfWqVUyMj7Fv79fMzMwQlkvEUYjGWcpbzjV7O+tMEEPl8uG5oJT0+44HVIxzGgUXgAmWV1nPpirm1+kHPTP5sQiFCiOiQpGkUefb/Qf4ev9+rtyyhWKp5AI87Xpg5EXP85x398fn1ty8ygbGBeBDXho274vzQZlBur1BSjqZ5uDsHM+/9ga79rzG4ePHUYUCpWoVrQKSXo8gCOi0WjTnZwmVYMf11/H0Y4/xwC23sMGrUWV5VROLt9chVAFaKmbSlD2ffcK/ffZZ3v30E7rGMF6rEcVF0iSlGBcdmNPpMjd1ipCMO2++kb965mkeuOMOxpSrrCvrKpw5391Vph2MePjMNC+/+SbP7d7NgePHqY6OU5uYJCgWkWmG7fXQ2TCyKzzSvLz0ab3+eK5Ik9+RnCrnkjiFCITvCnMBrvH326njCqw2qEARFQtkvR5Js0kpCrjp2mt4/KEH2bRmtXtj7feO/q1fLmjg9pe8+un2l/w5ddr9cODoUd7/8EMWGg3iUgkVhmhtSXTWn79uzfQGidLd/x9S+RH53rysAuuPNweJcHx4Bzxlbn6DowsLl9xom/fUDQCWZGSUzvxCePqTTzZsyvRPN06uLFwzPlpMJq95bQZaCJkjnH/v408TkI/V4L/8T+COO875pxu/3nfXHb9+9j/+4NNPbv9ibk4UR8eYXLmKOC4ws7BAEIZUazXa7Q7GWKLIoRLCT2KTaZI0dYGXtRhjCeOIOIxQSg8h2n+czTV/1/xhTnVGFBeIsJw+M8WhY0e58vLNFGo1gjBEJ4lrRlXKT0D/BmKoBD/40Vkf5LSaXZZsEcovmF56MQgCr0nuHvREa/Cbx2yryXtffMbf/vZZPvzyS4JikbGxcWQQsrC4hJQBpWIBYQyN+QWyTov777ydf/Szn3H99u2OipIkFH1TqLXGrVhKOj4XMNPp8Nwrr/Lbl3Zx9NQUYalCuVR0lQ2PlBWikG6zSaPVZP2KSR6+524eufc+rli3FoBep4u0lmKx6BZFa8msa+bpac2BU6d5/tXXeG7XSyw0W6zdtJHRiQl6Wcb84hJxsUAxDD16ZlF97nQ+fBB5gfkg+hUPJ7NXiCKMccoNWhtXOg8ChJToNHNlQQs2y0iylLTTYdX4GHfdcTu333Qja2rOxCMzxjUU5rJkxrq6Rq5a4NfvHGnLMg3SI/hAM0k5ePw4+/bv59T0NGuKRUZqNUIEnV5CL+0ilSJQgZN605k3pLIDR7ez59RZ88wODsOhEsKhElmaYI2jW4UqwIgB8vd9qCvnm9f9IM3/MAxDlBW0Wm3q9TpKCtauWcOG9RuQQtLrdr0Jk8RqTZpmSCkdVSUuYIVzlYuLRYRS7D94kDPXXM1IqczqFZNUq1VOTp1GaE1YKBB7GkSSpk6dQ6k+emm15s/j0keOhuf3I5eF7SNnebAupXPzs04LPkt7tOfmGLn+Rq686kpK1QrfHDrM519/zWKzQaFUckpJOPWgzJteBWHoDOCsa/ZKuj2M1qxeuYq1q1cjpaTRaLK0tMRoIUIGMcKaoSBliGKSP3yWwZweCpr7qL6UTkLT+v6TPIn0r82rSDlNpk9p9HMpn1tpmvbBk+8TwOShiTXumIIoRIcBp6an2bv/ADded5rKlsspCkGqjeNZBxfSXj8PWjXkRSCV6lc7MBYrFYH0vVnGq30J4YNI937KUzyOzi/w7Esv8exLL3F8eoq4WqE0MkKSZVggCp3QwZnTp1mcmeaeW2/hH/3s59x6zbWsXLGSeqopBcopaylBkiYkmUaEIbEM6GQp73/xOb/e+SKvvf02NgjZsv0qlApoNJp0uj3Wrd0AxnD88CF69To7rr6Sf/yLv+Dxe+91rtL+ChTjGJ1l9HoJQRg6+VVgrt3irY8/5u+efY5vjxxhZHIFlZERRBjS6SWuoT4IqS/WCYOAUqnk6ET5erbstople3yeVFrrDO6CMCCIQgLl5kqSpiRpirBu31B+79BpRqgUlVKJ0/MnMJ0uN1xzLffffRdXbNlMKXTnJR0e6TjYvr9CMagEZ1m2rDqcGkOqXdUnA1rAt4cO8/W+b+gaS6FUdlV+nfV56e75Tl1So1xM0z9/lu9r58w5z0FxibX0yLdXj+tTeVxlPL+ewivnIXy1wautIXBGiEI6sQQt3V6cJERSMVIbJSsUWJid5VjSXTN6+PBf3jN1JiqZoPebHVe9ZqIo7d8tmYOefz/jR6ODVgPusTbYePrUrScOHXzy5PTUZCokoxOTriu62/WmOw4pVYEv3RhDt9Oh1W67QFxAEIaUymWiQoHMGNIkJUtSdJo6g5Q/ItA1WNIs2jq0PCoWEIHi6MkTfLF3L4dPnKCV9HBtHp6EIYR7Wuy573XBDzr7BdaXpVSwLPC0OIqMUK6pxgJf7P+WF1/bw2ff7qORJMTVKloIOkmCEMKZaAjJmVOnIE25YccOHn/wIe6+9RZWjVSJyJ0/8/KUF+wXEgWcXqyz8813ePblV/j0y6/pakOhXKVYriJ8EBsFirTdoltfIsRyx0038vQjD3H5utUUcNliIQopxNGgsiEEoRTO3e3UFP/6N7/j+ZdfpmcsE2vWUBkbo9Xrsdho9rXGlVKetuPc+oQ/5ksZOXLWX6iyFG00CCfxBII0Tem2O2RJSqAUo9Uq0ljmpqeJA8m126/knjtvZ9vmzY5T7heUOI4JpGtQpI+OnzuMhV6mSTPdnx5nFhd5/5NPOHriBCI3/hCOT5n6Uqijb3ntXO00XPtlxYtNqwswNPIpl1cD0l4KxjopzELBqV4wjHx+/zGcLFvrKDZxHLG0uMD8nONmrl+3nvXr16G1pl6vk2XpgFqkvCOhHSghWSEo12p0k4T3PviAQ/v3UwsDLlu/ntGRURr1OlmmiQtOicD4gDHwFZmcRjBM4rno9eNPBK/8yMYgcdX9r2HaRxAEDrXyoILOXDKlLNDtsG7NKq68egcG2HfoEF99/TXtTpvKyEi/7K+N9goWeULo3ltJSa/TIel0WL1iksvWbyAuxDSbTRYXF9xaEDiFi+EKa3/9Hp7Dln6APfg300dBpXPcQacpgQ/E8uB6OMgepp3kSUkQBGit+wF5v6L5PYe21oMGMXGpzMzCAp/v3ctnX33F3NwcIY7KgxRoYy+6/p07z92Vcc+ARQUBQRQR+PczmSZLXQVRBu74e9pirHMUOTE1zUt79rBzzx6+PXKEoFigPDKCDCO6aeIoD1gW5ufQvYRN69Zx1y23cPfNN3H52rWMxiEFJRxWYXE0PClRYURRBjSyjM8P7ud3r+zizQ/ep2stlbEx55CZZU4WMQzoNOtMnzjO3NQpbtixnX/613/N3TfcyKpCEQWIvErKkCCzv+f1NOWVt97m1y+8yMGTJ5FxzMjEBCou0O52WarX6fUSlHQgRSDVgIKRY7riPF/5tRZgXPTpaCmBQJuMbq9Hp9vzAbMkiEKEEt7h01AuF1G4vaa9uMjKsVHuuvkWbrr6akZChdaWXjf1qi5DW8xZ938ZKOLPWypJJKCVJOw7cJDP9+7l5NQUQgoqFWcGZHH0EOek6wLyPIDO+ePuNTB0QVwCYoX/Wv7s5SpAxksaI3KhDG8QhAu4rb9eUklkIAjjgLgQowLVB9G08Zr7Qeg4+57ibBDIMOL41BSfffZZafH0qZ9vOn7qyTtPLxbG/nf/EfyL/y/87nfwV3918QfvDzx+NAH5pnbrsvs+/+qfqA8+fvK9o0fLC1pTGRujPDJKog2tVpswKiBEQK+XeoaG3yx9syZ4Tq/RCD95pcobIS0mG/AA/zAtaBceeRlfCkmhVEJGEdNz83y+dy+ffvkl0/ML7oXKBeRGXyAKuoTRx3gNYN3DkXMFu0lKL9NonP7ofNLjvcMHeP7N13n7449Z7HaJKhVkFJF4hDHw1KCk2ULqjOt3bOcf/+LnPHzHrawuxhSEax5RwxuUV3vJgIUk5aV33+Nf/uo3fPnNfjIhiEtllDdxiIIAYQ1Zp02v0WBlrca9t97K0w8/xG3XXEOlEPcteiOPoPW0JrMWjcvWPz98hN++/DK/feklDhw/xujqlYyvXoUWkman4yoThdglRjlPG4bu/yUOC0I6AwIEpEmKzgwSr1ySZSS9Hjp1i14cuC7/rNvDpAlXX7GNxx94kJu3X8t4GLnzMJ5KogLyRrDvqti4RdIlUx1g76HD7Hrtdc4sLLB67VrCuEA3Ten2ErSxzonVIw2Dvoch7u73mlssQwQLUYySklbLGXeMjYwxOuIaJPOG5ospEV30HHHPda6dHIYBURQwNzvL9OkpBLDxssu4fOMmkk6HpYV5j3C64ChUrhk3D/AyrUFKRr0j6gcffcwHX3xJA9i8ZSubNm50aKU1Du3Xpt9nEkY+mfNB5Z/HDxsX4pAPm6rl86vTapMZQ7xiJVs2b2Z1HHFyfpGPv/yKIyeOo4FqreZodal2yhfgg4EMa3HeAT4J12nKhnXruWz9ejCWVrMB7TYIZzokl8GUl3AufSRf9g2jjDFkaUqWppQKRSbHJ6lVq0gpnOGYP+fhPpM+HSCfq0MI+vcdUrr9rdvtIQNFuVrFCsnBo8d48733+ebYcTIGwViS5apRl/4ZOW3O4qiCwksAWmMHjbSeFtnVGqkEXWs52mjy4jvv8qsXXuDL/fvJpKQyPk5UKmKsdr4dWUra69Jt1Ll83Tr++ic/5dG772XjilWMhCEREEmnIqK97rhSAUIq2sB7X3/F//bb37LrjTeYWaozsXo1hUqFVrtL6k3FilHEzOnT9BoNbti+nb/+6U/5xWOPs2nFCo9Mu36hvKouhEQGIVoIjjUavPnhh/zaG9llQlAeHUPGEak19LLUNZYmCTrLKEQRcRh+J/Bnz/o+D8wJ/HVMU/eeOkMKBrK8iP6xRkFA2u0ye+oUE5UK9952G/ffeTvbNm5AAVkvwaQaeXbUe9ZQUvb389TLcuf3+PjMLLv2vMaXe/chgpC4VCaI477poJISJQVYM+iJkoI0SzBGf+9Ia1jpyiD6akLWU2es8OZ7eHlnb6jnTPyEPxav9OaTvTBQzkhOKTrdHkmqKVarNLo99h45Ij8/daIo9h+47fZvD969dvuOGn/zT+CZZ+C6677n0f9+40cRkG/Bcm26dFV5Zuq/mD569N5jZ84gopjKyCgG6CaJk94rFp3+Z6tNmqZuUTOGQhRRq1QoxjFWa1qtJq22W9jDOKJQKhLHMWpIoP/Czle/5/DZnfVJglKSKI4c3wqYnp3l20OHmFpcdCUy5QKyNEn7BkY/6DM913kYmcy0od5s0u50+tJGB0+f5O+e/S1vvvcurSSlPDpCoVKmmzrd0ihyerOLc7O0lha4fP16Hn/gfh5/6H7WTU6QgpPZ8h9jfMlReiOm+Vabdz/9gmdfepn3PvqYYqXC5q1bicsleklCt9MmVIqs26WxsIDQGdftuJK//Okz3HTN1YSA7nTIvBmDc8xM6CZOTz7RhpNz8+x5+22e27mTucUFVqxZTW1slNRolup1rBQUyyUKxQJJkpAkCaVi0aFmvZ7XSM1tW91wzSuCcxXqhxByIXwJzvH/XNCnscYShxElrw+/ND9Pr91izfgEd9x8C7ffdDO1YpGuNfSSDhLrbIvzOqX0x2LPn5QJgUelArS1zCw12Lv/IF/u+4bMwpr1GwjDmKSb9JGUMHAazTrLXEOnlKjzqEr0N4Hln+jqNnYgK4hXsJBCOmRfKdrtNkIIJiYmGB0Z8RqwnmOOU0bpU+LP93WB4Xjv7rkQUqKkImk2qC8uYNKU8bExVq6YJG236bVarrkI0DrzpVIX6KVZ2m/QLFeqBFFMfX6Or7/Zz6Fjpxirxlx++eVUKhXXHJZl/cRe5GVhHzz9mT/+/UdO9xlGi3P1IqCPDKdp6gJkpViYnydLM67asYPLN21CAwcOfMvho4dJs4wgjlxyjHX0FL/GgpPBy+Xj3BqcEUjBqslJRkZqdDptemnijFqAnOssRa5rnAeXg3MQfm3to+M+2ZR+XubzLklTUu2qLONjY0yMjROqkFarReaR/7MrRzml5Xy89EsdAvrzNEkSrIVCqUR1bIxelvHNwYPsO3SIqW6XHq5alGp9CZ917oPqenhcD02apiS9xBs4SYIoAivo9jLanYQi0Fpa4qU9r/Hsrpf55uAhZBQzvnIlKopItXaeAHGI1RlZp005jrjlhuv4i2eeYfuWrZgkHayHFrJUO2MipQiFM6k5dGaaXW+8wf+Pvf/6kuvI0j3Bn5kd4TJ0BAJaA4QiQBCgJqjJzGRmlrq3bs90P8zDzJqnXvMwf9HMujPd1VdUVxVTMEmCBEkABEmABKG1DoSWro4ymwez4+4BwSSzk9XTN8u4gohwBNyPsGO297e//X2/ef8DpmYXGF6xkv6BIaI4YXpmGmEEBd9H6IyluVlWjgzxf/77f8/rL71E1ffIjLYc6DwYz6zTp110JQ3g2wsXee/99zl36RLaU/Q4LfOlWp1WFOH5vl1DECRR7PjTDgo2dF3Dh4GXHCm388EllomlqGRpinR7su/7CAw6sVVJJayGeRJF1tE0jtm5bRuvvfwSm9evo4hlWkhjeGjZ77qtaWopJzbBsXM0ShLbSAo0gGt37/H5F18wNTvL6KpVFEuldjM/bXScNniVP49J4qrJD8Q0ufBE57vlP3XxJNv0GoNxZoemLVFr0O3n0arWpSSOTqkkeC4wT7MMYwRK+Xi+nXuJ0RQqZUo9PWQGboxNMHH10qbyvWt/W2gubfkjD8dPNv73CMiF+9z2XdpYnywOnj617rvPPx2+PnYXVS5jPI84zYiTDM8L8MMCiXYPC8ZyRH0fX0gKnk8xCCmEIcVikWKpRFAI0MIQxTGNRoMost34yvuJafNdz1xe3hdCIpVHoVRmqdnkzMWLfHHyJJfHx0myFM9X7Ya4zkXK+5sf+dbdv9iZvKLr0XexXRgWqJRKCK05O3aH9z76gA+OfMrNsfuIQojxArRUGCzVxaQpC3MzZK0mG1ev5tc//zk/e/klVhUL+O6NTWaDPG0gFRLpeSghWEw1x747x3/8z/+FY1+dRAuJXyyhfI8sSymEPqHv0VhaYHZiHJWmPLd/H79+5x2efXIvg+UKWZrgexJPWe5lM0lIjcELA1Lg2uQkv/3oY37zwUdcunkTr1Kmf2SYVpJQbzbJdGazYefgpbPUKpe4e5Fn2p2S4aOC8O7rKzocT6AQhBZJ1RlpHCMFlAsFqqUSgfSI600m7o5RCUJef/kQrz3/ApuHRyi75lVPuNIr2h4bedS6/F62F0xtSLSxFtXAfJzw3ZUrnDp3lom5OWJj3cry8qrn+fhBiFCyjUoCbVfLLMucEdIfo1+IZRMp75a39uQdxLO/v5+1a9cSBkFb5aJ7Hj44d5d9PVC27Vxyx9XFtCsRxDFJbYlWvU5vTw9rVq+2DcFA2TWtJXHiBCA6MqF0oY+FYhGvVObS1WscOfIpJk7Yu2Ude3bvQgjBxPg4yvNcv4IgTpI2t/JPpRL826Cd0HZfx/yZssG4oFgsUS6WmJ2YhCji0Asvsnnbdu7OzfLVt99w7eYNVBjgBQGpKztjnDOg8rAOxcIFFZpWs4EABnv72bB2HZVikYnx+7SaTWSp1Ja4fFx++NBrXcmyaE/wPMB2z0hquezlSpm1a9fS29vrAvJkmapM/h4PSunmqio/ahg736Wjcubuy739/agg4PbYGMe+Psmp02doNZqEUuD5qi2hl79H/odr/X7oq/uKdNBy2qIKqdEkGIKCT6VSZC7LOHHuHO/94UO+OXuOBEOhp4osFqhHLYywvHGdptTm5/DIeP3QS/zN22+xa9UqVhQLFD0PT1h+fJKmpBikJ/EE1IBvb9zgf3nvPT46eozFZkSlt59ytZdmy1JHquUqEpiZmmJ2apKNa9fw7huv886hl9g4Omx7D4zBU7Ltxpz7N0gpmGu1OPHtad57/w98evwLFpsNevr7yYQg1rYnx2hLWfKkIvA8Bwbodi+DxXh/gBFhdxwqRRvwyYEUCZjUqo8UPJ9SGKK0Zvz2HdJGk6effNIqk+3fz8qeHoyBJIpQShKGFizTmVNWeTAZc7c2yzLiOEFISSEIkMCtiSm+Ov0d5y5fppGk9A8Pg5S0Wq02KGoViWwvhuqaV7kQQFftk27uiujaAETXxtB+1Cz/rC3PnDqaivAkwsuraynojGIhoBQG+FLiK9ubVioW8JVCJwnNZoNmq0maabwgJAiLGBSFUoVCucL00hI3bt9atXDz+s+3XLry9LZaiwAsz8e2rP0JSOmPHz/9LtMTLv8CSTVU7kTxTdNbcXtsH1+eeebYFyfCe7UaIytXIT2fRqNJkqa2KTMMaTkuVRD4+EoRCImPwMQJraUa9fl5sigi8BRK2T7sNMtotJo04pZF7f4UBPpHDTv5lJQueDGW+ysEvQP9yCDg1tgYR44f5+jXXzPbaNpAx1cY+ePKpw+OHM0BJ/8jJdVyEa0kV6en+e2Hh/ngw8OMT88ig5BCuYKWljKjlEeaJET1BiKK2bZ+HT9//RC/fvs1tq9eQWwMqTFtFMk6r0nwPGJgOor58qzVAf/g009ZaDZZs2EDQkmWFpfIkoRAKXwM9bl5ilKy94lt/NU7P+P1559nqFRCJxFJHNlGROVZ6oMxoDy0lNyameOTL6zZw5lLl/DLZXoHB/HCAkvNJmmaWCMeYakkWRzb4FCK9sYfBEHb5fQHXVNsABpHEQJBISzY8nOaYtKMUhBSKRQR2tCq1UlbEdVCkad37+HX77zD3i1bCbEJlicFBT9wsoO6C3ntmpMPJGaZ4+H5Ahpac+3eGJ99/TVnr14hqFRQQcBSrUGSpChlm3g95SGM6KKqdIyAssyWiX/0+mI6gUOtVqPRaNBTrbJ+3TpWjo7SarWYm50Fx+VuN8X9mI/IOd/5Q6AdVxfA90nSjJmZaZQQrF61mpFVqyhWKlZbOke3jQshhHD8eUmSZLSimCAIWLV2DVNTUxz55AhXb91idO1aXnn1VXp6epgYH7eIVBgioN2A+G8B+Z82chm/PCDPr2HOJ28HHA4595QibTbpK5d5/plnKPf1cer8BU6ePs307Cw9/f1W1i+KSNPMyiR6vk3ApCQIQzzPI4kTFuYXKIdFtm3azIY1a9BpwvXr12m2mvT29aKU5aAvQ8PpDjsfHrlEneW806baKKnaMoaNRoM4ilg5OsrKlaO2sS3Ty+gq+Z/dVBXlGib/FKpXLqlXKhTQ2lBr1AlLJcp9fcRZxnfnzvH5l19yd24esIGw/BP2we7EWSmJ8hXCsypimUNLBVBrtfjsi6/4p9/+gTMXLpAYw8DwCorlKjqDVisiSyxQkjSalH2fnZs28bc/e4dDT+3HlzYALTr5Sp1pskwjlEemJAtZxpmbN/jdp0f4x9/+jlv3xli5dj3DK1ZikMzPLaKER1+lx+qZLy3SWwj5+Zuv8Te/eIf1wwOQZTSbTaQBhaP2GTDKBnuzccKpCxf5l/ff58jxY8wsLlKq9tDT20eSpOjMEPiBnQtZZvsHlCQIvDZF6/F0jUfCE+QhuZIS31PO/M6gUyv7JxF4KKQG4gyilKzRYuPq1fzdL3/Fmy88z4piER8rJ4y2FUPpmni1sQpsyz4tFxYAEofMB56HBywkCV+eOcOJb7+hlqRWWcWzTdRRHLfP0669lgKmlHXqNE4GNFeo+v6x/KmzYI1oiw8YbDCeudetEAJOSMJSjUySkkURWRShowiTpFY6UeZKYDbZSLIMzw9Qnk+j1cILC/QODWM8nzvz81y+dWvNxm/PHDh0+eqeIhQolwA8lBJUqz/8YfkTx0+vsvI325b/vDAt2LhJMlAlBNbqk8FIsvSyaZg3a7VGKQsLlCoVV6JKbCBhcI0ottEq8Dyr9JAZlDbMzs4yMzFBWltEFEIKK0Yo9/ZQ7qlSrpRIk8QuAMY1//zkJ91p5knTDG2sRnq5YhHghalprty4wYUrV3h6715Gq1U8R6dp63a6OK272NUeXVlnVwHUxnI61+IET9kF8vqdO/z+kyMc/uQI45NTDA6PkEpJkmo8P8DzAkyaMn1/AtFqsW7FCt48dIh333iTNYP91t49imyzilKknmd1UaXEB2bqDU5dusJvPjrM0a++JkUyuGKYUrXCxOQkmdb09fWRtFo0FxfI4ognd+7kVz/7OQf3PMlgYDnj1hXNblSJ4/4Wi0UyYCHN+OKbb/nd4cNcunEDGYYMjY7SihPqUUwQBnhSYVJNFEdobRwq57XpC37gozzfBtNOESAfbaOEzgVePoxxDpfCyqlp6xhaLpYg1UyOj1NbWGK4f4DnnnmOX7z9Fru3bKGvULC30uTGD87ywFhpqBwJfsh0w1gpKiEEgbLXeWF+nnOXLvLVt98wNjXFwPAIKEWz1bI9Fcp2oudSmLmbqUBY6orOm0KXB8v5ern8rDvbb47a5I1KC/MLaK1Zv34969etp1wqMz83z8zMDCMrVrhmH9MuY/7RwLz7WNxzrk1HhxmpKJStdfXU5BRJFDMyMsKWLVuYnJ1hZmaG1DWXSieDpbMM5XvWyCNNacYRBc+jr6+Pu5OzXL16jZPfnOONkVUcOHiQTz79lKtnz5Imie11cMHi/xY5ur/0kd+/7ucsD2Jz5ZWcvhK1WrSSBL9YZNVaO6+a9TrfffcdN2/fJskyqk6Vo9WK231BGEOqNUopwjBAYmjVIpYWFlk/upJtW7ewYniAyZkpbt++SbPVpFKtOAMT582QN5qK5UGB/ca4YM3OaE95SCFJ0oQ0sXJvublbSzVZXFhkYX6BSqXC6IpRent7SbPsIdpKt+tzd9UAWHa9vn/Y30szW8UpFUvUmw1qS3U8zxpiFapVZhcXOX/pMmcvXma0r4/hcqldIfu+j+oOkx6c/VJ5GK1J0gQDKE/hS1ioN/j67Fn+p//0nzjyxQnK/f1WsrhQsO7kQlAsFIkadVpLi+gkZt/uXfz89dfZvXETJaAVxSil2n4CwrPcYF8KlrKM2xMTHPniBEeOHWN8Zga/WKJUqdBotWjWm0gEOkmptyLmp2YY7u/n0HPP8rNXDrFj04a29na1VMSXijRNacUJnu9T8DwMcOX6dT78+GM+//IEM0tLDI6OIoOAZitCSkVYKOL7Pq1mi8g5ACsg8HyUku1GYyE7yVd7aX/oDroXuyh6nidJU0Gz2SQxmmIQUnWV7sXZORpLNYqez/q163j15UO89vKLrFmxoi257CuFHxYs4pxpRyVRbVWvbjRe2JKHpVIqRagktUxz/c49Tpw8yZXr1yn39hCWStQbjbb6lFTK9QsZPGn11aW0Bo3GGOuFYay4RaeMv/wCdOZX97NnIXObLNhjzRuKpXSVJm2rEAU/IGvF3Lh2g6jRICwV8TxFUAgJyyVK1SrlUgmDIE1tj1ycJmSxrdD19/VSrlYpVSrUFxa4efcu24dHdhTjxn4Bd9mypcUvfqHwvJQwfPzD8mcaP31A/swDAXljRDCySdBXNUMssPvKpZXywsLBiemZjYViidgLiKMUKRRK2sw7ShKQgmIxRArZRnKJYkLpMVipsqp/wDY5VEqkgcf9mSkatTp9/f2WzI9AZylCi46e9084JDmPNUULgx94SM/HKxQRQcDMwgJnL13iy2++obdYZMPQEPKHA7ePGJ3IRwgQShAlKWOT0/zLv/yW//TevzC5MI/fU6VUKtMyhmacooRHFqXE9Toizti0ag2vv/Qi777+Kns3rAFw7o55wGofFE9Yg5qagVNXrvGbw5/w3geHuTsxyfotm60LZ5Lg+QGhkvhSMDE1iUwTdm7dyq/eeZt3Xn2FgWrF2ipjeXHGcSFREuHbTP3u/ALHv/2O9/7wB749dw7jefT29eEXikT1mi0Ja0uLMZltpFWeLeMajO1c93wyA2kctykNP/iqCmvcIQzWXCpJUUhCP0AYQavZor5Yo+gX2Ln9CX7983d486VnWVEqtNeftlH9gyXrdqOKaCNM0KFyeEKSYku0F2/e5MTXX3Hh6lWW4phVvb1obajXak7zFdLEUlSktDxya/aQWtlEYZMUI2zi97278QPzqq3Lawz1ep1KpcKOHTtYvXo19XqdmdkZarUaoytX2qQty7Asvx83BF3lS5zlN5K+/n4rW3j1KlNTk2zbvo1nDh7k5p3bnDl/nkp/P0M9PUgEaWZLqdIlPUopyycXGaWwgB8GLC0tcfiTI4ysXs2OJ3eza9duvj17zm6AOkP6tgrX0V3+MYHSvw2gzZGGTvWjW2XFd30ncRyzuDCPjiI2b9rE/qeeQgrBhQsXOHnyJLNzc/hBQBCGZEJAnIKxm3JmrPGM8jw83ydNIuLEcpvXrV3L/n1P0VetcO7CeW7euEmz2aRveBjoGJf84NGmduSVHPtcSyGRviQMApYWFhi/f58sTVm5ahVbt27l2vVrLC0t0dfXB9jKS7d8Yjed5U+ZYzr3G3DIfSuKacYxxTCk0tfH3OQk1+/e4fMTJxgdHOD5fU9S5MfX4LtjKYlrqssyq64krBrH4aNH+f/8l3/kxDff0ExS+oolgmKJWGsybRtQlYDGwhKezti2cRPvvvYaPz90iJGeXrQxKGHdJHGJOUKClETAlftjHP7iC947/CFnr16h3NNHudJHnGh0Kgm9og3cp2dJoyb9lSpvvPQy/+7dn/HU5s2UgKaTnPVygx5XTS74HvUk5er4OB989jlHjh7lxt27+JUKvQMD1KOIZpQQBAE607SSJmhtGzgBtO1jsDrcuXeEeCipeex1d3MgiWN83yq1eFJiNPhS2eQhSliaW0DHCRs3reKt117lb99+gydWrMAHmmlK4Cg4SIiaTYwxhIViuxei456aG+oYdJq2pRQNcHtinGNffcWX33zDxOws6zZvRjnwBwS+HyA9hYlj16MksGC46dAkA3dd/qTeCGtuaKeBBietqIREGIFJNMQaT0J/by8ju3a7plRDvdlgsb5EM4poLC6hNQSFAlJJlFbO8kY7lSaDkIpqTy9Rvc7U/Bxzc9MHhxbnb65r1o419+2di/7H/zFDyEeQ8f/846cPyL3BB372BF6/wPfoXTQ9686mGyZPXh+6dn+CgYEBlhLN0sKibcQAkiQlSmP8MKDU20PSiqxrX5oRKo/+UoV9u3bz1FP7GBwZxiuGXLl1k//62/c4f/UKxVLRTh4p0ZnlDosHsrQ/9xC4rNghdcJTCKloxjFGSqp9fUS1Gvenpjny+VFW9PUzeuhlCrj+h65Glsc/vY84AQd55It61Iy4cukyX574iosXLjK0ejUD/YO0EqtH60sfUk19YZG02WTN6CivvfQSv3jzDbZv3Nh+WyUlKvAtNUBnGGWbL5aShHPXb/Lh0eMcP3mKsalJwkqFFatW0Ygipudm6e/tI/AkjaVF4kadDStX8tYrr/LaCy+wsq+PWr3Gos7oq1Rd5q7JsC5dGpjXhpNnzvG/vvceJ8+cwUjF6Jq14Hks1msozyOUgjhq2YVMKqqVqi1dJylREiOUIgwLNJpNms2Wa0r0HtqMH/YUs/cib0bTWUYcxVb9xbe8+cbSInGzRV9PDzu2bOf1l1/muaf2MFoukgLK0Ebec7m0bpSivUjngUvXLBLCbnytJOHW5ATfnD3DxStXiNKUopOpRAmUSxZSZwaUG+VIx5XPsItax1ToQVnC7knWXdBc/hvWFMgGp729vWzZsoViscjVq1dpNBrLG9QePUMfOTr4iXCuix1E2kpnaXqqPZhWxI1r1xi7d4+9e3awe/dujp/4gi9PnKBcrRL6AVEUt/mHmdY2sVcKre21aTSbVJ0ZyZmzZ1j7+WcMr1zBtm3b2LdvH+cuXkS3WgyPrgBoK4P8WzD+40ceaOb3s5s/3e1+nKQpS0s1RJay5+WX2blzB7du3eSrr7/i9p3b+EFAsadKkiaA6CSauWqWWzOzLCOJE4w2lEolNq5fz5bNtj/r/v1JpmdnyaTADwIbwBn92Dn6YKNlW/mhq5LlKeUoFa5HoVBgdnqG6elpZmZm2bBpEzt37uTe2Bjj4xP09fUtoz61KVr/G+eXFDasSrMEhMHzfWue5PsExaKT/Ew4c/4829avZ8uGDYz29RDy8DP6uK3xcUcnhcCXilaaMjYxwbETJ/j4k48p9vayafNm0tz91tiGcJNmJGmCh2Dz2vW89cqrvPrMc6zvH6AZtYiyjEqxaIGKLCPRGuUrIq0ZX1rgi+++5cPPPuX81atkymNodCXGSBZmF6mWKpRKIVnUYqpWp+hJnt37FL984w2e270bD4h1RsGzSiV5JVZISRD4GODq/XF+/9GHfHrsGJNzc5R6eij19VlJQkS7abxRaxA1W5TLJaqVCr7yqNdrtFoty9HP+wxE1/X7IwtiLoeZNyYWwpBioYDEKqTFzQbRUgMFrFm1mueePsCv3n6DfZs20ALb1JulCBGAcqo0SeIQ5wKGTjBubent+miMITPaJVaCxTjhwuWrfH3yJJPT0wSFIn4QOsqLVb7yPCt5mVd9cFVeS5O0MZbWuiv4/2Hzyf5d9z7ccS2XCOvcmRlMkkGaYeKUdRtX8cYrh1g1OsrkxATjkxNcvHqF67ducm9qktrCAn4cExaLKOWjlAB82xSbpNQbTcJigXJPlcbCPFO1emFocnzfc+N317Bh05XvVv4s+v479+cbP31A3jew/OeCr+ntA88jTFRYTIPeMzfvhldv3mHF5u0USwWariQpsMGg7/soT5ElCfNzMzQXFlk1soLn9u3n4O4n2bV1E6tXjhAWi5ggpFwp89kXx8Boh0bYMpBUHpjlsnem+4c/dbg26c7bdILiLNOEQYhSHouLC/ieor+vn8gPmJme4qNPP2X9qlU8f/AgQbHQRnUfPKQfJFQnrL62yQzSExQKIVu3bGXfk3s5f+0qU4uLpPfuM7BqFdVyhShOmJudoz4/T1+pxMF9+3jzlZfZsXEdvb6CLLNfApCSVFunN98Fk3emZ/in37/Pbz48zMziEgMrRin39TE1N4fWmmIYIjBMjo0xfX+MHVu38O/efZe3D73E2hUjxFlKIfAR2nPIAiAknucTeD6NNOXbM+f44MgnnD5/jlqrRbl/gMhxUJMsI7PWZQghKRXL+FJaubskcY6eNuNvNBpoY2xZW0m3ID06KH3clU6dPF5/by8KWJxfYOzmbaqFEs88fYBfvfMWh547wMhALwlgUkdLkUCmEUJ38eKcO5oQ+TLTHnmHu9U5hyyKuHTlKl9+8y3Xbt4irFQpDQ7SSmKr8pKmtllUCaT0HM9ft9UrLN3EGni4ymj7jDu9am7OdSWEeYwgjLVnRgmUZzekSrnEurVrkFIxMT6BybRthpTSNpY5JRvzEKjw6Ktr6BhA4BZ+sM9PYlIq5TK1ZosbN24wMT5OEdiwYT0rV4xAltr+BKWYbzYRUhEGIYnjNwolEUqAtuh5/0Afolzh269P8vXJk+w9eICNmzZyYP9TfHPiBJmSVLdsYm5+nqgVUSgU3HV63MwwD/z5/ef6f7jxQ9fHB063O9jMv88pKnlTpxA2wPZ9H8/32LNnN+vXr+fo0aN8feoU41NTrFm/jkK1yuLSEtLzUdLq3SvPzU0Jmc5oNOqQZQTKR/ghK0eGWDs6SJbB9NQMC4uLFKtVF7BGjqrStbKKR1fOuoPyHOEPPA/hWb5wM2rhKY9iGJKmKfNzcyzOL9Db08P2LVv4/Pe/J56YINi4ATyPKI7az6XJup/BvKz/6LC4oxCW3xPjroPlQDcbTaQSVKtVktTyfKXvEZaKRAuLXLp2la9Pf8veXTvp3baVsFR8JGr7/cFS508lJcLz2897X38/+/Y9xQvXbnDs65NcOH+BzTt20NPXb6lGcczU5CRxvc6urVv41Ttv88YLz7Fx5ShxnOA74MMm07bXRSlbJW2kKV9/9x1/+OQI35y/QCY9BoeGaLRi0ILAt1KDjaUlpsfG6C2VOfTsQf7u1z/n+Sd3E2I9JIzW4MzyjNsffCXJjOH6xCQfHjnCbz/4gOtj9/DKZcqVKvg+S7UGgKvQp1aCsFgk8H2yNCNLUlvt8FRbyrLjqfAAV0U8eDU78yxvPk/iiEbDNrCHnkezVmf8zh1MHLNp3QZ+/vbb/OKN19nuDPSyJEUKie9b9F6YFKEUQaFAvrbn+t3arffdFC2d7/FJws3bt/ny1Em+PfMdqTEMjAy7/jFrhNfW0c862v9aZ2idgcFJLjukPE+8l5286czhDjesfTWki2O0cS667gGRgHIMiSzJEBqUUAz09vLkti3s2ryBqdk1xEnM7Sd3cfH6DT778iu+PX+eetRCa02pXHV7jSQsFqkt1agvLbFqxTDlapXG0iL3ZucYuHqjuHZwaMtAZeAcwyOT3/NI/FnHTx6QF+l74BUfTY+IUHhCrJP4r83XW6unFpbo0xl+UMLThiy1Bj7K9/D9kCSJmZ6cRLdabFy9imf3P82v336LZ/bsYqgLXcyAqYF+ioF1T7PaqNa5TQkJSBtcAI/IxR549QeUmR4zcn6i5THbICNNUhugeR5BqYRWHpMLCxw9dYqdn33GoWcOsr6vDy0E0nQfy8OLczs4EPLBv7CLQQZB4LFx3Up+/s7bRFrz+ZcnuDF+n9biov09IK7NM1QtcuDJJ/nZKy/zzJ5dlCUWgUpSlDDkHEqEIJOSxGiu3L3P7458xvtHjnDp1k2GRlcxsGIFyvcZHx+nGPpUigVmx+/TXFhg/YpR/urtt/n7X77L2v4+pIClVkRPoYhUhnqrYYNx3yP0PBbSjNNXrvHe4Y84euIEC80mYaVMWC4SJTGpa1jMDM6xT1l9bGE7wNPESlcp6aO1IU4i/CDA9wOyJLXoQI5WGVyjI7Rh6a77b9kk1soYATpLiZpNovoSfZUS+3bs4ldvv8EvXnyG1QN91BOoR5qyb++HzRpcI2W+2bZ3YeHqchohbINtlmlbslMQAWdv3+HTL05w7sIl4swwVO2lWKowtzBPmqZ4gFa2vCmRGKHbHfVCCoSydJPuJADyXgMn0WUswcRg3RIFNrETGJSwygxxs0Gr0WB0qJ+9e3azanSU8+fOc/7Md0hgsH8AHCpCjhD9mOGus3AGEGQdbq/yFElmFYDGxsZYSjWDnmTHtm1s3baNKM1YnJu1x+spa5/szlEK5+AmIY0TUB5+yccvl7g5do+PP/2UX/zyXTZu2cLa7dsYuz/GwuwscStqu53mMl9//JS6STr/hqoDXY3Fsk3/aVeckoQkTRkaGmLj2rWsWbuB6dkFjn/5NVdv3kIVihQqVZTvEy8uoTKBDH2EVPY5NRqjM6QEhWBxdp6SVOzeto1djqJw9f4EY/fH0UaA8jHCqkp161j9sTuV08syJ7HmeZ71SHCUm5QUTUhYKqHTlGs3rvHUvj1sWb+ezVs2c+naFRr1JfxiET+w1TujOzrkVnrOJis/tstJKmnXuDTBlyFhGGJ0C51mJCIj9AJ0UGAuzfjm/AV+e/hjyuUSB7ZuITbgiw6lzt2wB4LGx18lKSWJo+AMViq88vJLBMUSKixw7ORJagsLSOURhCGthQX8NGXNypW889qr/PqtN9g4NGCdhxsNKsWSa5hNyXTqqriSmSji63Nn+N1Hhzlx6ltqUUz/ihVUq33Mzy8QeD6VQoHF2Rnqc3OUAsWrLz3Pf/frX/L8zq1UA584v8YYV03UlsoQShIDV8cmef/jw/zz737HuWvXkIWQ3r4+ZBjSjBJaUUTg/BeSJEVJZdWsECQ6s1rh0krr5etsnu5JzLJkrz3vXH+CnV+deaakRASBdQbWKfWlOrX5BTw0W7Zs4q3XXufv3nqDPZs2WLDJmR36nsKTkCX28xVYOUoc7QPdpqjYnimrd24AnCzznZlZDh8/zudffsnk3BzVkRVUe3tZrNctSOSSv1wcQAjLQc8bpIVYrq0vhAXLfsxYXpWy10oikcbSVXJUP45jesoVquUSg+Ui/UDPQB8K2DI8zPZNmxkeHKRaKnLm4gXuz8wSiwYqCAiKRYeUa9IkJklSfC+gVKowubDA7WvXqxtGVz9d2Fb/jmH+1QLyn5wUMzpTXPa1aqrkrZgrBMVMUsjSHbIR/w9BUFrnVXtIHF1BeIIoS4izBKGsKUuaJkzev0dfpcibL73I3/z8HQ7u3kVBSGIghnZ5JIsi4qhFZmxjl5CSLHPOmbqjFGLVGADyJjLTLncbOiYQdgI/+j/oxB7CWItaaUCnGWhDwQ8Qxga3pUIJT/ks1eo0o5hSby8btm/j2r27/L/+0z9w/vZNDJAiSI1rZLWfwHJ9OFt6yrqC9jyJEFI46SWBU/tjy+b1/Ordn/Pv/+av2b19KwvTE9y9foXG7BQqjdizbTO/fOtV9u/cSo+ySLDl7YPwPbSnSMBm30Jxb3ae3x7+mP/8z//M+Ow8w6vXsGLNamtXPztLIQwohyG62WLs+nUGyyX+h3/3t/z6zddZNzSAUVbKqFIsICVkaFAe0g9QnocEzl25wn/9zW/4/MQJ5paWqPb1UaiUyYy2XDCHRPiej6d8BIo4TonjBCnsYqk8391T7RrIbDKWJTEmy/CktNJ5ztTAlrDzIFk44wPLqxOepFQqEgY+4/fvcefWDchiXnnpef4v//3f8+bLzzI60EdiwCQxPimesnbuaZpgpHR643a+CdExYxBGu0bTzOmBOjk34PL1m3x45DNOfH2KpUaTkZWrUL5Po96wTc3SXgtEp5kRx522QahFJzKXvOTnhLFNLmDwPIlUwqEnpq0bq7MMnWZW2rFcpNVY4t71K2xat4bXXjlEf1+VW9evcv7bb5HGMNDfbxteTcc+vD1llw3T3qhkV2iUy4UJKVCuIUgohZ877qYpwveYnZvi7u2bCOCpbdt58+VD+Jlm7NYdeioVCqUizTjqUFaEhxIetlMB5mtLzDebrN2yBVUI+eTzT/n82FE8T/E3f/VrNm/YwJVz54haTSqlom2SNTmC48g1ucNcO1axP5iur7YF3X8jwzzm63EjVw/JA3LP85zucWadgH2fZqvF+P37DA4O8uprr2OE5OiJrzh15hyRgZXr19LSGY1WRKlYQjkUL199bY9RjB/4DPb3szg7Q1Rb4qVnnmHP7t000oxbN28xOTlFWCgh/ZA41TYoF6Lj+Nd+VpwhiTEdlSfRoVIJLLofx3Fbr9p6XChaUYv+wX76Bwe5dOkSVy9eYqBU4mevvMLz+59ievw+83MzlEsl4jgiiq2GtdaGNLOGbMpT9jmEP1Lut+mzzilpOK8Eo0njGOWCWTIbiIbFAqNr1jA5N8d7H3zIF6fPMdZKaaSdPg9hQGiD0MZWRk3WPoruIxLLAAXT5vYaYKC3h6ef2sf//f/2f+Wvf/UranNz3Lp8idrMNLNjY6waHORvf/ku7756iA0rhokNpAZ6yiU8T2J0YgUbdAZCkmH3gt++/wFfnvyWeitmxegqCoUyraYVGqgUS/hKcvfGNeLaAs8f3M9fvfs2zx14kqBUJDEGk2W2iuZboC5NddtU6v7kJB9/dpR/+f37nL18mXJfH4MrVyKCkEYrsr1QQeDQYdluZmzFMXGWYYTEC0JbLRCSVDuLd4dGa1cNUZ51GM+rgMbNM/sFRlikvt5qUSgVGRkZptVscvfWLeamp9i5fRv//d//e/7Dr3/Jjk0bSIE41ShtKPjK6W5bxTTlqqu4c7f9cxoPgSckvrAc7ShNiY1GCcn9pSWOn/2OD44e5dqdO5T7+ihVK+Qma1li7elzUynp1LRywznP7ck5Q8BS1mR7ztp1XtNZOA1GaPvVNb/TxBq65fQg2yxqqTE6zSgEVt2m1miQmhS/EJC5PSvDglhGClb0VDi0/yl+9cYb7NmylaJStBo17J6nSOKIMPDp6emh2WiRRCnVai9RopmbWyiZJNmujBn9I8vin3X85Ah57T//ZvkLs7OZeeIJvENvIgb6C41G1JcKhSgUnARf13857SNJMGlK4HmsHV3J7m1b2blmNcPKNrwZN0Fs8R+Uk8MxxrgSOuTLjnAPRxtJNp3AWkpJ7oao8zJJVxD1w0YHcxdCtAMdtO1gzjDtyeaFAcr3mF+c5/LtW/z+k08YrPSwZ8MGQimJ04yoXsdTnrP1to2piXYW09LDdAOv+ZAs2zH7igX2PLGF/v4+UBLPkxz78gtqMxPs37+fX731BocOHmSwXLacayMs2qpw94T2g3VvdpbDx7/g8LHjXLt7F79SpdjbQ6I1WkChUKAU+NRmpmktzLNl3Rp++dabvPvGmzyxfi0BkLirJIU7UGGbLovKoxbHfHPnPv/04Scc+fwok3NzeMWCtUHGupeJLmMfrTNbSUF2EhOnZGLRM41AIqRTMTAWnVOi26jDIJ2NtsFJDTp01qIOEoxmbnaO5uIiJknYsXULLxx4mjdffJln9+xhoFBAYUt3gWfdwoQwroAhl8VlD/JS88UrTTPi1HIHY2O4OTPLR8eO89GRT7k9MYEICxRKJSJtjaTyOZs79blaZGcOdgoAy2avrQaYtoqB1s4l0AjiOCFNDaHyKIZFTJqi45io0SCOW3iBx/btW9m2dRP1pUWmxu5BvWaTCac1rcHJaz36memiVi4bxgVBwmYrSGc4EScJGFCBT6FcZnpujuvXr7J11Uo2rVnDs/uf5szp7xibmCCOrAqC53kkrQSNbhtXSCnxwtDKlqUpvf29NNOY+/fu8e2Z7+gb6Gf1ylXs2L6NO3duY4ymUa9TLJaR2MX++0e+ybjzfNhx6S9qdHOku5FxKSVJkhA1m3hKsXr1arZv387Q8DBfn/qGjw8fppmk9AwOUaj0sLS0iM40BT+0SS6AEFabWmcUCiHSGMsVBTasWsXenTtZ29fDZK3F9Zs3mZiaplztRRVLaCN+dLOx/UjRljfsli3sfp6DMCTSTe6P3WNybIxQCHZv3cKurVs4efoUrXoNo610rzYdp0PbIKnb+1j3s2MRwu6d5RFDgtAWvURbJNQYuz5q7PpaKPvIwhLjCwv8y4cfUCwVef3Fl+jtLWEMRJF1hAx8G0gZk5FkMcIpaDzyuTX5Wm4Bo4IQrB7sp7enxwoaJAmffPops/fHWD86yi9ef41fv/U6W9asxsfiTKrtzGt9GaTy8FXAXKPBt5e+4x9/9z4ffX6M6Vqdck8fxVKFDEGcWom++ZlpkkadkZEBnn9qH794+3X2bdtMD51nVkoJ2rp6Iz0KRY9WknFzfJoPPj/GHz45zLXbtyEIKPb0oQpFojS1wBTOqdm4ewTt5sfUaOvcLER7D7bFFNXp2dGaKE7QOrZrkHMTtq7Gpm1sgzZWTSYMieoN6jMzzM9M01+tsnPrVn759tv87NVXWdvbi4eh0YpQ0sP3PIuhOEBRtKu8DoGXAmFkuzorgCTTJNr2MxmlWMTwzeVLHD52nEu3btFC0NvTg1Ce1SbP53z387D86Vg+KfKg5JFLYNfcbq+V3W+Vt3TmsYdt2japdVE2nkEK5fYHlyxk9g2c3R4KKACVaoXW9u3cuH6dy1evsXjvHjpJnSNr3oyqyKIEpMLzQuJM04zigsiyDbLJEHVyW1AeInz8mcdPHpBPHf7Dgy8l3sxEMjI7S6G3z59dWiLSGj8IrH60e2g8pVDC6nDW6zV0lrF25Sq2b97M2tGVFAMrQWPaCJtox6ECN/dcyWNZ0U0IpxbhZNVcycYuOnmQ5wK5dpnJfG+jcPvv8vnXRtlNu5nO8rs7D7MQwmbGmabS04+H5uNPP6enUKL33/87NvUPgBBEcYLxLPcZ92/SNLWNqsKaGeTntWxOS8eEcNcjlJKNK0d469DLDPRVEVnCzMwMv3zzTd584QXW9NoGy1Yc01ep4Pl2aqRGg1CkEu7Xlvjs1Cl+e/hjrt65TbG3l5LrB6g3GpQKBUqFAJKEqFanUijw7ltv8O9/9Uu2bFhrXVZbMUFg+cyZ0QhhHy7fJVcXxyf4x9/9lvcPH+b+1BSlnh7K/b0YIdyDZ9VChLQBvdHGlrGUaC+SNvB2m5sUboNzEmwIvPzaOQk2wPKM83+f2WRM5JJkJiWNY5rzCwRCsG3bVt59603efPkQW1euoiwkkc6sjCTg5009RiM9u7Asny/2rgiRzx2BkAqNppXE+GHI2MwsR058yYeff86lmzcIyhWKPb2k2rQVTDzpublpHrBpfsRk7VoYtbbd9b7XoWIEUrrjsYueLyVBEICU1OMmM5MTSCHYuXs3u3btJPQ8Tp49x/3JacKhIYtMtFqIvFypdVdFoHNMeSXpsceGIUoTpJZWNSNNqTcbeIUipXKZal8/cwvzXLpyhaf37mPz8AjbNm5kz7bt3L43xsLcHAVjKFaqZLGTm8s0UguUZ7mmsSu55m5t/UND3B+f4OuTJ0n2xAyvGOHgMwc5e+48S0s1wkLRmkktP9Tlh2/axasHzvkvNyjv1sHPNYtLzsSpXq8TR1G7OXjl6Ci3b9/hs2NHuXj1Chs3bqDUW3F6zrQdYD3lWyUmrcm0VX8qF4u0aktMT0yyaniE554+wLrRlVYqdLHB9Zu3mJ6dodrbA0FAZjIyk6IdaNJuIu4OIPLApmvkAfkyp1EXkPvOlTRHz8kyZufnGJ8YZ9WKYbZu2szalasZm52hvrREsVDAYOkPQtkyfJqltGlb3fPm+zYfcjAm7z1y/xl3/bW1Fs8cuNQ/PELcbPDVN98Qeh6rV66kd89OejxFnKW2aig8WwkwhkzbCpkip9N0fyZ0+qdM++8FUPAV+3buYMXAIKEUnPrmFK+/+jp//dYb7F63hgyoxykl38MTefKGBcSk2wvu3uS//u63/OGTz5hcqNG7YpRy/4ANYrGcYpNlLMxMo9KUN956k//w61+zc8smeqpVltKUglL47mDjLHOVBBsrTCzM85tPPuWf//AHLt28hiwXGO0bRYQBUZZarW3sPZdCkmZpWxUH1yuT6Ywss2o/VunG0gOVygNSpwakNWmmkbrj/Gx723KTNvunBRRhcX6eqF5jsFrlxYMHeevVV3lx3z7W9fcTYWg2m5CkBEVll9muosWyaesSPGuc1ZnbWaZJspRCschSEnPl3l2OfPEFX393mgRD/8gQfrFoqwCprd6A+FMEUx47HodXWDngXJ0JjHFJq7DX23LToVAqgIBWFKHTzv4ijdUsTwV4CHpLRZ7YvJnNG9Zzd3oanSYkcUxO29Vo50IrXYVYIpT0DWbYNHQPM9AuEPX9+c7/UeOnb+p8xPDTTGy/O6VWElbn5+ZJjCEMArsIZBlGZ1byR1gR/KjWQAnDilWr2bZpCxvXraNULLSRA3h05p5nacJYjDKXnDP5QiwlwjUi5Jtqm36SfwkeP3O6P8b9YBf59t+48rXDzrQt1QgsZQDHl/WDAB01uTN2j2NfnmD1ylHC519gw9AQlZ6q1VGOIkLf6oALWWijy20joAeOK3fuzZyiilACT8KakSHKzz5LX08PS0tL7N29i5UDQwD2mochnucDlntvhMIHGsbw+Zdf819++zvOX75CPU4o9/WRuWCwULCuWAuzs0zevctwtcKLzx7kjUOvsHPrNgpSoJPMJU4SrVNXpvXx3MN3/s5d3v/kEz7/4gtuj42hwgC/WMBISbMVoaWVWzJuYTBYGo0StiM/dQ6ieY+AlNZFVCqBERK0wGQWZfeU59QaNEkck0RNkFbeMAxsg5lxTa31+QXmZ6ye7XMHnubF557lxQMHWDs8TFHYh9jKLVrDjPz+m0cCBPniaGeYbYax0ksqCAiUx2KWcebaVQ4fO8rZq5eJTEZPtUxYKpBkGdqZRKi8otTmv+MCw3zV7CxS3RNW5UmqMxQRCKdgAWEQYJSlaNTqdcqFkGKhyNjtWwwN9vPM/gPs27kbpQ3ffXua+xP3GRwZJiwUiNOUxGSukUf94JpS5zkSCGV1gTOtKfkembbasZSsFnkpbjE9N8eFq1cZn51l5/AI61etZNe27Xxz7gKXx+5hfJ9qb2/bpCPLUlc29vGMtMGPyWhFEVIIKtUqi/Pz3Lpzh97eXtatX8fIylGqd8eoN1v2OUCAMO0Eyv4oui8zQrjkvh2Z51DAX2ZQniOEOXc8r1garYmdlnFvby+jo6M0m01u3DjP/MIclR4719M0pdGyKLpUvvVYMDZQTNIE5SmKQUggPZZqDZrzi6zZu4m9u3czMtiLBiZnZ7hy4zqTM1OsHx4glZJWErfVgh40isvDy7yn5EE0PP+5A7J0oiDp1JOkUuD5TExOcub8edave5vde3azefMmZhYXWJydZXh0FOl5NJMmQnSCAWHyYLwrgXXHtrzS5QAo53xoDyOvzrTDcqBDwckRfHRKM2px6eoVPv3iOH2VMnu3biIo2kpDkmagLf838IKuPaYDcHXucf4ciLYCTe7WOFSt0Fcq8vd//Ve8+MxBdj2xnS3r19t/r8GXEiUgTlKSJCUMfTypaAIXblzj/SOf8tV3Z1loRfQOD1PqqZJhZe0CP0QYQ31pkaLvs3n9eg7u3cuurVsZrpQJPYlJU4SrSGdphsapY0mYbbU4ceECH35xlFOXzpGiGexfiV8u0Yhbjooi8HyJcHxlka+dxt4NBQgh0S7WlXQMAa33Q0aj1UIqRaVim4mzLCNqRTSaLUul9DzCICAIAgLfo760yO3btykoye7t23l63z5ef/FFdm7ZxKiTzfSMQfm+dch2dEuEbVwXbgHKJTWNSxSkUxUz2sYMvu8hPEUI3Jif5/iJExz/8gR3xsboHRik0tOD8BRJ01YJlJOOzveMP/Lkd741D7+0bJjl3+bVlnzOGUczlnljk7BsB5P3BWFBJCGXV5SE6TAsSkHA1s2b2bxpM6fOXWAxikmi2Pb2uc8RMl8LLFVVmwydxGVD1kdAByH/icdPHpBvf/HQsp+j2hJ9q9eqrbXGiLh0eWBqatIiVYUCAFliu3c9XxEqD52ktGoNqsUC61avYtvGDYz29rSv0YP3uXvREnQC9vx3c/TUBk5Otqdr2WtP4rxRVP/wsOJBhDr/XB4IkNq/Y+wDLZSHkR5CeVy+dp1//Od/QRrBL19/nZFSiWIY0ogi4sxxwHJ+mEssvvcI87U9s9+XlKLU18fw88+TAbnUfZYnRTm3DXtsPnCvXuPo2bP8lz+8z/FTJ8EPKFaqBGGxjbwoAYuzMzQX5qkWQ15+4Tn+w1//Nfuf2E6PEm1OnXKbmLbwNZ60/PR709O899Fh/tff/JY74xN4hQIDw4N4QUgrTmi2WtboIghJ0qxdGbCukO4UdYYxHdk/4aAD+3nGPXwCnRjSTIOwRhXS8wiVNSGwldOUJI7J4pik2aSgFE9s2MBLzzzDO6+/xs7t21hZLucEBYzReA4QsWzLfDPtlMa7seIcrbCokGNQC0EALBnNF6dP809/eJ/j355iIWrSOzJEoVq2yFESgUMMlLAByg9ZJ/IjEdjycI6g5VM/dwy0C7UgS1KSVkTqWWwsjWLWr1zDW6+9waYVo3x7+QrffPMNU1PTrNu4kdQYojS1Gz9u/v9INKXtGtdFN8OVgv0woBSGpFnMzclxLl+7xu3792luf4L+YoGndu/mu8tXuT0xbqUoW/2EoVXjaDatcZLWhszZm0upaDSaFIKAUrlMq9lkcWmRK9euYYSgp6+Xnv5eaq2GNanKA65/Gz94dKvStMv3TiEpT4R6enoAuH37Nt+d+Y4kSxgaGUZIQRxZR8fQD5BIkix1m6a9j1JJBIbG4iJpI2Kw0suBvU/x7P4DDFQrzLZirt++ye3792jGTcqVIqkQxIsJaZIn7T98C+w27pFu3Wmvv6ajsR4EAUNDg0xOT/PxJ0d4Ye8edm7exEvPv8D41DTnL12k1VMhKJUB7bjsbgFx+1A3RQX+yKNkYb6HNz5nTd6uWOkMoRRCefQPD7PUavGHw4cR2iDNm+xev5ZqGNAyneqDJzy6KTSmjcN3gWHuQPPKlzDgCdssKjzF8/ueJHlyD0Vlr1mS2d3YF5LMJVkoixovpAmX7t7hvcMf8dvDH3P3/gSEIaXeHoxrIJVSYHRK2opoLS6y74kn+Ot33uH5A/sZ7atSwAY2qZtvOlcH8wOMECykCR+d+JL/+b33OHnhLDWd0Dc0iF8tEQtNPYrQxlbTfKnIksxK6jqqSfe6qYTbj4WLFRxN0tgp4QC0PCHFzTlFoWgVyIQx6DSm3kiYrdeROmP14BB7d+zglRee58C+vezcsIGKstXxOMvwlUR6vq1K6KwdkLfvPQ9+axFBndl5oKTCc/P2xuwsHx8/zuFPP+XqjRsYIQnLJVQQ0Ipjkkx3cRD+lYAFkasyZe2+PlcYt5UFJS19JUutQaFSeCoP4HHX3yBdVafgKTauGOYJV4lbun2HZr1BuVp28UjncxGW658Zw0K9jj+/WBnqSVBGo7IU1pZ/0lP/yQPyn/8//p8PvSaEkGGp3Hvz/Jnq/Pw8WhvCYsdVCodoK8cTzuIYr1RkxeAwg729BLg40xjyxqllyij5wgAd9AraTpi2ccw4O3FLYbFlVdN2Cmy7p2UPOCi2T6L7hy4Zn4f+3rQfTtNeb20Ql7tDGmNQfsCKlauozc1x+tx5yqUy/dUqLz9zkNFyGT8ISOIYk6aOn/z4h6N93sJKYpm85JsKyzVU9sYLY2g5IxnfU20jlCS16BVCkQFffnea//c//C98c+EixvMYGh5GBSHagK8syhw16sxOTTJYLvP80/v5u1/9kpeefooASI21/xVglS6cwonnW77xtfExjhw9xu8/+ohLV6/SMzjE8IpRytUKC7Ulosia+XjKQ0lFrNP2w2kyG5xbqSfhdEZt0GmwqFaWZmhhHFpnOXdZZojjBCUlhUJg9V4FxM0GtVqNqFZDGYPSmi0bN/LKSy/xxqFD7Ni4nhDLkc5Vc3wlLcfNbWQIvid4W575I1UbDWgCt2em+eCzT/nk2FEWWy36hofpHxohSmLiyLriSek0xl2ZdzlX+YGkL//ZdP3sGg+kcP0NxjgGPi4QthrLwveIWi1kmjLYP8CTu3axZ+cuW06+cpX74+PEaUJYLGCSBGEMSlk+rDa6/Ux2o3wP0VXah+2SGGH5qpm2981oq6tcKBQoFYtErQYZML+4yNj4BBP1OivKZdZv3MieXbs4df4MV+7dZWl+nr7BIcIwJEqSNmKYJCnKtxzzZqtppSELRSt5VRdMzUyDFKxYMYrv24af2dk5e50dVUHk/JRu6NKFKAL90B34Sx45wAE2eI1dqbhQKFCtVBBCMD4+zp07d5ifX2BgsJ9ypWxlSh1vXJjc4dMmaa53zUontlrUpmYoGHhi6zae2v0k61cN4wNjkxNcu3WDetQkLBcplIpWdjBJiVrWzdf3H7+Wdq/7+Xnk55LvEZ6TPtTGkCQJUlqDoOKKFYzfvs2p06e5OjbGnu3bOLD/ac5fvMi1a1dp1uoYhDWZERawEHkfjKGrKts10boepAcpaibfZNqn4hIgk6tRaUxqdfUlhlVr1lCbn+f67dt8+Mkn9FZK9A/8gifCQaQn0ZlaRk9Yjts/6lrh+nLo0JTyvUQqip6ya3FmK9JKeQhpOdTWodkjA67fvc8nnx/jyNHj3Lh7j0K5QliqkGpNFDdBSgphSNJsQZLQVy7z4oED/NXPf0Y58K2ClqNbCiz6LqXEDwMkMN1qceHGdX7z0Qd8cvRzvHKJlevWUq5WyYBGs0WSZijltymsdn20Jm1S2CqrxoDKK0B5BUFbjrmrriilrARlkrG0tESSxvi+T6VSpVqu4jnjnqWFBZqLi8xMTLB+9WrefetN3nrlFbZt2MBQb5WSEmRYnXGtNYEMuqrw+fzISS9d67trsLTtRZYyk1N9NDAbJRz76ms++PAjrty4hfJDRkb6CMKCNZdy/TiB0/3XXZ/1qPEj8ZfHjnzupK5pWgjLw1eiI+agtb0eYAh8D08sD8jB5ijGhjwEwMrhQVavXMmNe/dYWlqk0lN21TvdBtcspdUnE4Lp2hI9k1OF5/2JClrXhE5hz6Y/01k+evzkAXm5XFr2syv/KY+sN64tVefnF5DFAsUgIMtSRx9x9BJHh8jSDCUkQ/0D9FaqFukGjGuOfNCMJC/NoLuUEfIGGtclbYR1MDQG16jTkZzqNmrIrewfWrTzOEd0TcTlnQk8+A/aG7lb3NrcP4e4eL5PWCoTRTEXrl7jdx9/TL0V8cbBA6wdGsQPQ5bqDWqLS5TLJcvH5I88CCJPnkUHucQ2yqVphud5eJ4z8HD/JFfIGJ+Z5uzVy/zugz9w4coVZBAwMjSMUFYZQGuNpyTN+iK12TnKgc+BvXv421/9khee3EN+51PdybFzmk4grYTYZKPOJ8dP8A//+E9cvHaDYrlKpVJFeR6tKCZuJXhCUSoVrdtmnBI3WtYqu+iTaltRyRuDhGrPMUdXyMhMhlRWdURJZQ0NhL23SgjINPXaEs1ajebiIknUYqSvjyc2b2bn1m08s3cvT2zewMaVo5SBOM2sQ5tTaJGys0wJh+g+ZovHGGHNSwAv8NtasBK4cOcO/3L4MMe+Psn04iLVgX4K1QqpMdSaLbJME/gBuGsv6EZF8kU5/9l05pz7MT8m7VzPAt8ndRSYXN0hia0HQOj7VCoVJu7dI2s22bdrNy8/8yyjpSKXbt3mzJmzaKMJAp8oTYic3nchDGi0IpIoxnfNs/Agx90dkmgfWpujje7UF+I4cdKbkjAMKZVLRFGZQrlInGVcv3mT23fusOKJJxitFtm5Yxu7d+xgfHaGuelpgkKBYrWHIAyQRqAzFzRpkJ51WgVDFEUYA0r5xEnKwuISwlNUyhWL1nQucvt4l91V0f36g4SDv9zRVkbo7nNxgWzg5NiWlpZoNpssLS1RqZRRnqIVt2jFLUIvIAh8kiQl08apWxhSR40IA5/AWIR8cHCYfbt2s3XjGkrYxvHbY+NcuHqZVhpTrlYIA59iqUwSx8zNzrqqUBFYjubnVTWBk+A0y7nmDxoc4egsSZahlCIIAorO3GZ6dobzly7z8ssvsXXdOg7seZLvznzHmKvk9I+MgOeTpJo4yZDGUtragXl+POLR63yejAuRJwydpBoB0sg20JSRYYx1MtZS4BcLhOUydybu89Fnn6P8APHKIbavXkkQBkRJRhxbtSjldZo620pUjzqeLnBMCsutNzpDJylgLdaFUO01Sinr3NlMUm7cHeP9w4f5/aefcPXuXYJShd7BIVCKVpygPI8sTaktLlCfn2fDylW89cpr/PLN11ldDh2gYIUdsiyz1Btpuf3SGBaylC/OfMfvPvyQE9+eJhOKvmovpWKFNNW0koQ01RQCOyd0Yqk7SghrQ6/BpE5rO69mGNtUqI22dEk3b/Lm5TiK0BrKxRKeV0VJS+2ZGr/P0uI8UaNOb6nM+tVreOXgQQ7ufZIXnt7PE5s2UvZ9Gzy7IN9zFUQBmNyN2PU+kYfjXd4rlvdtk8lWK26vz1LA5PwCn31zmg+PfMqZixdpZBml3l7KPb3Umi2aUYwRuYKQR+IM0iTiB69qy/LKR82Vx7yupPUSiaKIIAzwg4AsTTvphwticvDLgof5c5BrG9hnNtGa1FhBjb5ymVWjKyj4AUkUt30vdJYrfBmEcg6jEpZaTUrNBX84XShidN1k6Z8r53js+MkDctNYXPaz4xKKoFyuZGlcqtVrlIMAzws6LoNIJ+Hm0IjMNpn19/ZSLpVsMP4IKkm+Eeqs07CZv27fCDzPGgRprDFFnLu/+Q5V1dItXDmiKn/UBHzweH7YsA93ZiAsV+j3AxZmZ/n865NMzM6BgF++9iqDYYjvKZbSlDDrZo135BqXhQ35DIYOV9L9oZ0UknJBoc51ll3jUpQl3L57m48++ojPPz/GzOISvaMrCcMirVbLmc1AywWxBU9yYM9e/u7dn/P6/n0MlYokRltr6ZzGIaQNioWVqbwzO8eJ707z3gcfcuKb0xSqPaxdswbl+URxQtOJ+Qd+SKFQsnziqGlLUkJZnWzj5APz+2S000jNyHsFPIfGWPAgQ0kPpYQtRUYxcatJEkeQpvSVSoysWc1Tu3fxzL59PPPUfrauGMbDZt+tJEPHCZ4SeIHvrrOt1Ahh9VI7CWL3/MsXEdfdLoQtlwGLccLU0hK//+wz/vl3v+PO5ASFapVKXz8oxVKzTjOKLKokJNpkzkpYdKLBHzzP7DUymUG75uL2guY2boS1Uk60RXB6CwVef/llXn7+eRCCkydP8c2pUxQKRQJPEcWxbcT0Ayu1Jrp13Xn4wXjUkbmF1PIFlW26TVOSKEJ6ikIQ0FOtkiYxvf39zM/O8t25c5x5Ygd7tj9BVcCWtat57dAh7kxMcPSrEyzMz4GnCMMSGEmSJWCczrsUhEFIlqXEcWxlu3yfkhBoNEtLNdLMLAvG/mwQ0F/QyB0586AcOshzs2Xddev1Op7n0d/fj0bTjJsWSfUttchkKWDl3OI4ITEZQeCjJJg4peD7bN2wkecPPsP6lSvJgJnYcOnGDS5euUwziRkeHKAYhvT1VC2ypjNrGpXzwH/guTwYkHePPPnIv8JikaBY4uTpM3x1/EveefE5Xtz/FFeuX+eDwx8yNjOFjmM8J/dqosRppf/wbTnPxdsUWmPalbo23112ghQjBBmaWqNB6PuMrl3D9P37nLtymXqjjhIQvPsLVvZU8TxF1Mos+k0Hi+0q9HYoal1ZaY7VWj655aRnWYqnPDxl5V+z1FI4lGdR3PmFGmfOnuOzzz7nq1PfQBiycv16giC0coDavl8zapE06vSXyzz71D7+/q/e5alVo2TGWCk/t5Do1DXbhpamMtFs8u2li/zj++/zwccfU49jVqxeTblSJc40tVqd1Gh8P6AYFEiShCSOEEikF+ArRZoltjGzi3usM+16TLS9TlJ1qo1OHCJXQvGUJIkiGrUlavNzkKWs6O3jyZ07ee7gQZ4/cIDdmzfS71nENwOSJLEUXleNkVI4tRg7x5DygXbbPLns0GbSzJBhCD1FJqBm4NjZ8/zz737HV9+dZr7epGdggFK1Fy1s8pOkKWGhgCe9dnJoHp+H/VmHXWsd4Of7FEoFWk3rLZJqg2dU218DV11KdP5M2luTQ7F5MzhKUSwWGRkcoBB46NQCPUpKUqycYyY0QlklLkFGrdFgIK6FZdUsG63njEnTn/rcf/KAPAwtNzwPFuNWiyyOhDTGN1nmJanVlFUq53PjfFKsRqXEBglSSIqFAoHv2+KwFIBqo8zQjZDrtlshrqsZd5OFVPi+5zp5hdPFTcmE5c8aKawEq+mirjxyve4KtvK92q1SnV/PmyzobOhd79VezNzLUZzge4qgWCQol1iq17h47QqffXWCkcEBntuxg4FKhcHhIVscdw0axulPKyldmYr2+S+j2+THICAMQ4IgsCWb1HLkMq3xgw7vdnZmhpmZGRYXF2k0mjTv36fejCgVC/T39yOB+fEJRJKwZfNGfvbG67zy4osUg4DEaLI4RgW+O0bArWMSGJ+Z4/OT3/D7jz7kzMVLlPr76R8cJiiWacYx9VZEkiT2GD3b6BcnCZk2FMICxhjiJLYIf26u4Rr4rKmElUoKAt8aZ2QZrVaLRGvKpTJoQ7O+yNL8AlGjSeh5rF+zmoNPPcX+fXs5sHs3a4YG6S2XMFjETacppCmhb/Vkc3TEYDcWK3XVpU/fnpm29JlmmlQb/CCwmuhYzdTr98c5duJLDn/yKXfvj+OXShT7e0HZKkEUx24z8131x+kBdz7gsbFi9yYKHfQm04ZWHBEUCgRBSKPZRJuMMPBRUhLVG0zPjiO15omtW3lm725WFwJu1FpcvHyVW7dvMzAyjFcqkQlb7UjiyBryGGNRBjsRH0LHH4WamK7j85WVlovTjCxOSHSGrxSVSpk4alEuV5ienuH6jRtcu36LpVpEfzWkr7eHA/ue4vT585y9eI5Go0F9cYnCUNEqIhhbshXaYDLLPbQVE/vpUkq8QgFtMjKd0Ww2yEv/udrS467xo77/Sx/aqRR5nm0oS7sC4NQpJqVJgnSGYFJZPePM2NezTJMmmQvsrG54kqWAplAo0qwtoWt1Vo0Ms2/3Lp7YuoW+coF6ppmYnOL23btMTE/TjCN836MYhFSLJZaCml0zXdCaHyvQVmWyP9BOJh4ViHfLOnaUM+zvN5tNisUi3vAw12/e4KuTX3Fo/162r1nD888+w/mL57k/NUGzVqPoecigYD/QJe45uvj4+KeTIEqE9TmANkVFO0m7/HiVEG3KpDGGRrOFQNA7OECWpcxOTnL97h0+/PRTysUir7/wPNtGhjFFHzJIUosedvXW2Wqy44MjhUuqtXOslK66nVqJX7/gRBUMJksdqixAWAfoubk5ZmdmqNWWyOIEIRWteoM0zaj29tBTKtJsWGWRShByYN8+Xn3heUZ7e9BA1LJ7jZTSHpNTOvGFYD5NuXLnLh9+/jlHv/qK+UaT3r4Bqj19pFrTbLWsU2jgE/hW0MAqwwo8365FSZKSOd8G4aI+LYylbwuBkh6B7znEVRO1rBNsT7mKFIJGvcbM/By1xUV0mjIyOMDunTvY/+Renj9wgE3r1zJcrRIKSaQhNhnCaDwhUb7M6c3tqFgoDyltfKPJ2vQUsN4UCCv3nKQZGksRC5RgptXiu4tX+Pizzzl9/gKLjRblnh6KlYrVVm/UASgUioRhwdI9U+sNIV1F4PuD8m7n2+/7vXw8vGJauiP4SlEICxRDmyDFUQzakClbwfeDAGMgiiIiJwMMVlghrw57UoBjP3ju/SyVy/ZMSZE/Nwbhnh2lFEJrGlFEkkSeL7OCMVppkf0fPyD/5P/7HwHazRUbdu9hw549lgdkjMj1aXPObd6h7GwPXGOXdSMrFAvtgNHKOy/Xa20j5Npx5ox5YHJIx2OD3p5+qqLCjJQ2O3Zd/9Jl2cY5DlqB/c5i/ENHjhI8alba5+oRRW0pSJ08mPADvFKJZivm5JlzKKmIkoRD+/czEIakaUYjiigVbLe5zjL7wEhD3gjXtml/YGFvq8x0ITzSNUvkSVHg+6xbu47XXnmVyvAKro9PcG9qmunZOZrz8yxOTuJJgdCap/bs4RdvvsHrTz/N6jAkMhqtbalTQtu1LHByVlOtFkfPnOW9jz7iyPEvWIpabN6+HeX51JKIVGu0JxEyQPoBGdByRi/KU4QFq8DQarYgs9q1OdUICUIqPE9aowIXDFieeUqr3mB+cgplDJVSiRX9fax+4gnWr1nDk09sZ+/OHWxcv57VPVVCINYZSabxpEIJEJ7VP3Wcl86m19W2qbVt1pF51zam3XxppK0SaKCWaW6MjfHx0aP8/sMPOX/lCgQBhXIZ5QW0IutI6ikfz/cx2pomCIzrI/jTAkCpPDJju+e9MEQpSZrGCAHFsIzE0Exi6vPzPLlrD++88SY7168nBi5evsTVGzdYXFpkYMUIfhjaLvdEkSQJutkkDKyNdW6O9ajxaLDFPnsWuRAI36emM+JWTOj7DFR7SFstioUiWaapz8xy7eYNq46ydSN9vmL9YC8H9u7m3KVzXLh6nUYUkcYRWqiOK53Jy8A24fY9v+vJAHCyqFlXSfQHjvxs/xWApP+/H1lmJcryQLUdKDr0LzeQ8jxbwYrj2FIJjaPSiVxzXJFmFvX1PA8/UPhSMj49g4pi9r3+DC+/+CwrR3rxsK6Pl65e4dbYXWKT2IAkDOjvrdJfrTI3Ow9atzWlHxyde9hRVMlR727qSjfqL12VLqdLxmlCEBYoFgrcuHKVU2fOcenOXV58Yjt7n9jOgb1PMjk1wezSElG9gW+dq8l9MOzn//Ah6UjFaYeS214/kfNIEK56p10jaZSm1JpNVBBSqlaZjyLOXLwAmSbLIHj1EGv7exBSUmvFeBp8ZT0qEBYHzte4HBxo03zcumfFxKTjAVvaijWSsb4HCAuu9fVU2LZ1C++8+SYbtm/j/sws49PTTExNsTA1hed7NOp1RkdGeGb/fn751pu88NQ+Sr5HmmYESjotdCfxqCRaSSLg4p27fHTsGB8f/4I7U9P0D49QKldoOoqK1gI/CAnCECGdeZV2vgqeD1oTp4lFwJXCKNFGyK28t00YZU6fdXriURwzdvcWOo4JnAP16o3rWbliBXt27mD/nj1s27SJjStWUJF2r0wMZBgwtrdNdXHUjat653NQItpqQfnMtYkmneRLCnyp8AXMNCOOfnuG995/n8+OH2euXrceH9Ue8C31ME4SS50NQpRQpElEmiSEYeDoWz9mz3ncDH70O+S/HUcRnucxNDRIX38/RgiWFpfIktTxy60oRxAE6Cyj0WgQu144Gxfa9TuXnFZuj1ZKUQgDlDEYp0XeBrVcrqHJNc8z20/QaoSejsrGaJXpnzwe/+kD8o//5/9p+QtCsOXAQYTy2kIyHd1Vp6UqwWQGpLDuWNI+AH7go1S3qojp+uoERN3IhVW9cNdcCZqNBnFsWLduLf29fSipSFoxi0tL1vXR962LU9oxfGhzlx55hqb9+rLkwOTd93RQcvKFEVdaNHRnlMr3ieOYqNmkUCxQLQ9AkjAzN8enx7+gFUUAvPDUU5T8oB1gCNxn2O4NF4hLxANOgd2d8t2vCU+4oKRjjFMMQ3Zu3c7mrds5+PLLXLx+g4tXr/Lt6e+4du06V65cwQBPbN3Ku6+9xrtvvsma/n6HJCd40iKxGOdE5oL/icUlTpw5x+8/OcLJM2eYb9TpHR6mZ2iIhVqN+cVFK2UYBihXeoqTjhmS5/so37d33KHMmU7bVRPp1FLA0i7ilit/G4MvJCoMyep1eopFtm3ayLbNm3l631Ns37KVbatW0h8GbdWSBKdxqjVeoWDnYvsqmXaiuGxoA65JxGop2ag50xojrfJLipXdunHvPke//JIPjhzh7OXLJMDo0LBtpkwS4ihB+T5+ULCltSxxAbqH5zb/djNk1xPRPTqvi/Yr2tjStVQeBuvMarBNSwqIWxEi0wz39/PiwQO8/srL9PX0cOnuPb448SWTU1MUS2Vb/jb2vJSvkK5py4CTZHTPUFfi182FfbCSJFxQYTKNMZbHLoUgiiKKnk9fpUp9aRElLKUNz2N6dpZz58+zaqiPwZEhPGDn5s289tLLpJnm4rXrRPU6MiigvAAtRbuqlWW28VS5JrBMZ9YxFVuRE+pB2lHnoB9aC9rn1anW/aUH5XnQmiTJMmpI/rrv+7bPQKk2ApaaFOnZJElJH+NUQtLMUtEqlTKBJ2kuLWLiFiuHh3nx2WfYt3u3pUsB07Uap8+dZXxiglKlQry4iO8pBnt76S2V8AXtDfvHnk/39/nPUnQC9xyBNoBQyvZmSMG9iUmOn/qGNaOjjPT28tKzzzE1M8vxr75koRWB9PELRRDWVfqxVLTuBzwvurYfbSsqK3B0TaMxxqnBtOelrUKFYUCapszMz1MuFChWKihPMT85yekL50EIwsDjtRdfZKS/F41wyivWedIKIdAGJPLjsYFiR/JU5AokLlAWYDnp0qo3aSPwhGB0ZIie/l627d7B5MIi5y9f4fiXX3H+wgWuXLtGfWEBD8POTRt59/XXObR/PysqZeZrdVKV0VN0vQDaYKRFSetpxt3ZWT778ks+/vxzbo9PUOztY2T1GpI4YXF+wQIAnk+pENoeBZdEAtaLQzrHbGF/Vp7qcnR2XhhGkyQxUWQVTxR27VK+R61VQ2nD6hXDbNm8maf27mX71q3s2raNlX19bYGK1N1bAfiyI/uXg4yi+97nfGmElfvLJ4E2loponKqc8+dIgYXMcPy7s/zjb3/Lkc8/Z2J2lqHRlZR6qqgwJEoz4iQDoToeJ2kKxuCJDtxkWHYgj56j3XP1xyyCDgit1WoM9Pezbu0aypUq0zOzRK5iXiwWLcXWJUFJktBsNtvPsqsfYKsc1u01Z+ta8KVTrSPfc8j7fky7/yLD0IxjkrjlqzQuaq3VvwJj5V9fh9wIgZHCGCliI0TSHUjkF8S435O+snrQ0qBNhnBuYblGu3jMxMg5SB2NWJspKiGo12tkOqHaU2XN2jU0m00mxidI45gksBQI3/Msyp5lyxbtDua9POzpoN0dHVgw1h2LjqGIyJ8q00kk2iYxLsDyfN/x/qxQXVgs4jUbzMzNceToMcis8sTLe59kuFols/GfFbZ3XOCOxq5FJ3JpPtHFcVgWlBtjy0TOXUw4y2KD7U5e1dtHaccOnti0iad37ebKtauc+e4McRTz5O7dvPzss4z29mF0RpxEhL7fdrfUxpbQPFc2unlvjN++/z6ff3GCRpqwaetWvFKJ++PjJNrgBQHS8zBYVNtoiwYXiyVXvYAkyfWjyx0ZxSxtI1lpmrC4MM/83CythTkEUO7tZ3BoiI1r17LxuWfZvnkzG1avZu3KlaweHqFcLFL2fTLyQM2Wu4pBgJUZtCZVmvw60vUod08+2fHDyc0NhHU8lY62lQE3Jyb44MgRPjxyhKs3blKo9tBTLKERpElqOZF+gJQKnWQkWdRGFAM/QBiIk3hZA3Jn5i07oK4/7VxsRRFSKao9PaRZSr3RoBCE+EoRNVtMj9+n6Hns37Ob5/bvZc3QAD5wa2yCk99+S61RZ2B4COF5lkbkPqEQBu3Pi6PYFWs6AWr3nw+OziJqNX89AYVqyQYAaULB96kWS4TKnrsUkkp/P60k4eLVKzz95E4YGSIF1q5ezcGn9nP58hWuXbtO1GhQ8C0CZohsUCAFJtXu8xL3PDi6kUua202JxkJO3xcjmQfnwUO/8Zc3cinbZrMJWDnAvNpgC3iircucObfYQARIzypE6Myi2Ep5+L5CZhbta9WWuHfrJqtHhnjn9dd5atcOhgJFA6gDd+6P8+25s4zPTFEql5lfXMRoTSEI8YS0lRvXf/Iwh9xtzcYsWyOhg0x2/9x+neWKMsqzVbQ0ywjCkFYUceHiBe7t2smmvU/yzP6nuX1/jHPnzjG/VEdHMUGpbK3XuyvjubsbnX3HPLADaa2tr6GSKCEQJp+3nYQdV6XM9yLft/bjUSuyQI/xKZbLDIyM0Jib58ylixhtmF9Y4tevvMS2tasx+CRZ6vjpdt3pNqZ7WK2mC7UX1oEzf87bplFKWhUubQgCn6EgoFqusKKvj23r13Nr7D6nTp9mbOweQ0NDPHtgPwf37qNaKtFMM8qFkMA13hptEU/fNTPWG3WOf/klh498ytUbNylVKhT7+mg0mxhtCHzbLCgwWGp24kwJZTvhSJMYJRU9VZuwWOWu1M0PWzWpLTVYmJujMTePTlPCUon+3l7Wjo6y66WX2bJhPWtXrmTbps1sWL2GSrFIT7FopZu1vUfKVeaF4JEryYNc/Rzsk8IpCuRAC9I+P9JWxgNgrFbn1PlL/Jd/eY8jRz8nAYZXrbaV2DAgNcbKSTpZR6M1zShGJynFIMArhG1viB8WYHfvR/aEculJIfJmZdMOiPOYyLOsCRbm56mUS4yMrKBSqbK0VKfVaBJHEX19vVZpLUucckzarpyBNX8KlBUczp0486PJmzgznUGaYHSG4IHrmoO4WpMlCTpNldTGR2th9I9L4P+U8a8dkAupM6PSRCmjVyijh3DmJnkTpg207WTKjCHNUpTvEZaKbSQr3zrzC51llsfrK5/UQKPRIE1S0NoKWErb1W1cVGy0YX52DrF2A9u2bGN6Yoqxu3fxlcJT0ipPaBuMd+TbumficjyyE6DRPg+r2uK4TO7XH0lT6ULMs0zbY5QSIyAxBpOmeMUSxTRjfnqaT098xVK9Sb3e4O0XX6CvVCT0Fca1duisI6S/fIF88BweNToSjW3dcCkpSUW5VEaWymzs7WXHxg3s37WLuNlizapVjA4OEmCVWwROucS9m5SKVpoyOTvDuSvX+OcPP+TDjz9mbGaG4VWrKBZKJEawsLCIVwgol602r9YG4xRAhBAYZdUVkiQmjROUULaSEcdWGSQvY/m2BF7xPSpDQ6jhYQYGBli9ciVrV69m28aNbN+8iY3r1tFbKlPFPgR5uUbbzkLHdRdd3LzcYCM3W5DWSTa/cvnGhG02MbnmtbSGDYEQxMDkUo0rd+/yhyNH+PToUS5du46Wiv6eHvywQDOK2giZUp0u+SzN2nKH9li6S+jLETuwU6+9FD1QZrRJsTVNSuKIJI7p6etHas3Swjxxs8mmTZt4/dAhntuzhwowEWd8d/kS5y9fJtIZA6OjGCVpZilRmuKHoU0UsCXHNEnxlXW4ezCwefz0M3lnp6MEaTAZ0mh8ISiHIX2VMgprurFyxQoarSbHvv6S/fv3snvbFjTQD+xcu4Y3X3yJqYkpvjh1iqZUhOUyYWBL3Gma4iuFFobYydVZXeuOo67vBxitabVaIM0jAo5/G9832sF3V9CbewTkQ2ttTamEDbYznYKxSiVRlJHGMThVlgKCtNWktbhISUle2L+fv/rZO2xctdK+N3Dj/iSnvjvD9du3aUQR/f09GCFQQtFbrhIqH2k6FEroBh47QE73Bg2PlzFtGwTZX+68LiVxmpIlCYNDQxC1OP7FFzy5fRtP732SIeD5XXu4/dJL/OaDD7k1PkmlWkX4qkM3xK5HBm0pcKKjTr682di0A9Lcc84aDdCGzw3YEr2rWNmKlEIpj0wnJFlGYKyoAAYmxsY4df4ctVZEkiW8+8arbFyxgqrvk1pLHDIX9LcrBNhKYOZ6B3LZwPyqSKE6O6dbk6Q7LoxBGduYWfAUfT1VVvVU2b11M7u2bGZqcpLBoSHWjAzTGwZEaUaiNUXfQxisYpiyyHyt2eTe5CSffHGCf/r9+3xx+jSxlKzo67XmdYs1PKUIPM8m2mh0lrSDTkuLAJ1mxFFk+xqCwHKVo5YDt3CmPj4FISn29CF7+uirVhkZGmLlyAo2rVvLjm1b2LxxPb3lMsPFEgXpXF5xHiXa3lslVRvJzcf3rpr5XHMVWK0h0xY59h2dsWYM16dn+fzLk3x67BifHj/O1MICq9etp9zTS5SmpAYSnaGNU6ATEp2mrilWOxWxP91/IcusdGHgB2jjnJOl7MQI2vLFPc8nTRJazQaFIGDNqtVsXL+e8YlJxsbGMEYTBoHtl8C0VcJacUS92SRKYns52nGOWJa82CTUp1wu2XUpNzgyrqqSMwuwNOUYG0fGzWag0qQksuy/OYRcAEqkWeo1W75SarNM0nXWWMFld3nGJARI22Gs4xjP86lUq3iBfaC7yCkAxHFEpsEv+yRRQm1hkaQVtZ05c81mbTTlShmTBFy9fJXh/iFefvllbt+8xcULFyg4Y5y41SIzpm39bbrqRW0kzyx/TeQBf+aCM2H56B1kMP9Ot1/pZMN5Kdfar2utCQvWiXRpaYlyscjQypVUenqYHR/nyLHjllZg4LUXn2O101AFW07MM9FlpS3R4dt3o6h5dmjcYt9Gy92/MzhOW/7+UtJfKtO7aTO4TUJgu7itvJTXXizypKRWq3PmzBn+87+8x4dHj7IUJfT39VEulpifmSExhqLvWy6pzuzna6wOOBqdZrSiDJ0kZLFtBjNakyUpjdoSaRTheYpCIWSgv5+e/n7Wr1nDhvXrWLd2LZs3bGTF8AiDAwNUigVCAZ6w0pqJEG1Kk8Qip8Itmp3TfgBBcyVM2mYEpn3M9tpb84goSVC+Z1VegNl6nW8vXuT3H3/MkS+OM7u4RKmvj0pvL1pImkmCJqfB2Kbd/P4FvpWJM9pKEwLtpCtvOGw3mCGQRnYF6l0IrhD4YQhC0Gw2SZPE2oFLQRpFZHHEioEBntyxg707dzE6MEAtTblw5TIXr16hFjXB9zFSIH0P4eSi8gUw9xHoBK9teK89jOj6ATpNny4g9z2F7ynrsJm63ogswxeS3nIFhSCJIoqlMkuzs9y/dYvvzl/g2f1PM9rfg1aKYqHAK8+/wJ279zh3/jwLjQZRo06xUiUlJY4jVKHQzlOlyjWlTfu6K2V1+LUxSOOsuruOu/29eMRrD//VX9zIqSpBELQ52MYYmwyKjoSg7/vtC5WmmdUOlgqpDFo4XqeSBEIyM7WApzP27djJoYMH2b5xo1Vlwl77qzevc/bSRSKjCUtFq9KiwfesSo+PNSNrVz5YHnTngXoehHS7cz5odNQeXdTB9ktaE8cxWZowOjREY36OS99d4puz57g2Ocn6kRE2btjAL975GZcvX+Pa9VskjSaqJB1PWZIZY+kSRuetQeTSucYehEMAczMtjck6e4DVa+8claRT5cmcDKGSAqUCjLHOvKHvERSLDK9aRatW49b4Pf7hn/+JialJ/k9/97c8vXEDmjZpz7pAi877am2dj3PBgM51WV5LtB4gzi5eKqTM6aW5UrZ9f98YNq1cwcbREXe+lvLneQrfgVBZZjnfwrfyfBNTk3z40WH+19/+jjNXLhPFCX0jKyDNaC7VME7Cz4iOFHGWZE4EQtseptRKNerUSm62soylxQXiZgOhFL7nUa1WqfT2sm71KOvXrGXjunVs3biJ0ZERVgwP01MpUQg8GyBjaZtR2+8UhBEESi0zjeteQLqnWKepPN9bc4nLNkuS1KF7QtiA//7cIh9+9jn//Pvfc+X6dZppwqp16ylVe6yueZo69TOntGUMaZogjA1eBZ5VLMsr7jy8vj3isPMjBpyBl5QEJZ8khTiLnGmfAie+YRWvAmqLCywsLLBh3Tqe3LOHgYEBTp76hiuXLjM4ZD0l0iRtyxeHYYHm0iL1Wo1avU6Kc8rGgDCOXgSZyRBCEQQ+lUqZMAjsPi1zyqtur/FC2EbeSCqarRZRs+mJNC2gteS/sYAcwLgsXQhjigLCh6WjckaH5fEYoxGexAs8hJKdyUzXAmg632vXuW/LEctJBZnOKBaLiCDg1s2bXL9+nUMvv8xT+/YyMzXFt6dPk6QJK1etwkhB6nhveTbfdZTtyZkH5jkP3soeKUdXwenE2gP8Yzihy0NsM6lrHjRK0YhjpFKUSmV6B4eZTif46rszZDpjbmmBV557lrUrVtAbBHhSkAppJYJSY1VpuvhodC2Ry86jq3QjH+DjL0+C8jKZQ3DIBZYc2uHeMC/pSWE3FhUE9A8MsG7tOqJMgx+A77NYr9uN20gazQZJGnchKjZr96TEV4qiH1AolfF9HyUsH6y3t4feapXQ9+itVhgZHGSwf4DVo6OMDg8x0NtHf7VKMfApiM5c6BjbGaeB0ulieOCu2EpJmtqeBqXIG5oEHWRaOutisJxsbQx+6FsaSJpya3qaT78+yeFjx/j2/DnGZ2cpVqoUqxWk5xHFiW1Gsh6++e3pOorO3TOO8tSuvLj51S3LZh1pTefftN/XJVlJQhLH9FarlAsh9cUFZsfHkVnGgWee4Y1Dr7B13VpKwNhSjZPffsvFy5fB9/CLBbSAJE0cGqYw2rSrUgKBJ10jX9eVfKjgZx5+li2CKtsvWLqIVVsKlLVK94QAx/X2igVEGHDx6hW+OfMdrz73DAPFIgUp6S2FvHzwAHfvjfHJV19xZ2qSTGcEhQKlUtFKimEX7lRnpLHVkc5VQRYWlzDGOdi6ZLVNG3go0jYPnMkDN/AvcHQHut2NkVmWPeyybEBIQbVSIdUpU5OTZAgK5QrVngpZK2Z6YoLa7Cxb16zmhf372b9jJ0NB2KYwLsUxN+7d4ebd2yRZSqFcJgiKkGSYNKNUKCK6kLGf8vYY4wxvPEWcpkRZSlitcOPuHY4eP87AoUOs7e9n84YNvPbKK9yfnOLKrVuIZpOhNauJsow0TTDGWKqPEGSRlaMTQhI4znQcRShoOy92XU47HpUX5xuXsK9YWqPVUY9cgEbgYQKfRrNJMj/H12ftfnP/xRfZt2sXq3t7bNVPCaIoJsoywtCqR4UuGO/++AdHpwLh+Niu0cqCCV1hfBewlB+6M53ufImOQlsrjomSFM/3GBoeZHOykXqWEVQqxAbqrQgTtagnMTXTUdkB2/fiKWXVODyfMCy3vRQ8peip7qCnp0LgB/RUywz29TPY38+qkVFGBgcZGehnuL+XSrFISXZ20Xyvyc9VtM90+b76iEnUuZGye21x10fYqrE2tipbktaEb7YZ8+2lS3x24kuOf/01l2/cIAPKfX0EpRKtzFYC3C7Svk+d+dMN1+XUrY5Kzw8b9j3CMEQIQavVBIxTsYEktpSYwPcJfI8sTVhcWCBuNtn5xBNs27KV+bl5ZqZnnCFS1pbD1TjDP5PSiiLbfJkkXZHNww+2AXJtdqVkxwq36ytf09sUtCzDZFoKjRTaCPEjXNv/1PG/S0CudIZQ3fpSXb/g/nOVOJu5ODK+16UJ3j2NpJTI/GrmGqSZKwW5DF67yS0dDz3LMiYmxrly+TL7n3qKV195hfPnzzM7M8OqVatshq81rTi2//Zx5Wp3j/KO9jww067B4uEZ/Pg8U0mF8QQmsycvgCAMiVotFut1hJAUqlWGPY/7d25z4vR3zC8tcX9ygkPPP8+29etZOTiIJ6wVs9Ya/6EjEJ0EphvF7DrHZTzJZQF5HuDldrrLH932d8LdR6PJREYQBqxft463Xn+D7Tt2stRsUWtFNOKYpVrN0jQwLCwt0mg02gmEtSVWFMKQUqFApVymp1KhWCwS+j6lYpE1q1YzMjxkEYtKmb5ymUoYUpJy2eQ2XV+dIzUPPpPL7ml7uJKWxHHzTOfatVFpV57X2DKukVZvd9EYzt28yecnvuT9jz/m3OVLxMZQ6u2l0tuHcAF7mi/V3dd+WWxnHnjdziOL8nU0840zDdKu1wAsGtFdWs/5pdoYizR5itriIkmrxfqVK3n5uec49Oyz9BdDasD1O3c4ceoUN+/dpdzXi18oWOWbKAJh6QVZmpGkiV30pLLc9x/TNGes+oJoG33Z+WicrrxEUPB8kqBgm/eyhDiJKFUrDIyMcPnGNY4cO8qWDRsY3LieXDdlz5bNmL/5a1pZyuThw9Tm5+gZ6Ke3t4+FJCLLMrzAJ0sy29wqcI3kzqrd0EaPcl+Efxs/bHRLAraDJpcsdhuu5cEUODQ90tTqdbwwpMe3635taYmF6SmGqxWe2buHV597ji1r1yKAEJiNIi7euMGFK1eZmJ7GSEmxYh2OcWo/xUKRLE4e4Iz/dOfu+5aTW280SLVh7fr1TExN8cFHh9mzdRtr+/spex5vHjrEUq3Of/yHf+D+whxRs04mXdMknSpYnqwK96zrLr1xk9PnHgqaHtiD3KlbKpnVyZZSYoRCoOwzkCT4vodXKBBojdSGu9Mz3H7/D9wdu8/E3DxP797FljVrKHi2bynVGl9bHrD0HhNmGqy5DoYu9g15dc+CQV0HCXRTbtoB07JfsWufkLLNZ69WKjy5Zw99A4PMLS6y1GrRyjIWGy3mazUarSa1eo04brUXWekAnkIQEPoBpVKJcqlMMSy4vSZk9apVjI6MWAffSoXeapVKsUBZSnweHVzn8QyY9n6TwyvLg8fue2SWf9+dvLSfp67b6fCxujHcmpzk3JXrvH/4Y45+eYLp+Xm8YoG+QWssGGeaZrOFMcJWtPP3eCDEyXf6Tk/cjxv5YQdBgDGaxcU6QRBQKlkfkySOHBJfRCnJ0uIiRmesWLGC/fufor+/j+NffMH9+2OUSkXANnwKKa2+u6sEx3FMs9UkdfLDD13L9tW2x9P23ZCqLTDQfr7orFltkNUgRJZJkWkhHqPK9Occ/+pNnX6SELZaQksZGGP87r/LA798oTauE155kiD07QLHw2tO2zWLDkKepbYRSwrXd65tEh63IoxOGRwaQiD59ptv2bppM1s2b2b3E0+QRi3qS0uUMOB5pEkMwsofma5jsx/m8GzjZKYMCGUpC11J/zK618OTu/NASilt05FJrFmJ1gS50kSrxfziIoHnUyoUWLVuPc3aIhdvXqeVtmgmEdNPPsXBPXtYNThAMfAwRrUdENsJjK3hODjeBs9Wp9adkjumTmIukRjoCq6+D1wy7kRzGo8GSoUCa1auZGRoiCd37yIxmlgbkkwTxRmptshBK2rZRbLrGkkXlPtKEQYhxTAg8BWe46H5vkWhpUPSlZLLusLzgxLd96C9mD0iI3zwFQ1CKKsFi8GkmUWClbNjbvdAZG3VmxwdXgJOnjvPb/7wIV+eOsnVO7cxvk9/b6/VfcWWDVPXuGZEh6bSvpYdIMseXTfSRRfC1F5a80DHoswi16Z380BjEErgC8/KG9brxIsLxI0Go0PD7Nu9h11bt7KiGAJwZ26Oa7ducvPObZaaDYbWrEYFAXGSoI1VTPA9jzRNbHArBUbYcvDjrqx54ByWDUn73xshyQyk2rYYh76PLhXxlQLHcwzCkEK5xK2rVzl99gxXrl1j48gwI+USGVAJfHZsWs/BPbs5d+UKF69fo1Wv2+YgT5K59NIvhKjMatu34haBH9DX29cuwQtDm/f40OiKebp/48dvY/9tjQcbjqGz+YGrgMncadCCL/V6g0yn9PX0WITb81icnWVhZppASXZtf4KXnn2WXVs2Uw1DWk6mbW5+nu/OnOHytess1huU+/vxgwJ5U6HyPAqFAlF3MvCop7/r+LrP4087f/tvrb9DQF9vDzeuXOHMxQtcuHGdHdu3EyrJxqEBnnvmaa7euM5Hx44ydX+MvuFhStUqaaqJoxZxZuz6VwzQ2IbuzGRW3agdtHZCP4e72HNi+fl29ldhXXqlQXqWKtPpQVKo0LP+AlFMvdUiSSzy2ohjbt8b4+0XX+TpbVuoBD6p8x1ItXYO2qrDPc43jLwvyBikpxCedPdHkK/GeSDYvWu1d69H3Ib8XAGM1gRBwPDAAH09PWzdvJkky0iNtr1lsaaVWtO4VtQkiqNOdG8spceTEk95BL5P6AeuyuHhKWHpPM4jwVNuD3LAz0M5UNeRqwfuR04jMu3f6Pr3eQ+NELRVuhw+kTmDJeH0+oW01zg3bbp2d4w/HPuCL0+d4uzFCyy1WhR7qoTlMijlqi4Zls60DEIjT4q6D0bz+DX8+17vwqusL4gTx5BSOBfOBDCUikUKoeWON2o1+np62LN7F5s3b2ZhYZGzZ84wPj5BpVql4JD2JEnIjMYPfcKCbRKPWtGygDwXB7GNuR3cVwhLafE8a4hiHD0xj1kMrgpqnLO0vRcCnSm0Bt0tMfnTjH/NgNwAXNy4kcqBA2LPnTulMI4Lj/1tYfUmTZbhez6lYslKCcFD08S6aXY4f3Eco7MUibVU7zb1yJxIZ1//AI2lJU6ePMmzBw6wY/t23nj9dWq1Jb45fZoRAT0DA67J3bSjiPYi5/h7aOGaIJ3upXFW6qaLevADL0/sqClhENCKIssTLzj5wEKBRr1BrDMCoFQqgRLUWg1uT07y+yNHuHT1Orfu3OGZp/azb/Mmhsul9rtrsCYb2toZ2xIEj3zCljUISvXQ33dkgrrvxYNv1NkkPCkJAw+cXfbys+6MvPT8qCHpJGvfN6yLa+7W6dQHpATh0ZkGnQf0j261gs4iiS3vKk+htSGJEoRSCGWbJD1Euzn05vQ0J8+e5eOjxzj65VeMT00ig4ChoSHCUonEGJrNBtbd2aOjgPNw4bD7UB4+PoeU6wyL4bvr5dDmHD3SWC5d7h7n+R7lSoX5qUmaCwv0lSu88OxzvPvWW+zZugUFNqE4c4aPPj7M5OwMxWoFvxBaB7lM22uRb7xGIIwLsB7g237fpe0+12UVCiGcnrEtTwJtk6jAU5BlpLbSZhFuCWOTE5z85ht2rl3Diu3b2u/XF4a8fPAZ5hotgsMfcunWDSbuj1Hu7aVUKhIlCVlmn2nPUzYISlM8z6rctKv7/zZ+1Og23VnmeeAqnTJXHnJ0FqM1zWaDIPAYHR4mA2ZnZ5kcH6eqPPY/uYe/evtNXnv2GUZ6qpjUlqwLvs/t8fscO3GCW3fuIJRHEFoJwSiKwfMolcsUSyWSZsvOp0cE3n/uc9c610LGmoGFIXg+03MLfHr0C9avXM1z+/cRAE+sWcsvf/Yzphbm+fDzIzSXlqx5mx+SYPc1tMYLLMhSazbIjKZcKiK1BQp+zCQVQiC07fkwyjZmep5tctbGeXBIKxOrbWaPHxZZrNX4+uw57k9Msbi0yNTiczy1YwejfX2U3DObmtxp28rNths8hQAp242l7kjau0leUftxu2Znv9JYMQNPehR9/3v/Xeq+ll0TOvvMD9lrwGm+a2c41j6b7uy8kzB0J4B/dHV0aEy7WTc/RqXsNRTWEVQCE60Wl27f5qPPj/PRp0e5cecWcZbSNzSIF1pKVyuO0cLuX6IdEz0OHsyV7h59XD/mqUkSW5EqFCwS3mo1SeKYoktQm40GU5OTzM/N8vzzz/P2W29SLpU4efIUN27eJM00vWvW4PsBcZqSZCkGTSCsrKQ2hiiyyWK7Oy+/Zor2PcH96TlHZuUpjLA9C7QrDg8nKWTaI8kCskyS/rcQkPf12T+bTYgic3vnDhae3CPXLi6Ui0lS4gGOGNAOmozGWaf7lAtFixbTdbHyHFPKNu85TVOiKLIamghnLJSn0MbKAwpBEIQsxnPMTc1w+dJlnj14kINPP82dW7c4/e23RI0Gulql6PskOUrXLh3RLh3axgDdDszbmaahne93fbwdYvnDmS/ecRzhBQFhoYBMUuI4IWo1rcuW70OpSJZqMm2oNVv4nmT1hg0szE5zd3yCO3fvMTE+wfj4JNHrb3Jw75MUpLXMFUCSWi6u57tud90FfFstufbx5yiSsyJ74B49LDj5OGQwV+1KHxP8Pvjvvs+CxVU8AZxUlu7q2DaOVpA5dRa7gSlhExrpuQTJLAv9Hnp/6DrVvMKB1TQXSiHde+nEJn62Q95a2ifAXKPO5Nwsnxw7zoeffMr5a9dYaDQIKhUGBgep9PbSjFrU6nVakbXN9qRyklWm86EPXqD2wZnlCIyw24hVjMiQ2E75PEnNEUKL4ueBu0ahKHgKE8d4xvDE5s28/vKLvPjcAQaFYDpNGZue4cgXX/DZF1/gVSoMDw2SGk0UJ6SpNc4QwjrTCSy1Q3lemyv8YHd+nm48bkHXYPmjwgUMroKTz0flgm/fJXZt2SsDQ0MjeMZw+tw59u7Yxbbt2yhii0Gt2LBp9SjvvvE6SkHrN+9x7toVSuUiXiEkiq3DqxAKzw8w2CpIs9VECeWupUNSlu1S3enogzfq30Z3QJ7/nKusdP+Z01i0tgmj55pyFxYWqM3OQtxix+4n+fXbb/Pm88+xsq/XosSZpRmNLS5w5tJlzl2+Qq0VUekfIAgKxFFCq9EgCIv09/VSCAMWhCHVqZ1jOT2qG4D4Mw0LsFknRSmtBGIziqj29dKSkq++PcWGtWvZvHU7frVIuVLmuYMHuXb7Jjdv3WBmcZHG/CLVvj4KyiP1JTrVJEmK9FQ7MMqb9ds8364jeKA28fC9EflxGpSxilIexlqtZ51Wfj8IKIZFCmFIrVBgbnKKm2NjJJ9+yr2xMW4/e5AX9j/FhpWrGKpUMEph0sw6WxqNn6+/BhsM5ofzwGKwrJL7A4cQtNe1/IUM7frPoG1g9MC9MdAG90TXV/eh5dxvnbnGWmkNy8BWJm0DsLGAjXCqXFLmfnwdqDgHgR4V5nSfC3S44hpLv83VgKSTgXaN5i0M9bhFI4756rszfPjpMb449Q13xsfRQtA/NEjP0BBxmlCr1WkliZMP9TBSd8qvD8UknV3oTx2dOodt0lZKUCqWSOKIer2OBOe67jGxMM/83AylYoH9+/Zy8OABzp2/wNdff02mMyrVHoqlkvUhMJ01WGtDkqSkaUrqQNhUGwJpr7dVTbGJX/dU8zyPMAjwfC+/bQ78yW+4rdTYdQnIMl8kaUFkmRL/TTR1/sM/2D9dgMT+/ZAkkigqgvHbC4OwS4hVnxFt1y2dZYSeR6log9I2Qt75nw3SnUFLmqVEUUyaavc8iPaio90Do5RFTgxQ7qly+9Ytzp85yy/f/QUH9+/n+NGjXLt1k5mpKdZt3EiUpswtLlrU3pU1tNB4WI6gVJaPhBZY0pF08eHyad1BALsyZfe8GiHaPOTU2Q2HYeB0tVME1rzH9yVZpllcXEQIzfDIEJX+foyBxvwiY1PTfHLsGDOzs9y6c4tdT2xn98YNDBYLeEW/HdBamSTdlncUotNIqoR8OO7oCsgf/8A+vJB2VdweG7y3Q5k8kRGPXrzy9zBYgRPp5J3a25CwJSkjcvtcuhBy9y7dH/iY8WBgLoRAOn14cJRUIQgKge1rcHPs1sQkn3/9NV9+8w1fnT7NxOwcmZT0DQ8TFgogFbMLCzRbLcu59H2nNS6s5KVDjoT440KB3ZUae+1wFAFcEG5RKmNSZ8wEWqcINOVSCU8JavNzmCRm7YoVPPPUfnZv2UrZ0X3mW00uXLvCucuXmJyZYf3QEIVS2Tbhxond5JxefJqlbRRMyDzpeeCeL3sWHrgBwl1sY5MGIbBKHA5BBUtFE1hDkyAMQCkMglYUE0UR/YMD6GaLqzdvcuyrr9i2cSN7Nm+gUghJsoSQgHVDfbx96GWm5maYWZhjaWGBVqtFudIDQWBdcqMIpCLwA1tpM5rQ92k3dYrOuS27R50p+NA9+ksd3U3G5gGkVGu7weZzJW9C7uvpJfQ95mdmmbh/H91qsW39Bt58+RCvvfgia1eMYLDSdqVikUKxyDffnear06eZXphH+UXK5R5QilbUIoojisUCPT29BIXQBQlWYUSK/PnpKL60lai617s/MVgXbqPXmbZ6/dpQLFfwpeLujeucOnuWF2/coLp9K4Ohj5RwcN8+7o/f58NPPuHGnbtIA31DQ5RLIfPztsdGBT6FMMQIQxon9vH5AZp5eVzoDs5x0Z2EoeOi54hilv7/2PuvJ8uOLM0X+7n7VkeGzshIrRNIIKFVQRdEoVQLDi+N5MuY8ZFvNJqRL2NGmz+DNP4BY8PLrjvd1V3VVSigoLXKREqk1hEZOuKordz54L73OScyEqK60MY7NhsWyDgnjtjCt/ta3/rW91l6gxBWkg4l6aUpfhgxNbONuN1itd3mk6+OcevWTS5fvswTDz/CTx56iF1bpgg8hVbSUlhEsa7Tn8DvPFuljfnw7m+ypmw4JrsOKIqQUmzyws2m/cF7eLMloVy3FPR9CPrjQypljXkG3mFwYcAd33nn+ln2yw383Qbl/V6gXINQyirMDaDa15eW+PLUSU5+c46PvzzG2YtXWO/1qI2MEEQRXhiw3mqXDteBA/UEgiROLB/7DgfiDWdjU/Tk+98LAmcC5Zx60yQlixPGxkapVCLa7Tary8sEvs+DDz7A448+zES9xoljx/n61ElGx8ap1etkOi8N+iwn3eZAvV6MMVZ+Mk+tNLAIvCE+uHBrvoWtLGgUBEGpqGVPsB05RphyDS3mBLT2hckr0uRSmP8eEPKf/ezO5zodjzyvD6WnQ6ifK1s5+aGwElGrVAhdQ+YdQ0L2cfM0y+glPVKdOqTNZrOFTrQRfVpDpVqlGoZcuXKFt996i6cee5yHjz7I/+Zv/5b/8j//V85fvszk1CR4Ct8hrJk25LnNwAqTmHKhMcZm5GXJ/ttu9/JoXTO1IAgjtNM9DnyfKAjInHNYkqSEoXBILyjfI8tTVtfXqddqjE5uoVFrsjo/z9Vbt7g1N8fFa9d4+MEHufX0U9x/+BBTY2M0nculkpSqIMbJ9RWd157n9Z25zKCk1/dHLspL497zLeEY5QtchjokyCrufE9f6WITTZRiotz0C74Nn918MwVfwZP9HFAU8krQSlNuLq9wc2GBTz7/kvc++ogTZ84wt7xE1GgyOjFKfWQUI6Dd6dDudChkDAMnP6hzXaqTiIHj/X5IxeA5EHb8SWtLbRFk65YplSy59gpDr9ViZWGeXVumefXZF3jhqSfZv3NbSVX55uIV/vT2O1y8cZ36xARhtWqrOHECxrnWCVtKz3Ntx4ywpgu2aavfnrUxARu8IkPnGtc8O6AoIBzaX3Dro6hCrd6AagUcpzBNM4LmCGluWGm1+Ojzz9m+dZqxsSZHts2glOVf1jyP+2Zm+NuXXiLNUt764H2u3LqFLz3CahVfKtI8tQo+SmGcesxm+/o/th++DTZP5WaY0qCkQglB5PvE3Q7zc7OYLOW+A/t59cUX+bufvsjhrVuQQDfLbJAHLKyv8dYHH/LJsWNo5VFpNFB+YG3A4wQyQ61SZXSkSSUKkcLYxFQwgJv+OFe3aL6zqhAarSEKQquQogIuXL7Km++8w0i9wvi+vSjggf370S+/Qm+9TXu9zeraOl0vpDHmE/gBmbZW5hUHEPTSYp37fkSP4khzlwAVDZg612XfhxKyL/+HQQqNJidNUwI/oFKtEgY+68D68hKnL1xieXWdK9dvcWt+gcceeoi927cz1WwQOlm/jXPZoMtpeb7+gvWlSCCGK7gbu4PcLLRhERpcme72zf3g/k4Rg0IueDC4Hvx2gQNpf8CxYCz9FQBl3ZSFEmgBnSxlYb3FUrvNF19/zXsffcSXx49z6cZN8ALqo2NUR0ZQnkeSpXR7PbSxwE8QBChpq5lSSLtj/w5boa+eJbZ3z0oPVsnSmFvXb2BMzkNH7+d/+vWvuffgIS5dv85nX33B3M2bHD5yH14Q2ibQPAcjUEqUKim5ccorUpHECUkcQ+CVtJzBzWBjSt/zqVQqBGFIbnJXWdnsCjnai9ah0LomtPbEf4fGQAAI+71V4ZCxvtbFwCuERBtbOvOURyUI8Yd4T+42EAy9N801SZo5ZRT6N5IBoWxpP8s1vlLUGg18Y5i9epVTJ09y7Msv+Lu//TW//PnPOXf+HJevXuXmtevURpo0xsYsapcbUjLSzDmW6fLOHsh2AdG/QcEgzJ2iMmWmbGwA4we2wSGJY9vI6Pv2mLV10kqTFJFbxGFkZIQ0S1lYWCCLM6anpmg0R/EdfWJpcZFT584xt7jI7PxtLj/2KEed2+ZotUpDSTe4/bIpJUmtNbs02k7KQ2dWbJzPNl7T4d+L8tK38TQHqhz2pW5i3SxqG+roGQxBxR3P9Qu4377d7RiKxULD0CRbvKhI6jrA+Ru3eO/jT/j82DFOnPmG5bU1hBewbdcevErFNkDmOXEck6QJnu8TRtZEx2hjtfbz3HKvC6TuW/Zx43Ww3Em3CDjEyzYVm74LnJQOGVCukXOd9eUlTJJw9N57ee3ln3LPnj3U3THdXlji5MmTfPTZZ3SzjD2HDpIbQ6fTtY14vofnWbQFnbsg2lWo0sxVjaQr2d/tOIprxcBd0v+lcNktlCW0SxaDIKReqxNVbX+E1vbeiZMUrQ1RvcHswjyfHTvGY489xr5tM4RhAHlO4uTQjh46TO55dHo91t5+m3arjdGGqNbo91doCIPQzkFZXo4AU84+G1bafwfljv+1bXpgAStAC1moJLjmSiWlc5+1dMRet8PqwgLdtXUO7bPI+K9ffZUjO3dazm+WIYAwilhJehz/5ixffP01c4tLTM5sw4uqJFlKlmboTKOkJPTtIuwHAQj6i/CPyCEH0wczhCgrqXGeIbRmatsMcZLwwccfcWj/Pg7u20sANKXknj32uJeX13j/089YWVgk19CYGEf6Pu1utzQK86RieMawm9jkkdXdtgBQ6pyNlbLV3FznTlqukIZTSAcGmUyT6wyda2KTWKTSUzRHR2k2mnTbbdqdNp+dOMHcwm0uXL7M448+yuMPPsjOqUnqnirvc4mbP50bcukOzV+eFvX9Nb4t3b/zrNi7+ft962bfYJ9x+ukDzfWDScbGyrLdChO54W8o/FjSNLda255NZjKgnRmu3Jrn+JnTfHPpEl+fPcOla9e4sbCEV6kxNb0VL4zIdE7c6ZDpDCEllaDiZFxtc7rOLSVMuIbewdVzkOQ0qL4yfL7uvt0JvdnHWabRua36Vyt1PKVYml9hbm6Wffv28fyzz/Lys88Spwlvvvkm169dRwY+MvBJte0T8YLQjts0xfcDgiDAV75Fx7Ocbq9re/Colae9ENUo9tkG5J6jy/jWBErnSOX3Z3U3jwuDm6dyT2odGa3lfxcB+ejV00OP22FAc60VeL1OpJU3dMIMwwu07crWeMrxfgYDcjMYkPez3FTnJHlKZnSJoFq6ikZh9TolFg3O8oxAeVQrFXrtNu+9+y737d3NYw8d5Vc/e5Vrs7d4/4P3iLOUxuiYDVKVDQJyx5NF24kO4Ro80P3WOjcoynTDQNmyMhTB2kkySTLLofR8K+OUZ2RphtEGT3n4vk9uDHGa0ut2kVIy2hjB5DmrSyt0nPvY6OQWqs0mrdY6K60WH3z1FRdvXufN99/jmcce54WnnmL/jh2MhAF1pUr1iMK6Fgza5P1OY0enuSuyzWZr293xjjLG3jgLiw3/Dv25b2x0N7x+Y5i++SS/2VIFDJTP++i0ceVHUar7aKwD2rkbN/jqxCk+/fIrjp04xdziIu1uDz+MiCpVZBAQZxp0zyL+UuFHFVyFnCRNbUOVdpOc7sti3RGgUkyFYmAwFctJH5tRjj8+eDjSaej6vsKTijxLWFpcwMdw9MgRXvzJUzxy7z00pOXAL62scfHKFc5eOM/V2RvkYcBMFBK322R5hu/7eMpz5iqQkZWBc8EFFq4cvvHibDJEhqhRYmgysIZDhbZ/IT0aRhXqIyPU6o3yrg/DCllmm25HJyZYvj3HxevXeOfjD9k+McZD+/YilCI1OSZJaQQ+R3bs5G9eeRWdGz765FPml1cwWtAYHQOh6Max7bmQkiDwy2Mrln+zYd4qd/1/xOVDW+lj4BIrgaUvFBQW5Xko37e0vzRlbWUVnWbs3b6dV559nl++8CL3Tk/jAeutFr7v4YdWdvP0xfO8/u7bnLl6mQRBUGtghEeapGX/kZJQq1Vp1KoEgDC2h0IIgyxBkjsnnI1OnT90E4iyWqSUVToyRpI4isnY5CRLt+c4df4c73zwAft3bOeBQweQYchEFPHco4/QbnVpt3t8efIUrbV1aqOj+FFIqHN6vS4CQxi6pPF7SIyWtR4BORrp3BkH0V0p+hbjEuECE2MNu4oG/zwn01baVUmJV6lYXnMHri4ssfzpp3x+6hSfHf+KV154niMHDjBeqzMeBv35SRRzVN8J2zh1kaHek29HJwZW/s2eH/i9oPN9J0xz5/vt4/6aM9Sc6eY1Rd87YTPgrb/pUkp4+NBsQC6EVZQrAuKegetLy5y/cpXPjh/n4y+/4OK1q9xeXUX4AdXJKarVGp5nTZGS1Mo0K88v7eTT2KqQoG0CbL/HadoMrCXlvpj+Xm12tjZT0LrbZh2lbW9IEFYIw5BWq8X6+jpRFHL06P088eQTTDYa/PHdd/nX3/+edqfN1JYtaAxpnmOEwPN9sjQjcdUxn4DA9St1O13a7TaJM8wrT7pgIE609bDAdwIhYQTGxnHSgyIFKVVWoEiofZnlYdTpSNPrfe/j/ku3Hz0g337z8tDjnq+Y6CaBn/T8XCo2Kzf1Oaj2BHlSEihvOPM0lCmQod/slxhDikaLfnOC5WLZrFM40r82FnVOcs3E5CRpp8unn3zCoX372Hv4Hp566gnmFuaZu3WT63NzrK+tUW3UUX5oJ9hcoLXlHRV3VtntPaBW9D2KYe7mNJYrLixlRGBVUbI0K5EQIUFoENo21lk91AZJnLC+ukony6nVqoyNjVIfHSEaaWDm51lcXGDh4gX02TPcuj3H/NIC9+0/yP4dO9i3YwdbJ8YJpJUN9KC0hy8sjQsE4+5HwF8UiJSNo0MfsPn5+u6P/z5T7Z0T5UZMpZRqk8VnWum9Xp7TSVNuLS5y/to1PvjsMz7/6hjnLl1htdUhrFaoNZtEtTpSucnRcZCV7+EHyk2Q1qo9T9NSJ1/ZziQ7aQgxVAwoewy+89AERTeRLgJjbJIV+B5SQq/TptdpESnFA/cc5levvsozjzzCiFsAV9sdLly+ykcff8LJ06chCPGqFdpJTJrnVqtXefT51H1UvxwnUjrOqCkRimLe/y78CuH4oMbYgMrpvlodcPsCP5TUGw1qtRqJu49DzwZhEuGk4lLavS5vvvsuk2OjbJ3Zykylgi8lvTjBIKgGAU8/9DBKetSCiA8//Ywb8wtknR4iCKwbqHNww3hD+71ZwvQ/tk22Iph1mvyIPhJrFW0cMi4lvU6HuNVGGsOhAwf4yaMP86uXX+ahQwfwgLjXxaQpodPAn2ut8t4nn/DnDz6gnaY0JyeRQUAS5+SZdsivQeeaWqVCs1pDYVHBvFCtENw5MP+6J8A1A3ooqWyzpHFW856PF0WkGD7+/FN2bJlgcmKM0W3bUFIyUa3w3KMP0UtSkIovTp9mbWWFoFEniAKS2B5LqZnM9xuPQ4Gq6K+bthJllTus74KdP3wh0cJVM5RF43NnWpQ65N/3faJmA79WpdNucXt9jW8uXuDqzevMLS7y4JF7OLx3L4f27mX39FYqyiNUyvaDuaQFBoPzH6Kz8n0uX1Ex3Qytvts7vt/39AP0DX91YcEw4FD8vx/j2KcEfdM2S8VaS1JuLS5xbXaWY2fOcPr8eU5+8w0Xrl9nrdMBP2C0PkJzagthENBeX7dSmHmOclKNUkrSNLHIuLbVIgmusb8vfXi3cyHAGRv2X7Wp8sq3bQ5wUr6VrSbPmb89h8Dw8IMP8sqLL7B/714urSzz9icfcfLUCbZs28nk9HTpAaNcr5IR1lG57FvKXGyH5ZPHgwH5XY7HIuQVwiCkqy2lU7neoP5a21eMl1nu5VKGt7ZMydZGkOlH2H70gHwiqAw9TnyPZqZ8T3ZFXozLgfmxOCui/EPfmKZ/OpxAXgFNIUvJvFwCznZYG22l0zQlLUTnmjTPrYSigTTNqI2MkHoe589c58uvj3Pq7BmeeOgoTz7yMBeuvMLvXv8TV2/cZJoZaiMD1vAShOzLZxXduYU2dYmuOIur0uLcXexBt0jAdkAb25yghZWdisLQ0mzSjDhJbIOH76N8i9rZrmVJvd50qGLO0uoKrAurNx1FTG/fBkbjS8Xqeov/8g+/YdvEJE8+9DAP338/Tz7yCPt27mA08F0cKh2CUaitbFaq27DdbQYbQNAHQ+5CiUMpaRvltHEndPOP3Axz2HQi/AGbGfiSoppigEK7tOhMSHXG3Noqn504wdvvf8AXXx/n4rUbGOkRVetsm5gCpdBYd1ecHF9UrVDoEGdZRpIldrS6srDEjXNtygSuyMyLkyaGzp8pdrB/XkRxdSwnVDtk2TbJaQJly8/ojOWF26wtL/HYww/yt6+9xks/eZqZLVtY15qGlCRxwo1bN3nv4484cfY0U/v2IqoRvSTBSkbZZqMsSzFYpaICOc61dpNuUCZ0g9dt0Aim/NuAAgwMWHsbp+uf5wjtbLbd2PAFhKGH7wdkqaUmJDIrP7cXpwSVCimas5cu8N4nH/PgfUeo3nsvI2GEUj6ZBpNrIiV59N57GRsdI/AD/vF3v+Pm1StUR0fZvnMntVqFdi+m2+vZZmdfuX6P4a3EWQ3DzKoSfRqo3fwbkdfhL777grrpXXHHCzd5511RyDu/287XxSS+4V4cvN8dd9xgyLXVUrYSfhblyvOcpfl51hcXue/QQV558XlefeF57tu7BwX0uj2EgXqziVCKdqfN6XPn+Pz4cS7fuMHkzA6aE5OkaUqW5kgBgefRMYY8TwmDgCiKnCKHnXeseZcYLIdtvm08H5u8rgQWBppYhRiQdcSQpSlxmuP5tsy+sroCQjCzfTu3rlzig08+5rFHHmbX1BSjvk8ObNkyyc9++hztXpeb87f5+puzBI06u/btpVar0uv1iOPYKod5ajjI+7ZjMVhvAoqk192bsi8drAtjPaVcM6Y9jn7za3Hstm/L3dwElSpBGDA+MU7cbvPme+/x+Refc+TgAR645x6ee/JJ7j90mG2jY9a0T6q+3K3aBFQZjAe/bbh+yxttw17x2YN34+YfuhkxQ7CBl27unIsHP6owXhOl5MrAfglpGwjLea/v/JwD7Szj1KVLfPjpp3z61TGOnT7DSrtFLiRRvUFjagvCD8kFrLZaCK1R2HlSOcpdnltFHkxuTZ4862eic0tdsX0+w02d3wqJlZObnZspAvry/iliHAekFmu0FHjCJQhA3O2yOr/Irl07ef75F3j20cepC8m7n33OqTNnUUFIWKlYTfyy8irodnsoJ19qZY0z2p0YgCisOPGLvATZisbMovYAtspdAFRKKcjSkmo0aJwnpG3GNloTJbGKq5H/9k+ekCd37uD/tdm5+StuP3pAHm7bN/RYVSp4i0ti+dxNWu0WlYrjOGlt+wyMQRkIlKKd5cTtNtUwZGx0xHWEu20QphJF2QiWVle4cvMWwvepNht00wSEwAsC19VvB4jJITXOcEQCkU9lYpRTly/w//nH3zDRrHF03z7+/le/pt3q8Nvf/57W6hpxmlFtNggCn1Rr4jixSI+T0snznDzL3PjcwFAbWKCH587BW6EYGG5IuwY3q5hhEEYjhG3M0Lkhy3NkEXQh0VlOluaY3CCx6IXyAoQL8ONuj26ec21+nuyLLzl76TKffX2CwwcOcGjfPg7t28/U5ASjgbL8dW9YNqjYdOFeKe7U8BzeBoKRDX8Z1Iff+Npvx8v/bVteyFQJMeT+Zh8Lq38cx9xeWmKt3ebc5UscO3WKr8+c5dK1a9yanyfOc5qjY/j1Kn6tQuYcYq1aSo4StpwrjKNyuMC7mLuEHGC/u/pk8TrPLZZWf9smKlL0P8cu/vZPaWyD5XqjAVLS6fXoJD08qRhp1pEG2u0WvbUVVJZz//4D/G9/9hp/8+KLTNQbREALwXya8smpE/zhnT9z+tIFMuVRqTfIpKTV7hH5AVIpdK5tuVprhEhBCPwgsLKjBfJYIOau0dlgUQ60Ic0zlG874XtxAlKgfL8oT/SRCYe+ASVtC3dtmo0mk+MTXL5xnThJCKMKUnnkWUaSxNQrIWG9RqYkX31zln/4/e+JvIAX7r8P4St8Y+UQpYFJ32N01w7ka6+igLfefY/Lt26xcOsmQbWKjCKiKCAzmlRnFOVeJaWjYGAli1xZf2jpFbb5yEpOameQYfqc4kKhR5t+Veov4DXfjdk5jG0Vj83wk5gNAcPg5w4khsVrXAJmsr7UpeeqJrlDnIxwjshF0Kc1cZaidW4lDasRoR8Qd7rMz87S63QJleLehx/iZz99nr95+QXumdlOAHR6MUZD4MZfO8344OuT/Ob133P87FnCWoMgsolvGsegBYHnU/F9FpOYNO4wPtJkcmLcBn7Ocbcwnsu1RiiBNKKkJBVJocs43HOWTqBzXVZuhLTXUSlFlmX0ej3CMCQMQ0sd0NrK5DnXZmEMwilbpVlqzWcqEX6txqVbt/iv//hPVPyA1554ggzrQLqzWecXzz5Dt9uDPOXUhQvcunyZbbt30RwZYWlxmSw3KGFcZVVYkzJXhVBSYtyxaed0qJxsotb9a1xAStr0g2577Lo/kornheg3XouiolqcD4nyAnyl7JhfXWW51eH0hUvcuDnH6TPnOLBvH0fvuYf777mH6S3TjDfq+AK8u1Rii10ZCr6/NQsdfIEY/lMx5ocCiMG/iw2v6/9aAgmDUspDMfog6m0T9T740N+PkqKD5YevpCnLa2vEacrl6zf44thxTp39huuzs1y7dYuF1VVQHlG9bhOeqALKI8kz8tQa71jPif59qgtflII+OAg4DShhfdtm8U4HGQrIdYYROYEfgIEstg3wSniAVX/LtUaFvlMXygh8H19KTJ6xPL9A1umwa+tWfvHii/zNT19k6/g4X506zZvvvM3l69cZm5rCc8Zzm4E5bqEGLRDG6oorKeglCd0kIccGtbk2pTbEoDmiMoaqH1DxfVZ7PavNLi2AW4K27til7+MpNWJ8tW11tBn1Kne3zflrbT96QG627hp6bJsUAm6vt1lfX6dSrbnFNLemOgYUBt9T6Dyj225Ri0Imx8dLKbvB+0kYl7sKezALS8tcuHoFzw8YGfHpxQl+FNqLHCcoIQk8nySOyUyO50vWki5KwNZ9u5i9cZ0/vvMm9z1wP/v37eOBPbtYeOF5Zuduc+zESZbX1vCjkKASgafoxD1AE0jLkTS5JsuNFe+Xsp88ljtOseP2n4G/aGeAUjiPGgOZe85O/A5R1IUrlXOdArI8tZ8nrP100XSmtUYnbohpQ7XW4J77psjihNXFFY6fO8+XJ08xOTbOvYcO8dQTT3HknnvZv3cPE6N1QiWoKEGAKB0wJZS0CCtjdrdSzt2hJ1l09wyivuUCeLdA/PsFK4PfuvEdhZALWHkqg0Ulcsdf7CQJS602Zy9d4fS5b7h87SrHTp7kxJkzxFnG2NQUUzt2EVWrzq7Z2Img6CnAHotNWPLy+5XjW5b7qM2wE5qjeWCccRM4LX1jFXGcs5gNhK3uvsFYDUYh7AIoBbnRaJMjfY+gGtJdW6e1tkzebnP//v384qWX+PVzL7BzZJSlbhcqFdI04cz5c7z+7lu889knJEqydecuci3oJRkYqzfeRxAsEpiV5VGr+KDzQkbTIkNWzjEnz3N8z8MIS8NSwkcoaRuPkPjSSllZVan+ouf7ga1QJIlFZYxVqWrWm0yNj3P+0kV6SYqaVChPWWRPW+fXMAyZ3rmDtaUl3nj/fXZM72DXtl1Mj9SoehKT2wAukzaheOzgARqNEabGRvntH//IyXPnSNIeVTFKUK1htCDNrGGKFB6Fi57Qbhy7gEECxugSHZOOs1lWEvLcSa/2A3Jr2GTuWLy/zzjv/z4ceJg7XrHZu4t77c5EePBR0fcwGE4Y7SADIV2VyyFRxoEN0r5RY++z3GjXoK+sr0QY0l1aprO8jDTw8GOP8ne//DnPPfkYByenMECr0yWNMyrVKl6g6GrNl2fP89s33uaPb71HK0vZvnM3SZrSWV8HBL7yCZTEV4K01yPpdhmtNxkbHbNHZKAwRtHGIvYWEbNSf6qocNpotawUgh3PBcovhAV2impXltkKph8GeIFPkqW2yqNttVEK8JW04zPJbGOdECRZxtTMdjqrK/zxnXeY2bade+8/ykS1gsTOTQe3T/P3P3sVhea//C//C6cuXqQ3Pk4jqhBEEXFq535ZqJC5/h87Hu01wNgIXLpEUhtA9FFf25jokg9Z8P0HO1QKUFiUFQ8o1jbHRzYa7eSG0zjG9wP2HziIJyXddpvZ2VnOnr/AWx9+xP59+3jmqZ/w4H1HOXzoMFsmx2lUQuqBGlprBsdzcX/ddTh/69aHlPq312Zv2jy97Z8f0ffKEHeuM6Z84BR2cns+pOhTa3NHT+ylGSvdDpeu3eDC5cvMLixw/ORJ3n7vPZZW15icnqZSq7N97yTS99EuHojjGE1s13qlQPXt5PVAZVK5+EPrQvLWbYUC1nC+MQAY9o+5/F0YcpGDyEEZyMHoHAq5WwS5660rmAJGCJSnEEYTd7u0l5ZpRhEvPf0M/9Mvfsl9O3dxeXaON9//gGMnTtGJU6a3bbMKMXHX9tLltvLr+z4aYVkC0qpg2V4mnzzXdHs94gFzoMJxHDEALGB9LiqBR+h71rPE81DKI41TMNpWgQtgLPBQoVdByV1A32XxR9x+9IA82jjmBQiDhzYid4GYKPgMhn4TpMEiCgKkk7qRmy5UfdzHYOW0Mp2jRX9YlaNN4CzO7XcGXoAKFUkaE+cpnvSRYUjSjfni+AkeOniYp48c4dGjR7m5tIrW8NXJE8SdDsr3CGpVK3ifZbTabXSa4SuPKLDuZvlQFlr8Ptx8M5zs33l8dwaWg53hg7fO4IcKN0Wa4TlHCNJcW1Mh6VEfHyOsVYm7XbIk5cQ3F7h0/RZjI2+yb+9eHrj3Xg7s3cORg3vZNjFKSN+4RypptRMH91VbzqY2fTnIYlYdOjK9SdA9hJb3F3cx9PfiXRvOkylKhFZizE5O9j1SSTzZFzizWqTD70+NYSWOuXrjJidOneHM+fOc+OYst+bnWW216KYpfq1OFAQE1SpeGEJZanVLltNy7x9XfwG441i/ZTPCLsJ9ypZ73mwI2Iw9ztHRUaSQLC8u0stSglqFLZOTKCVZW1li7voNVJJycMdOXnvxRf72tVfZMjFBN8uphiEAs4vzfHb8K06dP0dsNEG1igp8x8mTREEILgAXGKeyYhMEyyeNy8DE93yrYiHA9/0yULGyW7acmuUZSijCMLDohVvoBuVC+7SdAVc5AZ6EKPCIgsCORcd1tXKXAukpkjTBSEOt2STPctbXWnz4xVfs37aTXz73JNVa1SE4OSY1SCRe4LFrcoyfv/RTvDCg8fbbXLp5g+vzt+nlORNbZxifnKSXpCRpRpZYuozQtselGkaEQQBa0+t2reReLlHaKwPW0J3vUs8+y0rU3Joqqb8OlWXDNkijGQIR78DQB7eijGsfZblNGsIgIghCCK2lepqmtNMOnufZ6+/03AvHZCMgDAKajSZKCtK4y/LCArfbHUgSds1Mc8+hw/z8pz/l+ccfZdvEOMZoOp0WCkmjXsHzFbGBq7eX+er0Wb65dIlYgwxCclMo8RRImkaQ22DB3ZOeUvjKc+PFuGSiv2bccW9ucjqKKocUEt/3KapAeZaV81RUici1ptVu2+BRehTOa3aM2mtRMhlxs7mUmCBAhBGnz5/nzXfe4eUnn2DP2BgG6OaGkXqVn7/0Elme85vf/55Tly7B/AJ7Dh6kUq3R6XTpuaazMPCpVAJMntPr2bK+8jyiMLQmKr0YKT3rQgtlk97wGnLnudh4Wtyd2v9LH0gHYcGKVi/Gd+DUyMQElVodnWUstdr88e13eOfDj9g+s40j99zD/YcP8+CRe9g+NUkz9G0TLoMJ4d234enS9Ne+cs7cmFje8QkbHg+/pnTmxl4zqwDnQBhRSB/3ZT2Ln4IaVGypNrTihBsLC1y8coVL165z8uw3XLp6lWu3brG8vo72fcZmtuFXaqhKBH5g5RWNg3AMNs0yohxLm+fww2j/HcN6OPgoHwxFLQVIZgxRGILUtFstpBbUwzoKyzaw0rc+Ugb0kgSkIQx88jQj7nborq8x2mzwwKHDPPf00xy+5zBawKWrVzl37jxrrZalkMlCFa9/hw6ez4G0CoEDQYUkzXOSrG9mZUUoTPnG4n1KKQLl40vV731y5680gsIpl1neGShZQYg7bcZ/hO3HV1kpKl6Zhl6GrgVk7SwwaS5zYe7UkhaiRJTANnkVwfhwAMcdk0UKpNjGGa0NRjhzWRfhSzeotcnxlET6yiGTNovMck2t3kB7AV988QUzI6Nsm97KoalJXnzqKZJuj26vx5mL52mvrAJQbdRJPcV6KyVJLX1Aep4tsTtjhY3b4PxiGB5s370N32R3m1zuDOTtb4XRkAmgEkQEYUhUrdJtt1lfWePKjRucv3iRM+fOc+bsOfbs2sWRQ/vYvWOa6YkxtoyPM1KrMVJvUIsiAs8jLNAMacu6aJsd65LOMjwdDM31fVAZBgKAgppahuEDJ23T8KEMhgVG2SxACIFyH5m7n8zYzu31bpfF1VVuLy5x/eYt5hbmuXjlKt9cvMi1GzeYW1wk1RqkojE6yvjkJJ4LNsDyJksjEa3LgH/waoihZ7776hYBkDY5DlYpkYbBgLz4NGOMlfI0hk6vhxFQDUIipeiur7Ny8xZBlnPfwUO88uxz/PLF57ln2wy9LKOXZTSjkKtLC7z/xWe88f57nL9yhaBaI6o3wPfptrsoz0pM5WmCyV2ipaSVNRQ2SM/yvJxIrGZ4Xhq9FKiw1gbPEyhfWUk6Y4gqVnc/TlLrLlpq+rrJUbgx5ZIfjMYHakFILaqgDJY/KSy6qTND4AWkSUyapNTqdaqNBnGny/HTJ/l9rcn45Baefeg+Gp7A97zS7Q0piDyPe2a2UvvpT5kYG+ODzz/j/c8/5+b8PJlbVIwQeNgG3VwIeyy5Jk4TwM4x0vcIpEW++yj0wEAuEqqSj2vYZLn83pu9NfqL6feIX+78gG/ZXLqE5aZmpMZVfDwfbQRplpI6yo6UylVztJPPk3hKoEwOSU5vdY3e2io+gsP79vLcUz/hiUcf5Yl772W6YSXLunlOkqZUwxDPtyPryuw8b3/8OW99+BEXr98gqFYhtKpTCFnSqfqgTIbBqlMFQUDoKXxAaj1kRT547N96GtyJLfnwpQSasXJrUlKtVInTxCagvo9yk7opEQnjwIlC/av/0coPqI2O8s2lS/zj739PrV5n5OmnqUtBlqVEgeK+Xdvwfv4zjFJ0f/Mbzl+/Qby+Tlir43mKOKFESo0DoaQDuwo9bAm2iVwUd1kfQNg4BjeVIy7/9h3jVdC3lTdWZtivVolcQN5pd5hfXGJtbZVzly5z/vIVTp0+w/GTJ9g2Pcn05ATbpqbYMjnB+OgYtTAk9H0C4RSvNl4sMRiPu0BVDM6Xojj9/eP9luS3v24NQ2FDxy8BbLItlCyVuLLix1jAohvHrHc6LK2ucW12lhu3bnHhyhWuXL/B7O155hYWWOt0WG21CCpVtm3dQVStkbrqpzYWjbbcbXdVjAtctTO2UT/4rv9Bm3HjVhhp1bxclS/PjV0TBc4ACHJtqSyBUvRabZL2OoEUPHz0IX718is89/ijVAQcv3SNDz79nG/OfWOb8ysVcgw4ehgGJxe92ZE5Zriy8V037tFJ4pLqZavRAwi/+1c51azA85x4wF3UiWxGXczVFcD/657RzbcfHyFvxfagsgziHlAj7rT8dhKLTPc5k9qYPu964Mcag6jhTHMw3XW/W+NwSLKMLE2xslouYy2SAjOQwTo3rDyzDUbKUQIqYQWkx43LV/ni+Akee/QcE+PjTI5UeeC+e7l28waLS4vcmJujs7pGtRJSiSJko2EbEbTlppeZ6x1zfzEdb9iKCdttm08Vov9v+YK+XrjZ5JUbP69QN8jznLXWGibXSCHwlcf01mlmtk6T9hLa7TY3Zm9w9dplPvrkXcZHG2zdMsnBffvYvXMne/fsYcfMNibHxplsNql4nh2xQmBU/wgHE4Jy7weMfyy3emCiNAwtKH3u6sCRiD744YBwi3qLYtEZPvrEQDvT9JKE9fY6K502F69e4dTZs3x98hRnvvmGldVV4jTDjyKiaoWZnTstt1lZLqxUXskDt42Tuo/0CzGQMBYhpdxkQfv2Rcw2H9GfJBy/rUCOy6RD9NHkpZVVcq2p1Ks0ajUiP2BtfoGV27chjnng8GH+5mc/44VnnmH//j3EgPQ8Is+jB5y+fJn3Pv6Ek998w0q7zdaxCcKoYqtIgMlzTJ7TZxgZ16XvrpmSKJRNDLCJSpracr10PHnb8W/32VNWEaVwn8VAnmYI5WHUgLOjKI7fNtgU8lkSqIYh9UrFjhVt8KQi6cXkSUoYVRBKk5uM3JXyvcCn3Vrl67Mn+ec/1qmHgueOHiEMA4RSJFlOmuVowPMUMxPjPP/Uk1QqEdVqjUvXrvLlqVPcunSZ+kiTkZFxqrWGrSLECevr63S6HTpdiwY3Gg0ajTpJ3CNLU0uHyHPSLHNKSqKPKHueM6iwjUp3yEV+j60cYWZohrjL1h+zfWSzP3Itj7/4BFO+xPd8QNBpd2ilbXzPo1qtElYrqDwgTTPSPEfkGUqK8u++J+l12qwvLdFbXyfutJkaHeXeAwd4+dnnef7JJ9k1M81YpUKKa94XAj8IkX5AAsQaTl28xLsff8CJ06dZb7doTk2gosCOQzmgLCStiUrmdOt9TxGFAVEQWL8F05c1GwzqviuUsWCZpQbozFELne5/kqRoR5Pylesj0tpRVUSJ4NsJqqio2bFfhMRSeigfVpZXOHH6DG+98w5bR0d4/L77qIX2PKTAtm0zvPzCC/TihN+9+Weuzd+m3W5THxujElmEPk+ssoYvFVEYYbQmTVO67Q6+71OtVOxYzLO7tQ/0g8+7TF+Dahtm44c4x0PlKQLPB23I0oRer4fJc5RURNUqu0dGEMYQxzGddptjp07w2Zef4SvB9JZJ7j18mAP79nHPwYPs2rGDifEJxtxaU1Rr71xnKBOnMvQ2AwCP+7FCD4UOt2DjiSgu1+BxFpU/2zgp7bqzQcU4MYZ2rmnHPdZaLdY6HW7cnuPq9euc+eYcp06f4dbcbRZXVjAIvDCk2mgwtW0bOx19N81ystwi7wX3v79f/Z4tYYxlArjYZigs2HjBNp6jb9mGkvtiikCQ9GIEhma1iRSKuJcQJxkabDO/A2KUlES+hycMedLDQ7BtyzSPP/YYTz39E6ZHGlxZWOTTLz7jy+PHuL20SNhs4lerpQGcKE7+wDUTmGEFMoyjy0Avts33mSmu2caIqH8OfD/Acz4gtrdjIFkrqrGI0sVW5zrEmB9fYoV/h4D8o//b/wVWVtCPPor+j/+RA83Qmzm3HK51uzJ1TSbDDQcuwC5I9gOL1zC3UoDsBykaiIFur2dLpdrYzvOig9k4bvYA0p47V0/P9/C8wAYGoU8YBSjlceXqVV7/85+ZHh/hJ/cd4b6D++h2nkZnOX9+9x0u3biGFILmxBhhvUatXqPd6dLudqxovfTLkoi7lSh0SAcPA7jrZLfpdpcXlB+1WdxXxLVu4VKeZ3U884w8tcFCYaIRVMKSatLttOllMXOrq6zFXWaXl/n89GlG6nUmRsaYHBtj58x2tm3dytapSabGJ6jXatTrdcLQR2FTSx9KBGFoU6LPg7njSH7YlgJtxydbb7dZd3qntxcWmF9cZnlllbnFea7dvMb8yjI9rWm1OqzHMakQEAbIKMKrVm1Dn7IIXG6040e7xjzdd34t+KhyQwBj7jiMYoHY3IyieH0ZfA/QU4SbmPu2vv0tSROMEEyMTlDxPdrLK8xfv4FKM47s38ffvPwKf/PKq+zeMoEC1jpdJqsV1uMeX126zBvvv8+xk6dY78ZUag38MMRgv89TVlVE57lNL4rAzRi0Cx6Vsj+WomppAlIKjJZ0O108T1Gv1wBR8qellGR5XqpdFMfp+t/c4jmclBljzSUwhmoU0ajWLNqZZighMLm9NggXPGaGbqeLFtY2moZhYW2N199+m2atwvjoCAe2ThP6HrmAuJeQJClB4FOLAmaqVZ68/362TE5x4do1KmHER59/TjdNWZ6bZdVbpFpvUG3UaTRqVKsVS2XJc1rdDu1eF4G1jvawgILnjrM45sESUEF7KkCD77e5c3e3/H7oVZu91wz93Wx8rRn+XQhpbdQRKM9DI2wCltkAtDCaUZY/Qp7EJK2Y1eUl2qurRJ5i3/YdPPP4Yzz9+OM8ev9Rdm7ZQigF5NYJUkiLNkZhhK88Fnsxx0+f5c133+XE2TMst9fwogg/DBBOXtT0127AaXAZDcJSgcIwLI2HNlLBNj/wu29CSIQsqCp2dfGlshXBAZnOwvXYiU9Q9Dkhi2DQ3uNFg6lw/G8/jGj3erzz4UeMNho0Gw3u27WLSAiW4hg/CDi8azv1v/9b/CDgf/7H/8bF2Vl6acLU1q1UKxUSIei026R5bqk67h7NssyNMY2l9txlHhrCkQePfbOBcedmQRI7h8RxXH6a8n3wPIvuCoGRAqU8AiHIdE6SJWitSCXMr6/ROXmCUxcv8OcPP2Cs2WRsZJTtM9vYvnUrO2e2MTO9hUa9TrNWJ3ROlL6wQY3PAN98Iy5iLxKbLDzfvg2AghobfPeynLVOh/X1ddbX15lfXGJxZZml1VVuLy1x5dZNbi0s0I1jVlbXWG+1yLIcv1rDD0P8MCKIIoTnkWiN0dbgzNJhjKvm2HFVJHdD84ObL+8MxosDH0hZBkGtzbZNs5viKVOWLaVxZlLGIH0rXZ1qOzf7StFs1Ml6PZZu30ZkGQd37+apJ57g2SceY9togwQ4cf487374IWcvXCAXgsbICCLw6XS7ttJGgZAP7PvQYdv1QTr+fLvTpdPtuoqZGDryjWckDAOCMLDJdZ4NTKD9BA5hVcW01qRxIjyt//sIyE/8v/+f9pf5Wfg//UfGwd+zvhJl3baM8xzhTHA2Dihr5mNPruf7+M4q+G6bwQZk3a7l0hnp4UtrbSuc4KpkMCDXaG05nGEYEXgB7V5CKjNCz2d8cgudtTU++PADts1sY9v23ewZrfH0A/fhO3vnbrvFWqfLGtCUAi+M8D2PXi++Szls8MJ/zxWg3MRdfv9hWxGQe1i9c6MU2sSkcUI77pFpTeQH+FGF0SiikY2Q6ZRMZ6RpwsJ6m+7sbXqdDh6CWqXK9OQkM1u3MjMzw7atWxmpN5mcnGR0dMQ2cNWq1Ks1apWQiu/jCYGnBJ6zuLWNRpTVi8F9tSh4v7Rvy3eaDDshkGXESUo7yVheW2NheYnV9XWWlpZYWl5maXmZW7OzLCwusLiyysrKEsuzt9Cex+j2HYxPTDK9fYdtPNOaPNcgJVpIR8dwSgzu8hljnJmPcKhvmbvgXjJQLv1h16mkrOhvU9xw/Hq3qEdRZM1VhKCztk57aYma8jhy8BCvvfgiv3rxee7ZtsUaGiUpSZ6zBpy+cZN/fuNP/Pn995ldXqY2OkZUr2OEpNuL0doi26aQUBQuoRSUyTJaW66etAFxMaZ9z0Pnlktdr9UYHx9jcWmJXrdLVKlYxRVhA/RiElelckF/UsyNto230lIlMkcTiioh9VoVBegsQxiLbOeZLBE4JRXtpAMSKkFIbbJKe3mVa9dv8Prbb1OvVXn5hRd48OA+PKXIPUUvyy332xiiKGCm2WSq2WTXtm2MVKtMj49z8epVTp79htn5eWuWlIwxMj5OvVYnr0An7rG2vkbcjQn9ACVCcvKyp0IOSONpY1wTXJGUyO8Mxu/21x86I2ykP337p1oZNTD4npW2LJrcCo1jW8L2nLKQRmcZa2urpO02JsvZPj7OgT27eezBB3npmac5evgwY066NUlTV9XUCGONrJTyWMsyvj53jn9580+88+mHLKytE9RqVJpNEF55byJk2XBonW0spxVhG9xrlYrtg3BH+5esrMYY8jzDk4rQD5BOdjNNU8udVdbILYeS1kVRVnfn8NtnfwFS0RwfJ+92uHrzJm+8+x6jI03ECy9wYPdueqlt5m+EIUemJ8leeIa15SVe/+BDri3Mk/U6KGzPXSUIS7qIzm0J0gusJ3OSplipt43Ek83nm4GzsOmeb7oJW71KXSXM96yxnXKBepplJJ3Uel94HmG1SlCJbL+YFCRxzOrqCreuX6e1uobJMgI/ZGpyku3bZti9cxe7duxgdGSEyfEJRhoNAt9e62K9qUYRgbKNj0qKvuFREdgOXAt7O9hjG1Sa0caUVMc8TcmzjBTDervH0vIqq2trzC8usLi8xMLiIrNzs6wsL7PaarG8vs71WzfpJQmVRpNqvUFzZIRqtWYreVKitR3/cZzQ63XItbHNjEL0TePoT412iRBlEDlgg/Jdl+MHb8PjVKCkpXkkcWrTOSFLJSydZghprAEdhrjbJW23ObBnDz999lmee+Zp7t2/jzjPOXXhkm3kPHWS9W6H5sQkUa1GkuekaWaVW9TAcRd7YFwvmBuGBgu6ilzQ6fVo93rOnLFIJov/iiOx1zyKwlJOuvDrEAMylMXcqHyfNM/pdrtUc63G/oJz+EO3Hz0gH9os/ytUvV41jWOV6Rwh/DIYL0oNRgqn02knN3/AWhnoI4VlecFlrHlGnMSkaYoMrIqBKbVvbKlSu0kKxy33nLulkh7GQK+XoJDUGk1MrllYWOCjTz5h77ZtjD/7FDMjTe7bv4flnzzF2uoax06dYHZpkWWdUxsfxa9WGWk2yNPclTbLvS5OAsXAGETLB53/NmaD9qmBYEUMlFg2mSQ3vfncZxbSfmVDmfuzH/h2IRTSup1mWSmdhACkxIsi6mFItTmCSa2rqETQ1YYL165z7vIVsixDZzmNRp2J8XGiKGJ0ZISxkRFGR0YYHx2lXq3QrDeoVapUwogwCsryvVIODTV9R9TMlfoTx89MsqzsrL49f5vb8/O0u10WXADe7nboxbFL6mzgnmdWasyrN9l+1EorCSGtrnGagpt8swFktkBnbRBaUJ1sebkYfuWkbgzGtXi6vvqhALO4zkVgv+nFct9blledQofNS/u8OqP7spiTk5N4UnLz+nWWb83S9H0ePnKEv/vZz3juiSfYs2MHvQx6aUwY+Iw36lyYvcWfP/6IDz7/nCs3Z5FRSGN8HC8IWVtvEceJC7AipFODKMcp4BWNN66p0+R2DEop8aRnA1wsXaDZaDA2Osbi0iKdbgfPtw5yUipr7oBTUxHCOXP2T8VglSDX1ozEGEPoB1Sj0CHjefmcyQ1ZkmGURniWHqNxKLyUVBo1JrZu4ebiPL978w2SPKeiJEf37qYeBiBsWTZNEqQxyCjAk5LJWpUXHnuU3dtm+PrsN4yPjPD5seNcn5tj8fYc7XaLxugo9dFRAi9gfHSczKH5tvqUonOnzOHb4A1jjcBKeTrVD9Y3W2E3ouDD97i547nNF+lBTHTzJXrzZ23goI3GSBwanJeurJ7n43tWr9pW3FJ0mrK2sIDUmn07d/L044/z9GOPcPTQQfbMzBCpwk5d4wvwA69MhIWTk7xy4wbvf/4Zn339NTcWFghrdaojTYKoQrfXI83yoeXWCIkR1g+guGeCwCeMInyvT+3DzZ9999sCxh58PHhSbEKY5zkiDKlXQprVOuura8y35630o+eTZ5o0icmNIYwiq8KUWalMXcRQrgIymBSUV08IW530PaL1NW7cnuONd96lUqlQqVWZHhujrjxLzQR27NjF//E//AdqzQb/9Kc/cWt+nqXkNiOjY0xt2YL0fVZWV+n2ugBUKhW0S4CsV9PGkMuuTIPPmLuMqsH7tBibQ308bv6qRD7aKS0lSeLkQgVZbuf1GIOX2kZZpTyEsdQtgEpjhKjeZMs2bZN/B8bMr64xu/AV73/yKXmWUqtUGXeUnZERi6SPj40xPjpKo1ZlpN6kVq1RrUZEYYhSntXmdpU96OvTZ5mtciVpSpykpG4d7CUJN27c4NbcHGmasrreYnl1jfV2y7pEpglpnpWVEUvBFUxs225dM/0A3w9cZQnWOx3SNHPgCwip8LwAX1q1Egwl4GPXmoKqUkDi9kcI4xRwN4XIEUNX6ntum6xPwjgKhzbWl0JK/Cgk1ZaCV6tVCHyPPO4xf+sW6XqLqbExnnr0MZ5/+mn27dhGDbgap3zw6ad88MnHrLTWCatV24eXWmAN42QacUpA9NV2ysjJ2LVHC9uzIoEkS2y1mIGGbTPQnyP6cVcYhIRhAAPgmjAFydRVKsGqr2hDEseioXM1/f3P4F+8/XsF5PbOLwLyTqeWdDoySTNkZQNlxUU6JdFDSgI/KKXVAKt9Vr6uHxDFcUy32yWOYypBaJ3FDAODvpAfsrsjhXCqENbsxFMeWZrSi2OCKCSs1/FaLU6fPcvv/vgHRkfq/PwnT7GtWuGnjz+MpyRTE+O88/FHXJ69QW5yGkC13iDRkGS2qevuWOlfgpRvxHc2xVru+Ks9R5SSQTrXZLlFXKSygamRVoUlyzLL15WuRC2sw55yxgMeAiLAIZxpr0cvzeh2e3Q6HbIsY2F9nZuLi3i+TzWKqEQVKlFEFIUEniLwAgLPx1cuEJdWIkkqAUa7snNfXjHPc7I8I3WJROay6ThN6fR69OKenRy7XSsVKQSeu/HCMMQLfLwoxA8CavU6AkGv27Ml7yy3i4EUSIzTU3VZsuueNw5xY4gTWmTUetgMRxQ9EANXwPwQlKKPTJY8efpKEtpxH5VUJA4ZWLk9TyMIefzoUf7utVf5xQvPMT06gpIQZ4Yg8NFKsri+xpsffsi/vPEG569cJRWC0XoTpE+SGbLcWBMcWaih9G0rrL6xRnoe0pNoadBpapFDz8NT1vxhfXUNAWyZmmLnjh0EYQjGGrxUKlW7MPmSJE2QwrrQZo53W5y//sSoLYdc56UiSRgE1KoVgsC341prlLILeuoWVCszqazDrRDEWYKSgtHJSRZnZzl35Sr6rbfxlUfvhee4f88u6oFPFxtEC+O47Z5HpCSR73Nkxw4mR0bZPj3NkUOHOHH2LMdOnebm/DzLt2/TWl+j1mhSHxktFS3yrC83ZlFWeww2/uprrVvlhsHA+7vD6+/aNr7LbPj9rol7uQv9ZdBK+BWKElbNRop+b0CaJLQ7bdK4h9SaahBwz959HDl4kAeP3MOTDz/EgV07mIgqKHCJdoow2kqjSatlLIG1OOabGzf413ff5U/vvsuFG9fJlbLzcRiRaU2aZ65PSDl1JTu3UfLJc6SnqFUqNOpVwoHDKvyAfshW3PO9TodaWGFm61bGRkZtRTbukusUL7BJYm6KapFx526g8rfJlD8YMmVao6RiZHKStcUFjp89gwo8qrUqP3vuOcYaTYyBOM2pe4qH9+zAf+1V/DDgrfff4/iJk6zN3yaQktrICErYSmimtePVGwt2DZoibTzWzZ/+wVsx3kE4BQ7hnCILkMeqZEhlKT9pnqMLVr1rGrQgkbDBU66tVKnWdPPMJmVJzFKrxezysnVhrFSoVuxaUwlDfM+36lj+IOijrKhDoaXu9nXQ5CzLc7LMrjO5sY/X2y1a7TZpZr+7F8e2ulPQtTxFEIYEgY8KAvwgpFqpEngBuXaAj9bkeUFJAYxVoJEuIbdrhy6R8DIIdz/GUM7/AkpH6bteMDNwPcuE6Xtev42vNfYLpfRBWTWSLMtsUSoMSLoduqurdFZW2Ld9By89/wI/e+mnPHT4ACPA7W6Xj7/4krc/eJ8Lly9THRnpA0Fr62ggCMIynuvfF4KC8Nsfm2599hQiM/SS2Dp7Duz38Azaj4SiKKISRTg76LL/q/hOY3Dov0fsEPJ6J/X/PTgrP35AbomhCik0oKXWvojjKIl7Ks0zQikxUg5BQJav5HhTUqI2cMitw2Mhj+MAD4c4JUliVROMNUWw2aYLlkxxE0oKtyklhS2XOvQKYbvau0lC4HtMTm/h9vXrfHXiBOPj4zRrNX7y8INM1+s889gjNEdGyYym997bLLXb9FbXLKdw6GYqbvryAPt3iNh8+rsTddjwquIe/EGBnlWBUJ5HLvJSsq/U5M0yZ3zhSuzOFVQb626K47Pl7sQLl8X7lQp+VKU5NlGq4hRyd2A7mdNc02u3SZeWSOKYJLZIpM5yq79uTOEeXAYsRfBbSN+VlBZpTUikUkxOTFKt19HKo9IcIWqO2Inelb2lUu53O+EBpKnlq9rEQ9vucLcA2A5+jXBJXBEwgS7HGhiXvRdohaMdFNfKwRpDBWExfP3F4MUtr075Af3n3Juk6xpHaHLH9/elZOX2bXrr64xUIp568CF+/dJLvPSTJ9g2PlYqyyhPoBBcXVnho2Nf8fq773Lqm3MEtSoT4xOE1SqdXo80tde9ElVt8NHtWq1+Z35ijDMrksK6y8k+xcLyVAU6zVleWqQaVdm9cxfbZ7Yxv7DgdLZdcgyl+kOBYFh3QGty5bSRynukz5u0Z8iXwi26IZ6nMEbbxkgs3chom1BJz5qgCAydTgeBIBppMrZlivbyKpdv3uCPb79FL4nRP3uFxw7sxwsCfM+ZPGUZxmQEMgBhx8LM6AhbRh/gnkOHeOTSJd756CM+P36ck+fOsbCyQkcvQ55RqTfIjTUgEkJYyh2u6pNbZFcqq9YClMG7khYhHt42a5K+897eGHD3h5cY+ozBcVW+WAyiacW7+sta0X9jEygXQAirNpJnKUmnTdbt4APjjQYzk5O88MyzvPrcc+zdsY2JMCgXy9QF45ZeVOg6Cyc3Jjh74xb/8qc3+OM773D++jVkFDE6Pk5YqZDkjlaUG3zlIT2PuAzOZdl/oB1/ul6rUavVCN29YANSvlfUOYi0SWmDw+X1JVp+i1qtxtapLfQ6Hc6cPcPq6jpT09bGHFcRoaCdlVn1JlfP9AMMAXTjGCmg0RxBYFiem+XEmTNMjo8zMzND7YEHqCkPMCRZCoHPkZ078H7xCxqVCJlrvj51hsW5WTrdNo3xMSqViDTXJGlKbob7torRUR7wxp37jrxQDH7A4HTnqlppluF5PkEYWm8RrdFpaoE2N/49ZyJUVDULZZ0s19bkzpLu3XojiWp1W43yA5tQ93q0261ygs21Zq3XY3F1lSRJXMN3YtFuR1EoZPUKGl5RgSwcG5H9Ncd6CkhGR0ep1uvkShHU6oT1hu15c+dTuvtCuHtYCoESylUD7LnIjf3OoqqinCJYXqhRmbwMzMvTbkx5Duw65OSghU1oKI9n4/07CO0MLEB3pcVtHBFm6JrmjlngBb7VJc8zq95jNHGnTW99DeKEbVum+Omzz/L3v/wlh/buJgR6wLFz5/nzW29x4dJlpO8zNjFJWK/TiRPWW22CMKLRsL4YWZoijaUZF3LX/fukn0RJJ6nZi2N6SQ89mHQIUVJ6yiMTEPo+YRDYqq8xJV228JYoiS5KkZqcpNMV0Urs+2tA8y6n7q+0/fgB+c4a3GoptlQESmqRZD5pWsmSROYu8LPakwLhOoZLW1k3oXkuUy4ujDamtJvFDU5jrD1xEie2qdM4mUOhy4lYoN1gl2RZH9HMsgwjrEGIp0Ir2p+kmABqtSrVkSZxp8OJs2fZ/ukMzVqdB/bsYqZaQd17iJW1FdbbLc6cO8f127OsLcwT1Gr4lWqJtA5mqMML7J03x+DwK95oBoL3wTKiGLh3vmsTiLLjngKdEwOLjptUcBOiMYau07a1wbCk7J5yA13rwsvNudlJCS7IEEV3uAGptG3o8X28SoXINUeC42C74B5ByX0cvJGKSapo+nVYtG0QRKD8wKIfniohMBsAGmdYkJV0gKIx3VOezfS1JktSUpO4ddMF8c5Ewzjqi0UJBfngClaUDweC8aInotQ1G76w5bkTAxNNeU2NGxOukmNpAc7FzjmK5VojMSjhk3Y6VKTiyYce4e9//hrPPvYwOybGMcaw1ulSCQJ836MFfHz8GP/lH/6BL06eIgdqjRGieoMsN8RxhzzTVCoV68SGRX2yLBs4/3YXi4qFUIUpjI+SCp3npIlNtsZGRtmzexfVapUL58+DNkRhhDACneXlvWfAcfUzTO5MkMqA3DiZNnuvF8GWB4RRSFgJUYGHdsFJ6pBx4fi7WZYjpcALbHUtSezEX61UqU+MM9vpcO7qNbwgpNaoEwU+B2dmqPs+qaecIgc2adSWzy4925uyJQqp7N/HaKPOfffcw9dnzvDlyRNcvnqVy9eucfP6dSq1Bo2xMaJKhWqtVuqyd+OYOE1LyocQTr1D6/I8m6GhI/rja3BaKIbT5nEe/SG1AS8aWKSKkvhgSbf8VtF/rJRCBT5BEACGXq/L4tISq8vLpElCLYrYvX0bRw4f5omHHuLAnt0c3L2b7ePjNDxFnmV0ejFSCALfI/B8jOfZeVuAj6VFnbtxg7c+/JAPP/+Cs5cv08lTJicmqDYa9j7t9cjTjMBp3iMVKtcYYdWi0DZQMHlO4CnqtRrNWg0fS/PIXBn7LmJnm24GJ5fmWwOg9nqLuNdjz44dHNy/nyuXLjHbuoWZmiQII4wUNrh02sz96cKU9/eQJtNg0JPn5BgyowlqVerjY7SWl/n6zGnG3vwTvhA8dv9R6oEHrmlShSF7x0f5+5dfohGFREHAJ198yeLsLMrzGJuuEtVqrLXbpJ0ueZrj+XZNLWvTG2LvzRo+N1UHKw5i41PGoITEcx4GaRwTd/sVsGJIaq1JXTAZhpED1dKyeiSVQhZhirHgTpYbcpOR5holLP3LC0NHUbDrjvR9ZBDgZxmVegHIuVVDUBpxDSqKDJ6BotFWiiLgdtcHEMqaySjPKwPw4n7SWtsxlmWuObFo+MdJuxbzvgBXtbB0GVOquOBZum2xvxo9EJAP0HXLxHLj3jPw+M7/D80tYuM7hsLX/vV0cx9I4iTGaE3gK6r1GnncY2V+nrzbZd+OHbz4zLP86tVXOLhrO5OeZKnX48Sly7zx3nucOHOaXpLQGBklrFYxCNvM7eI863ory6XVzmP94yvummItsH05EHdjenFswY7C0d0UM98A4wLb41TokBvdrzaIMrRxIJiw9KEkTok6iRe1NDR/XJz8Rw/IK/u3I5qzsrd9Cu1JRJZ5MsuiLEllVgTkQgzpUQugINJKwHc0C/s8Dj0fbKWzW8E3toG+sY02WGkbi4grB7zrgWTR3vgaG5hLz0cFPr1egskMIQGN8TF6nuLarRu8+9GHlofmKR7at4eJwOfpo/fjScnumRne+/gjzl+9iokTZBhRTGP9YS6GF0tTTM+DN0J/+x5Azg/ajDbkJrdZfHFOB7aybOZQyzx3boqe7zqfRd94hyIh6KuCWGc+p5LjJiqw2uyqeCQlSjg3NtfoZtUG7AFro8sJc0htpAhMnAtgrqHb65KlmZ0cpRzSYy3K7NasyJSTsp3zbONfcZJz8r7kkiq0XnHNirjkzh0rBVJhH9uPGNj/8umNk9vdkAl3bQxOe1u6eL4wI3GVIikwGegspZeleDpn7/btPHzoMC89/zzPP/oQ080GObCWZeRCEEvJ3NoqJy6c55//9DrvfPIJqZBMbp0hqtUxSJIkdtfYXpcsSaG04rYTX+6CxSAIyHTuTHGs2obv++RJYmUGtWGk2WTPzp3s272H2dk5rl65SpZm1Ko1hLTKHEILp1trS/xCSKSiDMQLrqBAoqRXyluB1UaIwoBKVMHzPNu4huXpGgO+tHq4WZaRpZld1KWHkLY3wstzfD+gNj5OZ3WFs5cv0v1Dl263w2svvcRD+/dTk4I88C1Srm1KL4xApxmZUkglGQ1DRnbu5MDOndx/6CBHDx3k9Plv+OzYMS5cvU4vzUm0oddq0Wu18HyfIPCRnkfoGlspyuZu/EIf7drsvh8UQHOjZtPX3blED3/mxvBbmAIYFP3mdyGKW400Seh12nSNJs9tc5vIM2YmxhhpNDi4Zw8P3XuEB+6/j4cPHWSmXi+dAg1YvneeIwoXWmMVUAQ2yFnSMZdv3ORfXn+T373xFrOLi+SeojbSIKpXMUAcp2RpXsq0KmwFVAiBkso6w2YZJk2RxvYV1KMKddfQaQBbRxksbP+wzVMKozULt+c5cvAQB/bv58svvuDK1cv2UjoVkwI8Kpfvgby9SGz7181R9AoZYCnoJgmhr6iMjJBlGbdXVnjjnXet1rqBhw4fZrJaxRhI0pSK77NzbIzXnn6aKIwYHx3hg8+/ZLXTYfH2HLWxMatoEobW7bCYyxHlyNh8xH3/1Uds+F04wMQ2ceZlZUg5ZFwg0Fnf1bYwD5PkbpoXDiF1tC5X6bYBbI7J3DXxXAWvOOduXin2Qw2uM1I6N12GgvRCOKDMUt27pSgCbkO317X9abLvXGyr7YWuvEFrt8ZmNtiTxvbcFM2kiFKPqwwI+8CUvRLWPMqOo37Dd5ExCRfU49aaQtN5472+8Yrc7Yp9/+ursYmvERrfk0SeR97tkrTWCbXm4KHDvPL8C7z0/HMcPbC3vLcvLyzyuz+9wR/feou5pUUqzSaV5ghJmhFnPbIso16r4/s+aRy7NVc6g8G7HZO9oaSyC24cx/R6PVuZ8offUp4d0dfhl9ImbsLNd2Lg0wdjw9wYsiQRqtf1wm5HQP2vGY7dsf3oAfmWsW0o7avVxoRYlAqT5xJjpNZa3GHQUGZC/WKpDXSks/IdGEDGcvO0C9r7N6ouAxsGBm5/YcgcEuUycGlpGbk29OIYhcZ3E0OWZ7S6HRqVCpVmg5XlZS5dvcpXX3/N9JZpJiYmmWxU2TI6wpMPPcDE2BhpltGLE5Y6LXSaWn6ca86zQlPFBOAmjAIlHbrMhqHFsv/0UDDvniqXlsGhesd7i7+5Mpc2lv9bBAXFme2jdvYq+L5vGzo2oJT9QLlIjHRpBGEc+l1o8Zb7MRBcSwGp+45+s26/arFxKxO3oeO2R66kR+7KghtpIsVYGrat1/3EBJxNu4/v929LO56cDbwQzvrdyQ9iqxR9N7H+9xn3+f2FdwjLpFj6+n8R5XUpzqtwvFwyh4xgJ2sPq/UttCbtxWgEP3n2Bf73v/4V+7ZvZbReY11DL7FIZLVaYTXucezcOX73xp/4/PhxvChidGyc5vg4aabp9TpkqSaKKigpydKE9VYLIWx1yIs8sjQjy1JbLq5UiFM7+WWpRSiUEHTjmCxOqIQRO7fv4ODBg4yMNDn3zTlu3bxJtV6n1mxYdYXcGh8VzpV5nuP7HtJY6TjhxqhwN3FRAi4qIxKHcoS+5bIbjfRs03fWSy2a6QLcPM+sfq4QVpMZQbcXE5MwMjZONYpYmr/NibNn0XlKEAaMhAH379yJEpAre9/6TkHEIrC2SThX0tF3YPvEBGOPPcYD99/Hk088yZlz5zn1zTm+OHGKK9evM3frJibPaYxPMLFlC41mE6FsxUMbg6/8suEud0nYRryqGCcb7+rvlEkdGH/Dy7ZxAXe/ccrqgDtgRBRlcUEv7rG8eJu11RXQmvHRUQ4d2M8Tjz7Kfffcw4P33MP2qSmqvk8gJZmU9v53Dp++UkTNhq1U5BmdJMb3fTzPJwNOX7rEH9/4M7/9w+ucvXSVia1bmd6+HVWJyI2m1e2Suob7wPORKNuo7RpNpejr9WujkdoaRgWehzcwbzj/oh+0CRySm6ZUKhU8I7g9f5v19XV27tjB1NQkjUYDiVUHyXSO5/u28pEX8+WGz3TXdxAoAFzTryBJE/IsJfQ8as0REqlYWFnl488+pxZG1KtVRg8fJopCTJoRxwlB4DMzPs5LzzzNli3TRPUGf3zrLS5fu0a0usr09h1Ua3W8UnZ0qNbaH0dmMHX7ttXkzvM0uBVNktLNr56riED/eiFdI3CuiZMET3n2Pi3W89yQG+snUK45rj/E0hXsNc90XsqJDmKYEmvSU9IfcWGG2TyRhbvJjgp3HOGQ2ZmlV4pyfSruF+l5Dq03btZ2UpyOKlu8R3kKhSoidAy2WXHIlVk4QKpYSwtahdEFi+V7ppYbaGtFlHrXVw/8bgxJkmKEIQoDqn6AzHJuzM5CHHNoz15+/bPX+PXPX2OyWUdgaSrLWc7Zi5f48vgxLl+9iletMtUcQUURtxcWSdKMMIpoNhrkeU673bHKKc4XxtUEBmKfIv6zBy4QzpwsI81Sct0XqrjjAovhWMqeS8r1diM1shhbeZ5DlgiRJRKbY/xo24+PkLdaeOvrca/b1RiDkUpoY3S31zVZnhGGIbGBPE2QLsjJ0YS+b00zpCQMAsv5KeOlgUVpoPStc2055HHP8T9NX5dS2Sw3c6YukR8ipCRJUtv053mQ9EruX+B7pM6JMMkzPCWpjDRpr7c4fvo0nhdQq1V49olHGY0ipioV2LmLX//sNQ7s3csf3vozHx/7ktQYVBBSqTcIw5Ak17S7PQwC37d0AiGsWoTltxkKlQEwQzbPLsF29IniqN1pGMhV7naL9TEhUWaMm/LJBj674I4yEITbSzAYVOImGLunhUTa0A0wsBW8Lm0sglCM8DsC3IGjEUP2zv1Co9wQoGw0YioPz/R/16K/+JjybwPB/uCxFnmAoaQwDB+UGHiPe73pJx1a6z7KLl2JE1FSaayKjeO3C4uSJYltdgw8j2a9htCauNtlcXUFnWWMjYzw5JNP8tCRI7zy1FM8eGg/FezCo42x1uYSWsAnp07xj6//kQ8/+5zba+uMTE4SVKqkmba0LW0RAzEQFChH+bAGQMIGPC4hSdIEjKUw6DRFOym2Zq3Owvoc12/Ocu8rr/DEw48Q+ZGVAFteBiGoNRqEUQRJQpKlA8mp5fVqF5x6SqE8D2P6FS/pKZTvY7AIeSWKGG00qUUVjNEkSYx2/Ear4GLLwFIqfN8nSRN0jm0wxXI2kzTDD0LGJqfAGK7cmuU3//IvrKyu8MuXXuLovv1MVas2uHQBguckuUpzEW3whEFJQTWKmIwitjaa7J3Zxv333MOD9z/Ales3uHj5EtdvXGd1dY3ltTWuL8yTZBkIgR+GeEFAWKlQrdeJKqFzGh6orhmGfzfGaRT37zvYcI8W/w4sNsKdX8+zHgm6SJ7zzJq3xClJt0eaJJbLmVnVlKnxUe7Zs5ta9TDTU1Ps3L6dg/v3ce+Bg+zcupXpWp2+sKDbRyFAKnC6Q7m2fSJSeUQVG7Dcarc5c+Ecv/3Xf+XNd99jYXWNxuQ4qhphlCqdYI1rdvQo7h/X04EN0CwCmzI2MoJJfK5eOM/WkRG2bpmiHkUA9EyO8JSllWB9KHSWlwYgxbkq5rzcBffF/Z1nmkajQR7HnD11inv27eOZp3/CU089yfztOU6eOE6l2WDLzu30erbhzxjLay96VLSrOqqix0VA7KQjfd+3a1RmFayEtIZ3yg8IanW0Nswtr/DuJ5+SaQuoPHHkCJGj0vTiGM/zGKtWefT+e/F8j20zM7z+zjscP3uW+Rs3aI6PMzYxQYogMXl5zPa66XI8YAaMCos5EluJEE5lKcuycp0tGjALpaA7pFsL+oBLmsqA2BjHg7YD3GiDkcPjuEhNBwPSAjQxGjaG1hshEAC0bWaFIiAfTnaHoB5xFyKpW4S1m+gl/WpoATgJ2V9bBWDkYMV08OPMkLLa0DK2+RI4RPMrjrr83Rgn56gGzvkA0DfwBYWco9GugV85+oYDxPqA6AChx0AY+Chl0eWV+VlaC0s0goinfvI0r7zwAi8+/RR7xkcQUCoB/fMf/8Rv/ukfuTY3R9RsEFRrVvkssZUGz7NnMs/sfWFlOi3gEkahHY+5vfcpq6k2dsi1to39OmO9bVVvunGCrtpjjHuxlWkNg/Kc5lmGrzwqYYSnFHFx3YStTBS0Qd8PUAaydotWq0UjFyaS0Q9huv1F248ekLcP3oOa2pJ2d+wC5SHSHA15HCdG55ogCEiTxHFSPTsRuRm9iAULDdMiCxVuUigKjxLIspzllVXa7Y6NWoVFaFLnjCeVLDVrledsnwspJiUJlcSTyt1FFqEqJtA4SdGeojE+jhSSpdU1Pjv2Jc1mg0ZjFHnkEI3Qp1qt8ujh/dx3aB9CaNZb61y/eZOVVotMSHyp8JVHoKyphqVd6PK4yqB6YBIzQ9ON6KMXxYRWRtY/DPaxE8cw4jzwLRs+rkB4hidw95fyTX1eZJHdD33EBoTizu8R35Gx37GPDrEvMtoyebjbm4tgeihRsGjDoBva4P4UxzT8d3PHvhfBweCnorEusYPn2Th0vdwJO+nlxml9S4nQwh0PSDQmS4hb6xDHbBkb5aGjR/nbn/+c5x5/lO2BdStMtSbFcuw9AbPtdb6+eIHf/vkN3v7oY5bW1gnrDWoj4yRJSq/bQwrb7CqUKJt5ETiesDPaye2OKOWhdU631yvRLp1nCGMdS5UCdI5JU/bv2cOBffv55twF5m7NWq6+a2b0ggDP98jRJTpclG6VGUYpbAnYac/Tjw4U0Gw02b5tG81Ll1hutzG+TxBVUQ4fKwICJRW+55PEiaVZhCGBF5BmGZ12l0oU0BgZIapELM7NcvLCeRZXlllcXeEXr77K0w89TMMPrGa+m5M8KZDO2yB3KgxCSWtEZqAmFXvHxtg1NsZDhw6z0kuYm7/NufPnOHfhIsdOnODi5cssLS+TZBlKYJHkOCZXEpN59twUGbgoaG6ijJIG4xVZDOpioNsoZWgBL9DuQi0nzRLXkGkXPLTG6ByR5XhGo5Sk4lWstKTOOXrPPTz31JPs3bWDfXv2sHXLFsYqVSIKRNJKhkptpVBLx1EBRkk7PvMcT3gYAd085/riEp98/TXvfvABb737LrfmbzOzaxcTW2dodbr00pgstnQmT3p4vrT3U2765krKybgaO17DwEdnKe3lZcKJCXZt3061WrFjwvWlSGURVoEFQcxg9cydZ7tAa8jd+XPfF4YhcZrSnpvj+pUrtFotHjj6ADevXuHLjz7ECIOvdhEXCVN56/eR17JJD41AOsk1UFKQm9yqPkmbeOS5XQ8DL2B0Yoq1pSWu3Jxl9c23EEiCqMqRvXuoeR46Sel0ewjfoxqGPHHkXvbs3cuOHdv5p9//npNnz7LWatHzfdtzI5Vt0Hdz0SD1wsZvDsUukFtjZy7lAKOip8dSQod/SrR6iIY1OF/2o8VCF7xAPqzs4cAMvXFdcJOv/QhdPicH5/4iWRt4y5B06N2Xmbtu2t1XuJBVlA3JG5dLl1wIU8o3l8DO0IsHkPAN3yXKe9591lAkMLjwUCYaBUJfzJODyiKDVVnNIPWt/7tbRe2U48avDfTtdfSVAjI6q2vEq6s0fJ/nn3yS/8Pf/T1PPvwgk9UKPSwwtNCNOXv+PP/4u3/hjfffZ9eePUzObMMgiJOMLE9sLORZIY00ickxKE+S5bYKLT1pvWJMjidtAm9cwIwRzhVUIT1bxV1bW2NpZZXto2P4LqFWRZObu8Xz3IpB+F5gE47cAmZKSHKsmo4nLZ/d+HbN6/V6JsuFNgQ/LMj6C7YfPSC//X/9fyCyjHhkFCpV5MotDYhy0XW0AOkQRSEFQmuyNCGJEzKHwA0GgVIpq6ZgjGObWYT91uwsnV6P5tgY1WoNgCxNQFppJW0MnqdsgAAlL7agO3iuVIKAuGtF5iuRLZmmWYYXRFQbTTzl0e10OXbqlOVBmpyfPPIAYWnkJXj1pZcZGRvnD6//ibfee49bN29SG+2wZfsOdmybIc5yFpdXWFlbRUhFrVq1SiDYScbogaCbIgjPSydD96RdsBl4TP/vd5tzisnJwDClZPBj7viMwcTA9P8y5HI1PLmUainFdw7v5tBzg5/8Vx31G45j45TWf95ser7EHe8EzJ17KAs008JhTrEmIwwCgjDEQKlti7alaT8MEUKSZBm9XhcpJdVKhdF6HWE03XaLues3iVvrVHyfew8e5Jknn+Dxxx7n4XvvpekQ40zbqovneURhQBs4fv48//Db3/Lp18dpZwn10VGUH9Hu9OzVkwMNupiB67ihXOqOXDvlEuPOVRFEB2FIoBRzN2+RpxkPPPAA9x25D6Ukp0+f4tatW4yNjRFWqwhHfUBaTVuNozi5KpZUCuXZ5CBJM/zQohtCZ9bJL0nKc1+pVNg+M0Po+cxfucbMnt2MNBos3F4q3RnzzAY0aWL7IJTyyDNLVysQsk6vR6YzwsCjNjoCStBaX+Pdjz9mdW2VtdU1nnvyKXaPjhJi9dUTbRC5DcyVb0vOOs/JerFdJHzPUg+ASMBEJaA+M83M2AiPPfgALzzzDFeuX+fW7BzXZ2+ytLLCyvo6t27f5vzFi7RXViAMbPDteaXakReGVs84sD0sSlpTFZSyKKML9LTjpeZO/9kU/zqqXq/VYn15GbIMlEIoRSWqMNocYbQ5wsyuaaampti+bTvbZ2YYbTbYOjnOlrFRJppNRms16w2BXbhznaKzHKEtQmhhLwm5VQTKAa0UfuATAK0k4dytOV5/7z3efOcdLly5Qk8b9hw8jAoDWt0uSZ7ZYLEAYcoAS5QJihE4Q68cT0lCr8L6mg0WokqFLROTjDVHy/m+Jq1WeKeXWKdiI1xvgsA49Yqh6tgAqls8tipDkmBygnYac/HSBZ54/HEOHD7MroP7uTF7k9u3blGt1alXqmQa0lw7Hf3MqlKpAKOt0hPG8tKRkjxLMQ6dM5jSqCzPNUbapnjlmhVbccwnX36JTlP+/rXXePbBo1Rc4hFrTS/LMEoxUol4+dlnmJqY4P2PPuZf/vg6Z745z8TWaUYnJ+1nC1nKtEohkZ5wCL4ojznLMtu07Y7Bc021QeCjc0vnSQu03CmjWW+BHwAqfuvEPzz/bly3hmLtgTxIDMz/g8pl5eu/Bb+52z7ZMVHuynduRcBs3E6LjWXcu32XuOuDoacFVj1OIMq5WTvd4GJFHmwi1sbYplSlSLOUpNcFDIHnWXlIadevJLONyYHvE4YeSa/DyvI887O3OLxnD3/3s1/wynMvcP/he0Aoeqb05eLrM2f5r7/5B67M3mJ6x3bwPVKtkVKV64nJc6uU41ttfbQFgDxPlAi3zm2El5vcxWkZQvhuWhAOo1BUalWyPGd+YZ7u9BZGqjWq1Sp5kpL0evhRUFJThRCkeUaaWtUbU4CFEkzmKvwCyDW+kPjSEzLPhIi7QOO7L/i/YfvRA/J474HhJ/JcC4SxCIUgz+wJL+yWiybLwbJXmmYkaUbuK7QQpNpAbvnPQlmG1q3lZb489jWzs/M0miMEQVBOrHqgRCZcY0eSpmhjCMPQlkCc9WvRI6EosnubNRqjibPcLkT1OnGacunmdVZWV5CeIqpE3LdnFxOVCCVgZyWi/sADjAQh4yOjfPDZZ1y5fp3Zy1dor7eoNpvUohAhRu2+6NwG3bK4aft3fDEBFA0I2jC8cPyVtjuC8js2c5ffi8eD4e23fc63b3eG+N+9/dtf+2/Z4+EPN8bgKQ/lW/OBOE7sGBTW1t24cZWkqXuPcCU0iScFOklIux26a2sQ99g+McG9Bw/yynPP8vRjj7F32wyNIKCbpMRO0jGKIhIM11aW+Pz0af7b66/z3scfs9LpMDIxSbVaRxtJrxsjhcQbQAW/82Rh0SGLekl0bpASwiDAV4q0FzM/O8ueXbt4+eWXeeCBoywtLfHFF59z/fp1ZrZvRwY+cZ7R7XbxwwA/DNBZP9kWAnANuVlqg8ggsskMacrS8gpz8wvE2lZpRioVHrz/fj756hjHTp2BJMNHgLG6x8KhOtpxC6WSSKTrARAoIQmUR5on9OIYBFQqEePVCiueYnF5mQ+//IrF5RVOf3OWV555nsfuv5/I94ikwHk0WbfINO27AFpo2hrnOMSqIgQ132fCt91G+yYmePDQIZbX1phbmGdxdZWllVWu3bzB2XPfMLewAFLSixO6cUySJvRSqyKTaRvcmSTDGOtOnA4GHbLfkyGEsEEzWN1waQkfanISb3oLSioqYYVatcLY2ChbJqeYmphgx8x2prZMsW16mumJcZphQOSaagMAY0jzrA+iFNdQutC25CcLhOfZsSYEXWO4sbLKF6dO8/Gxr3n3o485e+ECic5pjo/jV+ukeU4vjl2CXDSWFkr4/V6XwR9tNH7gUwl8lmdnSVZX2T49zdF7j7Bvz17q1Spgkbsbt2a5ev0GUiqq1cBSLIaQSgNGo01BreiPT2OsM6nRmvHJCRaXlnj/gw84ev9Rjh69n8efeIK1N/7E/M1b7Nm3Dy+SdHo9hKMFWA36wWDOop5qoJHecvhFaWomccCThkyDF9iaRNLrcPHGDVZWVlyDvuTgnt1M1+sE0ib5aZIQ+D47o4iJ++5jx/gEtTDijbffYm5pmfbSElopjPJRYYAfBEhHmzHGJQIuuRNC4IeBTRKcoZXUEqSyAadDVyyvW/0o69O/11Yg2v0Hd3kNA6j3XV5TrIp/nTOx2Zc5JoEbxzq3VcVSJMOWDsqGVwBhLPUjz3LXTOs5Xrwm1j2Mu2crUWib2tOUzmqXXmeNqhA8cs+9vPbTl/j7n/+S+3fvIlKKdmpVqJY7Pc5cvco//eFfeePddyEMGNuyhW4ck2pD4GSnMZY+J929pXM7poywTbpW+czSmKVSGDS5zmz1xPSb/Isx5vk+SysrnPnmG/Zv28bWag0pJb0st/4XQLUaIaWwAFiclgDTYOXCuIqZMQadpURKEYU+ftKVsrWkoPG/bg65LILikq5gcgRp4PtGCkmWOpTGoYrC8UeVtIhWKhWtTpeV1jr1yCeUkiTXpGniGvE8lvKcs5eucPzkSW7PL1AdaZZZmOf75K5bWbkTXZjLKCEIw8BJAcaOD2ezuEoQOs5sarWRVcFD1QS+h1+pkCQxs0sLfPjpJzRrVaR6kYcOHcQHukClXuO5xx5h586d7Nm5m3/+13/lnY8+YuH2PJPbtrFj3z62Tk7Q6nZZXlnG6BztUJuibIqjL4gCvXDokNaWHz9Maflh2yASjhgu6Q0i48X/vytUHSypbUQovn0nNiDjmz234Zu+9cO+YxvGbPrRTIlgfNt+msGj3Ow11kTFC0KqUYV2q0Wr07Z9C5UKtXoF6Sl6cUyn0yHPcypRRL3RQBlDt7VOq9Ui7XSIlOSe3bt58uGHefKRR3nywQfYPjGGB/TSjLjbRQcBUSXCV5Iby4u88+UX/Lff/Y4PPv8CrRSN0XHq9REQEp3kdgwhhgobQ6No4ODFEJRUyFr2y4a1qEIax7TW10Hn7Nm1i588+QTjo6McP36cK5evsLa2xp79+8FTxN2+Mx04fV+KRdw28WRop2oCCIHnB2RSMTc3x8UrV1la7zJVqVANAu49cIiH7z/KZ18eI09S2isrRJ6H8DwwNogwjhZWIHZ5nmJyjVSuOVAKEp06s5kcz48YnZwiCENaq2t8cuw4X351nNnZeVJt2L1jBzunJqm6alaS5fS6XSphSK1aAXyM49Zqdwy5tF4LUsryPmp4kvr4KNvGR0mBXprS6nTsT7dLp9tlbb3FwtISy6urLC4vs7SywlprnbX1NeJeTJyk9BJbSbTlW+l4mfbH9zyi0MrgRVFo+3C0ZuvWafbs3Vs65TZrNcZGRxlpNqyjYWSTQx8LTLgl1IJG2OplliSW5+ka4JXyLOjhUPFUpyg/sOAK0Mpzrs7d5v1PP+f1t9/mzPkLLK2tU2lYxF0oxdp6C8tMKkAJG1CU0nGuOlgEq2XAI4VT2pDEvS6+EBzcs4cH7zvC3l07aVQiusCtpSW+OX+Ba1evMbJ1hkqlatF23Q8e7efb8V7QqQqpOqOtKIA0hkazyfzsLF9++SVzt+c4cOApHn34Yc6dOcPC7Xl0lpHEMd1uh6BStYmlsB4XeWopQZ5vmxx1bqk0Voa2MGGy0r5S9S3UjQHp+YTOX6ELLHe7/Pmjj0jylJdfeIHHjx5lrFZD+j6i1yPpdGi7MXD/7p2M/Ye/49Ce3fz+jT/x2fGvSRG0sxgtNCiJ9O0+pKlFvYsKlud5ZRN2r9cjz60DbeZcNSXW7Vk5Pn6apnaNLX0cvv/Wx3K/5TVmQ4V36OVm8/VqCHG6m67Zhuc2WQwGq6nfBuP0p87N15Xvt1ptugMbXtL3ZCmbhAUIR92VopBtdE3xwkrAJklCtVohqlTIczuPJb0eJlP4lQqVMEQrRSvu0WmtUvMVD9xziJefe44Xnn6W7dMztgEZ8H3JapLx9YVL/PPrf+DtD96nnSU0RhrgeZgks0pY7rpZNoDlu6dZTpwWlBWvH/uAk9ZVQ8BkkfyVTdx5jhCKhaUlTp05y737D7Jn+w4ibBIeZxoTZ/hV+3i902G90wYl+0pQZpDmKJwxXI7neVQrEZ5JJL31fyNa993bjx6Q//LzL4GikU6wO0uTJAi7Qa2qgxXrjCmcJFCqNTg0wXdlWoRgcXWVuYVFZsZGbLDuexgliHwPH/jmxk2+PnOGm3Nz5DonqlRItVWoiKKIXmJ1f30lbSaWaZTyXNe3RuusDDLy1JZ6/apvBed7MVIYlLILu3UTM0SVCE+N0/N9ZhfnefujD0jSGJFnPHLvvWWDkw/snZ6CZ56iVq8zNjnJVydOMLu0yNUL56mNjFBtNhhp1J29cGonQmMVLHzPuuEVfHedW8dMP7C629axrpA+6m/fkeDfuW0Ixu8IpDeJrL9nrH3XP2zkXf9btruG6JuWFgcnyKKOebfPHf77UAIkBl/X36RUJGlqqRJC0KjbMlduNJ1up0TLw8BHiRBPSnQas7y4xNLtechStk9NceTQIX763LM8/8QTzEyMM9Wo4wFZkkGeUY8iwjAg05pb7RZvfPAB/+1ff89Xp04T55ot0zOoMLJjJLcVwVI+sthrA4h+w9Od56d/fEWZ0EphKqpRhfmVVdaXV5iemubhBx7g0L49rK4scerUabpxr2zELBpblechpCwXDiGtG6wxujSmMsY2G6W5ledUvs/i8grnLl7kwqVLbBmpMxoGVKKQh+47wk8ee4wPP/ucuRs32bpzB9IP6KWJayVxAY1TZshERp5m6Nzg+Qrle0RSEacJq+stFpeX8H2PShjSnBinElWIWy0++PxzFpeWeeSBB3nxmad54PAhpsKAeuijVB2AXpZbNRzhTMYGxoVxiJQ9ZjvHFUh2BNR8n9GREbKREVJjSmOtbhwTJwmdOKYd2yC8G8ekaUKuc+I4pdvtkRWOc8KiqgXnMwxDwsAnCiPCwMfDUK9WaDQa+J6PpxSB57tqh1V8LoJvA1Y21qkSFWthICVeGKKkNYtK45hc564kHOCFFTw3eJIs49rSEsfPnePYyVN8eeIUp85dYLXdQUURtZERwsjO10m3U1ZJCyps0Wxlz6Ft4tNmUInC6poLNL1OmzyOmWw0Obh3Hwf27GGyWaMCzHU6fHP+AhevXGWt1WZUSjzft3zVTdSdjIvWirtFCoFQVk8dKalWqug8Z2H2FteuXsY8/RQPPPAAp77+mssXLxJ3OkhtHXLBWNdbF6zm2liJTyfP1+t20Ton9CJ7f5UNka5JUuCclXNXfbOa8FXZIEsSLt+6SeedTllFeey+o8yMNKhVKvTSlDxL6XVt4r99dJTnHn+MyYkxDhw8wIkz3/DlqdNcu30boyS1ZpPRsXEqUUQ1ikiShE63a4Nw595sXLK7EbYpFG5w1AmGX/Ld28A1+La3bQyC71iqNnnwXTTOu27lGzaMj82f/taPGdzfTdfYDdvQkLwLFF8Ek0KboXEsiopdyeHvr2UG2ycUBD55ntFurSOEIAp8mpUQck3c6bC+uEieZXhSMlqt8ewTj/OrV37KffsPsG3LFgp1pqK59ZtLl/j9n17nrQ/eZ25lmfEt06hKRJzn4ClMbnv9MOApH09Zhaw0ja2cpO9b08Isc6ZhNmAuIvGiMbo4HiGcp0WuqdRq9NKUC5evcPLsWQ7v2snB6Wma9SpGWcdmCaTGcHtxmcXlVcJKBansWlRS+oTlj+Ma3ZVv3VZD4Rkv/8Gj5wdvP3pA/ujtRXQcY5yFtBkZ6c2H1fXG6ERWW1ohTRLbnV0Y/xhXclFW4xgpuTk3y9lLl5iZ2UojDPGVlSHrAVeWV3j/q2N8cexr2r2YsFbDjyLiTgejDaGy1JhC66po4AsClwSkKVkSI4BKVCEXiiRJyDNr2S1RZfbkK48sz2wXfOBTrdephKG14r50iXa7bcvkSI7s3cNEFBJjy7x7p6cYe/45duzYwWdffcl7H33EVydPsD5/m6TTZnxy0i7iSmJyQZYbdy5y+kJOVgISsEFR0dDyVwtr//23zY5ADqAfpSQiw3PfD044NnnvZo/utv2QOoQQkGU2AAvDkCAMANBJTJ7Y+yBwbmEYYye/1jpZp8t0s8G2LVt47IEHeOyhB3nukYfZs2UKRwl0lAVtlTICnxQ4c+MG737+Kb/519/z+ddfk0vF+Jat1BpN4iyj2+7aSVBa62ihuSMA+e6Dkha9NNpObhribpf22hq+Ujz1+BM8//TTjNdqfPLxJ3zy2acEUYhXiYjTxGnTg+8HdiLNNcJY6khhwJC7fhLldIV7cYwSgkqtxvzKCucvX+HLr4+zc+sU47t34QP37TvAz19+lZs3bjF//DgmSdHCyhMK5xqrGVR7KGQUbQ8JLugvFq7E0WiiICIIq9SrDdJ6nRuXr/LBp59zc3aO24uLXH3sUY7s38eBHdupRxFeQTPQmkwIq3VbIGkOuaKQw9QGg2smFAPupUAoJRUhEL4Pvg+12h2XYrApKwdiNtfiklCi3J77926boVBv6i/aBqy5l9t3oKQCSYfmZnlGhq3WSYRtFBTQyXPW45iL167x1YkTvPvRx5w5d56VVptcSKrNJkGlaoNip5igisoG/WC83D9TNPENNrPbhtbA90jjLu2VFepRxD0HDvDg/UfZs32bpdgAV27O8uGnn3Frfp6oVkM6jX0cJcMUY7wMNAfuj4HJx7gTqwJFWAnptODrkyd44sJ57j1wgOeffporFy9y6vQZemnO1M6dtJOE2NFHhLPkNjiDO1v6xFbWTBnYFt9mJVRtUqDdPYK2zW9eGOE72/Gbi0v8+cOPaHV6LC+v8cQDR7l31w6qvm855WlKz1WVJxp1nn/wQXbv3sVnx44zNjrCJ8eOM7e0SLfXpbuygqlWCaIIhaTih0ggz3IykVvzNbcNKvhYVaR+4/+gzOH/P2zlmKYfDA/GuYOBvmMr/ZuW1rvlI3/11XrDfVHKxoq+oo0eqOwKhKOwCfLMNnMrTxH6El9Iut0OrZUlkm6P8dFR7j14kHsPHuC1n77Ik0fvL8HGFDtn3O50OHflOv/8pz/x5vvvcm3uNn61Sn10jDjPiZPE9kW4vgklJMJXlm6cWnpbAZAqIUmTno3dwnCoD8Hy5C2dBYNT08oRBkZGR+msrXFjdo6PPv+CLeMT8MRj7JueplkJEVjWwrWFNb46e47LN24QVqqWv+646cYYu0YqnzTvEXe7hJWIxtiYWdm2pdvZOZ39tS/dxk395//8n3/UL/jHpTZd6dFVHt2oSlqpyizJduULt1/srixPtdIUUchwib4Ws1KSJEmIez2klIw0m4yOTTA2NkbFU3jAxdvz/PmjT3jnww85d+kiOYKoVscPQ+IsI3PIWJZZOR1PeQjnluU5S+08y2yzGIJarYYfBFZ6Lo7JsgwV+KXaQxRFpdpEnmUIYwiCwJZy85xeErO2tsb6+jpbt2xlx+Q4MbZMkguB50mmpybZu3cfzXqDTrvN+uoqK8vLpLHVjg6DAN+VnDWWP28bGSSVSoWoUkUpRRwnxHFsURYXTPxbb3Qx8O+m5bXvmF3Ehp/v9YWDJSgEojRKGv6PTZ+1MFrxnzR37sPwz/f779u2skx6l3NhhCstK8/KDxrKqocQEIUh9WqFShCAzkg6bVpLS6zOz7NtcpKXnnuOX7z8Kr946SUePnIPW8ZGybVhrdUl7lk5RN/3Snvp89dv8Nu33uI3//IvHDt1mqBWY2b7dhqjY7TbXTrtLnlmO809zyMokFvnCjd4POVxib4udXloSpaBWeR5SK1ZW16ms7bGtulpfvnzn/Pc8y9ilOS3//oH/vz224w4q+lM52Ta2PKp8uxil1tZNyUtGVsXnfVK4gd2Luh0egR+QKNep91qYbKUWiVi965d7Ny+DQ1EUUhUb3L9+g2uXbtGkmZkWhOEhSqTPZAi2Tfa8o3DIMRobR0+sxQhBdValZGRUaqVCsYYer0eva5dHMZGx2g0m6yur3P58mUuXrzI7Pw8KoxojI9RDwJ8G62SG0Oa5xbp1IUhvOVCespKX8pCa95YJCZNbAN7oeZR0EALNZ4iYB6kahTjUWID7sEf34DnEtoiqdUU9vGD49nKb1oJuxyd5WVQXCBUnpR4jupE4alQ+gwIpB/ghRHKNUytJAmX5+b45KuveP2dd3j/0085fvo0i6urBNUqY1NT1JpNjIBOp0u3a9FX3/ecEoyT4izHYKHy1B+jwvGupbQBedxu01ldZdeWaZ59/Akee+gRdu/YjhHQyuGTY1/z5rvvcXtpmbBWx48ie4510RuBS8xcgDk49l3UpnVuzUqwc3mWZyAgTVO2jI7ywKFDjDYaLCwuc+b0adq9mK07tpPkVp3IaKcYFviuUdJqZxcNunmeOXOy4oakNAISiJJrPqiDjRCMjo1RqdZYWl7h5s2bLC8vgZRMjo8xWqsR+L7TxTa02i3WWy2U7zNSqzE9s5WZrVsZHWlSDUParRYry8usra6Q9GI8KalX69RqVRBFkquceZsNlDzPc7QCCxTlWtvnPPe6TWGXO6bOod83BaY3ebvY9G/9Gb+vaLVhJXBrhbV+h80A/Y1rWaFVMvgjB3/fdP0RmzzXTwqGHos7v7//YPM96//fBdoIJyMJRZN3rnM7jhwgIIVwruY9PKmoVSKqfojJM1qrKyzPz5N2OkyOjvLIAw/y97/4OX/76svct3cvxhg6SUpuDL6SpMCnp07zX37zD7z+7jsstlrUJ8apjY4SZ5ml/CLxvQCTa8uIEH0DwlxrkNZ5WXnW+yWNUwSCMLB69FmWOtMsS8nLczuLeZ7vpKIFzZEmxlhlu26nTZ5rtFCMjowwUa8hgdlWmy/OnuWNd97m9Llz1k3dCS7kzv9CeR5B6JPGPZYXFthdq7P9viPtk088/P89uX/m7P/9ziH4V91+9ID8P/2n/4S8/wEqL79AMrmVeGw6zY3cVl9febU3Pzt9a2UNlCKMKnhK2dJcljsukZ0w4zi2HbG5ddpbbLW5urTCe599zh/+/BYnzpxlrd1BhREyCMiMcaVIJ9UkRFnqkMKiZllqL3qtVrM2zgbXXGn5cpaaYiebXBealwFK2ZKdzrMSvVDCWojnGFZX11hYXKTX7eJXa1TqDZqBb0sRQuALqIc+0+NjbJ3awpbJSTypaK2vs7S4SKvVwvOtBmcQBgip7IJZ6PEaYzv1Pd8GZeLbeWzfEaEOzTjfFpDf8QXfM+ouX1asMwObueOVw9MMm0ykd93p77U7G19xt8/duAoMyMx9y3GXiIqwi6cUVl/VaI3nKSphSKAkvW6HxblZluZmMUnCji1THL3nMD9/+WV++dJLPP7gAxzYuoVm4JOl1mhKSUkYBQShj5KCtV7M6UuX+Yc//IH/9sfXuXjjBsbzGZmYJIgqVtav2wNhHfA8qfrNY2YAYy2PZ/B8b7I4yYLbmlMLI/I45ua1azSqVZ79yU/49Ws/Y9+WSS7O3uYff/tPHD92jK07dxDVanSTBCMEwjmjFoiH7/lgIM1SoNAjtsgaCDqdLpWowkhzhHZrnU5rnSxLmZ6aYteu3YSBT0MIwmoEWrCwtMLFy5foJQkjo6O2GlYcTRHRYkrerpBOtk0MoGdSOEOTHJ1ZzVvlW8t4IaVVtOl0WFpZ4catWW7MzjJ7+zZr3S74PkEUUfM8fGc6hhSOSmL5nAZdlvOHFnaXnChlKwbCFAu8GTbtoe82p3A9Oq5aJinQcDvPFKi4fR19HX1tMHlWfibGONm9Igi3ga4suJR5DqJorhJkWElGoZQL1u1IWckyzs/N8c6nn/Knd9/hT++8yxcnTzK3uEhiwK9UCCoVhFQuYTEY52JoMI4KZYZcWQu9dVNcR3uyypK8MJqk16G9soKvNU899AivvfhTDu/by3QUkOQ512/N88a77/Pn994lNtqqixhD5pDxgvpSKK4MheOi0L92nRbGYJs+czxPEvg+169dIwoCHn/sUQ5OTiKCgEsXL3Fj9hZxnmOkJAhCS/spkUtKI7sgDPA8j6TQ3BfS+hWIPn9cCVl6VhRj2rjAplqv4wUB3V7M6uoqy8tLLCwu0u310FIw2mhQD0Mr6ystIJVlGR4wFkZMjY0xPT3N7p07qNdq5K4vot1qo1OrrlJcC+XAACEkhdISWFEGMRBRlknMEJ3yLwjI7/aijU9/x+T/bYH2Zp8hNjz3LSuQ/ftdwKDvtUhutpN3/G3zUH3we4oeM+HmO6NNn2rm7pdCK973Ven1ksUxaytLLMzNknbbjDUaPPnoo/zi1Vf42Ysv8OT997NrbJRQSrQQBJ7CSMHt1VXe//JL/pff/Y63P/yQqw4ZrzabKD+gF9ueOyksXbCgvinnpJw7MyelFEEQEscx7Vbb9rU0Gvi+V5pLQeHGawFWg622Wi8P+7vWmjRJ6HZ7rLdaLK2sEGc5HSO4trzCl2fO8v5nn/P58eMsrK465bGArKBTSguYeErS67RZXpjn4OQUux58cO6rwwf/4Xq9duk/f/+r+RdtP3pA/n/+3/0HvIefQdz/MIsLbZZH6mTNyviOteWfxVcvb78wO4f0fCq1GlLYk53pHM+zWsdSSbq9Huvra6y21rk1d5tvLl7iq69P8MkXX3L6/DnWuzF+pYIXBGhhTSIKBCXPbLbu+5abJIRdzLrdLp7ymBifYHxsHM/zWFxcIkkSwqhiu8dl35nSjnHT7wx25ek8S+2ACiOCICTNM1ZXV7l2/Sqra6tUqzUazSZ+EJAbQZxbKsNUrcq+bTPs37efyckJhNG0223anXaZBBhRSMFZffQ0S0lTW1oJwxA/CJzjmr4D1Sm3v2A+2GxCHHQD/CGlvKGp+FveM4wkfL8oe+N+fL9d+q6pdePr7nx6AHjd/Ec4pN8RUZWS+J5CYsh6Pdory8TtdSrK49Ce3bz87DP86pVX+fkLz3Pfnt2MRbbElgOdnqVP1aoRgadopylzK2t88MWX/Mubb/Lb1//EN1eu0JyYYnJmG0EY0otj2p0uYIPxMAyt06gxpKmVDiwC0f4hio2HSR9/EU5m1EpV+VKRxzHryyscve8+/vZXv+Kxo/fTSVPe/egj3vngfWYXF5mcnkYFAYmr8BTfoR1XLwgC8txypQtjkUICFWPIspwwiqz2c69Hp9Om1+1QjUK2jI8zNTZGIwjQQjA5MUUvSzl99iy9JKbWbDpJK5cJalEijXmek+UZ0rNNbEUQnqYpWZqWZXd73WxHf5rl5MZQqVSp1GqgJKutda5eu8a5Cxe4evMmrW6PRBtUGGKkQHjKlmcLKoSwNBnbQ1AMIlHy25VbLEsOdUF5KXFx6KcOdk7Srgyss9wG3NoMUGWKANK93rhKgdMft2VfUVJ2pBRIJfpOsRi0yZ0DLggprYShFBgpyYWgk+espCkX52/z+amTvPXBh/zrG2/ywaef8c3ly3TSjLDWYGxignqziRaCdq9HL+6hAT8M8UPHs05TC54UCgpQgiqAdRQukxsnNZqlrC8v4+U5e7fv4GcvvsgLTz7JRL1KIASL3R5fnTjJn959h5MXzqMqFRrj46Uj6uCIL/or+ohjsdlzbdFzSzXJMitpWokibly9ipCSQ4cOc3jXLsbrdbpxzKXr17lw9SphpcLo2HgpYaid0UnxPWEYIJUky/LSl8Lz/n/c/dezZcmZ5Yn93Lc8+lwtQmsdkRGZkTqBhAYKVYWq6Z7uIWnkO81IszHjP9A1fOE7zYZGjvGBLz3VYkp0AyigEkAKpIzMiMjQWseNq8XRZ0vng/ve59zIyEygVHf1Nrtxbxy5t28Xn69vfWvZSCHJ3KzlkHmYfoB8TUpT7WFQKBZwXZcgCJhfWODJ/DxrjQZeuczolKa9FWwHz3Hp93sEcYTjatnSkXKZXdMzTM3OUi0VKZdKRt0Gut0uvX5PG7lZOrCzDMU0TQduwsL0EY3iq3xd+rI55un5ZvjI8Y+hifUryS9/z4D8Sz/j91jnnv3Sr1z0vnoJeuq1z8rfblqzs/5r0rTKbMAtKU3WXYtlSMCRer5NwpBuq0mv3cJGsXvbVl578UX+xR//EX/wne9wYscO6oUCoZTawDFV2FLwcGmRd86c4X/76U955+OP6MQRfq1KqVYDy9aAaJIaAEFoSVT0RlPTCDVyLwR5hr/b7hBHMdtmtzA2OkrYD7U7qKmns0zNhZ6fhTE301TBKIlRKK0UZFl0ej0Wl5ZZWlnl4fwCl27c4vyVq1y7dYuVjQbCdSkUi6SYon/THtLMe/1uh06zyf6Z6f7s8eOfXtm54xdrpeL8v/ma2/T3Pf7ROeQqTbn7737K4zPzpM0N5P/5X7L9xy+1D47V5ktegTTRuVlpFkoQOcdOWJbmsbkOnU6Xx0/mWVlehiSl3w9IlML2POqVGpbrkYLmXosUIXQQK1RskBSpXWuNfJuW5tKFA+Pj45RKFebnF2m1OxTiBNtzsZWmhgghsQREYaB3iI6D53ikMiEMA6IwBkd3kGK5SiAtltaW+fDsp0QqoRt2eenEc2ypj1C1LQIliAFhSSZqFd58+UW2b9vC4UOHePujj7h+5w537t8nBMamppnesoWRiQm63S7NRoNer5fzAS2prcu/jqn3tUw+8dUvUogvBuVf8VHiqRcJGBRnDT32he8Rg9lpU2pdDHjc2fuePocvaKqrZ4eZ6guEjKex+uFv2JzgR2VGLM8+BzOe9cZPSnzPhTSl3+2yurZCv9vGt2wO7dnDc0eP8uKpUzx38CAT9TpjZV20GUUxUaxRScexKBVcHCnpxAm35xc5d/Eib73zDp9fvsxys8XI1LR2m7QsWu02iUpwXQ9p2TrgDfoUCgWIFWGojX2kZeTNhlps0G4mFB+64cPFQt1eFytNmZ2Z4eSJ5zh69Di+73Hz5m0+v/A5nXab+khdp/TjUHMFU7H5fuQkTd0vpJB6Yk4TMw9IreqgBN1uFywL2/MIel3u3b/P9Rs3OLRnD5TLSGCm7HP80H5OHDvGhZs3iQ1vPTN9yRYnITUlJkXb1KdxqCkDtsSyXG1QBibrpTN2/X5fzwG2TZJE2LakWKtRqlTod9p0mi0+PX+B+/cf8tnZc5w8coQThw5y/NgRdo6O5kolCoEyc5tCG+mQGmdEjH6ztIaCGB08k1lk5x1Mt58OksH3nLxvi+ExoNTmO2uGlrQsHMOjNxB5TkGBrKjS8JbR83CsdEGWZ1mamgO0leL+8jJXb9zg47NnuXj9BnMLCzTabYRlUZ2cxC+WkJatnSHjmNigrMK4wYZRgJVKbNvCrRR1wW2c5AjrgFJldsLZeQOkKWmcEPUCxkdHOHroEIf27WOyqsdRD3iyuMz1W7eYW1xEeh7CcfLsZ94yQ3NO3lfM45kjq2UJLFsj+UIK4lgZRTBLZ4F6Xa5cvcILe3azZ3qGN157nc9v3ebynTuEYajpjbaDio0TpwTLdpDYRl5QaTWvVI9KISyTWdEc/mzDqMz6JSxt4JImMasrDSzbZmZqisqWWdrlEotP5ni8tEh07iyxSuj0uxw9sJ99M1soSYt6taYLz4M+3TgyXhgl9kxOUn7tNY4fPsb5K9c4+/nnnL14gftP5kh6Hey+T7FSoVQs6iJhyyIMQsJI0740si9Nn1X5OqwHwGC2fCZ8lHVtBr83veprFrFnxtPq2c9nWbGnV4EM5Hn2V4kv/vXMF6rB531NPD78nq9bozM62xfbLtPS1n1GmS/WBl16g2tbmR297j/dTpt+r0ev08EWMF6vcezwIV5/+SVOHjnCwR07KbteHhY4QEFAXyhW211+e+Yz/vyv/5JzV68QSYtte3ZjFwp0u336/RChhI6RjBtumibYrjRgY4JKTCAuBHGaEPR7pHFMtVRmdnoG13FYWVxCxXHu0omJc2ROj8pqPwRBGOE6NoVCkWKxSK/VYmN9ndsPH7CwugIIwjghStNcQUYJE3OqFCm1ukuSGPBBCAqeh+35j2PLPp8K0fia2/MPcvyjI+R/9m/+jKjt0b+zSnDthuy/fESlLx4pHl9eORBevLzr0r175UKpSLlaIQwCFFqJITZqJpZl5TbS0rLodvs0W22CKMb2PAqVik6DWjLnqWqed5rvrPTilOmpZo51WqIrCmN27tjJli1baDRbtDsdInNTMk67ZQyDEiPxZMtB1a5KM36jMAZENtLwv1vdNo/nHrOwsKglhkplJkZHKRiOrlLgSkHJsZmq15mZnWViapqRkTrSsun2+/T7PdrtltG/VTlfTwNdOh0khhfcp49NlI+vPrKXPv3qwaI4+P9Xfs4zvu13BBrMCRgagRiiEojBRDSsdPJsUOOLE7/I//769vhasGIofSjUwCVUCp19sS2JSFPCfp9eu02nsUHQ6VByXfbv3MnrL73IH33/e3z7tdd49dgxdo2NUfE8LDSCmkQavbQsm6Krke2lbo+PLl/m5795m7997z3OXrnKRq9PoVKjPjoO0iIII83ZE3LQR1RqCoOH0svWwP560Epi0ybKTOd5ayg07ca1bVbm55FxygsnT/JHP/g+zx3ciwJ+88GH/Me//Aua3Tajk1Mk6CJUpNS26Qhs48abZii9kSS1DY8WpQzNR2n1jTih3W7h+R6+75LEEavLyyRBwJ49e9k6O5tzqD3Po1itsbC0zJ27tzVn23Vy1Egg88BfCUjSOC/4zN0Ch9xCpaEMZEWXGRdV2jaWq01a9IKiAYJWu836RoO5J/Pcf/iQ+w8esLCxxmq3TSQl0vH0hkCY1s0XGdNHBTmanmlUZ309i88ZQtsH5ylzKkTudJq94enxP4xYisHzGaNHmXMQ0tZOrkJTb5RlEQKtKOLB8goX797h7TNn+PlvfsO7H33EJ59f4N7jOTY6XaTr4lcreKUyluOipJ6bM8qdkCKXN1MqyWkajm3naW0pNM4/CJKERsiNNblKEtIoRMQxVhLz0onj/Ms//DGnDh6g7jqkwHKjxfkrV/jZr97i8u1blEfHtHW3QXZFtvkwqC5k87npE2YUYEaAvleDuSdD8qXOv9NY22BmcooDe/cwWavSSRIeLSzQaDTpdLv4nmeMSSyNHkoLx3MJTNGntGxtrGQ+O3NSFVlfyc4DUwMlIDb6zVJo1ZhM6lPaFolSdHp9niwusLC0SLPdwi0UqFTr+LaNa8n8moXS9BfPsqgXi8yM1pnaMsPk+DiTE5PUq3WKxSLdToeN9XUaG+vEYaSNz1wtH5rPsjKrBcuCrs1rxmAu3nRJXznxfu368SUvEF/z91C+6ff4smevb896mxJi03c8/X3D//9d1sis7Ya/T5nBm1FW9IMpQilsqWlVjmVBmtBrt2msrdFpNnCkYGp0jNPPneBb33idH333O7x+8hSHpmaoZ+pYKCw0Pa4bxVy6d4+f//rX/MXf/A0Xbt6gm6aUx8fwKxWErVWLojCGRKPwVjaC0hTLlgjbIghNzYjrYFmSKAjZWFujWixxcN9+Dh04RJIkXL9+nU63h+v7SEtrl6tUIQ1okZi1RVhW3jIItJmclARRRJykhHGs1aqSFGXbuIZNkaQJidLjy5JG+zwKNR0wVYg4YveuXedrBw7+xTXh3VjvJr1/M/LFIvt/yOMfHSEHoOxBsS4oWRalYhpC2JfiNq71sOTZ054FpJqrJkzaNghD4iRG4OG4Hp7n43suSRASByGFYhFpWQTGISxOtIa343qajxcGWkrK80jSlDhNTJpNd7NSsUyz2eLx3GMOtZrs3beXwwf3EwU97j18RBQGFEolXN8Dqe2mHdfL9U8jY2gkpZbcSk3xgZbmEcxs2UK33eTx/ft8+MmnNNcb9PsBrm2zf8cOikJol7kEbZONYGp0hO+88hInjh/j5MmT/O277/LJZ59x5cYN1peXGB0fY2Jqmlq5RJIm9PvaSSvV3qe/Iwz+ZcdTb/7dI+jBJwzNcnkQPYSKf91HPvP0803Al5zf10H1m6r8h89CfOGlXzgRMfzM4L2ZfvYwTUhmLzEToQpD0n6PTqOBpRQj9RrPP3eCN197jReff569M9NYaOQhMkFomiT6fKXM6Voh8KjZ5uylS/z8V7/i488+Y3F9HbdcZvu2PThugX4/ZKPVIlUp/lBleppEOtUnLYJ+gGVZFIpF4+CYMryxGLTD8LYne1AhhMISCktB1OtRHq9w+rmTHN6/FwtYWm9w585d7j14QHl0hHK1ykazRZKkWELzBzEIGokkTZJcb9zKJlSleXxRGqOUdl/s9WM63S6VWplypY5IU+ZW17h2+y5nL1xi19Zt7JieJAQK1QpvvPoKV67f4Oxnn2JFMTJKwLINUq41Z/VckWilGmFMTBLtgpsFttnGQAiB63k5b9GyLRSKfj8kjiMkUKpWGR8bQyoIez0W19a49/AB777/Htu3znLi2DFOnTzJ0cNHmJwYZ2JklILjYJugX1p6yVNAjMqzB9lWMpMXy4PtobuTSc0NUO2heyqG+vpQBJAaVZPBYgYIK/87K/7E/E5QtIOQ5bUN5peWOHfhAmc//5xLV68yv7yCdBxK1SqTM7M4nge2TQr0en16/a7hHOs2VWpQx5M9FqfavAmVBYaD4Zfpj6fmmoVpH5UmhL0eRctiz7ZtvPHCC7zxwvPUpaSPNkt6vLTI1Vs3uX77No1Ol+k9IyTCohf0jbb4QFJN6cZkU0ORbXy0wkkcRrmUppb/TCFV1OujdBsNbt++w+dXr3P69MtsH63y3NHD/Oj73+M//OVfcuvOPUqeT7U+iuNKGs0WKo1wpUsSa0lb27KRtka+kyRBGWRRWrpAUijI7O0t2yZONbe2XhtBSkmr1WZ9fQPHcahVq1QrNXrdDssL83x64RJLyyv0eyFBGLF3x3amR0ZxHJeS45IopWU2u12UkLiey3S5zMTJE5w6dozbj+Y4d+USv3r3Xc5fuMCT+Xma/T4lz8OrVrBsmxDtfKjpbQxZxz8NGA36o3hW2nUI1v7SNePvtJh8zfE7Ak6Aob992Woy/JlfRL6fBj++5hO+8Ao1mBz0o2pwFnrzRr6ZRaWoJCJRgjgMSPo94m6bSsFn784dPHf8GG++8QZHDx9iwvMBPeY7mHlFKRIj13nlwX3+81tv8Vc//zl35uaY3LaF2YlxEilZWVvXcqCe9sRQxtjHNdKqkdIgZ5qmBKEu7CzYllacimPSIGJqbIKjBw8zUq/zeG6OVqtNlCYUKxUyxRiVarnaVClt+Ca0hKLjGw56p4NKE1zHplKpavDUcXRxqFLEqRboCMNQ+xPBQKFGJShDffGkVoKytm5Z2qjUbodXHnRY6cD/5Sdfe5/+Psc/PkL+Z//GImpCI1A0xuBbbyjvpV1if2u+P91c3+7Zzql2s8Haxjqe52rdYtPfBtI95EGenic1epJZ+mrkWhfMaB6mQAg1pGQAYIqHzOd4nkcUhDSbTUqlIrNTkxzYs4fm+jqfnztL0fcZGakDevFKDTKWKK18IoTUE6iQuvo+SZG2BKFVEzTKIvE8HyEk/W6PJwsLrKytE8UxtWqNkUIBW+rUS5QkejcrBEXXYXKkzs4tsxzcv5fpiXFsFOtrq8w9ekRzYx2lEkqlEr5fwHbcnGupA+EMRTOp6GTILEDqSmUTrZJxzVSa6fFmaWty1zhBxkU1N1VgKAwmMJUSYVwWM01PBAhL5gjBcNVLmn3eMD5gAudhVHz4ECJzJBOmSMQYreSavQalNsVolmX+NjPfQJnAbKSExgWzH0wBTJ7mNwu1MAVW0rJQAuJUc4kBLFvieg6e52JbFkGvx9ryIo/u3Ka9usJIpcy+nTv41muv8Aff+Q4/evNNnj90iJ1jo5SkNl7JAvmMF+e4Nr6jCzdbwLkbt/irX/ySn//6V5y9dJl2GFKoVKnUR0DI3NAmMTr6Vq64M7RpMJNZXtluMkCZkYdKldZzVSLn6SnD4U7TGMuGSrVEu7nB43t32TY2wU++/31+9J03Ob5lhm4Y8uEnZ/n1Bx+wuL6KW6rgFUtESeaamRXLSXOr1cBj2SC9eZpXmfFuxq02fTD24iZIch0X1/VZ22gyWqtyZP9eQiAKU0YcTfPpdns8uHeflZVl6rUR/FIZLFsXGqUJltRBnSUErvEj0IZhac5XjM04tiw7D25lVsxmFqusWAqh3e+iNCFRKcKSuMUCkUqZW17myvUbfH7pMpeuX+fB3BPWGi26odbeFY6DLwSaeKIlE20hNW3GGHuIjIueocYqH30DVB0dOOa8eZE9P+jPGETYsqycT5oXiprfgUrZ6Pd4tLzEzfv3ufnwAT//zTv8+V//J97+6GPOX7nK/bkntPsBjl+gWK7iF8tYtj0IbDPut8rmEBOGZKc1gL7zwFszUvSmIIpCowmsVXmSNCUhxbY1RY84YW1pkaJl8S//8I/40+9/j6lSESE0HbCXRLz90Uf85S9/yeOVZbxKldrIOEkKYRjn5/Ks4G8zIq0fSc0cIqWR6Yy1aUjBKyAR9DtaLWZ0bIIts1uYGq0zVavh12rMP5nj8aMHWunLdfCKPv1+T3NXLYs4jjWv12xccj1ps4ZJSe4Am911JXIlXwRyaM208uLorF5BCAlSu1Pff/iQm3fuEMQxlXod2/Mp2ha2QdZjsxa4loVv5qiSFNSrZWYnx9mxdQs7t21nZnICAXSaDR49fMjS0hJhFOEVfIrlklYnExpsSlSa044G87swS4KZGcycLmCTGsiwionO8g3WChjac+ZznXld1l5mfsk2UQO4YRCMPX0o88GDmHeoP2RjKzuvbF1Ug66UZa2QghSjsjQ0BnO/ADE8N5KrvajMPcfcWytXZ9Kb9iTV9u7KbH6ktPR9NwZdrufi+S5CQLfTZHFhjoW5x4TdNtNjIxw7sJ/vf/ObfP+b3+Sbp09zbNcupnwfoRRBFKGEwBUST0gSBI9Wljl75TL/4Wc/42dvv81So4lfr1EdH8NyXaIk0YZZQuAIG0sJLAUiHTJ9EwrpaGCk2+8ipKBcKNBtdwi7PUZLVb7xyqs8d/wEV65e5bPPz6MA1/exNzEeTLE5aMqaGROWMP9PdS2NRAM9lmXnYyFJFGmq4w/LsXA8j06/R6fbpeT7FD0PoVKa66sUUbywbz+db3/rN789eOjfLy51omS9I//NSwf+Llu93/n4p0DIBb2WYPS+4g0/5dhZQsZ7VyYLn1eOnTj3nBJ/On//zujdpXnqtTq2Y9OPYq3rC1q71wQIQRDmk3c2aaU571HbVqskIla6cwiTKs8WIYXSKJh+B7bj4HouTx4/5P7d25w4fJATRw9y+cJ2Wt0uQbuBXyqRqJQwSZG2hbAtSFKTjlfYSg8aaSmjQa6Rv3ani+/61EcnKBXLbKyscPX2XZaWV5lfWmGt0+P10y9QL/hUCj6OoxezWOmitslCgek9e3hhzx5eOHSYDw8e5KPPPuPcxYusbmxAHBO22vRokwoLhNZyzyqRFRp913NAOpgkyLj6ul/lqfosQAcwAXOS8W5NkEB2T4YD+WyxzQqtEHmn1/JpRqVgCAnJU+pDXduszeQpiC/rTNnKY15q5WDLcCHbAKHXH6sRXimykC4hk6LLJ0RJvulTKts1p7q/KIm09SZGGg6rjntT+r0uaRhBkiLShFqxgD89xbbpKV44fpxjhw9x6shR9u/YQdX18utIU13HII36hmXLfMJdC/o8XFrh1uM53v3wI9778EMePJkjBsanZqiPjILUKJvWcNUKDIONjRq0s9nF2rZBYHP7bgEJRr4s4yAO7oXmymbFNIIo7NPvtrBFwulTz/GH3/kOx7ZtQQBPVlucOX+e+w8eUBsdR7kO/SgCIfMNR2aDk6axGY9iwEs3r8kyD7rgTXNtLUtSKhVJVUq318eyLMojY6go4sL162w7u43nXniJqXqNglkRXzh6lDiMaa6t8ttPP6O7vo6PRBZLCEsgsbBJCeLQ0CWEVqCwtWscqUb2LKnRcJ2pE6bILtNZJi9GilNt2mKiT9xqmWK9gue69DsdVpaXuT/3hMs3b1Epl9kyPcuubdvZumWWndu2MTk2xtjICKP1GqP1OpVCAUeAY4pKbcMBzaQAc7pLfq+GxlCmcZiNl6HnFAPpRK37nhJGkU7phiHtfp9mv8fC6gqLS0s8mnvM3MICzXaXKzdvc/v+Q0DgFUuUSyVqo+OUS6U8qAyCQEuWCaF5+ZDTg7Lvz+71cCBkS5ssiMra0XJsBJI01htpaVtGLjCi1+uRBAEj5RInDx/i+6+/zO7JcWJz+b1+n6t37vDemTNcuHmDYn2EkbFpbT8fpZvnlxzl0a2VB+rmjBh6Ro99uakxVWok2i1tiHTnwRwfnjvP7OwUp2enOLp9Gz96/TXWlhf5/Np11taWEI5EOgKVKIKghyW1Lb0OODOxy4EzrsiyIHmRjEbnldA29bGpe3BsB9fRFKogDNFUMJtyfQSRpvS6He7OPeb2g0estTqst7oc3r+PI3v3sHVinLLtUBTCFGHrz5FKSwdXLIvK6Bg7Rsc4few49x494pOzn3Hh8mUuXb/GwuoqiRQEnTZJEpEgwLKxXdfIJJr8htLgh9kqku3KhQmcNf0izcEXPT/rI0U/hvo60uLg/imlTGG1vrepSgfKL0PR/PB4eqq3ktdrZPPVcLCenYIaBOdCDK5M5mvrAMQa8rEe3o7ma1aeTTLfnRrTH2BIonMwBwghcRxHo9JxRBT1TW1KSBL1KXsOo4VRdm3bykunTvHckaM8f+w4sxOTFM2ZRCZDkqYprm0TA6udDvfn5/no7DnOnD/P+599yvzaGlOzWxidnEBYkm4QEARaHlMikVl7G7t7laZ6QyaFpgKrFL9YwBaCKIxYX1mlYDkcO3aEU8dOUCmVuHnzJjdu3mTbzp2acx5rOdBcFcssc1KaWoU0IYl0n/FdN7v5qFQRpRFKmfU229qZzWySZg65Etd1sBAkQUDYblMsFNJ9M7PrZ3buuP1gpBoQbFBYeeDybMuHf7DjnyIg18TrI134f16GbWfp8x+TT+r/X+VMn7rx7SsXfuuk4RtSJaO21JI6kVFBiA3PzvU8hNC65FEYIoTA8X0sKYkjza1OSUlUQhrrr8tQgRwtJkOP9DBIE80NL5YKtDsdHj16xOL8Ant37eaP//DH/MVf/iUPHtzn0PETWnKwHxj5Mx/Hcgn7ga4AlhLXtnAs26TawTZcqlildPt9RKJw/CLlkVHCNOX6nTt0uh0eP37EyaNHOX34EFtH6qQY+kKS0DFSU7brsmVigh9+45u89tJLXL5xgzNnz/Lp5xe4evMWy6urKMthZGKKaq2GV3JzyoIQoCyDfQmtoBDGMUEYoJFGB2EZekS2k01T0iQhjiNj8xzj2E5umyzSVBtUQD5hKLNpygxDpGURRxGJ2TVnQWw2BT+LKjEMVDy7EGaAumVa9UJoVMkSlqF8pKZYd1CclqGdtmUjXY1uhlGkeZOmAClD2wV6kUxMYWESm0BLgJ3aeuDaFp7nIFRKr9NhbWGBxuoaQil2b9/Gi88/z9FDhzh19CjbZqaoFooUHFcXdGHm7iQl6mveqON6eAUP19JGJWtxzLlrN/j1Bx9oNPXJE9pBwOj4BMJ1sRyXXhjq3X6iBhOzGlbiMIcYeiRHXDRtRCWKXl8bBlmWjWP40EmitZalFLieg++5qDjiyaMHuELx0qnnOXn0OOPj4+C6rAYxd+7cZX5+gW6/jyoWtBunZSHSZGj5UYNzytK4ebSoTM9QOTouhcTKhLSFGbNGAivqByRhSAI8nJvjg48+5HuvvcT0xDh9BQUpOLh3F3/0wx+w0e7w4dlz2N0+49u243s+UqTEYQ8htIV0HMeUK1XKpSJ9s8DEUYxf1Hrk3W5XV+HbzqYgbVNcl3NotbBhlCqSMEQ6LuPTM0xMzej+Gcc0uz0+vXiRT86do+i51KtVauUyO7Zv57ljx9g2O6v1n0tF6tUK5VKRcrFMwffxXDtH080eksj8zhDuwXKvH0+AIIUg1nNLEIX0g4Buv896s8n6xgZziws8ejLHk6UlHs8/Ya2xznqjQavTI4xj/EqVHfv2EyuddralRNoOUZISp9rPQTtMmnucBRTZLpfNaObmBlT55rHb62HbFuOjo0RBSKvRIo4TKvUatVqVpaUF1paXkHHMN158kT/5wx8zPTG16WM3Wk3e/+Rjrt25hV3QbqCu7xP1Y9I403oXT53DF/6z6REhBbawcyDCcRziOKEZtCgWCrieR6fT4dGTx1y6eoWXX3yRg7NTWAKeP3GC+3Nz3H3wkIdLS1iOS3VkDMuWdLtdPFe7nmo/DJW7c+qIn3xyVEOnPJgj9djRIJVudw1UyLweIDXZMbdQZGbrduKgz925OVq//AU3bt3kyfPP89qpkxzeupWa5yFc16j3hKgo0q7QQ2BCxbE5vHMHM+NjvPziae49esSFq1f5/PJlzl+5wvzjxyRpSnVykuktW3E9XyOvalCPkSHK2SYjzeZ2o7ueLwhS6etAU7t0n9d9K1WDuhjdvzZ3sHzzl2YOouRrRwZEqTyoHbw3zb5BDV4PPJWBZBPqk4FB2XvSVKGkRmKlsHIN+yS/viyjIZFCIYWlNx9Z5tfEAUmSEJusnlbf0XLHlimKTow7sGMLkkjR6bRpbqzT67QouDbTE2Mcf+EFjhw4wPGDB9m7Ywfj9RFGSmUcIIgTwkjX0li2TcG3cYH5ZouzN27w4Wef8f4nn3Dv0SMCYPvuPdielhNN44gojPQ5iEzq1zKbV4ESkjAKiWK9oY6SGCUFY6NjCKVYXVqmvb7ByPQsRw4dZGREU1Xa3U7uau15vq7Xy+s88t0PQoJjKIdRHCEtC9d1teN6YlSz4hiUwnIcs/HXaHkYhnT7Ca7nMlarUfI87QeyvkbBdRmt1RpJFP22n3KTOGLk7kXqZ98L4f/6hTniH/L4p+GQg+Shgv8lSPk/AAcWFKSsj5YuNg5W/9f9zx+eTlLvpfnVFUS3S7k2guc6iDAiiMxO3/WwHM2rTZOUMEmQaaJ3zEYvVxhYOAvQpdJSXgizQ1J6gkuFRsIsaVEpV1lstXj08CHnPz/Prj/+Y/7gRz/izt27PJ5fYH1lBadcplopE0YxUa+HZdl6P2toDKn5jhz1McFdqhT9ONZFAr5PxXUIez1WWi0WV1aYX1ziwdwcK2urnD56lF2zM9Q8j9SyiNDIm4pjPMuiXCoxUyoxc/IUe6anOXnwEOcuX+Xa3Ts8Wlik0w9oNdbZWF5ESInvFyiWS1qlxraNNJAeOOVi0aSBtV57GPUZRsylSYO5roP0tT1tGEaAQTEEGv0UGQJvdvoGnc4cCTPd64G6b4YUDDrGgL81QBbygMIE8fkhMuxogAuqWJGgUV+JtdlFbujtKtW6wwh0oRnkbRJGsbkW4xwpJa7r4mcSTcZtrN1q0u20SeII17aoFArMjo5wYvdupiYmOHboMCePHmPfrp1smxjHZbM7YhTHRFGMZdlIx8GzJZ7jkEpoBCH35uc5f/UqZy5c4ONz53i8ME8iJdWRMYrlMphClSgMEQgcz87gfLLSIa14JYYaIGuqQTta0iIlhVhTBBzH0bKcSWI0wXXVudYDhyjs02k0md2xnTdefpWXnj/J1pkpigJuPnrEx2fPcuv+fbr9gGqtirSdAaq0+Q5++SEytFFLuG3iRA/lrYWUKKkVKYqVCvcePOSvf/pTtk1NsHdinMRsQiaqVb79zTdYabVYXl/nzpMF1peWmN62jSRV9ALtHld0PXPdCanqgxI4ljacSKMEJcB1XNOMm4PxL1dQECYbkVkx29iWg1C6ziRKEuIwoB9HdMOAZtCn2Gyy1Gxy/d5din4Bz3EoFAtUy6Xc6r5arlAsl6hWKhR9H89YTSuzmdYBeQY+6PRtGER0g5B2u0On0yGOEzYaDVbX1gjCkH4U0e33abRbNNpt2t0O3X4v1+gWnodbKFKo1iiUy7mJEOb52GQMktQol2SBzhdv77MPNdxHBJ7rISyhLd+TBGnbFF0HW0Kv1aK9to6LYsfWrXz71Vf49quvUC9onE8C63HEx1ev8psPP+DBkzkK1Tq255IoDTJgELzhjcLvegy7Bjq2Q5ikeu4oWRRLLmEUsvBkgTv3HnD15i2O7NzGjnqZgxOTvHrqFFeuXaN15gztRoNCsYRXKuN6bh58WTKjZakBk0ZPsFlTDU57aGwLkaGzavhk8wA4TsglNb2idkeNkoT55RWazSZPFhZ48OABzx8/yvPHjrF1coqaZSFdSSBlnl1WSrux+kKAZVGu1Zip1dgzO8v+nTt54dhxzl2+xNWbN1laW2NxZZXF23cIkxSvWMT1PPyCdgB1XE/TCZQgMgYyURiBSrGzYtOhwFjXFyiQQ4W+aoBjD+orDMUy61hms58H3GadzpTWchqXGh7bg5GuhhWO1CCwzwPyob6R3aUsoFfaWjl3YtU0VzmcxCSfK0x2MI1CwjBECmmkjW08zxlsCgzNJU0THeyGIUGnS9jvY0tB0fMYr5SY2LGV3du3cfTAfk4ePcL2mWm2TkxSNUaGcZwQRDFCClzPRkgLATTimMfzC7x/9iwfnD3L5evXebK4RColpVqdYrlColJDFTZUXSwcoSVeM652NqYtx0ZZUtfbCIljO1gKWo0m60vLjI+N8cZrr/Ht73ybxfl5fvrzn7G0vER9pI7tOUjHiAuY9kqVllNMlW7XrF9Ly0YJNE0yjk2/12CatAxAJIfoz6kijSPcgo9v2wTtNq31dVQcc2hmhh0nTy1fO/3CX9zZueMM7RZee8PxG8sCCL9qjvj7Hv/oAbkJSCQPgP+7CR/+Jx+l2nLVT5evH97x6xOUvuck5Zce/fa3dHo9/KIuplSeTZQmRElMEoKXucHJhCDUBY2ObeWpRI0MiJxHKYYmLUxqHvQYTFItp+N5Wo+y1e1y5tNPOXHsGD8+dJjvfud7LCwuc/n6NYpKMVmt0gwj+kFAYgoFbMdGqJRYJajI5C8FRvvTyvnUSghs25gfeS7CkjTCkAfz83T6PRaXlnjw+DHffP11jh/YjycERcfBkZIwiunFIaEp9Cv7Pid27ebort28evplbty/x8Ub17l26xY3bt3k4ePHhGGMjAIIbRJSUtsmVRAlKbbrUiyUSJXSlceRIjKLn0ZnbGzbwXVtbMfFsW1CFRAGQc7l1en7ATKQIxGKnIueBbbPEnNKhyc/NZhcs2x7rjuhBAOTcDNxwoDyArkihx6URt4p17xWucpImia5trtjadteEo3gpkprAwsUSkpsJbGEQkhLV5gLhSLBVhFOGmGlCWOFMnt27ODI/gOcOnac3Tt2sGvrVkaKBRw0dzJIUqO6ogPLMEoIwphCwcZ2LZSy6ABPlla4cfcuH3z6KZ9evMDjhQVWmk1iU1hSqJSRxjgkSmKSVA2MoZJEU2bEUID4zEIiBpNamurA09bpZNtx9MYS3X+zav00Tel0OyS9LpO1EZ47dJTTJ06xb8cOihL6wPWHDzl78XMtLWVLPSak0C65zwh6vioGypdTZfqIMAhhislmaOTFdiXScXBlmcVHjzh7/jwfnz3BoQMHGKuVcS1tgDJdLvPmqy+z1mry01/+mjuP54jaLSKhN6Ou6+I6LkkU0e/1CIIQ19aa7ZZtEYShWbA8kjTJi+i+HEdlk8yaSpUmR6UxcZRowx0hKVWrlKtVo+Cii9ktKel1ezy4dZug00Y6WoHAtm1s28L3fUqlEoVCgXK5TKFQwPNcI2Fp5WpSQmTKGSlJHNPvBfT6fTqdDt1ulyRJ2NhosL6+QaqUVuYwajSO5+H4Hn6tRsX18Hzf6Ppqab4w0LJ7mvqlBqhmzhEjrw0YimGeefOH+6OOm3RkWSgWidOURqOFbVmUinrB7HXaNDc2kFHE0d17eeOll3nz+RfYUiwSolfJGPj04iV+8fbb3Lh3j1gIRupVHUD0ushU5PSFVBha3e9xDKOlukBZAwCZbnipVKZYLtPt9fj8/HmObp9l68svALB/6za+9+abdMKQzy5dJuh1wJK4fpEwjIiTGNt2jMxiFpCbQPgLyHg20IdNd0xjD80BKF3wr1Saa/9LU1g9Nj5Ov9umsbbB5es3mJ+f5/qtmzx4PMfLzz/P3q3bmBwZQTruUIZLQRrrTYBlIYQO4uquR33bdk5s284rx49z6+FDHj2Z56NPP+W9Dz5gaW0NR0iIE+j3dTFslJC62vguA5otWwCaC531Cd2/kkHbGwEDATlwlNMnk6xuTA4BZNmaP2gnbbhknEbz7MPg+aFYeYiXziDzM9SpB08NaCzDgJEu/DU6/1nBuBxqUUWu5a5BsoQwDrGlhYuDbTs4tgVp5nsSk0ShyUBHkCSINMJSMfVihT07drB7+w5OHD7M4b172b9zB9Pl0qYek6TQC2L6YUCxVEBKi16SsNzqcPHWHT757DPe/fhD7j56RKcfUKxUGB8b1RvbRHtREOuCZtvU0tlSq4HFaZzLEUopcR1X0wPDgGLBp1Qs0l7fYG1pGVdKXn3xJf7gRz9k27YZ3n//t/z6nd9Qn5pgcuuWfOVPE5MRMfcsNYZCwsQEGPWWJNHF0YO+rhX3sj6W8e6FEHiOjWOBKxRRt0NzZZW0HzA9Ps6RQ4c6zukXfvvuiy+8c0+w4bfanlTSi/1Swj/3gHxC/9IiAZCE9w4SvfcNQeM3fmNnHH16+GRz/MDi/2v64XJ318Md/8dHj+brnVaTOC5QKJcZrdfohzHtrpb/k8bVyfU80iQhCkOkSLFsKy8eknJgJpEXHwrtupkVZAHG5UlRrdXoCMHtu3f5+JMznDjxHK++9hobjQa3bt+msbqmzX0sC+W6RLEuItWV+nrhjuMIJ0tpKYxyAgYp01qcCnBtm2K1iu06BN0OvSjmyq1brKytsby2xvyLp9m/cxeHtm6hVijguA5hqgtJe50usWVRLPhYAqarRYoH9rF92xZOn3yOR0+ecOv2bR7NPebug4c8ePyY5cUFukGA6/sUyxUqtRqBEAjLxpYWjm9DqWgQlYFLYRRFNJstoijCdW2KBT83bElN8ad2AjOTkdSTl0bFraG2F/nfA+QhQyuMEQmDIGIQJG+e+LJjExIidB2AQA/aNEnpG+OkDEXKJ27LwjHFr70gQAiB73kUS2Vt2Q2kcUzQ69LtdFlbXqbbadFvNXFsm7HxMaYmxtmxfz87duzg4N69bJ+ZZdvkJJMjoxR9X2+iGEzoQkEQhfRSTb2ybZuK5+IYlKcZp1y6cZ2333+fcxcvcuvBA3pRSCwEpXod2/e0ta8Q9IJ+bljjONrgIY1jhKEmZd+aooONoRbLs3zS0ALiUBclO66DkJYJ9HWwZUvNWyZN6Xc6rC8vU5CC5w4f4rUXX2bX9p3UfI92kvBgcZXPr17j/qOHxCqhUC7lKKJKhjiv5lCbz2rTb12wY+kxptC8w1TT0IZTxjKjsxgjIc/3aXc7nDl3jn27dvDjb30Tr1ikYz5367at/OgH32d5dY3FpSVWFuYpjo4yMj5GJwxodtpYCK1kIfV1x4kpUDIZgsSkdAVPmyk91TefekoXJCqj8pSSJiAtiStsLNvGcizS1CGKIqIoRNg2M9u3A4qswDorZlJAKARh0KcR9M2Y0xSjzCxMykGGJwcpxGD8pammYxVG6tQmp7QylHGpE1JgOfq8ZJYZUdDv9ogjzaG3TFF8nqfK51aRBy+ZbffwaB8OvIfjxU19IY/pJWkS0+v3KZeKeK4LaUJrY4PG8jK7t23nzVde5cff+y6H9+0hGfrMdhzz8flzfPDpJ0RSUK2N4roe7U6PJEwoWJ7m4QuBZpQ+Cy549o3NEM9sQU+MT4DtOgSxNhkSQK1eI40iPr94gWO7d/L6qZOUXIuxkTrfeO11Wv2AjVab6/fu0u71mJiewcqcosMAC6nrGfLVY9CEm7n4alAuoDQnViqdXUKasS5NYeeQSY/AaKpbHn6pjGVZ9DsFwjDk1t37tJot7t69x9EDBzj9/Cn27N7NtO9jI0BYJMLUgSQpSigTH4s82BwrlfD37GH3tq0c3LuHH7z5bR7MPeH2/fvcvneXqzdvMf/kIb1uB2wbt1yhOjbGyMgI9ZERMBvTvN+rlCQRpCbQy5y3sz6e1S9E4cBUKpf+0x1/0P+GHpeWxPZ0phRzXwckKwP+CBB5I4v8WWXadNP6lO0qBEPfn5fW56hT9p7B5iqLTSyUSvFcn7GxEaSQRGFIEke0mm3CXp9+t6ulodMEW9r4vo8tJXu3bePgvr1s3zLDzq3b2LN9J9smp6j4HlXPBQVBpFFtgY6DCgWPQsnDBjb6AdcfzfHh+c/58NPPuH7nNvMrK0jXpT6h/RZs1yGOI4J+X1+RElgMDM0EUve1RKP9SoAtdAZNJQlJEuM5LgXH5f7CAkG3x5FDh/jOm29y+OAh7t5/wOWrl0iDns4K+B79MCA2NSSbqElSYCFylSiF3sgkqc5oahBDgypKQRzFGkxIdS2V67qUigV81ybsd2msrrKxtspsrc6xAweoHT7yHx9u2fr/mS8U1kYeLTh7f/GbSmN5tdMrFvq/y3Tx9zn+0VVW/t9/9me4ID1QLqRi60mYel54j+9YYblEc++rYa80Pu/61vqOVvdwtd/f2QoC0Ww0iKKQQqGgjYKUNkFAqU2udoPCMJWNB7OT1YB1tpgJKY3jpU7lCamdB+M4olwq4dg2S4tL9IOQUrHIq4cPsH1sjEcLSywsLbGxtka5UKRUKmJZJjVjdmppVhWPyGXmsrRVZpSQptpNKlFKbyo8TzuLIuj0e6xtbPDg8WMeP3nCyvo6QZLiFAsoy6bgOHimqFDza4VeSJWi7DiMF4tsHRtl59at7Ny5nV1btzEzMclItcpYvUqp4FMq+BQ9lzgI2Vhfp91qEoUBcRSiiy8HfGvLyiq3s0lPB84aec2CZX1/dWpQDa2qA/Q6Q85SlXEEyRgWAwwhu2lqkJ3NkNKnSmf0fc446Xo3lKN0eSmUEKQZCiGFRnLMj2XrSnVpFiaVJAS9Ht1Gg/bGOq2NNXrtNmkcUfYcJmo1psZGObh3D6dPnuCNl17izVde5ZuvvMJrJ05yZPt2ttTqVDwPV+qCFn2RenOjwV0FUmoepi0JlWJxY4NzN27x3plP+ZvfvM07H33Mjbv32eh2kL6PUyzhl8u4BZ8Ucn1xAMdxcG0XidAym6nKrycVGunZHAeL/N+sPWMTTHi+R6xSev0e/aCPJQXFQgEpIO4H9LtdVD9gx8wsP/nBj/jhm28yNVqjIgSPG03e+fBjfvXee9yde4hfrWiXNqGNHpI8AHjqHj4VtYqhH2k8BBA6VBK5bIHuF1nQlw1wlWptdN/zePzoEb1el+07dzAxNYUL9FSKJySTtRq+49LudllaXKIbhtjFotajTlKSKMK2bVzHMRsW7dbpeR6WbWtDlqHA83cNyDOeqsxpW0PzkgmS8v6baqOZUqlMsVTWzr++j+v5OJ7JrNk2SmhN7yCO6QUhYaQzJrFSRIZCEUYxQax/YqU3aVgWwtYBt18sUq7V8Ar6c13XxXY9pO0YNMk4LRpX4SRKhoKPDIgQeVStAxdpfvLb84V0yKaA/OnHhR6/cZIQpymOY1PwPESS0NpYJ+50mK7X+c7rb/An3/sup3bvpGjb9OIUXwrW2m3e++ws/+5n/5nPb1xjZHqaYq2m+e1JioXANd4RKemgjuF3OfJAWJHpwGcBrmVZRFFW2wTFUhEU3Ltzi5LrsH/3bkq1GhXbZsTzKJZK9OOEhYUFFpeWSJWiXC7hF3w63S4qUbiWQ07eM31OPbXRHrTloLEHQd7Q/TDjZfPtyKg3AttxcX0fISX9MGJ5eYW5J094ODfHarNJu9enrxTKkliOi2dZ2mtDDpRn9NytA1hbCHzbpup5zNTr7N+2hQO7drJ1yyxbZ2aYHBtlZmKcsbExKpUKJb+ASFOCXo/2xgaNtTXa7RZBv6fV05TCMWPTcxw8V9u9SyujMqhcLtYSDOmhm96qBkX+OZKO3vzbBokfWsyyNw0aebjhzN9i0wKWzV3C0B6lyTAOOZYmOUQDZAWsBlySIndydh1t266SWDtFNjZoNzboNpskQR9bQb1UYnpsjAO7d/PcocOcOnKEb732Ct99/VVeOXmSY7v3sG9ykrGCT8HWlMbYBLQC3V8d10JJaIYRD9YavHvuc37x7rv84p13+PzqVVaaTU2xrY9QKFUQ0iYMI13joNJcEcc2NBVpUmKJUjojL7QOvvaTiUniGNdxKDoOSS/g0d27bJ2e4V/9i3/Fj3/4PZKkz7/983/Hex9+hHIdyiN1pOsSRjGxoZ8gMEWdGlzLCurz22KUfKSl4zwpB3NYmpm9SYlj2bi2hYUi6ffobmyQ9HqMFIuc2LEjOnDw4MX7L738v3x4cN+vFiCqfvRJafSv/trpNNd7XUnyf/vX/8PvOmv8nY5/dIRcl1gSge6OidsjLXeUiIt9y9Ui67eBYGLn4//uyKE/P5Akpd6tey91WjdpLK9iISmUK5rcXyjqYkIFSaQ1lr1M4D2OUQbt0ZywoUmUIcTG3Fggd6dLFbhegcmpaRqNBu9/+CFvnH6ek4cO8pOf/DHrGxu899vfEtV6lMtlbN8j7fUI+gFKamdRx3KJw1hroVs2UdgnJcUzTqNSSnr9Pv1+nziK8D1PTzLVCl65SL/TZmV+gTMXPufJwjx379/jzsMXOHnsGMf27WOiXMLxnHyq6Xe6hGGE73s4ni5kKNg2O8Yn2To+ycHde3jx1ElWN9a5++Ah9x484MnCIjfv3qXXbtENQtIwoi8F0nY0PcX1cH1doOQ5HkXfx3Zsur0OzVYDhbaYzSYbIYc8K1VWDZ7kLJPNi8EALc/k0Iywrn6tAltqmbdh+GxQHDY4smBcKYjCiNTIh9m24eoODdbsPiulCOMISwhKnnYQazUaNBobtDbWSfp9hFCM1OvMTk9x+MB+9u/dw7bZGXZs3crU5CRj9TpF18OTFq6p/tca4hFxECKV5htLywZLoqTEsl1sc+WtJOX+/CKfX7jAO+9/wLVbt1hYXUVZFtXJccaLBZSUpEIrHGQOeGmsF3/HdnAt7c6aJJGRd2AYxgGyAklyLnmGaGTtn9F7lNT8zSAJUaRadch1CTodwl4PSyl2btnKKydP8fKpF9g9PkIIBMD8apNzFy/w4PEjbN+nUC7h+C5BEJrUoi66kWJgpjLoK0P30pybwOxl4niAJg1Jl+Zpe6VIlNZR78cJ9VKJsfoIywuLfH7xIr/+7XuMVCsc3bmLRCgCleAIi+dPPke7F9DrdPnoymVWlxYZmZykUCzQbemsjFJoV1G0skpqFvksxZyt0OLpDjl8LUPXmBU7Zy55WnpTB7lxGqHMvbCMOhJCa3cDAw59xg+XDpbl4LrkEp5RFOPYFqVyCSlETj3LFrGM7zyMlguziW00W+aczRg1wUo2VrJg07VsCq5HmurPFdLIPJJtrDdnvfSGe4AEfsneZdORb8yBftDHdhzGR0eJw4Dm6irt9TW2jY/z2qnn+cE3v8nhffuwXYd+nBCGMSXb4/bcY376t3/LrQcP8MpVitUKSgp67S6u4+E5NiJKdbYjTcHWsnQZEPCMrvnse2xUPhKTrdLSqwOnUykzDwGLB48f8+Enn1DwPEr7dwOwZXYLrzz/AvPzC6yurbHSbJCM1CmVytiWVvVRWSBItoY9TZMaQn2HgvHs8Qys1WPH0uNQDdB9gCDUxcuubetMYaVCoVii22zSbja48/ARG+0O9x895urevZw8cojjB/ezZ8sWCpaDhZa0FXLI5ApBHGk/BcvShYdKQqXgc2zPLg7u2s03XnmF1WaDpbU1bt+7x50HD7h09So3b93m8dycLnSvVLB8n0KhoAtmpcCxfZ0NHcoK9Y3Ig7Qs7Yg8uEumLyrt1rspW67HlpY5Haw/WZ/NWlMBJIP36Hs9pGzCoN9kRbXZvJttMNOU3ARNF21mtTGYvZbufFKBSFNsaRMFfVZXlul1OggUUilKvs9ItcbU+AQ7t21jdmaGvbt2s33rVqYmJpioVSlYEkcOarBC00ZJlBi6rKuBPHQwttTucP32Pc5fvsS7n3zC1Vu3WGk08EolJqemKJYqKLQDZr/bIUliLAs8V28aJBKR6EBYq5WIfMNqWQLpWFhSEMcBUkK1VCTu9+msNyi5HqdPPMcPvv1tJooev/zgAm/96lc8WZzn4JHD9JOEdqc9kE1lUOw6nOXI5ZrRS6Cb01UhjmPtG4BGzF3P07SaVKGShHazSWdjHZnGTI+PcXD3Hvbs3HU5GJ/4n8/Xyudvme9otNbCW8sPUbadKm9Q2PyPdfxTFXU+dQjwfFh8BO/+FSjEUn1i46cvv/GL05Nb+qfEW/O7bPuNS3fujd1YWWFleZlStUatPkqxXEZYllbKABzbJk4G+qmDRUzz76JEL4LZApXxLYMgRAooFoskcUyUpoxOTLC8uMDN27d458MPmZ6e5sUTR1n7wfdprm8wvzDP4qNHVMZGkY7etQdxjLBMUUEYG1mlbDbVu3fLLG6+7xPFMWma0I9ioiTVuzZb4pcqTG13ibodWmHIpZs3WWs0uXX3LjcOHuTw3j1snZ1ly8QEFcehXCwSuPqzSDU/dbC8QqFUol4s0p+ZYd+27aweOcJKY4M7jx7z8PEcKxsN1hpNllfXWFheZqPRZG19Qxd+SgvLdgy/VFKqlCiVSyYQzgo/defP0nN6QdJFHqhBEDw0+wzS56YXZIVCWVslibbWzlDFTEFEPhVg54i6gFKpYAyfpHmdlgQLw5B+v08QBvR6PcIg0BbWqUZNi45DqVhgdnSU0b27GalWmRgdYWZygsmJcXZu3crM1CRjtRr1YhnfcfAyZD27CkPbsRHYrpvz1jD65xaacLbU7TH35AmXrl3nwtWrXL91m/uP5uiHIcqycYo+iZQEqV4OEoMwpxhOv2u4n6BtiNFFdZbIyT6D1AIih8lE3tibkepMCSejRViWheP7+L5n6AHrhO0O4/VRXn7+Bf7we99j37ZpMoP2+VaPS9evcfXWTTa6LUojda07nC1qw1Dds0f/F45MEk0lSX45Siqd5civTQfvA018QaK0/Gi5XqPZbfKrd95mpF6lWq8xXq3jS0kCjLoOp48fIQwDGlHIu+fOgW1TG6lT8DX9LQwDTVVxdd/vBwEy1gW+qZEJFGrQg3OFBpVtO59xjcro8ucBr9HMt+x8kdFAnzKbmIzupesaVJLmK/yARy+xHD1GBRCFMRmFJDM3siwtxWrueN7KmEAhSdXmzQBms5NoTrtS6B2SSI2CzKBIO3ttjhKKfA+1qRWE+uLdzp/P0gVD7YRAa/rbNmmc0Fxfo9vYoFYo8tJzJ/nD73+fU4cOUfdd4gR82yIVihvz87z12/c5c/4cvSiiPjFOlKKVKaQWAUhVijOE6sq8Uvh3w8n10Boa/3JgsOS4DhKNamsDKcHM7FYa7Ta/fPs3bNkyy4F9u3GAEUtyaOcOfvDmmzTbLd754H1WFhaI4phyqUyaCqJ+NBR4PHscDZEhcs50lnEBBteYBYCITZ9ZKJY0Rc/IvDmWhe96+OUKjusR9Hv0o4gb9+5z98EDrl27ws0Txzh9/Di7tmxj28wMo4XCwFjKHNLK1F20q2ISxZqmZVu4FhRLPmMln23jY+ycmeHkkcOcPnGcB4/nWF1f58nKMisbDTZaLdbWN2g0NphbXiIwLt6O6+L7Pn6hgOv5Ohh3HDzfB5WSpNkYGArKh5DxbJWM4zg3/srvbV6HkaGugw1q1kVRSuvCywFNJweo8nulv89yLIrFIsKy9EY8SYgirc4WBF2CoEcY6E1FGifEUUDB95gYG2N221aqpRKj9TpbZ6aZnphky/QsW6dnGKtVGBupUymWKNk2nhgMxWHxCte2EY5jxi30koTFZov1Vot3P/qEX733Ho/n51lptehGEaWREcq1On6hSJJqdakojJFSUi6XQWmzuYxkqpTSsqRKoYREmUx6mqvEpJpWo7RJ0Or8AgQxL7/4En/yw+9zaHqE+/NLfPzxJ6yurOh2MyIKuW8Gpn3NZ+aFuPnI0Bk7S9o5a0IIgWc7CM83Cmq6gYJeQLfdodVoEnXbuFJxeMsszx040Bmfmn379onn/vz93bve7967N7fr3XdwfZ/OubNRW4pESpk8K2P/D338lwnIhQDHhfVlmFuAdtMJ9hwO7szueFTetfsvqt/59qJ4odGd+vizb0UffOI219ercZI6otejnyRaJcWk8EPHHuyUlE77WkZ9QGScbqGdz5J0ELLGSazRAb9It90mCPqM1OsUiiU21lb59XvvMzs1zb/44ff54bffpN/r8Zd/9Z+4dvsWQgpKIyMUCh4paR6oYgnSRH+XbVmkKcSR5oFZto1jOdjG9S9LAVmWRGFT8H1Ga1WSqEZrfZ32xgbX793l/txjrty8wcG9ezmwdy/PHzvOnh07GB+p4Tk2ViqNPrEx5clWSCGwhaDquIyMjLJjZJQIOHX0OOvNJmuNJovLK8wvLnLXFOEsraywsrZOt9+n1w+IYq1MIIIA4ToaOYxjzecSmoeeB6FDO1eRBYp5in+gmjEcmMNm6ksoIE61Bm5q3itQpCoLaEyQkgUvSumgVAwNlSzVbuQPbaW0YkCphCiVcCyLomMzXq8zOzXN9u3b2Ld3D9OTk8xMTjBSq1IqFChKbYqRLTcD5XZ9Pmmqi1qE0CkyK+fO6te24ojVVosnq6tcuXGLa9ev8/nFSzycm6Pd6yNdl1KlilcoIG1bmysk6Sar9kxmy84cFGOdwtOFdQJbyjwQe1ZYsQmxHX5cSlKhCOIQhTbJ8jxXSzm2OoTdLrViicN79vCtl1/mtVNHKZhr68Ypl65f55OznzK/uoRwHUqVComAKAxIU63EkAXSvwcxQJ9rpuUHKJNBUZqLs2nxREpsoc1OkjhiYnqK1obD1du3+emv3qJSq/Htl19l9/gEsfnImdERvvvG66y2O2z0etybm6OxtMz4+DiZNkOcJviFArbtsLHRQEWJdp8c7G7y46lt4hePoUxctlEREpNlMpb0QKpMwbFSWCprNzEw0MrSC+a+IxnIoyUJ/bCv+4RB04XM0ubm+xkEFxlqPozU5VkVgS48ReZ86VzjdygYH2jXqzyQBi1zRjbk863i737/AQqui0oTWmurhK02UyMjnDp8hB995zu8cuoUI66da6krYK3Z4mdvv81Pf/M2CxsbFEdHKNdHaXY6WLZDwS3Q6/R0psT3B4ZUf49DGEAiU3LwXQ/bBBLdfh8JTM5OMf/wAeevXuHslUucPHmcrePjFGybyXKJb7zwPN1um9bGOh99fp7l+Sfs2X8AbJuwH6DUwOwJNm8dhm6b/v9QFkkYad90iG+t75sxaTO3SyJ1HZGdEEeKOFGEcULB1dzyQrFEr9ej026xurLKysoKiyvL3Lhzhz07dnL08GGO7D/IZL1OtVzCtSwcwJYi31SmRjZWJQl2qrR1uplXXcemNlpn92id47t20kl1MD2/vMzdx4+ZX17hwePHPHr4kAcPH7KyukKv3ydONIBgAVaieftxu03YapGo1MzTwpjkWNp3QGZa58YcMJuXLE1xzLNHRuc6X00Uup+TbgrOs8xf9rqM46zFAwZjXQqJbfWRQhpxgVTTbtMEJ9XGUiXLwimXcC2bNI6YGB/jyOFD7Ni6lbFqjcnxcWanpxmt1RitVqmYOiWBcdFViiDRmRJlAllhWdiWxJKCBGgmCevNNjfv3+fitWs8fvKEDz/9lIvXr2tQYnSM2ugohXIFy9GMgyDQcrC6ANLBtR2SJCSNU1Sq/UhSozGeKBBST26aRqSzgEKllIpF7FSw3lgniSJ2b93Kn/74R3zzm6/TSWJ+/d57vPf+e9hFn5pXI4x0fGFJrbGfzzuKXAZSmLUv466naUISBsT9AU0yNzXUuxQ97yUpTpIy6joUimNxvVxs7z/5XFR+/vnzj6r1//nywYO/WBipqe2/+qXY9df/yU5qtWQuCNKOX9ACUr/nXPZ3Of4LIeToidyyoeiDXwi9VsMe+9m/Ky+e/rb8t8+dPtOFz05OTHzzu9L/V/byyrfurK9O3Xgyz8PHj2l1OjkX2/FcXSCV8YPN37ajVQMs10Xatk6hpEpzjDNVDhPQaHRBaYF7z6VUqfDw8UPOnD/P8ePHeWH7Vr772is8uneftbU1WkGPNIxwCwVc2yEGEtN5kYokjXE9zUft9UKCKBoUo7pac1o6ukgrRSP4/V6f0KD2wnEpj44S9nuE3R735udZbjS49eAhDxeXOH7sKEcO7GfvzCzjnoed7RjNhJsksbYHT/VC69q2doEDKrZNsV5nqlplz+wMUXKERrfL2kaTtUaDxeVlVtfWWFxeZmV9nX4Q8nDuMfcfPqAXBPlGIkkSMEhrJptnuwPVh0KhgOd7GkXOkPLhyS9HwTGgrsRybV00hDIFIlpXPjF6ommkddEzzmAaRfTWG8TdbubUg5AS17Ipl8qMjowwPjrG7MwME+NjjNbrjI7UmRgdZXxkhEq5zOhInZGqVuZwbVvXJwgtISfQxYUa+U8Mx1lqGgOCmEwzWOZ6B4FSdOOE6w8ecPbKJS5dv8bla9d59HieXhBQqlSYGhvD8jyiKCZMEogibM/DRXNopRyYj4hUKwIBGj02CgxCGiREZO03tGBnCzViqLDSBFNCT+KxydRYro3rulgC+p0OQatFwXXYv3Mnp4+dYO+2LfjojUkvhcXlBleu3+TW3TskCAqlMsJxiMNASzoy4E8OT19Pn9umqUDowM2SEkfqIqREJQil3S+zwE+hFznNV9XjNw5DwjRiZGQK13NZb6xz7eZtfvXO22yZnWVmfAIbXaAIilrB47tvvEYkJP+/f//nXLlxA9+xqdbquEWfTq8LUiFdC9d3NZoVZajQUFJaPU1dySH8TdeLxKhGDI1RNG0rSaOhOhf9jjiJzVAZLswcIH6pGRcqjsmKKiUZLSULtkAYjnTWdmmSmDnB0CocB0iJwpgwp5cMcd7NGM0K61SqBvd0iJIyfLEiC+wZohk99bJBadygybJn9TsTon6X1sYao8UiLxw+yve++SYvHD1KybUHn2PBWhhz+c493vv4DHcePqBYr1GsVEmVIAwjSraL73p0Wm2SKCZ23ZyDqoapDF/skl96DNMeBBqF1+o72gshCIP82i3fJXQk1x/e59LNW9SqdSq2duMcc2ye27ePJy++xJOFea7ev0ev1cbyfK29PYTn5l0pa2elNzxCpXlgnt9BoRs9CyD1uUrTH/QcrJSi1eoaZZgSbtVBxTH9Xp9WpwNK4To2nuNQHxmjXh8h6PdYbTZ58vFZPvv8Mh+d+5yXTj3Pc0ePcujAfmYnJqi4DoWhLGhqCYRnm02CpvkImQ4Mf0x/soCSEKSWYMfEONP1Gr0kpdHt0Ww2Wd9YZ219nUajycLSEsvLyzxZWGRhaYlWu83y6gqNVisHipAW0qz/WkNdxwiaOmaBpeUfXd/LlXYGdJIh8AiMHaqWo0wy5FZgTHi0WEMUaqnCMAx1vUlqatTimGCjQRKG4Pl4nketUqZcKjIxOqLpJuPjbJ2ZZnxklHq1ymitxsiQQZhv27jGVTdzMtUbbJ0Z1BK4Ctd2DcpP7margHaquPboMecvXuTDs59x/uJF5h49IhaS6R07KFQquJ6HUtDrBzRabdI0xXM9quUytrRIoohuu0WqEqQUJCKjqGDMqTQIoCUpFSpOUGmsIYUwJApCeo0Gs5OTvP7qK7x06gQFW/LplZu8//En3L13j5ldO/ArWlJxuDg86/2ZoZPuxTLfcDlSEvYT2s0WPdN301jz1tM4JgoCSBWe4zI1McH22Vl2z86yZaTetC350eKxo3/9zokT734+NrY04TjWn4DVctziWq2GU60202YzodvdBDj+Yx7/5QJyMMGEBNtCxkla3FiNmx/+JmnfWYqYfIX52pF3L/yBv5ESfZLee3xo35nzY7vv3d3aDrrToCqWEGXLEm7iuqSWhUxSGkHAahBoVExqa3XSFCxJKsgR3kKxgEhhbW0d17Epl8vESYzjetg1iwd37nDh0mXOXbzI3rFRDs7O8i/++Ccoy+Y3777N2sY6YRJTGRuln6YEcYBjubqyPYkJ4xjLBBmeY/a0aaoHkKmidyxt2Z0Yw4Bs9yel0Ih6sYC0bIJej1YY0pl7zGq7xdV7d5kcGeH4/v28fvIk+7fvoOC61DwP15IktoMUUju4qUHVt0AX3ThZoaPjADBdKhJPjNNPFa1en1anzUazSaPVJghDHs0v8ODRYzq9Lp1Oh1anS6fbpR8EmoMcBgRRRGg0lhWKOOjR7GgnySRJ80K/NC8wyZB0jaYqKYilILYGVAAptGqELS1d9GJk0Fxp41gWjhQ4W7fgShvXdii4LuVikVKhwEi9zvjIKOOjY0xPTjJar1IplymXSlTLJc2PlwODFXjWwjykFJHdF8MFlBY4Bj6PMPqti4tcv3mLm3fvcvnWDR4tLbK0tkaz3SGIQr1B9D0wFsKpUeJJU5U7aGZqGVkwZCK2wQ8MkJxsAvwShHwzP2CQ1rQdG5UowrCP49n4jkUSRnQbDYJmkyN79/PmK6/wrZdfZveWLSYFDEGvz71Hc3x6/gI3bt+mNjGOWy7mSg46PawVjyzLGhjFPGPYg7kkMXhMMZCiG6DDebSnUT2GkHKUQVBsmp0ujgVTs1uYe3SfM+fOMzU1w3i5yvP7D+AKCJW+17smxvj+66+QJCH/6Re/4NadOyz3ulRHRiiUSygp6HY7CEs7KOZoMRkq9vRFDTI+X2h+laHEKu/vWUCec+0zdG4oSMwQ7DyANajbcPCefV7O6DJoepqkuadMfoZiSLPXLO5Kw3gMqb/p7xxGCQX5pk7BkHTsUPCSPZffryy7pT8w43lmmTth0P7BtUpTYJfSXFsj7LYp2RYvnTjBT374Q144dpSZkRphGOcFWwr47Wef8W//4i+4dOsmwnUpVatIxyGMtQqF7uMRrq2L55NES91atp279P2uR359Wbsb5E4Y1C5NdCDhej5CQKfXxy4UGZ2Z4dzVK4z87S/ZPruN8b078UyP2bNlCz96801anRa9v/kZcw/v41aqjM9s0Vr1aYrxezSBt3HwNI9qboXKtfvz7KMQOlhPTe2G2eANdYbcDC5NEmLMPVL6dbpwX9OasLU8qgMIQ61oJyk3H82x3Ghx5sJFdm3bxuEDB9i3ezcH9+xmaqROzbZwhUBZNlgZnSIZzGdmeyZQWAhsg8wUbBsydaNyiXhynEApemFIv9dnvdFgdaPBwtIySysrdLodlldXWV1fpxcG9IKAvqm9CY3BYBhFhGGs1YzimCRWtPp9YrQbdaIyhDsdnm7yNcoy3Ow00XmZTOEpc8+VUuJKSaFUwvNcXNfTNWKWjVQKz7Yp+gVq1Qrjo6PUKlUmxkeZGB9ltFpjYmSEarlMuVii4LrYgk3Z2az/Zb/NEMQSIIy6nGPrfpICgYLHi0tcu32bq3fu8Pn1azx88oQnK8u0Oh1Cx9F1eZUy0nGJU40+63hB6/Rbpg+pVCuYaH64CbwRpEiz889TLmYtShEkFBwbV1psLC8T93uMj4zwvTff5E//4Ecc3L6VBwtLvPf+h9y6dw/paJELLEnQC0z7C4YXD2X6rZ679Jwn0oR+v49IEraMjlKamMBRCl8IZKoD8ziKQiXEhm2769Wp6fna7t0rhaOHektbZ28vJsm55tjYpz3PXaw9uO1z+27hwb2HsfXwYSwrlVTZthqWw/ynOP7LBuTZoRS4XpqU6n31zjs2F37usfv/ET/5351ee/InB95G8vbktl3FH9Qm9+9YXno+EfERodQYKtkl0ni7q4REkfbTxF9dWirOP3zozS0uOhudjpBS6JRwYiYZY4Ptuh5xENJqtTRVpVCg2WohbQvXc/GLBZZWlvjt+79lx9Qk3z/9Aq8e3keUfJeNxjpnzp1lrdnELxXB2FubzApCCl1AiNJVvZ6egqMoNtJ1pujFtkFYiFTLA2U8KU1L0KmiQr1EpVYj7PXodDosrq/zaH6BfqfDudlzPHz4mJOHD7Nleood27W6iiclnqMRAT1Ms8U0NXQOoxCQSUUafnJRCoqlAlOlAkxOkKCLcoNUEUQJvSCg1W7T6nRotdq0223avQ7rjQbrjQYbzSbNdpswClnf2KDRaBAnCWEcaWTdmNqkcTJAb8w/SghiAYnZbduuje+6eI5HpVSiXCpSLZeplcuU/QIF16Xo+0xPTjIxMqY3VcUS1XKZUqFIpVii4Hv4roMnBTbPzlQrBnSULAAWDAIFkeniSj0hJehgKk61OVUniphfXeXx/DyfX7rEmbPnuHztKvMry7jFIoVKhdpInfFC0UgMJvTjGBXH5nN1iBbHiSn+yRJu5AGWOZm8rfQEKBGWNOjlsB5xFkxt5o3nCLper7EtvVF0hEBFIf1GAyuK2Do+waunnuebr7zE4V3bKTgWrb7C9gVzq6t8duFzbty9TSfoM1koYLkunX5fI11S9+UBfzOXDd4cHarN4Gi2PCtj+oC5F7kJhxgEn2Lo+lBGylTYrDcaeK7N9NQ4vX6XtcVF3n3/fWYmJhifnGRHfQQpBL0wxXYkO8ZH+d//5CdUSyX+/D/8e67fvU23uU6x6BMlMf1+X6uQODZRpHntOUPjK/jxT19VFkTnj8oswDZNYtheg4KxzZ+d2WaroYg5r60QmgmdBbdZH87GVvb6LHi0Mo3mvE0zJF5t/nzTjzC9iKzvqMGNy6XnzKSnlDZjS7M+Bjl3N9NIhwHdRfM+jTtumqLiCJXEBO0m9aLPySNH+MPvfZc3X3mZimsTxwm9fogoFQjimEcrq/z8N7/mp2/9LZXxMcanp7E9jzBOSMIIz3FJ05R+t4fnueA4REFgKENy0wb3dzrUoCjy6Z8oiiBNsG0Hv+AjFLQ7LQqlIrWxOuc/+YSPzpzhxROnmKxX2Tk+SgwULItDO7bzk+99j2a3zf/205+y3moSjY6C4fZnQQ6KoQyNoeyZ+5X1j6x+Rc8gMteDz7MsQ33LLRQ0QBSE9JMeAl187JrCNZUk2sgsSYwHhkWlPsrY5BRCQGOjwdzCAjdu3eKzzz9nz6XLHNq/j+ePH+fA3j26EH50BM+SuGYd0nQoC6GMyY9K9AZDZLivjuwUMp8uLKAodCE+nseWeo1khwZBAkPv6/Y1st/t92k0mzRbLZotY3TV0etTq9Wm1W7T7fWJkpjVjQ3WWk1SMHxyzSlPjL07apB50v0chK2zXbZjU/A9ioUCvudTLpUolUqUSyVqtRqVSoViQZt6jY+OMlKt4TkOlaIx9SoUKDo2rmDTuvT0rJKgzcVUti5kWSvzWh2Y2kRK0Y1iokSx1mgyt7jAJ5+f58PPPuPi1Ss8XlzE8lwqIyOMzWylWC6jgF63S7fXJYm1RK2UkoLnmw2vIgj7+bywyXBPShSaIquGtDez9dMVEk9KLBRRp02tUOC1F1/kJ9/9Ni/u30sX+PjKNT488wntbpfJmRmwLL2RCiO90ZEyj1myyUpaFspk+EBvItqNDcp+Id13/Hhv586dkbTtVDpOT1hWE6U6wHoq5ONUyvtRqXKlMzZ++86eHQ+vjFTXHwBTqeLo3dvWzg/eKd/+X/9cvP/p5eauU8+39z5/SsXhP6rk+DOP/zoC8uxQgJQJjp1iSzUcQW2U/P5vju+/WYh2LSmhPhRKebEQRalU6fRSq7Y1Sqx7M/XG6JPHL+5+570/uXfz5v7V1dXSll07iYXQsnFCK6JIIYjCgCROKBaLgKDX65vCLS2hNzk7y8bKMu+8+y57tm3nhWPHcX2Xo3v38qd/+EcIKfj1++/x5OFDxrdsYXJqivmlZcIoplQsIrBQaUKst5h6Z2drreMMZcLsuEk1mmEZSkdq2iJJEoIgyBEox/OoSIuklMDIGGGS8Mt33+WTzz5jx7at7Nyxg+OHj7Jv1072bd/GVLmUK3wApGZysS3FMCc7R1CGUBZpaBsu2oo89WwSzyYqF4jjET1Zx3pXHUQR/TimH0YEcUicprQ7HdqdDolRhIhjrdIQZTJGRi4rq0JHCI3a29aQFJTm3fuei++5FDyfguvjuQ6urSd63/PwHdcY8Ggda3uouCNHkxiKbYe6nEBp/xlljKREvpwNBSeDd6UKeoniyeoG9x494PKN63x28QJ3HzzgydISUZri+j6zu3aRKKUL76RNFKcgBvr4oOkH2fSac96EGCoczAKgLD04OJVEZAZLApUFGCaXmXFcpZSG56oRbGlLpCVotprYtmRqYow0DFldmGfu/n32bt/BH/3gB/zBt97k8J49aCQEPEfQUXD20nV++tYvWWtuMLNlC8Ky6PX7BP0+jq03TxJTzJWmmwxNYAhQURn6NOAC59c2BFF9UdEgBTVYrDGUllQpHNdH2pJGq4tTKFIbH2e10eS9Dz+m7Jf4w298g/2zMyhHEhl0dMyxePOFU7hS8bO33uKjc+eYf/QQr1KhNjqKsB36UUwYhFiWllvLzUk2n2oeHGVAZFb7kMslZmed00MyinkW8D5FA3m6ww4hNRlCnirtjjmgzpjMkuGmD14/dCPMd2gJvcHmgKHXJJvfZb5L5YFBFl4ncUKcZOSKIQ6uQfqjKCJFF867rkOSxLRaLZIoouj7lCoVHMum02yxsrREv9OiUnB49fnn+dd/8qe8dOwEZcem1w0QUlCuFEAIbtyd42e/+RXnrl3Dr9VwSyUUEIYRSRY0YzYfgrwYV0hLK/kkz87cfOUxNBc8venJa2gE2ulWgbA0170fxdSnpugnil+8/TZbJifZ+c3XsYEwSekFIft37eFf/OjHWELwV2+9xd1bN5jZvpORiUmSJKXXC0gjPa/YUhIbhRFFqms/DMVNDXZOeb/LcxtPXW8aJzmVMPPM0MhNptyEyeTqNyZJihIpaaQ3NNJ2GJ2YZGxyEs+2iVGcuXCRcxcvMjU6yu6dO3jx+VMcP3qE6ckJio5D3fcpSUtTPrI+r/F4c85Gfjc7ZWWoCtktkCKnEzqALwVKWpRKJarFoqYPTU3m60y2oehHkZaODSOtPJImNNodmp0OkNEjs7qjZJNhkBSDQk/L+CRIoZV0PM/BdRx8z8PzPF1s6vu4jpWvRb7rGiqk5jw7hv+elRRnvzfdmzQlMeNKWjJ30TRdbNPrE6DRD3g494TLN25w9uJFbty5w6OFeYIkAd9jy57deo0Q2nMi7XQRaMlXqTKKIYNsV56FU/lmXJEawQaB49qkQquWaYEADQxJAbaQ+LZNe22NjeVlJmo1vvn6G/zwBz/g2OHDJGnKtbv3+ezz8zx4/JhuEDBSq+J6BVQcERJo1S2zICSJduR0XJc4iTWlT2lFNUtKCALwC83K9h1/WXjx1U8WK5X2Jc/eeCDTtq8MpihEX0EztaxG7Li9nu/1m6Zn24ASpErKJpYNjhMj5e87O/yDHf8VBeSmA9iOwlcKV27K2YSWlc7Vyl2gCzwZfqft1+QDJdKHFYuXk2h++9jEaNUvTMgkLsX9PrKgbaaDOEIIlZsJkCp8z9eazsb8I04TRAylSplep82TJ/N8fOZTju0/wDdfeoGd1SqvvHCKTqfF2sYGn1+9QnNtDWnblH2P2NfcYCEF0nLAWLarJEEqbaNtWRZZxXBq7LW1/vIAmVUoVKJNSvLUme1g216efu51OizPz7Owusrc2ipX7t7j2p277Nm5kwP79rJvxw7Gq1UmR0eol0pUPA9PSlKZ4YxyUxV5hhoptFxUVkwhhJkIhcCVElxX/3zFEZkfxSDoyvXCM3hQqUFxmMCkAge7sGzCstFdIeN1/z49KuOeJWpoMjPXlC3YQhhaj8ix1/y8U6CfJHS6PVY2Gjx6ssiDx4+5ee8ej+afcH/uEY/mn7DebJIAlZE61XqNQqFIEIRm8UYHLrle+9A5mjT0cFHoF1bPvD2E0RlXOWKZmsXDlnZeTZ4hlrnikNJFz3EaYwlBwdd6wiqMaK+tEjXbTNXqfOP0S/zx93/Ic3t2UbQk7VjpwCGNOHflDm998AFX7tzCr1UYHRmlH0XaHl7aui3NAp8b2sjf524943rzCOgZN3aoTYQAaTkkpLR6PXzPpToyynqUcOPOHVSc4Nouhe98h5lqGdeSdKIYy5LsmZig/uabVIpFfM/j7KWLrLba9GwH2/exHJdi0de0qzjKF60sAB2glvrEBrxklSNZ2Zl+2fXl2Zkvb4kv9hsGQaVUQ/KjT3Evs3PJ9wPDQfhTG6an/970lUPXqtJsqhK6aC57rdDc6Qytt11bB8pRSBRHSAmObeHZFp7lkPQDgqhNr9PFQTA1Nc3rp0/y3/3oh7xw7AQjnqcLE5VWpYmE4O6TBf72gw/4xXvv8XBpicr4OLZtk6R6g0IWjIMp3tOmYXoOlTnSjUGMf9ei0+z68nYaul+ZzKpWltDZFGlZGl3uJdRHx4laLT6/epnffLiV3Tu3c3DLLEXbRqUpNdvi1N592D/+I9ZbbRq/egsVBvTaTSzbwbUtlLRI05jQVCg7nkcmOZcVvqksiv3CzfvizR0u7pVD3UttHlx5706UDlwTJbBtgbBsCmUX19VOkt1Oh42VVRory9x7/Jj7C/M8Wlzkk3PnmJmeZHZ6mp3btrFzyxZGKxUqpSK+5WiFqnyLN7QJ1JGhWSMSEqVAZPJ3ei3KaqcsAZ7QaLGwvzqkMdNj7u6qhp7QX5cO1ic2Z1V1/ZAGTPSaoZ//u6xLOf0s/6ps467ncI1SCwPS6ffFQF8pwjCk0W6ztLLC44VFbt67z6P5eW4ZGcnF1VWiNKU6Uqc2PkaxXCZREIba8C+OTcZFYYzEQBfN6/NIh2hxmfmTnswkZLEJaHdMpVAqwbE0Ik4c0291SbpdRoolXjv9In/8gx/w/PGjlKXgxtIKb3/4IWc++5Rmt43l+2DbRHFEqsBxPXiaTjZoFpRSOLaFUClBp0fZtpmd2dIpbj/8zvyuPf/+bIH+LaD51bcgX+alnghVYllh4ntQKCBsK+97/9THf0UB+d/9uFWyhdKshHg+ZXGPVzg3u2P7txvd1taNZouibVOoVAhakeYRDldVKy3VhCBPWWGQoGKpzJadO5mbf8Iv3voVszNbmD5axbUERw8dYmmjge17vPPhB9y7eYOTp1/EKRR5NPcYIS1c10HYQutJhxEqTnHsFN/38gBQoXKL7CSOSdSwrI8YWgOE4Y6lkAriOMHxfHbt308cRXTbbTrdLhdv3OTmvft89OmnbJ+ZYdvWWY4eOMDB3XvYuW07Y/UapCm+JXF1rvyLk4kJqBJT8SwQuWqDRoMyYx6+gILmiCfP5sCBQT4zdNDKri4LlocXhM1nliMlw5+b8RFz1HVQkJO52UkziWS7/zhNUErzwPW9HxQgZr/7qaIdaGRlaWWFR3NPuHztGhcuXeLajRs8mp8nlZJSrcro1CQzu/cgHW1vH8YRnX6AcaJ/5rXkD+ffq77w2Ka2y2PtjEVq2sSkNB1Lb+pUZoZgUGqkRNgS4lRbLSvBzOQEMomZu3+f1uoqs6OjnD55kj/63vfYs3070rLoAY6tl+O1fsi7H3/ExSuXKFbKuOUSUardPR3LoeDZhp8ZDfjGApQS+Yo2BMh+AeXZdK0iywc844kvtBkmEyByqchECRIlcGyL2ugovY0G9x895pe/+jVlx+UPv/Mm4+USnq0NXZCSquvxjZdexi34lMsl3v3oYxaWl3DLZUYmpqhVq7Q6XZr9NiIzzBJ6c603PAY1NSo5WU/NUKdn3M1NlyTgWVe86T05Ci4Gj+nDyCbm6OhTL2MQVD3jY7/44i95mW1450mSkBp/TMs2SJUYGKVlhaMI8AtFlFKsrq4QhgHlYpGRWo2i6xH2+qwuLtJuNCl6Hnt27ODlU8/xr/7wD3hu3x5WG6tsJBHlQplSyaMHPFpZ5+2PP+G9jz9ieaOB9Dwc3zebejS2+nRDDnc2NWiLDJv9BzmGg/N8boMk1vVBxaKP8H36zSYXrl7mV++9S/n7P+Dg1CTlcpEgSUilYO+unXz/zW/S6ve4evsWiyvLeKUy9dExHNujsbZBGER4nkelVkUpRaPR0EHhU/KDX4xohh8UT/WjZ7SE2PwfDQCInOqkhHEhDnoaDbZtprbMMjYxThJFuK7DnYeP+OC3v8X3Pfbu28veXbs4fuQQu3ZsZ9vsDNMT41TKJUpOAdds97IA1wLjF5JtorTbI4m5Vtv+0vVhcFXP/n/2e1hVWi9HJtJG5I+Jp1+DGkDVDMbu0+2XKga0Ip7acKvBO56WAhaSgc4/OghP0ZuHdj9geW2N1fV1bty6xeUrl7l07Rp3HjygH0ZYrkepVmfbrt1IxyZRiihNaba7ZtNm4dgumSSlMu7hCnK6rZ5Uh9tpMGnbjs7wx7FBrR2XIOxrNTPPQcQxYa9Hd22dqWqNU8eO891vvsmxQ4eo+D5POh0+v3qVM+fPMjc/h1cq4hbLpECn3cayHDzP10WZSQzCuANLHe+kRr3OL/hEnQ6N9TX2jY2yb9+BNB7Z0rliEZ3VSf2v45r800fav+Px30RAroTJsgJXtkwv9P/4h2eft9P1gwvz/ObWbayCT7le15XHZnuaDbbcXlqAEJqjlCRagsn1fVzLYvHhQ85fvMjb77/PVLXC4e2z7JudJnzpRcq1KuuNJu9/8gkP796lPj5OpViiGwR0e30cx8WyXQqWo1OlaUoUx7mSgWXr9LKWcVRDi+cg0NT/GzJ8yX6ERDouju3gIcCy6Xe7dKOIzvIKK+sb3Lx/n8vXbzAzMUGtXGb/nj0cPXSQ6YkJKoUC1XKZqu/jD9MzhMxTZWmaIpQyqbuMt2gQOqN5qsE2nfp0viTw1J/7+yOmT5s6PH1k+uupQdsz3vHAPjz76gFy6Fqbu71Cp/66Scpyq83yygq3793n3sNHzM0v8GRhgfWNDTaaTTo9LQnp10awXAevWEBZDoFJAcem/yiVl2Ll35uDPmKwNAwHZfnJPPN4VhgrcB3PoJYpQRxq5MMg44nhZCu0VJfvezhSEPf7dNfXaSyvMFYq8+qpF/jJH/yQN06fpmTspBV6Zlvu9vj43Od8cOYM9+efUJ8cxysVSZXmXrqOphVFQUQSp1qi0Wx2h5VfIAu2n7rOTdc75M75O7WByAuxtEubBVK72IYKCl6BuBDRWl3jwtWrlHwfv+Dz7ZdOM1mrgtSul5YlGHNdTh85Rq1UoVap8at33+Xx0hLLT+aIggCvUKJerRJEWeEyZMuZICvQ1PQvO6MLJcmX9NuvioS/eq0Y3qw866OH2/erRtumTS1DmwM1eGwQdKihYmxNh0JpKkgShoMZS+hzSk2WpN1uayUfSzJSr1MpFHWmst1hY3WV1uoqJc9j77YdfP/Nb/Pt11/lwPat2EClUDLykDo+eLSwyFsffswv3nmHizdvktoWbqmMdDzSSIMdw4WoqVCbrOalQQTz6/uSxvny7dPv1pabjhQsBAXHJ1GCpm1z6+ED3v34I7Zt28rkSJ26q4UAXGFTdlxefe4UkVIUfJ/3P/2UjUYDiaBWH6VQ8LEtmzhJ6BnlB8u2vxadfToc33R1wyZsX3O1Ok5MSZLI9A+lDa/QcruOkRuOgpBev0cIjGzZAiplsdFk/dJlrt2+Ta1SZnykzo5tW9kyO8u+3XvYuXU7k6OjVAoFpNKFeQ56frekDdhaqCHP4kJgXCCzDUF+SVmwO/QzvPY8c4Mq8n9+pyPj9utsoNo0XrJlO4u7B4pJJtDPOf1f/o0hsBGGNNtt5peWeLK4yJ0HD7h97x4ra2usrK7SMrTQUEjwPOxiCbtYwPI8EBYqiY0uuUKmes3O6DlSSC3uwOaxjjnv/LEhqaQMNLYsSZjGRH1t+uO7Lo5laVfRjQ18ITl64CA/+PZ3OH3yOaYqmjr74OFDPjjzCVdu3qAdhmyZmcUpFOmHEWGU4CgL388klPXOT1gWSIijyKDjujauH8d0Wy3GZrcko1tmrn447c1ddLUS5O98E/8rPP6bCMgB6Hbh7l2aScx1aT18o1y5Xt6y9XXr9m0Rdrsi7gfYwjKkIS3bo1OYmEGjd2NJapEqjfQ4loXrauvqtcYG7773LjPjo4xN/IjJgs+BrbPU6jW63S5JHHPu4kXa7Ta79u3HljahSonjBOFILQdoQxwb2UClcISFY0mjrxnnIvY5f+tLjmz/nqYpnV5fD3bboVhxKZbKJHFEv9ej222z2GiwsLrKlZu3UEnM9i1bOH70CFOTE4xUa0yOjrJlaorx0VHqlQrlQkFbFbuu1pY1BTnZxnkYEUgUpIkAwx/Lp/RnBQNfcjnDShq5A+fgSVMsxuA1AHLAI85L/Axqk793MBMDhn6iIDZBc5BE9MKIThCw1mix0WiyuLrG4/l55heXuH3vHo/m5lhYXGSj2USlKX6pxMjYOLXpaQqlEkoIXQAYhQRBmPOmpalS//2OZzWQ+NL/KfRa6ti6JqLf75PGujAYI+uWxDEJCmlpRR/fsZEqZXVxgXCjyXi5wrdeeYX//sc/5qXjR6l7Hv0k1ZxAdNrvgwuf81d/8zNuPLgHjk2hVMJ2XcI41jxHW59MJkVp27bpG1/eh39/eOLZWJXmaeu6D6RA2hLbdgnDPv0gwLEtCuUyKNhYWubMhQv0gj5CJfzoW29ScB1sqQNLhGCiUGDSoDnVYokPP/2USzdu0lxapjwSU66PkAhQUhjqlZ4nsjPSZiEDqtezse98a7YpUPpde8swu1EN/Xxd633l84p8U/Nln5aaAjrL0go6ymxC4lhLcmrJWV3/IcymNApDpIRysUilWMRG0Gs0aK9vkAYB26amOHrgIC88d4rvvf4KR/ZsR6BdBouuD0A7SVjYaPDWhx/xn956i0u3btGKImqVMdxC0dwHsamHZO2ZZeue1RbPujP/oIci94cg0g7HpVqN5cUnXLlzm7c//ICJkTovHj1O2bKw0LUQW+sjvPniS7iWTZIknL10idWWnn9G6mPYxQL9INCOrlJS8H0y6trvE04+63/Dj24O4vW/liVI04QoSjSf29REac6z6Qdm/kkRFKo1xsfGUGnM+uoajfUN5hYfkYQBlhSMj44yPTXFnl272LVzB5NjY8xMTjJWrVIrl6mWS5R8n4LrGRdmG8eS2DlFSJCKJMtHmRNXm85/MF4GI2WIkfKMK/6KR3M0W2nta0P3HGgIDcFpQ6kEIXQBfkZ/SdHId6y0ulacK+pANwhYbTZZWFllYWmJpZUVHsw9Yn5hQQNET+ZpdTsIaVGt16nWakxOTOk1UYgcFdfKKGi/A7NR1tnTRGfxJICVX+DT2YXhFhig/FprXQgBSYJKIrxiAVdKgnaLoNWi6vmcOHiIH3z3u7xy+jTb6xX6qeJeo8FH5z/ns/PnWW+18ctl3GIRJSRJmuZ1X3ltxvD6aXY3OkMPYb9H3O9T8j3q01vOia3b//ODqvew/cw7+M/r+G8nIH/wAP7H/xHefRcOHYri/+H/9FZxcnbnSKXyrWYYOu1mE7dURAqbKIwAXXiUZIiq0Bqltg1JonmHYRiCZVGuVohsm8cL83x24QK79+zh5IF9jBULjJZLfPPVVwjjhNW1Va7fvsXGyjK18Sn8QolGq0m/1ycOIx2Um1S3lpnSKXYpJcIYHKWbhsaXH9LSSGC/H6AUuK62PfddF8/zKZTKVKKaNiaKtM26IwWNToefvvUWUsBItcZYrc7WmRm2zs6wZWaabVu3MD42zvTUNBP1EaqugyuESVIP+HKZXbKyB+k1hcpRWczr8mJDhhbDbGLLAm4zCKVlIWy5eWEQmbTaU+ZD5nc2zWopQvHMIpkETUHpRxHtbpd2r8/y2jpzS4s8ePhQU1CePOHJ4iKtbg+FxHJdXN9nfOtWJo3TmpBa515IQS+KDEXCmPhYNtI255MONhmbl7QvPwZSdnqhGX4vCJ4GjgV67UnjGJVlWzxX01YQucQXUgftlkSrWPT7bCwvU3Ncnjt6lB9/9zt84+UXKVgWUZzS6YWUyz5RmvBoeYUPPjnDh599SmLZTMxMY7kuSaqr/3XgqRdjrZxhqFdDC/QXr/OpG0jWn8g3c5sgVzYHW5vbUuVIU5ImiFRgexZRJAnjhF4vpF4tMzFdxrFt1hYW+eizs1SLBcaqFV44dpR6uQLCOH6i+/fBXbsoFktMjk8ipM35y5dYW1qkH/TxikVNkxCSMNZ6/wKJazs4joNIFVEYEUeRpnOYepFNF/vUPX9WuzwrNhbDLzAB/UCW0zya/fcpxOupr/7CkX2fGgpo1NCzGco40CbXu27LMQVrxgdCqZQgCEjThGKxQLlQwLYskjCg1WiwsbyMrRRbJ6d56dQLvPnGaxw9tJ9dM1MooNVukSQJ9UoVS0rWOh3efv8D/uZXv+Lm3btEKEbGxiiWTYYjjJApCMOjz8vRnnmxg4yUyhvpqR3OM9pFqaH/fNUx9P4sH6dSRafZxnItypUKYTRG2O9x4epV9m7fwa7tOyiOjGIhaPf72K5LvVjk5ZOn6IUhYRxz5vx51tdWcS2HSq1OwXgYxFkG5mvv71PYt/jKZ5/ZFJriaRmTlRiBxEb7NigFSRoRxYFWyLIs/EIBIQSttg6THL/A+JTP2PgEaRLl/hIrGw0WP/2M9z/+hLAfsGPrFp47eoSxep16rcLY6CiT4+OMjY5Sr9UYrY9QKRQoC4EnBKk7IJ4MxsfgAgdZuWzznuZ1N3r+GFAcn9lyQw2RUdR039FZZBA5NXNAlcy+cfMGUKLXogjoxjGdbpdWr0ej1aLT7RIrxdzCAhcuXuTG7dssr6/TaDYJogjbcRGWRXVighLjCKE3xpZjk1oaiIjCiH6/T6xSpLRwbEdL3CpNx1VS0xo1vUkZ+ll2fpm062DdUqnSWRDzCst4QOj4KaXoeRRdj6jXYXV+Hkcp9h3dz4++/32+8eqr1MtFJHpMn/n0Mz757DOWV1cplEq45QpBGGrH8jjB9XwsIY2fi97Y5dKwQqsy2ZZEKkVjfR3Z77N1apLCrj2Xm9NbfpO47tqX3sR/Rsc/74D82jX4q7/Ufz9+DOfPQxwT3X8Qvr9ty99u379/196719+4eemSs7K8yJbiDhzHJQpCMnULHUQmkOqAUEti6aLPKNK7Sd8sKqtLS5y7dJliqYzt2Lxy9DAesG98DPXaKwTtJj//27d4+GSe1uoKfm0Ez3ZwLFsrEoSRCRylDuwEWmUEyPjkwCaEeXhi3PS30oic73pmx69IoohekgwsrgXatUvqIgXLkog0Je14BGFA1Gyx3ukxv77O9Qf3KRWL1Gs1apUKE2PjTI6PUymXmZ2aYGp8lKLna1UT16VQKFDwfVzHxRPafc1GIIQFhoaTTUi/L1b8VYdCx/eZVGG2pMZAmKb0wpAgDOl0u7S7Hdq9Lmtr66ytrtFotljbaLC0ssp6s0m336fZarGytkaz3aLd65MisF2Xou9hOw7CdbFcFwuRF+KkKtEoROaMJvWGLg8ehdZw/YfA4J6VaRiWnc4QC8cxusJKZ2GUSnAcrQTg2BZpFLKxukqv2WSsXOEbL5zme2++ySsnT+pgPEroRzG2rSW+5tcbvPfJJ7z/2afMLS+xZdduytUqnV4/LwS2bUdTY/INlSkuM3rzWNbvdfO/iFp+zZuVluOyLUm33yeKIhzX1moorkeUxPSCUFO6yhX8Spf1fo/fnvmENA5Z2vgB33n1VSaqNWwh6ClFEKeUHIt9E+MUX3+FUqnIttkZPvzsMx4uzCPiiDQKtZGT4+A5Hlo0SBEGQb5xsh0HIXQ6/xngfn7/hi7lK9vli1vRLzRF3oBZYkh94QVfd3wZ3i5yG2sYbKSz1HuapsTG2lwKTZkqeloWzlIprdUVmqurJEFA2fc5vG8fL5x4jm+88gonDh1grFhAKEUrCEBaeJ5PKCUPl5Z4+6OP+Ztf/5oLN64TSotitU6hXNH6yHFsHHuzkfePinn/3oc0c3A/7JNiU6wUqdZqNJOYWw/u884nHzM9PY3/wmm21evaeVApPGGzrVLljRdewLIljiX56NPPaK2tEAZ9RsYnqFVLhFFCr9cnk6D88uN36V1f03bKyC8KA5wInaENo5AkyRxgRU6Xk0I7KPaC0OhkOziOi+0NLNDDIKDf7+nC3n5Ir9sjePiI9U6boq9lbYulIvValdH6CPVqnanJSSZGR5gYGWGkXMGxbUbqNWpmA2dJC9tooGdiAFlAKYU2ssP6qgv9+sNCPHMYKsilglMgUop+FNLtBzr47AdsNJtsmDVneXWF1Y0NllZXabSa9Lo9mq0Wq80GG622VoVJUyzHxncc7ZjpejormssCKsIoIQi7hjIncKRt6F4y11fPi3glRjSCIeqkUezKNuPDG7yhbpEayWZbatlo25Z0NtbpNhoUhODk8RP88Q9+yBsvv8TOWoUIaAMX793nNx9+yPnLl2n2+oxNT+OVSrR6XfpBiCVt3KKDihX9fj9fyzLHT4TCdmy9joURGytrTPkeJ/buo3X8yJ1L22evNdx/yCjjv9zxzzYgtwF59hzqz/4nLX0jBDgugFDFIhf37272X3ju+g/OHOyt3blTeLS4gIpjLMfRnGgDpaapQcpN2jrT1pVCG2akiUK5FrZfoFirs7i2ynsffsDk9BRT01PMjNSpWxbbx8f4Vz/5Y6qlMn/9059xe26O1uoqtdExLdkjY21Hn8QgLCxL88q0K2WSq23AoNp58C/AU86HKsWybMqFAkpB0O8TRaGmLiiVK7FYtswNQZI0pVitMTIxCWlKEPSJg0C7sHW6zK2sEvZvodIU15jsOI7D7m3b2LdnF6WiT7FYoFquMFIfoV6vUS4Wc+3vYqFIwXVxTNGbQu90bXO/hmXsst9PoxM6O6U2/a3pJkpPcHFMEGvjpYyvHYQh/TCg1emw0WzR7rRZ3VhnZW2NtbU1FhcXWV9b12ZHG03WV1dJEkWpVqNULlOulBmdnmHS83QQiU79xUlqlBJ6uR10dmbZ4pTdqjRJcgQxszDP5S2fur7BMbwQDqEqmxBivvCOwTyaceZFjsRGkXaLs2yLYrGA69ioKKLX7xN1OhSk5PXTp/nXf/InnDxyjOlygShJ6XQDLNvGL7qsBxHnrl7j1++/z8OFRaqj4/jFEkmq6Pe1BJ3j2CYdqsePZetFOrM3VqlCSuPuqIaudHj9HwaOsyefFRvkbxx6DTpVbFk2tq3Tskkc60yU2TD2etrAKo4ifM+jOjFBsVziyd07/OK9d2kHAdgur7/yCpPlEkpBFMW0UkXBs9k+OsofvP4au7ZvZ7Re490PPqAdBGz0uoRxhFcs4ZVKYFsEQUg/jlCJwjMyaJFxzP1SBG4YrX36waf+/GK8NOgvSgwh208H4k+3+VceatM5DXrmQEIvU4bIvis1xZyZe69jW5QLBQq+h0xiOo0GjeVl4n6fqbExnjt6lO984xucPHaUfdu2UnEdFNAOdOBSKZeJheL+wgJvvfseP//1b7j94AGxsKiPT+D4BZJU0Q16kCocM16zDYj6kubjqec2Odt+Tavkzw9Dnl/3etOUQgpso+EchiGO7VIolmhuNLh26zZvvfsu9XKV6ksv4bsuAoiMcsrW+ijfeukVHCFRScpn5y+w1mrieR4jY+NI16Hb6ZAX2T/zeHZ2Zvj5L7TTMx5RQJymCCGxXZfMeTOOIwAzDm2tFoYGChJjdpYqpeUG49Ssr9rcxfF8HL9AdWQUAdiWRbvdYH1thbVuW6ttxAkCDLjgUa9qF8uJ0THGR0YoFHy2zswwOz2NbWnvilLB11rfxaIGj3ytsmYJkftyaNO53PHhSw819DtWKs8UAzkQFqWJLuaPNHc+CHRmoxcEbDSarLdadHp91tc3WFpeZm1jg+WVFVY31mm0Wqw3GnR7PZJWG9vzqM3OUh4dpWY7OK6HsLTJXzavaqUtfRYp2q0zCiN9/b6m9whELjecmWDpTVRCoAZrVX6dw5RQ9AY3TyCZRkgMLcr1HFwpUWFEd20d35IcPXKMP/mDP+C733iTeqlIBPSAizdv8db7H3Dh2jUa7Q5upYLjF1BSajqvkDi2gxQQKyM7qay80dMkQUhwpIWNIIxi0n5ArT4S7t615+4HO7fev+b9txGMwz/TgNzuB+x+72PGzlwmfOMH0OtBoaALG9odvz877V0cGd9QSbxUrlQ/rpRL33BWZDmJQ+JIu2dlkyVCDtRVzCExjoyWlgRKTWGDWyzSbrVYWFnmzPlz7Nu1g8mXXsSxLDzLYmutxpsvv4RE8Bc//xvOXb2GVAK/VMTzfUqFQs45jsJQG/NYAzMgyzh/6WH+rE5mFmFT9KDS/z97/xVjWZKneWI/syOvdu0e4aG1FpmRqqqyKqsqu6u6eqa3B9jhcrkkF/PEFwIDPhAg+LJYYJ/3gQNyMVjskpgZcGaHOzPVsnSlqoyMyIhIGVrrcA/XVx9lxgezc+91D48UVZXVmdltiUh3v+Lce+wcM/vb9//+36eIuh2DECmNaydFExA6dpI2QVumzG4zTjI6UWJkiqTACUICx8XxA7ywQJok5HytXKD/5oP7XL11Aykg8DwC32iuFsOQQqFAtVI2xaHlCuViicB1mZycYHxszKjYaKNd61otVmNBb9QxpOwbkUhpgzpt0OckNbSLbjeiE5sFu9np0Im6xGlKu9Pl3oMHzM3PkWlNJ+rSjiKS1Li0ZbagRSkjfZimGW6pzIbakJm0bLENUpBg5NlIcwUeY1vuWE507qpoEPJcM9ei4WvwS9FbjT8LZvfkdR4MFAZ/X6s+IjB0FKThi3fjmCiOcF2HwA/xXYd2fYX64hIqjhmrDXF4715+9Mc/4PlnnqHiuUSx2Sh6gUcpNAWdl69c5bW33+ajSxdJ0Ixv3ADSpd3porUpWnStokufvmBQlyRNexsxsU4H6MEvv14P6DxwEmte3A9Ae48KyNIElZnCQYRrajEyQ53xPY8oy2h3OyitKRUKhJUqw1Mb6CwvcvnWbf72F7+k0WrznZdeZPfkBG4xIMs0SaqQrqQY+OzdsonqP/kn7Nuzh3MffsQbp05y9fYtUg3V4RFGxsYoFUsUggJRZLSOO92uMWlZCzP1TlM/JUCyzz/l6SeoBPmxPuV1vRd/Ynv6C/JgoD9mjLqLFOBJkxoXGN504DgIpXj88BH1hQUqhQL79+3n2SOHeen553nm0GFGq2WKvtfjeYdBYCTPBFy9d5/X3n6bn7/xJpdv3kQ7DuXaEL4fWG56Yh2Ie0KMNvW+WjmlX6Bqt9EDt9TTxuV6Wb3PmmlY/R7znRwhKJQKKK3odjq4novrBdSGRmi1W7z30UcM12qMlkuc2L2bQhCgbKDkAqOFEs8fOUoUx/iuz6n332d+fp52q02xWqNQCA0VI1N82gXuBZJrH1s7KEX/d61z0MTMybmfhsYUzoL12LCgTy55qqwDre/bInGL0mZpThHNUX3RWwsUGV5YYGRikkylpEliZPriGJ1mRJlmbnmFpWaTBzMzBJ5visgzhVAK1/Mol4pUSiVq1SrDtRqVSplarUqpVLKBuXlPtVikFAQ9YZU+dWVNoGo7RGOcSzOVkWlFnCR0oy6dKKbZNKZDjUadpZVlmq0WrXaHVrdLvdWk1emSKaPLH6epoc2AWWNcj+GJSYbtRgVLD8Vx0I5LqkElhmeuler5AGi781ZKI6VDoeD2JBnTODX+DD2Q0TGAiTTF1j0lJDuGe2eqn7z/e6uzsFk/NEkc0VicJ+t0CaTkmYOH+eEffZ+XTzzHaMnUdURAJ1WcOnuOX7z2GvMrKwTlMqVaraea4jgefmCKNJMoIcsy3Px75mPWUrIcR0KmUGlKJQioVYYfyMLQv9dO8N4n3vRfsfbVC8jnHsObv0H9+x+T3b6P2r7VoJo2JaO0FqpYcDUa5QcP9ZbNfzG9f//E9jQ+0Y5jkkzjBQVj144NyqUwKdAsI1cLcYSR+hNSWFWFjMAPqIwM027U+fD8x4wNDTE1MUWwbw9lYVQpDkxvpPq97wIC1w+58/Ahi0uLBIUCw6OjlIoFaGs63S5xmuAHgeHeOh5C5NrF4ong64kAXYBWoHKdcgzHi1w1xo4uhTZV4Hbly7LMoBU2YHEcU8nsihDPD2xhmuztTnWWUV+OWWmYwlWh+46AEpO+DAKfMAyMcU8Y4rouw8ND1KpVY3qk6dl1e6sCctnTwDU7eDNB5wF5mqbGHClJzL/c3CFNyLSiGyfMzc+zUl8BIMlyvVrD6faDAD8MCAsFfD8gCFw8z6NUKOJISZKmPRMJrTJbLW8QTamN4kcfDezDBUZtRvQncvJFP1/EPj0M/701AQqz2UiyBOkICoUCvuuSdLsszc0TtVpsHB/nlZde4k+++wovHTzIqGdUC1pJSqag5nskwJVHs/zynXd48+RJHs7NG85idYhGo0WapHhW0UAKSYayiIZZ1bTWPSc1xzHZn/V6Igdd1uP7f65TF4I0NRN5WAjxXJ8ois2mEmtx7ftkkSJRGd0kJlUOpZFh/ELI8sICb549y4P5eRbrDf7ku6+wfWrSbFS0IEoUroCRIGBk4wa2DA+xY+MGRoarnDxzlmu377BQr7M4N0exElG0KXQhhOHvo3v39uqzX/3beoHS5+oHeKLGYL3jfUaAd/3PsPc6FhXXeRGfI3E9z9ItFGkUU68vE7fbEMfs2ryFvTt38q0XnufE0cPs2bqZ0UKBmL43Y+5W2CDjgyvX+JvX3uDk2XNcunGDWGlGh4YJS2WSJDXysRoKnkGTc/QP1kfHhe4H4mrgiU8U8/k9NPPdMjI0pbAACuJ2jMoUxULI6Ogoi0rxYPYxb71zivHaENVqlQNbtuDZ4jylwROC7cOj+C9+g9HhEQrFIm++c4qHj+dJM8Xk9LThJqfqE7MDn+u7rwXVtZ319OA/rIye4VJLKQZQcW25ypK1UV6ewcnrjaSwogb2ZnBdB79QBHTPpCfLUrLEOGkmcUKaJjS6McvNDlopuq02UbuNcCS+7xH4PmFgwKIwDCkUC0ZhyjN1Hp4jKQUBBc/r0Z16tUpSrAJZcj02Td9ePsMopUWJEWjoRJEBjTod2u22ydhGEXESE6dGHSR3ZXY9D9f3CcKQMCgQ+AF+IcT1fTzrLttut4mTBK2MklWf5y1NxiHJUIldpwQ4ntejp2SpKRBVVvHJcYwZnLmoNrPbW8NUXwlG2wu96u4Rq4ClIPQRWrGyvEh3uc5YucwLzzzDf/bDH/L8s8fZVKsSA5GGR8t1rty8weun3uHC9WuMTk5SHR3FDwumNiJODQ9eugitieMIKSW+75sCcmua6FpQVCpN0u2ik4SDmzYz/syxR+cO7v3LmyNDl36HW/1L1756AfmP/4L0v/1vuaHhZhjAwt3Vzy8sxHr7ds3i/15m7FpY2Lb11MSxo3+yr9U4cfbSZbpRTKlcIbHoqc1fGQtYW4zXx2ztxJqmpDrD8V2qoyOUq2VuXb3K2ffOsnXDFBXf5dDOHYDp0MmhKn/6R69SqA3xNz//OafPnaW5vEQxDAg8l4LvkSQxnSghiWLCsEAQmMcym+J+EqERA4uJWebNYHTNomN5u2li1D567pcWvTCmO6ZSXVl9VJUp0kT1BmnujildKxeoNWmSUBseYcOGjWDTlMb9Me3ttI30oZlgW5lCqIRHt27TajZAY4Nu0Zd6En3zjjzizWlDmeqHDfkkKaU0RZP2PKStKHdcl6GxcSamp82mKUewB1cAKVYhOMq6iGZZ1jP0yI/vDHS6MflISRMTeOSZB4TAzfl7DLgrDlTOrRePDwIRT9WFzq+16P8+GKzlzw0+lmXGeU4pZdK6NkWbxTHNlTppFDE5MsKzR47ww1e+wysvPE9VSiJl0shSOoRFHyEFNx4+4qevvcHJd88wt7REWCoTFIrESUqWGaWIPODMetmC/HxzjqJdoIUwiIZFgvWac0Mbt8hciq7XIwOci7446dowVvdeahSREiDAdSSJgDRLSbTC841xieMYulYnjkji2Fhb12oUtWZlfoHzV6/TaUdkccKPXn2Vg9s24QlM0bWCWJhMTlgo8NzBg0xv3MihfQd46/RpXn/nHe48fMh8s0VpqENlaJhCsYznG6v2NE1MX/S+fW80rwqYB+761ffL4H2xzuOQzwfrPfHkMdaPQz85fNOA57g4nskmxmliDNSEMFkJQ6JHxTHddpv6wjzdZovjhw7xJ9/7Pgd27eHY/j1MT4wQSElHKVOo5jj4VravpVKu3rvDj3/6U/7qV6/TiGK0H1CtVAjKFdJM0W530Jki9I07r1H36JqAu2fvmG9QBrTbNWTS3G95V0meLJT+bdu6vScNxzpVKTKRxn0Qk9XUmSIolKhWh0jjhPmVOucuXGBkbJRC4LN7cgothJF6Uwp8j4lKlW+eeJ5UQRSbQs/5ep2k27W1GqtTKk+g4AMPrr3D1j4/iJH2h6sx4jE1Krk3hYPjGdBKqaxHYRFCGLBH0ttASasgZtaWfpSX1+XkDrhRFNHpGhUX17oue15AEBR6/afS1Dprmn++nfe0LTDP0ozEAjqNLGV5aaXvwqmVLYaPUYmt6bJn2pcl7KPlemD+SSz9I1cDy4sqXc/HdY3ko1uuUJCSkpXcdYToAdHmmNJubujNn3Gc0o0SlGoihMB1PSSOKZbX2mSqrc58lqbGAdcCH0EQ4AjH6nQbAzwQOF6eKTdASZqkaJ2tOr9eEL52Ds5nKQG6t1abgui870ZqFZ45eJg//5Mf8erL3ySUeR9pEp1x4+Y1fvGrX3Pr7h0KlRKloRpBsUiqNLE9B9dxSbSRVVY2+HYciVIpWiukFJYvDzrLiNptnCzj0JbNxCeOL//bo/tmGmFhvdH3lW1fvYB8eRkePECHIbpWfTL6aaxkNBqK5Yh5aL87PX37O/Xl81MXL3y3tbxc6SLkpq3byNoR3TQ2u3hpbHGFMEoRQA/t08oaEUhJZIsyQ9ehNjzE4soKf/nXf00gHEbLVbaOjeA4kiiKGa+W+PaJZygXQirFAu+8e5qluVlarQaj4xPUiiV816Pd7RLHsUWdc5R44JzygSLoqW+Yv01aR2VZfz/rGKqNVANKJdbdTGCt2oW0lfEG3QS9agJKlSKNI/NWjeFOS4c4sxbzykwowpE4jkZohbBumEop69ylIQjxe+fSi9p66iz9c+sH5GgboK2ZGKU1NcitufNrJB2HTEoSDdpSdMxirKzVN71Uo0Yhc3R/wOra7jvMwme/i7R8TGm50lhFHK3pmcIYZYF+ijxPv4I5lrbX6InrONDW23T10fb1X7j2dhf0NddzrmS70WDx8WO6jSY7t23lB9/5Nt954QWeP3iAkpRGrDXTCOlQDEw1+3w34a2z7/GXP/0p1+7cQfgBQ2NjSN+n2WqBMuiVEEbBJdNGE9ZxHHvdM6S0CkJ5TUaOEK8HzdqItKeCoNc+Odgza95s/1S2sNRzXdCK2N63bm/xSoz6ipCW0uKhEUYzvhshwwK1sXGydoc7Dx/ylz/7GY8fz/Gj73+XF44eYSg0KGw3zkhShSMFgeeyaXiY8Pgxtm3exJ7duzj9/ge899F57j56yEyzSaFcplYdMvKhjmPdYgc2b+S3xtrNBj3Ezoz39SLGfOys2sWs87r13jmgoZCDZoPQJfTqHsTA5+fKKvlGXApBsRDiBwEqS6mv1FmaXyDtdhkqlzm4aw87t27hlRdf4MXjRxmpDTFSKhIKKxJsA7aCNIV/j5t1fn3qbX7y61/zwbVbLHe6eMVSr7A6yTJ0pnrSsQ6SOIr6/SMG+nCdwrS1G5/852frtd+uKTTCc3GRdKIIF0mlXEaliiRJaLc6eJ7P2MQEK0uLfHT5MkuLiwwVy+z6wZTJGniu9a7QOAKGBLx0+DChHzA1Mclf/fRnXDp/nuHJCTZs3UocpzZjoPtzj7CjcAABHTzvJ8dev3PEqteaAJR8bGvjPKyENllTbQJEQ2vABsC5J8SAC6TKeh+BGljT7HjogzU2kMyyXtH44I5SIBCua1xDXbMOaCVQUpC5Em2zxTguOBlSKbAunEJrpArQKl19vLVDK9842HnZ09oGTCKfeHGlEWjAccF1UI6DlhIlbO2oXXOMHKqkz1o3QWhmdcxV7liNRqu+O7eUfWWjfHvgOi5KqB5o1iuqFdZIx/a1iWHM1zUBvUTrbOCz1l7jwRvA9osQeI4plH107x7dRp2dWzbx6rde5nsvfpPj+/dRc82a4gAhGXdnHvHmyXf421/8nFaWMbFxI3gu9U7HADvCoRDmJnYpCAiDAqDoRqYGznawEcWQDkJlJusWRWnohu/5paG/yIS7Ahh+zNOaxoCu3ron+qVrX+6A3MY4srOIXOpCqWQGydatBhUIwyffE/qa2rDWF+a91mH01emgua9ceGtz4O+dGBp6dbHdGe62O6QKkA5Kg0AipDbOlNLwpzNMYYpCI10Xx3VIo4xOJ0K5DmPjU9T1HJev3eRvf/FLRodH+P7L32B6wxTtOKHiOGwdqjD+zRcYrhQZKoW8ffpd7j6aoeEsUqrVCIOAVGfEaUacxrYyWqwKugbvof5Q7v8vs6kpaSk2xsVstb1QHgwYGSNlpAXziUj0qRcIeosuWltE1CNVim7U7vM2Zd+pU0iJtBY4UoC0wUdYKplgVpupB637k24vqBhEYMwgXCtD1Qeg+3zlPODNufdpkqwyXsjPtV+AJhAyrxvIEXFpURlrbmQnbHMA2Ss+Ep5EZ8ZyeBDN76E60E9z2mtn+H3rlUZ98pygdd/O2s7IAxztfNHoF9cpy932HCM1JrWm22jQWFokEJrtO7byw+9/nz//4x9wYHojRd+nnRouoxQQWBOgB8srvPvRBX7y69f5+MpVtO8yNjpJsVSikyREUYTvegjp2cyB2YAJz7N8v16kZYqH09QgOGL12a4Njn7XprXJXLiuQ9SNyPI6DMeabaUpOkuRjoMrXVM8JF1TgBnFFAsFqiMjiGrK4wcPuHrnDo8X5llp1ml02hzatZPNU5M4rgupJk4zlJC4jmSiWGRqyxa2j42zf+dudm7dysl3T3P34QNWmi2yVp1MmMU61+iWjmPRMXtNdb5xsxmF3k7DdFS+8TSjQ9uxrHoLdb7Yf2If2Z9yYGPfc9MdCMJ1T4XBbLryOhLzvELZzbCQAsuVI4u6ZHEM3Q5VVzK8YYp9u3bxyje/ybNHj3Boy2ZqgQ9YxQllAsV8rDS05s7Dh7x//gP+/Y//I6+fPIVTqjG2aStesQSOQ5IkRFGMxNSvOAhUmhIlRuNcup9fyWfw59Oe/53vU215r1LS7XZBCFw/QImUOI5pdzqUykWK5QpxkjA/O8PCxUu8fuoU+/bsYfvGjYwFPrgOcWyodU7gMFUo8N1DBxkpFem0m8SdFo1ul/biEsL1kJ6HcKRRotIm0DPnZTnbFpkV651pfoPk150+go2wy3GPokePL94HMsxaACZzp5TCHbCyXzWHD+wMczDI1BMJEE7v9blCSK7sZJB5abOlhhaTphlRNmDOKC0N03VNgCNWrytSGMMhKUWP6jq4qxvcCA+GrUL25/jcXj4/l3w+Htx8a60hy6yIRL7NGFin6ING/fXDZGZzUYb8tZkyxxGAdM2Km8s252NXOnZ8YovrrRa5EXcwqm5KSTQDNEPbr4a/bs9Y90EepTVJ3CVup4iow5bRYX7w8rf4L370I47s3IUrBBHm3lDArYUFXj/1Lm+cfIe7jx4xvmkTlaERlhsNOp0OICgWSniuZ+WYDW3V9zziNCZKErB1CkIKQ8fJFK16nYKG2uRU8mjP9h8vieH/mP2ymaF8EOtL7AJG8iYEphRsCWHky42of7kD8gAQUPzFLyj81S9R1SosLsLhwxbhXGdaVRk4nuDt/9VPRyIp/4//22gxis9MSb3jW8+deOHjK9eHL927T3V8gkK1Srcb9dKLnU4H7fuEQWDT1SZYTZIErSTFQoE0MVrO1bDC8MgEcavL1Vt3+Pd/9TfIUpEfvvJtRqtlPMwNWgBePHSIWrHI2NAQP/7JT7ly6zbL9TqjGzdSLFdws4xWt4OyGxBDQcEsir2JSxuKRS5ZpNWqRTsPvA3sMBDQDnSNzF0t7SQqxUDxhJ0c+rtpMz5VjlxbzVWzkFtFGI3JA+fvz0EZrVFpSmwdDdd+kz5dZfDC9cPVpy2GT+Nmr9JGzr/5qrRc79C9yZQsR0vsdCtlr99MatSep0V0cvUAM/la1En0z6O/8PVRzsGU+Opvvh5mh0XhNa7j9YLKnEdvUplub5JOk4wsNWl/T3oErsfSwhyLj2fxJbz07HH+9I9e5eUTz7Ntcgq0IlGKwJEkUUYGeMI4cb57/hL/6Sc/4dyF8xSGahRrNcJSiVa3TWqpMGAXBQxSrpFG4SUz18Wxedk0NWlWIVZXQYgnT7eHzph76ml9tf4jYK67Upo4ToGcKyl61yKXghNCGE6i1ccPHBcQ6FTRabWRaMpDQ4RhSBp1OfnB+zycn+PZo0f5x9/5Ni8c2I/ru3Rxe985w47vQsjRXTvYPDnGM/v38tGF85x+7xxXrt/g/swcCYKh0TEqw0OEoXFlTFPDhc7SzGabBJ4wvHxlNzuYvVZvQVYYgCBVZtPhuv6qQHowxMz7s1fEqG29x0BwpYWh6WkbRBhqliAMTZFVlqY4Vi61m0ZGOSYMUNqlWV9hcX6JxtISoZRMjY3y3HMn+Mbzz3N0/wF2bd1COQgo+x5ok6KOLBe2YF392sD7Vy7zk1/+gnMfvMfV27eojk/iFStIxyVJUkhSe2+ZcaZURs5ok57s9cvqje7AHCIG7hxtte51/1XrBeW/TSC+7nssuKE1BEGA1IJOt4NQRpFIaiM12shaIB2GRscRWcrFa9f5t//xL/jzP/kRLx7YbRdoE+7kY0VIyebJcf53f/5nvHDsKP/y//OvePOttxnbspWRyQkCPyDVRgI2TowFuee4VprV9KNjTay0yshLYo0Xh80eavP9c2dHLTSudeaUxvZxsLtNP6zKAEmbZVndKSbwHNhIKhvsiv77czQ9/8PJ5Yh7H2Teo22B5RNXQeuBrMCT10ghyOxnPJ22tPoE18Ira60iBsuJ+9kZC0L16C8GnMopZvl9u0rpRZiA2/yujKCEztfXQQKNWZ/y+1wI0EL1+lDZtQRtX5dpsxNhIOuMIEpSlNb4nmPjAw12I+W6LlE3YmFunqXZGb559DD/h3/y57z47DPs2bYdPRCMe8CNhzP85K3f8Ne/+AW3Hz1k044dOGFAo9lAa03o+2ZeUxlpoo3UtM2ix0liaib8kNTsZnEs5z/p1Hl47z7HJid54TuvNE7+2feunXs4NK/+p3MB99sONe/p7pza/q8Zw3+5A/754ae+9MvQvpwBuRBQKcPlNlz4n0h/+h+I3n4PXSxCtQqVinndegGalJCmMHNfJQv3BPMPaA2Xl5xS4dT2ysiFRw/ntrSu3cCv1gixC54ZKfiujyMdu7NUCOMQjdTC7ibz4khJs9UmdF3GN0wz++gRl2/f4d/95V+RSfhH33uFqSDExwy4QAoOb9tK8Qc/ICwU+eWbv+HC9WvM3r9Pcahm5PdKBZIk7SGxUgs8WxwHpmgnS1MyZQJzx/WQrklB9QpaTafw5PRhB2L+/FMC2/y1gwi1spNKjgzYjh9Y6NaZ9UQf3Vj9HfpHBdZMhmLVGXxiyyktn/a6p7xoPTnCAVb74Nn1C2oG0Eo18K7+Qe1NNLjUD9AKPgvyZoJts2AmKrNGVaYQVWXaooURCPA9n2KxiNSCpNNleXaWrNth88QEzx0/wj969VVeOHqEzdUaAkhSw9VzJBTCgChTLEQx5y5f5VfvvMOZ8+eZrzeYmJ4mLFfQwkySAJ7n2dvGsvNlnlJec321RXA/4RxXXXPxGa71E702GMbnqBu97MHg1VuVaclRJPq21SrNSNFIR+IXQhzfI2tqZufnmbuwzPxKnShOmFlZ4dihg2yq1TCJXxOQx6nCAYZ9n+HRMTZWa+yenmbPtq18eOki569c5+b9h7STmPrSPAvzGa7vUygWKBSKhMWidVRVJKlx13MdoyGcWidUo+uMzb47ZhHLNz+Z4dK6jrsuODF4R+Z/SCEsvSxDC6MkJB2Jq43qUBD41otBGVUkIXBEgZXGMo8fP+w5vg6XS2wbH2fnpk0c2LWTl545zuE9u5mo1fCtRGi32yFJEoIgpFwokAGdJOHqzAxX797l1795izdPvcP9R4+QQcDExo1oJElqdexty5F6NXC/5TJ/T5vK8nMfbGto1v3b6Qtq2gZSUjpG/SLLzMbIbjAyrUhTE+T6hRCpNbcfPaLZfItKbYhqpcKODZMUfYmTCnSqySR4jmSiOsRodYhtGzay8HgBKVxW2h0W6g0aK8YELyiVCApG1tQYCdmCa89DqDxrmSO+CqXAESCQlv9uNhSmaNdye1W2zm7myU4cnC+fbLL/jk/p//zpHu+8d0QbeA5QrPodzxM3xtpv0XPX/Iw7sCdWVLH2+X7rB9j9cPvTc1lPHrufFxv8e+DzckzSovMme2DmQccVSOX0TOqMSlL/MxzXKrrY5zzPw/c9JJBEEa16nTSJERomhmoc3LKJf/rDH/Cf/fEfM1Iu4TsOKQYz7WYZDxp1fnnmDD957XU+unKZRAgmR8aIlQEbpXQGlLc0WmU2G2Kua5Zp87t0ybLEAIOeQ6fbptts4HkuG4dGV7aMTJx8a2zkTnbPgWtRwo02jPbNodZtmYaZCF5MPvM1+LtqX96AvFaDd07Bv/u/0FUZXYBGA2ZnP8sRNJAw+za8+Tbpf/lP0X/2Zw+6neSvvVJpYrhae1anKZ1226ROMrPjL5WKCG0KGQX0ZgPX80AIulEXgcQPAuqNJrHrMjk2xqatW1hcnOfM++/jhS5jYyN848BBNpdKZGij/gHs37KZyj/6UzZunObHf/sTXj/1Dq2lpR4n02h8GD6eENIsxNZyVyujw53ZSd0VRkowzTKUWGde00/9g8+7Cul1fvssb3h68eKaKHXN47/7Gvm077l2mzLwDfXqx9ceZQD7eeI46x37aW3tujHYpGPoQKYYMEU6Csd18XwflRkTjjg2qVnf9Qh8j6wTE7dadFfqbJ3eyPdf/iZ/9qMf8sK+PUggSmKyNKEQhEjpkCmN70iWo4hLt+/wxqnTvPfRR3TSlOroCH4hJFNZTx2gF9QO7CjWzVQMcBLXbetdkk9Fp57y3Jqnn7xaTx5m8F5cLddoXpYpbYqkiiUqw4qo3WZ2aYFf/OZNrly/zo9efZXvfetbVItFhouhKfrMFJFWKGEQPM/z2DW9iU0bN3Ds2FGu3LzN2Q/Pc/XGDT68eIF7Mw+Jul1crSn6Aa6xTTAp7jQxxdaOm1dBG4QVkPQlQqXdoCtbxK2VRjv07LHXb/0NjOkWK92pFa508H0H4QLKgABaKXSSkJIgHMdkFKKY7tIyfqnE5slt7N2xg6OHDnL80CG2b5pmqlLpARCZnUMbzQZpluEGIR7QjCKu3LnDG6dPc+bDDzl/5Srz9RVkoUhtbIxCpUqnG5El3VWbqfVOTK8HBPw27Xd576e03inYTaMcoHuY53sRFZk2QV+iBXNLS/zm3VMMVSvoF15i1/QkRVcSRwpyR1xbSCmV4k//+I/Zsm0Hr588yWtvv82dhw9RKqNQLFAMQxKlaKk2iTIFlkI4JiDVymy+pLRjQqFSM+Z7mVEEvm/Q0m53wDr9s/fC+g9/yhBf/6F1gJTP+FXWvkw8dQ36bO//vM8/7RX9e+HJxz7jgc3+w3LITYFvrrgmUELb4uecHmfuu5zqKqTAEw6OtNOOnYuiZoMkihgbHeWlZ5/lu994ie888wyTQ0M0Gyt0iShUqgA8WFrmjdPv8rPX3+DKzRvgeVSrVXtfZeTqaTlavd4mqDcWdO7xYei7y8vLqHabXVu2UNu67codL/iLhpb3cBIoNRWVOpTXoS4PtkzDSARuHZpNKJcHP7i3KfgytC9nQP77aT2IRcgCsT+0Mq/in3njk0e2TW949t78Ap1Gg8LoKChBiknT6MwU3QwyYnK1hSROCANjjqOzjKQbsbi8TCHwKZTLlLotrt+8xf/64x9TQDDx3HO4mEI3ZfmeU0M1Xj5xHNeRlMtlzl++xM0H97nfajI6Pk61UjEqBmlGlMSortkEeK5HEBYoCmkd0hI6cYy0Ve56baDyGe+vwZ3/J6MFX+DK9QduPdRlAKJdt7v0k09oWC0vpp98vrcOr3PQ1VsOE26ZhwTd2Ej4BWFAMQyNMki3S7PVwnEcCmFItVZFo4m7HZYWHrM0M0dJ+jxz4CCvfufbfPP5ExzYuoUQSC1y7Dhuj0KSYuoj7s/P8/a7Zzj57mnu3L+PDEOKlQqu7xk5yMQUFjmyX8T6B5Vz/ALbINqmUD2NZMczUplgFIySKGJ+ecU4CP5Nl3v373F4336+efQw2yfG8QOXBNMvnThGK00p8ClIh+mhMYYOltg6uYH7s8d58fiznL9ymdv37nLz7m1mbt+h2ekgXY9StcbI6DjlWtUoOVjakjIFLkhp6EIqy6x6mbbGS4amk6Nk9uz6iLj506qQiB4NTljpSi0FrnQIXBcVp0RxRDuKaLeaNFZWSOMIqTWOEGyZ2sBLL3+HqbEx9u7axa5dO9ixeRNTI8OUPA8P61KYWQdbNJXhEYTjoBBcnZ3lvY8/5uwHH3L2/MfMLCzQjGLCag0n8MH1qLfbqEybdMDXoa1B5Ndel97LRE5ngGKlTNbtcuXmDQpv+LhA+eVvsHvDFF7gkMQJnSjBDzwcKakUitTKDu6BfTZwdjh55gx3Zx4xc/8uYblCqValUCwS+B7tdodGcwXXMbK3SIHn+PjC0M2iKCJJMnzPJ/QDpJTGkr3VNtxly0Nfc5qrzmm9/OOnPfIk9v31aGKd3wbb6uD7yfNfvaQ/uRgJ+7hwrCtnqkAYkEDaDJjxDrCrjWPqzOIkIkpiyqUSxUIIKqO1Uqe5vEwWRxQ9jx1bt3Lk0CG+961v8czBA2wYGkIDXljEcxwcYK7d4sxHH/HLN17n/Y8+pBlFVEdHKZTLdLpdMm0dfe0X7heS52c3sGJaap0rBJ4QOErRrjcIk5RjmzeRfOcbN398/JlfzMjyDCtn4eH/AI9vQ3vkky+CBpIM/g1wZTP83/6v8M1vA+BKQTAxgfR9dKY+8TB/iPZ1Dsg1I8Pw/As8fvWP+PDI0biTpje2VEsfHY7a7WajXrxfb0KthiMkWgpDVRlQyNBgK6ANCp1L32VZhh8EhgoQxwgBQeAyNjbO4sIcb586xXCpRDkM2bt9BxPlEo4QtDOFJwUbq1W+//zzjA2PcPaD7fz6N7/hwrWrtBcXSaIuQbFojGs8j1gnZJkR85eOYwo/rYRUplff2p+Evq4bXT7RxJqf+fv+7m/Ur2cbVOIWCBy7WTdV+hpjvqGFcZZ1HGkdKTO6rTbN5RVqhZATBw7yj/7oj/j+N7/BhvERXIxEVx5QC+GQKZCOkX+7cvceP3vjTV4/9Q6Xb92km2WMlIYplItk2aDrorVozouwVgOtX90mACEQWiA1ZNpo82vA811DKymXcVyXNOoSpSnvXzzPvfv3uHH7Jo12ixeeeYbx4RrDxSKhlDhCEglFJASpHTLDQZHRTUX2bdrEs/v3cvPoYW7fvcsHFy5w8epV7j58yPzKCpkQxO0mSRzRiWJwHfwwtMVNDr7r9WofTG2CSUP7vo/jOCRJaoP3Tx/fmpxDampjoqSLkoKk1SFqd8yCLSUjpSKFsWFqlTKVsMA3jh3n2yeeY3xomMnxUUZGhilYL4dEaSKt0UKghEB4xnkvVpq5xWUePJ7l7TNnOfnuu1y5cYP5lTpeoUChWiEsl9FSEiUJnXbXmE5Z7vrfl5aHJQhNaagKSZFH9+5x7uOPUFlKWCwSvvJtxosFXM+lqxRxkuK5Dr7jIoGpaoXy4cMM12pMb5ji5JkznPnoQxaWFuh2mgyNjlEolQh8B6UMLQoUUZyaLJxnio9d1zPKYrZw2JGCxBqyOI6HQH4u+sU/tM/W1iN3flIvr9roWURcYYo5jcC/RvcK0PpHVDpDKEOFC3yPQuDjak271WJlfo6002FsqMaJI0d48cQJjhw4wL6t2xgrlRBAS2kKnjH0mmm1OHnuPf7657/kzAcfsdxsUhsdpVKroaSkU68beq3nfabxnC8xoeci0MSdDqQpQ+VytnnDppUb27e/f2fD+AMA4mVofQQsQvP2px4bgFngbz6C/fvBDWBpiZVOl5n6MtNpHX/IIP5/l1PP1zkghxdfgn/1r7gzOsodzH1aDsSNgw/vvTV+69YLj+uNobjbNRa+jiSJY7Po2ZRxXjmdKYWwhitZllFvNiiEIcVSERX4xFGXTrdLsVykUqvRWlnm5JkzBK7HP/rBD3n2wAFKnkucpLSzDN9xKYUBx/fuZmJslOHhISqv/Zq3332XR3OPmZzeRGVoiLBQpBCERFFijAfaHSIR4XvGGc/1XZIsNdxKwUBR5dM65JOH+HrP9hHdr98kvArNXu958eTja1Hv9fpc9/4YILrowb7sPdp/j1Km+Ms1vLlOt4MjJcVCSOD7oDWdVpvl+XlUmiCVYrhU5KWjx/nH3/8+Lx0/ypaRYRIg6kSgNMVCYDSCLYIrnYBWknHyzFl++utf8WhhAeF51Go1SpUKQgjiKDZ0mZ5JQ54xkp8zVf3lbBZgRmALlbVAZJokS0izBJV5uFYRJSwUkIUCUhvpuaVmk48uXaLRanHz9i0OHzzIicOH2Dw+TmD5lxrodGOSbkzJDykELsKBWjHk0M4d7N+5g+effZY7jx5x++49PrxwgSvXr3Px6lUePnxEBvjFIoVK2YAAQYCUJYQtuMudCVWa9QCCOEnRa1muOVHe/NHHooQJ5lViClrjdhtfQ9JuQ5oxNFRj8/RGNm3cyNatW9ixfRvT4+Psm97MppERPMt/1kLQTdJeUZjjufi+h2tpGRlwe+YR77z/PpevXePs+x9y8949oiQlrFQp1mr4YYgWxkQpS9UAhePr1Qang7XYYP8pk+F0PB8/DKmNjtBcWODSjWsUX/sVYeDxnZdeZHO5hB/4xHFMlKRopDU0g5LncHjXDoaHhxgZGUI6gvfPf8T9uccsJDFDI6MMjYxSHhkmSVOazTZRHKE6bXzfp1Ao4vs+rusaJZso6gXmhTDsmcx9SbL7X6m2FuJ6Yr15GmVlvbbOm83YljgDZhpGeqGvVKO10cBPlKJUDCkXK6gsZWV5mcbyMmm7xeTIMEcswPPySy8xWq7g2I9sZxmJ1gTSZbHV4oNLl/nl629w5oP3aScJoxNTDI2NoqSg2+kaZ1/5ZDH1YJpoMCcgbMLY93yS2PDYq2HA1MaNS3Ft+D+0PP9N+oIuv13TGv7Fv4B/+S9BaxYaTbobJhn6r/8L3NrQb33Y31f7egfkUQYzTVQcwqNHgGBlpPTh8nde/tdTzcbE8vLK8YfLyxSqVcq1mkEGlcJxXKR0zR2ilOVuWnQ8zazbZYJv+b2Zyuh0EhqtFq7jUB4eZubxY147dRolXRAOzx05SCE0yggqVThaMxT4FDZOMVR5manREcaGhjj1/ge0k5ilx4/RrkupXKFQqhDWQuIkIerGJGmCQhnJrxy6XAOArx9e563/4lVFIwLWzrar/vqqx+Tr0E9W/7L6tasCct1/bPAAT6en9JfaJwLxATWXHmtGGDthnaaoTOO7PkHgEQY+WZJSX1pieWEBMsXk2ChH9u/n4N69fPPYMY7t3s1YuQSAkyl8SwjUyhQEIgTCD7j5cJb3zn/Ma++c5Mbdu2jXwy8UKRSNnGgURbZoVJigVEpjtJFlOI6RG/s6oGOmwCnDzRUcsFrhSpOmVgbMsiakMPq61fExkm6XVrPJh5cvc/fBQ85fucLN27c5duAg+/fsZXpsmCIQBB6R6+BqaUSP7BwS2nqQ8lCNiVqVPZun2bd9G/cfznDz/gNuPbjPg8ezNLpdUgEPZmepd9pW8cfKcmpjcpQkhg/suY7lXA4m/PPR/2TGy9A4TWo4cFyGh4eZGhqm6pvCy4mJMXbv2sm2LVuYmhhnfKhGrVSm6ji4gE5SY0ICCCkpBD5aSnxLm5nvdrm/tMTj+XneeOcUvzn9LosrKyzVG2TSoTxaIyiVENKhGyfGkRBj8hUEvilQz54umvCVaQMByHp5xyebmQta7TaRI6mMDOO6Dq3FRc588D5oTZql/NELz7NpeBgnCIjstTBOyAIyRdF12D48ROnEc9TKJXbt3Mbpc+e4cvMm3XqduW5EsVrBC0MKYUAQ+HSjmDiJaXfbBH5I4AdopUmTiDjNKPgBvu8TpynojE9bXT6trdcPX/1Z5fffPtu+x3oE5FQQkYOJeRBsFikjGGAysFIYe6LWygorS4vEzSZF3+fA/gN88/kTPHf0KM8dPMSGcsWwALQmSVMCa+I1F8WcOn+Bn//6Nd46c4a5lRXGpiYp14ZRQrBcr5NmikKp1KMDPp2wsxoSk9oEpd2oS3N5maMbN3LgxDPNey888+v7m7Z+WH64HLR+9ZOu/tf/M7RaOVPu800Y3a75Z1u0sMiVn/yKruuC4xBUK/jlMjKOcbtdZLttsop/ALDgSxiQu0AX1E0I7sAo0MFoSX7WpoEm0LoBf/UvjDJLsynptr37f/znMx+88OrPDz148Ge7Ll48fvfiRaKOS7VWM/w4ZRBx1zMBSJqmhoMlTDAORnVCKUU3isE3N7yQkm4UUSwWKJeruI0W9+cX+OXbbyMdDyEk+7ZtZrJSRnmmuE5lRslgc6XK5HMnmBgaYvu2bXx8+RLvnb/Aw7l5SDM86VCoDuOFptCh3TXWvVIp43wmrZXx72VWW53mWofy+JVvA1uQfqHLus8PPPa5OuDzXwiBkcPLVGYcNwMP1xEk7S6tep32yjIFKdk8vYljhw7xR6+8wrOHDrJteMjwd62UntDg+laL2GYvG3HM43qL1955h7/82U+49eAByvPwCwW8sIBwjDZ3HMfW8dOzakPG6Gk12vrVbrm8WqYUMst6qgSe45LJ3AAns+oNdpGQgiGbRcB1WHw8x92ZGR7NzXH/0QwXrlzj2aPHefbIEbZumGBiuIbvOHhCgNIksS2Wk/Q2OqEQFMsVNuyp8Oye3XQ1zCytcOPubR7MzzOztMyvT77NxevXkfb7aq1RMtc7NnKCxqbcqBd8lrtOYvTZM51R9H32b9/OS0eOsXPjNNVCgeGRITZOjjNWKeML0ZMVzDJFGsekkeHKS9clKIQIR9LNMlpZxmK9zoUbNznz8cfcunuXcx9+xN0HD/HCkHKtRq1aM4u0ELQ7HbrdiMQi/b4n8aRjVB/42txun7nl8njtbgehNcWJCYbHxhBoZh/c5533z5KkMVJIvvetbzFaKuB5LkmU9GQhkyhGZQ5e4LNpqMboiefYtX0bO7du5c13TnL5+g1u3bvP0kyLUrVGbWSUYrGI63k0W9DpGJM6R1ptd1spnKmMVCtDn/sMV+bJV/xDuP1pffC73u95jVovGs+PK0BKx2Q6hBn/joBus0mrUUdHMZsmJti7fTvfffllvvPCC+yYnKTgeVZEwqwJWjgoIZhvNHjv8lX+6pe/4u2T7zC3uEi5WqM8PIJwHZbrDRqtFp4f4IchaZKQdbufLbsqzIqcxhFZp4urFNsnJpnav//hX+/ffWXWFZ0tH1wauf///B/S+um3UkywqPm8AfmalsYxDz48D54H4+N0l5ZYvHuXLEloLy+Trqz0dOK/6PYlDMhroO9C5/8Mm2fgP1cmqvi8dT4ZULwH0b+BRQeSSNNZTue7U1wQr2YHKqPnxmu1Y57j7FBp4qosMyl6EpIkJTdSkNIh01ZkX2scxyUMXdI0MVSVThvPdQd0ehWNVotCpYoXBKy027x+8jd0W01+9OqrvHz8KMOBD46gG6fEURflebiex5F9e6kND7Nj2zbK5Spvv/suc0vLLMw+Ju5GFMolw2/1fTpExjUPn9W1+5+15cPXYDiDqaPVr/osU/BXpT15ln2JqfVf3Xt8vU741G5f/Xk5HrAq+O+9X+G5DqHr4Xs+Okvp1BssWl5fpVjkyL79fOuFF3ju2RMc2rObqm8QC1P78GT1unCgo+D+3CIfXL7Mr956k9MfvE+hUmVkctJoW2t6mSGtNb7nIx1TOKwzg2z0ZA+/BgurBqNcZJUk0izrKQy4PZdeo7GuURZ0Eqw0mkghcPyA8elpsiim22ozt7zMyrmz3LhxiwsXLnLkwH5OHDvOrq1bmCyH+FIQhG4vqE1SRZoZaVPP9fA8o3BQELBxuMJwaR+74oTrDx9x8eoVrly7ZgJybVQUBMYh1ZWO5QEbExYjxpnfXavu8N6NbGIsSRontDotCiNDbNu0mW+9+CIHtmxGx108z8V3XRwhiLWxuI+7XQquRzksEAZWS8XKDnbSlJnFZS7dvMX5K5e5cPUqH1+5wuzCAkoIJjZuRDgeju+jpUO7G5EpRZqmeL6HHwSmhkdpup1ub4P0dQrinjaHrMqcabNR9FwPgGa7TcH3KFQqjExMENWbfHz5MqEfoFTGN048x87xUfzAM1FJpkCZTXScxOB6uK7LptFxKt/4FlMTE5w6c5ZfvvEGl6/foLW8hFIZYamMHxYJPN+CAsoE5dZYx5EOaZIQdVp4nodwHGvQ8+QJrp5/nn79chDks3XaV7npdX4z7Qmq5NPO92nrTu9tludhZZlzF1UTiEscx8V1JFJrVGpkc1US0200cLRmz46dvPzCCxw/fJjD+3azcXSEUDqkWUY3joyBnOfhOh4z7TbvX7zMz994k3fOnGWhXqcyPMzQ6CixUnTqbdqdLn5YwA8C40A+6CS+bu/Y/wtrUJgpolaESFNGqxUKxeJ7TeH8+weOt6gXl72JqxfChfpKuw4Jxvbn91fglqYwN8fDU6eYe99mpdKU9A+YsfsSBuQukEB6FcoNqPLbUZglEEXQnjWXTqFJyIiWaEF7ft/uv9nw4rMbdi8u/p8eP5pxO60mYaWM57tkWlkHLLMYCyWMdbhv3K7SNDHyT440i7iAVGW4notSkGqN6/m4rofSkrszs3Rab6NQeA48e2A/46UygecSaaP3SpYROg47NkwxXKuxcXyc3Vu38OHFK3x46RKPFxdot5oEpSJhqUSpGKK0IEoSkxL6LXdvg127epJYl+n2NWlrApYnHvu0tn5ff9KR1p+QBx9VBH6I7zo06nWWF+aJ220KnsvBfXs5cuAg33ruOY7s3cu2iQnKvkeqNTpJQCujEywk2YDGegpcuneXn7/5Fm+fPcN7Fy9AEOBXyjhBgM4yVGImHK20RSo9NJAq83iug56lGTr7emCXrusghHH40yojy0xBYs/tVZiNqsC611k6UYoZ477rErgmyGzXm7QbDW49vM9ifYUb9+7x0aUr7N2xnRNHDrB/13aKYUgtDPEdwwMXqTSKKaIfQksNBS0pBgHVIKBeG8ZTkHS6FIolPGmVmjKTCsu/p9Z9Xfy1V2Z9aoC5PxxbCFbyfaaGKoy6AtwCcZoZSooNuB1h5Bxdx+25AKZomnHM46VlLt+4yaVr1zj38cdcv32bheUVmt0uWjqUKmXCUqUnxaaU0bbPMqNB7LoOrmM1urW5v7SV/vw6TT3rzTZr/9aYgLYYhmgB9ZVl2lIwVK1SGx2j7Xoszs7yznvvmQLYKEF+8xtsGRsxCkpS4HouQikUpp+l41B2XWrlCtUDh5ioDTM5Ns7Z9z/gys2b3H30iJXWHHg+pWqNcqWC8gSdyIA9OA6+5xvUIkvRuXHMp6QTn5zb8pc+nbiwXt983donn+dTeJOfdDyxOqDXtn4DIXBcB9cxPgI6M+6wKopQcUza7TI1NMKRffv4xnPP8q3nTrBxwxRVz7X1RglZluJISej7CCFpasXpjz7mP/ztTznz4Yc8ePyYUqVCbXQMv1BgcXmRdreL53nUqjW0hkajjiMEnjUaXK8JBs29zPl2W03GgoC9O3YQPPvM6dt7dv9Fw3Xna80GxZWltpvEeYScPqXjfrumNSSGRhd/+qu/kPYlDMhtE5jujn7H40j6Th4OoFIy6F6pFC/4z584fejBzH99vtEsXF5cRPoeXqFod3cJOk3xXK+nauA6LmkaE3W7RrM4CPA8jziJiSKD/JhdqUeqjCFEZXiYLE1Yaqxw8t13CVyXTCmO79vHdK1GEARkmSmgqccJnucyVioxtX8fe7ds4dy+q0y8Ncapc2e5PztLp9XEdSRh4OMFntkcrLqdbfd9Do6FyLHb3lu+zsE4fJ5zWxdBH+CH9l6X/z3wQj24SVqz8uYLcG/x0hqylDRLaC4tETcbVItFjh7Yzw+/9z1eeu459m3bSogZtGlmkCypNZ7rIKQRo1aZInEkbaWYWanz+pl3+Ytf/IyL168hw5Ade/eSZIpOFJuFPNNIjL6161jeuEXLc2573gmDjL+vbNPaKBXlTqixUVbKwFpI9y+UCXoNau55nkEf44QkTvA9jzAIGJkskg0P02k2aTeaXLt7h0tXr/J2tcLF68d58cQzbJyYYM+u3WyamsJF47vCmK1g+1NBFisyDX5BmsLcZovG4hLtRoOh0VFc1zMGL1mK1qboNk2NZXQeKK93fQbZ5GZUa1zPoSBC0BnNeoPlhQaMDKPQNFttkiyjWCrg+x6h46E8jwRYSFO6KuPx4iL37z/k4uXLvPfhh1y/dYs7Dx8RpSlBWGB4YoJKbYjU3meOMC6+SlkdbYx6h9TaBOFaI7TClX0Jx6/87LPOvLGeeoPAzAN54ZvveAbgiVPiJMbzPEaGhqiNjJClGfXFRT66fBmljRfBd156iQ2jNQIhkI7Ac6TRgY8i4iwF30NJh7IfcHT7DrZt2sTxQ4d48+Qpfv2bt7l9/x5zKyu0NRT8AK9YxPM8dGS0q5Wr8cIAR3nEaUKmslVc2rUZv8/aNYNZw6ehx1/5JtZfN9a85BPa6nGw9u39YLxvjuY4Do4jDegApHGXuN1GxTGh41Kr1QhGhnnh2HF+8Mp3eWbfbsarZRQQxSmdbkKWJQSBhxeESGC22eDCjRv87a9+xZsnT7LS6VCsVBgZG8MvhkRJTCeK0ELghyF+GBJHkTE5dFyT9dH9K77q2g/EHGYsaNI4Zmh4hAN79q7MPPvs5YvTG25H4HhJqjPfXxa+n7/payf/9gcPyEXcxWkuI+MYEUvITOcKx8N1M+TyIszNw3IMFaD7ycf7zC0D2uZ4CrgEVPzyne+PDJ/yVPrtpfm5UlAsEJQNct1ut0mSFL8SEAYeWZbSbrcACIOw56jY6aRGkSEs9KyGtVLgOGgB3SSmUC4ReJL5lRXeOPUOrVaTOI753gsvMOR5BI6LDoTRhcXI2rmuw3Ah5Nl9exgZHWb/gX2c/eB93n3/fe7PznD/wT38QpGJqSkKYZHE8knz1GeuJJFrLq+eGJ6MKFdPDH1PMPGUV3yVm+jtywfCmIENzNrCTRgIzHX+oOgdKX9dTu9ZzeddPY3m/Tro2GcKbRxm7t1l6fFjJibG+fZLL/HM4cOcOHKEg7t2MF4bIoSeg57UmtDzDc1TQGI3g77rkACX793l56+9zs/eeIPr9+4SDtWM8UqSEEWJoQxYBz7Hcp11pkh1AkIghYMjhVmUVWzwYiHXjyq+Sk0YeVNlFQekkEZf2aZMc2c7O5RMkaEQvXy84ziG56iMNbkrpXHVLRQouy5ZkpLFMWmW8ZuzZzh/+SLTU5Ps37OH44ePsHP7DnZNTzNSCOnhRhJcT/QCdBfwpSRNUrqdLipJ8cICWF6/Rvc4/nqtM+oAZLbqcRscKDu2tYA4imm323S7XQwhU1AqFqzNtZ2L7NsXm02u3LnDjTt3+PD8ea5dv8GDh4+MlrrjUBkZYcgLEK6DdFza3Yg0zYz1OsI6Qpr0tZQS1zGaNDoz86UQAteVPRrV17KJdadehM5Jh4Ko0wUBtUqV1MrwLtdXCD2fqt2YtVdW+PDCRbIkY3FpkT995dsc3LzJaOJj5nzP83DtPCG1zr2mGPF89m/bzkh1mO3btvPBhQv85t13uXD1Gndv3qRQrRo/jHIepMXEUWTQWEubyjfqBoD4bS5Wf4M/SF/J1yx6z37V2+p1oL+GCPusefwT3v6pj5s+VKDN/Ow6Ej/wQSs6zSYLj2dpraxQcF3279rNKy+9xLOHD3B4zx7GakMMlwqgIYkzJIJywSfVLoEFDGbrdX5+8m3+4m//lvcuXSEFRsfH8YtFtJTUG00ybQo48yz90tISaE2xWEBo8QTFqYeKD2xaldZ4joPrOug4ItPZnaxa+V9vDA29cS9N2X/61Oj0lWtJ4GZLB//xn1KaGuPG22+TRr8rYvvlan+wgDzfSacbt9N5/o+R3S5JNwNlvkIqHRpOQDfcBge2wba7MFKHxPv9fAGVQtyEnUd6E8FctXqrcfjwvxm/fbu2pVH/xnK9gRsUGJuYxJEOkUqMDKKdzLLUqE24boBGkcYpSZriCbMjBeuupy2fVxlFh9DzcTwPrTQzi8v8+uQ7NDpt2t0OLx45yo7JSULHAcchyQy/MhbgOQ5jpSJjpa1s3zTNrq1b2LRhAx9eOM+Fq1eZXVykubRE22viej6e6+N7nlVfMba4Wilb8GGQTuO6nXNldT/AtGYj+cWSPejjqzdF5hPDE0Y2T5zA+klE0ftpLrzC9I2ptO4XM/TMcjQ9WcB8kdIDr7Ev6JnsCK3IbGpMqwypNa6QVEKf6b27ee6Z4/zw+9/n2MGDbB0exscki9Isg9wcRppi3lyvXEiXGJhvNrl06wZ/89prvPb2SW49eIBXKDA0Oo7r+7RaLbLU2hYrjbCa9mhl5bHMY0KYQqBUmfoJU+j19diUaTtG0cY9Mdf1FxqUUAP3je7dIloD0ui6G1UDa0dulVp8xzXcf60R2hg3zTy4z6P5xzxanOfWgwecv3qdLZs2sW/PbnZs2czkyBiT1RqVwGeoVCKwQXCioBtHtLttkjRBusbWXqWpzapIpNWDXgsRiYGf645XbeUepUOr2WSlvkKaJUY7XUDguXTTlIfLSyy328wuLvF4cYHrd+9x7c4d7j54yI1bt5ibmyOKY0qVKsMjI1SGR/B836Di3Yg4ilFaIRwHdIZG9JxRjfKPceTTKCMTKswYorfh/fvXBJAmJutRKBbREtrdtlE+0oJCoUSxWiNNUpYXFnnvwnnqzQZpmtF55RXGR0cYr5QI7dqhhCBLDV9zMJAe8jyGJsfZNDzEvh072LZpM2+dPs3l6zd4tDBPe3mZqN3G8X0Q4Hge0nFItSC1gJNW5s6TiN5mtpeV1bo3hsQakyc98O/vVxvoB6F72dSn9oOgv56Qr9V9d2FsrYUjzWwgpEAi0ElMs9Ug6rTRaUo18Nm1by9bN2zguWPH+faJExzZvpVKwahkpBm044wkTgkCh8Bz8XFopBk3ZmY5/d5Z/vpnP+HU2XO0M8XEpi2UajWE49DudulGXRCCog3I49gwCBwpKReLhtduOdg5zJefl0b33KB936fbbqHabTaNj7Nx585rC9XKf7gXBh/Hna6z9fIVNty5TX1igqmXnkcLuH369D8E5L9tE5hbMt5ymMahH/Uey1sCPAb0S/kjGV/MsO0PjJVSafbKsWd+eSCKf1Botb/x4zfeZH5uljGrK5xmmXHFjA1P188XzCQBoXtazeax2JyjMK5Z2NSrMe5IyIRmZHyCYrHI4twsb5x8h1ajQRTHBN/4BluGR0jsQu95rnFHtD2QAQXX5ciePUxOjPPs8WNcuHKFN0+e5K1Tp1haWWFkYgJZLiMDF99zAIc0zYjBOlDlqK6DdExQgUXbcnRX2QEvpQk8jUPjIFb+ZCp5LXc9nzTWViU/zeXxd61c7k/8A1j+OsfMA7AcJ1yLIK5ml9jdSH4OWpOoBCmF3XiZfjHosdnMSKmRVlZK67y/+5OOK8B1DS1EZxlpt0231SBLEjxpAqRvPHeCP/mjV9m/Zw9bJqcoOA6p0sRZik4TfMcxmuQIVJaRJDGJAFyXonCYa7c5e/kS/+Ev/5LXTr5NVymqoyOUh4ZJtaYTdUFIXNfI70ktzIYNO8dLYzykMQE6wjp1IvndrtKXqPX2nKI3ASmlepvRvDAt52j33mJB8nw8GM1f+7xVPElIyaF1ISVTWzbhORJPStqNJh9cusjbZ9+lVq2we8d2dm3dzpE9e9ixYZpj+/exeXwcwMieNus0ux1A9E3Ioth8c2muG1qZAH0gpdPH5Abg2MHTFxrpuLjSpb60QKPTRDvCZvMyip7Dw5VlTn/wPvdmHnHt5m0+PH+euzOzZNLB8QOCQoHpbTtwHNdsWAV0kti4ldrzd1wHR6xZXkxOGo3u1zrI/rfObOBuBtFvcW2/TG0ACR/MuPV+X3N+tmvwHBeEIE0StNC40kH6JiPbbLVwgKBYYNybJO1GzMzP85c/+ynziwv84NXvU9q/H98We6fa6IZLNELYQFpjuMauS+B77Nw4xeT4qxw8cIAPzp/np7/+Ne9+8D6PHjwgKBWZ3DBFsVLCcT26cYyOY1JbDI3WOEIiXNcAFUIbZU5t0e6BNcCsZWbs9Odie+bajDWRZxhzmtxgEDrYV58y13/RbfD7DP7+xPda9d3WrJP2odUZV9OMTKCwYIFZd1Wme2Cfxho3OQ4uBgx0MNnLVrvJwqOHdFpNJsbGePbos/zxK9/l0L59bNuwgVoY4DuyDxjZ4n0NZKLP7L318AF//ctf86u33uDG3TuMbpxmxPVQOHS7hp6i0IbeBMRJkncIYT5fWbdn88+6PaMHrq91SHYdCoUC8zMzNOfn1Le+853O3hPP3blSqTRWtFZISVwuzyWlMloIomaLuNl8akzxVW5/kIBcAjGGMdL69WvghpDE6LTPyTcDFfAkuB6k1lbw96PlRx5gEbcgqsPKMo1vvayv/1f/1ePd09M3N46NRrVSMZjvRHSsVXnoB2RZhsIMDCllL8DqsxbMjYbOAznzMY4wN32qUsOdlIJW1MX1fUYmp1ice8z56zdo/i//C/Pz8/zj77/KLis3pDDKCUpn1oXLoSAdSkJQHh5hvFpl68aNTE9NsX3bVi5cucLc4iKP5+Z4MD+P6wUUS2XK1SoFP0T7gihNiePUDBIr7wbG/dFxHBxpUlRoTb4VUFlGmiY2iPPMuao+gihswJ5PvPm/tQNlvUl11ZX5HSbV9SbE9SbM3nemP0EIkb9n9eSZTxxa9akL0ipapGmGtG6pnuegHYMAqDQjVYlB0aWRydRC4TpuT5YsTRIaKyu0mg3iTpvQddm8cSNHDxxk944dvHDsKPt37KBcLOIhECozXp6OQx4/ZpZzqwBcl5LjEKUpV+ZmeOPsWV47eZKT587xuN5gaGyMQrWGGwQknchI7wmLCmMdH1mdNl51XRjQ7/naTH7rZUVWbzTF2qcH3tZbSwaOZO6RgdJKYZBD1/URriTVisxzUUEAaUo9jrly7y53Hz3k9u1bHNm9h3KlzPj4OB6QZBntqEucJSA1Wko0pihSOn2DpkE0fL3zzOej1V4DBmFLtaLearLSaJiCdCAVguU048xHH/P/+4u/4N7sDO04YbHeoJmkaAcKvqTghbhhgOM4JquSZiiVmY2oHvz8/NvlndfvNT1wHZ4So36l23qh2OD5DQbmYvD1NkDTSpvsV75h0TZDJiWO65k5SGuiTpfbjx6Rnj5FJ4lZXFri+N49bBsbI/RcQ2PRCqUypM3kISVZkiKEoOSZOaSyfQsbh4fYMDHOoQP7uXjtGjfv3KHZbnL7ylWUlAyPjREWi0jHJfSDvtymsmoUqV3rhMSRDkIYJSPTCRbgYO183z97YchNPZWdT7of1gOCPk/7XdacwTXuaZuDXtCp9MD82o8Pehdcmce1BfByEM8APhlpmgMjjlU7MYXhWpv1Ga3pNltE7Tadeh0HzdTIMPtfeoETx45x7MABDu/ezWStRsmaKygNWap7WQ4/dPGkwJWwlCRcvXOPn7/xBm+cPMn1u/eJtKDoBziej0qNAIDS2gqa22y7PZYQwmRY84BuEB+wDxkMy9DtXM/4u7RbLXSaUiuXs5Fq9Vxlw9Sb7vj4A/8nf0v8819w8f59fa/ZJPU83CCgPjNDFv9dlV5+ce0PFpCnwAqQvf4avP7aH+JjP7VFM4+5/5//U3e2Wv6wWqv+ctvWrd/K7j6orSwuUa4NEYYBrVYbhUE/B4O6/oRqF541q7RJbSviJLEUAEmz2aJUKjIyMkJYLDB77x7vnHuPer1OmmW8+vLLHNq9B0crg1Qqw/9TwoRGQhpkc8hxqY2MMvniSzxz8CDnr13lzPvv8/6HH3Dl2jXD3+y0iK2rn3Bd0OA6ZpIw+tJ2AGkwlu1iMKlmx5JAa6Nf2gsCBoLe9SbBXKnC6DmvTqg/Den4fex0n3aMdR8XMt9L9Tn29mU5gqO0spOHRgiJdJyea6vSBkVwZJ4qlAZpzvJJyTimGfQSVJySpglJt4tKY4qOw/TGjWzesIFnjx3jlRde4Piu3QyHIRnQiWOiNMUVgsDaWmvpmglaZSitkY4pTIyAK7Oz/Oqdd/jLn/+cj69cJtGaiY0bKddqSNc1UleZ6n0fIQaR1P55P9l5true9vxXuj3ljAbA2aee8zroZm+FHQi0UqXJ4tQqMvmMjk/iT3tkKqHVbPDowX2aK8s4aJ4/cYJcWDdTGd0oMiiykKZmwDFziMi3SXkm43M3+16tyaIujabRDc4A6Qqa7Q5X79zm5LlzzC4tMr5hmtHxSYZdn06cIKVrAnEEWZqhsqwXdIkeSjpIWfiE77F+d36tmoDeCX6mOvs8C2PRU60srmwnLNXL3wlcP+hlKR4tLvKLN99kZnaW+W9+g5eff479W7YgHQehQGXGgVrYzKvKLI1ISrQj8RyHbaPDbPzGizx77DhXb97gN6ff4f2PP+L8xUss1huodpdUOEjXwZESz3CPUCLPsuX3pskSCyFQaUp/hAyuIQPbSZ2ft8DQOVZ31KetE58G+Py+2mcN4ns1XPk1HDyGOdCqB3rZA0t3E3L150gEjhC40qi6CW2AoTSKSBOTtfC1olAssHnjRo4fPcIffe97PHv4CMOONFoWGPTbGvWS9bLxDkIKYjSPWx3ev3SFX7z+Gm+dPs3CygqiEFItFsmQZElmNxdPAjWrQIJenLR6s90Pj5RZX5Wi4IWgFI8fP6YS+OzcvzeN9+w+eUOKNxcvXWqo//n/DT/7mbj/9Z4meu3Lq7LyxTeB1jrSWtUrxbNi8+TWbXM7Dy8v1Wt3Fxcplav4BZ8WbZtqW0Nx0Gt/GZhijKQAqAyhlNEN9jwToMcJCwuLeK5LqVZjPMt4NL/Af/rbv2FmdpZ//Md/xPHDh5nwQ4R0ydB0o4i02yX0AzzPR9jUUsFxmKrVKB06xKbJCY7s3csHVn7s+q1bPJydo9XpIv2AodExRicmCUtFOlFEnMTESUqWaRKVmQr6NAOtcIQg8DyCIKBYKBikP1dDyGks9l8vjWafWyvB+LSU3trnfx+px0+blHN0ZnCCN7bTA6oi5suYSUeKXqYjU30ENFPGmEkrQ+/xXBfHdfGCwHAq0UYxQmsay8sszs3RbrYohD7btm7iwN69PPfMcXZv38b26Wk21oYpBz4ZBmkKpUSGhuOnlSLqdonTFOG6+EGAL/qT7HtXr/E3b7zJ2Q8/5PrtOygEw6OjVIZHyIBuNyKOEks9MStEvsHKkZtBtBfoqT4MJqe0+LqVtK8bVa9OBIjBV67641NDYYHAlS5Km5oQw5cWpt7ED/DCFK8Q4giBcFyE45g+x6R6O92uueeE0YTPHVc15loI68Q6CBI87RzzpTLfbLqOR+AFICTtToeVeoN2khF6DoViiWKtRlAs4ne7uGEB6QVI18NVZhOgzITQs+OGHPWzIZnI8wUWDV/15cQT3yx/vq869NVvGlu4be+XnBb2xHgTg7Jv/fdqsfoBrbWtsNUIR1gtfYkWgmKlStRqs7KyzEcXLoLKSOIE8S3YtWkTJemgpYNAkyUxaZoamoNr9PHjOCbNFJnvIxzJaDHg2b17GK+W2b9jB7dPPMfFq9c588GHPHjwCC8M0AJcz8MPQgqFAn7o43sFMjRJZqQztTb1KPk5DY6xfG7RluNiNnHKgMqyT/lbr62HSv+h6AtrM8BrM7D933OOt4NAoJQNulcdzYan2gaoeapdpXiuSxgG+I6hr2ZpStyNaLbrxN0uSRwZOm2ny+TICPv37OL44UM8e+QwOzdtZvPUFEVH2my7QmQG5DObMqPEIhyBKwWx1jxuNnnr7Dl+/trrfHDxPI/m5/ELJcJCEccNjLY9pg6qf1s+OfespdD1g3e96h7I72nHqnq1Gg22TU1x+OBh9fhPfnT90oXztx/8d/+dWDl3DsxQ+uSb4mvSvvCAXA78+5I1TXtO8OAdeWHvifvuvsOn9zXS+5uv39py89EjkrhLQZcNGqQ/Tyhi7rgsTZFCUwhCMhtUOa4HIqMbJyRpSugHTG7azOOHD7ly6w5LKys0W00ezc1xdN8+tk9tYCgIKXgebW3d+aIYoTSO51LwHApCUi2UmNi8jZ0TU+zbsYM7Dx7w8aVLvP/xBW7fv8/MwiJxu8XMg3tmoQ0CU/CjFNJx8XwPISUqUz3UK0MTxRGxkL3AO6dj5D/BIOKDQTmwLoccfvc04+/SBr+PeiKIWc117KXdBGCVRrIs7Rst2I2HUsogRdaEQ2WKqNOm2+mQdto4mcKTkk3j4wzt2sWuHds4uH8v+3ft4sDOHUwODVGyMEqcpgYJFRLHMxkLlJG5S7LM2JO7Lp6QdLTm4fISNx884G9++St+9dbbLK00iJWiPDRCuVpDSodup0PSTUAZ6oyUVv8ai5QMBAeDQVG/V+zrWL2gfp3bOvH4uk087fmBFG1vE2v1zBWCOM0QWqCEwAtCir5PsVymUAjxsPYJcUyz2TIIueOQaYXAImcDx/+sbXWGY2BsCkOjajYatDsdQq9MAJQrNcq1YapKEBYqpFpDmtpUs3EyNSnqfkbo82+on9aDX88192kRxROXs1/EMPBgDrMa7r1A40hLc5Ame+eXipSkoN1q8uHly8wtLjA3/5hvPf88zxw4wIaqMfTQwjEBr+P0MoWunctRRhu/ICVlz6WyaRPT4+M0o4hrt++wdXoL569eY7nZYObxDAuLi7Q6XbrNJoVyibBYxAt8XCmQuRu1MrbuGnPfmNMRCJ0XI9pieAfM/3pMc/PST1kj/lDo+ODnwZOB+dpNQp+pY7MSlgOutGIVu83uwh3rZ2Ie1nhS4miNSo2GeNTu0Gm1UUmC57qMjY4zMT5OpVhi346tHD2wl6MHD7Btw0aK9hhxliG1yXxrgVWAM4pOrpRkCJaSmPO3bnH2o4/5xRtv8sGFi0RZilswinOiJ+Gch4qr+3pwE7nuiLa7UPOf3XT0aJ2QJSZz7GjNRG0om5ze9NEHoyPXzmcZXL+utUlG58Pna9++8IA8W/PzS9UeXhP89f/DvT/0f0+7W158vPvu7LmJodrOchhOJlGXTqdldpK2+O0zrYU2glFZZooVwoB6q0W73aZUqeB7Rmi/2+0iRUqtWmNiwwakhOWVOm+dfpfH8/PcOHaU77z0Iod372OiWMIPC2RJQrcToeOMYjHEca30mS3+qIYFDmzeyu7NWzmwey+H9h/g2u3bvH/+Aldu3OTW3bssLyxQGxoC1zX212FIoVQmCENTSZ9mxHFMt9uh2+2SxIlB1VwT0Lmua7VOnd5kIy2nbVUleN4dn7BQf1rA/tu2T+P3DT6fIziDAfmqC2xgRXJqkmv1uvMJWdrXqCwl6UZ02y26zSZpu03Bcdm8dSsvvfAchw8d4tiRw2yamjAqCPbwkTYOamkU4TkGZQfQaUaWpqSZQkjjBCulYDlNufN4ht+cOcM7Z85y5oMPmV1Y7qldBGGIBlqtNpEtssudHaUQKGnS4OozBT5fz+BobVuF4A78/mln//Rw0gTOiS108jxTf6G0Jo5TtFBoUqQ0cqnFYpHAC3qyh0kc02q20ErheB75UieERFtN7/x723q4db9rH3HurfQWrVMkicVshaAbRSSWj6kx0o6FsEC5nBEEIVGckqmUXr0MqpdKkLKXUCKnwvTVIMRTJ8vB77y6TGhwif/6taedXX/esVdsVd9ZjFEbRDlTGrRCW9WmLMtwfZ/J4WG6zSZLj2e5cPkKS/MLzD6eI4oTvvHcCUpBQOC6SNfUJORBlOO6OJhsXGaVlrQjkVIyVCgwUigwerjKtq3bufngETdu3eLSlcucv3SR2cdzLNXrpsguScgKBVzfQ1q317weKVN9znKvaF4aOqRj5yZT26SM8/A6Afkg4PNJhZ6f6Tr8FmvNeoH/WirnmmcNcKVB5Moq9JVSTDbVCCg4jmOVnow2P1lGGsWkSULcicjiGFfDyPAwU5OTHNi/nwN797Fl8yZ2btrI1FCFgrTZXCCOE9I4phiEOJ4LSNIoJlEZAhcFLKUp569e429//St+c/oUV27eQkmH0clJStUamdJ0uhEq04RBCFqjsn7d39PGsBj4KeyuQwgMn15bV2THQWhJu9kkiyImh4aoTm34YLla+9eP4bbug6BrE7hf6/aFB+QzmAuT8SXc4lxfFPy/fgU7/zeIP39x3imGv6wND+8eHxn+4Xy9QbOxQmVoBImxke61gfziU4N0YVJRUZKgAdc1HGAnd0NUijRJmF9YoOB7jE1MEVeHaNVX+PjaNWYW5phfWmT2+UW+eewZtoyO4nmekbOKU7SCJEpxPIljOWdaGU3iUEqmh4epHD7CwZ07ObJ/P5dv3eb2vXtcvnaduw8esFRfIYk6dOp16u4ifhDiBwGBHcCFMDCucdoUEuaWvECv4GRt4J0H7Dl1JZc7+qzt94V0fOJka1OtQE83XlnFisE0spE4zNOOEq8Y9oohpdCoLCHqdGk2mrQaRi0lDEPGhkfYuHkTuzZvZs+27ezcspVd27axcWqcyaEKoU1RZ8pMvK6UeI6HF5gFEAFxNyLLMqTr4oWh1WyGuXqD05cvc/qD93nr9Clu3b1HJ82ojY/jhwWE45rgKklQgOs5BoXSBgnN7bCVsHQDxFOCotX9tern16T9dvzr1UcYbGuPZqYIS1yw0aoUJgjRmGLpNEmJOl2iVoc0intHzJKEdqsFymymDJ3KBLhaaVMVJehxtbV88lx6gXiO1Nnf9eBXt+hkmiS9zEkKtFotGvUG3W5MUDS4rsz5xxqsjY05rhC5dxL52rma4rd+P+ebhb83K23eBgDwXhNP9kO+wcmDV6NdbfpX5cRkbQp+0ywjUxrX6YJ0CMpV4iRlodHi9Psf0mx3uD87w6ED+zmyYwdjhSIAkVKkaYLQujcPufn9ZhW4pA36y45k83CVoXKBbVNjHNq7h6MHD3Pz1g2uXL/G7Xv3WFheYunxrLFdTxLK1Sobp6fxg8Csg3mBYx6m24xLliaGMqMyg566Oc3lswE7v9Vl+D2tNettEvrHFiipehpVjhQ4wrW0kf4aI6UZUZ5jspoLc3N0221cKXE0lAsFJkZG2LRxmn2797B923b2797BpqlxKpUKFc8lBOI0IckyAs8ndF2UnS+SJMP1HMLAJ7fUubW4yKkPPuCNU+/w1ul3eTQ/hwxCxsbH8YICSZoRJ6nxo/CMq/G6s2ZvflndepQkNELYgEn3s+ee6+AAC/UVnDjh8M6dFJ89duPaM0d/XoeHxEkeb+R7jL8XU8UXHpDndbAC+kYYX5aWATfbpA9W6EDzg03Tb2zbv/+l/fX6D89++BGPl1coVasI5/N3k5CSTCuTjnFdSqWSsWSNIlzPw/N9BMIsvECtWqEYBKRKsTDf5caDR3SSd5mZX2RuaZkXjj/D1qkpJkolgtAnjVMypXBFT3sNnaZGutB18aVkslRiQ6nElvFxDu7dy1K9waVrVzl/6RJ3Hz7k8fwCs/PzzC8u0u62aLaadDyfoBBSKBYJwwKu4+C5PiYOMJXdeTC+FqkYpLZ82SSJegWmVnPbFEjpAa5m36THKNuIXhBiAnNNFHWJ2h2UtauXQuApxVilRDEMmd64kT07d7F540aO7T/Avm3bGa1VKUiDiGsg0Zg0bs+0wxgESVt4q1KjViFciQx9MmAljml1u5x8/31++trrnP3oQ+48fIjj+dSGR6gODxs5qDghShKyNMV1XQLHRwhBkiQkSWIQV8cx5iufEpBqBniv/9A+V7PCiLiei0aaManMwuw6rplPtAdakMUpaRRbbXjT4iiivrKCUgrfN9fQ3KI2OMvRQ367VUoI4+jo2Y1pp90iirq9lHOWpXS7HZLY6J57wmhamzV1AI0Q9my11RTv5+nXpayt+11W9dvf75ZvZ6CPLpo5SVgZ3NWygkpqpNBIYe6xequNJx28oMDY5AbazSbzK3VeP3WGO48eceLWHZZe/ibH9u1jrFYjkBItJWQZKtNoYUtGbXGhxkjiZdJBC1O4XnMcRsdG2Tk2yt6t0zyY2cOtOwe4euMGt+7f5+adO8wvLLBUr5NkGa3FRdqO06PWOJ6H63pGOQorH6sNLS/LUpACob3ejuWTUOnB5/8Q8oe/zWcprRBS4kiJY7MO5gmFSlOyNCVKElSaGGRcKQpCMlQbolYuMTw0xLZNm9m+eRPbt2xlx7btbJiaYqJSIAASNDl5TKkMssRkvx0XR0qiNOuNq0hrZut1Hswv8PbZs7x16h0+unSRmcVFgmKJ0ckpakPDNNpt2u0OWmkKhRJSOHTiNgLd81v51Gb3jyYbq5COQGHXNm3oKlJp4nabspDsnJ6muWPHzfeGajcWAEZH4ZVX4Ne/1jSbn7m/v+rtCw/IJ77oD/gdWj6sVtLUaUL2qw0bVr535PD8SzOPuHH1GvfrDcsFzxEhO0msk4k1iNDA80KgMoxxUBAQFEJSrWi3O0RxTKVSoVgsmhR1krCwuIzjCBzHZXRiCp0lxGnMB5cvMze/wJ0793jlW9/ipSOHGQtDXN8GcEojrWmN53m4mMfiNKVrjTmElAwHAdUxn4naczx7+Agz8/PcuH2bm7dvc/HqVe7cv8/j+QUazTadOCJqtcymwXEJikUCi6r0driet6qwM0fEkyQx3GpLa+n19VMmsS8aFV+FWlhU0Wj85oYwEs91kdaxMje5yDEagTHX6La7NJaXaKysEHXaFIOAqYkJtmzfwt5du9m8aTM7t+1ky8aNjA4PMVIqEUqBZ+ffFLMpUJmxZ/ccx+iWa21l46zyjRA4gZEU08BSu8PHN2/x8cVLvHH6Hc5fucJCfYXS0BBjE1MgJFGSGIULSy1yXRfXcSxnvG/ioTSkmeov+aIXU/X7kf4DOcd8zUu+2m2QmpQ/NPDAwFK/6m3rnf9gdmzV8/Zecy3dJE5SkiQ2qWsp8FwPz3PxfBdHODjSwXVkr84mimOarZahilmdX51TVsgsfWp9rspaOb3+N+wHOFI6OJ6pHdFoWu02nY6xRPaBMAzxfA9PGyQr6cl/rv2wfkF0zxBtYFx9Xn7v1wkxz89FiSezT09uQgbuJJ3PVQMmKhYpEBgp1fz+yg/keR5KadrttnHa9QMqlQphsURQKDL76BFXbt6h3mqzvLLCzOM5XnzuBPs2brT1LzZjm6boxGwMXc/DcX3ybXk3SajXmwjHo1yt4Eio+j6FTRvZMb2B548d4dH8Aldv3ebmXVMPdfHSFd49e4aVRoNSrYbn+4TFovkXFvB8HxyBI43xkOu7BhQVck2/2L76RDT6i2/rUTF7ATZr1qA8g66VEQew64vAjJU0jok7HaJul267TRJFtBoNxodHOH70KDu3bWVybIytmzaxb/cuNk1OUApDHIwXhgA6WtNutZFArVSk4Acoz0NpYeo+hEBYJFoDDxaXOPnBh7z73jlOv/c+D+fmiLVmcsMmSpUKbhjQ7nbpdLrWLdzD6IfbNWQAvFpboDo4F+abSW1ZAkpp6KnUWcdSpcjSFE9AqRC2i+XyhZkgvHw/54s/9xz8u38H//yfw//4P/4er+KXu33hAfm3v+gP+B2aa9MhZ7Xmmn0sK4TnC+Xy69VK+US4tFRO09QOOvn0Bdg2nadmsIWDjiAoFVBC02q3SLMMz3cNSiYgTY2ZkGO5X9IxklImsPdJO4Jmq8ulW7dZXFnh7qOH3Lh1k6P79nFs507GKxVw+gZCRqvYpBpdKXGRaGmCTAfj6lgJHKaCgI3lMlvGxzm2axcvHjvGg8dz3Hv4gJt37xrk/PEc84tL1OtLzM8vIH0f6br4vk8QBIRhSBiGxhnULr55QJ6lxpp8VV5WrA4P1mu/1eSaHzdHEQcfWzNp51X/QSHEcdx+8GCuWI+jn8QR3U6buNsl6nRwHUm1XGa4UGDbxDjDtRqbN25k6/Q027duYdumLYzUhhgbHqYSBISYC5Jojcid18EUMglr6mCjwEwrMmE4m8Lqm7tAI0m4Nz/Pux+f581Tp7l47Rp3Z2bIgKA6RKFcIZMOaWIKhA3HX+DioJRBm7IsM8fzXBzfM9dHpZaqYKUf7c2zyuQ57z6xjlr0Vzxi0gwGrYP3pB6McZ6I2MXa97J+V+RItgbSLAUMf9J1nR5alKQxaRYTJwnKE+CIVVJnzW7ESrNBohXC91B5AZ/QvUUNbSRRV1FQegj24IkMSHoKE9QbWcXMLJQIunFElCZ9ygzKKGVkxok4yTLzXjtPmffpHq1C2YB9gCjTU/F56pheZxL9OmVj9GD/r/P8ehSxVQGOXn0D9igOUqJy8qfNQqRpikBSLlVIs4wkSVmutwxFoVRhbKOkubLMfKPFG++e5c6Dh9y4c4fvvPACe7duZevYGAXXAd8nS1Ojb92br03wJYWgFAYI6eIBWZyg0YSehy8EQ9Uq49UqmycnObZ3N/VOl5uHDnP84AEePn7MSqPB3NIis/Pz1JcXeRzFaCFwfI+wUCAsFPA8Hy8IcB2P3Nl1VRCucindHGDob1pWc4CedlF6p2T++B3nsrwgNRc6WPXP8uHjJCaOI1rtmKjbIWp3yJIEoTTFIKBaLLJ1+zbGR0aplkpsnZ7mwN79bN24gVq5yOjwMCPlMqH1ssi0Jo4TI1MqJUXXRStFHEX4ntuT5xX0xTRmOx0u3bnDW6fP8Pa7Z7j38AGzC4soIamNjFIZqqGBdjsiThI8x8d3A1Sm6HY6CCEIwxCEXs3vH1zeB/pyMHOXz0/KmuU5NuucxAlZt02tVGLj1MYVvzby89TzzzDIbC4UoFT63S7SV6x94QH58S/6A36H5tvC97ug84C8HRYuLI+P/9vS1OTI6NLSkTRLyRJpbIQ/xwA2WtESNwgM1aHbwXFdwiDAc1ySJCFNbMDkegjHoLRKKWOX7UjcsETZcWk36jxaXOLRybe5cfs2zx45wvx3v8dLx49TDXxKNvU8WHzoSLMjH2xpbHiqnudRkJLNlQpbKhWObNlCW2tmV+rcvH+fuw8ecP3mLa7fvsPs3GMezC/Q6EakgHAkOktJoi46y0hcF88G5WCRZSmQawhKnwUh/20C8sGimjy1v0rWMEfvrH64BFwhENrohqdZhspSU9CUpmRJis4yPA2e6+H7GUPVKtu3bmXn1q3s3LaVbVu3sGPrVsZqQ4wWSxQHUJL8DNLMmDA50vC2MXFXzokxPHJtzT+EQEoHDbRURr0bcfHGTc599BG/OXWKjy5dYqXVxi0UGBmfICyVyTS02i2yNMURRrtaytwp1MgnojWu7+F4vjGbSM1EmBMfcgh8MBDVmI2DlmpVQG5e93UKmX63th46tLYl1oPAc32k21cjStKUJI1JsoTMd1HWYENjWHTNqEur0ybVmQ2C+7oTWg9sHoR46vfQmMlNDvxtNhSCNFOGemY5vVGSmPuFXK9YkyqjeZ+pzDwnHRwheuMJ7K2cm4PYuUfTt0j6vKP5K77XW7cN7FPWZC1ME2teLQQgxcAm58kmLH1FWLQyS1KkhGIhwM0UzaRFq90hThVDQwG10XGKlSrLS4ssPJ7hw0uXmZl9zIP7j3ju6BG+feIZ9u/YTmCzaz0vCXvfKW1qCMqlYm8OaKuUOEnIkgTt+/ieRwBsKBXZUCqSAAd37eTVb7/M7MKCycbeuc35K5e5c+8eD+fmWG42USiENk7ESkriSBOpru0Z2aMNIgZQaTuHDq4wn/te0+tcjE9pg1rbgyIAPbM8be79/jqWkamUNEvI0gRURuA5uL5DtVBiemKSzRunObR3L7u3b2fbpi1sGBujEgaUZN8XRJHTRU3dWRTHpq4pCAhDY17Y6XRIhKHEKSlI0DS7XZbaHc6dv8Bbp97h5Okz3H30CC8MCSoV/LBIpVLDkS7NdtPQVLQgrBTxrH9FN+0ihKBULKJQpCod7JFPvQJCCKupb1SiHGmuadyJiJtNtg4NsXnP7tbDLVveuV+tXvx8V+Tr177wgDz99Jf8nTV7w68SNWxMTDycPXHifff6jcXhazdZRJAqZQup+oOwjx8MQj1m2dMIw5nSmk63gwCCQgFHGsvzVjdCK40jXRxpuHSmetkhzUwxhVACz3PxwwJhEJJWKrTqK8wsLvKbM2e4d/8B169f549f+S4Htm/FxQSaWJevOFMIpfEcp1f06Yk8aLapUTSZXdQ9IRivVCjt3MnuzZs4cfQI8/U6Sysr3H44w92ZWRZWVng0M8PMoxkePXrEyvISKorMaVtaTqFQwPM8ypUKhWLRdtJqTmmvt2zAnD/YK14bHOirgKInB70gT5FbvredxM3xDZUmTVNUZgpc4jhifmGBVqtJksRk7Q6kKTiSsFBkfGyMDRPjbNuyhQ1Tk4zUamycmGDj1BQTo6PUSiXKYUApCPFcF3/gqufcSxQ4CELfoy8JlyOXAxkNm5p1MFSBBHjcaHDq3Hv8/LXXOX/5MnPLy2jPY3RqCjcIQDp0osgkkqW0tQiG65moBGlNjILcRVEroigCIcFuDvLFY73WQ4J5copdc2X+3rbPuvhLYXQU0NZQKjMGP67jIh0IgtBsxgUY3RUTkKdZZji1FgHMC+ywKeA8ICen0unB9LHocf97JVi95IaRoPMcF9/1kI5Lmhk0PFGqF8C7vlHicFIH13PtZsEERdrS4wCk0x9ryo5lnRdJ/1578qvbVk1foj/sxDqvEFjUVVrDHTUolNjPUOVZEm2vg+f7qEyzsrKCQOB4HrWhGhpBq9Oh1ekgJfhhgenNW8iSmG6jzrvvnePG9atcu3yJV7/zMs8/+yxbh4eNk6fWZDoHOhwEytI3DXgQ+B6+5xqqHKAzI4uJEIYmCRSEwPc9wvFxxioVDu3dw0svvMDs4gKPFxa49/ABM49nuffgAbNzczTbHRYfPqK+sGjmmrCA9H2CIKQQFghCk5l1fR/P9/Gsy2NmswJ5N+UbV9Nd660Z9DbHrBkj5lexBnA3FDHf83syv1mWGQWUJCHqRkTdbg94S+IEHUcIAX6lQHW4xkitxoYdO9i6eTNT4+NMT04xNTbG6NAwk7UhhsICxTAkcF18+9kZoFIDEOW0Fzf0bb+b9S6zxlwmvjDZXheoNzt8cPUab7zzDm+9e4qHc/NEacro+ATCdY16k3BottvGNE4IAj8EBFE3IhYxrutQqVTQWtHpdNBCIx2x5o598m7PVziN6M8PyhjsGSqrNHKOUcyGQpHajm3Jr44enL224ctMcP7DtC88IPc//SV/Zy3A3kJvvgn79zO8fz+l6WlVd92Hk1u33UsnJ7l79aomCMVIqWIRowHtXejxc8FQTnQPQTJLorYue640LnupDRKN86boIZpG7skEkXn8pi3a7Xou0imSKU2rXmeh0aTRukGj3eX2/YccP3SI/bt2sWP7VjaWS/g2vZwKo8CgMLGsHNA6pZcOVGhhUIeSI6gUQiiEUKsRT00RAQvdLnMLi6w0mjyaneXRoxnu3bvHo9lZlldWqDebxBZly1RmZJc6bZbqKwPulrnUnnUctRxn7Hfqp/4GFOvFepjsAC81PwdNj+em0gydGatoLKfVdRxbnOriWj79RLGA77m4rkMhCCkVioyNjjC9cSPTGzawbfNmJsfHeinDiuPgidXLaH7lFRpsoGS/tglapGO/piJLjTylcGTvvDygDSxambvzV65w8r1zXLx6hUvXbrC4UsfxfYaqQ4TFIlpKg0qlKRozQRs+nkUh1CBlwUo6KmtqpBWOsIu9fhJ902v+ygvKnj75/kP7tJbXIwB53Iy2Gybj8yMtJK17e80UWGm1WFhaAi0oBkWkApWkJthyJAJt09J5bmNdUsRTv5fWCp0JykUzV8zOLTC/tNzfcGnZQykc6aCRdgwrO6Z6iZ5Vn2b0jvtUlT9Eod3Xrtloste/ay+tYOC627BH2qxYliKEJBBeTxJXxUbBxHUlbuDj+yHa91Aqpb64wNLDB8zXV3i4uMCFW7d44dgxdmzezMToKFXP691FCkFm1yQpDJjU+8pKWW16s0mQ2DoFYVBe33UYKpcQlNg9MkJn+3ZaacrcyhJz8/Pcf/SQR7OPqa/UuX33PncfPCKKY5TWJJnR4Y7jhCxLSOoRXaXJdNajrORzXZ6tEXaeE9L6OeR0sB7a0NfiXyvXa7KpOWBhaDLmrVa2UeXUtpwWInAch6rrERSHCcMpfM+zNI+AiYkxNkxNMjYywqYNG9i2eZrR4RFGa0OUPKN64tMXvMgzEirPduu+wlF+xR03F0g15yJtP7c1zKw0efT4MWc//JB3z53jo0sXefj4Ma4fUqrWKJTKRirZ0nCzNCbLMjzXM66vmKJus6yaAFopyLRRTJM4nzjjPJEBkhKhNVmW9IA5iUQlKVG7TSEMkuLExMdLw0PzXzoVvr+D9oUH5K0v+gN+h5bYn53/9J/gvffY+d//9wyXy7QePRKjo6OXk8mpK43Tp3f45aoXbPLQiUBpI98kbEopA3RmKqmlRRZyCbEcTUBDlip7wwp8P+jd0Wk2KKdo3LS8vJJZadI4JrVSNY7jUhsewRgHOMytrPD//Y//kd+cOsWrr7zCN198iRNHDzNaLhLaDUCGTXNr+i5bFsmQIo/izOSWSUlmUVuLyeEhmQpDpqY3IoB07x66aUaz1WZ5ZZl6s8HcwgJzCwvMzs0xMz9Po9nk1t273HvwwKBvNs2WZKmx73WMS5zjelYKzgSpxrzG6QWV6yo12M1LT2qAvFgyQyUJidVuVWlqHEd9H69coVgxKjajQ0Ns2biRzdMbGB0eZnR0hLHRUSrlCsNDQwxVqxTDgMD2Ve5KAAOa+llmN1XamgX1OdmryXTaXlZtTGLyRcOeUwLMLK9w6fZtbty5w09/8QtOvXsGJwioDA0zsXEa1/fB0gzSOLEIqTBcvJwmoI3SAo75+JzjazsR1+lP99pKUZrFXvcQpVVdbP83uB36uoRWAnpmR31Eh4G/Bl440PQTTz29R/Ix1lNl0KYgTzgCkWfEFKRJaoIcBS4mBZ8CK42WKfIuFKkWinRTuwkTpgBZY7I+QvRpaYPjevBb9nN32gZzxrRMaU2lXMHPNI9mHzO7sGDGJsaWW2VqFeVL9VD6ATvsAY5v79yFYL1t9N/X9rSeeFpuQBtLx/578+s5kAUZnBNz5SsAP/TtSzPiqAOA6/THf5rEJHGEFBBWyhQqJaJOh/rSIu989CEfXb3CuY/P8+1vfJMXTzzHgR3b8dH4+ZzluAht7gPRqxGyi4swSlTCPiexhnJpigJS4SAdky30gCHXZWh0nF2j46R79xOlKVEcM7+4zOOFBRqtFssrKywuLzEzO8vs7Cxzi4s8npun3miwvNKk2WoSJQmO5xGUSub7SIPQS8f4ZdCbb4Wlfpig2nVdPMe1vPSs55SpbCar7yBq9ai0Jup20EmG77mEfkC5WKRcCBkfHWPSZlE3T08zMjxMtVKmWqkwPjrK8PAwge9TcJ0e+p3fA1opYm3MmaSdk3MZXimEqSmzmbBMZaRZhkAhbb2REoIIE2fdX1ji7Psfcur0KU6/+y4zjx8TFApsmN5MsVwm05pOp2vWIkBKA1J5rmvvJROLuF7+t6YbmWJv13Xzb9yfNfXq9cHMrTZLbB+UNiuklEZkyloYaITSuEKQef5vIs//T8Ay9v0M3veD6/8ANfTr2r7wgPzHX/QH/A4tv7x3AYKAu3v2cGdkBC9TK/va8b0CYjZ0vW0GlRqcGy3CKIwudU49GFygervFdbeSg3vMwQAufzqPktYMgByVB1IEynEp1mosNhq89pu3uXzjBuc+OMiRvXs5duQIO6fGCbGDwrFgXJKRxQmu5+D5Rl5KKBBKgVK2UEX2KAvCJrLzZTYQUPIchocqTNXKxGlKu7uZdrdLs9tlpdmk0Woxt7DIwtISUZLQ7HZodjq02m1anQ5RmtCNDOqRJIlxqcxS+3dmg0T9RN8J2zd5AZwrJWEQEAYBrpQEnkfg+/iumTCLYUgxLFCtVCiXy5QKBWqVMuNDw4zUKpSCgDCn2bgeoePgiSddZc3CkmdGhKEGScci+/3vll8xgQna0zjFcVyk5+KFQa/aPQMeNJpcuX6Ds+c/5tQHH3Dj5i1mFxbxiiVjqR74SM+o3PSslXskBDPpDRZa6v6v6zf9xC+f/Hr75NcutBoYn+s+/anv/wwfQT/wz9G0njVq/ukacmef/D8zrqEbx0RJQiHUOELiIOnll4RG6xyfe4LgxcAn2o/QvWBu9abCqnZoEwh10pQEk7XJOcS94+i17/7sffH3tv0uffN53pvPleSbIXpgRT5f5ofM74IMjBuj6+IWCoSqRkNr5lstzp4/z+LyCpeuXOXEkaPs3r6dQzu2saFatkhzn7mt0APUDwMY9WIme1MaD4UBymKezbQvkVISACXXRbsuI2HIlvExumlKJ4qIoi6NdpuVZot6vc7i8jL1RoOVRoNmu02cptRbLVqdDqnKiOx6EtufeVGyUbHKg12dd0gPNHMcieOaDa/rWBUkq1blCJOZqpRLVEtlfMcza0m5RKVUYrQ2zHCtxnClTK1SJggCAj8g8FxCzyMY4IMPjiQB6DxDnHeZEEhHojMDNMVZ0qMnGsqH10PE8+PcmnnMOx9/xNmPL3Dh8lUePnxAu92mPDxCEARoIWm1OyZ+kA6ekHZN6XsF6Ly6fxXO3Qe9ehNab+ZZvfFnkP7DwOt0XngrcaSLRJImCa7jMDI0gqzVHlcajTvfPXcubvo+bu5dYjcJbN0K/+yfge//Q0D++2gff9Ef8Ptpgk6Hx2fPavbtxR0bbS/PzN8eDgp3Jycmn+uolDjq9ow0AMO7svqiJs2kesjkqlT1eu3Tihf12qWz/3iPJqE0XiFkQ3ULrXqdh/Pz3Lp/jyvXr/PBzp1cunmL548fY+vkOBvHxygWCqb4UApSYQtjMMNGCGl3sspSW/LFWFvkIENrYfjuPR46BEIQeB4Vz4NKxXwvDPKbAqmGOMtoRxGdTodW1wTlnSiiZbVOu3FMN45Jk5ROp0OUxKCNMoThpNqJQpjFxXEML01Kgee4hl9YKBD4PuVCSKVYJAxCSsUixbBAGJjAPPA9fCnwMTf92suj1/ye945Wfb5hvikTQvbToAPv1PTtsTMNmbAcOmEyFfU4Zm5piQfz87x3/iIfnj/Px1cuc+v+fVYaTWojI2yYnkYLW9QlhFG4sOiN1IP3Q/5p65zA007sH9qXqpkgRfZ4wxropopuNzJmL5mhXUl7H6k8tY5N0f+WFzfnyGoFSZKh4oRukhBhxoZjzWBMPYQJZhT/QEH58rf+Bq1PlRq4RwRG/QPoRBFOmhKGIcVqFS/waTeadOp1Lt28zs07d7hy7ToH9+3nxuHDHN67h+nxYUarVRzHIZCyB0Yp62qgpTC89jzgxdxLvQ/Hghv23hZCmBqYgSxPICVB4FMLfCgVV51ditHSjtKUrvVcSLOMpZUVFpaWSDK7uYwiOlFEuxsRWdAn04Zuqi3QlSYZWaZwpIPnmdoaz/MIAh/f9wl932RXHRdHGqnB0ZERhoeGcKVDIQgoBsaAp2hR/09rmdKozNCRHNmnrNpdL7meshACJSQp2tBY7Xrt281NF1io17n/6BEPZh9z5uMLnLtwgfNXr7O4soLveYyNjTE6OkqaprQ7HZIkwXU9I6Nqg3FYmynss7/798xgcM6TC+dTm73emTKxgzWlEwizWXBcNm+dgj17Zpemp+9ORVEireu4udi2JuB734M///PeJvPr3r7wgPwr0+7dE/yzf6a5cwf+m/9Gd4dHHsiRkfsTU5PZ7MI83W4XNwiMVTEmSJOAcE1aTChhUcwBpOILbKb8UaKFMBqvYUi31aLdbPDehY+5evM6p8+9y4E9e/nGCy9wdP8+to4MU3EcdDE0qWnyydtBOLIv7JhPDAgchU1X9gem0pYmorRRVLELuHnWuo4BrgDfkRQLIToMULpmJ0Vtg1ZNmmmS1BxLyr5gQ2braHsFYhZhsR4TuPZzYgMf4LsCTxhDn56cYY+zZjOX9gzWGt4ora10mEHdByXo8srwXuzbS5Os/jvHF3IDJe24ZgLEyB8uJykXb9zg3bNnee+jj/jo0iUWV+ooIRgZG2fbrt3gunTixFIFcotsO1nmaOvAZi/vx68hjv31aD1b+T5yadaVvCjTPCeFKY5UQLfbpdvtGNqV6s8n6IEMXI9uxkDW5LM1m9gz2zopjARit0O70yUGigwi5LmkoR0x/3CbfSlbH7D5bK/WKCNNm2W4jsQJfArFIqVikWxoiLjdpttsce/RQ+aXFjj3/ln27dzBd156ieNHDjM2PMxktUrRdS2YY1aOJMvQKjMyu/k9qvpfStiUcQ8tX2eDp7Q2NE47JuTAdCsAXwhc16XgOKgwQGuYqFZRm6b7hcVak6JJVL5O9RNSeQ9kmTY0CvLA2IA9psTHZEFd+hmG3LHZsTbwuXxtrnSUDFwHpU2GVCuFIwTugMGcdGVv7Ocv1spyxnvFvCaLoR0XxzX1JghDaWtniplGi/c+Ps9vTv6Gk2fe5c7DGQqVGq7rMjExYRF6n263S2LpaZ7vW0lERbfbHdgM9deuQZHb3i01kAF+EoJ66i3We12mTUAuMfeEVopOq81IqcDmjdOsHDo899Gzzz5YDyT7+9j+ISDvNw2I6vyc3gFabpp4kBw5dG/70pzqNJvcaTSouC6ubyqtM9UvKulNLgMB+RfdhF1MG63YVLKHAUExxC+GNFZWWKqv8MHFi9x7NMP92Rku37jG1g0b2LdzJ1s3b2I4LOBjAuc+PmGQaZ1Hw1i0XGICwwEkQw5QRwYHq2A15eMza8R+Sntyqvjs7+l9l94TA7iAMArzrswlEwfA78F39gQtjN66FjZwydOx9PsFYYKrFnBjbo6PL13i8rXrfHzhIrfu3WVheYl2FOP4PkGhgBcWSLVx6UztRidXSAGrJ2sDtz6dKcfi/2Ea+6q1/lgRA2PKIpfdLu1OlzTNbOCe3199hBGhewVpn4YarXd39Dd2Rskj6nZpt9tEcYry3T7NQeep59/PGP6H9nfU/v/s/Xe0Jdl934d+9t5VdfK5+XaO05MHg4wBCBAkQJE2QZCiZEsmJVqmbNmyLD8/W7afk2wv2rKWlrWo+GzZ8ntaT4miaJGyRYJgAgSAABEnYPJ0z3RON4eTKu293x+76py6t2/3dPf06b7dXZ+1bve959SpdKr2/tUvfH9bvjqLxKmf2CzlZDAIXYO0LD3Dq1QIrCXs9dgI+6x3Nuj0u1y6eoXnX/4+jz3yCE+cOMGJ48eZmpxkKnDFiUYpdCZskDsn8ofPPJU7V8XK54Utc2WWW6xE5hCyWZYEo/SbonTsneR6I+mN5h13jDaLjJMdDyibpYlmPUBySeDhfWWyIv886ppFroWzxxG4SG72Kfqp5mqny9nLV3jj1CnOnL/Am6dOcf7iBS4vLBClGmUM7ck29UYDay1h5JRfXDqOk91Ns9SdoOKiEtcUUW63uK9zim/+zAuM1VgEvsrspiSm1+2ialXmZmf7lw4dWnm516Pyy7+MPHMGms2bXvs94b/8L8e6+tIgd+SXoJzSxh4EuwKRPnF06fg7h6Lzr75Ob3OTerNJUKuhjB15eu2teajuFMPJNI7R2jUvajTqTM/N0p6YoLu5wfrqKgvrq2w8/z1OnT3NZLvNs089xYc/8AEeOXyYPVNTzDRbNKtV59UWBWUNmzUeySSsTCG/PPf6XQ+TFW5g3YODuNnUL1tI79s2KAyjets+orLskdEEgHswyrfPyOOXjfOIYmOTzNSRaqedHD1q5J4XpzbhBhlJ5oUn9/Y7uTojBIubm7x96RLff/U1vvGtb/H6G29wZeEqflBhanqGPQcPEVSrpEBvELLe6WAzr4WxDKv7i+fgmhO143slu49cn9sircHafKotFEBmkbdBGBLGEXkBpXvQz9PHMtWFm3gOG165O9jrw4dHpRBSECUx/X6fMAwxQdONAXYkQTp8BizZfbzLF7P97TzVN/Bd/ZDWhiiOSNMEKXAFi76PX6/iVytO6tBa4v6AF19/nTdOneLY0aMcP3KEZ595hkeOHuWxY8fYOzODpxSBUnhy1IVCDyOUBSNaiGvqdIb7hhjK9IIbB21xrMsM8uL0k2rn8XfeFBeWKnrXt5+LUVxx55sof87No1n5A4GUWapJ7rgaeuBNVtskXeGqhK26KaM9cJKJTjbRaXMrZ7SrUR8Cg4s2DOKYUMPZy1d5/c03+c6LL/LCyy9zeeEqgzim0WwytXc/QaVCmsbUGw2CSmXoGU+NoeIHSN9zNU1pilN/qWGFi8YZa4Ze/htZ5DfjELvmWsvPJbk6FOgkJRqEGGvDoF5/sz87u9w5d5bOX/tr8Pp9IENeGuR3DQHIReBbYDaBZzxv/clm85IvxFw46GOMRmZ6oCLJ1T3M0CU8LM0qeJPHRd6efnJiAq01YRjRHwzwPUUlCFCVKhOzc1QHfaIwZLnTYb3rZAt//w/+gCdOnODjH/kIzzz+OI8cOcZEo8mEr6gKwJPuJ8N1SZPXHcDcQqNfXQlapspgBWQGiLX5YDjyKBQ9hPmAOyyAKawz92Zv3aRbl9kyeGb7IBiGInOzJw+Zuua8YjTqDtcrtq3ffSbRmkEUAU73W/keUow6oWlr6acpl5eWuHjpMr0w5Dvff4mv/ME3Wd7YdBlAQcDB44/gV6oozyPB0ut0ndavktQaTSctpjVS2EKYwSILezb0ihbmKDveS63kDjK8Tq3NojEjI8UAURSRJkn2IOsKviwjWTZMlqxWUI8o3ijbLp0dPX9uorRZWpfTcY7jmCSJh3GX7Q+0MFJhKLmPENf+aS0ksUYol/5Rr9XQOnByd8YQJWlm0Gbjp1JU2m321+tE/T4XlpY4e+Uyz7/2Kvv37OWpxx7nA08/7ZqnHT7MbLtFBTcGFx0dedMcY9y15QzcvBtIHk3NdzLbX1kwnEeD4BaHhRIgfa9g8I+O12bXbH7fmeHGMm99MT48TKUpzjcFp4zRmDSTjxV5qotT2SL/PKN9zz8/SkHMvOJCojJpRJFphwtGtVcauLC8ysuvvsYbp97hlTff4srCAkvr6/STBK/eZGoywKtU0FISGYNUik6/h+5sugZ4UlKt1VxDOGswOnVpqVl0f3j2MmN8yxwy/P1GT/6FeXzbx/I8cJv9nh+nK0lxaU0WOlp5J42US9nHin2QHlpKg3wrdgAMsj96Uq2KavV1IeUhm6Yz+c0kpB1eyCbzlTpEJgs1ynseN3kOqkBkg6krXgkqFbwgoBb4eNUqg36fJI5Y39gg7HZZWF7h4tUFvvX88xw7eITD+w9w/PARHjl8iJl2i3bNqYK4cKPLr9tyorb/UayyzvOexagxQD7AiW2fFYX/tzdxKJ6+6w4LudFRbPOehzwLA67N1r+lEC7f5WxssSJ/kCp+BpBuAM0lDjXQ05reYEAYRSwuL3NpYYE3T57k5NvvsLiyyqlz57i4uICqVJienaPRalOpVodeqSTVGMnQq5NPFM74KRhY+QNeQc0gV1Z0j3+lNX6/4+6NLM1p0CeMIifb5nkuzzsxWb5r8RMu9YA8deVWyCJEnueu6SRO6A8GDMJoKH04VM/I7qOHoaDqoSLTojfSDMdpa9VQGtAYkzVck5mMoEIEo47MycCwsLHBaqfH+StXeeWttziwbx9PPf4Ejz/yCAfm59g7M0270aCepbTkOdlWieEDn4VRZNS6GXU4Ag/TWrJdzse/4hieLZO5fIbLXePRzRRCVL6Yda+NvOh5BDWLChXWt+W0Dd/NDPmdJqlsXrGQRVQBKbDSRZvzBj4aV6Taj2N6/QG9OObClQXePHWKU6fPcPHyFc5dusTlxUXCJMEqRbXZpNZoUqnVEVISxwmp1fhCkegBSRLjKd8p6HgeqXZSiWS59+CicABKXV9T/E7h5KCVu77SFKNTakFAtV5f137whhFiIQtr30Tc78GnNMhH5BGj0QtCdBPhvY3yPqyknJG4OFXe9GJ7fvTQtit4L8eFQGC0YRD3XdV7pUJVuja6cZIQhiHS86gEAZVa3aVHJAkTk1NIa+l1Orzx9ju8+PIrNCtVjh48yFOPP8FHPvBBThw7xoF9+2g3GvhK0qoENCr+ULaveGxFj+2WsangbciXz30ROxuRo650o21sPbc7nofCgGp3eACy1xi3XMelbEd7kXsNsr+NEOD7WKBnDOv9PleWlri6sMDFy5d558wZLl2+wtlz57hy9SoLy8tUmm2OP/4ElXp92BypN4iIE9cgIahWqTUaCCGIIpcyIISgUqmQJ6zn+2uNGTagyj05uTFWPF8luwxbjAeJLZGO4SKMDA0DmfJQlD38ucYmzqNlt9xP1trCtb/1riw+5Iot72y1GYbNuXTqck6jaOsAWHLfcqMxwQVBlSugjJOhF1lmHlQyDXEAawXGQpSpYPnKY2punka9jrCWfq/HyuIiL73+Oi+++irPv/QSj584wYljx3jqscc4cvAg++bmmWo2adeqVJVzPkjhmpkNVcOsK4QU1mSNcHD6/XJrpLZ4bCMpRVt4ryA9XMjfpjBevutZG960wycFd79IOWz2ds1HROHezozx1Fii3BgWLo/bMFIi2wydg+zSlatcWVxks9flldff4He/9CUWllaYmp0lqNWZmJujnTltjBBOCjfftnBuJ4TTCldS4vl5nZshThJX1Ok5XfbcPgCoZuPL6Ixuv2pG77mxZPRgngcPbGHR7Z+2iKzA1418WhuEtUw0GzQnp/pprXExFWxkT2bXutwfQkqD/AYYIbupVznjVWsrtWoFhcBq7UJuWShPSOkqpLPum3mY92486ikhMhkjS5okw0nb91zBjraWKIqJohghs46VfgDWUmm0QCpqrSZozWJnk7UXn+flN19notni4IEDPPrICQ4f3M9TJ05weO9eGtUqFaWoiIIarRBbDFhwzogsuj4MoW83zimE4fOfvCPZjQeI0XbdIkVjZOuAmmfBAqMQvxitx+bev+wLExRVdkcDZzdNWd3cZHVjnauLS5y/dJm33n6HCxcvcvnqVVbX1ojTFAuoeoP9x9pUGg2CWo3UGOIkdalNCIIgyGQNDf1ef+jNCQLX1MPkjSjIJxfXJILhY0z2bnauRs6Fkt3ClofVAsNrsRAKH1690uWQ9/rOQ44Uw3B/3pTHdc0Uw3XbbA038+3n9oULqbtPyrxNe6qJo5A4S1nJFX3yD97cFkp2CzcYNYd/5x0UbepqGqSSSM8178Fa0lRnbdldzrNT5agC0BkM6EeRmw+tJWg0mfB8dJrQS1Nee+cd3rlwnm+/+ALTrTaH9u3nkaNHOLJ/P8eOHGZuZoa5RoN63rBMgFLgKW/okin2VxsZe6NrP1uqEAEdzUAyb4C344kxhftyq9No2wTFyIjP9kcU7r2Cd98FObduUQC+FHjSdTs1QAisRQlrq6tcvHqVsxcucP7yRd45e5ari0ssra7S7fdJhWRi7zwiCLC+RyqyuUA4zXTP8xBSoY0TGBAYhOchUaTWkmQGN8LJDapsn+M4RghBve7kJLdGwd6FQi798FTaHT63zTAXWW6nNQadJIBlut1icmaurxuTF1JYL+evEaVBfgOslD1TqZ6v1BvrzVoNz1OuKCN1fiQnSSQwqTPShzUlIwHBsTNs/5sXlyiFpzIZQq2JTTIqOoHhQ39QqdFstlBKkCYxvU6H9dUVzl++iIliGq0WR069xeGDB/n+kSPsn51jpj3BnrlZp3E6MUGzVqMS+FR831Xo4wzaYh7ecODaftPb0U+xWLNodNr8rmc0AIwOvGB8D23tfKB03petX0LhMUk4YzxPYDG43L0ky5+M04ROGLHe67O6vsHFy5e5dPUKC8tLLK2ssrCwxKUrV1jfWKc7cA0XqvUarYlJ2pOTNDNNdmdcxaSpa0Xs+T6e54qpkiQhTmJ0Vgvg+07JNs0M+6HvOzt5IynGbJ9t3qChZLcy+h6vRRSWMta4a9AYun2XOkI2+YJ7eEMIZGbAjDpn3ozX7/q4gjIgSdBxTJwkpLjJW2bGjnuwNpiHPpj8YJF/nSprTOOMWIm0Mvv+80LkkbxtEFTQOnWynLHrhBxUfOq1Oq2JSbCGwaBHd7PD8tISp8+dRwFT7TYH9+9jz9wcRw8e5MC+vRzaf4BDe/cx1WrSqjeoBgFB4FPxPHxxbUFmvtMuwDl600A2+LsHCZH9PZw1tkwsdmuRKAwFB3Jt/nx8LTZUgkLaTLb9fBVFz7gh6z+RRUQjndKPYzYGEeu9AQtLS5y/cIGF5SUuXr7EpStXWFheZmF52aWqdbtU222OnXiUSr1Or9/PVLecdKBzfrnxQmiyrq4uRdZokx1DpgCXpRz5Wa56mqauPklK1ywoM9DHTpbvn5K6hkDWMt9uUTl0oH/pyKFLG5tpn1dOg6255Wsz49+nXUxpkN8AK2VkKsGGV6uE1cDHEzJrapCCUpnCRnajFEJ8UoqCcTgmhHAhqShyYSrPyZWZobc864LmV5DSDbJ5N8w8zGdsFqC2Bq9SYX7/Afbs24/WmiSO2Bj0ePnNN/ju976LiRJmp6Y4cfw4Rw8d4vixoxw6eJD52Rn2zu9lstWmGfjUcgcuW5zRWz3o2f7nA6cAZCEEvyUMNnSWj9Yw7JQ6XKwQmhw5vK8xiLYa/aPwYQz0U816p8vi8jIr62ucPnee0+fOcebcOc6eP8/65gZxkqL8AKk8/EqV2f0H2BsErkWzcCHKONUsLq+4SS0zoKTyhlvWmQdcSUm1WiVvT55XwI+KnLKLJw/fDgMC2aQy1GeX78koK7nz3Ow9P9L6NmibPRTqJGttLYbi+fmDdjFf1Vq7Y4qW2HJf7Pz78J7LdJUxxrU4z1pqDy844VaYG/9lY6D7iMJXtVMKZV4U6RQ28g6WoPOkJeEawUmhyNNAdJKAkNSqdWQVyCJ4cZIQJ0luylJvtWi0Wsi8K6bWLK2vc+HyJb793e9QDQLmpqY4cfQ4R44c5sTxRzi037Wc3zMzQ7vZIMhkaIdOnuscZt5TIp+HTbavxdQKUfxNKvIUF2tB2tx5NCz93zJvDNtPbDu1+QNDcbkE6CUp3V6XQRSxurHJuctXePOdM5y/dJm333mHi1cuEWaRKK9SQXqK5vQUbW8ezw8QniK2hn63M1Q2U77vomPGotOUKAoRVgylKq2VJGmKkiNJyTzqnKZOgS3PKdda0+/3AZdD7i6G611EhQeXHc7BDT9K7vRy379zZCYEQjARBKSH9iZvPnpoc+kf/jb8jX8A5gAcn3ehkoeYsRvkjf/mvxn3Ju4MxkCvBz/yI4Az0sJ6bfDiI4fPTTz1+Orxi2e4sNGhF4UE9TpCuTxfrc3Q+BIU8jrH7bosWJdZB+4sNOReFDBSGHF3xtD7IRBgMtF+XF6JlCLLQVMoa7BSEGlNGA8YZA8hurNJePo0Z69e5XuvvU6z0aBZqzE7Pc3czCz75vewd36WVr3OntlZpicmkEoSeFlLe98jkK7hQn7bFVNfGB0S17x8G8aApVC5bgwaCKOYzW6X9W6XjV6PtfUNriwssry6wuLSEstra3T7PdY7HTa7XTY6HXq9gTOkpSTwwFceQSVAVSp4fgWRNVywaYrBtWi2Nmtvn1eZ53uUeTvdg4MoPBzZ0cSy7Sve/nsWcx6mEpRm0u5EZBJsJisGl1Jk3i73MK91ilWKoFJF+QFRotnY3CRJYqq1mvOyJTFeEAwnV1WYsLY/YG7//br7lf2kSUxqDaLdJDKaxeVlEq0JAt+FurOUvGGoq+S+pHidXDO6FOcrs+21LPUjcy9hjUUIO6xtwLqCxWFPDuFSN5R0qS/KtX9GJwmpSUk9j0EU0u112QxDljodXjt7hunvf5+J1gS1IGB+ZpZ9e+aZaDWZnpxkamqa2elpJlpNatUa1UqA5yk8XA+NXOlqdHyFh8nrcQsDZu7YyQ3uGNDaEMaxi4AOBmx0uqxtbrK6tsbC1QVWVldYWVtlvdOlM4hZ2eyw0emyvrlJGIUIJfEqPkiJ5/mooILyfbxqBQtEUUhqbHY0AmnZ4SHDImyWJluMDtudO+oWowK3XAR+O+QOJAMSSbUS0FtbIw1DJo8eRe/ds3bW93obFxbg5ILkkSOGiTroh7uKZewGefUv/aVxb2Is1ICOEnxrfmr5hx8/0Tnx6gHOLLxIN47Z026DVMP21rn4v8iqxPMikPFiXRfJzPuqrQHt7oItUlPaYBgVBHrFJ9BC3M1YS5hmIawsibTWaFJrNNizfz8VP8AkKf1ul7Vun7NXFxl0OhDHKM+j3W6zd36eg/v2MdWedMU8e/fgex7NWo1Wo0mr5X4qlSr1WoXA913aT1Z1XpGSitxmXhQ9PdecAfcErk2mA25dl7c0K2YJ44gwiuj1eoRRSBQndPp9FlfXWFheZnVtjStXFzh/4QKLy0usr6+TJgl4ikqjQbPdpl6vs3dmFj+oIIQc5t0ZY9HGkoSDbB4bSV8FfsXt3Y4ycbkHZ3SMgix0XPxOtiy//eCF6wJ5o5NTcm8RBQ+4deFjZVXmiXQpAGmqsb6lUq0ilUcYxqxtbBAlMbV63RnkUYwfBKRpOoyijMgiRrm37iaugeKDehw7g7w6OUmEZWFpkTiJ8bOisFHfgTKLfDez3fy65kF+GF3bOY1KDC+gkdvXIjKJzdE2JMJdY6keZRxmTapUVqQJrrurtmm2SmegV9uTtKamETgvbxJFDHo9Lq+t8vali8RhiA4jatUae2ZnmZqYYO/8HvbMz7N//35mZ2dpN1u0Wy3qtSqNep1GvTF09HhC4CmPipL40tVXQS7duPN5ys9PLsfoZBHduB4biLRBG422lkSnbGxusrG5SZzEbHZ6rK2vs765yeLiIkvLyywvL7N4dZG19TXW1taIU0212aLenqBarTExO8veeg3leRgssU5JtGsGF2lN1OsPHyakUuQ52iYr6s/338vUWvIIBbiIqy0cx/C7LUThcnK1lVvl3ceA0dWSPzpYa5BKUKtWsamm2+2aWrUaps3W1T4k1CTUtSJcsqTeQz/MjN0g74x7A2NCAFH2e1Cr2clWEyUsJk2HHoO8U2c+yLlQkbsIt+RrjIktdppgyx1zzaC746cLRt3QRrTkXQNt9rrWlkQajBUQVKm1Pfx6HTM3B8YijEHiBrBzl69w4coCL7z8Mmkc4ytFrVqlXqvRbDaYmGjTbDaYmppicmKCRqtBs9Gg6gdMtVq0ajW3TndCh3tezOnLw+rGWuI4YhBFxEnKIIzo9Hr0+n3WNzfY7GyyvrnJ2sYa3W6PbrdHlKYIz8MgnPGuDanRyFqN6Votk/iSKD/A852nEKVcIDfrxOryagUFp8Vo3ywIUZRXvP4YMzqi7b6rbSvd9iG79c+SXcywAGw0SGSGbj5eMFThSXRKFCWk2gx1yIUUWybZG6WNWLHVKN/h0tn6uhi19HaZBTprWGJG3RSL638P56FkPOx0NWybCoZsEZcqzhVbViKu+z0XNe7tlovpWseJQGCsIckeIj1r0VbiSQlCIvyASkPg1WrUJiZcCp6xyExnfz0csHn+HKfOnxvuqxKSWrXqGuK020xPTlKv15jJ5hLf86gFFeqVgFqlQrVSwfd9fOU5T/Mw2spwbnFFq5okTYmSmN7Adcrt9Ht0ej36YUiYpAyikIuXLrK4tOS82HFClCSkaZoZu84zL4WgMT1Nc3YWgyCKNUhJUK0igwAtZCaFaEmMRdvRg9L2GGk+PwgYOvm2mBVFr/c1SSXbvuT3jB0NLnanbbkds2y9zvK0Xue4hKrvWynoWkQHMKyfhbWva7qTlqyO6mFm7Ab5XSgbGDueH2xUKhWXw6VT99Sah5EeIMTwX8HILes8eam2wxtRegH1as3lpWXFNEkcEw0G9Pp9knjA5sYGYa+HkLgQo3I5bJVKhSDwqdfr1Bt1qrUq1WqVwPOoBxWqnpflk2+VlbzGIMcZKolOs4FREyUxgygiimLX8TAKGcQhg8GAKIqJowhrLV6lghdU8f2ASrVKtV6nGVTwgwDpudSj3FPi8ntdNXu+A7nje4uq+Q6KGqWx/JAy9BTulIG6fVn3njbGpVP1uoRxiPR8dy1mijzDgrU7yNAIkAJtNWESE8bRsNBYMNp2yYPD9gf6HY33m1xXbpoVnUOCwvRh8yime9DTeddkAN/HkxUq0qmBeMrDpCnhYEASx/QHEVE4oN/rE4chJFmdTSWgXqvRajgPeb1WoxoE+EpR8QMqQUA1cP8rKVEyb2qXzRyW4X1nLS7N0BhinRLGMVGcMAgjBlFImMTEqSv03+hs0u/3RxlcWeG1HwRUqzWq1Sq1Wo3A9wky+dpKlJBmBZYwKtrX5GkoLqXDqagw2r/83I78Zbf1/dxrZOZ8iOMYT0jq9bqRSi6k1i4CmrgLYEnWXU7QQ05Z1HkTaClPx1K+pLV+HGNqo3qnUTv2oU4wztsk7ppFtvNGRl4wO3zh3Xan6C0fGee4lJCsu5fAee6MsRht0dI1JrJC4ldrCM+nolOm5uYIKkEmz2bcYGycx0Snml4Ss765TrqusdpgtSbu99FR7FKAYOjB2+59KXqmVaav6p4VJNJ3TRGCSoWgWqXRajKRebqlklhjicMYm3U3E0K6XMks5JdmLY2dFyNTrrF5Acz20dHeYGTMRBe35RFs/fMan2XJA8Qw4iTyEcJk0ZPMc57dS0IptDYMBgM6nU3CKKJRqbrGPUIOr8n8vjB2p+3c2nAzlNTEDrcfDgaEgxBjjFNnUFFWZ1Kym7lZv+iOQ8/NLJu9YMWw5d2OO7A9ZUohkV4x8gfWOJWQoWynMFnjOU0itbtXfN95thtN2vm280JMrd1Pvg4LS5ub9Lo9p3ImhKvdAYQxbntZnZex2j3YFuYPIZy8qFTKyT5mkoLS8xBZYy6DRUjJnoOHqNZq2f2YHdNoRc64N4ZYG/rdHgKnTKN833X5zDzj+QmTuToMxXUVT+LO3+SWqHj2Sy65fCvc3Hhx45XuOIMVdlB6HsJakihCCUGz2TTSDxa0EAuMambLISajNMhvAuupC9b3XxdCHpLG1hjdg+SeWu1yFe6eiVWUMbx2j3dYvjAI7bS6wseKxrjFDRzSK4SwMwNDG0OajoZoKZw2u/I8UIJUkOlAymGKD0qBr5G+QqU+VhuM0WA0tUoFoU2hnfjWEL0t3OhD74KnRmH9PNNRCfAUWrltG1xhjNTZEoE/7ENkrMFo7RQmtuXf2Tw+KLZGQ3aIGBYCjdlZE9sH19E6R89Ixae2ckx6YBFgcSoWxetZAFLILP/TEEYhm5sdBoOQ1tQUys8eAnV2H2ZFojvXJtxcVKZ4lRkAKfB8hbaa3qBPf9BHa42X1XZco+ZSXqa7jOt94zvPAcN3d/weR1HRa+IxIitUv9EmC8kW+XK5apRbs4s8Dn/LanGMsBgrECpTczFZe3mlXO8MpbLuli5ik6YJOk1I44REa2StSrtadRsxzvmTN1OzhadXIcjqlcTQszMcpfNdz+4x4XmI7B4gSx1LhaSXpFuOUYhRu6/skdvJIgrn/NHGYnGSg6agbCOF24+tkV+bPXzsfGrzl21xsmZkB1w7l1wnR+l2sWJLtoqbx/J4dXFLI6Uap+KkSaII31NMtNsmbTUv7V1auvzj3+vb5y9c5NJ737MHhrEb5POb92sWOaRKYYHAcCWpN09VarVPB72eawIkFVLI4dP+vcxRGPdmpcDltBae5k3mDTDaZjrnYJXLERTSefXSOAWcDCSS4SAvpMKveAQVMTS6pRCuMKdghOce+dFxZufZiuFgKpR0Hd+0xmjXxEIbQ6Yf4wyK1JBmE4AUAl+p4eBubKYDnXtgcNsXUmQDZvFM3OBLFtf5veThI79MthhAFjJVBAFDPWQhBcpTWROvAZvdDmEcOYNAKXd/ZQb4OGQHhZR4vk9qNJ1Oh06nS5JovCBAKukelqWCMWy7ZPdwM+aadc+G2y/t635WWEYFo7gPyWw9WKdSZgsRXCdAkKe7OA30xLh0l9yAhSxdVCqk7wziSpYywtChMmo2lze5Ell6iZQSNx3lKSvFaKj7PY8K2byGKZOGTJKUNIlHiqC4eUIM7+rclSXwpHIPMUaTFrTP8yVlZrYOowpZ2Defo/LzejPRjt18Z8qs1isMQ2YrPrNzMyaZnjlfGyQXPrx00XRrDdaOHKVar2V9Fx5uxm6Qf/77r457E2PDPXQKpn1/o9dsLdZaraS2uYlJNQTu5jaZlzUfQFRWtDX2/PJt3u5rwpY3uEuvO4AOMzK2hr+MsVidkA9OMkslUULi+dtCbsZiTOrC4cYNKVpbii2NbWZ0C+GMd5dyIoiNJjJ6qxdxixe6sB3rBjfleQglnPfBJfZng53Iogi50V84fm2xaCeZJQVIb+QFzGx+k+fF5Pu8w/cpZMFrcROhxmsOZKdlb/TF7fTxkl1LHkETZAXAxqWvFMP2QriwrrGWKI6JohBt0kLXWjOSKgXn9cM6+XlG9xO4e8UCsnBJbam/2hZmt1lUTymPNNX0+n36/T7GaJeyIiU6MxByec6S3cVO38h2Y23oL80cDsXxcOvnrxets0M/SL6ea4ewrTHCfNzOm+gJFw4ablcxUmYZ2aSWQLlOlMa4vhnWaNJYj2oZMkUzlc0bsuLunW6vl0WctnqdcyO3qGyVG+gjQ9q9mM8BtpBSk0e/rbV4vk81qAy971iLa+WRl1TaYTF0njOubYrOO3tTUH2x2b2cWd3F6Kzzym87vQWn9xZnOAyjvVtjb6Pv7Xpc973ryDVt9bvv5IVn6IzIhx0hXUQvjWNqjTrTU9OGRntxqTW5xMycPfTzf4aZf/1nRn1EHnLGbpDP7Zx1dl+Qh4JMvbWRzs0szOzZk4Rr64RRhBISmbU7zxa74RPtWPfxDnDt7TX6TWYDqQsxMqwqzz3boiBVWGzHe41SQz4JZIOjJfMUmhQjcjUJQIyuma1jw8ibkg9A2jhFm1G773xAdoNgNhMUDsc6LfA8eGoFWTbBFqM8/+/dzu81E1tps5QUyCf+ocduGC3PPGbSNYPSaUo4CImTBEwWChcjtaPRw+homt2pMdDNYsnuACFQvkeqNZ1ul26vhzWGIHD560mqXWOr0kO+a7mVIefWv8WbMc5utMFRD4a8mdl2M1HgrmUBmFQTp7rgUXYyf1bILffM0OjOC+8zWUBbEAKAfK4ZNQLK15nXe410vLfGYrMJbxTsEsI5cozOPNxyKAI2fObNjWpjMxvZYqVFqsK2hicv26+h9nuhX0X+FHWrX9ZNfyl3D4H7DpI4ZiIImN2717z8kQ9dPbe4GFb/4T8mSDXB9PSo0d1u53M/MtbVj90gP3/00Lg3MXZEoxFaadfmDx1K+xcv8c5mh6ryqFYqIyWQ/MYXd+t+2CEufs1jNDu7mHdc3dbn3uLY4TqAZXnbwmB07kUAg0CY7ftgh97v3FtQNM6dYe8KJnXWxct5/XLPwrX7nN/YUBhvbVZsagp91oRA5O4FOyqoK+6fECMPobWj9tD5FDBs5rNtcB99fue4hN16BhmNrLfAtZsrud8Z3qZiOPEO38qusTiO6YcDUmMyT6IYTfBi5H8c/i12lqcT2/8QO83tuYvOPSAo3yMOE3r9Hv1Bn4of4Hu+K4IeejhH3YhLdhEi988WXyqGSArf/XUc4KOgXNGi2yEieL3B6BqnhB2Om6MxfzTu7zioZY6dNE1JMzWVvLukn3WhBkYFoXakgCWEwMuK8rcemB1GdZzzKK/DkKO3Gf0M1U3EaC5RYvR3kqakWrsmelkXUyFHDxzGGidQkLe7l6Bk1lyLwoayX4rKKjKXORUCq4vKRjt9D5kj6ZrH9R2XLPw+PDFbF7lJdtpi8ZoYPUJt3ZQ7H5qG59GYnBxceOz4xlvnT8P/93+HrGvofcNf/oWxrn7sBvnbc/Pj3sTYiatVJrTpvu/QQd19tcUbi0uoSo1qFoKSQmQeXrYUkdwNrvU1XPvqja26kVFvt7w2+i1NE+IslUQpifSK/dGywSX3WmcGuBswXcZhLhm4tZiRYQhPeR7g9NvtdcJsFtyAte1FpbYZN7kFMvQkbjNkENlYZ4aGjRIe0iscd3E+s9cOM9v3ofi6tcNEgmHKwo0Q24wcuyUksPNn332Jkt1AHvaWxedjIQp3aea5M4YwihiEA7BkHun8HsoeNjMjXVtX4Sk9dy/kPscixYnzXUcj4Rq3GK0Jw5AwHLgiOs/L8j9LlZXdzJbvuDD87+Qy2FGjfkfbe+cR5hq7fdsGiuvMNIRG0VPrxsYtiS3CFTXnbmY3vyiqxcizdfVBzuDdOhbnKYd5PVdupA8VWWz+0CkKjiFnIBtrh+pFw/ohM6rVcHOT666bp8F4SmEKRaraamyaW/GjdCDpy2GjN0v2EDIKjbkx3+befMiqTRFSubQikUeviufUbj3/W9TTCp71a77F69kE29luWO/Aza5q21qtxTWZsmCQZy30srcVw4SbErgbBnm1Ou5NjJ0ecKBe731sarrXqlYJBwO8ep3cyyRFnvN1U1Pg/UV2ExprRsUseR4c7OxUyQMGjDwUwNBoLzr3BWIoH6mz7ey4G8W8wOK+iUI6SiGMmZvjI3MizysnaxAhRwOWZGQ825ERfkvYbb+XlvLDS26D5BNnfq0L3AOtlGhNpsLgOssOoohBGGIZtSY3plDQmd1UxphhJKnYTvu97KpUCm0sg8hpMDfrFs/z3Dbuk0hyye3zbnZW7rLZyaC/nvMk/23YPC/POy88nTpBk5HDxFiDkk6P3FqbNakayXMO93RbjZEwJqvzt8P5yeZRazMc5TND2GBNNjsUrFiR71DhfLiVZ10pss3Lwtw2NPwLbiQpJVaOHkRsnuJZyLvPDfeiw2bkwLq5+WfkRtvluBOAi/axruGigQG+R6vVqsp+P7btdqlAnjF2g3x93Bu4C1igA6FR8pw15iNJHHuuY6cz/IQEaeWw4ApGA834CqF2sojvPNY6neLAy3P4bCbfNDrO4cAi8oElMyIKFehD7zVkT8ujwUwb5wEZ5sZeZ2q4piWwIDvnhfOdLbd9UMtTVwSZN8It6FRWsmLQ7VHCYdrKzZ6r4bbzNsfFKELJruBmv847+JVlWeQgGdZc5J5ya1zRWJSmRGkKUiGlGqqw5FEnRKEZ2ZZKTXNNDZYteOu2H07+WJt7BpXMU7wEWhsSbUiNAKGwSJd94MJN156T2zqX9+ALeNC5ThHezX50WKx5vYVusPq8yY7dvmD2mjGFfPBCdGiU5bk1BcUIjZFqyxieCwAUC/+Gyw/Hbb0lPXIonStz77cb563RWHQmHebWq8Soc25+HoYPAtn8sFM7esBJ7BYOPX+Q0Ho0f1yT7pV7xfO7sVDkDSOpSGBbxHT08Rt9J2O7c64JxbgZdTv51eD204DV2fgnQivlegoxtRqHDh0KfM/TemqqNMgzxm6QPyjDqkV0rfRe08Z8MI0GjwkMSrmip7zxgFJqWB2edwjbHcf/bpPgzbh0d37fZi3k84jcTp+zbsFt27M7rLLgrdj+TsGT8m57lg+uduv8MNqyGenP5kdu2S5xuJUtW7XXnq+hwXNN7PDGV8Dt9F+8Lzwj9wE7fTPv9dzmk6W7QnKjJKuRsGB0gkQhrHHayspDI+jFEb0wAumaVaVJglQeUqqhUeOamDhjJUnTLOdUQZbGstP+b//bGeouDI91CkpuvT5WKNY3e3heBSOy/gHGWWx5zvpO3tQbeVav97fdcYndMVreT+zkltlp9LneyHqzZzy/nm/0+ettd2joFg3ZwpL56zLrqDmy+9zR5NdKPp5nbjBcLrilaABanELW8DzYnW4MMTyaofPHjvZ6p2fPG5FHXq85+O3LbCPXHS86gK79+M3Ny+/9ztnpu9lKnoI3PNzh9ykLx2dxmvVmGI0QVuMJi23UzsWTE9/SsKrCiNra2iBYWUnTsjZlyPhVVtbWx72JsdOvVpja3BxgzBva884pJR9TKi9SdKEmC3hi1Opa3si6Gwt38qLe7nIreq2vZ5gX/9rqrc7XuKUo6BaM8S1LbTuvO3uw8wlg53WY7d6KdzHGt3ONN+hd9rFk91GcdMf1beXdX/MIjMB5DCUWaS2+UgipiI1hozdgs9d3xrJSpGmKLxVSChfxzdfpqaHeviecJ9De5L2zZd8yr52xrnmHUj4Ij/XNLtLz0WQNTsjbbZXm8q5lJ99GgZ0eom5zMzfFFg+u2MkUvWbpa9Mgd/ic2ckZs0Ph/VBZ5dqFR3fKcFtuJLjWaSR2+NyNjqK4fHFnrvMBW/hf7Gywv9sWr7/Su4HY+iOKY9AwXECaJmBTJhpVgqmJS+FE80ULG3pykvWPfSz0l5fR7fZd3O/dzdgN8p/+2tfHvYmxY4QgsNa0rNhMW61eq9V0UmU6RQin0zsMawmn6yvkdWvS7xA3ufab3ol3WfC2D8bu8Nsd4k6s8D2tYwzf8LutsrSK3jNDY/xW3L23iIBM/YfRZCXsMHqTNxIx1hAlCd1BSC+MMLjCNink0OO3fb1bOv1ZkeUc2K2T4bscy1CGkeK+WBLtZOeSrBBbZeldufb0rZyerI5654jXLa6r5DrYd4+xvet5fq9TyY4e4Xv77b5bXPJ6EaWbXcOtLnbb3Kn5+71+TBQdTduMcRh2IXUPNwaBs4tsmuAJQaPdpt6qGS3TVA56mqef4eJf+SsIrbGlBvmQsRvk+9a6497E2BHWYj0vMa32JW9yenFudpZYSuI4RkhXiW1hGFb2PG/45F1SUvKQklmkMq+Gtrmv2f0ts8Y7vXDA6sYam51NAHw/IM/BvTZFy2V856We7233RuuWmSrEIAzxez3iKMLaUaOTciQrKXnIyT35OwwGLiiRGePCopRAAYMoIlCSg/v2MXnocDiYmtnUQqYoSXT48F0/hN3O2A3yy0ePj3sTdwUhZKqq1SveytLy3rl5rq6uMggHVOsNp9fLqBLcqROY+0fsvqTkIWJoxhYzl97FY3a7Bmnugc79y5ZM50sIl36CZRBFrK6v0+t2QQr8SpCpNGSNQwrFbfkO5vmxd8pQlsoVbfezjodRHLvXMzWXGys/jN4rNj959zD/uyV/lZSU7BZycQabjUtZZhF5vMtgh06IPIo3GAyoVQP2z83hHznaf2d273pfeJpEZw367jMq/lhXP3aDfOl9j497E3cHKTX1+loQb27OvfF9VlZWWBuEVGsN5+li1InPyS7d6x0uKSm5GcQOxuPNpIHeYI2F/11KiYChDKLFgpRIzwMpiOIIYwz9fh9rwcsaoeRepy35psMCsFFR2PXSQt51LwsqQnlO+WAwAOs66wGuR0Durb/F9Vt22rdrU9juVI5zSUnJmChmwhUUyYYFrS5Hzy1o7TBzIAwHxFgmGk17Zf/+xe80m92N59+Edy561CrpPTiS98Yf/cxYVz92g/yNmYlxb+KuYIEY7JN75/on9u3j9Km3GfR6TE5No5R0esKpxhi2yDOVlJQ8bGSRsqzpifOQuxksVwwVYmR4R3FMFEWEYYiQAk96hfXczLbgvWZl557wwWCA1po4N8i3N+MqKSl5uLE7/THyDEgpUVKhJERhSAiRFwTnwqn2+XUrUr72Nvzui5KZ1t3f9/fK/W6QvzPuDdwl8oSUg5VqMj05aQIlZRLHWbHTqHp7S3vgXGy1pKRkV1FUghibykpevJlLDOZ6yxikkK4bppSk2mC0RmvjOgkWJD63pIpkNSq3JAl0E+S1L0II4iRxMo2FroXF7e08mt3s/tx4LCyWppaUlOxCthV35+o0VuT9DPIsgSwN0I1tYQrvaF8uoK3gQmh5pWvYUzoutzN2g1yPewN3GeupJRUEb1p43CSpEq7yaou837ArWUlJye7iOjbh9vv1uqbjrSaZD43rbWIuFtcqW4BOU7TWGGvx8iLK/APXrLfQ8a+gsXy7j/15gyAhJQpI0xSj9bA5SSnhWVJSUqxZuaalSNbpejhWCKcwZTD4ShJUKpENgnNGqUUsllBDN9E077+MlXEzdoP8QUNLdTkOgm+j1JQn2JcXXuUSZy5X1G6ROi0pKXn42OLpHpZ1jrKqVdZeW2s97G47xG5dx86NsbZnYd/6/lnAaO3CzEoRxzGaUapKGd8rKSlx2KxmU2wdG/JiEZlFBa1B6wSjNa16g5nZuZhG40Ki1BJkyyppUaWFtJ3SIL9FjOetpLX6SeUHn/CF2CexYDXWGpc7bkXpIS8peYCwcMMi7XdzmptCBG3oRbJ2KJdqtqeH5BJihc8UI29FbfMb7fO7keeN553yconDPDXGZr0VpLpTsofXKZUV17xSPgmUlOw2sjRxWeigqk0WYUNmnVadBz1JEmSaMtFsMTe/J6HRWko9f53UwiCGzgCawb09nl1IaZDfIiaorCbNiZPWDzYU4ClFYi06TQmCCkJKUq2H7eRLSkruX7ZnjdyKT9p9NlNVEbnSisnKS1zRpzEGnaauf4HyEHbkUc91f3Mjubgvd2JoGXbr1BpPKTyliIVrEIR12uTD9t7sYCMPd6bUSSkpeVgQuUGedzm1TszVZp5zYzRpHCPTlD3tFvP7DiTh1N7FWtduPBb14bmjKF9Cu3pvD2QXUhrkt0hcrXZ6s7NXgqmpfjMIsNpghm1/3QVaGuIlJfcXO5mSw9du+34eGdEi+zfPzc4NYWut67hJ0eje5j2+nmN5h4HmVkxiW/SMM/LAqyx9xWiNMRop1XVS8LZ7zsWOf21d5lpVmNKMLym5TxiqRIlrhqUsnuccDVqj45iJ6gyt+T3plbl963RJn+734cefgc8/Wwpe7EBpkN8ig8CLuocPrB159tnIXrzAOysrePU6rclJur0eFkG1WsMYgzEPWklrScmDx/WmhS1pKgXrMi+EBJAChJAImckbOvFwAJRSKCHQWjPo9xFWMDU5iRSCzuYmG+vreJ7H7NwsCKdHnoszFbW/R8Wb4obPBjc7vQ0VVTJpw2ajQZok9Ho9fM+nVqvjeYrLly/T7/XYt38/9XqdJEmIkxhjDEophMhSXoyLCEopEdkDh7EmewS5QUJPnhe/w2kuKSnZXeT3stEaqUApD2MtGp01MgMhLLV6jbjbYW1jk9bhw1T37ll5bf/06uJMm9bAd811PFUa5DswdoP8QckSskAKbALn2s2NDxw7mhye38urly4TKMVMpYLpdDHWjJoDlWkrJSUPBNZabKaxi83yrHNlpUz6FOEMdIu7940xWX+ClEqlgq88kjgm7PeJw5DpiUmmZ6ZpNhusrq3RGYR4lQrSUxTN1C1pKncwO0Rr7VJnlEJmhaVxktCow0S7je95rKys0NncJApDms0WFT8gNSlpqnHRQImnvOFDitbOEEdAqWBeUvIAkfc509vqYSBzRhisAV8phLFEgwGBUGnQbF5ebVQ21z1Yb9W2rbCkyNgN8va4N3CXiYDTED8mpW74Hr7vg7WYNMX3PbQ26CwUXRrjJSX3KYV718LQI44ApeQwxcQYjdEGYw0q85SDxVhDEqdOtcRoDh04QK1S4+TJk6wuLTEzNc373/8shw4f5uKlSywtrzAIBzR8DyWc52l7Iakd/rN1F2/VNs8LRn3fx1pLv9fD930ajQZrq2v0PI99+/bx7LPPsrq6ym/8+q+ztLDA0WPHaLfbeNZjM9xEa40fBNSqdQwwGEQYnWKxSKW2PUFs2+uiEHxJScnuJ6tpQSpX0KldBoAcGuMGDSRJijYGKQTGspoauwC21Di8CcZukA/GvYG7iAC6wABiEwQbzUoFT0oS7TxGvh+ASEmzIq1Sw7ek5MFA4FRHtDVg7FCRRAiJwJDrDljDKF3NGhqNKrVqjbDfZ+HiJdaXFjmw/8DgY899fPDs0083Njc2KhfOnqXT2aTVaiM9hbFbJRC3Z13ndu7tRnzzFBjPc57tKAzxlKJSqSCAfq/P5uYmjUaD/fv3s7mxwbe/+U3OvP0283PzzMzN0qy5tLwkTen3eiAEUkqCahUDJEk8LGYtKSl5cBDDRmcGhB0Wh7tacFekjjF4SiKUf9EI9bZFRPd6v+8Hxm6Q98a9gXtACsZKdUH53krgq8koTVWSxARVF47p9fsopYYTXklJyf2LS+kWGDKvUGZkKqUyQzxXUMnkTo1FGIuvJI1KlVqtxpl33mF5ccnu3bsv/eQP//DCRz728ZX++tqxN15/vfL2O+8QVCrs2bePQRQSm3TshmzenRNGqTVYqNaqDPoDrly5wjvvvMNHP/pRfuoP/2HazSb/4td+je7GGhVfMTk9Q7VSJSRis9vBWEu1XkcpiRICazy3zpKSkgeCoqiSta73ilTK1c9k9XLSgk1TPClo1hvQbJ3Xyn+rPYjCbrVKPbzP7fJmfayrL4s6bw9thLiA9M/5ftC0carSNKWuJMYqjMk0yUtKSh4IPM8NlfG2dvZ5BztjnFqKVBJPKZACpQTRoM/m+jrd1RXmpqeiT3zmMyc/8MlPncb3xUtf/9rel156MUv98HOBxMJ6i3+Mfs9TV27LZrej3E+tNVhLEATOUx5H1OsNrLFsbGzwveefZ6Ld5k/8zM8w/Yf/MEmvz/Pf/Q6Li4ukccr0zAy1Rh1jDVGSoLWm2+mgPI9KpYqQkkQnXKvHUFJScj9hC/9sbVKWK0dZMO7eNsYQKEW11SKdnlqsanvx06+8lcRKIu/3h/TPfGKsqy8N8tsjTaV8h0pwql6vP74+6FfiOAIhUErd630rKSm50xQkArEWKQTCWlfglHWvk1LiK4XnOcnAXrdD2NlEYDlw5NjS05/8wVc+80f+yEu+EM1v/vZvfezbf/D1icXlJY4/+hjK8+j2s9SPa+QEd9id7P/b9aMLIUiSBAFUKhW01sRxTLvZotlsEscxly5e5Dvf+Q6PP/oYn/roh3t/+k/+zObMZMv70pe+3Oh1OrWVhSuiOTlFo92iXq8xiGLWNjZI0pSgUskeGMqUlZKSBwU7/N9mEUGLM8eFU1gyliSOqCnJzNQUdu7gcr8ye2VqcyOVaYotU9huyPgN8nDsW7i7+EAsTOJVL9NuX2y323p5Y20oByayXMqSkpL7m+LUkaauJim/vwUCjMValz8upfOMSymduoixpP0Bylpm5+Z4+kf+0Dc/+K9+7nf2Hd3vvfiV3//RP/jib37gyvnzTMzOsmf/XjrdLmtX1wkq1cwbX+j2W7DOt2ij20JO+bWLXvd4irUtFpd6Y4zBaEOqnSLMzMwMYRhy9sxZ/tE//Ie0PdH7iR/54Qtx+q8MksTMv/zi84+cPnM2WFlcpFIJqNfqCCEZhCFRkpAmCUJI5BZNw+17l2fFl8KHJSX3C/Y6P3lH4XAQ0qoF7JmbQ83u7y/MHOrQmHUSLCU3ZPwG+c+NfQt3lxCoY5OfnFoQj+y/MnnxnK4uXKYfxqRpgucFmUavKPPHS0ruV7bdujqT+XPGslMVMJlsoKcUSkqssYSDPoPeAGk0+1p15g49ebn2yBNf+sSP/Su/c+LofvnOy6/+Gy/8zu/84MXLl2hNTjAzN8tmZ4MwivGCAKlG3TG3mKY7KK4MVVi2L/tuh5blj/u+D7iHDWsMUsnMa+4eOubm5lhfXeW1V1/hd37nd1tH9u+ffPrxR8/IIHhDV6rvpEK+f/HC+UNLV6+y0enQnGjTajaoGUM/DAHXVGh4KrfLxFzn2EpKSnYZQ3EkMfxfZA3FnGNiVNwZDnr49Qr75vewdmA+XthfT1VUQdzv6Sp3gfEb5L869i3cdawn7JV/ZX516pljV2dPndMTZ95hodsniiKELIs5S0oeNPJulkq6lDSjzbC9vJIKawxJHBNHESKOmWi0zKEn3r/++A/+4O/MPH7iV04cO1DtnX7np77xq//sY9//5jdaXsVnz8H9VOsNFpeXEEJRrVazxkJbt33HG9NbF3IOAtclIhwMhgZ6miQkcYLnebTbbXyl2Fxd5Tvf/k5tolaf/2P/xr/eO/LYoy/8yL/6Y6dmJif0C9/4/falixebK50NFacJs3v2EFSrhHGMMeUYWFLyoFAsAi92HdbGYDEI4YrcB/0BYhqmpmcGl+Zb3VNTUNUKYcp03nejzCG/HQTi9B5pm0fmO0/PTtuJoIbRhiROCAKDktJdpKVRXlKyK7lVp2zg+8PIl05TLCCFQkmFyKQD4yhGKY99c3McOXw0rj77g3+39ewP/JOnDvpBdO7cv/8HX/idn//e916gG0XsP3yIRrPBIIqIogjl+wRUh/uW/+QMhxLx3pM8cg88MPRqDVNxhCBOYuI4plav0263eezEo6xevMBX/+WXalrK+k/+sX9Nve+JR7t+4H+ll6bdmblTP/7ma69PX1xeZm11ldbkJEEQoLV2DYR2yBvdkiW/868lJSW7iPzeNNYVsLuooHE9GgQoKRFCopMUo01EELyxFKirFwGpoMzkfXfGb5A/+Wtj38RdZSOWdqbqL0/8ULRIO/5Yo2lb1SoCiJOYitZ4no/VmR75vd7fkpKSG5JnMm99rZhn7Rr95AWcJk3B2Kz7pkLHCZ3NDoHWPLN3PzOf/MRr9lOf+JXmI0/8c6/qLy+dufiJd7769WPPf/vbbKyvU61VCWpV+uGAMEloTExkLehTlNNqybI7sjxysXVvRv8WuEGV59bUFzE0wqPYFXV6nudkHY1BCEmlUkVKSZqkDGyIX62gfJ/u5oZ/8dRbP/jGCy+FqfR/68ze+e/FP/KZU0cOHb4y2Zr6iVNvvvrkyXPnWA4jDhw6hBECnSQuG17I4c4IQFiRndniPorRoVw3X8duPd7rH+m1n9np7fIJoKTklnCORjuUgsVahBR4nocxGqtTtDbr1g9eN0pdBTCAKY2hd+UuGOQPWM5KtyuZmJC0HyG0z3SU559RlnmSFGHck6IpTDQlJSW7GzMsoNzul87/FCRp6rpxSoESEqUk1qTEcYiOYtrCMrtvr5790Ae1/syn/9nas0/9pQkw/fNXPvvyv/z9H3/pK1957NS5s1QaDerTk1ip2Oh0SK1hYmIKrQ1JlGRNN3JXkpv4rMlMVzHap8Kv21URh5+8HnnTsiROsNZSrVbBWrTWCCkJKj6eVAzCkMFgQKMS0JyaoFGtyN7a2oHXvv2dT6+E5tKVP/SDb64cO/TleHLupflmu/v+RvD/SJNk5uzlS/TXV1FBBV95aGsxjMpULc7jLxHI/ADsSEbtvXgxbvTRckwuKbl98ltVu/AgSOEaoQEyK+hEQKAU0g/WExW85id60dOGahwjH4SMgXptrKsfv0GeVsa+ibtKkmrSisFIEGJRC+9r4SDcE3W7R6v79uEHAb2+608qxXtop1dSUjIWpMiaW+DyH/UwJ1LhZbKGxhjX+MKTKE8RJRGpTvHrNRqNOlIbVhYXWFtYIrDwo0ePceiHf/DV3//MD/+NpSce+8JeS33/1VT0X7zwxMLpdz5/6dL5vWvdDnunp2hMTWJ9DxUO6Gx0SFbXqdfr1Ot1bGpBu26gaIM1GmN09pCfp5YIpHKa5wKB0fYaOzaXJcv+KPxnEUohlcILBEZnxy8EZJKtSZoSmcR5zD1FCjRaE8hKjdNvnyKNk+NHjxz6T1tRf/UkfP/lqerVI4f2/sOPXT568TOfCv7cy9/6xoe/+PVv0N6zl+NPPUUviohTgxUSKwRaa3Sa4ilF1XOpQGmSECURSIXwvIIm+yhBp/jwsZOyjPO87/y+FflZyd8v3XUlJTeNzewZAGuwVjqZQyEwwqAthEmMSlMalQpBu70ZBdW3nzp/ZW3v+cv3v/54zqc/NtbVj98g7+mxb+KuMrBW+KmdP32ex6dq6zKJXrK+9/GqUke9LEnKYLLufeWgX1Ky28hDrspTCKmwKWht0MappsihJ9e4wkQj8CsBvvDxfMVg0CPu9Rj0u+yrBRyfm9+o/vRPfevkT37+n5ybmPgX3c1wTVzZmOzN7ekf2z8bHZKyvicIuBwEdHpd0qVlgmYT3w+YnJwk1e6BII4SMK7bnQSEcp54ZRXWWgwWMl+ztWBSM/QsCyGG6SgCOfI841pc5/KINjv+XMbRSkiNdqNV9nlgWOSplMKTgl5/QLSxQQo0fZ9WGEbn/CA6k8RsfPELenpgTqvDj1+pHDkeHTDi5z60vPr0pcWF/ZfOnpWtqSkq9QapgUEUo7XGU27d2liSOERg8f3AdUO1tygbcx2Kxruh9JCXlLwX8jS6/HeNxcisH5C0JDoGo5mabNOemO4lqXdxcmGzM93rlvrjN8nYDXIxZhf/3cZ6PrLq89xbJ3lOxnEv0YvezEx3dnp6qLTgez7WuNay5WVYUrJ7EIA1BoRFWA+lFBaBtanT4s7yqHPj1miDJaHaqOH5iigcsLayTNLrMdtq8aFHH1t94ulnvvk7H3/ub31rYuJ32kDr5FV/4+VL+vS/Wo/7j02+/OSTj//242Hvs6tvvzVzcXGBhYsXaUxNMjk3x/TkBNZAp9Ol1+mjpMSTHp6UqMyTLaXnijmt2z+tU+c11yZTPMBpfkuFlK54qmhc51rgNku/SdOUOEmcZnouXWYNNuvi6SsPL/Cz9BmL0Ibu+gZxt8PxQ4c58fjjp/szc798dm7+qxvnL8B/+B+hpvYw+J//RvhiEPyj+uHDF378T/zsz33lC1/48T/4/vcP1Gp1KvUmiU5dTrkQVCoBAkEUhoT9PpXAp1mrkWiN1im3YpGXY2xJyfixhbFGCNfp11rrxhAl0UmEpzXzU5O0p2eTDa/a6VZriVHBPd7z+4exG+Q/9uOfHfcm7iraWDwp2DfRoF9t9cOGd7Y+t39lZvIMa2lKGkXU6g00Gm3Se727JSUl2xDCpaXEcQIiBSnxfR+ZFR4arTE6HXqeXd64IBoMWLx6BZkkHN+7V3/4wL4r8kd/7De+8LFP/tqp3/zN7/Cf/gX6QmPf/3ntP/HpQfUX/xqX58Sb/+SP/am/8fH5mTd/1LM/8c7s9BOvXbxYv7S+zmI4oN+epNFo4iuPdqOKtS4v0xpDnMSEUcG3KwVKCec19z38QKK1JUldLrgVzrustUZkXnSHGT5g5Pi+5/TGhURIgRTuGD3lHgaM0XS7HdZWVtlcW+OJPXv4+Mc/nu6rt1+4+tQTv/KFj37gt99p1k5yWUO97l96+Xn7L//SL6TrtQ32ffYHn/f/yL+bPFtv1GZ9/4+/vbbhX75wAet5TM3MUm00XAOhOMFaQ2uyhbWW7qDnJvssbcilFY382qKYRr9NdSanqM1eZJT0UlJScjvkKXDOiZE1SxMC6SmkkoS9CKUNR+b2YJ58NPzGRx5fjmp1/OhB6w45PsZukNd+4jPj3sRdJVcoOBsnnEQmwlMXptYW1w6dOcnahQtE/T6tVtsVSd3rnS0pKbkGicRaQ5pqrAQvUENJwzRJ0DrFGounJJ6SYA29zQ2isE9VCI4ePKCffN8zp2be9+xvv/HJT/6Tlyemnk++9+2Uf/HrpEC64ZuakWbq7/1d2X3f0c7F//Av/MHZg/uuzplk6cjK8udqr7/23MybJ9tX19ZUd2OD7iAkqFapVuv4QYBVgiR1BrXFpapYkXfCExjnLsdagxUglSrkibv8dwqyq0LYLH1OZiktLh9UKYWvFEpIjNYkcUw/7mF1igR8KdhTr9nJOI1OfOhDqwd+6vOvDLza/3lyfu43Xj+6bynphYavf8cnSuQG6I1v/B5Y6O+f7cb79/3BRx97onG4Eqj0a1//aPTi94+vRqEw4QAbeAirkcKCJ5GeIkkTYp3gKR9fqFIytqRkl5GnrCgl0MaidYrneXhSIYUgGkSgU2Ym2nQP7984f3C2o6UEmvd4z+8fxm6Q//b+6XFv4p5grSX1PQxEn72yL3xkaopXzp4ljGMnu5sVEZVemZKS3YRwxq2UKOW5ok3fdzKAUUQURggstSCg4vv4SpLEERvLK3gCnnn0Ed7/xKOvVZ588pde/MQP/d6rE6032q99o7Z58e04gRTQvPQ1OP+66K9fru7f8wPihLXRm5XK+V967rl/+kOXzn31mXrlTzwyM/NvvnP+wr7Xz54XK2trdJa7RNU6E1NTVGo1kAK/GoCUiOxhwWTe7yRJhk2IpJDU6nWk5zkD3YISTgGhcMTOEM90xk2aotOEQEkqnjPIB1FIZ22VlaUlkihiqtXmqcce5ZkTj4YzleapzR947pf+4LkP//M3lbdwCXoW4K/+nQq/8JclrMW00OwDlvEGgRanjdbLgi8/9skfWP2YFT87Z/mj333n1LELVxdYXV9jz759VBt1wiSm093AANVaDWHFMDQ+YqtxXizuzIVZimKQIv/nBlKQJSUlt4rNak0koLP0PlBSYLEkUQhJoq0Q68L3z1CWbdwyYzfIB96D352p0mp2J9pt0IYkjFyo22Zh1XIyKCnZVeS1HUEQIDyJtoYojkiSBCkFtUqVWhAgjKGzvk6vs8n+Wo0njh/tHnv88ZfDj37kV187dvSLl8PNC+mly2FqIx8lNK52kHh9jd7GutWQNBbOBQd/9X+tnf2JfyPqzR1dVKu1xUuPPRZdevypC/uuXDrx6Vde/Ujn5NvvW1pZnbjc77O0usJynCADH+F5eEFAUKkQVKv4vo+vFL6qYH0PXakMpQIFdmhwC+ENe/FYl/8yPHYBGCVJDHTX11ju9UjjGGEMrUqNpw8dYqbd7tRbrXcOPPbBs95HP/7GK08eORXNtr6RxvHJwa/+U+zJk6o+M1tNvvoFm7CcAoYAqAEeFiFsKoWJAdsdnPQ+9Yl/umdyYuPx3/nyH/Lt99+/sLww0V1bJmi18CoVPE+BUni+h02zQtptDZCuMbK3UXxrWMA6rGItDMPleFxSclvkhd/gHJIuf9ylq6RpjI4jRKpT63tviyA4QzYeltw8ZafOO4D0/SWvWrkghdhntfZsmpZyhyUluxSXBiLwPIXFEscxSeyM8UatStX3QWuifp+026MhJc986EM88alPvdybnvxfX3zy6d98sVHf2PO9r9b2LF2ob9aavTTSNsnWr4E+oCqtRJ59C/WP/ueG2L9XiR87SiVOON2eeOsr+w6e/PTaytQnpqc+W/+xH/upuY3Oxybeemtev/KKp5eXfV9JX1ujdBQSJxFpNMDzfTzPw/d8lFRUlCI1hjByToC8U56QTqWFLH3F2kIeurX4UlITAm00YTSwNorSZqMZHTlyOHn26adqBx555NVeo/3PNw8986XX5ve+/g27Hk0moT1x+iz27/xviK98RTXm52S/X40T5hJYA5O6+IBFu8pSxcz51cbsG+/4qz/wwe9X3/++xSdjfW5qZupPvfn9Fz978colwo0NQatJtVZBeJ4rqh3u6/Ut55sZWUtfSEnJnSUvFM8f9ofdfQGdpEgLFT/Q1q+cS5V3ntIgv2VKg/wOYIS8YpR3SgXehCdpW62z7nTllFBSsptwzStcE4skSVzuchITBD6tep1apUJ3c4O15WXSKOLRyQk+/OijNH/kR/5/r3/qU//b93z/4iUhOpU0MfH01GDi9VfE49/6ffvyqyc56TYhyWTAZSQQqZcS1LpWKSOA2vQUrelpSBL7/N/8f6+9M+h/iX/wD197QvoHnvi9Lz/52emZ93vrqx9OPXV4MxxMXFpZVVeXl1lcXWN1aYk4TgodgAWe5+MFAUK6vHijXSjZqaZkeeTCpbEoIbDW0K432Dszw5Pz8+x5/PGk0ahdCdqtl5iceqU2Pb18+dDRM2cOHDtz+uD0+Qtvnw3j/+6/Ye3ll3i13qD75pv4vpdQr2sSaUcFp7jZxMPJuliLNz3dF9W63vjWS81DjxxMj33mk9/1Dx66ENdar8++/J0//cbJN5tXVpaYmpvDl5I0SZwOo5DuBIpt31u2NekOfet721/L9ci3D8Gln6Sk5LYQUroGQJlsbN4PAWtJk5hAebSaTS0q1aVUymUoy+huldIgvwOkyjtvKrVXGo3GE7V+r220xuStoktKSnYXUoKAWKdom6I8Sa1Wxfc9knDA5soKaafD8akpjj333Gr42c987ewHP/D33vK8by9duOBVw0js7XWZOPWq2ff8a96+V9+qJ7GfhPPzydXmqo09p9AS+yFRq2JtZTL1a22i1PLa//Uv6PV6MDFF7zvfsb0wXOOf/Z9rRz75mTf85z7xndXnPvqMDnvfrW2sH26ubxw7ceHCvrkLF4L1K1fqnbX1Rtzr19IoqmNMBWt9pXzPr1QkUmCsk0K0xjiL1BqQQgsp+0KprlCyZ61Ja1PtzsShAxuzjz6q/WMnFjvNqTfD5uRLkeef6qeDpW61tjmYnjILQDfqwosvEL/5JnF2+rxW09pKRVtVsG5DYAXoAm9dgX/6K2ymvj39/VeS6MIFU/34R83kn/iZtbceO/LG4twf3jh2YLbl12ufq7/+6vzi+jrhoE+91cJIO2zUVPq4S0p2H05q1aKURGDRaUIax7Trdfbt3WeYn7scKHn18bU1G/kefvoA2eXT462JLA3yO0AaBAu62TrTaLUH9Y0NrNEgLQJZOmRKSnYR1kmMYAUYY1GeRzUr3owHPXpr66SDPntmZ/jUs8+if/iHv/Jbzz33504qtVhdWKg8/cUvtlpXrkRWqWT/q68ycfmy169VW0dOPNrz66vJ7+3p2biepW+ImF5XY0NLtdbGrKzyzb/zd+GF5/PdcQU2/86f0f6f/fOs/sX/rvPFPTPfWfLnn5+3tvKhlZXJx6en988fPjx/YGNzvxyE+2Ucz8kk2Ys2EwJbxZp5q81hCz6ZgooQQiNEH0EXKRetFIvWUxeMJ69YIfrJRP1cb+/0O5vHji+emty/8QoyGiASsn4fswn2eAjVgNwmlmxN6b6WXvYD8KXvw5f+PZaAJecl26y+c8pXoj7xpT/xR9qdo/tfbHz6U//5iXo1afn+v/u157/LymaHdqOJkS4/1eQ58MVt5Pmr29/YYdlRDv27XxMlJSU3gXUipNa4hDClnNNRpykmSZiq1dm3f7/pHjq47FeC1eeuXr2nuzsW7neD/A+9dW7cm7hnGCGwQnAw0Wu99tRlKpXYl05SLM0ky8q0lZKS3YTFWD1sglMJfKqeR6/Tobu6AmHIo1PTyQc++rG39v/Rn/7dy4cP/7PmqVOb/okToFTsxXHHGwyM8Ty8MCKITGoC0Xlr5kr85tRF+tUowMOicCnlN65pNzhjV7355d81Fxau2E1rUv71fy2Nfu7nIr9a3VyfnLz6yoEDjdDSqiVJU1hbE8bUsDawWKWsbVaNna5A4AmMRAgNOhIiGUCUCLpCyoEVbFohulYIrQO1mVSD9W59MuwnfVtZeN0zJ/9vG4VLho/8+5b5DziPd/Gk3R754GfS9sRmKL3I+x/+h7h74oD99v/zP1k++5nP/OKedvvKc3Nz/9aZL//ekedPnWRidp7JPXtJjCG1Fm2yMVSMVujSzLOma0UjfYcdFoV/bXGPhguWFntJyc2Qyx5qozOVKoU1Bp0koA2ztToz8/Pm7UMHV1cOH0rq6xs3qsMu2YGxG+SPRMm7L3QfIyzEkxP9jcOHluaOHonjpatc6fWQlSp+tUqaaoYB2NI4Lym561ib6XAXtPIE4CuFTRI6nQ5Rt0NDqXTPgQNrj378E69M/dAPf3H56NFfXl9ZvTh16u2pxtQUvWo1TCuVKK3VsEqRVivg+6m0Ir1QXeJcfUkSI0myYibBu2VRWpxRrhZOnRScOmkBT87PUfm5n0urQBfiNycn475SazutQAAB0ACq2WsRrqg04t2rqqphVx0893yl+41/ZK/2l2KOfV4z/4Hr2be3jALRAntw0IsmTr0eVX/5n3g885h38c/82fRqo/nW408//bffp7XXWF356UthOBVrPTNY3wi0kshKgO8HzmNuwGTGsxQCJRXWWIw1Wb3O7e5hSUnJTZF5yPPCzrxLp9WaQadLZW6e9uzsypXJyfU3paIyZm/yg8jYDfKzTxwZ9ybuOUng02gHvafe/6zm9Du89v2XmZiZpdFqkSQp2phhIw4p5VAyKKcoJVRSUnLrjJrgiC2vFe81KeWwM6XA4ivJxtoqq1evMtto8PiTTy4/9dRT/2f38z/xf3/r2LHX/K98RctzF9rm0MFN2Whq0us4F3LDO8Xg7OBb2nVcgkvOLSVcKpzaYB1nmAtGTnkNw7zv6yKkTv3mwDQqILF4d3QQsi2wnwM+8NYrrJ59G2+wqanVQQhqbl83zyj5Dw6///1vfG7vvo9/62tf/dwrb755LGi2mJybp9lokRpNFMXYVGMB5fv4QYBOU9JYZ07yay3yoUc8F5gpLFLa7yUlt0auXOR5HtoY4jim0mwggI2VFcIDB1b9evO7RnmrcBNjT8k1jN0gfzXwx72Je04f2FsNus+2W2utwCcOBxij8ZRyk78VpdFdUrJL8DK1kUG3S0XAYwcP8MzU7NLExz7+hVd+6sd/5VJ74pvhN7+pG1/+ranm1UtKnHjUTC2epVWtUzMab34PMhxQq1YJlEeMKLqQ3+sNfsufFzf4ualPC1yHD3Frm44Q1JF8GJhje5aL+3sGeD+Ig1EEUWR9sFQqUKnQff55Vn/zN+P0k598i2fev+RNX11+/2Z/ctLK6Qv9XnOj31MrcUxQrTkd9qpPGEXEYYwwIKXAU8p1Mr3OeYEyZF5ScicYRvmtxWIRQmZODrKoo1yRnn+GiYlNzp/D/qN/DN0u1Gr3etfvHP/tfzvW1Y/dIL807g3sEqy1vW6avm2N+aiSop1do0ghc1GHnT4z/L9MZykpuTNs95LnrwkhkAJMmoJOkTrl0N59PPHIo5t7Dh/6v9958sn/z7dqE9/vfP9VPfsb/6KlTr1sWbycJCdfs0GvS2N6juiZjxHN78NbX2NlbQ0vChFeHfkQ3r8aQ4WUJ4BHgM629wUuZWYZxCbYHpnRbgysr2P/8T9m9W/+TTb+6/+aKz/xU2uhX3tp/w9+uvLM4UNi8pVXf/SNN16fu7y2itWWSlChVqugE00/HRDbmEoQOGUcrdHWXP8JZMeuQDeuUS0pKdlKPoamaYoV4Pse1mgE0G61qDbq3VSwWPW9AS99H37hFyB+wPzk97tB/vAgIiPVGaS6pIRoi/wpUkqnm1sa3SUld53hPSdElnss6fe6SKM5tm8/zxw9cWrq4NFf+eZPfvI33xiE33/sf/xb0VrUY+nQVD9dmhKdt0/bpfNXMb0+fn0RceoytlJFJAmvrq3xRGua9z9yHF89+B2JR7hzWqFLh3V+C0ODrXk3+VIGlzqTZ/UsA7z4Ivzcz8G5c4TG8K2/83d4ZnnFnvhTf2r5qx9+5vfksT3Jj0aJmY6TH31h8cqe5fUN0kEIQQVfKaqVChL3XWILEjAWbMHLbwv7iutlWti30hgvKbklsv4NJrNlpBSkWmOtpdWsQ6u1Hhh78ccvXA6nz13ga9aWnYFukdIgv1MIBomnXpfVyul6tfqkwJKmqRPSFwJTyGUtDfOSkrvDqLucQCqFUopet4tKU3P42fm0/tyHvvr9/Uf+wQsX9p8Mv/gWH/jVr/tTrcSqTz6b7tWbbKgO5zd7whhrBxtd2OhuWf+qqrlmNfJh6zsgUKREGC68+8Jbrd/VVfj93wcQBuitrNjLpxeocSA9nzZTO1H5+umPf3xwdGqy8swLL/yxb7/0EkvrG/h+gAwCqpUKRhvXhdTozAgv9RxKSu4G1hqEcPVw0aCH1Al7pqdpHD28uGn1yeTv/t1u9IXfAK3fXS61ZAsP2ywyNowQUVjxz4hW49JEs4kCkihyKZpZk6BikZktDfSSkruGM9lct8pkEDLo9eNGUH3+6pMHv/GFp45fXv3b4P+/VGUg55tNwuDxb77Ck2tvs6e6novulTfp7XOjSVkALJk2r60dIvgqVfGqH/3u4yf+5bkPPPG9fZNTPZGmdLsdwigaKjsYbdCpRmsN5mZy57e+WloIJSW3SEHKWUo3Kg76fWySsmdmmtqxo+una5VLv/o7X4y++eLzGGMk5bh5S4zdQ/6jtyw6cP+RElBXqW7MNq4MDs4vz83OsrC6QRhG1PwARN7d6lrjO/feQVnwWVIyLoQQrsBaCidkrbUV1vSwftciI+QpmnzRqygTzrSjuFK/yFS7V7my5glEHHEdG86TkkZQIWgoJ3XSJ2sKdDeP7r7GAkQXuiS/fhZvMxB8UMT22X2YqpJS60YaxxhrCSoBUilSrYnTBCklvu9jMBi7NTg+0h/PU1Us5ZdSUnL7GGvAgpISKRXGGHr9Hg3f5+jcPEsHDnS/c+LE+upf+Svwf/wf8Cu/YtC6NGpugbEb5JO/9k/HvYl7johjdLudnvnQh1aqz7xv9cjJ82x2eqz1e1TqdUSWX1qUXyuN75KSu40F67pzCl9LmcTTtpPO0Kci9r6e+HNfNyvRWkjviq1WFsTqUqCurgjsDW7WXhxxbmWJddmHSaAJ+Ly7AHgJgHVT0Bz24jH0b3TRiypVYd1O/Sz4SdwaDHpYLJVKhUq1ipWCJNZoa/GUwvN9kjRxhaKlvV1SMjaMMVhr8TyFVBJjUsLBAKRiZmKCK632xuLsLHzmMy4t7Vd/1aBvScX1oWfsBvlv/Uf/1bg3ce9ZXMR+6EP0/t7f4+NPf7D3yW+/xJlT7xCurbsQa8EDXsxphTJdpaTkTnNd+9k6P6nneXjWekrpw2IlPkiM9Ddn6BkvfO3qK9ZeXEAF0gqRRHHqmtJcj4XuOl9+7RXiJIX9wKeAPcDgzh/Xg8k88Ldh8EchjiARiXfBp/k6qMbAS2xKUA2oWAtSklqDxqJ8DzGUPLRD/3de07m1gBMsRakrW9ruJSW3yNChmPVT0RrXqdPaKBXqtJHywW3LfpcYu0HeuXR53JvYHSwsQqoxzdZqc2ryvJDycBxFmV6n2GJ4538X5Q5Lj3lJyd0h088VQtsWFVljhjSOXqG38g0bsqoMWFJTFAi5bnFSYjRJlHmBetknysqcW8ADDrqIgqm4VxJop4iaFRIlEb7ChJYwiYiNxWDxg4DUGOIoQQ3H13IMLSm5e1iXvlKpdOJG46XDg/jsB159nbfffIPuL/1jSu/4rVOqrNwZBNZKLNrCkvbU91Jsw2gzIxBbvOLbjXOA7Z07S0pKbp7rRZm23FPGYmWm+49FW4s1AjXh4x/ERvYV+pzPG10atiadyOzv8ia9C3geYqJFUK0ZlQCJMcRpSpQmLj1fuIZraZp1Cwx8PKXAFLofF9Y3zB4v08hLSu4M2dgaeB6qXh/0W+23Hx9EC9Xnn2fjb/51uq+9co938P6k9OXcGYrVxOtWcClNk55JE6QQeFIic+k1KVHShXxc1yvy1Fb3q8haPG+TC9jy0u215CspeWC5XqRp9LCb5zI4OdJYpyS+FHPaq7x/g9aESzHJ29gXXTs2+7vMCr9LBCZlJlxo+r3FSqc/oDuI0EClWiOoVJHKBSykFHie5/SRbd6t83oDosm0x0sVtpKSW0bgCuJFLnsIvlJILMaYxEi1LObnOt6RQ4h69V7v7X1L6SG/MxgGA8HXvkriyYV+o/V8bXb2B9pXFw+DRWfdrJQQSATWWNf62eaCasLlOV6ndXU+xZTTSEnJrVFsDASZ69s9DMvE6CDWuhVbRMEC38nwLm+9O4CQkrln3kfr8BF0FAJrwKO4KliADuGGx74PDuRkdbPSX172F9fWwfOpKA9js3QjYTFaI7D4vhrWBry7X6L8GktKbpe8GZDyFEkckQz67GlPcOjRE7E9dvDK6xfOrL39W7/F+sIijKKKJbdAaZDfGSyrq5b/8X8kPHt2tfPTP/3y5COPrOy9ukCqNVEUoYRASQUGjE6x1ukiU1A5tgLy3lYWgci60Ak7MspNFnvNpxZRusdLHnKKXvG8NqOIyB94AW0swvOQwqLDmEuEjVcmCXVtGHsqrbYxIZTi6X/z3+Kpn/05BkuLWGtwI5wHnCK3rGXg4VUCsXQyFWubHerNFlYbwn6I5/tIJTBpmkUbpSvqNDub5BZGlZ7FJWz+V/l1l5TcFMI9VAe+z0Zng/XlZZ575DhPffTDSefpR5ef/9/+j8HLf/0XYWvGQMktUBrkd4o0haUlkrOnw4EJN1pTrXh6coIrvT5GSIJKbZiWQsEYHxoPN3n5llNIScntY4XFSlfykViDtEY0QW5kb9/bvXtwmXv6GZ7+2T/J0R/6LJVGAyn2ZLl5KdABYkAiJFhrhY6kp7WViTYgJEIKjDZgBcJ5LhA2Uxjf8q2NBlKXAjhKURnmkZeUlNw2UoBJU9IwYqpapTk3n741vXdzoVLLFynvsttk7AZ5/bHHxr2Je4/W2CAgbjRJn3qSVWuS/ZOTZs/MDOdXV9FC0ao3SVPXwEIgEFkOubXGNSpxM8y9PpKSkgeYzIsqBFZKYmupJYk8BJ46fIT+wYOo6WnI+gYI3yddWiI8e3a71Vdyi+z70If56J/785g4oXf+HEJuL19Sw9+kh1SeCQTW09aSGJulq4ihvT2MDBbrA0pKSsaGtXlNDlnKraWmPHSlunEOMVjyguGilDflbTF2g/zYX/2r497ErsFKCe02y/Va9Oi01Wp6ijiM0MLDUx5aJ5Bd0JJsgjG5jq51LaDlyAd+jdNclFd5Scl7RQiBBLQxiE5HtKxVR//8fwD/2h8dNvFCCII9e1j8+3+fM//xf4yJHvyOw+PEDPokS4so38czGsz1JdEkVkisIk2kTtMsiU8ihBwa4q4g3rhmJWV0vKTkLmBHpraxoA1YViMhX1uBbiZyVOaOvwfGbpBvfu5z497ErkEYQy/VLHc63Y8I9XYtqPTjcFC1KpC5qkqxiYVkpAAhSmO7pGSs5PeXUhKBItKaVqerJjY3AyYmUCdObFm+CsR79gwLQt8Vg8u8GAAh7iYfaETYgTTiQUmrTMIB/fU19j79DNOHjmDS5LqyrdYYkkGfQx/4IHazg/U95Ls83CithdS6oqPIi5MEIxV4aughd9n+IlOnsgXpqZKSkvGRKVlpjbAWX3ng+2+lnvdCCt1CYUaZWXubjN0gv+A9ZGnqAYh6LexsrL0wIcR3hbEfE0LXwEkFubxxMsNcDH3hApDiOnrkpbFeUnLT7CSBaC1YYzHCOk+rMCTGYLtd2VxYqLCxAXFcXAnVuTmqy8sEjQZhGBK0WtffaB9oA63sfw9ikeDJCqa2F+XXIE0eiNQXISSNyWne9/mf4tmf+sPE/T4mTW+wvEAnCemgj+6PmqFdd3mtpdDaN1GskiTBBHLUv8GWY2FJyb3AFcdbkjRBCWg1Gohm+3Qk1BsiTQf0elv64ZbcOg+ZtXzXsNrzLtogOBv4wYdSY9BpmnlzRl7y/EcIhpNNPt0UJ52dJqDyqi8puZaiMb6lO272v7UWKQRSKWKtMYO+qnW7FZEk2KJBDqgo4sCxYzR/4RfQUYT0fa6LxrnUp7P/NWgsLS1JTZXjjVnMm6/xyqBP904e8D1g7vgjfOLf/rc5/MEPkmxuYtP0xg8aQkCSIPIHknczyLFCYD2dxCpJU/D9YR8HyHJYsyVL87yk5O7gZMgtaRyjpKA1MYF3+NgV/faZc9W/9tcS9S+/TH3UWK28MW+DsRvkj66sj3sTu4pEKXytbdXIS3Zi+uzszEy6ubFBFEagsrCrdCa5Me66lUIghUA/AN6zkpLdjXUF1cYSJwl6MFC1Xi+QaSpNHG/JfbSbm0xNTrLnx34MoRTW3CA1UuCM8ij7X7i4VyIsoUiZEz7i0kVOxfF9a5BLKWnPz/PUj3yWx3/gUwTVGp2lxR0KNK/z+ZvdDkgFgU1TlaYpKn+IktI5MawZxhZLSkruDlJKMJZ+v8+MUhw9cIDlZ59djFdWL7//q18luXxZXL8ypORmGLtB/tkzl8a9iV1Jrd5Y3Zzdu7xn335t45gwCvGqNfA8wBnfksyLJ0b+nqEQBFtLlUuPeEnJ9dmeBnGNHnmu32/zBhcSbQwmSYRIEk9KKUmSayxu2+kQdTrvad98wMzMEAlxX1c7eZUKn/53/gzv/9xPMOh0SLsdFPaGBZq3gzRCSCN8q1OltXEN1ZQr6LTG5awUveUlJSXjxjrBCSsIwwG1VouD+/fzrScf6/cuXuTzvs880HHuiPKuvE3GbpCf2j8/7k3sKnJDujc5udGw0eUjJ05ou7LCm2tr1HzfNbaQEm0sxlrUMMSO09h1vWkz/dytmrolJSW3R26c58a4MJZUa3QcKy+OKx5C6SS+fiL0e8SsrdFuNvmBn/95Xv3CFzj77W+Pa1PjQwiaU9M0J6aI1jcwxrxrPvjtbcZIIYyPscpikUIipUIgMEZjrcGKsiVaScndwlqQQmLQhIMBstVianr6oq3XF08K+F0BPwT2faAt2LENpA84YzfIv7l/btyb2JUMgMfmZ1Y+dODAYKNeJ7pyGb9Ww6/VkEpiMBjtkiGdtqfNHOXlNFNSMg7yEo08/UFrjUkSqbT2lNESPb6Aq+l0aLZafPSP/THSweD+McgtoDUCmD18GLRmsLaGNSYLOozBVeAEj5U1RuYqKlI6D7kQ+r6OMpSU3K/kksxR2Cc1es2r11+oBv5VrOUVXCRQZV1VSoP89hi7QR6OewO7mETK0PeDi1KIo2maYoyL5kglM6VOp/hAbpBb4dS8rut1KiawlD7zkpLbIlM6MtZijBHCGCnc/+PbJGDTlGhjg6TXG9t27jhaQ7/HE48+xqf/8/+S1twcg87mWDeZ6aZlfUhsZoi76KHLIXfRw2EBb+nEKCkZK04FzhWq6zgi1ulG6qtTFlYBsJY3QVzcIk3x4PG/jnn9YzfIH9Qv5mawUq7aWvVbibUHk8HgaOB5eJ5HNwxBSJSSQ0+TlBKxo7dp+2TzMJ/RkpL3jpQSiSVNEmKtder7kQgCPW6vjpCSfpIw9cQTPPGTP8n5b36T/vLymLf6HrEWkpSpPXs5+swzRL0evbW1my7kvB0EKAE1m6aBMSbzzEGapljjUlicKpUtdchLSu4AO0nFisxxkYumJEmCMZpGo0llemY9qdffPLq2srZw4RyX0pQ+Tv215PYpZQ/HiBVyPfaC72qhPiIFRyuBjxAQRRFBpYr0PNI0RgiFpxTW6Os22Bghbko6rKTkYeLd7xsyDWuDlAIpJDqOiY3RSRBEVCpjN8gB4iThwCc/yfTTT/N7//1/z+mvfOUubPXWyM+kBy4AXa9j0oTe4qLLwbeWcab3CCGkEKJq0tTXxrgoIpAkCQiBUhLpmhyTe9DL8bCk5PbINf63G+PbC6fjKEQYzd75OaaOHu5GU+2Lzyxd7fin3+HXk5iN0lv4nikN8jFirY2s0cu1aqXbbjYxWmOTBM9TCCkwI0FdtzwU+njuNMEUFy6v/ZKS22PkDbopQ/4O4nrZOZnTXYl1zUb7dXjqwmU+cf4yyc//20xVa6RJMpYizhvuji1qTW3F9VnLW3duLYIvKSm5McVC9xshEAgpiKMUaVKm63Vas1ORmZ1asUeOheLAYfBu0KOh5KYZu0G+d+3hDGIMKgGtXhpuVCYuVg8cXju0ssjqYEBiDLVGg9SC1no4oRjMsGtnSUnJ+Cga4sJaIdNUyTQV8gbdJu8kptNB93rMP/ooS2+8QW95GTNGj/PNI8BTBMCeS8s8+dob7NvcJP3kpwitJdzYcEvdHaN8iyU+NL5LSkreM/n4J6Ucese3dja22Q8oJfE9xWYUIXXMoYMHmDh+YnB634GlM/2lZGHzNNHBFoQVmJy4V4f0QDB2g/zZM0vj3sSuxAqQQsWLk/svto49unZo4TzLJ0/Rj2Oak1OYJCXVMZ5y4VhjbdnsoqTkLmItYIwQWiuhtRB3yShOul2UEDz38z/PxL59fOWv//X3rHV+x/ADJvvwzMvfo9XtslKrw6Yr4rwnBnGWlmKLY6OFba+UlJTcIkUPuTFmi5FeNNCVlAS+TxrHiCTkwPQ05uijyUvTezeXv/T3SF/7dcwPH4YfOlymjr1Hxm6Qn9nzcD4xCWuJg4BBtdL/gfjwxqHTe3jhtdfoxwme5yG1zjrOqWH3OUl+PZcXdUnJ2HEpkndFZaWIta5baHN6mtbcnOuAt1sQAi+FWr+Ln8ZEgX/P0uOcUWCGnrpsB4fvud0VpcpKScltUnzI3p6+56SYJUJKpBSkcYyNQh0EQb9Xb5xckiJM+l2IBz57Z1KCiuUujaEPKuNvDHRgctyb2PWks5NLE+2JDbSZSMKwkCGea4/bYZMNUfrJS0oeaHKFkHB9HR3HtPbudYawUnRXVu5J+orJ9olej2YlJgkqpK5q8q7vC9vSVUpKSsbDqHjzWpxB7sYAow3SWEDGiZTfiqR4IQXX2VDHHhurKVLd3Z1/ACmLOu8CWsiLqVSvIsT7hTFNm6ZYbVxnzkL+limoBWyfjYq3TDlTlZTcLgW5PFyzCyuEtULcQP9/PAy6XaaPHeMzf+EvENTrrLz9Nt/4y3+ZjXuQvhL5Pn6a8umXX+UDs4dRWOLAvzchaClACiOksLmxkOeQl2NfScmdZ0vEadioUAyjd6nW+Moj8FUqAv9sqtQFQNNblKyehGSW0iB/74zdIP/E5fPj3sSuxUiJlpL9vc0LSbX6Uq3ZOl4dhM0kirHGya+R3wD3emdLSh4SsrYyrqBJSmuVMkYISxCg6nWEUnfFM2yNoTkzw+z73kd7714ufOtbfK/dhsEAC6hmE5Wm4zWKs1UbK5GJ4eDyCgfUKgvCkl63N8J4yfzyGsqmnCUl4yQ3xK+nuCKkxBhDMohoVivMzUwlamr2nahSPwsYCA2ilyKqIEqD/L0ydoP8k8+/Nu5N7HoqrebixuzM25P79vU7/T5RGGKkxPO8re2nhSsGBYZucFH4PZ88yz6dJSXvDdd5TiCUslYpTRBYPRiQrK+DMXfVM9y9epX+ygqrZ86gowikRMQxyfo6dnMT22zCmPLMh4VbSmGDKr16nW6lgkm67v174CHPIhYGIYwzEDIvuRDDVD9rKJP7SkreA9ubARX1yIsecp3E9Lod9lVrHD56XPcPHb6yXG8sEkaWbmIZiARPjm2MepgYu0H+Wycf3qcmoy3aGJ756OzqoeNTF/YeOTLoLi6wnsQIzyfw/W3FSVDU082nQpFb4Nn8Y+9BFLmk5EFDSYn0PGN8P5XTM6b/0ouc+6Vfonf+PH6rdXf3JQiINjaohSEz3/selZ/9Wc5evUr48Y+T/sW/CFNTY9luSsqG2eSR6U/xaOMn2FN/jIHt39vws1QWqTRSmaHHLjcWAEyecmRLKcSSktugaIxvN8hNVpiZG+SxNvR6Peampzj02KPmW889t/TK669o+1f/Z8WrX4euBW+zVFi5A4zdIH91tT7uTexeUgOJQQQzXf9Y5eLM0SNR9623WFlaQrlw+bCAa1cpLZSUPKhYO8xHFgBSWhMEqZqdMYkQXH7hBVYvXaJ6t3cLUEAVqF2+TPprv8YiEG5sEHzkI5gf/3H05OQd325gBPujCh+ofJATrccZpF3CtD/sjnlPsJnWYSbFJoQrfs+jhSPHRUlJyXuhaJBLKZFSkmrtmpdJiVIKnaZ0Ox2qUjE1O39leWpqpbd4Ff6vfy7QWgIGont7IA8I4y/qDMa+hd2LBATyclWaeqO6+dHJdjpVq2G0Rlp3A2ijh8Wdw9QVuzUc67r7sfXvkpIHiZ2cK+92oe/kkSl8Ruz0IgJhQWKRWKyQ1nie0ZWKFb5PBagBlZvf8zuKYZQ4rYDma6/R+JN/ktVf/EU2/5P/5I5vr2UqfDQ6wKFwjQ27CLmIoL2HjYqMACMM1lhhDcLmRZ3gWnlnKuTDF7NvOosiOuVYu+XlkpKHjut5rAtOCbPlXgIrxVDhX0jh6tysgTgmiuPlUOsXDXSye8tQ3l53lLEb5MfthXFvYtcirFbC6vpVc6hzXk1tfGJi4vWqpz7YWVsLJpRHxffR2pBa5/YRViAhM8wzP1B+ozC68rfklZeUPEAMJwOur8a/U0dbISVYCg0uLEo6GdF8WSUFSgo2+11SnXBwfo7ZmTlUhDj3j/4J5/7ZL9NbX1MWSFxR4T1HAMpaqv/gH5AIQfTH/zhm//47su7DSyt84OwFZmKF9RukuyVKJ73ECm/dr1T69VoFbEKahIDMwupA5sG3dmsh2lCVPBsw7Y0upJKSB4StDrx3v+ilcMa2STXWGJTngRQYq7MiNYsxGozBEwLf82Bq+o2o1/+S+Vt/e5Xf/iIYU8qT3mHGbpBPvf2lcW9i1yLjRMo49hZX99PnkZ6t1r4thXxGR9FHbJoKJSVSKbAaYyzKbs0dz40Tm00sVpTGeElJkeFDaqbhj7BYozNLTY2cRAKkdBNLGkWYOGK63WZmbp9dtVW9/FtfYv3L/5IaeHXn+dkVBnlO66WXmL56lZX9+1n/43+c5D2ur5nGfOjCOT5w/hwb9Trrrdo9UVTZCaO8JBVypdJodCeadSKTksQDfL+CkMrlkmfFZ45cN6ek5GFku128c2yw+M6wgDPLF5fKNShMjXYPsZlBniYRgYC5yTbVvXvO9fv976X/+//e4fXXdlp9yXtk7Ab5W7/96+PexO4lDLUYDAadP/QpmvxoorVZ8D21MjXRxvMkcRwNi5VMXliRhdRHsVc7NMbz206Wk0/Jw8A2xaEdyXKKbVYLLQRIoUDYUR50FpYdqgcAvlLUfB9Tb+teaybcE1TZC8hd2pRGACwtof7cn+Otkyd56S/+xdte18H+Bp+6eo59skvv8CRIhdolBVlCCmyKTnp6IJVMqkFAarVrnFZwyBlr3VhZ0CbP/YIS58zYdV9iScld5HoDmbO3LcbYkdoUo8C8wBnoSgjiOEZaw/TkFI1aPU6TtGeNie/iYTxUjN0g7y4vjnsTuxkDRJPnLvDkwnpaSeSpeHbvmYMHDrDW7dLv9QjqDaQU6IK6Ss7umCJLSnY5lpFUoXVGnTPWyIxxgzXZgy0GazUCSzsICGcmBq8dnNn0mlXagNnFeZFCa6qrqwz++T+HvXvhc5+Dm01feekqfOM8VALStRVWz59nBehVK7vGMw6Q9lPax6f03h882KkenA8nXm8y6GyQpCm+ZzORcos1xnnLpXSe8l10DCUlu5ncILfG2RxS5AITKUYbhBSozCDfWF+nrRSPHjmCPXS092Z7djX5Qz+ZqiOPETSa9/pQHjjKTp3jxx6/usQHz1xMo2rr9ODYiYsHVhYZvPM2y50OfrWGyCTGrskTL/xeGuclDwM7dqS9QTK5KGQtjOS7Rlr9zgB3Nnauqa21RmpNVSrWJmrrb81WBqY1LOPctQb5kBdegD/7Z+Hv/334uZ+7uc/8xlvw334BUFzF5+quHVF6TP3A4/aDn/tgb++jB6OpbzZZ7KyTJilD6ZvCICmEQFpbrIcvuwmVlORsv83z+2RobIiR4pSxGG3wlIfyPJS1DLo9Jht1juzbxzsHDvdfPPZU33/fR5gyuyqj74GhNMjvAufnpui/7zHTCYLBoypeet+Vc1w+fZpOt0tzZgbpea5rYJ6qss0eGAoGFBoDlZSUMLS8t2jp5t5xDMZYjDXOSBfOe260JkliY6BPGC4Dhv/iv4Dpafhf/hfD8vI9PKA7zJkO/K2X4Z+9BeTa6h5Ow2U3Ytn0WrwwMxN+vDIX7Wu3ePsixLGLkksBRozS+6QQWbL/7n6GKikZC9c1BkbFzdtTurZ8XIwkYI0xrsBTSHypQKdEYUji+6Zery/ZuckLvUMtpHIqVOUdd+cZv0H+wz889k3sWqIIoojl97+P5YbTf9w3N70+PT29UVFqMgpDdJKi/ApKSdAWTHmZl5TcEbYkRQqElKhM+1/HiTbWXiJJr2KM4cAB+Pznndf5QTHIVy7Cv/gy/NLvwuIGMJO9sZvHmFWhZcOu+5J0Yiaebk8irCWNE6TItJKxCF36wUtKbpvcOrfOU5GnfQkhXMM0XCRRaI2QasNW6t+1jerbKBeBGtzbvX9gGb9B/su/PPZN7Fry3MZ2e/SSFGtGqTeklB9SUNFpisWilNMkN1i2iI/lxWr57yUlDzQ7Jq1cR0PA/SVFwUOeRZisxeWN4yQRpcoUjTJdXWuMMcg1K+Q6D+qd9T/9Ivz1v4FTVgfYJbKGN6QHNgH+PfygNajUqk7OUuusc2AmZClFVpiWZRgVNcd31KIvKXlwudEAtpPmilOkklis0yLPm3ABCoE1Gp2mVDyPWq020JXK26lSC+M7ghK4Gwb5nj1j38T9hBViCc97qVqvHaxVgkPGpBitUZ4PMiu0sKMMWPeh7MPbE8u3rHjsu15SMj6uJwfwLowaxuRGucjyiS0mVywXAiFkVvupkUriBb4WnnfVSLFEnnZ84AD8Z/8ZXLwIzV1csBSGUKvBBz6w49u50ghr69kr95U/y8LAeetUsCR9/6y19oDV2s+bmQjhUlXyhp723azwcmwsKRmJVmXecZm7L4YFnk4aVkhBmiTEYchEs87cvr19OT39tr54aZG3T96r3d8dfPazY1392A3yVlqOhgBWCPoKfPylqDHxQnNm7mPTi4uHYmNJk8QZ5G7JoT1eendKSm6fvAOdyKo8tdXEsaXqB9RrTS3q9QuJ8i4jsqTkffvgz//5e7zX7x0LpICdmYFKBWZnQe3WnPFtXLninDhKoq29qJV6VQomFEy5KKFLih3JHeaOi9yJUVJSctPYvPNt1plTSISAKAyJ+n0OTk6x/9FHw87Ro+c3z5xe4WtfdmOJekjLD+93g/wn1tNxb+K+Qfs+E2l1LZk++EZ1z4HVmYvnWegP0EmMrVZcCDbLTZF5UQYFwzx3mIudneYlJfc7WxNWtvafe9fPDj3hFoMZdnEUUmAF6FSTJgnVIGBmakrLWuNqIr0FdlkToFshN741I894DGwC6X/wH8BP/zT4/vXbaO824hjm52FyEnvl0rIJvLNKeR/2hERasNq4ng1ZipK1O4yP92THS0ruFduS+Lbl993wfsgMcoRAZjU2AoijiDgM2X/wIHMnHonOPXr86lJvI8LzwVMwdCCW3EnGbpBv/PVfHPcm7g+sRfT7rH7suUH0g588tW/50bUDb7/GShgySGOMTt1Taq4awcjvU1JScj1GHlMY2Z1im6aAzSJRaRgyqxRT83v04pNPXFw9dODKNIgYuN+mGIsbwGs4QzzN/k+y3zl+3P3cp2hYSoLqOYMYSGOQUpAag9EaK3OPfzlKlpTcKrmi27BZmnXa454ryCEKQ8LBgIlalcrszMpbzcbqRSndA7PxyqfeMTF2g/yLf/m/Gvcm7i/+9J+Gn/2Jjc8tHoj2VusIYzBGgzXZtHL9trf5a+W9UPIwULzObW5oZ9q57t/CEtYipMwM8p3dQtpo4iikXq3RmpkxVx99ZL3TrHP8Pr6l8tGil/2o7CdP4LgfTdX8y9DK76SV+lKlWk0CT2G0xgjJtUd3/a+vcLnceGMlJQ8oxYq07XeME6Jy77raDOmarGmNdYXUi32lXr0IYeL7UK+D57moW8kd5yFNBLpneFibAmlzevrlaqt9YW1ldW/qe/78vv2EcUycpk7aS7kQrTZmKEckhfMQpVrjeR5KKacyUEolljygFHUBhq8V0hSUlEghCaMIIQ31ep0ojomiKLtHPFeopCTRwNLtdKjNznF4375Of7BuB+tXaXS6930GshSCtjHM9xOCWNOT4v41yIXACMH+OB6oWm3jiSefSokTLi0v05qeodlss9nvoY1BbcuNv9F3eH2lnpKSB5Tsot+esZb3a8hMcZRUYC1apwRSEiiF9n2ot19MgtofkKY9Hn8cfuZn3Mrk/aDYdP9RGuR3D3dLZJIAfq32it+of1dY+6PCGF8JgfP9FBucMMzxEoU7yhiTpbeI+96QKCl5Lww9PsYMvT1F1YCsTRCB5zMQgqjfxwsq8fT05Jlmd72zcTlEJOmWdd2PNK3GNwJsFfBo3uejggCW6vXB6oEDS48OBnH3wiXeOHeBerNNUAkw3U2sBSl9952XTomSkltDCNefwbqCTgCMIc3kDhtTU3it9puR8l+y2oS029dVdiq5M5QG+d3DMioeM7HWGyrw1vbtnTfrgwFROMAikFJlBoUZ9vC2gLHWefqy4gsBw+rokpL7n5vPKxCFHxdBMq6xlhDESQKAHwRgLWma4inX6EIhQGt0mi5FWr+ZKu+KDqpokjEd093BImhEA6Ig4KUDx1mcmKGSxPd6t94zvUqFPRsbC0cXlweTWTpSkiYkcQzGNQkSQmRSsezcirCkpOQabO4bH9rhBk95SAHhoEdFSuanpwlqlcGaTroWW6pz3AVKg/zuYqfX1nnqjZPsSc1lOTFz9uiRo8nZC+fpdDoEjSae8oiTBG2N09otiHtBHi1y4SJbUBsoKXkQ2SlLuGh3WeOawyjPAwFxkiA9he/7pEns8iGlwFqDBHzPx1Yq55Dye3Orm+uVTg91H3d9lMagjOHtA/t57ehxNuotUilIK5V7vWt3hDAINm3gv+F53oeVEBWduoYlEiCPIhYoR8OSh5PrPIle52WnHmoRSoExaK2RfoAENjY2OTbR5snHHmPjqfevnNpzZLGeeqDAf9jN8up4Vz9+g/zAgbFv4r7AWlhfY9oPePzyVaK9ey9vHjt69uCgF60vL3HpwiVmgip+UCGKY6xh1PWk0IXOIrY1QikpeQjYbpFnoSMXJXLRI4sr3BRWjlK8XGdoojBCGMueqWmC+T0Xe7XWy81+sllPwrt/LHcQT2s8rTl5oMZKc+pe784dx0KcoL5JUHm6Xqs9J6wVaZy43HGpdtB/3ebAKF3mJQ8B15dB3tlGyNVVPM/DSolOU4QUCAO9Tpfq9BSHDh/pfeOJx5fO7J2yEx2YCEfF9Q8t971B/su/PPZN3DekCZenZ/ntAwfpTUykh9u1yz+2sdqZEIJeZ5Pp2Vk8pZDCpaiAS0+xQ3kiA0j3WmaM5KISpWuo5MFgqxJ5fmFfo8lP8XlVZJrlblmTt1QXruhTSUm/28XXmsP79tHcf3BjdWL2kkh1ZNP72+UjrEVYy8H1AZ946xyvHdrDZn3Ms8ZdRUQC781aUD/dbrafGxhNkiYoP8AI6b7nbY6JcigseVjZXsida5JvN6Rzm0JkjYBs7uAAdJqQaLOeSO/rqZSnYwVhsE3fvGQsjN8g/9Snxr6J+4l+9gPQbrevBq3Wq4FUh3UU1zEGTwqUlK5ILe/0kXUCstb97fLHDdbaYT55ScnDiBASKcFY4zzlnhvS0jRFSoHv+ShgY23dRaeefh+dJ55a/s7x4wtSG6S+vw1ycKokrUGIkQ+ePzjyvOj5R46/tOeZp9/Yv7bI5UsX6fT7tCYrCCkw2mRluyUlJTdDXn9mjM2aqbkfk2qkTqkohWjUz8e12u/t2eicf+asj58kW2VmH1Ye2z/W1Zc55PcQA91IiO/KSvB4s1Z7n7QWnWpkbmS4ZRxCZAL+lIVLJQ8dQw+5LXh9GHXiTNIEK1wxZ5KmaJ3iexV8z8PECWG3By3P7p3bs7p09NCV1/ZN36tDKbkFIt8z3zqyt/f4h99/5aOnT7J59SqLvR7NdjtThtghWF8sPLCFAGI5bpY8pGy5JTKPuLUumqgy/fE0TVBaM9VqUd2zbz2cmD61f2NtfW7hyr3c9d1FaZA/uFjoGCFebbcnLu6ZnXmfFIIkipwOedYCvDiRWOvK2cQ1gftsbSUlDxBbMrHste9B1qFTCLTRWCGoKEWqDcaCUgoBpEmCTTVSeRuy2vgWfnDyrh1EyR2h3qj39+3Z2ztTrTbjtTW01u77FQJRiMcXG6eV9nfJg4/Y8a9MY3n4urXDQDvY3Cuev+FS++Iooiosh/fNM3/s0W5//pELged1RL+H3S5kXjIWxm+QX7o09k3clyhFFEXdi3v3vjbz7LMXnwojTl+5zEa3S32ijZQSbQ1Gu5tqe2KKEBJX4llSUpLNKyAEUoqhJF4cJ4SDAdOtFvMHDq5H03u+5onKW9ORQRqDZ+5fhRXI8ugtbAaKbqDedfn7Fa9WW2nOzb/YnJj8iL+4UEuSBOGpLL3PlmJTJSW3gMjGSZe2YlFK0YsifE9x7PhR6o8/sXrm4IFlEwgj4/LmuluM3yD/lV8Z+ybuS3o9eidOJK9/7nMXPlGrrzy2sMj5K1fo9XrU2y2kkAgDwhqskJneoSvEMJZh3hel9GHJg4rd7vHZQWraOmNMKeU6PLp2z/ieQgKDMCQchOybmeHgo0+E/f1Hz+2P/JXPn15yHXDv5vGMAWUtnrF8Z2+bl+aa93p3xoZW3oWo0fxyZWJiT6NWf8wag0kNfuBj0E5xSpTxwpKS/397/x0n2ZHdB76/iLgufWV511XtPYBuNNDAwGP80FPkDo2k1a52yaUcl3p8K2mfVm93ZbmSKEoiZUjRk0MSY4mxmIE3Dd+N9t6W6/JVaa+NiP3j3syqagMzg0Z2V5/v51PdVZlZ6epm3HPjnjgnbii4/Idr3CaZ8VYqLq9sCAEpJRRnUWexa67W23H2ZJHVAwFY8lYfJW8dNEPeKqUS6sU2nDZNtb3QdmrYds771epQtVw2evr7oRmH0hGkVkkllZWtajmShRi60T6IkNtPY8sXwoCCRhRJcM5gCAMAg+e6cOt1DA4PY2D75trIhoERnS9U0uXKqijhxbVGpIFsPoWOQKL09kVE44uAY7b6qX14QoVwqDjmbd/2knP+1CNt585sriFe2H7NP6FeCjiShQZXRCmErC4MzXyUxgXX3dzj6lQC4Ax+EIAzBiedhgp81MPAM4tdL8vO7jcvC/gRAGP1nni76dz4gDy7emdtfiBKMTgpHSiFGcs8WmorfEOkUj9tLSwMRGEAxu0k4I5n8QRb+sAt71RIFQ/JarAyC3jpwuYc9oqNfGlmWydt0w3DgNQaXuDDsiwYXECFEaQfQGiNznwBqZ6uixc70nOzKY5UvnCjX9JHygbQNTIH71uHEb11CSimW/2UPhxKA4t1lH72Y5VL/9P9p1Ob1s30vpHH2fl5SDCk0hlIpZLVNgwavPl7cRM1Ft9HUqGKxkqyqly1QS+Vf73W0Wpz/RmLD1oFY9BSwvfqSDENp63olvoH9s0W2t+JQg0IhkjSp6bJvLGzOLSos1U41whDhsVFMT0wcGLs0Ye/MzQ+9gheeHFgZmEemfZ2pDIZ+L4PJljSeTCCCqP4NH08DQQqRE5Wh5X1xhs/abZUbIs3rkk2d464vKFUCrZtQzCGer0ObgImF6h5VTClUMhmkbKdo3WwNyaAyhSA1Ef50j4C4oVTwJcPwCvVgfY0IPh7/s4tQWkGkxtj0KELlD43uOb4cHfP9JvHj7fzdMbo6u5BpCSU1ODcgOACSkoEoQ/btGBbFly3DgUFy7IglYSS6qozjoTciprrMrWK182IuCeDglpKZ9WIFz4npwS1jsdNxhiyuRzcSglnT53Cju5O7HzkwWh29+aLZyxzEhe8NBQ4OG7thTYfps03tscDBeStYppAuQy89Rabc5za9Jo1J7fesbNqnD6F0bNnYaRSSOXyMA0TCgxSyjjntRGDqzifHDwp7N/q10PIh+zKihnvlhaplV7RCAhKw6vWkRYmhvoH4HT3v11K5Z93Ga8AgPsRPP+PVMYGOnOArwAZrJ7zzEoDhoTiHDOAy3P5t7o7u14t5nKfqCudi4Ig7tHAOKTSyYJeAa1ZstgzObRr1FsGsLRlrYKcJXLbY8m/jTPmii1r/IN44iJeb7YUKIikqxrTGjKMEPouBjvasWHLpplvDXVPnjlRA37nkEI9YkhTmNj0Hx64oXdP73Sr2DZQLmu8/nrk9vSg/rGPmdnOjkqxrQ1CCERBABlFsCwLfhhXijCEAZML8KStltYammkKxskqsnxrvnbA1FjDrKAhDAGuBYIgABiDZVkQjCP0fYR+gM5sFkMDA2DD6y7Od3aflkL4N/41tMC9a4GNPcB/fgF442I8S74axK1Iw2S7UPPQJzuLxcM7dux4eHR8HJXFRRipDAQX8IMQnAkYnMMQBqRU8Dw/righ4gW/cXfCq5YGE3JL0tBx35LmIs1GTBAvdm+sP2ONcslJYM4NDsYZauUyIt/DUP8AOjo7p13O3pzhdlmdvAj85+ciRJ6CsZo6//6AbvmAvFy+4Q9xS2IM8H2gWtWlchkjQDVMZb+Xzeb6UpZ1lx8EPPQ8OJkMlNLwXR+GEOAcYIpBUx9bsoqsmK9spjnGjbB00iPuWuvyGI93Rr4fgDGOTCYDKAXX8xCFAdocG/29vSPHt28893YhXTYPH3Oy9brmhnHrt+hs0BqsLQNVc1G3LkMOzgPp+nv/3q1AAyhEwNQ7wNen1aE7dp7How8f3WQw35+bw1uXRtGzZgh22oHn+5AqgmBmPKmhFUIZwbZMcAZEMopnBRlvtgon5FanAXDGoKChtIJKUloZi4s/8MbceXIgqqBhGgYEA6YWFiBkiPXrhtE9uPawznd9R8OYhpwEolcZUGWIsvRJ+Yjc+IB8y5Yb/hC3LCmBMAS6uzEPlC/29DzZsXFj/9DY6M7RsXFeLZeRzqThGAZ8zsF1fAQcH+nGdchpr0JWC33F90spKkuLOK+c22TgYIxDKQ0h4k6dXrWKwHWRMk10tHdOZrp6npsc7js1WfJQeOJl4VwYhypkV09ADoBLhshSYF0BMCgB6bX6KX14OANmLwMvnGGXNmzQzvbtF3aPjZ1qc1L9Xq0KHYUwOGBwBigFySQE5+CcIdIAE3GTtTCSMAwBIQSUUlQtlqwOLE5TUVonVdfiAH0pGG+kksejqlJxD3DOOPxaFQVTYH1fP/wtW4+eHVj7QhVYxNwMgIMASgBW1wL4m9mND8g///kb/hC3rMYeIZ1GBATHBvou7rhnz8Wt42O6PjuL85UKomIHTMdBOpVCGElIqZZOUTGW3AXtWcgtblkxlZVJK3rFzDhbFpI3Zs6hG7nDDNAKvuciCgN0FXIodHWNhunCsyqdHsH5BZS/czbiR88rtK2ynUxdAl0W1A/1AJuzQHUVHW9IAMLmSFkGTDPwlZ53NZ4yLKsz6zh3IIqgwwiWaSKUCkonAbkhmrmyUklIJWFANJuq0bhJbnksqaqiJbRSzTXvImmOBh3XGldKNac1lJLQSsYNgRhQsB30F9pqx7cMTHyvp2s+egXASzUGzCgg0kDQ0pd4O7nxAXmxeMMfYjWIgOg0gJ5i8ezO/oG3L2Vz95yZnbdq5TJyQsCxHURRHaGUsAxBuxJyW4jD76WEliursKjkgNQwTXAAnltHtVKGBYntfT1ge+68/MLOzfuiYxem+r/8MqYnJqMIFY3F1VY4IALKDmBmgDwD9CoKyAEg42pAKnzRhdfPp6d3b/1O+6P33bmrVrtjZHYWi/NzyLd3AAwIIwmlVFzWzRBx0KI0kLRsWFGivJWviZAPidK6WQqFMwaDxfPjUqulxc3JwangHKHvQSqJYi6LNT19c7l0/vmw2PFWFITAF58Bvv0XDIiST8wqG0tuYrSo8ybRCLDn0ukz1YHBP8j3r7Hap2bvqVcqEKaJfLG92Sabc9ZcRd0se0jnX8kqsLx3ZrPgob524KSBZhUNyzShoxDVchky8NHWVlDr+/vlxZ1bT7+yYc34Pb/xBHb/zrfYPpfLRXTCMldX2TsWhlAijajUDj3VDlRX2ayW42n4doTfFqgNoXry24NH7xm87/xdFycx9vwLWFycQ6HQBlMIKK2Thmpx8BFvIwxCGGDg0FJfd5si5Fa0vG7QUlMsDa1UUoEqnjEXRpzGUl9cRFSvY31PN9Zs2TIx2dP9pZlc1wEszAL7/zlQfpVOIbUABeQ3mcmOjpE39t77TP/s7Ge3TUzcc2h8HLVyBZlMFgwahsHBhYjrL8uk9ijtWcgtrhGIN7tnJoE2x9WBUyNVJak1FNckZxyhVHBrVTimgZ7Ojlo6k/keBHsagFLMsjs6iqm9Q7lyAKb4KvvMWLyKatSHI2//HEr7NgF8lQXkHPEM96KByhbgHQO6P22/ujWTfpJr9XDoue1hGMA00jCEQJhU3WnUy2RgMI34LIqSalnVe4o5yK1reROgRnofBwPTDFprqEjFlYUMDmEIGIaAwRgWfR+1chlr1q9DZuf2uWf27Dl63hJlRBGgVtvZw1sHBeQ3FzYHqLfbixd/fHjdiW1rhqKRUknMex7z6nUwziGEEZc7RBLErLLAgpB3c91pG60BJQEpsbarE8NbtpSP7tj+zQv9gy8MAKgvjNnn5o9xYXcwbnDIVbbPkaIOGVaAiTeByiKAaquf0oesETwvCIgu7cv71GRmzRtrtt1RXHf2/EZ17Eh7UK+BCQFh29BaQmkGxhm01HEpRMOAlBJSyji/lpBbXdKBNi5AjubgqLWGUjpuUpukqQjO4wPSKITJgWImrXsLbSO8p+eFsYH+cb+0CHz968DsLEBHqi1BAfnNRQOAD/Aol38l3d33l91dU5/ypicLoe/DSqXAOEMgI2gwcMGXzRUSsgo0N2XW3LZXVF9p9rZgyW3i5hYqCgElkbYtrO/qROeGDaN/unv3WZ3KBA8C5tFL7/j7JvZ5fIIpJlZJ05wV4j2zUl9FvIderWNCnUE9yiD/RF3GmoWxXfee3jI/X0vXKnj90iUwUyDtWGicAYnjlCS/lnPoKGrmlzM6tUhWiThzlSVny1mjQSfAAZYs8GQAZBjCr9eQc1Lo7R9QvL3re/N2+kkluIff/m3gH/6jFr4KcsMD8nv37b/RD7GqKKVNzVhhck3f29XHH+oplufv9+ZmCxOeByedBuMcoedBmCYMw4RSEsnKtqbGjkZr3WyEwRhr5tsScrNZmTwQB+Px9qqWtuelrPL4VmzpUgYOWxiwHAfZtHOimHK+ublQGHXLJRhf+1KbPH6oBqCuoAG5WhcpSQBhq5/EjaYAH9AaIwDMgjWybmjwK/lsPrs4O7u1IDgvdHTAMDiiZIYcOt5u4moTurnchtHSG3KLW7nIPf5Oa5WUg00OOln8OWAAgiDA3MwsdhZy2LV2KLrwsz/2ztuQB/3/7e8CX/l64y6v1SCZfARueEDe8+KhG/0Qq4rhB5YyjNSbP983Knds2f/Dh9aOsbPnBiemp6CCAFyI+NQTiz8rjSPjBq01pJRxdzrOwZNFTY1ZIUJubnGUpBGXMmTg8c9JmhY4W1rMKRVMIWAKDrdcRoYBa3u6UN+4cd/Jnq4vt/mVhfwbr2ZrX/2i8M+da/HrIh+SZrKRBDBmiMXxoTV/am3bWhg8e+of+mGAarkEZhiwTQsaQOAHABMwbBsqkoii1XpARm5XDPEBp1aAIeIcFq1UMmvOwLRCGEQIXRemjFDoH1xI7dr7/MX+re+MvfQq8MdfB6ZHGzVlm+tDk7unoPwjcsMD8iOrLZXxBuMeQm2iOukr9FlWpbOz9xu8raMgZqa31atVOEIgn8vBC0P4QQBDiGagzTlHGIbwfR9CCNi2DdM0EYYhoiiCEHFTDJopJzcfDZa0eI6kBKBgmiYYgCgKEcoI4BxmUltXSokoCOGkM0jbDkanzoJZptq2Z/fs6cc+deT5vuJp5+kv2OvfeEP05HJzIpuPMF9q9YskH7LIMKITawYmdj326MQPBa5+8ZlncPTCBQwMr0Umm0MoJXzPhWnaSKfTUJGC63owKFmTrBIMcdAdqQhaaRiOASiNMArjgBwMSinUKxXwIMCmni6kH3jw1ZO7Hvrnc187cwrfnQTu/f8Bh/5cY+ylRnBAubAtcMOHpZKkWdkPgkkWac5q8ANUTWvm7Xt2PTFYWVx3V+RuO3bhAuqVMtraCogkgysjSL1UWLcRcKfT6eb9+b4PpVRztpyQm118VgeQUdy8QgMQhhHnAINBaQ3BOVLZNGQQYH6mjO58DtuGh6eKA8NfC7r7XqlZUtdGT4W9E+cUjLUhowhsVQoBfQxAf0fxxF2DAy9f6u6+7/zcXNqtVmCnHDiZLFKOAxlJVKsVSBXBsgxKVyGrjpGMcRpAJCNIKZHOZCA4g1urwavXUbQM7OgfgNy27tQbg/l35iYPAuMLAps3S0wOAGMtfQm3vRu+lxJUQucDYUoprVRgVeq8Arj71vSd++zH7j21a34W0/MLOD83B79eBxhgCg6pFKSM9yxKKTiOA8dxIKWE67rwPA+MMdi23QzIaYac3HxWpqpozRFFPjQ0hGHAtCwAQBhF0ErBNAzkshnMjl/G3OXLePzuu3Hngw+NTvT2fWXCsg4CLqxsQRrpvESA2yP6YgxIpwHLWr2ly0olIJNpTkJoxFnzFxg7M5Jy/qRn04bMdt/be2ZsHKWFeTipFAr5HCqVGuZnZ+E4KaRSqfj0vl6l7xG5rehkBadpGAAYwjBAGETggsN2bEAqhL4PizF0dnTWu7ZsPnIZvccuH0CqXiq4MIoSsxKorvr1Jze9Gx6QV+ZWWT3cG01pgEUIvvCSYZyb0J0/81hYaG9/yW7r+S99vf0/PlMp98/PzCCdzyOXy8EPQ8ikCV0YBHBdd0V6im3bzQCccsjJzUxrDakUDMOAITiUEmDQ4JxDKRUffEYROGPgAKTvw6tWEbh13cbYqXB4zZMv3rf3xKmUrVCuQjgmzEIaTi0Vd2xc7To6gH/1r4BPfxqYnm71s7kxgiDu/tzTs+LisY7OiRfuve+F+wzzsZ1z83tHxsdRLpXhF9qQzRcgHRvlxRK01uBcQK3WAxZye7mib4OGRhCG8SScZYFDo+5WUSuXMJRJY/3WreX6xx/54tjJjd8p/0eEuLQWCAYBIwWUv9Wyl0FiNzwgDw6+eKMfYnXR8UIMVG1l+tpsu/cO8/LGnoO1HVt+r7O+uHbj3FT/m+cvwDAM5AsF+Ig/hJwlDYPCEJ7nwTRNWJYFy7KaOeSNhZ6E3LS0hlYS4AKmaQLQUFoh8ANorWEYAqYQ0FGEmfl5ZCCxfutWndm19+kRO/+VS6+9NicNE2xyBOqNE5g/NwIeLqBaqbT6ld147e1AVxfQ3b16zwgIAbgusH9/HJwLwRAERmV4ODy4YcOF7Rs3fXvTuXPrNkxP7zlz6VJ6cXYWlmnBsUzksxmwpKkanSUkq00UhvGkhVJIp9JIpdOoVasoz82DK4n1nd1Ys3nj0YN3Dj179Di7rPcBQGHZPWRb9MxJw41PrDzytRv+EKtKFABcAJs/G2nLgf/80dT+tFOXu7aN/pxbfnX9yZObj4yNr5VBILx6HUEQItAaLJkNN4SA53nxjGJSbUVrjSiKKI+c3MQ0GAOEiGfDw0jDcZx42/V9hEEEIThs04LBGbx6HQvT09i1ZhCf+Pjjeu6HfvLc2aPHT0W//IsM589CZ7PwowAXpcQIGJSUrX6BN1ZvbxyQ//qvA7/xG6s3IG9ovD6lgLk5gZ//eeh//I+jmY72Z9YM9HVu375jo1utpU9NXEbJmkexqwsdHe2o1j24ngfTNMAZW/VvE1nldFxnnDEgaBZvMODYFgzBUSktwq/X0FMsoqu//1XZ0flnp2DOrNLzZ7e8Gx+QR5Sy8gExKMkxdVSFzy/K6Rd1WHV+CfYv/PX5yfvv/9LaSrXjfhn+7VMnT4q56Wm09/bCZBw114VKcmtTqRSiKF7UAcSpKlaSg9uYKSfkppLsWITgCEMFJWVzJlNJBcs0YZsmLG4g8OqQnofOdApdGzecMe666wnWXfgeIg1Ua3GIVY3LOyksq5O3mlUqwPg4kEoBhrF6c8ivpLWG70f49rc1pqb0W3/9r83JvR975YGK992tZ8796PjsXEd5YQHCNNHd2wfPCCB1BAMCq7uBErkdcc7hpOKJjEq5jGq5gl7TwgPr1qH06CNvvbR799enZxfLSE8Df4fFCzBsA4AAsAVgvwikC8D+g8DTT7f2xdyGqPTAzYcBYObCJcYWLqka4OP0AywConcs85S9666nd07P/HB1ZnbT9NgYTM5h2DZCqaCTWXHDMJq1x6MogmmacBwHQRBASgmxKjsVklseQzOtSimFKIiSxXcauUwGluDw3Trqi4twGLBl7TByd931woGNm/6fIIWqhxAauhFl3V6RVq0G+D6wZk28sDO8jRZopVIRjh0DXn+dLezdqw/fd/+53m3b/yA7O5vbFgQ/dfz8OZTm55DN56GUjEvFXtFkipBbEltqAMg5j/f1loV6pYrywgLypoFNW7fVhz724PGX773nxZPtbXPYfxHITnH8L7aKq443PgmbAH4P0NkB/N7vUkDeAhSQ33wUAN0JaBvABKADxE0wRgF0CuPQpnT+13p6+n6pu1a9t1qtwmIc+UIelXK5mT/OOYcQAmEYNj+oURRRUwxyc2KAVhqRis/gGIaBKJRQyQGmbdvQYYjSwgLc8iKKnR3etsHBk5MbNr71XG+35wNgHQKhYLfJ1PA1SAlMTABTU6s/ZWU5xoB6nQPgCMNoBqg+sWf3y5802MO7F0s/vjg7Z5yam8Hs7AzsTAaObUMqlZxFoLOF5FbGoJSEUhKWZcG2LDAA5VIJlcVF3Ld+LYbuu+/MxQcf/bWFXOFlMT1pSMEkrKyCf43wj7uAVwdCymxoBQrIb07aAngOYO2ArEyUEB2agR9pcUl4Ey/dufMr27W/4y6vvvuZkyeNoF7H4NAwhGFARNGKuuMMQJisum4EOoTcbBgYpJKQMoJlWTANE0pqMM1gcAEdSfh1F4HrY20mh23bdlRKn/jUExfXDTztXj7FVV83zLmLgLw9Dzj7AQxrDeX7t0eKzhWSsuKqdmaEzZ+e1BXP1YbLn+/YfufWO6PoU/6Rgz3jpRKYIeCkU1CBhmp0OibkFtXYfpXW4IKDcYZarQ4tJTqLRb1+aENlaOPml8bXdL3UdvbCbP8rr7eFSlUVdHTN1FXOwfMF1Ecug9qoffQoOrtJBQDnAOsCVOr0jK78+QFWKNWd8gND3it/dU+pO2u8tH58cmdmbOxj5YWF3OLCQrMGeWMWXCkVV16JIgRBAMdx4plHmiUnN6W4oorSCmA6OcvDYXIBt1pDUK8j56Rx59ZNGHjkkYWnH3j4pUvB1MW1bzxbMEYzunr+SDgZBVjlyzevaTOAHwEQIU4Lvd2IuD6VPv/WCUzIr0GUF5Heu+Oti7s22oNpa50Xuj1z77wDJeM69pSvQlYDDQ0wJMUaGMIgRHlxEblUCpvWrw/tTVv+0u/qfrKdc6Pz9Plc6fnXYDgO+HUm5hhjMNMZjF8cp4C8BSggv/kwLK02UgzQTGtAKo1I+SKMFJTC4TVrn8GnP9n2Cc63HnnhhdzbE+Po7OxCR3s7hGmi7rqQSsW1yn0flWoVSum4zS5Y/EFuPFryTWMfxVac7mbNf/Xyvdj7nVqiHd+q0yx9e62N4Frbhb5yu1m6h+ZNEHecFYaAhl5qAGSZsISB6dkZmEGAjQP9SD304FPjjz32W6Np60Sl6qHDRN22ID3R7Bdz2+GIl2Vp3CaLWK+Q/Om5UEoaYWTYXlA43dtdq9298+SPHZVf6D+YtXK2fbcbSaH8AAwMHEmjtGvdIUu2Ur10/fJNSy+73dJQylZed/WtyW2jsd9c2nr0yqtw3e1CL91I67j6VGM2W2us7CuiNQTjsCwDluBwq1XMTk1iuLcfe9ZvKJ/75AOvnerpf7N73+ls5dgIMzircq0lu86ib8YYmFJgirbZVqCA/OalkIQySnBox4B2jIiL+EN4FqiJLZue+6lsds8dSn5+7Knv9Ejfg1+vI5XNgHOGUGpoxmBaNtKOApRGGIRxmaRlIXZzBRyLd+wMHCz5PDbr9b5HoKPf+ybkFsZwnYDkXTR3JnwpAI8XICU7A8ZWhOZcxGlWQRBARyFSlg2mFSKvDh6F6M3lsH147ezClq1feSuX/dbC3ALU2RGjNBuFhh+g7ptQa4YBYwbIpj+sl35zYwzgHNHsLPz5+dt5hhwKgHQc8EKBCa14RYbmBbcy/3pfz5c23nmXuXNusXj+1MmN07MzyBW7wEyBUMql0nFiqZOx0vEsOgMDZ0vB0XtZ/jm5/VYWkyWNPSLHtbaIax3krfjtZFsTgkNrQErVXLgpRKNogwTTGpZlwLYNVBYW4JZK2NjZjsG9d58vP3D/104Prntpci6sRKenhJivhSyTisAFNLtO+WPGoC0L+nZopHYTooD85qOB6591bwz4GsCMZU0eXTf8z9Y8+IB8eHLyV46cPInZcgm2Y8MyTWitUa/V4NgOcrksKpUKgsCHbdnggsfDA2tE/jq5Xw7OBYRmQNJeWmm9YlxZvpN5t50Ou8737/bCyc2HAeBXnzQBsPxvduXsoEq2KZbUyWXxtqRU0iVRx5claxsaAREXDMpTcS65mYbyfHiVKtqzaawbGh4p9g1+8URH5/7Tvgd851sCx45hKpMCWAmIbKjP/lC8WO92mSo3DMA0gWefBV5+udXPppXicZMBMHgI25q1jx01FeaMfY89Plt/4MEXPjM/11sbufDTo5OTmwr5IrjlINASGhqMxYvgweLgh8m4ShWDhikMMAZIra56QGBpZpwBzYmMJkbj2u1qaXtgyye9oaGhr5glX77dsGRFhAbAuYDWGkEQJhMcDEKIuCysVDA4g8kZTK2wOHUZppT4zOMf1/5P/ui3vnfH7v9n7ly9XDhx2bFMo4yMrVCmrfFmRgH5rUBpIFRAFM9yN5SAcB8w83hHx3d2rN2w0y2X761ePF+Ym7qMbLEd+Xwe1XodlUoF0BrZbBbpVAqB58eNUjhbmiHXOp6OZxo8ObpnjMdxDVPNdBX6OJP3FgficXlNDa00FFuqic/5ymC5cZApoxC+L1HI52AJger8Asqzc3DA9B3da8udd+96bt/evV85GpnH8MohhpkxDaOmlWHG55IyBtBVBAS/faqMmCZgmcD+VKufSUs10nXGT+zH0cU5pMJAL1RmFTYPSazfgvGda0+/Pay/1Hf3+rb7Fe86MDmZk6ms6O7vBxjg+j4qlQpMy4Jt2+CMI1QBojCEYCLZlpfNk9wmx3vk+9UY1fiyS1icgwodj09s5ZllhrjSlFQKQhgwDQNSKUSRbFZN45w3+zOYhoFMKoWwXsHs6GX0ZtLYvmXTQveWdd8a7+36MuN8hu1/03BfeMsZz1k+q8whqtYAxq8/YcEYRMWFZ2aQ2X4vlIzABYWJHxV6p29ycVFyAeRsABrMEBC1ECrHIb0Ic0LgVDr/dte2rf+pXwZ/v1yrPnLk0kUE9RqyuRws00Jd1+G5HnK5HCzbhu8HcT65bsyJxyGUjiNzKEgopiEYAxMMXHNIlZzavcYsOVn93m9KUuPsDWMMhjCgpEQoA2goMM4heJztq7WCXp6nKBW0jKCVRNq24RgGZioVGGGIwTVDsn3XrmdmHrzvz17fsvVg/RvHA3zhDQuFMIRT0Cg1dnoaQP3Dfuk3N8MADBOYvh0TVZY0toDpiycxfvFk42KJmTGNC+fM6W0p75XM3Ds/9tjdT2zp3Jk//7Wv/HCpWmsTOsm51xpaxg2ptIq3Vc4FOFdxXr5ufAKunpigsZBcy5XbxftLeIpvyTkD4xyB50GquGuxaZpQUsJ1XXAuYDt23KHTrSOo1bBtzy7s+vjjJ0Z7u/7wQir1slUqpZ1T77D6Oy9GUx3tgDDAuPGez0RrDWHlkNmxN97h3y6TGzcBCshvYs1j7GIafEsfEEawDAXx9lg8CygVV5G2zm3sLC/cfcc7Pyr9Z+8eH+8vef66icUFMT05ibb2DnR1dcL3Q/i+D8/zYZgmDJ7MXi4LsOMgScVBudZgXEBceSSdBOWssdiJff+TRfQxvzU0UpuAFWvYrnGreLtgWid54xo6SV2J88WTBcVKQ8kkTxdx8K6khGkKZDMZ+NUaStUqQt/Hrr5+7L57j3fs8ceef3PL1md9QOPwLPClKY28AJzr5ELeLhqDRLnVT+SmpOHXNZ76bwZnO5iRM4KDd971Ym1Nd8fHa9WHxt54ve3Q/CwiaKSzWfR2d8ILQtTqLrQGbNtGLpdFEIQIwyg5s8NWhOQrUxGWTTzS4Habi2fAFVuqdd9csdVc2N6YFIsvbuSIW5YFKRVqtTqCMIBpWTBsE1ppBGGcumIYAowxTE9NwY583LFpE/rXDj4519v5X47c87FjJ72Ae8+/BHt2LrDzxUiZjo7rtr3PvTVjQHQ71qtqLQrIb1IcQAiGskijWqojePPFOJ2k5oG5QZy6IhVY3RPu5x/3Jz//6Pjbn/zEF+9Ipa17nn32Zw++9daGE/MLYGDo7utDe3sRExMTqNXraCu0gXMezwQhWVkNBpWcUlNISs8pDc042DVC7isXpdD+Z3VbfuB2VZ5s8xogTnWKz8VKKZM8XIAzAc7iVBIlJVSkAAYIYUAIDgUOi3NYACanpiBrNezsH8DGRx49W3nkkS9ObN/6vRqgCmfHU+6JUeUqP8CiowETtPWR65KRxvl3ZOpyUfcOfAY624eFfOfbQz/+o3/SaZk/1/vccxtGp2fgAmgvFqENjbqOq/yYlgnGBZQKoKQC50Z8JrH578qAHMBVA+O1Pyvk9hHXuwdjV1Qvu3IFwvJrWHJGBrBsG8I0IaO4R4NCXHkKAHzPRVCvYrBYdO/afsep8t49Txxav/m7ExKi/ObbZvSdb0OOz6uIK62p1PEtgQLym5QAENpZTHfvgH+5AvzFn159ozACSpUI29uM6POPhm8xdrK8acMTPz4/n95YKv341JHD6yvlRZRtC5ZlwjQNWJbZXKGtVbyQk/O4oQCPS2KgMYgoHS9sitdzsmsH3++xw7lmFbx3u/J93Cf5iF35d2puCFcu6QSW/njxLDiApEkVixfGSdWsGGAaJizLgiEEtJLQYQCvUkNQqaI9l9V33323DD/++Fdf3bHjn9cBb+3FqYL9lTfExMGxuouUXqoOSsh1MKaRzgRWx3oUOu6ANV/K+qK6+OqGdf9k+KGHqtvGx38tCHxM1WqoLi4ChgHbNOL5S6nguh4iKaEZg152OvC9Wwotq05Fm+htaWXBA71skFx2NjG5JJ40j9NGwzCCBmA6FkzTgpQSnueBMwbDEBAMCDwPKgzRVWjDwKZNp8xt2/79sT33P3PAsVB45lkr9c1vGpVjx0JfKe1bZtyggNz0KCC/qTGAiTjwiYKly5q0QiYd4lvf1Di5D6hVMfLwo6ef/Gt/7ffvz6ZTn3Nr//0zp8+kRkdHWLlaRd/gINqKRSzOLyJodO/U8UISLpISdUCzq6fWGtBxP7vGrOe7PNPvy3WKd5Cb0PX+Vuw6t2pUBeCcJ2kpCjKSzVOutm3BsWwwMEQBUKrUUFmYw/ZiETsefnC2/NnP/s7sjh1/zDRc/9yMhYOjyuZpj2c6wjgY51c9+u3HBGDChA0bScUk0LuyAuOoqRouBiPgWstAZKWLfuT71jy5Ze/9uXtTqZ8//M7+dadHLsHJ59HZ14d0Joua66Far8GyHVhOHBglodTK+2/G3tc6QCW3tWukdF7rrMny7UprDWEY4IZAJCOEYQgwIJfLQACYnppCvVxGez4v92zbftL5zCefeHrvrhfP5fIzuDSC+u//PvRbb0UYGgpgGIpywG8dFJDfzLSKW4GbDLCvUUWBMYCbChfPAweeBQDuGpZ/6pd/+Wj3Y49+4c7SYuoO2/6sfnt/z/j8PIJiO1J2CpxhKR9Sa0itoGW8kKSxOioOyjX07dhlhHxoGgd3SinIpBmFIQxYpgmTCahIIvB9uNUauB9guL2IHXvvrwx+4nNPndm67Q9qwDnz8nwhPLeoolNjQeHCkcCZH9FpeOArztvcniQEIhioYxLjALKIQ/TbdkKsswC05QAlATcECikg14FgsYS5k/sBHkrY3QKVgnGhf9vJ4kMP/ub2fKbtjmrpf1yo151qEHC3WkU6m4NgDIJzGIYAFzyeKV+2sJ2QD5XWQFJNBZwhkhGCwAegYBkmICP4foCoXkeH42Djpk3T7Z/5xFfG777niZNVPebbAM6MsfCdQxHGxzQ2bVLgHKB0lVsGBeSrBwNgQUoNpfyXuXhl9MGHop8Kop5OL/js0xcuYG5qCtVqFblCAYbjIJTxIk6VpBAorZNFm426uss6euL7O/N6rfTK5T9rtvLn5afxyM3l6syVa/+llqckNSpUNHIiDSFgGgYMHtfS9VwPbq2G0sIiNvV04vG9eyD3PvLHp9Zs+bV8yql2jEwVFl49ZcrsYBXBos++9bvomBxBAZkb9TJvORoMVQTYD+BuAL0Aqi1+Ti2zZwvwsR1A3QOkAjgDLAO4HADTIwAiQM0A0WU29ukfx+IDe8vp3u7/unnzZvWA7fzCoSPHnIuTU/DyLtKFNrQV8oiUQpgENdcKxptpB5pheWfGBk05K7clBn2dnebVCX5g8b6WM4AbAmEYwvVcQGvYlglTCCzOzcGvVpG1LOzaunV+w8c+9vrI/XtePVRll6Iv7zMRWRITJzXK9Qgp6yN4heTDRgH56qHRKJSbBD/T7e1HX37ssX+91bZnHnnuuR/bd+CdwuWZaWSzWRiWBTAOpTkkV/ECPB3/Om80awGSvDa2soLAsge8FgqoV5n3dZC0LFmWsaXa9mg0nFLgnEEIA4ZhAFLCrdfhuS5MADuKeWzdeseEtfdT3zz04O4/PJkzxtacvpCyzs1YbKFcb3vpzwK97ykm5qdME5AmalQCIMEA1ADMAzgGwAXQhXgdym33JuXTQG8HUI2DGSgNBBHgB0naX7LS2BfKeeUlM1ee4/vvv/eY96M//Bc7nn/ZVKXyj4RubXDWrcO3HWRyOQS1GgI/gGGaWJmYsoTrqycTrpxwILeZ64ybekX257JbsHgxp+/70ErCEgKmYYJDI6zX4ZXLaDNNuXvd2tL9n/nUU7kHHvhy3fUvmvvPpdjkvA+V0pivApGKK6qQWw4F5KvLimLEdcOovtnT/byx977o40Fkzbneg9Hp04NhvQYpJQzHidvwgkNqBSWvXAm+fBnnyqN6mvO5Pb17fMFWbBuaL9UH1xpgnEFwBqYVwsCHW6nA4QKDA/16w/phZt/36HOHd979fx50zMnLF2ZF+bXDoifgQc623OLbz0Ae3icUYCQb+W0Xa74bC3H++HnEf6NO3KYBuR8C1TpQc1c0UYNggDABcAkWp7EMHD/hDB0+mHoz0+aX7rnnzey2LZMdDHpHJvM/nz571izVXNQWFyGVhsEABpUcXi59ChiWAvH4+8Z5I500gSG3s3c7Q3zVbZPyr2EYwDINpG0H0EDg1iBdF93ZLIY2bhjtuv++F9nu3V+MnPSbna++mu49fLZw3ipMIp0HKnZ8VkjSlncrooD8NnCpu/fAwb0P/6edipWKUfQT3zlxvCMUhujqH4CV4nG9VB2XOmSMJTPkuKohgF7+/7tEZo1fe68CAwwrb0CTSTevpWoA1zjdiqX6zDo59coYYIikYk+SEsW0hmAAlETkeahXK1jfVsTuoTX+9Kc/9e8OfGzv74yDlWefmIF4+hQzNocuX1/Quqwagb4C4IHinKs03hCRfC2/jFxJx+U3CzlPzgWh/R+/wKc/M6G//Tc+cfmBDet/a0umazKbSv3S26/u6ztx7iwGhtei2N6OcrUCqeOmQc1F7sk0eDPdbllAHi+Qbz4iuc2sWOGSbADNfg4MSfHM5Of4lCI4AFMIZJwUbNPAzOQk3NIiCuk07t20+VjHw499bd8jD3z3WM29sP0bT2Vsv14SuUwVAVO0kd36KCC/DdQM1Mb7O181PvGo5wjt7mHsRydGRtbPLS6iWq0glc8jk8kijCL4QYAwDOPFTCLurKiUissfcg7WaCikdVKFZSlNoRm0NfdCNEKsFnp5iUO2FJ7H16FZazcuK8ChoOK245zHp15tCzoM4Var8KpVpMBw50A/+u65Z3zisUe/fXL7tifOgF3yAYZTi5ztm1NiQCmeMoBygDj5hU7OvBeGeFFnCoANIHj3m68aDuIDEcM0gLQdz46ra61IlwBzAJ4CL3LFa3VlHD5uoNSNef5D7pHPpo7zh+/50w2O1bYrxOfF0XcGpksLmPVdtHV2QIHBDQLISAKIKwgZQgCaxXWilQJnyUJQHk90xB+dpI7GNZLQG5+txv/Xug25tTT2hkqq+EBNxKWFG7ni8UC2tG6LI04VtUwDluEg8FzMzVWgXQ9ri+3B+uHhC/zTn/nK4Y8/9ucnsulzbfsP6Y4z54o9HXmXW20RDY2rAwXkt4FMAJg+l9/u6nir/+OPej9j2+h98YWfePHIkeH5UglcCLQXixCCIwqjuNW5UhDcSkrWAQqymUfenANatlivkW/Okuot0Emawns8N9r13EJ0vBPRWjdnCRsLNhuhT3yGBVBKIwhCmIZAyjKRsm34YYh6tQK/XEFfX598aM+e6ugPf+6/Prnrzn9Zjme/OQCFnKHRaQFmsDLtgLwnhrjCSg1x/lr47jdfNSTig48wCIGqd3XKyvJbMgbwGmTVQxj4UOuzEfYXgP+J8Uv/AWrxlzNjeudd/9c9VqY22Nv+f3zpq1/DhdERdLUXwUwTgdZQWsblYMGaFaukZHHFKigIZiSnCBuFKGONUqCNoLsRhCu11LWWrB5KazAdrzEAWDJDnpw71snfXymAsbj6lCFgGwKlUgmV+Xms7e/Hrl27L3Rv3/7Hz+y+68m3sumTDoAuzuFkMzPcMKBpjFw1KCC/DXALMCwgDWCso/Pskz/2I79/TyYb/lAQ/syBiYneM7Mz5ukTx5FvKyJXKMC2s/A9H77rQRgGbNuGZVmouS4814XgHLZlxYvzsLLeNBB3aGzUM1+evtJwjb4y5CZnmiaUUnHAoxGXHDQABg7OddxUijMoDfi+D8aAQiEP2zAQeS4mRkfhlstICY77h9dg+85dp8Ntd33pYnvvV5NgHGhELiILneqBW3BQ6+wEkwEMy6YeK+9CIz6ayQOYBHABt1c9coF4Ixo7cBoYnY4rrFxzgNHxrZmDGddFTXNU1q0Dcm0AmEIEVMGDV3uzAaodT+6a7C589rFHP3ng4DvbDp04rrnjsO7+PuSzGSjNUPd81OpVcCZg2yk4jgOlFOquC60VDFMkj7oyKG9oBOCNWv1XXk9uTUprcM6RSqeglYbn+wi8AIoBhmnCsk0IzhBFEVSkITSaY+X4+AQKjo2P7bor3NLVd7B2z94vfveeXd+9fOnCma7vfgs240hHDEYqDTOTguFZyRS7E+/sqWHaLYsC8lWGlRdgHHsbGOiHXliEZIAMgGoIGKZGlDbck6Z1uH2o9wv3/ORfiba9c+AT/M037zwzMW77lRIs00Aml4cpTEQshFZxy17GGTgYDB5Xf9ZJF08AtCO5DUgpwTmDaZtQKp4Bj6QEYzzpxMnjU7BKgmkFUwg4pgkVBqiWSqgtLqJgGtg0NFTtfvjBw+6uPV+pIfvFBSc9Bq152+lTqjgzqaVtQZ4dhzV1CcXDLor1AozFCKW5GdQRp2OQq8WJZEAdwBTioPy2ND4bf70PNQA1IQAzAsqTaBwXSgBzAC5wdXCj5ZT7H3vknN/d/vnZJ768u1yvp3QQIGQMzDBgckDxeLmngoJkGpoDisfHAzpJ5VuahFiW7oelOv2NgJzG0NVFaYBxDmGaENBQUYQo8iG4hmnbSFsWNOcIfR/VxQUoz0NBcNwxvDbcfs99h8N16/7kxK67vnywqzjV8ezTat1Xv2b4jiMxOKxLQ+uhpAvX40j7AFgAEczB1xEUoyortyIKyFcZ4/QRZP/Z3wFPW9BBXDs3BDCVTJcVvTqggTd/9V8eHvnMz1Z/xLCPPab5f989evFTx86ewdzMLKAUnFQa2UwaYRjC8324rodcNodCLocgqZEa+D4M04QQcZ55mHT/tG0bACDfoyHBlbN3tCu6+cRpKQqu78GybOTzeUil4NZdeJ4Pzjls20G8eFNCRRHSjg1TCHjVGhZmZ+BXKugqFHDP+vXlLZs373/20Ud+98T6DX/58aOXfNsQ4L6vHvw3/wb3/v7vo9LbC9QU4EXgFzQck8NXGgdrVSwgHrBul1nfD8JAvNp1BMBCi5/LLUVK4NxFIHwbgFyxRzRlFEHrS0fa83/A9+6q/VQQdJw/fmLL26OjmBqbhplOo7u3D9n2IrxIolKtourVIQwLqbQDzhhkGAJar0jzWz6Z0UCB+OrCeTxuVmpVmKaNTDYDK+XAdeuo1apwpQvBGDLZLATnqNTrGBsdRTGVwqcffhib123aN9HZ91vP7Nz29tGu4hQAYZhmOiy2c51O16oylPWRc/E2poF+BfBMBm5lFGPSg89o6uJWRAH5KsNqFRjnTkCYcbM6AFAszq8UGrB9cK1h4qUX/OkN91/Yt3f34t1DA8GWl1+dazPtx4+fPtkztliCW60hly/AtB0YhokwjACl4HkepIpTUgwh4qRfFS/w5kKAJ7M872cH80FKQpHWaKQjpdIpaA2UKuVmzqJlmYAGojAAAyA4R8oyYQoDgetidmYaNjQ2DQ/LbX39F9L373328H33PHuhZ83LC75Zf2P9JvCDR7Dhm3+E4eee4z0ayFyebEYqKoi3EQfAFsSz4zNItuWP/q24KTVmXxcBzOI2bgj0/YmHoBAaeAvA/x/A/wDgTgAA1wyCC1+bhj+yYfs3Rvo31IdefPFnH376qccPAenxaoXPz07DyeZhZ7LIZNKwNeBHEjWvDgHANsykYlXygMtSVICrF3SS1SFeb8VgmCYiFaFUWgQXHJZpoLOjHVxrhJ6LqfExKD9AxjKxp7Md6+/YtdD503/92VNrh/7kQHnh+fNBqoKjl3nX2Ckne+48lOMEMAwdSQkVBlBJ5SqLA3akoGQdXCuA0wh5K6KAfLUxLahiDswRUOHSLEzj4yllyAFY5rHjzP36k96Rn/iJWb9/zVce23PPyYGuTs7b8p+PDh6U07Ozwq9UIMDgpDOwDROu68Kr+wBDfArOMJZOvYKBCwENjSiKmjnk5NYWd4/jsGwbfhCgWq3GQbLtwLZsaKkQBlF8G85hcA6/XodfrSANYOPaddhx990TbUNDXz5zx7Y/fW1o+Oz0ovAxBmNMQPZ++Um987d+HTbAFnD9qiBrEQ9Wi4gb39DAFePJVwnxwQr5wJJB6pIGfgPxlhYH5BEUfOnBnp/BfHdx6nBP7589vGf3wsNeLdpx/vwu89TJtWPTM6w8MwMnCFDo6EAqnYYIArhuFZHSsISxtHgPy7ogLxsbqcrKKhQ3XoBtmfA8H7V6DUJw2PkccqkUICUWK2VU5+ZgQevOtWuDO/fsVvlde587zcx/csCxTl5sHwTenuWFZ153+s6+Igxd8sKM7UHHFVn4suY/EkDIbUTMhKbt55ZF+7XbjwR0HW15hYUKw7/6b8aFTz6iaj/z6XM7t234P7cV2k9+1nR+4fihd/oOTE5iYXoSViqDXKEI27JhWjakihCGEWQQgRsCwjCaqQ2NmtPNArzLegvRMHHrYYxBao1ypQIuONra2sAAqCiC53sQ4EjZNtKOAx1J1MoVjI1cQtE08em778amO+56bXbT5t/93v13vDFlpEbXHbiU1oPrMReM+Wv/xf+Oju98mUcANwGVB5R3neeRQTxTbiApb/dRvQE3Ob7si3xfrlsvrgwPo94k1NgMivOjYrdpp8/veeTA3Od/7l8//OxTOx7h6ufOFNo+8c7pM5gYH4fvesh3diCVy6GrvR1BECL0Q2i5Mj3lyrxx9gHOKpJbRVxpLPR9mIKjq7MDhuDQMsLC7Ayqi4tQnoe+QgHbe3u8oXXrTh39mZ/984NB9GX9t//eWP2xB4F//H8AqZTSpvC0bQYIRFJDk/akqxXt125mjMWnnriZlM+68noOcCP+PyEZUDcYmBG3vL/GfWpoyLAtBwiT4dBxhDMLbMKq1PyPP36y9LHdvzecd2odhexn73njjR3j8/Ptl8sVY256GvliEdl8HoJzaKnjaipJwxcAUFJCKpU0FqJBY3VggFbxok7B42orUianShkcw4DFgcriPKK6C0NpbMlm0btlywT7oc+dPPvA3j+64GS/fHrRqHvPvixyzzyZzW27j+WFgfX7X4cTeHABfRzQZ3H91CUTcW70BOJcaRq4Yo2UlVqrn8it6V0j4NAE6o4EDz3kKnXeoZWYeeqb86c7hqcLd9x5ZOeGjfX+N/dLO5XZe+b4ibaRWg3TY2PItRfR0d0D00mhGkpIraHU1QF3Ix0MAC3oXG0YoJVGFARIpRzkUikoGWGxtID56RlktMLG/t5ocN368+v37HnN2bL1zfLA4FNzLzx/HgffBuYmgK07gcw2IJ9XyrSUlnTYvdrRfu1mpnWcCK5CQF1jgWSzAc+y1BQNpCMNEWmo6OoBnsm4mU/V9RHlpcZwX4jvfp3pb/8On/2TP9azP/NzI6/v2PavPwn99kOM/Y890zOfOXjsRNfpS6OolSowhAFhGOBgMEWcsiLDCJol6Q2Np44rjuPZyg6ejduQm1wSNFiWDSYYAt+HDEMwreFYFmwhENZdzE1OgkUSw/0DeGjX7knj0Ue++u2HH/itk/n8KbiRhS+dtvBfv6KPn/mdyp3dT+odGx9AuPY+hCKj/EuH8A7iyhaE3DQiCV2PezIEuVwYAIv8n/46oskKXnvq27WZu+768iP14Mi29o5f6ezo/Hl96JB9bmSEl2ZmYRkm0tlCvM6GccikudrytJR3S2MhtzaW9OEUnIMphcCtw63XUC+XwZXEurXD2HXvvXVj/frfq+3Z86fza9bUsydPyq7vfi+3wJgfvXM4xN/4Gxr/4LeArXe1+uWQjwgF5DepSQDbIh+/sHAePcJE/Voz5Ig7fyGoAEgq7NYimOeqYIJdu2FAcj/Rwn4o5yIyJR8v1Mb100xjy59/I59uW6MOP3pv5bUd29+qd7YHu45eeOtRp/2n1xVPPXzkwnmMjI7BtG10dHUil8+hUqsh8FyAMaQzaTDBUa3VAMZgmtde6d1sF/wDv0vkhms2XdVQkYRmDCnbBgeD79YxOzcH5rpYn89j0/C60cL6Td8du/++N47t2fX2xVz2El44BPy35wB3jYLjRAAgfC9l1usGy+bqlw1TngZQWrbMoTUvlBAAX/gCcPwEEEVYmJvCsdmJeMAy4/o+pQvjQKgZ/sW/Yumf+enQvvfu46/cte3f++uHT95r2g9uKbR97PjcbM+F8cuYdxbR0z8Azo24iRDn8djXKH2YBOjXaxZEbl1KaRico6OjHdVSCRfOn4dyXaztKOLOnTs95xMff/bcww//xeWBgX3G/MxUz7PfcvzFqjTBJFvqy0BuMxSQ36T6ADyiQvx0fQZrAZTf5+/pQEHP+O95OzYzAgMjyAPMAvQo49jz4uvc6F5njA708tlNaysHeXqfs2nbW7sH11SHp+7K1p9/ucd//c104Lv5qFbndQAyCiEYgzAMGFwk7Rbj+QFy62ukLJqGgNYMWkqEgQ+EESLXRVpp1d7XV9v0wANu7557v7VY7Pzto1s2Hj3tGBHGzgN/+kUTf/Y8x8N/XaIzDwCQtsOjdFowpVCNwsZiRNpgSOu9+Wb8haRO+dW3YAA4vvSEUQukuti7MXwrO3CUdQ2PD3/840fXbFhXso4f/4zJDreNz845tcVFwDRh2DYsIy4RqxGXhJXAUqdjmh2/5bFlp345Y2BKwSuXALeOjlQKdrG9vPauu84OP/zA2fm9e/9gtL341EkFpI8etowXvmeFvcMucrmQKqTcviggv0l9FsDnER8qj+CGHTKzOUDcDeg1DPJMT2dpvxeh72svqSL2pVRn3n7zRx70T20Z/Nq2zQPvbEgV7l2TKf7k2MWTjxw5ejh9aWIc7V1daO/ugunYqPsevCCAZdlxowwdtwRu1OAFuzJNJW4rvPRs3uWZfoBFoc27vN4v3OgJqGvtXN/vY7IPcuPv4/7f71No3KWOu3CmbQeCA169hunJywhrdXTn27BnyxZ3/X33vTXz8Y//4Strh793xg/cRdtSOHUC+Nu/wPHccQnj8QhOXkNNNR6injzM8s2aZsbJrUCDc4mMrUYiS19+bRTey+NMbe6uPvGpHfse6MxP3CflkU19A3/l7bfe2vv0gQOGNA20dXTCzGTBjaRzJ2eQCknnmGQlAGPNFaZs5SOuwK4cRd9rYPxAY8/7cKPGz2WPf+VDfNiHK+yKB1j5Hl75Dl9p2XRTMoIxFteab1xuCIGgXsPZU6ewvrsbn338MeTWrP/u3PZtf3Jo986R0LGnCpcvF60XX67j5KHQSKVKMpfTerYKSua8fVFAfpPqATAIYBxxKbgbNH+iI0AVAd0OYNI0lAwjOBOzMLxIBjIKolTaH7901o2+8vXFjRt3ja978PHLbt+aw7tS+U9tOntsx0wYWrNzM3DDEIoxZAoFZNvaoDhDtV5HFEXNBkFccIikVjkHklZ2cZMMpVSyiJU3F4XG5Xv1itQbzhgYX1Yy7IrFUnrZvyteaPI/W/bvB/X95b6//72cRrLQa6lo8bLHXHoFjCVVNRo7cBUf/DTeJ845hOAAlqo3XNkZcPnp8SsrPDDOIZLum4JzqCjEwtQE/HoFjjCwKZtH36ZNi3Zf8bWOBx8+WNt935EFRC/MV+anytlifCe+D0xMaGABYEJjZee4a1W2oL0QuTUwAIahwwgI512g5DF0ONK37Iq27cOyq2v+8J57z3p9PY89aovdslS9c6ZaL45PT8KTEqlMFrl8AdlUClJrhKFEEEmoSIIllVciKaGThdOCCwghls3AqqSDcry4mnEOtqwE3ooPktbNC5qL7ZdVdVkxprGVv9a4qDH2sBu1F7qWKydvrjMh06j3zRmL9yNJSia/YpwDsGKcU8m+J96fLHVJjd+H+P4ar15p3TyTkdwRkOSHm6aAwTmUkgh8H57rIgpDpAAUHCe8Z/u2s70bN53jG7aM5obWPllKpZ8/fep0UDp9wsocOZryanVdMJSCZccFHGgUvK1RQH6TqgOoID4Av5HDIE9KzbkAfKXBhECUTSFMsSBKOwGTEfD1r2P6V39VX/ypvzad/cVf/Ua07o7vrhkeOmyd2/A3zx06vM09drS36tYZs0xwLSF9F9xxYFlm3MET0fLHW4rG2NKAr7QCdDyAKgAi2XHEA/GyYJI3BstkgF0W212Zm369se2j2q1cb/L/ug2Rktej2VL1DL10Vfy7jV9eHlRDr6h13HiUK3NSWXJZ44CmeTCzrFIO47x5sKSlhNYKKvAR1Spg9YrKFQvenXdvS6976IFDl3s6/+35dR0vXxbTwt5/ymZGRxb3PlyDEM2n/cHeMUJuFRoQDHBMQEIhZQOMwfI8VJQe+05f71h7X/drf6U9/3j68uX/+czBQ58o76/63sysGTEmIsuCaZpgQiSB47LPJ+PQWsaxdBIwcs6Wcs+TgJAx3bzs6mn1d3vqeumLsWXjZmM8WfnvVWPPDfZBj9abY5qOxzQWX7jyNxuvF8m4qmU8gdE40GkcADTfjOTvwNAcBxs4Z2Aa4ElTHqYVEEWQngcWBsgIgWw6jd6+/okd27d/I+odeOKsFqe5RtUfH8X80YN88dvfVHMjozU8/glpbN8ABOWlN5rctiggJ9dWLAJTk8Df+iXg7Ze5BvjLT/6FmhWW2vXL/zQ48tD2b47dPTz6YCr94F/JpH9ySoX3nJ24zI6dv4gLp06hs78fazZvhikEHNuCUhpRJBGGIUIpwRAvehFCgHOBRtjdqNYSSdlsLsQZb3a7U1LFFQuSHZZIdmgrLf185VXfb0ZIw/JTm9e/m8bObNmNG1k77/LYXMQz0lovVWPAslmbpbtv7JR5MpvDwY1G57/4kRvtuRsHLY2dFgODjCRkFDXbdxuGAdMwYZkmOAOkjFCr1VCr1rC4MI+cJbB3+zZs7+6Y5Wb0Wu3RgX0vPTz80jlj16nJ418I+Ru/JdelPhGZO37mWvtSQm4DGoCCLbLImkVkIoWLhezi1x54+JWd/vTI+qHCMz/Sln907tzIvafn5jovXp7E+MQ47HQG2VwBhbYi7JSDQCq4ngfLMuPPdXJmKYoihKEPKUMwAKZpwDQNGJwjCCOEYQjGWTKexme3lk9cKKmglUIURfHMezJu6utE28sP5luS3/4+RxEGQCsFpeNAWfC4EZNSElFzjNPNRjpx7XcOYRhoNO9RSMZKpaE0ABZPULBksNZaNZ+PaQhYlgkDDDII4NXrqJZKCF0XluBY19eHnevXIb91+7PVYufvX56bPleZnx1hha6aAOL3WQgF09QwTYAzTSMmaaCAnFybZQGuC7z+BnB5AgBYLYpw9pXnYHUN4tLs/aWpjZ2vdezacam4Y+fiutmZmeyhdzY4UnVftu38vOeJyfPnwS0r7vTppGCZJkLGEAQhpJJYnqunATAR70SklM1gUXAOfUUUqxnAmFja4TSvuX5gvvLn95+Rf2U++o3Ns2jMarPmrHfjoRuzVytm15WOdxaMgwsBzllz5yuVhEoOCRozQPFZCA0wDcPkYCw+3coZh5YKXq2CIPAQhSEMcHSmUuixe1VHe27xrru3TWV37nz+TK7jqbFNPa9fMJyZiakLCN98ihmH39Bq596IOylamkluT8wAmIFL/jF4M9+Fd34z0FEMLnJ7XPZ+bLx+56dPd+WHT3aOjpy769TpBzoPHlo3cnGkuKg0It9FvQREngMzlULGsZMyiRpaAVLGwaWUClozCEMAXECBJ6dQOYSxlI4GxIG01Ctn0BljMAyjef3N6lpDyLsuL9JxWqPAUuoO0/EsdvPMH1t25lSvnIVvJgkuqyilpQSDimfDEZ/ZNQ0BwQDluqjU63F1ManQYRroLvYhm05P9W3YOLr2zrsWph566A/PZ1J/Fn37G8yYmOS5rj6dStmoSwvMNAHL1rBtgHPQHAZpoICcvB8q+UJp4iJe/0//FPqrGegf+1T06j/4l+OXN2/7s4dG257v8/xHPpbO/LQQxoPPv/RS+rlX98HJZNDW2QmRV7AzaaRMCyYXkEpB6jigDKWElAoG4+CCQ0E1Z8R1kr+3LFMDXBgwTROccwRBgCiKmoHscmxZIiLD0tVxa+H3F5R/fwH5+8w2v+rONFSSO7r8iTMw8Ct3SSrOg1RKQ0OBMQ6V5Iw3cvI1Q5JfGr+ZUkbQSsG2LDi2BSEEDC4gwxCuV0VlYQ61Wg2MMQz192Pb5s1YNzQ8l+4qvqzajb98abj/+ReG7lzIcRbkJi86+NJvCJz9aoguK4BjUrEucvtiJsCBI/P7cHT/r0MdBRCC6bTDRn/yj/TI9s8vYMu2p+5Lpd58TEYPDHa0/+ymkbFPnh0da7s0PoHJ2TmUowhtHZ0odnXDl/HZRCnjcRIATNOMe0CIOOgMwgBhGMI0TViWnZRRjM+KNSY1lFJgiGfODcOAZRhgy8bNxtF6nMahm2mES69recrbDXblYLvyabz772kNHUlIppoHJYYwwIxlIY7WcWsPxAcrEQDG47GTsyQtCABUsm5Ja3Ad99YQjMHmHDIMUF8sobwwD6Ykivk8tm/ehDu2b4fhpPaV27v+bHztxvMvFtsvnoo8foeGWhNpGYURAj9EFMrm+0zIlSggJx9IPL8KjsATmL7M8PprcjrXU3qlp6OUTu+udty59WJvW/6LfV0dW/4707mT6fDeicWF4tmpaYy7LgzbRr7QhnxbEelUCgoaru+j7nrJLJBM0lQEuIhPMwKIdy5SQWoFyAiRkuBcJCkZrJmqsXyWOZ4VunrsWzH7fJ1A+wd+l+J7/0D3vKJxCE9eh47TTJp53zqeNYtnxwEhDHAhwFg806KSag2NvNPGF6ChVXywYxgcWkUolRdRr1QReT6Y1mhLZ7B53ToM5LNez/p1p6xtW9/ytt9x8GL/mlOjTur4OWNxQuJNiFOLjt5/yoQ766MgQhQ0rK42yHwBtKchtxUGoL0IHDsE/N0/gT77PegxxB/7CByWL/R3fy3Cz5UV/pe/6Z/f9+pl7ytfflb8r78y0Xfv3hfWvPTizo0dxc/Mjk+uu1Aq4/zkFE6Oj8NwHGQLbcjm88im0mBcIJISoZSImuNEXG5Wa40gCNBYdgOw5sJssWxRp4wi1JMF9owxoLk4XjdGzngSBMs6iDb/wUd2wL0irZCt+O/at2fxHLaS8QEJE/EBiBACbPkkhVZQyU5BmPGBSdjY5ygNwQUsw4BhGktFB5SCAKCjCJMjowg9Fx2FAu5buxZDbW1ByjRP1e++540Djz1ycLaz8+BiOnMq4qw8eeBEqL75ghgdG9Xznq9xdhEXDAtBWqCeU4Bt3bg3kNyyKCAn3w+GXJ7DchgOH+G1/o3swqMPh+gojhmqOFaoR9i9676unX1Dj6cXFlznwP57vbfeUOmZmQ5fqRQ8D7WFBQSuDW6aYMJAyrIQyghKyaUgkjEsT7CLF+7w5qy6juRSDvmyuJcD4M1VTsuGcgVckdn9IbwR1/fBg/zk9DLjiOvQsGZIr1Qjn3HZ2p8k8I7zIBuPx+L0FXAkb2HzoIMLDg2OyK3D9T34dRdwXeQNQ+dyuWDNxvWVgW2bp9PDG07rteufrfX2PD+RzZw9K73wol9W9XPPcZz6pmld9E1jnCuUSxHqptYzPkqlU1CVfcCafmBwEDh+HPA8xE3vBSBMQBvv8Y4RcovQABgHDBMoFIFTrwNP/AFQr6y4GYNmW/AON6Pf1yd37dAzT30XM08/u4j/7z98bfuGTW9vvXRhgzU0PNFWrv7Q9gvn8+Kt/d1nz1/IM0OYhpZMunUEUkJYFnSyoN3gDEo3qi2xZuqaauY6xwfz8ZqUOChVSkFGUZJXrWGaBkQyofFeltd6+qh8kFGCJeNgnGqi434JyVdcIWVZl9TGbZNAnYFDMIAbgMEEBGPgSkJLCRVGgFJgWkNojQJjyOQL4ZqBwYWBvff42e3bzmkpn7o8tObJA2vXnpxxXUSXxxh8j+HJp0x84Wk2n82o+ZStISeAegD0F4D71gL2tZvmkdsbBeTkg9IAJKAlGANsO843T8jL82zx6/v5y9v6F48+tvOZdRUc3Oy0b3skn9uTqZV/6vLM7PbDZ8/h5MWLKLsunEwWPX19aO/sgGaAHwRQAEIZIZQhZCTjGQ3DhGEZMJOdSBTFZb+aVpS3WlZ0QF1dgKA598OWVRC4zottXq5X/HfVDfTVF6287P2cpWQcQjRmr5aVMVNJ/rdaOnXcuE0oI0RBEJ925RxCMAiDQzCORnku6HgGyOIcYAamJ2fg16so5vPYuG4t1vX0RrlsblxvHPjW7LZ1335p8+4Lc4XuxU2A137+fKb4zjfEhPtkuf7M6z6eMyP2Ix+P2GCbZl99ReHCPFSBYcT4BmC/CGWagGEA9SowdRlALwADEA4AKzlpQDmT5FanAWEAdgpw0oBpXb2CHJAcUP8U0F2HDuFn/upfxfSFCwYGBgRsKzBVFKoguPDU9p3/ZS6V+ebnHHPoE471uXu3bfv0XLU6cHJkxDo3OorFag3CcVAotqPY3oF0Og0FBjcI4PkeLMuCYQgEYYAgCCCTqiBCibgpkRAQhgAXAoZpxosglVrRlOjKZD+tlo0zS6/4hobkjemTFUuGrvGAy/O9kWR4s2QfwfhS99MgWdS5tLCTQxjxOqW65yGIItiOg4zjwDbjhZqh78Or11ArVxC6LoTWsAAUM2k8tGM7Ng0OzUhuPPXKnj3f3Lf3ngMaqKaBSg7ApqeeSlX/+I+syyeP+xHaQwzuiKN5reLJCC6AVLKdXKuLNrntUUBOvh/LymLHM7TNKxSHrDItn3w6mj//yvzAj/zY/OxDO0Yn+7Nn+hgmcuPj921//e3CQKF9+8Li/IbFwDcW3Tomz5cQMkDYNuyUAyeVgm07UHY8sEZSIfR9gDXSWOIA9Koa2ng/syvf/4zPVfd9rSIF14rOcfWBwbvSS29xfOY0PrJo1M0VhhG/D4xBIwJPahUbgkNwBikjBL4Pv15HFLhxQM6AjCmwva2AznXDHi8Wxuv3PHR8atd9R9I2G1/T3fZWRyZ1+NDx/f7c019BGHrmZmlYOXeKiYWLEmMuMObKyssnUO/OQF5eYJCAntc6QAlA6RovpA6ow8ApCcgpQIaA4bzfd4GQmw/jgJXCrrHT+KGn/ghGKgt/7DQQrOyQXAeQBfS9AGuv1/EPLlzQfwzow5wrADC4gGWl/NAw/ZGurtk3H370WNd9j4/mFsrH+s4e2bj70Ntb+trb+msLi2vnq/XcTL2O6dERaMOAmXKQymSRclLgQiCu4CdgW1Y8Gy7jRaEyinPJ43KxceDKhEiqkzRmGRp5fdeLfm9ucdlcxAG34MmCWAmlkkpchtE8kyqVRBBGsC0LmUwm/u0oRK1Wg++6COt1IIpQ4Bx9hYLqyOd9s63jTL2n/8jMox+bmt287qQq1Y6cMXInaycmFzEzDsOrgbku0m+8rfS5syE/fSZC9xaFQUNDJRMpDPEkC+N0kpBcFwXk5AfXyI0AgNK8BqtrfPULwO+egJDtGPmb/517ZN3w8T6G47u6uv5iyMmv377zzs9F5fnPzFy8tOH4wYMdZy+cV0EUWimtBDgDMw0IHiduKK2hZByUawBKCAhhJOkay4PxK0a6Zl75tfzgo+KKe9DX/PYD0M30lPhp6xUzUnGNYjSb9TRKeFnJDBigk4WwEjKQiHwfke9D+x4MpbTJuTQED1K5fLj23nvTWzauPwev/u3v3rHhCwe29h4qS40uYTs9tYo5/PUvWEf+6Dd1uQ61+Jmf8POffjhiPAXk4hddOXpq+VvwHi+3DMjDwJnDSxcZ9vf1DhFyU2AMsFO4b+wM/sWBfe/rNwDgVwFdij8NEpwjCANUKvMQi3NAdzfeMYwAaRxIZZyDDzkb8zs78js2zi8+4Lj+T05fGrnn6KFD3tkzZ8xquWRp3+cpLmBaFjzfgxeGMC0LhmXBNA1oIy4dG0URVBQ3EJKcJZWsODhYUpXpqqeZpHJcq1slez8f+B/Ide/7WkN784dkUqax7gZJMSlwCEPEZxCEAaUVfN9FGEVwTANpIRAEHrxaDX7NReT7MKFVKuX4/UPDbO3mLXM9PT2n0u19X50udH7ne1uHR891F0IMAPjeW8L48287vQvjdsarhqFp1sMO24/6eqFPnqQZcPJ9oYCc/OAymfj/3/yPwH/+HUCawPQFHgUuO/VP/j8qnL6g8Y9+FVkhUE455ee2rD9d37Juoa1a2be1o3P4biez+c5Nm9fZ9eqD5Xpl6PziAi5MTmJuYRFeFCKVyaDY2Ym2YhF2KoVIa3hBAD8ImrPGy2efl4bCpUtVM8N6OXbtttPvMpZeN4y/YlZcAyvv+5qT8lfXbNEaV+R1xnmjzIh3pCzJs1FRBAXAtEwIgyPwPFQqFdRrVQSeB0NrZB0ba9vbsb67O+osFKbQ2fXazODga2994rGxs/ncxI++8fpU+vgfT5TfPobJmeHUiXLenvDn9NzYad8s5IIgrLAkGf/9vGpCyLWt/JwwBpgOJhen8PZb34F34Cl0t/cIpoVTMo6GXr8RHLjvf1s8fff9R8zS/FSbYb4+OD6+bmd7cc39a4cfqy6W9k7PLeTOTU+ziYsXsFivQwoBJ51BPp9HPpeDnUoh5TjNkolBGCJSEpGUUFrCMMyk/4NeOvhfVuVk+ZrKK0uu3ugJXs2w4vGBK9/AlWdEGz8prcA0ms2BGpVlDM7BoMG0gmAcJuO4PDKCWmkRmZSN9lwOQ8V2bOnZiN5icS6wnJdH77n7laO7dx1/yXHK6+aro1tHZqcGnt2vp4f7zNoD20J1dJ/Ek7+n+a69kRhcp3Xgghk6zi8k5PtEATn5wRnJApUjR4GTx5oXKwClqTHg0NuAUrCFQCS4Gsulqy5QnXPsi5vb501n5509M+25TTUdjeqJ8b29p88a1rGj7XP2eKeKwjbJuRVBIyyV4JbLiJRCqDXAORwnBcOykp0JW7FjaaazJBeyK4Lz5buWa2WZfBg7nsYs97Vi8xWPfI3SYnEzi2SnIjiggTAM4QeNFs0BoBQMwWBwgYwQaC/kYbe1yYyTXki3Fabatm0p2Vu3Tizm8ycL6czz3Uzsry54pYvHx9BxaASjM/uBxVeEe6lbTE0YuqwWwkpXd8iLbQpuBTCulzz/LpcSQpa74nPCAGGg4lYwOnIC6cU5dFgZAByROMC9Hd1sbvff0XMcZRTby+3AWb1u3etIp7vbd+8+ySqVI7nZ6eHhI0d6s8dP5oJydU0ItPkA3DBCdW4OZQ1wI84ZN2wbRpK2YQkRl5HlPFnsmQTAKk79uHKRp2aIm+SA4aNoENSYyFgaoZePPysPDBoaDebQWLgpknFeKvi1Gsq+DxlF4IwhZZtImwaG8zmItC3TjrPYNjAwVdi0aYZv3RrO9/cfCcCfXRgceGOms2N2FIAVAluCCbRfnEx3Xhxj7sJIpF5/SauFUVWd6FCB9KGjAMZQN5gwKCWFfN8oICc3yntOFTCttV2tBpdsc+LrO7bM+Kbxavf69R2fbutee393/92qtvgxG/rxycnJ3uNnz+DMhQuYnl+A5gxOJoN8WxuEbcNggNRxGxyml4LgWPzT8p0Jv8aTY9f74Ypd6bVn4uMLG9kzS6knemmWfPkxwIqFpAyNdJNGybJmcJ5UVDAYIDSgtUIkI+jAR+TW4XseqqUSTM7Q3dmJ4Y0bsX7tsO5s75i0C8VXgnTm5Yt3bH/j7Y3rLh4Hwq2lkvfIkRNB9stfsy69dpJ908kEcsuiNvsh7Vp7zY5ycKSjhWNBBxUKtwm5UbSGIQykUlkwDQSpvORa1BTPAFkVf+ATeQB1246+Nzg4VQf7dlrL5+9AYO3cun7t5sPbducq9c/59frD0/NzuVNnz4ozZ89hdn4ekZRIZTLIF4vIt7XBdmwIw4DScTqLVGpZ6nhcc3vlgskVTxhLUxo36C3B0ri5XGNYXJq0WFYpSykYgsMUHCqZgOFJg6QgDFF36yjPz8P3fDiOjVR7Ebl8FnfcdacaXjM4GsroYNjW9tz00NDbL2zaNHKuvX2RKaXXMBZkm08sHsejwX43fOk54N/9Q43ZSaYAtnDmsNanDmomBDLpx2GlnBv8LpHVjAJy0nKKQUaCxyVThJhICWN2fNPGkWN9nYdsge91zFf6h0cnU2sOHFgTnD2xU3C9LWRIl8IIY7OzmJ6YgISGLyUUGLhhwHJSSKVSsCwLtm3HVVoME5oxRJGMywiyxvzLUiOIeIHQsuY6cS/lZjOO5Rq53k2NnYZOOiklK0x50g1TsKQUIeJGP5wls+BJxZdGKkoYhXDrdbg1F7VqFb7ngSkJxzTRlsuhWChg69AatDspaI7RwLJOiba2hdS6jZPBho3TB3s6J+bzubOa89H5XPbyJOBJAEyI+GmWqxFmFplsExqhbDx3Cr8JuQklx/A64jwCEEUQrgUTs4NrFo7musYjJ3Wi3Q2+NXB+onND/8mezqEzfXx2esio1dZrzjsWfI9N1qooTS5goVyGHwQQjgPLccCFgGXbsO0UTMuC5VjNBeNaASqpex53CdXNDsrLZ9Kb3y2/LPm+sfC88TquumnjiKBxJMDjxZmMs+ZaGUPwZnlHpSRUFMWLVaMI0BoLi4uoVipQMoIBBtswkU2n0ZHLYqhYRL63NzJsZ5Zn86fNrp6zZndPaWbHpstH1vaPRlJNra1UznUFwWXOeQgAmsdlZK8KqxnTUBLwvaWXkdSj1Y2Gbh/BWQSyelFATm4uSmnuuv5IZ3H0jTWDowBeWosptvvsaLbn7rs3dHzi4YeFW3uQl0tbK5cnU/LoUVNdumhrpewgCLKRUrZmLG4OoSWEjCB9Den7CJKoU4FBs3hHEbebxoq20zxZQKniiDm+jF97oL2ybOLK9G+dzJzHFVKklvFMvlRxfVtocDCI5HRwnOcYfzkALEPAtkx4KoxkBC+VSXudvb3+4PC6cHDz5ijX2x0g5byilHw2FUaTlY7ec+eH1k6+056Tk9bVBxC88eTSjkIhE5fgMq6+HSHk5sU0YPl1LHDuv9XTM6oCb7So2IuZ9VvNLalC95r+no2+wTYrph8UnndX4cKFgnHyBHempiwEgekyZqYcJ206jhHF5/HAIh9SR/ClD84FGBPxWKlVMvOMZBH9yoWgcRO3ZPRrtK3H0ix3XBFr5WlC3cwrXDmZwRiglYpL3SKe0OCMIUp+qTFuQie1wRFfn+UctmkCQmhhmr6ZTtfy+Ta3Z2g46N68XhcGB8dYJnswspz9fqbtUD1fnD3ZmZ09lTYCAJCXL6NzdBQiDD/In4EmMMiHjgJyclNqjHZpANW33tDP/f2/X+W//PdO8b//K5NhFH1n88JC210zM507Bge775qY2CCCYJ0RhPeFvre5XK9jurSImdIiFkplzM3MoVytwatWoTVgZHLglh2nhIi4UoFpmiu+LMsEN00IIZqtqJckOximr86rTJ64hIbUccmxKAwRhBF814Xvugg8D2EQxDM8SoEls/O2YSCfyaCQz2GwuwuDQ0PobGvTtuPMRuBng3TmZNDeMSK6+8cur187+mJfx+K8Wyv3jo5V75+aruTqNZcHvmIqjTgxhxCyapnJ2p3nXwAujoM9+NnQjMLJahQuPLtly9GRoYFnhly3sLG3v39zoWP99lppkLu1XhXJPiMKd9dr9c6ZSgWTCwu4PDeL+blZLJYrCMMQUBrMMMANA0wYsJ0UsoU8TNuO00KSvO1GqcHG9/GMOJbS8pLhsdFJWSkFqVSzwVlc0SUO7IUQ8NwQ9XIZYRRAhiFCP0Do+1DJehkhBFK2g0I2i0ImA8cwsGn9WmwYGNBMqXrkpM7Izs6jLF08Vh1cc/byri0zb2bTc5eBmvLDGle6roQR1g0efeR/L0LeAwXk5KbEUmlASgSvvAL9+78H9+J5jSf/0sWWzS4eegjnuroQtbez4pZNuYzy+1hQ72el+svObHV9oeS2DVZK+a7F2VT94vlMZXQk59XqGa/uOlA6Z5t2BxfCCpVGqCR8FSFUCkEUIQg8yHoNVSkhk5zE5ixR48ktO93aDMhZUo8g+VHweAcT77g40oyhzTJhOTZsIWAzDgEAWte0RglaBzKXm0ZHx1Qmkw3SQ0Out3FdbXTd+kWZzU2EtepE3+T0WH+5PhO1d09f6OisjOczKAmApRwEALiU8QwSIWT1a/R/mJpkuHiR4R5fAYik1tGiY9cWOZ81MhlszOaOGkPD7Ze62npqabvdiaJOIwh32m59Tbpa0esvXsr0nz9fqMzPZ+sLi8XI89u0lG2csYwQgknB4SsN1/PhhyEiBshIxYvrl6WzNNJUGv8rqKVa51hZlpYxNOuiG0n/BM4YLMPAYC4Dg+dgM4YUACiNSKlIQ5eEac5bqXSFtxUXeXt7ybBTHrZsql/atKEc5HLzwcGDF9V3nrokK+7FUl//9OV3eoJJAV23bOCTnwTWrrvqbTQcB6liEcKmcqyktSggJzclls0Cnovo3/4bRN/8VhztvvgiMDMDfOlLamH7dixwoeGFZQS8DF48jZ6u57N9jN9TR3r9yETRHj/d1dnd2dF/zz19wvc7mUKOaQyJILwPUTQcRVL6dZdVFkuoVsqstLjIFkuLqFWrrFKpQPoeC8MAUmtwwVmznKHWzXVGccdM1kx/AYuXlTLD0KZpatu2kUmnkclmVbFY1MViO9raCiKTy1WYaUyCixEFNqEZc5XtHI/S6SOaier4QN/8yQ3r5s5DB5UgADrbcXck0TExBWY4EL6PtM6gJiWcMFxakEUIuU0kn/hUSiOb1eAcSM7kLT/DmHbr4bxSU88PDkzN5TKMxaH8l4cBsR3I9m4Y7+7atHmwz/O7DNdby8NwiMtwgEfROqZ0D5MyvVgus5GJCT1fWmRKKea7LnNrNeb7PvM8j/m+DyUbzXiSgFwpREn6CUsauiUz65oLAcPgMAxTm6YJQxhaa60729uxpr9PZ9Jpnc5kWLZQ4GYqNauYuKA5G5dCXJCmeRmGMRLZ6bEwkysdWjMws7+3o1oHgMOHgD/9Y6BSWflWpVLA7/5uHJCXSkmhcgYYBvzJSZQmJhBks0A+f8P/aoRcDwXk5Fagr/m97wP/9rc5vnoCaL9P4e89Cv4T61Uhg+r0/ufrR3/7d2bxv/6ybf30T6X43JzNNEwAWa3UX6Sgcm2RFoV5WNnJkm0tTtrd1flUl1dLydCzZeDZKoxMpSQHlC2gHTCYYAyaM25KyVJhGNdEEVyDM0AIBcYiRBKRZXl+Jl2HMH1uOS7LpD1k2up+ruiNFduCuUK6NmOiFjJWAmO1wDDktsuTi3eMXy5phgBOSkJwhX/374D9+4Ff+zWgvf0jf+MJIatKM3nbAKTQunSyvb0+2tY2baVSKcH5fqZ1RpcrKcN1synOsv2Verat5lncYrrT95xUqZTnpVIGpVJOeV5G+34aUWTKKBKW48DOZiG50n7d5VG5bqpIggkeMcEVOI8YFxE4j2AaPjeMELbta9PylUaQyeWDXLEYhH5YH7Ht2sU1fW49k66aUlXBWD0QosqA+q5LI7UNswt1qVVwneLfHIBAPG+iEAQSv/7rGl/6EuB5S7diDJdmZrCYSmH+//6/gb6+j+BPQMi1UUBObhVXTwBLCbz1PMPBZxkQafz03ToCMP7mYVT/8M/Vxdf2ufhbv+gCWERHx4pftQB0aGAoDawxiyybyxjZWqfjSDclWGQJFdlCKZMxzTm0JZR0wGGCM2ZqxRazGTbZ1sal4BDQGowDnCvNWBRqpvOu6w7Uq3Um4XuW4/nplFu1C/Wqkw9n221cSHFMYGX5xbZSCdt9Hyw5FS0A8AP7OZ56iuF//0cKnd00CU4I+YEZACwpIcIQc6lUeMl1S3jzzRImJ4FCAdi5E+jtgQHAzYTYFCqwnIWsYGZbvZ5x5ufT1txcnvt+Rvh+2gBMJ5vlc2OjmDh5CnYoVE9fv8jt3W4Ky0TkBZHmcUCuOY8U55EyjBCGEUSW5Ssn5VvtneH0ydP+mTffCDJbdrj1u++MzuZs1MTVC+qHxi9jo+9BBgG4kjCxopwtT76WflFKhgMHNA4cAK5YZVoGUDYM4MkngYEBYN26pfx8Qj5CFJCTWxgD0C6BXgAFoK0bbvkyDv6Dvwv94ssMts3gpK5Yzh8zEJ/OtQIwVpfQbj2K3GrVj7waR8i4DMGlBINmDBpcyzhnnANZP2Cn2grsW5s3scAwmCllc+DXgI6E0NsmJ9Vnjk+qtBfCS2cRKalVxMGUYLZlaEtwwMT7aSJBSeGEkBtrfBz4lV9heOMNjs5Oht/7PSl+7Md0BkAqDJjwAsiciSiMorBUKrNSqSIrlSnu+4z5PjMYg3AcHNn3Mp7697+JHj+n9z72I1j/C59jmcFO+OVKXIWFc2jOteYc2jCgDUMr24IOQ4h8UV944Tk8+8/+L+z+W7+MnoceZPz7K8eqcP1xMylGe8X9RhHwH/4DcPYs8Id/CHR2fh8PS8gPhgJysnowBq0lIrcOLHXbea8B/crr33MHwKChGEOY1PVu/L+c5CsnaAgh5KalNeC6AKBRq2msqCr17mOknU6jOjWFA9/8Jg48/RRC3weQw8KJSzj7J99F3yfuRvvOdVBKrywLm7AyWVTKZRz5z7+Jw088gdB1ceFLT2C6LQ/vl34R6PpQg+N3H99dF9d8koR8BKg2GlnNaGQlhJD3J27TEH+977HTchz49ToOPfMMps+c5wCsdK49q4Ioc/nFQ6x04hKYYYBdo7kaEFc5CT0PJ7/5DUyfOM4A8JnRi+ziX34FYaX8YbyuK13zrCkhrcY0HQ0SQgghhBDSMjRDTgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAv9v8xhW1HHxtCzAAAAAElFTkSuQmCC"
-
-
-# ------------------------
-# Watcher (merged from organizer.py)
-# ------------------------
-
-DEFAULT_RULES: Dict[str, List[str]] = {
-    "Images":   ["jpg","jpeg","png","gif","bmp","tiff","webp","svg"],
-    "Videos":   ["mp4","mov","mkv","avi","wmv","flv","webm","m4v"],
-    "Audio":    ["mp3","wav","flac","aac","ogg","m4a","wma"],
-    "Documents":["pdf","doc","docx","xls","xlsx","ppt","pptx","txt","rtf"],
-    "Archives": ["zip","rar","7z","tar","gz","bz2"],
-    "Code":     ["py","js","ts","tsx","jsx","java","cs","cpp","c","h","go","rs","rb","php","html","css","json","yaml","yml","xml","sql","sh","ps1","bat"],
-    "Installers":["exe","msi","msix","apk","dmg","pkg"],
-    "Fonts":    ["ttf","otf","woff","woff2"],
-}
-
-
-def normalize_rules(rules: Dict[str, List[str]]) -> Dict[str, List[str]]:
-    normalized: Dict[str, List[str]] = {}
-    for cat, exts in rules.items():
-        normalized[cat] = [str(e).lower().lstrip(".") for e in exts if e]
-    return normalized
-
-
-def get_category_for_ext(ext: str, rules: Dict[str, List[str]], unknown_target: str) -> str:
-    for cat, exts in rules.items():
-        if ext in exts:
-            return cat
-    return unknown_target
-
-
-def ensure_directory(path: Path) -> None:
-    path.mkdir(parents=True, exist_ok=True)
-
-
-def wait_for_file_ready(path: Path, max_attempts: int = 40, delay: float = 0.25) -> bool:
-    """Try opening the file for reading until it is ready (not locked)."""
-    for _ in range(max_attempts):
-        try:
-            with path.open("rb"):
-                return True
-        except Exception:
-            time.sleep(delay)
-    return False
-
-
-def unique_destination(dest_dir: Path, filename: str) -> Path:
-    base = Path(filename).stem
-    ext = Path(filename).suffix
-    candidate = dest_dir / filename
-    counter = 1
-    while candidate.exists():
-        candidate = dest_dir / f"{base} ({counter}){ext}"
-        counter += 1
-    return candidate
+# Milliseconds of no typing before the rules are checked, saved and applied.
+RULES_CHECK_MS = 300
+# Milliseconds between drains of the activity buffer into the panel.
+ACTIVITY_POLL_MS = 250
+# Move records kept for the activity panel; older ones are dropped.
+ACTIVITY_ROWS = 500
+# Records waiting for the next drain; beyond this the oldest are dropped (counters stay exact).
+ACTIVITY_BUFFER = 5000
+# Seconds of history behind the moves/s figure.
+RATE_WINDOW = 5.0
+ALL = "All"
 
 
 def _sanitize_base64(b64: Optional[str]) -> Optional[str]:
@@ -94,109 +63,37 @@ def _sanitize_base64(b64: Optional[str]) -> Optional[str]:
     return s or None
 
 
-class CreatedHandler(FileSystemEventHandler):
-    def __init__(self, root: Path, rules: Dict[str, List[str]], move_unknown_to: str, quiet: bool = False) -> None:
-        super().__init__()
-        self.root = root
-        self.rules = rules
-        self.move_unknown_to = move_unknown_to
-        self.quiet = quiet
-
-    def on_created(self, event):
-        # Ignore directories
-        if event.is_directory:
-            return
-        src_path = Path(event.src_path)
-        # Guard: only handle top-level files (not inside subfolders)
+def load_icon_base64() -> Optional[str]:
+    """Icon as base64 from WATCHER_ICON_BASE64, settings.json, or watcher-icon.b64."""
+    icon_b64 = os.environ.get("WATCHER_ICON_BASE64")
+    if not icon_b64:
+        icon_b64 = load_config().get("icon_base64")
+    if not icon_b64 and ICON_B64.exists():
         try:
-            rel = src_path.relative_to(self.root)
-        except ValueError:
-            # outside root
-            return
-        if len(rel.parts) > 1:
-            # file in subfolder; ignore
-            return
-
-        name = src_path.name
-        # Wait until file is ready
-        if not wait_for_file_ready(src_path):
-            print(f"[ERROR] File not ready after retries: {name}")
-            return
-
-        ext = src_path.suffix.lower().lstrip(".")
-        category = self.move_unknown_to if not ext else get_category_for_ext(ext, self.rules, self.move_unknown_to)
-        dest_dir = self.root / category
-        ensure_directory(dest_dir)
-        dest_path = unique_destination(dest_dir, name)
-        try:
-            shutil.move(str(src_path), str(dest_path))
-            if not self.quiet:
-                print(f"[INFO] Moved: {name} -> {category}")
-        except Exception as e:
-            print(f"[ERROR] Failed to move '{name}': {e}")
-
-
-def start_watcher(path: Path, rules: Optional[Dict[str, List[str]]] = None, move_unknown_to: str = "Other", quiet: bool = False) -> Observer:
-    root = path.resolve()
-    use_rules = normalize_rules(rules or DEFAULT_RULES)
-    handler = CreatedHandler(root, use_rules, move_unknown_to, quiet)
-    observer = Observer()
-    observer.schedule(handler, str(root), recursive=False)  # top-level only
-    observer.start()
-    print(f"[INFO] Watching '{root}' (top-level only). Press Ctrl+C to stop.")
-    return observer
-
-
-def start_watchers(paths: List[Path], rules: Optional[Dict[str, List[str]]] = None, move_unknown_to: str = "Other", quiet: bool = False) -> List[Observer]:
-    observers: List[Observer] = []
-    for p in paths:
-        observers.append(start_watcher(p, rules, move_unknown_to, quiet))
-    return observers
-
-
-def parse_rules_text(text: str) -> Dict[str, List[str]]:
-    """Parse rules from JSON or simple DSL ('Category = ext1,ext2')."""
-    text = (text or "").strip()
-    if not text:
-        return {}
-    # Try JSON first
-    if text.startswith("{"):
-        try:
-            obj = json.loads(text)
-            parsed: Dict[str, List[str]] = {}
-            for k, v in obj.items():
-                if isinstance(v, list):
-                    parsed[str(k)] = [str(x).lower().lstrip('.') for x in v]
-            return parsed
+            icon_b64 = ICON_B64.read_text(encoding="utf-8")
         except Exception:
             pass
-    # Fallback: DSL lines
-    rules: Dict[str, List[str]] = {}
-    for line in text.splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
-            continue
-        left, right = line.split("=", 1)
-        cat = left.strip()
-        exts = [e.strip().lower().lstrip('.') for e in right.split(',') if e.strip()]
-        if cat and exts:
-            rules[cat] = exts
-    return rules
+    return _sanitize_base64(icon_b64)
 
 
 class WatcherGUI:
     def __init__(self) -> None:
         self.root = tk.Tk()
         self.root.title("Watcher - Automate Organization")
-        self.observers: List[object] = []
+        self.organizer: Optional[Organizer] = None
 
         self.init_style()
         self.set_icon()
 
         # State
         self.settings = self.load_settings()
+        # Saves go to disk from a background thread, so editing never waits on it
+        self.writer = SettingsWriter(CONFIG_PATH)
+        self._rules_check: Optional[str] = None
+        # Folder edits are applied on this thread, one at a time; the newest waiting edit wins
+        self._live_thread: Optional[threading.Thread] = None
+        self._live_settings: Optional[Dict] = None
+        self._live_started: Set[str] = set()
         self.folders: List[Dict] = self.settings.get("folders", [])
         self.rules_text: str = self.settings.get("rules_text", "")
         if not self.rules_text.strip():
@@ -205,6 +102,18 @@ class WatcherGUI:
                 f"{cat} = {','.join(exts)}" for cat, exts in DEFAULT_RULES.items()
             )
         self.status_var = tk.StringVar(value="Idle")
+        self.sweep_var = tk.BooleanVar(value=bool(self.settings.get("sweep", False)))
+        self.sniff_var = tk.BooleanVar(value=bool(self.settings.get("sniff_content", False)))
+        self.dedupe_var = tk.StringVar(value=self.settings.get("dedupe") or "off")
+        # Latest sweep progress per root, written by the sweep thread and shown by update_status
+        self.sweep_progress: Dict[str, str] = {}
+        # Filled by worker threads (deque appends are atomic), drained by poll_activity
+        self.activity_buffer: Deque[Tuple[float, MoveRecord]] = deque(maxlen=ACTIVITY_BUFFER)
+        self.activity: Deque[Tuple[float, MoveRecord]] = deque(maxlen=ACTIVITY_ROWS)
+        self.activity_roots: Set[str] = set()
+        self.activity_categories: Set[str] = set()
+        # (monotonic time, moves + failures) samples for the rate
+        self.rate_samples: Deque[Tuple[float, int]] = deque()
 
         # UI layout
         self.build_ui()
@@ -214,6 +123,7 @@ class WatcherGUI:
         self.update_status()
 
         self.root.protocol("WM_DELETE_WINDOW", self.on_exit)
+        self._activity_poll = self.root.after(ACTIVITY_POLL_MS, self.poll_activity)
 
     def init_style(self) -> None:
         try:
@@ -238,13 +148,15 @@ class WatcherGUI:
         left.pack(side=tk.LEFT, fill=tk.Y, padx=8, pady=8)
 
         ttk.Label(left, text="Watched Folders").pack(anchor="w")
-        self.folder_tree = ttk.Treeview(left, columns=("path","unknown","quiet"), show="headings", height=12)
+        self.folder_tree = ttk.Treeview(left, columns=("path","unknown","quiet","recursive"), show="headings", height=12)
         self.folder_tree.heading("path", text="Path")
         self.folder_tree.heading("unknown", text="Unknown")
         self.folder_tree.heading("quiet", text="Quiet")
+        self.folder_tree.heading("recursive", text="Subfolders")
         self.folder_tree.column("path", width=320)
         self.folder_tree.column("unknown", width=120, anchor="center")
         self.folder_tree.column("quiet", width=80, anchor="center")
+        self.folder_tree.column("recursive", width=80, anchor="center")
         self.folder_tree.pack(fill=tk.Y)
         self.folder_tree.bind("<<TreeviewSelect>>", self.on_folder_selected)
 
@@ -274,6 +186,9 @@ class WatcherGUI:
         self.quiet_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(form, text="Quiet", variable=self.quiet_var).grid(row=1, column=2, sticky="w")
 
+        self.recursive_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(form, text="Include subfolders", variable=self.recursive_var).grid(row=2, column=1, sticky="w")
+
         form.columnconfigure(1, weight=1)
 
         # Rules integrated below details
@@ -290,6 +205,33 @@ class WatcherGUI:
         self.rules_textbox = tk.Text(rules_frame, height=16)
         self.rules_textbox.pack(fill=tk.BOTH, expand=True)
         self.rules_textbox.bind("<<Modified>>", self.on_rules_modified)
+        self.rules_textbox.tag_configure("rule_error", background="#ffd6d6")
+        self.rules_error_var = tk.StringVar()
+        ttk.Label(right, textvariable=self.rules_error_var, foreground="#b00020").pack(anchor="w")
+
+        # Recent moves, newest first
+        activity = ttk.LabelFrame(self.root, text="Activity")
+        activity.pack(fill=tk.BOTH, expand=True, padx=8, pady=(0, 8))
+        bar = ttk.Frame(activity)
+        bar.pack(fill=tk.X, padx=4, pady=4)
+        ttk.Label(bar, text="Folder:").pack(side=tk.LEFT)
+        self.activity_root_var = tk.StringVar(value=ALL)
+        self.activity_root_box = ttk.Combobox(bar, textvariable=self.activity_root_var, values=(ALL,), state="readonly", width=30)
+        self.activity_root_box.pack(side=tk.LEFT, padx=(2, 8))
+        self.activity_root_box.bind("<<ComboboxSelected>>", self.on_activity_filter)
+        ttk.Label(bar, text="Category:").pack(side=tk.LEFT)
+        self.activity_category_var = tk.StringVar(value=ALL)
+        self.activity_category_box = ttk.Combobox(bar, textvariable=self.activity_category_var, values=(ALL,), state="readonly", width=16)
+        self.activity_category_box.pack(side=tk.LEFT, padx=2)
+        self.activity_category_box.bind("<<ComboboxSelected>>", self.on_activity_filter)
+        self.rate_var = tk.StringVar(value="0.0 moves/s")
+        ttk.Label(bar, textvariable=self.rate_var).pack(side=tk.RIGHT)
+        self.activity_tree = ttk.Treeview(activity, columns=("time", "folder", "file", "category", "result"), show="headings", height=8)
+        for col, title, width in (("time", "Time", 70), ("folder", "Folder", 140), ("file", "File", 260), ("category", "Category", 110), ("result", "Result", 200)):
+            self.activity_tree.heading(col, text=title)
+            self.activity_tree.column(col, width=width, anchor="w")
+        self.activity_tree.tag_configure("failed", foreground="#b00020")
+        self.activity_tree.pack(fill=tk.BOTH, expand=True, padx=4, pady=(0, 4))
 
         # Actions toolbar
         actions = ttk.Frame(self.root)
@@ -297,6 +239,12 @@ class WatcherGUI:
         ttk.Button(actions, text="Start Watchers", command=self.on_start_watchers).pack(side=tk.LEFT)
         ttk.Button(actions, text="Stop Watchers", command=self.on_stop_watchers).pack(side=tk.LEFT, padx=4)
         ttk.Button(actions, text="Create Test Files", command=self.on_create_tests).pack(side=tk.LEFT, padx=4)
+        ttk.Checkbutton(actions, text="Sweep existing files on start", variable=self.sweep_var, command=self.on_sweep_toggled).pack(side=tk.LEFT, padx=4)
+        ttk.Checkbutton(actions, text="Detect type of files without an extension", variable=self.sniff_var, command=self.on_sniff_toggled).pack(side=tk.LEFT, padx=4)
+        ttk.Label(actions, text="Duplicates:").pack(side=tk.LEFT, padx=(8, 2))
+        dedupe_box = ttk.Combobox(actions, textvariable=self.dedupe_var, values=("off",) + DEDUPE_ACTIONS, state="readonly", width=9)
+        dedupe_box.pack(side=tk.LEFT)
+        dedupe_box.bind("<<ComboboxSelected>>", self.on_dedupe_changed)
         ttk.Button(actions, text="Exit", command=self.on_exit).pack(side=tk.RIGHT)
 
         # Status bar
@@ -313,14 +261,18 @@ class WatcherGUI:
         current = self.rules_textbox.get("1.0", tk.END)
         lines = [l.rstrip() for l in current.splitlines()]
         existing: Dict[str, str] = {}
+        # Conditional rules depend on their order, so they are kept first, as written
+        conditional: List[str] = []
         for l in lines:
-            if "=" in l:
+            if parse_conditional_rules(l):
+                conditional.append(l.strip())
+            elif "=" in l:
                 left, right = l.split("=", 1)
                 cat = left.strip()
                 existing[cat] = f"{cat} = {right.strip()}"
         for cat, exts in DEFAULT_RULES.items():
             existing[cat] = f"{cat} = {','.join(exts)}"
-        merged = "\n".join(existing[c] for c in sorted(existing.keys()))
+        merged = "\n".join(conditional + [existing[c] for c in sorted(existing.keys())])
         self.rules_textbox.delete("1.0", tk.END)
         self.rules_textbox.insert("1.0", merged)
         self.on_rules_modified()
@@ -329,7 +281,7 @@ class WatcherGUI:
         for item in self.folder_tree.get_children():
             self.folder_tree.delete(item)
         for i, f in enumerate(self.folders):
-            self.folder_tree.insert("", tk.END, iid=str(i), values=(f.get("path"), f.get("unknown","Other"), "Yes" if f.get("quiet") else "No"))
+            self.folder_tree.insert("", tk.END, iid=str(i), values=(f.get("path"), f.get("unknown","Other"), "Yes" if f.get("quiet") else "No", "Yes" if f.get("recursive") else "No"))
         self.update_status()
 
     def on_folder_selected(self, _evt=None) -> None:
@@ -341,6 +293,7 @@ class WatcherGUI:
         self.path_var.set(f.get("path", ""))
         self.unknown_var.set(f.get("unknown", "Other"))
         self.quiet_var.set(bool(f.get("quiet", False)))
+        self.recursive_var.set(bool(f.get("recursive", False)))
 
     def on_browse(self) -> None:
         d = filedialog.askdirectory(parent=self.root)
@@ -356,9 +309,11 @@ class WatcherGUI:
             "path": path,
             "unknown": self.unknown_var.get().strip() or "Other",
             "quiet": bool(self.quiet_var.get()),
+            "recursive": bool(self.recursive_var.get()),
         })
         self.refresh_folder_list()
         self.save_settings()
+        self.apply_live()
 
     def on_update_folder(self) -> None:
         sel = self.folder_tree.selection()
@@ -366,13 +321,17 @@ class WatcherGUI:
             messagebox.showerror("Error", "Select a folder to update", parent=self.root)
             return
         i = int(sel[0])
+        # Keeps max_depth/include/exclude set in settings.json
         self.folders[i] = {
+            **self.folders[i],
             "path": self.path_var.get().strip(),
             "unknown": self.unknown_var.get().strip() or "Other",
             "quiet": bool(self.quiet_var.get()),
+            "recursive": bool(self.recursive_var.get()),
         }
         self.refresh_folder_list()
         self.save_settings()
+        self.apply_live()
 
     def on_remove_folder(self) -> None:
         sel = self.folder_tree.selection()
@@ -383,50 +342,222 @@ class WatcherGUI:
         self.folders.pop(i)
         self.refresh_folder_list()
         self.save_settings()
+        self.apply_live()
 
     def on_rules_modified(self, evt=None) -> None:
-        # Reset modified flag and save
+        # Reset modified flag; check, save and apply once typing pauses
         try:
             self.rules_textbox.edit_modified(False)
         except Exception:
             pass
+        if self._rules_check is not None:
+            self.root.after_cancel(self._rules_check)
+        self._rules_check = self.root.after(RULES_CHECK_MS, self.on_rules_settled)
+
+    def on_rules_settled(self) -> None:
+        self._rules_check = None
         self.rules_text = self.rules_textbox.get("1.0", tk.END)
+        problems = validate_rules_text(self.rules_text)
+        self.rules_textbox.tag_remove("rule_error", "1.0", tk.END)
+        for line, _ in problems:
+            self.rules_textbox.tag_add("rule_error", f"{line}.0", f"{line}.end")
+        if problems:
+            line, message = problems[0]
+            more = f" (+{len(problems) - 1} more)" if len(problems) > 1 else ""
+            self.rules_error_var.set(f"Line {line}: {message}{more}")
+        else:
+            self.rules_error_var.set("")
         self.save_settings()
+        if not problems and self.is_running():
+            # Half-typed rules would drop categories from the running watchers.
+            # Only the rules changed: swap them in, nothing is read from disk
+            self.organizer.set_rules_text(self.rules_text)
+
+    def on_sweep_toggled(self) -> None:
+        self.settings["sweep"] = bool(self.sweep_var.get())
+        self.save_settings()
+
+    def on_sniff_toggled(self) -> None:
+        self.settings["sniff_content"] = bool(self.sniff_var.get())
+        self.save_settings()
+        if self.organizer is not None:
+            self.organizer.set_sniffing(self.settings["sniff_content"])
+
+    def on_dedupe_changed(self, _evt=None) -> None:
+        action = self.dedupe_var.get()
+        self.settings["dedupe"] = None if action == "off" else action
+        self.save_settings()
+        if self.organizer is not None:
+            self.organizer.set_dedupe(self.settings["dedupe"], self.dedupe_index_path())
+
+    def dedupe_index_path(self) -> Optional[Path]:
+        index = self.settings.get("dedupe_index")
+        return Path(index).expanduser() if index else None
+
+    def on_sweep_progress(self, root: Path, scanned: int, queued: int, finished: bool) -> None:
+        # Runs on the sweep thread; only store text, the Tk loop picks it up
+        if finished:
+            self.sweep_progress.pop(str(root), None)
+        else:
+            self.sweep_progress[str(root)] = f"{root.name}: {scanned} scanned"
+
+    def poll_sweep_progress(self) -> None:
+        self.update_status()
+        if self.is_running() and self.sweep_progress:
+            self.root.after(500, self.poll_sweep_progress)
+
+    def apply_live(self) -> None:
+        # Push folder edits into the running watchers; unchanged folders keep their watch.
+        # Checking folders and scheduling watches hits the disk, so it runs off the Tk thread
+        if not self.is_running():
+            return
+        self._live_settings = self.current_settings()
+        if self._live_thread is None:
+            self.start_live_apply()
+
+    def start_live_apply(self) -> None:
+        settings, self._live_settings = self._live_settings, None
+        organizer = self.organizer
+        self._live_started = {str(r) for r in organizer.roots}
+
+        def run() -> None:
+            try:
+                organizer.apply_settings(settings, self.on_sweep_progress)
+            except Exception as e:
+                print(f"[ERROR] Applying settings failed: {e}")
+
+        self._live_thread = threading.Thread(target=run, name="watcher-apply", daemon=True)
+        self._live_thread.start()
+        self.root.after(100, self.poll_live_apply, settings)
+
+    def poll_live_apply(self, settings: Dict) -> None:
+        if self._live_thread is not None and self._live_thread.is_alive():
+            self.root.after(100, self.poll_live_apply, settings)
+            return
+        self._live_thread = None
+        if self.organizer is None:
+            return
+        added = [r for r in self.organizer.roots if str(r) not in self._live_started]
+        if added and self.sweep_var.get():
+            # New folders are swept; progress shows up as it is reported
+            self.root.after(500, self.poll_sweep_progress)
+        if self._live_settings is not None:
+            self.start_live_apply()
+        elif settings.get("rules_text") != self.rules_text and not validate_rules_text(self.rules_text):
+            # Rules typed while the folders were applied; the thread used the older ones
+            self.organizer.set_rules_text(self.rules_text)
+        self.update_status()
+
+    def is_running(self) -> bool:
+        return self.organizer is not None and bool(self.organizer.roots)
 
     def on_start_watchers(self) -> None:
-        if self.observers:
+        if self.is_running():
             messagebox.showinfo("Watcher", "Watchers already running", parent=self.root)
             return
-        rules = parse_rules_text(self.rules_textbox.get("1.0", tk.END))
+        rules = compile_rules_text(self.rules_textbox.get("1.0", tk.END))
+        if self.organizer is None:
+            # Created once; Start/Stop only add and remove watches on it
+            self.organizer = Organizer(resolve_workers(self.settings.get("workers")), resolve_settle(self.settings.get("settle_seconds")), bool(self.sniff_var.get()))
+            self.organizer.set_dedupe(self.settings.get("dedupe"), self.dedupe_index_path())
+            self.organizer.set_temp_suffixes(self.settings.get("temp_suffixes"))
+            journal = journal_path(self.settings.get("journal"))
+            if journal is not None:
+                self.organizer.open_journal(journal)
+            start_exporters(self.organizer, self.settings.get("metrics_port"), self.settings.get("stats_file"), self.settings.get("stats_interval"))
+            self.organizer.add_listener(self.on_move_record)
+        organizer = self.organizer
         started = 0
         for f in self.folders:
             p = Path(f.get("path", "")).expanduser()
             if not p.exists() or not p.is_dir():
                 messagebox.showerror("Error", f"Folder does not exist: {p}", parent=self.root)
                 continue
-            obs = start_watcher(p, rules if rules else None, f.get("unknown", "Other"), bool(f.get("quiet", False)))
-            self.observers.append(obs)
+            sweep = bool(self.sweep_var.get())
+            if sweep:
+                self.sweep_progress[str(p.resolve())] = f"{p.name}: starting"
+            try:
+                organizer.watch(p, rules, f.get("unknown", "Other"), bool(f.get("quiet", False)), sweep, self.on_sweep_progress, **folder_options(f))
+            except OSError as e:
+                self.sweep_progress.pop(str(p.resolve()), None)
+                messagebox.showerror("Error", f"Cannot watch {p}: {e}", parent=self.root)
+                continue
             started += 1
         if started:
+            if self.sweep_progress:
+                self.root.after(500, self.poll_sweep_progress)
             messagebox.showinfo("Watcher", f"Started {started} watcher(s). New files will be organized.", parent=self.root)
             self.update_status()
         else:
             messagebox.showwarning("Watcher", "No watchers started. Add valid folders.", parent=self.root)
 
+    def on_move_record(self, record: MoveRecord) -> None:
+        # Worker thread: no Tk calls here
+        self.activity_buffer.append((time.time(), record))
+
+    def poll_activity(self) -> None:
+        # One batch per tick, however many moves arrived since the last one
+        batch: List[Tuple[float, MoveRecord]] = []
+        try:
+            while True:
+                batch.append(self.activity_buffer.popleft())
+        except IndexError:
+            pass
+        if batch:
+            self.activity.extend(batch)
+            new_roots = {str(r.root) for _, r in batch} - self.activity_roots
+            new_categories = {r.category for _, r in batch} - self.activity_categories
+            if new_roots:
+                self.activity_roots |= new_roots
+                self.activity_root_box.configure(values=(ALL,) + tuple(sorted(self.activity_roots)))
+            if new_categories:
+                self.activity_categories |= new_categories
+                self.activity_category_box.configure(values=(ALL,) + tuple(sorted(self.activity_categories)))
+            shown = [item for item in batch if self.activity_matches(item[1])][-ACTIVITY_ROWS:]
+            for item in shown:
+                self.activity_tree.insert("", 0, values=self.activity_row(*item), tags=("failed",) if item[1].error else ())
+            rows = self.activity_tree.get_children()
+            if len(rows) > ACTIVITY_ROWS:
+                self.activity_tree.delete(*rows[ACTIVITY_ROWS:])
+        self.update_rate()
+        self._activity_poll = self.root.after(ACTIVITY_POLL_MS, self.poll_activity)
+
+    def activity_matches(self, record: MoveRecord) -> bool:
+        root, category = self.activity_root_var.get(), self.activity_category_var.get()
+        return (root == ALL or str(record.root) == root) and (category == ALL or record.category == category)
+
+    @staticmethod
+    def activity_row(at: float, record: MoveRecord) -> Tuple[str, str, str, str, str]:
+        if record.error:
+            result = f"Failed: {record.error}"
+        else:
+            result = f"Moved in {record.duration * 1000:.0f} ms"
+        return (time.strftime("%H:%M:%S", time.localtime(at)), record.root.name, record.src.name, record.category, result)
+
+    def on_activity_filter(self, _evt=None) -> None:
+        # Rebuild from the kept records; at most ACTIVITY_ROWS inserts
+        self.activity_tree.delete(*self.activity_tree.get_children())
+        for item in [item for item in self.activity if self.activity_matches(item[1])]:
+            self.activity_tree.insert("", 0, values=self.activity_row(*item), tags=("failed",) if item[1].error else ())
+
+    def update_rate(self) -> None:
+        if self.organizer is None:
+            return
+        # Engine counters see every move, including any the buffer dropped
+        totals = self.organizer.metrics.snapshot()["totals"]
+        now = time.monotonic()
+        self.rate_samples.append((now, totals["moved"] + totals["failed"]))
+        while len(self.rate_samples) > 2 and now - self.rate_samples[0][0] > RATE_WINDOW:
+            self.rate_samples.popleft()
+        (t0, n0), (t1, n1) = self.rate_samples[0], self.rate_samples[-1]
+        rate = (n1 - n0) / (t1 - t0) if t1 > t0 else 0.0
+        self.rate_var.set(f"{rate:.1f} moves/s • {totals['moved']} moved • {totals['failed']} failed")
+
     def on_stop_watchers(self) -> None:
-        if not self.observers:
+        if not self.is_running():
             return
-        for obs in self.observers:
-            try:
-                obs.stop()
-            except Exception:
-                pass
-        for obs in self.observers:
-            try:
-                obs.join(timeout=5)
-            except Exception:
-                pass
-        self.observers.clear()
+        self.organizer.unwatch_all()
+        self.sweep_progress.clear()
         self.update_status()
 
     def on_create_tests(self) -> None:
@@ -437,22 +568,11 @@ class WatcherGUI:
             targets.append(Path(self.folders[i].get("path", "")).expanduser())
         else:
             targets = [Path(f.get("path", "")).expanduser() for f in self.folders]
-        samples = [
-            "sample.jpg",
-            "clip.mp4",
-            "track.mp3",
-            "report.pdf",
-            "archive.zip",
-            "script.py",
-            "setup.exe",
-            "font.ttf",
-            "unknown.bin",
-        ]
         created = 0
         for t in targets:
             if not t.exists() or not t.is_dir():
                 continue
-            for name in samples:
+            for name in SAMPLE_FILES:
                 try:
                     (t / name).write_bytes(b"test")
                     created += 1
@@ -464,67 +584,50 @@ class WatcherGUI:
             messagebox.showwarning("Watcher", "No test files created. Check folders.", parent=self.root)
 
     def on_exit(self) -> None:
+        if self._live_thread is not None:
+            self._live_thread.join(timeout=5)
         # Stop any observers
-        for obs in self.observers:
-            try:
-                obs.stop()
-            except Exception:
-                pass
-        for obs in self.observers:
-            try:
-                obs.join(timeout=5)
-            except Exception:
-                pass
+        if self.organizer is not None:
+            self.organizer.stop()
+            self.organizer.join(timeout=5)
+        if self._rules_check is not None:
+            self.root.after_cancel(self._rules_check)
+            self.save_settings()
+        # Flushes the last save
+        self.writer.stop()
+        self.root.after_cancel(self._activity_poll)
         self.root.destroy()
 
     def update_status(self) -> None:
-        running = len(self.observers)
+        running = len(self.organizer.roots) if self.organizer is not None else 0
         count = len(self.folders)
         if running:
-            self.status_var.set(f"Running: {running} watcher(s) • Folders: {count}")
+            status = f"Running: {running} watcher(s) • Folders: {count}"
+            if self.sweep_progress:
+                status += " • Sweeping " + ", ".join(list(self.sweep_progress.values()))
+            self.status_var.set(status)
         else:
             self.status_var.set(f"Idle • Folders: {count}")
 
     def load_settings(self) -> Dict:
-        if CONFIG_PATH.exists():
-            try:
-                return json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
-            except Exception:
-                pass
-        return {"folders": [], "rules_text": ""}
+        return load_config() or {"folders": [], "rules_text": ""}
 
-    def save_settings(self) -> None:
-        data = {
+    def current_settings(self) -> Dict:
+        # Keep keys the GUI does not edit (e.g. "workers") intact
+        data = dict(self.settings)
+        data.update({
             "folders": self.folders,
             "rules_text": self.rules_textbox.get("1.0", tk.END),
-        }
-        try:
-            CONFIG_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
-        except Exception:
-            pass
+        })
+        return data
 
-    def set_icon(self) -> None:
-        # Priority: embedded -> env var -> settings.json -> .b64 file -> .ico -> .png
-        icon_b64: Optional[str] = None
-        if ICON_BASE64_DEFAULT.strip():
-            icon_b64 = ICON_BASE64_DEFAULT
-        elif os.environ.get("WATCHER_ICON_BASE64"):
-            icon_b64 = os.environ.get("WATCHER_ICON_BASE64")
-        else:
-            try:
-                if CONFIG_PATH.exists():
-                    cfg = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
-                    icon_b64 = cfg.get("icon_base64")
-            except Exception:
-                pass
-            if not icon_b64 and ICON_B64.exists():
-                try:
-                    icon_b64 = ICON_B64.read_text(encoding="utf-8")
-                except Exception:
-                    pass
+    def save_settings(self) -> None:
+        self.writer.save(self.current_settings())
 
-        # Try base64 PNG via iconphoto
-        icon_b64 = _sanitize_base64(icon_b64)
+    def set_icon(self) -> None:
+        # Priority: env var -> settings.json -> .b64 file (bundled default) -> .ico -> .png
+        # The icon is only read and decoded here, never at import time.
+        icon_b64 = load_icon_base64()
         if icon_b64:
             try:
                 try:
@@ -554,55 +657,9 @@ class WatcherGUI:
 
 def main() -> None:
     # If CLI args provided, run CLI mode; else launch GUI.
-    import argparse
-    parser = argparse.ArgumentParser(description="Watcher GUI/CLI")
-    parser.add_argument("--path", action="append", help="Folder to watch (repeat for multiple)")
-    parser.add_argument("--quiet", action="store_true", help="Reduce logs to errors only")
-    parser.add_argument("--unknown", default="Other", help="Folder name for unknown file types")
-    parser.add_argument("--rules", help="JSON text with category->extensions mapping")
-    parser.add_argument("--create-test", action="store_true", help="Create sample files in each folder")
-    args, _ = parser.parse_known_args()
-
-    if args.path:
-        # CLI mode
-        roots: List[Path] = []
-        for p in args.path:
-            rp = Path(p).expanduser()
-            if not rp.exists() or not rp.is_dir():
-                print(f"[ERROR] Path does not exist or is not a directory: {rp}")
-                return
-            roots.append(rp)
-        rules = None
-        if args.rules:
-            try:
-                rules = json.loads(args.rules)
-            except Exception as e:
-                print(f"[ERROR] Invalid --rules JSON: {e}")
-        if args.create_test:
-            samples = [
-                "sample.jpg","clip.mp4","track.mp3","report.pdf","archive.zip","script.py","setup.exe","font.ttf","unknown.bin"
-            ]
-            for root in roots:
-                for name in samples:
-                    try:
-                        (root / name).write_bytes(b"test")
-                    except Exception:
-                        pass
-        obs = start_watchers(roots, rules, args.unknown, args.quiet)
-        try:
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            for o in obs:
-                try:
-                    o.stop()
-                except Exception:
-                    pass
-            for o in obs:
-                try:
-                    o.join(timeout=5)
-                except Exception:
-                    pass
+    args, _ = build_parser().parse_known_args()
+    if args.path or args.config or args.shards is not None or args.undo or args.plan or args.apply:
+        run_cli(args)
         return
 
     # GUI mode
@@ -612,47 +669,3 @@ def main() -> None:
 
 if __name__ == "__main__":
     main()
-ICON_BASE64_DEFAULT = "iVBORw0KGgoAAAANSUhEUgAAAuQAAALkCAYAAABHpCBlAAAACXBIWXMAAAsTAAALEwEAmpwYAATcPUlEQVR4nOz9d5RkSXbeCX5m9oRrD60jI7WqzEpRWouWQDUaaAV0o4GBIkCguRgAxMwswQV4hrsHSy453HNmd4bAAHNAYsABKBaKIEA0WlZXVVd3iazUWkRmhpau3Z8ws/3D3nMRGZmVVd3VXtV1f3WiMsL9+VPufu3ad6/dy7TWIAiCIAiCIAiiO/BunwBBEARBEARBvJ8hh5wgCIIgCIIgugg55ARBEARBEATRRcghJwiCIAiCIIguQg45QRAEQRAEQXQRcsgJgiAIgiAIoouQQ04QBEEQBEEQXYQccoIgCIIgCILoIuSQEwRBEARBEEQXIYecIAiCIAiCILoIOeQEQRAEQRAE0UXIIScIgiAIgiCILkIOOUEQBEEQBEF0EXLICYIgCIIgCKKLkENOEARBEARBEF2EHHKCIAiCIAiC6CLkkBMEQRAEQRBEFyGHnCAIgiAIgiC6CDnkBEEQBEEQBNFFyCEnCIIgCIIgiC5CDjlBEARBEARBdBFyyAmCIAiCIAiii5BDThAEQRAEQRBdhBxygiAIgiAIgugi5JATBEEQBEEQRBchh5wgCIIgCIIgugg55ARBEARBEATRRcghJwiCIAiCIIguQg45QRAEQRAEQXQRcsgJgiAIgiAIoouQQ04QBEEQBEEQXYQccoIgCIIgCILoIuSQEwRBEARBEEQXIYecIAiCIAiCILoIOeQEQRAEQRAE0UXIIScIgiAIgiCILkIOOUEQBEEQBEF0EXLICYIgCIIgCKKLkENOEARBEARBEF2EHHKCIAiCIAiC6CLkkBMEQRAEQRBEFyGHnCAIgiAIgiC6CDnkBEEQBEEQBNFFyCEnCIIgCIIgiC5CDjlBEARBEARBdBFyyAmCIAiCIAiii5BDThAEQRAEQRBdhBxygiAIgiAIgugi5JATBEEQBEEQRBchh5wgCIIgCIIgugg55ARBEARBEATRRcghJwiCIAiCIIguQg45QRAEQRAEQXQRcsgJgiAIgiAIoouQQ04QBEEQBEEQXYQccoIgCIIgCILoIuSQEwRBEARBEEQXIYecIAiCIAiCILoIOeQEQRAEQRAE0UXIIScIgiAIgiCILkIOOUEQBEEQBEF0EXLICYIgCIIgCKKLkENOEARBEARBEF2EHHKCIAiCIAiC6CLkkBMEQRAEQRBEFyGHnCAIgiAIgiC6CDnkBEEQBEEQBNFFyCEnCIIgCIIgiC5CDjlBEARBEARBdBFyyAmCIAiCIAiii5BDThAEQRAEQRBdhBxygiAIgiAIgugi5JATBEEQBEEQRBchh5wgCIIgCIIgugg55ARBEARBEATRRcghJwiCIAiCIIguQg45QRAEQRAEQXQRcsgJgiAIgiAIoouQQ04QBEEQBEEQXYQccoIgCIIgCILoIuSQEwRBEARBEEQXIYecIAiCIAiCILoIOeQEQRAEQRAE0UXIIScIgiAIgiCILkIOOUEQBEEQBEF0EXLICYIgCIIgCKKLkENOEARBEARBEF2EHHKCIAiCIAiC6CLkkBMEQRAEQRBEFyGHnCAIgiAIgiC6CDnkBEEQBEEQBNFFyCEnCIIgCIIgiC5CDjlBEARBEARBdBFyyAmCIAiCIAiii5BDThAEQRAEQRBdhBxygiAIgiAIgugi5JATBEEQBEEQRBchh5wgCIIgCIIgugg55ARBEARBEATRRcghJwiCIAiCIIguQg45QRAEQRAEQXQRcsgJgiAIgiAIoouQQ04QBEEQBEEQXYQccoIgCIIgCILoIuSQEwRBEARBEEQXIYecIAiCIAiCILoIOeQEQRAEQRAE0UXIIScIgiAIgiCILkIOOUEQBEEQBEF0EXLICYIgCIIgCKKLkENOEARBEARBEF2EHHKCIAiCIAiC6CLkkBMEQRAEQRBEFyGHnCAIgiAIgiC6CDnkBEEQBEEQBNFFyCEnCIIgCIIgiC5CDjlBEARBEARBdBFyyAmCIAiCIAiii5BDThAEQRAEQRBdhBxygiAIgiAIgugi5JATBEEQBEEQRBchh5wgCIIgCIIgugg55ARBEARBEATRRcghJwiCIAiCIIguQg45QRAEQRAEQXQRcsgJgiAIgiAIoouQQ04QBEEQBEEQXYQccoIgCIIgCILoIuSQEwRBEARBEEQXIYecIAiCIAiCILoIOeQEQRAEQRAE0UXIIScIgiAIgiCILkIOOUEQBEEQBEF0EXLICYIgCIIgCKKLkENOEARBEARBEF2EHHKCIAiCIAiC6CLkkBMEQRAEQRBEFyGHnCAIgiAIgiC6CDnkBEEQBEEQBNFFyCEnCIIgCIIgiC5CDjlBEARBEARBdBFyyAmCIAiCIAiii5BDThAEQRAEQRBdhBxygiAIgiAIgugi5JATBEEQBEEQRBex3ukDMMbe6UO8R3AA3ANgDEAVwHkAC7ff/KmngF/4BeAHfxDo6YEAsAOAAnAVgPrCF4Df+Z1o42FY4hDu2zcM4FN4/dwPI5T/FsD/BECh93/8TfT+kx/D0k/9JCp/9CcAgInf/Jc49IVfx97Xn8eZwQz+9qH7AQB7gwCH1gvYdfY0Vhp1/OWDD2G+rx8MwDYABwsFjJ04gbHpG1jM5fEXjz+KmcEBAMAogCkZIF9dw8DyCrKrBVhhCLvhQ9R9iCAAlxJMKzAlAaXAlG77V5sL1EC63sBaPos/feYpdmVifOOHiG/yu2p7TE8Baieg5wBcB1A3u0WuVsfHXjmGbXNrmOkbxolDO3FutA9+9Hy27uGHXjmLwVQCpx/Yh9cA1K/O4sC/+2tUtu1E8cED2P/6SyjPfAuvN65D/9lLwImZN3vzDR8+BPz4Y0C1AOz/EPD0TwNf/Y/AF/8A6OsDvn4O+NvjZtuPfhT4D/8ByOWA89PAj/0GcPIlAEMANDIZgS1bHKR1AqXsGm4ceAP1z38IePa3gHUGqAGgfy/wO78H8T//v5HfsQNyaQnF1167u3N9D7MNwE4AEp0fio2EAPom+zB2cBx8YQHhjWXAApIKWHeAL28D5pYBnAdGnn4Yzn/7C5h97keRvLaCkedfg/jgp1B86StY/MUfhq5V39pJJhLAN74BZLPAk08Cy8vNp+596il87Bd+AUO+j2PDw/jTp59GNZkEB5AAMFXW2DHfQG9xEa4uAUkXjGkgCMFlCPgSWgJaWKhl+1DsG8XpPgvTSbP/fdem8Ymvfg2ZegPVZAKKcyjLQpBKI0hmsLRjG27s2oaLnGP14kXgl38Z6OkBfv3XgQcfBL7yFeATnwDK5db1/NIvgf/rf43tMF/IK9H9b4dJiX1f/xtYv/97OPdXX0FQq4OLFHK5B+B8/GegPv1D4GN98P7ur1H+Fz8Htb646a1LpdOY3LoV2WIReubuvnsC5rNwHcDym2z7XuPhH/9x9Pz3/z1ePHwYld/5HeALX+j2Kd2eH/9x4I/+COAcWUjsDyvYe+Yihs5dQU+9jtf27MF/fvhhSM7RX67j2ePT2DozA+ato6dcxBt7d+LPn3kSoSWQ8STunS1jslJDUtWQqFaQqBZh+TXwIIAVhEg26njhwH72d0ePMADYPjunP/X153V/sYSqmwC0NoYfgPlFQzOGTKOOmeFB/NnTz/C5aHwDIIA6B2aiweoNDfyy3lnbro6U/w99PLsHl1KtS003Gvj4Sy/jnuuzWBoYwumnHsUJr4rCH/wB5J695jsEYKru475CDadGe3BpbhY9/+u/RuLieQTZHpSLAn4xBGyGR55+CEMffxbPb5tEIeGCyxBjb7wCVC5jbopBeVeAq+eB62Xgzy8AX7rSee//5ePAf/d5AE8C//Ivgf/hH5vHP/As8Gd/iqmZEnb+6z9GotDA9MkXcObUV9+hD8F7F631m2/0HfCOO+TE+4cQgM85pOsCySS3kr5lh4FtM+HaEAnLtl0hZYJB2UxKl0nlMKUdKGVBKc6UZpFDrm3LQtZx2eHlFTbAuU74fghAasYCzVgIDgXOQm3bVSVETYGHigsvcOyG5zhe1rJ0CDP1aXT1rhAEQXxfwdDmxnYLzRhC24FKKHCtmaWkbUs/YQttxppQupZj2VO+7z4+M+vWHSexdXklkXFdYWcyKmXZqs0hZ4CGhtaaMW1ZVtgjrPDo0mI4LkOZCIJQ2W5ZW35Nw4NiOpCs12vwTwaDGPFUwpWhLWGmfreBMUApoFZn8DzgXXAPiXcX5JATbweuAcaghSUlByCcMLQSnCcSgZewq1VLl0o5v1TMqzBMhA0/79f9HA+CPJcyz7RKMiWzUCrDlE5DqRRT2oLSPHLIFQCGep3tfflb2Kd1qBnzwbkHwWuasxoEC2BbDZl0l6STWNHc8nUiUQ5yuWKQzdaKAwPlpXy+lmTMy2rtNwDpWVZoh2HIoIOWFn/XRjFW6cmIEgTxnoE5DuA4xnD5vvlph1vmBwBUaH7usDt8b20hbzsm41pzR4ZWaAnhBkHCbdRSolJNSVlLBrVKmlVLvYFXy/MgyDGpslqHqZ6LFzNPnDmX4aHMa6176xyJuoaCrvvQmkHH+9cM0EozFoDBh1evHVxZbhxizNdC1MOkOyMTzjI409q2GtJ2q8r6iYbfk6qsD9UqzC4VIHqrtgoRWJa0QxlyrUNtgkUaSisIiyGfF0inNW4NIsXQWPM+hRxy4q4JAUjOLTuZzPPe3pF+xid/8PKVwdrMza2274/ZUg7zRi0na2VdmJu3b84t2GEQCK9Wtxu1uuPVarbvNWwppaWktABYYLA4mMXBmJKKaanANNORCMOsMITQUmnGFeNcMSFCzhEywRUTXErOPGE7nptMqnQ2F2T7+4N0b1+YHR4O+/r6gn2pVE257mLI+XwgxJoVyrkesPOqr/+mSKYbnrAC700MHwulJYrVJK97ARga6EygiQeM2xlXgiCIrpH/mZ+B89M/jTWtEf6bfwP8/u93brD7YWDPowDjwMWXgbPP32l3esO/QMthvlOGGLB5euHtYZzxREo4qUyfZQUT3LGGdte9rT/56rHxwBaTbsMbSFV9q7ywaC8vzIm1el00KiWnXqs49WrVbjTqVhCGgvmBbUlpM6VszbkjLUsopbVWSjVNuQbTWgHQmnGuwJjiDNKBlhZjSnMuQ4Yqs4TnJFwkU2mZzfeFmeyQyg8PhEPD6eAjfXP1IJNbBticFGLNDuXKgFI30d8346RSxdD31r2hAU9/7nMhEonNr1lKzosFNywUVN1OeFIljbJOvC8gh/z9yW1n4AHn0LYFnUikkr7Xs61STli2PZKu1kYGGBPuwkK2cO3qUGlxeUxX6xOJanko43nblFYjgQx4xfNQ8wOsVaooVKvwZYiG76Pe8NAIfPhBAKlUJIEbTYJF/8XhQ65bBqg9Z4sxBsYZGOMQnJkIoJQQnMNxXaSTSeRSKaQTCfSm08gnU0gnXDi27THwJUeqQui4c/N9fReQ7plR6Z7qaEaVhRhdVRKFmuOs99T8QlqzSug4NRk52WE+g+JDB1DtH2UqVJz7gS2qVSCsBzh0L7OyO3VmaR7B3Cyqlcod7y9BEMT3ktTBg0g+/DCKAMJXX711g+EdwMEPAaEEelLApAO4Eph3gOMAAsCYNAfARQDntJ0bALKTCJkLXbwBlOcApGFMXg1oc77Z7t1I7NiBgStXlT+1DYuRg6nBoCwbsG1bWHaKJWD3Sjmyd3FpbC3pOoPzK0l980bf4s2bI151bSz0vWG7Ud2WbNTHk1L2hNBimWmsVspYK5TRCENUPQ/VRh21RgOe70MqCaVhJhuMgTMz1iipoJUCY23GWkcBU8bMDIMBjHNwzqOxJjR3wbaRTCSRTaeRTl5FTzaLfCqFvmQSScsOJFCwlC5Iy1q+mcnMsHRuRmRyhWzSnt9j7VryevvqoZRFvbJa8DivDmlRgG3XlFkcpIuPPa7GhgblcLmOm1fWealSBtKuSa8hvq8hh/z9B0NrjdNm33AbQK5h27tSnrf/qbNn+lkon1LV+hOVcsVeXlwMZhcW2PLioiiWiqLR8FgYhkIzMA0NpTWU0shkc8jk89BawUppZDlHjnEIISAEB+PM5ItoQCkFKA3BBSwm2gRobU5QG2PZsaCCtbZQWkMrBaUUaoGPYq2O62sFhEGAMAggw9BWSo3KMBxxbWd3Tz7/xNDAoBoYGNDbF686D46OLgvHPavc5MnQSp5icG6uDPddBbDMgboc7pOrn/lgQ5a1cK7OpnkoU6xakbBVCf/w14Nk3369+9/8Ptb+5I9x+fz5trMjh5wgiO4iYaKbtzVGfh0oLgNrBeADjwE/+qtAmgN/EQA/C2AdMK5CBsA/B9hvILXtINj+n0HJGYU+9vsap/6jNgULNIDLQCuZWrPP/pge/Me/iade+BbWHBt/w1j7udhgmABjO+uu2zOxvPLM6NzCRxoNf2B9bQ3ri4vszOwsW1lZ4aVyWdQaNa6U4gA44xxgQCaXRzafh7ZtaMtCIp1GknNwIcC5gBDCiDnRRIAB0EoDupmr0pYVr6NM8vjk49NsBQaU1tBSIgxDrAUhFpeWIIMAMgghg8CSUvbJMOwVnG9NJdNH+3r71MDAgBqbv8l3XzhfSaYzC8J1z/mCn1bCmq4Oj51bmpy6HoRYR2+flJ/7nDdy4xoOfuNlVlt81Sn5K0DapaVQ7wPIIf++I7YgVZh6AooHjRXNmdD7PvJDyK7WNHdEWN5/AGXGuJdKZbZXq6Mfu3Bxe8IS+9LF4jaxOJ+6efnS0PrVq4Pe2mrGkXok4SZzNT/AWq2WrPg+Kl4DfhBAQQOODW5ZEILD5gKMcViOC8kFNATAYFQGLsCEADhvGTqlAaYArqHBIRlrKeax060BrVVTwWj65W3ZjFopaCmhlIa2GbQGGBcQlg2uFI+0dVicQzOOQqmIRrWC4swMEkKMacb7LcvZ4/b0PpYYHCrkq/uKBxrrpQnXnSk7zlk7k7oahNbMSkqULj7+UGXhge1ayzJw4CFYCyWRr9eStQ9/MMTP/ULDuVZWgi2ivq0CWGOAHAe0ApwlwFtAtKCHIAji3YHWgJaA6wDprHksA7SpI4bdPwg8YoFLH5ylgdwE4A7AbDlv4aEPaPzYL4U7i9Vg6vI0RLWIc/fdh6rrMGvHTnvf2lo/u3BpXHNsTzdqu5Ll9eHw/IXh0+cu9RSKxRRvBJN58C1KSlb0PBR8D6VGHZ7vw2caPJmEJQS4EBC2gBAWhGXBg4mg8ug5FjnkjBl7b8Qf44QDMCo4i1RwGOU8vlYVjTVa61gSim8StFZQGtCcQwoBrQBY2ijw3AK3bMalFrbWEJxDWJbdCEMsryyjtr6KuZMnU5zxIc75FieVvDefy6/ndu1eHti1tP7kYO9qMZe5EmSyZyfr3kV3cnzV/3s7PWd6Tj98/jwm8ymshZHiT3xfQg759wUagGRMSq5VqLWC4rkxJAfuR7XI4PWYsk17PvgD/MDgFldUV5MXhid6ZxZnJ2ulwmTv3LW9+19/7R5Ly4eLlfLwzMoyri8uYHZ5GWuFIhQXSOd7wC0blmXDsW3Y6SyStmUMom0ZFYJzcC7AOUfgB/A8DwCD1hpSaigpEQYS7f402n5XyhhB3lQzOrXyjSWHGABwBvBW2ouwXVhuEsm0iZlyziG4UUpsIaC1hu81UK/XsVarYaa4hmqlwsMgSHJgqieTmRrs68Hu5RlsOTOCCcdZU7Z9wk8kj1mDg+d6t2+dWdi7ew4925f7gXoNqDC1hpW+Pqvw9OMKH3kO6TcCBn2BNQ7PaM33aFOID8CJvwNe+D+BIHgnPgQEQRDvLPfcC3z+APTX/n9MvX6Nadan7ewO7Uw+h0axwuUHPqzZr30B29cbePLkeccpLyXSu7fmzhRKw+WZm2P95y/s3Fcp7rSDxhGvXttfqFSyswsL/NrCPJZX19CQCol0BhBG5LEsC46bQCqbQ95x4DgOhCUigYeDMY5Go4FqvRb9bcYMpQEZSGhtFqhqrSNVHB0DT6ycc9YMuRqHPC6BGI05jLGmIBS/hgkLtu3AZSlwMHBwcMbBOYPgJmNHKgXf91FvNLBcKaNSLsOr1wEZ9mQSiZ6+fB5b11Ywee0yBjMZTDrutdASL6t06tjK5MS09eyR6f0Hds5/ICnrPqzqgtR+5yRB8ajGqTb/SkBJIwA1r4h4r0AO+fcFHqALwqok02GtrJX2K7t+9AfUyH97EK9btqqOD8LXmvnFSiYI5X4GfnTnys0n+29cPLBw7XLq9YvnU4uLC4lSpZz2whCwLNhJF+mBAfRMTMAPJGq1BizLRiKRgG3bsGy7aaSkVPD9EEopqMjoCW4Mk0lhUVBSQisVpehFBo1HKSycg4EhgEKoFJrSRRsMDJy3HosNr9YasZ3V0VJQSNVMc2GRQWaR8g4AmmnAtpDI55HM59CvFFQYIgx8qCBAKZB44/JVnLh8BSoM8pyx+x3X3b9lakswtby/9EOLC3Oif+ClmuW+OLN7+7Fzk5NrZ37h5wt+JgnuK6ZXC662VrnGWgB4b1YOmyAI4r1BVEuWlXxXLxeFRlFOfvwDwdCHPinPcnil4V6zWaHsekE4Bc73Hr1+8+ltFy8/ULhydeDkuXO5hfk5u1wqpQIZJrkluJVwYWUyGO/tRagAzw8BLmA7DizbhmVZxgEXHAoafhgibHgI/AAyDMGFgOXYABgQiTrNiGrTHTXRUS6MEy+VgtSq5Yw3xxsVjRNReguP0lraUl50M8cFADSUitIuIzPPozFOMQ0/CKG0huXYyA8Oom9oqBXNDQKowMf00hKm5+egggBM6QmL84+OjI4+tWXf3trHgrDan+95wwJ7vpzJvsBc52p8rhpgOghdBL6A4gFkDfDLQK0AeHUdnZCp8EK8JyCH/L0PQ+oAU3t+nF39QF8Q9u3Weobr3KccbD2402FQk7Javqf3/M3diQtXey+cPbttfWl+l9uo7kIY5BfLFcwXCihWKqiHIbQl4DoO7GQKIpWG5SYhXA1hJ4zx4gIaQBCG0FpBSmUWyERfec54m6NuHuSagTEBcBGdcHTiGmCRcm6sh0ZsRTr1cYPWusMwxuq7bnriZqEQN5I54nxA6Eh9jwymZgATZjJgW8IsENWACkMEnofA89Co1eB7PmTgCQ6ddQI/q6enUV9fw+Drr+/PJdM7WE/fgcFD911zjh6+NjTYO+819IWwXr++PpWuryR3KrB+AAOtC5CBQKPMUS9JBPV4dvLd+yQQBEG8czDT2IGx0qP3QB4cCZHY4rsPjunhfRlhAz21Rm1X4ur0vpGrM6Pz5y9MLc/fmHRLhXu51xifr1Qws76OQrmMuu8DlgXXspCybIhEEtxx4YCDu6GpRBg5ykHkwOogEneUgpZG5ImVDqW0aY7FGBh4lBeuOxr/sGjNpoYZL1h0DAWANdcodUZiY99bI0qLRFvZciDeYZxX2ToOzDijGIMWAtriYFYUUWYmYT0MAoSNBhpawwtDeEEIyNB2uOhjq6vQJ0/Bu3ARhVR6qprN7rRHxh7ONWpX7ldeuT44eEkqdbExPrW0bA/WkQ2AYCuDfUhgoMLgzAF7l7WjNJhi8CWgDzswLfKoINi7FXLI36vYNmCsAsf+R5j6qS/ouR+Gj0nNGVSqUYPDzq7vefD8y0+k56c/U67VH5hfXsbpixdx5do1eEGAdC4HN5FAKpvF0GQfnGQC3LYhtYYvA3iej1KpDNsyq8qVUgiCAGEYIggCSClNigkXsCwLtmXBtm0IbiEMAgRBAMa5USaY+TGLZ4zRU5FRNSvhNSA4mGCREx2Xhu2c3GuYNBQdhyZV7JCbvzkzKSycmZBh5Jc3nXYFIFTSVHpRCmEYmHBjlFMobBspx0EmnwdjJiOGRYpLuVDA6ZlZ1CoV2FxsG+zr27ZzcR67Lp+t7e3rv+T0j/3twviWvzt5cPu1Su/4SqDGVahVyDhCBUjYCY5Mnw0uFBJRgqYm8ZwgiHcfjGlwW5tqKA4DfAAMAinG9eNHNOsDNLTrgznWYnny6LHX9vffuPapMPQ/ulYs5M9euYzT586hWK0ikUpBuAm4qRRywyMYTCRgOQ4AhlApBIGPUq0GzgQSjgutjcMqlUQopXHCI0HGFAYQsF0HQojIjoeRYMSbqSvG9utmuooZc0LjUEfGvZn+EY8RmxQP0IwBTDfHu3iiECvn0WYdrwEACA7Xtk0DozBEw/PRUGZtpmAMluAQjoNcImHGLa0hANhCoF6tYnplBSfW1yF9vzeTSj0xMTryxJ6lOf3glUthT1//82v9A396+sGjL62ObrtqKXAfCHgPQr0HoX7CjKDp6HQCABr/BcAb0V/EuxFyyN+r/PzPAEce1lh0JPbdA+txsHuT0HvXVw4n1mc/HF5ZOLT+xsWt1y+cGqguzY/6jMGDRsA4RrZNQWpjaBk3i2B8pRA2PDA/hGbMpIEoAUswaKlRq9YRr43nYEg4rjFGPHaczcJL3/ehtMkd55xFTrBRp5VWzVY82uzILAAFj9e2t4wljGrdXP3ebiM7FIz2JyMHVzGTlgKjfrTCmBrgxuCBiaaRN2FH4xgrBkjGwLVREVjUXU0pCWXZyPQPINPXZwwq47ixsIDZ2dkkZ2xPvm8w379z9+Nb5nfpndu3varc5H9pWOXT07nU8unRe1Df9WCAnqEAfh3onzSn7NPieYIg3n0Mb6ng/n8wi2vJXpzZMwyE0JhEyHYB+9PAnlJ9Irk8dzSzuvZMeGX66PSxY9ljVy6NNwI/X9MKdQBuTx59PT1AtNjSdlwI24G2bISaG8c7VAhCBRVqKB2gLqNUEs5gCw7HtoC4Mkss5miNUEmEMjTrhCzRXGckVdhyqjcW5uKIFnQytOoGsFaRlVgDalv8GWOJKMLL293vllLeHJbaxiclpflTKbDovAENGalDSgNSRgXPlAZjgMU5FGNwczn0J5NgWsMSHFWpcPLceXbu3Hk7nUo/kBkbG7Znrv/UY/v3vpHu7/u6ZsGpGwl77vXJXZVSIkUy+HsQcsjfqxw4DGfPYTG0grSdDscTYmFq++tXekePnXkyWLn5kfm5m1M3Fhb5fLGMgu+DOzacRAJ9fX3o7ekF5xwNz0cYSgRBiDCUUKY7PRgzeXZMMAgmoBAiDEKzWEVwcMYgory+OJynlEIo0VSeOedRikpshNqMWNtCGcaZUc8BSCWhtQJvM5Sx1WRR6LHpekeKN2faSAEarZQUzaO1O7qZRxgv0mGaNctd8egQKnbrI2MvtYrSAXXzdVoDluMgmU7DjfLn/UYDxUIBxWKReY1GIl2ubJ2olbduv3kVo/35rVYuOTQ24FzM7955PtC5y0ujW6/pyYPFNUA166wEHoPfAHxPv0mHPIIgiO8Z+YEGDv3AHGrDAmcmh9EPsDS8oUSlvG3P6ZXRrScuHA5uXjpaX55/YKGwOnxleQlzhXUESoPbNjI9eeT6+yBsB4FUiM2qBBCGZgGi1ipSrxm4sKGVhFIyilha4CwqWxiLO0pHKStmTZJZJ9SpcrcqpLQW+zPWKmHY1MVjnxux0h1HWdv21bEAFB0LRzvqr7TtsD2lRYZhc90UZwyCWZFYZF4TKuOMt19HQ4ewLA43m4Ft2eCcQ8oQtWoVa4UiKuUyWKGQ7y+XDo7N3ETqxOs77f6e7YMZfiG1dcu5Mpwz8xNbL3EdFhpu0qsIK9qzRKyVE+9OyCF/D5MNPfvZlZuTe88u/Del5Zkfu3TyVP6vT51019ZWLV8plshkkR4cRG8qCc04QmlyvteLpWgPDDpKDeHcghCt3GwAUY1wCcYYXNdpigUmP1xCxqHE6CWMMdiOHWWlRAs8mXF921OlY7PVDCXCNGhQWpkar2AQUS5gk2buSfs+0AwddhjYtjU6rP3AiBWZwBjAOLQZLfaJr81MIFRHWDLOi/fDEJ4fAFqBAUjncujp6zdGMwhRr9dxfHER3758YVSo8BOH9+12D7D89Y8WX/6qGr/2VzdGRl59fnRqeT6ZiZb/Kw4lOVQYRgcmCILoOjLgqK66KPc4EIB4aK6SO3T9xgcwe/nTK9NXj7x25uzojZs3dKlcsq2Ei1Qmg7EtU+CObcYbpRBKCT9smLQXGEW43RHmMDZYWJbJ/NYKWoVR7jZDKCWCMDKV7TadMdiWEUZMykpLEOZRQYHO9UZxpRUVLfhUzTRGwTh0+1gTs2F9j5QKkJHY1N5RCK2JQAfNYSQSneKJBdAsdtCq4gJwzqLxSUKDIZAKXtiIorcalu1gcHQUQ+PjCMMQfqOBBd/H1XMX+rxi4andUxMfOBzYy88G3zzuTEz/1cJA31df3r57eiXXG+k/ijWVJuJdCTnk7y6MpLxJVQ4NoAhgol5Pf3B5dVtK8AcxM3N09fmvD3772rUjygun5tbWUKrWEVquKReVSsN2k7As1xhDFULGjnKkGsRhO9ZuXW75vsaGrS31I1IgVNOgsNZLm4azzWZ1hA5jNaJDYzCVVKJVNFqzjS9qqvGboZnZQ3zceDHnxhPQsTSuW1573AiipXu058oYY8sQp8rEqnmURxjVVmecgykNzQVCJqDthNA6TF2dXUax+OJkyhY/MDw1sS938MD5p3ZXLqzu3f/1Yi77xqUHPhCuj22Rg+k0gvU/YoUvn9kkSYcgCOIdouEDhSrDetVG3VcwtVQgLVsgmc4/UK4dGjp+6mHn1VOTl8+eP+oXlvetlQvZpWqFhRoQyRSYbUMLG+A2uDDrkEw977Z1lW1CSbSuEgyxMhzZU6YBzm+xfi17Hg8ErGWmIzHI7LOtj0V76knbMVsDVMu51xsP2OmLRymWrCNKe6uFbu03vmDeVN5ZFAmITj+6Ka1xNx7zTLqOZgxStwQiZu4UFMySVcY5IAQk52BukjsZnVitBjh14txw/uzFx3oH+kbdHdufOLJeWdm778CrpWTya+dyR2dm2BSAXg7UeHRiVAXsXQQ55F0j/g7kwS0NlpBQiQR0ucLgecwU7lYAAyxA5OuNXJ/rZKfm5u/d9crrj/cWCz9yZebmni+99ipurKwglckhlUohOzCIXjfRDHMppeA3gsghl2AaEFyg3f1E9Ntm+iyLlGmlOn3EeFFls35r7CzrVsWVDsc7tshot3Wd0wAWOdWxEtJWPGXTc9Md/295/x3Gtd16RqFCxkVbanp0Xbfkpcf2PvpdtQKRcY1ZaAYVKnhhq9GPZdnI5vKw+/tgCY6VlSVMX79hh34wPr60On7PevXhPRevz+1cWt6x9MADf+UN77yE0V2ro0ChcPS6LIz+DXPm58GHR+BFDS0IgiDeIZjoz2m2ZwxhIQW7PyNSQeB6tp1JVCrbKsW1vVMXFj7mzl1/9rXz53Lnb9wUDalg2Q56e3vQPzAELrhp3BMECAIJqYEgGnu4ZRn9Ay3BxJjq2J7GIU/dVhClbYSIo5ObnHi8UBNoLeI3T6Bpz299XeSscw3WMfq1Z4Pf5kY1q3dt/myHoM7ix1qpMErrWweytqhze53z6EEwsGi8RjMq3Xwp43DdJHKZHBK2g0qphMvLS7xaKedSN+YOb1taP3zfcgG7b9w4WRkd7rf33vctjB6dr9prxUpPphZs26rta9MaY2MIhICWlHbebcgh7xp1AD0AnoM7EMI9vITqfQ/K4OxFhj//c45SCWh4Eoxjjxc6T56+cHBQBT9TvHzx2RPffk1cu3ihf71ahdvbg9EtU5BSwbZtMMuKnG8FqbTJ24tbe+l2J3kj+o4Pb9TPN266MU38LaNbTj7bzPu+mx1s+K0z4th8FJtfQevZ1kv0JlttkOk3WGEzFmj4UkFCI9vbj1Q2Z8op1mo4dfUqv3j16sjozZufGT937uknp7aeqe3Z/Vdn9u//z1c//ak1dviw2r+wDt7fj5PJJCirnCCIdwgGgOcf2amdX39OLfihP1lYs588eW57n9/4XOPGjY8unrmQPnPp0vB6oZAVySTPDgyCNxom/cJxEGqAhWasaS7yj9TqOPOvVYX2VtGj/UQ6rS/b5HlDxys3E5He9LJ1szTh7V74piPQWx2idGuo2Oz8GdDMLd9sahCnTnYMPdEWoVLwwhBWIoHeoWGk8z2QvoflchlfP3US/TPX9/QPD//aluvzK3vuPfDC8vbR/+3VT/7EuQuP/hAmymW4g/24kM5CFq9sdubx8E8q+vcAcsi7RgjTm3g3bFESbq4u6mMjCqOTCiMjsmfPTgzduy+XLhaPbL984n7xwksPLBZWn76+uDB8aWUNs6urYK6DbDoDO5GA53lNoxYqBR0349GtLzMiFWFTteE2f9/eRG7+uu+E72T/GxNg7uY4bINfvvH4d0ri6XyGQ2/YkVJmcahtW3CSSbiJBBq2jUqpyErlsl25cKGvOj/X5wwOTuamD472razs2nfo0DfZvfdeHr8XN1aAemuPigEVCygqwJUmypgEYG9y1gRBELciAeS378bgxz6NhaRAJeVqCEuqZ59ELgl3MMmmdl+bfWjwW68+pWZnP7w0Pzt5eW0Ns2vrCBlHfzoNO5lEMlrUzoSFoJmXrYG4BwVMrvh3a0XMmynXd8NGR/a7sc+3d/Tb82aWfDMpjYFBhhJhKGFbFhLpNNLZDMIwQL1awVqxgNXp625+fmELZue2bLt5bUtqx7b03oce+UrvPfun08D5VaDAAMha3QqqdTtcLzLG0uHIxCE/paROhUIHFQ0dmhOwPIn17WnM39cPjE4C15eAr34JKNcBjMLkhFYAFO762gkDOeRdI07fKkHaoZC2k9ArqxIf/EGJX/olTHAePjR35aGJl1/5h7Mvv/Ls8xcvOLOLi/CkQr6nF9t2bEcinYYvFYIgNGFBraGgTTmlyCkH0NkaGOhYOd587DZ/axZ1HmvbIIrG3WLkNnrxHfts36A9FaXdj72NSN+5jw2HaeXHvDkdm0YVV+5omjffacv5Zs3f20OtUcYgtNao12oANBzHRjqdQj6XRqPeQGm9gJlKBctz86lRz3tk9NrVRx751rfOZnbt/k/LB+//8o3t244zWzfAWQgmwETeAgaUtvslQg1YHAAH1TEnCOLNiKubTD78FI7seggvjKVRyToAIEJA5orF7Y+/+OKPOidOfPbM/Pzey9emsbRegO0mkO7rNe3sNYNSEpZtNdMqpIo7MGuzKDHOj2Yw5ukOKR7ttGsjG9X0jS95M+Hm1nFno3XXzejnZkHUTp3m7gSPOws2nbu57R7fxHfd7HWMAVJphGEIraTppeHYSCWTSLoOUskEysV1lCtVvDa/gMul8kDv+Ut/b//pCz908MCBr1x/+qk/ujk19RUGaGHbrp1NZUS9LgYmdlX7Ju71tzOO/lWF8nUJWQO40Eh5Hk49tAUL/+wo9NRTwOtvACdfA8oBgP0AHADXYVa9kUP+ViCHvGtwC2gwYFFWn/iIX/2tn/PRN4RtWkw+dO3KB1Nzs/eVT5x44PWTZ/bNXb/hrHk+rEQSyWQKqXQGXDjw/TCqxSo7CnTEaRPNtGpmcqU3K9e0GW3p3t/x96k9n7vdCd+YNLJpCPE75JZdxvfjttZ7E26xgu1mnGGzpBalAcuyYFkMnANB4CMMQ9S8BuxoAWgynQLnprjKWrkCr1RBYW5xamBu4fPbffnxZ3zvr7cm03/4zV0TlxdHBvWBX/6Fem3lk+zylgyQywHHTwB/8afATAnI3fUtIQjifYywHVhJgYbrIBt46Q/MLu7pWV35gcbF8x+afuWVyflLl8bmGx48pZDM5ZBMp+EkTZUu3wsAmIooQJQWGYYANDgztrCZEMg5eNvC+duyYbkP2+yJu+E2h7ldNPg7iyve5tWbzhTe2YFNw0yEbNuG1hqe78HzGhBRAyXOGRLpLCzLQRgE8JVGqVbDiVOn+i9evfrB0bW1A48+8siXD2fzf8m2jb429Cs/sXiYqdz837zmvvjHL/b4VY9LmQqEdqtccMWYggUFbrtAKtm6xmbOqgVTm2KTqjXEm0IO+TtPm2vrA6gCCHjf7t1CjG7RK9X7VOLpB9nQrt19Ahjd9/prH9vy5S/9yMLZ8wcvzM+nFmpVBFwgm+tBLpOB4yagFOAHIQIvgI67jUVdzFr5063FMLp1Am/r5DWL2tm3SdObKeqb5sjdJfF5btSsb2fP7ybt5k6ve6fNhSn7aEpZWZYFKSX8qN67bVmw3BQsJwkpQ/iNOlY9D7Nra+lMubwTnod9s/P5nYPjbL16z0vpndvP7/rhx+dmE9y7nIr2n+dc/dl/Enq9pDDI5R1vFkEQ71c6pBU/DBHWqmK4ktiSmLvy2O6vv/CIvHr5o2fnZ7efXVjAUrUGN5lCpqcHmXwPuGWb0oW+D6mk6YQJUwVFKgWpFUx1rKgKiBHLwZkAuCll+1ZojgPs1sc3+/3tWjyFzddGte/z7brSm6V7vtM0yykqQIYSvlIQnCHhOnAdF66bgAwlAt+DL0MslcuWv7Iy1KjXh/ZfuTo0MDrWn/vws/cMPfDg+W3AlfnH/bUbc+tiTIZ8/GbdvvLlWcsrer6TtBDCg6xWgFIFGERr3QAUTJ3zOPpPvFXIIX9nib/zOlp+AaAgANe+5wv/EKlf+Xzw5arG9vmF3If/9itPq+W5X164dOGpF69Ne7Pz83bF8+Bmssjn80imTBPcMJTw/dC08YWp42q6j7Xm/bqVON5yxtvqpLbXZr2dQbqlpCp781QX/SYyd3P/uvPv+KAbJxC3bLPp/jbRVG5nCdsuUAKmxFbbc28h6+WOz3LBEIQ+6vUGLEvAdmw4lgsNU3ddaSCImidx20HCtpFIK9hOAl6lipcvXsHlpbVtU1unfvVAdeUH718u/MXC8L1/UtqSvYTIIYfSQodBBr7fYIFVpyU3BEFsgMHIlVErSKDhOhCqMvqxN07+Rv3ca587d/GSunDxfHqhsA7hJNA/MopsPg/uOAilRrXegOd5kErBtkyqioy8bqVVs7EbGDdNe7RqtrdnjEGHrZSNDtu5qSE1D+qN297pJW+XTcaat3ecW0eNjlh1R6rm23fR48jDrYdkkFpCSQnLspFwE0AC0NI8Bph65owxKGgoIaAA9I+OQQC4sbSIK6+9OtjX2/vpx4PG5/uX1k98MzXw2/9lcvwvz/7m59WPplz28BfPJGZf/BO3KldZIsx5HApMUirKO8H72yFPJoGhIcC2gTcr+aM1ICVEfz/c4REkmEC4XEV5vgDtrSOvihgqV5AOQ4Qwy+2KgL4JIHj2KeC5TwAYwND0mtxZXJPFowewCvQ+ZRUe2XLzzJPeCy89vHD98uEb6ytYZ9wNXBfJTAaJRBLctuHJEFIBKlRRFzLWTEURUWdNjagFvNbNiiUx7A5Sc5zWEv15W4Xgnf4KvuXskbepQehNfuu4CXe/g86wQfy0VrAEh20lYRpdKIRKgzFh3qco70/J0DRTEsKUS+zrRyqdxcryMmZWllm1Wk77szMHt86tZLMHSofvr2/7z319ia8e2711ju/YFoz90i9UVV3KZfsa1M1/AZSrb+t+EATxHidqnoPHHgP+yT8BLAt96wW9Y2U9LOw/gAaQevT6jX07FtcfzMwuP3zjpa998Ma5E5l5rbHuB3DzPcj29CKZzkAzhprno+H7gGawE0kkhYAMAzMOslZE1ggpRjVXTHa0nW9GaVXLKb8zrZHnzmPBZjLSW2NT5/aOp7nx0bcx9jRFs9ud/8Z93nptt6j4UaoIa3bNNtqf0kb4QbSWKa5jDi7AwMBsB0xw2JkMAiVF1Wukzx4/jsry2v700OSvjt5/35an0vu/9npq5NLFI1P14H98zlo8MaNLtRpGeID1+1MUkX0HeH875Ok0sH07kEoBvn/nbbUGPA/Wnt3IHD6CPJJonFlE5bUrQPkqeuQ09jYaGA5DNAAkADYL45SvPvkM8A9/BQAwsbiEp65dc/56xxhfnZ179KNf/NI/CI6feOrbC3Opm8vL8LVCrrcHPZksLNeBUgqNhoeGF0DD1BC3uAATrKViR9/zuImA0gpQrKPNL2A6mAGIOn9tSA2J9tGR1/0d3dwN+dptU/w3E7Df0v7fxo423La3eAZvvo3WCsIScBwLMgwQBAGU0mBMRhMnDimjzm/QUEJDagY7lUA6lwIXFoprqyiUy3hlZtaaqdd23ltd3bn35tS2sZHJ3jWmXyju2nZm/Bc+31gGdGP1HFN/8AcaFXLICeJ9iZRArQbce6/5ATC4WsCjV2fFpakxZ3lp+f6HXvz2J7MXL3z8YnF127dOncLM6hp6+vuR6x9AOp+DsG34oUS1WkPD86AU4DgOXMeBZVnwtYaUkeMfjRWc8WbBgI50w7YW9m9vILnzizZ1j+92ALmL1Mo3PeXv6MVvfePbiWOaIYpSWCZRRJpFtqYLqHl/VNScM25pJ7gFP5TQYYhsbx96evsQeg3cWFnB7OlTyW0jS08eKa2O77tyZeLPn33iby4f2Pvqwz/7SG3uyoq6Mn2TbRuVWmVrVLf8HeD97ZBHqjfC8K4VcsgQCAIoWFDR67SSYErDgoYDkw7hASIH4ClAngT05Wg3nmVbUvFtHz19/u/duHbls8e/+XJubno6WYZGsiePjOsgVAp13wcLZORoo7mQhkXhQWgGphWUkgBn4JpFtcdVFErkEBsuwXQza9Vg7Zir604HvfWizR683T1qGeaNL++sQXvrPnXbZGDTyN7t7Hqb1MFav97uBJv7V7FRbrsXG3WZ2+5mY73EzhMBY0AY+gj8Bizbgu24cMAQhAF836yG51wg4boAY1BSIfACLJaXwMAw0NeLsclJ+PU6VhYXsVgo4JsnTmJlvbB/p5Zf+OBx69FAq/9Y3b71b8uWKIeqkdBV5aHBOmdaBEG8b/E5R12r3NFLV36ourzwufUrl/a/8OorE5fnZpEeGMCOvfsAS0BzhkqtjrpXQBiGEMJGIplCwk1AK4VqpQLP85BOp2BZoumUG2c8KqUbKbXNal5KdRQaAHDXC/eZZnccdtqrcTfHsLeo5sRpMZsWc7mLsebWc2rbrClCxU3uNukEuvkr73TKtzwfj5MmEtG5iRHfWh1LpZSQWkWRc5PmEr+PCceB5SaQzGRRK5VwdX4RlVJ1YqJY/NyjQv3II0z9+ez+Pf+8Cr6Gim/zmgqRUIrd2lCV+A4hh1yp1s+bbas1EEroIICGgJYBoCUsreBrjasamIP5kI4COtnTwyqPPKKrjz4CAHwyCLJbZ2YeLV+98jFx4dwPVi5fmri6toaCCpFMpWGlUuCWhcDzjYqtJBCF/Rhj4FxEzrhJTVFKAjAr3BnnxjhFi2zilsDxuWulIZUGZ60FjVFE6xbjt5kx3BhouxtuG+TbzAhGD29ugDtz6NoXZN6aMNKJ3vBLZ35iR2beW+R2Z9sGY6YeuZSABrQCBOPQ3LyXHCYxX4PB4gKBNvmZfijhagCWhVQ+D82AhlfHxcUFp+h7O3ZeuTwysbI8kvKePFQ7uPfPCtnxY9bjn+XrPZL7CDRCrSmcSBDvT7jWbMj39Z611aOZteUf8k+d/OHZ8+eOXFpbw7XiOnzXQU8+BzebhRcECGWIQCpIqaG1ceI4mGnQpjSYitrbR+OIVq10lWaHTR2PQ62ukloZYeg7upZNHrtdFPc2Os6tj91m0GgfZ2LJhbdtG4+XGyPJG4916/h5u1Hqu2Gjo/fFvGMbTtao5wwMmqPZCdWUQRbQMKmTXhDA4gx2Mok05wjqDSw26m55+sq4s76KiWr5swP1WjjVM/En9pbBU7a1jrJXYdoFR9v6BOI75/3tkH+XsAF4AM6itcb4KUCG+/fjxd//fdTGx5HxvOyzx44/NPH66z937vr0J89dvMgWi0Wk83kMDQ5CWDb8wIfX8MAYhxBWZO+isF8zL888JnUIpRUE42ZxYDQjFoic8rZ0FRWFsEwMizdbv3ekrMS/tD/RJW6npGz2+J2UjFs3jxV83ZY+s9Gktxztze7J7bP62h7RGpZlQQgLQRCgUW9AQ8MWNhzbAecCUmqEQQilNbgQcBwHiUQCUoXwAx+LixVoLZHNpDEyMQ6mFZYW5nHm6lV20bIyR1Xw+GNMPT6Vcpi/Y/uloQ/+c+sKpoOb+kYDQSOEQzaSIN5nMADaljL18MXLw0cvXPpMbWX5V799+mTi9bNnEXKOwdFRDI2NoVyrYbVYgFIanHNYloVcPmHU1EAi8H2EngcRRfKSiYRRVcPIZsVVPRCPT2gTgszJ6E07HX+X+C6Ztw7rvyGlsuPcozzs28nxd77Su3lO41ZX/s7qOWsb6JRSZkLEzBimVOs94YLD4haEjqLAjMHiDJpZJmob+Ai0hus4yOTzSAwMoFosYm15GV+fm8WWF1+cPLKy/BuHPvKRzPChA7+5slbSRQ9gCSvQpnQcDTbfJcgh/+4jNGNi9ad+Kiz+g3+gasPD2Nvwjjz48rc/1XjhhQdfPHXi6Hy9wepKIZnvgbZteFKBIzQiPTMz3U7jEIcBNbSW0LEqLkz+ntLa5HPFr2GRm9lWWYVHCjq0UWw5ixzzSILQWker5I242nToo5QZhU0aKbSxUU1HlM9ubFinoY7V23iiobQyOdYbct474om3CWMKEa/8l1CReqO1MtvE0QUe/2vugY7VGxapBWgtiDFBk9bNj1/bUaGmXeqPbaJud+RZtA8JrTWEMLE9zpjJ79MMiKIV8VVpGUJp3rw93DILdaXWqPk+mNawEknk+wcglcT1+QVUvvxlTBUKPzH5+BMD7sTkX+nx8Rdv2oMh1CmGsCpgyvp8J7yVhCWCIL73MOF5OdFo8IDz9Uml8k+cOv1o+tgbP3Lm5MkfnFlZcRbW15Ho6QGzbTDXRblehyelGWs4InvMoKVJZ+QasKKvvtAAUxrgcSqHSUthaFvDhFbKhNIqlmEBzszfTUexuXXzbxaldBh0SzwCOlvFN+XpTp94YzN5znFLAQPzUt0RMQbrDCKaQgnxxhsc4Sgdx7JscM4hpYKUEkpHY07z2EYYi8exlryjm1Ft2YzEx1HvlpgWXxRnvE2Ia2vu1yxtGOWIw0ym4vGpKVhFY018geZ+tq7JVPsy4xgHixZ6mnHYDwOzkW0jlc+DuS6Knocz58+jN/R/JH/9cu7IUO/XUnt3fW1xavtNDWiEgYDWb6aU01hyF5BD/p3CABYEnPkNpqWUDuO6956Duv65H1e4//7kWL2+956XXv65oS9+6bPPnznde3Z5iduZDHoHB5HMZFCp1xBIBa7Ml4hvkGI7wmiRsdNMN0NRZsG7qXndnMEzNB3IlnLRrg+3apY3mwXpaNEH0wDjxojy1ow7tlZaobVqPj5BbFSajUPP286D83Yj3GkcuOIdK/Fb/i5rnnO7Ed94cBVdD2/m45hwnG6z3Epp6KgSgQCHhbZjcm0qBbAo14+Za2SIDBZaOYAsMtw6PnttzqBd1TABCAUZGkMuhN1KE9LarEMAg4gnPNBQUpmJQmRHLdsMiaEM4QceAA3XddCXGYGUEuurK5i5MYNqrbolsbL82aGpLT1bHnw8d++e/ceuJUdvllNWFQCD7wO+bxYYtEa/uzWKb2VbgiDeaSYnwaem0FMuglcrCHJ5VA4f8t2h4b49DW9i95lzD0x8+SsfuXDxwtOnpqeH1hoNJPN59I2MAFzACwOUqlWzxki0hn+tNWTU8ZkBEG1OtNYKWgKasaiiSictT0u3hgoWLSjcJElbs5ZQ07TR2jjzOnacY2c87qjZJoSwWOnVxik1Y0M8ZiFyXKNzR8shb44fLB5L28cx1jzxpqCFtrEq9ue1AoMGFwwMopnSEgtA5lCymQHLYmc72jfnAk01PL7OtuoMcXoqg6mU0lzj1GaJmY51tEi4i8Z4HR2npeS3CV9tdXHbL5tzDiGMP621gu/7CIMQlmUhmcvBTWdQq1YwXSlj6bXXJ7deu/KjI3t2TW1zsn2HB3a8eKUH54o9uQoefphh+RRHtaZNa7wMgAkAywDq8cmQw/4mkEP+nRArC57nIPAtZov6rg/9oDzys39fXXrsSaDR2P/xb7z0eytf/drR/3r2jCw06jzb24tkLgfbdREoBTARdXTkMHUN2x3ptkDYBivY+hKbL3VneK3tFNseVjDGyhaWUcqbM21zLVxwcESGN34tY82FO0orSC1bKTRMA5pFqkB0aGUMiWMJuLZl1G+tNpTDimf8xgkW3EQFwjBEGIZtq/Zj49TKo29eLzPqS73RQCglLGHDcSxYlgXGzcdaatPF1A8CKBnA931wAG4qDYsJBEFgFrsoDYHo+jkHZwKKq/hNaCrn0TDQ2RU1UsZ5dE0sGrR0UzWKjWJzdy2JR7feIGNwdXNiBAmouFYuM2+eVAph1Jwjm++B47iohD6OTV/L9a6sfHpftbbjw8XVv/rq0aN/fCwxcAkA4NcdNBoMSvlgrF0quRvDR9XNCeLdxGc+A/sf/wbuP/YtjBRWcHP3Xj2992AdIXc/8Oprv9Z44YWPfv3Uqdzy2mqqrjVyff1wUmloxqGgAcEhYAEKzZQShpaTx2IbfcuBb33kTsTGJa7sZcy/bopK7U5vMzob2TbbcZqikhHYI1U+1lviNVSSAVH6jBAiUu7jC4pPu2XuOoQgBeg2JT5eGMmiEsLxuMPbIqS1ag2+70PYFizbgmU5EFwA0VgUSgU/CBAEIYIggFYawrKbNdmFZZnfI11fRdFqUxHFjMM8uh8sGi/NRCMW3aKxhsdjJprVVKKs/w6B/3YLSdltfm+fxKjYP9AK3LaRzGQQMuBmpZoonb/wxAFmbftItf7Q1x9//H9+effel/Hv/p3GP/5fOf7F/84BVwL7NPA4gK8CeAO481jCYOrla7zPOwqRQ/524RysWmNsdoHVH31UJT7wM/7hs+fV/h33oO+ee12+tv6Ryuk3fm71a9/Yc+nUKSzWaiKVyyGdSUNxjkBKqNCkjjAmwLQp3N8yZd/9iaLx+TSCMIhm3+YLz6N27owhSh9RLWOlBZSSCFUYzaYtCNeCxVvlrpoo3VQ0fM9DtVwEtAnvyVBCSuMgq+in6fDz2Jx0RgfM77rNmMdKiklNAWdwEy5sxzF597ZtjF6Uv80EB+MMQnBYlot0OgkojdAP4QW+GQhi5Z2zaMFn+3+x8s+iCUek9qN1Tm0ifKzjbxL2vNs3qG1Aif6OPXIFQEoNzjWYxWA7Ljjn8Boc69UaVpbXOCuWD95TbyTv53bWfeSR//BKOnFi9LnnvCnfT1965RU3CIJgy4MPhpZto7q2hpUrVyDfrNwnQRDvHtJZ8P4B9O6YQq8/ipU9h3CPYk/ljh/7+eo3XviBiy+/3HdlbRUilUSmpwdOMoUQDA3Ph+YcJiuOgRmZuZmiYpzy9kzodiN8Z1u2caRq/1sphTg8y5huKsKxfY0FKMZgUvsYQ6jCtsgrosWIUTQ4EnBsYcFyjbrbqDdQrZSNPZcmzz0IAoRhGKUyqqZdjUUgNBXyyL63G/LmONRK+UQk2AjLAhcClm3Dtm0I24ZlWeCCg3ER9Z9wwdJJaI1I9Il0kMjJNbuOShTHVdHaBCpTttAcV3A0u6DqaFzm8boxM2BD6Y1R5/b3QLf9f+O7yVpyeVt6jNYmHUlpQDMObtkAACeXA/wGm1lZFXjt1SlWrvTsB7NyTz/1hxd7e7829/lPVbwa5/jzP2eYXQZwVPc88GFYuTTWv30MslIDBzAZnc/N1nnFEv77Wh0HyCF/68Sf5iCEdiyOraMCn/4RqX78Q/Lel17G1sX1wdmb0w/lLl/4HyrHX3vs+ZkZlHwP2d5e9PT0QnOOUrWCIJRgXMB1bDCY0ncsDplh4xKRWz+nm5nIN3cB45l8aJxJziE4AG7SU8yU2+wldtg5AKVMaUdwwBIMlhAQQpjSVlJChWFU+1yDa2NApNdAUK+ZNBzGwLWGxRhszqGaEkYrRMc5R8Jx4dh2ZKh0s56qlDJSshWkNMcMlASDQMqy4TguwjAwbYEbDXNtgkFYArbtwHETcFwHrmNDa4bA8xHI0KgVPIpOcNZy/JXqmM4blYS33cWoskDTjqjOt0nH/9vwjmzQpuPOpk0VHJHxjUOf0eYqHsS0hgxDMLQGFjeRAjRDyQ9wobDuVE6f2fd0uTZ6T62WOf/4Y/+fsf37z+0aHg7Xg8DxXJdNbdmiUvm8mj9/HoWbN8khJ4j3BgwARzqhNaDq5RrqlXVbzE/v2HH60q/gyy9+4sUrl3C5UAAsGz29/cjm8wiVgtfw4Pk+uCXA25Rkptt+No45bdpIrLQawWKzUWZzP0pDR2uPWDONgrU9h6g+dqyAc84htUKowsgut9Rpk9IXjTGcwRIcsGwwZUEHPrTvN9NQmJSwosmFbTx9cMYguIiioEakidX7ZmRSt3LY4/FGK20casaQchNwHAdSKoRSIghD+PW6OVdLwLIsOK4Lx7ZgWwnjuHMGPwgRSgWpQsi2Dpc6vgXR9cfquVQa8QjUig7DbBxHDpoBVg7O2tMo0YzEtnfX3uwdYrrNHW4OQuYPpaPKOlHEgAsLyVQSXCfRCHxMF0tYP3su/7Tnf+qBuj+ee/hp/417t371yj/9OalXVhn+/XEGlGTfY48htX0SlbNXISs1CAA7o+OvAKi1ToeisSCH/G1gHLdgbikZTA0L/bOf9vHwYQnft6XSI261/NnU6uJPHn/j1d3nL12CTCSQ6+tDJpOFZhy1RgNewwePnHHHsiPVOIwWGALtc9y4julbmTy2m8x2H1FDgwlu2rhHiyk1gFBKsGaKsXEKRTQr1lojkU4hlUpAa2WcWd9HtVJGrVpBo96AV6+bNr1ag2tzDf19fRgdHIBjO0gnk8ikUshkMsim03BdF8lEEq7rmnsQqQyum4Bt2U2jGP8EQdhMZwnCEGEooQH4QYCV1VWsra/BC3yUymWsF0uo1qoo16qoBX5kTI0DqwEkUmkMDY2gtyePMKoYoCIHO44OAHHqiLlxWvPWwlBmjKRJU4wWNulIaYiUe5OHvmGBavN90B1vUKdywdr/MJ8FzhAv9I0HCh1VRmDclBfjlsDY5CQa5TIW1tfY3xUKvbuV+siPazivPvHo//6X/f3ffPyXf1n2/u3fZha+8pUEXLcqkkkPm5wfQRDvQnozHE8fdvDIwUADyrMEBiu1p4ZPXfzC2a9+46lT334VDdtCtqcHbjKFRCqFUGl4QQgNwLFtsGhxeVOVRpSmgs40lVi9bhcKgDuNQC1Hrn1bxhhsS0SmUTfX/cXHNfkZMMpsXOVXMLiODW6ZogMcDCqU8KUHL/BRrVTQqNXgNxpQngd4Pnr7BzA6Pg7HdpBKJpFOp5HP5ZDP5pBMJpFKJeG6TlT5yqSPJBIJuK5jUkWUajrkYRiaSG403khpuo+GUmK9UMB6sQjP81AqlbBeLKBcraJUKaNWbiCIxhPGGaRUSCSSmJjcgnQmi0qtDqVMXkZcYMCkuuimJ2rKGEcpmZxHuehGvrIEh7CEyeWXKopYMwhhgWseOfrxjKf9vYjf3da4054+araIJz7tL42mUjxKh+FAreHB4hpjW6ZQL5exPLuAr544iX1+eOg+hf9XPvOBfyGG+v/4xv/yq6hPfA34V99iuriqdSg70mc8ACMA7gNwEcDibT9X7z/IIX+LSM9j8H1rdM8OOzx4UFcevjcUjrD2XJs7kCqWf2jh+tXPXJi+dmB6ZgZVzpFLp+EmU5BKo+bV4fsBOLeME8oFlDQdsxCp0YzdPvfru0Hz+8bNohSgpURD66j6ioAlLAhhFh5KP0CxUoYMfYR+ABmGkGEIAY284yCRzSKVSCKdTCLlurC4wNapLdi+bRsSjotMMolMKolsOoNM5JCnksYhdxwbdmQoLcsy+dexYxuvTI8UchUp5DIKg/qBj8WlJaysrSEIQxTLVawWCiiUSlhdX0OxVES5XEaxXEa9UUe93kAgFSprqyjxdYBxcG6OKxwLlmUmBwyA1OY4JuQpARnnGEYr49tvaAcbl7du/h5s/ngrRGp6DxllydQuNw6/ybVUUZ6hqVsuLAuW4yCRzqBRreHm+hqsUye3jnv+Z4a1wtrTT+pif/+JwjPPFJZ9v0e/8DzKL74I2WjcNp9cAEiildjXbThMfa063h3nQ7y3iD8zWQD1TAa1QwehensBz/venghjpueFDM2aoXaPNy5NG/fFiJ2m9SLHoX0cf/+zKvHAg+G2Yik73gifwfTsz8+ev/YDF06fETO1KvoGhpDJ5yEsC76U8D0fSsN0DbaFsS9KQUl9izN+J97u960ZcYzsuFkQieZCmngBabwgXwiBMAzhV2sIIrurpGxWELMYx0AqBTffg6SbQCKy1VvGx7F96zYkE0lkM2n05LKRQ541DnkyAcuxYQmrqYo7rgPbto29bXPIVdTQSDadcd0UrVZW17C2to4g8FGqRmNNoYDl1RUUSkUUSyUUS0XU6jXU6g34oUR5ZQWFlVWTGB3lxxsV3QUXAkoDoVIIo74iWsP0qBAmrToWeKTWzTQVqc25KakhmtFbiU2jsnd8f3THaNVcxBsLVMqo6JybijSe78ODQq6nF+l8L+o1D7PlMuS5M8m8Cg9NAb/42LMfVKmxga+c+cwTy/68YHqc22zlOmOhDBGlpfgAHACjMM65B6CM93nyeAQ55G8RFUqLu25i7MNPwt21UxYAZ9eVGzvue/34c3Jl4aePT09vO3b+ApK9PdgyPm4c8UYDjVoDUkq4totUKgnOOVQYIgxM+ogJz0Wmb5OC2/o2prM5D34zET363sVOZlx7ljMOzRgUjNEzKScaXCpwzWELjtJaAQvzNwEpkXSNCtGfy2FoaAiDA4OYnJjAyNAwBvv70ZvLwbVtDA8OYWhgAI5lwREcVqz4onPNTbtKq9sf4/HjAoAd3ZLOfDgNYPvwYPN3XwHVRoBavYZCqYS14jrW1wtYXFrE2toaKvU6bs4v4JXjb2BucQGJlGlT77gu3IQLkTKd6LhlwYIZHEIJBJCQMlo8055O0pZzaYQJ1hxg4m02viW67b3YSDNPPpJM4rqy8U+s7pi8TDQXCmkA64V1JGwHfUNDSCQSWC2V8DcXLmSeYey/+aTG2J889fg/vjk2doz95E8W9Je+BFy60sob2oTYYCbxnddO/G5gAygAmMW743yI9xaxCjkEwO3rw9Uf/Sy8/fuB9fXunJBut2K3/tpRCqNe55iYYHjiiXAnYD11+cy9k7NL/935C9ef+OK3X4EUFiantkK4CWjG0AgC1BselFIm15lZZlJvrHxkf+P1L/qWw9/aPI1Fv22S/8A2NyAm91shDE3aR7NaCo/X2jSztyEYg8U5bCEA30etUoHXaCAMA6hQwuIc+WwWQ/292L51K6a2bMG2qa3YMjqOXDaLfCaDhOvCtmwkXRsJR0BElq1jrGk7u+Y1MgZs6Mtxy/2PLnlrf3/TpocAGn6AWr2OQqmEQqmI9cI6lpaXsba+jmqjjvnFRXzz269genYOqWzWCE6IopuWZSKt0KbCWnQ8BZhOztE6KLN41eTCMybMglMhmtFYFRVX0Kz97NtNe0spv+W9jiIXcRPB1i7apXQV9ycEA0cQSiwuLiOXTqNnYABCCKwtL+Hvzp/HE5b1xIMu35N49KlfUQ+O/PuTf/RJKzh+0VF/eMzSCjXEGTow4koDJp88AeAYgMomn6P3G+9vh1xLQNaBUAHhHYZ5zgAvYJhfEsmD91qp555Tp3btrA6GMn3/tRv7Js6c/2z54rlPX5yeHr94cwZKWGBWlAsdJXsxxuA4LlzHgSVEc+GJkmFUi9RCFE+MDrqZU9e22GRDusGdVPXmPqKIFo/CZVJFi0nAYFs2bC4gInWgViqhsLqO4toqejIp3LNtBzKpJPp68xgcGMD42BjGR8cwODiIkYEB5NNppJJJJFwXFudwLQs257CxmUFsO7c2e9FaaLqxbm3st2+WAtLaJi2AnrSDMO3A68uj4Q/D8zxUa3XUGg3UfB+Lq6u47+hhXJ+bR6FcxsLSMmbn5rBeXMfa8hLAOGw3gXQ2i3Q2g3QmAw2Gaq1mUnsYb+WQ61hliM+hFW4017ZJWhy7gybF4nXyunlxcYpLHFZsry/LANhuAgoaxWIBMpAQmQwy+R5wxrG+vIQ3zpwVOxh/7HEl/5/nPvzB3z2eSf/F+HM/gdSVop4++TyCRhU804OeH/lFqEoRhb/83eabIvDuUcgFNu/aRxBvBQHALpTB/uJ54IULQKP2pq/5rhIEsNNpTO7YhcT4EEquBtcadcfCaj6JRDqJVL4HpYkJ+PmcUdJtK0wxBzsbHA/dnP5k//kLv3ru1OnDx86cRbXhITuQg5NKIYhymzVjcFy3eUilTDk7DdXKXGgvWg1sMK1tbmxTCLmditDSVDbaCcE4bMuKxjo/su0Crm3DjdTtwPNRKZdRLhVRKZWQtG2MDA5geGgIffk8+vr7MT4ygvGRUQwPDWF0aAh92Qx68z3IZTJwbQt2lBMvNrmM9vGhHRmlKkYJGfG609a2m6TzxdY8tkN514F0HYzmc/DCETR8D7VaDY2GB0+GWC0V8eCR+3B9dhbFahXzi4uYmZvF6noB80tL8KUEEwLJTAbpXB7ZXB5MCJQqZUArWMKBZgx+lEIDDdiWKZ3ILGYWsGoNJW9noVvjxOZbtFKTmgWG21OUNCKF3vyRSqbAOFAsFbFWKqEnm0W6pwfM4lien8eZK5cgv/hfe/ZV67/58LPP9vHJsd+bPrK7MjvzmIu/+CPZtwpsA5CHaaCI6Nh5AAcBXAWlr7y/HXKRBNLjQCoD+HcIXUoFZDgwsYPLZ56SjX37pASSY9euH935xsmP18+c+ZHjVy9tvzB9HQFjGBwZgWJAvVIzlT/A4dquWVAiOKQMzcJKpiBs09hGM33LrPz2xMl3bw2TBcE6lVcAkBpSmnxrJhW40rC1wFCuF72WgwN7d+OJxx7CQH8P+nry6O/rw2BkMDOOg0Qz9711VjIKeYXR2XLW5mS2VUxpwqI6tIjLU7XXHmdxLk9zWxMOhQlpag3GhWkKIQABhhRnSCdcsIQL5HPmnADU9U489sD9WCmVMLe4iBszMzh74SKuXb+O6Rs3sLK+Di8IIOs11LVC2GjAdlxTVsuymuE8rdBsR4zoseZp3jYR5M6Y9yZy5qNSWG2rd+KNWlaTcZP3DsCyHCilUPd9iFQKiUwG2TDEteUVlE6eyjxXb3zkkMX52mOPL+x45CMnEnNBvRqU9dyNE2D3P4H8Z76A8PwJ45DH72HbT7eJezQTxHeCBBCWSsDXvgITd/lef6rqsJIDGLuvgez+PVjMKlhKYT3tYm28Fy560dvTCy+fh8znkYZRE7eulQefvHTlSP/J4z9z7dSxJ751+hQWyhX0j44imctDAcZuSZPCZttxExvZzIWOTUcsbihscMCifzfTWtuffytwAExwCOY00zJ1KFH3A6gwgPQDaCmRTSSR4gJTY6M4uH8fxoaGjCM+OootW7ZguL8fOcu6xWHZ7JxNxk+UGw7dtKvt5XmhTYoIA6BYXDEstqsbvNJIJgnDsDnWCNGqDuYyhoRtI2/bQDrTfKkE8Pi9h7HmeZhfXMS1G9dx9sIFTN+4gSvTN7C0toZqw0MIBu15qBUKYJYpScxtDh1KI+gpmCpsUkMyBduywIUFBg4ZBFA67KgpfzcYJ71D/mlz31t3tz2NUlimsozr+Kg3aihVquA9eWR7eiFsC3MzM/jW6VMOLxXv2c3kTx/9yEeW1cjoi7XdW+btew5g2/Wb2A0JH+C++WyoAMYJ3QmTukIO+fuZRA8w8jCQHQAadwiYlOvA1KDGZx8JGvcf0Eta2x8+d2H3fSdOf7y+uvKj5+Znt1yZnUVdhsj39yPbk0exVIJXbyDNBSwmgGgBXhAEADS4MPlktm1HCoIHoC1s1CYdt+quxKp5KyTVsb46Tgu5neXUrfwwyzX50tAa9UoVpfUCymsFsECiN5vD3p27cf/hI9izfTt2bZvEQG8GuUwKqYQDO0p3iWu/hhpRbmJUjQUMlmXBskR03Kjhg26d68bKJQDAwW/RYljc+aAjNsqad4KLlhqtpIYKtXGIOQe4WVHfHryzGUPWEkjkcxjOpHFw21Y8cvgQ5pZWcO3mTVy4cgXTN2/gwpUrmFtYxOz8PNxkCuO7d8PNZBCGQduNjnfcCgcqBrC4ZGSber55n9O2DD7dUsEFN5VWpI4mKcrUKwDn0AxQTEcDDVCrVqA1kM/loZVGrVrFeqGIlOOip38AgnE01gv4yrVpHHj+xWc+15C/M2eP/9+XBkb+/L6f/b/CPdCPa9sn4a8MQn/x6m0+OATx/QQHkAbg4ns/3RTQSCNwHASuQGhxQClIYepZy6g0ns1NytiWdaBn5gYm5q7dP1Er/9OLV84/8M3Tp7FSLCHf34+R8Qn4SqFQrprqHFoD0qQkxospja0VzfVJWqumQt4ZWW1J3c35v24fd26TcneLyB7tW0nUPYmEaxb2W5aAV6+juLaO1ZUV1KtVJB0XW7dM4d4DB7Br+w7s37kdYwP96M/nkEunTK6448CKFuWH0d6VVNHidhZFz1pRVc5M4x7NRXN8ZNAwbRgQbQOTIhNfJ7v1/FsXZeqC2/F4Fj2mo86bcSPMZqfOtnFNAOh1HKRHR7F1aAj37bsHq6Uyrs/P48r165i+eRNnL13C9M0Z3Lh8HuAc47t2QbgJePWGORznsC2T784UoKUZ94QQUKHcPBLbvJRb3WwwRBH2VppMR9LOhvfXZJAyeI0GgiBAJpODbdsolYtYXV9DPpdFT28fhpXGytwsXpmZQe0bzz9wVKv/76O7tv32Ljf9u/i1fxTqbL/2/sMfMgCObQ7uITr2u0X46Tbvb4fcTgG9U0B+FKgXAa6Aag0o1tARi2swAZ1lGB4LcwD2zC317716/VPBmdOffePm9ZHppSVIy0LP4BCSmTTqngcVKlhMRAX+zSIdHuWrxdU8pJQQlkCr31gbG1LAWFs5vFaciUVG1jiEzdrZTTW5We3V7F1rM8NNOKhWqlhcXIRXr0OAozebw459+7FtYgu2jI1j/64dOLBrOybHRtCfdsFgPiyd82c0F71ohqh0ogkcWu0VY1iHiWtd3y1Rwc6UjVuDhrdqNc0KAcw4yTpudRnbFt0prltmYyQsy6gRAAaTSWwZGsLebVtxaO8eLKyt4szFy7hw6RJmbs7g5vwclleWEK4sI53JRGUUXXArGkRVW/32yDHn8T1/M12p7WmtFKQGuCVaEQx96x7apiiwhKliEPomCCiEiJqAAF4QwkmmIBiD7wW4fuqMFd6YOTR4/5PP7Drw2Jny+MHr9v4RD/0OdFEBQQCC+P4nNj5vL9L4ncER9as35UyZNpVm2yJrDKZlvQUgyYADtcpHMxfP//ypi+f2vnHuLFaqVfQODyPX24dqw0MjCEzDMCEiR1wjDIKoG6eI1gmpqKGZcWLjWuAdgcfYkG9unFvWdxMfvv0Jxsy4YAsLmUQCYRCgsLpqqnGFIVzLwpbhEYwOj2BifAwH9u3F/t27MTk6htH+fqRs0VxQ3tx123GbKRYsFjHaTmOD0H1bdX9jeuCb2WqGKCyKpsNtRHXWVN1bd641miul4ABI2DZg2+hLJDDZ34cdE2O4Z9dOLK8XcO7yFZy7dBmXr17D7MI8Kl4Dq3PzaHg+3EQC+d5epDMpKKXQ8DyEQQCtddQEr1VSsv1mNe/XrW9jfPcQ14QHTAqPGUI7u5TG0RQGmIIKUkEwYUo2J5MIZYi654GVy+C2hZ7BQTSqVdy4fh3hysrwfY889NkHnnimurBlx19c+tm/t3ZjKAv/L/6M6ZtzjGEAQA0Mphzi8u3v/vuG97dD7tWA5WtAowQ0qoDiQDoFjKYAtFRPJCEwkBBw7HBPtTLxzBunng0uX37u9dkbE6euXIGybAyNjSOVycALAhQLBQjO4SRsgMXduHSzU5fSCkFUwq9Z1J/FineEjpw6HjUFiBZxdKQsAICK2rszFgeYmipGZC+i/WkwLSEkIAIG1Gvg9ToSUmJ8eAiHDxzEA4eO4P4jRzAxOoKBpICDZunTDsNmFp4YxduI0VHeNO9UvNtnFKx5MhtDYu1bxs142hSa9l1thCFSB8zx+cYs402MkYZpsIN4AhHhABhOpzC0bSvUtq04vHcfbiwsoFAu45Vjx/C3X/oS5haXkBDCLLJpKGghwCzbLMDhHCFjpoRl1D0NsbGEUSTapxGt/7cmH3GZR85gOsB1XARre50ZRZlmSDpJaK1Rq1XNRCORhBVVKyhVy0i5CWR7e2GDY+baVZw4dQof6et57ODo8GLFGvy6rmdOgPdVolnTxlHptuMZQRDvCEwDkCYYJqyqt1utL//07PWLn/jGsWNYKpUxPDaGkcktCLXGzOwcFAA3WpDOwCCDAKFUgJbN9UKAsZXxRL/Ven7j0dEhBG32dDu67f/GButIHDILFQWAwPcRVqrQvo/+XA7bt07h4P79uP/IUWzbuhVbhgaRsURzihRXX4l13+bYBxbZRgazanMzpef2Z92+6caXbeq3brzWSHAxhzb3Ne5uvdletFaQYQiAgdm8uZBUA8jYNtKDA9g+OIA9U1vw0JEjWC9XcPb8ebz08ss4eeYsiqhAQcMKfFhhYDp7y9Cch+DNSLDWcb33aILC297GTWZPOnIQODMRXRVNNIBIWGu7jo61XNyUoKzUKrBtG8lEElKFaHh1rKyuIZtOobe3H4MDQ5ibnsa3Ll9Burfv0fzYtoRa9+vFZx77L1ceO1quralQ/59/JoABBszpjmrk73Pe3w756k3g+f/DfLkDCyhmgZ/+LPCLnzBBlWrdbKe0n7Qtfq+VwIELlx+vXj7/j86eOLb70twsEj09EI4LyRjqng8pJWzbBmMaipkC/5rHH2zVtDKCC3C0alXrKF3D5A2rZqMAS1gIpYTn+wilBOcCtusCMLVOZRDCEhZsx4aGRigDhFFNc9s2HcWYUgg9DzIMsDg3i8LyMkaHhvH4kaPYt2s3Duzbh6nxCYwO9GMgn0PC5s0wUqtVcSvVhMdVUPSdDdmbtzdqPaYRF27SiF3r2EC3u6/tv2oAiBzX9kWuG1X8jcfmvGWg9Sav4QB6kwkkJicgtcbk4AAO792Lsxcu4tS5czh38QKmZ2cQaCCVy6F/aAjpfB4QApV6HaVSCaEfwHVc2LbdVLFNSFmBczRr7EKZEHIcWuZMABqQSjZnVM2WyDpus2G6qnLNoKXJNXcitR/KLPQxCooNBY2a74EDSPb2YNCx2bFz5w5WPOk+9Piz2yec3X9wSeMl6SmL+aEFs/g9viUWzCe269FEC+93Y0V8PxO7UyIMHeF5oizs2mS1/tihUy//P6a//MUHTpw4BZZKYSifh5NKoVCpQGoNy3WNY8ij6ksAwAFucUDHCmgzzAoN09nRCEPCpFBqBcFNF0qtAClDIyBxAds23zoZSoSBaaZm2w4YMx01w9CMNZYlYFvCqO9SgmuN9eVlnL9+HblUCgf27cOenTtx+MAB7JjagsnREQz39SGZTCLR5tR22vzWg5pvrtq3P3Rr3HTjhrrt+VYn5lv2usGHbd5BYUV7aSnSna+OHV4NxnRUBSsWVtrPrvOIWceBO9CPif5eTPX34v69e3Hm/AUcO3kSp8+fxaVr17A8exPKEkj39CLb0ws3m4ZmDHXPg5QBEET1yi0By3LARRQpCQMj8nBT4ldrwI+awQkhmpHcZnRG36Y8RPQgF3ENdYUw9KGhYXEB5ibBINBo+PAZQzKbx9jWHTh24TLWK97+D33ww781uL7XqU6M/iH+1T8NsHULx//0v1jw1iRoeVCT9/cY51WB+YvRHxxACmBVYMdQ9Fhvc9OEF2QOX579UM8rr/7M66dP7rt08yYqYBgc6AGzbIR+COn5QKRCmNlw1AiBtVqq60hzjhfvKbRUima6A+cQUTjJ9z0orcEZ4NpOVMFDQyoJrRkcxwHTDGEQQmoJJswKe84BpULUa1VIzwOXEjYDRvp6sGNoCEcPHMAHn3wSh/bvx7bRMTgbrFIotSmFyyPzpnUzRNjklkovm8urbwWT7XdrLvlteRsH2bA+tO3YrbNPcIa044ABGBkfx8Hxcdy3Zzde27ENb5yewrGTpzCzuIhCtYpqoYB6vQ7uumC2jWQyBZ3Q0KFZcBpI2TySSSeK6tzGEQawppIVd2Ez59M6Qd38H9oiAaZVNKBN51QgqqVrjhenQzWkWaHvpEw9+OlLl2x+7dL+XRMj44OXxtZ3C2dJjPUsFw/trYlvPODI6RMh4L0rVPH4SoswZQ/JchPffzAwKRlv1Nn6tknP2ro1t7fu3bf7zOmfKH39i49feOM1frNaw8TkJNxUGn4gTVokGGzXjZawaGgt470ZFRlG4NEbnEatjX03Jr2V8yxlKyXDsljkdEsoaYQkN6rcEgR+s0KXbduwbAtam0ougecBMoTDGLKJBPbt3ImdU1N47MEHceTgQRzasxsDmVRnOkpcjQxoKvi33J/bRDujYWnT5+PXdlw7WgrxHV50x111jh2bm0kdBbM5j3p9xNfXNllg0ctNSoupadXX34ut/b3YMz6Ce7ZP4cTZHXj59ddx5cYNzK+voa4VGtUyPBmAOQ6YEHAcGxBmESu0RhD4EEq0xDPARE1YCMZEc21X65w6pysbr6N51SzyAaI1UyqqTBdX0wEAzzNpjwk3iZ5kGotLy7hw9Upi1+nj+3onRz//gGMvXRgeeLn0Y58q4HrBxhf/E8PylfY7/CYxmu9v3t8OeQeRQ47Eps/2+I1x6/Lpf7R46vX7L83MQrkJ9GVzYJbVbFbDYVI5lArBBDM/TecqlpN55Ji3YkTti23iBgkcQOj7aDQaYIwjmUwhlUpBM6DWaCAMJTi3kEgmEXgBqpUalFZIplwk3QQ416hUPJTX16E9D72ZNPryeTx8+CiefPhh7Nm+HUM9PehJJlvOeJul4EwDLJo8cJNZtlnnyQ7awmNxbt+bOejthkCY4aH5+G00kY5SiW9Km6G/87ncWuldNkO6xlke7e/Hs488invvOYD777sPx0+fwavHj+PEuXNYXFqG5BwDI8MYGR+D6yZRKVVQq9eMIhENXkIISGnKgMkwBGcMjm3DtRwAzAx+bfe5M81lM4UoHiVaxjW29E2rFiVTBkoh1BqDY2OwNdhrV672HPri1z72iXKjfu4jT/zxuU98+Fx+Jsyu/fm/Emr65QCtNVRdg0cnsQzjlBPE9x9Gc2WM2di61Wts3Zp/7MWX/onz13/98b87exYlxjA0PAzhuAiVkXSE7UDEymbcMr5tf80v7UapOSKI1py0IngKvu+BAbBtx7SIVxL1eh2BH8C2HSTTKYRBgEq1Ct/3kUgkkE6n4Dg2GvUaasUi6tUKXMuCcBwcPngQH3j6aezdvh0D2RyGBvqQT7rNRYRMa2gZN6RDW+rmXd+2lkfeJhXdUczRiFI/N6RjxC/chI3D423PJU7dYbc8YR7fUH6rva67VnEUw6SG5NIp3LtvD7Zv24pDh+7F2cuX8eqp03j99GncWFhAcX0dTiqFTD6PTDYLyzEVdby6h4bXMDn8tg3XdcA4Q+iHCIIQwrKRzWbBGIcXbXfLuN5c8Lv5XYzXHrCo70a8fq05yWEMgZQIQ4nRiUko38er0zfwyBe/9KEPlqtTxWee/L+UDu78Ev7on0n8UhH43d+Ji2jFAZKuR2S7BTnkd8GD64VnDr3y6i/OfuP57ZfPn0VVKmQHBpBMpdHwfVMOCboZymKCNxdWxk4Ri+rhMR0HytrSKbQG54CTSEBLCd/3YEWdK1030VwA2mg0gCg0mUgkoDTDerEAxhhS2RRcxwaDhlevolwsoF4pA1JianQURw8cwL379+PBQ4ewY3wcfek0LEQLZ7SOZtcAOG+WQ4zLI4K9efdJAGiL5CG++JaTe3tr17oXG+KPscyw4eW3pKK3v+bW3d/+dPUGhzeyym0VGqFhWhqbygcCPbaFdH8f8tnDmBobw9aprRgbn8S5CxdxY24WjVodC1emkcxkkcpmkXAcMAaEoYzSUDSEJcC4i8CPaslCQ3EzFdEyvmcbG1q3LjA2lG81OBArItl8Ho1yGeevXIFbre15sK/nuYnhvtesXUcuzvz9j8irmcvc+68Nh3O7zqJw5/ccZpoelWdnsTY9jer3/gwI4h1DcwYeBLBLNViVapLt3aGDD36gsX1oeOi+b7/60crXvrb72rHXsVAuI9Xbi1Qma5xxFUKDRcora+X/ao1WbfHNex3ETqcGg2ubMqmhH4C7DLZtRXYqQBAGkHHlDs6QzmbBucBqoQBojWQmjbzdA84AGfhYWltBrVSCCgIM9fVh944d2LVtKx4+cgT3HbwHw/194EojEVVEQXQeULE/3RpnNqrQHefe/trmY7Hqozdse3vrGGe/dO5TA02n+NYBplMNZ7e+tumUIkrp6LwQ1jzP9l3rzr91FC2QJvrgCgE3nUJq5w4MDw1iZHQMA4PDOH3+HM5dvoyVYgHrCwuoFYvI9/QgmUohmUpAWByNRsOkEwkOx3GQTKdhyxBKKlPTPD6VDZOSdmlad5xy6xkGFovlbQJQxw2B0ibym87m4NdrWF5YwPHTZ+BpPfGILT7e9+zTC6/29p6Vv/arErksx7/9t8DSUvSpeP9CDvkdEADy9frgtlde+Xz2r/7mR18+dw43anX0DAwgnUoB0Ah9Dwom305F5aZsy2624N34adUbv4zN302YMZAaQRCAA3CcBETChh8EZgFoEESVTOKmxxpShXASDhIpFxYD6uUyyuvrCBoNDOd7sG1yEg8dOYIHDx/Cod17MJHLtpU5ir6ASjWNAG8vqA00U2Q2qQNzC2/VQWy/DaZVfHP6Eq0cjXZ616rJncXcN91Lm4JhjE1khrWZEAEMOkoNGXAcDExOYKx/AFu3bMGVa9fw+vETOHHqDK5MX8NaqQw1OIhkJo2EbSMUAoEMIFUILhi4JWBz1xhHZTqobjox+Q5p12Ti99CyLTBLwAsDXFpZQur8+Z17mf2Jbclcyb5n17HcT/xIUBhJW8HZM5YqFgPubh41eidhnMNKJOBBozA9/T0//neJuxLX3sa2xHsZDbBQIsxlUB4bhfQ9eDu3i57tO+wDly5+YMdf/eef/sapkxNnSyU46bRxiC0LXrUKrTls24kUVW0EHh1/u+8OBpiGPXEZXm26R2omoMMQQRiAKVPPnAsBYZuOkdVGDa7joDedhOs4aFQrqJSKqBeLyDgOxiYn8MChQ3jw8GHs37Mb28ZGkbWEqfYerTmKZVDEaSO8parqt2H2Nh0aNjjo7V+t1nAS37e217SHXjd+GzeKTZ0vbPvZ8KKOc9Adr+q8EPOjlI46MUeiHWNwhMCW3l7kMlkMDAzinl078fqJkzh59iyuXJ/GSrGAUhhC9uSRyeXgui4Y42h4DUglESoJ13Fh2Q6CIIDn+YBSsKw3c/9aUdbN8vrv8DJomOpBXDDYrg0n4WK6UkHj4gX3I1p98ohtVWYee/R3Z3fvvq5/5me19bVv2NbSkuIDo3enjkf3x68UEdS/f+QacsjvwJZCcctzbxz/zOpXvvbAX585jYpSGBgcRK6/3zSZqddN2oFlgXNuHGnBYdm2acYQhG2LNnHrzDiCwTh98f6gzRczlNKsXOcmR4vzqMyeVCiXyxCWwNDwEGxLoFouYXVtFeX1AiwwTI2O4fGHHsIjDz6II/v2YjCXRtZNIAAQhgoWM6UJ4+YzjEUdwMSGCUTUrEfr2JjdIXUlVpYjZZvdTsreaM/Mi5qtgM3LTZ1y3l67ijU3NYPaRtmEoW2D9rvLNrGAHbvsfB3rtMZCCCREpEgpDV+GCBiHbQmkky7u2T6FPVMTmBgeQS6ZRcp1cfrCOawtLSLj582iz4QDL+So1uvw6nVwy4LtuHAcB0oq+EEIBsDiou1cb2f1YqW81dphU0WsTelvD9E2vAaEEBifnEStWMD0zevZ4Vz2p/ovXgoTlnvuoT17KnXlW9++cCKzVlquJ/J9jU12/47COINgAXh4h4Zd737iee/dDDLxmGcWBRDfv2gNq1ZHdeskrn/mGfh9+frwypr7sTNnt9pf/9pTL1688OhyvYHe/n5k+/sBIVD3PARBYBbscWaiskqZakxMd6Rc3OrYRsqGbkkqQWhSVlzHAeccfhggDEP4YQDNAMexjW1SyixSD0Lkc1kkE0mEYYhKsYhKcR1BvYH+bBaH9+3HfUeP4PH7j2LH+BhyqRQ4GPxQQUZjDWvaLbQ1p+Mtu64ilTmyVXcZl70VM6BuuP7OxzZ2hWaMAeIWt/M2bBh8YvFq40C18fd4u+Y4pm85HBdmvA/DEL7nIZASXFhwkwm4toWd48PYOjqIyZFhjI2M4OzFC3j1xHFcvn7DpKoohUw2h4TrgFsc9XoDXsNHGMrmYtx4VtIpsXWanHhUiT9LTW28/b6ytiEzfl37HEcr1L0GLMExMDKESsFBtd4Qr8zNjO1+/djTP8L4+a9/9EN/e7qnd3Hg/sfd3syEcia21pr35g5wywYYw+y3v4Tls6/dcdv3EuSQN5EMKFk9tZVwfKUIkU1j4uz5B/k3v/m5uTOn752rVtDT349UPgfGOerVKuqNBoRlmQY70YK8UIammUvTA283Q4YNLm/zXyUlLGEZoxeE8IMAPEpdMU6+hAxNRMcWFizBgDBAtVJCcW0NjUoFQ7k8dm/fgccffBBPP/Iwdk1NYtg1dcRDqRBq44x3hO3aC6l2nFesVmtAyWaznTeFMWPwVFsOenvaS4cx6/y1fbHP7Wg3Ei2l36wo10rBtmyj7GuTbqK1KU/1dg08g1m4YkQUBa5h3melYFkC/VFNc3fXDuSSCRzavwcvvfoaXjt5AvOrK1hfXoJwHLjpJJKuAy9gCJWCDANYlumohzcxQLe5E3g7vlu13kDSdTA0NooVwbG2vITjZ0/iQMJ9elsi+cvJnWP/ftaZPLVQeDS7sj6ApBuXxfruKfdvCuPgMoVK8C7u3VYuAzt2AL/yK0B5HUhlgWQSeOEF4KtfBTZ/c+Li1xrlMtjBg7B/+ZcxdP6C7G/4UKUitu/dA61U1ISqhYbppOELBiSSYH4KQoWcpVwz1woCxsKQQ4TQIbTmtkTSVTLFoOy3eY1hyLC+bsGy3hXVdt77MEApxkvVVKi08vt762kA++pyy8TZ81+4fOLEc5fn52GnMsjle2AlEqg2Gqj7PrhodeBU0nSaFJx3fCvf3BoYpTbwAwghkEwm4YcB6vW6qcYRNaxjgkeFAxAVFLCRS6cR+j5WlpZQKRaQTSSwZ2orHnvgATz18EPYMbUFU4MDyETN2qTWkMyMgLcEOjeKLIjselOpZremldwGs5A9asbGWadodBvx6O0l4bX2JcPQLKhnZkE9b2sytJk+fssDum183bhZVGEtnrhoxgGlYXGGhLDABJDYOoW+XA73HbgH26e24vmXv4nz166gVCyiWiqb3PJ8HsmEC+b78HxTCtO2bQjbNuma8m6yQ257NbfdPJaHNDPNEMEZ3FQSSZVFOQxwaWkRiXNnDj6WTv387i2TBTG59S93//RPMP2tM87ymRsaUvosk5aIKpdB3XqewnEBxrF64fjdndd7BHLImzgM2GIN6Wzw8OVZa1zW7l959ZUffPXs2X2zfgO5gX5kenoBLlCp1VCr16E1kBC2SVeJFmRqreEHgVEjWCvxYaOO2coQbsmYgnM4jg3XTaCmavB8HwJm4Q1nAjKIyio6DvLpDLQKUFhchFerIum6GB+fwH0H78XD992Hx44ewc6hgY6adUGkwtqufYvBak0LOqcP7SI3A1oz5Ha1Gqw1846uWCmJUCqj8GvdagnffqwNJZZaeWmtUJlGZ1KZaYPMmvlr7XXSQxk2my0JGOVIKRU57uxW47xBSG8OCJtsFA8qgjPA4lCBQhAEYIwhiCYpuXQS9+/ZiaN7dmLXzl2Y2jKB51/+Jo6fO4vK+iqkzKJ3aAjMsdHwTRoSZxxcWJFT3nYyd6Qt9Nn23txyTe1704iu30ReQqnAbRu53h40ahVcXlxC+tzpHdtHhn5teSBbvFjZcnWu90N+fXXKK1YvMSPDbZguvdUqBW8FJgCVAYJL79wxvhO0BopF4N6twCO/3fmW/d7/Brz0EqwgUFYqDWiFQAhIzpmlNBelokYqJb1KBUgkkPyt38LOuSUcunyNJ0vrXFSKXAY+C/yAc615IghENZm0Er5vJwREqiYTrNRIqlIhGaiSq32bA5qxUHKuQs58ybRkCsIKwXjd4qmayxJlnlYNZTtwgiBkpiP7xq9Z/G/8O+A4DJOTFrJZ1SzjQXwHaEAIIQd7U95gbwMAHlqu5o986/gPzF248Plr6+uDUthIZzNgroNqo4FaowGlNRJuApbtNBdCxnavuRbmNgHJmPhpDaNGM8Ei515GC/44bMe0R4/VWVtYpssmF0AQoFEsQtdryLsuDuzZgycefhgfffop3Lt1KuqYGXVdDKXpbilEK0Wk/UTQGndaLl9rUGGdm5lxpul0847rVEojVApgANe8Y3FoR0JJp3zbPJWNskbsJseOfXtt9HhEV0rBD/ymCeRRBLWVSd52qbd7M5pH2/gUM2UoOQdsG0pryKgqTshNsYSkY2PnyBB2jwxhbHgAw8OD+PrLL+O148cxu7CA0uoqHMtCIpVCwnaMGCejtVCRUh4ov7UmtnknbnOamyjom10f2/C8ZgyhVqh5HrgQsDNpFCtlXC+sp3vnZh8bOn7y9LZE+oLz4KGFa7CC4pWZJJiQAr7E/HXznm8yznDLXINfKdzuDr8neT875PEk2XzLx4eA/9tv+uqZD0MW1lwsLf5YZfbGj9+cm7FDy0J/fz/ABeptlU9s2yixMlJLbduG1GbRBGeWqSndTmSYYhGAo9MoSKngeT7CUDVrhVq2qb4RBr6pN+3YSKdScG0bxbUK5q/fQE82jUP3HsKD992HR++7D1tHhzHW0wOugUbDBzTg2gKuZYF1KCodrYTQcnNjYxiH2LhJZYmNnDY55zJqlMCFgBAtJ18DUQ110fGFjScHCqZyRshY1HpYGRVeKkDKpqOuGTONC6JzsCwbCZsjCVMqKj6WOV8O23IhhIzKeJlnYkPZ3s648/3Y8ECboWy64lpDy8Ck0HABwTlc24YtWvczbp9sRa/fs2UEmdSzyGRTAAfOXbiA9XIZRcZgp1KwHAecm3um44WTCm0r8TeHbRg+9IZ/2eZ2tWMr2zKf05X1NSQcB/mBAXi+j5nVVbz07W8njwTqw7sfTl4//ev3/E39L9Y8/JvXHWgWIJ9RyKVbBtLmzXr03100wGzA7TXddN9rPPccxMQk7lkqYe/8AkR5Bd/avQPXxib1PTPL4a6rV6CFxLd27MAsgCoAX9gQiVQiGfgjtpbDMvR7Ldcd2h6E4589dnwwcKwJ7vt9XsPTslBlKNWEblRFuVYS1UadSSXN5A6MWVGKm2M72k5l5UA6Gz6cToQPJC0F27GHfH8hn0pdsJKpEue8JDlbC4S1yJKpJZ1MrSjbKTYAGQLAxITCb/92HTMzQK3ZwIOh1cNF4z2ZZmMBsPG9i/rEx1niOtcvaj/7XL326WcrADC2tvhzqesXf+XUiRM9y6UKegaHIFwHdS+A5/vQjMF2E+CWZcaaQEIIAQbRLKN6t8RWzeQZM3ieh1CGsG0LiWQCQgiEYQDf9806JjeBhOPCr1VxfWYGFoAdU1PYv3sPnnjoIRzZvw87xkZgw3wYlNJQYdxHY0O5QnbrebQ/yCIZnenO1BEZyqi5ngITHBazmvacARCCQ4hO+97+oWyOOYxBImp57wdQUQ315jZNscmMNa5lI8kBm7UmGhomimtZNrgwH/94H3F6J4u6VW+85o3X3l7aoblGK+r6zBhrNq7jiLqBMmZmylElrrifxlhPD55+8AH09vSit7cPr71xDJeuXcPa8jKcVBLpXB6ZZBKaCyPGhMZfiTtxasAIiNH5tIuELckw8hOix+4cYWglUnLGoZRCpVaDbQk4joOegQF4tRrOXLqIwVT6J92tU8mvTY3/1sWDu28Efz/po39Asr/9r8A/+2fA/DyQz996hCjVqb62dMczea/xfnbI44kwx9gY8KOfVvjkh5AeGJ7IfvniD82cPf3BC1evug0NuMkUmO3ACwL4MoRmDG4iAVvYUDJE4JsqK07KBdMKXsOIT+wufZV4GyEElDKLOoVlwbGM4QkCYzwc2zFVO6TE0tISgloVuyencN+9B/Dsk0/ggaNHsWtkCAIAUxpeEEJLFYU1GRiLBTDeduzNZ/RNBzZaxW/MRUtV180fDnDRTEmJ5bWGVKgFAUIp0fB91D0P5VodhbIpBViuVlGt19HwPPgNDyoMoYMwcshV2/4BcA4hLKRSSfTkcsil08glE3AFhwoD9OayGB8eQT6bg225iKu7a327oODd0BFf7LxfSoODNeu5tiv48e8ZzrFnaBDOIw8jnU7h2IkTePX4cdxcWEC9WISdTCKRzkAIbuq9KwWt2V1/Zt4W0c2wXbO4Z71QRG9PDvlsBv3Dw1iencXxCxcxxu2nR7aNl3YeGbg0fSR7onb1gOX3OqEqrADnp42rphhQ8YBARWULvptwgEnACoG1M9/lfX8PGJ8AH5vAWFni3hs3YS9cw8VdWzE9tQ0jBY0DN284dnG+t+Ek+pMrq2M5z+sduDGTX794qXdhaWEorJSHGEOP0mrQ9vzxVL0xaEMnJQDpBSj7HirSh6cUGl4Ar+FBKd1cb2IcFAFbCFOpgTNkhIUUt2FzYN11GzPJ5BoYrwrOi8y21q1kYtHO5ZdFJr+ettj6zoSopF13ftW2Z/nevcWgt3e9urhYWwVUY2hI44d/WGJ+XrNkktmlEoJ77+32Xb8rjEOlkEcFEh6C71lRh3ginRSBswtX7jlQyTI4+2bmj7Djx37gytkTW2aXlqBTKfTlsvBDicDzoDTgOA5sx4EKQwS+Dx1KuK4LiwtIKd+WveCCt1RewU0uedThNwgCuNH4YzGG6vo66uUykoxh3/bteOqxx/DQ/Q/gyN7dGEgmIBiDH6VUAMbRNN2b786YsfZ/jRLTekCbPzUDdNTcxnQENSgAdaVQDwIEUpmxxjdjTblSQa3RQLVeQ91roN7w0GiYBnlBowEVmJQwpTVCbcpJci7+/+z9Z6xlyZqeiT0Rscz2x5v03ttKW1kmy9tr2pLsZpNDrwHBgUgBxEiQBGowEEfAjDCAfoz+aCgJM6JIqGnaXVfe26yqNJXe2+PttstF6Eestfc+J7Puraq+1bzdd6KQmaf2OWeZWLEivni/93tflOOQ8/OUi0XKxSI9xSI5xyFuNakU8qxZtZKB/l5yntu2mu+Gth6UqPhF3SC6v8iGStIp8JTKBqAyrbPKNjpholFCsK6nQs/+PfT39bB57Rreev99Tp07y1y1St0YKgMD9hkLSdBlYPjzrkdAew2Frn3fN5juhZQkWhPGMUYYXC9PZaCfRWO4Oz7O5XNnC9HIyBOyv/85sWP7v1/cuXEegMESjF2HxUVY/KsVdP+89usekEvA5Z/+04T/8r/UAOUbN47337jwvz975tTqa5PT9I4Mg+NSqzdIDCAUvu/hex7CGOIoVeAQpEUidjEURmK6dUcfmKLKZhwAWySojSHRmnyxiJSKRq1GGAQoIch7LkpAdX6BO9eusXJwgN/53vd44cknWDM6ykBPCQzUWyEmSnCUIJ/3LHpgIAxagMHzfTJ8vrNX76Dby93HtLGKMVJKhJQYFEIpVFf9YZz+CQwEcczE1DRjExM0goDZhUWmZ2eZnJ5mfGqK+YUFpufmmF9YoN5o0mw0SKII4gSRWDzDYCdgpFUk8VyPUrFAf7lMuVDAl4KcUvSWSxzct4+Hjx5m68ZNeKqATlFtm+rL0AbZhvMeHGo/OGFni4wESrmANWSyGvAST7rt3uoGaAwQpX9WDA3x3COPsGXjRvr7+nntrbe4duc2zcUanuPjSRclJLGObPpQWfvr5WnUpbJTnTMtT7mapT/wwJUg4/Qbo62CjzHky2WKlQrzrSkuVRdU/vSFfU8vxM9d2XS49fH/+qXr0xvQ+s2P4fTr0KhDJOH8FNQDy/P7pTYPqzp+AczsL/nYfzHNGENrfo7q2D3cmWmidasAVDA9WZqZHF9XWpjYc/DOraP7g+DxoNnYuLgwX7xz53Z05do1OTM7i1BKhHEikiSRNsEjUa5rMytpjUSWNfI8HymkLdAGm72KQquepOMO31VbSc9Ws+k36rVRASaX88n7vu6pVBgcGDD9AwNm7fS4Wnfzmt5dLH4e+Lm3Ez93IxgaPHN3dPT6e1E0O7ZnT4v/8X9UaG0k6JIxpuW6NPnVh8ljwCdmHbM4wN2/sDNnPbM/0eKppOqPsJnGgRffePe/uPTBe3u/uH0Hv1zBKVrjn0hra/riOJZigJVOjSPrXSCFnYtJecztOeBrIhBJYmVYtdH4ro/jurRaTaJ0ralUKnhK0VisMjsxQV4Kjuzby7OPP86BvXvZtG4t/YU8CdZkiMSAYwNx6WY8k/Rk3dwTMjR4eb/Yn7FOonbOFWnG0q41akmFdIydXwNjmJid4974OPVWi9n5eWbn55mcnmZyaor5xUVm5uZYqFWp1erU6w3iKLTBeGpDH2tNYqwqiErfp0I+T7lQpJTLUcrlyLsuecdhx+ZNHD18iD07tzM0OIAjrfCApUTKZV2/XPR3+dvR6YduWUSR1RTFiRV5EAIprSmTEDYjgLDZiDAI0ICfz1N0XXavX8eakVF6ymV8x+Hk+fNMzM9ZWcpEI13PeoxIueQKOpnVrutYcgdpXViKoBuxtCbLZD+bIkp2cyUsNQqrDCSkpRb5SuIXC/ilMmfn5og/+2z4CSP/yYBU5k92bf9/PaCjfm3adx+QP9b3nZ/iW7dmDRCCLf1REfyD4xNb17z/3rMnT3yy+ub4ONpx8QslIm2Imi3L9U2L+6I4RgFKObiuDdSiMEzpGw5GC7sA0iXn1B5mXRNS19AzwnLToihCpccKwwjP8yj6HkkUMj1tlVR2bNnM9599hh88+zT7tm1u8/e0MfiOwqRun5lTF5g2otuBIjrJJ5EFn93NZHbvoo2KdycTs1TffBAwMTXN7Xvj3Lh9m6mZGa7dvMm9yUmLWkQRzTAkiGJaUURkdJvvHRuD9n1wXERiA3JhrPWzcFJVGaOJtKYRJ5hqjYXFGrMTYxAFPHb0KL39/fT09FrNdiBJUS+7ORJ0knHct2Dd92h+bhNW1UBxn37r8n4TgBI2vTmQz1NYtw7/uWfp7+/ntbfe5MSp0yzOzJBUIio9feRcjyjl+CGE1YNPNxZtl9TsnDp1gJUp6Sn9/oPuQdx3g9bVVUhJpaeHJImZn1+gVCxQ7O0FA3dmZil+eXb1007+H5Ue2jsZbOCctr8qMKHBhBaySppAE5Jf9jQS2+Pyl1phBZnLo3r7yl5U3XR8eubRjXMn9nH+infx4oXexsTdYbEwv0a0ghGjpBMqKRomUZFO8IoljBBgtB3JWTF1WjwmlbKLv5AYKYllSg0zqQOfkBip7LjQCuE4yMTSy9AG33WFVyoKjEECSqBaScLk7BxzC/OM3b5FwXFRUu42Sg1rqWZHt22dHtm/f/q5wcGF2sjol0n/wIlmqXBxQsnqHaDBXxz548/bBOBi/qLRKAEonjuWeH//d+QWEYo9b53ZF1698tytGzeGp+tNVq9bi3EdGmFon28aNMVRZCl9Jq0nSucFi453Zu3lm/juU3fglnQKFAIjst826CQmaDVQUlLK5xHGMD81zcz4BP2lMo8fPcJLTz/J0f376SkVKXseDvZNtUFzd9F+14Usoal0X80yKCQNBjWWpihS4YHuMaWBWhwzs1jlzoRdayZnZrhy4wZ37o3RiqI0GxvSCgKCKCLWdu1I0j+xlBjloqSDRLflI6Wg/a5pKQmEQLda1OoNokYDxxjWjIywY+tWyj09FMvlduFlRnVpB+ZApkv+YKWx7s7pfjZdKV0beaMMXZP40j61FHNlNb/TTUzBcSiWHR4/dJBioUBvfx9vf/QR41PTNOoNyn391u8EQRRbTXs7l4i0ztS0efPpbSBM5z6SrO7rKwyZsm91jwMhBI7joo3dBIZhhHJcKr29zE1Nc+/eWH6sdOGhkTXrDhwbGP3D86O91Xnnlw3y/OVo3/2c9I9/7zs/xbdqiYGwZRBo9m1ntNZaefj9D/6z+bffefadq9cIhKDU24NJA0IjOmohRidWF1wqPNdWvhNDlIQYwHMd+3plZg0GEFmaqeNuZVv6UqYFJNrYorugFeA4DkoKXEeBTqhXqzhGs3XdGn77Bz/kr33vJdb29+Jnt5RGTb7b4W6bRGMSe26pnE4wvlwasOut0l2AvhECI0ELYSUTjaXU1JtNpucWmJ6d5dadO9wZG+PGzVtcu3mTyZkZxiYmWazXQUqk66JcD9f38QsF3JyPXyxR9HyU66IcB4WAJEZqjascpCMxAuIkSScJiIOA1uIiQbWKkJLRlas4dPAQhw8cZOXoCnwhibEWwiJDkcQy6HpJWxadP2AREQ/421G/+LXJNi5hEmOMoaAc9q1ezdDQED2lIp7rcf7SZUvhQVKs9OD6Ps0wRKfovs5kuVIzqKzYyZESgc2k2HXs64ZC9ueSOMFxHQrFAvV6nXq9jgBK+Tz9Q0PcbTS4MTHmnb91dZOeuHNspdn640CoqTpSo5HExpAoY5Fsw9fTxvkmzUv//CqGeAKMEUJriTGkxolGAAWtVb4ZFI0wvbkw7FP3Jvomb13fKmbHdvWenXth7fT0tsvj97h+5y6Tc/PUWi20EHj5HPligVK5QrlvgJLv22fbLk6zOJUmjbHJlm9bf2DiFP1O1367nncQRutTkhZea4PjOHiuA6nST5IkhEFIq9lksdnk9vSM5S7HcYkkKZlEb9w4Ps6+sXFW9/ayqly53CyUfmI27jg9tHXrLW+gMOcV/PHYiFnX91qhkr/S5h4ZkPAXUqEqBKxeDaUSNBqCPzhi8r+3unD8vS+O97z1ycsfXr86PBlFFMsVnFyeUGuiWOM46YZca+I4QRiDoyTKsXUnWmuMXnYHIgNW6NiiiwdoSwnLU0ZY4EOTYJLYcsalRAG1uTlaC1V6C0WefuxRfv83f8jBrVvpKeTbYzFKwQIprIdGJ6b8xZ4VWTO6sxYJadrAjwYiDFGiqbcCZherzCwucOfePe6M3ePazZtWg3tmhrvj48wtVNEYhHJRyjqFerkcnu+Ty+dtQazjtuuaXGkDfmMsOp5Am/IFEIUhUb1O3GhBnFDO+ezZu4ejR4+wccNGegslBG1yJBlZZUlw2laLsR3T/Uzac7FObOy9ZJ0yaXZdIF2ns8FpL1fp8bAbNAwYDXEQkQCu67CmUqZy5BA95SK+7/PRp59x6fp1FqdnGBxdgZ/PgzE2M5Bm5WUqMywMqUKawZHKrj+JHWsSgV62kC5PyixJ0KYyxgidxk/QaLbwlEOhXCaJYhr1Bp/cvsPRM2cPPDW86jfmRg+8Mu84k12o168NYv7dB+R/87/+zk/xzZqwL0o9hDDWSBHucfLsvnJu9O6l84/fmZ5eIzyXYq6Ak8vTCkO0FrjSSd8rg0S2ebNRnLqLC4uWI+zgFWRpJY1BgwQllTVgSCUB7e48reRW9nvKcWwhpwBHSfLFCvX5OSZmZxFxzMG9e/nes8/xxJFDrBkesEiJsWislDaN1f1y2eu0eqLd6acU/raGNFLiOE4bJU8STWIyUE7iCJseDIHpRpPx8XHOnj3L51+c5MKlS9y5d49YG1zPx83lMJ7PyNq1DAuBkSJNcomUgpL2nZAkBusmllbkJ1GEIwWlooeJExrNBs1Wi1KxyFB/P4tByNzsHAtTU+zeuoXf+f73efHpJ9m0Zk17kZDYCvWlQfSy1pacgi5IomvysFxukS5wS49hHjw9dAfxXfsblU562Zl6PI8nHnmEXL7Im2+/zStvvMnY7Vts2LyVYm8vQkqCKKIRhkRJyhV1HYKW1SFWQL5UQgLVWg2EQHmefXLLUHLR9T9tFMYIO8kCYSvEcR2KpSJhq0W92WwH5Y35Bd758gyP9PQceaa3/w/+5MjB/991Ke9Qbbgs1mKEn7QrWX9dWlrTIOPYlUGY07E2sSE0EPQAO5tBfseXF/evmJ9/qRU1H7l9/vzI6fPnKgvzc25jfr5skgSVy+GWyoz29Vk0kPQdlQIhFbGQtiYlRdi0MbZQrq1IJNvoqbSzDNn22xYfm3aGCOzrZjLZ0TQ4C4KAZqvZGafa2MLBfA4351Pp67XcWAFonW7qE764dp1PghYm0Wt9P//7q9af/eubdu+ee2LNqpvO4MjPJis9r1zesPrahUqx1ZX1hl+jBfW+JiX8s38Gf/fvGiYmYtatg1ZQUo25fzQ9fvOH569cptg/wPDgELVGg8jYDZMFflIjL6XayKXW2UwHkKl6mHTjlRYTpjKAJg2WMwSUbAwIQxBZvXHf91JpWE2lVCQJAuanp1mcnmX18AiPP/wIv/3i8xzZtxdHCBu4klbzGkMUR3ajkII92XiVKZWju4nssmV67dpYYzRj1z9bpmpbAlTjhOn5OS5cusLJ06c5d/ECF69eZb5aJdLaBty5HH0jI/SOjKbvU+qSmd63vWe77sSJBXikMERZQaNOCKKAMEnwfI98Po+nXMIgpFarIcKYvkoPuzZv5nsvvMCTjz8KRpNgkG01GAuQiGxdEdn7Zu/F0idtH1tvDbvWJkbTCgIEgkI+T7dSmYktsCSVahd3LsGO2oCNBZ2ENCgJQtsNQpiug4d27aKYzzPUP8C//sN/x5lz5ykWihQKBYq5PGES02i1iMIIz/NxPJckjIgiG9fkijkcx6HeqFshCiXbcYQRXY6wXS98FkeL9DrjJCaIA/LFIvlcjoX5eVphTM716Ontoy4Ut8fH2Xz7+rFN8xO9LtxBqklsfJrtn38t5pDvPiB/9VesH8ME8gr2DMKQB2A2jt89tPXyxb/13o3rG+7Uqoh8AZXzEUqhoxgQqWxfusNN/zakbpzpe5RNQJZmkGlwCxDKLq5ao7Xp0BCArDxFJ1a7PEkR4VzOx3UUzXqNhbk5PGDPnj385ksv8uxjj7G6t4LCAv3GpAL+Mq3GNl1JsCXvspUjTOIkVQtROMYibUli2qicdCQ5Yaf9RqKZqtW5MzXF1dt3OHvxIrdv3eLO3dtMTU8zP79Ao9VCOS45pSgKget5eDkf4bgpopcGFqSZV93ZmesMIUnVWhIMc9UqCLuYeLkcxhhmZ+dYnJnBkYotmzbzwrPP870XX2LbqtH2W9t9n53W9Z020mA6acH2DJg+vy5FLQMktoNRjuw69tcc01ojjX3eOklAKXwhWJPP4+/fR2+phETyxjvvsjg9Ta1WpdTbi3JdPNdBm4QoiTDCIB2JJz3QmiiOESmnH2H5hg8SZ3kA4A+QbgqxWsSuHQdgDadibaxNdxRzZ3aWiXPn9q16f8Vf31Iun2z0996Z/Lu/qU3e1Vwag3/1GsxMAH8JlVC6mwCTgIgRnsDxW2gnIhExWf2zlEHgqHoNFYTR4ro1oX48jlevHdQ7cskgtyeOVKJgc+/NW9vMhyc2jd+8eagatdbfq84zWV2gFoY0wxClHIqOg5vL28BcWUqW1oZIJ8RxRBLHdni2tfuFdXYle03SIH6JGoNsi90YCdKoLiKD/R0b4OsUDLBfS2kpWG1VIpHVQ1iVFtWFGNZqdarNBYLYQKJ9XzeH5I1r6JmpkdlCcXO50rtCrFy1e92xw7P92zafnTPms7lS5ep0sdicdiRROgidVst3Wk2BMRG/LrrmK1dCfz/095vRRqO04+zZxxuXLm69OTFOrRVQdj0czyesVkmM9ZiwrbPeLDdje9AMlG37u+Vks8DQcoQ7KK3juIBuI+PSokc0FqsEizVWDA3yzOOP8RsvvMiBHdsopsG4TgNPmR5XpbrfS4CA9HzaGGucJ21dFdKuVUls2gnaTLUKKYgNVIOQ6WqVa2P3OHPhAleuXuPa9etMTE8xX62yUKsSxjHCccn7OYRUOLk8juta0MeIdiGiDVrtUmzBFitQYDNNGqRBOQqtnPbcF8caYWLqtRpBvUlvocSBfQ/x4lNPcmTXLspAKGT7/RKmvb9orwzdT6qtVS4F4BDHmmbYwkk15f1cri33a0iz0xmwLkVHf6E7GId2Wq4dwwtbx2Q3YIZYJyhtKDgOu9euo5DPE4cROT/HrXtj3Ll2jf6REZTn4jqOBQeF9e2QSuF6NiaJEltnIKCt6vJNmnIcfCVJdIxCIFE4yiXWVuih6Odw83mcQoFrd2+j3nlz3fCK4YMHHPez8Ae/0bj72qvJ3PjYrw3q890H5P/ij7/zU3yjNt+ClWX4r5+CobUAjro7/sPwyrW/Pz8/n2sKQdHPYYStDpaZc+ISikeXVKB4sFeiSWkWKnW/TFKjjyRF1EW6GJIeWuuEOJU6dJXCd12SKGJuagoHw54d2/mt773MC48/znC5SBwnNMOIou+jpEXiRVuDtXOVS8OyFJUIIxxXoBwHIR2MtoFnEGmMtOk8IwTz9QZX797jzOUrnLt6jZNffsmZc+eYm53F831GRkcZXbeeXD6X6pxarVMDRNpgwpBuL8mMOa9Np78yVF6kaE0SJyzMT+M4Dv19vRQLBerVRcbu3MZEIbs2buTJY4/w8jPPsGndalzsqv5gj7WvCkkFGN0uws1mNY01s8goL0JIW1xlTKpv+/OH1pKzpcex+6O0MDaxaYxACvoKeR7eu5u8n8P3fX7y6ivcmZrESEGhXMb3fYzwaAYBQRCTLxQsmhXHNOsN0IZ83qaP48w44QG3+6AeMNkmoS1bKfFcKyQZRjGO45AvlxgcHuZW0EScPrX9UK74ePmpJy/9x3/y+3eNEIbPL8O/+xhmbvCXPiA3COkIE3uImqtc7TlxlBOJcQLACHKeE/f2+U6pB0cbHVV8qQ9uK/ci5N4btx7uf+fD3w5v3Xru2ti9Vedu3+bm2BhBEtEzYL0LeiQMui5SOmgDUZLQaFmesFQSIUVqYx6TuQcqY+cWlRa0CSHTecKkUqGma3PflcnJirU6+8x0A5yQpHKllp6q2hQ8oH1snWgi7LXItEBdKoVwXCoDA3iuZwPGlEJ3fmpG1Bavug7sWzs6uu/owjQHL2262nT9f1PfsOntK1u3XDkxUF6YzOcWBZiwVMrpvgFJT4+m2dL3mRH8FW8PXb322JE33vrbJy5cXHGt0aR3cBDhKOrNRjvrAR1gQRjzgHmtCxQQnZ826TxgTLcTZsckJ3NcxoCX82xRd7OFoyx9I6w3MVHIyGA/Txw7xm+//CKHd+7EUQ4ztSblvI+jBElqEqeERDrLNg8pNVOk12PdRR0bkJM5UGuSxOqge56DEVALAsYmZ7l85y5Xx+7w2ZnTfHziBNdv3CAMQnoHBxlaMcKmtasxCMI4JowsBzrShiAI2+uLLZDMeq0NU7clZQ2QpMG5AJTrkZNWLz2OQuJGTNxq0VMssm3DRp569BGeefwxenxJE4v0KzKOu26f5X6GRSrdb7ASyEKCsEowjmuQrmvXQtNxqM5+1RHiPilH2kfPNs8ZoGR/UUisZKSQKGOz3/OtAMd12b5iBaXf/A16evv4n//tv+HLixfxXId8pYJfKODkfMLEChb4nofruMRRTKtl3T9930NIRWZF0B1ZLOtmey3ppkJJaTM8wq5VYauF7/pWmScIQRtyrsfIqlXcvXOHu++9535fqe89++zzd27/k3/6J285bnPu//2vfm1miO8+INe/Yn2pjf3jeIyCf+TLU1srJz7ZcfLy5dz04gKJFIhUbtBkVsPLA3LRoSB0B+Pd9AaNBp1K92kBFtdqL7BKOXY3awxJbDnpYdCiXC4z2N/P4sI80xPjhI06+/bt4zdeeolHHnqI0YqlK2gB0lU2TSUyJN5elcCiZ5kOaKf226CUQy4v0YkhbEUYLCLuuBLPdYmBmoFrt+/wyWcn+OSLk5y6eIm5WoN6q4XwfUbWrCGXy+P5Pq0ooRHV2ilTkfL/TPuM3X1kOh9291n2cbqJ8T0fL9256zimVa0S1GsM9/Wzb9dunnnyOHu3b8aH9pSUBcF2lv05Yy794TiICcMQ5Vluu8SmMxdqTebmF8jlfUaGBym4diFJjN1kWHSoy2ioO/DpOk0W9AqRTkik6gDGdKm0SHZv3UQQPYvRmtfeeYe701PESUypvx/P84i1lY2MUl1glZlipMGaNsa6qHaNvWyoLsOtsl7CGG2RGJEVvIrUCTYmDEJcpfBcl3JvL5N3bnPjxvXS4xs2/pPhsKmF4f+CINU9bDhQ05D7JSOdIbao89tRkR3AB1rQTrE/oFnIShsPUMXefGue0fATNdTK7ztgBlaWCV79N4I+4/Iv/paafPIHzfy+o/HGQpnNCws7Bq5c+YEzO/vQ/Nnzuy+dOjs4Pzk5UIsimkCur5e8knieZ5+AUMQahElIEisBZk2zBI5xLE1NOWltgl1gjdYkcUIYBenGKXvPVUdhRSpEikJqo9sUtQxdby/aEhRW+UkL3Z4vLOUgTaVDisan84WxCFkcBSTa4Pg+Xi5HrA1B0MIkCUYpSgMDFHsqiCQhBs5cuszZ8xdWtKLo9/c/8shvHBXJ1a03nTc+Wr/uJ5+sWnnlwuHHFuTqTUL/g0nBf/svBX/6U4iiX7FF4pfWBGmtfQ7MamCg3tg9MzHxwo07t93FZouBkVGMUgRhhFCOlaw1nTHb/XX3utM9qm0gmErkmc5n3Z4TGUKcIeRhEOI6ikIhT9CsU61WiRpNVg0P8+jBQ7z8zLOW7qAUUZzgKktBSUM/MghEIEiSiCSxpnOZ9TsCpBLk8z5xnNBotlInUAfXc/H8TuHg+NwCn5+9yGcnT/Phyc+5NTlGLbD1FQMrV1pKpeuhpaTeChDKsdnWtOYq6UL+s3lOmG5XjazTOnUVjqOI0SzWaniuQ6lYwJOS+sIC81PT+EKxY9tmnnvqKY4d2EefL3Gw60DbKMjQAWnagcLSx69SKclWK0AoBVKRyxdwXJcwSbhzb4wwjhkcGKCvWMBXilZsSNJsVRzbTXpmFJRlOgTZ+91pdoNuZRCVlHiOwMQJ0mgUktV9PTx59DDohD/66U85c+EC1bkIKQW5YgkQBNoa1mllN0xGpGms9JlmSk7LWycjk/6/BeqJwtA+PyUJIyvs4PkeSkq0sgBFAhRyeYTrUZufc+bHx56q3blzS28uvsU//+dNjhyE//a/ldy4Ad92UfhL0n4dZQ/tTOI6yQC19YcuXvx7F06ePPzFjRto18UrFGj7hGU5JNMJZ+7bGS5rWcoqo69onaRc8RTxcixFwMqUpTSWJEFg8H0Pz1EkYUB1dhYf2LN3D7/x4gs8/8RxVpRLeNgB7CqJUNmE2zEnyNoyfKB9cdaDJ5Pzw+7alSQCGmHI9bFxLly/xacnv+CT1GBgemERv1AkXyrR09dPqVRESocwCGi1GtYISSmclD5hHSgz+1+x9ALSixJk60tnIo2CACkVvb29SGMIGw0W61V0ELB+1UqOHjzIC08dZ//6dTZ1aKOUr2GDvPypKYywKdWMiBQB1++N8/npM1y6dJlSqcJD+/ezfs1KRgd6yaUFtrZw9sEjIBsfOrtHaVH2bBHoLn3U2qAl9AjB4S2bKHg/QDgOP339NWZri9QX5ij19VmpSyVpBQGtQOM5ViFAKJFSgJYnSX9xyxA0KaUdm9pmcrTQJImm2QpACrxCHr9cJqjV1NVrl4fcL08/smmgb9OtVSsvtnJ5U1qx3nNvtxI90vfLCcgzGlepnziZo3HnLkmr8Qt+6f42D4wBJWhnUJYszmnTgKsjXGKitZuYGS1we7xlCqs3KvXIThk7cwmjw6Hze/+ESmnj4MZ6vHn72Nyq0RMfPxN8+O5TY/fG11+emMyN1esExuDnC+SLRSq5PEJZGUId2yDcpq6FRcWliyO0/b7WECcgU75vV0CO1gij05S46ChPiHSDq20g7ShB9hbYzbAGI9qFYVnLEHfb1TotDEzXt5SLKmWqgaHTaCMNAoyQxNoQJVZ6TxiD5zoUikVcJe3GuVHn3uIitbm5gg6DTcUvPqdUr24uS7lm60P718aPPfrBYt/gmblNW2/NbNoa6Tu/Z5hqiuSS4+j5RQMk33Aof+umgRxQxirEfEfcGfsAHGX6IHdkqrbVv3Tt4Jnbt9yJxQVEoUixUmahbnWyC8WSvbY4K6D7+q3bPl6mc86DurL9mdaWpoUhqjeRUcJI/wBPPHyM33zueQ5s2UxZKephgEBS8D1EuonrLpTvYl92Hb0z32abACNAS4nj2DFWj2PG5hYYm5zl5Jkv+fTECc5fvsLlWzepRwHl3l6GV4xQLBVBSpqtFq0oJAhClJMaqQlhVcCWgH5LVxzRWXLIhP4M2HFtRHp9Gmk0URAQN5t4GHZv3cSLTz/J048+wqbRIZJEY6TAQTxwLlnyLLp7QzgkOqLRaOD4OQolHx/BXL3OqUuXef+DD6nXG+zctYvtWzezbvUqcr5PvoseYjMbmU9F57lm+QBtMhNdA6kKnMCCNznHctXDJMFXim2jIwy+9CKOUiRhyPW7d6jPzwEGN5fHd635YZxEti4g9TQwUmJpuF9v75xdY5LECC1wlG/7O0lSUQHrCJvohChJCOKIYqWMgxbXJifxvzxzYLRU+X7+0EN/xsjgBNeuGf71vxaMjX2t8/9lbd99QP6L8vx/0c1WQSiETOIkWV+tN/5gem5+uNpoMrCiF6dQIE7iVBbJBs3SZPhjBleYdrxuN94dmNQiGqZdvNkOyNPFMHOuinWCTuwfjMZRikqpTNRqMXbrFkGjwZ4d2/iNl17mmcceYaRSBqzuqicyeaXlldvLbpPOS5teHlEcEQQhjufi56y+bQRM1wMuXL/GWx98wCeff865y5dYbNRx8jnWbtpIsdyDMRDH1oxE6yDl4Sn8TOscCMPQFh8qa7CwlOqTXtt9H9nri8IQ13EoVcoEjQZzc7PU5uZYPTrMwwcP8PKzz3D4oYfwPI8AQ5LEbQm4X4iMs3SiVK6HpxxrhgEstkJOnjvPH//4x3xx8hSFQpEbd2+zb89eDu/fy5a1qyi6Llp+9XTcHfYLIZGqk8czqZxhluZNsGhLIMDxfXZt3cRU9REmZ6f47ORJJubnUK5Lub+Pkl8giiyijzZ4ro8jJXEU34+WLblTln03DXjbWRVpqQw6IYkVmC5EJ7U6HhoeJi4W+fjmLba//saaHyjnpVd/8EJ0enjg2ornHnHKGzaYqOeXRFlJx4o7MEp98ho3/+hDktbMNz7MFDbI2g4M8ZXBlgEioZNIgJgd3WYmTJ+IJ0543r3rOTfeLs0//Jd1RtclQ8DjX549uOvU6b/XaLUeO3/u7KozX34Zzy8sKq0cipUKPZUevHzBqhFFMUkcWUUHpVLTJ8vddx2rKmQEqQlLaN3zojAdJ3Zz7SibWfF8v51Ry7Tj4yQhihKb4ZGCQsFHSlsDoFPnW7tIp10qltKtdEZXwiClstrRQpG5xnaoTIqcm8N1PII4oh4EIGw2RaUc4iCOCUJb9IkQFHt66O/vx5GSsdkZbnzwQa5SLOzd3qgffGJ+frbS2///OLNl87/60e6dN5q/93ciHjou+Af/vc/cnMamRb7zZiN/6AfywA2g+t2dSuP55GDFqhMf/I2xzz45dHViAuN6lHt6kI5jn38SpxSINOhdcohuZPwBZ7CRH/Zv0X63Ic2Udq0RWUAnpUDHMfV6nSQIGOnrY//u3Tz76KMc3L2LspTUw5DqwiLFfJ6CZ7OnYAM9CXa8mqwWwe0UH6YXlSQxzVaAdFxyuXz7+hvA1bFJ3v34Uz774iSnz55lem4eIyXDq1aRKxaQroOREGlNFIaEYWSLGNOCfW2y83fUy7ImDG3JxKUAdqcHk8Tqe5eLBRQQNVs0FhZwjWH96lU8fuwYjx89wqqBPrSBVjNA+i6O27WmpZnKzqO4/zkJUi52FOPkJE56RTfu3OVnr73BT195hVq9zqE7d7h55w6HDx1g184d5PN5K1LgOFbS0CQYNEaLdh+0z2usGo2S1gzMdPWLlAITC6IwpOEYlOcwVMhxZN8eJqen0O++y/krV6gZKPUJ8uUyYRQSRTFaGxzXS2Wcs3FkdVa6n/T9A7KdkGiLXxijUWnWUBuD0TYozwC8xVqVUrFAb7nEvUuXKF+6tGHHxg1/tzx+d4r16/+E/+6/M4yOGv75P7/vjH+V2ncfkP/3P/zOT/HApiTUWzBXteYJ6QRFQqxc1B5ZG97w+oUDF0+dKd6cnUXl8uRKJYTjEtYbNqgWZklAu4yUYP954IZDLAmRMq5mJlcVJ0lavGVwlCLv562tvdHU5ueozs2yfdMmXjj+BMcPH2Lz4CASyz01GJv66j5biqxlaFc2GXdfqpU2MmghcHyXnGsf/UIYc+HWbU6cPsOJU6c4cfokd8fHqUch5b4+BkdGKZbKRFFMEISEUdhlu2vvMo5j4thuQhzHoVwutwODTi/84ryC77oopQibDarzs0TNBpVinn07d/DcE8c5vGsnw75HTLrzNhph1FekC+9/YgJBbDStsIEUCs/zUcBYtcbJs2d5/YMP+OT0GW7dvUexWMQ7fYpLN65z9eY1nnniCXZv30pPoYC/5Jnfn6a87wraC8b96Ermm1oCDm7bSvjSS0gpeeejD6kvLiKkoNLXT951rRJNOjHG6TgSqVlTt91xN5Wxc+pMPzZL22aGTzrVvk9QSuL7PkEUEMcJQRBQLhZRhSK3azcYvn1rW/HO7b/fNzlzVazfcG32rz/WqC40hMm70JeHgmN3Gd+25SwJSf5Pf0j0h/+WeH7qWx8q9HIsbNuDOzBMUp1n4folqrNTS7MUwO2kzMVgnRmelXlvy6Cn/sHfjye2bai5q1axw+8trp1rPF2ZHnup9sorB995590tkeP0TzWbNBLt+D09+PkiuUIBHIcgiYlTfndG3RJCIB2nvUgGUQhx1EajLZfb0tqkEKnUqULQceOz/8bEic24RZFNK8c6IQhjavV5MnQse5dEqujUociptiKD57q4jmsL7NJi8nafpDS6LGjXUUScUpyctAi1wzvvAhwwljaXpaKFANcjllIstAL3xsVLJBOTvYN9fb9VmZzc8L1m8+r8rn1/sji05iP9f/q79YV72plrJH5YI46kmzyIOf3LbgYoSMWO4c1QGYI4/NbHkmnW4MaThxl7bD+EMbRaRnieWTc4yt5PvtgSXDj70r07tzYvtlr0DA6RL5UtGqkTSwfRug2kyCywER0IulOgL7qmnexD056Tpehyj+wKzkSqvKUA33Wp1uvMTkywamiIRw8e4vknn+DRffuoSGnHcZJQLBTIeba+RJr7nSgzKlVbyi+jxljSJsr1LfCBdRW4MT3N6QsXOXHyNB9/9gU3b99mbqGKm8vT29dLoVy0Aaa2mRiEXc98P2d30ElMFEd2DZIS5XSyzd098vPWGwGEQYBwHIaHhgibDaamp6jPzbFj00ZefOpJnj/+GJtXr0RpjYljcp7bph4ujfI7EEh2xkz2URtNGNSJkoRCuUK5WCSIIq6OjfOzd9/jrfc/4NLNmwCcu3KVa7dvc+naFV587jl2bt1MyfcZ7Oul7OUwSLtZNjrdPHfdj0iLs6VE2y1d1/3b8eA6Diat/DYCNq9dw/effookCqlWq4xNT1NfnMdxHRyp8Fxhx4DRiJQ3/qAw6EFvaTfw5aQbhCAF6Xzft/GP1tbkKlWWi6PQ1sZISawUs4166fbNG8dWnb+8e1//8I8uVwpJo1zODvsgMsCfY+H51WnffUC++T8RQq4TyJehsuq+oDkXxerhjz77fvG19374R1+e9+bDiL7+fhzXI07TX1onGJlydjMB4K/T0uGSpdFkl+SUgXYxFlhJQddV+DkPx8Ds9DQmDNi8dg0vPvUkLz5xnE3DQ3hYVq1Ao8g0XtOtguieHu9v9iW2ibwYEI7CkQ5NY7g9McX5a9d5+6OP+eTzz7hy8wZz9Rp+scDg8Ep6+wcpFIroJKHVahEGYdv5UqYKDMZYp1KtNUopq3Hs+cRxTBC07kPuv7rbrLKMiWNmJseJmk1G+/vZsWUzLz71JA/v38+Knh77syZGolOkdzkdJXsI7R7o+tum8cNEIx2FBhZbAZ+cOcOrb77JJ6dPUU1i+letJJ/LMddscv3ePW7eucPt27d55vhxHj50kFVDQ/Tk/Cz0ecD5H3B/XVFy9gQdkXLKDbSkYLhU4vFDB4nDkEazyckvzzA/t4BJoFAuU8jlCCK7GCWJaQfzy3tYPGi6Sj+36drUES/JClstD1QIB9d1cI1LHEdEYUSgQhwMfjFP1STOxXt395Tv3Nu7ef2GH9/csSIJwQ6wmRbUY6u/+W2bV7AXfO4LuPDRtz8OoH2f6s6H8LbuRty9ydT8LHOz9wX4gihvaI6Knfkhv7x7i+M99mRLFEt+pd5ct/ezz/dsPHf292dnpr9/+pNPnM+vXydfLFPq6aEyMEi+WES5LnFK82kFAUmqfKKUIk60zYiki1IcZ8GE3bx6rovrZgG4m4IAYIzdsMdxRBxHaJ3YZ5VeskhtyT2lSIAgiTHatGs4hBRIlfkJWf16HScWMdcG7TgY17MFokmqRy1T0yGpEK4DqZNjnMREafraUR1pVJ2m+k1KG7PF0am+dxSB0XilIvlSkSQMmVlcZPzOXZkbn9i6bX5h6/6798h9fnntwrad+eCxHXfORoWp6c8Wwpwk8qNFAvR3LsESADmp2Dy6heGVOwmD2rc+ltsKEUlC6/u/y9jfeK7zDWPEoRNnNm5+6+0nTl+9tPHG4gJePkelvw/pucwtLACQ8/0UhdSI5eHdslfqvtmmDdiKVArTzi/aZLK72TqU8ruNtq7NUURfscihfft5+amneXT3Lir5PIG231dAvlBI6ZAalmRds3N2RUSJTQhYDR8Q0sFXisgYJubnuTU1wfufnuCDTz/j3KXLTM7NoRyP0uAAxUovuUIeYwytZsMKIOgEISSu6+KkZmzKSBJke+4VJpUXFEuv6edNyYYU5ReQhAFhvYaKY9aMjPD44cO89PRT7Nu4CRdoBC2UEBRz+c5vf+UUt7RnNIJWFKOkolgsYoBzt+/wZ6++xqtvvcPtySkKvf34+TwtY7hz5w53JyeYW1xg/66d7NyymQN7d1NcsaataqPbcUhn3cncwe2oMUvXXGOLPV1lQYE4SQi0puy57NuwnuCJ4zSCgA8+/oRbE2PU5udsoafnI5KEMInRcYLj2Pnpa8dBaZNKWRAyFazICnyti3ZixS2UwjEOYRSRhCGl3h7COOLk1Wvq0Z5TB58cWfn4xIFdnze83KJFWhONyhmSIOuDr7cI/yVo331A/tL/4Ts/xX3NGJich7/2BPw3/wjyfvtbAujBOFGz/uRsdf7haqOOyvkUiyW7YGrLTzOxlTR0XJui6eapdbujdX1I92ZNa7tLlUq1+d1aa4wAx3WR0mvLFOkkodFsMjV2jw0rV/LCc8/y7JNPsHHtGhzsfsABhLJSVaSmDstnBtl9LcKmylppUYXrebZyO/25C7du87P3P+DjL77gi7NnmV1cQCvF6Jo19Pb346Ua7GMTE8RhTC5Nnbuu20bgM1kpqdz2ecMwotFottHyB7UH6f1n2a1m0GJmaoq+cokdW7fw7BPHOXbwEP3FUvrWJQitrWat7E7Fd6cOH4Rgpw4uUpLL5UEqqonm9MWLvPX++3x26jTztTpDK1ZQ6e1BOQ7NmqXszN2+xb//n/8nJq9fw3Uk7qGDlFesXHLWrzr7/Rv4zLoj/Tw1/AHrulhQikP79zFbq1Gt1/n05Ekmx8cYVZJybx9SKur1FnGcpHbE2VyU5XJMhzeZfstgSzCzlcqYJD2tLfIVSMIwII5jlEz71XHQiSYIWkTC0DcwQNho8OXlSxz+8MN9/X39j09t3vh56PuL1EL4F2/An1yEkeIDn/nXajIt07197tsfI23CGEQcIoMmIgxSd9OlPwI4tBqKZt2MP/JIK3zhuXAU9M6JqX1bTp76g+jGjafePXlyz7nLl1UsJRu3bkc6DsJxQUgaQUjSbGGwOsp+LmezDXFsedaAcRycNGKQUuF6KWVACOukazRCg+s4RGHE5NQktdoiYCynNYpskCasnKjv+RRLRfLFAp5yyJXKFPLDtkgqMe15Jo4tkh4EgdUdb7ZotQKiOCFqtohaLUAgUvOUYrlMqVwmny/gpUXVWTYvk0pNIgsLZMFBtjiL7kJSY3XQbZbA4Po++UKRfKFAbX6ehZlZTl29xtj0DNuqtd/d6LNtWFd/fHfv7n/XemzwzLqb0xTqV5k3MUkn3nvQrvvPP0bSf6MkohW3iOJv7wybxAEy0SQ6XvK5AFEifprq3Peu37yZX2g0qQwO4fk+zSim2WpRzBco+HnryGl0Bx3P/hZZB3TnXbv+7UxxKRKeAkBat2tMOlQWSIKI6bExKn6OA3v28dzxJ3loz17yBZ8kSQhS5RXfdRDCpGj3UiDInly0bd5NktixKiXKdS16nf7sxPQ0b5/8nI8//4KPv/iCsalpmlFMubePnr5+cqkb9uJilTiOyPkuru/hGisDHIYhjWYDIQSe75PP55BS2ixeFBLHOnVk7uqHTFHFdPrS9pXNGFTKFbROuHX9OmG9zrrRUZ585GFefOZpNoyuwMeCJUIY5JL1anmOYMmzbn9lwwGFXyiSSzMEl+7e5ZV33+W1t97mxt17lPv7GSqVbEF9GLK6WKA6P8frb7/NjWtXiF94npUjw6weGcUTEictrBRLHnoHoe/8//LrJXUNt94mMnMYFYK9O3fS0Jowiph/Z5E7U1MYKSn2uXiuS5RKHzqO2wYV28WkZumZl3eEBqI0g2aEsBndMLQBeNtd2D4j13Gte7dOKPf20lpc5Nb4OHsn7x1b0Vq8I+EG+eFFeg9KEmlwaoaFC6Dj72Ru+E/VvvuA/PMPv/NT3N8MMAlXR+5biNdGsbfn6o0D1QvnN90du0siJMVCEcfzaNTrJFpbjqdMF/X2oM64AB1frp+HTLed8rALZJJWgwupbCW6kyIVUUS1XoMwoL+3l2NHjvDSs8/w0IaNlEgLBLVJJ+k0EBeizRGVUrXP06bltN9V0SnUEvZX79ZrnL16jbc+eJ+33n+fyzduUmu16Onvp9TTS7FcRiqXMIxpNUPiMEYIbDEOlsOapIYwon1KkQbnuqsKOwsQ788wdRYW0fnbGOq1OmGzSblYZPf2HRx/5BEePXyYTUOD9gkkEVpHON0V5+0b/qpMQeccNuwVFKRiql7nxIWLvPr2O7z94Qfcm5xC5QtUSiVEPk8YRzSSGCeXxyuVCaREuw5ePo/rOO1i0PvPRAdFSAOUpd9ces1KSDAJSZIQp9X063p6ePTQQeq1OouLVc6cP0+rVsf38niFoqUgaMvJs2npzim6e6F73haASYeHreM0GGFwle3LOLYbwySR7YJP6Sji2KYSS+Uy1Sjk7tQkBy6ef3bVth2zq0ZW36j6/mKSJHD1Ntz7Eu71PuAZfN3mplc69+c4RtYMItGIqGGzZUNPQfIsuBJqV6EwZTi00fQOr4jWmp7EGx6gR7Nq7fTU06X33vvexOtvHr01M73y6sy0txAE9A4Mkav0ECUxsTYp17oTJJlU7hNjcFOetTVcsfQPKQWOo1DSs7IbcUyr1aRRrRK2WiRRiCslxXye3sFBXEeR83yK+Tz5fJ5SoUCxVKRQyFMqlykUCvieRz6XI5fP48hO2j4LyMMwpNFo0moF1Gp16o2GVRJaXGRufoEgjm1BVRDQaLZo1uvMLMwTG4u2uzkb/Hi+j+Moi2il81qmbmFhd8jKCE06P5kUIYy0JgkCBOCVyvQ6Ls1ajYlWi+b5s/7M7PTe1YMrSr1BfeWTR/e9k6/PvhH05+7ufPJJbrzxGnNBy6jv/8BURlaSu3CJ6c9PkNQXvjFS99XDxLQLXPX9m7av3XRahNt9WaUwZv2dsQHv5s3Hxibu7ZuZmwPfp9hTIcHQCkMbjLg2+LF1BLqtmpIhngZLM1hepNtNTBTL5oDuJqSwmSthvQfiMCSJYzZuW8cPv/c9njp6mNGCTxDGhFGEqySe5yAUhDpM1xGVPtEMf28f3fahBlJNcZkGW3NBwO2xMT74/HPe+PADvrxwgbGZadx8gXy5TK5YIhGCVhTZNUWk3PZ0TCHSOUsJJCk1Ly0stf1tEJmPhVh2TQ/4ujuc9l2PJIqozs3RXypxeP9+XnzqaR7et48cgljHhJFVnFJCECdBqtmvloXCDz5r9nwKyqGRJNycnOC1D97nlbfe4ty1qwg3x0BvH8p1CaKIIEno6+1FCLh+6QK1Wg2UQjj2nlOjka6McBeo85VxSDYaNJkOoT2KphVZ8LHi5zi4cSPBM08xX69Se+99ojAkaDTIlUq40j6En085vb+1xywWofd8299RFNmNleuiHEkYRYRhiFQSI4R17vZ9tFLUooh7E2MrKlcuH9+8dtUfB8W+GzPPfF/glQ1jp+GDq5Ya9leo/QWorAx+96e4r2WDp8Lywbp2bGL3/o9P/PZHn59cc3lmhnyKClklhFRezGTqGFbztzPLmg4Q3o52xAP2Z6LLJMiiRYnJgniNNgISg0liojBgcWGeiu9z9PAhnn/mabZu2EA+NckRWiPShULrlDPsOGk6MuMGPqAHUkTfy1nptYbW1MKQ9058xh//5Md89uUZphcWCA0MrlrJyOgKHNen0WwxOztPGEQ4yqGcL6VasZooConisE1zcBzHmpCk6SeTFt3kXIt0mi4FkCWV+N1fkyHmmurCInlH2eKi449zZP9+VvT1Wf68jtFRiDAJ0vfai1b3cX7+lCGyqQkNXLh1i5++/joffvYZ96amUbkcfrFAK4lozs0RtFpEQUDOcRhavZqdO3bw4hPHeWjvXgb6+rs6ugueyrYfy+/bGERbU9bQyUGbdLMkMVFMHCcYBTiKVf39PP7wUWZm56jXGkzNz1FbWKTH9XClBNdNTy0619HVAUtAlK4rzPrbTvKdTI+UwurYk5pDYLMq4KKTyP6coxCey736Yl/x7sRju26Ha6NBblwSAkQB6MW+c9+2ecv+/SW0OFVp2fh3YNPDtmNu/RSGT8L/+W/HK9f18MJP3xF6drIc/tFPvj80P/lfnT7x6eg7J0+x2GxR7u9n/aYtoBT1ICAIQ2KtcZSD53p4SmGMLTyLwggpsDq+nkcYR8RatxEtk6RoEWDiGKIYEcfIOCZsNOnr7eXg7t1sXLeWQs5noK+P0eFh+nt76e/tpVQq4vm+dW9t88KxaispdzgLlwyQaFswFUUxrSAkCO3mqt6sM79Ypd5sMjU7x/jkJFdv3ODazZuMTU4wMzdHYAxJ6OGYBAfrHqmMtfgWQrTpJIkxkG5GhASENVEzthKeMAxptVpIKSkXiwysWIEE5mdnuXPzJrfOnvNGR2e3H3XF9kNj48/dq/SVFzdt/X8+unlr5M3OJR9fPIv3v/vfsuLQYYb+9R8Tz/03zH7xyRLO8K9q2zg5XXrm0y/2LZw5teH89CR4HuXeHtycT63ZIowCfN+32Q1ti/vJ5o50jTHZH+jikNtmzPIA3FI4MtSRlL5g6YUWTGk064goZt2aNbZw8djDrC4XiRJNq9G0NU1FS89ITEisY2veIxSZPGb6oNtntRt8gePZeTkEWlpz6tJlXn3zDT4+eZI7k5NUmw16Bgbp6R8A5dBoBiwsLJAkhlwuR6FQREiPVtAkSjqbI9d1rFGfkOhEEwZhu16qXcDataZ0UzaWr40ZPNOs15FGs3JwiId27+aZ48fZs3kzZQQtLGVHJDFOoYAEwigER7SpIcvbcldkITrF5FfHx3j1vXd44933uHLrFk6hQKm3HxyXuXqdRqNhQa96g3wux459+zmwewf79u5ldHQUhUKLBI25T3nnqzYHS3+iE7jbeCQhDgOCOKYuJX6hwMH9+5iam2V+bp7zV6+yWK3iprUmUipr5Jf2d7ZuPGjzl20il/SNlLhpliAykaXNGYOSCmMgiWKSROD6Ho7jEsQxWknKvb3cWqySP3lq6Gi+sLfQs/bST3/n2Un6hwzvCDjx7yH8C6kD/wtrv3ayhwXMzmIU/PW5memRuXqdjStGUa5DGEa4jts2hlFSghFtCb/MpeqrlgE7ODvfbU+WqduWNALpWAe9JEkwicGRUPR9Atelr6fMU8cf45HDh8lL+9KLRKOj2AZLji3SSpKEOAgQ0qqYdEtQdV9MrC3fzE+ve6HV4u2PPuSPf/Yzzly4QD0M6RkaQnguystRbwWYZmiVOwTWAEQ6uMohiWOCKEAIW4SaFQvpNMDIiseyDFZW9ElqZtKZNFIUretSM86bRFBdWKBneJCnHn+M5544zuqBAVxHEpoEVwKuAp0qzLRRlHTxWobbdI7f+VdiC1AvT8/wxnsf8PZ77zMxN0uhXKZvaIhAa2qtltXJzfsoKRi7dYue3Aaefe5Znn7kGKMDA+RUOkHFcdtgpbNTS68knZXb4dGSDYlZgqKLtOhGYdOIsYG867J51SqOPfQQd+/e450PP2Rufp5CqYTj53GUIghDTMontn2vl06S7RXctJF0izIppLEqNVEUEqe4Vy6Xw1GKRr1BGIc4rpOqdwhaYYh0HCq9fdyenUed+ry4q2/lnundz1y6JOU4oiUgVlCOrcDjt0EbM2rZLzEgz5qFhuyfeqCYqUuCOFK+Lwul0vr85OTfuX7t6t9699yX/Tfu3UN6HkN9/RQqFYyQBFFMlGik4+ACGKtbn0mWgi2UE/YFIA4CPM8ln/MxRlOv15mZmaU6O4eOYyrlMiuGR9i5Zy+rRkYYHhhgxdAgq1etYLi/n5zjUMzlKOVzeL5ng/xU3aKtg5zdW2owdt/4lwLjuRjPJSnmrasvVrowiGLiJKERBNRaLaYXFpiYmWF6bo47Y2OMTU5w+85tbt+9y/S9uzQaTVzXo9JToaevz6pmuC5hZFHVOI7RMi04FyKl6tkF3M/l0VrTDEOi2VlcpZCOYnT1asIgwBjDiVOnuHL+3NpDjz76X+ze91B5Ltb/0+7v/8ZY3/e/z9l162gF2vpDLC9Y/xVuJcyGgbD58sXr19devX2XfG8vpbIFier1OrHWlEoVtNY0gjo6TlBCgPw6m422OG/bE0GngZJOEWOTBuYyrTcAWJydhTDk+888zYvPPEN/wRZLoiGfz7XVspLEotYZVSEL7u8LwoSlwyWiY3sfAJdu3OSN997nZ2+9zdj0NPlKhVylB+V6BFFspT7BqoloO07iJEKkKiIy21QIkWYHzBIFICDdaKj0Prszs52gvJ1tMJZy47oOjpRcPvcljtH8xve/z2+9/BL7t22hUirRMAZH2HXZxIo4CtP5uUPV7JyFNlhtln0jA2Zmk4QTX57hR6+8woWr1zCOx+DoCnBcFus1Em3o6ekl77tc+PIMOSX5re+9xA+fe4Z9W7cy2FshMTFhs4nvuinYtXwEcP91ZT/Tlja1oJB19ZXkczkcbag3mxBGlItFDu7aw/jEJHfHxxmfmiZXKFCo+CjlUGs2bGG3dDqxjch2ip0MRTYXdgskWiGCCFc55AsOcaYYhjU/KuRzRIkVuYgiWzvgOi5DI8OMXb5KfPJUad+69ccHdu69yOE1P6UvD4vrwVkqbvFXof3aBOS+QayJY9e7em3bqfPnRuaDFvlKBeX5bSTJ9TwwJuXy3X+MzkfiAV8tbdnnWlseuVTSOpxhd/xxGBDWWyRJwuYVqzh+5DDHd+1jpXJopJw9KbCTs63Oop0eTLR10UNiEiunR+r2l1geC0ZJIiNoxAnX7t7l41OneOXNN/ns9GkiwC+XKVV6ka5DGNmizTiyVBTlWMk1hQKscZGOE5TbSUdm0mrZblmmBT9WuSMLlq1mrUi1jTPNdYsMy3TTY2jVq+gwYNvGdTzz6CM8+cjD7FgxioNVltFagxIo6XTytG2ELA1Psixe+pExnYUpmzcS4OLYPf7DT17lR2+8weTCAsZ18YpFqwaAxkusQRNxQt5x2bhqFY8dPMizx46xa2SkHdjbBcAWVxqj2vrO9tJEGo+aNp/z/gG1bCKV0pqCAFFqHNTnKA7v2slCtUatVuPjL75gbmqa3pERvEKJRhDY5+LYYi0hReq9bM2WMnMoIyy1CSwnWGUoJoJYJwgjkCrd3GV/jEDH6UQOJInG9XI4Xo7JuSrO9WsD+1Z98dfLE5vHGNj0H9i2VfDWLYfwTIwJsPSTb9oyY5zJb/G7X9Gybm5hIwWQbFmtnX1N2VfyCn237h24dfnyS+b61d+9fuvGxivj4zQTTaWvj0pvP9L1aLXseypJsxmAwRYzx9pyft20oFkBpAtLdaGBMYlVUEo0vb5P79AQ/ZUe1q9dw9YNG9i7ayfrV69h9aoV9BbzeNjtyIOQsK+TpH7Q7Wd7ETfduOYdB7L6jpLl/CerVtICWgamFha4N36Py9eucP7iRe7evcftu/dYWKwRJQmtxUWa1RrScVCej3RcPKXQCLtRzd5NY4Mmz/fQSUIUBjQbTWJHUSwWKPf2oJOEarXKxPwskwuzYuD8lzty6H/cKFUKq7dt+9OR7TvOXRsabixOzQmqVZcwTOiAj9m+5OsLJH93TQKuxopAeUChXts+Oz3+/Zna4toWklKuANIhSguzJRIlBEkcpwVuVls7Cy07HpC/oKXBd0aNEkoSxREIyOd8pBDEzSbNWo2K57Fj+3ZeOn6cw+vWEmHBG1uj4LZrA2yZkkQJN+1YgyKji1jUHCGtGo8QGEeSCBiv1vjiwkXe+fBD3nzvPa6PjWMch0IubyXvsG7AAFI61jzLWIlEHSd2rnIkpGtP1hEaYzMI2rR1+TM3UoRpJxfaHHrSNUBrXEfhOnbdajUaVOtVSp7L/h3b+Y3nn+f5o4cpAfUoJgoiPN/FkS7GlcRhC5BI5bWBKClkm5/fFm1g6TsqgPFGndc/+ID/8NOfcunWbeqJplwuIHwfIR1UnJAEIVGzgYoUZd9n1+aN/OC5Z3n26FFK6fGCJEqLvTWJSTDGypRK0THhE3Sj9N3AYCqNLDLIytKPHCVwFDQbTZIowjWGLaOjPHn0KOP3xqjVGszMLSCkQ6Gn10pAp8dUSln338SuU1LZzEU3CGMxKkGmoZ4kBuVKlHIBiU5iDKkQhLJBfqwTtLZAgZfPkcsX0I7DbLVaunPt2lPJ4syp4V1b35yFVtxXZBm5/69E+7UJyCutVs+Tl2/smnntzS0/ff99in19rFi1mjB1ydTGIFOOpJQy5UnTMdJYdrxfIHltJ9fUbc9xHKSjqFUbuI6iN1+iGYYszC8SLCzw7MFD/N4Pf5OVo6PEdBZjIQXCdZdgv0o5bTUFkxiSIEK5CqRDEIYEcYL0PPK+1Q6+cm+cP37lVV55/Q3GZ6ZJHC/liTu0miG0ojTItCgt2fmNISEmSX3pXc+zE38WaGID6gwVN4nGtIvXpA2kkxjP81DKTQPywKIgxuB4Lo5MC1qr80SNOn/7t37AP/yDP8BXklAnSKms1JSxPydSZRcwbVS8k8+l4worBYnWRLG2RkzKKszcnpnmzY8+4t/96Z9we2qajVu30YxC6q0mUzPT9PT1UCmVuHtrlsb8PMXhYX740sv8tZdfZu1Avw3qo8gGIlKhBDSDAB3F5HO5NoKS6JROhK0Jt3rkXQtrFrCkRTrd40sAjrCFlwkOI+UiDx/YS6tVY2p2io9PniZXKZMrV2wmJEnQiSHnODYI19bynHQCj+MEjMDzXIzGFuZpY9FGLPJjJ3Ornx3FMUIKXNdNObUZPcmmLo224ytGlKfm5o6bidmPhlZv/g9z/+BJHdfPGf7n/zuEc1iF52/boj/H735FM0CEIETxNw9Gg7+/M/fyzakDxZ+98/dOfPTBb16/drUnkoLhlSupSEmz2aIRtJBRjDHgSIUyJp0rdBoQ0N4EGa3RIkEJadHIOGZscoJ6tUp/Tw8rh4fZsXs32zdvZt+uXWxcs4bBvh4q+RxKCBwhUWlAkW0e23rh6UZeCGtXrrrGDemCZ7//gCSyoU1fo+tVaXOTEXYDj33vfQErK2VGi1vYvm4Nx48eptFocfnqNU6d/pJzly5x5tx5Jian0ErSOzxM7+AgfjFPrC0v2gacNgvkSmsqopREeh6+66QbQmEzMZGlRaxau4aC6/HlzRtcGRtbt3/Pnv/jcLG0pbli9H9I9JozQso6xlSwMtaZW5ST/gn4zrx9vnZzgEooqCloPgqM3p1cf/7a9c2RnxODq6zaV6PVQjkOeT9PojVBEKCkxPX9Nqp6H5d9CTXFhl9txSSyZ2lIjLZrg6MIW00816VSKhE2m0zPLzB99y6PHznM3/+932Pf5s1kYa+SoLqMaEjf92x8tA3cBOgkJoliXE9glCRMLPJqhN3zfn7hMv/2P/4RH372GbPVKgMjozi+1Z7OaCiyraNtrLRhele0gZv2hSwJMmWWEbXfslN+KpRg0gyBENZt1iSaJIkxOiHn5Mi7LmjNzNwsYzdv8rs//B7/+B/+PdatXGWpFIAjJa60xdb2HArPy5PhvrrrPUxiq4Tkej7C6TyZLEAOgPO3bvP/+ff/gU9On2LNxo0UDbRaEdNzc/T19tPX28fU+Djjt2/j6ITnnnyCP/jd3+bIzp2UsDs7o2NcAbl8kSiOCYIIjcBzwHMcmwnH4LX1vrvpSmmfppKn3Tn87GmXi0Xbb9j85KaVq/j+c88xNTPHn77yKotS4ubzNoZJ5xHXda0vRhCQy+VQjiKOWxitU08Dy/lHZHQmCdIi5Tq0c7ty3XS8QxRFgMGRtvZECIlJDI1ag/6hIWQYqjM3b/Ru+PTM1udW7hh5d13v7VuO1HRSsf9LQP7127fXdv32zQCB8IlNBcM80JMkw2sX5/9Wc37u6YVmi9ygwvE94mYrjY+67HeXTHZfcfif/4Hl7CGsbnAS4WiB51mR/7DZJGm16C8VGRoZ5di+/exat1RRhXTBXP4iQQcBEEKkdJuQqNkER5Er5BFKsRDFfHntBh989jnvfPwp1+6NIV2XYrmEUC4mNShqKyWIZamujp89Ig2yTdYxJkV8HwDeZLt1k06ebs4HY2jUaugkIee7VIpFgmaD6vwccRiwYqif3dse5omHj7CuVCZEo0wnNQ8C0k3I0pN2CoAy23CjDXEQk2BtnD0laCUx16cm+cmbb/KjV19nvtFE5fLM1WpIR5HL5a2VchBSm5sjajRYOzrK44cP8/yjj7J/3doOTUAI4tByYh3Xw8/laQURs9U6k1NTRGHIhrWrqZRKxEknlbekZZ39IPArTZlmqJREsLJc5uCePZy9eJmbt+/SqtVY8GbxCwWUcYjjOK0ftehkrDUqnYgVkGhb4IewgbY1mMlUE7pPnSFAgsyEJmtJlCCQONLB8XK04oibU5OMnrmw+ujA6s2f7F05Nvnkygb/31Y6OP6TcPsEZK+RSJACsxg6Zm7BM08EIYeIiYl2bzXrD9wbfz5+5Y3nzrzxzvE781MVk89TLJWIpUxdVCWJBqOTNOWbZToy50xQjsJRKWtba6KgRbXeor6wiNEJK/oHWLNnNyuGhtm+eQt7d2xn3aoVrBsZpsf3l6DgRmfmUdn7aL03jRQYYXMn7UJxY1PRSVo0KtOCPWuI0kVmEV2XzdKPs29q7D3q1BFUpCo7jnTodUuM5kvoAVg7MMzWteu5PTbGyXPnOHvpEldu3mRiboGZyUm0msHJ5fBy+fR9ckjihLAVEjSbqIyWJW2msFlvIbB1KIV8zro3BgFhSpG7dW9Mun7h2QHf9x+R+meXV65+7eRTj9yeX/Uvo/yP/lR5r7/my7t3iSBUqYjQN23ZO+2GCW6tRdKsf4ujpMdqBolMkkaiTdMFf9PY5E595tTOc1euiAjwKxUrLdmeu22NktZWrztTQTFddR3AV0yzZslXWUZCpnJyOors/CQlSRjSWFxERBGrhod4+MBDPHboECt6epCAkwZjS/CC9lhjSebRaG2zRK6LSVF5qax84GwQcObiVX70+pt8dPIUc80muZ4eRC6HUcoCKtlas3Sl6Zyie640GZ6b/s6STlk6eWptQAryxQI60dRrNZI4ppjL0d/XTxyETE+MU19YJO86HD92jJeeeZqDu3aRQ+Bm50/7YkmxbJsSagudkyii3ly0Phaunxahkhbk26utAe998QX/8ac/4drYPSIpma838PMF/GIBT1u64NzMNPX5OQbKJbauX8/3n3uWp44eoZzShkyqepUkMc1GA6kcXN8WcN8YG+fuvTHWrFvPisE+Ym3Sje7SkdLJ0Ir7WZ6mI4dotAal6Mvl2Ld9Bw8fOsSFy1e4OTVFdWGB3v4BYgxBELSzDUJIe+86leBNN946NT1USnU9JQvmGbJ6l4zm2fVg0+XSSec5Y8D1chgDU9VFNty+tXn9zWtPnVx34FVU4S4MSVgw/2nqFL+b9p0H5AW357s+xf3NGJI4dHIqb/KIuAysbLZGqpMTT7eicKh3YMBqjmcWxUpiUsMUozO+WXaoZbqeX7MJIeykJayiglSSfM4nbLaozs/jas3mDRt54shRjj60H4+uSUF0hunyNFjnHu0HwlXEgabZalHqqZBTijpw/voNXnnnXT48cYLrt2+RKxYpVCq4vk8Ydpn7tA/W/e+y7uzeoXz1Hbe/0thgJZPEsk5rAZ5S5F2PnOvSWgyJW01K+TyPHjrEb33vZXZt2EBIgoNFKdr3LJZaBi/pCZ1emxJtqkqYJEhlbZo1cG1ikjc//IA/+vFPOH3hIqs3bqEoJFMzsxTLJUqlIq6jmJoYp76wwIqBfp557DG+9/TT7N20EaerZ6SURKFNVwoXFIJ6FHHm4kXe//Ajmo0WL77wAkcO7LlPiov2hNi5/qWLr/2htste+pCV67Jm5UqOHjzAnfFxPjp5mrmZadZUNuAIh2ZK6xHGXp9ObFoz44Dr2BCEgUXm8vm2rvV9F5GlNbOgIE3/am0II5tJcXI5/HyOsJ5wc2aa1WfO79g7tOp7F9ev/JPJ4dx1PCRNoPANUQsBIgYZLu+Ur98MCJ3mup1yxb5L+ZLrbqv44pm+kEOQQ5c2nj79/Oifvv6fv3Xi4+0XxscKhZ4KQyMr8PJ5ZuZmLH0tdcakjVLbgmXpWEoAInXTTNVNwjAgajbRUYinJEODAxx/zKoEDfb1smndWlb29uBjF3yNzaSQIuDtIjWZIohtw6dOIrh71GQa4taERZECUraYsv3zYkmwtfQdsk0abS1c0uDeJIZESoxStoAzLRMdLBQY3LiRvRs38tD+/Vy+do2T587x6clTXLx+ndsTE4RRhNSavOva4NtRaCUIooTEZChsqscexZbi4zi4rker2aRWq9M3MIASMLlYpXHxwtCmWvXlA2P3VpknHpdnDx34j2xeN6E3b6QeBK7XaEZetRrHUhKnffVNWhIHRH6J2kAZf7QXdIlMZ/2bNhGEiU503a1UKCZxX/7yxZenL50/NjY1hVMoMlSu4Dl2TMWpKZwQIi2WNG3KyrfZWLSL7F3HFvGGIbmUqrK4uEh1bo6BYpEje/fx6OGjDPf0YAV0Lalg6by6dEWA9j60HfgKpZbAkrNBxOfnLvKjV17l7Q/fZ6FRp39oiGJPD41m02bdsuzpz7uPb3Hv9v4BI3CUS6xDwjBEGI2rrGrRXK3K/PQUcSvg4JHD/N7v/BaPHjrYDsYzxaxl9fnpl9kmAiSSBFuo7Ht5VGquZwNy+2szrRaX7tzlP/74x/zZq69QHhxkeNVqFqs1hONRyBfxHIfZyWkWZmYoui5H9+/nxaee5MlDB+lVkthAGEcIo5GORxQbGkFAqeSBlMy0Wrz10cd8/MmnHDt2jCcee5S+cpmiq9LCy/SO2rFLphWXFWMuHWUCCwhoEoxS9PkeB/bs5ta94/z0nXe5OTlJqVzGCIkwhiRKrCKKI9MsrKVGKsfBUYowSBkHUnaOT7bfyq7nK6y/smSe6MRQMZZK15qb2mbuXPlNjwNXUPm70G9gyFjP3b8a7TsPyA+t3Pddn2JJszsrLbg77t/rW6lvSxnvBTZcn6xcOX1G3ZoYp1Ao4Ka2rRlFJUMHO85mgsxZE/jGQXnK3m0jywKbvm1FEY1qlb5CgfVr1/DIw8fYtHH9fXmX7KXpBreW4gqdzx3XtXJ8rksITM4v8sWZM3zw0Ydcv3WbIIoo9/VbOccM4RYdoPsBndhZlLL77kJUlxtVZJ+1kQ6j8XI+QkoWFxaIo4hCzqenVEQZw/T4Parzc/SWyuzfs4cnjh5j1/pNDBWKKWqVvqwZB3zZPS/5SqQFpBlvHJCeg+fYhW6sWuPjU2d49a13uHrjFiiPME5Qvku5XKFcLiKNYWFmloWZWcp5n707d/DEw0fZv207PYVCasDT2ZQ4nksiBKGxEnfj83N8fPokf/bqq1SrNSIpKZWK7N68HiHtJJ4h2Bma3+nWFJWWsmuMdRYBg0UMej2P7Zs28dC+vVy8cZOZO3chjkmMIQqtzX3O83Fdl1bQIooiDAbPc9uKH1k63HQ98/sepVn6YXsiT01gpLRFelGzxczcHPX5ud1e1PoNBSfIieusEJIeEtbxzZKJHriTUL4EKv7mJaESaIFZhLCyfY8e2H9URBE5tWWd0/9bLwbX1q+JB4LWit8+f/ZvtH70s7/x4w8+3r0QBF65r5d8sUgUh7QWQ0xicJUNKC38aCU/dar9L5XlTAqsc2GrXqdRrbEwN4MrJKtGV3Dwkf0cOXiAPTt2sGHVKL4QFD2vzYqNUkUnK98pQDpLbyR9AFprYm0lMS1SaoslVUrd8pWHRrcRKjvGusKrdvarI3tqpUuNrWdJsyFKKpSrlgWi2WbEFveFGrSQCMelL5dn35bNbNm4gQP7H+LzU6d596OPOX/lMnPVKjONBl4uR6FUxs/l8d2irW9JNEliaRXFYsluZFIFGMdx6O3tx3UUUdDCCMHY9DSNRj0nTXJ042Bv9fdNsvjmnr2vX966deLmf/VfVXNPPEH/p58ylctR9X2U+bqDzTZjNEIqak6OoYEVrB5cYeUHk2/OfonSDfGakX5WXbgx7E1OPdMIg22ZGpVVlDBpP6RAUPrOtwsVTZYV/QZrTQbeSDs2iC1Nw3NdTBTRWFwkaDbpX7WKAwceYuumTW2AYemr3j33LMucZceXDomOiaIIqZw2zeXKjeu88dabfPjJR4xPTlLs7cVxXVvMt/RS75sO2jFwFwi1dJOw/AjZpx1BYmUNPWg06iRJjO+75FwXV0lmp6eYm5rCl5JNmzdz/NgxHj14gLWDAx2ENj2QkpZa0b2+dZ8xCzrL5UpakwOxrUjFUVZd5trde7z+1tuc+PwUC9UGud6EQqFEj1Dkc3mEMdQWF1mcm0EmEevWr+XRI4d44tgRVg30o4E4ilDCrusGkK5HuaePvOOyWK/z4eef82evvMLnn5/kzsQUvu/zwpPHcVA0TYZNpS+8tt6dMq1P+KpmBQ80cWJwPYe1q1Zy9PBhLly/zs1792hUqxbh9/2USpe055Vs7HYWlkzNRXfB8V+/GTrHk9Ii/GEcs1Bd7KnPTh9dk0Sj0zLhHrNxwqT5dgICv5rtOw/IF4M/v8nHN2maBMe4rEzycZVSFAjJYBhtGrx04fDnZ84UJmanqaxcbaUDu6zmu4Nx+OYB+PKWxJYbp9KCTiklcRAQNhooYM3KlezZto0ta0bJA2EmYZj+/lcF4lkTwiIWQRRZVZR8HiMlNyanef/ECd56910uX7lCjKBQKpHL59EGoij+hTHSN/n+g66tjegbTRIFOEJQKeTxpaQ2N8f03TF6SyUO7dnDS88+yxMHDzJcKFjUJoUqtE4nwHZB64OvRKSbhyQtJtVC4CpFDNxbWODtjz7hP/7kJ5w4fYZEKkZWjxLECb429Pf2opOI+ekZ5mdm6CsVOHb4AN979jke3/8Qo4UCkU5oJTF5x0VoG9Aq1xYnVYMWN8bGeOeDD3n30xOcu3aNRqOJee01Kv195Cpl1o1ap9UMHFie7cgyAA9qdgGzGyEH2LR6FY89/DCXrl1jZm6O2vycNZ5x3XYxnVCd1HeSJBgcHEe1OeFJknyz+TGFNjKJvTiOcR1bjBVEETOz0+7CxNj+kfHa4L2tW6n+b/6hNj/5I8OXtyDH/dWJX9VckE3IG1sO+nVCou5pWIKT4kIJfWuJ1h+WgwuTeb1qZXB1/ZrGChhd99kXv6N+9up/duPDDx66MT/PwOgoPb29JIn1A0gSjSNdpFCkPAKMSOcFrEyX73pgtKVc1WtEQQtPOaxfuZItGzayZ/tOHj16hF1bNjNYyJFPu1CbTomDgA7/XGQa/qa9YWsbu9i8MCJd/LNAPLNGt/etcOWD39nuTXv3v7YIXLXPC3SpMdCmLNlNR4YeGoTRiCTBU4py6lw4smkja/v72bhmTUpluciZ8+cZm5qitrBA38AgPT09eLkcQRjS0gHGCFzlWrfZ1MBICQevkEMnln+ey+WJooh6HHL25i1kGB7ZODGp9oZRITh86E9urV49E+zaZdy5uaLu6WmFxWLifFMdcTuJEtYWCNasZOGhI6hCER1+c4MgLa2O8qbxydzK06c3j50+tWJ8YZ7BwUFkLo9U0lqGxzFa67ZjIXQ25X+uNadrY+86LgpBEIZErRYDPRX27NjO4X37WDs0kA3t+5DSrzx09oWwmzItDK6UVOOYmxOT/PTNt/jZG29wZ2ICr1hkYGiQIE6o1+ttY7yvOmaWibs/Wl+ete0+xrLjCbt5bTabOErSUy7hKUlzcZGpe2PklWL/rp08/cRxvvfEE6zv77OFBzrpGCel4gPtDc6SK+ngy1IIHMfDGENsEhJhC3ND4Oz1G/zotdf56RtvcG9qioGRkZTgJujr6yMKQxZmZqnOz+ML2LlzB88++STPPnqMjX29SCCIbAGnkh15UUfYotSFMOTd02f4Dz/+CR9+9jmz8ws0Tp9iYGSIQqXM0X17GC4USLCGPEmS4EqJqzpI9QPjCSFAKTBWelMbGC4WObBrJ+f27+PqrZuMT88ghKBSqdAIWrYeIJ2n2ls506VQR6eY9OtH5OmKpw1JCrQJKVM9dsXUwgI3rl7tHTl5av0OL1+c/Ft/p5lMzxmKf556pV+t9p0H5CfH/+S7PsV9zRW+8Z1nWvT0IoTEm7t3yNy9+szczGSlEcUMep61LE/0UtS5KyCHDFn6ppOk3bnHaeDjug6e72F0QnVhHh2GjPT3s3/XbnZu32arzLGawU7Kx7NH6f53KWqRAsfEWlNvBVa/U0lmg5Avzp7lZ2+8wdkLF0Ap+vv68ItlNIJGEBAlCarbQfMX3l4nilgCQAnR/d0lhxMC4jBAYCjkfHKuiycFjcUFGosLFByHPdu288xjj/Po/v2sKpXaVVkSa+muU6MII4RF+r7qOUjrSBcnMVpYtFEC4wsLfHzqND967VU++uxzImDFmjX0Dwxy++4YSZLguy4zc7MszsziYnhozy5+88UXeWT/Q4wWS4QYWq0mItFQcCw/2xgcoJEk3Jma5rV33uXVt97i3uQkuf4+vJ5ebo2P8+a77zE4OMixgwfYsGolvhSpY2MnPZql5bp7emlepPN1CBSlZOuG9Rw7eJAbt25x/uo1RC5Hb2mYIAxtvUJsC2QymU6trQKB67pWmk7rjjqB6d483ffE2/9nx7GbUjNCnEI+rYLPM1mvc/vGDbnjy7PDzrNH1dv/q/+bjs8k8Ef/w4Of189pJr3PpfX6X926eymxAbmoQDLVVLSiCms2DYiFLZvELa0rv/vlmd9d99Of/ud/+vHHWyYWFxgYGaZ3YADpOITVOkbbgNtxHXRiiGNLezKkaDIGJ9UaiKOAsFGnVV2kUiiwecMGDu1/iGOHD7Nl4yZW9vfgYSfXCFJ+eJpCzpxQM56osR4FURKnngcgUllAmf1cKuCjSfnCy3jGetn/dzpo6WhashEUtvjKYOziHceYJEGkSKFKkXghFY5wcLLCNWPtt5uRQTpWenXd0CArhgbZt2sXp86e5SflMh9//jm3x8do1hbxXYecACkMSkmSxBDFiZ1PpES5HghFGEaEYQt0gp+znP4gbDEzOcmn165VJpqNpx5B0++7zX976MhroeMsmCgqi2o1lmGYyG+IkGetVK+zaAS3esto14Wi/4t/6Sva6ol4XXnizv7Pzp0rTS4sMrRqNRFWNjRTU5Ht4nTuk/Fbvgb94iba80kcJ+0C0TgMiFotCp7Pzm3bOXLgAGtHh/GAWkqPcdvr2/3nawNTaYSq2wGWQDouMXBtfJw33nmH1955i+t3blPs6WV45UqK5TKNmTlazRaFYiG9ryVH7778DiItTHsuuj9o7M7+pHzorg2z9cFIcJRDzvdIWi1atRpBvcqWLdt4+vhxfvjM02xfucKuNUkCcWrmpVQ7GL//CtMg0WRBOSA0idFEBoQS1IHbk9O8+d4HvPL6m1y+cZOeoSFWr1/HxOQkcRTjKpdafYHq3Cxxq8XuHTt4+dlnePbxx9m2coWV5kkdhXO+D8IG1UhFgq1ifvfkF/z7P/tTPvzsM1paM7J6NWEQcvLceZsNdR2eOXTQouyJtuf1PH6urU97v2MlCI2xyluOUgyWSxzas5uL167x9vsfWLllY+sIJLSLQUkDZ601CTZjISSpoABfKx5vb8y6/tUmNXcTgnyxyHy9zpXr19WaV97Yt+KlFx6S/9d//imu++3tdX8F219NlZWch/qbLzLyOy+wfUGKnpuz+5rV+UdjrYVwXaRyII7Q6eTYLqZZkuIV7a+/UWsPJt0erBJrG1uft8HolvXrOXrwIXZv20YxLQSRwqJR3QvmkrZkDktHuZI4OR/f82jFMecuXeTdjz/i7IULVOsNCj29OH4ejU352PXvqyHL7pfWpBN1+1Ve8kaLB/5O+7sCWq0mGMPo0BCOgPnpaabu3aOSy3PkwEN87/kXOH70KCO9vQDtIk6RBqoqRQ87RSlffdVJ+seVDkYIGsDJixf50WuvceL0GZo6YeWatQjPZ2axRrFcRmjN3PQ0UxMT5JVi17btvPjEUzx+6DBD+QJxEtOo13AdBz+XSyNoiXQVEpipLnL64gU++PxzvrxyFa9YYGjNGnzXZ+z2HS7fusUf//jHBM0G/hPHWT08hO86xNDOzGRqGUvvbilEYx+DsYG261GSkn07tnPq/HbOX7oMcUIxlwMBzVZAGFhrYuU6qT66DaKz6vdOtuEr8ZJlvWt/xHEUUWit2D3fw3Fd8qUi1VaTu7duOWsunN4/uGvTHlYMfolS38o+LQIW6HA6v6ppLIpexkoEWkoRUVgcoLbhURMXtyndaKkPn3pkZtvWgTW//elnzxc+/OB3PvvyzO6J2RkKgwMMr1zBQq1Oa7GKoxSu66GkNdwyxiqpRKHlOefyeTxXEYcBs7PTVOfncIVhuK+Phw8c5NGjR9m3YwfrVoxQ9nMIbSxH2lW4UqKzh7ysFiJJ61WQlv9qRR9FW8vP0NmcRNgsWvYMojAkTm3Fg6wmJH1nMklRpWxmxHVdfM/+q5SVNHUR5AAHu4k1ntNGwgHLFTUWNRekNR3pXOkohRTGGnoEBum45DzJ6nKR0t7dDPVUOLR3L+98/BEnzpxmdmaKmZkpipUeSj295PIejUaLONFI6VDIp8V49QYCjaOsSpLn+OScIvlKmYWZaa7fvcuKUumRDRcutr6vTRSsW/9e64c/XBQff+w4t27h5PMBiYacBwMV8N2UqP/zm5MDVfK/PpD3c1oes9ULWg/Pzk5V5poB/TJV/Egzpq7b0bPONsjAEsraNzU9yp6bThI8x8eVgvmZeZJWkxUD/Rw5+BBHDh6gp1gkNIYoCKyqi1KdF7zr3pd0Q1c9VQx4KUByZ36e9z/9hJ+89hoXrl5F5Xx6BvpRnstCdRGNxs/n7GjW93dtVieVbSayH7gf5un6RECWcmtTXIQgjiJ0ElMulsi5imZtkYWZGWgFbFy31tZyHD3C6oEBAOvtIQSea8k7ois1belcuv2uZnG6EbYiI9YxQauJdFxcN4cDXB0b59V33+O1997l+r17+OUyXqFIK0rIl0okUcTMzDSzk+MInbBh9WrrtXH8cTYMD6OAZrOBktbBUghBK44Io5BKvsRCs8mnly7yJz97hXc++ZQoMfQOj5AvljBa02w2OHHyJMOD/fRUyqxZuYK+Uolc+q4uf6aZAlj3fVuwQCKNptVsolxLddy6cSOH9+/lxvXrXL97j4X5edxcSo/tqoVw0sLdOK3fsjz2ZMm5f/Go7mInmAyssLSnXCHPQq3KzNyskrXF4+UovCyMOU0mZvtXpP1VDMiF9pUY+50devNjjth/orrOOXV1062pCeHkfAqOi8YWRC3nh3dPhN088m/jCifTCmNjbFFj3GoRBwGjoyMc3r+P/Zs3068kzSRGG3Czn+frrQtJet0Fz6OaaM7euGmLOD/5hPnFRfxigUJPBQ1td8FsJ/ttWxacf0U5RrvZDUZalGkSgkaT6uwsnhTs3bGN33z5ZZ579BFW9fYQawgiW4CT1p90AseuYPyrnoAFbSRSCbSQTFYXOX/9Oj96/XXe/eQT5mpVegYHKQ8MsFhtUF1cZLC/j7DVYn56moLjcHjfHl5+9hleePhhVuQtZ7wRthA6wXVyOK4HiUYoSUNrbs0v8PaJE7z6zjucuXSJWpIwVChS6Osn5/kMGbh58TxvvPE6Zd9l15bN9Pf2UE6LgNph8IOysV9xk3EYYQw4nsfOTZt45MABzpw+zc2JSeqLC8hcLg2aA4SwmRnHSRV4oghHWUUQJTqI2jdq6QKYWYxL36NYLjLXrDM2MeaLO1dfLM1O3BArBi8iVUwnpvzaTfP1Z9cYO3kltAPyJFyxisbf/gfoyoiRTl16a3rdtVNjj+x4591/+OknH+/7YmICr7eXysAgWkpaoXXeVPkCGXUkjq2zrhQSLUBIuygbnRC2GjSqi+SkYOv69Rw9cIDnn3qaPdu3M5KqpkTa8qKJk/a7Jru5KqLTl7boW7T/PzKGIAppRRFBHNMIAuZrNaqLVeYXF1mo1mg2GtQbDYJWQJTaToeprnW2eZVpYahyHPzU2TOf88n5HlIKKuUSgwMD9Pf00VMs4StF3rcbe991yWXoubGBsUiDskxjXSDSzaRF05IoAhxcVzFcLDK4cwe7d2xn/bo1DA708enJk1y6cZPG4iKe55NXjr1GZdUWlONgdEyiTboRl8Ra2/S9o8iVStZiu97g3MSU75w8dWzr5JSkp09f3LHjz+rz83I6lxPFXM4G4TOLcPY6LNTB+8V6+KrVojEBppmHQgHCr6kMliQIx6F/7TD+ikFaBvxabXez1Xy4FcelIEnsdcc2UHFSrXoppTVASd2NHwQKfZtmh5Z1hK0tLNCTz7F140YO7dvH1pERu7GLYqvG8bWP2pmkhJSEwGy9znsnTvCT117j8y/PEBqbfSxUemiFEQuLi+RyefJ+jii2sqFff6+Thendd/XVP5FlGh1H4LsOSRiwMDtN3Gyyec0annr0EV5+5ll2bd2CI6AZxQjAkdlauDwfSFvUwS49ov2ffVEtpcNRDqHW3K0u8sYH7/NHP/kxZ69cJVGK4ZFRjHKYX6xRLuYJwwbT4+MonbBzy2YeO3KE7x0/zu7UtbYVttBhgJvLWbAQOya0dJjXMScuXeRPXvkZb3/wAeMzs6xcu5ZipRdjBDnPZy4MuX37Nq+/8w7lUpHnnnqKvq3b8BwHozWR1rhLfDLSns1uKd0wKsex8x3YbBmwuqeHI/v2cu/uXRbeeIubY5MMjo6SL5dtliCJEUbiedbMLat5aY+vb7LJTYMfmVH2TFbsLHD9HNJ1abaacm5hfm1xbu7oUKvVd9vzFv/qMMj/agbkMgF1teCFPvRsH/ts98Tlz4evT0ziFvJ4Xg6dIhOdl/p+mkp3GnH5z/zcls4QrmsXAh3HNMMAE7QoeC7rVq1ix5atllMG1Kp1cq5LrpjKUiznEpplx4YlBZQecOvuHd5+/z0+OvEpkzMz5CsV8uUK0nFpNhq24Egp6xlDt57+12tZkY39LbnsspYfyy7g5UIBaTQzk1PU5+dwMezatpWnjz/B0UMHGe3tIQaiILQpMNW1RKivWi7SdH3WR0JghNNGFBejkHPXrvKT117no08/oRmG9I+MUOzpo94MCKIIIQXNWp3G/BwkMdu3buX5p57i2ccfY01/H4kxBEEDhaFQKlk+sdHta5qvNvjgkxO2qObsWepRxMDICLliiVqzSa3WIJ/PUfBzVOctz7vearZVSpSgc68P2n2ZZV+nYa3QdqFVQA+wY9MGjh58iKk33uTO7VusWLuWXD5v5fCSjqNdVsiphUDL+ylYbfSiG8ZIz9td3GSSNChzVBvtdX0fpCSIIidJ9EYMB2kTLNpiIt8+wvg5TQPV5R8OldC/vQ82r9PFxQY/uHjpwIpPP3nhi5s3H7owO+MLx2XF6jUEScLde+P4vm/VAxJDGEagUyRMSpRy8JRVEQiaTVqNGjoKKOVzbN+wnuNHj/Lk44+xd9OWlI9qiIOQJIrxXYdi3iflrpFJ2RkpUalhhsZmxRIs+t2IE2YXF5mamWFqbo75xUWmpqa5ffcuk5OTjE1YS/t6s0mz2WxzkdsFW6QoqTZodBsBU46ynH/XxXUVSZKwYnSYLZs226C8t4++nh5GBgcZHhxkaGCA4Z5eCo7VC19ieAWWZ25SU5tUJQUhSOKEqBlilES4ipwUHNqzh3yxyNDQEO7b73D55k2q87NEcUy+WMLxPJLEELRagCCXz2GSGLCFn60gJA40ruvQMzAAPT0szszw5dWrvSBeWP/FqRs9Rn7S2LZ9YvHgwaAeBJDPwydn4V/+GXx5Acp9v3gwGTDqU4z3h99sG1ltIPsr7P1nf42tv/kE89XmQN+t2+unqtWy8n18I21tgu6AO9DZ1GbBuJNSCONUjeSbZGXbxJK0QDhJNHGrRRJG9I8Ms3XjRlb096GAyFg6Qd7J3b8GfEUMbKcDgZECD5hqtjh75Spvf/ghZ86dwyjF8PAwfYNDNFoBjUaTOE5spklk+R6z5CRLQu6vdavdK1AmkZA1Tc5zUcIhDlrU5udo1WusHBzk4YMHeP7pp9m7fTuuMTTrTYQ2VIoFK0tsdAeMw7QDVbtBetA6aVDKIZ8voYTgbnWR9z/+hFffeovzV66QCMnA8DC5QpFGKyBotfAlNGs1omaLtWtW8eiRIzz75BNs3riBBIh1jEliHClQwubENAJPOgQKTl28zM/eeYePPj9JLQgYGB3BL5asEksYWpBEGKTjMDk1yeXLlzm0b5+l5ChFKwgwSYJTKNoMGss057HjMQwCXGNwcz6FfL5dZ+AAKweHOPzQQ5w6d57zV64QBb0UyiWUkoSxQZsYKTyEozCJbMdWbZniZevcAz1cUjfprHBdGJHWQKWFzlLi5nLEQYubM7Nsun6j5/F16wZP5PM3L7jfxoTuV7N95wF5mZXf9SnSZnexAXdMgImxknPDpdrUY5fHb6+9NzPDwEorbRZHiX0Zu367GxHvRiu+aRqxjScoS23QcUKr0cDRMStHRti/axe7tm5lsFREdPN5yVJjv/A2UzqJXcjrwNlrV3n/k0+4fO0GrTihr1Sy8oaJfbmFVFajNrZOnmKJPmj7zF0IeBd1Jg3iu3l9y2PG5UfCGIvG6YSx2RlEHLN1+zZeev55XnjqSdYO9NsFItFWx9lYwwlr7bv0ytrHN3ayMkZbPdMURc8KXxpxzLmrV3nzvfd46/33uXnvHr3Dw/T095MIxezUDPlcnp5ikdnJCZwkYufmjTz/9FM8fewYa3oqSAy1ZgNHguflkMolaLYwGPx8nplGiy/OnefdTz7h09OnGZuZpXdkhErfAEgrMdasNxjo7aNYqbBy40ZWrVlDpVTCUR10/EFtCWdzWZMSPNfScYzWICXrhoZ44pFjfHH+PJeuXiVqDVMsFsH3CaOYONEdR0Bp+3XpmF6aeWif9asvEJkaBhljnTutLm4O3Wxwa2qS0oXzpb39feWrzz5bmy8UEtKA/ee2QgHm5+EP/xDOn//5P7usLUNGBI4ylHOMAnun721ecfni35k5c+YHF25c82taU+ztBcfq7jqug+M6GG0pPa7joTzHLgLamlzliwVazTqLc7M0aousGhni8P6HePrYMQ7v2smm0VGKQL1lNbU9+6AsZ1anqkQpCiekaPP6wSL89TDi7vQ0t8fGuHbrFtdu3uTu2DizCwtEOqHZaFKt12kGAc1WiyiyVBoNCNcGwjKVhcjk+rRO0gUx5SZrQytKUNogI4EQhnBiiqlqHc9xLCXLcegplRkdHmLVipVs3rCBlSMjjI6MMtzXS5/vk8ueY1aIqNMARhu7YU0SZOqkKBKBKxU5qdi/fj2DxRJ9lR5e/+ADTn75JbMzM0gE+VIFx3VoNkMSY1BKoXWCI6wxTRzZjZJB4Hk+vp+nulBlZrHOlZu36SlVvjfU2xvt7av8q7hSPjmVz9vx7DjQqAOzUP06WLDCsnTnySpZvl5bxMwMcq0nR09fb3nztZu7Zi+cX3X5zm1ULkc5X7SCVlKg0mNmCivZe5kVd3ZvoLs3QV+nZUphjpJEzQZxs0GlWLBFxjt2MjowiAB0FFrTliyA+boYk7ChkgRu37vHa+++wwcnPmV6YYHhlSvpHRyCVEFMI8gXigghiML4Kx1nOxSUZd/MPr5vU9D5vlkW3DlSooRhvrqIDlusGhriiWPHeOHpp9i5fj0VIBICJ30WWZxtj3t/mrJbBYu0UFEbK3YvlYMrYLxW5YPPP+dPX32NT06eohlF9AwOkSuWaEWhXTNch9rCAiKK2LR6FY8fOcpTDx9j94YN9CtFGEfo1IXT8X2EEiSpE0kA3Jia5Mdvv8mfvfYak3Pz5MsVevoHaIWpeZtni0uDVkASR6xYu4od27exYngYV0qaQQDaqkZZ/4yIOI7xfH8pACZsViqlyeNKm6GKogjlugyUyuzbsYNd27Zx8sxZTJIQtloo37O+ApnsbjoOM3rWEnrsA8aawbSj8+X7wfbqlGYRY61xcz46LnJ7dpryxQu9u1ev2nN9YOA2g4O/RGvn/7TtOw/IK6z5rk+RNrsoNYm1HOmlKV1yMauU0Y/Wm401i406/UIilCIJ4vYObjkl5c9DU+luxlhUUipBFAZ4UrJt02b279rFqqEBPCyqls/5OCnX13QFSl9xi1a/GPvgGmHIhTt3+PDkaS5eu04zSSj29OD4OYIkoRmESGWLw7QBhG5Lof3yW2aqYK2Ng0YTEUf4ymHjhvU88+STPP/Y4+wcXUEIBGkq3PUc62gaxdb2GbFskuxCV2yen2waNQYcAbPNJhdu3uDVd9/hrQ8/4s7kJCpfoNTbh3AcgkaLOArB83CEg0pitq5fxw+ee45nnniczSuGSQzUmw20jnG9PFI5JElMbDRBnLAQN/jk1Bl+9PobfH72LLVWSLmvn0K5DEqRpMh0HIbMTk6wYWSY/UcP8+TRw6xftZJizutkQB6UhjWdFOJ9t28EfqakojVaSirFEg/t3s2ebdv4/MyXmCQhaLWQKTXFGIgy3qrjphQETZK6qX1jGU+dIIRVcEi0IQhDPNehUCwSY7gwMcG2Eyd6Hqn0bEsefnj25Msvf31uX70Op05944B8WROsHjH4Lg/NL+44+vYHv3vjyuWXvxi7OzhTrVLq76fc10+90QQhKeSLaK2JohCdbvCko0AKdGyJMFHYIgqaKAzrV67ksSOHef7JJ3h0715GC9ZyvhFFhK2AvOfj5137jsapmo2jrIthioi3koRGFDNXqzExPcO9yUkuXL7M1Rs3uHztGrfv3GVmfp4wjvByORzPw8/lcH2fXKWHSi5nHW5THrIUok0y78QPGp1KVGqTqah0MElHKprNOvML8wStFmH6RxhDpVxmsK+fNStXsmJ0lPVr17Fl02bWrl7FquEhenI58q6Dn6KxWmu0iRGxtm6jjrVTR4BOErSUFB2XHStWUDl+nEqlTMH3+eTkaVphSKtewysUEdJuHJIkwpgEI62LrC0sVSSJJghjJIpcoUygYabR4Nr1a6vdfO4PDqBv5XQy8frQ0GzV9wOExPoO5rFSP7946NAm5WTY4NdpDloMiJtrNhh3cKBnW9g6MHvl6urL16/Tv2Il+UKJMIwtpU7S3ixBZqKilhRyfjsRAdoFukoIms0WOgxZu2IF+3fvZtvGjfSWSpbimL77S0jbP6dHsulWCEmEoYrgi0uXeO+jj7k7Pkm+VKZ/cBjpuMzXqgRRjOO55DzrdRHHMa5S7aLCJai4WHquB3zM8tzscrAqk8fVkQ1s41aLkf5+jjz0EC8+8zRH9j9EXkgibN/7rkum9K4x98kbZl2/5DQ61fw3BuEoWlqz2Ap458Tn/NFPf8onJ09SD0P6R0cpVCoYYQhaIVLYotl6rcb6kRGefPQYTz76CHu3baPi+yQYjI6RxqLuynXTWhFDhOHCzZu8+u67vPrOe1y/e4+e/gGKPT1I1yNqtHBdiesoqnNzSDSbN2zgxeee5XvPP8+mlatwhSCMYnKua5WhsMpvSRxjvEx9vTN+3JTapZPEzoMpXSSSEl8pVvT1s3/XLk6dPcflm7dYnJ+nf3gI33EI2nVKsq0EldHc4IGx+Fe0TgZJGDtmlFRoYdVnPM/H7VGMX7/OvWvX+vbt2PGwV69f+F8C8m/QzF+QRqQhQdNi9MnfZuQf/TXRym00G7+8vbLoutsihasDy6O2k1+a0k0HTzeXrzv9+22C8ixcjKIIpSQ5xxY7IGDNqlWsXbkST1gL5aAVUC6XrCRiotNiiHbJ5n0Hzhb2bMkIGg0+P3mSL06fZm5xkVJPj0WEtaHesDSJQqWCTl8Ya2OviFOr2rTjll58dg9d386mxOzaLBHBtNGfNnphrFuY5yjG79whqNfYvnkjzz7xJMePPcKq4ZElJicCLKImJMpxrQZs+5yi3ZdZsI/MXBENichSojAzO/v/Z+/PYuw69jVP7Bexpj3mzpnJKTkPIkWJlKhZpCRq1hnvvXXLXYWCbfjBcNuAu54acMOA3UAbttEPBgwbfmi33Q+ualTdGs45OpopSqRmauIgjuI8JJlz7nmNEX6ItfbeSSYlUufo9j3XDoBS5s6919orVqyIf3z/7/99HPr0c/Yf/JgLV65S7h/ELRaJ4oR2tYqQFqPDw8xNT9OYuslYfz/PPPkkr770EuPDA0atpl4nZ9v0FcsgJL7v02q1GRzoR0Qx5y5c5s339vP7d94msWyGx8aojAwzX68xNzNDoVCgr1QiJyWXvj/LlhXLeeG5Z3n0/u2MVSoGSdAanepPm2BKk1UN9aKnvTNZHEUoleA4LrZtpYoaGgfBcKHEfZs2cd/mTczWGtSrNSzXwcsXjFOiMmhfJlmYJAbVXBT8p+e5HSfqpsPBTM52WhAYhj5BkqSa5DlsNHM3b7Bw/frQ1smp3blW+zKDXLzjQ/LnbQaW+d/+T0XxX/4v1cb+Ilsu3XiJZv1ffn/+XOXazAzF/n6KfRWEtAmTAK1iLCmJY4VtOeRzBVrtNvV6nUKhQKGQR8URU5M3iIM2q0aX8dtfvMqvX3qR0Uo/lULRjGOtcaXELRaxpCmQU1FsxqVjd6zAJUY9ZmK+ytnz5zn8zTccP3mKy9evMV+rgZRIx6EwMEBhcNAoB3XqJ9KskZQoYazKgyRIU+waoQ36mj4Zi9QizFhRPXOZJiBGS0mxUqFYrkBKnxDpRlopzfkrVzlz/gK5r75hdHiY0ZEhHt21i8d27WLN+EqWl42xjJAS7bpIK3Mv7e4ojeRpZApwXZeRgUH2PLybUrGMm8vz0WefcXNykuLAAIMjI2hh0Wg0TRAuBEEYoKXEcb1U3ScmDEI8y6Kv0o+II85cvcaNubn8L/orrz68fGxONZvvfrlly7Ublv1jZS63DSHTFoWNd9G0DdoB2hYUPcser8/NDczeuMnw6jW4+TyN5hxS2liW4Y5nSLiVygFmUqQAdpq9uZd1x8zV5ntLTIGjTBKWjy5j45pxxgYHyGGMa/Kuh9BGAz8r0L3zgVO7eEwBdRCEnLhwkW+PH2dybo5cqUixUiHWmlatTqPt43k5Y84TJ11t+14t8nT/uNS96WRgtRm3ljRShIkWHe+3ztjucbV1LAu/Ucdv1rGUYsP4OE/s3s2WdespCWnGdJKgkhjXspEIkjg215+qKKX38pZepROMayGxbFN/U6/V+eLIMf7dH17no8OfIz2PFWvWUKhUaLZ9wlabQr6A32rTqFbRYcimdWt4ad9z7Ni4gUpKy1JC4DguQikUmkgrbGGC4lYS8f7HH/P//lf/mprvs3z1OP1DI9TqDeozM5TLZTzXI2i3uHr5EmtXLOOXr73Ka889y4bxNbgYFZp8LmfAPjQqSrBts5lHm+dcStEde65R4YriCDeVaXbSZ1FiqLHrVq9m29YtfH/xItVqlaGRIVzXI9GaRrOFZVkUcjlD11VpNrub4mbxc7ZoBC8aC8aIzbwqHRshIfB98iWXQj5Hq92itrBQspXaZAsxcudB/JfX/tEE5IpYRITW6OqV8UMPPijidlhsnzq5/MS5k6VqGFEYHkbLrtpIxm26VXf8VqWVXn3ypYL12yY1YV6zLEkcRczVani2zZb169i1YwfrVq82xWhpAZMUJib7QaqK+arEKjFuWcLonp6+epX3DnzAyTNncItFCuU+hO3gB2GHmmIE+juHWfRI3O2aJYQJIKNsgXVchGUbw5DUkt11HFxLkgQ+89V5Ir/N6rEx9j29l1f37WPz2rWUpEWcIkFSSITsUoKEJbp8MSSJilEqwbIkljC8ZaNKoI1ahDAFZ+dm53nzo0959+Ahzl66jHZdCv0DWK5Ls9k0Fr4izTf6AWOVfn754gv8dt+z3Dc8ABi03pLS9HGisG2J7bo42iSyvzp9hn/zH1/nw88+x0+0MT2ybRKlcV2XMAxo1WpIYKBY5LGdO/nl88/z5EMPsbJY6PRjpmfdzVKk5Yg/cCfMPeveOSkEKg2ecsCu+7ZxZvdl/vD2u8xOTbFs5crUgMYE39JKi5eURmiT2v1h1Zpbm/muljRHjVK97sxFTVgWWBY136ddrS7PNRr7nDj+Fn7WgHzxMBZC8sBrUf/AwwOP3bz8tProwC8++fKLyvXZWexigVJ/P1oKWn47vRqJUuaaLMtK0+eGb23bFr7fwm/UUUGb7Rs28urzz/OLZ/fy4IqVRjcgRZ6lEGbBSzelSoO2Up1waahUN32fSzducur77zn23QkuXr7M+UuXmJqfp9luoaVFrlCk4OUo5vO4rou0LBKlTZo84xujTQGryuzWzYInNFhYWL0BeY+5kNZ0NnGQUSIktusghZFZTetKDQ/cD2i1fZqtFnG1xvTCApcmbnD1xk2+PXacdeOr2HHffWxYs5Z1K1cwlM8bmbP0ZqjEjG8DbmgT8CcK15Ks7KtQ3rUL13YoeXkOfPop1yYnqQpBoa9CIe8ZyckoIo5ipO1gOy6GgGOKbYUjU4t4RWzbLDTq3teffPr0Tt+v3//gA1NXt2xp3LCYN2S+mgD3LqJbgSERRRhk3ePuAnPX/JM2Iap/furGI2EQrLYLBXQ6P3VuAkuvF9n97UXHfyggv+096eOsE0WUhCRhSMFx2LxhPVvXb6DPdc1ISJFPoeRtdM3bugIIVWwcl1MN/KlqldfffZdDn39GiKbY30+uUCSIE4IwwuyLzXuTtIBVStntgx9ondlNaxzbxrZsWq0WftjC8fK4Xg4hJX7gk6gE17bJex5CJYTNBrWZGXKW5LGHH+K3r7zKo7t2snJouFPtJNDYogu2ZcZ4i/qxF4zqcPxBCDMnaKAahBw6eoy/e/2PfPLl19T8iGUjy8hX+gzYl54rCQPqczN4SvP0Iw/zV6+8xKPb76NfSiKl8MMIaVk4rguWNFr/6Qbo4vQ07x46xB/fe58bs/MU+/vximUSDY7roJWHThLmpiaJ/TZrV4zx2vP7+NVLL7F9zdqO74HxG7OywAGhjEwptrG2vxX2y+gmWQQthfHzyIarDaxdtYqHdu7k6yNHmVlYoN1qUUqLwasLVZMls2zCwMg3OrZtnl197zGgmZPS+EuZ+6CFcd528gWQsq82P7/TbbXGh4EC4MT3tp3+Se1njpj/ERV1CgGWo2rTMRPfyVKxtOzm9MXRrz7/TIQoVqxeTaQSoig2aFLPA3lrwQ10+U/ZhGnO0HXvvBXp6H7WcEU9z6Me+kxN3mTD2HIe2fUQ923aSJ8wlJN8zkPrFBFRymiAAllhQ/ey0mdKa8JEIW2z+F2ZnubwN99w7NQJWoHP8rXrENKiHQSp5JpjFvbETCx2ylM031F3ueG9XbgESKDJ+sbwuJQGxzXBi05Eiq6B5brGkCeOqM3OMb58jFefe47n9+5l89r15KQwgUGS4EqrI2t46+mzaSJJEuI4QgrXVEKi0zRogrRtbCGYaQe8/eFBfv/mm5y/ehWnWKQyMgy2TRjFCASe7ZAEAc1anbH+Cnsfe4y//sVrPLBuLQEG/XEsC6tQIPB9Wu02uUIB17Kw8jlOX7zM797Zz9+9/jradrjvgQeotdosNJvUWzcYHBqkv1hiYn6e2PdZPzLMP/3tb/nVc88yVMgTKyMP5zo2UshU069rmtDL21/U8Z0R7XSqJE3nmElfYwK+NeOruX/rFt54622Cdouc6xp30NQKvZMIUQrSQEkLFp3z9sW5+0p2P2zbFASGYYiQAttxEJZMK+2NXq6QVr9SyQNaqeW3HfLP3wRS6hTq0XgeOdg4/MWRf3ns7f3Pfvjdd4yuXMXI6DKUkNQbTaIoppAWN6lEGfqNTmgHPrZrG2tzNLWFeRK/zdoVK/nVSy/wt7/5DcvzeVoaRBJjqdTuIy1oVInhdWspEJYkBtpKMecHfH3qFJ9+8QUHP/mYU2fOECUJpXIfQ6OjrCj3GR30KE7VOGIiP+hc3q15/ex+GY6rBZhaEKm6CGOWwdKLRlRKBROpkZaGKE4AoziRFVkJQFg2fQODVAYGO1kxS0ouXZ/g6yNH6C+VeGDbNh5+6CGeffppHtq+nbJjk+/o3idIDY5lCj4tZcZeEESEWlHOeTy2434G+gcQlsXr777D7MIsiYpZtnwFkUiIQpUitBql4s78JW3bZAbDCBVHjC5fjqUS8eXJ75ym39rx4upVT3uoq0h7Hlm2oKKRffe2Rvc8Mz/ewgRyYLu0/cbQ5UsX71O2FCPj4ySZfJxtg+46PpP2ae/vGWc8Qyvv1gtDp6lJmdaW+IGhHg3397Nh7RqWL19mNgZagUpIZYO6SludVNnipjDjQyOwXJs2cO7KFT767DPOXbzE+MaNOK5rCpLjGNt2cFyzDurEbBJ1olBLVu+lp86uL530TSAMtuWYtbPRxPdDLNtkBi3LotVOiKMIz5K4roUOYhYaNaRWbBhfw2svvsgr+56jaDvYWhPGEVYaWEqr656VFdGqNDWoSYujRabsERMnJnNrO6Z/2krz6bfH+A9vvsOnX39DoGHl2vV4pSLtIKbVauJ5Lo4ladaqiDBg/Zo1/JNf/oIXn36avDTzQhQnRp1H9mwXhNkOzgU+H3/zNf+vf/2vuTo9w4b7thFpTdMPqDabDA0MUMrlmJqYYO7GDYYrffzihRf4T377GzatWm1qoAKjPS+FRCdmQ4zSPZmzLrAIusMl19qY8Fk9Y8MUtZrNvEIwUCiwcXycrZs3cuXmBI26UXPzcvlUNclseoI0IHcd1+T0OxSpO684vc0SRjZRoYmShESA6xpju1Y7om9gEM+2mbh5c7BvamHl41uxiYj5SWK799j+0gNyi78feo9FpG0a0bmVRRZ2bZPPTEyNFeoLY612W+qcS952SGJhdms/YRu11KS4VBEoWqOl2W1KQEchlXKJVSuWU8mlhhNKpZa2mELGzrGX9k7LUoeWbSOEoKU1R0+e5Msj3xImimK5D8t2U7dKOnJqGmFSbhm6n6bQSRbXqZszLz5fZ5EWgiiODcrleUjLIopjglYLS0rKfSWEhrDts1BdQIc+y4YG2PPE47zywgtsXbeWvvS8xn1T3OEqjd1vrBStoIUAPNfDtkyhne/7CCHJF4vYUnJ5epYDn3/B+x99xMXr17ELBbAsmn6IsBLyrkvedanOzRE2mlTyeZ598kn+9le/YGMqNyVVYlwQtVkMhWXhuS6uZdEIIo5duMQf3n6XDz/5jEKlgpIWcwtVsB3K5TJCaIJmk1a9jogitq5fx76nn+LJBx9kvFQ0Jgloo0zSyxNN9ccXh023T1eapcHs7jQpqLgea1atYsPaNcxWa8RRZJz6pIVlqY50lMRkOrquc7cfs/dL9Cr5QNd8pqNug9HrFUIiLBvLcc3i0W6tHA6ioa1ApRljx3GnCHmp5vR5+PWA72PF3B3ftUQbGdH8Z/8Z7NypRbWW7Bpb6Wz54KNtF7/8ctvNWk2WBwexc3naUUQUJ1iWhW07qCR9/pWmFTYRlsTxHGzLSEY2alVsodmyZTN7H3uMvY88wjIT7BMDUloYbWVFHERGQ9x1sFOEKwSuz83x7YkT7P/kU748fpxWGDBfq+GVyxRcl3yhAK6Ln8SoJDaW8pkyQXonuuF4Bzno3Kgl9s3p63cwCMqOpE1QDiYQSA+8+H1ZQZvoymMmyiCitueSRBHnrl1naqHK6e+/5+EHH+DB+7bx2H1bWT04AI5tHITDCEkq5yoElpDYSiOUpuI43Ld2Da8+9yyJSvj0q8NcuXmT2alJ8sUSuZxHEEbEqa4xwtCukLJjjCSkQcwSFMLN0QrDtdVr1/7Jtq++OR31jRw98X/+n9t+rR3hWGa+zXlQLhq1JLVELxXy5vX/y38Lv/s7oERXMOhOraalRu24epXxc/Zoe74q62gs1zj5ou4dGbyb1l1rzO+WJVGpGlC5UGDj+nWsXT1Of1q8KRKVSslhol6lu7Kytx3bjCPLsrAsGxv4/to1vj12jGqzhe3lwLKNY6cy7sjIriKJ6DnQ4rlNL5pPsveKFBwzhlTCUD0aLTw3R2G0RBTHNOoNEpVgOzblYgEJNKoL+NUFWrUqux/Ywd/++lc8tXs3wylfWiUJYDJYnfW151HKzknqkG0ogxKlYhM0y8ybQFD3A749e463DnzAV8eOo1Kwqxb4uEJTKBapVCpU5+aoz89hK8UjDz7IX7/yCk89vIt+x6bVbiMdh5xjo6RZ5/wwIucak6XJRoO3Dx7kd2+/Qz00nhMz1SpuPk+ukCevcwTtNtV6jWZtgZVjozz+0EM8v/dptq1bi4MJ5mzbRWhhFIrCiJznYntmHCRxjAoVtmOn9NMuSp7dLdETGaRLlOGDS0EBGBkeYvWKFfT3lbk2OYXfamI7bupxYDJXVlY308ka3Bpt/HAAZhJKhsojMwdV3dVPdzyPKEm4MTvHxjNnBvIrV6/4evnojcmCE+X+PoLyn7H97AF5c89LP/cpTItiLRrteG7XI8wMD1mP3pzcngv8+5QwMsBaASn14e58ALutt1p4KcS829JdoDL8SZQi73msXrGC9WvWUMrnO8fIVCu6skt3blkwZAtBW2uuTU7x8Rdf8u3R4+SKJcrFEkrrFA03O3uyB6KHXpOltRPugbIizIOQqOxBtmi2WiSJopDPUyoUCNs+1XoNv1FnfNkydu/ayS9efInd92+nmJ5Hpahip4I9W+2zhaLTsrS6jW05oDVxHJNoTSnnoYTk+kKddz/+lN+99RanLl4gFIL+SoVQa/woRCiDpEitUUHAaKWPXdu388t9z/D01s2ptXBs+HvpJkZpQ4URlkUAfHvuPH/cf4A39u/n+vQ06zdtph1GLNTrVPr7KeZzJHHIzMQsOgzYtHYNrz2/j9eee46Ny5eZ8rBUKlBmKFWaFYh6JM+6W7F7bwJTtrZyeJhHHtzJ5OwcN+cXQAhypTKWtAjjGBUlprBTCuMYeU/nMDcrUcZ1zbIsU8eQpEVJrovtuuTLZdpKcfn6BIMXLo/uGl5VmrVkK7Cksn7AnMVJAC2RW++D82dhaPjHKTWzs5r774e/+RvYuhWhtdhx+OtXxz448LevHz3S11AJy1evxk8UrSAgSRSlQhHXcvHbfvqwpSi5JXFthzgyRYZx22fTpg288txzPPf449y/dk1KAQI7I7PqLBHe3aC0leLm/ALXJic5fPQoHx8+zMeff8bMzAzlFSvoHxpicGwMmVKdwiiiHYYkKkWiUqWUTGXIIN6Lt669Ac291bfc/rTfFvCnP2eP5SJPBqUp9fUzPDJK0PaZn59lYnqay9euceb8BY7fd5bJZ/bw+EM7WdbfT5/nGV+BdBGVlska2loaHWzbomJJntixnVzOpa+Q460D73Px+gRCKSrDo+A6iEgQRbH5QumGxdAtNNKyCJMElGJgdBmxRJz87rv1jwnnl0/s2XP94iuPfOnnc/PZNcg4wmo174gKk/fMvP3kw6jv56GcB/tHAvJ2iCzn2eFHG1eeOLn14MKcXY0ThOd0qEI/pd0K/tx6r7PfNd35RamEoNlgw/r1PPTgTlaPjWJjMqukWQ4QqUpVkgID4raFJ1GKSBk3Z4kh/hw+dowPP/6YRED/yHBH9cLIq6bFlcKMsZ92xZ0LJ4pi/CCkWCxRKJWYX5gn8H20VlTKRRzLMnKy83PkLMGWDev41Usv8puXX2HY8xCkLtla40hpspLZLlb0ju10IyAMUJHJM5pMl8RzjCZ3S8PnJ07xh3fe5eDnXzBZXWBwbAzStUZhMkBaK1q1Ko5SbFm/lt+8/CJ/9eorDEmJjmNUFBk6m20jbRudKPxU6/va/DyfH/+Of/fHN/n8229ZsWYN5VyeWqOJlfMMwKI1kzcnaVcXGB2s8MKep/n1iy/y8Jat9AGBTgwFTVrGpTMximo6nU+y18CY8C31CPzQvcvmiz7XY/PataxdtYqbU9O0G03cXJ6cl0OntFbHccFKayNuS8PfTVMpkGgyxGSKNNq4mTueh99ocPXmJOvOnlnVv2H9tqmRvupNnOpfOufjZ//68//2//hzn8K0rFptZAgRx67VaN4nomhLrLTR7hDCIBbpYnwvMHkvb+9Ojp4dKkh69CjV/+wrlVizaiVrVq8in8sZcC5JjNZmR96qhyKQ8dV7g/30/xZQbzY5f/ESp86e5cbUNKs3biKfLxIqRRQnaQY/LRjqQTVlZ3m/td7pTv2QXnOaRrRtx0ghxcZoxk13+8RJp6gm7zhs3bSZF555lge2bMGjh34SRbjSMmn+3vvVc31gVCAK+YJJuWlNEPgkWpMvFJFSstBocPjbbzjw8cec+P4skWWR76sQa2OaU/I80Aq/VsVvtijmPB5+4AFeee457lu/oXNlVqp7GoYRWkhs18ORkkYcc3l6loNffc3BL75grtEgX+6jHUVoKSmVShTzeVQYUp2fw6/XWDU6wmMP7WTv7t1sGV+NQ2pcIwUqjom1xkpRiURr5qsLxEqZ4hzHxRKiU6h769x1JyTbFOGZ3/pyBTatW8fo8DCXrl1H2BZeodihIyQph1XQLRpe6r7feu7ep8QEQoauLTSpkofqbJ4KhSJtv8WFq1d56NR3y/Krlo9/t2nDhYmC6+d/YBMgJOjRPsL/zX8O/+v/VUdW7wdbkoDrQuq8p0G0GvVfzcxM/WJqdg5RKtDvuqi2j5AS13LQymj+yrQGQwiBnS8gbYN2+60WKooZ6Otjx5atPPrgg6wZHTGczKz4FlChWRhwLBzPRUhBBFyemuKzb49w5MR3fPbVV1y5cQO3r48Nq1ZheZ4pdBLCGDUlRqfZsm0cmcl+aqP1nj0Suje8Wepe9ahE3B5XdY7RbWkQctfTXnc0SCnwg4AgCHAch4HBYfoqFZqNBs12my+PHmHixgRHjx/n8YcfYs+uXawdHsKxDRc+jg2NQQqJSOK0qM6lLC22rFxF8Oij3JiYYOrmJFG7TRQEuPkC0rKRMjTZg7Q/tDbZG4QJHqXWFMslGgsLnDx/gc0Dg78pNx+IhFZngU5Abh87Q/G/+VfI+Sq6VLz9aoMQpKD5m1fxP/m/Q9s34+yHmuNAEEh97coG/9AHmxfmF+wgjMgVS2aW1XfKef5Iz4vb14M7vc+4GytUFBEFAUMD/WzauIFKqQTQKWA0PgoiVd+5FfvvzsOJVoRxTM62CYHpWo3jp89w4sxZ8gMDi1Wl0g2q0Iu3jtlsswhqMnvOJeeYjLaitcBxPCzbRSlNo14naPt4jkOh4FHO52k1atTnZ1FBwNpNG3luzx4e372bSmbMlSTEYYCdGk519qLZMyLSdVsDWhiOfPqljH66xnE9LCFphxFnr13n/Y8+4v2PPqLqBxT6zFrgFAsM9ldwbJtGdYGZ6Sliv82OTRt56bnneOT+HfRlgIsU5DzXFNYrg75blsSWgoUw4uiZc3xw6GPOX75MBPhK4+Ty9Lseec9DJzH1RoN2o0ZfPsf9mzbz7OOP8/jOnZRsmwRwhYVOEuJEkSCwXRc3Z/w9WmFEvV7Htm2KaX1DRnzMwEkD4vXelcU/Z694ts3a1atZu2o1R4+foBUExEGIVygRJglhEOA5DkIa8Qhxl4penansljlLpIkcnSiTtZXgeR7Nep3p2Rmatfmx4STaINFHMEbPf9HtZw/Ix8f+fotgQ6BvMizJhebGZtAugzATu5DoJDYct3sqajPtVie1W4twst+NHBnUa1UsrRhfsYKtGzeweiRd3Bfxzpf+HroHxVE6W3hN0DY5X+XYyVNMTE6jpI2wbZQwDmwq6Vr+ZuGUECAznWK92KflTr2wCJXTYDkW0pa0/bZJg+VzFHM5pIbZyZs0azXK+Ty77r+fl597hkd23M9YqZgWpWlIwBamyOeOaVKtO+lLKYzyTRTHKCGN8YOUzDabHPrmW/74/vt8ffwYjTCkPDyMW8jTjkI84WBLQbveorlQpWhZPLzjAX750ks8tuN+lvVXUs6j2Z4kYBQupLE4D4Fzk9O88+Eh/vjufs5cuEhlaIhy/wD1RoNcLkdfqUgU+MzPTNOq11g5MsLze57ml/v28fCWzZSAlh+SaCh4LnGckKiEvG2DgPlWi8+++ZZGq8F9W7cyvmIVA8ViWt65tCQi9GKct/+9mFocr16+nC+++prID0niBIHh9JkMoEbJOyDVaeSd0tqXHAtZEN9B5LQwk3+iwTZUolqzzuVr19g+cW35QLO+PtLqOuC35Y88b5Y0wXUaYN9LWx4E/du/P7e3dfiL7ZcuXADXwfI8/NgUINu2g2XZ6CghSSJsaZtMkoBSqYRKYmrVBZrVeZYNDrB75072PfkED2zYwKBr+PvmHqbXLoXhoNpmAZtp+5y9fJWDn3/Oh599wsWrV5haWMD2PMp9FQrlMlESE8YxcRx3jyUltlERTwO3tL+78csSAfnS27W7Exj7KTmY7lF1+oOOExzHwfHy9DkuDbvK/OwcR8+cZeLmTSZuTlKv1Xjwvq08uH49A8Ui0rGMLrsARxqlIJXKQo4Wizxy/w5qtTphEHD42HGmJq4zuGwsVQuy0JEmTpJuL4ieQlUpsT0Py3Op16qcPn/eGv/qm/t3lQfXnt629dI1L9X/bzSxv7+ENT2HqpRv751W26g4/TqBSt78u5uWJJY3fW2HaNZ3Vht1JwBKtk2MCTB/eq//cBNCdMZIEseLsrGbN6ynUiwSa+MSLVI6AWCoKr0P+i3YlBSpKZYQTLdbnDx3jpPnzzE1v8Dq4SGcXM7wyzPqUPq5DmrfWR/vGfZCp1lKaVk0mk1838dxLPorfRTyOfx6ndnJm0StFhvGV/HcU0/yyrN7uX/9BtzOURR2mhEQ2XqjU0rGrbSa7BMpNUoLo39vCUEjCjny/fd8+NnnHPj0E65OTdE3MkK+UqHebJK3HfL5HEG7xcLsNI2FebZv3Mhrz+3jpb172DS+mkTFtKMYWxhZQY2ZN8GUEjWiiC+PHucP77zDR18cph5GDI0tJ0oSo/hVKNBuNpmfmcGv1xkolnhi105e3rePp3buYsC2SbRBoi3LMdS3JEY6Lq5tkWjNhSvXOHfpMs1Gg62bN7J944ZUqe3ehIiy9+Zsi/Xj42zZsIHhgQGuTE4RBAGlvn5ipYjjGM9xUzlPFs1tS3T+Hc4lOs94ti6ByQKpRODk8iAsms0Wcbs97upkh9C8C9y8h0v6B9l+9oD8oSN3aUP8Z2rKdbGbwVB8c64y06pjObaxPkd0zSz+xFlyKe54FpTbto1EU69WqRTzbN64kY2rxynTtS20s8lxqfRphhxr3a3UtyQJ4APnr17jyHcnaEURw8uWGYpFYAT/QXSR9XQ2NOYk5vdbUfy7bRqdUmKM6km5WMQRgna9zsLMNOV8jl3b7uO15/ex97FHGS2XDDIexyZ1mMka3hbtpTlDrc2CbYjOaOgEMblcDikltTjmk2++5T+88SZfHzvOQrtN/8gITrFoapW0QoUBYaJoVqsUHIftGzbw8jPP8MyjjzDgOeg4JggDpPSwUmk523HR0jJ9e2OSA59+wRvvvseJVLmmMjxMvlCg1mggtEKohPr8LEGjxnBfmX1PP8nfvPoKD23dQsm2CZKEKAoN6q2NtmyMIJaCehDy3ffnePP9A8wtzFNt++TzRYaLRbOA/+h9SLvtltcd22bV8uWsWbmKSkodicIQy3GxbRuhNCqO0XFiinhuHXLp/+UiSHzxicyYSRc0KZBaIhKFUgmJUniui9IwX6vR9tvLh9DrBXzNz4xabL509fGn3v/gPz34xeFt31erDK1cgbJtWm0fy3awbMsUmXW4JuY7Z5cXhwFBs0bBttm+YSOvPLOXJ3bcz5DrmHEYJ6C1Ma6SAsvzDJIax8w12nz93Xd8fPgLPvriC85cukikNX1DgwyNjCCERRBGRHHctbcn46GbjF2SZu1MgPVj+RF9y8/3QhC4u/fe6V0GRDAFW0YT2KFYyNM3MIiwbOanp1loNDhy8gTNZoNTZ85Sff559jz6KEVb4lpplk9aRhEkDFFK4bkOA67LMw8/jG3bNNoBHx7+inatjlYKN59DCoUQWf2u2UwbZRIQUhInmlyuyMCg5vTMLP4XXw68UBx4tVipzF9bv/oogHYdVH/FjNm+0m3XJ/I5A2ZEqanJXfRTOoYcnSSb4ihaF4ShThwHadkIlRWz/flbRpMyYAuE7TZSKVaMjbF+zRqWDQ3ikRaJ3vo9RKqM1KFKpgF0+mfLkoZuBNycm+fwN98yMTljKHC22wmQsnW0k31OO0WrtLolqzXJNk5Zp2Vfo+d6FrkEpwh2FEYkUURfqUDeddFRyOzUJFGrxdoVK9j39B5efuYZto+voQT4KKRW2Aik43bXFuiqW6XXr7TuUMIQRg42ihMcz3yuDRw9f54/HnifQ598zsXrE/QNDVGuVLAch1zOQ2hNu95gfmYaHYZsXL2al559hlefe47NK1bgSUm9UTMF4I6LdmwQpqBeAQtxwvFzF3j7g4Mc/OQzJhfmGV21isHRUabnZtFKIZSiVavh12oUHJtHdz7IX736Kk/tfoiVpRKB1iRhaKiZKeCmpQTbgEuTtSYffHGYzz77DCEFbiHH/Rs3LLoV3Vige3N6IbtF9wlTcDnieqxdtYrVK1cyNT9P2G5D6nqayUrrtG/vMdAwZ5UShFFrMjx0kdItM8plOoZtG630qI7iLbbWZTAiDX/J7WcPyEen/iSzj3tu0s05SbM2WL951Z2pNxG2oVuITpWa0e6915bt/DMjh1uDcaBjyiKUwm82GcznWLd6FaMjw2mFteEtWz1Wr73LqlkERKoqLA13O1FG5ksp5uoNzl28wOlz54gSxcDQEDGmKjz7bh11mCTlqaeShSbuXew+ejeLtBCCMIyIVYzrOBTzefKOQ31+nurMNCKO2Lx2K/uefopHH9jB8kql89lcGgz1qLD1Hrinc0UnKFFK0fZ9lBB4+TyulCw0m3x55gzvHvqIr48dp+b7lAYGKPVXqLfbKKEpF4u0Gg3qc3PE7Rab79/Bay++yO4d9zOUSwt9RI/aDBItLFxpEQLzrYBPvznCG++9x+lLl3BKRZaPjxPEEcHCPEOD/SRBwOz0JNXZGZYNDfDk7t28tu85Htmxg5wUBGFI2/fJeV7HQMd2bGS6oboyOcXn337LZ19/xUKtRv/IMA9s2warVrE4YdhFPn8M89QYZ7WhQoFVK1YwNjrKtdkZgtAnZ9k4npHE8+OYRCVptf1i/PWW9bDzWm98LoVMF2PdMSFRUhoqSJzguTZaSlSi0HEyaik1zt25svyklk+0eGghZO3Zq5u/v3TpqfkgKLvFIo6XIxIaIm1MJRJNGAXkHBcnleQyRVySVrNOu1HHUpp1q1fx6AM7eGjLZlaWSiRaU6/XEUC5WMZybNMXmZxhrcEnXxzmrQMHOHH2DNPVKoVKP7lSkXyphLRtfD8gCiOkkHi2i2VbZoOAsTg3EpKpVpewUmOsrOlFS+StU5ZxT7z1nbe86bZprmc0/egc2HN2rVMtbYswhND38f02fuBTLOQoFIsU83mSwCcKfM5fvsKli5eo1xuoJOaxnQ+yolw26h1aE6kk3eQnxInAtWxGymUe3bGDs+cvcPXGJNPVKu16HSkEbs5DOtIUiqbZFp0YMEOhCOMA17Ep9VeYnZ5iemZqeTg//b9YHrTmNsPRy5jM6Q9eresAAu937+BMziD/2W8Qo7dnbASmBicA2oADVhwGg34Uoi1LCGmCXYlEsTgjebftVopKb0a3k5lNn0GBpt1uUbRs1qxcyfjy5RQxc24iJU7qPXHbsdLAVCVJKtOZIedmXoiB69MzHPnuBNVmk8HRUSzbIU5dGdGY/E4vbTM1pcq+X3as3r5b6udsLhIWBFGI8n1yOZf+/jKlQp6o3WRheprG3BzjK8YMMv7MM+zYvAVXmrnVybT45e393ckYp2tgEicphcpQ8KS0cDyJa0laKuHq/DyfHT3CocOHOXXpAk6+xMrxcRZqdcJWi+GREZr1OpNXrjI3PcV9Gzfw21df4dVnnmHT+OqOtn85b2iDiUpoBQG242JbNhZw5sIF3nx3P599+ZVRUBkZxXE9wiCkXCwRRSFTN25Sm5mmz3O5f9MmXti7lycf3c1gPk+oFIHvk3MdY8QXhkjbNlKKwI16g8PHjvH+Jx/z2Rdf0F8us/vRRwnSvs/MmrrB+A8XhGdvNtpOMNxXYdXy5Zz8/hz1hSpRGCGExLZsUz+BWuSKmh2pN94RdH9ZjKKn2fKObn+mRCRQOqXlWhZe2g9ho7l8WZIUE37GBefvqf3sAfngzIWf+xSLmp3L9zWarZWXJ67kpxaqyFQyCaWxhOQeSJR3bEtKInY0yjE600lCuVBgw5q1jA4Nm4GYFpt02i0IuYZusU06erXWpkBQKSZu3OTM9+e5cvU6xYFBCsUy9XYTlURk2uciq35P/9mWnU5IP/G6U2RdJQleySic1OYXmJ+axBXw4LatvPb88zz/xJNsHBvDwxSYCAS26EFjb0tNZKhJivSk60GizG7fdRxzrjjm0xMn+eN773Poi8PcXFgwGrjlEmQ6qXFCEob4tRo5KVi7eTOvPfccL+/Zw5rhITNhxcbG2XEcozQhJKQubpemZvjq+Ane2n+Ab0+cIBaCobEx8qUSc3PzxIFPXyFPvVGluTDH6EAfzz/5BL96+WUe3b6dohQESUyUOtM5tm0qzYXGlpJ6EHDiynU++PxzDn7+GZenpmi3Wxw9dYpz166x6/4dWICzJEJ6B6OonmZjFuDxsTE2btjAbKPBbL2B5xVM6laYgiV9y3i7u5YiaFIafd4k1bRNVRjiJCGOY7TyDDJo7JxX2lG4fUSKykwT1Lk0k/hD1JUowRnIUx7vx7LED5ZdV4GBOC7uunlzS3LqxM4Pz54u+yqhr3/AOG4KiW2LNIWbPnMpSqa1wnU9BILZ6SmsOGbdyhW8uGcvL+/Zw/qhIQRmQ5tR0IRluLqhVsz5bc5dm+DwkWMc/OQTDn97hEbgk++rMDAygpNzCeOYerOF0EaXN8tUCS0gAU2qspQGNUKKDrf9T3UI/jmaEII4johjwwn1cp5R2AGiyDi45j0Xx7URlkWr1aZaq/Hx4S9IVEK11eLpRx9lpNKHm4IGmYRhpjUshGB5Xx8v7dlL3Q9594MPuDQxgW9J3JyD49hECen8LVPHSUCZIj7Lkji2S6FcIYhCcezUd33jG9Zu27ly5epqX2liUkoTt1lWIhzvdqmt9LlwJ2bQBz4htCOSVSOIpr/obXEQUBwYYMOOB3HGx4kXFgbV9ExhptnEcl2k4/zUmfau7sOtv1saGlWj4LNx3XrWpj4EKv277Thp0bDRsV90HL14ToiTBJGaE80nmu8vXebYqVPUo4gV42sIwpAwMprj0M0S3wsFtBc01bf832xUTbZ3cGCAcqFA2GoyOzlJUK8xPjbGS3v38uuXX+bhzZspS4mfJMSA1xFeWGKtE73LkPmbqYERWJZI52qBD5y6dp1DX37J2x8e5PSFC4RApdKH5blGxz2I0WFIc26OuNFkzegyXtrzNH/9ysvcv3o1OQRNZZSBHMtOr88gu8KyWYhiLk9M8ub7H/Lehx8yMTPbycRGqZpYsVSgPt9gfnKSsuewe8f9vPjMMzy3+2FWFQomWx4EqNgU1VuWRWwleK5DmCRcXqjy6ZGjfHjoI744dpyrN29S830uXJ/g6lyV0UqZkiXv2SFGq5RSKWGo0seGtWvp++Zbrt68SRgEOLk8ruNCmlGXqSnRvTal01VPmHPSqcFSxIkBIKW0KPdVqAU+09ev58dmquXR4gBu9WdNyMKy/p/18D97QG7cAv/+mq2SMpE/trAwl6s1GuQHhzsOabKza7+3QXIrb3yphTN7PUldwQr5HGPDw4yNjFJKzRkcy+4G5L1FjZ0TZQfr/k9aFhYQKcXE5E1uTE4SKYUSAqMUmxWmdI0ZejcKZgbMUPxsx7oYfeu5iqUuHseysW0LR9oErRaz05Mo32fThg28+OxzvLhnD+tXrMDFVPVLlXRlttJjmHm/yyHXGU2FtFDQEoRxQqwUXj6HKwQLccw3J07y5oEP+OiLL5ieX6DYP0Cx0oeWkma7ZbIfStFcmEdEIRvXrOXlfft4cc/TjI+YYLwVxug4MlrgaRGMwKB1c80WXx37jtffeYejJ06A7TAyOkKuVKLWaIAA25bUqvM0qwv0FfI8svNBXtn3HE/t3k1RSoIkwffbqWFFAZUo4kSlhVRwbaHO/o8+Yv9Hh7g6cZ3CwABOscjk3BxnL17k6vQ0KwYGyKVGCotTzFlQfiumdPvdGqj0sXZ8nKOnTtNuT1Mx5MmUny9TpTOZGq3o21bGH1pWO6hX5/1psJoqDMRJgnRsCqUSkVaIZmvN9kRU2qfnufC7E+Yz7g8UbNYCvF3LGVtexrPsH5SUHQQGVbysUJ148fKNC7uvTE7SPzLKQKlIs91Guo4ptmo0EQgKuRxJHBMkIbYtcVwbFSf47RbLKhUe3LaNZ594nAfWjqOBJDL0nr5CsaMrLoBZP+C7c+fY//EnfHr4K65M3CCQksGxMcr9A9iuSyvwqdbqhEFIpdSH53nEUUwcxYSh31HeyKzTbdtZlLHKUv6LbkzvT+LWv3QTyz/yJC9uS73hjsWDkiAMiOOYfD5Pua9s1BziGN/3aTZbtJpNPNvGcRyGx8YYHR1l8vo1Pv36S9qhTxAGPPXoo6wcHqaUmklJMlssc82RhgfWr6W65xkuXbzM9Nws7TAgiSKEbTIIOv2elpTopJuxiaOYdqIYHB4majX58sxZ3L5P1m5evuqp4tOPH8J1J4AcSRLoKLwjYK6XLyOamaD+X/wXJLU5gxT0NqWw165l3X/1f2JtvuxWL19aWbtytXijUcf1PITjGoqU5hYuxp+/ZXVB7VYbCgVWLB9jcGgoM1JON84pUJRJFArRkSjUKTKerWcqMeoqSmsmpya5ePkyMwsLyEIRx/VohyEqVqloQFqkm56r4xzbs8beus6KWwax6HSRoWcqoRGWxBbm+Y3DgJnpaeoLVZYN9LPnySf45UsvsWv7dsqWRahMMastBNh2d8PfOY9eNM4zR1PLkiSY4lZpGR1wX2sm5ub55OtveGv/fo6fPgOux9jIKJ6XZ2Z2FtdxkI7DzI0bNOfnWTkywjNPPcGvX3iBrWvW4AGh1tiY7IXO5llLYls5Ygzl9N0DH/L+wUNcn5yiUKlQHhrCsm2COCaOIoJWi7DZIGdJtm5Yz769T/Pc00+xamSECJOR1Mq4lArM3Ox6Bhueb7f58sgR3j5wgG+Pf0c9DCmOjGK7LhMzM5w+d47i9q30FYsokzLo3JIlR2vPiyKbm6SkWCyyauVK+isVlDKGcXYuj+04RKnCXK/GeXbcu3kSuhr92ZY9zX4ICy0UcZSAEBRLJRb8NhOXLlkrz10dKEWeEzXr0V2c4qe3v/SA/PzQxp/7FADpA22xOqn3ebOTK5r1Wr4VBFRc16Su47jLG7vHkLy3YEX2TGC9NJYMhQjCEBFHDPYPsHZ8nNGhQTpejVIuRshvLTLJAlcpOgG7kxoG1Votzp2/wM3JKYrlvm5xDen7TWib7vzT7yXSq025WJ3NxB0fjZ4dQScmMIU2tmMThSGteh2pFGvXrmXvk0/yzGOPs3XVKmOv7LeJk5h8Prd4d5zNk6KL9WYuhAKDUggEYRIRK0XBdWiphJMXLvDuwUMc/PRzJmZmcYpFigMDqeOqQeyKnoeOI4JWk9UjIzz18EM8+9ijbFu1CgtottrESUIh5yFtu6NmooBqq82xk6f58ONP+Orboyy0WlTGxiiUKzSDNvPzcwwPDeLaHtPXrlJyLB5+4H5e2vcsu3fcT0FKojgiCHxcy8J1XLQ26AWWBcLl0swsH376KZ98eZhTF86TCMGyFcsJfJ/Zmze5cOUqV65eZaRUMouKpjNJLlZEET0/dRce3dO//X19rF61Gi/nEQYBEkMpSZRaJLF4h6m385esfxYNh97v1DOejBufJkpRi0KpSN33mb9+XVZu3sgNzEmopxPsUgQ/IQzPdbJFONtmUukOwndry+Q6t8wv5O4/c3Zrcu7cSwu16g5t2yRSdiTe0KlZT5TgOg6e69EIA6I4xMuVieOIsN0m77lsWreO3Q8+yPplI+baE23Mp1SCxNBUEoz825nrV/ng8Oe8+8lHnL90BdvLMTAyQrmvj1hpatUabb+N53pU+vqJw8ikqqWF5dhIx+5IkWZ9qTLOZWrkZDj+2f1ZnD3rbYuyJvqWeYRbcMIlgnhuee9SP3cOrxWu6+B6Zny3222yOUIoQw3SymxCpUjAtnFyLuXBQaqz03z85Ze0Ap8ojtj31NNsGR3tkDmStC4DBJY0UnvjgxUe2LqNq5M3+f7qRVrNJrZK0ufXZBpsjDqG0oA0mZooiSn3lUFo5ppN6rNTj/XPz0a7681ZN5YT84VSUD95NIpPXUdkPONb+8KyUX4L1W6YF5bQEm9ZNl+sWomulErr5mfGbkxcz89Wa0Z1x/aMm2oqQSuXOMef2rKCygQQKkEKKBUKjA6PUCmbgtXbyG7SqAlljpBKG0KcoWAaeqNl2x3w5+Kly1y6fIUEI4oQpbKTiMxmKp2FzA6JjDeuzePXMd3prkw6w4ZIv2D60dQzI/3dchxsIWm3W/j1OtWFeQYGKux++CFeeHYfD22/nz7LIooigjDEc40ZT7f1RpCk91h31lOzXxCAoVNaQhAAk9VqWg9ymBPfn6MZRYwsX8HQ6DKT8ZmZZXhgEBLF3NQUQ8UST+3ayW9feJ7HdtyPi6GNqCQhn88RRxEN30e6Np7tYQGXbtzk4Kefsf/DDzh/6RJOoUipfwBpO1RrNWOsI6A6P4cjBZs3bWTPE0/w+M5drBoawgXCyAhTuJaFZXXrsiQw22jwRSq5+s1333FjdpbSwAAVL0fYanFtcpKTZ8+wfd0aKBbT3lq8ne8dNbfgg2a+T18t5gusXL6CocEhg4pna4K0OxufpTN+t2cvbn3ZOHuajaOU0vgnJAlaZgyA2JgvFvI0ZurM3LhhbZ6cGKlvWDtweO2yKSUl9o8pJP0DbT97QH6jsvrnPgUASkgibAZa1waKKl4RtJq5MI7JFfJoJH7Lp7MN/Ilz5FLWxh1lldQm2Pd9CANWjwyzce1aBsplI8eklDEpyHalS0zUurNh6OGAW7aZMGbnOHLiJNdvTjI0OgauayyL09jamEsnxpExzQYYcweLJDZSY5ZjCrPuFbCxpMQRgoX5BQgDNqxey749T/Has8/wwFpjSpAoRZxEqSOcuh1ZEtmUbDYdmYFRtj0yBhPCuCoCx85+zxvvv8+Bjz/i6s1J8ikyLl3HFNoJiS0k9fkFHK1YM7acfY8/zmvPPMuO1auxMRJYKkmwRerOJgQxJi6crNX56ruT7D/4EZ99/TULrRa5ktG+VZAWyWpC30eiyEnB7gd38De//CVPPPwQy/r6CaOAKAywBORcs8CHUYiwJIHSTE/P8cb+A/zh3Xe4NjNFLCReqWBkGtG0ooiJySmuT05x38aNDOXztw3NH8XY0qBcCCiXSqwcW0be8VBRguc4aK0IwxBbWmBJYmXUBIS4y2GQLmhGR96MqUSlaJplIVJVoSQxQX++UKDabDJ5/Zocm7qZy+mKw5DQaOIlZxuVmM3LqpWED6xg1v6xcjron5tfvuLU6QeOHflmw+XpGQaGhxGuazbD0ih6GLt2G8eyU5MQ4zbq2BZzMzOErTYbVq9mz+OP8cgDOxgaGAANiR8itDLBszDUmZaO+fr0Kd48+CGHjx7l4o0bRJZFsdKHVy6jpIXvt2j5PnGUUMjb5LwcjTAmimKEkxZ7C4G0rM6GRmnV8SToLX77oempZ+a5/Vb9aM/9xJYGa9KyCFPaglYGpXYsG8e2002FQWHDOAYBhb4ySismrl3lm+PfIaQgEQr27mV5ZYiSZZlQLlFGpi699f19FZ5+ZDez9QUWmjWm5ueIVEJ5YKDrkiwz+UoQ0sJGkChBlCgSoNDXR9X3vYnvz+7eOL7mgfjytcMHLp+tta6c1TTvyYLq1iYi29JXlw2zopgrbGg3R6tTk/nZhQUGli/Hch0zBcZpQGAb7uufAyW/VclEa4WlFH3lMivGljE2MkTRsdL5QBjAuEdPVYpupq3jFCwESWzuXcY/brR9zpw/x9Xr1ymV+yCfpx0ERgJXSNPnnTBO9Wz8RJrySDeZGqwfLY/tNqW12UDbDrM3b9CuVRkol3n6sUf59Ysv8OQD2+h3LEJt1GOkUqZmS1qkRiPp96CzvhqbeDo1nmYzkhhwDMM/vz4/z+dHjvDOhwf56thx2kpTHhqhWBkgSkwdl+u4NKpV7ChitK+PvY88wl+98jKPbdtqsqRRQhwlSDQqTkymXGscy6ENXJ+Z5p2PDvHmu+9y5sIFsG0GR0awPY8gjkmiyAAASYhfr7F900Z+8eILPPXQw2xaswY3NcUSWQ2PbTJsCdrUpwFfHDvG795+m6NnvzdKT4W8ET5wXWZuxly9Mcmp788z/WSDdSPDnVt210NTdDdURcti+bJljA4PUSzkjT9FYrj5JvOd5b/uFhe/tXXBTrQkjCLDFnBskthkHVzPZTaMYH7Wsmszwy1b9Z9d1v/340T5M7WfPSDPqb8HlRUBSkmkUpat4kEhqCRJYmsNrusSJ1m1Lneti7no8L08755JMXs9S9MppUzRWBTSVy4zOjRIPjVS8f2AgudhWb1ct8VN9qTcVJKgMMFjoDUzc/Ocu3CBmblZVm/aTIyk0WohhErtpTVadrFvy7I6zp4KEzALJVLkuou8dk7ZC7Vmf9fpJJ7EhFFIY36ekf4+dj1wP/ueeIKdW7eSw9CS4jDEc3NIAToV8Zcpn6zbMrUWs2GwLcukm1VCEMV4rkeSJFyfmeKDzz7l7fff58b0LOXBAYbHluPHMc1mC8d1KOYLEEdcP3+OsUqFJ557ll88v4/d99+PDcaKPEj73HZSe/c0RQtcmpjgvUMH+ejzL5icm2NwdBTh5fDDkDjwyXkuleIYE1ev0Ap97lu3hpf3Pc+LzzxHSVr4oU+rUaeQz5PLG/ujaqNOq91m2cgIoR9x/soV3vvwAz758jBrNm9i+erVhDrBD0MWqobW0A5Cmm2fZpCaTCDSRayriGN6bhEm2jM2u3u7nOPQXy7j2RJLaLycS5AooijAzhfR2pgsCcvIWC4qp8iApM65Fo9SnQZBlrRIEiOxKYXEsiUy3fQhwLIt2u02tXqd0SSUshDZDPoGaLaWKODwQ2PC8sIaWLvstj8v1VzHHgnDYPWxkye9yYUF1m7dShAnhHGM61rEUYxONMVCEaUUzUYD13PJeUUEmtrCPFYcs3n9Oh7ZuYPx5aPkLEnUNsoOtmtjuQ6hNsWA1Xab/Yc+4t+//gY4LpWhIZxcHoWg3mySRDG2bVMqltBKkcQJszOz2JaN67pmXohMJjWrP8nUCMDQ0qQ0sphJD4J+t+1nC8Sz4wtj+KHCAJEuhDKDODuF4tI40gJRooiiNo5tkS+X2XTfNuampjh64iRRFGEheWXfPkp9/SAshFCdQRzHUPA8dm7fxPXZG5y8cJaFepVWEuM4NjqOieIodZ81BbJaKWzbxrVdGo0GQegzsmyMhaDNV19/Yz21dt0G78zp9Y3P3zlGGCbQecB+Sst4V7EAR8Qq32w0rWarRX9KG1RJTJLW0Vg/6vZ596137VFKdYKzwUo/K5evoL+vD4/U1RnMupiozponhSlI1ilSnKH3SWJqhGzXfLbWbHHt5iQL9RrlSh+RkERhhC3ocvd1VrKqu1m6lKZoPD9IESbds6rQM6Gk1yK76DhaI9FYQhO0WjhCsm3zZl7au5dnn3iMim0TK6Ms4jpuKl/L4mAcOmNJa1M4LYTASX0glEoIoxjLdtApHe37y1f48NPP+OzLr5ipVhlbPU6uVCaIIqYmpykXCqwcG+Pkt0fIacVLzz7D3/z6Fzzz+GMU0/XcFgaxjeOIRrOJtG2KxRI2MDk9zaHPPuP1t9/h2MkTlAeG6BsewSkUqNYbaK3pr/Tht5q0my08Idm+aRP7nnqK9ctXULAsosDHtWzcNMuWgQUOgmaScGVqikNffMGhzz6njSBf7qPQ14eTy+O32zRbbZrtNtOzc0zOLtBanyUse2ePDDK74wDs/LOFYKBUpFIskXNzuJZFrFUn1uqaKd6LWVS2oepi9tKSoARJHKEwXHJI5Tlt4wocBpEkigtCqxKYRMJdn/IfWPvZA/KL6nbN1z93UwlYRUluuZOE05Mr9Mlgp2M7/a7nmQUDwJJdVOBPPeEtCLnSGqkUOc9jQSla9RrD/RXWrlxJLuVK2raVvk/fVV2dQqBSBPnqzZscOXWSVhzhFgr4QYCwHVP8lh5PdLavoqO/amqgzDVnsmWZ5bKTGvQEQYDGLGhCClRi0E/H8XBdF5Ri5uYEjbkZ1q1exSvPPce+PXvYuXkTmXhYQobG2ykDQXVoDl3DAd1J19tSgLCM45s2/EHLcZHAlbk5fvfWW7zx/gFuzM2Tq1TIlftohSFaCHJeDtexmJ+8SWthno0rV/GL557lVy++yENbthgeexwbyTTXBSmIMYi9KwXtMOTry1f5u3fe4/1PPmNydo5csUSuVDL8vHYLjSZWMUKAk8Rs27iJf/bbX/PSE0/Sn/L0EZKc6xmESScIYePk8ggkc3HCR19/zb/6d/+Rb06fximVsbwcwrLRYUIQhriex8jYcqamZ/jm2HEe3rULlaIWZoCk8Fa22v3ImNGYmWiwr4/N69Zx9sIFmrUqkZTYrp1Wp5tjL6L3L3GcJU/V+VC2mGMWQm1MNpI4xpaSnFdgYW4Oa+KGe9/U1Ip8n9OPo6cAza0KCFrDYAU8CYf+CG9PQJham2cPid+GYom+V34LG7fSAqJqdVdtcvIXfhAOJqnOumVZWIlGRQlSGyQazGYxM8tS6bPpSsG6tWt46pGHeXDLZsqOnT06CMdG2BZJ2k9nr13nvY8O8fEXX7FQb1GoOBRsD1saxQmdqLTwKAUIpURjaiGwupv23mKynzuA/jlbD/iIyXbpzh8yyrSRl9XESmFpG9txKFYG0MDRU2cMpUhpfvX0HtaNjqIchyRWECviGCxb4lnw4KZNPPXoY0zPzXL64gXqCwsUyn1Y+QKNWhNbaPK5fMpIMDxWKSWe5yGFZn6+SRQEOXXlym9WDQ9d3/6b35449+knSfP69T8Frs6cVJAwaAXBhqjd7gvDkEw/GQyN509tvZRI6HJrhRB4Xo52s4HfbLBmZITN69Yx2FfuhP8i+69cDCh1iIS6KwMoU3MqIQT1OObKzZucvnCRyZlZxjcOYCPT7NPthce65753gm/dcx6M5r5EoOIErdP6Ccc21JYkSdWfJMVCnub8HBOTkwyVSjz95BPs27uHZ3Y+yEi6XkWJMhQwK9UZ19191a0UCzAbJNnpA6NWJCwb27KZ8X2+Onma//DmW3zw8afMt5qUBoZwcgVipYmjhFK+QNBocmV6horn8cSuB/nNK6/w6I77O8E42mSRldIk2tBuCrkcWimuVmu8cehjfvfWW5w8ew7h5clXKiSWpN1sIlKZSa0SarOzDBTyPPfMM/zNa6+xfXwNeSCOQ3QcG88MYaPS+2AkdeHbCxf596+/zoeffko1jHALRTwvj5Q2YRCitaavr8x0rcrl69e4NjVJNYgY8pyO06hl3cWspLtjUmDWmy3r17Fp7TgnL1wgsmwGR0YJMQ7EcTbG7gop77lr2bOjtMn4awP0aKFJkshQe6zUkVSBI5Rr+f4mKwxXAUd//EL+4bafPSC/pG7XfP2ztxC8fli1GuJADAXN9nLXdnA8jyCKUEIiUjnCzi79XqbkWxGrNFBeVMgpBF6xiBSCsO3TXyqzbHjYUAWAnOOSJEazuaND3nvIW3+RsjMwr9+4wcnvv8crFxkcHabWrOPlCjiuk349E8DpzsWlKhUZj0pKLNdN1SZUh9dnPtuTKE8rmrU2Gwg7TVEHjQauVjzz+GP887/+LeuWr6DPtgkUONJMRogMDddIx+lJw6fc9c7xQdqmCDVOkR5S6aqJRoNDX3/F6/vf4+yliwwOjzI4NEykYGp2hpyXp5wvoMOY5uwcVhTxy+ef53/2P/qnrBkZIWdZ+IEPKjEGD45DEBr9Z8d1UcDZqRn+7s23eP29/UzOzVMq91EZGiIWgiQxQThJQtBsgYDtG9bzNy+/zN88t4/BUolW0MKzHeyUVx+EIUEY4XjGhbQZNzl17Hv++9ff4Hf791MaGGDDtm0kKqHt+wYhdGzK5T4Gy/18f/Ik3xw/ztTcAtG6NTidSLkDG6VDridU1l0H1gzPzpKEpXyOrRvWc+zUSc5du4bI56kMjxCGkeGSp1kJYUrZzeHSc6il4v4sUE3lErXWaYFN+j1SWSqtFbbt4OU8WmGAnJnxrKnZNWU5MOShbwA4tz1GglCFBJeuwt/9P+CbbyF/y8PQAtHv4q3exMDGrVjg6uvX75+4dm283F9BRUWCIEolxSyiwKBnjuMYJQKl8NKNU6vZZGF2jpXDIzzz+GM8tH0bw65nLNg1Jmvg2AhL0NaaapTwyTff8m9+/zoz9Tpjy1eZjXICQTsAYSQn3bRYVcUxaBPgeK5rqFiZXvZSfOWeYD3p4Srfa8B+Dxnnn3wsY8udmkwlGiW6RePZKBTp5kwIOhuiIIhotQPKxSIr+iqcO3OKIydOIoVkpDLA2PP7zCIkBXGUdBSmEmDF8uU8/tAuzpw7w+VrV6nOz5MrlCiUy9SqDRK0CVIQhEFAEAUUykWkk6NZr5FoEFLajempFaN7nt39+L/8zx3l/d/C4/+f/0575XLnO/a2yLaJbfv2OT9rk5OK4WFwHEQUDcrQ3yC1KtOp0TAPjG1bPYe49/i/1wH61rFjWRa5vLnGarVKee0axleMUUgpJ534ePHuqXNvEMJw71Ok3LbtDu5fb7a5MjnN9elpGs0WUkuDfqJ76p90d3rq2d1rMkfVbONmVhlDDjEuxZ29diZf2bPBlyjCVpOwXmPHQw/yN6+9zKMP7mJl2SiL6NBQImzHTgedXnR93a/XNepzHMecRSszZoVE2BY14NilS/zu3Xd59+AhZqs1RlaspDI0TMv3CcM2lhAMlPuYWqhSn5nhpb17+Bd/+7c8uutBRsqZ26v5DlpAmLr45vJ5pBBcXajy9qGP+A9/fJMjJ09g5/MsGxvD8lyaQUCrHVAqFUErgmaLvG3x0P3b+Bf/9J/wxMaNaCCOQpO1S0G2GDp1ALUoYmJ+gT9++CH//euv0wgjlq8cNyIWWhMFhl7meR6DAwPM3phgZn6Wm9NTVBt1BrzBNJGhjXlglvHvHYc9P+hUHCJ7TWlYv2YN69eMc/ibr4ldl5Xj4yRaEQcRSqseh/Bu6zi29sTovaIFApnKuqbeJ4DrGHfYOI5wXBcpLKIwNhsgabl2GG2SYbQS+Mskj6ftZw/I/76aA3IURClRThDHxMpYAShtCocSle7OMzT5HlqvTBT0THg9/8DsNAVGWi/vuuRsm2zjaZCEuz+zsTs2P0dJQjsMCRNTlJOZu2Qp7wyJWDrh1A3sNMaURAoI/AClErxCrkM5CIMAKS1KxSJSWtRrNSavX2ekXGLPc3vZ+8QTrBwdJW9Z5phJAlreImcnupO0Smi3Wghpkc8XsG3HOHBGxs5Z2FY62cNCq8X+Q4d48733aAUxhXI/kYL5Wh03l2NgYICg5TNz8yZBq8HowABP7NrJC8/sZeXYGI1aFe255F0PMJSVdrOJ5bjkXIO+Hzl/gd/tf59Pv/yKRtuktbVl4ccxMknwch62JZifmUIFPqNjY7yybx8vP7+PfN4493mOKRImlYK0pIVt21gIqq02R0+f5fdvvsXn33xD3/AQ5YHBVJ877tCcREobSpQiShIavs/03Cz1KGHQWRpZuxOiTc/rEmNtXHBdvJSzrHomUJEWHwvdXc86Q+Su5UCzMaY72v5aZOtiqm1s/olA4d6nfHtIVxddAxiULOfl+fLYIT4++DpMXIYitxd+tkC7MO259IH3yJkzG8LTp4fPzc8RaHDzeRwjtYhOFFaqu6+VkTyUlkXOy6FRhH5Au9FgbOsmdm7fxmilnyw26DzZ0mxsgiji8LdH+Oybb1hoNEm0RGPT3b7q7nywxM1ZjAfdRd/+KZjt39ex0/jntqxK5/rTDB1mgc0KyKNUBjKOPfoHR4jbLa7fnOLgZ18wXOnnsW1b6CsUCaSFJUBaZi4rACtGR9m4Zi3Lhke4MHGDdquNlyuSyxfQicmGGQdgM6aiKDJ0rXyeQrkPkoTJmVmca9fcYENxYOvzLzXXjq/FcpxFga6dGM2qb+/bwPn1qyGI04rRW1oQwOAgrFkDM9O20CovhbCs1OzJbEruXcmr05e3oOK9r2WiAlnApVLpTM/1KOTyuD3zcO+QXLTm6Nv/IHqC6jCJaYeBUeCwnQ74JLP7murf96Lit19E9zuYZSAh0ZpEpwotUuAHAbEycpX5fA6h4ea16xSl4Pm9e9j7+BOsW7mCvtRp1VJ0FIpu7y/Ryfyp9Lm3pOxsuIwxV4jjOqYYEvjmzFnefO99vjl2nFhIVq1dh3Q9Wu02bT8wdEoNk9ev4wnBU48+ysvP7+PhB3cwUOhxcdWGkx5rjbDMemYDM80WXx47wTsHPuTshYv0DQwSC2j6Pp6ASqWfSkUwNXmD6swMfZ7Hnscf5W9+8Qs2rFgBgN9uGeWuXA4NRFoRJTFOqkJ1bW6Of//Gm7x94ADadSgVy+DYmDIyQ+MxNWumT7Qwymz1Ro1mswlDg+k9NetRFid0wp1b+lqkO6fs1tsCXCnTAlOLWJM68naz9N1bZuoXMvhocTajN4rqsp1uHVO6d1yl/0mfYSm0zqO1d9sA+QtrP39A/kP6ZX+upsAJkCNV8rlqy53328SpQYFSBn1K4iQdJHdfZHK3LZvYkyRBSkmhUKBcLpHP5RenC4VcPDn+QLMsgUqRonrKyQ1Dk5K17S41JEMklgjD79g0gjiljxgJK0GiEmzLwrEcLDSN1Jij7Lo8vfsR/tlf/4YHtmxiyMuZBFSil9j7psfPqCrCmMEvpvhIklQZwMZc39XZOb46cYI/vrufz7/+lr7hYfLlPjO5KkUSx3hejtBvE/otSp7H3ice5z/57W/YnVJnAtXV1NXp57QQ5F0XP1FcnJzmd+++z3988y0mFhawiyWKlQpJmupGKaLAhyTG0rBufA17H32EFx57nA0Dg4RakWiNJW3DZ1PG7N6xHRJgLgz5/LuTvPXefj74+GMmF6qMb9yEVygYBYjUblpKiSXMQhGnkqBhEHJzcpK5hQUGR+7dPj5rEsjZNuVCkVK+YIottWF6ZoZWf46WBd9mDk+DMNGjza81QmlbBtFgPNBXbq1IC4h6Ahxp2ySVCuE3n8BXZ4yjwyi34xshkiISz4otGNlw6dK+U9+f3Xx5cpLiwIAJzBBEcYxOx3CG5KqUW+w4Ns1Gndj3KXo5tm3azO4HdzLU19dzUXQK4erA8ctXeOPAAT7/6itCBdLxFgXZi4OcJV/9/zdM11iWTRTHJElCpdKH8lxmb97k0KefYQtBqVjkkfu2IGyBlcYFSmksKRgqFNi5bTunzl9gZqFK0Gzie3mKuSJhrAj8AEumRey2TRBFSBSVchlR6SOo1bkwcZ3k9Kn+1f0D2/KPPDzvv/JSM4zjRZtVWxnUNx6sQKnwQ5fUbX5QEIoRW1p527LTzW4636XZxtuK2++x3bHeKQ3ItVIU83kq5RKOzKzl7uK4MkPg9SKJ2qbvs1CtoQDX8zCzXHrK7D+3nODW2PzW82cSiMIytM0k9EEIPMtkYRM/JAp8Er/Ntgd28E9/8xt2bd3C6uFhcilnOGVaLnHsLjIvhdVdkVIUOY4ioiTG6IK7NJOE85M3eP39/bz17n6q7QC3UCRXKJriypR6GgcB7XabsNFg54MP8Le/+hV7HnmIVZVy98xpHUiiTRCZgUs32z4ffHGY37/xFt9+9x1+HLGsb9QE1Bh+dRJHxGFEfX6eguPwwLb7+OWLL7LviScoCmGcgUl5/tl9VSZwjYHzU9Mc+PRT/vD2Wxw/+z2r1q3HK5ZBmGNr3VVVQ5O6bJuC38mZGWbm51Djq829lZlN0I+sD0KY+CntYgtwXYdcLofruoSpc3MmdNGpGP0Jy85SYyg7kKKnAMQE/5ZADwt05d7P9A+r/fwB+Z+vpuUHm9Ra56ptT89X3Wa7bWzRU5MDnQYCmWPlvbZsIliquLPXGMHI/kjy+TylUplc/paAvHdm+5E1XKbBuA/MV+tUq1XiOMZ2bGzbSdH/7CCLJ32TDlr6KchkEY3QvjGDSEKjwlIuFLGF6DhelnN5Hrh/Oy8/+yy7tm1jqJBPdYPNhL7YWRAySoPZmJggMJdb7J2lBcbQxzbV8tW2z9ffneSdDwySEGkIopiCl6OQaqtGYUijWiUJfJaPDLJ1wwZeeGYPD++4nyKmnwb7Kwg0SRylfEebfME4pV2amebdA+9z4KNDXL5xg2L/ALliiTCKcT0jmxUFPtX5KiKJWTY0xFOPPcqLzz7DyhXLFxVCaW2kLTUSJ++BgNl2m2Pfn+PdDz/k88OH8cOQwaEhvDSFHMcxSYqQZ2heRhWStlHdWFhYoNGoQxaQZ0Gv7g6WLthw50yLIyWlUpFCsWDURqIEVIqViDsOiyWbXuoXQbrZSnWN6RaMZdelNKASpxC0R8+OjVb+w7b7AJC9EnJZceP9a6GMmWGXUpBVSBQuiFjDaByGT9eqtfULtTrlkVFsx6HdbhukNEW4tRQdpMbIkSrajYaR61y9im2bN7N6dIw8mZRihrCZZenClasc/Phjvvr2W6ZmZhleNoZ0jaHUUkHHzwlu/0NpP+V6k9RcKZfLEcURUWj4rCItOJ+cnubbo0fZsHYtw4ODrEmlJ5PEzCHCtbFtmw1r13Lfpk2cPHOWKzcnadUbFPMlHEvia4VSAmlbxtE4Dk02SmgcL0fo+Ny8eYOh61eHB+vzjxwp5S4eHBv6PgISrbszZ4YKTguYB5ZhSLI/1JQuEqvllrAso6KTcmWzgFxk2YJ7a72Oyr20plt9MFRinsFisUilUllEwely+5eeKTIDuTiJsS2JTEGCeqPN7NwsiVZG5hKT8dKZWR23LF8aFv2BW5Y00UVMpWURBAG+71MplykXiyRRzNTkJJHvs27FSvY8+hiPPbSLNcPDuOmxEp0GZEJ0s6+iS3PIlHeEBZa0kNKk2RKl8EOjzuHmPARw4cYN3t7/PgcOfsy1yUlGVq7E9nLML8xj2Tb5QoG86zHdqBO3W6xcNsrTjz3Gs08/xVjJ64jWoLRRSUKjhaGXCmC22eTI6TO88e67fPjpx+SKJQZHR4i1ws15FBwHrTWzU9NUF+ZxBOx+8EF++dJL7L7/fkrC1H5Jy6aQt9GJ8TBIhDAghtZUfZ/DR47w/ocHuTE5jZcz2WfbtowmeKa0loo6GOqcxrFtJJqZmRlm5uY6/godgKWz47pDE1n+q3uHPc+jUCiYWCsOzHOL+JMAoF7UPCsJ7c34GIpk+rqUCEtKjSporQZ/0gn/AbWfPyDf+rOfwRSuJEo4QdtJ5mt2s9UCYVzKzKOcqhmkKXvdUwhyNy3jwvVGM7dKH2aBqJWK5vf1lSmkk8CiY932+TvvEJSGhh8yNzfPwsKCMc1xva70XEdb/JZz3PYgiEXHVEphOw5WqueqlDaWvlIStdvU5uZwtGb7pg389S9e5fmnHmeokMdb+pC3NU1XLcKoyogO2q0wBRpSwFwr5OjJM3xw6GM+//Jr6kFA/9AwWkikZWM5LiqKaNfr1KsLDPaV2bl9O/ue2cNjDzxAHxClaHXe9VCJKaYTtkvedVFac3Fmjv2HPubN9w9w8eo1in2GM64dl7YfGLkmEpr1Bq16jbHBQZ54ZDcvPrOXbevXU/RcwiTGSSeYRCmk7aQOqFBTimNnz/HGe/t578MPuT45xdjqVZQGhmiHEXEQpIWFKt0QphupVPvXcRyklDQaTZqt9k+SfuidIgVQKpYoFkupqkqU6rpmG7XFt66XjbV4qv2hs7EoHWkmdZPU7mjQam2LJB5B6/7sk2oJtHDstV8ypgMu/zf/LfNfnl7MIReAjxI3iIeaAeuJRuJabVej1epXWhvnPClMcWWKJCVao+MIgeGP2rZFEkfUa1Uq+TwP3r+DLevXUzRdYazAAVsa57o28M2J79h/4ADXb07i5vPkikW0kERx0umj2xRqspa+/qPO9H9BrXf71+WQih+lOWVBpG07pm4ETcv3sYG+wQFIYm7MzPDewYOsGh5i08svAsZcTGPqE3KWxarhYbZu3MSalSu5MTlFs1ZjcGAIaTmmmM5gpFip26nSiiCK8GwT0DeDgLDdWl3S6pex5JgP35tLWMIRVoMdQ18bbAWRMrUVvfdTSfBdcNpxMQyDCik6r9JAXOsukvinbtaWcufMHtrsuTYZ2bKp5SGlDWQB7A80E2wrdKourYBavc7M3CxxEpu6G61N/YoQHbpK70WJ3o7p0cNfNDbS7pDC1CZ5nksu5yG1pt6oEzQbjPQPsG/PXp7fu5eVg13vDkUXRJKW6AIaZP+6m+kkSUAYjr3SxvXZch3yjoNWmoszM+w/+DFvvPMel65fp1ipYHu5VLFEU8znsZEszM7i12usXraMV194kRefeZplJQ+PLjiX6d4Lx8aRBnme8X2+PnWKDz7+mG9PnqARBvSNjuDmczR9n5xdxLFt6rUqCzNTiCThgYd28trz+3jmkUdYOTxMAsRhaK7TttN5zVBNHWCq2eSjr77hj2+/w9dHjmJ7HitHR5GW3anRygohOyZN6fPkeh4yiZlfmGdufp5EdzeNnRt3jy2fy1MslYyAQlqzQyqNqZRektH0p7dM956U9QBBFCKjsNRnHt/4x/bS/1Dbzx+QL//ZzwCACJW0JwIvbDbtRqsFUuCkHDhIRebFvaOEd9s0EIYhQgrK5TKlUplumeM9HghAGA3VRqPO7OwsCwsLOMWisUKW0lARMorGDxwuS0Xpzo7TDGJNag4hTD9ZAtqNBnG7Tclz2bZ5M79+/nleeHgnKwsFU0zCnVKGna9s+MRSpsV+6QSBCWRjrRHSwhKC2ZbPNyfPsP+Dg3x0+EtuzM5RGBykr3/IBNXCIOPtRp0o8KkUc+zcvpUX9+5h76OPsaZcJtAJSRwhtCaOTdGQFgLPcYmBq7OzvHPwEH94622+O3sW4biMji1H5nL4seH7+60mcdCm3WwwOjjA47sf4pVnn+HR7dspAHEqsea4Dkob5QjHcZFCUEsSvj19hj++/z4HPvqIy9cnKFQqVAaGcPMF6q1ZwiTuIkSyu3BoLZGYtLC0LWqNGvVm894D8myFzBZfISgVS5SKxc4GJeP23j42fmrAkIWlixddM2jBuIJKTyq1Rih1Ry1DCaxcsY4N//w/Zf6Nj5nntImIe4/q5pR44MF4G8pae/bUqpuXLw1Xg4B8qZjSn8ym1KgICaI4QicKR1rkcjlsKYn8NmG7zcDoKI/s3MmG8TWAQXCTHkfVhSDg/MQEHx3+kq9PnMDrqzA4OmpMuKIYdPyjQc4/9nYvYyYrBI6TGGlZOK5Ho15HS0n/YD+2EFRnZ/nq2FHWr1vLzkcfZdVAJd0cGVQPFEUpWb98jG2bNnHm7Dnmr08Q+m2cfCq1mCQp7KKwHYtYCfyWj5XLmfnSdvDjOF+rVR/vaza3jMDr89yBTSnNuCwFUE5AKrCSGCuVMQTQUhLkbcoLrdJ8tUaIxnJd8521Mo6TMnOx/Knqinfo0wx1T1F0KQT5fJ5CvrBIUvNugqwsIM9aBMwtzDM5NUmsEtycZ5DpTvHk0pyUJU+hMR0ppTlHipzmXJeC56LjmFqzit9osHZsjCcfeZRfvbCPnevWdIzBtO6d10jlG+msaGl+DktItIREGblJlDB8ZiHI2Q4xcHlunnc+PMjv33qLE+fOYZf7OlK6CLNm21LQrC1Qm51l9dgYrz73HH/16ss8uGoZsdYGpcYAWrFSJELgSIsEmA8Cvjp5gtff38+nh79ktl5n2cpV2Kk8quu66CSh2WpRnZ2mL+dy36ZN/OqVl3npqadYPTCIBQRxjEgziUmS6u1Ls3G80fb5+Jsj/O7NN/nk8GEaYcj42HL6BgaYr9WI0z42q/1iEE6jcXMeMpYsVKvMzM0RRDHKde4hDhedns+O73kepWIRL5dDNBpGGMFy7jQq7qr1Krncdnq6lBVJVjyuabR97GbTHQ+iXOI4DTsIfvL5f7Dlf16a+j+aok4BtiWUl0SB0/INZcVKpQYNeJaSLdRP4zT1nKezI++8ZraDRLEJvgqFAvlcDhs6gazSWUHpjxw8pdiIVEYp8AOazQbtdhu7UOimgrJgvPM9Fpurd8P0Dp5lHiQpsaWFH4VopSgVSziWRdRuMT8zQ8Gy2LppE6/te559z+yl0mc4cxa3o4JdlGLxRUiZSVLpFBnXKCGwLbtjf33+2jU++OQTPv3qa6YWqvQNDaNsBz+KqPT3EwU+C9NzLMxOM1gs8MB9W9j39FPsfvB++gsFIiCJAjzPIYkiavUarpenmNJUrk5O8c6nn/LmgQOcPn8et1ig0NcPjk292URaNsVCnvm5GRoLc+Rsi53bt/PaCy+wbd26DoJqCcOPTiLVkcwSQtAGrs3O8+HnX/Dhp58yXa0yvGI5gyOjtMKA+VbL3POOzTTpYqINzy5FeG3HASGp1uvUm42OG2VnXBkeyNJDVmcLszKIlDQSm/lczhQCaYMyyvQ4Oj1/ByUXncPc3fSpu1s7SBd+LVN0XKcLvPnetrAsGzEkYXipQ3nAamAE8ImMNOXiJgCbf/q3kfg//FdyKGyu8D44MH7y7BmrGYZUKpVOVsp2TcYiSRITZMfGjMeyzBiMowjbkgwN9LN65UoGK4Y7nsSGI2NZJsU9tVDlyyPfcur890RaMdjXR75YJAgjE7jTLYi9tV/uHAH9eQOy/6Fa12ExDUrRXUR00cTQ/dlKlUaarWZHgcfKJFmVxs7ncIt5qtUq350+zYFDB3nxySdYPzKClhattk8YxzjlEgPlPtavHmd4oJ9L164RRwHSNRtjbYmOyZJjO8gkod1uEUpJ3nUplkv4SnHx+nVGJq5WHl43XvzEzYd1IZe02dYCEmkUpAYiTX+zRjFoGt1zDcq2RBgVbVmdz8/Uq/gqQTq2UX3Rxpgoe947lqT30tdiKYfDxWh5p/jTsnAcx+hs9449ITo88TvmYnUXnNKYGv1mo0F1oWqs2VMQAqFNlqDnQKIX/tcdqOe27yyFJEli43+AoJDPkXNsbl67Tn1mlkqxwJMP7+Zvf/UrtoyvNiCWTjcyOkVb6SLj2dOks7lIpK6hQiIshzhOjFOy7eA6xvl1YmaWg58d5vV33uPEme8p9g9SGh5GOA7Nep2+vjLDQ0NMXLnC9I0J8o7Lk7sf4TevvsraZUOGTReE2K4pBI7C0BjTOC4OgoUo4ty1q3z61dd8evhLzl+5wvDYGMvXrOH6xHWkSlg2Mkptfo6pGxO06w0efehB/uZXv2TP7kdYNThElERoKcmldK4oDGn7Pq7n4doWAfDV0WP8/o03+eboMRIhWb5qNcJxqDWbaQF7GgWkc3CWjVU6QWCysQJNs14zmYkoJHEdbBZPYT82XHUKfAE4PRxyKUSqQa65NbNzLy3bUHaowCkavsiVQxkqVTbGm3FIYWbBWn7phqctuyGjn0mK/L61P89x0/aPJyDX2rKTKN/2m06z3UKltAcTsKRvulNg82doOl34XUtSKpXwerjTHc5T7yC9w3jN3iswO3Hf92k1WwRBQJ8wBZ1JopecsO9wxEUnzGK8DO/QKNqtNn6tjlSaLZvW8erzz/P8E4+yYaCSmgqZAqvO4XqzlD2Hz0CRbmFNOoFKowfrCEEtDPl+4ibvHPyIDz/5jEvXr4PrURoYwk8S4kQRhRH1hSqNao28bbPjvi28+sI+nn7kEdaNjOEAWoVYElMEJiXCtvHSFOtsu8X+w4f53RtvcfzMGXylGB0ZwfI82n5AEieGfxmG+PU6A6UyD26/j1f37eOpXbsYyuWQaII0kHMd0+fCkiRC4AMnLl3mw88P88Enn3J54gaFvgr9o8vwSkXmp6bx2wHFQjE1e0oxHW1S66Y41EwyjueA0ixUq9TqjZ+GkN+SR87nckZZJL05lmWlaGO6gP3EFJEmG3c9gUE2LFIWjpJguy7SsWm02+D7fQMYJkoMzNBFN4oYmq52BOX/yf+Yfj8if+igcYcZHBRyZiY3vW5tkoyPi9LZU5vE5Wtbr1y64rS1YGBohIjU6EhIEyCKVFITUy+SqITQ9wnabYYqFTauXcuqFcsp0UXgZLqJaQNnLl7grQMfcOHqNQaXLcMrFAkTZVArbcbazzaB/MW0u162EVqbMZEoIm30g+1U8agdhsZAwnYoDPZz6cYEv3/7bVYvH2P9yAhg1DmiMCTRmv6+MhvXrWXNypWcPnceFSeEYYiVSlpqpUmSmIJnaEqtZjM1rxKUimXarQbfX7zEY5cuDa7eft+YMzQ2ib10QA6puY42G8ei7RJYmuuupGVL+uPE2hQ0K/HcVOn6/ByBTnA8xwS1KknBl64B208NTXrN5259PatHcV0X13Gw0o0/cIfQeImWrQVpljVOEmqNBrPz88RSGBpguskAFtOwFm1M73zGrARGCrAsSdhu05pvU5udYahU5olHHuHVfc/yyH2byaVH6RTbpnxx0bP0ZCAE6FQqMftblv0VCMsi79iEScLlhRrvfvI5b7y3n2NnvicUktGBQaTr4YchtuMQhxGzk5PMTk0y2NfHk7t389rzz/LAmuUGTItiXGmhE0UsAMvCs20SBA2tOXb+PPs/+ZiDn3/OlRs30I6D9HJEWuHlC+gkodVoMDs1hU5iNm9czwvPPssLTz3F+MAgLhAgsBFY6cVKabI/rm0x2/Y5cvYcf3j7XT767HNacUzf8DD9wyPUWy3a7bbJEJq9UwcQ0+lYUcrkjzzbQmiLVqtFtV4nCAJUsfgnZErBte0OACmlNLQhy8zwXaT7JzwBvUNqiS+XFXka5+OEVhCSazWsSqvmaiGMi3CxhLRtQ+H5C2n/aAJy0EKq2I1C32n5ATKXw5Zi0aDoGivc45F7UyhLoOMZohGGEW4+Rz6fN9qutx2nG892inVuf9cimaswCglTNNu2jYJEEASmuORH6CqLj5rtng1q6tg2KEXc9mnVa8g4ZtO6Nezbs4fn9jzF2rFl5jMpbxYhe76sWHRcoFPseVtLEWaVBrJnrk7wzgcfsv/DgyYYdxz6BgexXRdPKZJ2i/nZWVq1eQqezea1G9i352n2Pv4460aW4QKKCCk1lrBJlEZLi0KxhJQ2E9Uqn337LW8dOMCREyeJpaB/ZIRcqUQrCGm12yZwDyP8wKecy7N7x3Zee/EF9jz0EMtyORJMYamOI6RwkbbsPCmNOObq7BwffH6YN959j+8vX8YtlegfGsbyPOqtFrFKENbidEjG48sCR8Ozk8YxLo5otZq0/faSY+KH7nEXre6+z3Edw+nLUDQpEYmhrnQkzno+kKWBf6iJlOultOoUAeneBbGz2ZW4Xg4Exr65WnXug7yA9hQw23NNERAR47ouQ3/1T7BWr0P87/93cPo0wrKEpbVsFYuqCrZUbI7D6L5as2lb+SK5fI4kCAyVhAStEkSKFmLbKY0pptlokPgtNq9Zy7YtmxkoGf1grcCSNtK2iYBrNyc5cvw7vjl6lGaSsHHDRhrtIHXDlelCeYeJ4y767y++dbkCXYQ0u+o7XLxxRzbp+iQxAXQun0dKQbvdJokjLCkYHF3G3OQNvj1xnGNnT/PYw7soWA7SsbHSYuiCbbNy2TI2jI8zNjxMNQiNE6/rkunxq8xExJI4jp3WC4GXy1Fr1JiYnKRx48ZYpVZbJ/pHFrCdxg9es4ZECIJ8iev5El8WIRIwEEZy7fUbFbEwU5xfWDDW6vl8Fk12sih381zd3s3puvAjwbgmDdpct1OH0jnGj4Xkorse9MrTJSqh1W7TbDWxSiVsx06fL277Lt2NRpp9W+qMGtAq1dC2cYSgWavSmJ+nlMvx2MMP8ZtfvMbu+7eTI90kK42VBttGpevWQ2ZUndsDvVhptLCwXRsBTFSrvPfxZ/zurbc5duoUwnUZG1uGnc/hxxFhEJL3PBr1KrML8xRsh6cfeYS//fWv2b39PiTgt30sISjkPKIoJEk0tuuCECyEARdvTHDgs0947+BBLk1M4JbKDA8OoIVkenqWSl+ZqO0zNTlJ2G6zZd1aXnz2WZ5/+mlWDg4jMMXFXlqQq5RR85KWkdNtAkfOnOf3b7/Nx198wUKzyfDy5QwMD4OURpQhUV0jKmEAGBAdACjrMyENkd8PfVotA/L1ilplG50lA6Ql0iyaTGnFxXVdLDtTxOnmzX86Tr70V+j9JwSmiD8RhHFEoiIhHSzh2CTNJq0bs0vq+P9Jbd3KP9+xlmj/aAJyAVJqbBUnVhiF5HI5hBSpTbvZMSYqSR357jki7waeqUvWUi1JpYpc18WyeiaTJSaPO5+ruwGAtJI+UekEbHWLV6SFlKLLAbzlQVnqUTCou0HFXdcBCc1qA5HELB8dYe+TT/LsU0+ycngoRaEVVkdJpedB7QX6b0FlssLHTPooowqF2lgUf/DRR3z02WdcuHIVbVmUBwZwCgWjz5rL4VgWs/M3cbRi/dr17HniCZ54aDcrBobSQh/d1QcWqVKCtHCExUyrzeHj3/Hm/g84euI0uA5DQ0MU+voIk8QoCtgSx7IIEh8bzeZ1a9n7+OM8/uADjA8OIIA49BGaDsocqQSRIqkL7YCvjh7n4Kefcub8ebRt0z8wBLbF3MICzXaLYrFIPl8gDmNEWhSle+6TSbGajrPS8RTFMVEUd/hxgqV5oAJuow5lx8vugZMWs2WpS8uyIEyMTn6mBHGvLVvEdU9BTQcd111US2tc1wOVMNeos+zarDs20SyeGC22L9p3JnBYQPuBB5j7r/9r4v/yv0T+m3+jFPiNiQks0LaQmy0ltgmQho9vmUVIR6YwU1s4QiJtG2kJSBJUFOH7bXQQsnxsjI3r1lJMZdSSVF1CSKgnijMXL/LdqVPUGg28SgUvn6faDojihJxr0xUsVd1NVdqPutPzt96cLEz5Rx+uL9mSxEig5b2c8VIIAqN4lVLtEm1wTSfnIRyX2sICJ8+e5fiZ02xfv4GBXAFLSuyUuztcqbB+fJwVY8tYuHiRKFJIq68DTmQIndDgWY7JkiQJjmWjEWazvFBb7dbbm4TS3/3U6xJKOU67Xfar1UKtVkU7Nq5to4VEYwIqUuOtey1q61Xsyn7PAJ/ef6TPte262HamqX7361ono2QZqUCVztthGND2fQqlolGAiiK08W67bQ3T0DPx0xnmmeI0GkSaXRXScP1VGOJZFg/efz8vPvcsD2/bxlChQBgbZRBbCAOAdJ6vLkzaoYuJ2wV3jd+IoRjawFwQ8O2p07x36EO+On6UUMP4qpXk+/qYnplFWJKc5xCFAa2FBawk4fHHH+c3r77Crq2bKDkufjvAtR3cNOsmLAtpmexbG7g8Nc0nX3/Dwc8/5/SFi2jbYdnKUYaGR1io1ViYnaWvWKTdaLIwNcOqZaM8/ehjvPrMs2xftx6tDb3GFoK8lycKAsI4QjoeecsijBNOX77C/o8Oceizz5ian6c8OEixv58gSWjOz4MQhr+tu0CeobWyqD4ATNZGI4iimCAIiKLImDWJ7tbqblovEGhcyG1c1xizmUyp7jrE/oSpbymFoA5Nl+4apAQISyK1Ik4USinhCikqleXcPPoRX/8//6/Url/F66vc+5e4U/vssz/fsZZo/2gCckBKKSyVJCKKInLC2GfrJO5Y98ZxnO7q/pz7NjoTZnZ813UXWSdL0nTfXQzOzN0PzPjL7OaNWkEakMcx0japOaHNZ7Jiju4pblFf6SkCkkJCkhAHPkGjwfiKMfY9/SQvPbuXHRs3pN4spvZedKg2tyC+PddmznaHvkHQjmLOXb/B2x98yBvv7efitevEWtM3PIhXLKaIdAAoVBBAGLBu7Tj7nn6SF55+mvvXrzMV7lqhVJTSQMzkIi1JgqShEj4+cpR//+ZbfPH1N8w3G4yMjeEVC8Qo4iTCdR20lCzMzFCwXbZv2sQLz+zhlaeeZG26CfEjUyRqpfc0wSwmFnB+Zpb3vzjMuwcP8t3pM8RCUiyVsTyPII4J48jIQVqmEGcR31p0g4ZsYjHFnWbhipOEWPUyqe9ywAgJQi+ioYjUHCfrf4TZuCVKdZCle34CsuCbxUU9pN/SSH4KEBau5yHCgNl6g+GZeWew2ioGg/n52JY/4KKWELkO9fvuI3n5ZcTVq1omSZDbupWRZrNsLyysCVRiuV4ebdkksUpRbmuRmkAcx1hCYkuB7VhorUjiiLFlI6wdX43nOB0kTjqSAJiYnuajzz/nq2PHyFcq5PsHaLR9tNbYVqZt/P+7gfVPbZmqENDxTzDzmfEIsFwHISV+nGDn8hQrFb797jv2H1zGstERRnIFpOMQhCGe61K0LdatXs2qlSs5dvYsEeA4FkFkbMUdKY1EHDGu4xiKQRDh5vNI2yGME0Q72Oz4wcNCq3fu9jp69l4AWGjHjuNi1Gh4tVqVYv8AnuOa+g+RqnqlahN/SluKlqjTuhyRgh2u6+K4TlrUfA/HBhCp0EH2mtImWAtD8rob2HXLJ3s+2/Nzd55bPK8IjKykIyQqjpifm6XoOWzftYtfvPACzz7+OEPlsjlGkhhTqB8ttLoFrU/t6hUC25JEwIwf8PFXX/Ef33qLL44dox5HDI+NIfNmno6VIufYWFozMz1JybHZtfNB/uqVl3nu8UcYsAw9JdAKW4Do6XOEIATOXL/G/k8+5v1DH3Hi7Dm041Dsq2B7Ln4QYElJ3ssze3MKHfhsHB9n3949/PrFl3hgzTgFwE/SDYdKCIOWQbotG891aGo4fvESv3/rLf743n4mZubIV/oZGBkl1hq/7ROlrpWWlRnVpWo0jvFfUYnqrDsCiZVSLlWSdDLvRi7SusuZrcs26G2WZZmAPPVH+blbz97PzPtSpPrnNuQdMTE2yzlxnBvffEE0W/35v9Cfsf35XXL+h2sClDAmASk6kcpg9eq5/pyLqkoVLX4IRf8pLQvkes1XMl3sTpzcQ6sRwtAJMrRVgXEJFWBLgWtbxH6boNkgZ1ns2LKFfXv3sGXNGjxMsVuSuo7qJEEnJo7qpkvv3IdGUcRCC9lRMbg5N8fnX3/NoU8/4+zFiyjLYnDZKJWBfhSaMAyQQKtWJWzWGRsc4NGdO3nq0UfYsHIFeUDrmCgOUYnhpwlhmfQkkkYYcuriZd7/5FM+/fJrar5PX4qMt4KAarUGGjzbwdKa+vwcg+UCzzzxGPueeIxNY6MIy8IPQ1QUknM8pGXRCvzUWAcC4MtTJ/mPb/yRr44cJVKaFatWUSiWaLVb+L5PvpBnaGgIpRWtdjvtD5kGyNK4x6VjQylFHJtiJ52a99y64dHpffsps1xWi6DTgxnd4qQzRu/1iMaFkM7GLhsFt8n7CYHlOCAtmn5AFPt514oHpNBF0gwnP+ZO8C/+Bdb+/QwdOsQD//yf8+iVK0Pe5cv5+TDCyeWQtk0YR8RJjGXZFHIFcq6L1oog8An9EK00tuWYwivHpq9Uoq9U6m5UUtSr1mxy/tJFjhw/zo2pKcZWrKTcV2F+fgG0wHNzHXTGoHP0pPzp9EHHSvwfa8vYKXc5cAQYk6ZUezqJEzzH0KiiOEKjcVwP23FptdpYrsPgsmVcvXGDr44cYXp2lkwrvNlu0mi3SICBgQGGBgZI4pg4jlKzE3NvbNs2ykJBmC5sXWlY23aMOye6QhxvQpP/ga//Q11ABXKuoC9RKh9GhjNuWZZ5vjETb0f+815PwmLaSgcRv/W7pOuMnWbDrHtcybsEsy4LWwvjpqkSUwTY61B9p5qlRc+A1OafmSgMb1wIRJKQ+AGthSrLh0d4ed/z7H3scZZV+mk2GjQbDTzb1OpIK7tz2TfM+rE3K5d+FwUq0SRKE2uNDdRabY6cPsPr777Hh598QjuJWTk+zuiyZVRrdaamp/Ay74l2k6BRZ8OacX7z6is89sAOBmwbJYyufSGfQyUxQeATpdKqITATBnx1/DjvHzrE8TNnSCyLVWvW0j84RLPZ5vr168RBxEC5zML0DCXH5eV9+/jrX/ySXdu2IjyPBGPiVsjlkdKi0WiCMJr9Arh09Sr7P/yQN997j+8vXaZvaIixlavwigUarabZNOULRnAgjjtjwkhEdjduQKoB340fNEaWOE4yL4nee9khhNzVOJKkYz991jP62J9uQndr3LZ4nl30XAjzvW3poPKSo5zi+OhRojuXiPyDbf94EHKtLRHFeUtrL1NXyVyjjKNZ6nr1pwTK4vbq996AX0hp0oh278SSmbaZ1J0JjAxSLaylvsstg5DU3dGySBLjdtfhaimN5zgEfpu275MvFvHyebTS+GGQGuQY9zhbCAq5HLYQRL7P3M1JynmPfc/s5a9ee5UHN26ikst1NJmtLAgRAqQNwnDXtdbkPK/Tjeah76LoShkdYc82knQ3G03e++RT/u3vf8+p8xfQjkPf0BDCdWm0Wji5HHnLwm80mLx+jZVDg/zml6/xyxefZ8ua1eRtmyiJcS2JsB1T6JUYKo2WBhE5ev4Cf/f7P/DRl1/R0oq+kRGkZbFQq+G4Lv2VCpYQXLlwAeX7PPbQTv7qlVd4/onHWbds1CzmOk3pWRZxGKKkwPFy5Cybm40mn586yZsHDnDy/HnqbZ9SZQA7lyMKAhLf0BhSuV6kNI6P3DK5Ka0htZHOqCRKSrPp+YFF76e23jTfn+VYpJStDA/rCRyMS17XDEZJSStJUPWFTSO1mZd3qYF/P4x1rjjTLCY5JwyKrgoEuoWNhU0IhKRLreOgHQcfyGnNqBCyvbAgZ2pVhG0jpU0SJ6lbbFpxnyToRGEJC8d2EAiajQa2ZbFyfJyVy8coFfJYwhhvZGnaqelpvvj6a2arVYp9fURxAtLGdgzvWQpwLNu4jOoumUj3yK10iCs/MUX7D71l1IQuaecuP6dNUSe9AYLWCKSxl8+qe4U0xbhSECSKa5NTfHXsOKuGRlk/PJLSDw1paNnIMCuXL8e2JLEfmA16mp5PkhjbtgBJGIRIIXFdh0QlIAWFYpl2GNGaX6iMJUlUxxivLWoOqAIERQgsSGJo2zAYRfazU+1CNNRXGxYiPxLHz8xa1kNevojSwrgo247ZgAM6TlAWJhBC8EMgxlLNusXkJ8uSdjb0GWqbbgQWIdNCdBM6d1ru0s266BnDnU18SkEz03qXzqBSJ2rbsk1ApxKTcbbsjvycjs2m35ESxzJ0o6mJCRLfZ8fWLfz2lVd57rHHWDU8bAq7vRxuajJ367Vmpjb0BF7ZQNRJQhJrYg22YyEsQyP55vRZ/s0f/sDBz7+gGoQsW7USr1ik3mqhtKaQy1FwHCauXCZpt9i9437+yS9eY99jj7JycAALDLVP9jgPY6g9NjC5sMC7X3zOf3jrLb45eRLpeVQqAyAlUWj8DyqlCrW5eRbabVaNjvLS3r28tu95dqwdp0jPPAcmmNaCfKFIPp8nUorr8/P84b39/Ns/vM7N2Tn6R0fIlUsEKiFph7i5HFEUEQRB6h9idWWGb2kyldtVSYxSCXGSQM97F+f+0r6/JRveM7KANOhP1/sMAFQ99607rm73b7mbtsg8rwNyWkiRmlRlWdqUiiyQaGkhk8RyfN+FpsTyVSqS/xc1I//8AfmxY/f2/jiGXA7WrIFi8e4/p7XUcexKsKzUoVP9f9n7z2C7jnRND3wyc5ntj4UHCIAASAL03ntvyt1763bflnqkUIxiFDGaHo0mQr80mgj90EQoQqFRzPzoUMwPmZhutbm3HB0IEgS99wYg4f05OH77vdbKzPmRufbeB44gq+oWb09l1SEODvbZe5lcmd/3fu/3vp4za7X7vm+c8Ae8R/2JLYbk/s4aTpLLTSo8x8qq89MG+pzfob8j3CKRZRqsky/S2iEZeI63kgL8OVuG1LasS0SUdI1paadDY36Bahxx2w3X81fPPM39N99MDGRWo62hKAOk1lhrnKaol1q0Js/A/XX1KJD1i5YQEoPESocknFpYYM+77/Or51/koy++gChm1arVFMplumlC0us6aa0sJe00WTMxyj233szTjz7MnVdegQLavS6ZNcQy9g+g2xisVLSyjAOnTvP8nj28+NrrzCwtMb5qFaXRUZIkodvpuIYna8m6XUynw9rJSf7yqaf4q8cfY2Wp6O8PSOOMRaxQJDoBFWJVwByWt/d+yb/69a9599PPaGeaUm2EYrVKqrWX83KNZBhN2uv1pQaX80cF1vjA288VJSWZEEMLzh+mYOW3trP43o7CNaz+8L3G0Dzvu1Xm3FZyWVHIfLJkpKRjLAszU1s7+776q3Wlgl4RFr4KDxxdIQvFrLF6RfP4aKEhYyuKJo1GCJNVMuqEUqZdoCCQNaXMqm63XG61dhxfWFg532whwwChQl/xcQGw0do/G854JAwD0JrGUp1KGLJpw2WsWrGSWAwClxzpPTZ9hk+++IJeljE+uZJOLyUUAcW4QKfdweoMFYcMnEmHLsn3vYb/wMdwenmxc+9f46FNGmsxXvNZ+gqeq8IJVBiAFKQ6I65U6GQZn375Bddu2crlkysoxsX+mlYpxExOTDBSq1FPZskSF95Ya0hT7apbEjpt9+yrICTTKRYolIrMdbpUp6cqVy8u3lwql5PDjWYZrFACiUVl81ZGTatGlowaFzYqZjYgDMTo4nx18tSJ8WzT6pm0Em1oHDn8VLPZvKxYrWKkJEk0AY7ioWTg9hjRfxIv/RoPJb753/OK6HDjZh6s5FKfvz8e6YYSDvzxOGf/3oEDLASiHyTlwZfGYq3OZcdRSEIhMGlKs9PBJgmb1q3jF089zS8ee5TLJibQWJIsoxRFTinLmn7wNmgQH5KPXMYh9nuosKAURgkWuz32HTnGs7tf5ZW33mK20WBs5UoqIyMkWUaz1aQQxQRS0m01CHTGto0b+atnnuGnDz7IZeNjgAOTpOOKuo+TyjlgKsU8lrf2fs2vXniRDz79jK61rBwbp1As0W53MNoQyoCCCqi3O8TAw3fdzS9/8hTXbr+CmgcDhOfkW2udVLKUrhKHo8LsfO01/u1zz7P34CHWbtrI+OrVdJKURruFMVAsueeh2+k6gzopMNlgfT47gcuvmTamrziipOp7N3zfSdK/P2KgiZ+lqausCAGeq+5ffenvn39MH+jxwTge6BISgYs1+pmE8JKXUqBSLWl3Q4FQiNAMoa//YJbqP35A/stffr/Xz87C9u3w3//3cOutl/577uYYRG7mO8SUFXy/iXfOe5/bt95HEvwEN37B0JlrmMgy3T+sYeRB5hPoAtCFEPTnkUNbnbqJ9rSRHKXPzXeazQblcpFqbQWLjTrz83OoIHDobrGE0Zo4DImVIm13mJ2eprkwz2MPPsC/98u/5tqt2ygAKW7iqzxokQIhFAiXxWttiELXCJr5EpmSEhUEzl0sy5BKEipBCJxuNHjns8/5zQsv8MU3+xhdtYpSrYaKC9SbTYIwoFat0ul0nRxU2uOXzzzNP/75T5moVWkmCbUoohTHWJ2hs8xr4krCMMIAZ5bqPPfyy+x5621UsUAR6GQas1SnUi4xMTlBY2mRuenTyDTj6quu4rEH7ueGq68mDEIa7S6l2DXgogQ6yTBZRhgVsIFiPu3xwZdf8sLLL/PJV1+z0GhRGRmlVK6hwpCk5yg0QeCqIlYY0jRxRihIwiDGtaPlpefBVM3nkNbGaZIL6fjQDF7T36DOorN818jLvWcrNsg+h50fjJyfZcA39InDB+42nlQbTszMRdHHH++IDx78zyWia9udICrEtjBSNetKBR1ESgQgJpSyVxZKOi6WtHTImJVK9SpBEGbNxmhncWGiZS0yjBBB5FA5aftVACkFWJ9sGIPVGmMtSikKcUwhilyjMp6nJwRNYGZxkcVGg1a3iyyUUGGIlMpRXoIAqw0mGyp9emQ8D04H1yFXmvgHs/Z/r9G/w8vm4flD82Fg9pxp6x7h5VQsH21bKwjCCCMl8/UGC406XQYcp9S/NApDRkdHmWk2yTKn3yzAay67Jn4VKDcPjcapiSisECxkGaunzqze9skn/9n2gwf/vUazFWBtJC1VjKkk3SzodRJrdCKzpCe07wtKOx11vFFXyfsi6xkdJvX6xOyZMxgpCeMCKEmSZu6zw8A5dxpDmn3/svnZ1bLzKa/kfhRpmvrmvMHF7qOcF8nv8yZw079bgkC6ZDYMw8E+Ixw/WyEpFGLSxClViUARxhGhUnR6XTqdhFApKsUipTiENGVxbonZ01Ns37KVnz75JA/edSeXTThdbyyE0q2NaZZhtfamdwppcT+zhigM3DzxG6nxCYhUrooVAg1jOXjyFL97aRdvvPceIo5ZPTJCoVKi2W5jMRSLBcgMCzNnaNfr3HHdtfzy6ae585abWTE+1reRz3usrHFVTxUGBFLSs5a333uP3zz/AvsOHaJQrbJiYoJemrG4tITJNJViCZFpTk8dpxrF3HH99dx3x11s23g5oR2oUvnTdvM9irzbLBw5M8Ou19/gX/ybv+XAiROs37yJ2sQEqTH+PJz7cJKmYC1xHCF9tSCfE2fPn2GBCCny/ibHJ1dSnBUX/aDuIqcMo7V358b3Ejmnzu+5dV3SGGDz9BM4t7A7PjlkxjvA/MPRO/Tjjx+Qf/vt9/+dQ4eg0/nu1y0fBikypDTDihN/zO1xGdfPcxW11nQ6nT5yCj5A6iOMIHN0/OySYp5K9H8mnDyhAJNlgwCdYaqMRwuMQSlJEAYIH9gp4STHQiHR3S5TJ49TEHDfHbfzF08/xf233UpFScBgsoRABYQOgnYHJmQ/A5ViqJTUl0B052ssCKkIlXMtW0xTdr3zLv/6t7/jy337SKSgVqtBFDkHuDhEWEu30WDmzBniIOD6667jyQcf4J4dO6j3OijrEPrASyYmWjuOWhiigQNnZtj93vvsfvsd9h89ysiKFRSqVayUrhFPCKw2tJfqmE6X1ZMTPHbfPfz1M0+zemycUhCQGZ/kGJdQWGOQYYAMFPPtNh9+s4/nXn6Z1997j9lGg6hSpjwyShhFZKlTjQBLGDjFm8wr4gRKoUQwfFPPPxGFa0aR1hLHsZMq7E+JoV+4WOnZl3TdJuyGdh3n5KYZZ6Mlf6ynIi+CGpzpUXl0hK418tDRo6U4y0rKaNd8F0jiQBHlZWGsUxoIAkphSOjlzjJhEaUySRBw9PQUzTSlWCwjpEIb46vXLjSWvrnV+mqSzjJ0khJVq4yOjDBSLhPiegEErol2anGJg8ePc/rMDK1ewki5ShBFTgEkywikwiLIkuSs63e+8/7Dbzw/pvGHPsccgc3r2zkPvFgqY7KEYydOcejocebqS0xWa8QejVVArVJl3eo1nJ6fp9vtEsZeAxlXxbBioEefeTt1GShCInrWcvzokXLrxInbysYgdYa3nnGmPxgSo0lTTVdrelZjrCG1lh7Q63RJUo0uxJgwIi5XCOIIYwVZlqCUq3Bqj+L+0NF/fs/ik4OnswiBNoZempIkDhiwSl7yDfKek7gGW7deKqmIw5hCHCOF9DboDqXG4hpm80qUp2YihdsmpCUMJIESWJOxODuD6Xa58vLN/OSJR/n544+xZfVKFNDqdomCgDjwljTC0Q/7NAf/eYNg0v0gzTJvPOMoMhb3PH91+Agv7HmdV95+iwPHjzG2ciXFcpkgikh0hkk1JktpL9URScKm1at4+J57ePLBB1lZrbi+KcB6UzFjjAOXwgAhJPUk4eP93/J3L77AnrffxgQBca3mKJM6Q0pBqVjEJAm9RguZpdx04038xTPPcNt1V7OqHHrlLNfra6zpV4oC4WiXx+YXeH7P6/x25y6OnJ5yUrorJtFC0O46meM4jpBK0Wq1UEJSjGNXnR5qOAV8Fdv2v4fB8yuFJAzD/n4j5bnSkt81cpUfcFWrLMtIksQDdX+8iGsYBDnfyIS2Sgi9mU22s7CFaRNwERWBH+X4cXLIjYHmxSVizx3CWCkTIWSmhHu4h5vagCFO2h/4eN2bE4bOHKLb7fZRZPzn9/m84iz1kwu8Fzgucr+L+myOsbVOEqxYwuiMRr2OiiOqlaorYVqLMBopBEmvQ9JsYns9rr3uOv7Dv/kbHrjtFkaVJLGGLO0hjOPfCpUvGB7Ft56HllNULAQq7HO8kix1i4s/99ONBp988w2/3rmT1955m7EVK1ixYiVGCDrdLlJKRqtV2o0mjaUlSFOuv2YHf/3Tn3DDFVcQAbU4dginzkiF6wHQCIIgoqct0406e955j9+99BJHT08h4gIaJ/8UxTHSWtJOh3ajgTKGTRs3ctuNN/DgHXdy1cqVfQ5sVIhdl75HmYIoRHgVjq+PHWPXntd58/0PmV5YpDa5gmK1hgqifpd6pl3QJhAYbTGZIwpFYYwUijTRfWQxR07zUl+uQKG1RgHlcplSsTCkWnNh9BGRo+eAceV6O/TvaZaSpenAqc/PO+spHj80qLr477mAygrvwhiE1EplsiSh1WpS9+o1gVKQZWTaXfPUZC4Y85QGnSaubC4VaZYSFQoUyhVSY5BhhA0kGtA6RXk1GYEFMaT0YAUYS5akREHIxOgY1aKjJ1nj6sWpNhyfmuLwiRMsNpuYIESFbsPLMk2WpIRxEYQks/6iCTsoLgyXzIYXmX8XRw5QcvZZfleYftY1ySft8GTtlxDdj+JCkV4z5fTUGQ4dPsLpqWmqcYE4jtHGEknBSK3K2tVrKB8+zMzSEkEYIYPA9wtZl8hJOeBZ45r0IuVQ+ZOzM3w+NU3S7bp+Hy+jmdPG8gb6XLfZCs8hDkMyH/gWw5C4WEAph+DqzCWbSIm2kHkUs2+o9j3nxzAVsu+6OCyFKF3AnPV6viKbwfewLPfT2T0PXqFFBpJCqUCpXEL7yqiw7rOsNnQ6XQTOLl2FTotLZ5pAKcJikUBIbJbRS3q0G3U2r1nLTx5/gp8/9ig71q8FoNXtkXS6hMUiwvdCKaXAa2fnQ0qBsAN3C2MsmW+sVGGIQbCYJpyam+OVd95i52u7OTk7Q1AuYaOQRGeQuEb+Xq9Ht9XCdjts3bCB+++8iwdvv511I7X+J0og827bmdbEKkYLt9Z8uO8b/va5Z3nj3fdYaDZZt3EjWgUs1ZsoJSkXShRVwPxigwjB9iuv4vEHHuT+O25ntOD3cpvTRiypdgG/Ctwqf2x2jjc//Jjndu3i82++YWLNGspjY9hA0Wi26KYZYRwTxbFrzM8yTz900qE5GNNP3oz1oYZYHvv478MoohgXiKO4313/w2apS2SSJOk3bv+xhlt3TX/xzU2QciqTAFKZWWWluWZxmy3OXcue4igNGoSVyh/tuP7Q48cZkM/Pwz/7Zw5d/2f/zNd4vmMILEIZoZT93tyo7xpDnLb+x/VpJcKjC7JvH5trfP6+W7QQwqtE5Dzuwc+tBSvwvHjlHDW17itplIolAilp1BsszpwhBm689lp++tST3H79tUxUKiQWMJpIKpQK/HvZZdk2Og9GBFknxVpLWIoGD7+UBNL16i8kPT746kt+++JOPt+3l7BSIa5WsYGi0+m6zDwISLtdlubmXDB+9Q6eefRR7r/1ViZGarTShEIQOhRUZyRpivBlYSkEM4067338CS/t2cNHn3+OLJepjY2hcQt7ICVpr8vi3Cxps8mGFU5f/amHH+LaK64AcKi057p1e11Hx4ljwjCgl6Z8eeQoL766h7c/+JAz84sUylWK5QoISavddvQhY1x51183a1zwnbsG2rMEiPOqjQXw/HHZ32QF5VKJYqHYN1gajvfgwgtlzulnqO8gSRJ6fv7ZfF5YM0hG86Dcf8glzVN7bjFzWNZxOOXwDAS0tQ6hUAFBMSBQbq5kOsOkrpoTKVfil1I6alKSEEgFxtLudhBSERQKBFIRRLFraEo0Js0Qyi6ryrtzctgf3rkxCAJqtRpxFLvr5dGkzGimpqc5MzvraBCFmCAOsTjkUXt5PkfzGZTM+13+Q3do8N3ZIeu/K5j5hWaIOOdvw1XBwUsGyejAEG1o7tjBvwdhiEGy1GwyNTPDzNwcm9euhTgmyzIKUUilXGR83EkNJr2ECk57P8tVhLQLoA3OGEXgG9WlIstSkIqxVSvB2EHfhoBcEcmLKPd/bsWAiBT5KqQKQoyxdNN08Ex57qw2DqmXFy9tXXScj7Li0OGBcpi11iOTqW92c8Nglzsmn/Pm9HnZRhusNH0VqEKhSLlYpp6mZEnW1zjPm6CjKKJYLNJJe67HAkupVCQKFJ1Wk3azSWAMqyYmuP3mm3n4/vu5YuNlDqhKMow2rpHT+yRkHmGWvhrlL7lTz7HufqRZSpImLqkKIgSuR+nYmWne+uBDdr/5JvuPHaU2NsFYrUYnSVxlxBpiJem1WiTtNqvGx7jn9tv4+ZNPcPXlWxxi7XnP0iP0KghQUUQhDOgkCV8cPsLvdu5k157XqPe6Tj4xjEi1RknJaG0Em6QszM7Sa7e4/oqr+MXTP+GBu25jtCB8k6izeHcMDifHGklBagwnGk3e/uQzXn7jDfYdOkRiLCqOSa2l1WyRGUMYOffZNEsxWUYhjhwNL45JupAkbl92VDyJtZq8apg3QUovDWi1JgpCCsWik2dmOZMgl5A9pyw7/K1/jcARQ3q9HkmSoI32fXQC83vwE3KVvFyEw9qBYEK+xg8rAGHcuUskGGl78w3GN2/lnv/qvyJpt1Bh9IOO408xfpwBeZrCwYNc9q//Nddefjl777uPQ6Oj3/FLQluhEiGDTPUb1374gngpY7ikKKV0KE6S0Gq16Ha7fSRWSoG0Q4v8JQ4pJXEhplKpUCiVEGLA38Znv8Zap5MtBN1ej8xkzhhGWGzSozE7g0xStm69nF88+QQ/e/gh1tSqzr46TYmkcPJk/Ycw5ymeFanlJ+OjLQfO2j6HfL7X44Mvv+B3u3ax+623aCYpK9au9WikJgxDClGE7nWZOzNDYC3X79jOE48+wtMP3MfGiXGsNXRTDTi0y0rpDJA8CnVscZE973/ggvEvPqedJFRrNQrFIvgAt9Ns0Fpawva6rF+xgvvuupOnH3yA2668gkoYklqDwKK1JjWG1DughqFzbPzi6DF+u+sVXnx1D8enp5GFIpXaKBaXaHW7PQSCUAXeDRCscc2wQgoUDmF1Ml3LE8mBIZD7EhZ0kkEYUKtUqZTLF3Y8vchwgc5A1afV7tBqtwc80RxZox/7/FGHq07hpMIA5XmSym96Usu+4UsQBgRR6IJeY7CZdgG5NQTdDsY6tN1K6RuMFVaYwaKcf5gfEvqfZTJNoAKq1SphFPpjc8FVO804fPwE0zOzRMUihVIFpQK36VlXqjcm8823op9k/Hn8McYAaZfSUe4yA7Pzi5w8PUXnyivdq3wiWQgjapUqQRCSeLMhpZyLcaZTtDUEeTeglC5BBoSvzgRhSLFWQ6mgTwUZTCG/rpoheVfhuOiZ1o4CGARkmXMeTdO03wiZc4+NxVXOHAT9+10Z38w5zA+GvLfIkiaJW/ezFGz4/faYvMJmLFJBIKFWLjM2OkZj5gzdbodqOeivWSp0zrYG97k6TQnDkEhKpNZ06kvobpfVK1dx16238rOHH+GajRsoAD3t3HSjICD2vUjWf7ZFnMN3z/dWbQ2p0Q5wkaEDUYAjZ6Z4/f332fnKq3y2dy8pEJVLFMtlUt9kqHs9mr0uIk3ZuGoV991xOz99+GFu2LSJSA6UQcD3H3i6YyAEbWv58NAhnn3xRXa+upvTs7NMrFlDbWycRqtFGMVUSwXINPW5OZJGk+2XX85PnniMJx68l82jFU+DsU5Vy1oMwicfrsfmZL3B2x9+ym9efIn3Pv6ITqaZWLMWo5STb00zooKT4M1SJ/MpcSpngVKkaeqUbsRQwjt0/aSUGOucthWQ9RJsmlEplxmtjhBHMcM2cZeKkudmfxpIsoxOp0O313WUTyldAvv3tFgaT9eVjgtsUqF00m3bcN0qLr/pOmQU9Tn2/xDGjzMg9+ORd97h//k3f8P/7Z//c/6Hf/pPL/paK4TOlEwIVKqU7JfncxOTPxhifh60HNwkViogNV1arRbtdpsU9yBIKZHfhyqQl2WEpBAXqNVqVKtVQJBlKXlTqLEusHQyi8plqBZKUYxJEtqNBlmnzbbLNvLIvfdx/623cNnoCF1cYB9gzwrGwXNRBiVTKR0UbyxhHPrjEySpJhOWgpI0koR9R47wyltv8+5HH9NKU6oT41RGRphfWEACY9URdJJQX1yiPjvLDTt28ORDD/Lo3XeyaXKSrjGEQlKOChhryNwOShgFWGBJGz748ite3L2bjz7/nMQa1m+8jFaakqUJ4xPjtFotGgvztBYXuWzlSu697TYev/8Brtm+HRko17hjIZAB3bRNs92mUCxTKLgO968OH+G5V1/j1bff5tjp00SVCuXaCDIMabbbvtSoXDAeuGA8yzKMznBax27zShJnuBAEilyJRsrBNR6WFkvTFAJFtVymUiotD8hzmhPLUYz+EDgOpx1SXwDanTadbsdVDDxVJZfF6r+bGLw+//PC8/M7KAl22Vv6nxkGfciuupOlmd8EfUDtaQVJkrjmMmORFrQ0fetsKRyqlGUGdIYKPGKipOspyPs3+sGTs51WSnm6AsRh5IJ8HPdVA0utDqempqk3mhRLFeJCAesTNYElUNJRgaxFSoYUVobOcliUu09bOaeWdsGr+g9vDKG2nH3uy7893+YuBGdVjoZQLj+MsQgZUiiW6fZSZubmaXV7AH25VwEEKiBvorc5LUXm66L280BirSCzGdoYlDbO7Rgx5AFgsf4+ukc1/375Op838Gc2RSfaBUOZf+5D5foNLH3/hihQICxpqjnPk3tJ43zNnf19zCeWxhjSJKHXSzBeNSpPxF1F5yJtejkY6l8ggXKpzOhIjeNnzpB0eohSFYmT+VShk5DstrokaUKoAsrFAsIauq0WSbvDRKXC1VdcwZMPPcQdN94IQEdrhNbEUeiqsENVOiWVp9ade5xufXQqJFEYIX0wPttq8NGXX/L6O+/y1f79aCFZuXIVmTYs1euuWq0USVfTWaqzbmKcO268kWceeZRbrrm2H/u7JkeFtpbUGGxetQT2Hj7Ei7tf4aU9ezg9P8/qDRsoj4yQZppOu8NkqUK1VObE4cMszc6xbnKSh++7jycevJ/JapEUyJKMKHBc9yTTSN9rZIGZdpfPvz3Ea+++x/sff8rU3AIbLt/MqnVrmZ6doZelRJ7nnemMNO25ym4QghR0kx7dTs+ppQTeFMrzOIQUg5jHz2chpas2pykjlSpjIzXiMFxOWcmr/vn8O3dG+n8f3Kmkl9DpdEiTFGvxvRzutbkm+e9NFcDFcX2GgP+S0I/HlFIQhKYXBBlKkRpDd24ul7P5/Q8gH5dd9od7r/OMH3VAHgLVdpsoSb77xUJYGwY9EQaZkq4RcJA3wu+zMS4rj5B/6zPrPNCxDqXRWUa9XqdRr9PNMko+4DX9UtClDykdL3p8fILJyQkavZReLyGOi4PynghIM421mmIcE0qJNIa5mWlskrB142X85LFH+dljj7FlnePxhdCnONhMOyMEJfvlIaONKw9J1zyEz0JF4NRIrIYwcAosPWDfkaO8/PobvPX++0zNz1MZGwOlWFhapOi5hZ12i7nTpxFpxjVXXMnTjz3Go/ffx+UrJgkAaVwzpLDWodBKEccxIXByqc67eTD+xecsNJsUR0Yoj9QQ3S7aWnrdNouzM3QbDSaqVe665RaefuwxbrjqCsbDAGMBPaA4SBUQF4pUCgW6WnN4boaX3n6bl15/nSMnT2GDkFK1howix4mWAUGQS1K6hSaXntS+AUsal+AoGfYd0s43LEMbfJIg4phatUalVPoOx5xzh/DNjAzN0WazSbPZdN30MtdB9k/CWXFUTn3qF0TOkzjmy/QgaD9fcDr4xUGy6JJHJSXDCZ6SynFrhSCzmkxnaOMsz5Vw7poDpMelKMYYtMnQJu8LsX2nU2H7nAGwA5lPo31AHkUE3hdA4ubswtISJ06fZrFeZ2L1GlQYobVBa0fZCpQEr6kshpIpv3Ndwo0ZusqX6qbzD20Mo8pn/zCvLy+Lv4fMZsiDzeXXxhiLVAHlSoVeknBqaoqFpSWytWv6WtVCDKp6eQNz/nOXwQk/pweqEVprMpxLswCyVPuGNzGkqTzQVRZyWG/fH7F18zfvhQik7FMdZP93ctOVDCF+WCBgz9pnhnW5h9eUvELU7fVot9uYkarng5/rl3G+0T9X/+hGwOjYCJMrVqAOHiTpdvuqIxkGYw1J6qoChTimVIiQWJbm5kjaLSaqVe6+9VaeeOghrtuylQrQ8wtK4PXSjW+4dhUN5emR+ckODsxJ7FpnVy8cOBUCJ+bnefPjj3h+9yt8/MUXdDJNdXSMuFSi0emg05RSFNFuNDDdLmOVKnfddhs/e+pJbty61cn7Zpnb84TzytAAUlAQgkaS8M2pkzy3Zw+733yLU7NzxOUKldERUm3ppSnlUomk02V6scHSzCyb1q7liYcf4pF772bTxBhJlpGlKSqv3gnHzw+VJLGW+XaHtz/+jBdffY33P/mU+VaL8ugYUbHsdNWj2HH4jabRqGOtk2yO4tgnok5e1uKpdkHgQSCLEGYZAOlwDYESgqTbIzCa8bXjrJicJA6c+EPecPrdE9P/x6+BAkdXabZaJF5+VCnVdww9X5L1Q8eyBDlHrSz93rxQSkQcmaRcToOJCZbef5/j//Jf0p2eJvhDcsj/l//lD/de5xk/6oA819K+7NgxKs0m7VIJcyGlAyGMDaNEBFGmPB/tj1meH9b7zDcEZ96jaXTaLCwu0mq1KFQqzuL+UoJxQR+dFtaZyxQjxapVK1mzZi3NY8fodLsUCiXAoZ5CKTLtZKPKxSrKahqLi6TdLhvXrOHpRx/hLx99hGs2bcQAnTQjVm4jsVK55j8xpHHrQdllKIt1nGinYeqCcgl0koQjU2fY/dbbvPLGGxw+dYqgVGJkYoJmt0Oz2aZaqUGSMH/mDL1Gi2u3beOnTz7OTx5+kCtWr0IDXZ0RCIHENakYYwmUK4k1jeW9r/fy6+df4P3PPmWx1aI04nXAjaZQLNDtdJg/c4b20iKrxsa4+dpreeKhh7jzxhsZlb6hJvOsX2nRNkUFimIQkQB7T59i9zvv8PyePew9fJi4XGZsZIy4WKSXpKSZ4yIHobuPSZqSZZ4zLgVKKIyxPjD3evNw3k2x/zO/kBhjCMOQifEJatXaD5iHbuLkFUJtbT8hFJ4SIiT0282FWB4kfY9xoV8TZ7/A5559xXNrfbzsNsFcWtNxGo1XoxgERUa735FSIJWvdBk3L/Dv4fSQLQYzSGI8X1Lkx6I1AteHkd8TiZPGnFtY4MzMLO12h1WBMxZJPNdeSeWfD903nsmP7Xzp/ZBH0J+HH3myB0MBLee7Tst/mhmDCALK1RG67SYnT00xO79Iz0LfR024xNi5YvpGL2tchSVHYPPhmYLWo+nCU0uMr1ANhvD/94orQ8HvObKDQqCw3tvBIY/aGqIoIJACm6akadIPRM/NTC5y3YYpKSxfQ5btIdb2ZUybrRaLS4volZMQhpc8GXNlleFfGB+psXblKqIgJE0SdzX8mqGt7ZvkFIoFAinpNOt06g1GSkVuuf4Gnn7kUe697TZGw5AEQGsC4WT23GEbl3xLV/3KVaCGJR2x3u+CgUFSxxjmtebDr7/mhV0v89YHH7DYbrN6w2UUayP0vDqKo71lmF6PsUqJm6+5hqcefpg7r7+BEo6zTu5PIp0zKdI18KbA3pMn+N0ru3jxld0cPn6S6tgY5ZERMmvpdDtYA+VSiYWZWbqNJutWreLJRx7mL595iisvW+/udJr5IFzhwn3pexpgut7gs2++5blXdvPqW29Tb3epTUwysXIFqTHMzS+gAkUYRqRpQpr0kEJQKpcJwsA1t6YZ1kIQxqggdImgjz2ktYP1Ma/OCtcjliYJQsDqlatYtWLlcvAnBzXgIvNnuXGQATrdDq1mk8QrUSml6KXaiRWogO8z9y91DFLnQUNrKCSiUDTJ6KiWhQKNTpdD//ZvSWZn/qCf/f/XAXkLd9P/0//mv2Hs4EH+i//2v+XU2rUXeLWwVobaysA4fik+mMRrav9hFIJzdA7ORUDzxaPX69Futeh2OlhvbjRcvbnYepkH+FI4l7cIGBsfY3LFCg4eP0Haa5M3dWpXI3WNKKG7lfV6ncW5WVaOjnLP7bfz+EMPccXmze5zjSUwlixN+r8ThAPeYV97NfAJhMXRMZDIIKDb62GBuBiTAVNzi7zzwYe8/d57HD91ChlFlMbGyYwligqomqLXabM0PUN9do6tGy7j0fvv44kH7uPKdeucLXajiRA4So519IRisUikJM0s4/N9+9jz5ht89tWX1NttKmNjlGs1ejpjYXGe8fExTJYyPztLOYzYsW0bD9xzD9dvv4piH3xxDVZKOJfFXpIShRFCWE4uzvP2px/x8puv883Rw1CIqEyMUyhVSHopaabRmaMCZV5iqpf2QEAYxwReqjBJUox2XfpCOAvtPBBwBTfAUyCcBrNDiqVSrgoyMU51OJMfjmj6GPVg/tnzzD9wXM16s0mr1QIpvPqERPiIfDjR+q4hzvM32//e21mf9Vrrg2clpdczxktzWfcwG02G2zyN0a6SoCRRGDpjJuOQOIEzGJGejhOIACFdAtSnJhjdtynPVWvMMB/YgkQQqKDfvCeApJfSaLRptTokWdantxnfjGswWJPLfboAwmUYavl18YG4GLpNrulzGHP6w5g9/ZjGsnM+a9j+PLH9qkyfZZEjbPl7MEC9bF7ZtiClIogLtBYXmF2Yp9l2zW25+zF4hNyXo3M1qJyilDela2sQ1q2jjjNlvAuYJZAKg8JiXfUsRxWta5QWZhCMu/XWOK+FPFkzTpbVCEG310EgCAKH+FrlkHsB2NzX4XtuPjngk8sfyj4aL3zDqFd+UYp2u83S0pKTAvUfJcXw83r+O+XcohUiR74ElIslJsYnCILQn+9gvXBrVbGPmnc6bZqNJnEYsm3zZu6+/Xau276dShi6SkGWkSsg5UcipXvW+wZ6AkzmQZhAIaRz2EbkrsAOS1hqt/nim2954+132Lf/AI1Wh7hSpVytYYR0RlBKIZWrEFdLJa64/HIeuPc+rr3qKkKg3e1AllEulhEqN3Fy6HFmLacadd7/4jPeePcdDh4/SlAssWLdarSFqdPTxHHRNVJ2erQbLUbLFR66/0GeePhhNq9djbDQ6SUU4whp3fpmrEUG7jyamebQ8eN88PGnfP7118wt1SmPjjG5ejWVWo0zszPMLy25hs2C61WolsoEgSSKC/S6PTrdrtuPleu1aHed8k0YOoOgXH45R4+tAaHcfEqzjChUTExMMDY62kfHja8yivzBvNCMsXlS6v6uLXS6rjqTDpt+5TGMHDzrf8jhvDnzmMWBN0pJKMRk5bKTSYijf5AoyY86IO/3BWQZV77xMdH/5wNYfRWoFjy+FdYPEEWL0BqVWSuNtAbjoRHrF2m8k+UPisr9Dr/sV4XwDlLurkspCaMIIR2HuNXp0E2SPsJhcZNHwJAU1vk+a1CeETh6yWilzOT4OEoK10SklJe7sxiriYIIKWF+YY6s1WLV5CSP3n8/v3z6KW647DIiHIctEJJAKrSx/WJS7gSan1NexswbbvrKAdZgZY5MweGpM7zy5ls8t2sXn+79GhtHlCo1wiim1e1SLpcoBEVOHT1K1mhxxebNPP3wIzzzyCNsXb3aXTMLYa4OYgzaS1hEgaRtLJ8dOsqvX9zJzt27mas3KY6OUB4ZoZdmaGvc4tju0G7UiQRct+Mqnnz4Qe695RY2j425DTF/YGWexEAYRmgZMNVY4qW33+Tvnn+eL7/ZT9fC2MpViCjyaOnAUMft1O4GSSFAOak0ay3auMYdKX1ZNnPomzOryW/rwDnTWqfW4LjNkigMWDm5gtFysT9Xlm3il1hcMUAvTWl12rS6HTKtUbiSvLbuGJX4/dap7zqk4UVd4BZmRx3Jr6MLVqwxLmmR0kt4+XlgheuWz6+CyYO6AVLnpNg8mp4nLtL9DJ036Vnne44gDKNl7rdpmtJut+n2ep6eJTy9YOAlkHg1AuHVX/Jn45xz/fNYPi52US6CvA2/QEpn7NPqdDgzO0ur22WYiS2lcI3ASpI3Peb3TQQKpTwVwTgviDAIUYHEovvrG9Jbdlnr9cfxgMCw1sdQQp2vBdLVSbRxc0sq10ti/M+0dVSDMFSDU/sBe4709I5hHnkftffVtZxa0+l0WGo2yfQgIL8U4AeB7+8w2MwiQ0m5WGB8dBQlwPSc4pFQbp3L0oyoGBNHIc3FRTpLS0RScNP1N/D0ww9y9y23sGF83FW9hHDGM0PVo9zgTA5LHFpcku3/3dEdnGqUr4Ew12zy8Zdf8vyul3n93fdYarUZmVxBaWSEVqeLlZIoCOj1evS6bWIpuem6a3nm4Ye5+6abWF2r0Ut6fVqkRXurDdewnQFH5ufY+fpr/N3zz/P1gYOYMKQ2MUE3zUjTzFEcwxDd6zIzdYbxao0H7ryTZx55iFu2O3O9JE3QuTKTkP25JIQiAb46cIAXX32VN9/9gJPT01T8fmaAhXqdTBuKhYIHcoxbC/PqRJr6xl2ICk73Ps0yjHX00UApstSQaVdFtBbv4OoQ80ApdJqisYyPjjI+OtLfM6x2QIQYXrzPN2ewy+KZRGtHz8kydK8Hceyafq3xvW1hH8n+YUNwNsLep5WRP7vWV2MlslCyCZiZ0weYfuU36F73B37un278qAPyZePYIvzfdwEfwEQRsf6XiPU1SFJMFBJoY0yiMww6VK6Bz1jT15Fdjih+v8Dc+kVw2cLovnEbtS95ueDCZa6dbo9mu+M0jMkrQhee9P0FVNCHlPJXVYtFJkZGnMFPmjokzvOopHRGDFkvpV2vs3p0lHtvu42fP/44d1x1FRboZU67VHnTm0B5GaBlZSpn8AAuGHf8XJd5G2tJM00QhRghmEk0b3/6Gc+/8jKffP0VLa1ZtWYNQaFIojU6zTC9FCsEvUaTy1as5MmHH+anjz/GNVs3ozVkmSUQUCqXvKOd4/UROHTl68OHeeGVl3n5NcfpXrFmHaPjE0gV0lxYolCIGalWODN1CrKE6666kicevJ/7bruNNaNj3vYCjDZOeSNwZWptXVPnyfoib372Cc/tfpUPP/8CEUWMTqygUqvRaLbRmSEOQ4QSKGeK3V9ohZRYX3VJ+/QVQRiFhEFIapO+lbGTGnQBY06jEsKZkKA1pThicmSEydEaJc7D57N4BPD8kfTwfq+BTrfLQr1Oo9UGofpJg8kVDcQwfju8Ww4WuvM9GxdVLBp+vcgXS4NOteN8e86tULLf6OOKBMJVY6REG43RA3w1/yNXWO/LRvpytjADfNX6+Ws95toPYqyTvRvSywAgy1J6vZ7jqsv8mAbPnPESlgGOv2qXbQPnOedzLsUAyf13ZVw8EfuONM36pXLZv9v+XrscJ/GVF+sCnFYHuknq0F81qDaIPAET9P3VXfDh5oq2FqtNP5FyDaE5zWmA3g8HrxfbEvKmbdcPocmbQYWUBFHkuNHWkKYZBkuxWEQIQZZk3xkcX+oYps5gvcxrFNLudphfWqJrBmoS+Wde8Hk2fi+Sy5+PQhQxVqtQKRYc4moN1rqmTgToLKWrU+qLCxSFYNtlG3niwQd56uFHmCjECGPo9noUopBCbvzjj9nkT9JZF0NKlyDpzMmNGulM7TIgAb48cpRX9rzB62+/x7GpKVasWcPKteuxQcDR48dQSjFWq9JaXMCmCSvXrOH+2+/gsfvuYzQM0WlCr9OhVioShyFZkroET7krdHR2lj3vv8+vnnueDz77lNLYGGtWriIulThz5gwSGK2OQJrRbbWIMNx2w3X84qknuXHbZipAB1/ZQThVD+mSNYGgYS3Hpqd59d132f3GGxw7eZqwXGHlunUk1rLUqNNstahWq4yOjpIkXax2YgFaZ6464RvgoyiiWCjQ7SV00pQ4LlCIYsg1uv2Nt0P/A68+BRTCgPFalWrZCwhYcDKJYlDKGiB0y5/snL7q72pmDPVmi3qrBcqpoeX7zPC7nDv5vuNpsDlQ6J9rO0xSGUrM3Ybgkm4lseWKWTI6O/i//r+p/4//A7IrHONeCaPNsJLSj3f8wwnIcQgWKFSvx+qdH1JZOIpeSlizaQUb1o5STK1pKmlr1RrNpUV6aY9Cueqs3bXpW5Nb+/0WyDz47t/PIf54H+HzSIUxhpJvMJmanWfTZRupRX5uSQlak2mHcoucV9c/RdvnYaVpitWuIW3lyAgbV69GeWmpNE1IEBgpqFUqLMzOsjQ7w0SlzN233cpPnnica7dcTgCkXoEi8lrP50k6zz1fIQkCZ7KRZAYjcLw2IZheWGTnux/wt88/zydf70UUSoxVKhgV0Or1UEHAiokVLExPMzM3y4rRMR645y4ee+B+rti4nhBIs4RUGwgUgQywwpKhKYVF2lnGNzNn+N0ru/jtC89zamaGscmVjK1YgRGSbrfH6OgY1qTMzc5w6vBhrt1xFf/kL/+CB26/g7Wj4+i0R89qimGMVb6EJvJFXtAC3vryK/7Xv/0V+w4cIC5XqY2NQRDQbDb9gmHpdrtO/1o6RWHTnzQuw7PGIq3sNyjmPFW3WUqkFCQ9pwdeKJQwGNI0IYoiOq0Ws0tLrBwd5YZrr2a8VnWatV4v3JX3hxfJwVzMb53Ngxn/Mg00eynfHjrC8dNTTKxbhyyWSFK9vC8AlqldnDcBOGuKDP9kmPzlEt1lvz44Ph90C5zqkcEgrG+i83PR2Sv75klLf+Mx1vaTnvxNla9MZFqTGWeOIbw+v8FXrKRDpgwWijFWQr3ZIEl64FWC2u0O9foSQgjiOOwnENLPfZTTmDYGPGuWPKtfHpjb/nkOrpLsb4J/uJamP/1YDhFcaPkYRNbCAwvirJ8PXjl4r7xIZy2uGoELoMMwQChFo92i2W5THnEV0cwaut0u2hpUFDp02rp+GqMtQmcoATbnimuDtk49xwpX0bLG9sGPvj4/XpaOwfru4psBMu2ACq/WIly1B0SfgiGV74/wVaEfOgOG+5LANaUON2tmWUpciIkmJ1hstTh47BiLrRYbPOKq8ptkh9IBwRBf2zWDu6ZlP++BUhyxdsUkV2zayJFjx2i1m2RCEBZiVo6NMTt7hqNHDhMYy/XX38iTjzzC3TfdxMpCjAC0wXkz5FQdBKnOyIxTAwtyKdjzTCAh3A6fakshlLSThK+On+R3O1/m+Vd2s9hqM7pyFdWJSRqdDkmmmRifIEsTGkuLtJt1rt66hZ89+SQP3HoLk2HozY2gViqh8H0EQUgsJT0LC6nm9Q8/5l/9+td8eeAAcbXmgn0paTSaRGFEMYoIgEMHD1KNYh69717+4qknue2a7dSKsWOJG+OafIVz+dVIP5fg5IkT/Orl3ex+401Oz8xRqFaJyxWSLEVbS6gE5VKMFMYF4152FSsQwqn1IHzjsHCqVNYY4iBACdBJD52lbj0LA4QSGCuQOF55liUkPUO1WGDj6jWsX72a0VIZ5RPYvDGZPjAhlq3jg/vjeP/gAvwgCvnq22/48ptvmVy7lh6wVK8jhKQQxb7nTAzeNp+E5xnDEhzWfyOkdAi+pS8M4N7THXcgJUI7Y7lqHLNQLGYHrE0aSwtUDfFVm4NgolhMFxORfHWkRaOdnfezf0zjx0hwPAuKyofE9YFXkali7POjrH3xA1bt+ZzKqVlQymptdaBCXSgUHAqWJH31kMwYxwH+IWlSnq0NjXzi5AsnOEMWFQQUq1XOzM1z8PgJWunQJLjAmfXf0zo0XihHtTEeXRmvVNiyfgOXrV5NqVTqW/sGgaTdrJN2WqwYqXHnzTfz9EMPctf117GyWCSzFqudCc45ZkmDZ88FMCZzyGDf7lmAdyqTSmGl5EwvZfdnX/LbXbv44PPPaWQZxdFRKuPjoEK0gSxJSdptus0mtbjAI/fcy188+RQ3Xr2dkShyVsOAkGCFxuI2GhVGTrHl9An+dufz/GbnTr49epSwVGJy9WpUVEAbxzcMhKLbaNNdanDFli08/fDDPHjXneyYWElNSkKjsVmCNRkIw7Ac+Fy3y54vv+Dvdr3Mmx99ynyrS3V8gmK1hrHQabcRUhB6ibUcY+gb3VjbXyQcyiQIvA68k/pz9sH5Bq68qoibL05nOQhCkiShvrjAqslxrrnqCkY8XUUY43a1/rwaulEXnDhu4e9pw+zCIsemzrC41CSIiwRh1Le7HgrHL/xeF/6Qoa9LHH4uC8+TMRZHffLoqAukdF8thbwkn4dxLotd9uy5pMI6RAjrqSqOVuXYST4Yl4IgDtFWU2/W6Q0pNSVpSqvb9bQip+yD8V9DfF0Xz+TJw8VDq8GVybGoH+PS+vc7BN81e5e/Ik9nBBqBRilnMtLpdul2B+XnTGuarSZpliAjhfEKIPkzZz0lT7lCtivfe7MnbY2vlFlv1HL2EQ2rmeTzzA0XzLq/S6W8K+eQlCgCJQICEWC9AtMPHec0Ovqf5cM1g0dUyhVmFxbYe/Ag0wsLdBnE4SY/weGT9H/Pn7NB1detcUVg7eQE27duYd3qVXS7bYzVFAoRSbdF0qpTjgKuuWIrj91/H4/ffy/b160hAmxqEMYSBw7EMEBqrNuH+ncXb7p19pW3uFw4QIURbeCzw0f5N88+z3Mv7+bY9AxRpcrYylVYoUh842AYSLqtJt1mg+1bt/CLp57k548+yo61awkBqTWBEMRh5Ncg23+2T9frvPr++zz7ym4+/PIrutoyMrkSFRfItCH1vUY2SWnNLzBaLHL3zTfxj376Ex669RZWFJ0KmLEGZXO1J5zxWxDQM4ajzTY7P/iEF159ja8OHCSTkuroKFGxQKfXIU17SAmFOHTUpyz1jcpuTuUuskK4L2txDcNGEwUSZQ0mS90+j5NxNNZgMCAhDBUmy6gvLDBSrrB961Y2rl5NNZ+xedVefMce42aJT+Rc+NxKM/YdOsyh48cpVWuUKlV6eXOnDAaR9Q8Z/lDypdlaATYHRnwPhRAYrbFeqCLDmIaQKZtuYuV11zC5YYstlorW6BSsuZQT/JOPHytCfpHIwTXFZZUipibIeoJ3rtpEsGOLfejQgq7JyBiTOcdKhDfSEYgcvRTCmUZ8j3E+tYxhlZU8oJBSEEUxCMns3DwnT52m54Nqx1E0jv8Y5Jd9CL0gRxPdkEr2kaMIWDE+zjXbt3NyYYEeljhyXfBHjx1jxUiNe2+7lfvvuIOrr7iCWEoywBpDIHOd8eEruHwYo9G+YUmp/CEQaOuQ8UDAorW8+vbb/Ob5Fzl47BiFSpVquQzeTlopRSGKaC4tMHviOGOlEnfecgtPPvIQN15zNZEQdNMEqzWFqOCdyzQZlgBJIODI/Cyvvf8ez760kyOnT7B6vaOpCBXTaDRQoWt0WZpfoLEwz6qxEf7p3/ySpx9+AJllLCVtalGRaqmE1hlZlmClQgZOb7ULHDh5kr/73bO8/9EnlEdGieICQoW02h16vZ7jr+blac9LNdZ4NuPZ82a5tGbefS78NcVYwjDCCkGn2wMliKMAgeO0lwoFRqtVRsoVYnkJgofnXdtE/7BanQ4zc3OOKx7HJElKrjjkkoSh3zlnp86x3+96Ns49iLP3+2VvcZ5F2Z79ueLslwzRTsQQlurREYHwluX0S5bgaDnGWkLyIB20yUiztN/wxtDxaeNKwjkFwHiag/bPu6MnuUziYk/Q4JyHawfnXIR/uOOCh3+R8/ohuAdu3QuUl2PTGTrv/Rl6S6017U6bXuo2f+sDrRz5dbnxoPHZob8DNSyBX2tF3rDp5qTIayv2bNlAe9afgz1h2bwYmuv95+h7XofzNWqf/2eeN28N9WaTmbk55paWaAMV8Noe56rODHov3POfo6MWl6gEIqBSKLB6cpKJ0VGmFxcpFQoUo5Bv9+0lkoLbb7iBu2+5lftuv40142MEeKqd8OmocHQCbQ2ZThFSuX4MQOsMnWmHogeqnz1Yv6+H/lz3HT/Fztfe4vldLzM1N8eGTZuojI6RGMPS4iJjY6NEUcDM9DSzU6dZs2Kcpx5+mJ8+9jgrfXO8sY52KC2gteN1B07tZDHN+GL/QZ596SW+3LePkfEJolIJwpDZ2TnCMKBULGLTjMXZOWSa8tBdd/FXP/kJ1121nUoh9j1uxqUZEtfYiOtZAFjodvntizt5/uVXWKjXKZZLRIUCVkrHu9aZ9/lw1CoHmuW9A+dOn7zikE+HXGFEKen13F3vROYTTyEEcbFIt9djaWGRibWr2bRhPePVqn+nfmQC37nuD14icIIb07MztLodNNY1l0YxcVzwa6n2SkHnJl6DvebsMxy8v3An6NZ3O3hmQXpeve838CBrlmUk3bZASrZd/zgbD/R6Zz79gBP732Z6pi1wsa7FmYv+aMePMiCvgv0LsP8xTrWKc3ZAi+52oa7DsCdj20s7XdDJ5WMdeWhlUiwUCIMAkbmGTikEViqsNs6g5w+4Pw53wgshKRRiUIqpEyc4cOgwS40mesUo4OIJATn5yS1EZy22xpdlpBKIIMBikQgmR2pcu/0qvjywnw+/3ouMC1TLZWpByA3bruTRu+/llmt2sGliwpUrM2eTK4LgvOie9QijA/8lSjlTGwcUGhAOgZfAYqfH+3u/4dmXXuaNd95BxDGFWo2wENPJNMJowiCgl/ZIux2UNdx87bX8xTNPc9OO7Yx7ZzIjpUc8/TosJApBD5haWODXO3fyty88z9TsApXqGJXqCElmsLpHGIVondFqNFiYnWXdypU8fN+9PHTHXexYuY56r03oKUl4tDQxhiiIAMlS6syLXnrtNd754APOzM2yat16Yt+NbVLTl4eyxqJzewPj769S5yxZbtE4O60azAtrXSXD4Fw+40JEHIRkSQ+TplRKRdatXcu6tWsphGH/PcU5H3K+xdL2/y2/vfV6naMnTtDt9YgKhT5XPNfBH7bc/n3GUA3ljzKsHXT+Qx6QuGYva5xmvpIK7bm8+UFZO8RfzKlfWebR1HTZB1g7qJYNO36e78r0G+nOPs7zHrz/nR926n8eQ9XIfonaLRb9lyRZxvzigpvncTQUxAwk34zJ+tUO16Ru+rr0OfCR9w/Ysx5iO7TjnL10/n2nVudDyF0zpz83Y+l0u8wtLjA7N0er3aZcKi0/Vp+4Wh81O5DTURKNNo5yJ72nhoKClGzbtInLN17G19/upzk/T2A0vcU6GzZt5M4bbuTB2+/kuq1bKfrGda0NCidTmh+yxFUPpfRt2p6WFng1FNcoqn0viVOm6lk4PDvLs3v28Owruzg9N0uxVqE66dS70iRzfU06Y2l2kZOHD7Nl0wZ++bOf8Ni997F5ZDQnmfWVl3JutZRuje0AH3/9Nb/b9RLvffIJ0wvzjE6uQAYhVjgPAqu1c2ZuNIgEbN2yhYfuvY97br2VWuQAHoObn67y4qprURAiEZxeXOTl995n56u7+eyrrwgKBQrlEnGpiAEyqx21KDcjuuCaPHT//X+Xp/q2v38b6AfkFksoJKFUdHRGo1FncmIHV115pQPSLvJRw+v72QlBHq80Ox3vEbDo+qh0RiyLSCXJEictKZWvDJ8veT1rLPucofUYvw/0m4P93LfgvSkMVikolZksxM2tUFqviu3QlsqtlrbClHojwUjWzJo639Mn1mxFycuYOynRo1W4cgzWVODadTAWwr/63+C99y9ytH+88WMMyG0F+I+Au/P4pAwn5YjNWgJMgpAQT45ht5VEPRFhWisnRRABFINyGKnI63PqxGvTCkJf1s675v+gB5yjM0AYOc3jeqPF8ROnODU1TWPTesp9gzL/WOVlO7U8BLPWmUoEvkkif305DNm6cSNrJidpzM+RWVh1xVVcfe31PHn/g9x1/Q2smxglxuvFWuMRW//evhw/QHDdcSslnEZzXzHELS5KulTSAB9+s49fP/ccH3z6KUudDmPlMjIIyLR2yVGWYtIe3WaD0VKJzdu28ZPHH+GBu26n6p0RBY5baKwl9Tq0Vjjt14NTp3n7o4/42+df4KMvvmLjli1UqiNkqe5TSEqlMp1Gm7TdZqJW5b7bb+MXTz7J5avXEADVuEiAcB3eRpMZCyJAyoDFbpdvjh7mhd27een1N5lfXKRSrTqHTutslqUQBHGMtTjbZbTnb/ry2PnvPBfFlIVLboxHzgLp7OLrjQY2y1i9YgXbLt/MhrVrCcPQI61i+RsM38P8R8PoydA/Tc/Ns//AAbpe5UZK4X1S5LLNPEeg/1Tjoguzfz7PeY0YltNylBKtvRb8Wc8PeHOfMCTJUuYXF5dRHnJqjMBdDyllvz+gzxv+DorKuQf+3ef25/HdwxiLEc41sa+WZ5df11a3x/TMDJ1el2KphFKDgFzkCI61A+WdfkEof3CGIg+RBwDfHRD9WIcKQtJMc2pqivmFeVaXSn3Qoz98wiryJN7/0BkYOUUTh5M71Hzzxo1csflySsFrnJiaJsw029Zt4L7b7uCOG25ix4YN1HwlNtWOqiICMfTcuM/qq2hZ4+V8hVdZcX1dmTUoVP+Y9p04wa633+E3O1/k6wP7mVy9mur4OFpAO+/RKsS0G3U69TorR8d48oGH+ff/4i/ZMDHubnWaYZVvvvfNq9ZLKM51u+w/cZznX3mF3W+8QaPXJSqXHf1Ia6Rw9JFOs0nSbKG05torr+LxBx7g7ltuZLIQLVP8yelQmYVCHJEhmG23eOXdd/jVc8/xzYEDJNo5dkZxjFQBadJDG9untgjAZNpJZV503VkeKg/CXGeEaBjIGCqlCMKQLEvJkpRCFLNpw0a2bd1GsVAcep/zodiDsRwcGvyt0Wxy9NgxFpeWyDmheSC9bK+xgyM99zwu8Jk+gcQyoAHh4pccn7L9PEsgwsCqSiVbGxezHVCaLwe2OVmKR1aOZmNrH0jrJuPway+Y9uw0IBhfvYUouJvFUwo9sg5u3Qy3rIVntsIE8NXnfw7ILzAsYP+nm+7i/zVyG7N7FDRPCxGPsuLua23yj29IvtQ6ERNVrtC6MDkztyqaOjOWWVey0zojTRNsYFFCDaTvzMUnxNljWXc7+cK2/MHJVR2kFMhAYYWg3mpz4tQUi0sNKmNV18RpBu9hLCi/KQymXR6gu4fOmNyoRDAxNsrk6AixtZg0Ze3EGI8/8AAP3nk76yZGKUrnaJgkKYFUhKEr6+dIk1ByKHjJg7KBWXtmjUMXgoBACBaTlMPHT/LS7j3sfvNNMiHYuGULBkuinctksVKh026zODdL1umy/dpr+MVPnuG+O3wwrjNSaykEIdZYEp3S05o4igDLQrfLe59+xq+ee57DJ05SGR8nKpXRQC9NiOMYgG6rRXNhgZFKhdtvvpknH3yA67dtIQoUHa0pKIXCkmpDkmauTBpFSGB6cYH3P/6EN999j8MnjlObXEFcG3GmRN0ORmuKhRJh4LrE0yRxiEogUUpgpT1voOhCwfPhFrmxh3ROgtYQByGFMERYQ7vRoBgo1q9by+b161kRx30TrAGH+jyB+NC3Q9LBbq4D0/PzHD9xgm6aUiiVnESl7wP4rhl/8bDDnvcF+Vr5g0OW4VI6roTqHyMGyP8wig1Wa6x1iVKfBCzdop9z0/OFWypF0ktZXFyi0xtwyPNGbOHRVJG7LUrpmgJ9kDZItM9Nuv506cy/u8PigQo54PHL88yuVqvN3Nw8SZJQrFZd81euQS7EsqfS5cLGu3J61BTIfJKcc8b7Slo5Wj408sqS+a4J/weYFMsTZy6cOPsAGyGo1GpEhSKnz8wwNzePXLfeFxXE4FgFCN+Y7H+tDxDlgZ2Lg1ylcKxcZs2KFYyN1Ni//wC2UuXBhx7imcee4MotW6j4NTrppSgrfDVVLDu+/gUZrl745tdempJpSxAGREqSGsOZdpvX3nuff/PrX7P34CEK1Srjq1aSGcPc7CxBGFKMYqSA+vw8Y5UKjz/0ML948nHW+2C8l2aEOEdWayxpmrkGe09VOXDiBL/b+RKvvvUmM4sLrFq3ntDTOgwWaQ3SCnqtFqQJl61Zy4P33s0zjz/KurExh0J77wIhhFOO8c2qIYLZRoP3P/+Mnbt38/HnnyOLZVatWYMIAlQYDnrZsH4NEv17ma81ffGFC80RIFfFQoDBOQznakNIQRSFFKKIxsIiaS9h1YoVXLZhAysmxonCoL9/WIY55OcOMfSZw+SWVrvFyVOnaLXbhFHkKITW9XfkiVdfUcsOlFku+AEX/Qd/pN4sCgPWn6sIAoKoIMIwDqvaVkvQfv2qdW0lH2r/rBbRvm4HH6pMmEOfKWanATJjNNr0sCiwbUia0GpAVwPqgtfi72P8iQJyCZRx7Oj8Nvv87ubNtO/ewm91xmJWYIoxfiNL0SGzSqz95cZkulexycYa5oEdTIyVyje0GxvGF+fXbJlbuHLl6amrZ06dvG2p08ZKSRzFrhxnrTch+eEXur8oD3FRc3St79hpvfU2gmK5QmI0X337LTfu2MZlY1XyvgSddx/nD9A5lydfSH1pHWc/vnpykqu3buWma67BCsH9t93Gg3fexpVrV7kraJz+p8odDvOGdr8A5Czl/BxyN7gsS0m0xirH9QuBpTTlo7372LV7Ny/u3s2ZhQUmV6+hUK3S7LQJI0cJ0GlCc2kB3euy44qtPPPIwzxy5x1cPjaKNobAOu1razS9JCUxhiAKsVIxtVTnrY8+5lcvvsR7n32BLJaYXLWKTqpRmSUKI8LQad7Oz8xQLRa566Yb+fmTj3PfTTcwGYUkxvoEy5Jp1+gjpSKOY1Jr+ebUKXa+/jovv/Y6B48fR4QRYaGIVIper+ful+eM5jbcfeTU3eQfhCYL6VVWkgRrDeVygUAJuq0WvVaL9RvWcf327Wxa4xD+FN8c5D/TvQkX3OTzfxJAai1LScqREyc4evIE3SSlUBsB4SoGrjStfcVkkID92IYd2sSFcnPeCve8hL4Z1nhOv9a50dH53sj9QxiGJGnCmZkZ5ut1wHNdpXR8TYAhdRXvFTsI0vKGPv9+P86r9u/WcBUlOdjQhSvrK1/+7gLzi4ucmZulmyTUCgW09XTAfjK7fGRaI4316h8uiMqDRKBfMcl7Cc6bfP4Rz/mHDIv1vS1QG6kRAPsPHmT/kaPcct11FMHxmnXm9gM5AGOsrys5feqg32OkhOs3UUAMbFm/ntuvvwHbS9mwdi1PP/wQ991yI4F7a7LMgLYI7/yc71n9Rlgf6OX7bm7Gk2UZqXHV4UBJEuDg7Bxvffghz73yCvsOH0bEMROrVzt6hzEEgSJUkm6rRdJuM1apcN/tt/FXTz/ObVdf5QjCfu8NpcRq2/eRIFDUtebgqZM8t+dVnt29m8OnTxPXRgjKZVQYIk2GsJas16Pd7hBay7YtW3j0gft56r57uXxsDPDoM4IszTDCIoOAWAZYYD5JeO2zz/i73/2Gdz76kLbWjBWLFMolEm0wOM6/yQEX6+mh/Wn4w3R5jLXOOEsEDhDUA6GBhdkZCkJyww3Xc/WVV1DzAFdmrFcRvcgmc56h/b2fnl9g/8FD1Jst4mIRFYQYa8jSXNTg+za127O+83NGij6LzSUF3lfGc8njUgmCgKMzM4T7D9y2thD/X24cHzmiAg5ftnnziYObN011amEv+Q//g6y4dSvr04CRWRPVj5wR2ElHodAZZD0wGXAJvVx/xPEnCsgVsAKo4UIR/J8JPPUES//1P+K/o8V/x2XARlb+838RXXPsqNrwn9ydfXHZZWafpdxtUtj+0YHrtn/78T2FbucmLcS13SxZPz11OppvNrBSUiw6lQmjDZnX1c6Rl+87EYdHjpAPc3Jz/mqWZSAktZERJJL9hw5x9PQUt+24wvHOrCXLDEEecAwdRY6Q9nmP/c8zBEJRCwJ2bNvG4w/cT6Va49YbbmDDigkATGaccYCEKIr65+ecISFHXK11wZmUyvObLd0so5skxMUSFmgD3xw7xqtvvsHzr7zM0ekzrFy3nrBYotnpkKQp1WqVKAyYPn0a3e1y2erVPPnwQzzx0AOsGqk5Td5eh1Ico7x+epYmWCkJgpC5bo+P9u7jdy+/wnuffkamAlatXEV5ZJSp06eJgoBypYJOEnrtNsparr9qu1ORue4aVhQLtDTEno6UZdpptPvGWgOcWqyz+623ef6lXew/fhRRKLJyYoIky2i2WlggCJxWrNYGnfUAP0eGaB6XMpYh5R6BEtJJ/bkyaETa7dJuNIiVZOO6tVx9xRVMjI87hNtqlLX0a+75vT/P+izO+kqyjNPTU5w4dZKl+hJEBZcs4eTXtDFYbXwDkfXHetb8t8v+8J99/vO/1C3jh7yub1gihZexc0lWKS74HgFXZtdZ6pt8RJ9mkq/cOVIexhFZkjC3sMD07BxLFkrC3fO8sdqYgWZ5rmE9cP38/fn2fx6XOMRZf/ohGdwvCzSNYX5xgXqzSZY5e26TOQ1mtx5z1rJuMWmGkopioUBgHTqbGI0VzoDmwseUB7AMykH9dz330P8QY3g/yf/e/8yzjsElIVAoltG9LsdOnOTbw4eZmp9n3fg4MYIkTYkC5z+BHEZi3Xu79c+9r/QN4PmnrJuc5P7b72DD6rWsnBjjuiucAY7GxdzCuoBaDYE/WIP1Blv5zXB5kttztc7opSnWI8YpcGx+njc/+YTf7NzJ599+Q3VygtGJFYRxzNz8HGEQMFKrkXa6tFstTLfLzXfcyc8fe5RrNm+kADQ7CcUoIApdo2iaZWTWEhUi2tay/+Qpdr3xOi++/jqHp6cojI6yYu06uklKt9MhEBJhNFmvR9ppsXXDeh69715++uhj7Fi9hgx8IuLOKzWObhMFjmpYN4b3vvyC3+x8gT1vv01HG9ZethGkopekTn5Yucq5kBLhZcMdIIR3dj4rMfST67tWIIujqbrL7MUgjMGmGe16nRWrVnHrDTdwxaZNTnZYu6bPQCpfQc/TgPO4mQ8dhwQSa2kJwfHpMxw9eZJOt0uhVEGpgNRTXgNvkDeYx6JPPfkuCXLIH7VcMtGv6cIlLw4l99UcAcVKGas1e48fx7z19nXbTpy89j6lTlnUO72o9E5n3Yo3C2uu+Mb+s/9zZ93//j9N7vzyhDjzb38bT534TFpInRTRj2f8iSkrw4hG/meAy8/7hXZx5smHOrrX0aPr1nNLa3H7rUePPLWqzQ2LH35y1btv7B5p1ZcmTRxVM6VUK03pphkqigijYLAwCDEAB8W5ZclLOtrzLI45Qp4rrWRZBlJSqpTRvZRjJ09x9OQpFrRlRDmb3uEGjvwKWOj/PO9OtjY3thh0Ja9ftYq7b7uN0ZERNq5dSymOQGtMmjrb4NwhLi/i54mDHUJV843Lf6YMAgpKUQlDlno9vjp2jJ179rD77beYXligPDJCbXycerNFN0moViskvS4LM3Vmz5xh26ZNPP3oIzx8151sGh9352U1xShEWovxKheFYhEbhGTAZ3v38rudO3nvk09opSmr1m8gBRaW6oxNTECWsbi0xML0FCOFAnfcdCPPPPE4d916KxNeIlBq079WOs2QgSIqOHewo2dm2fX2u7z06mt8vf8ANgwoj5QQgSLp9ci8bFgURlhjnVGMcQY2oQrRWtNLen10brh0Nxjn25YtVnqkT7tVN29q6jSbdJoNxmpVtm3ezOWbNjHqG2wCJFKcJXN2wZmYSzEKj1RlnDo9xdTMDIkxxEp6+au8ajJUzhd+wbPDx3zhMcxUvJThyt6X/tpln2UdqoWruiKlIE01OkuJwoByoYTA0mg2SNK074w7HKgIrz0tLMRxTDdJWFhaYtrbUoejIwRRSBQ6cyydaXSmkb4HP18vBIPAKLfw/vP4Iw6fIwopHZLqf6akIo5iotjdr6V6g7nFBZI07YMZ+e2XwjsMe+ogUmKNIcsS4qhApVhECYlptbCJq46pYFh9aDDO4b/+PU2ASwnEh90Sc0OyLOkxt7DA8VOnOH1mhslKhVIUnSPZ2e/D8I7LZ5+Y6Ic7MFIuc92Oq7lq21Zq5QLjNafOQeZ9DciNvQZHg4BB75KnSnqpPKM12oIMI8JAkQKz3R7vfPo5L7zyCp/v+4ZuZlhZG3V0wmbTJw+WrNtlfvoMpSDk2htu4KePPsxdt9xIOYqwQDEKCIXEZoYkc+olUeyaL4+cPMGu11/jxT17OHD8OMWRESpj41gpnUwfliCQLC3MQ9Jj9cQED913H888+iibJifddctSrFfC0mmKUIo4iIiUYr7V4r19e3nulVd475NPaWtNaWSUsFSk203opamjggqBkLlLqVtfpMlBwvwGMQBHlhVKL7So+iDaz/f8TdLU0S6FMayenOTaq69m7apVCHJR1rMR7IH2+Ply4/z71BhmluqcOH2a+YVFtLWUix4AypwTbg4oOtlP20e3L2VYlj9zyyk93sUVgbGuohlGETpJqLdafLV3H8cOHBR0OqvjOH5wdO26q9fS/eufpJ2v52rV3xKMvkZtdOHg/+EvGydWXa74r98xtOr9+/FjGH/CgNyFFMspK3lRcgloCSjaECuijavF6jTdVJo5c83oW28/xQcfPNSyZuOh01OFfUeOsNhuI8IAFQbEpRLFcgUVhgjhZA+NxTtn+Y31j5EU+UjHNRVCXCrR1S1mp6f55uBhDhw5xvYNaxmLQkyfknL2FXGTzWnnukcj5zzilU/Ga1Wuu/JKCmFIHDjeVq4e4Dhprv/beD64EE6LVwj6jaT9B8a6Twy9i10H+PLECZ579VWe37WLg8eOMzY5SXVsgkQbNHhuWsD06Rnq8/OsXTHJY/ffxy+eeJxt69Y5XVajCaTTIs2SxFFkghAVhJxpt/n60BGe3fUyb7z3PovtDrXJlZRHxliq18nSHuMjIzQ7HZbm55HGcsOOHfz1z3/KAzffzLpamdQYemlGIARo4wx6lCSOIzJjmWt1ePXdj/jdCy/y+Tf76GrL+IpxZBzR6iUuCfGyYcNcTSGcEYdrEnNcuEC5bF8bc8mLisBJfhnjnGKlgKTXpdduEUnBjiu2cfN117Fh5UoK4PsExHn5shf7jPzVC+02Xx/Yz4mpKcIoIowjUA6FoX9ezmXwH8zwKHmmM5I0pVAoMDE+ThyFdDttms0eYRggpTODgUHCYYwGK4jjAr1mi4WlJY6fPs307CxjIzWKxRKVSsU10lqvFy2AvBE6H8Plqz+Pv5ehfPKaZSlSCkrFEtVqlVKpgAVOT01x/ORJV6IPgkEbgXAUjEFzp9dLtoY0TVHFEmMjIyjhjKXmGw0y69yHVY64/WlP/XuNPogDLhCTgsxaTk5Ns+/b/axbsYKxiXGkcjSGC3JxLjIKUcTalSsIpSBSzv00097AC1/MU2dDFUN7m3XoK77amxrtlLUCF9hO1+t8vPcbXnhlN29+8BE9o6mMjqKiiF6SkCUJpTgmbXeot9qE1nLLNVfzF08/xUO33MSKOKarHR0zUtJXiTUaSyEK6BrDVL3JK+9+wHMvv8IXB/aThgErVq5EBCGtdhujNaEUrik1y1i/ciX333EHT993P9euXU+GJUl67pR8Zd0I71OhJD3go2+/5VcvvMDr777L1Pw8k6vWEBaLtDo9tMWtxYNydx8MyYPXYFgJ6HvGJg5go7+fgbs3aaeLsJaNa9Zy87XXceWmTYwLx0MIcnAS+lG/Ofs9l/2NfprWyzIOHD7MgcOHafV6BFFE5MUQQPQpUE4Ry1yUn36xc3LvNjSnlv3LYMggAGvRScZCu81sr0e70VShFBOTjaUJ0Vhky959V0+WihNq3eXXNrbuOF5+4PrdhSfCY/HOqbB7pGF73Ux/78bCP9L4ETZ19nEPESCZRAS3zM6PXX1g7xPy+Kn/7Ou3377y408/S5vtVhCXK4yvW8eEUo6X7buWpf97L00ckiKEs072JfvcpuCSjygv853FGV8mQ8XQdPFlKaQks4aTU6c5cOAAGyZGmYhGkEEwmKN5iZ4h4F5Arp0r8s83xml7CkGlUOhrcVpjnASWCr2cogvENdbryg7CvJx3GwQhxjeXECgUgo61HJ2d4Z1PPuGd9z/g4LET2DBi5dr1GAQnT51iZGSEWqVM2uvQadSpFmIevOcunnrwfrasWYNNE5aSHiOlMgqJRZNqjfAd321r+Wr/QX770ku88e57tJPMUWHKFVqdDkopYqVoNZoszswitWbHVVfyxEMP8uDtt7G2UiExhm6zTRgExMUCac8pbYRxCAJm6m3e+fBjXnn9db49fATCkJUrJilUq9Q7zvGvUCgQqACMJUuzvpFIoJTTQPaBehAEhFHkTC7S1EmwXRKC7e+rT37AknQ6CK2ZGBvjuh072L51C6XANddkWYoKwz6qdLGNU+Qf7OdcB5iam+fbg4eYnZ+nWC6jPE8wp184mpDyqMVA4/Y877zs22EQ/fs0cF54+fyO98iTT38ZjDFkWUaWZcRxzOhoDaUEZ2bO9DV/ZZ+mkB+gb/CTLiCXKqDdbDE7t8Ds4iKZ1sTFIuVqlUJccJsh/dvl9qehJM0d1lkX4c/jjzqsdTSrIAio1qqMjNQo4qCaU2fOcGpqGguEYTi86PbL/cZqAhViJWSpM+sKlKJarRAIRb3VBGu8q671Trein9CJs3gCeaPn38fdHwYJzh7n0Kc8VcsYi1QBpXKFpUaTfQcPct01O7h8YtyBNPgd1fiK3Tn9EP1XLPuZ1ZqslyDCkECF3ilXXNDzanndF/c8+4KtAYx0SRNA08I3R4/z2ltv88mXX9DqdZlcs4ZipUq700EJSaXorO7PzM7TazS45sorePS+e3jozttYVS73HUmVR1FTk2EkBGGEAKabLd54/z32vPUmh0+eREQxY+PjqDCi1enQbjYpxjGhFATWsmpinFuuv55HH7ifbZs3kwGtZh2FoFJySiwWUFGIFIJWlnHg1Cne+OB93v/kE2YXF6mNjrFi9WqWmk3mZueo1moU4kK/P0l7GU+Zgz/eJ8TFE/nVW77e5EH3eedfDjb6uSstSKGcEZoQXHPVdm694QZGi3H/5co7iA7fqrMReAs+8bL+/rnegm6WceDIUY6dPIVQiqhQdCZISYa1bs+0HsxiWTB+dnC9fMb01efE4DW2/2y6V+TUHnAJjpvPwiHlcUy5VCYKQ6zRJJ023Xab9w4c5MODB8ojtepjN1wx/9MrIjN/++za/3zlFZP/c/u/vKVy8FeH0tNHsi6puRTtgz/6+BEF5BZHUxkHrgaEWZ9mY/dMHbmp8tEnDx1+950npk+c3HhmfhETRqEoWmShgAgjh5R4rinGmTtoozEmt6IPXED+A2GQYXrK2Y2dZw8xFIxb5eztp2dnOHDkCDdfdzWMjoBYHuQPfvds+xnhf+6PQ2f0NUfzbmYpEUr1I7W8zjBA14cQYN/YY3HSg9paYhGQASfm59n52uv87sWd7D98mLhSZXRykla3hzaGUqlEGCgWZmc5ffw4aybHefT++/jp449x7bZtBNYgsMRh6CyKdYY2GhkERFFMBnz17X5e3LOH1959jxMzZyiNjkGg6GUZSZJQLZWwScKJw4eJBdx8zTU8/fgjPHbvvazy2roYQxSGBEr1VyrlGyibqeGTr7/h1887tKKLZcW6dcS1CvP1JTIspVIFNcTT1N7hLJfnStO0f0+CIMBaS6q1p1IM1RDPO1H6/+nzkaNQIbWm0+shrGVybJTrd+xg+8ZNqPyeWuM4duLCpbNlYbpf6ATQyTJOTk/z5d69nD5zhnUbN2JVQGaMK4/6AEN5JYosS7yGsRq82dn7/PLpt3z4uUt/cTznn5e/x/cYbi1ezmPMsowsTSkUYkZGR7DGufNhtNOn5dzH2jXmSgqFAkIp6s0mS80GHU9VKgRQq1WJvPa7lHLQeOb/zI1m/jz+Pod/Jg3gq1PlUomR2ggFoAFMzcxwenoKbS1BoeD0rLPcUyFH5rz8oTeAM96tuFQsUYwLLNTr/ebCgQzuUBbqn91+IN6PlL4f0nfRMx3qQxreCy4WkOe/57/p01EyY7FCUqxUmF9a4ouvvuKu227hussv77uh5PS5fo9E/tyf96PcZygpHe1Q5gSHoetwnkdjEHItD7oMTpJPSoUSkg7w6dd7efbFnbz6lqNFjkxOEhWL/cpiqVSALOPU0aMorbnpmmv4xZOP89R997CiVMJaZyHvnmG3RlshiMIAheB0vc7r773Pb158kQ8+/5yOsVTGx4nLFZqtDoGS1MplOs0m7WaTiWqFe+6+i1888Tg3XHEl1TCi1+0QBoFrErXGNbFKp+3dA748coTf7tzJ87tf5dTMHKWRUWrj4yw2m/SSjGKpDAjfcJnTUPNrGzhZXQNZpp33iO9dMrmaiF/Z+uvbcEzrfyiwjn4inIKbEFCMItpJQjfLuO7qq7nz1lupRFG/pyg3g8rHhaOZHJRxL86AmaUlvty3j8PHjmIkRMUCUiqStI2UAXEUk3jn0ND7qJxNezw39AfEICVY1kdhB30hAtFPnsH3/3jsXgUhCOn14CUyLhKrgExA0mmJpU678NW3e5mrz4+N1xf+T2vvu7tmbtn0t7JSWzDvnAjnrVJpPTEQX+xy/NHHnyggz4PvzP+J/z4ViBGrGJWjULzq8IG717y5+68OfvDho+/v+3btXLNFZWSU1WvWMhEETuIuSbHa0RDSJENKCALVb1yJgsAZ7EjpbFaNOf8adLGjHQqczzZXOQcp91/auCa6crnMUqPBvoMHOHp6msvXrCbEZXeZ1v2mQqDf7X7uWpe/r+xzqow2GKOdput5kFUpAo/8mX7Dh/JBp/UJhRGCDDg8M8Oe99/n2Zde4pMvvqBUq7F67XqK5SonT50ikJKJsTHqC/PMT08RWsP9d9zBf/DLX3LNZZdRVIr5+hJVv+FlWUqaaYwQFOKYlrEcnDrN86+/yctvvMXU/AJxuUKpVqPbS0htj1BJbJaQdlrYXoftV+/g5088xuN338WWiXE61kKSIq0lLkS4RkyLDCVWQiPTfPDFVzz70i7e+uADZpYWWb1xI8VKhcRYGq0WhXKJcrlE0u2RpqlDi/AmG8K5cg6qCG7BzGWclMqt1IfvyvIcf7haK4VrdlI4zqFJekyOj3HNlVdy5YYNFIGe5zoHOYw0HBucZ5KeD2M4PX2Gfd9+y/TMDL00hSDwmvJ4zp3tB/B5AqKEGnDJL3HkyLzNEba8QnNWlej3HX2ddOjzXa2/TsW4gBwbJw4jkl4XMCglyPTye5Gj3c5ePCQuFpmZn+Pw8eNcf921VKKIkdoIo6OjQ5q89JteLXxnYPTnceljOcf/4tfUcfc1WZYQRSGjo6PUamUsMLvU5OiJk8zMzqGCgNDLheZz2RoXjOPXOywu0TWWYlRgfHSsD9xIKZHqD0PhGjRJysEzcZ4qy3CgkVdac1O5/O/fZ/Qrn15BrFiusNBscOTEcb49eIibdlzN6pEaofR9FXiqyTn34OyVxYMKShCpsP+jgQGeWP6rF7ilFpYBRKEQLGUZ3xw7zou7d/Pynj2cmp2lODbGxIpVLmHOMkc9THp063V6rSY3XXMtv/zZT3n6rjtYMzGOttDt9cAYROQC3p7OiKMIi2AmTXn1gw/51bPP8dHnX9Do9ZhYvZqoUiWzgqyXUiwXCUNBvd2iIAVXbdrE4/fdz73XXu8oH0kXrTPKxSJKKrenGe8SDnx56CC/e+UVfrvzJfYfO8bkmjWMTq6AIGBxdo4wjKhUqvR6XbI0IwzCwVwgF26QaJuR6cz5pfTngRggxpZ+c32eYA6CVX/t3WLn1mVjSJOEWClWT0xw3far2DIxQoJTqxHGIkQexg6BTBeYYDkVReD4/t8eOsyBI4eZX1piZMUKVBihrSVNU8LQCWYM+jikV036/vM6Bw5zik+OVQk7xEYYmpMycI7hna6Tt42jkEK5QqlSJk269LodphYXOPHNt2LDocM3X376dLH2s5/NX37ZyvcLD452Pziq5hcKcas/cf9E409EKjVAHZgB5vzXrICZgCijAKUnjx77+cbnn/0/7nru+ac+OXBwTVipsXHLVqpjYyzU6zTbHZIsI9WG1DdmCQGBCghUSChDIhU6G1tjSXsJSS/pNx58n+ihr3oyHCD0szSzbNEFrwWeOqv02vgo7W6bfd/s46u9e5maWwDACtF39/Jv5DcU4xf1QcAkACEVQRCivNtYoAJCFWK1U9AYTGP3P+nfM+0lpEkyeF9AC0EUhkRhSEtrPvjsM37z7HPs+/YAcanM6rXrQUhmZ2cpRDEjlSoiyzh15Agqy/jZE0/wV089xdWXX04chhhrqRZiokD1y80oRRBFKODE6VM8t+sVXn7jTU7OzFIdH2dschKLo2vESjJSrrBw5gz1mTNcs20bTz/8MPfcfjsrx8ecCkmSYHWG9IiBtpbUGpSEdrfLZ9/s59/+7nle3P0KXWtYv3kz45OTLNSXmJ2bo1YbIQ5jOu0OWmdDTm7guP/uXjgOuerfW2GtR+BV/94azye3DKQm+7bcfp4oKYgCZwLRbNRJOm22bLyMu++4g0nfKJT0ulit+5bJGIPVmb/xYtn2OIwE66F5ceDQQT7/+iuKlTLjkxPOAEdAEDpN9Uy7BdF404soDAcd8Fxo7bHnfOXNkybTBCqgEMfOnMcnljnyZsx3L8AX/NyhzT5PJvJAv9VqIRCsX7+BOIxozs5htXHUo6EgSEpB4DmqS/U6cbHIpssv58ixY7z6+utMzc0DUKnVWL9+PWNjo3Q6HZeoKEWSJC5Zw1Ei8irJn+kq338Mr5E59SjfqJWnhg2vqVJIotBxUJNuQhQXGJ+YoFws0AFOnDrJoaNHWFxapFypEMUxvW7PK0tIksRtxqF/D6wLQDCWWrXK+nXrsNowPzdHFIUUi67qpv0z7Q8aGFSB8mGxy+Ri8y8hhJNb9RQbcjDGvQnaPxtBECyjOwaBExzodrsI4SQ6h9eS4a/zgT55gj0I6iEuxIRRTDdJOXTsKMdPHHfrF4By3O1zkhAfcC3fEPOVxg7+sPnxaMAMLUjW+wG43ieBCyiNcdc11U6WNk8GTpw8xQsvvczrb73D/FKdlavXMjI6TqvdIUlSSsUiY2MjTB0/ypmjh9m+bSu/eOYpHn/ofsYnxt36pzVRGFAsFtz1x5IJCIVkqdnkrY8+4t8++yxvvPsuRinWXbaRkdEJWvUWnXqTyZFxpLYsTk+T1OvcsP0q/v1f/pKbd+xAAWnSQwlBpVRCSeXWT6koRDFIxemlRXa9+Ra/e2kXM/UGk2vWMja5gnqrzdzCIqOjo5RLJXrdnrsuQvb7vPK9xHhFNuv3FxUov7YbL/Xn4oM0y0h1hhUgA0UQBk69S1uHrFuLNZoscaCWsIbjhw9TKRR45IEH2XbZ+iGQSBAG0lN8zEAzHFfttMbNV+P7BFxQPNDkOjM3y7eHD7PYaKKCkEJcQAhcQiEGz4Obm/SFLs5Gxi9UB+5PKa3BGOcdg/D7onEVAHxC42UPsbgeMgaoee4rkGQpzU6HTpIQxDErV69m9bp1LErJVx99vO3Q//Q//z/iXz3/f92yuLStdOt6xZbIHUamL+wF+EcefxqEvFyBB34Gm65yguzg3Hq0SSeu2FHafujgXbVXX/2bk3v2PH7g8CFRHJ9g5eioo6akKamBVGuk9aV3f3fdQ+8nVpa5AF2ESCSBsCCGOup/wP56aQjGgDYSSEWoFBrLzPwCX3/zDYeu3s7KsRFKUjrU3piBWedF0Aagb6qAxbnQ+SCOPJPMUVBj3EPHQGsc/4DnJSgNnJyf5/0vPufZXS/zxTffkArByPgESEXaSzGpoVIuk3Y6LC0tMl4uc9fNN/EXTz/N7ddeS004TV+L7SMpFkeNKQYhqTEcXFzihfc+4KU33uTbY0fJpERGkbMpThJCpRBakzQb0O2wadUqfvbYIzz90ANsW70SAfSShFA4hzeXdTsFDulLhx9+s59/9evfsXP3q0wvLLB+82Zq4+Mk2pBkLngOgsA1amaZDx5lv+Tnb+5Ad9xfb2MtSJep5zJ7KlQ+EPc6wD6I73eDa40xGVaCMIrW4hI26bF5w3ruue027rjpJsZrNRJjsFmGCMP+fR3wl5dPApsfC/TRNAM0jOXTr/fy0SefUhgZYWR8gswnFzbzSKBwyj7WDJX1fwDwO1BocXbbVuY9FZ6XbgzmAlWkSx52wIl1Jh0ucCGKaLdapL0ek2NjTIyPoeLYJ52DMryxTv4zv7/aZIRxTCEMWWzU+ebIYQ6dPMlVmzYyXqtw2foNjI2OM7s4T2Ytcbns9K7Pg14OVwP+PC59iOHnw488sF0mi+YTr0AF9NIW83MzrNq8la3btjJeqzHXavH5V19y9PgJkiwjjGKIItJONy9ODX2GwBrnuGu1ZqRSZfWqVUyMj7Fv79fMzMwQlkvEUYjGWcpbzjV7O+tMEEPl8uG5oJT0+44HVIxzGgUXgAmWV1nPpirm1+kHPTP5sQiFCiOiQpGkUefb/Qf4ev9+rtyyhWKp5AI87Xpg5EXP85x398fn1ty8ygbGBeBDXho274vzQZlBur1BSjqZ5uDsHM+/9ga79rzG4ePHUYUCpWoVrQKSXo8gCOi0WjTnZwmVYMf11/H0Y4/xwC23sMGrUWV5VROLt9chVAFaKmbSlD2ffcK/ffZZ3v30E7rGMF6rEcVF0iSlGBcdmNPpMjd1ipCMO2++kb965mkeuOMOxpSrrCvrKpw5391Vph2MePjMNC+/+SbP7d7NgePHqY6OU5uYJCgWkWmG7fXQ2TCyKzzSvLz0ab3+eK5Ik9+RnCrnkjiFCITvCnMBrvH326njCqw2qEARFQtkvR5Js0kpCrjp2mt4/KEH2bRmtXtj7feO/q1fLmjg9pe8+un2l/w5ddr9cODoUd7/8EMWGg3iUgkVhmhtSXTWn79uzfQGidLd/x9S+RH53rysAuuPNweJcHx4Bzxlbn6DowsLl9xom/fUDQCWZGSUzvxCePqTTzZsyvRPN06uLFwzPlpMJq95bQZaCJkjnH/v408TkI/V4L/8T+COO875pxu/3nfXHb9+9j/+4NNPbv9ibk4UR8eYXLmKOC4ws7BAEIZUazXa7Q7GWKLIoRLCT2KTaZI0dYGXtRhjCeOIOIxQSg8h2n+czTV/1/xhTnVGFBeIsJw+M8WhY0e58vLNFGo1gjBEJ4lrRlXKT0D/BmKoBD/40Vkf5LSaXZZsEcovmF56MQgCr0nuHvREa/Cbx2yryXtffMbf/vZZPvzyS4JikbGxcWQQsrC4hJQBpWIBYQyN+QWyTov777ydf/Szn3H99u2OipIkFH1TqLXGrVhKOj4XMNPp8Nwrr/Lbl3Zx9NQUYalCuVR0lQ2PlBWikG6zSaPVZP2KSR6+524eufc+rli3FoBep4u0lmKx6BZFa8msa+bpac2BU6d5/tXXeG7XSyw0W6zdtJHRiQl6Wcb84hJxsUAxDD16ZlF97nQ+fBB5gfkg+hUPJ7NXiCKMccoNWhtXOg8ChJToNHNlQQs2y0iylLTTYdX4GHfdcTu333Qja2rOxCMzxjUU5rJkxrq6Rq5a4NfvHGnLMg3SI/hAM0k5ePw4+/bv59T0NGuKRUZqNUIEnV5CL+0ilSJQgZN605k3pLIDR7ez59RZ88wODsOhEsKhElmaYI2jW4UqwIgB8vd9qCvnm9f9IM3/MAxDlBW0Wm3q9TpKCtauWcOG9RuQQtLrdr0Jk8RqTZpmSCkdVSUuYIVzlYuLRYRS7D94kDPXXM1IqczqFZNUq1VOTp1GaE1YKBB7GkSSpk6dQ6k+emm15s/j0keOhuf3I5eF7SNnebAupXPzs04LPkt7tOfmGLn+Rq686kpK1QrfHDrM519/zWKzQaFUckpJOPWgzJteBWHoDOCsa/ZKuj2M1qxeuYq1q1cjpaTRaLK0tMRoIUIGMcKaoSBliGKSP3yWwZweCpr7qL6UTkLT+v6TPIn0r82rSDlNpk9p9HMpn1tpmvbBk+8TwOShiTXumIIoRIcBp6an2bv/ADded5rKlsspCkGqjeNZBxfSXj8PWjXkRSCV6lc7MBYrFYH0vVnGq30J4YNI937KUzyOzi/w7Esv8exLL3F8eoq4WqE0MkKSZVggCp3QwZnTp1mcmeaeW2/hH/3s59x6zbWsXLGSeqopBcopaylBkiYkmUaEIbEM6GQp73/xOb/e+SKvvf02NgjZsv0qlApoNJp0uj3Wrd0AxnD88CF69To7rr6Sf/yLv+Dxe+91rtL+ChTjGJ1l9HoJQRg6+VVgrt3irY8/5u+efY5vjxxhZHIFlZERRBjS6SWuoT4IqS/WCYOAUqnk6ET5erbstople3yeVFrrDO6CMCCIQgLl5kqSpiRpirBu31B+79BpRqgUlVKJ0/MnMJ0uN1xzLffffRdXbNlMKXTnJR0e6TjYvr9CMagEZ1m2rDqcGkOqXdUnA1rAt4cO8/W+b+gaS6FUdlV+nfV56e75Tl1So1xM0z9/lu9r58w5z0FxibX0yLdXj+tTeVxlPL+ewivnIXy1wautIXBGiEI6sQQt3V6cJERSMVIbJSsUWJid5VjSXTN6+PBf3jN1JiqZoPebHVe9ZqIo7d8tmYOefz/jR6ODVgPusTbYePrUrScOHXzy5PTUZCokoxOTriu62/WmOw4pVYEv3RhDt9Oh1W67QFxAEIaUymWiQoHMGNIkJUtSdJo6g5Q/ItA1WNIs2jq0PCoWEIHi6MkTfLF3L4dPnKCV9HBtHp6EIYR7Wuy573XBDzr7BdaXpVSwLPC0OIqMUK6pxgJf7P+WF1/bw2ff7qORJMTVKloIOkmCEMKZaAjJmVOnIE25YccOHn/wIe6+9RZWjVSJyJ0/8/KUF+wXEgWcXqyz8813ePblV/j0y6/pakOhXKVYriJ8EBsFirTdoltfIsRyx0038vQjD3H5utUUcNliIQopxNGgsiEEoRTO3e3UFP/6N7/j+ZdfpmcsE2vWUBkbo9Xrsdho9rXGlVKetuPc+oQ/5ksZOXLWX6iyFG00CCfxBII0Tem2O2RJSqAUo9Uq0ljmpqeJA8m126/knjtvZ9vmzY5T7heUOI4JpGtQpI+OnzuMhV6mSTPdnx5nFhd5/5NPOHriBCI3/hCOT5n6Uqijb3ntXO00XPtlxYtNqwswNPIpl1cD0l4KxjopzELBqV4wjHx+/zGcLFvrKDZxHLG0uMD8nONmrl+3nvXr16G1pl6vk2XpgFqkvCOhHSghWSEo12p0k4T3PviAQ/v3UwsDLlu/ntGRURr1OlmmiQtOicD4gDHwFZmcRjBM4rno9eNPBK/8yMYgcdX9r2HaRxAEDrXyoILOXDKlLNDtsG7NKq68egcG2HfoEF99/TXtTpvKyEi/7K+N9goWeULo3ltJSa/TIel0WL1iksvWbyAuxDSbTRYXF9xaEDiFi+EKa3/9Hp7Dln6APfg300dBpXPcQacpgQ/E8uB6OMgepp3kSUkQBGit+wF5v6L5PYe21oMGMXGpzMzCAp/v3ctnX33F3NwcIY7KgxRoYy+6/p07z92Vcc+ARQUBQRQR+PczmSZLXQVRBu74e9pirHMUOTE1zUt79rBzzx6+PXKEoFigPDKCDCO6aeIoD1gW5ufQvYRN69Zx1y23cPfNN3H52rWMxiEFJRxWYXE0PClRYURRBjSyjM8P7ud3r+zizQ/ep2stlbEx55CZZU4WMQzoNOtMnzjO3NQpbtixnX/613/N3TfcyKpCEQWIvErKkCCzv+f1NOWVt97m1y+8yMGTJ5FxzMjEBCou0O52WarX6fUSlHQgRSDVgIKRY7riPF/5tRZgXPTpaCmBQJuMbq9Hp9vzAbMkiEKEEt7h01AuF1G4vaa9uMjKsVHuuvkWbrr6akZChdaWXjf1qi5DW8xZ938ZKOLPWypJJKCVJOw7cJDP9+7l5NQUQgoqFWcGZHH0EOek6wLyPIDO+ePuNTB0QVwCYoX/Wv7s5SpAxksaI3KhDG8QhAu4rb9eUklkIAjjgLgQowLVB9G08Zr7Qeg4+57ibBDIMOL41BSfffZZafH0qZ9vOn7qyTtPLxbG/nf/EfyL/y/87nfwV3918QfvDzx+NAH5pnbrsvs+/+qfqA8+fvK9o0fLC1pTGRujPDJKog2tVpswKiBEQK+XeoaG3yx9syZ4Tq/RCD95pcobIS0mG/AA/zAtaBceeRlfCkmhVEJGEdNz83y+dy+ffvkl0/ML7oXKBeRGXyAKuoTRx3gNYN3DkXMFu0lKL9NonP7ofNLjvcMHeP7N13n7449Z7HaJKhVkFJF4hDHw1KCk2ULqjOt3bOcf/+LnPHzHrawuxhSEax5RwxuUV3vJgIUk5aV33+Nf/uo3fPnNfjIhiEtllDdxiIIAYQ1Zp02v0WBlrca9t97K0w8/xG3XXEOlEPcteiOPoPW0JrMWjcvWPz98hN++/DK/feklDhw/xujqlYyvXoUWkman4yoThdglRjlPG4bu/yUOC0I6AwIEpEmKzgwSr1ySZSS9Hjp1i14cuC7/rNvDpAlXX7GNxx94kJu3X8t4GLnzMJ5KogLyRrDvqti4RdIlUx1g76HD7Hrtdc4sLLB67VrCuEA3Ten2ErSxzonVIw2Dvoch7u73mlssQwQLUYySklbLGXeMjYwxOuIaJPOG5ospEV30HHHPda6dHIYBURQwNzvL9OkpBLDxssu4fOMmkk6HpYV5j3C64ChUrhk3D/AyrUFKRr0j6gcffcwHX3xJA9i8ZSubNm50aKU1Du3Xpt9nEkY+mfNB5Z/HDxsX4pAPm6rl86vTapMZQ7xiJVs2b2Z1HHFyfpGPv/yKIyeOo4FqreZodal2yhfgg4EMa3HeAT4J12nKhnXruWz9ejCWVrMB7TYIZzokl8GUl3AufSRf9g2jjDFkaUqWppQKRSbHJ6lVq0gpnOGYP+fhPpM+HSCfq0MI+vcdUrr9rdvtIQNFuVrFCsnBo8d48733+ebYcTIGwViS5apRl/4ZOW3O4qiCwksAWmMHjbSeFtnVGqkEXWs52mjy4jvv8qsXXuDL/fvJpKQyPk5UKmKsdr4dWUra69Jt1Ll83Tr++ic/5dG772XjilWMhCEREEmnIqK97rhSAUIq2sB7X3/F//bb37LrjTeYWaozsXo1hUqFVrtL6k3FilHEzOnT9BoNbti+nb/+6U/5xWOPs2nFCo9Mu36hvKouhEQGIVoIjjUavPnhh/zaG9llQlAeHUPGEak19LLUNZYmCTrLKEQRcRh+J/Bnz/o+D8wJ/HVMU/eeOkMKBrK8iP6xRkFA2u0ye+oUE5UK9952G/ffeTvbNm5AAVkvwaQaeXbUe9ZQUvb389TLcuf3+PjMLLv2vMaXe/chgpC4VCaI477poJISJQVYM+iJkoI0SzBGf+9Ia1jpyiD6akLWU2es8OZ7eHlnb6jnTPyEPxav9OaTvTBQzkhOKTrdHkmqKVarNLo99h45Ij8/daIo9h+47fZvD969dvuOGn/zT+CZZ+C6677n0f9+40cRkG/Bcm26dFV5Zuq/mD569N5jZ84gopjKyCgG6CaJk94rFp3+Z6tNmqZuUTOGQhRRq1QoxjFWa1qtJq22W9jDOKJQKhLHMWpIoP/Czle/5/DZnfVJglKSKI4c3wqYnp3l20OHmFpcdCUy5QKyNEn7BkY/6DM913kYmcy0od5s0u50+tJGB0+f5O+e/S1vvvcurSSlPDpCoVKmmzrd0ihyerOLc7O0lha4fP16Hn/gfh5/6H7WTU6QgpPZ8h9jfMlReiOm+Vabdz/9gmdfepn3PvqYYqXC5q1bicsleklCt9MmVIqs26WxsIDQGdftuJK//Okz3HTN1YSA7nTIvBmDc8xM6CZOTz7RhpNz8+x5+22e27mTucUFVqxZTW1slNRolup1rBQUyyUKxQJJkpAkCaVi0aFmvZ7XSM1tW91wzSuCcxXqhxByIXwJzvH/XNCnscYShxElrw+/ND9Pr91izfgEd9x8C7ffdDO1YpGuNfSSDhLrbIvzOqX0x2LPn5QJgUelArS1zCw12Lv/IF/u+4bMwpr1GwjDmKSb9JGUMHAazTrLXEOnlKjzqEr0N4Hln+jqNnYgK4hXsJBCOmRfKdrtNkIIJiYmGB0Z8RqwnmOOU0bpU+LP93WB4Xjv7rkQUqKkImk2qC8uYNKU8bExVq6YJG236bVarrkI0DrzpVIX6KVZ2m/QLFeqBFFMfX6Or7/Zz6Fjpxirxlx++eVUKhXXHJZl/cRe5GVhHzz9mT/+/UdO9xlGi3P1IqCPDKdp6gJkpViYnydLM67asYPLN21CAwcOfMvho4dJs4wgjlxyjHX0FL/GgpPBy+Xj3BqcEUjBqslJRkZqdDptemnijFqAnOssRa5rnAeXg3MQfm3to+M+2ZR+XubzLklTUu2qLONjY0yMjROqkFarReaR/7MrRzml5Xy89EsdAvrzNEkSrIVCqUR1bIxelvHNwYPsO3SIqW6XHq5alGp9CZ917oPqenhcD02apiS9xBs4SYIoAivo9jLanYQi0Fpa4qU9r/Hsrpf55uAhZBQzvnIlKopItXaeAHGI1RlZp005jrjlhuv4i2eeYfuWrZgkHayHFrJUO2MipQiFM6k5dGaaXW+8wf+Pvf/6kuvI0j3Bn5kd4TJ0BAJaA4QiQBCgJqjJzGRmlrq3bs90P8zDzJqnXvMwf9HMujPd1VdUVxVTMEmCBEkABEmABKG1DoSWro4ymwez4+4BwSSzk9XTN8u4gohwBNyPsGO297e//X2/ef8DpmYXGF6xkv6BIaI4YXpmGmEEBd9H6IyluVlWjgzxf/77f8/rL71E1ffIjLYc6DwYz6zTp110JQ3g2wsXee/99zl36RLaU/Q4LfOlWp1WFOH5vl1DECRR7PjTDgo2dF3Dh4GXHCm388EllomlqGRpinR7su/7CAw6sVVJJayGeRJF1tE0jtm5bRuvvfwSm9evo4hlWkhjeGjZ77qtaWopJzbBsXM0ShLbSAo0gGt37/H5F18wNTvL6KpVFEuldjM/bXScNniVP49J4qrJD8Q0ufBE57vlP3XxJNv0GoNxZoemLVFr0O3n0arWpSSOTqkkeC4wT7MMYwRK+Xi+nXuJ0RQqZUo9PWQGboxNMHH10qbyvWt/W2gubfkjD8dPNv73CMiF+9z2XdpYnywOnj617rvPPx2+PnYXVS5jPI84zYiTDM8L8MMCiXYPC8ZyRH0fX0gKnk8xCCmEIcVikWKpRFAI0MIQxTGNRoMost34yvuJafNdz1xe3hdCIpVHoVRmqdnkzMWLfHHyJJfHx0myFM9X7Ya4zkXK+5sf+dbdv9iZvKLr0XexXRgWqJRKCK05O3aH9z76gA+OfMrNsfuIQojxArRUGCzVxaQpC3MzZK0mG1ev5tc//zk/e/klVhUL+O6NTWaDPG0gFRLpeSghWEw1x747x3/8z/+FY1+dRAuJXyyhfI8sSymEPqHv0VhaYHZiHJWmPLd/H79+5x2efXIvg+UKWZrgexJPWe5lM0lIjcELA1Lg2uQkv/3oY37zwUdcunkTr1Kmf2SYVpJQbzbJdGazYefgpbPUKpe4e5Fn2p2S4aOC8O7rKzocT6AQhBZJ1RlpHCMFlAsFqqUSgfSI600m7o5RCUJef/kQrz3/ApuHRyi75lVPuNIr2h4bedS6/F62F0xtSLSxFtXAfJzw3ZUrnDp3lom5OWJj3cry8qrn+fhBiFCyjUoCbVfLLMucEdIfo1+IZRMp75a39uQdxLO/v5+1a9cSBkFb5aJ7Hj44d5d9PVC27Vxyx9XFtCsRxDFJbYlWvU5vTw9rVq+2DcFA2TWtJXHiBCA6MqF0oY+FYhGvVObS1WscOfIpJk7Yu2Ude3bvQgjBxPg4yvNcv4IgTpI2t/JPpRL826Cd0HZfx/yZssG4oFgsUS6WmJ2YhCji0Asvsnnbdu7OzfLVt99w7eYNVBjgBQGpKztjnDOg8rAOxcIFFZpWs4EABnv72bB2HZVikYnx+7SaTWSp1Ja4fFx++NBrXcmyaE/wPMB2z0hquezlSpm1a9fS29vrAvJkmapM/h4PSunmqio/ahg736Wjcubuy739/agg4PbYGMe+Psmp02doNZqEUuD5qi2hl79H/odr/X7oq/uKdNBy2qIKqdEkGIKCT6VSZC7LOHHuHO/94UO+OXuOBEOhp4osFqhHLYywvHGdptTm5/DIeP3QS/zN22+xa9UqVhQLFD0PT1h+fJKmpBikJ/EE1IBvb9zgf3nvPT46eozFZkSlt59ytZdmy1JHquUqEpiZmmJ2apKNa9fw7huv886hl9g4Omx7D4zBU7Ltxpz7N0gpmGu1OPHtad57/w98evwLFpsNevr7yYQg1rYnx2hLWfKkIvA8Bwbodi+DxXh/gBFhdxwqRRvwyYEUCZjUqo8UPJ9SGKK0Zvz2HdJGk6effNIqk+3fz8qeHoyBJIpQShKGFizTmVNWeTAZc7c2yzLiOEFISSEIkMCtiSm+Ov0d5y5fppGk9A8Pg5S0Wq02KGoViWwvhuqaV7kQQFftk27uiujaAETXxtB+1Cz/rC3PnDqaivAkwsuraynojGIhoBQG+FLiK9ubVioW8JVCJwnNZoNmq0maabwgJAiLGBSFUoVCucL00hI3bt9atXDz+s+3XLry9LZaiwAsz8e2rP0JSOmPHz/9LtMTLv8CSTVU7kTxTdNbcXtsH1+eeebYFyfCe7UaIytXIT2fRqNJkqa2KTMMaTkuVRD4+EoRCImPwMQJraUa9fl5sigi8BRK2T7sNMtotJo04pZF7f4UBPpHDTv5lJQueDGW+ysEvQP9yCDg1tgYR44f5+jXXzPbaNpAx1cY+ePKpw+OHM0BJ/8jJdVyEa0kV6en+e2Hh/ngw8OMT88ig5BCuYKWljKjlEeaJET1BiKK2bZ+HT9//RC/fvs1tq9eQWwMqTFtFMk6r0nwPGJgOor58qzVAf/g009ZaDZZs2EDQkmWFpfIkoRAKXwM9bl5ilKy94lt/NU7P+P1559nqFRCJxFJHNlGROVZ6oMxoDy0lNyameOTL6zZw5lLl/DLZXoHB/HCAkvNJmmaWCMeYakkWRzb4FCK9sYfBEHb5fQHXVNsABpHEQJBISzY8nOaYtKMUhBSKRQR2tCq1UlbEdVCkad37+HX77zD3i1bCbEJlicFBT9wsoO6C3ntmpMPJGaZ4+H5Ahpac+3eGJ99/TVnr14hqFRQQcBSrUGSpChlm3g95SGM6KKqdIyAssyWiX/0+mI6gUOtVqPRaNBTrbJ+3TpWjo7SarWYm50Fx+VuN8X9mI/IOd/5Q6AdVxfA90nSjJmZaZQQrF61mpFVqyhWKlZbOke3jQshhHD8eUmSZLSimCAIWLV2DVNTUxz55AhXb91idO1aXnn1VXp6epgYH7eIVBgioN2A+G8B+Z82chm/PCDPr2HOJ28HHA4595QibTbpK5d5/plnKPf1cer8BU6ePs307Cw9/f1W1i+KSNPMyiR6vk3ApCQIQzzPI4kTFuYXKIdFtm3azIY1a9BpwvXr12m2mvT29aKU5aAvQ8PpDjsfHrlEneW806baKKnaMoaNRoM4ilg5OsrKlaO2sS3Ty+gq+Z/dVBXlGib/FKpXLqlXKhTQ2lBr1AlLJcp9fcRZxnfnzvH5l19yd24esIGw/BP2we7EWSmJ8hXCsypimUNLBVBrtfjsi6/4p9/+gTMXLpAYw8DwCorlKjqDVisiSyxQkjSalH2fnZs28bc/e4dDT+3HlzYALTr5Sp1pskwjlEemJAtZxpmbN/jdp0f4x9/+jlv3xli5dj3DK1ZikMzPLaKER1+lx+qZLy3SWwj5+Zuv8Te/eIf1wwOQZTSbTaQBhaP2GTDKBnuzccKpCxf5l/ff58jxY8wsLlKq9tDT20eSpOjMEPiBnQtZZvsHlCQIvDZF6/F0jUfCE+QhuZIS31PO/M6gUyv7JxF4KKQG4gyilKzRYuPq1fzdL3/Fmy88z4piER8rJ4y2FUPpmni1sQpsyz4tFxYAEofMB56HBywkCV+eOcOJb7+hlqRWWcWzTdRRHLfP0669lgKmlHXqNE4GNFeo+v6x/KmzYI1oiw8YbDCeudetEAJOSMJSjUySkkURWRShowiTpFY6UeZKYDbZSLIMzw9Qnk+j1cILC/QODWM8nzvz81y+dWvNxm/PHDh0+eqeIhQolwA8lBJUqz/8YfkTx0+vsvI325b/vDAt2LhJMlAlBNbqk8FIsvSyaZg3a7VGKQsLlCoVV6JKbCBhcI0ottEq8Dyr9JAZlDbMzs4yMzFBWltEFEIKK0Yo9/ZQ7qlSrpRIk8QuAMY1//zkJ91p5knTDG2sRnq5YhHghalprty4wYUrV3h6715Gq1U8R6dp63a6OK272NUeXVlnVwHUxnI61+IET9kF8vqdO/z+kyMc/uQI45NTDA6PkEpJkmo8P8DzAkyaMn1/AtFqsW7FCt48dIh333iTNYP91t49imyzilKknmd1UaXEB2bqDU5dusJvPjrM0a++JkUyuGKYUrXCxOQkmdb09fWRtFo0FxfI4ognd+7kVz/7OQf3PMlgYDnj1hXNblSJ4/4Wi0UyYCHN+OKbb/nd4cNcunEDGYYMjY7SihPqUUwQBnhSYVJNFEdobRwq57XpC37gozzfBtNOESAfbaOEzgVePoxxDpfCyqlp6xhaLpYg1UyOj1NbWGK4f4DnnnmOX7z9Fru3bKGvULC30uTGD87ywFhpqBwJfsh0w1gpKiEEgbLXeWF+nnOXLvLVt98wNjXFwPAIKEWz1bI9Fcp2oudSmLmbqUBY6orOm0KXB8v5ern8rDvbb47a5I1KC/MLaK1Zv34969etp1wqMz83z8zMDCMrVrhmH9MuY/7RwLz7WNxzrk1HhxmpKJStdfXU5BRJFDMyMsKWLVuYnJ1hZmaG1DWXSieDpbMM5XvWyCNNacYRBc+jr6+Pu5OzXL16jZPfnOONkVUcOHiQTz79lKtnz5Imie11cMHi/xY5ur/0kd+/7ucsD2Jz5ZWcvhK1WrSSBL9YZNVaO6+a9TrfffcdN2/fJskyqk6Vo9WK231BGEOqNUopwjBAYmjVIpYWFlk/upJtW7ewYniAyZkpbt++SbPVpFKtOAMT582QN5qK5UGB/ca4YM3OaE95SCFJ0oQ0sXJvublbSzVZXFhkYX6BSqXC6IpRent7SbPsIdpKt+tzd9UAWHa9vn/Y30szW8UpFUvUmw1qS3U8zxpiFapVZhcXOX/pMmcvXma0r4/hcqldIfu+j+oOkx6c/VJ5GK1J0gQDKE/hS1ioN/j67Fn+p//0nzjyxQnK/f1WsrhQsO7kQlAsFIkadVpLi+gkZt/uXfz89dfZvXETJaAVxSil2n4CwrPcYF8KlrKM2xMTHPniBEeOHWN8Zga/WKJUqdBotWjWm0gEOkmptyLmp2YY7u/n0HPP8rNXDrFj04a29na1VMSXijRNacUJnu9T8DwMcOX6dT78+GM+//IEM0tLDI6OIoOAZitCSkVYKOL7Pq1mi8g5ACsg8HyUku1GYyE7yVd7aX/oDroXuyh6nidJU0Gz2SQxmmIQUnWV7sXZORpLNYqez/q163j15UO89vKLrFmxoi257CuFHxYs4pxpRyVRbVWvbjRe2JKHpVIqRagktUxz/c49Tpw8yZXr1yn39hCWStQbjbb6lFTK9QsZPGn11aW0Bo3GGOuFYay4RaeMv/wCdOZX97NnIXObLNhjzRuKpXSVJm2rEAU/IGvF3Lh2g6jRICwV8TxFUAgJyyVK1SrlUgmDIE1tj1ycJmSxrdD19/VSrlYpVSrUFxa4efcu24dHdhTjxn4Bd9mypcUvfqHwvJQwfPzD8mcaP31A/swDAXljRDCySdBXNUMssPvKpZXywsLBiemZjYViidgLiKMUKRRK2sw7ShKQgmIxRArZRnKJYkLpMVipsqp/wDY5VEqkgcf9mSkatTp9/f2WzI9AZylCi46e9084JDmPNUULgx94SM/HKxQRQcDMwgJnL13iy2++obdYZMPQEPKHA7ePGJ3IRwgQShAlKWOT0/zLv/yW//TevzC5MI/fU6VUKtMyhmacooRHFqXE9Toizti0ag2vv/Qi777+Kns3rAFw7o55wGofFE9Yg5qagVNXrvGbw5/w3geHuTsxyfotm60LZ5Lg+QGhkvhSMDE1iUwTdm7dyq/eeZt3Xn2FgWrF2ipjeXHGcSFREuHbTP3u/ALHv/2O9/7wB749dw7jefT29eEXikT1mi0Ja0uLMZltpFWeLeMajO1c93wyA2kctykNP/iqCmvcIQzWXCpJUUhCP0AYQavZor5Yo+gX2Ln9CX7983d486VnWVEqtNeftlH9gyXrdqOKaCNM0KFyeEKSYku0F2/e5MTXX3Hh6lWW4phVvb1obajXak7zFdLEUlSktDxya/aQWtlEYZMUI2zi97278QPzqq3Lawz1ep1KpcKOHTtYvXo19XqdmdkZarUaoytX2qQty7Asvx83BF3lS5zlN5K+/n4rW3j1KlNTk2zbvo1nDh7k5p3bnDl/nkp/P0M9PUgEaWZLqdIlPUopyycXGaWwgB8GLC0tcfiTI4ysXs2OJ3eza9duvj17zm6AOkP6tgrX0V3+MYHSvw2gzZGGTvWjW2XFd30ncRyzuDCPjiI2b9rE/qeeQgrBhQsXOHnyJLNzc/hBQBCGZEJAnIKxm3JmrPGM8jw83ydNIuLEcpvXrV3L/n1P0VetcO7CeW7euEmz2aRveBjoGJf84NGmduSVHPtcSyGRviQMApYWFhi/f58sTVm5ahVbt27l2vVrLC0t0dfXB9jKS7d8Yjed5U+ZYzr3G3DIfSuKacYxxTCk0tfH3OQk1+/e4fMTJxgdHOD5fU9S5MfX4LtjKYlrqssyq64krBrH4aNH+f/8l3/kxDff0ExS+oolgmKJWGsybRtQlYDGwhKezti2cRPvvvYaPz90iJGeXrQxKGHdJHGJOUKClETAlftjHP7iC947/CFnr16h3NNHudJHnGh0Kgm9og3cp2dJoyb9lSpvvPQy/+7dn/HU5s2UgKaTnPVygx5XTS74HvUk5er4OB989jlHjh7lxt27+JUKvQMD1KOIZpQQBAE607SSJmhtGzgBtO1jsDrcuXeEeCipeex1d3MgiWN83yq1eFJiNPhS2eQhSliaW0DHCRs3reKt117lb99+gydWrMAHmmlK4Cg4SIiaTYwxhIViuxei456aG+oYdJq2pRQNcHtinGNffcWX33zDxOws6zZvRjnwBwS+HyA9hYlj16MksGC46dAkA3dd/qTeCGtuaKeBBietqIREGIFJNMQaT0J/by8ju3a7plRDvdlgsb5EM4poLC6hNQSFAlJJlFbO8kY7lSaDkIpqTy9Rvc7U/Bxzc9MHhxbnb65r1o419+2di/7H/zFDyEeQ8f/846cPyL3BB372BF6/wPfoXTQ9686mGyZPXh+6dn+CgYEBlhLN0sKibcQAkiQlSmP8MKDU20PSiqxrX5oRKo/+UoV9u3bz1FP7GBwZxiuGXLl1k//62/c4f/UKxVLRTh4p0ZnlDosHsrQ/9xC4rNghdcJTCKloxjFGSqp9fUS1Gvenpjny+VFW9PUzeuhlCrj+h65Glsc/vY84AQd55It61Iy4cukyX574iosXLjK0ejUD/YO0EqtH60sfUk19YZG02WTN6CivvfQSv3jzDbZv3Nh+WyUlKvAtNUBnGGWbL5aShHPXb/Lh0eMcP3mKsalJwkqFFatW0Ygipudm6e/tI/AkjaVF4kadDStX8tYrr/LaCy+wsq+PWr3Gos7oq1Rd5q7JsC5dGpjXhpNnzvG/vvceJ8+cwUjF6Jq14Hks1msozyOUgjhq2YVMKqqVqi1dJylREiOUIgwLNJpNms2Wa0r0HtqMH/YUs/cib0bTWUYcxVb9xbe8+cbSInGzRV9PDzu2bOf1l1/muaf2MFoukgLK0Ebec7m0bpSivUjngUvXLBLCbnytJOHW5ATfnD3DxStXiNKUopOpRAmUSxZSZwaUG+VIx5XPsItax1ToQVnC7knWXdBc/hvWFMgGp729vWzZsoViscjVq1dpNBrLG9QePUMfOTr4iXCuix1E2kpnaXqqPZhWxI1r1xi7d4+9e3awe/dujp/4gi9PnKBcrRL6AVEUt/mHmdY2sVcKre21aTSbVJ0ZyZmzZ1j7+WcMr1zBtm3b2LdvH+cuXkS3WgyPrgBoK4P8WzD+40ceaOb3s5s/3e1+nKQpS0s1RJay5+WX2blzB7du3eSrr7/i9p3b+EFAsadKkiaA6CSauWqWWzOzLCOJE4w2lEolNq5fz5bNtj/r/v1JpmdnyaTADwIbwBn92Dn6YKNlW/mhq5LlKeUoFa5HoVBgdnqG6elpZmZm2bBpEzt37uTe2Bjj4xP09fUtoz61KVr/G+eXFDasSrMEhMHzfWue5PsExaKT/Ew4c/4829avZ8uGDYz29RDy8DP6uK3xcUcnhcCXilaaMjYxwbETJ/j4k48p9vayafNm0tz91tiGcJNmJGmCh2Dz2vW89cqrvPrMc6zvH6AZtYiyjEqxaIGKLCPRGuUrIq0ZX1rgi+++5cPPPuX81atkymNodCXGSBZmF6mWKpRKIVnUYqpWp+hJnt37FL984w2e270bD4h1RsGzSiV5JVZISRD4GODq/XF+/9GHfHrsGJNzc5R6eij19VlJQkS7abxRaxA1W5TLJaqVCr7yqNdrtFoty9HP+wxE1/X7IwtiLoeZNyYWwpBioYDEKqTFzQbRUgMFrFm1mueePsCv3n6DfZs20ALb1JulCBGAcqo0SeIQ5wKGTjBubent+miMITPaJVaCxTjhwuWrfH3yJJPT0wSFIn4QOsqLVb7yPCt5mVd9cFVeS5O0MZbWuiv4/2Hzyf5d9z7ccS2XCOvcmRlMkkGaYeKUdRtX8cYrh1g1OsrkxATjkxNcvHqF67ducm9qktrCAn4cExaLKOWjlAB82xSbpNQbTcJigXJPlcbCPFO1emFocnzfc+N317Bh05XvVv4s+v479+cbP31A3jew/OeCr+ntA88jTFRYTIPeMzfvhldv3mHF5u0USwWariQpsMGg7/soT5ElCfNzMzQXFlk1soLn9u3n4O4n2bV1E6tXjhAWi5ggpFwp89kXx8Boh0bYMpBUHpjlsnem+4c/dbg26c7bdILiLNOEQYhSHouLC/ieor+vn8gPmJme4qNPP2X9qlU8f/AgQbHQRnUfPKQfJFQnrL62yQzSExQKIVu3bGXfk3s5f+0qU4uLpPfuM7BqFdVyhShOmJudoz4/T1+pxMF9+3jzlZfZsXEdvb6CLLNfApCSVFunN98Fk3emZ/in37/Pbz48zMziEgMrRin39TE1N4fWmmIYIjBMjo0xfX+MHVu38O/efZe3D73E2hUjxFlKIfAR2nPIAiAknucTeD6NNOXbM+f44MgnnD5/jlqrRbl/gMhxUJMsI7PWZQghKRXL+FJaubskcY6eNuNvNBpoY2xZW0m3ID06KH3clU6dPF5/by8KWJxfYOzmbaqFEs88fYBfvfMWh547wMhALwlgUkdLkUCmEUJ38eKcO5oQ+TLTHnmHu9U5hyyKuHTlKl9+8y3Xbt4irFQpDQ7SSmKr8pKmtllUCaT0HM9ft9UrLN3EGni4ymj7jDu9am7OdSWEeYwgjLVnRgmUZzekSrnEurVrkFIxMT6BybRthpTSNpY5JRvzEKjw6Ktr6BhA4BZ+sM9PYlIq5TK1ZosbN24wMT5OEdiwYT0rV4xAltr+BKWYbzYRUhEGIYnjNwolEUqAtuh5/0Afolzh269P8vXJk+w9eICNmzZyYP9TfHPiBJmSVLdsYm5+nqgVUSgU3HV63MwwD/z5/ef6f7jxQ9fHB063O9jMv88pKnlTpxA2wPZ9H8/32LNnN+vXr+fo0aN8feoU41NTrFm/jkK1yuLSEtLzUdLq3SvPzU0Jmc5oNOqQZQTKR/ghK0eGWDs6SJbB9NQMC4uLFKtVF7BGjqrStbKKR1fOuoPyHOEPPA/hWb5wM2rhKY9iGJKmKfNzcyzOL9Db08P2LVv4/Pe/J56YINi4ATyPKI7az6XJup/BvKz/6LC4oxCW3xPjroPlQDcbTaQSVKtVktTyfKXvEZaKRAuLXLp2la9Pf8veXTvp3baVsFR8JGr7/cFS508lJcLz2897X38/+/Y9xQvXbnDs65NcOH+BzTt20NPXb6lGcczU5CRxvc6urVv41Ttv88YLz7Fx5ShxnOA74MMm07bXRSlbJW2kKV9/9x1/+OQI35y/QCY9BoeGaLRi0ILAt1KDjaUlpsfG6C2VOfTsQf7u1z/n+Sd3E2I9JIzW4MzyjNsffCXJjOH6xCQfHjnCbz/4gOtj9/DKZcqVKvg+S7UGgKvQp1aCsFgk8H2yNCNLUlvt8FRbyrLjqfAAV0U8eDU78yxvPk/iiEbDNrCHnkezVmf8zh1MHLNp3QZ+/vbb/OKN19nuDPSyJEUKie9b9F6YFKEUQaFAvrbn+t3arffdFC2d7/FJws3bt/ny1Em+PfMdqTEMjAy7/jFrhNfW0c862v9aZ2idgcFJLjukPE+8l5286czhDjesfTWki2O0cS667gGRgHIMiSzJEBqUUAz09vLkti3s2ryBqdk1xEnM7Sd3cfH6DT778iu+PX+eetRCa02pXHV7jSQsFqkt1agvLbFqxTDlapXG0iL3ZucYuHqjuHZwaMtAZeAcwyOT3/NI/FnHTx6QF+l74BUfTY+IUHhCrJP4r83XW6unFpbo0xl+UMLThiy1Bj7K9/D9kCSJmZ6cRLdabFy9imf3P82v336LZ/bsYqgLXcyAqYF+ioF1T7PaqNa5TQkJSBtcAI/IxR549QeUmR4zcn6i5THbICNNUhugeR5BqYRWHpMLCxw9dYqdn33GoWcOsr6vDy0E0nQfy8OLczs4EPLBv7CLQQZB4LFx3Up+/s7bRFrz+ZcnuDF+n9biov09IK7NM1QtcuDJJ/nZKy/zzJ5dlCUWgUpSlDDkHEqEIJOSxGiu3L3P7458xvtHjnDp1k2GRlcxsGIFyvcZHx+nGPpUigVmx+/TXFhg/YpR/urtt/n7X77L2v4+pIClVkRPoYhUhnqrYYNx3yP0PBbSjNNXrvHe4Y84euIEC80mYaVMWC4SJTGpa1jMDM6xT1l9bGE7wNPESlcp6aO1IU4i/CDA9wOyJLXoQI5WGVyjI7Rh6a77b9kk1soYATpLiZpNovoSfZUS+3bs4ldvv8EvXnyG1QN91BOoR5qyb++HzRpcI2W+2bZ3YeHqchohbINtlmlbslMQAWdv3+HTL05w7sIl4swwVO2lWKowtzBPmqZ4gFa2vCmRGKHbHfVCCoSydJPuJADyXgMn0WUswcRg3RIFNrETGJSwygxxs0Gr0WB0qJ+9e3azanSU8+fOc/7Md0hgsH8AHCpCjhD9mOGus3AGEGQdbq/yFElmFYDGxsZYSjWDnmTHtm1s3baNKM1YnJu1x+spa5/szlEK5+AmIY0TUB5+yccvl7g5do+PP/2UX/zyXTZu2cLa7dsYuz/GwuwscStqu53mMl9//JS6STr/hqoDXY3Fsk3/aVeckoQkTRkaGmLj2rWsWbuB6dkFjn/5NVdv3kIVihQqVZTvEy8uoTKBDH2EVPY5NRqjM6QEhWBxdp6SVOzeto1djqJw9f4EY/fH0UaA8jHCqkp161j9sTuV08syJ7HmeZ71SHCUm5QUTUhYKqHTlGs3rvHUvj1sWb+ezVs2c+naFRr1JfxiET+w1TujOzrkVnrOJis/tstJKmnXuDTBlyFhGGJ0C51mJCIj9AJ0UGAuzfjm/AV+e/hjyuUSB7ZuITbgiw6lzt2wB4LGx18lKSWJo+AMViq88vJLBMUSKixw7ORJagsLSOURhCGthQX8NGXNypW889qr/PqtN9g4NGCdhxsNKsWSa5hNyXTqqriSmSji63Nn+N1Hhzlx6ltqUUz/ihVUq33Mzy8QeD6VQoHF2Rnqc3OUAsWrLz3Pf/frX/L8zq1UA584v8YYV03UlsoQShIDV8cmef/jw/zz737HuWvXkIWQ3r4+ZBjSjBJaUUTg/BeSJEVJZdWsECQ6s1rh0krr5etsnu5JzLJkrz3vXH+CnV+deaakRASBdQbWKfWlOrX5BTw0W7Zs4q3XXufv3nqDPZs2WLDJmR36nsKTkCX28xVYOUoc7QPdpqjYnimrd24AnCzznZlZDh8/zudffsnk3BzVkRVUe3tZrNctSOSSv1wcQAjLQc8bpIVYrq0vhAXLfsxYXpWy10oikcbSVXJUP45jesoVquUSg+Ui/UDPQB8K2DI8zPZNmxkeHKRaKnLm4gXuz8wSiwYqCAiKRYeUa9IkJklSfC+gVKowubDA7WvXqxtGVz9d2Fb/jmH+1QLyn5wUMzpTXPa1aqrkrZgrBMVMUsjSHbIR/w9BUFrnVXtIHF1BeIIoS4izBKGsKUuaJkzev0dfpcibL73I3/z8HQ7u3kVBSGIghnZ5JIsi4qhFZmxjl5CSLHPOmbqjFGLVGADyJjLTLncbOiYQdgI/+j/oxB7CWItaaUCnGWhDwQ8Qxga3pUIJT/ks1eo0o5hSby8btm/j2r27/L/+0z9w/vZNDJAiSI1rZLWfwHJ9OFt6yrqC9jyJEFI46SWBU/tjy+b1/Ordn/Pv/+av2b19KwvTE9y9foXG7BQqjdizbTO/fOtV9u/cSo+ySLDl7YPwPbSnSMBm30Jxb3ae3x7+mP/8z//M+Ow8w6vXsGLNamtXPztLIQwohyG62WLs+nUGyyX+h3/3t/z6zddZNzSAUVbKqFIsICVkaFAe0g9QnocEzl25wn/9zW/4/MQJ5paWqPb1UaiUyYy2XDCHRPiej6d8BIo4TonjBCnsYqk8391T7RrIbDKWJTEmy/CktNJ5ztTAlrDzIFk44wPLqxOepFQqEgY+4/fvcefWDchiXnnpef4v//3f8+bLzzI60EdiwCQxPimesnbuaZpgpHR643a+CdExYxBGu0bTzOmBOjk34PL1m3x45DNOfH2KpUaTkZWrUL5Po96wTc3SXgtEp5kRx522QahFJzKXvOTnhLFNLmDwPIlUwqEnpq0bq7MMnWZW2rFcpNVY4t71K2xat4bXXjlEf1+VW9evcv7bb5HGMNDfbxteTcc+vD1llw3T3qhkV2iUy4UJKVCuIUgohZ877qYpwveYnZvi7u2bCOCpbdt58+VD+Jlm7NYdeioVCqUizTjqUFaEhxIetlMB5mtLzDebrN2yBVUI+eTzT/n82FE8T/E3f/VrNm/YwJVz54haTSqlom2SNTmC48g1ucNcO1axP5iur7YF3X8jwzzm63EjVw/JA3LP85zucWadgH2fZqvF+P37DA4O8uprr2OE5OiJrzh15hyRgZXr19LSGY1WRKlYQjkUL199bY9RjB/4DPb3szg7Q1Rb4qVnnmHP7t000oxbN28xOTlFWCgh/ZA41TYoF6Lj+Nd+VpwhiTEdlSfRoVIJLLofx3Fbr9p6XChaUYv+wX76Bwe5dOkSVy9eYqBU4mevvMLz+59ievw+83MzlEsl4jgiiq2GtdaGNLOGbMpT9jmEP1Lut+mzzilpOK8Eo0njGOWCWTIbiIbFAqNr1jA5N8d7H3zIF6fPMdZKaaSdPg9hQGiD0MZWRk3WPoruIxLLAAXT5vYaYKC3h6ef2sf//f/2f+Wvf/UranNz3Lp8idrMNLNjY6waHORvf/ku7756iA0rhokNpAZ6yiU8T2J0YgUbdAZCkmH3gt++/wFfnvyWeitmxegqCoUyraYVGqgUS/hKcvfGNeLaAs8f3M9fvfs2zx14kqBUJDEGk2W2iuZboC5NddtU6v7kJB9/dpR/+f37nL18mXJfH4MrVyKCkEYrsr1QQeDQYdluZmzFMXGWYYTEC0JbLRCSVDuLd4dGa1cNUZ51GM+rgMbNM/sFRlikvt5qUSgVGRkZptVscvfWLeamp9i5fRv//d//e/7Dr3/Jjk0bSIE41ShtKPjK6W5bxTTlqqu4c7f9cxoPgSckvrAc7ShNiY1GCcn9pSWOn/2OD44e5dqdO5T7+ihVK+Qma1li7elzUynp1LRywznP7ck5Q8BS1mR7ztp1XtNZOA1GaPvVNb/TxBq65fQg2yxqqTE6zSgEVt2m1miQmhS/EJC5PSvDglhGClb0VDi0/yl+9cYb7NmylaJStBo17J6nSOKIMPDp6emh2WiRRCnVai9RopmbWyiZJNmujBn9I8vin3X85Ah57T//ZvkLs7OZeeIJvENvIgb6C41G1JcKhSgUnARf13857SNJMGlK4HmsHV3J7m1b2blmNcPKNrwZN0Fs8R+Uk8MxxrgSOuTLjnAPRxtJNp3AWkpJ7oao8zJJVxD1w0YHcxdCtAMdtO1gzjDtyeaFAcr3mF+c5/LtW/z+k08YrPSwZ8MGQimJ04yoXsdTnrP1to2piXYW09LDdAOv+ZAs2zH7igX2PLGF/v4+UBLPkxz78gtqMxPs37+fX731BocOHmSwXLacayMs2qpw94T2g3VvdpbDx7/g8LHjXLt7F79SpdjbQ6I1WkChUKAU+NRmpmktzLNl3Rp++dabvPvGmzyxfi0BkLirJIU7UGGbLovKoxbHfHPnPv/04Scc+fwok3NzeMWCtUHGupeJLmMfrTNbSUF2EhOnZGLRM41AIqRTMTAWnVOi26jDIJ2NtsFJDTp01qIOEoxmbnaO5uIiJknYsXULLxx4mjdffJln9+xhoFBAYUt3gWfdwoQwroAhl8VlD/JS88UrTTPi1HIHY2O4OTPLR8eO89GRT7k9MYEICxRKJSJtjaTyOZs79blaZGcOdgoAy2avrQaYtoqB1s4l0AjiOCFNDaHyKIZFTJqi45io0SCOW3iBx/btW9m2dRP1pUWmxu5BvWaTCac1rcHJaz36memiVi4bxgVBwmYrSGc4EScJGFCBT6FcZnpujuvXr7J11Uo2rVnDs/uf5szp7xibmCCOrAqC53kkrQSNbhtXSCnxwtDKlqUpvf29NNOY+/fu8e2Z7+gb6Gf1ylXs2L6NO3duY4ymUa9TLJaR2MX++0e+ybjzfNhx6S9qdHOku5FxKSVJkhA1m3hKsXr1arZv387Q8DBfn/qGjw8fppmk9AwOUaj0sLS0iM40BT+0SS6AEFabWmcUCiHSGMsVBTasWsXenTtZ29fDZK3F9Zs3mZiaplztRRVLaCN+dLOx/UjRljfsli3sfp6DMCTSTe6P3WNybIxQCHZv3cKurVs4efoUrXoNo610rzYdp0PbIKnb+1j3s2MRwu6d5RFDgtAWvURbJNQYuz5q7PpaKPvIwhLjCwv8y4cfUCwVef3Fl+jtLWEMRJF1hAx8G0gZk5FkMcIpaDzyuTX5Wm4Bo4IQrB7sp7enxwoaJAmffPops/fHWD86yi9ef41fv/U6W9asxsfiTKrtzGt9GaTy8FXAXKPBt5e+4x9/9z4ffX6M6Vqdck8fxVKFDEGcWom++ZlpkkadkZEBnn9qH794+3X2bdtMD51nVkoJ2rp6Iz0KRY9WknFzfJoPPj/GHz45zLXbtyEIKPb0oQpFojS1wBTOqdm4ewTt5sfUaOvcLER7D7bFFNXp2dGaKE7QOrZrkHMTtq7Gpm1sgzZWTSYMieoN6jMzzM9M01+tsnPrVn759tv87NVXWdvbi4eh0YpQ0sP3PIuhOEBRtKu8DoGXAmFkuzorgCTTJNr2MxmlWMTwzeVLHD52nEu3btFC0NvTg1Ce1SbP53z387D86Vg+KfKg5JFLYNfcbq+V3W+Vt3TmsYdt2japdVE2nkEK5fYHlyxk9g2c3R4KKACVaoXW9u3cuH6dy1evsXjvHjpJnSNr3oyqyKIEpMLzQuJM04zigsiyDbLJEHVyW1AeInz8mcdPHpBPHf7Dgy8l3sxEMjI7S6G3z59dWiLSGj8IrH60e2g8pVDC6nDW6zV0lrF25Sq2b97M2tGVFAMrQWPaCJtox6ECN/dcyWNZ0U0IpxbhZNVcycYuOnmQ5wK5dpnJfG+jcPvv8vnXRtlNu5nO8rs7D7MQwmbGmabS04+H5uNPP6enUKL33/87NvUPgBBEcYLxLPcZ92/SNLWNqsKaGeTntWxOS8eEcNcjlJKNK0d469DLDPRVEVnCzMwMv3zzTd584QXW9NoGy1Yc01ep4Pl2aqRGg1CkEu7Xlvjs1Cl+e/hjrt65TbG3l5LrB6g3GpQKBUqFAJKEqFanUijw7ltv8O9/9Uu2bFhrXVZbMUFg+cyZ0QhhHy7fJVcXxyf4x9/9lvcPH+b+1BSlnh7K/b0YIdyDZ9VChLQBvdHGlrGUaC+SNvB2m5sUboNzEmwIvPzaOQk2wPKM83+f2WRM5JJkJiWNY5rzCwRCsG3bVt59603efPkQW1euoiwkkc6sjCTg5009RiM9u7Asny/2rgiRzx2BkAqNppXE+GHI2MwsR058yYeff86lmzcIyhWKPb2k2rQVTDzpublpHrBpfsRk7VoYtbbd9b7XoWIEUrrjsYueLyVBEICU1OMmM5MTSCHYuXs3u3btJPQ8Tp49x/3JacKhIYtMtFqIvFypdVdFoHNMeSXpsceGIUoTpJZWNSNNqTcbeIUipXKZal8/cwvzXLpyhaf37mPz8AjbNm5kz7bt3L43xsLcHAVjKFaqZLGTm8s0UguUZ7mmsSu55m5t/UND3B+f4OuTJ0n2xAyvGOHgMwc5e+48S0s1wkLRmkktP9Tlh2/axasHzvkvNyjv1sHPNYtLzsSpXq8TR1G7OXjl6Ci3b9/hs2NHuXj1Chs3bqDUW3F6zrQdYD3lWyUmrcm0VX8qF4u0aktMT0yyaniE554+wLrRlVYqdLHB9Zu3mJ6dodrbA0FAZjIyk6IdaNJuIu4OIPLApmvkAfkyp1EXkPvOlTRHz8kyZufnGJ8YZ9WKYbZu2szalasZm52hvrREsVDAYOkPQtkyfJqltGlb3fPm+zYfcjAm7z1y/xl3/bW1Fs8cuNQ/PELcbPDVN98Qeh6rV66kd89OejxFnKW2aig8WwkwhkzbCpkip9N0fyZ0+qdM++8FUPAV+3buYMXAIKEUnPrmFK+/+jp//dYb7F63hgyoxykl38MTefKGBcSk2wvu3uS//u63/OGTz5hcqNG7YpRy/4ANYrGcYpNlLMxMo9KUN956k//w61+zc8smeqpVltKUglL47mDjLHOVBBsrTCzM85tPPuWf//AHLt28hiwXGO0bRYQBUZZarW3sPZdCkmZpWxUH1yuT6Ywss2o/VunG0gOVygNSpwakNWmmkbrj/Gx723KTNvunBRRhcX6eqF5jsFrlxYMHeevVV3lx3z7W9fcTYWg2m5CkBEVll9muosWyaesSPGuc1ZnbWaZJspRCschSEnPl3l2OfPEFX393mgRD/8gQfrFoqwCprd6A+FMEUx47HodXWDngXJ0JjHFJq7DX23LToVAqgIBWFKHTzv4ijdUsTwV4CHpLRZ7YvJnNG9Zzd3oanSYkcUxO29Vo50IrXYVYIpT0DWbYNHQPM9AuEPX9+c7/UeOnb+p8xPDTTGy/O6VWElbn5+ZJjCEMArsIZBlGZ1byR1gR/KjWQAnDilWr2bZpCxvXraNULLSRA3h05p5nacJYjDKXnDP5QiwlwjUi5Jtqm36SfwkeP3O6P8b9YBf59t+48rXDzrQt1QgsZQDHl/WDAB01uTN2j2NfnmD1ylHC519gw9AQlZ6q1VGOIkLf6oALWWijy20joAeOK3fuzZyiilACT8KakSHKzz5LX08PS0tL7N29i5UDQwD2mochnucDlntvhMIHGsbw+Zdf819++zvOX75CPU4o9/WRuWCwULCuWAuzs0zevctwtcKLzx7kjUOvsHPrNgpSoJPMJU4SrVNXpvXx3MN3/s5d3v/kEz7/4gtuj42hwgC/WMBISbMVoaWVWzJuYTBYGo0StiM/dQ6ieY+AlNZFVCqBERK0wGQWZfeU59QaNEkck0RNkFbeMAxsg5lxTa31+QXmZ6ye7XMHnubF557lxQMHWDs8TFHYh9jKLVrDjPz+m0cCBPniaGeYbYax0ksqCAiUx2KWcebaVQ4fO8rZq5eJTEZPtUxYKpBkGdqZRKi8otTmv+MCw3zV7CxS3RNW5UmqMxQRCKdgAWEQYJSlaNTqdcqFkGKhyNjtWwwN9vPM/gPs27kbpQ3ffXua+xP3GRwZJiwUiNOUxGSukUf94JpS5zkSCGV1gTOtKfkembbasZSsFnkpbjE9N8eFq1cZn51l5/AI61etZNe27Xxz7gKXx+5hfJ9qb2/bpCPLUlc29vGMtMGPyWhFEVIIKtUqi/Pz3Lpzh97eXtatX8fIylGqd8eoN1v2OUCAMO0Eyv4oui8zQrjkvh2Z51DAX2ZQniOEOXc8r1garYmdlnFvby+jo6M0m01u3DjP/MIclR4719M0pdGyKLpUvvVYMDZQTNIE5SmKQUggPZZqDZrzi6zZu4m9u3czMtiLBiZnZ7hy4zqTM1OsHx4glZJWErfVgh40isvDy7yn5EE0PP+5A7J0oiDp1JOkUuD5TExOcub8edave5vde3azefMmZhYXWJydZXh0FOl5NJMmQnSCAWHyYLwrgXXHtrzS5QAo53xoDyOvzrTDcqBDwckRfHRKM2px6eoVPv3iOH2VMnu3biIo2kpDkmagLf838IKuPaYDcHXucf4ciLYCTe7WOFSt0Fcq8vd//Ve8+MxBdj2xnS3r19t/r8GXEiUgTlKSJCUMfTypaAIXblzj/SOf8tV3Z1loRfQOD1PqqZJhZe0CP0QYQ31pkaLvs3n9eg7u3cuurVsZrpQJPYlJU4SrSGdphsapY0mYbbU4ceECH35xlFOXzpGiGexfiV8u0Yhbjooi8HyJcHxlka+dxt4NBQgh0S7WlXQMAa33Q0aj1UIqRaVim4mzLCNqRTSaLUul9DzCICAIAgLfo760yO3btykoye7t23l63z5ef/FFdm7ZxKiTzfSMQfm+dch2dEuEbVwXbgHKJTWNSxSkUxUz2sYMvu8hPEUI3Jif5/iJExz/8gR3xsboHRik0tOD8BRJ01YJlJOOzveMP/Lkd741D7+0bJjl3+bVlnzOGUczlnljk7BsB5P3BWFBJCGXV5SE6TAsSkHA1s2b2bxpM6fOXWAxikmi2Pb2uc8RMl8LLFVVmwydxGVD1kdAByH/icdPHpBvf/HQsp+j2hJ9q9eqrbXGiLh0eWBqatIiVYUCAFliu3c9XxEqD52ktGoNqsUC61avYtvGDYz29rSv0YP3uXvREnQC9vx3c/TUBk5Otqdr2WtP4rxRVP/wsOJBhDr/XB4IkNq/Y+wDLZSHkR5CeVy+dp1//Od/QRrBL19/nZFSiWIY0ogi4sxxwHJ+mEssvvcI87U9s9+XlKLU18fw88+TAbnUfZYnRTm3DXtsPnCvXuPo2bP8lz+8z/FTJ8EPKFaqBGGxjbwoAYuzMzQX5qkWQ15+4Tn+w1//Nfuf2E6PEm1OnXKbmLbwNZ60/PR709O899Fh/tff/JY74xN4hQIDw4N4QUgrTmi2WtboIghJ0qxdGbCukO4UdYYxHdk/4aAD+3nGPXwCnRjSTIOwRhXS8wiVNSGwldOUJI7J4pik2aSgFE9s2MBLzzzDO6+/xs7t21hZLucEBYzReA4QsWzLfDPtlMa7seIcrbCokGNQC0EALBnNF6dP809/eJ/j355iIWrSOzJEoVq2yFESgUMMlLAByg9ZJ/IjEdjycI6g5VM/dwy0C7UgS1KSVkTqWWwsjWLWr1zDW6+9waYVo3x7+QrffPMNU1PTrNu4kdQYojS1Gz9u/v9INKXtGtdFN8OVgv0woBSGpFnMzclxLl+7xu3792luf4L+YoGndu/mu8tXuT0xbqUoW/2EoVXjaDatcZLWhszZm0upaDSaFIKAUrlMq9lkcWmRK9euYYSgp6+Xnv5eaq2GNanKA65/Gz94dKvStMv3TiEpT4R6enoAuH37Nt+d+Y4kSxgaGUZIQRxZR8fQD5BIkix1m6a9j1JJBIbG4iJpI2Kw0suBvU/x7P4DDFQrzLZirt++ye3792jGTcqVIqkQxIsJaZIn7T98C+w27pFu3Wmvv6ajsR4EAUNDg0xOT/PxJ0d4Ye8edm7exEvPv8D41DTnL12k1VMhKJUB7bjsbgFx+1A3RQX+yKNkYb6HNz5nTd6uWOkMoRRCefQPD7PUavGHw4cR2iDNm+xev5ZqGNAyneqDJzy6KTSmjcN3gWHuQPPKlzDgCdssKjzF8/ueJHlyD0Vlr1mS2d3YF5LMJVkoixovpAmX7t7hvcMf8dvDH3P3/gSEIaXeHoxrIJVSYHRK2opoLS6y74kn+Ot33uH5A/sZ7atSwAY2qZtvOlcH8wOMECykCR+d+JL/+b33OHnhLDWd0Dc0iF8tEQtNPYrQxlbTfKnIksxK6jqqSfe6qYTbj4WLFRxN0tgp4QC0PCHFzTlFoWgVyIQx6DSm3kiYrdeROmP14BB7d+zglRee58C+vezcsIGKstXxOMvwlUR6vq1K6KwdkLfvPQ9+axFBndl5oKTCc/P2xuwsHx8/zuFPP+XqjRsYIQnLJVQQ0Ipjkkx3cRD+lYAFkasyZe2+PlcYt5UFJS19JUutQaFSeCoP4HHX3yBdVafgKTauGOYJV4lbun2HZr1BuVp28UjncxGW658Zw0K9jj+/WBnqSVBGo7IU1pZ/0lP/yQPyn/8//p8PvSaEkGGp3Hvz/Jnq/Pw8WhvCYsdVCodoK8cTzuIYr1RkxeAwg729BLg40xjyxqllyij5wgAd9AraTpi2ccw4O3FLYbFlVdN2Cmy7p2UPOCi2T6L7hy4Zn4f+3rQfTtNeb20Ql7tDGmNQfsCKlauozc1x+tx5yqUy/dUqLz9zkNFyGT8ISOIYk6aOn/z4h6N93sJKYpm85JsKyzVU9sYLY2g5IxnfU20jlCS16BVCkQFffnea//c//C98c+EixvMYGh5GBSHagK8syhw16sxOTTJYLvP80/v5u1/9kpeefooASI21/xVglS6cwonnW77xtfExjhw9xu8/+ohLV6/SMzjE8IpRytUKC7Ulosia+XjKQ0lFrNP2w2kyG5xbqSfhdEZt0GmwqFaWZmhhHFpnOXdZZojjBCUlhUJg9V4FxM0GtVqNqFZDGYPSmi0bN/LKSy/xxqFD7Ni4nhDLkc5Vc3wlLcfNbWQIvid4W575I1UbDWgCt2em+eCzT/nk2FEWWy36hofpHxohSmLiyLriSek0xl2ZdzlX+YGkL//ZdP3sGg+kcP0NxjgGPi4QthrLwveIWi1kmjLYP8CTu3axZ+cuW06+cpX74+PEaUJYLGCSBGEMSlk+rDa6/Ux2o3wP0VXah+2SGGH5qpm2981oq6tcKBQoFYtErQYZML+4yNj4BBP1OivKZdZv3MieXbs4df4MV+7dZWl+nr7BIcIwJEqSNmKYJCnKtxzzZqtppSELRSt5VRdMzUyDFKxYMYrv24af2dk5e50dVUHk/JRu6NKFKAL90B34Sx45wAE2eI1dqbhQKFCtVBBCMD4+zp07d5ifX2BgsJ9ypWxlSh1vXJjc4dMmaa53zUontlrUpmYoGHhi6zae2v0k61cN4wNjkxNcu3WDetQkLBcplIpWdjBJiVrWzdf3H7+Wdq/7+Xnk55LvEZ6TPtTGkCQJUlqDoOKKFYzfvs2p06e5OjbGnu3bOLD/ac5fvMi1a1dp1uoYhDWZERawEHkfjKGrKts10boepAcpaibfZNqn4hIgk6tRaUxqdfUlhlVr1lCbn+f67dt8+Mkn9FZK9A/8gifCQaQn0ZlaRk9Yjts/6lrh+nLo0JTyvUQqip6ya3FmK9JKeQhpOdTWodkjA67fvc8nnx/jyNHj3Lh7j0K5QliqkGpNFDdBSgphSNJsQZLQVy7z4oED/NXPf0Y58K2ClqNbCiz6LqXEDwMkMN1qceHGdX7z0Qd8cvRzvHKJlevWUq5WyYBGs0WSZijltymsdn20Jm1S2CqrxoDKK0B5BUFbjrmrriilrARlkrG0tESSxvi+T6VSpVqu4jnjnqWFBZqLi8xMTLB+9WrefetN3nrlFbZt2MBQb5WSEmRYnXGtNYEMuqrw+fzISS9d67trsLTtRZYyk1N9NDAbJRz76ms++PAjrty4hfJDRkb6CMKCNZdy/TiB0/3XXZ/1qPEj8ZfHjnzupK5pWgjLw1eiI+agtb0eYAh8D08sD8jB5ijGhjwEwMrhQVavXMmNe/dYWlqk0lN21TvdBtcspdUnE4Lp2hI9k1OF5/2JClrXhE5hz6Y/01k+evzkAXm5XFr2syv/KY+sN64tVefnF5DFAsUgIMtSRx9x9BJHh8jSDCUkQ/0D9FaqFukGjGuOfNCMJC/NoLuUEfIGGtclbYR1MDQG16jTkZzqNmrIrewfWrTzOEd0TcTlnQk8+A/aG7lb3NrcP4e4eL5PWCoTRTEXrl7jdx9/TL0V8cbBA6wdGsQPQ5bqDWqLS5TLJcvH5I88CCJPnkUHucQ2yqVphud5eJ4z8HD/JFfIGJ+Z5uzVy/zugz9w4coVZBAwMjSMUFYZQGuNpyTN+iK12TnKgc+BvXv421/9khee3EN+51PdybFzmk4grYTYZKPOJ8dP8A//+E9cvHaDYrlKpVJFeR6tKCZuJXhCUSoVrdtmnBI3WtYqu+iTaltRyRuDhGrPMUdXyMhMhlRWdURJZQ0NhL23SgjINPXaEs1ajebiIknUYqSvjyc2b2bn1m08s3cvT2zewMaVo5SBOM2sQ5tTaJGys0wJh+g+ZovHGGHNSwAv8NtasBK4cOcO/3L4MMe+Psn04iLVgX4K1QqpMdSaLbJME/gBuGsv6EZF8kU5/9l05pz7MT8m7VzPAt8ndRSYXN0hia0HQOj7VCoVJu7dI2s22bdrNy8/8yyjpSKXbt3mzJmzaKMJAp8oTYic3nchDGi0IpIoxnfNs/Agx90dkmgfWpujje7UF+I4cdKbkjAMKZVLRFGZQrlInGVcv3mT23fusOKJJxitFtm5Yxu7d+xgfHaGuelpgkKBYrWHIAyQRqAzFzRpkJ51WgVDFEUYA0r5xEnKwuISwlNUyhWL1nQucvt4l91V0f36g4SDv9zRVkbo7nNxgWzg5NiWlpZoNpssLS1RqZRRnqIVt2jFLUIvIAh8kiQl08apWxhSR40IA5/AWIR8cHCYfbt2s3XjGkrYxvHbY+NcuHqZVhpTrlYIA59iqUwSx8zNzrqqUBFYjubnVTWBk+A0y7nmDxoc4egsSZahlCIIAorO3GZ6dobzly7z8ssvsXXdOg7seZLvznzHmKvk9I+MgOeTpJo4yZDGUtragXl+POLR63yejAuRJwydpBoB0sg20JSRYYx1MtZS4BcLhOUydybu89Fnn6P8APHKIbavXkkQBkRJRhxbtSjldZo620pUjzqeLnBMCsutNzpDJylgLdaFUO01Sinr3NlMUm7cHeP9w4f5/aefcPXuXYJShd7BIVCKVpygPI8sTaktLlCfn2fDylW89cpr/PLN11ldDh2gYIUdsiyz1Btpuf3SGBaylC/OfMfvPvyQE9+eJhOKvmovpWKFNNW0koQ01RQCOyd0Yqk7SghrQ6/BpE5rO69mGNtUqI22dEk3b/Lm5TiK0BrKxRKeV0VJS+2ZGr/P0uI8UaNOb6nM+tVreOXgQQ7ufZIXnt7PE5s2UvZ9Gzy7IN9zFUQBmNyN2PU+kYfjXd4rlvdtk8lWK26vz1LA5PwCn31zmg+PfMqZixdpZBml3l7KPb3Umi2aUYwRuYKQR+IM0iTiB69qy/LKR82Vx7yupPUSiaKIIAzwg4AsTTvphwticvDLgof5c5BrG9hnNtGa1FhBjb5ymVWjKyj4AUkUt30vdJYrfBmEcg6jEpZaTUrNBX84XShidN1k6Z8r53js+MkDctNYXPaz4xKKoFyuZGlcqtVrlIMAzws6LoNIJ+Hm0IjMNpn19/ZSLpVsMP4IKkm+Eeqs07CZv27fCDzPGgRprDFFnLu/+Q5V1dItXDmiKn/UBHzweH7YsA93ZiAsV+j3AxZmZ/n865NMzM6BgF++9iqDYYjvKZbSlDDrZo135BqXhQ35DIYOV9L9oZ0UknJBoc51ll3jUpQl3L57m48++ojPPz/GzOISvaMrCcMirVbLmc1AywWxBU9yYM9e/u7dn/P6/n0MlYokRltr6ZzGIaQNioWVqbwzO8eJ707z3gcfcuKb0xSqPaxdswbl+URxQtOJ+Qd+SKFQsnziqGlLUkJZnWzj5APz+2S000jNyHsFPIfGWPAgQ0kPpYQtRUYxcatJEkeQpvSVSoysWc1Tu3fxzL59PPPUfrauGMbDZt+tJEPHCZ4SeIHvrrOt1Ahh9VI7CWL3/MsXEdfdLoQtlwGLccLU0hK//+wz/vl3v+PO5ASFapVKXz8oxVKzTjOKLKokJNpkzkpYdKLBHzzP7DUymUG75uL2guY2boS1Uk60RXB6CwVef/llXn7+eRCCkydP8c2pUxQKRQJPEcWxbcT0Ayu1Jrp13Xn4wXjUkbmF1PIFlW26TVOSKEJ6ikIQ0FOtkiYxvf39zM/O8t25c5x5Ygd7tj9BVcCWtat57dAh7kxMcPSrEyzMz4GnCMMSGEmSJWCczrsUhEFIlqXEcWxlu3yfkhBoNEtLNdLMLAvG/mwQ0F/QyB0586AcOshzs2Xddev1Op7n0d/fj0bTjJsWSfUttchkKWDl3OI4ITEZQeCjJJg4peD7bN2wkecPPsP6lSvJgJnYcOnGDS5euUwziRkeHKAYhvT1VC2ypjNrGpXzwH/guTwYkHePPPnIv8JikaBY4uTpM3x1/EveefE5Xtz/FFeuX+eDwx8yNjOFjmM8J/dqosRppf/wbTnPxdsUWmPalbo23112ghQjBBmaWqNB6PuMrl3D9P37nLtymXqjjhIQvPsLVvZU8TxF1Mos+k0Hi+0q9HYoal1ZaY7VWj655aRnWYqnPDxl5V+z1FI4lGdR3PmFGmfOnuOzzz7nq1PfQBiycv16giC0coDavl8zapE06vSXyzz71D7+/q/e5alVo2TGWCk/t5Do1DXbhpamMtFs8u2li/zj++/zwccfU49jVqxeTblSJc40tVqd1Gh8P6AYFEiShCSOEEikF+ArRZoltjGzi3usM+16TLS9TlJ1qo1OHCJXQvGUJIkiGrUlavNzkKWs6O3jyZ07ee7gQZ4/cIDdmzfS71nENwOSJLEUXleNkVI4tRg7x5DygXbbPLns0GbSzJBhCD1FJqBm4NjZ8/zz737HV9+dZr7epGdggFK1Fy1s8pOkKWGhgCe9dnJoHp+H/VmHXWsd4Of7FEoFWk3rLZJqg2dU218DV11KdP5M2luTQ7F5MzhKUSwWGRkcoBB46NQCPUpKUqycYyY0QlklLkFGrdFgIK6FZdUsG63njEnTn/rcf/KAPAwtNzwPFuNWiyyOhDTGN1nmJanVlFUq53PjfFKsRqXEBglSSIqFAoHv2+KwFIBqo8zQjZDrtlshrqsZd5OFVPi+5zp5hdPFTcmE5c8aKawEq+mirjxyve4KtvK92q1SnV/PmyzobOhd79VezNzLUZzge4qgWCQol1iq17h47QqffXWCkcEBntuxg4FKhcHhIVscdw0axulPKyldmYr2+S+j2+THICAMQ4IgsCWb1HLkMq3xgw7vdnZmhpmZGRYXF2k0mjTv36fejCgVC/T39yOB+fEJRJKwZfNGfvbG67zy4osUg4DEaLI4RgW+O0bArWMSGJ+Z4/OT3/D7jz7kzMVLlPr76R8cJiiWacYx9VZEkiT2GD3b6BcnCZk2FMICxhjiJLYIf26u4Rr4rKmElUoKAt8aZ2QZrVaLRGvKpTJoQ7O+yNL8AlGjSeh5rF+zmoNPPcX+fXs5sHs3a4YG6S2XMFjETacppCmhb/Vkc3TEYDcWK3XVpU/fnpm29JlmmlQb/CCwmuhYzdTr98c5duJLDn/yKXfvj+OXShT7e0HZKkEUx24z8131x+kBdz7gsbFi9yYKHfQm04ZWHBEUCgRBSKPZRJuMMPBRUhLVG0zPjiO15omtW3lm725WFwJu1FpcvHyVW7dvMzAyjFcqkQlb7UjiyBryGGNRBjsRH0LHH4WamK7j85WVlovTjCxOSHSGrxSVSpk4alEuV5ienuH6jRtcu36LpVpEfzWkr7eHA/ue4vT585y9eI5Go0F9cYnCUNEqIhhbshXaYDLLPbQVE/vpUkq8QgFtMjKd0Ww2yEv/udrS467xo77/Sx/aqRR5nm0oS7sC4NQpJqVJgnSGYFJZPePM2NezTJMmmQvsrG54kqWAplAo0qwtoWt1Vo0Ms2/3Lp7YuoW+coF6ppmYnOL23btMTE/TjCN836MYhFSLJZaCml0zXdCaHyvQVmWyP9BOJh4ViHfLOnaUM+zvN5tNisUi3vAw12/e4KuTX3Fo/162r1nD888+w/mL57k/NUGzVqPoecigYD/QJe45uvj4+KeTIEqE9TmANkVFO0m7/HiVEG3KpDGGRrOFQNA7OECWpcxOTnL97h0+/PRTysUir7/wPNtGhjFFHzJIUosedvXW2Wqy44MjhUuqtXOslK66nVqJX7/gRBUMJksdqixAWAfoubk5ZmdmqNWWyOIEIRWteoM0zaj29tBTKtJsWGWRShByYN8+Xn3heUZ7e9BA1LJ7jZTSHpNTOvGFYD5NuXLnLh9+/jlHv/qK+UaT3r4Bqj19pFrTbLWsU2jgE/hW0MAqwwo8365FSZKSOd8G4aI+LYylbwuBkh6B7znEVRO1rBNsT7mKFIJGvcbM/By1xUV0mjIyOMDunTvY/+Renj9wgE3r1zJcrRIKSaQhNhnCaDwhUb7M6c3tqFgoDyltfKPJ2vQUsN4UCCv3nKQZGksRC5RgptXiu4tX+Pizzzl9/gKLjRblnh6KlYrVVm/UASgUioRhwdI9U+sNIV1F4PuD8m7n2+/7vXw8vGJauiP4SlEICxRDmyDFUQzakClbwfeDAGMgiiIiJwMMVlghrw57UoBjP3ju/SyVy/ZMSZE/Nwbhnh2lFEJrGlFEkkSeL7OCMVppkf0fPyD/5P/7HwHazRUbdu9hw549lgdkjMj1aXPObd6h7GwPXGOXdSMrFAvtgNHKOy/Xa20j5Npx5ox5YHJIx2OD3p5+qqLCjJQ2O3Zd/9Jl2cY5DlqB/c5i/ENHjhI8alba5+oRRW0pSJ08mPADvFKJZivm5JlzKKmIkoRD+/czEIakaUYjiigVbLe5zjL7wEhD3gjXtml/YGFvq8x0ITzSNUvkSVHg+6xbu47XXnmVyvAKro9PcG9qmunZOZrz8yxOTuJJgdCap/bs4RdvvsHrTz/N6jAkMhqtbalTQtu1LHByVlOtFkfPnOW9jz7iyPEvWIpabN6+HeX51JKIVGu0JxEyQPoBGdByRi/KU4QFq8DQarYgs9q1OdUICUIqPE9aowIXDFieeUqr3mB+cgplDJVSiRX9fax+4gnWr1nDk09sZ+/OHWxcv57VPVVCINYZSabxpEIJEJ7VP3Wcl86m19W2qbVt1pF51zam3XxppK0SaKCWaW6MjfHx0aP8/sMPOX/lCgQBhXIZ5QW0IutI6ikfz/cx2pomCIzrI/jTAkCpPDJju+e9MEQpSZrGCAHFsIzE0Exi6vPzPLlrD++88SY7168nBi5evsTVGzdYXFpkYMUIfhjaLvdEkSQJutkkDKyNdW6O9ajxaLDFPnsWuRAI36emM+JWTOj7DFR7SFstioUiWaapz8xy7eYNq46ydSN9vmL9YC8H9u7m3KVzXLh6nUYUkcYRWqiOK53Jy8A24fY9v+vJAHCyqFlXSfQHjvxs/xWApP+/H1lmJcryQLUdKDr0LzeQ8jxbwYrj2FIJjaPSiVxzXJFmFvX1PA8/UPhSMj49g4pi9r3+DC+/+CwrR3rxsK6Pl65e4dbYXWKT2IAkDOjvrdJfrTI3Ow9atzWlHxyde9hRVMlR727qSjfqL12VLqdLxmlCEBYoFgrcuHKVU2fOcenOXV58Yjt7n9jOgb1PMjk1wezSElG9gW+dq8l9MOzn//Ah6UjFaYeS214/kfNIEK56p10jaZSm1JpNVBBSqlaZjyLOXLwAmSbLIHj1EGv7exBSUmvFeBp8ZT0qEBYHzte4HBxo03zcumfFxKTjAVvaijWSsb4HCAuu9fVU2LZ1C++8+SYbtm/j/sws49PTTExNsTA1hed7NOp1RkdGeGb/fn751pu88NQ+Sr5HmmYESjotdCfxqCRaSSLg4p27fHTsGB8f/4I7U9P0D49QKldoOoqK1gI/CAnCECGdeZV2vgqeD1oTp4lFwJXCKNFGyK28t00YZU6fdXriURwzdvcWOo4JnAP16o3rWbliBXt27mD/nj1s27SJjStWUJF2r0wMZBgwtrdNdXHUjat653NQItpqQfnMtYkmneRLCnyp8AXMNCOOfnuG995/n8+OH2euXrceH9Ue8C31ME4SS50NQpRQpElEmiSEYeDoWz9mz3ncDH70O+S/HUcRnucxNDRIX38/RgiWFpfIktTxy60oRxAE6Cyj0WgQu144Gxfa9TuXnFZuj1ZKUQgDlDEYp0XeBrVcrqHJNc8z20/QaoSejsrGaJXpnzwe/+kD8o//5/9p+QtCsOXAQYTy2kIyHd1Vp6UqwWQGpLDuWNI+AH7go1S3qojp+uoERN3IhVW9cNdcCZqNBnFsWLduLf29fSipSFoxi0tL1vXR962LU9oxfGhzlx55hqb9+rLkwOTd93RQcvKFEVdaNHRnlMr3ieOYqNmkUCxQLQ9AkjAzN8enx7+gFUUAvPDUU5T8oB1gCNxn2O4NF4hLxANOgd2d8t2vCU+4oKRjjFMMQ3Zu3c7mrds5+PLLXLx+g4tXr/Lt6e+4du06V65cwQBPbN3Ku6+9xrtvvsma/n6HJCd40iKxGOdE5oL/icUlTpw5x+8/OcLJM2eYb9TpHR6mZ2iIhVqN+cVFK2UYBihXeoqTjhmS5/so37d33KHMmU7bVRPp1FLA0i7ilit/G4MvJCoMyep1eopFtm3ayLbNm3l631Ns37KVbatW0h8GbdWSBKdxqjVeoWDnYvsqmXaiuGxoA65JxGop2ag50xojrfJLipXdunHvPke//JIPjhzh7OXLJMDo0LBtpkwS4ihB+T5+ULCltSxxAbqH5zb/djNk1xPRPTqvi/Yr2tjStVQeBuvMarBNSwqIWxEi0wz39/PiwQO8/srL9PX0cOnuPb448SWTU1MUS2Vb/jb2vJSvkK5py4CTZHTPUFfi182FfbCSJFxQYTKNMZbHLoUgiiKKnk9fpUp9aRElLKUNz2N6dpZz58+zaqiPwZEhPGDn5s289tLLpJnm4rXrRPU6MiigvAAtRbuqlWW28VS5JrBMZ9YxFVuRE+pB2lHnoB9aC9rn1anW/aUH5XnQmiTJMmpI/rrv+7bPQKk2ApaaFOnZJElJH+NUQtLMUtEqlTKBJ2kuLWLiFiuHh3nx2WfYt3u3pUsB07Uap8+dZXxiglKlQry4iO8pBnt76S2V8AXtDfvHnk/39/nPUnQC9xyBNoBQyvZmSMG9iUmOn/qGNaOjjPT28tKzzzE1M8vxr75koRWB9PELRRDWVfqxVLTuBzwvurYfbSsqK3B0TaMxxqnBtOelrUKFYUCapszMz1MuFChWKihPMT85yekL50EIwsDjtRdfZKS/F41wyivWedIKIdAGJPLjsYFiR/JU5AokLlAWYDnp0qo3aSPwhGB0ZIie/l627d7B5MIi5y9f4fiXX3H+wgWuXLtGfWEBD8POTRt59/XXObR/PysqZeZrdVKV0VN0vQDaYKRFSetpxt3ZWT778ks+/vxzbo9PUOztY2T1GpI4YXF+wQIAnk+pENoeBZdEAtaLQzrHbGF/Vp7qcnR2XhhGkyQxUWQVTxR27VK+R61VQ2nD6hXDbNm8maf27mX71q3s2raNlX19bYGK1N1bAfiyI/uXg4yi+97nfGmElfvLJ4E2loponKqc8+dIgYXMcPy7s/zjb3/Lkc8/Z2J2lqHRlZR6qqgwJEoz4iQDoToeJ2kKxuCJDtxkWHYgj56j3XP1xyyCDgit1WoM9Pezbu0aypUq0zOzRK5iXiwWLcXWJUFJktBsNtvPsqsfYKsc1u01Z+ta8KVTrSPfc8j7fky7/yLD0IxjkrjlqzQuaq3VvwJj5V9fh9wIgZHCGCliI0TSHUjkF8S435O+snrQ0qBNhnBuYblGu3jMxMg5SB2NWJspKiGo12tkOqHaU2XN2jU0m00mxidI45gksBQI3/Msyp5lyxbtDua9POzpoN0dHVgw1h2LjqGIyJ8q00kk2iYxLsDyfN/x/qxQXVgs4jUbzMzNceToMcis8sTLe59kuFols/GfFbZ3XOCOxq5FJ3JpPtHFcVgWlBtjy0TOXUw4y2KD7U5e1dtHaccOnti0iad37ebKtauc+e4McRTz5O7dvPzss4z29mF0RpxEhL7fdrfUxpbQPFc2unlvjN++/z6ff3GCRpqwaetWvFKJ++PjJNrgBQHS8zBYVNtoiwYXiyVXvYAkyfWjyx0ZxSxtI1lpmrC4MM/83CythTkEUO7tZ3BoiI1r17LxuWfZvnkzG1avZu3KlaweHqFcLFL2fTLyQM2Wu4pBgJUZtCZVmvw60vUod08+2fHDyc0NhHU8lY62lQE3Jyb44MgRPjxyhKs3blKo9tBTLKERpElqOZF+gJQKnWQkWdRGFAM/QBiIk3hZA3Jn5i07oK4/7VxsRRFSKao9PaRZSr3RoBCE+EoRNVtMj9+n6Hns37Ob5/bvZc3QAD5wa2yCk99+S61RZ2B4COF5lkbkPqEQBu3Pi6PYFWs6AWr3nw+OziJqNX89AYVqyQYAaULB96kWS4TKnrsUkkp/P60k4eLVKzz95E4YGSIF1q5ezcGn9nP58hWuXbtO1GhQ8C0CZohsUCAFJtXu8xL3PDi6kUua202JxkJO3xcjmQfnwUO/8Zc3cinbZrMJWDnAvNpgC3iircucObfYQARIzypE6Myi2Ep5+L5CZhbta9WWuHfrJqtHhnjn9dd5atcOhgJFA6gDd+6P8+25s4zPTFEql5lfXMRoTSEI8YS0lRvXf/Iwh9xtzcYsWyOhg0x2/9x+neWKMsqzVbQ0ywjCkFYUceHiBe7t2smmvU/yzP6nuX1/jHPnzjG/VEdHMUGpbK3XuyvjubsbnX3HPLADaa2tr6GSKCEQJp+3nYQdV6XM9yLft/bjUSuyQI/xKZbLDIyM0Jib58ylixhtmF9Y4tevvMS2tasx+CRZ6vjpdt3pNqZ7WK2mC7UX1oEzf87bplFKWhUubQgCn6EgoFqusKKvj23r13Nr7D6nTp9mbOweQ0NDPHtgPwf37qNaKtFMM8qFkMA13hptEU/fNTPWG3WOf/klh498ytUbNylVKhT7+mg0mxhtCHzbLCgwWGp24kwJZTvhSJMYJRU9VZuwWOWu1M0PWzWpLTVYmJujMTePTlPCUon+3l7Wjo6y66WX2bJhPWtXrmTbps1sWL2GSrFIT7FopZu1vUfKVeaF4JEryYNc/Rzsk8IpCuRAC9I+P9JWxgNgrFbn1PlL/Jd/eY8jRz8nAYZXrbaV2DAgNcbKSTpZR6M1zShGJynFIMArhG1viB8WYHfvR/aEculJIfJmZdMOiPOYyLOsCRbm56mUS4yMrKBSqbK0VKfVaBJHEX19vVZpLUucckzarpyBNX8KlBUczp0486PJmzgznUGaYHSG4IHrmoO4WpMlCTpNldTGR2th9I9L4P+U8a8dkAupM6PSRCmjVyijh3DmJnkTpg207WTKjCHNUpTvEZaKbSQr3zrzC51llsfrK5/UQKPRIE1S0NoKWErb1W1cVGy0YX52DrF2A9u2bGN6Yoqxu3fxlcJT0ipPaBuMd+TbumficjyyE6DRPg+r2uK4TO7XH0lT6ULMs0zbY5QSIyAxBpOmeMUSxTRjfnqaT098xVK9Sb3e4O0XX6CvVCT0Fca1duisI6S/fIF88BweNToSjW3dcCkpSUW5VEaWymzs7WXHxg3s37WLuNlizapVjA4OEmCVWwROucS9m5SKVpoyOTvDuSvX+OcPP+TDjz9mbGaG4VWrKBZKJEawsLCIVwgol602r9YG4xRAhBAYZdUVkiQmjROUULaSEcdWGSQvY/m2BF7xPSpDQ6jhYQYGBli9ciVrV69m28aNbN+8iY3r1tFbKlPFPgR5uUbbzkLHdRdd3LzcYCM3W5DWSTa/cvnGhG02MbnmtbSGDYEQxMDkUo0rd+/yhyNH+PToUS5du46Wiv6eHvywQDOK2giZUp0u+SzN2nKH9li6S+jLETuwU6+9FD1QZrRJsTVNSuKIJI7p6etHas3Swjxxs8mmTZt4/dAhntuzhwowEWd8d/kS5y9fJtIZA6OjGCVpZilRmuKHoU0UsCXHNEnxlXW4ezCwefz0M3lnp6MEaTAZ0mh8ISiHIX2VMgprurFyxQoarSbHvv6S/fv3snvbFjTQD+xcu4Y3X3yJqYkpvjh1iqZUhOUyYWBL3Gma4iuFFobYydVZXeuOo67vBxitabVaIM0jAo5/G9832sF3V9CbewTkQ2ttTamEDbYznYKxSiVRlJHGMThVlgKCtNWktbhISUle2L+fv/rZO2xctdK+N3Dj/iSnvjvD9du3aUQR/f09GCFQQtFbrhIqH2k6FEroBh47QE73Bg2PlzFtGwTZX+68LiVxmpIlCYNDQxC1OP7FFzy5fRtP732SIeD5XXu4/dJL/OaDD7k1PkmlWkX4qkM3xK5HBm0pcKKjTr682di0A9Lcc84aDdCGzw3YEr2rWNmKlEIpj0wnJFlGYKyoAAYmxsY4df4ctVZEkiW8+8arbFyxgqrvk1pLHDIX9LcrBNhKYOZ6B3LZwPyqSKE6O6dbk6Q7LoxBGduYWfAUfT1VVvVU2b11M7u2bGZqcpLBoSHWjAzTGwZEaUaiNUXfQxisYpiyyHyt2eTe5CSffHGCf/r9+3xx+jSxlKzo67XmdYs1PKUIPM8m2mh0lrSDTkuLAJ1mxFFk+xqCwHKVo5YDt3CmPj4FISn29CF7+uirVhkZGmLlyAo2rVvLjm1b2LxxPb3lMsPFEgXpXF5xHiXa3lslVRvJzcf3rpr5XHMVWK0h0xY59h2dsWYM16dn+fzLk3x67BifHj/O1MICq9etp9zTS5SmpAYSnaGNU6ATEp2mrilWOxWxP91/IcusdGHgB2jjnJOl7MQI2vLFPc8nTRJazQaFIGDNqtVsXL+e8YlJxsbGMEYTBoHtl8C0VcJacUS92SRKYns52nGOWJa82CTUp1wu2XUpNzgyrqqSMwuwNOUYG0fGzWag0qQksuy/OYRcAEqkWeo1W75SarNM0nXWWMFld3nGJARI22Gs4xjP86lUq3iBfaC7yCkAxHFEpsEv+yRRQm1hkaQVtZ05c81mbTTlShmTBFy9fJXh/iFefvllbt+8xcULFyg4Y5y41SIzpm39bbrqRW0kzyx/TeQBf+aCM2H56B1kMP9Ot1/pZMN5Kdfar2utCQvWiXRpaYlyscjQypVUenqYHR/nyLHjllZg4LUXn2O101AFW07MM9FlpS3R4dt3o6h5dmjcYt9Gy92/MzhOW/7+UtJfKtO7aTO4TUJgu7itvJTXXizypKRWq3PmzBn+87+8x4dHj7IUJfT39VEulpifmSExhqLvWy6pzuzna6wOOBqdZrSiDJ0kZLFtBjNakyUpjdoSaRTheYpCIWSgv5+e/n7Wr1nDhvXrWLd2LZs3bGTF8AiDAwNUigVCAZ6w0pqJEG1Kk8Qip8Itmp3TfgBBcyVM2mYEpn3M9tpb84goSVC+Z1VegNl6nW8vXuT3H3/MkS+OM7u4RKmvj0pvL1pImkmCJqfB2Kbd/P4FvpWJM9pKEwLtpCtvOGw3mCGQRnYF6l0IrhD4YQhC0Gw2SZPE2oFLQRpFZHHEioEBntyxg707dzE6MEAtTblw5TIXr16hFjXB9zFSIH0P4eSi8gUw9xHoBK9teK89jOj6ATpNny4g9z2F7ynrsJm63ogswxeS3nIFhSCJIoqlMkuzs9y/dYvvzl/g2f1PM9rfg1aKYqHAK8+/wJ279zh3/jwLjQZRo06xUiUlJY4jVKHQzlOlyjWlTfu6K2V1+LUxSOOsuruOu/29eMRrD//VX9zIqSpBELQ52MYYmwyKjoSg7/vtC5WmmdUOlgqpDFo4XqeSBEIyM7WApzP27djJoYMH2b5xo1Vlwl77qzevc/bSRSKjCUtFq9KiwfesSo+PNSNrVz5YHnTngXoehHS7cz5odNQeXdTB9ktaE8cxWZowOjREY36OS99d4puz57g2Ocn6kRE2btjAL975GZcvX+Pa9VskjSaqJB1PWZIZY+kSRuetQeTSucYehEMAczMtjck6e4DVa+8claRT5cmcDKGSAqUCjLHOvKHvERSLDK9aRatW49b4Pf7hn/+JialJ/k9/97c8vXEDmjZpz7pAi877am2dj3PBgM51WV5LtB4gzi5eKqTM6aW5UrZ9f98YNq1cwcbREXe+lvLneQrfgVBZZjnfwrfyfBNTk3z40WH+19/+jjNXLhPFCX0jKyDNaC7VME7Cz4iOFHGWZE4EQtseptRKNerUSm62soylxQXiZgOhFL7nUa1WqfT2sm71KOvXrGXjunVs3biJ0ZERVgwP01MpUQg8GyBjaZtR2+8UhBEESi0zjeteQLqnWKepPN9bc4nLNkuS1KF7QtiA//7cIh9+9jn//Pvfc+X6dZppwqp16ylVe6yueZo69TOntGUMaZogjA1eBZ5VLMsr7jy8vj3isPMjBpyBl5QEJZ8khTiLnGmfAie+YRWvAmqLCywsLLBh3Tqe3LOHgYEBTp76hiuXLjM4ZD0l0iRtyxeHYYHm0iL1Wo1avU6Kc8rGgDCOXgSZyRBCEQQ+lUqZMAjsPi1zyqtur/FC2EbeSCqarRZRs+mJNC2gteS/sYAcwLgsXQhjigLCh6WjckaH5fEYoxGexAs8hJKdyUzXAmg632vXuW/LEctJBZnOKBaLiCDg1s2bXL9+nUMvv8xT+/YyMzXFt6dPk6QJK1etwkhB6nhveTbfdZTtyZkH5jkP3soeKUdXwenE2gP8Yzihy0NsM6lrHjRK0YhjpFKUSmV6B4eZTif46rszZDpjbmmBV557lrUrVtAbBHhSkAppJYJSY1VpuvhodC2Ry86jq3QjH+DjL0+C8jKZQ3DIBZYc2uHeMC/pSWE3FhUE9A8MsG7tOqJMgx+A77NYr9uN20gazQZJGnchKjZr96TEV4qiH1AolfF9HyUsH6y3t4feapXQ9+itVhgZHGSwf4DVo6OMDg8x0NtHf7VKMfApiM5c6BjbGaeB0ulieOCu2EpJmtqeBqXIG5oEHWRaOutisJxsbQx+6FsaSJpya3qaT78+yeFjx/j2/DnGZ2cpVqoUqxWk5xHFiW1Gsh6++e3pOorO3TOO8tSuvLj51S3LZh1pTefftN/XJVlJQhLH9FarlAsh9cUFZsfHkVnGgWee4Y1Dr7B13VpKwNhSjZPffsvFy5fB9/CLBbSAJE0cGqYw2rSrUgKBJ10jX9eVfKjgZx5+li2CKtsvWLqIVVsKlLVK94QAx/X2igVEGHDx6hW+OfMdrz73DAPFIgUp6S2FvHzwAHfvjfHJV19xZ2qSTGcEhQKlUtFKimEX7lRnpLHVkc5VQRYWlzDGOdi6ZLVNG3go0jYPnMkDN/AvcHQHut2NkVmWPeyybEBIQbVSIdUpU5OTZAgK5QrVngpZK2Z6YoLa7Cxb16zmhf372b9jJ0NB2KYwLsUxN+7d4ebd2yRZSqFcJgiKkGSYNKNUKCK6kLGf8vYY4wxvPEWcpkRZSlitcOPuHY4eP87AoUOs7e9n84YNvPbKK9yfnOLKrVuIZpOhNauJsow0TTDGWKqPEGSRlaMTQhI4znQcRShoOy92XU47HpUX5xuXsK9YWqPVUY9cgEbgYQKfRrNJMj/H12ftfnP/xRfZt2sXq3t7bNVPCaIoJsoywtCqR4UuGO/++AdHpwLh+Niu0cqCCV1hfBewlB+6M53ufImOQlsrjomSFM/3GBoeZHOykXqWEVQqxAbqrQgTtagnMTXTUdkB2/fiKWXVODyfMCy3vRQ8peip7qCnp0LgB/RUywz29TPY38+qkVFGBgcZGehnuL+XSrFISXZ20Xyvyc9VtM90+b76iEnUuZGye21x10fYqrE2tipbktaEb7YZ8+2lS3x24kuOf/01l2/cIAPKfX0EpRKtzFYC3C7Svk+d+dMN1+XUrY5Kzw8b9j3CMEQIQavVBIxTsYEktpSYwPcJfI8sTVhcWCBuNtn5xBNs27KV+bl5ZqZnnCFS1pbD1TjDP5PSiiLbfJkkXZHNww+2AXJtdqVkxwq36ytf09sUtCzDZFoKjRTaCPEjXNv/1PG/S0CudIZQ3fpSXb/g/nOVOJu5ODK+16UJ3j2NpJTI/GrmGqSZKwW5DF67yS0dDz3LMiYmxrly+TL7n3qKV195hfPnzzM7M8OqVatshq81rTi2//Zx5Wp3j/KO9jww067B4uEZ/Pg8U0mF8QQmsycvgCAMiVotFut1hJAUqlWGPY/7d25z4vR3zC8tcX9ygkPPP8+29etZOTiIJ6wVs9Ya/6EjEJ0EphvF7DrHZTzJZQF5HuDldrrLH932d8LdR6PJREYQBqxft463Xn+D7Tt2stRsUWtFNOKYpVrN0jQwLCwt0mg02gmEtSVWFMKQUqFApVymp1KhWCwS+j6lYpE1q1YzMjxkEYtKmb5ymUoYUpJy2eQ2XV+dIzUPPpPL7ml7uJKWxHHzTOfatVFpV57X2DKukVZvd9EYzt28yecnvuT9jz/m3OVLxMZQ6u2l0tuHcAF7mi/V3dd+WWxnHnjdziOL8nU0840zDdKu1wAsGtFdWs/5pdoYizR5itriIkmrxfqVK3n5uec49Oyz9BdDasD1O3c4ceoUN+/dpdzXi18oWOWbKAJh6QVZmpGkiV30pLLc9x/TNGes+oJoG33Z+WicrrxEUPB8kqBgm/eyhDiJKFUrDIyMcPnGNY4cO8qWDRsY3LieXDdlz5bNmL/5a1pZyuThw9Tm5+gZ6Ke3t4+FJCLLMrzAJ0sy29wqcI3kzqrd0EaPcl+Efxs/bHRLAraDJpcsdhuu5cEUODQ90tTqdbwwpMe3635taYmF6SmGqxWe2buHV597ji1r1yKAEJiNIi7euMGFK1eZmJ7GSEmxYh2OcWo/xUKRLE4e4Iz/dOfu+5aTW280SLVh7fr1TExN8cFHh9mzdRtr+/spex5vHjrEUq3Of/yHf+D+whxRs04mXdMknSpYnqwK96zrLr1xk9PnHgqaHtiD3KlbKpnVyZZSYoRCoOwzkCT4vodXKBBojdSGu9Mz3H7/D9wdu8/E3DxP797FljVrKHi2bynVGl9bHrD0HhNmGqy5DoYu9g15dc+CQV0HCXRTbtoB07JfsWufkLLNZ69WKjy5Zw99A4PMLS6y1GrRyjIWGy3mazUarSa1eo04brUXWekAnkIQEPoBpVKJcqlMMSy4vSZk9apVjI6MWAffSoXeapVKsUBZSnweHVzn8QyY9n6TwyvLg8fue2SWf9+dvLSfp67b6fCxujHcmpzk3JXrvH/4Y45+eYLp+Xm8YoG+QWssGGeaZrOFMcJWtPP3eCDEyXf6Tk/cjxv5YQdBgDGaxcU6QRBQKlkfkySOHBJfRCnJ0uIiRmesWLGC/fufor+/j+NffMH9+2OUSkXANnwKKa2+u6sEx3FMs9UkdfLDD13L9tW2x9P23ZCqLTDQfr7orFltkNUgRJZJkWkhHqPK9Occ/+pNnX6SELZaQksZGGP87r/LA798oTauE155kiD07QLHw2tO2zWLDkKepbYRSwrXd65tEh63IoxOGRwaQiD59ptv2bppM1s2b2b3E0+QRi3qS0uUMOB5pEkMwsofma5jsx/m8GzjZKYMCGUpC11J/zK618OTu/NASilt05FJrFmJ1gS50kSrxfziIoHnUyoUWLVuPc3aIhdvXqeVtmgmEdNPPsXBPXtYNThAMfAwRrUdENsJjK3hODjeBs9Wp9adkjumTmIukRjoCq6+D1wy7kRzGo8GSoUCa1auZGRoiCd37yIxmlgbkkwTxRmptshBK2rZRbLrGkkXlPtKEQYhxTAg8BWe46H5vkWhpUPSlZLLusLzgxLd96C9mD0iI3zwFQ1CKKsFi8GkmUWClbNjbvdAZG3VmxwdXgJOnjvPb/7wIV+eOsnVO7cxvk9/b6/VfcWWDVPXuGZEh6bSvpYdIMseXTfSRRfC1F5a80DHoswi16Z380BjEErgC8/KG9brxIsLxI0Go0PD7Nu9h11bt7KiGAJwZ26Oa7ducvPObZaaDYbWrEYFAXGSoI1VTPA9jzRNbHArBUbYcvDjrqx54ByWDUn73xshyQyk2rYYh76PLhXxlQLHcwzCkEK5xK2rVzl99gxXrl1j48gwI+USGVAJfHZsWs/BPbs5d+UKF69fo1Wv2+YgT5K59NIvhKjMatu34haBH9DX29cuwQtDm/f40OiKebp/48dvY/9tjQcbjqGz+YGrgMncadCCL/V6g0yn9PX0WITb81icnWVhZppASXZtf4KXnn2WXVs2Uw1DWk6mbW5+nu/OnOHytess1huU+/vxgwJ5U6HyPAqFAlF3MvCop7/r+LrP4087f/tvrb9DQF9vDzeuXOHMxQtcuHGdHdu3EyrJxqEBnnvmaa7euM5Hx44ydX+MvuFhStUqaaqJoxZxZuz6VwzQ2IbuzGRW3agdtHZCP4e72HNi+fl29ldhXXqlQXqWKtPpQVKo0LP+AlFMvdUiSSzy2ohjbt8b4+0XX+TpbVuoBD6p8x1ItXYO2qrDPc43jLwvyBikpxCedPdHkK/GeSDYvWu1d69H3Ib8XAGM1gRBwPDAAH09PWzdvJkky0iNtr1lsaaVWtO4VtQkiqNOdG8spceTEk95BL5P6AeuyuHhKWHpPM4jwVNuD3LAz0M5UNeRqwfuR04jMu3f6Pr3eQ+NELRVuhw+kTmDJeH0+oW01zg3bbp2d4w/HPuCL0+d4uzFCyy1WhR7qoTlMijlqi4Zls60DEIjT4q6D0bz+DX8+17vwqusL4gTx5BSOBfOBDCUikUKoeWON2o1+np62LN7F5s3b2ZhYZGzZ84wPj5BpVql4JD2JEnIjMYPfcKCbRKPWtGygDwXB7GNuR3cVwhLafE8a4hiHD0xj1kMrgpqnLO0vRcCnSm0Bt0tMfnTjH/NgNwAXNy4kcqBA2LPnTulMI4Lj/1tYfUmTZbhez6lYslKCcFD08S6aXY4f3Eco7MUibVU7zb1yJxIZ1//AI2lJU6ePMmzBw6wY/t23nj9dWq1Jb45fZoRAT0DA67J3bSjiPYi5/h7aOGaIJ3upXFW6qaLevADL0/sqClhENCKIssTLzj5wEKBRr1BrDMCoFQqgRLUWg1uT07y+yNHuHT1Orfu3OGZp/azb/Mmhsul9rtrsCYb2toZ2xIEj3zCljUISvXQ33dkgrrvxYNv1NkkPCkJAw+cXfbys+6MvPT8qCHpJGvfN6yLa+7W6dQHpATh0ZkGnQf0j261gs4iiS3vKk+htSGJEoRSCGWbJD1Euzn05vQ0J8+e5eOjxzj65VeMT00ig4ChoSHCUonEGJrNBtbd2aOjgPNw4bD7UB4+PoeU6wyL4bvr5dDmHD3SWC5d7h7n+R7lSoX5qUmaCwv0lSu88OxzvPvWW+zZugUFNqE4c4aPPj7M5OwMxWoFvxBaB7lM22uRb7xGIIwLsB7g237fpe0+12UVCiGcnrEtTwJtk6jAU5BlpLbSZhFuCWOTE5z85ht2rl3Diu3b2u/XF4a8fPAZ5hotgsMfcunWDSbuj1Hu7aVUKhIlCVlmn2nPUzYISlM8z6rctKv7/zZ+1Og23VnmeeAqnTJXHnJ0FqM1zWaDIPAYHR4mA2ZnZ5kcH6eqPPY/uYe/evtNXnv2GUZ6qpjUlqwLvs/t8fscO3GCW3fuIJRHEFoJwSiKwfMolcsUSyWSZsvOp0cE3n/uc9c610LGmoGFIXg+03MLfHr0C9avXM1z+/cRAE+sWcsvf/Yzphbm+fDzIzSXlqx5mx+SYPc1tMYLLMhSazbIjKZcKiK1BQp+zCQVQiC07fkwyjZmep5tctbGeXBIKxOrbWaPHxZZrNX4+uw57k9Msbi0yNTiczy1YwejfX2U3DObmtxp28rNths8hQAp242l7kjau0leUftxu2Znv9JYMQNPehR9/3v/Xeq+ll0TOvvMD9lrwGm+a2c41j6b7uy8kzB0J4B/dHV0aEy7WTc/RqXsNRTWEVQCE60Wl27f5qPPj/PRp0e5cecWcZbSNzSIF1pKVyuO0cLuX6IdEz0OHsyV7h59XD/mqUkSW5EqFCwS3mo1SeKYoktQm40GU5OTzM/N8vzzz/P2W29SLpU4efIUN27eJM00vWvW4PsBcZqSZCkGTSCsrKQ2hiiyyWK7Oy+/Zor2PcH96TlHZuUpjLA9C7QrDg8nKWTaI8kCskyS/rcQkPf12T+bTYgic3vnDhae3CPXLi6Ui0lS4gGOGNAOmozGWaf7lAtFixbTdbHyHFPKNu85TVOiKLIamghnLJSn0MbKAwpBEIQsxnPMTc1w+dJlnj14kINPP82dW7c4/e23RI0Gulql6PskOUrXLh3RLh3axgDdDszbmaahne93fbwdYvnDmS/ecRzhBQFhoYBMUuI4IWo1rcuW70OpSJZqMm2oNVv4nmT1hg0szE5zd3yCO3fvMTE+wfj4JNHrb3Jw75MUpLXMFUCSWi6u57tud90FfFstufbx5yiSsyJ74B49LDj5OGQwV+1KHxP8Pvjvvs+CxVU8AZxUlu7q2DaOVpA5dRa7gSlhExrpuQTJLAv9Hnp/6DrVvMKB1TQXSiHde+nEJn62Q95a2ifAXKPO5Nwsnxw7zoeffMr5a9dYaDQIKhUGBgep9PbSjFrU6nVakbXN9qRyklWm86EPXqD2wZnlCIyw24hVjMiQ2E75PEnNEUKL4ueBu0ahKHgKE8d4xvDE5s28/vKLvPjcAQaFYDpNGZue4cgXX/DZF1/gVSoMDw2SGk0UJ6SpNc4QwjrTCSy1Q3lemyv8YHd+nm48bkHXYPmjwgUMroKTz0flgm/fJXZt2SsDQ0MjeMZw+tw59u7Yxbbt2yhii0Gt2LBp9SjvvvE6SkHrN+9x7toVSuUiXiEkiq3DqxAKzw8w2CpIs9VECeWupUNSlu1S3enogzfq30Z3QJ7/nKusdP+Z01i0tgmj55pyFxYWqM3OQtxix+4n+fXbb/Pm88+xsq/XosSZpRmNLS5w5tJlzl2+Qq0VUekfIAgKxFFCq9EgCIv09/VSCAMWhCHVqZ1jOT2qG4D4Mw0LsFknRSmtBGIziqj29dKSkq++PcWGtWvZvHU7frVIuVLmuYMHuXb7Jjdv3WBmcZHG/CLVvj4KyiP1JTrVJEmK9FQ7MMqb9ds8364jeKA28fC9EflxGpSxilIexlqtZ51Wfj8IKIZFCmFIrVBgbnKKm2NjJJ9+yr2xMW4/e5AX9j/FhpWrGKpUMEph0sw6WxqNn6+/BhsM5ofzwGKwrJL7A4cQtNe1/IUM7frPoG1g9MC9MdAG90TXV/eh5dxvnbnGWmkNy8BWJm0DsLGAjXCqXFLmfnwdqDgHgR4V5nSfC3S44hpLv83VgKSTgXaN5i0M9bhFI4756rszfPjpMb449Q13xsfRQtA/NEjP0BBxmlCr1WkliZMP9TBSd8qvD8UknV3oTx2dOodt0lZKUCqWSOKIer2OBOe67jGxMM/83AylYoH9+/Zy8OABzp2/wNdff02mMyrVHoqlkvUhMJ01WGtDkqSkaUrqQNhUGwJpr7dVTbGJX/dU8zyPMAjwfC+/bQ78yW+4rdTYdQnIMl8kaUFkmRL/TTR1/sM/2D9dgMT+/ZAkkigqgvHbC4OwS4hVnxFt1y2dZYSeR6log9I2Qt75nw3SnUFLmqVEUUyaavc8iPaio90Do5RFTgxQ7qly+9Ytzp85yy/f/QUH9+/n+NGjXLt1k5mpKdZt3EiUpswtLlrU3pU1tNB4WI6gVJaPhBZY0pF08eHyad1BALsyZfe8GiHaPOTU2Q2HYeB0tVME1rzH9yVZpllcXEQIzfDIEJX+foyBxvwiY1PTfHLsGDOzs9y6c4tdT2xn98YNDBYLeEW/HdBamSTdlncUotNIqoR8OO7oCsgf/8A+vJB2VdweG7y3Q5k8kRGPXrzy9zBYgRPp5J3a25CwJSkjcvtcuhBy9y7dH/iY8WBgLoRAOn14cJRUIQgKge1rcHPs1sQkn3/9NV9+8w1fnT7NxOwcmZT0DQ8TFgogFbMLCzRbLcu59H2nNS6s5KVDjoT440KB3ZUae+1wFAFcEG5RKmNSZ8wEWqcINOVSCU8JavNzmCRm7YoVPPPUfnZv2UrZ0X3mW00uXLvCucuXmJyZYf3QEIVS2Tbhxond5JxefJqlbRRMyDzpeeCeL3sWHrgBwl1sY5MGIbBKHA5BBUtFE1hDkyAMQCkMglYUE0UR/YMD6GaLqzdvcuyrr9i2cSN7Nm+gUghJsoSQgHVDfbx96GWm5maYWZhjaWGBVqtFudIDQWBdcqMIpCLwA1tpM5rQ92k3dYrOuS27R50p+NA9+ksd3U3G5gGkVGu7weZzJW9C7uvpJfQ95mdmmbh/H91qsW39Bt58+RCvvfgia1eMYLDSdqVikUKxyDffnear06eZXphH+UXK5R5QilbUIoojisUCPT29BIXQBQlWYUSK/PnpKL60lai617s/MVgXbqPXmbZ6/dpQLFfwpeLujeucOnuWF2/coLp9K4Ohj5RwcN8+7o/f58NPPuHGnbtIA31DQ5RLIfPztsdGBT6FMMQIQxon9vH5AZp5eVzoDs5x0Z2EoeOi54hilv7/2PuvJ8uOLM0X+7n7VkeGzshIrRNIIKFVQRdEoVQLDi+N5MuY8ZFvNJqRL2NGmz+DNP4BY8PLrjvd1V3VVSigoLXKREqk1hEZOuKordz54L73OScyEqK60MY7NhsWyDgnjtjCt/ta3/rW91l6gxBWkg4l6aUpfhgxNbONuN1itd3mk6+OcevWTS5fvswTDz/CTx56iF1bpgg8hVbSUlhEsa7Tn8DvPFuljfnw7m+ypmw4JrsOKIqQUmzyws2m/cF7eLMloVy3FPR9CPrjQypljXkG3mFwYcAd33nn+ln2yw383Qbl/V6gXINQyirMDaDa15eW+PLUSU5+c46PvzzG2YtXWO/1qI2MEEQRXhiw3mqXDteBA/UEgiROLB/7DgfiDWdjU/Tk+98LAmcC5Zx60yQlixPGxkapVCLa7Tary8sEvs+DDz7A448+zES9xoljx/n61ElGx8ap1etkOi8N+iwn3eZAvV6MMVZ+Mk+tNLAIvCE+uHBrvoWtLGgUBEGpqGVPsB05RphyDS3mBLT2hckr0uRSmP8eEPKf/ezO5zodjzyvD6WnQ6ifK1s5+aGwElGrVAhdQ+YdQ0L2cfM0y+glPVKdOqTNZrOFTrQRfVpDpVqlGoZcuXKFt996i6cee5yHjz7I/+Zv/5b/8j//V85fvszk1CR4Ct8hrJk25LnNwAqTmHKhMcZm5GXJ/ttu9/JoXTO1IAgjtNM9DnyfKAjInHNYkqSEoXBILyjfI8tTVtfXqddqjE5uoVFrsjo/z9Vbt7g1N8fFa9d4+MEHufX0U9x/+BBTY2M0nculkpSqIMbJ9RWd157n9Z25zKCk1/dHLspL497zLeEY5QtchjokyCrufE9f6WITTZRiotz0C74Nn918MwVfwZP9HFAU8krQSlNuLq9wc2GBTz7/kvc++ogTZ84wt7xE1GgyOjFKfWQUI6Dd6dDudChkDAMnP6hzXaqTiIHj/X5IxeA5EHb8SWtLbRFk65YplSy59gpDr9ViZWGeXVumefXZF3jhqSfZv3NbSVX55uIV/vT2O1y8cZ36xARhtWqrOHECxrnWCVtKz3Ntx4ywpgu2aavfnrUxARu8IkPnGtc8O6AoIBzaX3Dro6hCrd6AagUcpzBNM4LmCGluWGm1+Ojzz9m+dZqxsSZHts2glOVf1jyP+2Zm+NuXXiLNUt764H2u3LqFLz3CahVfKtI8tQo+SmGcesxm+/o/th++DTZP5WaY0qCkQglB5PvE3Q7zc7OYLOW+A/t59cUX+bufvsjhrVuQQDfLbJAHLKyv8dYHH/LJsWNo5VFpNFB+YG3A4wQyQ61SZXSkSSUKkcLYxFQwgJv+OFe3aL6zqhAarSEKQquQogIuXL7Km++8w0i9wvi+vSjggf370S+/Qm+9TXu9zeraOl0vpDHmE/gBmbZW5hUHEPTSYp37fkSP4khzlwAVDZg612XfhxKyL/+HQQqNJidNUwI/oFKtEgY+68D68hKnL1xieXWdK9dvcWt+gcceeoi927cz1WwQOlm/jXPZoMtpeb7+gvWlSCCGK7gbu4PcLLRhERpcme72zf3g/k4Rg0IueDC4Hvx2gQNpf8CxYCz9FQBl3ZSFEmgBnSxlYb3FUrvNF19/zXsffcSXx49z6cZN8ALqo2NUR0ZQnkeSpXR7PbSxwE8QBChpq5lSSLtj/w5boa+eJbZ3z0oPVsnSmFvXb2BMzkNH7+d/+vWvuffgIS5dv85nX33B3M2bHD5yH14Q2ibQPAcjUEqUKim5ccorUpHECUkcQ+CVtJzBzWBjSt/zqVQqBGFIbnJXWdnsCjnai9ah0LomtPbEf4fGQAAI+71V4ZCxvtbFwCuERBtbOvOURyUI8Yd4T+42EAy9N801SZo5ZRT6N5IBoWxpP8s1vlLUGg18Y5i9epVTJ09y7Msv+Lu//TW//PnPOXf+HJevXuXmtevURpo0xsYsapcbUjLSzDmW6fLOHsh2AdG/QcEgzJ2iMmWmbGwA4we2wSGJY9vI6Pv2mLV10kqTFJFbxGFkZIQ0S1lYWCCLM6anpmg0R/EdfWJpcZFT584xt7jI7PxtLj/2KEed2+ZotUpDSTe4/bIpJUmtNbs02k7KQ2dWbJzPNl7T4d+L8tK38TQHqhz2pW5i3SxqG+roGQxBxR3P9Qu4377d7RiKxULD0CRbvKhI6jrA+Ru3eO/jT/j82DFOnPmG5bU1hBewbdcevErFNkDmOXEck6QJnu8TRtZEx2hjtfbz3HKvC6TuW/Zx43Ww3Em3CDjEyzYVm74LnJQOGVCukXOd9eUlTJJw9N57ee3ln3LPnj3U3THdXlji5MmTfPTZZ3SzjD2HDpIbQ6fTtY14vofnWbQFnbsg2lWo0sxVjaQr2d/tOIprxcBd0v+lcNktlCW0SxaDIKReqxNVbX+E1vbeiZMUrQ1RvcHswjyfHTvGY489xr5tM4RhAHlO4uTQjh46TO55dHo91t5+m3arjdGGqNbo91doCIPQzkFZXo4AU84+G1bafwfljv+1bXpgAStAC1moJLjmSiWlc5+1dMRet8PqwgLdtXUO7bPI+K9ffZUjO3dazm+WIYAwilhJehz/5ixffP01c4tLTM5sw4uqJFlKlmboTKOkJPTtIuwHAQj6i/CPyCEH0wczhCgrqXGeIbRmatsMcZLwwccfcWj/Pg7u20sANKXknj32uJeX13j/089YWVgk19CYGEf6Pu1utzQK86RieMawm9jkkdXdtgBQ6pyNlbLV3FznTlqukIZTSAcGmUyT6wyda2KTWKTSUzRHR2k2mnTbbdqdNp+dOMHcwm0uXL7M448+yuMPPsjOqUnqnirvc4mbP50bcukOzV+eFvX9Nb4t3b/zrNi7+ft962bfYJ9x+ukDzfWDScbGyrLdChO54W8o/FjSNLda255NZjKgnRmu3Jrn+JnTfHPpEl+fPcOla9e4sbCEV6kxNb0VL4zIdE7c6ZDpDCEllaDiZFxtc7rOLSVMuIbewdVzkOQ0qL4yfL7uvt0JvdnHWabRua36Vyt1PKVYml9hbm6Wffv28fyzz/Lys88Spwlvvvkm169dRwY+MvBJte0T8YLQjts0xfcDgiDAV75Fx7Ocbq9re/Colae9ENUo9tkG5J6jy/jWBErnSOX3Z3U3jwuDm6dyT2odGa3lfxcB+ejV00OP22FAc60VeL1OpJU3dMIMwwu07crWeMrxfgYDcjMYkPez3FTnJHlKZnSJoFq6ikZh9TolFg3O8oxAeVQrFXrtNu+9+y737d3NYw8d5Vc/e5Vrs7d4/4P3iLOUxuiYDVKVDQJyx5NF24kO4Ro80P3WOjcoynTDQNmyMhTB2kkySTLLofR8K+OUZ2RphtEGT3n4vk9uDHGa0ut2kVIy2hjB5DmrSyt0nPvY6OQWqs0mrdY6K60WH3z1FRdvXufN99/jmcce54WnnmL/jh2MhAF1pUr1iMK6Fgza5P1OY0enuSuyzWZr293xjjLG3jgLiw3/Dv25b2x0N7x+Y5i++SS/2VIFDJTP++i0ceVHUar7aKwD2rkbN/jqxCk+/fIrjp04xdziIu1uDz+MiCpVZBAQZxp0zyL+UuFHFVyFnCRNbUOVdpOc7sti3RGgUkyFYmAwFctJH5tRjj8+eDjSaej6vsKTijxLWFpcwMdw9MgRXvzJUzxy7z00pOXAL62scfHKFc5eOM/V2RvkYcBMFBK322R5hu/7eMpz5iqQkZWBc8EFFq4cvvHibDJEhqhRYmgysIZDhbZ/IT0aRhXqIyPU6o3yrg/DCllmm25HJyZYvj3HxevXeOfjD9k+McZD+/YilCI1OSZJaQQ+R3bs5G9eeRWdGz765FPml1cwWtAYHQOh6Max7bmQkiDwy2Mrln+zYd4qd/1/xOVDW+lj4BIrgaUvFBQW5Xko37e0vzRlbWUVnWbs3b6dV559nl++8CL3Tk/jAeutFr7v4YdWdvP0xfO8/u7bnLl6mQRBUGtghEeapGX/kZJQq1Vp1KoEgDC2h0IIgyxBkjsnnI1OnT90E4iyWqSUVToyRpI4isnY5CRLt+c4df4c73zwAft3bOeBQweQYchEFPHco4/QbnVpt3t8efIUrbV1aqOj+FFIqHN6vS4CQxi6pPF7SIyWtR4BORrp3BkH0V0p+hbjEuECE2MNu4oG/zwn01baVUmJV6lYXnMHri4ssfzpp3x+6hSfHf+KV154niMHDjBeqzMeBv35SRRzVN8J2zh1kaHek29HJwZW/s2eH/i9oPN9J0xz5/vt4/6aM9Sc6eY1Rd87YTPgrb/pUkp4+NBsQC6EVZQrAuKegetLy5y/cpXPjh/n4y+/4OK1q9xeXUX4AdXJKarVGp5nTZGS1Mo0K88v7eTT2KqQoG0CbL/HadoMrCXlvpj+Xm12tjZT0LrbZh2lbW9IEFYIw5BWq8X6+jpRFHL06P088eQTTDYa/PHdd/nX3/+edqfN1JYtaAxpnmOEwPN9sjQjcdUxn4DA9St1O13a7TaJM8wrT7pgIE609bDAdwIhYQTGxnHSgyIFKVVWoEiofZnlYdTpSNPrfe/j/ku3Hz0g337z8tDjnq+Y6CaBn/T8XCo2Kzf1Oaj2BHlSEihvOPM0lCmQod/slxhDikaLfnOC5WLZrFM40r82FnVOcs3E5CRpp8unn3zCoX372Hv4Hp566gnmFuaZu3WT63NzrK+tUW3UUX5oJ9hcoLXlHRV3VtntPaBW9D2KYe7mNJYrLixlRGBVUbI0K5EQIUFoENo21lk91AZJnLC+ukony6nVqoyNjVIfHSEaaWDm51lcXGDh4gX02TPcuj3H/NIC9+0/yP4dO9i3YwdbJ8YJpJUN9KC0hy8sjQsE4+5HwF8UiJSNo0MfsPn5+u6P/z5T7Z0T5UZMpZRqk8VnWum9Xp7TSVNuLS5y/to1PvjsMz7/6hjnLl1htdUhrFaoNZtEtTpSucnRcZCV7+EHyk2Q1qo9T9NSJ1/ZziQ7aQgxVAwoewy+89AERTeRLgJjbJIV+B5SQq/TptdpESnFA/cc5levvsozjzzCiFsAV9sdLly+ykcff8LJ06chCPGqFdpJTJrnVqtXefT51H1UvxwnUjrOqCkRimLe/y78CuH4oMbYgMrpvlodcPsCP5TUGw1qtRqJu49DzwZhEuGk4lLavS5vvvsuk2OjbJ3Zykylgi8lvTjBIKgGAU8/9DBKetSCiA8//Ywb8wtknR4iCKwbqHNww3hD+71ZwvQ/tk22Iph1mvyIPhJrFW0cMi4lvU6HuNVGGsOhAwf4yaMP86uXX+ahQwfwgLjXxaQpodPAn2ut8t4nn/DnDz6gnaY0JyeRQUAS5+SZdsivQeeaWqVCs1pDYVHBvFCtENw5MP+6J8A1A3ooqWyzpHFW856PF0WkGD7+/FN2bJlgcmKM0W3bUFIyUa3w3KMP0UtSkIovTp9mbWWFoFEniAKS2B5LqZnM9xuPQ4Gq6K+bthJllTus74KdP3wh0cJVM5RF43NnWpQ65N/3faJmA79WpdNucXt9jW8uXuDqzevMLS7y4JF7OLx3L4f27mX39FYqyiNUyvaDuaQFBoPzH6Kz8n0uX1Ex3Qytvts7vt/39AP0DX91YcEw4FD8vx/j2KcEfdM2S8VaS1JuLS5xbXaWY2fOcPr8eU5+8w0Xrl9nrdMBP2C0PkJzagthENBeX7dSmHmOclKNUkrSNLHIuLbVIgmusb8vfXi3cyHAGRv2X7Wp8sq3bQ5wUr6VrSbPmb89h8Dw8IMP8sqLL7B/714urSzz9icfcfLUCbZs28nk9HTpAaNcr5IR1lG57FvKXGyH5ZPHgwH5XY7HIuQVwiCkqy2lU7neoP5a21eMl1nu5VKGt7ZMydZGkOlH2H70gHwiqAw9TnyPZqZ8T3ZFXozLgfmxOCui/EPfmKZ/OpxAXgFNIUvJvFwCznZYG22l0zQlLUTnmjTPrYSigTTNqI2MkHoe589c58uvj3Pq7BmeeOgoTz7yMBeuvMLvXv8TV2/cZJoZaiMD1vAShOzLZxXduYU2dYmuOIur0uLcXexBt0jAdkAb25yghZWdisLQ0mzSjDhJbIOH76N8i9rZrmVJvd50qGLO0uoKrAurNx1FTG/fBkbjS8Xqeov/8g+/YdvEJE8+9DAP338/Tz7yCPt27mA08F0cKh2CUaitbFaq27DdbQYbQNAHQ+5CiUMpaRvltHEndPOP3Axz2HQi/AGbGfiSoppigEK7tOhMSHXG3Noqn504wdvvf8AXXx/n4rUbGOkRVetsm5gCpdBYd1ecHF9UrVDoEGdZRpIldrS6srDEjXNtygSuyMyLkyaGzp8pdrB/XkRxdSwnVDtk2TbJaQJly8/ojOWF26wtL/HYww/yt6+9xks/eZqZLVtY15qGlCRxwo1bN3nv4484cfY0U/v2IqoRvSTBSkbZZqMsSzFYpaICOc61dpNuUCZ0g9dt0Aim/NuAAgwMWHsbp+uf5wjtbLbd2PAFhKGH7wdkqaUmJDIrP7cXpwSVCimas5cu8N4nH/PgfUeo3nsvI2GEUj6ZBpNrIiV59N57GRsdI/AD/vF3v+Pm1StUR0fZvnMntVqFdi+m2+vZZmdfuX6P4a3EWQ3DzKoSfRqo3fwbkdfhL777grrpXXHHCzd5511RyDu/287XxSS+4V4cvN8dd9xgyLXVUrYSfhblyvOcpfl51hcXue/QQV558XlefeF57tu7BwX0uj2EgXqziVCKdqfN6XPn+Pz4cS7fuMHkzA6aE5OkaUqW5kgBgefRMYY8TwmDgCiKnCKHnXeseZcYLIdtvm08H5u8rgQWBppYhRiQdcSQpSlxmuP5tsy+sroCQjCzfTu3rlzig08+5rFHHmbX1BSjvk8ObNkyyc9++hztXpeb87f5+puzBI06u/btpVar0uv1iOPYKod5ajjI+7ZjMVhvAoqk192bsi8drAtjPaVcM6Y9jn7za3Hstm/L3dwElSpBGDA+MU7cbvPme+/x+Refc+TgAR645x6ee/JJ7j90mG2jY9a0T6q+3K3aBFQZjAe/bbh+yxttw17x2YN34+YfuhkxQ7CBl27unIsHP6owXhOl5MrAfglpGwjLea/v/JwD7Szj1KVLfPjpp3z61TGOnT7DSrtFLiRRvUFjagvCD8kFrLZaCK1R2HlSOcpdnltFHkxuTZ4862eic0tdsX0+w02d3wqJlZObnZspAvry/iliHAekFmu0FHjCJQhA3O2yOr/Irl07ef75F3j20cepC8m7n33OqTNnUUFIWKlYTfyy8irodnsoJ19qZY0z2p0YgCisOPGLvATZisbMovYAtspdAFRKKcjSkmo0aJwnpG3GNloTJbGKq5H/9k+ekCd37uD/tdm5+StuP3pAHm7bN/RYVSp4i0ti+dxNWu0WlYrjOGlt+wyMQRkIlKKd5cTtNtUwZGx0xHWEu20QphJF2QiWVle4cvMWwvepNht00wSEwAsC19VvB4jJITXOcEQCkU9lYpRTly/w//nH3zDRrHF03z7+/le/pt3q8Nvf/57W6hpxmlFtNggCn1Rr4jixSI+T0snznDzL3PjcwFAbWKCH587BW6EYGG5IuwY3q5hhEEYjhG3M0Lkhy3NkEXQh0VlOluaY3CCx6IXyAoQL8ONuj26ec21+nuyLLzl76TKffX2CwwcOcGjfPg7t28/U5ASjgbL8dW9YNqjYdOFeKe7U8BzeBoKRDX8Z1Iff+Npvx8v/bVteyFQJMeT+Zh8Lq38cx9xeWmKt3ebc5UscO3WKr8+c5dK1a9yanyfOc5qjY/j1Kn6tQuYcYq1aSo4StpwrjKNyuMC7mLuEHGC/u/pk8TrPLZZWf9smKlL0P8cu/vZPaWyD5XqjAVLS6fXoJD08qRhp1pEG2u0WvbUVVJZz//4D/G9/9hp/8+KLTNQbREALwXya8smpE/zhnT9z+tIFMuVRqTfIpKTV7hH5AVIpdK5tuVprhEhBCPwgsLKjBfJYIOau0dlgUQ60Ic0zlG874XtxAlKgfL8oT/SRCYe+ASVtC3dtmo0mk+MTXL5xnThJCKMKUnnkWUaSxNQrIWG9RqYkX31zln/4/e+JvIAX7r8P4St8Y+UQpYFJ32N01w7ka6+igLfefY/Lt26xcOsmQbWKjCKiKCAzmlRnFOVeJaWjYGAli1xZf2jpFbb5yEpOameQYfqc4kKhR5t+Veov4DXfjdk5jG0Vj83wk5gNAcPg5w4khsVrXAJmsr7UpeeqJrlDnIxwjshF0Kc1cZaidW4lDasRoR8Qd7rMz87S63QJleLehx/iZz99nr95+QXumdlOAHR6MUZD4MZfO8344OuT/Ob133P87FnCWoMgsolvGsegBYHnU/F9FpOYNO4wPtJkcmLcBn7Ocbcwnsu1RiiBNKKkJBVJocs43HOWTqBzXVZuhLTXUSlFlmX0ej3CMCQMQ0sd0NrK5DnXZmEMwilbpVlqzWcqEX6txqVbt/iv//hPVPyA1554ggzrQLqzWecXzz5Dt9uDPOXUhQvcunyZbbt30RwZYWlxmSw3KGFcZVVYkzJXhVBSYtyxaed0qJxsotb9a1xAStr0g2577Lo/kornheg3XouiolqcD4nyAnyl7JhfXWW51eH0hUvcuDnH6TPnOLBvH0fvuYf777mH6S3TjDfq+AK8u1Rii10ZCr6/NQsdfIEY/lMx5ocCiMG/iw2v6/9aAgmDUspDMfog6m0T9T740N+PkqKD5YevpCnLa2vEacrl6zf44thxTp39huuzs1y7dYuF1VVQHlG9bhOeqALKI8kz8tQa71jPif59qgtflII+OAg4DShhfdtm8U4HGQrIdYYROYEfgIEstg3wSniAVX/LtUaFvlMXygh8H19KTJ6xPL9A1umwa+tWfvHii/zNT19k6/g4X506zZvvvM3l69cZm5rCc8Zzm4E5bqEGLRDG6oorKeglCd0kIccGtbk2pTbEoDmiMoaqH1DxfVZ7PavNLi2AW4K27til7+MpNWJ8tW11tBn1Kne3zflrbT96QG627hp6bJsUAm6vt1lfX6dSrbnFNLemOgYUBt9T6Dyj225Ri0Imx8dLKbvB+0kYl7sKezALS8tcuHoFzw8YGfHpxQl+FNqLHCcoIQk8nySOyUyO50vWki5KwNZ9u5i9cZ0/vvMm9z1wP/v37eOBPbtYeOF5Zuduc+zESZbX1vCjkKASgafoxD1AE0jLkTS5JsuNFe+Xsp88ljtOseP2n4G/aGeAUjiPGgOZe85O/A5R1IUrlXOdArI8tZ8nrP100XSmtUYnbohpQ7XW4J77psjihNXFFY6fO8+XJ08xOTbOvYcO8dQTT3HknnvZv3cPE6N1QiWoKEGAKB0wJZS0CCtjdrdSzt2hJ1l09wyivuUCeLdA/PsFK4PfuvEdhZALWHkqg0Ulcsdf7CQJS602Zy9d4fS5b7h87SrHTp7kxJkzxFnG2NQUUzt2EVWrzq7Z2Img6CnAHotNWPLy+5XjW5b7qM2wE5qjeWCccRM4LX1jFXGcs5gNhK3uvsFYDUYh7AIoBbnRaJMjfY+gGtJdW6e1tkzebnP//v384qWX+PVzL7BzZJSlbhcqFdI04cz5c7z+7lu889knJEqydecuci3oJRkYqzfeRxAsEpiV5VGr+KDzQkbTIkNWzjEnz3N8z8MIS8NSwkcoaRuPkPjSSllZVan+ouf7ga1QJIlFZYxVqWrWm0yNj3P+0kV6SYqaVChPWWRPW+fXMAyZ3rmDtaUl3nj/fXZM72DXtl1Mj9SoehKT2wAukzaheOzgARqNEabGRvntH//IyXPnSNIeVTFKUK1htCDNrGGKFB6Fi57Qbhy7gEECxugSHZOOs1lWEvLcSa/2A3Jr2GTuWLy/zzjv/z4ceJg7XrHZu4t77c5EePBR0fcwGE4Y7SADIV2VyyFRxoEN0r5RY++z3GjXoK+sr0QY0l1aprO8jDTw8GOP8ne//DnPPfkYByenMECr0yWNMyrVKl6g6GrNl2fP89s33uaPb71HK0vZvnM3SZrSWV8HBL7yCZTEV4K01yPpdhmtNxkbHbNHZKAwRtHGIvYWEbNSf6qocNpotawUgh3PBcovhAV2impXltkKph8GeIFPkqW2yqNttVEK8JW04zPJbGOdECRZxtTMdjqrK/zxnXeY2bade+8/ykS1gsTOTQe3T/P3P3sVhea//C//C6cuXqQ3Pk4jqhBEEXFq535ZqJC5/h87Hu01wNgIXLpEUhtA9FFf25jokg9Z8P0HO1QKUFiUFQ8o1jbHRzYa7eSG0zjG9wP2HziIJyXddpvZ2VnOnr/AWx9+xP59+3jmqZ/w4H1HOXzoMFsmx2lUQuqBGlprBsdzcX/ddTh/69aHlPq312Zv2jy97Z8f0ffKEHeuM6Z84BR2cns+pOhTa3NHT+ylGSvdDpeu3eDC5cvMLixw/ORJ3n7vPZZW15icnqZSq7N97yTS99EuHojjGE1s13qlQPXt5PVAZVK5+EPrQvLWbYUC1nC+MQAY9o+5/F0YcpGDyEEZyMHoHAq5WwS5660rmAJGCJSnEEYTd7u0l5ZpRhEvPf0M/9Mvfsl9O3dxeXaON9//gGMnTtGJU6a3bbMKMXHX9tLltvLr+z4aYVkC0qpg2V4mnzzXdHs94gFzoMJxHDEALGB9LiqBR+h71rPE81DKI41TMNpWgQtgLPBQoVdByV1A32XxR9x+9IA82jjmBQiDhzYid4GYKPgMhn4TpMEiCgKkk7qRmy5UfdzHYOW0Mp2jRX9YlaNN4CzO7XcGXoAKFUkaE+cpnvSRYUjSjfni+AkeOniYp48c4dGjR7m5tIrW8NXJE8SdDsr3CGpVK3ifZbTabXSa4SuPKLDuZvlQFlr8Ptx8M5zs33l8dwaWg53hg7fO4IcKN0Wa4TlHCNJcW1Mh6VEfHyOsVYm7XbIk5cQ3F7h0/RZjI2+yb+9eHrj3Xg7s3cORg3vZNjFKSN+4RypptRMH91VbzqY2fTnIYlYdOjK9SdA9hJb3F3cx9PfiXRvOkylKhFZizE5O9j1SSTzZFzizWqTD70+NYSWOuXrjJidOneHM+fOc+OYst+bnWW216KYpfq1OFAQE1SpeGEJZanVLltNy7x9XfwG441i/ZTPCLsJ9ypZ73mwI2Iw9ztHRUaSQLC8u0stSglqFLZOTKCVZW1li7voNVJJycMdOXnvxRf72tVfZMjFBN8uphiEAs4vzfHb8K06dP0dsNEG1igp8x8mTREEILgAXGKeyYhMEyyeNy8DE93yrYiHA9/0yULGyW7acmuUZSijCMLDohVvoBuVC+7SdAVc5AZ6EKPCIgsCORcd1tXKXAukpkjTBSEOt2STPctbXWnz4xVfs37aTXz73JNVa1SE4OSY1SCRe4LFrcoyfv/RTvDCg8fbbXLp5g+vzt+nlORNbZxifnKSXpCRpRpZYuozQtselGkaEQQBa0+t2reReLlHaKwPW0J3vUs8+y0rU3Joqqb8OlWXDNkijGQIR78DQB7eijGsfZblNGsIgIghCCK2lepqmtNMOnufZ6+/03AvHZCMgDAKajSZKCtK4y/LCArfbHUgSds1Mc8+hw/z8pz/l+ccfZdvEOMZoOp0WCkmjXsHzFbGBq7eX+er0Wb65dIlYgwxCclMo8RRImkaQ22DB3ZOeUvjKc+PFuGSiv2bccW9ucjqKKocUEt/3KapAeZaV81RUici1ptVu2+BRehTOa3aM2mtRMhlxs7mUmCBAhBGnz5/nzXfe4eUnn2DP2BgG6OaGkXqVn7/0Elme85vf/55Tly7B/AJ7Dh6kUq3R6XTpuaazMPCpVAJMntPr2bK+8jyiMLQmKr0YKT3rQgtlk97wGnLnudh4Wtyd2v9LH0gHYcGKVi/Gd+DUyMQElVodnWUstdr88e13eOfDj9g+s40j99zD/YcP8+CRe9g+NUkz9G0TLoMJ4d234enS9Ne+cs7cmFje8QkbHg+/pnTmxl4zqwDnQBhRSB/3ZT2Ln4IaVGypNrTihBsLC1y8coVL165z8uw3XLp6lWu3brG8vo72fcZmtuFXaqhKBH5g5RWNg3AMNs0yohxLm+fww2j/HcN6OPgoHwxFLQVIZgxRGILUtFstpBbUwzoKyzaw0rc+Ugb0kgSkIQx88jQj7nborq8x2mzwwKHDPPf00xy+5zBawKWrVzl37jxrrZalkMlCFa9/hw6ez4G0CoEDQYUkzXOSrG9mZUUoTPnG4n1KKQLl40vV731y5680gsIpl1neGShZQYg7bcZ/hO3HV1kpKl6Zhl6GrgVk7SwwaS5zYe7UkhaiRJTANnkVwfhwAMcdk0UKpNjGGa0NRjhzWRfhSzeotcnxlET6yiGTNovMck2t3kB7AV988QUzI6Nsm97KoalJXnzqKZJuj26vx5mL52mvrAJQbdRJPcV6KyVJLX1Aep4tsTtjhY3b4PxiGB5s370N32R3m1zuDOTtb4XRkAmgEkQEYUhUrdJtt1lfWePKjRucv3iRM+fOc+bsOfbs2sWRQ/vYvWOa6YkxtoyPM1KrMVJvUIsiAs8jLNAMacu6aJsd65LOMjwdDM31fVAZBgKAgppahuEDJ23T8KEMhgVG2SxACIFyH5m7n8zYzu31bpfF1VVuLy5x/eYt5hbmuXjlKt9cvMi1GzeYW1wk1RqkojE6yvjkJJ4LNsDyJksjEa3LgH/waoihZ7776hYBkDY5DlYpkYbBgLz4NGOMlfI0hk6vhxFQDUIipeiur7Ny8xZBlnPfwUO88uxz/PLF57ln2wy9LKOXZTSjkKtLC7z/xWe88f57nL9yhaBaI6o3wPfptrsoz0pM5WmCyV2ipaSVNRQ2SM/yvJxIrGZ4Xhq9FKiw1gbPEyhfWUk6Y4gqVnc/TlLrLlpq+rrJUbgx5ZIfjMYHakFILaqgDJY/KSy6qTND4AWkSUyapNTqdaqNBnGny/HTJ/l9rcn45Baefeg+Gp7A97zS7Q0piDyPe2a2UvvpT5kYG+ODzz/j/c8/5+b8PJlbVIwQeNgG3VwIeyy5Jk4TwM4x0vcIpEW++yj0wEAuEqqSj2vYZLn83pu9NfqL6feIX+78gG/ZXLqE5aZmpMZVfDwfbQRplpI6yo6UylVztJPPk3hKoEwOSU5vdY3e2io+gsP79vLcUz/hiUcf5Yl772W6YSXLunlOkqZUwxDPtyPryuw8b3/8OW99+BEXr98gqFYhtKpTCFnSqfqgTIbBqlMFQUDoKXxAaj1kRT547N96GtyJLfnwpQSasXJrUlKtVInTxCagvo9yk7opEQnjwIlC/av/0coPqI2O8s2lS/zj739PrV5n5OmnqUtBlqVEgeK+Xdvwfv4zjFJ0f/Mbzl+/Qby+Tlir43mKOKFESo0DoaQDuwo9bAm2iVwUd1kfQNg4BjeVIy7/9h3jVdC3lTdWZtivVolcQN5pd5hfXGJtbZVzly5z/vIVTp0+w/GTJ9g2Pcn05ATbpqbYMjnB+OgYtTAk9H0C4RSvNl4sMRiPu0BVDM6Xojj9/eP9luS3v24NQ2FDxy8BbLItlCyVuLLix1jAohvHrHc6LK2ucW12lhu3bnHhyhWuXL/B7O155hYWWOt0WG21CCpVtm3dQVStkbrqpzYWjbbcbXdVjAtctTO2UT/4rv9Bm3HjVhhp1bxclS/PjV0TBc4ACHJtqSyBUvRabZL2OoEUPHz0IX718is89/ijVAQcv3SNDz79nG/OfWOb8ysVcgw4ehgGJxe92ZE5Zriy8V037tFJ4pLqZavRAwi/+1c51azA85x4wF3UiWxGXczVFcD/657RzbcfHyFvxfagsgziHlAj7rT8dhKLTPc5k9qYPu964Mcag6jhTHMw3XW/W+NwSLKMLE2xslouYy2SAjOQwTo3rDyzDUbKUQIqYQWkx43LV/ni+Akee/QcE+PjTI5UeeC+e7l28waLS4vcmJujs7pGtRJSiSJko2EbEbTlppeZ6x1zfzEdb9iKCdttm08Vov9v+YK+XrjZ5JUbP69QN8jznLXWGibXSCHwlcf01mlmtk6T9hLa7TY3Zm9w9dplPvrkXcZHG2zdMsnBffvYvXMne/fsYcfMNibHxplsNql4nh2xQmBU/wgHE4Jy7weMfyy3emCiNAwtKH3u6sCRiD744YBwi3qLYtEZPvrEQDvT9JKE9fY6K502F69e4dTZs3x98hRnvvmGldVV4jTDjyKiaoWZnTstt1lZLqxUXskDt42Tuo/0CzGQMBYhpdxkQfv2Rcw2H9GfJBy/rUCOy6RD9NHkpZVVcq2p1Ks0ajUiP2BtfoGV27chjnng8GH+5mc/44VnnmH//j3EgPQ8Is+jB5y+fJn3Pv6Ek998w0q7zdaxCcKoYqtIgMlzTJ7TZxgZ16XvrpmSKJRNDLCJSpracr10PHnb8W/32VNWEaVwn8VAnmYI5WHUgLOjKI7fNtgU8lkSqIYh9UrFjhVt8KQi6cXkSUoYVRBKk5uM3JXyvcCn3Vrl67Mn+ec/1qmHgueOHiEMA4RSJFlOmuVowPMUMxPjPP/Uk1QqEdVqjUvXrvLlqVPcunSZ+kiTkZFxqrWGrSLECevr63S6HTpdiwY3Gg0ajTpJ3CNLU0uHyHPSLHNKSqKPKHueM6iwjUp3yEV+j60cYWZohrjL1h+zfWSzP3Itj7/4BFO+xPd8QNBpd2ilbXzPo1qtElYrqDwgTTPSPEfkGUqK8u++J+l12qwvLdFbXyfutJkaHeXeAwd4+dnnef7JJ9k1M81YpUKKa94XAj8IkX5AAsQaTl28xLsff8CJ06dZb7doTk2gosCOQzmgLCStiUrmdOt9TxGFAVEQWL8F05c1GwzqviuUsWCZpQbozFELne5/kqRoR5Pylesj0tpRVUSJ4NsJqqio2bFfhMRSeigfVpZXOHH6DG+98w5bR0d4/L77qIX2PKTAtm0zvPzCC/TihN+9+Weuzd+m3W5THxujElmEPk+ssoYvFVEYYbQmTVO67Q6+71OtVOxYzLO7tQ/0g8+7TF+Dahtm44c4x0PlKQLPB23I0oRer4fJc5RURNUqu0dGEMYQxzGddptjp07w2Zef4SvB9JZJ7j18mAP79nHPwYPs2rGDifEJxtxaU1Rr71xnKBOnMvQ2AwCP+7FCD4UOt2DjiSgu1+BxFpU/2zgp7bqzQcU4MYZ2rmnHPdZaLdY6HW7cnuPq9euc+eYcp06f4dbcbRZXVjAIvDCk2mgwtW0bOx19N81ystwi7wX3v79f/Z4tYYxlArjYZigs2HjBNp6jb9mGkvtiikCQ9GIEhma1iRSKuJcQJxkabDO/A2KUlES+hycMedLDQ7BtyzSPP/YYTz39E6ZHGlxZWOTTLz7jy+PHuL20SNhs4lerpQGcKE7+wDUTmGEFMoyjy0Avts33mSmu2caIqH8OfD/Acz4gtrdjIFkrqrGI0sVW5zrEmB9fYoV/h4D8o//b/wVWVtCPPor+j/+RA83Qmzm3HK51uzJ1TSbDDQcuwC5I9gOL1zC3UoDsBykaiIFur2dLpdrYzvOig9k4bvYA0p47V0/P9/C8wAYGoU8YBSjlceXqVV7/85+ZHh/hJ/cd4b6D++h2nkZnOX9+9x0u3biGFILmxBhhvUatXqPd6dLudqxovfTLkoi7lSh0SAcPA7jrZLfpdpcXlB+1WdxXxLVu4VKeZ3U884w8tcFCYaIRVMKSatLttOllMXOrq6zFXWaXl/n89GlG6nUmRsaYHBtj58x2tm3dytapSabGJ6jXatTrdcLQR2FTSx9KBGFoU6LPg7njSH7YlgJtxydbb7dZd3qntxcWmF9cZnlllbnFea7dvMb8yjI9rWm1OqzHMakQEAbIKMKrVm1Dn7IIXG6040e7xjzdd34t+KhyQwBj7jiMYoHY3IyieH0ZfA/QU4SbmPu2vv0tSROMEEyMTlDxPdrLK8xfv4FKM47s38ffvPwKf/PKq+zeMoEC1jpdJqsV1uMeX126zBvvv8+xk6dY78ZUag38MMRgv89TVlVE57lNL4rAzRi0Cx6Vsj+WomppAlIKjJZ0O108T1Gv1wBR8qellGR5XqpdFMfp+t/c4jmclBljzSUwhmoU0ajWLNqZZighMLm9NggXPGaGbqeLFtY2moZhYW2N199+m2atwvjoCAe2ThP6HrmAuJeQJClB4FOLAmaqVZ68/362TE5x4do1KmHER59/TjdNWZ6bZdVbpFpvUG3UaTRqVKsVS2XJc1rdDu1eF4G1jvawgILnjrM45sESUEF7KkCD77e5c3e3/H7oVZu91wz93Wx8rRn+XQhpbdQRKM9DI2wCltkAtDCaUZY/Qp7EJK2Y1eUl2qurRJ5i3/YdPPP4Yzz9+OM8ev9Rdm7ZQigF5NYJUkiLNkZhhK88Fnsxx0+f5c133+XE2TMst9fwogg/DBBOXtT0127AaXAZDcJSgcIwLI2HNlLBNj/wu29CSIQsqCp2dfGlshXBAZnOwvXYiU9Q9Dkhi2DQ3uNFg6lw/G8/jGj3erzz4UeMNho0Gw3u27WLSAiW4hg/CDi8azv1v/9b/CDgf/7H/8bF2Vl6acLU1q1UKxUSIei026R5bqk67h7NssyNMY2l9txlHhrCkQePfbOBcedmQRI7h8RxXH6a8n3wPIvuCoGRAqU8AiHIdE6SJWitSCXMr6/ROXmCUxcv8OcPP2Cs2WRsZJTtM9vYvnUrO2e2MTO9hUa9TrNWJ3ROlL6wQY3PAN98Iy5iLxKbLDzfvg2AghobfPeynLVOh/X1ddbX15lfXGJxZZml1VVuLy1x5dZNbi0s0I1jVlbXWG+1yLIcv1rDD0P8MCKIIoTnkWiN0dbgzNJhjKvm2HFVJHdD84ObL+8MxosDH0hZBkGtzbZNs5viKVOWLaVxZlLGIH0rXZ1qOzf7StFs1Ml6PZZu30ZkGQd37+apJ57g2SceY9togwQ4cf487374IWcvXCAXgsbICCLw6XS7ttJGgZAP7PvQYdv1QTr+fLvTpdPtuoqZGDryjWckDAOCMLDJdZ4NTKD9BA5hVcW01qRxIjyt//sIyE/8v/+f9pf5Wfg//UfGwd+zvhJl3baM8xzhTHA2Dihr5mNPruf7+M4q+G6bwQZk3a7l0hnp4UtrbSuc4KpkMCDXaG05nGEYEXgB7V5CKjNCz2d8cgudtTU++PADts1sY9v23ewZrfH0A/fhO3vnbrvFWqfLGtCUAi+M8D2PXi++Szls8MJ/zxWg3MRdfv9hWxGQe1i9c6MU2sSkcUI77pFpTeQH+FGF0SiikY2Q6ZRMZ6RpwsJ6m+7sbXqdDh6CWqXK9OQkM1u3MjMzw7atWxmpN5mcnGR0dMQ2cNWq1Ks1apWQiu/jCYGnBJ6zuLWNRpTVi8F9tSh4v7Rvy3eaDDshkGXESUo7yVheW2NheYnV9XWWlpZYWl5maXmZW7OzLCwusLiyysrKEsuzt9Cex+j2HYxPTDK9fYdtPNOaPNcgJVpIR8dwSgzu8hljnJmPcKhvmbvgXjJQLv1h16mkrOhvU9xw/Hq3qEdRZM1VhKCztk57aYma8jhy8BCvvfgiv3rxee7ZtsUaGiUpSZ6zBpy+cZN/fuNP/Pn995ldXqY2OkZUr2OEpNuL0doi26aQUBQuoRSUyTJaW66etAFxMaZ9z0Pnlktdr9UYHx9jcWmJXrdLVKlYxRVhA/RiElelckF/UsyNto230lIlMkcTiioh9VoVBegsQxiLbOeZLBE4JRXtpAMSKkFIbbJKe3mVa9dv8Prbb1OvVXn5hRd48OA+PKXIPUUvyy332xiiKGCm2WSq2WTXtm2MVKtMj49z8epVTp79htn5eWuWlIwxMj5OvVYnr0An7rG2vkbcjQn9ACVCcvKyp0IOSONpY1wTXJGUyO8Mxu/21x86I2ykP337p1oZNTD4npW2LJrcCo1jW8L2nLKQRmcZa2urpO02JsvZPj7OgT27eezBB3npmac5evgwY066NUlTV9XUCGONrJTyWMsyvj53jn9580+88+mHLKytE9RqVJpNEF55byJk2XBonW0spxVhG9xrlYrtg3BH+5esrMYY8jzDk4rQD5BOdjNNU8udVdbILYeS1kVRVnfn8NtnfwFS0RwfJ+92uHrzJm+8+x6jI03ECy9wYPdueqlt5m+EIUemJ8leeIa15SVe/+BDri3Mk/U6KGzPXSUIS7qIzm0J0gusJ3OSplipt43Ek83nm4GzsOmeb7oJW71KXSXM96yxnXKBepplJJ3Uel94HmG1SlCJbL+YFCRxzOrqCreuX6e1uobJMgI/ZGpyku3bZti9cxe7duxgdGSEyfEJRhoNAt9e62K9qUYRgbKNj0qKvuFREdgOXAt7O9hjG1Sa0caUVMc8TcmzjBTDervH0vIqq2trzC8usLi8xMLiIrNzs6wsL7PaarG8vs71WzfpJQmVRpNqvUFzZIRqtWYreVKitR3/cZzQ63XItbHNjEL0TePoT412iRBlEDlgg/Jdl+MHb8PjVKCkpXkkcWrTOSFLJSydZghprAEdhrjbJW23ObBnDz999lmee+Zp7t2/jzjPOXXhkm3kPHWS9W6H5sQkUa1GkuekaWaVW9TAcRd7YFwvmBuGBgu6ilzQ6fVo93rOnLFIJov/iiOx1zyKwlJOuvDrEAMylMXcqHyfNM/pdrtUc63G/oJz+EO3Hz0gH9os/ytUvV41jWOV6Rwh/DIYL0oNRgqn02knN3/AWhnoI4VlecFlrHlGnMSkaYoMrIqBKbVvbKlSu0kKxy33nLulkh7GQK+XoJDUGk1MrllYWOCjTz5h77ZtjD/7FDMjTe7bv4flnzzF2uoax06dYHZpkWWdUxsfxa9WGWk2yNPclTbLvS5OAsXAGETLB53/NmaD9qmBYEUMlFg2mSQ3vfncZxbSfmVDmfuzH/h2IRTSup1mWSmdhACkxIsi6mFItTmCSa2rqETQ1YYL165z7vIVsixDZzmNRp2J8XGiKGJ0ZISxkRFGR0YYHx2lXq3QrDeoVapUwogwCsryvVIODTV9R9TMlfoTx89MsqzsrL49f5vb8/O0u10WXADe7nboxbFL6mzgnmdWasyrN9l+1EorCSGtrnGagpt8swFktkBnbRBaUJ1sebkYfuWkbgzGtXi6vvqhALO4zkVgv+nFct9blledQofNS/u8OqP7spiTk5N4UnLz+nWWb83S9H0ePnKEv/vZz3juiSfYs2MHvQx6aUwY+Iw36lyYvcWfP/6IDz7/nCs3Z5FRSGN8HC8IWVtvEceJC7AipFODKMcp4BWNN66p0+R2DEop8aRnA1wsXaDZaDA2Osbi0iKdbgfPtw5yUipr7oBTUxHCOXP2T8VglSDX1ozEGEPoB1Sj0CHjefmcyQ1ZkmGURniWHqNxKLyUVBo1JrZu4ebiPL978w2SPKeiJEf37qYeBiBsWTZNEqQxyCjAk5LJWpUXHnuU3dtm+PrsN4yPjPD5seNcn5tj8fYc7XaLxugo9dFRAi9gfHSczKH5tvqUonOnzOHb4A1jjcBKeTrVD9Y3W2E3ouDD97i547nNF+lBTHTzJXrzZ23goI3GSBwanJeurJ7n43tWr9pW3FJ0mrK2sIDUmn07d/L044/z9GOPcPTQQfbMzBCpwk5d4wvwA69MhIWTk7xy4wbvf/4Zn339NTcWFghrdaojTYKoQrfXI83yoeXWCIkR1g+guGeCwCeMInyvT+3DzZ9999sCxh58PHhSbEKY5zkiDKlXQprVOuura8y35630o+eTZ5o0icmNIYwiq8KUWalMXcRQrgIymBSUV08IW530PaL1NW7cnuONd96lUqlQqVWZHhujrjxLzQR27NjF//E//AdqzQb/9Kc/cWt+nqXkNiOjY0xt2YL0fVZWV+n2ugBUKhW0S4CsV9PGkMuuTIPPmLuMqsH7tBibQ308bv6qRD7aKS0lSeLkQgVZbuf1GIOX2kZZpTyEsdQtgEpjhKjeZMs2bZN/B8bMr64xu/AV73/yKXmWUqtUGXeUnZERi6SPj40xPjpKo1ZlpN6kVq1RrUZEYYhSntXmdpU96OvTZ5mtciVpSpykpG4d7CUJN27c4NbcHGmasrreYnl1jfV2y7pEpglpnpWVEUvBFUxs225dM/0A3w9cZQnWOx3SNHPgCwip8LwAX1q1Egwl4GPXmoKqUkDi9kcI4xRwN4XIEUNX6ntum6xPwjgKhzbWl0JK/Cgk1ZaCV6tVCHyPPO4xf+sW6XqLqbExnnr0MZ5/+mn27dhGDbgap3zw6ad88MnHrLTWCatV24eXWmAN42QacUpA9NV2ysjJ2LVHC9uzIoEkS2y1mIGGbTPQnyP6cVcYhIRhAAPgmjAFydRVKsGqr2hDEseioXM1/f3P4F+8/XsF5PbOLwLyTqeWdDoySTNkZQNlxUU6JdFDSgI/KKXVAKt9Vr6uHxDFcUy32yWOYypBaJ3FDAODvpAfsrsjhXCqENbsxFMeWZrSi2OCKCSs1/FaLU6fPcvv/vgHRkfq/PwnT7GtWuGnjz+MpyRTE+O88/FHXJ69QW5yGkC13iDRkGS2qevuWOlfgpRvxHc2xVru+Ks9R5SSQTrXZLlFXKSygamRVoUlyzLL15WuRC2sw55yxgMeAiLAIZxpr0cvzeh2e3Q6HbIsY2F9nZuLi3i+TzWKqEQVKlFEFIUEniLwAgLPx1cuEJdWIkkqAUa7snNfXjHPc7I8I3WJROay6ThN6fR69OKenRy7XSsVKQSeu/HCMMQLfLwoxA8CavU6AkGv27Ml7yy3i4EUSIzTU3VZsuueNw5xY4gTWmTUetgMRxQ9EANXwPwQlKKPTJY8efpKEtpxH5VUJA4ZWLk9TyMIefzoUf7utVf5xQvPMT06gpIQZ4Yg8NFKsri+xpsffsi/vPEG569cJRWC0XoTpE+SGbLcWBMcWaih9G0rrL6xRnoe0pNoadBpapFDz8NT1vxhfXUNAWyZmmLnjh0EYQjGGrxUKlW7MPmSJE2QwrrQZo53W5y//sSoLYdc56UiSRgE1KoVgsC341prlLILeuoWVCszqazDrRDEWYKSgtHJSRZnZzl35Sr6rbfxlUfvhee4f88u6oFPFxtEC+O47Z5HpCSR73Nkxw4mR0bZPj3NkUOHOHH2LMdOnebm/DzLt2/TWl+j1mhSHxktFS3yrC83ZlFWeww2/uprrVvlhsHA+7vD6+/aNr7LbPj9rol7uQv9ZdBK+BWKElbNRop+b0CaJLQ7bdK4h9SaahBwz959HDl4kAeP3MOTDz/EgV07mIgqKHCJdoow2kqjSatlLIG1OOabGzf413ff5U/vvsuFG9fJlbLzcRiRaU2aZ65PSDl1JTu3UfLJc6SnqFUqNOpVwoHDKvyAfshW3PO9TodaWGFm61bGRkZtRTbukusUL7BJYm6KapFx526g8rfJlD8YMmVao6RiZHKStcUFjp89gwo8qrUqP3vuOcYaTYyBOM2pe4qH9+zAf+1V/DDgrfff4/iJk6zN3yaQktrICErYSmimtePVGwt2DZoibTzWzZ/+wVsx3kE4BQ7hnCILkMeqZEhlKT9pnqMLVr1rGrQgkbDBU66tVKnWdPPMJmVJzFKrxezysnVhrFSoVuxaUwlDfM+36lj+IOijrKhDoaXu9nXQ5CzLc7LMrjO5sY/X2y1a7TZpZr+7F8e2ulPQtTxFEIYEgY8KAvwgpFqpEngBuXaAj9bkeUFJAYxVoJEuIbdrhy6R8DIIdz/GUM7/AkpH6bteMDNwPcuE6Xtev42vNfYLpfRBWTWSLMtsUSoMSLoduqurdFZW2Ld9By89/wI/e+mnPHT4ACPA7W6Xj7/4krc/eJ8Lly9THRnpA0Fr62ggCMIynuvfF4KC8Nsfm2599hQiM/SS2Dp7Duz38Azaj4SiKKISRTg76LL/q/hOY3Dov0fsEPJ6J/X/PTgrP35AbomhCik0oKXWvojjKIl7Ks0zQikxUg5BQJav5HhTUqI2cMitw2Mhj+MAD4c4JUliVROMNUWw2aYLlkxxE0oKtyklhS2XOvQKYbvau0lC4HtMTm/h9vXrfHXiBOPj4zRrNX7y8INM1+s889gjNEdGyYym997bLLXb9FbXLKdw6GYqbvryAPt3iNh8+rsTddjwquIe/EGBnlWBUJ5HLvJSsq/U5M0yZ3zhSuzOFVQb626K47Pl7sQLl8X7lQp+VKU5NlGq4hRyd2A7mdNc02u3SZeWSOKYJLZIpM5yq79uTOEeXAYsRfBbSN+VlBZpTUikUkxOTFKt19HKo9IcIWqO2Inelb2lUu53O+EBpKnlq9rEQ9vucLcA2A5+jXBJXBEwgS7HGhiXvRdohaMdFNfKwRpDBWExfP3F4MUtr075Af3n3Juk6xpHaHLH9/elZOX2bXrr64xUIp568CF+/dJLvPSTJ9g2PlYqyyhPoBBcXVnho2Nf8fq773Lqm3MEtSoT4xOE1SqdXo80tde9ElVt8NHtWq1+Z35ijDMrksK6y8k+xcLyVAU6zVleWqQaVdm9cxfbZ7Yxv7DgdLZdcgyl+kOBYFh3QGty5bSRynukz5u0Z8iXwi26IZ6nMEbbxkgs3chom1BJz5qgCAydTgeBIBppMrZlivbyKpdv3uCPb79FL4nRP3uFxw7sxwsCfM+ZPGUZxmQEMgBhx8LM6AhbRh/gnkOHeOTSJd756CM+P36ck+fOsbCyQkcvQ55RqTfIjTUgEkJYyh2u6pNbZFcqq9YClMG7khYhHt42a5K+897eGHD3h5cY+ozBcVW+WAyiacW7+sta0X9jEygXQAirNpJnKUmnTdbt4APjjQYzk5O88MyzvPrcc+zdsY2JMCgXy9QF45ZeVOg6Cyc3Jjh74xb/8qc3+OM773D++jVkFDE6Pk5YqZDkjlaUG3zlIT2PuAzOZdl/oB1/ul6rUavVCN29YANSvlfUOYi0SWmDw+X1JVp+i1qtxtapLfQ6Hc6cPcPq6jpT09bGHFcRoaCdlVn1JlfP9AMMAXTjGCmg0RxBYFiem+XEmTNMjo8zMzND7YEHqCkPMCRZCoHPkZ078H7xCxqVCJlrvj51hsW5WTrdNo3xMSqViDTXJGlKbob7torRUR7wxp37jrxQDH7A4HTnqlppluF5PkEYWm8RrdFpaoE2N/49ZyJUVDULZZ0s19bkzpLu3XojiWp1W43yA5tQ93q0261ygs21Zq3XY3F1lSRJXMN3YtFuR1EoZPUKGl5RgSwcG5H9Ncd6CkhGR0ep1uvkShHU6oT1hu15c+dTuvtCuHtYCoESylUD7LnIjf3OoqqinCJYXqhRmbwMzMvTbkx5Duw65OSghU1oKI9n4/07CO0MLEB3pcVtHBFm6JrmjlngBb7VJc8zq95jNHGnTW99DeKEbVum+Omzz/L3v/wlh/buJgR6wLFz5/nzW29x4dJlpO8zNjFJWK/TiRPWW22CMKLRsL4YWZoijaUZF3LX/fukn0RJJ6nZi2N6SQ89mHQIUVJ6yiMTEPo+YRDYqq8xJV228JYoiS5KkZqcpNMV0Urs+2tA8y6n7q+0/fgB+c4a3GoptlQESmqRZD5pWsmSROYu8LPakwLhOoZLW1k3oXkuUy4ujDamtJvFDU5jrD1xEie2qdM4mUOhy4lYoN1gl2RZH9HMsgwjrEGIp0Ir2p+kmABqtSrVkSZxp8OJs2fZ/ukMzVqdB/bsYqZaQd17iJW1FdbbLc6cO8f127OsLcwT1Gr4lWqJtA5mqMML7J03x+DwK95oBoL3wTKiGLh3vmsTiLLjngKdEwOLjptUcBOiMYau07a1wbCk7J5yA13rwsvNudlJCS7IEEV3uAGptG3o8X28SoXINUeC42C74B5ByX0cvJGKSapo+nVYtG0QRKD8wKIfniohMBsAGmdYkJV0gKIx3VOezfS1JktSUpO4ddMF8c5Ewzjqi0UJBfngClaUDweC8aInotQ1G76w5bkTAxNNeU2NGxOukmNpAc7FzjmK5VojMSjhk3Y6VKTiyYce4e9//hrPPvYwOybGMcaw1ulSCQJ836MFfHz8GP/lH/6BL06eIgdqjRGieoMsN8RxhzzTVCoV68SGRX2yLBs4/3YXi4qFUIUpjI+SCp3npIlNtsZGRtmzexfVapUL58+DNkRhhDACneXlvWfAcfUzTO5MkMqA3DiZNnuvF8GWB4RRSFgJUYGHdsFJ6pBx4fi7WZYjpcALbHUtSezEX61UqU+MM9vpcO7qNbwgpNaoEwU+B2dmqPs+qaecIgc2adSWzy4925uyJQqp7N/HaKPOfffcw9dnzvDlyRNcvnqVy9eucfP6dSq1Bo2xMaJKhWqtVuqyd+OYOE1LyocQTr1D6/I8m6GhI/rja3BaKIbT5nEe/SG1AS8aWKSKkvhgSbf8VtF/rJRCBT5BEACGXq/L4tISq8vLpElCLYrYvX0bRw4f5omHHuLAnt0c3L2b7ePjNDxFnmV0ejFSCALfI/B8jOfZeVuAj6VFnbtxg7c+/JAPP/+Cs5cv08lTJicmqDYa9j7t9cjTjMBp3iMVKtcYYdWi0DZQMHlO4CnqtRrNWg0fS/PIXBn7LmJnm24GJ5fmWwOg9nqLuNdjz44dHNy/nyuXLjHbuoWZmiQII4wUNrh02sz96cKU9/eQJtNg0JPn5BgyowlqVerjY7SWl/n6zGnG3vwTvhA8dv9R6oEHrmlShSF7x0f5+5dfohGFREHAJ198yeLsLMrzGJuuEtVqrLXbpJ0ueZrj+XZNLWvTG2LvzRo+N1UHKw5i41PGoITEcx4GaRwTd/sVsGJIaq1JXTAZhpED1dKyeiSVQhZhirHgTpYbcpOR5holLP3LC0NHUbDrjvR9ZBDgZxmVegHIuVVDUBpxDSqKDJ6BotFWiiLgdtcHEMqaySjPKwPw4n7SWtsxlmWuObFo+MdJuxbzvgBXtbB0GVOquOBZum2xvxo9EJAP0HXLxHLj3jPw+M7/D80tYuM7hsLX/vV0cx9I4iTGaE3gK6r1GnncY2V+nrzbZd+OHbz4zLP86tVXOLhrO5OeZKnX48Sly7zx3nucOHOaXpLQGBklrFYxCNvM7eI863ory6XVzmP94yvummItsH05EHdjenFswY7C0d0UM98A4wLb41TokBvdrzaIMrRxIJiw9KEkTok6iRe1NDR/XJz8Rw/IK/u3I5qzsrd9Cu1JRJZ5MsuiLEllVgTkQgzpUQugINJKwHc0C/s8Dj0fbKWzW8E3toG+sY02WGkbi4grB7zrgWTR3vgaG5hLz0cFPr1egskMIQGN8TF6nuLarRu8+9GHlofmKR7at4eJwOfpo/fjScnumRne+/gjzl+9iokTZBhRTGP9YS6GF0tTTM+DN0J/+x5Azg/ajDbkJrdZfHFOB7aybOZQyzx3boqe7zqfRd94hyIh6KuCWGc+p5LjJiqw2uyqeCQlSjg3NtfoZtUG7AFro8sJc0htpAhMnAtgrqHb65KlmZ0cpRzSYy3K7NasyJSTsp3zbONfcZJz8r7kkiq0XnHNirjkzh0rBVJhH9uPGNj/8umNk9vdkAl3bQxOe1u6eL4wI3GVIikwGegspZeleDpn7/btPHzoMC89/zzPP/oQ080GObCWZeRCEEvJ3NoqJy6c55//9DrvfPIJqZBMbp0hqtUxSJIkdtfYXpcsSaG04rYTX+6CxSAIyHTuTHGs2obv++RJYmUGtWGk2WTPzp3s272H2dk5rl65SpZm1Ko1hLTKHEILp1trS/xCSKSiDMQLrqBAoqRXyluB1UaIwoBKVMHzPNu4huXpGgO+tHq4WZaRpZld1KWHkLY3wstzfD+gNj5OZ3WFs5cv0v1Dl263w2svvcRD+/dTk4I88C1Srm1KL4xApxmZUkglGQ1DRnbu5MDOndx/6CBHDx3k9Plv+OzYMS5cvU4vzUm0oddq0Wu18HyfIPCRnkfoGlspyuZu/EIf7drsvh8UQHOjZtPX3blED3/mxvBbmAIYFP3mdyGKW400Seh12nSNJs9tc5vIM2YmxhhpNDi4Zw8P3XuEB+6/j4cPHWSmXi+dAg1YvneeIwoXWmMVUAQ2yFnSMZdv3ORfXn+T373xFrOLi+SeojbSIKpXMUAcp2RpXsq0KmwFVAiBkso6w2YZJk2RxvYV1KMKddfQaQBbRxksbP+wzVMKozULt+c5cvAQB/bv58svvuDK1cv2UjoVkwI8Kpfvgby9SGz7181R9AoZYCnoJgmhr6iMjJBlGbdXVnjjnXet1rqBhw4fZrJaxRhI0pSK77NzbIzXnn6aKIwYHx3hg8+/ZLXTYfH2HLWxMatoEobW7bCYyxHlyNh8xH3/1Uds+F04wMQ2ceZlZUg5ZFwg0Fnf1bYwD5PkbpoXDiF1tC5X6bYBbI7J3DXxXAWvOOduXin2Qw2uM1I6N12GgvRCOKDMUt27pSgCbkO317X9abLvXGyr7YWuvEFrt8ZmNtiTxvbcFM2kiFKPqwwI+8CUvRLWPMqOo37Dd5ExCRfU49aaQtN5472+8Yrc7Yp9/+ursYmvERrfk0SeR97tkrTWCbXm4KHDvPL8C7z0/HMcPbC3vLcvLyzyuz+9wR/feou5pUUqzSaV5ghJmhFnPbIso16r4/s+aRy7NVc6g8G7HZO9oaSyC24cx/R6PVuZ8offUp4d0dfhl9ImbsLNd2Lg0wdjw9wYsiQRqtf1wm5HQP2vGY7dsf3oAfmWsW0o7avVxoRYlAqT5xJjpNZa3GHQUGZC/WKpDXSks/IdGEDGcvO0C9r7N6ouAxsGBm5/YcgcEuUycGlpGbk29OIYhcZ3E0OWZ7S6HRqVCpVmg5XlZS5dvcpXX3/N9JZpJiYmmWxU2TI6wpMPPcDE2BhpltGLE5Y6LXSaWn6ca86zQlPFBOAmjAIlHbrMhqHFsv/0UDDvniqXlsGhesd7i7+5Mpc2lv9bBAXFme2jdvYq+L5vGzo2oJT9QLlIjHRpBGEc+l1o8Zb7MRBcSwGp+45+s26/arFxKxO3oeO2R66kR+7KghtpIsVYGrat1/3EBJxNu4/v929LO56cDbwQzvrdyQ9iqxR9N7H+9xn3+f2FdwjLpFj6+n8R5XUpzqtwvFwyh4xgJ2sPq/UttCbtxWgEP3n2Bf73v/4V+7ZvZbReY11DL7FIZLVaYTXucezcOX73xp/4/PhxvChidGyc5vg4aabp9TpkqSaKKigpydKE9VYLIWx1yIs8sjQjy1JbLq5UiFM7+WWpRSiUEHTjmCxOqIQRO7fv4ODBg4yMNDn3zTlu3bxJtV6n1mxYdYXcGh8VzpV5nuP7HtJY6TjhxqhwN3FRAi4qIxKHcoS+5bIbjfRs03fWSy2a6QLcPM+sfq4QVpMZQbcXE5MwMjZONYpYmr/NibNn0XlKEAaMhAH379yJEpAre9/6TkHEIrC2SThX0tF3YPvEBGOPPcYD99/Hk088yZlz5zn1zTm+OHGKK9evM3frJibPaYxPMLFlC41mE6FsxUMbg6/8suEud0nYRryqGCcb7+rvlEkdGH/Dy7ZxAXe/ccrqgDtgRBRlcUEv7rG8eJu11RXQmvHRUQ4d2M8Tjz7Kfffcw4P33MP2qSmqvk8gJZmU9v53Dp++UkTNhq1U5BmdJMb3fTzPJwNOX7rEH9/4M7/9w+ucvXSVia1bmd6+HVWJyI2m1e2Suob7wPORKNuo7RpNpejr9WujkdoaRgWehzcwbzj/oh+0CRySm6ZUKhU8I7g9f5v19XV27tjB1NQkjUYDiVUHyXSO5/u28pEX8+WGz3TXdxAoAFzTryBJE/IsJfQ8as0REqlYWFnl488+pxZG1KtVRg8fJopCTJoRxwlB4DMzPs5LzzzNli3TRPUGf3zrLS5fu0a0usr09h1Ua3W8UnZ0qNbaH0dmMHX7ttXkzvM0uBVNktLNr56riED/eiFdI3CuiZMET3n2Pi3W89yQG+snUK45rj/E0hXsNc90XsqJDmKYEmvSU9IfcWGG2TyRhbvJjgp3HOGQ2ZmlV4pyfSruF+l5Dq03btZ2UpyOKlu8R3kKhSoidAy2WXHIlVk4QKpYSwtahdEFi+V7ppYbaGtFlHrXVw/8bgxJkmKEIQoDqn6AzHJuzM5CHHNoz15+/bPX+PXPX2OyWUdgaSrLWc7Zi5f48vgxLl+9iletMtUcQUURtxcWSdKMMIpoNhrkeU673bHKKc4XxtUEBmKfIv6zBy4QzpwsI81Sct0XqrjjAovhWMqeS8r1diM1shhbeZ5DlgiRJRKbY/xo24+PkLdaeOvrca/b1RiDkUpoY3S31zVZnhGGIbGBPE2QLsjJ0YS+b00zpCQMAsv5KeOlgUVpoPStc2055HHP8T9NX5dS2Sw3c6YukR8ipCRJUtv053mQ9EruX+B7pM6JMMkzPCWpjDRpr7c4fvo0nhdQq1V49olHGY0ipioV2LmLX//sNQ7s3csf3vozHx/7ktQYVBBSqTcIw5Ak17S7PQwC37d0AiGsWoTltxkKlQEwQzbPLsF29IniqN1pGMhV7naL9TEhUWaMm/LJBj674I4yEITbSzAYVOImGLunhUTa0A0wsBW8Lm0sglCM8DsC3IGjEUP2zv1Co9wQoGw0YioPz/R/16K/+JjybwPB/uCxFnmAoaQwDB+UGHiPe73pJx1a6z7KLl2JE1FSaayKjeO3C4uSJYltdgw8j2a9htCauNtlcXUFnWWMjYzw5JNP8tCRI7zy1FM8eGg/FezCo42x1uYSWsAnp07xj6//kQ8/+5zba+uMTE4SVKqkmba0LW0RAzEQFChH+bAGQMIGPC4hSdIEjKUw6DRFOym2Zq3Owvoc12/Ocu8rr/DEw48Q+ZGVAFteBiGoNRqEUQRJQpKlA8mp5fVqF5x6SqE8D2P6FS/pKZTvY7AIeSWKGG00qUUVjNEkSYx2/Ear4GLLwFIqfN8nSRN0jm0wxXI2kzTDD0LGJqfAGK7cmuU3//IvrKyu8MuXXuLovv1MVas2uHQBguckuUpzEW3whEFJQTWKmIwitjaa7J3Zxv333MOD9z/Ales3uHj5EtdvXGd1dY3ltTWuL8yTZBkIgR+GeEFAWKlQrdeJKqFzGh6orhmGfzfGaRT37zvYcI8W/w4sNsKdX8+zHgm6SJ7zzJq3xClJt0eaJJbLmVnVlKnxUe7Zs5ta9TDTU1Ps3L6dg/v3ce+Bg+zcupXpWp2+sKDbRyFAKnC6Q7m2fSJSeUQVG7Dcarc5c+Ecv/3Xf+XNd99jYXWNxuQ4qhphlCqdYI1rdvQo7h/X04EN0CwCmzI2MoJJfK5eOM/WkRG2bpmiHkUA9EyO8JSllWB9KHSWlwYgxbkq5rzcBffF/Z1nmkajQR7HnD11inv27eOZp3/CU089yfztOU6eOE6l2WDLzu30erbhzxjLay96VLSrOqqix0VA7KQjfd+3a1RmFayEtIZ3yg8IanW0Nswtr/DuJ5+SaQuoPHHkCJGj0vTiGM/zGKtWefT+e/F8j20zM7z+zjscP3uW+Rs3aI6PMzYxQYogMXl5zPa66XI8YAaMCos5EluJEE5lKcuycp0tGjALpaA7pFsL+oBLmsqA2BjHg7YD3GiDkcPjuEhNBwPSAjQxGjaG1hshEAC0bWaFIiAfTnaHoB5xFyKpW4S1m+gl/WpoATgJ2V9bBWDkYMV08OPMkLLa0DK2+RI4RPMrjrr83Rgn56gGzvkA0DfwBYWco9GugV85+oYDxPqA6AChx0AY+Chl0eWV+VlaC0s0goinfvI0r7zwAi8+/RR7xkcQUCoB/fMf/8Rv/ukfuTY3R9RsEFRrVvkssZUGz7NnMs/sfWFlOi3gEkahHY+5vfcpq6k2dsi1to39OmO9bVVvunGCrtpjjHuxlWkNg/Kc5lmGrzwqYYSnFHFx3YStTBS0Qd8PUAaydotWq0UjFyaS0Q9huv1F248ekLcP3oOa2pJ2d+wC5SHSHA15HCdG55ogCEiTxHFSPTsRuRm9iAULDdMiCxVuUigKjxLIspzllVXa7Y6NWoVFaFLnjCeVLDVrledsnwspJiUJlcSTyt1FFqEqJtA4SdGeojE+jhSSpdU1Pjv2Jc1mg0ZjFHnkEI3Qp1qt8ujh/dx3aB9CaNZb61y/eZOVVotMSHyp8JVHoKyphqVd6PK4yqB6YBIzQ9ON6KMXxYRWRtY/DPaxE8cw4jzwLRs+rkB4hidw95fyTX1eZJHdD33EBoTizu8R35Gx37GPDrEvMtoyebjbm4tgeihRsGjDoBva4P4UxzT8d3PHvhfBweCnorEusYPn2Th0vdwJO+nlxml9S4nQwh0PSDQmS4hb6xDHbBkb5aGjR/nbn/+c5x5/lO2BdStMtSbFcuw9AbPtdb6+eIHf/vkN3v7oY5bW1gnrDWoj4yRJSq/bQwrb7CqUKJt5ETiesDPaye2OKOWhdU631yvRLp1nCGMdS5UCdI5JU/bv2cOBffv55twF5m7NWq6+a2b0ggDP98jRJTpclG6VGUYpbAnYac/Tjw4U0Gw02b5tG81Ll1hutzG+TxBVUQ4fKwICJRW+55PEiaVZhCGBF5BmGZ12l0oU0BgZIapELM7NcvLCeRZXlllcXeEXr77K0w89TMMPrGa+m5M8KZDO2yB3KgxCSWtEZqAmFXvHxtg1NsZDhw6z0kuYm7/NufPnOHfhIsdOnODi5cssLS+TZBlKYJHkOCZXEpN59twUGbgoaG6ijJIG4xVZDOpioNsoZWgBL9DuQi0nzRLXkGkXPLTG6ByR5XhGo5Sk4lWstKTOOXrPPTz31JPs3bWDfXv2sHXLFsYqVSIKRNJKhkptpVBLx1EBRkk7PvMcT3gYAd085/riEp98/TXvfvABb737LrfmbzOzaxcTW2dodbr00pgstnQmT3p4vrT3U2765krKybgaO17DwEdnKe3lZcKJCXZt3061WrFjwvWlSGURVoEFQcxg9cydZ7tAa8jd+XPfF4YhcZrSnpvj+pUrtFotHjj6ADevXuHLjz7ECIOvdhEXCVN56/eR17JJD41AOsk1UFKQm9yqPkmbeOS5XQ8DL2B0Yoq1pSWu3Jxl9c23EEiCqMqRvXuoeR46Sel0ewjfoxqGPHHkXvbs3cuOHdv5p9//npNnz7LWatHzfdtzI5Vt0Hdz0SD1wsZvDsUukFtjZy7lAKOip8dSQod/SrR6iIY1OF/2o8VCF7xAPqzs4cAMvXFdcJOv/QhdPicH5/4iWRt4y5B06N2Xmbtu2t1XuJBVlA3JG5dLl1wIU8o3l8DO0IsHkPAN3yXKe9591lAkMLjwUCYaBUJfzJODyiKDVVnNIPWt/7tbRe2U48avDfTtdfSVAjI6q2vEq6s0fJ/nn3yS/8Pf/T1PPvwgk9UKPSwwtNCNOXv+PP/4u3/hjfffZ9eePUzObMMgiJOMLE9sLORZIY00ickxKE+S5bYKLT1pvWJMjidtAm9cwIwRzhVUIT1bxV1bW2NpZZXto2P4LqFWRZObu8Xz3IpB+F5gE47cAmZKSHKsmo4nLZ/d+HbN6/V6JsuFNgQ/LMj6C7YfPSC//X/9fyCyjHhkFCpV5MotDYhy0XW0AOkQRSEFQmuyNCGJEzKHwA0GgVIpq6ZgjGObWYT91uwsnV6P5tgY1WoNgCxNQFppJW0MnqdsgAAlL7agO3iuVIKAuGtF5iuRLZmmWYYXRFQbTTzl0e10OXbqlOVBmpyfPPIAYWnkJXj1pZcZGRvnD6//ibfee49bN29SG+2wZfsOdmybIc5yFpdXWFlbRUhFrVq1SiDYScbogaCbIgjPSydD96RdsBl4TP/vd5tzisnJwDClZPBj7viMwcTA9P8y5HI1PLmUainFdw7v5tBzg5/8Vx31G45j45TWf95ser7EHe8EzJ17KAs008JhTrEmIwwCgjDEQKlti7alaT8MEUKSZBm9XhcpJdVKhdF6HWE03XaLues3iVvrVHyfew8e5Jknn+Dxxx7n4XvvpekQ40zbqovneURhQBs4fv48//Db3/Lp18dpZwn10VGUH9Hu9OzVkwMNupiB67ihXOqOXDvlEuPOVRFEB2FIoBRzN2+RpxkPPPAA9x25D6Ukp0+f4tatW4yNjRFWqwhHfUBaTVuNozi5KpZUCuXZ5CBJM/zQohtCZ9bJL0nKc1+pVNg+M0Po+cxfucbMnt2MNBos3F4q3RnzzAY0aWL7IJTyyDNLVysQsk6vR6YzwsCjNjoCStBaX+Pdjz9mdW2VtdU1nnvyKXaPjhJi9dUTbRC5DcyVb0vOOs/JerFdJHzPUg+ASMBEJaA+M83M2AiPPfgALzzzDFeuX+fW7BzXZ2+ytLLCyvo6t27f5vzFi7RXViAMbPDteaXakReGVs84sD0sSlpTFZSyKKML9LTjpeZO/9kU/zqqXq/VYn15GbIMlEIoRSWqMNocYbQ5wsyuaaampti+bTvbZ2YYbTbYOjnOlrFRJppNRms16w2BXbhznaKzHKEtQmhhLwm5VQTKAa0UfuATAK0k4dytOV5/7z3efOcdLly5Qk8b9hw8jAoDWt0uSZ7ZYLEAYcoAS5QJihE4Q68cT0lCr8L6mg0WokqFLROTjDVHy/m+Jq1WeKeXWKdiI1xvgsA49Yqh6tgAqls8tipDkmBygnYac/HSBZ54/HEOHD7MroP7uTF7k9u3blGt1alXqmQa0lw7Hf3MqlKpAKOt0hPG8tKRkjxLMQ6dM5jSqCzPNUbapnjlmhVbccwnX36JTlP+/rXXePbBo1Rc4hFrTS/LMEoxUol4+dlnmJqY4P2PPuZf/vg6Z745z8TWaUYnJ+1nC1nKtEohkZ5wCL4ojznLMtu07Y7Bc021QeCjc0vnSQu03CmjWW+BHwAqfuvEPzz/bly3hmLtgTxIDMz/g8pl5eu/Bb+52z7ZMVHuynduRcBs3E6LjWXcu32XuOuDoacFVj1OIMq5WTvd4GJFHmwi1sbYplSlSLOUpNcFDIHnWXlIadevJLONyYHvE4YeSa/DyvI887O3OLxnD3/3s1/wynMvcP/he0Aoeqb05eLrM2f5r7/5B67M3mJ6x3bwPVKtkVKV64nJc6uU41ttfbQFgDxPlAi3zm2El5vcxWkZQvhuWhAOo1BUalWyPGd+YZ7u9BZGqjWq1Sp5kpL0evhRUFJThRCkeUaaWtUbU4CFEkzmKvwCyDW+kPjSEzLPhIi7QOO7L/i/YfvRA/J474HhJ/JcC4SxCIUgz+wJL+yWiybLwbJXmmYkaUbuK7QQpNpAbvnPQlmG1q3lZb489jWzs/M0miMEQVBOrHqgRCZcY0eSpmhjCMPQlkCc9WvRI6EosnubNRqjibPcLkT1OnGacunmdVZWV5CeIqpE3LdnFxOVCCVgZyWi/sADjAQh4yOjfPDZZ1y5fp3Zy1dor7eoNpvUohAhRu2+6NwG3bK4aft3fDEBFA0I2jC8cPyVtjuC8js2c5ffi8eD4e23fc63b3eG+N+9/dtf+2/Z4+EPN8bgKQ/lW/OBOE7sGBTW1t24cZWkqXuPcCU0iScFOklIux26a2sQ99g+McG9Bw/yynPP8vRjj7F32wyNIKCbpMRO0jGKIhIM11aW+Pz0af7b66/z3scfs9LpMDIxSbVaRxtJrxsjhcQbQAW/82Rh0SGLekl0bpASwiDAV4q0FzM/O8ueXbt4+eWXeeCBoywtLfHFF59z/fp1ZrZvRwY+cZ7R7XbxwwA/DNBZP9kWAnANuVlqg8ggsskMacrS8gpz8wvE2lZpRioVHrz/fj756hjHTp2BJMNHgLG6x8KhOtpxC6WSSKTrARAoIQmUR5on9OIYBFQqEePVCiueYnF5mQ+//IrF5RVOf3OWV555nsfuv5/I94ikwHk0WbfINO27AFpo2hrnOMSqIgQ132fCt91G+yYmePDQIZbX1phbmGdxdZWllVWu3bzB2XPfMLewAFLSixO6cUySJvRSqyKTaRvcmSTDGOtOnA4GHbLfkyGEsEEzWN1waQkfanISb3oLSioqYYVatcLY2ChbJqeYmphgx8x2prZMsW16mumJcZphQOSaagMAY0jzrA+iFNdQutC25CcLhOfZsSYEXWO4sbLKF6dO8/Gxr3n3o485e+ECic5pjo/jV+ukeU4vjl2CXDSWFkr4/V6XwR9tNH7gUwl8lmdnSVZX2T49zdF7j7Bvz17q1Spgkbsbt2a5ev0GUiqq1cBSLIaQSgNGo01BreiPT2OsM6nRmvHJCRaXlnj/gw84ev9Rjh69n8efeIK1N/7E/M1b7Nm3Dy+SdHo9hKMFWA36wWDOop5qoJHecvhFaWomccCThkyDF9iaRNLrcPHGDVZWVlyDvuTgnt1M1+sE0ib5aZIQ+D47o4iJ++5jx/gEtTDijbffYm5pmfbSElopjPJRYYAfBEhHmzHGJQIuuRNC4IeBTRKcoZXUEqSyAadDVyyvW/0o69O/11Yg2v0Hd3kNA6j3XV5TrIp/nTOx2Zc5JoEbxzq3VcVSJMOWDsqGVwBhLPUjz3LXTOs5Xrwm1j2Mu2crUWib2tOUzmqXXmeNqhA8cs+9vPbTl/j7n/+S+3fvIlKKdmpVqJY7Pc5cvco//eFfeePddyEMGNuyhW4ck2pD4GSnMZY+J929pXM7poywTbpW+czSmKVSGDS5zmz1xPSb/Isx5vk+SysrnPnmG/Zv28bWag0pJb0st/4XQLUaIaWwAFiclgDTYOXCuIqZMQadpURKEYU+ftKVsrWkoPG/bg65LILikq5gcgRp4PtGCkmWOpTGoYrC8UeVtIhWKhWtTpeV1jr1yCeUkiTXpGniGvE8lvKcs5eucPzkSW7PL1AdaZZZmOf75K5bWbkTXZjLKCEIw8BJAcaOD2ezuEoQOs5sarWRVcFD1QS+h1+pkCQxs0sLfPjpJzRrVaR6kYcOHcQHukClXuO5xx5h586d7Nm5m3/+13/lnY8+YuH2PJPbtrFj3z62Tk7Q6nZZXlnG6BztUJuibIqjL4gCvXDokNaWHz9Maflh2yASjhgu6Q0i48X/vytUHSypbUQovn0nNiDjmz234Zu+9cO+YxvGbPrRTIlgfNt+msGj3Ow11kTFC0KqUYV2q0Wr07Z9C5UKtXoF6Sl6cUyn0yHPcypRRL3RQBlDt7VOq9Ui7XSIlOSe3bt58uGHefKRR3nywQfYPjGGB/TSjLjbRQcBUSXCV5Iby4u88+UX/Lff/Y4PPv8CrRSN0XHq9REQEp3kdgwhhgobQ6No4ODFEJRUyFr2y4a1qEIax7TW10Hn7Nm1i588+QTjo6McP36cK5evsLa2xp79+8FTxN2+Mx04fV+KRdw28WRop2oCCIHnB2RSMTc3x8UrV1la7zJVqVANAu49cIiH7z/KZ18eI09S2isrRJ6H8DwwNogwjhZWIHZ5nmJyjVSuOVAKEp06s5kcz48YnZwiCENaq2t8cuw4X351nNnZeVJt2L1jBzunJqm6alaS5fS6XSphSK1aAXyM49Zqdwy5tF4LUsryPmp4kvr4KNvGR0mBXprS6nTsT7dLp9tlbb3FwtISy6urLC4vs7SywlprnbX1NeJeTJyk9BJbSbTlW+l4mfbH9zyi0MrgRVFo+3C0ZuvWafbs3Vs65TZrNcZGRxlpNqyjYWSTQx8LTLgl1IJG2OplliSW5+ka4JXyLOjhUPFUpyg/sOAK0Mpzrs7d5v1PP+f1t9/mzPkLLK2tU2lYxF0oxdp6C8tMKkAJG1CU0nGuOlgEq2XAI4VT2pDEvS6+EBzcs4cH7zvC3l07aVQiusCtpSW+OX+Ba1evMbJ1hkqlatF23Q8e7efb8V7QqQqpOqOtKIA0hkazyfzsLF9++SVzt+c4cOApHn34Yc6dOcPC7Xl0lpHEMd1uh6BStYmlsB4XeWopQZ5vmxx1bqk0Voa2MGGy0r5S9S3UjQHp+YTOX6ELLHe7/Pmjj0jylJdfeIHHjx5lrFZD+j6i1yPpdGi7MXD/7p2M/Ye/49Ce3fz+jT/x2fGvSRG0sxgtNCiJ9O0+pKlFvYsKlud5ZRN2r9cjz60DbeZcNSXW7Vk5Pn6apnaNLX0cvv/Wx3K/5TVmQ4V36OVm8/VqCHG6m67Zhuc2WQwGq6nfBuP0p87N15Xvt1ptugMbXtL3ZCmbhAUIR92VopBtdE3xwkrAJklCtVohqlTIczuPJb0eJlP4lQqVMEQrRSvu0WmtUvMVD9xziJefe44Xnn6W7dMztgEZ8H3JapLx9YVL/PPrf+DtD96nnSU0RhrgeZgks0pY7rpZNoDlu6dZTpwWlBWvH/uAk9ZVQ8BkkfyVTdx5jhCKhaUlTp05y737D7Jn+w4ibBIeZxoTZ/hV+3i902G90wYl+0pQZpDmKJwxXI7neVQrEZ5JJL31fyNa993bjx6Q//LzL4GikU6wO0uTJAi7Qa2qgxXrjCmcJFCqNTg0wXdlWoRgcXWVuYVFZsZGbLDuexgliHwPH/jmxk2+PnOGm3Nz5DonqlRItVWoiKKIXmJ1f30lbSaWaZTyXNe3RuusDDLy1JZ6/apvBed7MVIYlLILu3UTM0SVCE+N0/N9ZhfnefujD0jSGJFnPHLvvWWDkw/snZ6CZ56iVq8zNjnJVydOMLu0yNUL56mNjFBtNhhp1J29cGonQmMVLHzPuuEVfHedW8dMP7C629axrpA+6m/fkeDfuW0Ixu8IpDeJrL9nrH3XP2zkXf9btruG6JuWFgcnyKKOebfPHf77UAIkBl/X36RUJGlqqRJC0KjbMlduNJ1up0TLw8BHiRBPSnQas7y4xNLtechStk9NceTQIX763LM8/8QTzEyMM9Wo4wFZkkGeUY8iwjAg05pb7RZvfPAB/+1ff89Xp04T55ot0zOoMLJjJLcVwVI+sthrA4h+w9Od56d/fEWZ0EphKqpRhfmVVdaXV5iemubhBx7g0L49rK4scerUabpxr2zELBpblechpCwXDiGtG6wxujSmMsY2G6W5ledUvs/i8grnLl7kwqVLbBmpMxoGVKKQh+47wk8ee4wPP/ucuRs32bpzB9IP6KWJayVxAY1TZshERp5m6Nzg+Qrle0RSEacJq+stFpeX8H2PShjSnBinElWIWy0++PxzFpeWeeSBB3nxmad54PAhpsKAeuijVB2AXpZbNRzhTMYGxoVxiJQ9ZjvHFUh2BNR8n9GREbKREVJjSmOtbhwTJwmdOKYd2yC8G8ekaUKuc+I4pdvtkRWOc8KiqgXnMwxDwsAnCiPCwMfDUK9WaDQa+J6PpxSB57tqh1V8LoJvA1Y21qkSFWthICVeGKKkNYtK45hc564kHOCFFTw3eJIs49rSEsfPnePYyVN8eeIUp85dYLXdQUURtZERwsjO10m3U1ZJCyps0Wxlz6Ft4tNmUInC6poLNL1OmzyOmWw0Obh3Hwf27GGyWaMCzHU6fHP+AhevXGWt1WZUSjzft3zVTdSdjIvWirtFCoFQVk8dKalWqug8Z2H2FteuXsY8/RQPPPAAp77+mssXLxJ3OkhtHXLBWNdbF6zm2liJTyfP1+t20Ton9CJ7f5UNka5JUuCclXNXfbOa8FXZIEsSLt+6SeedTllFeey+o8yMNKhVKvTSlDxL6XVt4r99dJTnHn+MyYkxDhw8wIkz3/DlqdNcu30boyS1ZpPRsXEqUUQ1ikiShE63a4Nw595sXLK7EbYpFG5w1AmGX/Ld28A1+La3bQyC71iqNnnwXTTOu27lGzaMj82f/taPGdzfTdfYDdvQkLwLFF8Ek0KboXEsiopdyeHvr2UG2ycUBD55ntFurSOEIAp8mpUQck3c6bC+uEieZXhSMlqt8ewTj/OrV37KffsPsG3LFgp1pqK59ZtLl/j9n17nrQ/eZ25lmfEt06hKRJzn4ClMbnv9MOApH09Zhaw0ja2cpO9b08Isc6ZhNmAuIvGiMbo4HiGcp0WuqdRq9NKUC5evcPLsWQ7v2snB6Wma9SpGWcdmCaTGcHtxmcXlVcJKBansWlRS+oTlj+Ma3ZVv3VZD4Rkv/8Gj5wdvP3pA/ujtRXQcY5yFtBkZ6c2H1fXG6ERWW1ohTRLbnV0Y/xhXclFW4xgpuTk3y9lLl5iZ2UojDPGVlSHrAVeWV3j/q2N8cexr2r2YsFbDjyLiTgejDaGy1JhC66po4AsClwSkKVkSI4BKVCEXiiRJyDNr2S1RZfbkK48sz2wXfOBTrdephKG14r50iXa7bcvkSI7s3cNEFBJjy7x7p6cYe/45duzYwWdffcl7H33EVydPsD5/m6TTZnxy0i7iSmJyQZYbdy5y+kJOVgISsEFR0dDyVwtr//23zY5ADqAfpSQiw3PfD044NnnvZo/utv2QOoQQkGU2AAvDkCAMANBJTJ7Y+yBwbmEYYye/1jpZp8t0s8G2LVt47IEHeOyhB3nukYfZs2UKRwl0lAVtlTICnxQ4c+MG737+Kb/519/z+ddfk0vF+Jat1BpN4iyj2+7aSVBa62ihuSMA+e6Dkha9NNpObhribpf22hq+Ujz1+BM8//TTjNdqfPLxJ3zy2acEUYhXiYjTxGnTg+8HdiLNNcJY6khhwJC7fhLldIV7cYwSgkqtxvzKCucvX+HLr4+zc+sU47t34QP37TvAz19+lZs3bjF//DgmSdHCyhMK5xqrGVR7KGQUbQ8JLugvFq7E0WiiICIIq9SrDdJ6nRuXr/LBp59zc3aO24uLXH3sUY7s38eBHdupRxFeQTPQmkwIq3VbIGkOuaKQw9QGg2smFAPupUAoJRUhEL4Pvg+12h2XYrApKwdiNtfiklCi3J77926boVBv6i/aBqy5l9t3oKQCSYfmZnlGhq3WSYRtFBTQyXPW45iL167x1YkTvPvRx5w5d56VVptcSKrNJkGlaoNip5igisoG/WC83D9TNPENNrPbhtbA90jjLu2VFepRxD0HDvDg/UfZs32bpdgAV27O8uGnn3Frfp6oVkM6jX0cJcMUY7wMNAfuj4HJx7gTqwJFWAnptODrkyd44sJ57j1wgOeffporFy9y6vQZemnO1M6dtJOE2NFHhLPkNjiDO1v6xFbWTBnYFt9mJVRtUqDdPYK2zW9eGOE72/Gbi0v8+cOPaHV6LC+v8cQDR7l31w6qvm855WlKz1WVJxp1nn/wQXbv3sVnx44zNjrCJ8eOM7e0SLfXpbuygqlWCaIIhaTih0ggz3IykVvzNbcNKvhYVaR+4/+gzOH/P2zlmKYfDA/GuYOBvmMr/ZuW1rvlI3/11XrDfVHKxoq+oo0eqOwKhKOwCfLMNnMrTxH6El9Iut0OrZUlkm6P8dFR7j14kHsPHuC1n77Ik0fvL8HGFDtn3O50OHflOv/8pz/x5vvvcm3uNn61Sn10jDjPiZPE9kW4vgklJMJXlm6cWnpbAZAqIUmTno3dwnCoD8Hy5C2dBYNT08oRBkZGR+msrXFjdo6PPv+CLeMT8MRj7JueplkJEVjWwrWFNb46e47LN24QVqqWv+646cYYu0YqnzTvEXe7hJWIxtiYWdm2pdvZOZ39tS/dxk395//8n3/UL/jHpTZd6dFVHt2oSlqpyizJduULt1/srixPtdIUUchwib4Ws1KSJEmIez2klIw0m4yOTTA2NkbFU3jAxdvz/PmjT3jnww85d+kiOYKoVscPQ+IsI3PIWJZZOR1PeQjnluU5S+08y2yzGIJarYYfBFZ6Lo7JsgwV+KXaQxRFpdpEnmUIYwiCwJZy85xeErO2tsb6+jpbt2xlx+Q4MbZMkguB50mmpybZu3cfzXqDTrvN+uoqK8vLpLHVjg6DAN+VnDWWP28bGSSVSoWoUkUpRRwnxHFsURYXTPxbb3Qx8O+m5bXvmF3Ehp/v9YWDJSgEojRKGv6PTZ+1MFrxnzR37sPwz/f779u2skx6l3NhhCstK8/KDxrKqocQEIUh9WqFShCAzkg6bVpLS6zOz7NtcpKXnnuOX7z8Kr946SUePnIPW8ZGybVhrdUl7lk5RN/3Snvp89dv8Nu33uI3//IvHDt1mqBWY2b7dhqjY7TbXTrtLnlmO809zyMokFvnCjd4POVxib4udXloSpaBWeR5SK1ZW16ms7bGtulpfvnzn/Pc8y9ilOS3//oH/vz224w4q+lM52Ta2PKp8uxil1tZNyUtGVsXnfVK4gd2Luh0egR+QKNep91qYbKUWiVi965d7Ny+DQ1EUUhUb3L9+g2uXbtGkmZkWhOEhSqTPZAi2Tfa8o3DIMRobR0+sxQhBdValZGRUaqVCsYYer0eva5dHMZGx2g0m6yur3P58mUuXrzI7Pw8KoxojI9RDwJ8G62SG0Oa5xbp1IUhvOVCespKX8pCa95YJCZNbAN7oeZR0EALNZ4iYB6kahTjUWID7sEf34DnEtoiqdUU9vGD49nKb1oJuxyd5WVQXCBUnpR4jupE4alQ+gwIpB/ghRHKNUytJAmX5+b45KuveP2dd3j/0085fvo0i6urBNUqY1NT1JpNjIBOp0u3a9FX3/ecEoyT4izHYKHy1B+jwvGupbQBedxu01ldZdeWaZ59/Akee+gRdu/YjhHQyuGTY1/z5rvvcXtpmbBWx48ie4510RuBS8xcgDk49l3UpnVuzUqwc3mWZyAgTVO2jI7ywKFDjDYaLCwuc+b0adq9mK07tpPkVp3IaKcYFviuUdJqZxcNunmeOXOy4oakNAISiJJrPqiDjRCMjo1RqdZYWl7h5s2bLC8vgZRMjo8xWqsR+L7TxTa02i3WWy2U7zNSqzE9s5WZrVsZHWlSDUParRYry8usra6Q9GI8KalX69RqVRBFkquceZsNlDzPc7QCCxTlWtvnPPe6TWGXO6bOod83BaY3ebvY9G/9Gb+vaLVhJXBrhbV+h80A/Y1rWaFVMvgjB3/fdP0RmzzXTwqGHos7v7//YPM96//fBdoIJyMJRZN3rnM7jhwgIIVwruY9PKmoVSKqfojJM1qrKyzPz5N2OkyOjvLIAw/y97/4OX/76svct3cvxhg6SUpuDL6SpMCnp07zX37zD7z+7jsstlrUJ8apjY4SZ5ml/CLxvQCTa8uIEH0DwlxrkNZ5WXnW+yWNUwSCMLB69FmWOtMsS8nLczuLeZ7vpKIFzZEmxlhlu26nTZ5rtFCMjowwUa8hgdlWmy/OnuWNd97m9Llz1k3dCS7kzv9CeR5B6JPGPZYXFthdq7P9viPtk088/P89uX/m7P/9ziH4V91+9ID8P/2n/4S8/wEqL79AMrmVeGw6zY3cVl9febU3Pzt9a2UNlCKMKnhK2dJcljsukZ0w4zi2HbG5ddpbbLW5urTCe599zh/+/BYnzpxlrd1BhREyCMiMcaVIJ9UkRFnqkMKiZllqL3qtVrM2zgbXXGn5cpaaYiebXBealwFK2ZKdzrMSvVDCWojnGFZX11hYXKTX7eJXa1TqDZqBb0sRQuALqIc+0+NjbJ3awpbJSTypaK2vs7S4SKvVwvOtBmcQBgip7IJZ6PEaYzv1Pd8GZeLbeWzfEaEOzTjfFpDf8QXfM+ouX1asMwObueOVw9MMm0ykd93p77U7G19xt8/duAoMyMx9y3GXiIqwi6cUVl/VaI3nKSphSKAkvW6HxblZluZmMUnCji1THL3nMD9/+WV++dJLPP7gAxzYuoVm4JOl1mhKSUkYBQShj5KCtV7M6UuX+Yc//IH/9sfXuXjjBsbzGZmYJIgqVtav2wNhHfA8qfrNY2YAYy2PZ/B8b7I4yYLbmlMLI/I45ua1azSqVZ79yU/49Ws/Y9+WSS7O3uYff/tPHD92jK07dxDVanSTBCMEwjmjFoiH7/lgIM1SoNAjtsgaCDqdLpWowkhzhHZrnU5rnSxLmZ6aYteu3YSBT0MIwmoEWrCwtMLFy5foJQkjo6O2GlYcTRHRYkrerpBOtk0MoGdSOEOTHJ1ZzVvlW8t4IaVVtOl0WFpZ4catWW7MzjJ7+zZr3S74PkEUUfM8fGc6hhSOSmL5nAZdlvOHFnaXnChlKwbCFAu8GTbtoe82p3A9Oq5aJinQcDvPFKi4fR19HX1tMHlWfibGONm9Igi3ga4suJR5DqJorhJkWElGoZQL1u1IWckyzs/N8c6nn/Knd9/hT++8yxcnTzK3uEhiwK9UCCoVhFQuYTEY52JoMI4KZYZcWQu9dVNcR3uyypK8MJqk16G9soKvNU899AivvfhTDu/by3QUkOQ512/N88a77/Pn994lNtqqixhD5pDxgvpSKK4MheOi0L92nRbGYJs+czxPEvg+169dIwoCHn/sUQ5OTiKCgEsXL3Fj9hZxnmOkJAhCS/spkUtKI7sgDPA8j6TQ3BfS+hWIPn9cCVl6VhRj2rjAplqv4wUB3V7M6uoqy8tLLCwu0u310FIw2mhQD0Mr6ystIJVlGR4wFkZMjY0xPT3N7p07qNdq5K4vot1qo1OrrlJcC+XAACEkhdISWFEGMRBRlknMEJ3yLwjI7/aijU9/x+T/bYH2Zp8hNjz3LSuQ/ftdwKDvtUhutpN3/G3zUH3we4oeM+HmO6NNn2rm7pdCK973Ven1ksUxaytLLMzNknbbjDUaPPnoo/zi1Vf42Ysv8OT997NrbJRQSrQQBJ7CSMHt1VXe//JL/pff/Y63P/yQqw4ZrzabKD+gF9ueOyksXbCgvinnpJw7MyelFEEQEscx7Vbb9rU0Gvi+V5pLQeHGawFWg622Wi8P+7vWmjRJ6HZ7rLdaLK2sEGc5HSO4trzCl2fO8v5nn/P58eMsrK465bGArKBTSguYeErS67RZXpjn4OQUux58cO6rwwf/4Xq9duk/f/+r+RdtP3pA/n/+3/0HvIefQdz/MIsLbZZH6mTNyviOteWfxVcvb78wO4f0fCq1GlLYk53pHM+zWsdSSbq9Huvra6y21rk1d5tvLl7iq69P8MkXX3L6/DnWuzF+pYIXBGhhTSIKBCXPbLbu+5abJIRdzLrdLp7ymBifYHxsHM/zWFxcIkkSwqhiu8dl35nSjnHT7wx25ek8S+2ACiOCICTNM1ZXV7l2/Sqra6tUqzUazSZ+EJAbQZxbKsNUrcq+bTPs37efyckJhNG0223anXaZBBhRSMFZffQ0S0lTW1oJwxA/CJzjmr4D1Sm3v2A+2GxCHHQD/CGlvKGp+FveM4wkfL8oe+N+fL9d+q6pdePr7nx6AHjd/Ec4pN8RUZWS+J5CYsh6Pdory8TtdSrK49Ce3bz87DP86pVX+fkLz3Pfnt2MRbbElgOdnqVP1aoRgadopylzK2t88MWX/Mubb/Lb1//EN1eu0JyYYnJmG0EY0otj2p0uYIPxMAyt06gxpKmVDiwC0f4hio2HSR9/EU5m1EpV+VKRxzHryyscve8+/vZXv+Kxo/fTSVPe/egj3vngfWYXF5mcnkYFAYmr8BTfoR1XLwgC8txypQtjkUICFWPIspwwiqz2c69Hp9Om1+1QjUK2jI8zNTZGIwjQQjA5MUUvSzl99iy9JKbWbDpJK5cJalEijXmek+UZ0rNNbEUQnqYpWZqWZXd73WxHf5rl5MZQqVSp1GqgJKutda5eu8a5Cxe4evMmrW6PRBtUGGKkQHjKlmcLKoSwNBnbQ1AMIlHy25VbLEsOdUF5KXFx6KcOdk7Srgyss9wG3NoMUGWKANK93rhKgdMft2VfUVJ2pBRIJfpOsRi0yZ0DLggprYShFBgpyYWgk+espCkX52/z+amTvPXBh/zrG2/ywaef8c3ly3TSjLDWYGxignqziRaCdq9HL+6hAT8M8UPHs05TC54UCgpQgiqAdRQukxsnNZqlrC8v4+U5e7fv4GcvvsgLTz7JRL1KIASL3R5fnTjJn959h5MXzqMqFRrj46Uj6uCIL/or+ohjsdlzbdFzSzXJMitpWokibly9ipCSQ4cOc3jXLsbrdbpxzKXr17lw9SphpcLo2HgpYaid0UnxPWEYIJUky/LSl8Lz/n/c/dezZcmZ5Yn93Lc8+lwtQmsdkRGZkTqBhAYKVYWq6Z7uIWnkO81IszHjP9A1fOE7zYZGjvGBLz3VYkp0AyigEkAKpIzMiMjQWseNq8XRZ0vng/ve59zIyEygVHf1Nrtxbxy5t28Xn69vfWvZSCHJ3KzlkHmYfoB8TUpT7WFQKBZwXZcgCJhfWODJ/DxrjQZeuczolKa9FWwHz3Hp93sEcYTjatnSkXKZXdMzTM3OUi0VKZdKRt0Gut0uvX5PG7lZOrCzDMU0TQduwsL0EY3iq3xd+rI55un5ZvjI8Y+hifUryS9/z4D8Sz/j91jnnv3Sr1z0vnoJeuq1z8rfblqzs/5r0rTKbMAtKU3WXYtlSMCRer5NwpBuq0mv3cJGsXvbVl578UX+xR//EX/wne9wYscO6oUCoZTawDFV2FLwcGmRd86c4X/76U955+OP6MQRfq1KqVYDy9aAaJIaAEFoSVT0RlPTCDVyLwR5hr/b7hBHMdtmtzA2OkrYD7U7qKmns0zNhZ6fhTE301TBKIlRKK0UZFl0ej0Wl5ZZWlnl4fwCl27c4vyVq1y7dYuVjQbCdSkUi6SYon/THtLMe/1uh06zyf6Z6f7s8eOfXtm54xdrpeL8v/ma2/T3Pf7ROeQqTbn7737K4zPzpM0N5P/5X7L9xy+1D47V5ktegTTRuVlpFkoQOcdOWJbmsbkOnU6Xx0/mWVlehiSl3w9IlML2POqVGpbrkYLmXosUIXQQK1RskBSpXWuNfJuW5tKFA+Pj45RKFebnF2m1OxTiBNtzsZWmhgghsQREYaB3iI6D53ikMiEMA6IwBkd3kGK5SiAtltaW+fDsp0QqoRt2eenEc2ypj1C1LQIliAFhSSZqFd58+UW2b9vC4UOHePujj7h+5w537t8nBMamppnesoWRiQm63S7NRoNer5fzAS2prcu/jqn3tUw+8dUvUogvBuVf8VHiqRcJGBRnDT32he8Rg9lpU2pdDHjc2fuePocvaKqrZ4eZ6guEjKex+uFv2JzgR2VGLM8+BzOe9cZPSnzPhTSl3+2yurZCv9vGt2wO7dnDc0eP8uKpUzx38CAT9TpjZV20GUUxUaxRScexKBVcHCnpxAm35xc5d/Eib73zDp9fvsxys8XI1LR2m7QsWu02iUpwXQ9p2TrgDfoUCgWIFWGojX2kZeTNhlps0G4mFB+64cPFQt1eFytNmZ2Z4eSJ5zh69Di+73Hz5m0+v/A5nXab+khdp/TjUHMFU7H5fuQkTd0vpJB6Yk4TMw9IreqgBN1uFywL2/MIel3u3b/P9Rs3OLRnD5TLSGCm7HP80H5OHDvGhZs3iQ1vPTN9yRYnITUlJkXb1KdxqCkDtsSyXG1QBibrpTN2/X5fzwG2TZJE2LakWKtRqlTod9p0mi0+PX+B+/cf8tnZc5w8coQThw5y/NgRdo6O5kolCoEyc5tCG+mQGmdEjH6ztIaCGB08k1lk5x1Mt58OksH3nLxvi+ExoNTmO2uGlrQsHMOjNxB5TkGBrKjS8JbR83CsdEGWZ1mamgO0leL+8jJXb9zg47NnuXj9BnMLCzTabYRlUZ2cxC+WkJatnSHjmNigrMK4wYZRgJVKbNvCrRR1wW2c5AjrgFJldsLZeQOkKWmcEPUCxkdHOHroEIf27WOyqsdRD3iyuMz1W7eYW1xEeh7CcfLsZ94yQ3NO3lfM45kjq2UJLFsj+UIK4lgZRTBLZ4F6Xa5cvcILe3azZ3qGN157nc9v3ebynTuEYajpjbaDio0TpwTLdpDYRl5QaTWvVI9KISyTWdEc/mzDqMz6JSxt4JImMasrDSzbZmZqisqWWdrlEotP5ni8tEh07iyxSuj0uxw9sJ99M1soSYt6taYLz4M+3TgyXhgl9kxOUn7tNY4fPsb5K9c4+/nnnL14gftP5kh6Hey+T7FSoVQs6iJhyyIMQsJI0740si9Nn1X5OqwHwGC2fCZ8lHVtBr83veprFrFnxtPq2c9nWbGnV4EM5Hn2V4kv/vXMF6rB531NPD78nq9bozM62xfbLtPS1n1GmS/WBl16g2tbmR297j/dTpt+r0ev08EWMF6vcezwIV5/+SVOHjnCwR07KbteHhY4QEFAXyhW211+e+Yz/vyv/5JzV68QSYtte3ZjFwp0u336/RChhI6RjBtumibYrjRgY4JKTCAuBHGaEPR7pHFMtVRmdnoG13FYWVxCxXHu0omJc2ROj8pqPwRBGOE6NoVCkWKxSK/VYmN9ndsPH7CwugIIwjghStNcQUYJE3OqFCm1ukuSGPBBCAqeh+35j2PLPp8K0fia2/MPcvyjI+R/9m/+jKjt0b+zSnDthuy/fESlLx4pHl9eORBevLzr0r175UKpSLlaIQwCFFqJITZqJpZl5TbS0rLodvs0W22CKMb2PAqVik6DWjLnqWqed5rvrPTilOmpZo51WqIrCmN27tjJli1baDRbtDsdInNTMk67ZQyDEiPxZMtB1a5KM36jMAZENtLwv1vdNo/nHrOwsKglhkplJkZHKRiOrlLgSkHJsZmq15mZnWViapqRkTrSsun2+/T7PdrtltG/VTlfTwNdOh0khhfcp49NlI+vPrKXPv3qwaI4+P9Xfs4zvu13BBrMCRgagRiiEojBRDSsdPJsUOOLE7/I//769vhasGIofSjUwCVUCp19sS2JSFPCfp9eu02nsUHQ6VByXfbv3MnrL73IH33/e3z7tdd49dgxdo2NUfE8LDSCmkQavbQsm6Krke2lbo+PLl/m5795m7997z3OXrnKRq9PoVKjPjoO0iIII83ZE3LQR1RqCoOH0svWwP560Epi0ybKTOd5ayg07ca1bVbm55FxygsnT/JHP/g+zx3ciwJ+88GH/Me//Aua3Tajk1Mk6CJUpNS26Qhs48abZii9kSS1DY8WpQzNR2n1jTih3W7h+R6+75LEEavLyyRBwJ49e9k6O5tzqD3Po1itsbC0zJ27tzVn23Vy1Egg88BfCUjSOC/4zN0Ch9xCpaEMZEWXGRdV2jaWq01a9IKiAYJWu836RoO5J/Pcf/iQ+w8esLCxxmq3TSQl0vH0hkCY1s0XGdNHBTmanmlUZ309i88ZQtsH5ylzKkTudJq94enxP4xYisHzGaNHmXMQ0tZOrkJTb5RlEQKtKOLB8goX797h7TNn+PlvfsO7H33EJ59f4N7jOTY6XaTr4lcreKUyluOipJ6bM8qdkCKXN1MqyWkajm3naW0pNM4/CJKERsiNNblKEtIoRMQxVhLz0onj/Ms//DGnDh6g7jqkwHKjxfkrV/jZr97i8u1blEfHtHW3QXZFtvkwqC5k87npE2YUYEaAvleDuSdD8qXOv9NY22BmcooDe/cwWavSSRIeLSzQaDTpdLv4nmeMSSyNHkoLx3MJTNGntGxtrGQ+O3NSFVlfyc4DUwMlIDb6zVJo1ZhM6lPaFolSdHp9niwusLC0SLPdwi0UqFTr+LaNa8n8moXS9BfPsqgXi8yM1pnaMsPk+DiTE5PUq3WKxSLdToeN9XUaG+vEYaSNz1wtH5rPsjKrBcuCrs1rxmAu3nRJXznxfu368SUvEF/z91C+6ff4smevb896mxJi03c8/X3D//9d1sis7Ya/T5nBm1FW9IMpQilsqWlVjmVBmtBrt2msrdFpNnCkYGp0jNPPneBb33idH333O7x+8hSHpmaoZ+pYKCw0Pa4bxVy6d4+f//rX/MXf/A0Xbt6gm6aUx8fwKxWErVWLojCGRKPwVjaC0hTLlgjbIghNzYjrYFmSKAjZWFujWixxcN9+Dh04RJIkXL9+nU63h+v7SEtrl6tUIQ1okZi1RVhW3jIItJmclARRRJykhHGs1aqSFGXbuIZNkaQJidLjy5JG+zwKNR0wVYg4YveuXedrBw7+xTXh3VjvJr1/M/LFIvt/yOMfHSEHoOxBsS4oWRalYhpC2JfiNq71sOTZ054FpJqrJkzaNghD4iRG4OG4Hp7n43suSRASByGFYhFpWQTGISxOtIa343qajxcGWkrK80jSlDhNTJpNd7NSsUyz2eLx3GMOtZrs3beXwwf3EwU97j18RBQGFEolXN8Dqe2mHdfL9U8jY2gkpZbcSk3xgZbmEcxs2UK33eTx/ft8+MmnNNcb9PsBrm2zf8cOikJol7kEbZONYGp0hO+88hInjh/j5MmT/O277/LJZ59x5cYN1peXGB0fY2Jqmlq5RJIm9PvaSSvV3qe/Iwz+ZcdTb/7dI+jBJwzNcnkQPYSKf91HPvP0803Al5zf10H1m6r8h89CfOGlXzgRMfzM4L2ZfvYwTUhmLzEToQpD0n6PTqOBpRQj9RrPP3eCN197jReff569M9NYaOQhMkFomiT6fKXM6Voh8KjZ5uylS/z8V7/i488+Y3F9HbdcZvu2PThugX4/ZKPVIlUp/lBleppEOtUnLYJ+gGVZFIpF4+CYMryxGLTD8LYne1AhhMISCktB1OtRHq9w+rmTHN6/FwtYWm9w585d7j14QHl0hHK1ykazRZKkWELzBzEIGokkTZJcb9zKJlSleXxRGqOUdl/s9WM63S6VWplypY5IU+ZW17h2+y5nL1xi19Zt7JieJAQK1QpvvPoKV67f4Oxnn2JFMTJKwLINUq41Z/VckWilGmFMTBLtgpsFttnGQAiB63k5b9GyLRSKfj8kjiMkUKpWGR8bQyoIez0W19a49/AB777/Htu3znLi2DFOnTzJ0cNHmJwYZ2JklILjYJugX1p6yVNAjMqzB9lWMpMXy4PtobuTSc0NUO2heyqG+vpQBJAaVZPBYgYIK/87K/7E/E5QtIOQ5bUN5peWOHfhAmc//5xLV68yv7yCdBxK1SqTM7M4nge2TQr0en16/a7hHOs2VWpQx5M9FqfavAmVBYaD4Zfpj6fmmoVpH5UmhL0eRctiz7ZtvPHCC7zxwvPUpaSPNkt6vLTI1Vs3uX77No1Ol+k9IyTCohf0jbb4QFJN6cZkU0ORbXy0wkkcRrmUppb/TCFV1OujdBsNbt++w+dXr3P69MtsH63y3NHD/Oj73+M//OVfcuvOPUqeT7U+iuNKGs0WKo1wpUsSa0lb27KRtka+kyRBGWRRWrpAUijI7O0t2yZONbe2XhtBSkmr1WZ9fQPHcahVq1QrNXrdDssL83x64RJLyyv0eyFBGLF3x3amR0ZxHJeS45IopWU2u12UkLiey3S5zMTJE5w6dozbj+Y4d+USv3r3Xc5fuMCT+Xma/T4lz8OrVrBsmxDtfKjpbQxZxz8NGA36o3hW2nUI1v7SNePvtJh8zfE7Ak6Aob992Woy/JlfRL6fBj++5hO+8Ao1mBz0o2pwFnrzRr6ZRaWoJCJRgjgMSPo94m6bSsFn784dPHf8GG++8QZHDx9iwvMBPeY7mHlFKRIj13nlwX3+81tv8Vc//zl35uaY3LaF2YlxEilZWVvXcqCe9sRQxtjHNdKqkdIgZ5qmBKEu7CzYllacimPSIGJqbIKjBw8zUq/zeG6OVqtNlCYUKxUyxRiVarnaVClt+Ca0hKLjGw56p4NKE1zHplKpavDUcXRxqFLEqRboCMNQ+xPBQKFGJShDffGkVoKytm5Z2qjUbodXHnRY6cD/5Sdfe5/+Psc/PkL+Z//GImpCI1A0xuBbbyjvpV1if2u+P91c3+7Zzql2s8Haxjqe52rdYtPfBtI95EGenic1epJZ+mrkWhfMaB6mQAg1pGQAYIqHzOd4nkcUhDSbTUqlIrNTkxzYs4fm+jqfnztL0fcZGakDevFKDTKWKK18IoTUE6iQuvo+SZG2BKFVEzTKIvE8HyEk/W6PJwsLrKytE8UxtWqNkUIBW+rUS5QkejcrBEXXYXKkzs4tsxzcv5fpiXFsFOtrq8w9ekRzYx2lEkqlEr5fwHbcnGupA+EMRTOp6GTILEDqSmUTrZJxzVSa6fFmaWty1zhBxkU1N1VgKAwmMJUSYVwWM01PBAhL5gjBcNVLmn3eMD5gAudhVHz4ECJzJBOmSMQYreSavQalNsVolmX+NjPfQJnAbKSExgWzH0wBTJ7mNwu1MAVW0rJQAuJUc4kBLFvieg6e52JbFkGvx9ryIo/u3Ka9usJIpcy+nTv41muv8Aff+Q4/evNNnj90iJ1jo5SkNl7JAvmMF+e4Nr6jCzdbwLkbt/irX/ySn//6V5y9dJl2GFKoVKnUR0DI3NAmMTr6Vq64M7RpMJNZXtluMkCZkYdKldZzVSLn6SnD4U7TGMuGSrVEu7nB43t32TY2wU++/31+9J03Ob5lhm4Y8uEnZ/n1Bx+wuL6KW6rgFUtESeaamRXLSXOr1cBj2SC9eZpXmfFuxq02fTD24iZIch0X1/VZ22gyWqtyZP9eQiAKU0YcTfPpdns8uHeflZVl6rUR/FIZLFsXGqUJltRBnSUErvEj0IZhac5XjM04tiw7D25lVsxmFqusWAqh3e+iNCFRKcKSuMUCkUqZW17myvUbfH7pMpeuX+fB3BPWGi26odbeFY6DLwSaeKIlE20hNW3GGHuIjIueocYqH30DVB0dOOa8eZE9P+jPGETYsqycT5oXiprfgUrZ6Pd4tLzEzfv3ufnwAT//zTv8+V//J97+6GPOX7nK/bkntPsBjl+gWK7iF8tYtj0IbDPut8rmEBOGZKc1gL7zwFszUvSmIIpCowmsVXmSNCUhxbY1RY84YW1pkaJl8S//8I/40+9/j6lSESE0HbCXRLz90Uf85S9/yeOVZbxKldrIOEkKYRjn5/Ks4G8zIq0fSc0cIqWR6Yy1aUjBKyAR9DtaLWZ0bIIts1uYGq0zVavh12rMP5nj8aMHWunLdfCKPv1+T3NXLYs4jjWv12xccj1ps4ZJSe4Am911JXIlXwRyaM208uLorF5BCAlSu1Pff/iQm3fuEMQxlXod2/Mp2ha2QdZjsxa4loVv5qiSFNSrZWYnx9mxdQs7t21nZnICAXSaDR49fMjS0hJhFOEVfIrlklYnExpsSlSa044G87swS4KZGcycLmCTGsiwionO8g3WChjac+ZznXld1l5mfsk2UQO4YRCMPX0o88GDmHeoP2RjKzuvbF1Ug66UZa2QghSjsjQ0BnO/ADE8N5KrvajMPcfcWytXZ9Kb9iTV9u7KbH6ktPR9NwZdrufi+S5CQLfTZHFhjoW5x4TdNtNjIxw7sJ/vf/ObfP+b3+Sbp09zbNcupnwfoRRBFKGEwBUST0gSBI9Wljl75TL/4Wc/42dvv81So4lfr1EdH8NyXaIk0YZZQuAIG0sJLAUiHTJ9EwrpaGCk2+8ipKBcKNBtdwi7PUZLVb7xyqs8d/wEV65e5bPPz6MA1/exNzEeTLE5aMqaGROWMP9PdS2NRAM9lmXnYyFJFGmq4w/LsXA8j06/R6fbpeT7FD0PoVKa66sUUbywbz+db3/rN789eOjfLy51omS9I//NSwf+Llu93/n4p0DIBb2WYPS+4g0/5dhZQsZ7VyYLn1eOnTj3nBJ/On//zujdpXnqtTq2Y9OPYq3rC1q71wQIQRDmk3c2aaU571HbVqskIla6cwiTKs8WIYXSKJh+B7bj4HouTx4/5P7d25w4fJATRw9y+cJ2Wt0uQbuBXyqRqJQwSZG2hbAtSFKTjlfYSg8aaSmjQa6Rv3ani+/61EcnKBXLbKyscPX2XZaWV5lfWmGt0+P10y9QL/hUCj6OoxezWOmitslCgek9e3hhzx5eOHSYDw8e5KPPPuPcxYusbmxAHBO22vRokwoLhNZyzyqRFRp913NAOpgkyLj6ul/lqfosQAcwAXOS8W5NkEB2T4YD+WyxzQqtEHmn1/JpRqVgCAnJU+pDXduszeQpiC/rTNnKY15q5WDLcCHbAKHXH6sRXimykC4hk6LLJ0RJvulTKts1p7q/KIm09SZGGg6rjntT+r0uaRhBkiLShFqxgD89xbbpKV44fpxjhw9x6shR9u/YQdX18utIU13HII36hmXLfMJdC/o8XFrh1uM53v3wI9778EMePJkjBsanZqiPjILUKJvWcNUKDIONjRq0s9nF2rZBYHP7bgEJRr4s4yAO7oXmymbFNIIo7NPvtrBFwulTz/GH3/kOx7ZtQQBPVlucOX+e+w8eUBsdR7kO/SgCIfMNR2aDk6axGY9iwEs3r8kyD7rgTXNtLUtSKhVJVUq318eyLMojY6go4sL162w7u43nXniJqXqNglkRXzh6lDiMaa6t8ttPP6O7vo6PRBZLCEsgsbBJCeLQ0CWEVqCwtWscqUb2LKnRcJ2pE6bILtNZJi9GilNt2mKiT9xqmWK9gue69DsdVpaXuT/3hMs3b1Epl9kyPcuubdvZumWWndu2MTk2xtjICKP1GqP1OpVCAUeAY4pKbcMBzaQAc7pLfq+GxlCmcZiNl6HnFAPpRK37nhJGkU7phiHtfp9mv8fC6gqLS0s8mnvM3MICzXaXKzdvc/v+Q0DgFUuUSyVqo+OUS6U8qAyCQEuWCaF5+ZDTg7Lvz+71cCBkS5ssiMra0XJsBJI01htpaVtGLjCi1+uRBAEj5RInDx/i+6+/zO7JcWJz+b1+n6t37vDemTNcuHmDYn2EkbFpbT8fpZvnlxzl0a2VB+rmjBh6Ro99uakxVWok2i1tiHTnwRwfnjvP7OwUp2enOLp9Gz96/TXWlhf5/Np11taWEI5EOgKVKIKghyW1Lb0OODOxy4EzrsiyIHmRjEbnldA29bGpe3BsB9fRFKogDNFUMJtyfQSRpvS6He7OPeb2g0estTqst7oc3r+PI3v3sHVinLLtUBTCFGHrz5FKSwdXLIvK6Bg7Rsc4few49x494pOzn3Hh8mUuXb/GwuoqiRQEnTZJEpEgwLKxXdfIJJr8htLgh9kqku3KhQmcNf0izcEXPT/rI0U/hvo60uLg/imlTGG1vrepSgfKL0PR/PB4eqq3ktdrZPPVcLCenYIaBOdCDK5M5mvrAMQa8rEe3o7ma1aeTTLfnRrTH2BIonMwBwghcRxHo9JxRBT1TW1KSBL1KXsOo4VRdm3bykunTvHckaM8f+w4sxOTFM2ZRCZDkqYprm0TA6udDvfn5/no7DnOnD/P+599yvzaGlOzWxidnEBYkm4QEARaHlMikVl7G7t7laZ6QyaFpgKrFL9YwBaCKIxYX1mlYDkcO3aEU8dOUCmVuHnzJjdu3mTbzp2acx5rOdBcFcssc1KaWoU0IYl0n/FdN7v5qFQRpRFKmfU229qZzWySZg65Etd1sBAkQUDYblMsFNJ9M7PrZ3buuP1gpBoQbFBYeeDybMuHf7DjnyIg18TrI134f16GbWfp8x+TT+r/X+VMn7rx7SsXfuuk4RtSJaO21JI6kVFBiA3PzvU8hNC65FEYIoTA8X0sKYkjza1OSUlUQhrrr8tQgRwtJkOP9DBIE80NL5YKtDsdHj16xOL8Ant37eaP//DH/MVf/iUPHtzn0PETWnKwHxj5Mx/Hcgn7ga4AlhLXtnAs26TawTZcqlildPt9RKJw/CLlkVHCNOX6nTt0uh0eP37EyaNHOX34EFtH6qQY+kKS0DFSU7brsmVigh9+45u89tJLXL5xgzNnz/Lp5xe4evMWy6urKMthZGKKaq2GV3JzyoIQoCyDfQmtoBDGMUEYoJFGB2EZekS2k01T0iQhjiNj8xzj2E5umyzSVBtUQD5hKLNpygxDpGURRxGJ2TVnQWw2BT+LKjEMVDy7EGaAumVa9UJoVMkSlqF8pKZYd1CclqGdtmUjXY1uhlGkeZOmAClD2wV6kUxMYWESm0BLgJ3aeuDaFp7nIFRKr9NhbWGBxuoaQil2b9/Gi88/z9FDhzh19CjbZqaoFooUHFcXdGHm7iQl6mveqON6eAUP19JGJWtxzLlrN/j1Bx9oNPXJE9pBwOj4BMJ1sRyXXhjq3X6iBhOzGlbiMIcYeiRHXDRtRCWKXl8bBlmWjWP40EmitZalFLieg++5qDjiyaMHuELx0qnnOXn0OOPj4+C6rAYxd+7cZX5+gW6/jyoWtBunZSHSZGj5UYNzytK4ebSoTM9QOTouhcTKhLSFGbNGAivqByRhSAI8nJvjg48+5HuvvcT0xDh9BQUpOLh3F3/0wx+w0e7w4dlz2N0+49u243s+UqTEYQ8htIV0HMeUK1XKpSJ9s8DEUYxf1Hrk3W5XV+HbzqYgbVNcl3NotbBhlCqSMEQ6LuPTM0xMzej+Gcc0uz0+vXiRT86do+i51KtVauUyO7Zv57ljx9g2O6v1n0tF6tUK5VKRcrFMwffxXDtH080eksj8zhDuwXKvH0+AIIUg1nNLEIX0g4Buv896s8n6xgZziws8ejLHk6UlHs8/Ya2xznqjQavTI4xj/EqVHfv2EyuddralRNoOUZISp9rPQTtMmnucBRTZLpfNaObmBlT55rHb62HbFuOjo0RBSKvRIo4TKvUatVqVpaUF1paXkHHMN158kT/5wx8zPTG16WM3Wk3e/+Rjrt25hV3QbqCu7xP1Y9I403oXT53DF/6z6REhBbawcyDCcRziOKEZtCgWCrieR6fT4dGTx1y6eoWXX3yRg7NTWAKeP3GC+3Nz3H3wkIdLS1iOS3VkDMuWdLtdPFe7nmo/DJW7c+qIn3xyVEOnPJgj9djRIJVudw1UyLweIDXZMbdQZGbrduKgz925OVq//AU3bt3kyfPP89qpkxzeupWa5yFc16j3hKgo0q7QQ2BCxbE5vHMHM+NjvPziae49esSFq1f5/PJlzl+5wvzjxyRpSnVykuktW3E9XyOvalCPkSHK2SYjzeZ2o7ueLwhS6etAU7t0n9d9K1WDuhjdvzZ3sHzzl2YOouRrRwZEqTyoHbw3zb5BDV4PPJWBZBPqk4FB2XvSVKGkRmKlsHIN+yS/viyjIZFCIYWlNx9Z5tfEAUmSEJusnlbf0XLHlimKTow7sGMLkkjR6bRpbqzT67QouDbTE2Mcf+EFjhw4wPGDB9m7Ywfj9RFGSmUcIIgTwkjX0li2TcG3cYH5ZouzN27w4Wef8f4nn3Dv0SMCYPvuPdielhNN44gojPQ5iEzq1zKbV4ESkjAKiWK9oY6SGCUFY6NjCKVYXVqmvb7ByPQsRw4dZGREU1Xa3U7uau15vq7Xy+s88t0PQoJjKIdRHCEtC9d1teN6YlSz4hiUwnIcs/HXaHkYhnT7Ca7nMlarUfI87QeyvkbBdRmt1RpJFP22n3KTOGLk7kXqZ98L4f/6hTniH/L4p+GQg+Shgv8lSPk/AAcWFKSsj5YuNg5W/9f9zx+eTlLvpfnVFUS3S7k2guc6iDAiiMxO3/WwHM2rTZOUMEmQaaJ3zEYvVxhYOAvQpdJSXgizQ1J6gkuFRsIsaVEpV1lstXj08CHnPz/Prj/+Y/7gRz/izt27PJ5fYH1lBadcplopE0YxUa+HZdl6P2toDKn5jhz1McFdqhT9ONZFAr5PxXUIez1WWi0WV1aYX1ziwdwcK2urnD56lF2zM9Q8j9SyiNDIm4pjPMuiXCoxUyoxc/IUe6anOXnwEOcuX+Xa3Ts8Wlik0w9oNdbZWF5ESInvFyiWS1qlxraNNJAeOOVi0aSBtV57GPUZRsylSYO5roP0tT1tGEaAQTEEGv0UGQJvdvoGnc4cCTPd64G6b4YUDDrGgL81QBbygMIE8fkhMuxogAuqWJGgUV+JtdlFbujtKtW6wwh0oRnkbRJGsbkW4xwpJa7r4mcSTcZtrN1q0u20SeII17aoFArMjo5wYvdupiYmOHboMCePHmPfrp1smxjHZbM7YhTHRFGMZdlIx8GzJZ7jkEpoBCH35uc5f/UqZy5c4ONz53i8ME8iJdWRMYrlMphClSgMEQgcz87gfLLSIa14JYYaIGuqQTta0iIlhVhTBBzH0bKcSWI0wXXVudYDhyjs02k0md2xnTdefpWXnj/J1pkpigJuPnrEx2fPcuv+fbr9gGqtirSdAaq0+Q5++SEytFFLuG3iRA/lrYWUKKkVKYqVCvcePOSvf/pTtk1NsHdinMRsQiaqVb79zTdYabVYXl/nzpMF1peWmN62jSRV9ALtHld0PXPdCanqgxI4ljacSKMEJcB1XNOMm4PxL1dQECYbkVkx29iWg1C6ziRKEuIwoB9HdMOAZtCn2Gyy1Gxy/d5din4Bz3EoFAtUy6Xc6r5arlAsl6hWKhR9H89YTSuzmdYBeQY+6PRtGER0g5B2u0On0yGOEzYaDVbX1gjCkH4U0e33abRbNNpt2t0O3X4v1+gWnodbKFKo1iiUy7mJEOb52GQMktQol2SBzhdv77MPNdxHBJ7rISyhLd+TBGnbFF0HW0Kv1aK9to6LYsfWrXz71Vf49quvUC9onE8C63HEx1ev8psPP+DBkzkK1Tq255IoDTJgELzhjcLvegy7Bjq2Q5ikeu4oWRRLLmEUsvBkgTv3HnD15i2O7NzGjnqZgxOTvHrqFFeuXaN15gztRoNCsYRXKuN6bh58WTKjZakBk0ZPsFlTDU57aGwLkaGzavhk8wA4TsglNb2idkeNkoT55RWazSZPFhZ48OABzx8/yvPHjrF1coqaZSFdSSBlnl1WSrux+kKAZVGu1Zip1dgzO8v+nTt54dhxzl2+xNWbN1laW2NxZZXF23cIkxSvWMT1PPyCdgB1XE/TCZQgMgYyURiBSrGzYtOhwFjXFyiQQ4W+aoBjD+orDMUy61hms58H3GadzpTWchqXGh7bg5GuhhWO1CCwzwPyob6R3aUsoFfaWjl3YtU0VzmcxCSfK0x2MI1CwjBECmmkjW08zxlsCgzNJU0THeyGIUGnS9jvY0tB0fMYr5SY2LGV3du3cfTAfk4ePcL2mWm2TkxSNUaGcZwQRDFCClzPRkgLATTimMfzC7x/9iwfnD3L5evXebK4RColpVqdYrlColJDFTZUXSwcoSVeM652NqYtx0ZZUtfbCIljO1gKWo0m60vLjI+N8cZrr/Ht73ybxfl5fvrzn7G0vER9pI7tOUjHiAuY9kqVllNMlW7XrF9Ly0YJNE0yjk2/12CatAxAJIfoz6kijSPcgo9v2wTtNq31dVQcc2hmhh0nTy1fO/3CX9zZueMM7RZee8PxG8sCCL9qjvj7Hv/oAbkJSCQPgP+7CR/+Jx+l2nLVT5evH97x6xOUvuck5Zce/fa3dHo9/KIuplSeTZQmRElMEoKXucHJhCDUBY2ObeWpRI0MiJxHKYYmLUxqHvQYTFItp+N5Wo+y1e1y5tNPOXHsGD8+dJjvfud7LCwuc/n6NYpKMVmt0gwj+kFAYgoFbMdGqJRYJajI5C8FRvvTyvnUSghs25gfeS7CkjTCkAfz83T6PRaXlnjw+DHffP11jh/YjycERcfBkZIwiunFIaEp9Cv7Pid27ebort28evplbty/x8Ub17l26xY3bt3k4ePHhGGMjAIIbRJSUtsmVRAlKbbrUiyUSJXSlceRIjKLn0ZnbGzbwXVtbMfFsW1CFRAGQc7l1en7ATKQIxGKnIueBbbPEnNKhyc/NZhcs2x7rjuhBAOTcDNxwoDyArkihx6URt4p17xWucpImia5trtjadteEo3gpkprAwsUSkpsJbGEQkhLV5gLhSLBVhFOGmGlCWOFMnt27ODI/gOcOnac3Tt2sGvrVkaKBRw0dzJIUqO6ogPLMEoIwphCwcZ2LZSy6ABPlla4cfcuH3z6KZ9evMDjhQVWmk1iU1hSqJSRxjgkSmKSVA2MoZJEU2bEUID4zEIiBpNamurA09bpZNtx9MYS3X+zav00Tel0OyS9LpO1EZ47dJTTJ06xb8cOihL6wPWHDzl78XMtLWVLPSak0C65zwh6vioGypdTZfqIMAhhislmaOTFdiXScXBlmcVHjzh7/jwfnz3BoQMHGKuVcS1tgDJdLvPmqy+z1mry01/+mjuP54jaLSKhN6Ou6+I6LkkU0e/1CIIQ19aa7ZZtEYShWbA8kjTJi+i+HEdlk8yaSpUmR6UxcZRowx0hKVWrlKtVo+Cii9ktKel1ezy4dZug00Y6WoHAtm1s28L3fUqlEoVCgXK5TKFQwPNcI2Fp5WpSQmTKGSlJHNPvBfT6fTqdDt1ulyRJ2NhosL6+QaqUVuYwajSO5+H4Hn6tRsX18Hzf6Ppqab4w0LJ7mvqlBqhmzhEjrw0YimGeefOH+6OOm3RkWSgWidOURqOFbVmUinrB7HXaNDc2kFHE0d17eeOll3nz+RfYUiwSolfJGPj04iV+8fbb3Lh3j1gIRupVHUD0ushU5PSFVBha3e9xDKOlukBZAwCZbnipVKZYLtPt9fj8/HmObp9l68svALB/6za+9+abdMKQzy5dJuh1wJK4fpEwjIiTGNt2jMxiFpCbQPgLyHg20IdNd0xjD80BKF3wr1Saa/9LU1g9Nj5Ov9umsbbB5es3mJ+f5/qtmzx4PMfLzz/P3q3bmBwZQTruUIZLQRrrTYBlIYQO4uquR33bdk5s284rx49z6+FDHj2Z56NPP+W9Dz5gaW0NR0iIE+j3dTFslJC62vguA5otWwCaC531Cd2/kkHbGwEDATlwlNMnk6xuTA4BZNmaP2gnbbhknEbz7MPg+aFYeYiXziDzM9SpB08NaCzDgJEu/DU6/1nBuBxqUUWu5a5BsoQwDrGlhYuDbTs4tgVp5nsSk0ShyUBHkCSINMJSMfVihT07drB7+w5OHD7M4b172b9zB9Pl0qYek6TQC2L6YUCxVEBKi16SsNzqcPHWHT757DPe/fhD7j56RKcfUKxUGB8b1RvbRHtREOuCZtvU0tlSq4HFaZzLEUopcR1X0wPDgGLBp1Qs0l7fYG1pGVdKXn3xJf7gRz9k27YZ3n//t/z6nd9Qn5pgcuuWfOVPE5MRMfcsNYZCwsQEGPWWJNHF0YO+rhX3sj6W8e6FEHiOjWOBKxRRt0NzZZW0HzA9Ps6RQ4c6zukXfvvuiy+8c0+w4bfanlTSi/1Swj/3gHxC/9IiAZCE9w4SvfcNQeM3fmNnHH16+GRz/MDi/2v64XJ318Md/8dHj+brnVaTOC5QKJcZrdfohzHtrpb/k8bVyfU80iQhCkOkSLFsKy8eknJgJpEXHwrtupkVZAHG5UlRrdXoCMHtu3f5+JMznDjxHK++9hobjQa3bt+msbqmzX0sC+W6RLEuItWV+nrhjuMIJ0tpKYxyAgYp01qcCnBtm2K1iu06BN0OvSjmyq1brKytsby2xvyLp9m/cxeHtm6hVijguA5hqgtJe50usWVRLPhYAqarRYoH9rF92xZOn3yOR0+ecOv2bR7NPebug4c8ePyY5cUFukGA6/sUyxUqtRqBEAjLxpYWjm9DqWgQlYFLYRRFNJstoijCdW2KBT83bElN8ad2AjOTkdSTl0bFraG2F/nfA+QhQyuMEQmDIGIQJG+e+LJjExIidB2AQA/aNEnpG+OkDEXKJ27LwjHFr70gQAiB73kUS2Vt2Q2kcUzQ69LtdFlbXqbbadFvNXFsm7HxMaYmxtmxfz87duzg4N69bJ+ZZdvkJJMjoxR9X2+iGEzoQkEQhfRSTb2ybZuK5+IYlKcZp1y6cZ2333+fcxcvcuvBA3pRSCwEpXod2/e0ta8Q9IJ+bljjONrgIY1jhKEmZd+aooONoRbLs3zS0ALiUBclO66DkJYJ9HWwZUvNWyZN6Xc6rC8vU5CC5w4f4rUXX2bX9p3UfI92kvBgcZXPr17j/qOHxCqhUC7lKKJKhjiv5lCbz2rTb12wY+kxptC8w1TT0IZTxjKjsxgjIc/3aXc7nDl3jn27dvDjb30Tr1ikYz5367at/OgH32d5dY3FpSVWFuYpjo4yMj5GJwxodtpYCK1kIfV1x4kpUDIZgsSkdAVPmyk91TefekoXJCqj8pSSJiAtiStsLNvGcizS1CGKIqIoRNg2M9u3A4qswDorZlJAKARh0KcR9M2Y0xSjzCxMykGGJwcpxGD8pammYxVG6tQmp7QylHGpE1JgOfq8ZJYZUdDv9ogjzaG3TFF8nqfK51aRBy+ZbffwaB8OvIfjxU19IY/pJWkS0+v3KZeKeK4LaUJrY4PG8jK7t23nzVde5cff+y6H9+0hGfrMdhzz8flzfPDpJ0RSUK2N4roe7U6PJEwoWJ7m4QuBZpQ+Cy549o3NEM9sQU+MT4DtOgSxNhkSQK1eI40iPr94gWO7d/L6qZOUXIuxkTrfeO11Wv2AjVab6/fu0u71mJiewcqcosMAC6nrGfLVY9CEm7n4alAuoDQnViqdXUKasS5NYeeQSY/AaKpbHn6pjGVZ9DsFwjDk1t37tJot7t69x9EDBzj9/Cn27N7NtO9jI0BYJMLUgSQpSigTH4s82BwrlfD37GH3tq0c3LuHH7z5bR7MPeH2/fvcvneXqzdvMf/kIb1uB2wbt1yhOjbGyMgI9ZERMBvTvN+rlCQRpCbQy5y3sz6e1S9E4cBUKpf+0x1/0P+GHpeWxPZ0phRzXwckKwP+CBB5I4v8WWXadNP6lO0qBEPfn5fW56hT9p7B5iqLTSyUSvFcn7GxEaSQRGFIEke0mm3CXp9+t6ulodMEW9r4vo8tJXu3bePgvr1s3zLDzq3b2LN9J9smp6j4HlXPBQVBpFFtgY6DCgWPQsnDBjb6AdcfzfHh+c/58NPPuH7nNvMrK0jXpT6h/RZs1yGOI4J+X1+RElgMDM0EUve1RKP9SoAtdAZNJQlJEuM5LgXH5f7CAkG3x5FDh/jOm29y+OAh7t5/wOWrl0iDns4K+B79MCA2NSSbqElSYCFylSiF3sgkqc5oahBDgypKQRzFGkxIdS2V67qUigV81ybsd2msrrKxtspsrc6xAweoHT7yHx9u2fr/mS8U1kYeLTh7f/GbSmN5tdMrFvq/y3Tx9zn+0VVW/t9/9me4ID1QLqRi60mYel54j+9YYblEc++rYa80Pu/61vqOVvdwtd/f2QoC0Ww0iKKQQqGgjYKUNkFAqU2udoPCMJWNB7OT1YB1tpgJKY3jpU7lCamdB+M4olwq4dg2S4tL9IOQUrHIq4cPsH1sjEcLSywsLbGxtka5UKRUKmJZJjVjdmppVhWPyGXmsrRVZpSQptpNKlFKbyo8TzuLIuj0e6xtbPDg8WMeP3nCyvo6QZLiFAsoy6bgOHimqFDza4VeSJWi7DiMF4tsHRtl59at7Ny5nV1btzEzMclItcpYvUqp4FMq+BQ9lzgI2Vhfp91qEoUBcRSiiy8HfGvLyiq3s0lPB84aec2CZX1/dWpQDa2qA/Q6Q85SlXEEyRgWAwwhu2lqkJ3NkNKnSmf0fc446Xo3lKN0eSmUEKQZCiGFRnLMj2XrSnVpFiaVJAS9Ht1Gg/bGOq2NNXrtNmkcUfYcJmo1psZGObh3D6dPnuCNl17izVde5ZuvvMJrJ05yZPt2ttTqVDwPV+qCFn2RenOjwV0FUmoepi0JlWJxY4NzN27x3plP+ZvfvM07H33Mjbv32eh2kL6PUyzhl8u4BZ8Ucn1xAMdxcG0XidAym6nKrycVGunZHAeL/N+sPWMTTHi+R6xSev0e/aCPJQXFQgEpIO4H9LtdVD9gx8wsP/nBj/jhm28yNVqjIgSPG03e+fBjfvXee9yde4hfrWiXNqGNHpI8AHjqHj4VtYqhH2k8BBA6VBK5bIHuF1nQlw1wlWptdN/zePzoEb1el+07dzAxNYUL9FSKJySTtRq+49LudllaXKIbhtjFotajTlKSKMK2bVzHMRsW7dbpeR6WbWtDlqHA83cNyDOeqsxpW0PzkgmS8v6baqOZUqlMsVTWzr++j+v5OJ7JrNk2SmhN7yCO6QUhYaQzJrFSRIZCEUYxQax/YqU3aVgWwtYBt18sUq7V8Ar6c13XxXY9pO0YNMk4LRpX4SRKhoKPDIgQeVStAxdpfvLb84V0yKaA/OnHhR6/cZIQpymOY1PwPESS0NpYJ+50mK7X+c7rb/An3/sup3bvpGjb9OIUXwrW2m3e++ws/+5n/5nPb1xjZHqaYq2m+e1JioXANd4RKemgjuF3OfJAWJHpwGcBrmVZRFFW2wTFUhEU3Ltzi5LrsH/3bkq1GhXbZsTzKJZK9OOEhYUFFpeWSJWiXC7hF3w63S4qUbiWQ07eM31OPbXRHrTloLEHQd7Q/TDjZfPtyKg3AttxcX0fISX9MGJ5eYW5J094ODfHarNJu9enrxTKkliOi2dZ2mtDDpRn9NytA1hbCHzbpup5zNTr7N+2hQO7drJ1yyxbZ2aYHBtlZmKcsbExKpUKJb+ASFOCXo/2xgaNtTXa7RZBv6fV05TCMWPTcxw8V9u9SyujMqhcLtYSDOmhm96qBkX+OZKO3vzbBokfWsyyNw0aebjhzN9i0wKWzV3C0B6lyTAOOZYmOUQDZAWsBlySIndydh1t266SWDtFNjZoNzboNpskQR9bQb1UYnpsjAO7d/PcocOcOnKEb732Ct99/VVeOXmSY7v3sG9ykrGCT8HWlMbYBLQC3V8d10JJaIYRD9YavHvuc37x7rv84p13+PzqVVaaTU2xrY9QKFUQ0iYMI13joNJcEcc2NBVpUmKJUjojL7QOvvaTiUniGNdxKDoOSS/g0d27bJ2e4V/9i3/Fj3/4PZKkz7/983/Hex9+hHIdyiN1pOsSRjGxoZ8gMEWdGlzLCurz22KUfKSl4zwpB3NYmpm9SYlj2bi2hYUi6ffobmyQ9HqMFIuc2LEjOnDw4MX7L738v3x4cN+vFiCqfvRJafSv/trpNNd7XUnyf/vX/8PvOmv8nY5/dIRcl1gSge6OidsjLXeUiIt9y9Ui67eBYGLn4//uyKE/P5Akpd6tey91WjdpLK9iISmUK5rcXyjqYkIFSaQ1lr1M4D2OUQbt0ZywoUmUIcTG3Fggd6dLFbhegcmpaRqNBu9/+CFvnH6ek4cO8pOf/DHrGxu899vfEtV6lMtlbN8j7fUI+gFKamdRx3KJw1hroVs2UdgnJcUzTqNSSnr9Pv1+nziK8D1PTzLVCl65SL/TZmV+gTMXPufJwjx379/jzsMXOHnsGMf27WOiXMLxnHyq6Xe6hGGE73s4ni5kKNg2O8Yn2To+ycHde3jx1ElWN9a5++Ah9x484MnCIjfv3qXXbtENQtIwoi8F0nY0PcX1cH1doOQ5HkXfx3Zsur0OzVYDhbaYzSYbIYc8K1VWDZ7kLJPNi8EALc/k0Iywrn6tAltqmbdh+GxQHDY4smBcKYjCiNTIh9m24eoODdbsPiulCOMISwhKnnYQazUaNBobtDbWSfp9hFCM1OvMTk9x+MB+9u/dw7bZGXZs3crU5CRj9TpF18OTFq6p/tca4hFxECKV5htLywZLoqTEsl1sc+WtJOX+/CKfX7jAO+9/wLVbt1hYXUVZFtXJccaLBZSUpEIrHGQOeGmsF3/HdnAt7c6aJJGRd2AYxgGyAklyLnmGaGTtn9F7lNT8zSAJUaRadch1CTodwl4PSyl2btnKKydP8fKpF9g9PkIIBMD8apNzFy/w4PEjbN+nUC7h+C5BEJrUoi66kWJgpjLoK0P30pybwOxl4niAJg1Jl+Zpe6VIlNZR78cJ9VKJsfoIywuLfH7xIr/+7XuMVCsc3bmLRCgCleAIi+dPPke7F9DrdPnoymVWlxYZmZykUCzQbemsjFJoV1G0skpqFvksxZyt0OLpDjl8LUPXmBU7Zy55WnpTB7lxGqHMvbCMOhJCa3cDAw59xg+XDpbl4LrkEp5RFOPYFqVyCSlETj3LFrGM7zyMlguziW00W+aczRg1wUo2VrJg07VsCq5HmurPFdLIPJJtrDdnvfSGe4AEfsneZdORb8yBftDHdhzGR0eJw4Dm6irt9TW2jY/z2qnn+cE3v8nhffuwXYd+nBCGMSXb4/bcY376t3/LrQcP8MpVitUKSgp67S6u4+E5NiJKdbYjTcHWsnQZEPCMrvnse2xUPhKTrdLSqwOnUykzDwGLB48f8+Enn1DwPEr7dwOwZXYLrzz/AvPzC6yurbHSbJCM1CmVytiWVvVRWSBItoY9TZMaQn2HgvHs8Qys1WPH0uNQDdB9gCDUxcuubetMYaVCoVii22zSbja48/ARG+0O9x895urevZw8cojjB/ezZ8sWCpaDhZa0FXLI5ApBHGk/BcvShYdKQqXgc2zPLg7u2s03XnmF1WaDpbU1bt+7x50HD7h09So3b93m8dycLnSvVLB8n0KhoAtmpcCxfZ0NHcoK9Y3Ig7Qs7Yg8uEumLyrt1rspW67HlpY5Haw/WZ/NWlMBJIP36Hs9pGzCoN9kRbXZvJttMNOU3ARNF21mtTGYvZbufFKBSFNsaRMFfVZXlul1OggUUilKvs9ItcbU+AQ7t21jdmaGvbt2s33rVqYmJpioVSlYEkcOarBC00ZJlBi6rKuBPHQwttTucP32Pc5fvsS7n3zC1Vu3WGk08EolJqemKJYqKLQDZr/bIUliLAs8V28aJBKR6EBYq5WIfMNqWQLpWFhSEMcBUkK1VCTu9+msNyi5HqdPPMcPvv1tJooev/zgAm/96lc8WZzn4JHD9JOEdqc9kE1lUOw6nOXI5ZrRS6Cb01UhjmPtG4BGzF3P07SaVKGShHazSWdjHZnGTI+PcXD3Hvbs3HU5GJ/4n8/Xyudvme9otNbCW8sPUbadKm9Q2PyPdfxTFXU+dQjwfFh8BO/+FSjEUn1i46cvv/GL05Nb+qfEW/O7bPuNS3fujd1YWWFleZlStUatPkqxXEZYllbKABzbJk4G+qmDRUzz76JEL4LZApXxLYMgRAooFoskcUyUpoxOTLC8uMDN27d458MPmZ6e5sUTR1n7wfdprm8wvzDP4qNHVMZGkY7etQdxjLBMUUEYG1mlbDbVu3fLLG6+7xPFMWma0I9ioiTVuzZb4pcqTG13ibodWmHIpZs3WWs0uXX3LjcOHuTw3j1snZ1ly8QEFcehXCwSuPqzSDU/dbC8QqFUol4s0p+ZYd+27aweOcJKY4M7jx7z8PEcKxsN1hpNllfXWFheZqPRZG19Qxd+SgvLdgy/VFKqlCiVSyYQzgo/defP0nN6QdJFHqhBEDw0+wzS56YXZIVCWVslibbWzlDFTEFEPhVg54i6gFKpYAyfpHmdlgQLw5B+v08QBvR6PcIg0BbWqUZNi45DqVhgdnSU0b27GalWmRgdYWZygsmJcXZu3crM1CRjtRr1YhnfcfAyZD27CkPbsRHYrpvz1jD65xaacLbU7TH35AmXrl3nwtWrXL91m/uP5uiHIcqycYo+iZQEqV4OEoMwpxhOv2u4n6BtiNFFdZbIyT6D1AIih8lE3tibkepMCSejRViWheP7+L5n6AHrhO0O4/VRXn7+Bf7we99j37ZpMoP2+VaPS9evcfXWTTa6LUojda07nC1qw1Dds0f/F45MEk0lSX45Siqd5civTQfvA018QaK0/Gi5XqPZbfKrd95mpF6lWq8xXq3jS0kCjLoOp48fIQwDGlHIu+fOgW1TG6lT8DX9LQwDTVVxdd/vBwEy1gW+qZEJFGrQg3OFBpVtO59xjcro8ucBr9HMt+x8kdFAnzKbmIzupesaVJLmK/yARy+xHD1GBRCFMRmFJDM3siwtxWrueN7KmEAhSdXmzQBms5NoTrtS6B2SSI2CzKBIO3ttjhKKfA+1qRWE+uLdzp/P0gVD7YRAa/rbNmmc0Fxfo9vYoFYo8tJzJ/nD73+fU4cOUfdd4gR82yIVihvz87z12/c5c/4cvSiiPjFOlKKVKaQWAUhVijOE6sq8Uvh3w8n10Boa/3JgsOS4DhKNamsDKcHM7FYa7Ta/fPs3bNkyy4F9u3GAEUtyaOcOfvDmmzTbLd754H1WFhaI4phyqUyaCqJ+NBR4PHscDZEhcs50lnEBBteYBYCITZ9ZKJY0Rc/IvDmWhe96+OUKjusR9Hv0o4gb9+5z98EDrl27ws0Txzh9/Di7tmxj28wMo4XCwFjKHNLK1F20q2ISxZqmZVu4FhRLPmMln23jY+ycmeHkkcOcPnGcB4/nWF1f58nKMisbDTZaLdbWN2g0NphbXiIwLt6O6+L7Pn6hgOv5Ohh3HDzfB5WSpNkYGArKh5DxbJWM4zg3/srvbV6HkaGugw1q1kVRSuvCywFNJweo8nulv89yLIrFIsKy9EY8SYgirc4WBF2CoEcY6E1FGifEUUDB95gYG2N221aqpRKj9TpbZ6aZnphky/QsW6dnGKtVGBupUymWKNk2nhgMxWHxCte2EY5jxi30koTFZov1Vot3P/qEX733Ho/n51lptehGEaWREcq1On6hSJJqdakojJFSUi6XQWmzuYxkqpTSsqRKoYREmUx6mqvEpJpWo7RJ0Or8AgQxL7/4En/yw+9zaHqE+/NLfPzxJ6yurOh2MyIKuW8Gpn3NZ+aFuPnI0Bk7S9o5a0IIgWc7CM83Cmq6gYJeQLfdodVoEnXbuFJxeMsszx040Bmfmn379onn/vz93bve7967N7fr3XdwfZ/OubNRW4pESpk8K2P/D338lwnIhQDHhfVlmFuAdtMJ9hwO7szueFTetfsvqt/59qJ4odGd+vizb0UffOI219ercZI6otejnyRaJcWk8EPHHuyUlE77WkZ9QGScbqGdz5J0ELLGSazRAb9It90mCPqM1OsUiiU21lb59XvvMzs1zb/44ff54bffpN/r8Zd/9Z+4dvsWQgpKIyMUCh4paR6oYgnSRH+XbVmkKcSR5oFZto1jOdjG9S9LAVmWRGFT8H1Ga1WSqEZrfZ32xgbX793l/txjrty8wcG9ezmwdy/PHzvOnh07GB+p4Tk2ViqNPrEx5clWSCGwhaDquIyMjLJjZJQIOHX0OOvNJmuNJovLK8wvLnLXFOEsraywsrZOt9+n1w+IYq1MIIIA4ToaOYxjzecSmoeeB6FDO1eRBYp5in+gmjEcmMNm6ksoIE61Bm5q3itQpCoLaEyQkgUvSumgVAwNlSzVbuQPbaW0YkCphCiVcCyLomMzXq8zOzXN9u3b2Ld3D9OTk8xMTjBSq1IqFChKbYqRLTcD5XZ9Pmmqi1qE0CkyK+fO6te24ojVVosnq6tcuXGLa9ev8/nFSzycm6Pd6yNdl1KlilcoIG1bmysk6Sar9kxmy84cFGOdwtOFdQJbyjwQe1ZYsQmxHX5cSlKhCOIQhTbJ8jxXSzm2OoTdLrViicN79vCtl1/mtVNHKZhr68Ypl65f55OznzK/uoRwHUqVComAKAxIU63EkAXSvwcxQJ9rpuUHKJNBUZqLs2nxREpsoc1OkjhiYnqK1obD1du3+emv3qJSq/Htl19l9/gEsfnImdERvvvG66y2O2z0etybm6OxtMz4+DiZNkOcJviFArbtsLHRQEWJdp8c7G7y46lt4hePoUxctlEREpNlMpb0QKpMwbFSWCprNzEw0MrSC+a+IxnIoyUJ/bCv+4RB04XM0ubm+xkEFxlqPozU5VkVgS48ReZ86VzjdygYH2jXqzyQBi1zRjbk863i737/AQqui0oTWmurhK02UyMjnDp8hB995zu8cuoUI66da6krYK3Z4mdvv81Pf/M2CxsbFEdHKNdHaXY6WLZDwS3Q6/R0psT3B4ZUf49DGEAiU3LwXQ/bBBLdfh8JTM5OMf/wAeevXuHslUucPHmcrePjFGybyXKJb7zwPN1um9bGOh99fp7l+Sfs2X8AbJuwH6DUwOwJNm8dhm6b/v9QFkkYad90iG+t75sxaTO3SyJ1HZGdEEeKOFGEcULB1dzyQrFEr9ej026xurLKysoKiyvL3Lhzhz07dnL08GGO7D/IZL1OtVzCtSwcwJYi31SmRjZWJQl2qrR1uplXXcemNlpn92id47t20kl1MD2/vMzdx4+ZX17hwePHPHr4kAcPH7KyukKv3ydONIBgAVaieftxu03YapGo1MzTwpjkWNp3QGZa58YcMJuXLE1xzLNHRuc6X00Uup+TbgrOs8xf9rqM46zFAwZjXQqJbfWRQhpxgVTTbtMEJ9XGUiXLwimXcC2bNI6YGB/jyOFD7Ni6lbFqjcnxcWanpxmt1RitVqmYOiWBcdFViiDRmRJlAllhWdiWxJKCBGgmCevNNjfv3+fitWs8fvKEDz/9lIvXr2tQYnSM2ugohXIFy9GMgyDQcrC6ANLBtR2SJCSNU1Sq/UhSozGeKBBST26aRqSzgEKllIpF7FSw3lgniSJ2b93Kn/74R3zzm6/TSWJ+/d57vPf+e9hFn5pXI4x0fGFJrbGfzzuKXAZSmLUv466naUISBsT9AU0yNzXUuxQ97yUpTpIy6joUimNxvVxs7z/5XFR+/vnzj6r1//nywYO/WBipqe2/+qXY9df/yU5qtWQuCNKOX9ACUr/nXPZ3Of4LIeToidyyoeiDXwi9VsMe+9m/Ky+e/rb8t8+dPtOFz05OTHzzu9L/V/byyrfurK9O3Xgyz8PHj2l1OjkX2/FcXSCV8YPN37ajVQMs10Xatk6hpEpzjDNVDhPQaHRBaYF7z6VUqfDw8UPOnD/P8ePHeWH7Vr772is8uneftbU1WkGPNIxwCwVc2yEGEtN5kYokjXE9zUft9UKCKBoUo7pac1o6ukgrRSP4/V6f0KD2wnEpj44S9nuE3R735udZbjS49eAhDxeXOH7sKEcO7GfvzCzjnoed7RjNhJsksbYHT/VC69q2doEDKrZNsV5nqlplz+wMUXKERrfL2kaTtUaDxeVlVtfWWFxeZmV9nX4Q8nDuMfcfPqAXBPlGIkkSMEhrJptnuwPVh0KhgOd7GkXOkPLhyS9HwTGgrsRybV00hDIFIlpXPjF6ommkddEzzmAaRfTWG8TdbubUg5AS17Ipl8qMjowwPjrG7MwME+NjjNbrjI7UmRgdZXxkhEq5zOhInZGqVuZwbVvXJwgtISfQxYUa+U8Mx1lqGgOCmEwzWOZ6B4FSdOOE6w8ecPbKJS5dv8bla9d59HieXhBQqlSYGhvD8jyiKCZMEogibM/DRXNopRyYj4hUKwIBGj02CgxCGiREZO03tGBnCzViqLDSBFNCT+KxydRYro3rulgC+p0OQatFwXXYv3Mnp4+dYO+2LfjojUkvhcXlBleu3+TW3TskCAqlMsJxiMNASzoy4E8OT19Pn9umqUDowM2SEkfqIqREJQil3S+zwE+hFznNV9XjNw5DwjRiZGQK13NZb6xz7eZtfvXO22yZnWVmfAIbXaAIilrB47tvvEYkJP+/f//nXLlxA9+xqdbquEWfTq8LUiFdC9d3NZoVZajQUFJaPU1dySH8TdeLxKhGDI1RNG0rSaOhOhf9jjiJzVAZLswcIH6pGRcqjsmKKiUZLSULtkAYjnTWdmmSmDnB0CocB0iJwpgwp5cMcd7NGM0K61SqBvd0iJIyfLEiC+wZohk99bJBadygybJn9TsTon6X1sYao8UiLxw+yve++SYvHD1KybUHn2PBWhhz+c493vv4DHcePqBYr1GsVEmVIAwjSraL73p0Wm2SKCZ23ZyDqoapDF/skl96DNMeBBqF1+o72gshCIP82i3fJXQk1x/e59LNW9SqdSq2duMcc2ye27ePJy++xJOFea7ev0ev1cbyfK29PYTn5l0pa2elNzxCpXlgnt9BoRs9CyD1uUrTH/QcrJSi1eoaZZgSbtVBxTH9Xp9WpwNK4To2nuNQHxmjXh8h6PdYbTZ58vFZPvv8Mh+d+5yXTj3Pc0ePcujAfmYnJqi4DoWhLGhqCYRnm02CpvkImQ4Mf0x/soCSEKSWYMfEONP1Gr0kpdHt0Ww2Wd9YZ219nUajycLSEsvLyzxZWGRhaYlWu83y6gqNVisHipAW0qz/WkNdxwiaOmaBpeUfXd/LlXYGdJIh8AiMHaqWo0wy5FZgTHi0WEMUaqnCMAx1vUlqatTimGCjQRKG4Pl4nketUqZcKjIxOqLpJuPjbJ2ZZnxklHq1ymitxsiQQZhv27jGVTdzMtUbbJ0Z1BK4Ctd2DcpP7margHaquPboMecvXuTDs59x/uJF5h49IhaS6R07KFQquJ6HUtDrBzRabdI0xXM9quUytrRIoohuu0WqEqQUJCKjqGDMqTQIoCUpFSpOUGmsIYUwJApCeo0Gs5OTvP7qK7x06gQFW/LplZu8//En3L13j5ldO/ArWlJxuDg86/2ZoZPuxTLfcDlSEvYT2s0WPdN301jz1tM4JgoCSBWe4zI1McH22Vl2z86yZaTetC350eKxo3/9zokT734+NrY04TjWn4DVctziWq2GU60202YzodvdBDj+Yx7/5QJyMMGEBNtCxkla3FiNmx/+JmnfWYqYfIX52pF3L/yBv5ESfZLee3xo35nzY7vv3d3aDrrToCqWEGXLEm7iuqSWhUxSGkHAahBoVExqa3XSFCxJKsgR3kKxgEhhbW0d17Epl8vESYzjetg1iwd37nDh0mXOXbzI3rFRDs7O8i/++Ccoy+Y3777N2sY6YRJTGRuln6YEcYBjubqyPYkJ4xjLBBmeY/a0aaoHkKmidyxt2Z0Yw4Bs9yel0Ih6sYC0bIJej1YY0pl7zGq7xdV7d5kcGeH4/v28fvIk+7fvoOC61DwP15IktoMUUju4qUHVt0AX3ThZoaPjADBdKhJPjNNPFa1en1anzUazSaPVJghDHs0v8ODRYzq9Lp1Oh1anS6fbpR8EmoMcBgRRRGg0lhWKOOjR7GgnySRJ80K/NC8wyZB0jaYqKYilILYGVAAptGqELS1d9GJk0Fxp41gWjhQ4W7fgShvXdii4LuVikVKhwEi9zvjIKOOjY0xPTjJar1IplymXSlTLJc2PlwODFXjWwjykFJHdF8MFlBY4Bj6PMPqti4tcv3mLm3fvcvnWDR4tLbK0tkaz3SGIQr1B9D0wFsKpUeJJU5U7aGZqGVkwZCK2wQ8MkJxsAvwShHwzP2CQ1rQdG5UowrCP49n4jkUSRnQbDYJmkyN79/PmK6/wrZdfZveWLSYFDEGvz71Hc3x6/gI3bt+mNjGOWy7mSg46PawVjyzLGhjFPGPYg7kkMXhMMZCiG6DDebSnUT2GkHKUQVBsmp0ujgVTs1uYe3SfM+fOMzU1w3i5yvP7D+AKCJW+17smxvj+66+QJCH/6Re/4NadOyz3ulRHRiiUSygp6HY7CEs7KOZoMRkq9vRFDTI+X2h+laHEKu/vWUCec+0zdG4oSMwQ7DyANajbcPCefV7O6DJoepqkuadMfoZiSLPXLO5Kw3gMqb/p7xxGCQX5pk7BkHTsUPCSPZffryy7pT8w43lmmTth0P7BtUpTYJfSXFsj7LYp2RYvnTjBT374Q144dpSZkRphGOcFWwr47Wef8W//4i+4dOsmwnUpVatIxyGMtQqF7uMRrq2L55NES91atp279P2uR359Wbsb5E4Y1C5NdCDhej5CQKfXxy4UGZ2Z4dzVK4z87S/ZPruN8b078UyP2bNlCz96801anRa9v/kZcw/v41aqjM9s0Vr1aYrxezSBt3HwNI9qboXKtfvz7KMQOlhPTe2G2eANdYbcDC5NEmLMPVL6dbpwX9OasLU8qgMIQ61oJyk3H82x3Ghx5sJFdm3bxuEDB9i3ezcH9+xmaqROzbZwhUBZNlgZnSIZzGdmeyZQWAhsg8wUbBsydaNyiXhynEApemFIv9dnvdFgdaPBwtIySysrdLodlldXWV1fpxcG9IKAvqm9CY3BYBhFhGGs1YzimCRWtPp9YrQbdaIyhDsdnm7yNcoy3Ow00XmZTOEpc8+VUuJKSaFUwvNcXNfTNWKWjVQKz7Yp+gVq1Qrjo6PUKlUmxkeZGB9ltFpjYmSEarlMuVii4LrYgk3Z2az/Zb/NEMQSIIy6nGPrfpICgYLHi0tcu32bq3fu8Pn1azx88oQnK8u0Oh1Cx9F1eZUy0nGJU40+63hB6/Rbpg+pVCuYaH64CbwRpEiz889TLmYtShEkFBwbV1psLC8T93uMj4zwvTff5E//4Ecc3L6VBwtLvPf+h9y6dw/paJELLEnQC0z7C4YXD2X6rZ679Jwn0oR+v49IEraMjlKamMBRCl8IZKoD8ziKQiXEhm2769Wp6fna7t0rhaOHektbZ28vJsm55tjYpz3PXaw9uO1z+27hwb2HsfXwYSwrlVTZthqWw/ynOP7LBuTZoRS4XpqU6n31zjs2F37usfv/ET/5351ee/InB95G8vbktl3FH9Qm9+9YXno+EfERodQYKtkl0ni7q4REkfbTxF9dWirOP3zozS0uOhudjpBS6JRwYiYZY4Ptuh5xENJqtTRVpVCg2WohbQvXc/GLBZZWlvjt+79lx9Qk3z/9Aq8e3keUfJeNxjpnzp1lrdnELxXB2FubzApCCl1AiNJVvZ6egqMoNtJ1pujFtkFYiFTLA2U8KU1L0KmiQr1EpVYj7PXodDosrq/zaH6BfqfDudlzPHz4mJOHD7Nleood27W6iiclnqMRAT1Ms8U0NXQOoxCQSUUafnJRCoqlAlOlAkxOkKCLcoNUEUQJvSCg1W7T6nRotdq0223avQ7rjQbrjQYbzSbNdpswClnf2KDRaBAnCWEcaWTdmNqkcTJAb8w/SghiAYnZbduuje+6eI5HpVSiXCpSLZeplcuU/QIF16Xo+0xPTjIxMqY3VcUS1XKZUqFIpVii4Hv4roMnBTbPzlQrBnSULAAWDAIFkeniSj0hJehgKk61OVUniphfXeXx/DyfX7rEmbPnuHztKvMry7jFIoVKhdpInfFC0UgMJvTjGBXH5nN1iBbHiSn+yRJu5AGWOZm8rfQEKBGWNOjlsB5xFkxt5o3nCLper7EtvVF0hEBFIf1GAyuK2Do+waunnuebr7zE4V3bKTgWrb7C9gVzq6t8duFzbty9TSfoM1koYLkunX5fI11S9+UBfzOXDd4cHarN4Gi2PCtj+oC5F7kJhxgEn2Lo+lBGylTYrDcaeK7N9NQ4vX6XtcVF3n3/fWYmJhifnGRHfQQpBL0wxXYkO8ZH+d//5CdUSyX+/D/8e67fvU23uU6x6BMlMf1+X6uQODZRpHntOUPjK/jxT19VFkTnj8oswDZNYtheg4KxzZ+d2WaroYg5r60QmgmdBbdZH87GVvb6LHi0Mo3mvE0zJF5t/nzTjzC9iKzvqMGNy6XnzKSnlDZjS7M+Bjl3N9NIhwHdRfM+jTtumqLiCJXEBO0m9aLPySNH+MPvfZc3X3mZimsTxwm9fogoFQjimEcrq/z8N7/mp2/9LZXxMcanp7E9jzBOSMIIz3FJ05R+t4fnueA4REFgKENy0wb3dzrUoCjy6Z8oiiBNsG0Hv+AjFLQ7LQqlIrWxOuc/+YSPzpzhxROnmKxX2Tk+SgwULItDO7bzk+99j2a3zf/205+y3moSjY6C4fZnQQ6KoQyNoeyZ+5X1j6x+Rc8gMteDz7MsQ33LLRQ0QBSE9JMeAl187JrCNZUk2sgsSYwHhkWlPsrY5BRCQGOjwdzCAjdu3eKzzz9nz6XLHNq/j+ePH+fA3j26EH50BM+SuGYd0nQoC6GMyY9K9AZDZLivjuwUMp8uLKAodCE+nseWeo1khwZBAkPv6/Y1st/t92k0mzRbLZotY3TV0etTq9Wm1W7T7fWJkpjVjQ3WWk1SMHxyzSlPjL07apB50v0chK2zXbZjU/A9ioUCvudTLpUolUqUSyVqtRqVSoViQZt6jY+OMlKt4TkOlaIx9SoUKDo2rmDTuvT0rJKgzcVUti5kWSvzWh2Y2kRK0Y1iokSx1mgyt7jAJ5+f58PPPuPi1Ss8XlzE8lwqIyOMzWylWC6jgF63S7fXJYm1RK2UkoLnmw2vIgj7+bywyXBPShSaIquGtDez9dMVEk9KLBRRp02tUOC1F1/kJ9/9Ni/u30sX+PjKNT488wntbpfJmRmwLL2RCiO90ZEyj1myyUpaFspk+EBvItqNDcp+Id13/Hhv586dkbTtVDpOT1hWE6U6wHoq5ONUyvtRqXKlMzZ++86eHQ+vjFTXHwBTqeLo3dvWzg/eKd/+X/9cvP/p5eauU8+39z5/SsXhP6rk+DOP/zoC8uxQgJQJjp1iSzUcQW2U/P5vju+/WYh2LSmhPhRKebEQRalU6fRSq7Y1Sqx7M/XG6JPHL+5+570/uXfz5v7V1dXSll07iYXQsnFCK6JIIYjCgCROKBaLgKDX65vCLS2hNzk7y8bKMu+8+y57tm3nhWPHcX2Xo3v38qd/+EcIKfj1++/x5OFDxrdsYXJqivmlZcIoplQsIrBQaUKst5h6Z2drreMMZcLsuEk1mmEZSkdq2iJJEoIgyBEox/OoSIuklMDIGGGS8Mt33+WTzz5jx7at7Nyxg+OHj7Jv1072bd/GVLmUK3wApGZysS3FMCc7R1CGUBZpaBsu2oo89WwSzyYqF4jjET1Zx3pXHUQR/TimH0YEcUicprQ7HdqdDolRhIhjrdIQZTJGRi4rq0JHCI3a29aQFJTm3fuei++5FDyfguvjuQ6urSd63/PwHdcY8Ggda3uouCNHkxiKbYe6nEBp/xlljKREvpwNBSeDd6UKeoniyeoG9x494PKN63x28QJ3HzzgydISUZri+j6zu3aRKKUL76RNFKcgBvr4oOkH2fSac96EGCoczAKgLD04OJVEZAZLApUFGCaXmXFcpZSG56oRbGlLpCVotprYtmRqYow0DFldmGfu/n32bt/BH/3gB/zBt97k8J49aCQEPEfQUXD20nV++tYvWWtuMLNlC8Ky6PX7BP0+jq03TxJTzJWmmwxNYAhQURn6NOAC59c2BFF9UdEgBTVYrDGUllQpHNdH2pJGq4tTKFIbH2e10eS9Dz+m7Jf4w298g/2zMyhHEhl0dMyxePOFU7hS8bO33uKjc+eYf/QQr1KhNjqKsB36UUwYhFiWllvLzUk2n2oeHGVAZFb7kMslZmed00MyinkW8D5FA3m6ww4hNRlCnirtjjmgzpjMkuGmD14/dCPMd2gJvcHmgKHXJJvfZb5L5YFBFl4ncUKcZOSKIQ6uQfqjKCJFF867rkOSxLRaLZIoouj7lCoVHMum02yxsrREv9OiUnB49fnn+dd/8qe8dOwEZcem1w0QUlCuFEAIbtyd42e/+RXnrl3Dr9VwSyUUEIYRSRY0YzYfgrwYV0hLK/kkz87cfOUxNBc8venJa2gE2ulWgbA0170fxdSnpugnil+8/TZbJifZ+c3XsYEwSekFIft37eFf/OjHWELwV2+9xd1bN5jZvpORiUmSJKXXC0gjPa/YUhIbhRFFqms/DMVNDXZOeb/LcxtPXW8aJzmVMPPM0MhNptyEyeTqNyZJihIpaaQ3NNJ2GJ2YZGxyEs+2iVGcuXCRcxcvMjU6yu6dO3jx+VMcP3qE6ckJio5D3fcpSUtTPrI+r/F4c85Gfjc7ZWWoCtktkCKnEzqALwVKWpRKJarFoqYPTU3m60y2oehHkZaODSOtPJImNNodmp0OkNEjs7qjZJNhkBSDQk/L+CRIoZV0PM/BdRx8z8PzPF1s6vu4jpWvRb7rGiqk5jw7hv+elRRnvzfdmzQlMeNKWjJ30TRdbNPrE6DRD3g494TLN25w9uJFbty5w6OFeYIkAd9jy57deo0Q2nMi7XQRaMlXqTKKIYNsV56FU/lmXJEawQaB49qkQquWaYEADQxJAbaQ+LZNe22NjeVlJmo1vvn6G/zwBz/g2OHDJGnKtbv3+ezz8zx4/JhuEDBSq+J6BVQcERJo1S2zICSJduR0XJc4iTWlT2lFNUtKCALwC83K9h1/WXjx1U8WK5X2Jc/eeCDTtq8MpihEX0EztaxG7Li9nu/1m6Zn24ASpErKJpYNjhMj5e87O/yDHf8VBeSmA9iOwlcKV27K2YSWlc7Vyl2gCzwZfqft1+QDJdKHFYuXk2h++9jEaNUvTMgkLsX9PrKgbaaDOEIIlZsJkCp8z9eazsb8I04TRAylSplep82TJ/N8fOZTju0/wDdfeoGd1SqvvHCKTqfF2sYGn1+9QnNtDWnblH2P2NfcYCEF0nLAWLarJEEqbaNtWRZZxXBq7LW1/vIAmVUoVKJNSvLUme1g216efu51OizPz7Owusrc2ipX7t7j2p277Nm5kwP79rJvxw7Gq1UmR0eol0pUPA9PSlKZ4YxyUxV5hhoptFxUVkwhhJkIhcCVElxX/3zFEZkfxSDoyvXCM3hQqUFxmMCkAge7sGzCstFdIeN1/z49KuOeJWpoMjPXlC3YQhhaj8ix1/y8U6CfJHS6PVY2Gjx6ssiDx4+5ee8ej+afcH/uEY/mn7DebJIAlZE61XqNQqFIEIRm8UYHLrle+9A5mjT0cFHoF1bPvD2E0RlXOWKZmsXDlnZeTZ4hlrnikNJFz3EaYwlBwdd6wiqMaK+tEjXbTNXqfOP0S/zx93/Ic3t2UbQk7VjpwCGNOHflDm998AFX7tzCr1UYHRmlH0XaHl7aui3NAp8b2sjf524943rzCOgZN3aoTYQAaTkkpLR6PXzPpToyynqUcOPOHVSc4Nouhe98h5lqGdeSdKIYy5LsmZig/uabVIpFfM/j7KWLrLba9GwH2/exHJdi0de0qzjKF60sAB2glvrEBrxklSNZ2Zl+2fXl2Zkvb4kv9hsGQaVUQ/KjT3Evs3PJ9wPDQfhTG6an/970lUPXqtJsqhK6aC57rdDc6Qytt11bB8pRSBRHSAmObeHZFp7lkPQDgqhNr9PFQTA1Nc3rp0/y3/3oh7xw7AQjnqcLE5VWpYmE4O6TBf72gw/4xXvv8XBpicr4OLZtk6R6g0IWjIMp3tOmYXoOlTnSjUGMf9ei0+z68nYaul+ZzKpWltDZFGlZGl3uJdRHx4laLT6/epnffLiV3Tu3c3DLLEXbRqUpNdvi1N592D/+I9ZbbRq/egsVBvTaTSzbwbUtlLRI05jQVCg7nkcmOZcVvqksiv3CzfvizR0u7pVD3UttHlx5706UDlwTJbBtgbBsCmUX19VOkt1Oh42VVRory9x7/Jj7C/M8Wlzkk3PnmJmeZHZ6mp3btrFzyxZGKxUqpSK+5WiFqnyLN7QJ1JGhWSMSEqVAZPJ3ei3KaqcsAZ7QaLGwvzqkMdNj7u6qhp7QX5cO1ic2Z1V1/ZAGTPSaoZ//u6xLOf0s/6ps467ncI1SCwPS6ffFQF8pwjCk0W6ztLLC44VFbt67z6P5eW4ZGcnF1VWiNKU6Uqc2PkaxXCZREIba8C+OTcZFYYzEQBfN6/NIh2hxmfmTnswkZLEJaHdMpVAqwbE0Ik4c0291SbpdRoolXjv9In/8gx/w/PGjlKXgxtIKb3/4IWc++5Rmt43l+2DbRHFEqsBxPXiaTjZoFpRSOLaFUClBp0fZtpmd2dIpbj/8zvyuPf/+bIH+LaD51bcgX+alnghVYllh4ntQKCBsK+97/9THf0UB+d/9uFWyhdKshHg+ZXGPVzg3u2P7txvd1taNZouibVOoVAhakeYRDldVKy3VhCBPWWGQoGKpzJadO5mbf8Iv3voVszNbmD5axbUERw8dYmmjge17vPPhB9y7eYOTp1/EKRR5NPcYIS1c10HYQutJhxEqTnHsFN/38gBQoXKL7CSOSdSwrI8YWgOE4Y6lkAriOMHxfHbt308cRXTbbTrdLhdv3OTmvft89OmnbJ+ZYdvWWY4eOMDB3XvYuW07Y/UapCm+JXF1rvyLk4kJqBJT8SwQuWqDRoMyYx6+gILmiCfP5sCBQT4zdNDKri4LlocXhM1nliMlw5+b8RFz1HVQkJO52UkziWS7/zhNUErzwPW9HxQgZr/7qaIdaGRlaWWFR3NPuHztGhcuXeLajRs8mp8nlZJSrcro1CQzu/cgHW1vH8YRnX6AcaJ/5rXkD+ffq77w2Ka2y2PtjEVq2sSkNB1Lb+pUZoZgUGqkRNgS4lRbLSvBzOQEMomZu3+f1uoqs6OjnD55kj/63vfYs3070rLoAY6tl+O1fsi7H3/ExSuXKFbKuOUSUardPR3LoeDZhp8ZDfjGApQS+Yo2BMh+AeXZdK0iywc844kvtBkmEyByqchECRIlcGyL2ugovY0G9x895pe/+jVlx+UPv/Mm4+USnq0NXZCSquvxjZdexi34lMsl3v3oYxaWl3DLZUYmpqhVq7Q6XZr9NiIzzBJ6c603PAY1NSo5WU/NUKdn3M1NlyTgWVe86T05Ci4Gj+nDyCbm6OhTL2MQVD3jY7/44i95mW1450mSkBp/TMs2SJUYGKVlhaMI8AtFlFKsrq4QhgHlYpGRWo2i6xH2+qwuLtJuNCl6Hnt27ODlU8/xr/7wD3hu3x5WG6tsJBHlQplSyaMHPFpZ5+2PP+G9jz9ieaOB9Dwc3zebejS2+nRDDnc2NWiLDJv9BzmGg/N8boMk1vVBxaKP8H36zSYXrl7mV++9S/n7P+Dg1CTlcpEgSUilYO+unXz/zW/S6ve4evsWiyvLeKUy9dExHNujsbZBGER4nkelVkUpRaPR0EHhU/KDX4xohh8UT/WjZ7SE2PwfDQCInOqkhHEhDnoaDbZtprbMMjYxThJFuK7DnYeP+OC3v8X3Pfbu28veXbs4fuQQu3ZsZ9vsDNMT41TKJUpOAdds97IA1wLjF5JtorTbI4m5Vtv+0vVhcFXP/n/2e1hVWi9HJtJG5I+Jp1+DGkDVDMbu0+2XKga0Ip7acKvBO56WAhaSgc4/OghP0ZuHdj9geW2N1fV1bty6xeUrl7l07Rp3HjygH0ZYrkepVmfbrt1IxyZRiihNaba7ZtNm4dgumSSlMu7hCnK6rZ5Uh9tpMGnbjs7wx7FBrR2XIOxrNTPPQcQxYa9Hd22dqWqNU8eO891vvsmxQ4eo+D5POh0+v3qVM+fPMjc/h1cq4hbLpECn3cayHDzP10WZSQzCuANLHe+kRr3OL/hEnQ6N9TX2jY2yb9+BNB7Z0rliEZ3VSf2v45r800fav+Px30RAroTJsgJXtkwv9P/4h2eft9P1gwvz/ObWbayCT7le15XHZnuaDbbcXlqAEJqjlCRagsn1fVzLYvHhQ85fvMjb77/PVLXC4e2z7JudJnzpRcq1KuuNJu9/8gkP796lPj5OpViiGwR0e30cx8WyXQqWo1OlaUoUx7mSgWXr9LKWcVRDi+cg0NT/GzJ8yX6ERDouju3gIcCy6Xe7dKOIzvIKK+sb3Lx/n8vXbzAzMUGtXGb/nj0cPXSQ6YkJKoUC1XKZqu/jD9MzhMxTZWmaIpQyqbuMt2gQOqN5qsE2nfp0viTw1J/7+yOmT5s6PH1k+uupQdsz3vHAPjz76gFy6Fqbu71Cp/66Scpyq83yygq3793n3sNHzM0v8GRhgfWNDTaaTTo9LQnp10awXAevWEBZDoFJAcem/yiVl2Ll35uDPmKwNAwHZfnJPPN4VhgrcB3PoJYpQRxq5MMg44nhZCu0VJfvezhSEPf7dNfXaSyvMFYq8+qpF/jJH/yQN06fpmTspBV6Zlvu9vj43Od8cOYM9+efUJ8cxysVSZXmXrqOphVFQUQSp1qi0Wx2h5VfIAu2n7rOTdc75M75O7WByAuxtEubBVK72IYKCl6BuBDRWl3jwtWrlHwfv+Dz7ZdOM1mrgtSul5YlGHNdTh85Rq1UoVap8at33+Xx0hLLT+aIggCvUKJerRJEWeEyZMuZICvQ1PQvO6MLJcmX9NuvioS/eq0Y3qw866OH2/erRtumTS1DmwM1eGwQdKihYmxNh0JpKkgShoMZS+hzSk2WpN1uayUfSzJSr1MpFHWmst1hY3WV1uoqJc9j77YdfP/Nb/Pt11/lwPat2EClUDLykDo+eLSwyFsffswv3nmHizdvktoWbqmMdDzSSIMdw4WoqVCbrOalQQTz6/uSxvny7dPv1pabjhQsBAXHJ1GCpm1z6+ED3v34I7Zt28rkSJ26q4UAXGFTdlxefe4UkVIUfJ/3P/2UjUYDiaBWH6VQ8LEtmzhJ6BnlB8u2vxadfToc33R1wyZsX3O1Ok5MSZLI9A+lDa/QcruOkRuOgpBev0cIjGzZAiplsdFk/dJlrt2+Ta1SZnykzo5tW9kyO8u+3XvYuXU7k6OjVAoFpNKFeQ56frekDdhaqCHP4kJgXCCzDUF+SVmwO/QzvPY8c4Mq8n9+pyPj9utsoNo0XrJlO4u7B4pJJtDPOf1f/o0hsBGGNNtt5peWeLK4yJ0HD7h97x4ra2usrK7SMrTQUEjwPOxiCbtYwPI8EBYqiY0uuUKmes3O6DlSSC3uwOaxjjnv/LEhqaQMNLYsSZjGRH1t+uO7Lo5laVfRjQ18ITl64CA/+PZ3OH3yOaYqmjr74OFDPjjzCVdu3qAdhmyZmcUpFOmHEWGU4CgL388klPXOT1gWSIijyKDjujauH8d0Wy3GZrcko1tmrn447c1ddLUS5O98E/8rPP6bCMgB6Hbh7l2aScx1aT18o1y5Xt6y9XXr9m0Rdrsi7gfYwjKkIS3bo1OYmEGjd2NJapEqjfQ4loXrauvqtcYG7773LjPjo4xN/IjJgs+BrbPU6jW63S5JHHPu4kXa7Ta79u3HljahSonjBOFILQdoQxwb2UClcISFY0mjrxnnIvY5f+tLjmz/nqYpnV5fD3bboVhxKZbKJHFEv9ej222z2GiwsLrKlZu3UEnM9i1bOH70CFOTE4xUa0yOjrJlaorx0VHqlQrlQkFbFbuu1pY1BTnZxnkYEUgUpIkAwx/Lp/RnBQNfcjnDShq5A+fgSVMsxuA1AHLAI85L/Axqk793MBMDhn6iIDZBc5BE9MKIThCw1mix0WiyuLrG4/l55heXuH3vHo/m5lhYXGSj2USlKX6pxMjYOLXpaQqlEkoIXQAYhQRBmPOmpalS//2OZzWQ+NL/KfRa6ti6JqLf75PGujAYI+uWxDEJCmlpRR/fsZEqZXVxgXCjyXi5wrdeeYX//sc/5qXjR6l7Hv0k1ZxAdNrvgwuf81d/8zNuPLgHjk2hVMJ2XcI41jxHW59MJkVp27bpG1/eh39/eOLZWJXmaeu6D6RA2hLbdgnDPv0gwLEtCuUyKNhYWubMhQv0gj5CJfzoW29ScB1sqQNLhGCiUGDSoDnVYokPP/2USzdu0lxapjwSU66PkAhQUhjqlZ4nsjPSZiEDqtezse98a7YpUPpde8swu1EN/Xxd633l84p8U/Nln5aaAjrL0go6ymxC4lhLcmrJWV3/IcymNApDpIRysUilWMRG0Gs0aK9vkAYB26amOHrgIC88d4rvvf4KR/ZsR6BdBouuD0A7SVjYaPDWhx/xn956i0u3btGKImqVMdxC0dwHsamHZO2ZZeue1RbPujP/oIci94cg0g7HpVqN5cUnXLlzm7c//ICJkTovHj1O2bKw0LUQW+sjvPniS7iWTZIknL10idWWnn9G6mPYxQL9INCOrlJS8H0y6trvE04+63/Dj24O4vW/liVI04QoSjSf29REac6z6Qdm/kkRFKo1xsfGUGnM+uoajfUN5hYfkYQBlhSMj44yPTXFnl272LVzB5NjY8xMTjJWrVIrl6mWS5R8n4LrGRdmG8eS2DlFSJCKJMtHmRNXm85/MF4GI2WIkfKMK/6KR3M0W2nta0P3HGgIDcFpQ6kEIXQBfkZ/SdHId6y0ulacK+pANwhYbTZZWFllYWmJpZUVHsw9Yn5hQQNET+ZpdTsIaVGt16nWakxOTOk1UYgcFdfKKGi/A7NR1tnTRGfxJICVX+DT2YXhFhig/FprXQgBSYJKIrxiAVdKgnaLoNWi6vmcOHiIH3z3u7xy+jTb6xX6qeJeo8FH5z/ns/PnWW+18ctl3GIRJSRJmuZ1X3ltxvD6aXY3OkMPYb9H3O9T8j3q01vOia3b//ODqvew/cw7+M/r+G8nIH/wAP7H/xHefRcOHYri/+H/9FZxcnbnSKXyrWYYOu1mE7dURAqbKIwAXXiUZIiq0Bqltg1JonmHYRiCZVGuVohsm8cL83x24QK79+zh5IF9jBULjJZLfPPVVwjjhNW1Va7fvsXGyjK18Sn8QolGq0m/1ycOIx2Um1S3lpnSKXYpJcIYHKWbhsaXH9LSSGC/H6AUuK62PfddF8/zKZTKVKKaNiaKtM26IwWNToefvvUWUsBItcZYrc7WmRm2zs6wZWaabVu3MD42zvTUNBP1EaqugyuESVIP+HKZXbKyB+k1hcpRWczr8mJDhhbDbGLLAm4zCKVlIWy5eWEQmbTaU+ZD5nc2zWopQvHMIpkETUHpRxHtbpd2r8/y2jpzS4s8ePhQU1CePOHJ4iKtbg+FxHJdXN9nfOtWJo3TmpBa515IQS+KDEXCmPhYNtI255MONhmbl7QvPwZSdnqhGX4vCJ4GjgV67UnjGJVlWzxX01YQucQXUgftlkSrWPT7bCwvU3Ncnjt6lB9/9zt84+UXKVgWUZzS6YWUyz5RmvBoeYUPPjnDh599SmLZTMxMY7kuSaqr/3XgqRdjrZxhqFdDC/QXr/OpG0jWn8g3c5sgVzYHW5vbUuVIU5ImiFRgexZRJAnjhF4vpF4tMzFdxrFt1hYW+eizs1SLBcaqFV44dpR6uQLCOH6i+/fBXbsoFktMjk8ipM35y5dYW1qkH/TxikVNkxCSMNZ6/wKJazs4joNIFVEYEUeRpnOYepFNF/vUPX9WuzwrNhbDLzAB/UCW0zya/fcpxOupr/7CkX2fGgpo1NCzGco40CbXu27LMQVrxgdCqZQgCEjThGKxQLlQwLYskjCg1WiwsbyMrRRbJ6d56dQLvPnGaxw9tJ9dM1MooNVukSQJ9UoVS0rWOh3efv8D/uZXv+Lm3btEKEbGxiiWTYYjjJApCMOjz8vRnnmxg4yUyhvpqR3OM9pFqaH/fNUx9P4sH6dSRafZxnItypUKYTRG2O9x4epV9m7fwa7tOyiOjGIhaPf72K5LvVjk5ZOn6IUhYRxz5vx51tdWcS2HSq1OwXgYxFkG5mvv71PYt/jKZ5/ZFJriaRmTlRiBxEb7NigFSRoRxYFWyLIs/EIBIQSttg6THL/A+JTP2PgEaRLl/hIrGw0WP/2M9z/+hLAfsGPrFp47eoSxep16rcLY6CiT4+OMjY5Sr9UYrY9QKRQoC4EnBKk7IJ4MxsfgAgdZuWzznuZ1N3r+GFAcn9lyQw2RUdR039FZZBA5NXNAlcy+cfMGUKLXogjoxjGdbpdWr0ej1aLT7RIrxdzCAhcuXuTG7dssr6/TaDYJogjbcRGWRXVighLjCKE3xpZjk1oaiIjCiH6/T6xSpLRwbEdL3CpNx1VS0xo1vUkZ+ll2fpm062DdUqnSWRDzCst4QOj4KaXoeRRdj6jXYXV+Hkcp9h3dz4++/32+8eqr1MtFJHpMn/n0Mz757DOWV1cplEq45QpBGGrH8jjB9XwsIY2fi97Y5dKwQqsy2ZZEKkVjfR3Z77N1apLCrj2Xm9NbfpO47tqX3sR/Rsc/74D82jX4q7/Ufz9+DOfPQxwT3X8Qvr9ty99u379/196719+4eemSs7K8yJbiDhzHJQpCMnULHUQmkOqAUEti6aLPKNK7Sd8sKqtLS5y7dJliqYzt2Lxy9DAesG98DPXaKwTtJj//27d4+GSe1uoKfm0Ez3ZwLFsrEoSRCRylDuwEWmUEyPjkwCaEeXhi3PS30oic73pmx69IoohekgwsrgXatUvqIgXLkog0Je14BGFA1Gyx3ukxv77O9Qf3KRWL1Gs1apUKE2PjTI6PUymXmZ2aYGp8lKLna1UT16VQKFDwfVzHxRPafc1GIIQFhoaTTUi/L1b8VYdCx/eZVGG2pMZAmKb0wpAgDOl0u7S7Hdq9Lmtr66ytrtFotljbaLC0ssp6s0m336fZarGytkaz3aLd65MisF2Xou9hOw7CdbFcFwuRF+KkKtEoROaMJvWGLg8ehdZw/YfA4J6VaRiWnc4QC8cxusJKZ2GUSnAcrQTg2BZpFLKxukqv2WSsXOEbL5zme2++ySsnT+pgPEroRzG2rSW+5tcbvPfJJ7z/2afMLS+xZdduytUqnV4/LwS2bUdTY/INlSkuM3rzWNbvdfO/iFp+zZuVluOyLUm33yeKIhzX1moorkeUxPSCUFO6yhX8Spf1fo/fnvmENA5Z2vgB33n1VSaqNWwh6ClFEKeUHIt9E+MUX3+FUqnIttkZPvzsMx4uzCPiiDQKtZGT4+A5Hlo0SBEGQb5xsh0HIXQ6/xngfn7/hi7lK9vli1vRLzRF3oBZYkh94QVfd3wZ3i5yG2sYbKSz1HuapsTG2lwKTZkqeloWzlIprdUVmqurJEFA2fc5vG8fL5x4jm+88gonDh1grFhAKEUrCEBaeJ5PKCUPl5Z4+6OP+Ztf/5oLN64TSotitU6hXNH6yHFsHHuzkfePinn/3oc0c3A/7JNiU6wUqdZqNJOYWw/u884nHzM9PY3/wmm21evaeVApPGGzrVLljRdewLIljiX56NPPaK2tEAZ9RsYnqFVLhFFCr9cnk6D88uN36V1f03bKyC8KA5wInaENo5AkyRxgRU6Xk0I7KPaC0OhkOziOi+0NLNDDIKDf7+nC3n5Ir9sjePiI9U6boq9lbYulIvValdH6CPVqnanJSSZGR5gYGWGkXMGxbUbqNWpmA2dJC9tooGdiAFlAKYU2ssP6qgv9+sNCPHMYKsilglMgUop+FNLtBzr47AdsNJtsmDVneXWF1Y0NllZXabSa9Lo9mq0Wq80GG622VoVJUyzHxncc7ZjpejormssCKsIoIQi7hjIncKRt6F4y11fPi3glRjSCIeqkUezKNuPDG7yhbpEayWZbatlo25Z0NtbpNhoUhODk8RP88Q9+yBsvv8TOWoUIaAMX793nNx9+yPnLl2n2+oxNT+OVSrR6XfpBiCVt3KKDihX9fj9fyzLHT4TCdmy9joURGytrTPkeJ/buo3X8yJ1L22evNdx/yCjjv9zxzzYgtwF59hzqz/4nLX0jBDgugFDFIhf37272X3ju+g/OHOyt3blTeLS4gIpjLMfRnGgDpaapQcpN2jrT1pVCG2akiUK5FrZfoFirs7i2ynsffsDk9BRT01PMjNSpWxbbx8f4Vz/5Y6qlMn/9059xe26O1uoqtdExLdkjY21Hn8QgLCxL88q0K2WSq23AoNp58C/AU86HKsWybMqFAkpB0O8TRaGmLiiVK7FYtswNQZI0pVitMTIxCWlKEPSJg0C7sHW6zK2sEvZvodIU15jsOI7D7m3b2LdnF6WiT7FYoFquMFIfoV6vUS4Wc+3vYqFIwXVxTNGbQu90bXO/hmXsst9PoxM6O6U2/a3pJkpPcHFMEGvjpYyvHYQh/TCg1emw0WzR7rRZ3VhnZW2NtbU1FhcXWV9b12ZHG03WV1dJEkWpVqNULlOulBmdnmHS83QQiU79xUlqlBJ6uR10dmbZ4pTdqjRJcgQxszDP5S2fur7BMbwQDqEqmxBivvCOwTyaceZFjsRGkXaLs2yLYrGA69ioKKLX7xN1OhSk5PXTp/nXf/InnDxyjOlygShJ6XQDLNvGL7qsBxHnrl7j1++/z8OFRaqj4/jFEkmq6Pe1BJ3j2CYdqsePZetFOrM3VqlCSuPuqIaudHj9HwaOsyefFRvkbxx6DTpVbFk2tq3Tskkc60yU2TD2etrAKo4ifM+jOjFBsVziyd07/OK9d2kHAdgur7/yCpPlEkpBFMW0UkXBs9k+OsofvP4au7ZvZ7Re490PPqAdBGz0uoRxhFcs4ZVKYFsEQUg/jlCJwjMyaJFxzP1SBG4YrX36waf+/GK8NOgvSgwh208H4k+3+VceatM5DXrmQEIvU4bIvis1xZyZe69jW5QLBQq+h0xiOo0GjeVl4n6fqbExnjt6lO984xucPHaUfdu2UnEdFNAOdOBSKZeJheL+wgJvvfseP//1b7j94AGxsKiPT+D4BZJU0Q16kCocM16zDYj6kubjqec2Odt+Tavkzw9Dnl/3etOUQgpso+EchiGO7VIolmhuNLh26zZvvfsu9XKV6ksv4bsuAoiMcsrW+ijfeukVHCFRScpn5y+w1mrieR4jY+NI16Hb6ZAX2T/zeHZ2Zvj5L7TTMx5RQJymCCGxXZfMeTOOIwAzDm2tFoYGChJjdpYqpeUG49Ssr9rcxfF8HL9AdWQUAdiWRbvdYH1thbVuW6ttxAkCDLjgUa9qF8uJ0THGR0YoFHy2zswwOz2NbWnvilLB11rfxaIGj3ytsmYJkftyaNO53PHhSw819DtWKs8UAzkQFqWJLuaPNHc+CHRmoxcEbDSarLdadHp91tc3WFpeZm1jg+WVFVY31mm0Wqw3GnR7PZJWG9vzqM3OUh4dpWY7OK6HsLTJXzavaqUtfRYp2q0zCiN9/b6m9whELjecmWDpTVRCoAZrVX6dw5RQ9AY3TyCZRkgMLcr1HFwpUWFEd20d35IcPXKMP/mDP+C733iTeqlIBPSAizdv8db7H3Dh2jUa7Q5upYLjF1BSajqvkDi2gxQQKyM7qay80dMkQUhwpIWNIIxi0n5ArT4S7t615+4HO7fev+b9txGMwz/TgNzuB+x+72PGzlwmfOMH0OtBoaALG9odvz877V0cGd9QSbxUrlQ/rpRL33BWZDmJQ+JIu2dlkyVCDtRVzCExjoyWlgRKTWGDWyzSbrVYWFnmzPlz7Nu1g8mXXsSxLDzLYmutxpsvv4RE8Bc//xvOXb2GVAK/VMTzfUqFQs45jsJQG/NYAzMgyzh/6WH+rE5mFmFT9KDS/z97/xVjWZKneWI/syOvdu0e4aG1FpmRqqqyKqsqu6u6eqa3B9jhcrkkF/PEFwIDPhAg+LJYYJ/3gQNyMVjskpgZcGaHOzPVsnSlqoyMyIhIGVrrcA/XVx9lxgezc+91D48UVZXVmdltiUh3v+Lce+wcM/vb9//+36eIuh2DECmNaydFExA6dpI2QVumzG4zTjI6UWJkiqTACUICx8XxA7ywQJok5HytXKD/5oP7XL11Aykg8DwC32iuFsOQQqFAtVI2xaHlCuViicB1mZycYHxszKjYaKNd61otVmNBb9QxpOwbkUhpgzpt0OckNbSLbjeiE5sFu9np0Im6xGlKu9Pl3oMHzM3PkWlNJ+rSjiKS1Li0ZbagRSkjfZimGW6pzIbakJm0bLENUpBg5NlIcwUeY1vuWE507qpoEPJcM9ei4WvwS9FbjT8LZvfkdR4MFAZ/X6s+IjB0FKThi3fjmCiOcF2HwA/xXYd2fYX64hIqjhmrDXF4715+9Mc/4PlnnqHiuUSx2Sh6gUcpNAWdl69c5bW33+ajSxdJ0Ixv3ADSpd3porUpWnStokufvmBQlyRNexsxsU4H6MEvv14P6DxwEmte3A9Ae48KyNIElZnCQYRrajEyQ53xPY8oy2h3OyitKRUKhJUqw1Mb6CwvcvnWbf72F7+k0WrznZdeZPfkBG4xIMs0SaqQrqQY+OzdsonqP/kn7Nuzh3MffsQbp05y9fYtUg3V4RFGxsYoFUsUggJRZLSOO92uMWlZCzP1TlM/JUCyzz/l6SeoBPmxPuV1vRd/Ynv6C/JgoD9mjLqLFOBJkxoXGN504DgIpXj88BH1hQUqhQL79+3n2SOHeen553nm0GFGq2WKvtfjeYdBYCTPBFy9d5/X3n6bn7/xJpdv3kQ7DuXaEL4fWG56Yh2Ie0KMNvW+WjmlX6Bqt9EDt9TTxuV6Wb3PmmlY/R7znRwhKJQKKK3odjq4novrBdSGRmi1W7z30UcM12qMlkuc2L2bQhCgbKDkAqOFEs8fOUoUx/iuz6n332d+fp52q02xWqNQCA0VI1N82gXuBZJrH1s7KEX/d61z0MTMybmfhsYUzoL12LCgTy55qqwDre/bInGL0mZpThHNUX3RWwsUGV5YYGRikkylpEliZPriGJ1mRJlmbnmFpWaTBzMzBJ5visgzhVAK1/Mol4pUSiVq1SrDtRqVSplarUqpVLKBuXlPtVikFAQ9YZU+dWVNoGo7RGOcSzOVkWlFnCR0oy6dKKbZNKZDjUadpZVlmq0WrXaHVrdLvdWk1emSKaPLH6epoc2AWWNcj+GJSYbtRgVLD8Vx0I5LqkElhmeuler5AGi781ZKI6VDoeD2JBnTODX+DD2Q0TGAiTTF1j0lJDuGe2eqn7z/e6uzsFk/NEkc0VicJ+t0CaTkmYOH+eEffZ+XTzzHaMnUdURAJ1WcOnuOX7z2GvMrKwTlMqVaraea4jgefmCKNJMoIcsy3Px75mPWUrIcR0KmUGlKJQioVYYfyMLQv9dO8N4n3vRfsfbVC8jnHsObv0H9+x+T3b6P2r7VoJo2JaO0FqpYcDUa5QcP9ZbNfzG9f//E9jQ+0Y5jkkzjBQVj144NyqUwKdAsI1cLcYSR+hNSWFWFjMAPqIwM027U+fD8x4wNDTE1MUWwbw9lYVQpDkxvpPq97wIC1w+58/Ahi0uLBIUCw6OjlIoFaGs63S5xmuAHgeHeOh5C5NrF4ong64kAXYBWoHKdcgzHi1w1xo4uhTZV4Hbly7LMoBU2YHEcU8nsihDPD2xhmuztTnWWUV+OWWmYwlWh+46AEpO+DAKfMAyMcU8Y4rouw8ND1KpVY3qk6dl1e6sCctnTwDU7eDNB5wF5mqbGHClJzL/c3CFNyLSiGyfMzc+zUl8BIMlyvVrD6faDAD8MCAsFfD8gCFw8z6NUKOJISZKmPRMJrTJbLW8QTamN4kcfDezDBUZtRvQncvJFP1/EPj0M/701AQqz2UiyBOkICoUCvuuSdLsszc0TtVpsHB/nlZde4k+++wovHTzIqGdUC1pJSqag5nskwJVHs/zynXd48+RJHs7NG85idYhGo0WapHhW0UAKSYayiIZZ1bTWPSc1xzHZn/V6Igdd1uP7f65TF4I0NRN5WAjxXJ8ois2mEmtx7ftkkSJRGd0kJlUOpZFh/ELI8sICb549y4P5eRbrDf7ku6+wfWrSbFS0IEoUroCRIGBk4wa2DA+xY+MGRoarnDxzlmu377BQr7M4N0exElG0KXQhhOHvo3v39uqzX/3beoHS5+oHeKLGYL3jfUaAd/3PsPc6FhXXeRGfI3E9z9ItFGkUU68vE7fbEMfs2ryFvTt38q0XnufE0cPs2bqZ0UKBmL43Y+5W2CDjgyvX+JvX3uDk2XNcunGDWGlGh4YJS2WSJDXysRoKnkGTc/QP1kfHhe4H4mrgiU8U8/k9NPPdMjI0pbAACuJ2jMoUxULI6Ogoi0rxYPYxb71zivHaENVqlQNbtuDZ4jylwROC7cOj+C9+g9HhEQrFIm++c4qHj+dJM8Xk9LThJqfqE7MDn+u7rwXVtZ319OA/rIye4VJLKQZQcW25ypK1UV6ewcnrjaSwogb2ZnBdB79QBHTPpCfLUrLEOGkmcUKaJjS6McvNDlopuq02UbuNcCS+7xH4PmFgwKIwDCkUC0ZhyjN1Hp4jKQUBBc/r0Z16tUpSrAJZcj02Td9ePsMopUWJEWjoRJEBjTod2u22ydhGEXESE6dGHSR3ZXY9D9f3CcKQMCgQ+AF+IcT1fTzrLttut4mTBK2MklWf5y1NxiHJUIldpwQ4ntejp2SpKRBVVvHJcYwZnLmoNrPbW8NUXwlG2wu96u4Rq4ClIPQRWrGyvEh3uc5YucwLzzzDf/bDH/L8s8fZVKsSA5GGR8t1rty8weun3uHC9WuMTk5SHR3FDwumNiJODQ9eugitieMIKSW+75sCcmua6FpQVCpN0u2ik4SDmzYz/syxR+cO7v3LmyNDl36HW/1L1756AfmP/4L0v/1vuaHhZhjAwt3Vzy8sxHr7ds3i/15m7FpY2Lb11MSxo3+yr9U4cfbSZbpRTKlcIbHoqc1fGQtYW4zXx2ztxJqmpDrD8V2qoyOUq2VuXb3K2ffOsnXDFBXf5dDOHYDp0MmhKn/6R69SqA3xNz//OafPnaW5vEQxDAg8l4LvkSQxnSghiWLCsEAQmMcym+J+EqERA4uJWebNYHTNomN5u2li1D567pcWvTCmO6ZSXVl9VJUp0kT1BmnujildKxeoNWmSUBseYcOGjWDTlMb9Me3ttI30oZlgW5lCqIRHt27TajZAY4Nu0Zd6En3zjjzizWlDmeqHDfkkKaU0RZP2PKStKHdcl6GxcSamp82mKUewB1cAKVYhOMq6iGZZ1jP0yI/vDHS6MflISRMTeOSZB4TAzfl7DLgrDlTOrRePDwIRT9WFzq+16P8+GKzlzw0+lmXGeU4pZdK6NkWbxTHNlTppFDE5MsKzR47ww1e+wysvPE9VSiJl0shSOoRFHyEFNx4+4qevvcHJd88wt7REWCoTFIrESUqWGaWIPODMetmC/HxzjqJdoIUwiIZFgvWac0Mbt8hciq7XIwOci7446dowVvdeahSREiDAdSSJgDRLSbTC841xieMYulYnjkji2Fhb12oUtWZlfoHzV6/TaUdkccKPXn2Vg9s24QlM0bWCWJhMTlgo8NzBg0xv3MihfQd46/RpXn/nHe48fMh8s0VpqENlaJhCsYznG6v2NE1MX/S+fW80rwqYB+761ffL4H2xzuOQzwfrPfHkMdaPQz85fNOA57g4nskmxmliDNSEMFkJQ6JHxTHddpv6wjzdZovjhw7xJ9/7Pgd27eHY/j1MT4wQSElHKVOo5jj4VravpVKu3rvDj3/6U/7qV6/TiGK0H1CtVAjKFdJM0W530Jki9I07r1H36JqAu2fvmG9QBrTbNWTS3G95V0meLJT+bdu6vScNxzpVKTKRxn0Qk9XUmSIolKhWh0jjhPmVOucuXGBkbJRC4LN7cgothJF6Uwp8j4lKlW+eeJ5UQRSbQs/5ep2k27W1GqtTKk+g4AMPrr3D1j4/iJH2h6sx4jE1Krk3hYPjGdBKqaxHYRFCGLBH0ttASasgZtaWfpSX1+XkDrhRFNHpGhUX17oue15AEBR6/afS1Dprmn++nfe0LTDP0ozEAjqNLGV5aaXvwqmVLYaPUYmt6bJn2pcl7KPlemD+SSz9I1cDy4sqXc/HdY3ko1uuUJCSkpXcdYToAdHmmNJubujNn3Gc0o0SlGoihMB1PSSOKZbX2mSqrc58lqbGAdcCH0EQ4AjH6nQbAzwQOF6eKTdASZqkaJ2tOr9eEL52Ds5nKQG6t1abgui870ZqFZ45eJg//5Mf8erL3ySUeR9pEp1x4+Y1fvGrX3Pr7h0KlRKloRpBsUiqNLE9B9dxSbSRVVY2+HYciVIpWiukFJYvDzrLiNptnCzj0JbNxCeOL//bo/tmGmFhvdH3lW1fvYB8eRkePECHIbpWfTL6aaxkNBqK5Yh5aL87PX37O/Xl81MXL3y3tbxc6SLkpq3byNoR3TQ2u3hpbHGFMEoRQA/t08oaEUhJZIsyQ9ehNjzE4soKf/nXf00gHEbLVbaOjeA4kiiKGa+W+PaJZygXQirFAu+8e5qluVlarQaj4xPUiiV816Pd7RLHsUWdc5R44JzygSLoqW+Yv01aR2VZfz/rGKqNVANKJdbdTGCt2oW0lfEG3QS9agJKlSKNI/NWjeFOS4c4sxbzykwowpE4jkZohbBumEop69ylIQjxe+fSi9p66iz9c+sH5GgboK2ZGKU1NcitufNrJB2HTEoSDdpSdMxirKzVN71Uo0Yhc3R/wOra7jvMwme/i7R8TGm50lhFHK3pmcIYZYF+ijxPv4I5lrbX6InrONDW23T10fb1X7j2dhf0NddzrmS70WDx8WO6jSY7t23lB9/5Nt954QWeP3iAkpRGrDXTCOlQDEw1+3w34a2z7/GXP/0p1+7cQfgBQ2NjSN+n2WqBMuiVEEbBJdNGE9ZxHHvdM6S0CkJ5TUaOEK8HzdqItKeCoNc+Odgza95s/1S2sNRzXdCK2N63bm/xSoz6ipCW0uKhEUYzvhshwwK1sXGydoc7Dx/ylz/7GY8fz/Gj73+XF44eYSg0KGw3zkhShSMFgeeyaXiY8Pgxtm3exJ7duzj9/ge899F57j56yEyzSaFcplYdMvKhjmPdYgc2b+S3xtrNBj3Ezoz39SLGfOys2sWs87r13jmgoZCDZoPQJfTqHsTA5+fKKvlGXApBsRDiBwEqS6mv1FmaXyDtdhkqlzm4aw87t27hlRdf4MXjRxmpDTFSKhIKKxJsA7aCNIV/j5t1fn3qbX7y61/zwbVbLHe6eMVSr7A6yTJ0pnrSsQ6SOIr6/SMG+nCdwrS1G5/852frtd+uKTTCc3GRdKIIF0mlXEaliiRJaLc6eJ7P2MQEK0uLfHT5MkuLiwwVy+z6wZTJGniu9a7QOAKGBLx0+DChHzA1Mclf/fRnXDp/nuHJCTZs3UocpzZjoPtzj7CjcAABHTzvJ8dev3PEqteaAJR8bGvjPKyENllTbQJEQ2vABsC5J8SAC6TKeh+BGljT7HjogzU2kMyyXtH44I5SIBCua1xDXbMOaCVQUpC5Em2zxTguOBlSKbAunEJrpArQKl19vLVDK9842HnZ09oGTCKfeHGlEWjAccF1UI6DlhIlbO2oXXOMHKqkz1o3QWhmdcxV7liNRqu+O7eUfWWjfHvgOi5KqB5o1iuqFdZIx/a1iWHM1zUBvUTrbOCz1l7jwRvA9osQeI4plH107x7dRp2dWzbx6rde5nsvfpPj+/dRc82a4gAhGXdnHvHmyXf421/8nFaWMbFxI3gu9U7HADvCoRDmJnYpCAiDAqDoRqYGznawEcWQDkJlJusWRWnohu/5paG/yIS7Ahh+zNOaxoCu3ron+qVrX+6A3MY4srOIXOpCqWQGydatBhUIwyffE/qa2rDWF+a91mH01emgua9ceGtz4O+dGBp6dbHdGe62O6QKkA5Kg0AipDbOlNLwpzNMYYpCI10Xx3VIo4xOJ0K5DmPjU9T1HJev3eRvf/FLRodH+P7L32B6wxTtOKHiOGwdqjD+zRcYrhQZKoW8ffpd7j6aoeEsUqrVCIOAVGfEaUacxrYyWqwKugbvof5Q7v8vs6kpaSk2xsVstb1QHgwYGSNlpAXziUj0qRcIeosuWltE1CNVim7U7vM2Zd+pU0iJtBY4UoC0wUdYKplgVpupB637k24vqBhEYMwgXCtD1Qeg+3zlPODNufdpkqwyXsjPtV+AJhAyrxvIEXFpURlrbmQnbHMA2Ss+Ep5EZ8ZyeBDN76E60E9z2mtn+H3rlUZ98pygdd/O2s7IAxztfNHoF9cpy932HCM1JrWm22jQWFokEJrtO7byw+9/nz//4x9wYHojRd+nnRouoxQQWBOgB8srvPvRBX7y69f5+MpVtO8yNjpJsVSikyREUYTvegjp2cyB2YAJz7N8v16kZYqH09QgOGL12a4Njn7XprXJXLiuQ9SNyPI6DMeabaUpOkuRjoMrXVM8JF1TgBnFFAsFqiMjiGrK4wcPuHrnDo8X5llp1ml02hzatZPNU5M4rgupJk4zlJC4jmSiWGRqyxa2j42zf+dudm7dysl3T3P34QNWmi2yVp1MmMU61+iWjmPRMXtNdb5xsxmF3k7DdFS+8TSjQ9uxrHoLdb7Yf2If2Z9yYGPfc9MdCMJ1T4XBbLryOhLzvELZzbCQAsuVI4u6ZHEM3Q5VVzK8YYp9u3bxyje/ybNHj3Boy2ZqgQ9YxQllAsV8rDS05s7Dh7x//gP+/Y//I6+fPIVTqjG2aStesQSOQ5IkRFGMxNSvOAhUmhIlRuNcup9fyWfw59Oe/53vU215r1LS7XZBCFw/QImUOI5pdzqUykWK5QpxkjA/O8PCxUu8fuoU+/bsYfvGjYwFPrgOcWyodU7gMFUo8N1DBxkpFem0m8SdFo1ul/biEsL1kJ6HcKRRotIm0DPnZTnbFpkV651pfoPk150+go2wy3GPokePL94HMsxaACZzp5TCHbCyXzWHD+wMczDI1BMJEE7v9blCSK7sZJB5abOlhhaTphlRNmDOKC0N03VNgCNWrytSGMMhKUWP6jq4qxvcCA+GrUL25/jcXj4/l3w+Htx8a60hy6yIRL7NGFin6ING/fXDZGZzUYb8tZkyxxGAdM2Km8s252NXOnZ8YovrrRa5EXcwqm5KSTQDNEPbr4a/bs9Y90EepTVJ3CVup4iow5bRYX7w8rf4L370I47s3IUrBBHm3lDArYUFXj/1Lm+cfIe7jx4xvmkTlaERlhsNOp0OICgWSniuZ+WYDW3V9zziNCZKErB1CkIKQ8fJFK16nYKG2uRU8mjP9h8vieH/mP2ymaF8EOtL7AJG8iYEphRsCWHky42of7kD8gAQUPzFLyj81S9R1SosLsLhwxbhXGdaVRk4nuDt/9VPRyIp/4//22gxis9MSb3jW8+deOHjK9eHL927T3V8gkK1Srcb9dKLnU4H7fuEQWDT1SZYTZIErSTFQoE0MVrO1bDC8MgEcavL1Vt3+Pd/9TfIUpEfvvJtRqtlPMwNWgBePHSIWrHI2NAQP/7JT7ly6zbL9TqjGzdSLFdws4xWt4OyGxBDQcEsir2JSxuKRS5ZpNWqRTsPvA3sMBDQDnSNzF0t7SQqxUDxhJ0c+rtpMz5VjlxbzVWzkFtFGI3JA+fvz0EZrVFpSmwdDdd+kz5dZfDC9cPVpy2GT+Nmr9JGzr/5qrRc79C9yZQsR0vsdCtlr99MatSep0V0cvUAM/la1En0z6O/8PVRzsGU+Opvvh5mh0XhNa7j9YLKnEdvUplub5JOk4wsNWl/T3oErsfSwhyLj2fxJbz07HH+9I9e5eUTz7Ntcgq0IlGKwJEkUUYGeMI4cb57/hL/6Sc/4dyF8xSGahRrNcJSiVa3TWqpMGAXBQxSrpFG4SUz18Wxedk0NWlWIVZXQYgnT7eHzph76ml9tf4jYK67Upo4ToGcKyl61yKXghNCGE6i1ccPHBcQ6FTRabWRaMpDQ4RhSBp1OfnB+zycn+PZo0f5x9/5Ni8c2I/ru3Rxe985w47vQsjRXTvYPDnGM/v38tGF85x+7xxXrt/g/swcCYKh0TEqw0OEoXFlTFPDhc7SzGabBJ4wvHxlNzuYvVZvQVYYgCBVZtPhuv6qQHowxMz7s1fEqG29x0BwpYWh6WkbRBhqliAMTZFVlqY4Vi61m0ZGOSYMUNqlWV9hcX6JxtISoZRMjY3y3HMn+Mbzz3N0/wF2bd1COQgo+x5ok6KOLBe2YF392sD7Vy7zk1/+gnMfvMfV27eojk/iFStIxyVJUkhSe2+ZcaZURs5ok57s9cvqje7AHCIG7hxtte51/1XrBeW/TSC+7nssuKE1BEGA1IJOt4NQRpFIaiM12shaIB2GRscRWcrFa9f5t//xL/jzP/kRLx7YbRdoE+7kY0VIyebJcf53f/5nvHDsKP/y//OvePOttxnbspWRyQkCPyDVRgI2TowFuee4VprV9KNjTay0yshLYo0Xh80eavP9c2dHLTSudeaUxvZxsLtNP6zKAEmbZVndKSbwHNhIKhvsiv77czQ9/8PJ5Yh7H2Teo22B5RNXQeuBrMCT10ghyOxnPJ22tPoE18Ira60iBsuJ+9kZC0L16C8GnMopZvl9u0rpRZiA2/yujKCEztfXQQKNWZ/y+1wI0EL1+lDZtQRtX5dpsxNhIOuMIEpSlNb4nmPjAw12I+W6LlE3YmFunqXZGb559DD/h3/y57z47DPs2bYdPRCMe8CNhzP85K3f8Ne/+AW3Hz1k044dOGFAo9lAa03o+2ZeUxlpoo3UtM2ix0liaib8kNTsZnEs5z/p1Hl47z7HJid54TuvNE7+2feunXs4NK/+p3MB99sONe/p7pza/q8Zw3+5A/754ae+9MvQvpwBuRBQKcPlNlz4n0h/+h+I3n4PXSxCtQqVinndegGalJCmMHNfJQv3BPMPaA2Xl5xS4dT2ysiFRw/ntrSu3cCv1gixC54ZKfiujyMdu7NUCOMQjdTC7ibz4khJs9UmdF3GN0wz++gRl2/f4d/95V+RSfhH33uFqSDExwy4QAoOb9tK8Qc/ICwU+eWbv+HC9WvM3r9Pcahm5PdKBZIk7SGxUgs8WxwHpmgnS1MyZQJzx/WQrklB9QpaTafw5PRhB2L+/FMC2/y1gwi1spNKjgzYjh9Y6NaZ9UQf3Vj9HfpHBdZMhmLVGXxiyyktn/a6p7xoPTnCAVb74Nn1C2oG0Eo18K7+Qe1NNLjUD9AKPgvyZoJts2AmKrNGVaYQVWXaooURCPA9n2KxiNSCpNNleXaWrNth88QEzx0/wj969VVeOHqEzdUaAkhSw9VzJBTCgChTLEQx5y5f5VfvvMOZ8+eZrzeYmJ4mLFfQwkySAJ7n2dvGsvNlnlJec321RXA/4RxXXXPxGa71E702GMbnqBu97MHg1VuVaclRJPq21SrNSNFIR+IXQhzfI2tqZufnmbuwzPxKnShOmFlZ4dihg2yq1TCJXxOQx6nCAYZ9n+HRMTZWa+yenmbPtq18eOki569c5+b9h7STmPrSPAvzGa7vUygWKBSKhMWidVRVJKlx13MdoyGcWidUo+uMzb47ZhHLNz+Z4dK6jrsuODF4R+Z/SCEsvSxDC6MkJB2Jq43qUBD41otBGVUkIXBEgZXGMo8fP+w5vg6XS2wbH2fnpk0c2LWTl545zuE9u5mo1fCtRGi32yFJEoIgpFwokAGdJOHqzAxX797l1795izdPvcP9R4+QQcDExo1oJElqdexty5F6NXC/5TJ/T5vK8nMfbGto1v3b6Qtq2gZSUjpG/SLLzMbIbjAyrUhTE+T6hRCpNbcfPaLZfItKbYhqpcKODZMUfYmTCnSqySR4jmSiOsRodYhtGzay8HgBKVxW2h0W6g0aK8YELyiVCApG1tQYCdmCa89DqDxrmSO+CqXAESCQlv9uNhSmaNdye1W2zm7myU4cnC+fbLL/jk/p//zpHu+8d0QbeA5QrPodzxM3xtpv0XPX/Iw7sCdWVLH2+X7rB9j9cPvTc1lPHrufFxv8e+DzckzSovMme2DmQccVSOX0TOqMSlL/MxzXKrrY5zzPw/c9JJBEEa16nTSJERomhmoc3LKJf/rDH/Cf/fEfM1Iu4TsOKQYz7WYZDxp1fnnmDD957XU+unKZRAgmR8aIlQEbpXQGlLc0WmU2G2Kua5Zp87t0ybLEAIOeQ6fbptts4HkuG4dGV7aMTJx8a2zkTnbPgWtRwo02jPbNodZtmYaZCF5MPvM1+LtqX96AvFaDd07Bv/u/0FUZXYBGA2ZnP8sRNJAw+za8+Tbpf/lP0X/2Zw+6neSvvVJpYrhae1anKZ1226ROMrPjL5WKCG0KGQX0ZgPX80AIulEXgcQPAuqNJrHrMjk2xqatW1hcnOfM++/jhS5jYyN848BBNpdKZGij/gHs37KZyj/6UzZunObHf/sTXj/1Dq2lpR4n02h8GD6eENIsxNZyVyujw53ZSd0VRkowzTKUWGde00/9g8+7Cul1fvssb3h68eKaKHXN47/7Gvm077l2mzLwDfXqx9ceZQD7eeI46x37aW3tujHYpGPoQKYYMEU6Csd18XwflRkTjjg2qVnf9Qh8j6wTE7dadFfqbJ3eyPdf/iZ/9qMf8sK+PUggSmKyNKEQhEjpkCmN70iWo4hLt+/wxqnTvPfRR3TSlOroCH4hJFNZTx2gF9QO7CjWzVQMcBLXbetdkk9Fp57y3Jqnn7xaTx5m8F5cLddoXpYpbYqkiiUqw4qo3WZ2aYFf/OZNrly/zo9efZXvfetbVItFhouhKfrMFJFWKGEQPM/z2DW9iU0bN3Ds2FGu3LzN2Q/Pc/XGDT68eIF7Mw+Jul1crSn6Aa6xTTAp7jQxxdaOm1dBG4QVkPQlQqXdoCtbxK2VRjv07LHXb/0NjOkWK92pFa508H0H4QLKgABaKXSSkJIgHMdkFKKY7tIyfqnE5slt7N2xg6OHDnL80CG2b5pmqlLpARCZnUMbzQZpluEGIR7QjCKu3LnDG6dPc+bDDzl/5Srz9RVkoUhtbIxCpUqnG5El3VWbqfVOTK8HBPw27Xd576e03inYTaMcoHuY53sRFZk2QV+iBXNLS/zm3VMMVSvoF15i1/QkRVcSRwpyR1xbSCmV4k//+I/Zsm0Hr588yWtvv82dhw9RKqNQLFAMQxKlaKk2iTIFlkI4JiDVymy+pLRjQqFSM+Z7mVEEvm/Q0m53wDr9s/fC+g9/yhBf/6F1gJTP+FXWvkw8dQ36bO//vM8/7RX9e+HJxz7jgc3+w3LITYFvrrgmUELb4uecHmfuu5zqKqTAEw6OtNOOnYuiZoMkihgbHeWlZ5/lu994ie888wyTQ0M0Gyt0iShUqgA8WFrmjdPv8rPX3+DKzRvgeVSrVXtfZeTqaTlavd4mqDcWdO7xYei7y8vLqHabXVu2UNu67codL/iLhpb3cBIoNRWVOpTXoS4PtkzDSARuHZpNKJcHP7i3KfgytC9nQP77aT2IRcgCsT+0Mq/in3njk0e2TW949t78Ap1Gg8LoKChBiknT6MwU3QwyYnK1hSROCANjjqOzjKQbsbi8TCHwKZTLlLotrt+8xf/64x9TQDDx3HO4mEI3ZfmeU0M1Xj5xHNeRlMtlzl++xM0H97nfajI6Pk61UjEqBmlGlMSortkEeK5HEBYoCmkd0hI6cYy0Ve56baDyGe+vwZ3/J6MFX+DK9QduPdRlAKJdt7v0k09oWC0vpp98vrcOr3PQ1VsOE26ZhwTd2Ej4BWFAMQyNMki3S7PVwnEcCmFItVZFo4m7HZYWHrM0M0dJ+jxz4CCvfufbfPP5ExzYuoUQSC1y7Dhuj0KSYuoj7s/P8/a7Zzj57mnu3L+PDEOKlQqu7xk5yMQUFjmyX8T6B5Vz/ALbINqmUD2NZMczUplgFIySKGJ+ecU4CP5Nl3v373F4336+efQw2yfG8QOXBNMvnThGK00p8ClIh+mhMYYOltg6uYH7s8d58fiznL9ymdv37nLz7m1mbt+h2ekgXY9StcbI6DjlWtUoOVjakjIFLkhp6EIqy6x6mbbGS4amk6Nk9uz6iLj506qQiB4NTljpSi0FrnQIXBcVp0RxRDuKaLeaNFZWSOMIqTWOEGyZ2sBLL3+HqbEx9u7axa5dO9ixeRNTI8OUPA8P61KYWQdbNJXhEYTjoBBcnZ3lvY8/5uwHH3L2/MfMLCzQjGLCag0n8MH1qLfbqEybdMDXoa1B5Ndel97LRE5ngGKlTNbtcuXmDQpv+LhA+eVvsHvDFF7gkMQJnSjBDzwcKakUitTKDu6BfTZwdjh55gx3Zx4xc/8uYblCqValUCwS+B7tdodGcwXXMbK3SIHn+PjC0M2iKCJJMnzPJ/QDpJTGkr3VNtxly0Nfc5qrzmm9/OOnPfIk9v31aGKd3wbb6uD7yfNfvaQ/uRgJ+7hwrCtnqkAYkEDaDJjxDrCrjWPqzOIkIkpiyqUSxUIIKqO1Uqe5vEwWRxQ9jx1bt3Lk0CG+961v8czBA2wYGkIDXljEcxwcYK7d4sxHH/HLN17n/Y8+pBlFVEdHKZTLdLpdMm0dfe0X7heS52c3sGJaap0rBJ4QOErRrjcIk5RjmzeRfOcbN398/JlfzMjyDCtn4eH/AI9vQ3vkky+CBpIM/g1wZTP83/6v8M1vA+BKQTAxgfR9dKY+8TB/iPZ1Dsg1I8Pw/As8fvWP+PDI0biTpje2VEsfHY7a7WajXrxfb0KthiMkWgpDVRlQyNBgK6ANCp1L32VZhh8EhgoQxwgBQeAyNjbO4sIcb586xXCpRDkM2bt9BxPlEo4QtDOFJwUbq1W+//zzjA2PcPaD7fz6N7/hwrWrtBcXSaIuQbFojGs8j1gnZJkR85eOYwo/rYRUplff2p+Evq4bXT7RxJqf+fv+7m/Ur2cbVOIWCBy7WTdV+hpjvqGFcZZ1HGkdKTO6rTbN5RVqhZATBw7yj/7oj/j+N7/BhvERXIxEVx5QC+GQKZCOkX+7cvceP3vjTV4/9Q6Xb92km2WMlIYplItk2aDrorVozouwVgOtX90mACEQWiA1ZNpo82vA811DKymXcVyXNOoSpSnvXzzPvfv3uHH7Jo12ixeeeYbx4RrDxSKhlDhCEglFJASpHTLDQZHRTUX2bdrEs/v3cvPoYW7fvcsHFy5w8epV7j58yPzKCpkQxO0mSRzRiWJwHfwwtMVNDr7r9WofTG2CSUP7vo/jOCRJaoP3Tx/fmpxDampjoqSLkoKk1SFqd8yCLSUjpSKFsWFqlTKVsMA3jh3n2yeeY3xomMnxUUZGhilYL4dEaSKt0UKghEB4xnkvVpq5xWUePJ7l7TNnOfnuu1y5cYP5lTpeoUChWiEsl9FSEiUJnXbXmE5Z7vrfl5aHJQhNaagKSZFH9+5x7uOPUFlKWCwSvvJtxosFXM+lqxRxkuK5Dr7jIoGpaoXy4cMM12pMb5ji5JkznPnoQxaWFuh2mgyNjlEolQh8B6UMLQoUUZyaLJxnio9d1zPKYrZw2JGCxBqyOI6HQH4u+sU/tM/W1iN3flIvr9roWURcYYo5jcC/RvcK0PpHVDpDKEOFC3yPQuDjak271WJlfo6002FsqMaJI0d48cQJjhw4wL6t2xgrlRBAS2kKnjH0mmm1OHnuPf7657/kzAcfsdxsUhsdpVKroaSkU68beq3nfabxnC8xoeci0MSdDqQpQ+VytnnDppUb27e/f2fD+AMA4mVofQQsQvP2px4bgFngbz6C/fvBDWBpiZVOl5n6MtNpHX/IIP5/l1PP1zkghxdfgn/1r7gzOsodzH1aDsSNgw/vvTV+69YLj+uNobjbNRa+jiSJY7Po2ZRxXjmdKYWwhitZllFvNiiEIcVSERX4xFGXTrdLsVykUqvRWlnm5JkzBK7HP/rBD3n2wAFKnkucpLSzDN9xKYUBx/fuZmJslOHhISqv/Zq3332XR3OPmZzeRGVoiLBQpBCERFFijAfaHSIR4XvGGc/1XZIsNdxKwUBR5dM65JOH+HrP9hHdr98kvArNXu958eTja1Hv9fpc9/4YILrowb7sPdp/j1Km+Ms1vLlOt4MjJcVCSOD7oDWdVpvl+XlUmiCVYrhU5KWjx/nH3/8+Lx0/ypaRYRIg6kSgNMVCYDSCLYIrnYBWknHyzFl++utf8WhhAeF51Go1SpUKQgjiKDZ0mZ5JQ54xkp8zVf3lbBZgRmALlbVAZJokS0izBJV5uFYRJSwUkIUCUhvpuaVmk48uXaLRanHz9i0OHzzIicOH2Dw+TmD5lxrodGOSbkzJDykELsKBWjHk0M4d7N+5g+effZY7jx5x++49PrxwgSvXr3Px6lUePnxEBvjFIoVK2YAAQYCUJYQtuMudCVWa9QCCOEnRa1muOVHe/NHHooQJ5lViClrjdhtfQ9JuQ5oxNFRj8/RGNm3cyNatW9ixfRvT4+Psm97MppERPMt/1kLQTdJeUZjjufi+h2tpGRlwe+YR77z/PpevXePs+x9y8949oiQlrFQp1mr4YYgWxkQpS9UAhePr1Qang7XYYP8pk+F0PB8/DKmNjtBcWODSjWsUX/sVYeDxnZdeZHO5hB/4xHFMlKRopDU0g5LncHjXDoaHhxgZGUI6gvfPf8T9uccsJDFDI6MMjYxSHhkmSVOazTZRHKE6bXzfp1Ao4vs+rusaJZso6gXmhTDsmcx9SbL7X6m2FuJ6Yr15GmVlvbbOm83YljgDZhpGeqGvVKO10cBPlKJUDCkXK6gsZWV5mcbyMmm7xeTIMEcswPPySy8xWq7g2I9sZxmJ1gTSZbHV4oNLl/nl629w5oP3aScJoxNTDI2NoqSg2+kaZ1/5ZDH1YJpoMCcgbMLY93yS2PDYq2HA1MaNS3Ft+D+0PP9N+oIuv13TGv7Fv4B/+S9BaxYaTbobJhn6r/8L3NrQb33Y31f7egfkUQYzTVQcwqNHgGBlpPTh8nde/tdTzcbE8vLK8YfLyxSqVcq1mkEGlcJxXKR0zR2ilOVuWnQ8zazbZYJv+b2Zyuh0EhqtFq7jUB4eZubxY147dRolXRAOzx05SCE0yggqVThaMxT4FDZOMVR5manREcaGhjj1/ge0k5ilx4/RrkupXKFQqhDWQuIkIerGJGmCQhnJrxy6XAOArx9e563/4lVFIwLWzrar/vqqx+Tr0E9W/7L6tasCct1/bPAAT6en9JfaJwLxATWXHmtGGDthnaaoTOO7PkHgEQY+WZJSX1pieWEBMsXk2ChH9u/n4N69fPPYMY7t3s1YuQSAkyl8SwjUyhQEIgTCD7j5cJb3zn/Ma++c5Mbdu2jXwy8UKRSNnGgURbZoVJigVEpjtJFlOI6RG/s6oGOmwCnDzRUcsFrhSpOmVgbMsiakMPq61fExkm6XVrPJh5cvc/fBQ85fucLN27c5duAg+/fsZXpsmCIQBB6R6+BqaUSP7BwS2nqQ8lCNiVqVPZun2bd9G/cfznDz/gNuPbjPg8ezNLpdUgEPZmepd9pW8cfKcmpjcpQkhg/suY7lXA4m/PPR/2TGy9A4TWo4cFyGh4eZGhqm6pvCy4mJMXbv2sm2LVuYmhhnfKhGrVSm6ji4gE5SY0ICCCkpBD5aSnxLm5nvdrm/tMTj+XneeOcUvzn9LosrKyzVG2TSoTxaIyiVENKhGyfGkRBj8hUEvilQz54umvCVaQMByHp5xyebmQta7TaRI6mMDOO6Dq3FRc588D5oTZql/NELz7NpeBgnCIjstTBOyAIyRdF12D48ROnEc9TKJXbt3Mbpc+e4cvMm3XqduW5EsVrBC0MKYUAQ+HSjmDiJaXfbBH5I4AdopUmTiDjNKPgBvu8TpynojE9bXT6trdcPX/1Z5fffPtu+x3oE5FQQkYOJeRBsFikjGGAysFIYe6LWygorS4vEzSZF3+fA/gN88/kTPHf0KM8dPMSGcsWwALQmSVMCa+I1F8WcOn+Bn//6Nd46c4a5lRXGpiYp14ZRQrBcr5NmikKp1KMDPp2wsxoSk9oEpd2oS3N5maMbN3LgxDPNey888+v7m7Z+WH64HLR+9ZOu/tf/M7RaOVPu800Y3a75Z1u0sMiVn/yKruuC4xBUK/jlMjKOcbtdZLttsop/ALDgSxiQu0AX1E0I7sAo0MFoSX7WpoEm0LoBf/UvjDJLsynptr37f/znMx+88OrPDz148Ge7Ll48fvfiRaKOS7VWM/w4ZRBx1zMBSJqmhoMlTDAORnVCKUU3isE3N7yQkm4UUSwWKJeruI0W9+cX+OXbbyMdDyEk+7ZtZrJSRnmmuE5lRslgc6XK5HMnmBgaYvu2bXx8+RLvnb/Aw7l5SDM86VCoDuOFptCh3TXWvVIp43wmrZXx72VWW53mWofy+JVvA1uQfqHLus8PPPa5OuDzXwiBkcPLVGYcNwMP1xEk7S6tep32yjIFKdk8vYljhw7xR6+8wrOHDrJteMjwd62UntDg+laL2GYvG3HM43qL1955h7/82U+49eAByvPwCwW8sIBwjDZ3HMfW8dOzakPG6Gk12vrVbrm8WqYUMst6qgSe45LJ3AAns+oNdpGQgiGbRcB1WHw8x92ZGR7NzXH/0QwXrlzj2aPHefbIEbZumGBiuIbvOHhCgNIksS2Wk/Q2OqEQFMsVNuyp8Oye3XQ1zCytcOPubR7MzzOztMyvT77NxevXkfb7aq1RMtc7NnKCxqbcqBd8lrtOYvTZM51R9H32b9/OS0eOsXPjNNVCgeGRITZOjjNWKeML0ZMVzDJFGsekkeHKS9clKIQIR9LNMlpZxmK9zoUbNznz8cfcunuXcx9+xN0HD/HCkHKtRq1aM4u0ELQ7HbrdiMQi/b4n8aRjVB/42txun7nl8njtbgehNcWJCYbHxhBoZh/c5533z5KkMVJIvvetbzFaKuB5LkmU9GQhkyhGZQ5e4LNpqMboiefYtX0bO7du5c13TnL5+g1u3bvP0kyLUrVGbWSUYrGI63k0W9DpGJM6R1ptd1spnKmMVCtDn/sMV+bJV/xDuP1pffC73u95jVovGs+PK0BKx2Q6hBn/joBus0mrUUdHMZsmJti7fTvfffllvvPCC+yYnKTgeVZEwqwJWjgoIZhvNHjv8lX+6pe/4u2T7zC3uEi5WqM8PIJwHZbrDRqtFp4f4IchaZKQdbufLbsqzIqcxhFZp4urFNsnJpnav//hX+/ffWXWFZ0tH1wauf///B/S+um3UkywqPm8AfmalsYxDz48D54H4+N0l5ZYvHuXLEloLy+Trqz0dOK/6PYlDMhroO9C5/8Mm2fgP1cmqvi8dT4ZULwH0b+BRQeSSNNZTue7U1wQr2YHKqPnxmu1Y57j7FBp4qosMyl6EpIkJTdSkNIh01ZkX2scxyUMXdI0MVSVThvPdQd0ehWNVotCpYoXBKy027x+8jd0W01+9OqrvHz8KMOBD46gG6fEURflebiex5F9e6kND7Nj2zbK5Spvv/suc0vLLMw+Ju5GFMolw2/1fTpExjUPn9W1+5+15cPXYDiDqaPVr/osU/BXpT15ln2JqfVf3Xt8vU741G5f/Xk5HrAq+O+9X+G5DqHr4Xs+Okvp1BssWl5fpVjkyL79fOuFF3ju2RMc2rObqm8QC1P78GT1unCgo+D+3CIfXL7Mr956k9MfvE+hUmVkctJoW2t6mSGtNb7nIx1TOKwzg2z0ZA+/BgurBqNcZJUk0izrKQy4PZdeo7GuURZ0Eqw0mkghcPyA8elpsiim22ozt7zMyrmz3LhxiwsXLnLkwH5OHDvOrq1bmCyH+FIQhG4vqE1SRZoZaVPP9fA8o3BQELBxuMJwaR+74oTrDx9x8eoVrly7ZgJybVQUBMYh1ZWO5QEbExYjxpnfXavu8N6NbGIsSRontDotCiNDbNu0mW+9+CIHtmxGx108z8V3XRwhiLWxuI+7XQquRzksEAZWS8XKDnbSlJnFZS7dvMX5K5e5cPUqH1+5wuzCAkoIJjZuRDgeju+jpUO7G5EpRZqmeL6HHwSmhkdpup1ub4P0dQrinjaHrMqcabNR9FwPgGa7TcH3KFQqjExMENWbfHz5MqEfoFTGN048x87xUfzAM1FJpkCZTXScxOB6uK7LptFxKt/4FlMTE5w6c5ZfvvEGl6/foLW8hFIZYamMHxYJPN+CAsoE5dZYx5EOaZIQdVp4nodwHGvQ8+QJrp5/nn79chDks3XaV7npdX4z7Qmq5NPO92nrTu9tludhZZlzF1UTiEscx8V1JFJrVGpkc1US0200cLRmz46dvPzCCxw/fJjD+3azcXSEUDqkWUY3joyBnOfhOh4z7TbvX7zMz994k3fOnGWhXqcyPMzQ6CixUnTqbdqdLn5YwA8C40A+6CS+bu/Y/wtrUJgpolaESFNGqxUKxeJ7TeH8+weOt6gXl72JqxfChfpKuw4Jxvbn91fglqYwN8fDU6eYe99mpdKU9A+YsfsSBuQukEB6FcoNqPLbUZglEEXQnjWXTqFJyIiWaEF7ft/uv9nw4rMbdi8u/p8eP5pxO60mYaWM57tkWlkHLLMYCyWMdbhv3K7SNDHyT440i7iAVGW4notSkGqN6/m4rofSkrszs3Rab6NQeA48e2A/46UygecSaaP3SpYROg47NkwxXKuxcXyc3Vu38OHFK3x46RKPFxdot5oEpSJhqUSpGKK0IEoSkxL6LXdvg127epJYl+n2NWlrApYnHvu0tn5ff9KR1p+QBx9VBH6I7zo06nWWF+aJ220KnsvBfXs5cuAg33ruOY7s3cu2iQnKvkeqNTpJQCujEywk2YDGegpcuneXn7/5Fm+fPcN7Fy9AEOBXyjhBgM4yVGImHK20RSo9NJAq83iug56lGTr7emCXrusghHH40yojy0xBYs/tVZiNqsC611k6UYoZ477rErgmyGzXm7QbDW49vM9ifYUb9+7x0aUr7N2xnRNHDrB/13aKYUgtDPEdwwMXqTSKKaIfQksNBS0pBgHVIKBeG8ZTkHS6FIolPGmVmjKTCsu/p9Z9Xfy1V2Z9aoC5PxxbCFbyfaaGKoy6AtwCcZoZSooNuB1h5Bxdx+25AKZomnHM46VlLt+4yaVr1zj38cdcv32bheUVmt0uWjqUKmXCUqUnxaaU0bbPMqNB7LoOrmM1urW5v7SV/vw6TT3rzTZr/9aYgLYYhmgB9ZVl2lIwVK1SGx2j7Xoszs7yznvvmQLYKEF+8xtsGRsxCkpS4HouQikUpp+l41B2XWrlCtUDh5ioDTM5Ns7Z9z/gys2b3H30iJXWHHg+pWqNcqWC8gSdyIA9OA6+5xvUIkvRuXHMp6QTn5zb8pc+nbiwXt983donn+dTeJOfdDyxOqDXtn4DIXBcB9cxPgI6M+6wKopQcUza7TI1NMKRffv4xnPP8q3nTrBxwxRVz7X1RglZluJISej7CCFpasXpjz7mP/ztTznz4Yc8ePyYUqVCbXQMv1BgcXmRdreL53nUqjW0hkajjiMEnjUaXK8JBs29zPl2W03GgoC9O3YQPPvM6dt7dv9Fw3Xna80GxZWltpvEeYScPqXjfrumNSSGRhd/+qu/kPYlDMhtE5jujn7H40j6Th4OoFIy6F6pFC/4z584fejBzH99vtEsXF5cRPoeXqFod3cJOk3xXK+nauA6LmkaE3W7RrM4CPA8jziJiSKD/JhdqUeqjCFEZXiYLE1Yaqxw8t13CVyXTCmO79vHdK1GEARkmSmgqccJnucyVioxtX8fe7ds4dy+q0y8Ncapc2e5PztLp9XEdSRh4OMFntkcrLqdbfd9Do6FyLHb3lu+zsE4fJ5zWxdBH+CH9l6X/z3wQj24SVqz8uYLcG/x0hqylDRLaC4tETcbVItFjh7Yzw+/9z1eeu459m3bSogZtGlmkCypNZ7rIKQRo1aZInEkbaWYWanz+pl3+Ytf/IyL168hw5Ade/eSZIpOFJuFPNNIjL6161jeuEXLc2573gmDjL+vbNPaKBXlTqixUVbKwFpI9y+UCXoNau55nkEf44QkTvA9jzAIGJkskg0P02k2aTeaXLt7h0tXr/J2tcLF68d58cQzbJyYYM+u3WyamsJF47vCmK1g+1NBFisyDX5BmsLcZovG4hLtRoOh0VFc1zMGL1mK1qboNk2NZXQeKK93fQbZ5GZUa1zPoSBC0BnNeoPlhQaMDKPQNFttkiyjWCrg+x6h46E8jwRYSFO6KuPx4iL37z/k4uXLvPfhh1y/dYs7Dx8RpSlBWGB4YoJKbYjU3meOMC6+SlkdbYx6h9TaBOFaI7TClX0Jx6/87LPOvLGeeoPAzAN54ZvveAbgiVPiJMbzPEaGhqiNjJClGfXFRT66fBmljRfBd156iQ2jNQIhkI7Ac6TRgY8i4iwF30NJh7IfcHT7DrZt2sTxQ4d48+Qpfv2bt7l9/x5zKyu0NRT8AK9YxPM8dGS0q5Wr8cIAR3nEaUKmslVc2rUZv8/aNYNZw6ehx1/5JtZfN9a85BPa6nGw9u39YLxvjuY4Do4jDegApHGXuN1GxTGh41Kr1QhGhnnh2HF+8Mp3eWbfbsarZRQQxSmdbkKWJQSBhxeESGC22eDCjRv87a9+xZsnT7LS6VCsVBgZG8MvhkRJTCeK0ELghyF+GBJHkTE5dFyT9dH9K77q2g/EHGYsaNI4Zmh4hAN79q7MPPvs5YvTG25H4HhJqjPfXxa+n7/payf/9gcPyEXcxWkuI+MYEUvITOcKx8N1M+TyIszNw3IMFaD7ycf7zC0D2uZ4CrgEVPzyne+PDJ/yVPrtpfm5UlAsEJQNct1ut0mSFL8SEAYeWZbSbrcACIOw56jY6aRGkSEs9KyGtVLgOGgB3SSmUC4ReJL5lRXeOPUOrVaTOI753gsvMOR5BI6LDoTRhcXI2rmuw3Ah5Nl9exgZHWb/gX2c/eB93n3/fe7PznD/wT38QpGJqSkKYZHE8knz1GeuJJFrLq+eGJ6MKFdPDH1PMPGUV3yVm+jtywfCmIENzNrCTRgIzHX+oOgdKX9dTu9ZzeddPY3m/Tro2GcKbRxm7t1l6fFjJibG+fZLL/HM4cOcOHKEg7t2MF4bIoSeg57UmtDzDc1TQGI3g77rkACX793l56+9zs/eeIPr9+4SDtWM8UqSEEWJoQxYBz7Hcp11pkh1AkIghYMjhVmUVWzwYiHXjyq+Sk0YeVNlFQekkEZf2aZMc2c7O5RMkaEQvXy84ziG56iMNbkrpXHVLRQouy5ZkpLFMWmW8ZuzZzh/+SLTU5Ps37OH44ePsHP7DnZNTzNSCOnhRhJcT/QCdBfwpSRNUrqdLipJ8cICWF6/Rvc4/nqtM+oAZLbqcRscKDu2tYA4imm323S7XQwhU1AqFqzNtZ2L7NsXm02u3LnDjTt3+PD8ea5dv8GDh4+MlrrjUBkZYcgLEK6DdFza3Yg0zYz1OsI6Qpr0tZQS1zGaNDoz86UQAteVPRrV17KJdadehM5Jh4Ko0wUBtUqV1MrwLtdXCD2fqt2YtVdW+PDCRbIkY3FpkT995dsc3LzJaOJj5nzP83DtPCG1zr2mGPF89m/bzkh1mO3btvPBhQv85t13uXD1Gndv3qRQrRo/jHIepMXEUWTQWEubyjfqBoD4bS5Wf4M/SF/J1yx6z37V2+p1oL+GCPusefwT3v6pj5s+VKDN/Ow6Ej/wQSs6zSYLj2dpraxQcF3279rNKy+9xLOHD3B4zx7GakMMlwqgIYkzJIJywSfVLoEFDGbrdX5+8m3+4m//lvcuXSEFRsfH8YtFtJTUG00ybQo48yz90tISaE2xWEBo8QTFqYeKD2xaldZ4joPrOug4ItPZnaxa+V9vDA29cS9N2X/61Oj0lWtJ4GZLB//xn1KaGuPG22+TRr8rYvvlan+wgDzfSacbt9N5/o+R3S5JNwNlvkIqHRpOQDfcBge2wba7MFKHxPv9fAGVQtyEnUd6E8FctXqrcfjwvxm/fbu2pVH/xnK9gRsUGJuYxJEOkUqMDKKdzLLUqE24boBGkcYpSZriCbMjBeuupy2fVxlFh9DzcTwPrTQzi8v8+uQ7NDpt2t0OLx45yo7JSULHAcchyQy/MhbgOQ5jpSJjpa1s3zTNrq1b2LRhAx9eOM+Fq1eZXVykubRE22viej6e6+N7nlVfMba4Wilb8GGQTuO6nXNldT/AtGYj+cWSPejjqzdF5hPDE0Y2T5zA+klE0ftpLrzC9I2ptO4XM/TMcjQ9WcB8kdIDr7Ev6JnsCK3IbGpMqwypNa6QVEKf6b27ee6Z4/zw+9/n2MGDbB0exscki9Isg9wcRppi3lyvXEiXGJhvNrl06wZ/89prvPb2SW49eIBXKDA0Oo7r+7RaLbLU2hYrjbCa9mhl5bHMY0KYQqBUmfoJU+j19diUaTtG0cY9Mdf1FxqUUAP3je7dIloD0ui6G1UDa0dulVp8xzXcf60R2hg3zTy4z6P5xzxanOfWgwecv3qdLZs2sW/PbnZs2czkyBiT1RqVwGeoVCKwQXCioBtHtLttkjRBusbWXqWpzapIpNWDXgsRiYGf645XbeUepUOr2WSlvkKaJUY7XUDguXTTlIfLSyy328wuLvF4cYHrd+9x7c4d7j54yI1bt5ibmyOKY0qVKsMjI1SGR/B836Di3Yg4ilFaIRwHdIZG9JxRjfKPceTTKCMTKswYorfh/fvXBJAmJutRKBbREtrdtlE+0oJCoUSxWiNNUpYXFnnvwnnqzQZpmtF55RXGR0cYr5QI7dqhhCBLDV9zMJAe8jyGJsfZNDzEvh072LZpM2+dPs3l6zd4tDBPe3mZqN3G8X0Q4Hge0nFItSC1gJNW5s6TiN5mtpeV1bo3hsQakyc98O/vVxvoB6F72dSn9oOgv56Qr9V9d2FsrYUjzWwgpEAi0ElMs9Ug6rTRaUo18Nm1by9bN2zguWPH+faJExzZvpVKwahkpBm044wkTgkCh8Bz8XFopBk3ZmY5/d5Z/vpnP+HU2XO0M8XEpi2UajWE49DudulGXRCCog3I49gwCBwpKReLhtduOdg5zJefl0b33KB936fbbqHabTaNj7Nx585rC9XKf7gXBh/Hna6z9fIVNty5TX1igqmXnkcLuH369D8E5L9tE5hbMt5ymMahH/Uey1sCPAb0S/kjGV/MsO0PjJVSafbKsWd+eSCKf1Botb/x4zfeZH5uljGrK5xmmXHFjA1P188XzCQBoXtazeax2JyjMK5Z2NSrMe5IyIRmZHyCYrHI4twsb5x8h1ajQRTHBN/4BluGR0jsQu95rnFHtD2QAQXX5ciePUxOjPPs8WNcuHKFN0+e5K1Tp1haWWFkYgJZLiMDF99zAIc0zYjBOlDlqK6DdExQgUXbcnRX2QEvpQk8jUPjIFb+ZCp5LXc9nzTWViU/zeXxd61c7k/8A1j+OsfMA7AcJ1yLIK5ml9jdSH4OWpOoBCmF3XiZfjHosdnMSKmRVlZK67y/+5OOK8B1DS1EZxlpt0231SBLEjxpAqRvPHeCP/mjV9m/Zw9bJqcoOA6p0sRZik4TfMcxmuQIVJaRJDGJAFyXonCYa7c5e/kS/+Ev/5LXTr5NVymqoyOUh4ZJtaYTdUFIXNfI70ktzIYNO8dLYzykMQE6wjp1IvndrtKXqPX2nKI3ASmlepvRvDAt52j33mJB8nw8GM1f+7xVPElIyaF1ISVTWzbhORJPStqNJh9cusjbZ9+lVq2we8d2dm3dzpE9e9ixYZpj+/exeXwcwMieNus0ux1A9E3Ioth8c2muG1qZAH0gpdPH5Abg2MHTFxrpuLjSpb60QKPTRDvCZvMyip7Dw5VlTn/wPvdmHnHt5m0+PH+euzOzZNLB8QOCQoHpbTtwHNdsWAV0kti4ldrzd1wHR6xZXkxOGo3u1zrI/rfObOBuBtFvcW2/TG0ACR/MuPV+X3N+tmvwHBeEIE0StNC40kH6JiPbbLVwgKBYYNybJO1GzMzP85c/+ynziwv84NXvU9q/H98We6fa6IZLNELYQFpjuMauS+B77Nw4xeT4qxw8cIAPzp/np7/+Ne9+8D6PHjwgKBWZ3DBFsVLCcT26cYyOY1JbDI3WOEIiXNcAFUIbZU5t0e6BNcCsZWbs9Odie+bajDWRZxhzmtxgEDrYV58y13/RbfD7DP7+xPda9d3WrJP2odUZV9OMTKCwYIFZd1Wme2Cfxho3OQ4uBgx0MNnLVrvJwqOHdFpNJsbGePbos/zxK9/l0L59bNuwgVoY4DuyDxjZ4n0NZKLP7L318AF//ctf86u33uDG3TuMbpxmxPVQOHS7hp6i0IbeBMRJkncIYT5fWbdn88+6PaMHrq91SHYdCoUC8zMzNOfn1Le+853O3hPP3blSqTRWtFZISVwuzyWlMloIomaLuNl8akzxVW5/kIBcAjGGMdL69WvghpDE6LTPyTcDFfAkuB6k1lbw96PlRx5gEbcgqsPKMo1vvayv/1f/1ePd09M3N46NRrVSMZjvRHSsVXnoB2RZhsIMDCllL8DqsxbMjYbOAznzMY4wN32qUsOdlIJW1MX1fUYmp1ice8z56zdo/i//C/Pz8/zj77/KLis3pDDKCUpn1oXLoSAdSkJQHh5hvFpl68aNTE9NsX3bVi5cucLc4iKP5+Z4MD+P6wUUS2XK1SoFP0T7gihNiePUDBIr7wbG/dFxHBxpUlRoTb4VUFlGmiY2iPPMuao+gihswJ5PvPm/tQNlvUl11ZX5HSbV9SbE9SbM3nemP0EIkb9n9eSZTxxa9akL0ipapGmGtG6pnuegHYMAqDQjVYlB0aWRydRC4TpuT5YsTRIaKyu0mg3iTpvQddm8cSNHDxxk944dvHDsKPt37KBcLOIhECozXp6OQx4/ZpZzqwBcl5LjEKUpV+ZmeOPsWV47eZKT587xuN5gaGyMQrWGGwQknchI7wmLCmMdH1mdNl51XRjQ7/naTH7rZUVWbzTF2qcH3tZbSwaOZO6RgdJKYZBD1/URriTVisxzUUEAaUo9jrly7y53Hz3k9u1bHNm9h3KlzPj4OB6QZBntqEucJSA1Wko0pihSOn2DpkE0fL3zzOej1V4DBmFLtaLearLSaJiCdCAVguU048xHH/P/+4u/4N7sDO04YbHeoJmkaAcKvqTghbhhgOM4JquSZiiVmY2oHvz8/NvlndfvNT1wHZ4So36l23qh2OD5DQbmYvD1NkDTSpvsV75h0TZDJiWO65k5SGuiTpfbjx6Rnj5FJ4lZXFri+N49bBsbI/RcQ2PRCqUypM3kISVZkiKEoOSZOaSyfQsbh4fYMDHOoQP7uXjtGjfv3KHZbnL7ylWUlAyPjREWi0jHJfSDvtymsmoUqV3rhMSRDkIYJSPTCRbgYO183z97YchNPZWdT7of1gOCPk/7XdacwTXuaZuDXtCp9MD82o8Pehdcmce1BfByEM8APhlpmgMjjlU7MYXhWpv1Ga3pNltE7Tadeh0HzdTIMPtfeoETx45x7MABDu/ezWStRsmaKygNWap7WQ4/dPGkwJWwlCRcvXOPn7/xBm+cPMn1u/eJtKDoBziej0qNAIDS2gqa22y7PZYQwmRY84BuEB+wDxkMy9DtXM/4u7RbLXSaUiuXs5Fq9Vxlw9Sb7vj4A/8nf0v8819w8f59fa/ZJPU83CCgPjNDFv9dlV5+ce0PFpCnwAqQvf4avP7aH+JjP7VFM4+5/5//U3e2Wv6wWqv+ctvWrd/K7j6orSwuUa4NEYYBrVYbhUE/B4O6/oRqF541q7RJbSviJLEUAEmz2aJUKjIyMkJYLDB77x7vnHuPer1OmmW8+vLLHNq9B0crg1Qqw/9TwoRGQhpkc8hxqY2MMvniSzxz8CDnr13lzPvv8/6HH3Dl2jXD3+y0iK2rn3Bd0OA6ZpIw+tJ2AGkwlu1iMKlmx5JAa6Nf2gsCBoLe9SbBXKnC6DmvTqg/Den4fex0n3aMdR8XMt9L9Tn29mU5gqO0spOHRgiJdJyea6vSBkVwZJ4qlAZpzvJJyTimGfQSVJySpglJt4tKY4qOw/TGjWzesIFnjx3jlRde4Piu3QyHIRnQiWOiNMUVgsDaWmvpmglaZSitkY4pTIyAK7Oz/Oqdd/jLn/+cj69cJtGaiY0bKddqSNc1UleZ6n0fIQaR1P55P9l5true9vxXuj3ljAbA2aee8zroZm+FHQi0UqXJ4tQqMvmMjk/iT3tkKqHVbPDowX2aK8s4aJ4/cYJcWDdTGd0oMiiykKZmwDFziMi3SXkm43M3+16tyaIujabRDc4A6Qqa7Q5X79zm5LlzzC4tMr5hmtHxSYZdn06cIKVrAnEEWZqhsqwXdIkeSjpIWfiE77F+d36tmoDeCX6mOvs8C2PRU60srmwnLNXL3wlcP+hlKR4tLvKLN99kZnaW+W9+g5eff479W7YgHQehQGXGgVrYzKvKLI1ISrQj8RyHbaPDbPzGizx77DhXb97gN6ff4f2PP+L8xUss1huodpdUOEjXwZESz3CPUCLPsuX3pskSCyFQaUp/hAyuIQPbSZ2ft8DQOVZ31KetE58G+Py+2mcN4ns1XPk1HDyGOdCqB3rZA0t3E3L150gEjhC40qi6CW2AoTSKSBOTtfC1olAssHnjRo4fPcIffe97PHv4CMOONFoWGPTbGvWS9bLxDkIKYjSPWx3ev3SFX7z+Gm+dPs3CygqiEFItFsmQZElmNxdPAjWrQIJenLR6s90Pj5RZX5Wi4IWgFI8fP6YS+OzcvzeN9+w+eUOKNxcvXWqo//n/DT/7mbj/9Z4meu3Lq7LyxTeB1jrSWtUrxbNi8+TWbXM7Dy8v1Wt3Fxcplav4BZ8WbZtqW0Nx0Gt/GZhijKQAqAyhlNEN9jwToMcJCwuLeK5LqVZjPMt4NL/Af/rbv2FmdpZ//Md/xPHDh5nwQ4R0ydB0o4i02yX0AzzPR9jUUsFxmKrVKB06xKbJCY7s3csHVn7s+q1bPJydo9XpIv2AodExRicmCUtFOlFEnMTESUqWaRKVmQr6NAOtcIQg8DyCIKBYKBikP1dDyGks9l8vjWafWyvB+LSU3trnfx+px0+blHN0ZnCCN7bTA6oi5suYSUeKXqYjU30ENFPGmEkrQ+/xXBfHdfGCwHAq0UYxQmsay8sszs3RbrYohD7btm7iwN69PPfMcXZv38b26Wk21oYpBz4ZBmkKpUSGhuOnlSLqdonTFOG6+EGAL/qT7HtXr/E3b7zJ2Q8/5PrtOygEw6OjVIZHyIBuNyKOEks9MStEvsHKkZtBtBfoqT4MJqe0+LqVtK8bVa9OBIjBV67641NDYYHAlS5Km5oQw5cWpt7ED/DCFK8Q4giBcFyE45g+x6R6O92uueeE0YTPHVc15loI68Q6CBI87RzzpTLfbLqOR+AFICTtToeVeoN2khF6DoViiWKtRlAs4ne7uGEB6QVI18NVZhOgzITQs+OGHPWzIZnI8wUWDV/15cQT3yx/vq869NVvGlu4be+XnBb2xHgTg7Jv/fdqsfoBrbWtsNUIR1gtfYkWgmKlStRqs7KyzEcXLoLKSOIE8S3YtWkTJemgpYNAkyUxaZoamoNr9PHjOCbNFJnvIxzJaDHg2b17GK+W2b9jB7dPPMfFq9c588GHPHjwCC8M0AJcz8MPQgqFAn7o43sFMjRJZqQztTb1KPk5DY6xfG7RluNiNnHKgMqyT/lbr62HSv+h6AtrM8BrM7D933OOt4NAoJQNulcdzYan2gaoeapdpXiuSxgG+I6hr2ZpStyNaLbrxN0uSRwZOm2ny+TICPv37OL44UM8e+QwOzdtZvPUFEVH2my7QmQG5DObMqPEIhyBKwWx1jxuNnnr7Dl+/trrfHDxPI/m5/ELJcJCEccNjLY9pg6qf1s+OfespdD1g3e96h7I72nHqnq1Gg22TU1x+OBh9fhPfnT90oXztx/8d/+dWDl3DsxQ+uSb4mvSvvCAXA78+5I1TXtO8OAdeWHvifvuvsOn9zXS+5uv39py89EjkrhLQZcNGqQ/Tyhi7rgsTZFCUwhCMhtUOa4HIqMbJyRpSugHTG7azOOHD7ly6w5LKys0W00ezc1xdN8+tk9tYCgIKXgebW3d+aIYoTSO51LwHApCUi2UmNi8jZ0TU+zbsYM7Dx7w8aVLvP/xBW7fv8/MwiJxu8XMg3tmoQ0CU/CjFNJx8XwPISUqUz3UK0MTxRGxkL3AO6dj5D/BIOKDQTmwLoccfvc04+/SBr+PeiKIWc117KXdBGCVRrIs7Rst2I2HUsogRdaEQ2WKqNOm2+mQdto4mcKTkk3j4wzt2sWuHds4uH8v+3ft4sDOHUwODVGyMEqcpgYJFRLHMxkLlJG5S7LM2JO7Lp6QdLTm4fISNx884G9++St+9dbbLK00iJWiPDRCuVpDSodup0PSTUAZ6oyUVv8ai5QMBAeDQVG/V+zrWL2gfp3bOvH4uk087fmBFG1vE2v1zBWCOM0QWqCEwAtCir5PsVymUAjxsPYJcUyz2TIIueOQaYXAImcDx/+sbXWGY2BsCkOjajYatDsdQq9MAJQrNcq1YapKEBYqpFpDmtpUs3EyNSnqfkbo82+on9aDX88192kRxROXs1/EMPBgDrMa7r1A40hLc5Ame+eXipSkoN1q8uHly8wtLjA3/5hvPf88zxw4wIaqMfTQwjEBr+P0MoWunctRRhu/ICVlz6WyaRPT4+M0o4hrt++wdXoL569eY7nZYObxDAuLi7Q6XbrNJoVyibBYxAt8XCmQuRu1MrbuGnPfmNMRCJ0XI9pieAfM/3pMc/PST1kj/lDo+ODnwZOB+dpNQp+pY7MSlgOutGIVu83uwh3rZ2Ie1nhS4miNSo2GeNTu0Gm1UUmC57qMjY4zMT5OpVhi346tHD2wl6MHD7Btw0aK9hhxliG1yXxrgVWAM4pOrpRkCJaSmPO3bnH2o4/5xRtv8sGFi0RZilswinOiJ+Gch4qr+3pwE7nuiLa7UPOf3XT0aJ2QJSZz7GjNRG0om5ze9NEHoyPXzmcZXL+utUlG58Pna9++8IA8W/PzS9UeXhP89f/DvT/0f0+7W158vPvu7LmJodrOchhOJlGXTqdldpK2+O0zrYU2glFZZooVwoB6q0W73aZUqeB7Rmi/2+0iRUqtWmNiwwakhOWVOm+dfpfH8/PcOHaU77z0Iod372OiWMIPC2RJQrcToeOMYjHEca30mS3+qIYFDmzeyu7NWzmwey+H9h/g2u3bvH/+Aldu3OTW3bssLyxQGxoC1zX212FIoVQmCENTSZ9mxHFMt9uh2+2SxIlB1VwT0Lmua7VOnd5kIy2nbVUleN4dn7BQf1rA/tu2T+P3DT6fIziDAfmqC2xgRXJqkmv1uvMJWdrXqCwl6UZ02y26zSZpu03Bcdm8dSsvvfAchw8d4tiRw2yamjAqCPbwkTYOamkU4TkGZQfQaUaWpqSZQkjjBCulYDlNufN4ht+cOcM7Z85y5oMPmV1Y7qldBGGIBlqtNpEtssudHaUQKGnS4OozBT5fz+BobVuF4A78/mln//Rw0gTOiS108jxTf6G0Jo5TtFBoUqQ0cqnFYpHAC3qyh0kc02q20ErheB75UieERFtN7/x723q4db9rH3HurfQWrVMkicVshaAbRSSWj6kx0o6FsEC5nBEEIVGckqmUXr0MqpdKkLKXUCKnwvTVIMRTJ8vB77y6TGhwif/6taedXX/esVdsVd9ZjFEbRDlTGrRCW9WmLMtwfZ/J4WG6zSZLj2e5cPkKS/MLzD6eI4oTvvHcCUpBQOC6SNfUJORBlOO6OJhsXGaVlrQjkVIyVCgwUigwerjKtq3bufngETdu3eLSlcucv3SR2cdzLNXrpsguScgKBVzfQ1q317weKVN9znKvaF4aOqRj5yZT26SM8/A6Afkg4PNJhZ6f6Tr8FmvNeoH/WirnmmcNcKVB5Moq9JVSTDbVCCg4jmOVnow2P1lGGsWkSULcicjiGFfDyPAwU5OTHNi/nwN797Fl8yZ2btrI1FCFgrTZXCCOE9I4phiEOJ4LSNIoJlEZAhcFLKUp569e429//St+c/oUV27eQkmH0clJStUamdJ0uhEq04RBCFqjsn7d39PGsBj4KeyuQwgMn15bV2THQWhJu9kkiyImh4aoTm34YLla+9eP4bbug6BrE7hf6/aFB+QzmAuT8SXc4lxfFPy/fgU7/zeIP39x3imGv6wND+8eHxn+4Xy9QbOxQmVoBImxke61gfziU4N0YVJRUZKgAdc1HGAnd0NUijRJmF9YoOB7jE1MEVeHaNVX+PjaNWYW5phfWmT2+UW+eewZtoyO4nmekbOKU7SCJEpxPIljOWdaGU3iUEqmh4epHD7CwZ07ObJ/P5dv3eb2vXtcvnaduw8esFRfIYk6dOp16u4ifhDiBwGBHcCFMDCucdoUEuaWvECv4GRt4J0H7Dl1JZc7+qzt94V0fOJka1OtQE83XlnFisE0spE4zNOOEq8Y9oohpdCoLCHqdGk2mrQaRi0lDEPGhkfYuHkTuzZvZs+27ezcspVd27axcWqcyaEKoU1RZ8pMvK6UeI6HF5gFEAFxNyLLMqTr4oWh1WyGuXqD05cvc/qD93nr9Clu3b1HJ82ojY/jhwWE45rgKklQgOs5BoXSBgnN7bCVsHQDxFOCotX9tern16T9dvzr1UcYbGuPZqYIS1yw0aoUJgjRmGLpNEmJOl2iVoc0intHzJKEdqsFymymDJ3KBLhaaVMVJehxtbV88lx6gXiO1Nnf9eBXt+hkmiS9zEkKtFotGvUG3W5MUDS4rsz5xxqsjY05rhC5dxL52rma4rd+P+ebhb83K23eBgDwXhNP9kO+wcmDV6NdbfpX5cRkbQp+0ywjUxrX6YJ0CMpV4iRlodHi9Psf0mx3uD87w6ED+zmyYwdjhSIAkVKkaYLQujcPufn9ZhW4pA36y45k83CVoXKBbVNjHNq7h6MHD3Pz1g2uXL/G7Xv3WFheYunxrLFdTxLK1Sobp6fxg8Csg3mBYx6m24xLliaGMqMyg566Oc3lswE7v9Vl+D2tNettEvrHFiipehpVjhQ4wrW0kf4aI6UZUZ5jspoLc3N0221cKXE0lAsFJkZG2LRxmn2797B923b2797BpqlxKpUKFc8lBOI0IckyAs8ndF2UnS+SJMP1HMLAJ7fUubW4yKkPPuCNU+/w1ul3eTQ/hwxCxsbH8YICSZoRJ6nxo/CMq/G6s2ZvflndepQkNELYgEn3s+ee6+AAC/UVnDjh8M6dFJ89duPaM0d/XoeHxEkeb+R7jL8XU8UXHpDndbAC+kYYX5aWATfbpA9W6EDzg03Tb2zbv/+l/fX6D89++BGPl1coVasI5/N3k5CSTCuTjnFdSqWSsWSNIlzPw/N9BMIsvECtWqEYBKRKsTDf5caDR3SSd5mZX2RuaZkXjj/D1qkpJkolgtAnjVMypXBFT3sNnaZGutB18aVkslRiQ6nElvFxDu7dy1K9waVrVzl/6RJ3Hz7k8fwCs/PzzC8u0u62aLaadDyfoBBSKBYJwwKu4+C5PiYOMJXdeTC+FqkYpLZ82SSJegWmVnPbFEjpAa5m36THKNuIXhBiAnNNFHWJ2h2UtauXQuApxVilRDEMmd64kT07d7F540aO7T/Avm3bGa1VKUiDiGsg0Zg0bs+0wxgESVt4q1KjViFciQx9MmAljml1u5x8/31++trrnP3oQ+48fIjj+dSGR6gODxs5qDghShKyNMV1XQLHRwhBkiQkSWIQV8cx5iufEpBqBniv/9A+V7PCiLiei0aaManMwuw6rplPtAdakMUpaRRbbXjT4iiivrKCUgrfN9fQ3KI2OMvRQ367VUoI4+jo2Y1pp90iirq9lHOWpXS7HZLY6J57wmhamzV1AI0Q9my11RTv5+nXpayt+11W9dvf75ZvZ6CPLpo5SVgZ3NWygkpqpNBIYe6xequNJx28oMDY5AbazSbzK3VeP3WGO48eceLWHZZe/ibH9u1jrFYjkBItJWQZKtNoYUtGbXGhxkjiZdJBC1O4XnMcRsdG2Tk2yt6t0zyY2cOtOwe4euMGt+7f5+adO8wvLLBUr5NkGa3FRdqO06PWOJ6H63pGOQorH6sNLS/LUpACob3ejuWTUOnB5/8Q8oe/zWcprRBS4kiJY7MO5gmFSlOyNCVKElSaGGRcKQpCMlQbolYuMTw0xLZNm9m+eRPbt2xlx7btbJiaYqJSIAASNDl5TKkMssRkvx0XR0qiNOuNq0hrZut1Hswv8PbZs7x16h0+unSRmcVFgmKJ0ckpakPDNNpt2u0OWmkKhRJSOHTiNgLd81v51Gb3jyYbq5COQGHXNm3oKlJp4nabspDsnJ6muWPHzfeGajcWAEZH4ZVX4Ne/1jSbn7m/v+rtCw/IJ77oD/gdWj6sVtLUaUL2qw0bVr535PD8SzOPuHH1GvfrDcsFzxEhO0msk4k1iNDA80KgMoxxUBAQFEJSrWi3O0RxTKVSoVgsmhR1krCwuIzjCBzHZXRiCp0lxGnMB5cvMze/wJ0793jlW9/ipSOHGQtDXN8GcEojrWmN53m4mMfiNKVrjTmElAwHAdUxn4naczx7+Agz8/PcuH2bm7dvc/HqVe7cv8/j+QUazTadOCJqtcymwXEJikUCi6r0driet6qwM0fEkyQx3GpLa+n19VMmsS8aFV+FWlhU0Wj85oYwEs91kdaxMje5yDEagTHX6La7NJaXaKysEHXaFIOAqYkJtmzfwt5du9m8aTM7t+1ky8aNjA4PMVIqEUqBZ+ffFLMpUJmxZ/ccx+iWa21l46zyjRA4gZEU08BSu8PHN2/x8cVLvHH6Hc5fucJCfYXS0BBjE1MgJFGSGIULSy1yXRfXcSxnvG/ioTSkmeov+aIXU/X7kf4DOcd8zUu+2m2QmpQ/NPDAwFK/6m3rnf9gdmzV8/Zecy3dJE5SkiQ2qWsp8FwPz3PxfBdHODjSwXVkr84mimOarZahilmdX51TVsgsfWp9rspaOb3+N+wHOFI6OJ6pHdFoWu02nY6xRPaBMAzxfA9PGyQr6cl/rv2wfkF0zxBtYFx9Xn7v1wkxz89FiSezT09uQgbuJJ3PVQMmKhYpEBgp1fz+yg/keR5KadrttnHa9QMqlQphsURQKDL76BFXbt6h3mqzvLLCzOM5XnzuBPs2brT1LzZjm6boxGwMXc/DcX3ybXk3SajXmwjHo1yt4Eio+j6FTRvZMb2B548d4dH8Aldv3ebmXVMPdfHSFd49e4aVRoNSrYbn+4TFovkXFvB8HxyBI43xkOu7BhQVck2/2L76RDT6i2/rUTF7ATZr1qA8g66VEQew64vAjJU0jok7HaJul267TRJFtBoNxodHOH70KDu3bWVybIytmzaxb/cuNk1OUApDHIwXhgA6WtNutZFArVSk4Acoz0NpYeo+hEBYJFoDDxaXOPnBh7z73jlOv/c+D+fmiLVmcsMmSpUKbhjQ7nbpdLrWLdzD6IfbNWQAvFpboDo4F+abSW1ZAkpp6KnUWcdSpcjSFE9AqRC2i+XyhZkgvHw/54s/9xz8u38H//yfw//4P/4er+KXu33hAfm3v+gP+B2aa9MhZ7Xmmn0sK4TnC+Xy69VK+US4tFRO09QOOvn0Bdg2nadmsIWDjiAoFVBC02q3SLMMz3cNSiYgTY2ZkGO5X9IxklImsPdJO4Jmq8ulW7dZXFnh7qOH3Lh1k6P79nFs507GKxVw+gZCRqvYpBpdKXGRaGmCTAfj6lgJHKaCgI3lMlvGxzm2axcvHjvGg8dz3Hv4gJt37xrk/PEc84tL1OtLzM8vIH0f6br4vk8QBIRhSBiGxhnULr55QJ6lxpp8VV5WrA4P1mu/1eSaHzdHEQcfWzNp51X/QSHEcdx+8GCuWI+jn8QR3U6buNsl6nRwHUm1XGa4UGDbxDjDtRqbN25k6/Q027duYdumLYzUhhgbHqYSBISYC5Jojcid18EUMglr6mCjwEwrMmE4m8Lqm7tAI0m4Nz/Pux+f581Tp7l47Rp3Z2bIgKA6RKFcIZMOaWIKhA3HX+DioJRBm7IsM8fzXBzfM9dHpZaqYKUf7c2zyuQ57z6xjlr0Vzxi0gwGrYP3pB6McZ6I2MXa97J+V+RItgbSLAUMf9J1nR5alKQxaRYTJwnKE+CIVVJnzW7ESrNBohXC91B5AZ/QvUUNbSRRV1FQegj24IkMSHoKE9QbWcXMLJQIunFElCZ9ygzKKGVkxok4yTLzXjtPmffpHq1C2YB9gCjTU/F56pheZxL9OmVj9GD/r/P8ehSxVQGOXn0D9igOUqJy8qfNQqRpikBSLlVIs4wkSVmutwxFoVRhbKOkubLMfKPFG++e5c6Dh9y4c4fvvPACe7duZevYGAXXAd8nS1Ojb92br03wJYWgFAYI6eIBWZyg0YSehy8EQ9Uq49UqmycnObZ3N/VOl5uHDnP84AEePn7MSqPB3NIis/Pz1JcXeRzFaCFwfI+wUCAsFPA8Hy8IcB2P3Nl1VRCucindHGDob1pWc4CedlF6p2T++B3nsrwgNRc6WPXP8uHjJCaOI1rtmKjbIWp3yJIEoTTFIKBaLLJ1+zbGR0aplkpsnZ7mwN79bN24gVq5yOjwMCPlMqH1ssi0Jo4TI1MqJUXXRStFHEX4ntuT5xX0xTRmOx0u3bnDW6fP8Pa7Z7j38AGzC4soIamNjFIZqqGBdjsiThI8x8d3A1Sm6HY6CCEIwxCEXs3vH1zeB/pyMHOXz0/KmuU5NuucxAlZt02tVGLj1MYVvzby89TzzzDIbC4UoFT63S7SV6x94QH58S/6A36H5tvC97ug84C8HRYuLI+P/9vS1OTI6NLSkTRLyRJpbIQ/xwA2WtESNwgM1aHbwXFdwiDAc1ySJCFNbMDkegjHoLRKKWOX7UjcsETZcWk36jxaXOLRybe5cfs2zx45wvx3v8dLx49TDXxKNvU8WHzoSLMjH2xpbHiqnudRkJLNlQpbKhWObNlCW2tmV+rcvH+fuw8ecP3mLa7fvsPs3GMezC/Q6EakgHAkOktJoi46y0hcF88G5WCRZSmQawhKnwUh/20C8sGimjy1v0rWMEfvrH64BFwhENrohqdZhspSU9CUpmRJis4yPA2e6+H7GUPVKtu3bmXn1q3s3LaVbVu3sGPrVsZqQ4wWSxQHUJL8DNLMmDA50vC2MXFXzokxPHJtzT+EQEoHDbRURr0bcfHGTc599BG/OXWKjy5dYqXVxi0UGBmfICyVyTS02i2yNMURRrtaytwp1MgnojWu7+F4vjGbSM1EmBMfcgh8MBDVmI2DlmpVQG5e93UKmX63th46tLYl1oPAc32k21cjStKUJI1JsoTMd1HWYENjWHTNqEur0ybVmQ2C+7oTWg9sHoR46vfQmMlNDvxtNhSCNFOGemY5vVGSmPuFXK9YkyqjeZ+pzDwnHRwheuMJ7K2cm4PYuUfTt0j6vKP5K77XW7cN7FPWZC1ME2teLQQgxcAm58kmLH1FWLQyS1KkhGIhwM0UzaRFq90hThVDQwG10XGKlSrLS4ssPJ7hw0uXmZl9zIP7j3ju6BG+feIZ9u/YTmCzaz0vCXvfKW1qCMqlYm8OaKuUOEnIkgTt+/ieRwBsKBXZUCqSAAd37eTVb7/M7MKCycbeuc35K5e5c+8eD+fmWG42USiENk7ESkriSBOpru0Z2aMNIgZQaTuHDq4wn/te0+tcjE9pg1rbgyIAPbM8be79/jqWkamUNEvI0gRURuA5uL5DtVBiemKSzRunObR3L7u3b2fbpi1sGBujEgaUZN8XRJHTRU3dWRTHpq4pCAhDY17Y6XRIhKHEKSlI0DS7XZbaHc6dv8Bbp97h5Okz3H30CC8MCSoV/LBIpVLDkS7NdtPQVLQgrBTxrH9FN+0ihKBULKJQpCod7JFPvQJCCKupb1SiHGmuadyJiJtNtg4NsXnP7tbDLVveuV+tXvx8V+Tr177wgDz99Jf8nTV7w68SNWxMTDycPXHifff6jcXhazdZRJAqZQup+oOwjx8MQj1m2dMIw5nSmk63gwCCQgFHGsvzVjdCK40jXRxpuHSmetkhzUwxhVACz3PxwwJhEJJWKrTqK8wsLvKbM2e4d/8B169f549f+S4Htm/FxQSaWJevOFMIpfEcp1f06Yk8aLapUTSZXdQ9IRivVCjt3MnuzZs4cfQI8/U6Sysr3H44w92ZWRZWVng0M8PMoxkePXrEyvISKorMaVtaTqFQwPM8ypUKhWLRdtJqTmmvt2zAnD/YK14bHOirgKInB70gT5FbvredxM3xDZUmTVNUZgpc4jhifmGBVqtJksRk7Q6kKTiSsFBkfGyMDRPjbNuyhQ1Tk4zUamycmGDj1BQTo6PUSiXKYUApCPFcF3/gqufcSxQ4CELfoy8JlyOXAxkNm5p1MFSBBHjcaHDq3Hv8/LXXOX/5MnPLy2jPY3RqCjcIQDp0osgkkqW0tQiG65moBGlNjILcRVEroigCIcFuDvLFY73WQ4J5copdc2X+3rbPuvhLYXQU0NZQKjMGP67jIh0IgtBsxgUY3RUTkKdZZji1FgHMC+ywKeA8ICen0unB9LHocf97JVi95IaRoPMcF9/1kI5Lmhk0PFGqF8C7vlHicFIH13PtZsEERdrS4wCk0x9ryo5lnRdJ/1578qvbVk1foj/sxDqvEFjUVVrDHTUolNjPUOVZEm2vg+f7qEyzsrKCQOB4HrWhGhpBq9Oh1ekgJfhhgenNW8iSmG6jzrvvnePG9atcu3yJV7/zMs8/+yxbh4eNk6fWZDoHOhwEytI3DXgQ+B6+5xqqHKAzI4uJEIYmCRSEwPc9wvFxxioVDu3dw0svvMDs4gKPFxa49/ABM49nuffgAbNzczTbHRYfPqK+sGjmmrCA9H2CIKQQFghCk5l1fR/P9/Gsy2NmswJ5N+UbV9Nd660Z9DbHrBkj5lexBnA3FDHf83syv1mWGQWUJCHqRkTdbg94S+IEHUcIAX6lQHW4xkitxoYdO9i6eTNT4+NMT04xNTbG6NAwk7UhhsICxTAkcF18+9kZoFIDEOW0Fzf0bb+b9S6zxlwmvjDZXheoNzt8cPUab7zzDm+9e4qHc/NEacro+ATCdY16k3BottvGNE4IAj8EBFE3IhYxrutQqVTQWtHpdNBCIx2x5o598m7PVziN6M8PyhjsGSqrNHKOUcyGQpHajm3Jr44enL224ctMcP7DtC88IPc//SV/Zy3A3kJvvgn79zO8fz+l6WlVd92Hk1u33UsnJ7l79aomCMVIqWIRowHtXejxc8FQTnQPQTJLorYue640LnupDRKN86boIZpG7skEkXn8pi3a7Xou0imSKU2rXmeh0aTRukGj3eX2/YccP3SI/bt2sWP7VjaWS/g2vZwKo8CgMLGsHNA6pZcOVGhhUIeSI6gUQiiEUKsRT00RAQvdLnMLi6w0mjyaneXRoxnu3bvHo9lZlldWqDebxBZly1RmZJc6bZbqKwPulrnUnnUctRxn7Hfqp/4GFOvFepjsAC81PwdNj+em0gydGatoLKfVdRxbnOriWj79RLGA77m4rkMhCCkVioyNjjC9cSPTGzawbfNmJsfHeinDiuPgidXLaH7lFRpsoGS/tglapGO/piJLjTylcGTvvDygDSxambvzV65w8r1zXLx6hUvXbrC4UsfxfYaqQ4TFIlpKg0qlKRozQRs+nkUh1CBlwUo6KmtqpBWOsIu9fhJ902v+ygvKnj75/kP7tJbXIwB53Iy2Gybj8yMtJK17e80UWGm1WFhaAi0oBkWkApWkJthyJAJt09J5bmNdUsRTv5fWCp0JykUzV8zOLTC/tNzfcGnZQykc6aCRdgwrO6Z6iZ5Vn2b0jvtUlT9Eod3Xrtloste/ay+tYOC627BH2qxYliKEJBBeTxJXxUbBxHUlbuDj+yHa91Aqpb64wNLDB8zXV3i4uMCFW7d44dgxdmzezMToKFXP691FCkFm1yQpDJjU+8pKWW16s0mQ2DoFYVBe33UYKpcQlNg9MkJn+3ZaacrcyhJz8/Pcf/SQR7OPqa/UuX33PncfPCKKY5TWJJnR4Y7jhCxLSOoRXaXJdNajrORzXZ6tEXaeE9L6OeR0sB7a0NfiXyvXa7KpOWBhaDLmrVa2UeXUtpwWInAch6rrERSHCcMpfM+zNI+AiYkxNkxNMjYywqYNG9i2eZrR4RFGa0OUPKN64tMXvMgzEirPduu+wlF+xR03F0g15yJtP7c1zKw0efT4MWc//JB3z53jo0sXefj4Ma4fUqrWKJTKRirZ0nCzNCbLMjzXM66vmKJus6yaAFopyLRRTJM4nzjjPJEBkhKhNVmW9IA5iUQlKVG7TSEMkuLExMdLw0PzXzoVvr+D9oUH5K0v+gN+h5bYn53/9J/gvffY+d//9wyXy7QePRKjo6OXk8mpK43Tp3f45aoXbPLQiUBpI98kbEopA3RmKqmlRRZyCbEcTUBDlip7wwp8P+jd0Wk2KKdo3LS8vJJZadI4JrVSNY7jUhsewRgHOMytrPD//Y//kd+cOsWrr7zCN198iRNHDzNaLhLaDUCGTXNr+i5bFsmQIo/izOSWSUlmUVuLyeEhmQpDpqY3IoB07x66aUaz1WZ5ZZl6s8HcwgJzCwvMzs0xMz9Po9nk1t273HvwwKBvNs2WZKmx73WMS5zjelYKzgSpxrzG6QWV6yo12M1LT2qAvFgyQyUJidVuVWlqHEd9H69coVgxKjajQ0Ns2biRzdMbGB0eZnR0hLHRUSrlCsNDQwxVqxTDgMD2Ve5KAAOa+llmN1XamgX1OdmryXTaXlZtTGLyRcOeUwLMLK9w6fZtbty5w09/8QtOvXsGJwioDA0zsXEa1/fB0gzSOLEIqTBcvJwmoI3SAo75+JzjazsR1+lP99pKUZrFXvcQpVVdbP83uB36uoRWAnpmR31Eh4G/Bl440PQTTz29R/Ix1lNl0KYgTzgCkWfEFKRJaoIcBS4mBZ8CK42WKfIuFKkWinRTuwkTpgBZY7I+QvRpaYPjevBb9nN32gZzxrRMaU2lXMHPNI9mHzO7sGDGJsaWW2VqFeVL9VD6ATvsAY5v79yFYL1t9N/X9rSeeFpuQBtLx/578+s5kAUZnBNz5SsAP/TtSzPiqAOA6/THf5rEJHGEFBBWyhQqJaJOh/rSIu989CEfXb3CuY/P8+1vfJMXTzzHgR3b8dH4+ZzluAht7gPRqxGyi4swSlTCPiexhnJpigJS4SAdky30gCHXZWh0nF2j46R79xOlKVEcM7+4zOOFBRqtFssrKywuLzEzO8vs7Cxzi4s8npun3miwvNKk2WoSJQmO5xGUSub7SIPQS8f4ZdCbb4Wlfpig2nVdPMe1vPSs55SpbCar7yBq9ai0Jup20EmG77mEfkC5WKRcCBkfHWPSZlE3T08zMjxMtVKmWqkwPjrK8PAwge9TcJ0e+p3fA1opYm3MmaSdk3MZXimEqSmzmbBMZaRZhkAhbb2REoIIE2fdX1ji7Psfcur0KU6/+y4zjx8TFApsmN5MsVwm05pOp2vWIkBKA1J5rmvvJROLuF7+t6YbmWJv13Xzb9yfNfXq9cHMrTZLbB+UNiuklEZkyloYaITSuEKQef5vIs//T8Ay9v0M3veD6/8ANfTr2r7wgPzHX/QH/A4tv7x3AYKAu3v2cGdkBC9TK/va8b0CYjZ0vW0GlRqcGy3CKIwudU49GFygervFdbeSg3vMwQAufzqPktYMgByVB1IEynEp1mosNhq89pu3uXzjBuc+OMiRvXs5duQIO6fGCbGDwrFgXJKRxQmu5+D5Rl5KKBBKgVK2UEX2KAvCJrLzZTYQUPIchocqTNXKxGlKu7uZdrdLs9tlpdmk0Woxt7DIwtISUZLQ7HZodjq02m1anQ5RmtCNDOqRJIlxqcxS+3dmg0T9RN8J2zd5AZwrJWEQEAYBrpQEnkfg+/iumTCLYUgxLFCtVCiXy5QKBWqVMuNDw4zUKpSCgDCn2bgeoePgiSddZc3CkmdGhKEGScci+/3vll8xgQna0zjFcVyk5+KFQa/aPQMeNJpcuX6Ds+c/5tQHH3Dj5i1mFxbxiiVjqR74SM+o3PSslXskBDPpDRZa6v6v6zf9xC+f/Hr75NcutBoYn+s+/anv/wwfQT/wz9G0njVq/ukacmef/D8zrqEbx0RJQiHUOELiIOnll4RG6xyfe4LgxcAn2o/QvWBu9abCqnZoEwh10pQEk7XJOcS94+i17/7sffH3tv0uffN53pvPleSbIXpgRT5f5ofM74IMjBuj6+IWCoSqRkNr5lstzp4/z+LyCpeuXOXEkaPs3r6dQzu2saFatkhzn7mt0APUDwMY9WIme1MaD4UBymKezbQvkVISACXXRbsuI2HIlvExumlKJ4qIoi6NdpuVZot6vc7i8jL1RoOVRoNmu02cptRbLVqdDqnKiOx6EtufeVGyUbHKg12dd0gPNHMcieOaDa/rWBUkq1blCJOZqpRLVEtlfMcza0m5RKVUYrQ2zHCtxnClTK1SJggCAj8g8FxCzyMY4IMPjiQB6DxDnHeZEEhHojMDNMVZ0qMnGsqH10PE8+PcmnnMOx9/xNmPL3Dh8lUePnxAu92mPDxCEARoIWm1OyZ+kA6ekHZN6XsF6Ly6fxXO3Qe9ehNab+ZZvfFnkP7DwOt0XngrcaSLRJImCa7jMDI0gqzVHlcajTvfPXcubvo+bu5dYjcJbN0K/+yfge//Q0D++2gff9Ef8Ptpgk6Hx2fPavbtxR0bbS/PzN8eDgp3Jycmn+uolDjq9ow0AMO7svqiJs2kesjkqlT1eu3Tihf12qWz/3iPJqE0XiFkQ3ULrXqdh/Pz3Lp/jyvXr/PBzp1cunmL548fY+vkOBvHxygWCqb4UApSYQtjMMNGCGl3sspSW/LFWFvkIENrYfjuPR46BEIQeB4Vz4NKxXwvDPKbAqmGOMtoRxGdTodW1wTlnSiiZbVOu3FMN45Jk5ROp0OUxKCNMoThpNqJQpjFxXEML01Kgee4hl9YKBD4PuVCSKVYJAxCSsUixbBAGJjAPPA9fCnwMTf92suj1/ye945Wfb5hvikTQvbToAPv1PTtsTMNmbAcOmEyFfU4Zm5piQfz87x3/iIfnj/Px1cuc+v+fVYaTWojI2yYnkYLW9QlhFG4sOiN1IP3Q/5p65zA007sH9qXqpkgRfZ4wxropopuNzJmL5mhXUl7H6k8tY5N0f+WFzfnyGoFSZKh4oRukhBhxoZjzWBMPYQJZhT/QEH58rf+Bq1PlRq4RwRG/QPoRBFOmhKGIcVqFS/waTeadOp1Lt28zs07d7hy7ToH9+3nxuHDHN67h+nxYUarVRzHIZCyB0Yp62qgpTC89jzgxdxLvQ/Hghv23hZCmBqYgSxPICVB4FMLfCgVV51ditHSjtKUrvVcSLOMpZUVFpaWSDK7uYwiOlFEuxsRWdAn04Zuqi3QlSYZWaZwpIPnmdoaz/MIAh/f9wl932RXHRdHGqnB0ZERhoeGcKVDIQgoBsaAp2hR/09rmdKozNCRHNmnrNpdL7meshACJSQp2tBY7Xrt281NF1io17n/6BEPZh9z5uMLnLtwgfNXr7O4soLveYyNjTE6OkqaprQ7HZIkwXU9I6Nqg3FYmynss7/798xgcM6TC+dTm73emTKxgzWlEwizWXBcNm+dgj17Zpemp+9ORVEireu4udi2JuB734M///PeJvPr3r7wgPwr0+7dE/yzf6a5cwf+m/9Gd4dHHsiRkfsTU5PZ7MI83W4XNwiMVTEmSJOAcE1aTChhUcwBpOILbKb8UaKFMBqvYUi31aLdbPDehY+5evM6p8+9y4E9e/nGCy9wdP8+to4MU3EcdDE0qWnyydtBOLIv7JhPDAgchU1X9gem0pYmorRRVLELuHnWuo4BrgDfkRQLIToMULpmJ0Vtg1ZNmmmS1BxLyr5gQ2braHsFYhZhsR4TuPZzYgMf4LsCTxhDn56cYY+zZjOX9gzWGt4ora10mEHdByXo8srwXuzbS5Os/jvHF3IDJe24ZgLEyB8uJykXb9zg3bNnee+jj/jo0iUWV+ooIRgZG2fbrt3gunTixFIFcotsO1nmaOvAZi/vx68hjv31aD1b+T5yadaVvCjTPCeFKY5UQLfbpdvtGNqV6s8n6IEMXI9uxkDW5LM1m9gz2zopjARit0O70yUGigwi5LmkoR0x/3CbfSlbH7D5bK/WKCNNm2W4jsQJfArFIqVikWxoiLjdpttsce/RQ+aXFjj3/ln27dzBd156ieNHDjM2PMxktUrRdS2YY1aOJMvQKjMyu/k9qvpfStiUcQ8tX2eDp7Q2NE47JuTAdCsAXwhc16XgOKgwQGuYqFZRm6b7hcVak6JJVL5O9RNSeQ9kmTY0CvLA2IA9psTHZEFd+hmG3LHZsTbwuXxtrnSUDFwHpU2GVCuFIwTugMGcdGVv7Ocv1spyxnvFvCaLoR0XxzX1JghDaWtniplGi/c+Ps9vTv6Gk2fe5c7DGQqVGq7rMjExYRF6n263S2LpaZ7vW0lERbfbHdgM9deuQZHb3i01kAF+EoJ66i3We12mTUAuMfeEVopOq81IqcDmjdOsHDo899Gzzz5YDyT7+9j+ISDvNw2I6vyc3gFabpp4kBw5dG/70pzqNJvcaTSouC6ubyqtM9UvKulNLgMB+RfdhF1MG63YVLKHAUExxC+GNFZWWKqv8MHFi9x7NMP92Rku37jG1g0b2LdzJ1s3b2I4LOBjAuc+PmGQaZ1Hw1i0XGICwwEkQw5QRwYHq2A15eMza8R+Sntyqvjs7+l9l94TA7iAMArzrswlEwfA78F39gQtjN66FjZwydOx9PsFYYKrFnBjbo6PL13i8rXrfHzhIrfu3WVheYl2FOP4PkGhgBcWSLVx6UztRidXSAGrJ2sDtz6dKcfi/2Ea+6q1/lgRA2PKIpfdLu1OlzTNbOCe3199hBGhewVpn4YarXd39Dd2Rskj6nZpt9tEcYry3T7NQeep59/PGP6H9nfU/v/s/Xe0Jdl934d+9t5VdfK5+XaO05MHg4wBCBAkQJE2QZCiZEsmJVqmbNmyLD8/W7afk2wv2rKWlrWo+GzZ8ntaT4miaJGyRYJgAgSAABEnYPJ0z3RON4eTKu293x+76py6t2/3dPf06b7dXZ+1bve959SpdKr2/tUvfH9bvjqLxKmf2CzlZDAIXYO0LD3Dq1QIrCXs9dgI+6x3Nuj0u1y6eoXnX/4+jz3yCE+cOMGJ48eZmpxkKnDFiUYpdCZskDsn8ofPPJU7V8XK54Utc2WWW6xE5hCyWZYEo/SbonTsneR6I+mN5h13jDaLjJMdDyibpYlmPUBySeDhfWWyIv886ppFroWzxxG4SG72Kfqp5mqny9nLV3jj1CnOnL/Am6dOcf7iBS4vLBClGmUM7ck29UYDay1h5JRfXDqOk91Ns9SdoOKiEtcUUW63uK9zim/+zAuM1VgEvsrspiSm1+2ialXmZmf7lw4dWnm516Pyy7+MPHMGms2bXvs94b/8L8e6+tIgd+SXoJzSxh4EuwKRPnF06fg7h6Lzr75Ob3OTerNJUKuhjB15eu2teajuFMPJNI7R2jUvajTqTM/N0p6YoLu5wfrqKgvrq2w8/z1OnT3NZLvNs089xYc/8AEeOXyYPVNTzDRbNKtV59UWBWUNmzUeySSsTCG/PPf6XQ+TFW5g3YODuNnUL1tI79s2KAyjets+orLskdEEgHswyrfPyOOXjfOIYmOTzNSRaqedHD1q5J4XpzbhBhlJ5oUn9/Y7uTojBIubm7x96RLff/U1vvGtb/H6G29wZeEqflBhanqGPQcPEVSrpEBvELLe6WAzr4WxDKv7i+fgmhO143slu49cn9sircHafKotFEBmkbdBGBLGEXkBpXvQz9PHMtWFm3gOG165O9jrw4dHpRBSECUx/X6fMAwxQdONAXYkQTp8BizZfbzLF7P97TzVN/Bd/ZDWhiiOSNMEKXAFi76PX6/iVytO6tBa4v6AF19/nTdOneLY0aMcP3KEZ595hkeOHuWxY8fYOzODpxSBUnhy1IVCDyOUBSNaiGvqdIb7hhjK9IIbB21xrMsM8uL0k2rn8XfeFBeWKnrXt5+LUVxx55sof87No1n5A4GUWapJ7rgaeuBNVtskXeGqhK26KaM9cJKJTjbRaXMrZ7SrUR8Cg4s2DOKYUMPZy1d5/c03+c6LL/LCyy9zeeEqgzim0WwytXc/QaVCmsbUGw2CSmXoGU+NoeIHSN9zNU1pilN/qWGFi8YZa4Ze/htZ5DfjELvmWsvPJbk6FOgkJRqEGGvDoF5/sz87u9w5d5bOX/tr8Pp9IENeGuR3DQHIReBbYDaBZzxv/clm85IvxFw46GOMRmZ6oCLJ1T3M0CU8LM0qeJPHRd6efnJiAq01YRjRHwzwPUUlCFCVKhOzc1QHfaIwZLnTYb3rZAt//w/+gCdOnODjH/kIzzz+OI8cOcZEo8mEr6gKwJPuJ8N1SZPXHcDcQqNfXQlapspgBWQGiLX5YDjyKBQ9hPmAOyyAKawz92Zv3aRbl9kyeGb7IBiGInOzJw+Zuua8YjTqDtcrtq3ffSbRmkEUAU73W/keUow6oWlr6acpl5eWuHjpMr0w5Dvff4mv/ME3Wd7YdBlAQcDB44/gV6oozyPB0ut0ndavktQaTSctpjVS2EKYwSILezb0ihbmKDveS63kDjK8Tq3NojEjI8UAURSRJkn2IOsKviwjWTZMlqxWUI8o3ijbLp0dPX9uorRZWpfTcY7jmCSJh3GX7Q+0MFJhKLmPENf+aS0ksUYol/5Rr9XQOnByd8YQJWlm0Gbjp1JU2m321+tE/T4XlpY4e+Uyz7/2Kvv37OWpxx7nA08/7ZqnHT7MbLtFBTcGFx0dedMcY9y15QzcvBtIHk3NdzLbX1kwnEeD4BaHhRIgfa9g8I+O12bXbH7fmeHGMm99MT48TKUpzjcFp4zRmDSTjxV5qotT2SL/PKN9zz8/SkHMvOJCojJpRJFphwtGtVcauLC8ysuvvsYbp97hlTff4srCAkvr6/STBK/eZGoywKtU0FISGYNUik6/h+5sugZ4UlKt1VxDOGswOnVpqVl0f3j2MmN8yxwy/P1GT/6FeXzbx/I8cJv9nh+nK0lxaU0WOlp5J42US9nHin2QHlpKg3wrdgAMsj96Uq2KavV1IeUhm6Yz+c0kpB1eyCbzlTpEJgs1ynseN3kOqkBkg6krXgkqFbwgoBb4eNUqg36fJI5Y39gg7HZZWF7h4tUFvvX88xw7eITD+w9w/PARHjl8iJl2i3bNqYK4cKPLr9tyorb/UayyzvOexagxQD7AiW2fFYX/tzdxKJ6+6w4LudFRbPOehzwLA67N1r+lEC7f5WxssSJ/kCp+BpBuAM0lDjXQ05reYEAYRSwuL3NpYYE3T57k5NvvsLiyyqlz57i4uICqVJienaPRalOpVodeqSTVGMnQq5NPFM74KRhY+QNeQc0gV1Z0j3+lNX6/4+6NLM1p0CeMIifb5nkuzzsxWb5r8RMu9YA8deVWyCJEnueu6SRO6A8GDMJoKH04VM/I7qOHoaDqoSLTojfSDMdpa9VQGtAYkzVck5mMoEIEo47MycCwsLHBaqfH+StXeeWttziwbx9PPf4Ejz/yCAfm59g7M0270aCepbTkOdlWieEDn4VRZNS6GXU4Ag/TWrJdzse/4hieLZO5fIbLXePRzRRCVL6Yda+NvOh5BDWLChXWt+W0Dd/NDPmdJqlsXrGQRVQBKbDSRZvzBj4aV6Taj2N6/QG9OObClQXePHWKU6fPcPHyFc5dusTlxUXCJMEqRbXZpNZoUqnVEVISxwmp1fhCkegBSRLjKd8p6HgeqXZSiWS59+CicABKXV9T/E7h5KCVu77SFKNTakFAtV5f137whhFiIQtr30Tc78GnNMhH5BGj0QtCdBPhvY3yPqyknJG4OFXe9GJ7fvTQtit4L8eFQGC0YRD3XdV7pUJVuja6cZIQhiHS86gEAZVa3aVHJAkTk1NIa+l1Orzx9ju8+PIrNCtVjh48yFOPP8FHPvBBThw7xoF9+2g3GvhK0qoENCr+ULaveGxFj+2WsangbciXz30ROxuRo650o21sPbc7nofCgGp3eACy1xi3XMelbEd7kXsNsr+NEOD7WKBnDOv9PleWlri6sMDFy5d558wZLl2+wtlz57hy9SoLy8tUmm2OP/4ElXp92BypN4iIE9cgIahWqTUaCCGIIpcyIISgUqmQJ6zn+2uNGTagyj05uTFWPF8luwxbjAeJLZGO4SKMDA0DmfJQlD38ucYmzqNlt9xP1trCtb/1riw+5Iot72y1GYbNuXTqck6jaOsAWHLfcqMxwQVBlSugjJOhF1lmHlQyDXEAawXGQpSpYPnKY2punka9jrCWfq/HyuIiL73+Oi+++irPv/QSj584wYljx3jqscc4cvAg++bmmWo2adeqVJVzPkjhmpkNVcOsK4QU1mSNcHD6/XJrpLZ4bCMpRVt4ryA9XMjfpjBevutZG960wycFd79IOWz2ds1HROHezozx1Fii3BgWLo/bMFIi2wydg+zSlatcWVxks9flldff4He/9CUWllaYmp0lqNWZmJujnTltjBBOCjfftnBuJ4TTCldS4vl5nZshThJX1Ok5XfbcPgCoZuPL6Ixuv2pG77mxZPRgngcPbGHR7Z+2iKzA1418WhuEtUw0GzQnp/pprXExFWxkT2bXutwfQkqD/AYYIbupVznjVWsrtWoFhcBq7UJuWShPSOkqpLPum3mY92486ikhMhkjS5okw0nb91zBjraWKIqJohghs46VfgDWUmm0QCpqrSZozWJnk7UXn+flN19notni4IEDPPrICQ4f3M9TJ05weO9eGtUqFaWoiIIarRBbDFhwzogsuj4MoW83zimE4fOfvCPZjQeI0XbdIkVjZOuAmmfBAqMQvxitx+bev+wLExRVdkcDZzdNWd3cZHVjnauLS5y/dJm33n6HCxcvcvnqVVbX1ojTFAuoeoP9x9pUGg2CWo3UGOIkdalNCIIgyGQNDf1ef+jNCQLX1MPkjSjIJxfXJILhY0z2bnauRs6Fkt3ClofVAsNrsRAKH1690uWQ9/rOQ44Uw3B/3pTHdc0Uw3XbbA038+3n9oULqbtPyrxNe6qJo5A4S1nJFX3yD97cFkp2CzcYNYd/5x0UbepqGqSSSM8178Fa0lRnbdldzrNT5agC0BkM6EeRmw+tJWg0mfB8dJrQS1Nee+cd3rlwnm+/+ALTrTaH9u3nkaNHOLJ/P8eOHGZuZoa5RoN63rBMgFLgKW/okin2VxsZe6NrP1uqEAEdzUAyb4C344kxhftyq9No2wTFyIjP9kcU7r2Cd98FObduUQC+FHjSdTs1QAisRQlrq6tcvHqVsxcucP7yRd45e5ari0ssra7S7fdJhWRi7zwiCLC+RyqyuUA4zXTP8xBSoY0TGBAYhOchUaTWkmQGN8LJDapsn+M4RghBve7kJLdGwd6FQi798FTaHT63zTAXWW6nNQadJIBlut1icmaurxuTF1JYL+evEaVBfgOslD1TqZ6v1BvrzVoNz1OuKCN1fiQnSSQwqTPShzUlIwHBsTNs/5sXlyiFpzIZQq2JTTIqOoHhQ39QqdFstlBKkCYxvU6H9dUVzl++iIliGq0WR069xeGDB/n+kSPsn51jpj3BnrlZp3E6MUGzVqMS+FR831Xo4wzaYh7ecODaftPb0U+xWLNodNr8rmc0AIwOvGB8D23tfKB03petX0LhMUk4YzxPYDG43L0ky5+M04ROGLHe67O6vsHFy5e5dPUKC8tLLK2ssrCwxKUrV1jfWKc7cA0XqvUarYlJ2pOTNDNNdmdcxaSpa0Xs+T6e54qpkiQhTmJ0Vgvg+07JNs0M+6HvOzt5IynGbJ9t3qChZLcy+h6vRRSWMta4a9AYun2XOkI2+YJ7eEMIZGbAjDpn3ozX7/q4gjIgSdBxTJwkpLjJW2bGjnuwNpiHPpj8YJF/nSprTOOMWIm0Mvv+80LkkbxtEFTQOnWynLHrhBxUfOq1Oq2JSbCGwaBHd7PD8tISp8+dRwFT7TYH9+9jz9wcRw8e5MC+vRzaf4BDe/cx1WrSqjeoBgFB4FPxPHxxbUFmvtMuwDl600A2+LsHCZH9PZw1tkwsdmuRKAwFB3Jt/nx8LTZUgkLaTLb9fBVFz7gh6z+RRUQjndKPYzYGEeu9AQtLS5y/cIGF5SUuXr7EpStXWFheZmF52aWqdbtU222OnXiUSr1Or9/PVLecdKBzfrnxQmiyrq4uRdZokx1DpgCXpRz5Wa56mqauPklK1ywoM9DHTpbvn5K6hkDWMt9uUTl0oH/pyKFLG5tpn1dOg6255Wsz49+nXUxpkN8AK2VkKsGGV6uE1cDHEzJrapCCUpnCRnajFEJ8UoqCcTgmhHAhqShyYSrPyZWZobc864LmV5DSDbJ5N8w8zGdsFqC2Bq9SYX7/Afbs24/WmiSO2Bj0ePnNN/ju976LiRJmp6Y4cfw4Rw8d4vixoxw6eJD52Rn2zu9lstWmGfjUcgcuW5zRWz3o2f7nA6cAZCEEvyUMNnSWj9Yw7JQ6XKwQmhw5vK8xiLYa/aPwYQz0U816p8vi8jIr62ucPnee0+fOcebcOc6eP8/65gZxkqL8AKk8/EqV2f0H2BsErkWzcCHKONUsLq+4SS0zoKTyhlvWmQdcSUm1WiVvT55XwI+KnLKLJw/fDgMC2aQy1GeX78koK7nz3Ow9P9L6NmibPRTqJGttLYbi+fmDdjFf1Vq7Y4qW2HJf7Pz78J7LdJUxxrU4z1pqDy844VaYG/9lY6D7iMJXtVMKZV4U6RQ28g6WoPOkJeEawUmhyNNAdJKAkNSqdWQVyCJ4cZIQJ0luylJvtWi0Wsi8K6bWLK2vc+HyJb793e9QDQLmpqY4cfQ4R44c5sTxRzi037Wc3zMzQ7vZIMhkaIdOnuscZt5TIp+HTbavxdQKUfxNKvIUF2tB2tx5NCz93zJvDNtPbDu1+QNDcbkE6CUp3V6XQRSxurHJuctXePOdM5y/dJm333mHi1cuEWaRKK9SQXqK5vQUbW8ezw8QniK2hn63M1Q2U77vomPGotOUKAoRVgylKq2VJGmKkiNJyTzqnKZOgS3PKdda0+/3AZdD7i6G611EhQeXHc7BDT9K7vRy379zZCYEQjARBKSH9iZvPnpoc+kf/jb8jX8A5gAcn3ehkoeYsRvkjf/mvxn3Ju4MxkCvBz/yI4Az0sJ6bfDiI4fPTTz1+Orxi2e4sNGhF4UE9TpCuTxfrc3Q+BIU8jrH7bosWJdZB+4sNOReFDBSGHF3xtD7IRBgMtF+XF6JlCLLQVMoa7BSEGlNGA8YZA8hurNJePo0Z69e5XuvvU6z0aBZqzE7Pc3czCz75vewd36WVr3OntlZpicmkEoSeFlLe98jkK7hQn7bFVNfGB0S17x8G8aApVC5bgwaCKOYzW6X9W6XjV6PtfUNriwssry6wuLSEstra3T7PdY7HTa7XTY6HXq9gTOkpSTwwFceQSVAVSp4fgWRNVywaYrBtWi2Nmtvn1eZ53uUeTvdg4MoPBzZ0cSy7Sve/nsWcx6mEpRm0u5EZBJsJisGl1Jk3i73MK91ilWKoFJF+QFRotnY3CRJYqq1mvOyJTFeEAwnV1WYsLY/YG7//br7lf2kSUxqDaLdJDKaxeVlEq0JAt+FurOUvGGoq+S+pHidXDO6FOcrs+21LPUjcy9hjUUIO6xtwLqCxWFPDuFSN5R0qS/KtX9GJwmpSUk9j0EU0u112QxDljodXjt7hunvf5+J1gS1IGB+ZpZ9e+aZaDWZnpxkamqa2elpJlpNatUa1UqA5yk8XA+NXOlqdHyFh8nrcQsDZu7YyQ3uGNDaEMaxi4AOBmx0uqxtbrK6tsbC1QVWVldYWVtlvdOlM4hZ2eyw0emyvrlJGIUIJfEqPkiJ5/mooILyfbxqBQtEUUhqbHY0AmnZ4SHDImyWJluMDtudO+oWowK3XAR+O+QOJAMSSbUS0FtbIw1DJo8eRe/ds3bW93obFxbg5ILkkSOGiTroh7uKZewGefUv/aVxb2Is1ICOEnxrfmr5hx8/0Tnx6gHOLLxIN47Z026DVMP21rn4v8iqxPMikPFiXRfJzPuqrQHt7oItUlPaYBgVBHrFJ9BC3M1YS5hmIawsibTWaFJrNNizfz8VP8AkKf1ul7Vun7NXFxl0OhDHKM+j3W6zd36eg/v2MdWedMU8e/fgex7NWo1Wo0mr5X4qlSr1WoXA913aT1Z1XpGSitxmXhQ9PdecAfcErk2mA25dl7c0K2YJ44gwiuj1eoRRSBQndPp9FlfXWFheZnVtjStXFzh/4QKLy0usr6+TJgl4ikqjQbPdpl6vs3dmFj+oIIQc5t0ZY9HGkoSDbB4bSV8FfsXt3Y4ycbkHZ3SMgix0XPxOtiy//eCF6wJ5o5NTcm8RBQ+4deFjZVXmiXQpAGmqsb6lUq0ilUcYxqxtbBAlMbV63RnkUYwfBKRpOoyijMgiRrm37iaugeKDehw7g7w6OUmEZWFpkTiJ8bOisFHfgTKLfDez3fy65kF+GF3bOY1KDC+gkdvXIjKJzdE2JMJdY6keZRxmTapUVqQJrrurtmm2SmegV9uTtKamETgvbxJFDHo9Lq+t8vali8RhiA4jatUae2ZnmZqYYO/8HvbMz7N//35mZ2dpN1u0Wy3qtSqNep1GvTF09HhC4CmPipL40tVXQS7duPN5ys9PLsfoZBHduB4biLRBG422lkSnbGxusrG5SZzEbHZ6rK2vs765yeLiIkvLyywvL7N4dZG19TXW1taIU0212aLenqBarTExO8veeg3leRgssU5JtGsGF2lN1OsPHyakUuQ52iYr6s/338vUWvIIBbiIqy0cx/C7LUThcnK1lVvl3ceA0dWSPzpYa5BKUKtWsamm2+2aWrUaps3W1T4k1CTUtSJcsqTeQz/MjN0g74x7A2NCAFH2e1Cr2clWEyUsJk2HHoO8U2c+yLlQkbsIt+RrjIktdppgyx1zzaC746cLRt3QRrTkXQNt9rrWlkQajBUQVKm1Pfx6HTM3B8YijEHiBrBzl69w4coCL7z8Mmkc4ytFrVqlXqvRbDaYmGjTbDaYmppicmKCRqtBs9Gg6gdMtVq0ajW3TndCh3tezOnLw+rGWuI4YhBFxEnKIIzo9Hr0+n3WNzfY7GyyvrnJ2sYa3W6PbrdHlKYIz8MgnPGuDanRyFqN6Votk/iSKD/A852nEKVcIDfrxOryagUFp8Vo3ywIUZRXvP4YMzqi7b6rbSvd9iG79c+SXcywAGw0SGSGbj5eMFThSXRKFCWk2gx1yIUUWybZG6WNWLHVKN/h0tn6uhi19HaZBTprWGJG3RSL638P56FkPOx0NWybCoZsEZcqzhVbViKu+z0XNe7tlovpWseJQGCsIckeIj1r0VbiSQlCIvyASkPg1WrUJiZcCp6xyExnfz0csHn+HKfOnxvuqxKSWrXqGuK020xPTlKv15jJ5hLf86gFFeqVgFqlQrVSwfd9fOU5T/Mw2spwbnFFq5okTYmSmN7Adcrt9Ht0ej36YUiYpAyikIuXLrK4tOS82HFClCSkaZoZu84zL4WgMT1Nc3YWgyCKNUhJUK0igwAtZCaFaEmMRdvRg9L2GGk+PwgYOvm2mBVFr/c1SSXbvuT3jB0NLnanbbkds2y9zvK0Xue4hKrvWynoWkQHMKyfhbWva7qTlqyO6mFm7Ab5XSgbGDueH2xUKhWXw6VT99Sah5EeIMTwX8HILes8eam2wxtRegH1as3lpWXFNEkcEw0G9Pp9knjA5sYGYa+HkLgQo3I5bJVKhSDwqdfr1Bt1qrUq1WqVwPOoBxWqnpflk2+VlbzGIMcZKolOs4FREyUxgygiimLX8TAKGcQhg8GAKIqJowhrLV6lghdU8f2ASrVKtV6nGVTwgwDpudSj3FPi8ntdNXu+A7nje4uq+Q6KGqWx/JAy9BTulIG6fVn3njbGpVP1uoRxiPR8dy1mijzDgrU7yNAIkAJtNWESE8bRsNBYMNp2yYPD9gf6HY33m1xXbpoVnUOCwvRh8yime9DTeddkAN/HkxUq0qmBeMrDpCnhYEASx/QHEVE4oN/rE4chJFmdTSWgXqvRajgPeb1WoxoE+EpR8QMqQUA1cP8rKVEyb2qXzRyW4X1nLS7N0BhinRLGMVGcMAgjBlFImMTEqSv03+hs0u/3RxlcWeG1HwRUqzWq1Sq1Wo3A9wky+dpKlJBmBZYwKtrX5GkoLqXDqagw2r/83I78Zbf1/dxrZOZ8iOMYT0jq9bqRSi6k1i4CmrgLYEnWXU7QQ05Z1HkTaClPx1K+pLV+HGNqo3qnUTv2oU4wztsk7ppFtvNGRl4wO3zh3Xan6C0fGee4lJCsu5fAee6MsRht0dI1JrJC4ldrCM+nolOm5uYIKkEmz2bcYGycx0Snml4Ss765TrqusdpgtSbu99FR7FKAYOjB2+59KXqmVaav6p4VJNJ3TRGCSoWgWqXRajKRebqlklhjicMYm3U3E0K6XMks5JdmLY2dFyNTrrF5Acz20dHeYGTMRBe35RFs/fMan2XJA8Qw4iTyEcJk0ZPMc57dS0IptDYMBgM6nU3CKKJRqbrGPUIOr8n8vjB2p+3c2nAzlNTEDrcfDgaEgxBjjFNnUFFWZ1Kym7lZv+iOQ8/NLJu9YMWw5d2OO7A9ZUohkV4x8gfWOJWQoWynMFnjOU0itbtXfN95thtN2vm280JMrd1Pvg4LS5ub9Lo9p3ImhKvdAYQxbntZnZex2j3YFuYPIZy8qFTKyT5mkoLS8xBZYy6DRUjJnoOHqNZq2f2YHdNoRc64N4ZYG/rdHgKnTKN833X5zDzj+QmTuToMxXUVT+LO3+SWqHj2Sy65fCvc3Hhx45XuOIMVdlB6HsJakihCCUGz2TTSDxa0EAuMambLISajNMhvAuupC9b3XxdCHpLG1hjdg+SeWu1yFe6eiVWUMbx2j3dYvjAI7bS6wseKxrjFDRzSK4SwMwNDG0OajoZoKZw2u/I8UIJUkOlAymGKD0qBr5G+QqU+VhuM0WA0tUoFoU2hnfjWEL0t3OhD74KnRmH9PNNRCfAUWrltG1xhjNTZEoE/7ENkrMFo7RQmtuXf2Tw+KLZGQ3aIGBYCjdlZE9sH19E6R89Ixae2ckx6YBFgcSoWxetZAFLILP/TEEYhm5sdBoOQ1tQUys8eAnV2H2ZFojvXJtxcVKZ4lRkAKfB8hbaa3qBPf9BHa42X1XZco+ZSXqa7jOt94zvPAcN3d/weR1HRa+IxIitUv9EmC8kW+XK5apRbs4s8Dn/LanGMsBgrECpTczFZe3mlXO8MpbLuli5ik6YJOk1I44REa2StSrtadRsxzvmTN1OzhadXIcjqlcTQszMcpfNdz+4x4XmI7B4gSx1LhaSXpFuOUYhRu6/skdvJIgrn/NHGYnGSg6agbCOF24+tkV+bPXzsfGrzl21xsmZkB1w7l1wnR+l2sWJLtoqbx/J4dXFLI6Uap+KkSaII31NMtNsmbTUv7V1auvzj3+vb5y9c5NJ737MHhrEb5POb92sWOaRKYYHAcCWpN09VarVPB72eawIkFVLI4dP+vcxRGPdmpcDltBae5k3mDTDaZjrnYJXLERTSefXSOAWcDCSS4SAvpMKveAQVMTS6pRCuMKdghOce+dFxZufZiuFgKpR0Hd+0xmjXxEIbQ6Yf4wyK1JBmE4AUAl+p4eBubKYDnXtgcNsXUmQDZvFM3OBLFtf5veThI79MthhAFjJVBAFDPWQhBcpTWROvAZvdDmEcOYNAKXd/ZQb4OGQHhZR4vk9qNJ1Oh06nS5JovCBAKukelqWCMWy7ZPdwM+aadc+G2y/t635WWEYFo7gPyWw9WKdSZgsRXCdAkKe7OA30xLh0l9yAhSxdVCqk7wziSpYywtChMmo2lze5Ell6iZQSNx3lKSvFaKj7PY8K2byGKZOGTJKUNIlHiqC4eUIM7+rclSXwpHIPMUaTFrTP8yVlZrYOowpZ2Defo/LzejPRjt18Z8qs1isMQ2YrPrNzMyaZnjlfGyQXPrx00XRrDdaOHKVar2V9Fx5uxm6Qf/77r457E2PDPXQKpn1/o9dsLdZaraS2uYlJNQTu5jaZlzUfQFRWtDX2/PJt3u5rwpY3uEuvO4AOMzK2hr+MsVidkA9OMkslUULi+dtCbsZiTOrC4cYNKVpbii2NbWZ0C+GMd5dyIoiNJjJ6qxdxixe6sB3rBjfleQglnPfBJfZng53Iogi50V84fm2xaCeZJQVIb+QFzGx+k+fF5Pu8w/cpZMFrcROhxmsOZKdlb/TF7fTxkl1LHkETZAXAxqWvFMP2QriwrrGWKI6JohBt0kLXWjOSKgXn9cM6+XlG9xO4e8UCsnBJbam/2hZmt1lUTymPNNX0+n36/T7GaJeyIiU6MxByec6S3cVO38h2Y23oL80cDsXxcOvnrxets0M/SL6ea4ewrTHCfNzOm+gJFw4ablcxUmYZ2aSWQLlOlMa4vhnWaNJYj2oZMkUzlc0bsuLunW6vl0WctnqdcyO3qGyVG+gjQ9q9mM8BtpBSk0e/rbV4vk81qAy971iLa+WRl1TaYTF0njOubYrOO3tTUH2x2b2cWd3F6Kzzym87vQWn9xZnOAyjvVtjb6Pv7Xpc973ryDVt9bvv5IVn6IzIhx0hXUQvjWNqjTrTU9OGRntxqTW5xMycPfTzf4aZf/1nRn1EHnLGbpDP7Zx1dl+Qh4JMvbWRzs0szOzZk4Rr64RRhBISmbU7zxa74RPtWPfxDnDt7TX6TWYDqQsxMqwqzz3boiBVWGzHe41SQz4JZIOjJfMUmhQjcjUJQIyuma1jw8ibkg9A2jhFm1G773xAdoNgNhMUDsc6LfA8eGoFWTbBFqM8/+/dzu81E1tps5QUyCf+ocduGC3PPGbSNYPSaUo4CImTBEwWChcjtaPRw+homt2pMdDNYsnuACFQvkeqNZ1ul26vhzWGIHD560mqXWOr0kO+a7mVIefWv8WbMc5utMFRD4a8mdl2M1HgrmUBmFQTp7rgUXYyf1bILffM0OjOC+8zWUBbEAKAfK4ZNQLK15nXe410vLfGYrMJbxTsEsI5cozOPNxyKAI2fObNjWpjMxvZYqVFqsK2hicv26+h9nuhX0X+FHWrX9ZNfyl3D4H7DpI4ZiIImN2717z8kQ9dPbe4GFb/4T8mSDXB9PSo0d1u53M/MtbVj90gP3/00Lg3MXZEoxFaadfmDx1K+xcv8c5mh6ryqFYqIyWQ/MYXd+t+2CEufs1jNDu7mHdc3dbn3uLY4TqAZXnbwmB07kUAg0CY7ftgh97v3FtQNM6dYe8KJnXWxct5/XLPwrX7nN/YUBhvbVZsagp91oRA5O4FOyqoK+6fECMPobWj9tD5FDBs5rNtcB99fue4hN16BhmNrLfAtZsrud8Z3qZiOPEO38qusTiO6YcDUmMyT6IYTfBi5H8c/i12lqcT2/8QO83tuYvOPSAo3yMOE3r9Hv1Bn4of4Hu+K4IeejhH3YhLdhEi988WXyqGSArf/XUc4KOgXNGi2yEieL3B6BqnhB2Om6MxfzTu7zioZY6dNE1JMzWVvLukn3WhBkYFoXakgCWEwMuK8rcemB1GdZzzKK/DkKO3Gf0M1U3EaC5RYvR3kqakWrsmelkXUyFHDxzGGidQkLe7l6Bk1lyLwoayX4rKKjKXORUCq4vKRjt9D5kj6ZrH9R2XLPw+PDFbF7lJdtpi8ZoYPUJt3ZQ7H5qG59GYnBxceOz4xlvnT8P/93+HrGvofcNf/oWxrn7sBvnbc/Pj3sTYiatVJrTpvu/QQd19tcUbi0uoSo1qFoKSQmQeXrYUkdwNrvU1XPvqja26kVFvt7w2+i1NE+IslUQpifSK/dGywSX3WmcGuBswXcZhLhm4tZiRYQhPeR7g9NvtdcJsFtyAte1FpbYZN7kFMvQkbjNkENlYZ4aGjRIe0iscd3E+s9cOM9v3ofi6tcNEgmHKwo0Q24wcuyUksPNn332Jkt1AHvaWxedjIQp3aea5M4YwihiEA7BkHun8HsoeNjMjXVtX4Sk9dy/kPscixYnzXUcj4Rq3GK0Jw5AwHLgiOs/L8j9LlZXdzJbvuDD87+Qy2FGjfkfbe+cR5hq7fdsGiuvMNIRG0VPrxsYtiS3CFTXnbmY3vyiqxcizdfVBzuDdOhbnKYd5PVdupA8VWWz+0CkKjiFnIBtrh+pFw/ohM6rVcHOT666bp8F4SmEKRaraamyaW/GjdCDpy2GjN0v2EDIKjbkx3+befMiqTRFSubQikUeviufUbj3/W9TTCp71a77F69kE29luWO/Aza5q21qtxTWZsmCQZy30srcVw4SbErgbBnm1Ou5NjJ0ecKBe731sarrXqlYJBwO8ep3cyyRFnvN1U1Pg/UV2ExprRsUseR4c7OxUyQMGjDwUwNBoLzr3BWIoH6mz7ey4G8W8wOK+iUI6SiGMmZvjI3MizysnaxAhRwOWZGQ825ERfkvYbb+XlvLDS26D5BNnfq0L3AOtlGhNpsLgOssOoohBGGIZtSY3plDQmd1UxphhJKnYTvu97KpUCm0sg8hpMDfrFs/z3Dbuk0hyye3zbnZW7rLZyaC/nvMk/23YPC/POy88nTpBk5HDxFiDkk6P3FqbNakayXMO93RbjZEwJqvzt8P5yeZRazMc5TND2GBNNjsUrFiR71DhfLiVZ10pss3Lwtw2NPwLbiQpJVaOHkRsnuJZyLvPDfeiw2bkwLq5+WfkRtvluBOAi/axruGigQG+R6vVqsp+P7btdqlAnjF2g3x93Bu4C1igA6FR8pw15iNJHHuuY6cz/IQEaeWw4ApGA834CqF2sojvPNY6neLAy3P4bCbfNDrO4cAi8oElMyIKFehD7zVkT8ujwUwb5wEZ5sZeZ2q4piWwIDvnhfOdLbd9UMtTVwSZN8It6FRWsmLQ7VHCYdrKzZ6r4bbzNsfFKELJruBmv847+JVlWeQgGdZc5J5ya1zRWJSmRGkKUiGlGqqw5FEnRKEZ2ZZKTXNNDZYteOu2H07+WJt7BpXMU7wEWhsSbUiNAKGwSJd94MJN156T2zqX9+ALeNC5ThHezX50WKx5vYVusPq8yY7dvmD2mjGFfPBCdGiU5bk1BcUIjZFqyxieCwAUC/+Gyw/Hbb0lPXIonStz77cb563RWHQmHebWq8Soc25+HoYPAtn8sFM7esBJ7BYOPX+Q0Ho0f1yT7pV7xfO7sVDkDSOpSGBbxHT08Rt9J2O7c64JxbgZdTv51eD204DV2fgnQivlegoxtRqHDh0KfM/TemqqNMgzxm6QPyjDqkV0rfRe08Z8MI0GjwkMSrmip7zxgFJqWB2edwjbHcf/bpPgzbh0d37fZi3k84jcTp+zbsFt27M7rLLgrdj+TsGT8m57lg+uduv8MNqyGenP5kdu2S5xuJUtW7XXnq+hwXNN7PDGV8Dt9F+8Lzwj9wE7fTPv9dzmk6W7QnKjJKuRsGB0gkQhrHHayspDI+jFEb0wAumaVaVJglQeUqqhUeOamDhjJUnTLOdUQZbGstP+b//bGeouDI91CkpuvT5WKNY3e3heBSOy/gHGWWx5zvpO3tQbeVav97fdcYndMVreT+zkltlp9LneyHqzZzy/nm/0+ettd2joFg3ZwpL56zLrqDmy+9zR5NdKPp5nbjBcLrilaABanELW8DzYnW4MMTyaofPHjvZ6p2fPG5FHXq85+O3LbCPXHS86gK79+M3Ny+/9ztnpu9lKnoI3PNzh9ykLx2dxmvVmGI0QVuMJi23UzsWTE9/SsKrCiNra2iBYWUnTsjZlyPhVVtbWx72JsdOvVpja3BxgzBva884pJR9TKi9SdKEmC3hi1Opa3si6Gwt38qLe7nIreq2vZ5gX/9rqrc7XuKUo6BaM8S1LbTuvO3uw8wlg53WY7d6KdzHGt3ONN+hd9rFk91GcdMf1beXdX/MIjMB5DCUWaS2+UgipiI1hozdgs9d3xrJSpGmKLxVSChfxzdfpqaHeviecJ9De5L2zZd8yr52xrnmHUj4Ij/XNLtLz0WQNTsjbbZXm8q5lJ99GgZ0eom5zMzfFFg+u2MkUvWbpa9Mgd/ic2ckZs0Ph/VBZ5dqFR3fKcFtuJLjWaSR2+NyNjqK4fHFnrvMBW/hf7Gywv9sWr7/Su4HY+iOKY9AwXECaJmBTJhpVgqmJS+FE80ULG3pykvWPfSz0l5fR7fZd3O/dzdgN8p/+2tfHvYmxY4QgsNa0rNhMW61eq9V0UmU6RQin0zsMawmn6yvkdWvS7xA3ufab3ol3WfC2D8bu8Nsd4k6s8D2tYwzf8LutsrSK3jNDY/xW3L23iIBM/YfRZCXsMHqTNxIx1hAlCd1BSC+MMLjCNink0OO3fb1bOv1ZkeUc2K2T4bscy1CGkeK+WBLtZOeSrBBbZeldufb0rZyerI5654jXLa6r5DrYd4+xvet5fq9TyY4e4Xv77b5bXPJ6EaWbXcOtLnbb3Kn5+71+TBQdTduMcRh2IXUPNwaBs4tsmuAJQaPdpt6qGS3TVA56mqef4eJf+SsIrbGlBvmQsRvk+9a6497E2BHWYj0vMa32JW9yenFudpZYSuI4RkhXiW1hGFb2PG/45F1SUvKQklmkMq+Gtrmv2f0ts8Y7vXDA6sYam51NAHw/IM/BvTZFy2V856We7233RuuWmSrEIAzxez3iKMLaUaOTciQrKXnIyT35OwwGLiiRGePCopRAAYMoIlCSg/v2MXnocDiYmtnUQqYoSXT48F0/hN3O2A3yy0ePj3sTdwUhZKqq1SveytLy3rl5rq6uMggHVOsNp9fLqBLcqROY+0fsvqTkIWJoxhYzl97FY3a7Bmnugc79y5ZM50sIl36CZRBFrK6v0+t2QQr8SpCpNGSNQwrFbfkO5vmxd8pQlsoVbfezjodRHLvXMzWXGys/jN4rNj959zD/uyV/lZSU7BZycQabjUtZZhF5vMtgh06IPIo3GAyoVQP2z83hHznaf2d273pfeJpEZw367jMq/lhXP3aDfOl9j497E3cHKTX1+loQb27OvfF9VlZWWBuEVGsN5+li1InPyS7d6x0uKSm5GcQOxuPNpIHeYI2F/11KiYChDKLFgpRIzwMpiOIIYwz9fh9rwcsaoeRepy35psMCsFFR2PXSQt51LwsqQnlO+WAwAOs66wGuR0Durb/F9Vt22rdrU9juVI5zSUnJmChmwhUUyYYFrS5Hzy1o7TBzIAwHxFgmGk17Zf/+xe80m92N59+Edy561CrpPTiS98Yf/cxYVz92g/yNmYlxb+KuYIEY7JN75/on9u3j9Km3GfR6TE5No5R0esKpxhi2yDOVlJQ8bGSRsqzpifOQuxksVwwVYmR4R3FMFEWEYYiQAk96hfXczLbgvWZl557wwWCA1po4N8i3N+MqKSl5uLE7/THyDEgpUVKhJERhSAiRFwTnwqn2+XUrUr72Nvzui5KZ1t3f9/fK/W6QvzPuDdwl8oSUg5VqMj05aQIlZRLHWbHTqHp7S3vgXGy1pKRkV1FUghibykpevJlLDOZ6yxikkK4bppSk2mC0RmvjOgkWJD63pIpkNSq3JAl0E+S1L0II4iRxMo2FroXF7e08mt3s/tx4LCyWppaUlOxCthV35+o0VuT9DPIsgSwN0I1tYQrvaF8uoK3gQmh5pWvYUzoutzN2g1yPewN3GeupJRUEb1p43CSpEq7yaou837ArWUlJye7iOjbh9vv1uqbjrSaZD43rbWIuFtcqW4BOU7TWGGvx8iLK/APXrLfQ8a+gsXy7j/15gyAhJQpI0xSj9bA5SSnhWVJSUqxZuaalSNbpejhWCKcwZTD4ShJUKpENgnNGqUUsllBDN9E077+MlXEzdoP8QUNLdTkOgm+j1JQn2JcXXuUSZy5X1G6ROi0pKXn42OLpHpZ1jrKqVdZeW2s97G47xG5dx86NsbZnYd/6/lnAaO3CzEoRxzGaUapKGd8rKSlx2KxmU2wdG/JiEZlFBa1B6wSjNa16g5nZuZhG40Ki1BJkyyppUaWFtJ3SIL9FjOetpLX6SeUHn/CF2CexYDXWGpc7bkXpIS8peYCwcMMi7XdzmptCBG3oRbJ2KJdqtqeH5BJihc8UI29FbfMb7fO7keeN553yconDPDXGZr0VpLpTsofXKZUV17xSPgmUlOw2sjRxWeigqk0WYUNmnVadBz1JEmSaMtFsMTe/J6HRWko9f53UwiCGzgCawb09nl1IaZDfIiaorCbNiZPWDzYU4ClFYi06TQmCCkJKUq2H7eRLSkruX7ZnjdyKT9p9NlNVEbnSisnKS1zRpzEGnaauf4HyEHbkUc91f3Mjubgvd2JoGXbr1BpPKTyliIVrEIR12uTD9t7sYCMPd6bUSSkpeVgQuUGedzm1TszVZp5zYzRpHCPTlD3tFvP7DiTh1N7FWtduPBb14bmjKF9Cu3pvD2QXUhrkt0hcrXZ6s7NXgqmpfjMIsNpghm1/3QVaGuIlJfcXO5mSw9du+34eGdEi+zfPzc4NYWut67hJ0eje5j2+nmN5h4HmVkxiW/SMM/LAqyx9xWiNMRop1XVS8LZ7zsWOf21d5lpVmNKMLym5TxiqRIlrhqUsnuccDVqj45iJ6gyt+T3plbl963RJn+734cefgc8/Wwpe7EBpkN8ig8CLuocPrB159tnIXrzAOysrePU6rclJur0eFkG1WsMYgzEPWklrScmDx/WmhS1pKgXrMi+EBJAChJAImckbOvFwAJRSKCHQWjPo9xFWMDU5iRSCzuYmG+vreJ7H7NwsCKdHnoszFbW/R8Wb4obPBjc7vQ0VVTJpw2ajQZok9Ho9fM+nVqvjeYrLly/T7/XYt38/9XqdJEmIkxhjDEophMhSXoyLCEopEdkDh7EmewS5QUJPnhe/w2kuKSnZXeT3stEaqUApD2MtGp01MgMhLLV6jbjbYW1jk9bhw1T37ll5bf/06uJMm9bAd811PFUa5DswdoP8QckSskAKbALn2s2NDxw7mhye38urly4TKMVMpYLpdDHWjJoDlWkrJSUPBNZabKaxi83yrHNlpUz6FOEMdIu7940xWX+ClEqlgq88kjgm7PeJw5DpiUmmZ6ZpNhusrq3RGYR4lQrSUxTN1C1pKncwO0Rr7VJnlEJmhaVxktCow0S7je95rKys0NncJApDms0WFT8gNSlpqnHRQImnvOFDitbOEEdAqWBeUvIAkfc509vqYSBzRhisAV8phLFEgwGBUGnQbF5ebVQ21z1Yb9W2rbCkyNgN8va4N3CXiYDTED8mpW74Hr7vg7WYNMX3PbQ26CwUXRrjJSX3KYV718LQI44ApeQwxcQYjdEGYw0q85SDxVhDEqdOtcRoDh04QK1S4+TJk6wuLTEzNc373/8shw4f5uKlSywtrzAIBzR8DyWc52l7Iakd/rN1F2/VNs8LRn3fx1pLv9fD930ajQZrq2v0PI99+/bx7LPPsrq6ym/8+q+ztLDA0WPHaLfbeNZjM9xEa40fBNSqdQwwGEQYnWKxSKW2PUFs2+uiEHxJScnuJ6tpQSpX0KldBoAcGuMGDSRJijYGKQTGspoauwC21Di8CcZukA/GvYG7iAC6wABiEwQbzUoFT0oS7TxGvh+ASEmzIq1Sw7ek5MFA4FRHtDVg7FCRRAiJwJDrDljDKF3NGhqNKrVqjbDfZ+HiJdaXFjmw/8DgY899fPDs0083Njc2KhfOnqXT2aTVaiM9hbFbJRC3Z13ndu7tRnzzFBjPc57tKAzxlKJSqSCAfq/P5uYmjUaD/fv3s7mxwbe/+U3OvP0283PzzMzN0qy5tLwkTen3eiAEUkqCahUDJEk8LGYtKSl5cBDDRmcGhB0Wh7tacFekjjF4SiKUf9EI9bZFRPd6v+8Hxm6Q98a9gXtACsZKdUH53krgq8koTVWSxARVF47p9fsopYYTXklJyf2LS+kWGDKvUGZkKqUyQzxXUMnkTo1FGIuvJI1KlVqtxpl33mF5ccnu3bsv/eQP//DCRz728ZX++tqxN15/vfL2O+8QVCrs2bePQRQSm3TshmzenRNGqTVYqNaqDPoDrly5wjvvvMNHP/pRfuoP/2HazSb/4td+je7GGhVfMTk9Q7VSJSRis9vBWEu1XkcpiRICazy3zpKSkgeCoqiSta73ilTK1c9k9XLSgk1TPClo1hvQbJ3Xyn+rPYjCbrVKPbzP7fJmfayrL4s6bw9thLiA9M/5ftC0carSNKWuJMYqjMk0yUtKSh4IPM8NlfG2dvZ5BztjnFqKVBJPKZACpQTRoM/m+jrd1RXmpqeiT3zmMyc/8MlPncb3xUtf/9rel156MUv98HOBxMJ6i3+Mfs9TV27LZrej3E+tNVhLEATOUx5H1OsNrLFsbGzwveefZ6Ld5k/8zM8w/Yf/MEmvz/Pf/Q6Li4ukccr0zAy1Rh1jDVGSoLWm2+mgPI9KpYqQkkQnXKvHUFJScj9hC/9sbVKWK0dZMO7eNsYQKEW11SKdnlqsanvx06+8lcRKIu/3h/TPfGKsqy8N8tsjTaV8h0pwql6vP74+6FfiOAIhUErd630rKSm50xQkArEWKQTCWlfglHWvk1LiK4XnOcnAXrdD2NlEYDlw5NjS05/8wVc+80f+yEu+EM1v/vZvfezbf/D1icXlJY4/+hjK8+j2s9SPa+QEd9id7P/b9aMLIUiSBAFUKhW01sRxTLvZotlsEscxly5e5Dvf+Q6PP/oYn/roh3t/+k/+zObMZMv70pe+3Oh1OrWVhSuiOTlFo92iXq8xiGLWNjZI0pSgUskeGMqUlZKSBwU7/N9mEUGLM8eFU1gyliSOqCnJzNQUdu7gcr8ye2VqcyOVaYotU9huyPgN8nDsW7i7+EAsTOJVL9NuX2y323p5Y20oByayXMqSkpL7m+LUkaauJim/vwUCjMValz8upfOMSymduoixpP0Bylpm5+Z4+kf+0Dc/+K9+7nf2Hd3vvfiV3//RP/jib37gyvnzTMzOsmf/XjrdLmtX1wkq1cwbX+j2W7DOt2ij20JO+bWLXvd4irUtFpd6Y4zBaEOqnSLMzMwMYRhy9sxZ/tE//Ie0PdH7iR/54Qtx+q8MksTMv/zi84+cPnM2WFlcpFIJqNfqCCEZhCFRkpAmCUJI5BZNw+17l2fFl8KHJSX3C/Y6P3lH4XAQ0qoF7JmbQ83u7y/MHOrQmHUSLCU3ZPwG+c+NfQt3lxCoY5OfnFoQj+y/MnnxnK4uXKYfxqRpgucFmUavKPPHS0ruV7bdujqT+XPGslMVMJlsoKcUSkqssYSDPoPeAGk0+1p15g49ebn2yBNf+sSP/Su/c+LofvnOy6/+Gy/8zu/84MXLl2hNTjAzN8tmZ4MwivGCAKlG3TG3mKY7KK4MVVi2L/tuh5blj/u+D7iHDWsMUsnMa+4eOubm5lhfXeW1V1/hd37nd1tH9u+ffPrxR8/IIHhDV6rvpEK+f/HC+UNLV6+y0enQnGjTajaoGUM/DAHXVGh4KrfLxFzn2EpKSnYZQ3EkMfxfZA3FnGNiVNwZDnr49Qr75vewdmA+XthfT1VUQdzv6Sp3gfEb5L869i3cdawn7JV/ZX516pljV2dPndMTZ95hodsniiKELIs5S0oeNPJulkq6lDSjzbC9vJIKawxJHBNHESKOmWi0zKEn3r/++A/+4O/MPH7iV04cO1DtnX7np77xq//sY9//5jdaXsVnz8H9VOsNFpeXEEJRrVazxkJbt33HG9NbF3IOAtclIhwMhgZ6miQkcYLnebTbbXyl2Fxd5Tvf/k5tolaf/2P/xr/eO/LYoy/8yL/6Y6dmJif0C9/4/falixebK50NFacJs3v2EFSrhHGMMeUYWFLyoFAsAi92HdbGYDEI4YrcB/0BYhqmpmcGl+Zb3VNTUNUKYcp03nejzCG/HQTi9B5pm0fmO0/PTtuJoIbRhiROCAKDktJdpKVRXlKyK7lVp2zg+8PIl05TLCCFQkmFyKQD4yhGKY99c3McOXw0rj77g3+39ewP/JOnDvpBdO7cv/8HX/idn//e916gG0XsP3yIRrPBIIqIogjl+wRUh/uW/+QMhxLx3pM8cg88MPRqDVNxhCBOYuI4plav0263eezEo6xevMBX/+WXalrK+k/+sX9Nve+JR7t+4H+ll6bdmblTP/7ma69PX1xeZm11ldbkJEEQoLV2DYR2yBvdkiW/868lJSW7iPzeNNYVsLuooHE9GgQoKRFCopMUo01EELyxFKirFwGpoMzkfXfGb5A/+Wtj38RdZSOWdqbqL0/8ULRIO/5Yo2lb1SoCiJOYitZ4no/VmR75vd7fkpKSG5JnMm99rZhn7Rr95AWcJk3B2Kz7pkLHCZ3NDoHWPLN3PzOf/MRr9lOf+JXmI0/8c6/qLy+dufiJd7769WPPf/vbbKyvU61VCWpV+uGAMEloTExkLehTlNNqybI7sjxysXVvRv8WuEGV59bUFzE0wqPYFXV6nudkHY1BCEmlUkVKSZqkDGyIX62gfJ/u5oZ/8dRbP/jGCy+FqfR/68ze+e/FP/KZU0cOHb4y2Zr6iVNvvvrkyXPnWA4jDhw6hBECnSQuG17I4c4IQFiRndniPorRoVw3X8duPd7rH+m1n9np7fIJoKTklnCORjuUgsVahBR4nocxGqtTtDbr1g9eN0pdBTCAKY2hd+UuGOQPWM5KtyuZmJC0HyG0z3SU559RlnmSFGHck6IpTDQlJSW7GzMsoNzul87/FCRp6rpxSoESEqUk1qTEcYiOYtrCMrtvr5790Ae1/syn/9nas0/9pQkw/fNXPvvyv/z9H3/pK1957NS5s1QaDerTk1ip2Oh0SK1hYmIKrQ1JlGRNN3JXkpv4rMlMVzHap8Kv21URh5+8HnnTsiROsNZSrVbBWrTWCCkJKj6eVAzCkMFgQKMS0JyaoFGtyN7a2oHXvv2dT6+E5tKVP/SDb64cO/TleHLupflmu/v+RvD/SJNk5uzlS/TXV1FBBV95aGsxjMpULc7jLxHI/ADsSEbtvXgxbvTRckwuKbl98ltVu/AgSOEaoQEyK+hEQKAU0g/WExW85id60dOGahwjH4SMgXptrKsfv0GeVsa+ibtKkmrSisFIEGJRC+9r4SDcE3W7R6v79uEHAb2+608qxXtop1dSUjIWpMiaW+DyH/UwJ1LhZbKGxhjX+MKTKE8RJRGpTvHrNRqNOlIbVhYXWFtYIrDwo0ePceiHf/DV3//MD/+NpSce+8JeS33/1VT0X7zwxMLpdz5/6dL5vWvdDnunp2hMTWJ9DxUO6Gx0SFbXqdfr1Ot1bGpBu26gaIM1GmN09pCfp5YIpHKa5wKB0fYaOzaXJcv+KPxnEUohlcILBEZnxy8EZJKtSZoSmcR5zD1FCjRaE8hKjdNvnyKNk+NHjxz6T1tRf/UkfP/lqerVI4f2/sOPXT568TOfCv7cy9/6xoe/+PVv0N6zl+NPPUUviohTgxUSKwRaa3Sa4ilF1XOpQGmSECURSIXwvIIm+yhBp/jwsZOyjPO87/y+FflZyd8v3XUlJTeNzewZAGuwVjqZQyEwwqAthEmMSlMalQpBu70ZBdW3nzp/ZW3v+cv3v/54zqc/NtbVj98g7+mxb+KuMrBW+KmdP32ex6dq6zKJXrK+9/GqUke9LEnKYLLufeWgX1Ky28hDrspTCKmwKWht0MappsihJ9e4wkQj8CsBvvDxfMVg0CPu9Rj0u+yrBRyfm9+o/vRPfevkT37+n5ybmPgX3c1wTVzZmOzN7ekf2z8bHZKyvicIuBwEdHpd0qVlgmYT3w+YnJwk1e6BII4SMK7bnQSEcp54ZRXWWgwWMl+ztWBSM/QsCyGG6SgCOfI841pc5/KINjv+XMbRSkiNdqNV9nlgWOSplMKTgl5/QLSxQQo0fZ9WGEbn/CA6k8RsfPELenpgTqvDj1+pHDkeHTDi5z60vPr0pcWF/ZfOnpWtqSkq9QapgUEUo7XGU27d2liSOERg8f3AdUO1tygbcx2Kxruh9JCXlLwX8jS6/HeNxcisH5C0JDoGo5mabNOemO4lqXdxcmGzM93rlvrjN8nYDXIxZhf/3cZ6PrLq89xbJ3lOxnEv0YvezEx3dnp6qLTgez7WuNay5WVYUrJ7EIA1BoRFWA+lFBaBtanT4s7yqHPj1miDJaHaqOH5iigcsLayTNLrMdtq8aFHH1t94ulnvvk7H3/ub31rYuJ32kDr5FV/4+VL+vS/Wo/7j02+/OSTj//242Hvs6tvvzVzcXGBhYsXaUxNMjk3x/TkBNZAp9Ol1+mjpMSTHp6UqMyTLaXnijmt2z+tU+c11yZTPMBpfkuFlK54qmhc51rgNku/SdOUOEmcZnouXWYNNuvi6SsPL/Cz9BmL0Ibu+gZxt8PxQ4c58fjjp/szc798dm7+qxvnL8B/+B+hpvYw+J//RvhiEPyj+uHDF378T/zsz33lC1/48T/4/vcP1Gp1KvUmiU5dTrkQVCoBAkEUhoT9PpXAp1mrkWiN1im3YpGXY2xJyfixhbFGCNfp11rrxhAl0UmEpzXzU5O0p2eTDa/a6VZriVHBPd7z+4exG+Q/9uOfHfcm7iraWDwp2DfRoF9t9cOGd7Y+t39lZvIMa2lKGkXU6g00Gm3Se727JSUl2xDCpaXEcQIiBSnxfR+ZFR4arTE6HXqeXd64IBoMWLx6BZkkHN+7V3/4wL4r8kd/7De+8LFP/tqp3/zN7/Cf/gX6QmPf/3ntP/HpQfUX/xqX58Sb/+SP/am/8fH5mTd/1LM/8c7s9BOvXbxYv7S+zmI4oN+epNFo4iuPdqOKtS4v0xpDnMSEUcG3KwVKCec19z38QKK1JUldLrgVzrustUZkXnSHGT5g5Pi+5/TGhURIgRTuGD3lHgaM0XS7HdZWVtlcW+OJPXv4+Mc/nu6rt1+4+tQTv/KFj37gt99p1k5yWUO97l96+Xn7L//SL6TrtQ32ffYHn/f/yL+bPFtv1GZ9/4+/vbbhX75wAet5TM3MUm00XAOhOMFaQ2uyhbWW7qDnJvssbcilFY382qKYRr9NdSanqM1eZJT0UlJScjvkKXDOiZE1SxMC6SmkkoS9CKUNR+b2YJ58NPzGRx5fjmp1/OhB6w45PsZukNd+4jPj3sRdJVcoOBsnnEQmwlMXptYW1w6dOcnahQtE/T6tVtsVSd3rnS0pKbkGicRaQ5pqrAQvUENJwzRJ0DrFGounJJ6SYA29zQ2isE9VCI4ePKCffN8zp2be9+xvv/HJT/6Tlyemnk++9+2Uf/HrpEC64ZuakWbq7/1d2X3f0c7F//Av/MHZg/uuzplk6cjK8udqr7/23MybJ9tX19ZUd2OD7iAkqFapVuv4QYBVgiR1BrXFpapYkXfCExjnLsdagxUglSrkibv8dwqyq0LYLH1OZiktLh9UKYWvFEpIjNYkcUw/7mF1igR8KdhTr9nJOI1OfOhDqwd+6vOvDLza/3lyfu43Xj+6bynphYavf8cnSuQG6I1v/B5Y6O+f7cb79/3BRx97onG4Eqj0a1//aPTi94+vRqEw4QAbeAirkcKCJ5GeIkkTYp3gKR9fqFIytqRkl5GnrCgl0MaidYrneXhSIYUgGkSgU2Ym2nQP7984f3C2o6UEmvd4z+8fxm6Q//b+6XFv4p5grSX1PQxEn72yL3xkaopXzp4ljGMnu5sVEZVemZKS3YRwxq2UKOW5ok3fdzKAUUQURggstSCg4vv4SpLEERvLK3gCnnn0Ed7/xKOvVZ588pde/MQP/d6rE6032q99o7Z58e04gRTQvPQ1OP+66K9fru7f8wPihLXRm5XK+V967rl/+kOXzn31mXrlTzwyM/NvvnP+wr7Xz54XK2trdJa7RNU6E1NTVGo1kAK/GoCUiOxhwWTe7yRJhk2IpJDU6nWk5zkD3YISTgGhcMTOEM90xk2aotOEQEkqnjPIB1FIZ22VlaUlkihiqtXmqcce5ZkTj4YzleapzR947pf+4LkP//M3lbdwCXoW4K/+nQq/8JclrMW00OwDlvEGgRanjdbLgi8/9skfWP2YFT87Z/mj333n1LELVxdYXV9jz759VBt1wiSm093AANVaDWHFMDQ+YqtxXizuzIVZimKQIv/nBlKQJSUlt4rNak0koLP0PlBSYLEkUQhJoq0Q68L3z1CWbdwyYzfIB96D352p0mp2J9pt0IYkjFyo22Zh1XIyKCnZVeS1HUEQIDyJtoYojkiSBCkFtUqVWhAgjKGzvk6vs8n+Wo0njh/tHnv88ZfDj37kV187dvSLl8PNC+mly2FqIx8lNK52kHh9jd7GutWQNBbOBQd/9X+tnf2JfyPqzR1dVKu1xUuPPRZdevypC/uuXDrx6Vde/Ujn5NvvW1pZnbjc77O0usJynCADH+F5eEFAUKkQVKv4vo+vFL6qYH0PXakMpQIFdmhwC+ENe/FYl/8yPHYBGCVJDHTX11ju9UjjGGEMrUqNpw8dYqbd7tRbrXcOPPbBs95HP/7GK08eORXNtr6RxvHJwa/+U+zJk6o+M1tNvvoFm7CcAoYAqAEeFiFsKoWJAdsdnPQ+9Yl/umdyYuPx3/nyH/Lt99+/sLww0V1bJmi18CoVPE+BUni+h02zQtptDZCuMbK3UXxrWMA6rGItDMPleFxSclvkhd/gHJIuf9ylq6RpjI4jRKpT63tviyA4QzYeltw8ZafOO4D0/SWvWrkghdhntfZsmpZyhyUluxSXBiLwPIXFEscxSeyM8UatStX3QWuifp+026MhJc986EM88alPvdybnvxfX3zy6d98sVHf2PO9r9b2LF2ob9aavTTSNsnWr4E+oCqtRJ59C/WP/ueG2L9XiR87SiVOON2eeOsr+w6e/PTaytQnpqc+W/+xH/upuY3Oxybeemtev/KKp5eXfV9JX1ujdBQSJxFpNMDzfTzPw/d8lFRUlCI1hjByToC8U56QTqWFLH3F2kIeurX4UlITAm00YTSwNorSZqMZHTlyOHn26adqBx555NVeo/3PNw8986XX5ve+/g27Hk0moT1x+iz27/xviK98RTXm52S/X40T5hJYA5O6+IBFu8pSxcz51cbsG+/4qz/wwe9X3/++xSdjfW5qZupPvfn9Fz978colwo0NQatJtVZBeJ4rqh3u6/Ut55sZWUtfSEnJnSUvFM8f9ofdfQGdpEgLFT/Q1q+cS5V3ntIgv2VKg/wOYIS8YpR3SgXehCdpW62z7nTllFBSsptwzStcE4skSVzuchITBD6tep1apUJ3c4O15WXSKOLRyQk+/OijNH/kR/5/r3/qU//b93z/4iUhOpU0MfH01GDi9VfE49/6ffvyqyc56TYhyWTAZSQQqZcS1LpWKSOA2vQUrelpSBL7/N/8f6+9M+h/iX/wD197QvoHnvi9Lz/52emZ93vrqx9OPXV4MxxMXFpZVVeXl1lcXWN1aYk4TgodgAWe5+MFAUK6vHijXSjZqaZkeeTCpbEoIbDW0K432Dszw5Pz8+x5/PGk0ahdCdqtl5iceqU2Pb18+dDRM2cOHDtz+uD0+Qtvnw3j/+6/Ye3ll3i13qD75pv4vpdQr2sSaUcFp7jZxMPJuliLNz3dF9W63vjWS81DjxxMj33mk9/1Dx66ENdar8++/J0//cbJN5tXVpaYmpvDl5I0SZwOo5DuBIpt31u2NekOfet721/L9ci3D8Gln6Sk5LYQUroGQJlsbN4PAWtJk5hAebSaTS0q1aVUymUoy+huldIgvwOkyjtvKrVXGo3GE7V+r220xuStoktKSnYXUoKAWKdom6I8Sa1Wxfc9knDA5soKaafD8akpjj333Gr42c987ewHP/D33vK8by9duOBVw0js7XWZOPWq2ff8a96+V9+qJ7GfhPPzydXmqo09p9AS+yFRq2JtZTL1a22i1PLa//Uv6PV6MDFF7zvfsb0wXOOf/Z9rRz75mTf85z7xndXnPvqMDnvfrW2sH26ubxw7ceHCvrkLF4L1K1fqnbX1Rtzr19IoqmNMBWt9pXzPr1QkUmCsk0K0xjiL1BqQQgsp+0KprlCyZ61Ja1PtzsShAxuzjz6q/WMnFjvNqTfD5uRLkeef6qeDpW61tjmYnjILQDfqwosvEL/5JnF2+rxW09pKRVtVsG5DYAXoAm9dgX/6K2ymvj39/VeS6MIFU/34R83kn/iZtbceO/LG4twf3jh2YLbl12ufq7/+6vzi+jrhoE+91cJIO2zUVPq4S0p2H05q1aKURGDRaUIax7Trdfbt3WeYn7scKHn18bU1G/kefvoA2eXT462JLA3yO0AaBAu62TrTaLUH9Y0NrNEgLQJZOmRKSnYR1kmMYAUYY1GeRzUr3owHPXpr66SDPntmZ/jUs8+if/iHv/Jbzz33504qtVhdWKg8/cUvtlpXrkRWqWT/q68ycfmy169VW0dOPNrz66vJ7+3p2biepW+ImF5XY0NLtdbGrKzyzb/zd+GF5/PdcQU2/86f0f6f/fOs/sX/rvPFPTPfWfLnn5+3tvKhlZXJx6en988fPjx/YGNzvxyE+2Ucz8kk2Ys2EwJbxZp5q81hCz6ZgooQQiNEH0EXKRetFIvWUxeMJ69YIfrJRP1cb+/0O5vHji+emty/8QoyGiASsn4fswn2eAjVgNwmlmxN6b6WXvYD8KXvw5f+PZaAJecl26y+c8pXoj7xpT/xR9qdo/tfbHz6U//5iXo1afn+v/u157/LymaHdqOJkS4/1eQ58MVt5Pmr29/YYdlRDv27XxMlJSU3gXUipNa4hDClnNNRpykmSZiq1dm3f7/pHjq47FeC1eeuXr2nuzsW7neD/A+9dW7cm7hnGCGwQnAw0Wu99tRlKpXYl05SLM0ky8q0lZKS3YTFWD1sglMJfKqeR6/Tobu6AmHIo1PTyQc++rG39v/Rn/7dy4cP/7PmqVOb/okToFTsxXHHGwyM8Ty8MCKITGoC0Xlr5kr85tRF+tUowMOicCnlN65pNzhjV7355d81Fxau2E1rUv71fy2Nfu7nIr9a3VyfnLz6yoEDjdDSqiVJU1hbE8bUsDawWKWsbVaNna5A4AmMRAgNOhIiGUCUCLpCyoEVbFohulYIrQO1mVSD9W59MuwnfVtZeN0zJ/9vG4VLho/8+5b5DziPd/Gk3R754GfS9sRmKL3I+x/+h7h74oD99v/zP1k++5nP/OKedvvKc3Nz/9aZL//ekedPnWRidp7JPXtJjCG1Fm2yMVSMVujSzLOma0UjfYcdFoV/bXGPhguWFntJyc2Qyx5qozOVKoU1Bp0koA2ztToz8/Pm7UMHV1cOH0rq6xs3qsMu2YGxG+SPRMm7L3QfIyzEkxP9jcOHluaOHonjpatc6fWQlSp+tUqaaoYB2NI4Lym561ib6XAXtPIE4CuFTRI6nQ5Rt0NDqXTPgQNrj378E69M/dAPf3H56NFfXl9ZvTh16u2pxtQUvWo1TCuVKK3VsEqRVivg+6m0Ir1QXeJcfUkSI0myYibBu2VRWpxRrhZOnRScOmkBT87PUfm5n0urQBfiNycn475SazutQAAB0ACq2WsRrqg04t2rqqphVx0893yl+41/ZK/2l2KOfV4z/4Hr2be3jALRAntw0IsmTr0eVX/5n3g885h38c/82fRqo/nW408//bffp7XXWF356UthOBVrPTNY3wi0kshKgO8HzmNuwGTGsxQCJRXWWIw1Wb3O7e5hSUnJTZF5yPPCzrxLp9WaQadLZW6e9uzsypXJyfU3paIyZm/yg8jYDfKzTxwZ9ybuOUng02gHvafe/6zm9Du89v2XmZiZpdFqkSQp2phhIw4p5VAyKKcoJVRSUnLrjJrgiC2vFe81KeWwM6XA4ivJxtoqq1evMtto8PiTTy4/9dRT/2f38z/xf3/r2LHX/K98RctzF9rm0MFN2Whq0us4F3LDO8Xg7OBb2nVcgkvOLSVcKpzaYB1nmAtGTnkNw7zv6yKkTv3mwDQqILF4d3QQsi2wnwM+8NYrrJ59G2+wqanVQQhqbl83zyj5Dw6///1vfG7vvo9/62tf/dwrb755LGi2mJybp9lokRpNFMXYVGMB5fv4QYBOU9JYZ07yay3yoUc8F5gpLFLa7yUlt0auXOR5HtoY4jim0mwggI2VFcIDB1b9evO7RnmrcBNjT8k1jN0gfzXwx72Je04f2FsNus+2W2utwCcOBxij8ZRyk78VpdFdUrJL8DK1kUG3S0XAYwcP8MzU7NLExz7+hVd+6sd/5VJ74pvhN7+pG1/+ranm1UtKnHjUTC2epVWtUzMab34PMhxQq1YJlEeMKLqQ3+sNfsufFzf4ualPC1yHD3Frm44Q1JF8GJhje5aL+3sGeD+Ig1EEUWR9sFQqUKnQff55Vn/zN+P0k598i2fev+RNX11+/2Z/ctLK6Qv9XnOj31MrcUxQrTkd9qpPGEXEYYwwIKXAU8p1Mr3OeYEyZF5ScicYRvmtxWIRQmZODrKoo1yRnn+GiYlNzp/D/qN/DN0u1Gr3etfvHP/tfzvW1Y/dIL807g3sEqy1vW6avm2N+aiSop1do0ghc1GHnT4z/L9MZykpuTNs95LnrwkhkAJMmoJOkTrl0N59PPHIo5t7Dh/6v9958sn/z7dqE9/vfP9VPfsb/6KlTr1sWbycJCdfs0GvS2N6juiZjxHN78NbX2NlbQ0vChFeHfkQ3r8aQ4WUJ4BHgM629wUuZWYZxCbYHpnRbgysr2P/8T9m9W/+TTb+6/+aKz/xU2uhX3tp/w9+uvLM4UNi8pVXf/SNN16fu7y2itWWSlChVqugE00/HRDbmEoQOGUcrdHWXP8JZMeuQDeuUS0pKdlKPoamaYoV4Pse1mgE0G61qDbq3VSwWPW9AS99H37hFyB+wPzk97tB/vAgIiPVGaS6pIRoi/wpUkqnm1sa3SUld53hPSdElnss6fe6SKM5tm8/zxw9cWrq4NFf+eZPfvI33xiE33/sf/xb0VrUY+nQVD9dmhKdt0/bpfNXMb0+fn0RceoytlJFJAmvrq3xRGua9z9yHF89+B2JR7hzWqFLh3V+C0ODrXk3+VIGlzqTZ/UsA7z4Ivzcz8G5c4TG8K2/83d4ZnnFnvhTf2r5qx9+5vfksT3Jj0aJmY6TH31h8cqe5fUN0kEIQQVfKaqVChL3XWILEjAWbMHLbwv7iutlWti30hgvKbklsv4NJrNlpBSkWmOtpdWsQ6u1Hhh78ccvXA6nz13ga9aWnYFukdIgv1MIBomnXpfVyul6tfqkwJKmqRPSFwJTyGUtDfOSkrvDqLucQCqFUopet4tKU3P42fm0/tyHvvr9/Uf+wQsX9p8Mv/gWH/jVr/tTrcSqTz6b7tWbbKgO5zd7whhrBxtd2OhuWf+qqrlmNfJh6zsgUKREGC68+8Jbrd/VVfj93wcQBuitrNjLpxeocSA9nzZTO1H5+umPf3xwdGqy8swLL/yxb7/0EkvrG/h+gAwCqpUKRhvXhdTozAgv9RxKSu4G1hqEcPVw0aCH1Al7pqdpHD28uGn1yeTv/t1u9IXfAK3fXS61ZAsP2ywyNowQUVjxz4hW49JEs4kCkihyKZpZk6BikZktDfSSkruGM9lct8pkEDLo9eNGUH3+6pMHv/GFp45fXv3b4P+/VGUg55tNwuDxb77Ck2tvs6e6novulTfp7XOjSVkALJk2r60dIvgqVfGqH/3u4yf+5bkPPPG9fZNTPZGmdLsdwigaKjsYbdCpRmsN5mZy57e+WloIJSW3SEHKWUo3Kg76fWySsmdmmtqxo+una5VLv/o7X4y++eLzGGMk5bh5S4zdQ/6jtyw6cP+RElBXqW7MNq4MDs4vz83OsrC6QRhG1PwARN7d6lrjO/feQVnwWVIyLoQQrsBaCidkrbUV1vSwftciI+QpmnzRqygTzrSjuFK/yFS7V7my5glEHHEdG86TkkZQIWgoJ3XSJ2sKdDeP7r7GAkQXuiS/fhZvMxB8UMT22X2YqpJS60YaxxhrCSoBUilSrYnTBCklvu9jMBi7NTg+0h/PU1Us5ZdSUnL7GGvAgpISKRXGGHr9Hg3f5+jcPEsHDnS/c+LE+upf+Svwf/wf8Cu/YtC6NGpugbEb5JO/9k/HvYl7johjdLudnvnQh1aqz7xv9cjJ82x2eqz1e1TqdUSWX1qUXyuN75KSu40F67pzCl9LmcTTtpPO0Kci9r6e+HNfNyvRWkjviq1WFsTqUqCurgjsDW7WXhxxbmWJddmHSaAJ+Ly7AHgJgHVT0Bz24jH0b3TRiypVYd1O/Sz4SdwaDHpYLJVKhUq1ipWCJNZoa/GUwvN9kjRxhaKlvV1SMjaMMVhr8TyFVBJjUsLBAKRiZmKCK632xuLsLHzmMy4t7Vd/1aBvScX1oWfsBvlv/Uf/1bg3ce9ZXMR+6EP0/t7f4+NPf7D3yW+/xJlT7xCurbsQa8EDXsxphTJdpaTkTnNd+9k6P6nneXjWekrpw2IlPkiM9Ddn6BkvfO3qK9ZeXEAF0gqRRHHqmtJcj4XuOl9+7RXiJIX9wKeAPcDgzh/Xg8k88Ldh8EchjiARiXfBp/k6qMbAS2xKUA2oWAtSklqDxqJ8DzGUPLRD/3de07m1gBMsRakrW9ruJSW3yNChmPVT0RrXqdPaKBXqtJHywW3LfpcYu0HeuXR53JvYHSwsQqoxzdZqc2ryvJDycBxFmV6n2GJ4538X5Q5Lj3lJyd0h088VQtsWFVljhjSOXqG38g0bsqoMWFJTFAi5bnFSYjRJlHmBetknysqcW8ADDrqIgqm4VxJop4iaFRIlEb7ChJYwiYiNxWDxg4DUGOIoQQ3H13IMLSm5e1iXvlKpdOJG46XDg/jsB159nbfffIPuL/1jSu/4rVOqrNwZBNZKLNrCkvbU91Jsw2gzIxBbvOLbjXOA7Z07S0pKbp7rRZm23FPGYmWm+49FW4s1AjXh4x/ERvYV+pzPG10atiadyOzv8ia9C3geYqJFUK0ZlQCJMcRpSpQmLj1fuIZraZp1Cwx8PKXAFLofF9Y3zB4v08hLSu4M2dgaeB6qXh/0W+23Hx9EC9Xnn2fjb/51uq+9co938P6k9OXcGYrVxOtWcClNk55JE6QQeFIic+k1KVHShXxc1yvy1Fb3q8haPG+TC9jy0u215CspeWC5XqRp9LCb5zI4OdJYpyS+FHPaq7x/g9aESzHJ29gXXTs2+7vMCr9LBCZlJlxo+r3FSqc/oDuI0EClWiOoVJHKBSykFHie5/SRbd6t83oDosm0x0sVtpKSW0bgCuJFLnsIvlJILMaYxEi1LObnOt6RQ4h69V7v7X1L6SG/MxgGA8HXvkriyYV+o/V8bXb2B9pXFw+DRWfdrJQQSATWWNf62eaCasLlOV6ndXU+xZTTSEnJrVFsDASZ69s9DMvE6CDWuhVbRMEC38nwLm+9O4CQkrln3kfr8BF0FAJrwKO4KliADuGGx74PDuRkdbPSX172F9fWwfOpKA9js3QjYTFaI7D4vhrWBry7X6L8GktKbpe8GZDyFEkckQz67GlPcOjRE7E9dvDK6xfOrL39W7/F+sIijKKKJbdAaZDfGSyrq5b/8X8kPHt2tfPTP/3y5COPrOy9ukCqNVEUoYRASQUGjE6x1ukiU1A5tgLy3lYWgci60Ak7MspNFnvNpxZRusdLHnKKXvG8NqOIyB94AW0swvOQwqLDmEuEjVcmCXVtGHsqrbYxIZTi6X/z3+Kpn/05BkuLWGtwI5wHnCK3rGXg4VUCsXQyFWubHerNFlYbwn6I5/tIJTBpmkUbpSvqNDub5BZGlZ7FJWz+V/l1l5TcFMI9VAe+z0Zng/XlZZ575DhPffTDSefpR5ef/9/+j8HLf/0XYWvGQMktUBrkd4o0haUlkrOnw4EJN1pTrXh6coIrvT5GSIJKbZiWQsEYHxoPN3n5llNIScntY4XFSlfykViDtEY0QW5kb9/bvXtwmXv6GZ7+2T/J0R/6LJVGAyn2ZLl5KdABYkAiJFhrhY6kp7WViTYgJEIKjDZgBcJ5LhA2Uxjf8q2NBlKXAjhKURnmkZeUlNw2UoBJU9IwYqpapTk3n741vXdzoVLLFynvsttk7AZ5/bHHxr2Je4/W2CAgbjRJn3qSVWuS/ZOTZs/MDOdXV9FC0ao3SVPXwEIgEFkOubXGNSpxM8y9PpKSkgeYzIsqBFZKYmupJYk8BJ46fIT+wYOo6WnI+gYI3yddWiI8e3a71Vdyi+z70If56J/785g4oXf+HEJuL19Sw9+kh1SeCQTW09aSGJulq4ihvT2MDBbrA0pKSsaGtXlNDlnKraWmPHSlunEOMVjyguGilDflbTF2g/zYX/2r497ErsFKCe02y/Va9Oi01Wp6ijiM0MLDUx5aJ5Bd0JJsgjG5jq51LaDlyAd+jdNclFd5Scl7RQiBBLQxiE5HtKxVR//8fwD/2h8dNvFCCII9e1j8+3+fM//xf4yJHvyOw+PEDPokS4so38czGsz1JdEkVkisIk2kTtMsiU8ihBwa4q4g3rhmJWV0vKTkLmBHpraxoA1YViMhX1uBbiZyVOaOvwfGbpBvfu5z497ErkEYQy/VLHc63Y8I9XYtqPTjcFC1KpC5qkqxiYVkpAAhSmO7pGSs5PeXUhKBItKaVqerJjY3AyYmUCdObFm+CsR79gwLQt8Vg8u8GAAh7iYfaETYgTTiQUmrTMIB/fU19j79DNOHjmDS5LqyrdYYkkGfQx/4IHazg/U95Ls83CithdS6oqPIi5MEIxV4aughd9n+IlOnsgXpqZKSkvGRKVlpjbAWX3ng+2+lnvdCCt1CYUaZWXubjN0gv+A9ZGnqAYh6LexsrL0wIcR3hbEfE0LXwEkFubxxMsNcDH3hApDiOnrkpbFeUnLT7CSBaC1YYzHCOk+rMCTGYLtd2VxYqLCxAXFcXAnVuTmqy8sEjQZhGBK0WtffaB9oA63sfw9ikeDJCqa2F+XXIE0eiNQXISSNyWne9/mf4tmf+sPE/T4mTW+wvEAnCemgj+6PmqFdd3mtpdDaN1GskiTBBHLUv8GWY2FJyb3AFcdbkjRBCWg1Gohm+3Qk1BsiTQf0elv64ZbcOg+ZtXzXsNrzLtogOBv4wYdSY9BpmnlzRl7y/EcIhpNNPt0UJ52dJqDyqi8puZaiMb6lO272v7UWKQRSKWKtMYO+qnW7FZEk2KJBDqgo4sCxYzR/4RfQUYT0fa6LxrnUp7P/NWgsLS1JTZXjjVnMm6/xyqBP904e8D1g7vgjfOLf/rc5/MEPkmxuYtP0xg8aQkCSIPIHknczyLFCYD2dxCpJU/D9YR8HyHJYsyVL87yk5O7gZMgtaRyjpKA1MYF3+NgV/faZc9W/9tcS9S+/TH3UWK28MW+DsRvkj66sj3sTu4pEKXytbdXIS3Zi+uzszEy6ubFBFEagsrCrdCa5Me66lUIghUA/AN6zkpLdjXUF1cYSJwl6MFC1Xi+QaSpNHG/JfbSbm0xNTrLnx34MoRTW3CA1UuCM8ij7X7i4VyIsoUiZEz7i0kVOxfF9a5BLKWnPz/PUj3yWx3/gUwTVGp2lxR0KNK/z+ZvdDkgFgU1TlaYpKn+IktI5MawZxhZLSkruDlJKMJZ+v8+MUhw9cIDlZ59djFdWL7//q18luXxZXL8ypORmGLtB/tkzl8a9iV1Jrd5Y3Zzdu7xn335t45gwCvGqNfA8wBnfksyLJ0b+nqEQBFtLlUuPeEnJ9dmeBnGNHnmu32/zBhcSbQwmSYRIEk9KKUmSayxu2+kQdTrvad98wMzMEAlxX1c7eZUKn/53/gzv/9xPMOh0SLsdFPaGBZq3gzRCSCN8q1OltXEN1ZQr6LTG5awUveUlJSXjxjrBCSsIwwG1VouD+/fzrScf6/cuXuTzvs880HHuiPKuvE3GbpCf2j8/7k3sKnJDujc5udGw0eUjJ05ou7LCm2tr1HzfNbaQEm0sxlrUMMSO09h1vWkz/dytmrolJSW3R26c58a4MJZUa3QcKy+OKx5C6SS+fiL0e8SsrdFuNvmBn/95Xv3CFzj77W+Pa1PjQwiaU9M0J6aI1jcwxrxrPvjtbcZIIYyPscpikUIipUIgMEZjrcGKsiVaScndwlqQQmLQhIMBstVianr6oq3XF08K+F0BPwT2faAt2LENpA84YzfIv7l/btyb2JUMgMfmZ1Y+dODAYKNeJ7pyGb9Ww6/VkEpiMBjtkiGdtqfNHOXlNFNSMg7yEo08/UFrjUkSqbT2lNESPb6Aq+l0aLZafPSP/THSweD+McgtoDUCmD18GLRmsLaGNSYLOozBVeAEj5U1RuYqKlI6D7kQ+r6OMpSU3K/kksxR2Cc1es2r11+oBv5VrOUVXCRQZV1VSoP89hi7QR6OewO7mETK0PeDi1KIo2maYoyL5kglM6VOp/hAbpBb4dS8rut1KiawlD7zkpLbIlM6MtZijBHCGCnc/+PbJGDTlGhjg6TXG9t27jhaQ7/HE48+xqf/8/+S1twcg87mWDeZ6aZlfUhsZoi76KHLIXfRw2EBb+nEKCkZK04FzhWq6zgi1ulG6qtTFlYBsJY3QVzcIk3x4PG/jnn9YzfIH9Qv5mawUq7aWvVbibUHk8HgaOB5eJ5HNwxBSJSSQ0+TlBKxo7dp+2TzMJ/RkpL3jpQSiSVNEmKtder7kQgCPW6vjpCSfpIw9cQTPPGTP8n5b36T/vLymLf6HrEWkpSpPXs5+swzRL0evbW1my7kvB0EKAE1m6aBMSbzzEGapljjUlicKpUtdchLSu4AO0nFisxxkYumJEmCMZpGo0llemY9qdffPLq2srZw4RyX0pQ+Tv215PYpZQ/HiBVyPfaC72qhPiIFRyuBjxAQRRFBpYr0PNI0RgiFpxTW6Os22Bghbko6rKTkYeLd7xsyDWuDlAIpJDqOiY3RSRBEVCpjN8gB4iThwCc/yfTTT/N7//1/z+mvfOUubPXWyM+kBy4AXa9j0oTe4qLLwbeWcab3CCGkEKJq0tTXxrgoIpAkCQiBUhLpmhyTe9DL8bCk5PbINf63G+PbC6fjKEQYzd75OaaOHu5GU+2Lzyxd7fin3+HXk5iN0lv4nikN8jFirY2s0cu1aqXbbjYxWmOTBM9TCCkwI0FdtzwU+njuNMEUFy6v/ZKS22PkDbopQ/4O4nrZOZnTXYl1zUb7dXjqwmU+cf4yyc//20xVa6RJMpYizhvuji1qTW3F9VnLW3duLYIvKSm5McVC9xshEAgpiKMUaVKm63Vas1ORmZ1asUeOheLAYfBu0KOh5KYZu0G+d+3hDGIMKgGtXhpuVCYuVg8cXju0ssjqYEBiDLVGg9SC1no4oRjMsGtnSUnJ+Cga4sJaIdNUyTQV8gbdJu8kptNB93rMP/ooS2+8QW95GTNGj/PNI8BTBMCeS8s8+dob7NvcJP3kpwitJdzYcEvdHaN8iyU+NL5LSkreM/n4J6Ucese3dja22Q8oJfE9xWYUIXXMoYMHmDh+YnB634GlM/2lZGHzNNHBFoQVmJy4V4f0QDB2g/zZM0vj3sSuxAqQQsWLk/svto49unZo4TzLJ0/Rj2Oak1OYJCXVMZ5y4VhjbdnsoqTkLmItYIwQWiuhtRB3yShOul2UEDz38z/PxL59fOWv//X3rHV+x/ADJvvwzMvfo9XtslKrw6Yr4rwnBnGWlmKLY6OFba+UlJTcIkUPuTFmi5FeNNCVlAS+TxrHiCTkwPQ05uijyUvTezeXv/T3SF/7dcwPH4YfOlymjr1Hxm6Qn9nzcD4xCWuJg4BBtdL/gfjwxqHTe3jhtdfoxwme5yG1zjrOqWH3OUl+PZcXdUnJ2HEpkndFZaWIta5baHN6mtbcnOuAt1sQAi+FWr+Ln8ZEgX/P0uOcUWCGnrpsB4fvud0VpcpKScltUnzI3p6+56SYJUJKpBSkcYyNQh0EQb9Xb5xckiJM+l2IBz57Z1KCiuUujaEPKuNvDHRgctyb2PWks5NLE+2JDbSZSMKwkCGea4/bYZMNUfrJS0oeaHKFkHB9HR3HtPbudYawUnRXVu5J+orJ9olej2YlJgkqpK5q8q7vC9vSVUpKSsbDqHjzWpxB7sYAow3SWEDGiZTfiqR4IQXX2VDHHhurKVLd3Z1/ACmLOu8CWsiLqVSvIsT7hTFNm6ZYbVxnzkL+limoBWyfjYq3TDlTlZTcLgW5PFyzCyuEtULcQP9/PAy6XaaPHeMzf+EvENTrrLz9Nt/4y3+ZjXuQvhL5Pn6a8umXX+UDs4dRWOLAvzchaClACiOksLmxkOeQl2NfScmdZ0vEadioUAyjd6nW+Moj8FUqAv9sqtQFQNNblKyehGSW0iB/74zdIP/E5fPj3sSuxUiJlpL9vc0LSbX6Uq3ZOl4dhM0kirHGya+R3wD3emdLSh4SsrYyrqBJSmuVMkYISxCg6nWEUnfFM2yNoTkzw+z73kd7714ufOtbfK/dhsEAC6hmE5Wm4zWKs1UbK5GJ4eDyCgfUKgvCkl63N8J4yfzyGsqmnCUl4yQ3xK+nuCKkxBhDMohoVivMzUwlamr2nahSPwsYCA2ilyKqIEqD/L0ydoP8k8+/Nu5N7HoqrebixuzM25P79vU7/T5RGGKkxPO8re2nhSsGBYZucFH4PZ88yz6dJSXvDdd5TiCUslYpTRBYPRiQrK+DMXfVM9y9epX+ygqrZ86gowikRMQxyfo6dnMT22zCmPLMh4VbSmGDKr16nW6lgkm67v174CHPIhYGIYwzEDIvuRDDVD9rKJP7SkreA9ubARX1yIsecp3E9Lod9lVrHD56XPcPHb6yXG8sEkaWbmIZiARPjm2MepgYu0H+Wycf3qcmoy3aGJ756OzqoeNTF/YeOTLoLi6wnsQIzyfw/W3FSVDU082nQpFb4Nn8Y+9BFLmk5EFDSYn0PGN8P5XTM6b/0ouc+6Vfonf+PH6rdXf3JQiINjaohSEz3/selZ/9Wc5evUr48Y+T/sW/CFNTY9luSsqG2eSR6U/xaOMn2FN/jIHt39vws1QWqTRSmaHHLjcWAEyecmRLKcSSktugaIxvN8hNVpiZG+SxNvR6Peampzj02KPmW889t/TK669o+1f/Z8WrX4euBW+zVFi5A4zdIH91tT7uTexeUgOJQQQzXf9Y5eLM0SNR9623WFlaQrlw+bCAa1cpLZSUPKhYO8xHFgBSWhMEqZqdMYkQXH7hBVYvXaJ6t3cLUEAVqF2+TPprv8YiEG5sEHzkI5gf/3H05OQd325gBPujCh+ofJATrccZpF3CtD/sjnlPsJnWYSbFJoQrfs+jhSPHRUlJyXuhaJBLKZFSkmrtmpdJiVIKnaZ0Ox2qUjE1O39leWpqpbd4Ff6vfy7QWgIGont7IA8I4y/qDMa+hd2LBATyclWaeqO6+dHJdjpVq2G0Rlp3A2ijh8Wdw9QVuzUc67r7sfXvkpIHiZ2cK+92oe/kkSl8Ruz0IgJhQWKRWKyQ1nie0ZWKFb5PBagBlZvf8zuKYZQ4rYDma6/R+JN/ktVf/EU2/5P/5I5vr2UqfDQ6wKFwjQ27CLmIoL2HjYqMACMM1lhhDcLmRZ3gWnlnKuTDF7NvOosiOuVYu+XlkpKHjut5rAtOCbPlXgIrxVDhX0jh6tysgTgmiuPlUOsXDXSye8tQ3l53lLEb5MfthXFvYtcirFbC6vpVc6hzXk1tfGJi4vWqpz7YWVsLJpRHxffR2pBa5/YRViAhM8wzP1B+ozC68rfklZeUPEAMJwOur8a/U0dbISVYCg0uLEo6GdF8WSUFSgo2+11SnXBwfo7ZmTlUhDj3j/4J5/7ZL9NbX1MWSFxR4T1HAMpaqv/gH5AIQfTH/zhm//47su7DSyt84OwFZmKF9RukuyVKJ73ECm/dr1T69VoFbEKahIDMwupA5sG3dmsh2lCVPBsw7Y0upJKSB4StDrx3v+ilcMa2STXWGJTngRQYq7MiNYsxGozBEwLf82Bq+o2o1/+S+Vt/e5Xf/iIYU8qT3mHGbpBPvf2lcW9i1yLjRMo49hZX99PnkZ6t1r4thXxGR9FHbJoKJSVSKbAaYyzKbs0dz40Tm00sVpTGeElJkeFDaqbhj7BYozNLTY2cRAKkdBNLGkWYOGK63WZmbp9dtVW9/FtfYv3L/5IaeHXn+dkVBnlO66WXmL56lZX9+1n/43+c5D2ur5nGfOjCOT5w/hwb9Trrrdo9UVTZCaO8JBVypdJodCeadSKTksQDfL+CkMrlkmfFZ45cN6ek5GFku128c2yw+M6wgDPLF5fKNShMjXYPsZlBniYRgYC5yTbVvXvO9fv976X/+//e4fXXdlp9yXtk7Ab5W7/96+PexO4lDLUYDAadP/QpmvxoorVZ8D21MjXRxvMkcRwNi5VMXliRhdRHsVc7NMbz206Wk0/Jw8A2xaEdyXKKbVYLLQRIoUDYUR50FpYdqgcAvlLUfB9Tb+teaybcE1TZC8hd2pRGACwtof7cn+Otkyd56S/+xdte18H+Bp+6eo59skvv8CRIhdolBVlCCmyKTnp6IJVMqkFAarVrnFZwyBlr3VhZ0CbP/YIS58zYdV9iScld5HoDmbO3LcbYkdoUo8C8wBnoSgjiOEZaw/TkFI1aPU6TtGeNie/iYTxUjN0g7y4vjnsTuxkDRJPnLvDkwnpaSeSpeHbvmYMHDrDW7dLv9QjqDaQU6IK6Ss7umCJLSnY5lpFUoXVGnTPWyIxxgzXZgy0GazUCSzsICGcmBq8dnNn0mlXagNnFeZFCa6qrqwz++T+HvXvhc5+Dm01feekqfOM8VALStRVWz59nBehVK7vGMw6Q9lPax6f03h882KkenA8nXm8y6GyQpCm+ZzORcos1xnnLpXSe8l10DCUlu5ncILfG2RxS5AITKUYbhBSozCDfWF+nrRSPHjmCPXS092Z7djX5Qz+ZqiOPETSa9/pQHjjKTp3jxx6/usQHz1xMo2rr9ODYiYsHVhYZvPM2y50OfrWGyCTGrskTL/xeGuclDwM7dqS9QTK5KGQtjOS7Rlr9zgB3Nnauqa21RmpNVSrWJmrrb81WBqY1LOPctQb5kBdegD/7Z+Hv/334uZ+7uc/8xlvw334BUFzF5+quHVF6TP3A4/aDn/tgb++jB6OpbzZZ7KyTJilD6ZvCICmEQFpbrIcvuwmVlORsv83z+2RobIiR4pSxGG3wlIfyPJS1DLo9Jht1juzbxzsHDvdfPPZU33/fR5gyuyqj74GhNMjvAufnpui/7zHTCYLBoypeet+Vc1w+fZpOt0tzZgbpea5rYJ6qss0eGAoGFBoDlZSUMLS8t2jp5t5xDMZYjDXOSBfOe260JkliY6BPGC4Dhv/iv4Dpafhf/hfD8vI9PKA7zJkO/K2X4Z+9BeTa6h5Ow2U3Ytn0WrwwMxN+vDIX7Wu3ePsixLGLkksBRozS+6QQWbL/7n6GKikZC9c1BkbFzdtTurZ8XIwkYI0xrsBTSHypQKdEYUji+6Zery/ZuckLvUMtpHIqVOUdd+cZv0H+wz889k3sWqIIoojl97+P5YbTf9w3N70+PT29UVFqMgpDdJKi/ApKSdAWTHmZl5TcEbYkRQqElKhM+1/HiTbWXiJJr2KM4cAB+Pznndf5QTHIVy7Cv/gy/NLvwuIGMJO9sZvHmFWhZcOu+5J0Yiaebk8irCWNE6TItJKxCF36wUtKbpvcOrfOU5GnfQkhXMM0XCRRaI2QasNW6t+1jerbKBeBGtzbvX9gGb9B/su/PPZN7Fry3MZ2e/SSFGtGqTeklB9SUNFpisWilNMkN1i2iI/lxWr57yUlDzQ7Jq1cR0PA/SVFwUOeRZisxeWN4yQRpcoUjTJdXWuMMcg1K+Q6D+qd9T/9Ivz1v4FTVgfYJbKGN6QHNgH+PfygNajUqk7OUuusc2AmZClFVpiWZRgVNcd31KIvKXlwudEAtpPmilOkklis0yLPm3ABCoE1Gp2mVDyPWq020JXK26lSC+M7ghK4Gwb5nj1j38T9hBViCc97qVqvHaxVgkPGpBitUZ4PMiu0sKMMWPeh7MPbE8u3rHjsu15SMj6uJwfwLowaxuRGucjyiS0mVywXAiFkVvupkUriBb4WnnfVSLFEnnZ84AD8Z/8ZXLwIzV1csBSGUKvBBz6w49u50ghr69kr95U/y8LAeetUsCR9/6y19oDV2s+bmQjhUlXyhp723azwcmwsKRmJVmXecZm7L4YFnk4aVkhBmiTEYchEs87cvr19OT39tr54aZG3T96r3d8dfPazY1392A3yVlqOhgBWCPoKfPylqDHxQnNm7mPTi4uHYmNJk8QZ5G7JoT1eendKSm6fvAOdyKo8tdXEsaXqB9RrTS3q9QuJ8i4jsqTkffvgz//5e7zX7x0LpICdmYFKBWZnQe3WnPFtXLninDhKoq29qJV6VQomFEy5KKFLih3JHeaOi9yJUVJSctPYvPNt1plTSISAKAyJ+n0OTk6x/9FHw87Ro+c3z5xe4WtfdmOJekjLD+93g/wn1tNxb+K+Qfs+E2l1LZk++EZ1z4HVmYvnWegP0EmMrVZcCDbLTZF5UQYFwzx3mIudneYlJfc7WxNWtvafe9fPDj3hFoMZdnEUUmAF6FSTJgnVIGBmakrLWuNqIr0FdlkToFshN741I894DGwC6X/wH8BP/zT4/vXbaO824hjm52FyEnvl0rIJvLNKeR/2hERasNq4ng1ZipK1O4yP92THS0ruFduS+Lbl993wfsgMcoRAZjU2AoijiDgM2X/wIHMnHonOPXr86lJvI8LzwVMwdCCW3EnGbpBv/PVfHPcm7g+sRfT7rH7suUH0g588tW/50bUDb7/GShgySGOMTt1Taq4awcjvU1JScj1GHlMY2Z1im6aAzSJRaRgyqxRT83v04pNPXFw9dODKNIgYuN+mGIsbwGs4QzzN/k+y3zl+3P3cp2hYSoLqOYMYSGOQUpAag9EaK3OPfzlKlpTcKrmi27BZmnXa454ryCEKQ8LBgIlalcrszMpbzcbqRSndA7PxyqfeMTF2g/yLf/m/Gvcm7i/+9J+Gn/2Jjc8tHoj2VusIYzBGgzXZtHL9trf5a+W9UPIwULzObW5oZ9q57t/CEtYipMwM8p3dQtpo4iikXq3RmpkxVx99ZL3TrHP8Pr6l8tGil/2o7CdP4LgfTdX8y9DK76SV+lKlWk0CT2G0xgjJtUd3/a+vcLnceGMlJQ8oxYq07XeME6Jy77raDOmarGmNdYXUi32lXr0IYeL7UK+D57moW8kd5yFNBLpneFibAmlzevrlaqt9YW1ldW/qe/78vv2EcUycpk7aS7kQrTZmKEckhfMQpVrjeR5KKacyUEolljygFHUBhq8V0hSUlEghCaMIIQ31ep0ojomiKLtHPFeopCTRwNLtdKjNznF4375Of7BuB+tXaXS6930GshSCtjHM9xOCWNOT4v41yIXACMH+OB6oWm3jiSefSokTLi0v05qeodlss9nvoY1BbcuNv9F3eH2lnpKSB5Tsot+esZb3a8hMcZRUYC1apwRSEiiF9n2ot19MgtofkKY9Hn8cfuZn3Mrk/aDYdP9RGuR3D3dLZJIAfq32it+of1dY+6PCGF8JgfP9FBucMMzxEoU7yhiTpbeI+96QKCl5Lww9PsYMvT1F1YCsTRCB5zMQgqjfxwsq8fT05Jlmd72zcTlEJOmWdd2PNK3GNwJsFfBo3uejggCW6vXB6oEDS48OBnH3wiXeOHeBerNNUAkw3U2sBSl9952XTomSkltDCNefwbqCTgCMIc3kDhtTU3it9puR8l+y2oS029dVdiq5M5QG+d3DMioeM7HWGyrw1vbtnTfrgwFROMAikFJlBoUZ9vC2gLHWefqy4gsBw+rokpL7n5vPKxCFHxdBMq6xlhDESQKAHwRgLWma4inX6EIhQGt0mi5FWr+ZKu+KDqpokjEd093BImhEA6Ig4KUDx1mcmKGSxPd6t94zvUqFPRsbC0cXlweTWTpSkiYkcQzGNQkSQmRSsezcirCkpOQabO4bH9rhBk95SAHhoEdFSuanpwlqlcGaTroWW6pz3AVKg/zuYqfX1nnqjZPsSc1lOTFz9uiRo8nZC+fpdDoEjSae8oiTBG2N09otiHtBHi1y4SJbUBsoKXkQ2SlLuGh3WeOawyjPAwFxkiA9he/7pEns8iGlwFqDBHzPx1Yq55Dye3Orm+uVTg91H3d9lMagjOHtA/t57ehxNuotUilIK5V7vWt3hDAINm3gv+F53oeVEBWduoYlEiCPIhYoR8OSh5PrPIle52WnHmoRSoExaK2RfoAENjY2OTbR5snHHmPjqfevnNpzZLGeeqDAf9jN8up4Vz9+g/zAgbFv4r7AWlhfY9oPePzyVaK9ey9vHjt69uCgF60vL3HpwiVmgip+UCGKY6xh1PWk0IXOIrY1QikpeQjYbpFnoSMXJXLRI4sr3BRWjlK8XGdoojBCGMueqWmC+T0Xe7XWy81+sllPwrt/LHcQT2s8rTl5oMZKc+pe784dx0KcoL5JUHm6Xqs9J6wVaZy43HGpdtB/3ebAKF3mJQ8B15dB3tlGyNVVPM/DSolOU4QUCAO9Tpfq9BSHDh/pfeOJx5fO7J2yEx2YCEfF9Q8t971B/su/PPZN3DekCZenZ/ntAwfpTUykh9u1yz+2sdqZEIJeZ5Pp2Vk8pZDCpaiAS0+xQ3kiA0j3WmaM5KISpWuo5MFgqxJ5fmFfo8lP8XlVZJrlblmTt1QXruhTSUm/28XXmsP79tHcf3BjdWL2kkh1ZNP72+UjrEVYy8H1AZ946xyvHdrDZn3Ms8ZdRUQC781aUD/dbrafGxhNkiYoP8AI6b7nbY6JcigseVjZXsida5JvN6Rzm0JkjYBs7uAAdJqQaLOeSO/rqZSnYwVhsE3fvGQsjN8g/9Snxr6J+4l+9gPQbrevBq3Wq4FUh3UU1zEGTwqUlK5ILe/0kXUCstb97fLHDdbaYT55ScnDiBASKcFY4zzlnhvS0jRFSoHv+ShgY23dRaeefh+dJ55a/s7x4wtSG6S+vw1ycKokrUGIkQ+ePzjyvOj5R46/tOeZp9/Yv7bI5UsX6fT7tCYrCCkw2mRluyUlJTdDXn9mjM2aqbkfk2qkTqkohWjUz8e12u/t2eicf+asj58kW2VmH1Ye2z/W1Zc55PcQA91IiO/KSvB4s1Z7n7QWnWpkbmS4ZRxCZAL+lIVLJQ8dQw+5LXh9GHXiTNIEK1wxZ5KmaJ3iexV8z8PECWG3By3P7p3bs7p09NCV1/ZN36tDKbkFIt8z3zqyt/f4h99/5aOnT7J59SqLvR7NdjtThtghWF8sPLCFAGI5bpY8pGy5JTKPuLUumqgy/fE0TVBaM9VqUd2zbz2cmD61f2NtfW7hyr3c9d1FaZA/uFjoGCFebbcnLu6ZnXmfFIIkipwOedYCvDiRWOvK2cQ1gftsbSUlDxBbMrHste9B1qFTCLTRWCGoKEWqDcaCUgoBpEmCTTVSeRuy2vgWfnDyrh1EyR2h3qj39+3Z2ztTrTbjtTW01u77FQJRiMcXG6eV9nfJg4/Y8a9MY3n4urXDQDvY3Cuev+FS++Iooiosh/fNM3/s0W5//pELged1RL+H3S5kXjIWxm+QX7o09k3clyhFFEXdi3v3vjbz7LMXnwojTl+5zEa3S32ijZQSbQ1Gu5tqe2KKEBJX4llSUpLNKyAEUoqhJF4cJ4SDAdOtFvMHDq5H03u+5onKW9ORQRqDZ+5fhRXI8ugtbAaKbqDedfn7Fa9WW2nOzb/YnJj8iL+4UEuSBOGpLL3PlmJTJSW3gMjGSZe2YlFK0YsifE9x7PhR6o8/sXrm4IFlEwgj4/LmuluM3yD/lV8Z+ybuS3o9eidOJK9/7nMXPlGrrzy2sMj5K1fo9XrU2y2kkAgDwhqskJneoSvEMJZh3hel9GHJg4rd7vHZQWraOmNMKeU6PLp2z/ieQgKDMCQchOybmeHgo0+E/f1Hz+2P/JXPn15yHXDv5vGMAWUtnrF8Z2+bl+aa93p3xoZW3oWo0fxyZWJiT6NWf8wag0kNfuBj0E5xSpTxwpKS/397/x0n2ZHdB76/iLgufWV511XtPYBuNNDAwGP80FPkDo2k1a52yaUcl3p8K2mfVm93ZbmSKEoiZUjRk0MSY4mxmIE3Dd+N9t6W6/JVaa+NiP3j3syqagMzg0Z2V5/v51PdVZlZ6epm3HPjnjgnbii4/Idr3CaZ8VYqLq9sCAEpJRRnUWexa67W23H2ZJHVAwFY8lYfJW8dNEPeKqUS6sU2nDZNtb3QdmrYds771epQtVw2evr7oRmH0hGkVkkllZWtajmShRi60T6IkNtPY8sXwoCCRhRJcM5gCAMAg+e6cOt1DA4PY2D75trIhoERnS9U0uXKqijhxbVGpIFsPoWOQKL09kVE44uAY7b6qX14QoVwqDjmbd/2knP+1CNt585sriFe2H7NP6FeCjiShQZXRCmErC4MzXyUxgXX3dzj6lQC4Ax+EIAzBiedhgp81MPAM4tdL8vO7jcvC/gRAGP1nni76dz4gDy7emdtfiBKMTgpHSiFGcs8WmorfEOkUj9tLSwMRGEAxu0k4I5n8QRb+sAt71RIFQ/JarAyC3jpwuYc9oqNfGlmWydt0w3DgNQaXuDDsiwYXECFEaQfQGiNznwBqZ6uixc70nOzKY5UvnCjX9JHygbQNTIH71uHEb11CSimW/2UPhxKA4t1lH72Y5VL/9P9p1Ob1s30vpHH2fl5SDCk0hlIpZLVNgwavPl7cRM1Ft9HUqGKxkqyqly1QS+Vf73W0Wpz/RmLD1oFY9BSwvfqSDENp63olvoH9s0W2t+JQg0IhkjSp6bJvLGzOLSos1U41whDhsVFMT0wcGLs0Ye/MzQ+9gheeHFgZmEemfZ2pDIZ+L4PJljSeTCCCqP4NH08DQQqRE5Wh5X1xhs/abZUbIs3rkk2d464vKFUCrZtQzCGer0ObgImF6h5VTClUMhmkbKdo3WwNyaAyhSA1Ef50j4C4oVTwJcPwCvVgfY0IPh7/s4tQWkGkxtj0KELlD43uOb4cHfP9JvHj7fzdMbo6u5BpCSU1ODcgOACSkoEoQ/btGBbFly3DgUFy7IglYSS6qozjoTciprrMrWK182IuCeDglpKZ9WIFz4npwS1jsdNxhiyuRzcSglnT53Cju5O7HzkwWh29+aLZyxzEhe8NBQ4OG7thTYfps03tscDBeStYppAuQy89Rabc5za9Jo1J7fesbNqnD6F0bNnYaRSSOXyMA0TCgxSyjjntRGDqzifHDwp7N/q10PIh+zKihnvlhaplV7RCAhKw6vWkRYmhvoH4HT3v11K5Z93Ga8AgPsRPP+PVMYGOnOArwAZrJ7zzEoDhoTiHDOAy3P5t7o7u14t5nKfqCudi4Ig7tHAOKTSyYJeAa1ZstgzObRr1FsGsLRlrYKcJXLbY8m/jTPmii1r/IN44iJeb7YUKIikqxrTGjKMEPouBjvasWHLpplvDXVPnjlRA37nkEI9YkhTmNj0Hx64oXdP73Sr2DZQLmu8/nrk9vSg/rGPmdnOjkqxrQ1CCERBABlFsCwLfhhXijCEAZML8KStltYammkKxskqsnxrvnbA1FjDrKAhDAGuBYIgABiDZVkQjCP0fYR+gM5sFkMDA2DD6y7Od3aflkL4N/41tMC9a4GNPcB/fgF442I8S74axK1Iw2S7UPPQJzuLxcM7dux4eHR8HJXFRRipDAQX8IMQnAkYnMMQBqRU8Dw/righ4gW/cXfCq5YGE3JL0tBx35LmIs1GTBAvdm+sP2ONcslJYM4NDsYZauUyIt/DUP8AOjo7p13O3pzhdlmdvAj85+ciRJ6CsZo6//6AbvmAvFy+4Q9xS2IM8H2gWtWlchkjQDVMZb+Xzeb6UpZ1lx8EPPQ8OJkMlNLwXR+GEOAcYIpBUx9bsoqsmK9spjnGjbB00iPuWuvyGI93Rr4fgDGOTCYDKAXX8xCFAdocG/29vSPHt28893YhXTYPH3Oy9brmhnHrt+hs0BqsLQNVc1G3LkMOzgPp+nv/3q1AAyhEwNQ7wNen1aE7dp7How8f3WQw35+bw1uXRtGzZgh22oHn+5AqgmBmPKmhFUIZwbZMcAZEMopnBRlvtgon5FanAXDGoKChtIJKUloZi4s/8MbceXIgqqBhGgYEA6YWFiBkiPXrhtE9uPawznd9R8OYhpwEolcZUGWIsvRJ+Yjc+IB8y5Yb/hC3LCmBMAS6uzEPlC/29DzZsXFj/9DY6M7RsXFeLZeRzqThGAZ8zsF1fAQcH+nGdchpr0JWC33F90spKkuLOK+c22TgYIxDKQ0h4k6dXrWKwHWRMk10tHdOZrp6npsc7js1WfJQeOJl4VwYhypkV09ADoBLhshSYF0BMCgB6bX6KX14OANmLwMvnGGXNmzQzvbtF3aPjZ1qc1L9Xq0KHYUwOGBwBigFySQE5+CcIdIAE3GTtTCSMAwBIQSUUlQtlqwOLE5TUVonVdfiAH0pGG+kksejqlJxD3DOOPxaFQVTYH1fP/wtW4+eHVj7QhVYxNwMgIMASgBW1wL4m9mND8g///kb/hC3rMYeIZ1GBATHBvou7rhnz8Wt42O6PjuL85UKomIHTMdBOpVCGElIqZZOUTGW3AXtWcgtblkxlZVJK3rFzDhbFpI3Zs6hG7nDDNAKvuciCgN0FXIodHWNhunCsyqdHsH5BZS/czbiR88rtK2ynUxdAl0W1A/1AJuzQHUVHW9IAMLmSFkGTDPwlZ53NZ4yLKsz6zh3IIqgwwiWaSKUCkonAbkhmrmyUklIJWFANJuq0bhJbnksqaqiJbRSzTXvImmOBh3XGldKNac1lJLQSsYNgRhQsB30F9pqx7cMTHyvp2s+egXASzUGzCgg0kDQ0pd4O7nxAXmxeMMfYjWIgOg0gJ5i8ezO/oG3L2Vz95yZnbdq5TJyQsCxHURRHaGUsAxBuxJyW4jD76WEliursKjkgNQwTXAAnltHtVKGBYntfT1ge+68/MLOzfuiYxem+r/8MqYnJqMIFY3F1VY4IALKDmBmgDwD9CoKyAEg42pAKnzRhdfPp6d3b/1O+6P33bmrVrtjZHYWi/NzyLd3AAwIIwmlVFzWzRBx0KI0kLRsWFGivJWviZAPidK6WQqFMwaDxfPjUqulxc3JwangHKHvQSqJYi6LNT19c7l0/vmw2PFWFITAF58Bvv0XDIiST8wqG0tuYrSo8ybRCLDn0ukz1YHBP8j3r7Hap2bvqVcqEKaJfLG92Sabc9ZcRd0se0jnX8kqsLx3ZrPgob524KSBZhUNyzShoxDVchky8NHWVlDr+/vlxZ1bT7+yYc34Pb/xBHb/zrfYPpfLRXTCMldX2TsWhlAijajUDj3VDlRX2ayW42n4doTfFqgNoXry24NH7xm87/xdFycx9vwLWFycQ6HQBlMIKK2Thmpx8BFvIwxCGGDg0FJfd5si5Fa0vG7QUlMsDa1UUoEqnjEXRpzGUl9cRFSvY31PN9Zs2TIx2dP9pZlc1wEszAL7/zlQfpVOIbUABeQ3mcmOjpE39t77TP/s7Ge3TUzcc2h8HLVyBZlMFgwahsHBhYjrL8uk9ijtWcgtrhGIN7tnJoE2x9WBUyNVJak1FNckZxyhVHBrVTimgZ7Ojlo6k/keBHsagFLMsjs6iqm9Q7lyAKb4KvvMWLyKatSHI2//HEr7NgF8lQXkHPEM96KByhbgHQO6P22/ujWTfpJr9XDoue1hGMA00jCEQJhU3WnUy2RgMI34LIqSalnVe4o5yK1reROgRnofBwPTDFprqEjFlYUMDmEIGIaAwRgWfR+1chlr1q9DZuf2uWf27Dl63hJlRBGgVtvZw1sHBeQ3FzYHqLfbixd/fHjdiW1rhqKRUknMex7z6nUwziGEEZc7RBLErLLAgpB3c91pG60BJQEpsbarE8NbtpSP7tj+zQv9gy8MAKgvjNnn5o9xYXcwbnDIVbbPkaIOGVaAiTeByiKAaquf0oesETwvCIgu7cv71GRmzRtrtt1RXHf2/EZ17Eh7UK+BCQFh29BaQmkGxhm01HEpRMOAlBJSyji/lpBbXdKBNi5AjubgqLWGUjpuUpukqQjO4wPSKITJgWImrXsLbSO8p+eFsYH+cb+0CHz968DsLEBHqi1BAfnNRQOAD/Aol38l3d33l91dU5/ypicLoe/DSqXAOEMgI2gwcMGXzRUSsgo0N2XW3LZXVF9p9rZgyW3i5hYqCgElkbYtrO/qROeGDaN/unv3WZ3KBA8C5tFL7/j7JvZ5fIIpJlZJ05wV4j2zUl9FvIderWNCnUE9yiD/RF3GmoWxXfee3jI/X0vXKnj90iUwUyDtWGicAYnjlCS/lnPoKGrmlzM6tUhWiThzlSVny1mjQSfAAZYs8GQAZBjCr9eQc1Lo7R9QvL3re/N2+kkluIff/m3gH/6jFr4KcsMD8nv37b/RD7GqKKVNzVhhck3f29XHH+oplufv9+ZmCxOeByedBuMcoedBmCYMw4RSEsnKtqbGjkZr3WyEwRhr5tsScrNZmTwQB+Px9qqWtuelrPL4VmzpUgYOWxiwHAfZtHOimHK+ublQGHXLJRhf+1KbPH6oBqCuoAG5WhcpSQBhq5/EjaYAH9AaIwDMgjWybmjwK/lsPrs4O7u1IDgvdHTAMDiiZIYcOt5u4moTurnchtHSG3KLW7nIPf5Oa5WUg00OOln8OWAAgiDA3MwsdhZy2LV2KLrwsz/2ztuQB/3/7e8CX/l64y6v1SCZfARueEDe8+KhG/0Qq4rhB5YyjNSbP983Knds2f/Dh9aOsbPnBiemp6CCAFyI+NQTiz8rjSPjBq01pJRxdzrOwZNFTY1ZIUJubnGUpBGXMmTg8c9JmhY4W1rMKRVMIWAKDrdcRoYBa3u6UN+4cd/Jnq4vt/mVhfwbr2ZrX/2i8M+da/HrIh+SZrKRBDBmiMXxoTV/am3bWhg8e+of+mGAarkEZhiwTQsaQOAHABMwbBsqkoii1XpARm5XDPEBp1aAIeIcFq1UMmvOwLRCGEQIXRemjFDoH1xI7dr7/MX+re+MvfQq8MdfB6ZHGzVlm+tDk7unoPwjcsMD8iOrLZXxBuMeQm2iOukr9FlWpbOz9xu8raMgZqa31atVOEIgn8vBC0P4QQBDiGagzTlHGIbwfR9CCNi2DdM0EYYhoiiCEHFTDJopJzcfDZa0eI6kBKBgmiYYgCgKEcoI4BxmUltXSokoCOGkM0jbDkanzoJZptq2Z/fs6cc+deT5vuJp5+kv2OvfeEP05HJzIpuPMF9q9YskH7LIMKITawYmdj326MQPBa5+8ZlncPTCBQwMr0Umm0MoJXzPhWnaSKfTUJGC63owKFmTrBIMcdAdqQhaaRiOASiNMArjgBwMSinUKxXwIMCmni6kH3jw1ZO7Hvrnc187cwrfnQTu/f8Bh/5cY+ylRnBAubAtcMOHpZKkWdkPgkkWac5q8ANUTWvm7Xt2PTFYWVx3V+RuO3bhAuqVMtraCogkgysjSL1UWLcRcKfT6eb9+b4PpVRztpyQm118VgeQUdy8QgMQhhHnAINBaQ3BOVLZNGQQYH6mjO58DtuGh6eKA8NfC7r7XqlZUtdGT4W9E+cUjLUhowhsVQoBfQxAf0fxxF2DAy9f6u6+7/zcXNqtVmCnHDiZLFKOAxlJVKsVSBXBsgxKVyGrjpGMcRpAJCNIKZHOZCA4g1urwavXUbQM7OgfgNy27tQbg/l35iYPAuMLAps3S0wOAGMtfQm3vRu+lxJUQucDYUoprVRgVeq8Arj71vSd++zH7j21a34W0/MLOD83B79eBxhgCg6pFKSM9yxKKTiOA8dxIKWE67rwPA+MMdi23QzIaYac3HxWpqpozRFFPjQ0hGHAtCwAQBhF0ErBNAzkshnMjl/G3OXLePzuu3Hngw+NTvT2fWXCsg4CLqxsQRrpvESA2yP6YgxIpwHLWr2ly0olIJNpTkJoxFnzFxg7M5Jy/qRn04bMdt/be2ZsHKWFeTipFAr5HCqVGuZnZ+E4KaRSqfj0vl6l7xG5rehkBadpGAAYwjBAGETggsN2bEAqhL4PizF0dnTWu7ZsPnIZvccuH0CqXiq4MIoSsxKorvr1Jze9Gx6QV+ZWWT3cG01pgEUIvvCSYZyb0J0/81hYaG9/yW7r+S99vf0/PlMp98/PzCCdzyOXy8EPQ8ikCV0YBHBdd0V6im3bzQCccsjJzUxrDakUDMOAITiUEmDQ4JxDKRUffEYROGPgAKTvw6tWEbh13cbYqXB4zZMv3rf3xKmUrVCuQjgmzEIaTi0Vd2xc7To6gH/1r4BPfxqYnm71s7kxgiDu/tzTs+LisY7OiRfuve+F+wzzsZ1z83tHxsdRLpXhF9qQzRcgHRvlxRK01uBcQK3WAxZye7mib4OGRhCG8SScZYFDo+5WUSuXMJRJY/3WreX6xx/54tjJjd8p/0eEuLQWCAYBIwWUv9Wyl0FiNzwgDw6+eKMfYnXR8UIMVG1l+tpsu/cO8/LGnoO1HVt+r7O+uHbj3FT/m+cvwDAM5AsF+Ig/hJwlDYPCEJ7nwTRNWJYFy7KaOeSNhZ6E3LS0hlYS4AKmaQLQUFoh8ANorWEYAqYQ0FGEmfl5ZCCxfutWndm19+kRO/+VS6+9NicNE2xyBOqNE5g/NwIeLqBaqbT6ld147e1AVxfQ3b16zwgIAbgusH9/HJwLwRAERmV4ODy4YcOF7Rs3fXvTuXPrNkxP7zlz6VJ6cXYWlmnBsUzksxmwpKkanSUkq00UhvGkhVJIp9JIpdOoVasoz82DK4n1nd1Ys3nj0YN3Dj179Di7rPcBQGHZPWRb9MxJw41PrDzytRv+EKtKFABcAJs/G2nLgf/80dT+tFOXu7aN/pxbfnX9yZObj4yNr5VBILx6HUEQItAaLJkNN4SA53nxjGJSbUVrjSiKKI+c3MQ0GAOEiGfDw0jDcZx42/V9hEEEIThs04LBGbx6HQvT09i1ZhCf+Pjjeu6HfvLc2aPHT0W//IsM589CZ7PwowAXpcQIGJSUrX6BN1ZvbxyQ//qvA7/xG6s3IG9ovD6lgLk5gZ//eeh//I+jmY72Z9YM9HVu375jo1utpU9NXEbJmkexqwsdHe2o1j24ngfTNMAZW/VvE1nldFxnnDEgaBZvMODYFgzBUSktwq/X0FMsoqu//1XZ0flnp2DOrNLzZ7e8Gx+QR5Sy8gExKMkxdVSFzy/K6Rd1WHV+CfYv/PX5yfvv/9LaSrXjfhn+7VMnT4q56Wm09/bCZBw114VKcmtTqRSiKF7UAcSpKlaSg9uYKSfkppLsWITgCEMFJWVzJlNJBcs0YZsmLG4g8OqQnofOdApdGzecMe666wnWXfgeIg1Ua3GIVY3LOyksq5O3mlUqwPg4kEoBhrF6c8ivpLWG70f49rc1pqb0W3/9r83JvR975YGK992tZ8796PjsXEd5YQHCNNHd2wfPCCB1BAMCq7uBErkdcc7hpOKJjEq5jGq5gl7TwgPr1qH06CNvvbR799enZxfLSE8Df4fFCzBsA4AAsAVgvwikC8D+g8DTT7f2xdyGqPTAzYcBYObCJcYWLqka4OP0AywConcs85S9666nd07P/HB1ZnbT9NgYTM5h2DZCqaCTWXHDMJq1x6MogmmacBwHQRBASgmxKjsVklseQzOtSimFKIiSxXcauUwGluDw3Trqi4twGLBl7TByd931woGNm/6fIIWqhxAauhFl3V6RVq0G+D6wZk28sDO8jRZopVIRjh0DXn+dLezdqw/fd/+53m3b/yA7O5vbFgQ/dfz8OZTm55DN56GUjEvFXtFkipBbEltqAMg5j/f1loV6pYrywgLypoFNW7fVhz724PGX773nxZPtbXPYfxHITnH8L7aKq443PgmbAH4P0NkB/N7vUkDeAhSQ33wUAN0JaBvABKADxE0wRgF0CuPQpnT+13p6+n6pu1a9t1qtwmIc+UIelXK5mT/OOYcQAmEYNj+oURRRUwxyc2KAVhqRis/gGIaBKJRQyQGmbdvQYYjSwgLc8iKKnR3etsHBk5MbNr71XG+35wNgHQKhYLfJ1PA1SAlMTABTU6s/ZWU5xoB6nQPgCMNoBqg+sWf3y5802MO7F0s/vjg7Z5yam8Hs7AzsTAaObUMqlZxFoLOF5FbGoJSEUhKWZcG2LDAA5VIJlcVF3Ld+LYbuu+/MxQcf/bWFXOFlMT1pSMEkrKyCf43wj7uAVwdCymxoBQrIb07aAngOYO2ArEyUEB2agR9pcUl4Ey/dufMr27W/4y6vvvuZkyeNoF7H4NAwhGFARNGKuuMMQJisum4EOoTcbBgYpJKQMoJlWTANE0pqMM1gcAEdSfh1F4HrY20mh23bdlRKn/jUExfXDTztXj7FVV83zLmLgLw9Dzj7AQxrDeX7t0eKzhWSsuKqdmaEzZ+e1BXP1YbLn+/YfufWO6PoU/6Rgz3jpRKYIeCkU1CBhmp0OibkFtXYfpXW4IKDcYZarQ4tJTqLRb1+aENlaOPml8bXdL3UdvbCbP8rr7eFSlUVdHTN1FXOwfMF1Ecug9qoffQoOrtJBQDnAOsCVOr0jK78+QFWKNWd8gND3it/dU+pO2u8tH58cmdmbOxj5YWF3OLCQrMGeWMWXCkVV16JIgRBAMdx4plHmiUnN6W4oorSCmA6OcvDYXIBt1pDUK8j56Rx59ZNGHjkkYWnH3j4pUvB1MW1bzxbMEYzunr+SDgZBVjlyzevaTOAHwEQIU4Lvd2IuD6VPv/WCUzIr0GUF5Heu+Oti7s22oNpa50Xuj1z77wDJeM69pSvQlYDDQ0wJMUaGMIgRHlxEblUCpvWrw/tTVv+0u/qfrKdc6Pz9Plc6fnXYDgO+HUm5hhjMNMZjF8cp4C8BSggv/kwLK02UgzQTGtAKo1I+SKMFJTC4TVrn8GnP9n2Cc63HnnhhdzbE+Po7OxCR3s7hGmi7rqQSsW1yn0flWoVSum4zS5Y/EFuPFryTWMfxVac7mbNf/Xyvdj7nVqiHd+q0yx9e62N4Frbhb5yu1m6h+ZNEHecFYaAhl5qAGSZsISB6dkZmEGAjQP9SD304FPjjz32W6Np60Sl6qHDRN22ID3R7Bdz2+GIl2Vp3CaLWK+Q/Om5UEoaYWTYXlA43dtdq9298+SPHZVf6D+YtXK2fbcbSaH8AAwMHEmjtGvdIUu2Ur10/fJNSy+73dJQylZed/WtyW2jsd9c2nr0yqtw3e1CL91I67j6VGM2W2us7CuiNQTjsCwDluBwq1XMTk1iuLcfe9ZvKJ/75AOvnerpf7N73+ls5dgIMzircq0lu86ib8YYmFJgirbZVqCA/OalkIQySnBox4B2jIiL+EN4FqiJLZue+6lsds8dSn5+7Knv9Ejfg1+vI5XNgHOGUGpoxmBaNtKOApRGGIRxmaRlIXZzBRyLd+wMHCz5PDbr9b5HoKPf+ybkFsZwnYDkXTR3JnwpAI8XICU7A8ZWhOZcxGlWQRBARyFSlg2mFSKvDh6F6M3lsH147ezClq1feSuX/dbC3ALU2RGjNBuFhh+g7ptQa4YBYwbIpj+sl35zYwzgHNHsLPz5+dt5hhwKgHQc8EKBCa14RYbmBbcy/3pfz5c23nmXuXNusXj+1MmN07MzyBW7wEyBUMql0nFiqZOx0vEsOgMDZ0vB0XtZ/jm5/VYWkyWNPSLHtbaIax3krfjtZFsTgkNrQErVXLgpRKNogwTTGpZlwLYNVBYW4JZK2NjZjsG9d58vP3D/104Prntpci6sRKenhJivhSyTisAFNLtO+WPGoC0L+nZopHYTooD85qOB6591bwz4GsCMZU0eXTf8z9Y8+IB8eHLyV46cPInZcgm2Y8MyTWitUa/V4NgOcrksKpUKgsCHbdnggsfDA2tE/jq5Xw7OBYRmQNJeWmm9YlxZvpN5t50Ou8737/bCyc2HAeBXnzQBsPxvduXsoEq2KZbUyWXxtqRU0iVRx5claxsaAREXDMpTcS65mYbyfHiVKtqzaawbGh4p9g1+8URH5/7Tvgd851sCx45hKpMCWAmIbKjP/lC8WO92mSo3DMA0gWefBV5+udXPppXicZMBMHgI25q1jx01FeaMfY89Plt/4MEXPjM/11sbufDTo5OTmwr5IrjlINASGhqMxYvgweLgh8m4ShWDhikMMAZIra56QGBpZpwBzYmMJkbj2u1qaXtgyye9oaGhr5glX77dsGRFhAbAuYDWGkEQJhMcDEKIuCysVDA4g8kZTK2wOHUZppT4zOMf1/5P/ui3vnfH7v9n7ly9XDhx2bFMo4yMrVCmrfFmRgH5rUBpIFRAFM9yN5SAcB8w83hHx3d2rN2w0y2X761ePF+Ym7qMbLEd+Xwe1XodlUoF0BrZbBbpVAqB58eNUjhbmiHXOp6OZxo8ObpnjMdxDVPNdBX6OJP3FgficXlNDa00FFuqic/5ymC5cZApoxC+L1HI52AJger8Asqzc3DA9B3da8udd+96bt/evV85GpnH8MohhpkxDaOmlWHG55IyBtBVBAS/faqMmCZgmcD+VKufSUs10nXGT+zH0cU5pMJAL1RmFTYPSazfgvGda0+/Pay/1Hf3+rb7Fe86MDmZk6ms6O7vBxjg+j4qlQpMy4Jt2+CMI1QBojCEYCLZlpfNk9wmx3vk+9UY1fiyS1icgwodj09s5ZllhrjSlFQKQhgwDQNSKUSRbFZN45w3+zOYhoFMKoWwXsHs6GX0ZtLYvmXTQveWdd8a7+36MuN8hu1/03BfeMsZz1k+q8whqtYAxq8/YcEYRMWFZ2aQ2X4vlIzABYWJHxV6p29ycVFyAeRsABrMEBC1ECrHIb0Ic0LgVDr/dte2rf+pXwZ/v1yrPnLk0kUE9RqyuRws00Jd1+G5HnK5HCzbhu8HcT65bsyJxyGUjiNzKEgopiEYAxMMXHNIlZzavcYsOVn93m9KUuPsDWMMhjCgpEQoA2goMM4heJztq7WCXp6nKBW0jKCVRNq24RgGZioVGGGIwTVDsn3XrmdmHrzvz17fsvVg/RvHA3zhDQuFMIRT0Cg1dnoaQP3Dfuk3N8MADBOYvh0TVZY0toDpiycxfvFk42KJmTGNC+fM6W0p75XM3Ds/9tjdT2zp3Jk//7Wv/HCpWmsTOsm51xpaxg2ptIq3Vc4FOFdxXr5ufAKunpigsZBcy5XbxftLeIpvyTkD4xyB50GquGuxaZpQUsJ1XXAuYDt23KHTrSOo1bBtzy7s+vjjJ0Z7u/7wQir1slUqpZ1T77D6Oy9GUx3tgDDAuPGez0RrDWHlkNmxN97h3y6TGzcBCshvYs1j7GIafEsfEEawDAXx9lg8CygVV5G2zm3sLC/cfcc7Pyr9Z+8eH+8vef66icUFMT05ibb2DnR1dcL3Q/i+D8/zYZgmDJ7MXi4LsOMgScVBudZgXEBceSSdBOWssdiJff+TRfQxvzU0UpuAFWvYrnGreLtgWid54xo6SV2J88WTBcVKQ8kkTxdx8K6khGkKZDMZ+NUaStUqQt/Hrr5+7L57j3fs8ceef3PL1md9QOPwLPClKY28AJzr5ELeLhqDRLnVT+SmpOHXNZ76bwZnO5iRM4KDd971Ym1Nd8fHa9WHxt54ve3Q/CwiaKSzWfR2d8ILQtTqLrQGbNtGLpdFEIQIwyg5s8NWhOQrUxGWTTzS4Habi2fAFVuqdd9csdVc2N6YFIsvbuSIW5YFKRVqtTqCMIBpWTBsE1ppBGGcumIYAowxTE9NwY583LFpE/rXDj4519v5X47c87FjJ72Ae8+/BHt2LrDzxUiZjo7rtr3PvTVjQHQ71qtqLQrIb1IcQAiGskijWqojePPFOJ2k5oG5QZy6IhVY3RPu5x/3Jz//6Pjbn/zEF+9Ipa17nn32Zw++9daGE/MLYGDo7utDe3sRExMTqNXraCu0gXMezwQhWVkNBpWcUlNISs8pDc042DVC7isXpdD+Z3VbfuB2VZ5s8xogTnWKz8VKKZM8XIAzAc7iVBIlJVSkAAYIYUAIDgUOi3NYACanpiBrNezsH8DGRx49W3nkkS9ObN/6vRqgCmfHU+6JUeUqP8CiowETtPWR65KRxvl3ZOpyUfcOfAY624eFfOfbQz/+o3/SaZk/1/vccxtGp2fgAmgvFqENjbqOq/yYlgnGBZQKoKQC50Z8JrH578qAHMBVA+O1Pyvk9hHXuwdjV1Qvu3IFwvJrWHJGBrBsG8I0IaO4R4NCXHkKAHzPRVCvYrBYdO/afsep8t49Txxav/m7ExKi/ObbZvSdb0OOz6uIK62p1PEtgQLym5QAENpZTHfvgH+5AvzFn159ozACSpUI29uM6POPhm8xdrK8acMTPz4/n95YKv341JHD6yvlRZRtC5ZlwjQNWJbZXKGtVbyQk/O4oQCPS2KgMYgoHS9sitdzsmsH3++xw7lmFbx3u/J93Cf5iF35d2puCFcu6QSW/njxLDiApEkVixfGSdWsGGAaJizLgiEEtJLQYQCvUkNQqaI9l9V33323DD/++Fdf3bHjn9cBb+3FqYL9lTfExMGxuouUXqoOSsh1MKaRzgRWx3oUOu6ANV/K+qK6+OqGdf9k+KGHqtvGx38tCHxM1WqoLi4ChgHbNOL5S6nguh4iKaEZg152OvC9Wwotq05Fm+htaWXBA71skFx2NjG5JJ40j9NGwzCCBmA6FkzTgpQSnueBMwbDEBAMCDwPKgzRVWjDwKZNp8xt2/79sT33P3PAsVB45lkr9c1vGpVjx0JfKe1bZtyggNz0KCC/qTGAiTjwiYKly5q0QiYd4lvf1Di5D6hVMfLwo6ef/Gt/7ffvz6ZTn3Nr//0zp8+kRkdHWLlaRd/gINqKRSzOLyJodO/U8UISLpISdUCzq6fWGtBxP7vGrOe7PNPvy3WKd5Cb0PX+Vuw6t2pUBeCcJ2kpCjKSzVOutm3BsWwwMEQBUKrUUFmYw/ZiETsefnC2/NnP/s7sjh1/zDRc/9yMhYOjyuZpj2c6wjgY51c9+u3HBGDChA0bScUk0LuyAuOoqRouBiPgWstAZKWLfuT71jy5Ze/9uXtTqZ8//M7+dadHLsHJ59HZ14d0Joua66Far8GyHVhOHBglodTK+2/G3tc6QCW3tWukdF7rrMny7UprDWEY4IZAJCOEYQgwIJfLQACYnppCvVxGez4v92zbftL5zCefeHrvrhfP5fIzuDSC+u//PvRbb0UYGgpgGIpywG8dFJDfzLSKW4GbDLCvUUWBMYCbChfPAweeBQDuGpZ/6pd/+Wj3Y49+4c7SYuoO2/6sfnt/z/j8PIJiO1J2CpxhKR9Sa0itoGW8kKSxOioOyjX07dhlhHxoGgd3SinIpBmFIQxYpgmTCahIIvB9uNUauB9guL2IHXvvrwx+4nNPndm67Q9qwDnz8nwhPLeoolNjQeHCkcCZH9FpeOArztvcniQEIhioYxLjALKIQ/TbdkKsswC05QAlATcECikg14FgsYS5k/sBHkrY3QKVgnGhf9vJ4kMP/ub2fKbtjmrpf1yo151qEHC3WkU6m4NgDIJzGIYAFzyeKV+2sJ2QD5XWQFJNBZwhkhGCwAegYBkmICP4foCoXkeH42Djpk3T7Z/5xFfG777niZNVPebbAM6MsfCdQxHGxzQ2bVLgHKB0lVsGBeSrBwNgQUoNpfyXuXhl9MGHop8Kop5OL/js0xcuYG5qCtVqFblCAYbjIJTxIk6VpBAorZNFm426uss6euL7O/N6rfTK5T9rtvLn5afxyM3l6syVa/+llqckNSpUNHIiDSFgGgYMHtfS9VwPbq2G0sIiNvV04vG9eyD3PvLHp9Zs+bV8yql2jEwVFl49ZcrsYBXBos++9bvomBxBAZkb9TJvORoMVQTYD+BuAL0Aqi1+Ti2zZwvwsR1A3QOkAjgDLAO4HADTIwAiQM0A0WU29ukfx+IDe8vp3u7/unnzZvWA7fzCoSPHnIuTU/DyLtKFNrQV8oiUQpgENdcKxptpB5pheWfGBk05K7clBn2dnebVCX5g8b6WM4AbAmEYwvVcQGvYlglTCCzOzcGvVpG1LOzaunV+w8c+9vrI/XtePVRll6Iv7zMRWRITJzXK9Qgp6yN4heTDRgH56qHRKJSbBD/T7e1HX37ssX+91bZnHnnuuR/bd+CdwuWZaWSzWRiWBTAOpTkkV/ECPB3/Om80awGSvDa2soLAsge8FgqoV5n3dZC0LFmWsaXa9mg0nFLgnEEIA4ZhAFLCrdfhuS5MADuKeWzdeseEtfdT3zz04O4/PJkzxtacvpCyzs1YbKFcb3vpzwK97ykm5qdME5AmalQCIMEA1ADMAzgGwAXQhXgdym33JuXTQG8HUI2DGSgNBBHgB0naX7LS2BfKeeUlM1ee4/vvv/eY96M//Bc7nn/ZVKXyj4RubXDWrcO3HWRyOQS1GgI/gGGaWJmYsoTrqycTrpxwILeZ64ybekX257JbsHgxp+/70ErCEgKmYYJDI6zX4ZXLaDNNuXvd2tL9n/nUU7kHHvhy3fUvmvvPpdjkvA+V0pivApGKK6qQWw4F5KvLimLEdcOovtnT/byx977o40Fkzbneg9Hp04NhvQYpJQzHidvwgkNqBSWvXAm+fBnnyqN6mvO5Pb17fMFWbBuaL9UH1xpgnEFwBqYVwsCHW6nA4QKDA/16w/phZt/36HOHd979fx50zMnLF2ZF+bXDoifgQc623OLbz0Ae3icUYCQb+W0Xa74bC3H++HnEf6NO3KYBuR8C1TpQc1c0UYNggDABcAkWp7EMHD/hDB0+mHoz0+aX7rnnzey2LZMdDHpHJvM/nz571izVXNQWFyGVhsEABpUcXi59ChiWAvH4+8Z5I500gSG3s3c7Q3zVbZPyr2EYwDINpG0H0EDg1iBdF93ZLIY2bhjtuv++F9nu3V+MnPSbna++mu49fLZw3ipMIp0HKnZ8VkjSlncrooD8NnCpu/fAwb0P/6edipWKUfQT3zlxvCMUhujqH4CV4nG9VB2XOmSMJTPkuKohgF7+/7tEZo1fe68CAwwrb0CTSTevpWoA1zjdiqX6zDo59coYYIikYk+SEsW0hmAAlETkeahXK1jfVsTuoTX+9Kc/9e8OfGzv74yDlWefmIF4+hQzNocuX1/Quqwagb4C4IHinKs03hCRfC2/jFxJx+U3CzlPzgWh/R+/wKc/M6G//Tc+cfmBDet/a0umazKbSv3S26/u6ztx7iwGhtei2N6OcrUCqeOmQc1F7sk0eDPdbllAHi+Qbz4iuc2sWOGSbADNfg4MSfHM5Of4lCI4AFMIZJwUbNPAzOQk3NIiCuk07t20+VjHw499bd8jD3z3WM29sP0bT2Vsv14SuUwVAVO0kd36KCC/DdQM1Mb7O181PvGo5wjt7mHsRydGRtbPLS6iWq0glc8jk8kijCL4QYAwDOPFTCLurKiUissfcg7WaCikdVKFZSlNoRm0NfdCNEKsFnp5iUO2FJ7H16FZazcuK8ChoOK245zHp15tCzoM4Var8KpVpMBw50A/+u65Z3zisUe/fXL7tifOgF3yAYZTi5ztm1NiQCmeMoBygDj5hU7OvBeGeFFnCoANIHj3m68aDuIDEcM0gLQdz46ra61IlwBzAJ4CL3LFa3VlHD5uoNSNef5D7pHPpo7zh+/50w2O1bYrxOfF0XcGpksLmPVdtHV2QIHBDQLISAKIKwgZQgCaxXWilQJnyUJQHk90xB+dpI7GNZLQG5+txv/Xug25tTT2hkqq+EBNxKWFG7ni8UC2tG6LI04VtUwDluEg8FzMzVWgXQ9ri+3B+uHhC/zTn/nK4Y8/9ucnsulzbfsP6Y4z54o9HXmXW20RDY2rAwXkt4FMAJg+l9/u6nir/+OPej9j2+h98YWfePHIkeH5UglcCLQXixCCIwqjuNW5UhDcSkrWAQqymUfenANatlivkW/Okuot0Emawns8N9r13EJ0vBPRWjdnCRsLNhuhT3yGBVBKIwhCmIZAyjKRsm34YYh6tQK/XEFfX598aM+e6ugPf+6/Prnrzn9Zjme/OQCFnKHRaQFmsDLtgLwnhrjCSg1x/lr47jdfNSTig48wCIGqd3XKyvJbMgbwGmTVQxj4UOuzEfYXgP+J8Uv/AWrxlzNjeudd/9c9VqY22Nv+f3zpq1/DhdERdLUXwUwTgdZQWsblYMGaFaukZHHFKigIZiSnCBuFKGONUqCNoLsRhCu11LWWrB5KazAdrzEAWDJDnpw71snfXymAsbj6lCFgGwKlUgmV+Xms7e/Hrl27L3Rv3/7Hz+y+68m3sumTDoAuzuFkMzPcMKBpjFw1KCC/DXALMCwgDWCso/Pskz/2I79/TyYb/lAQ/syBiYneM7Mz5ukTx5FvKyJXKMC2s/A9H77rQRgGbNuGZVmouS4814XgHLZlxYvzsLLeNBB3aGzUM1+evtJwjb4y5CZnmiaUUnHAoxGXHDQABg7OddxUijMoDfi+D8aAQiEP2zAQeS4mRkfhlstICY77h9dg+85dp8Ntd33pYnvvV5NgHGhELiILneqBW3BQ6+wEkwEMy6YeK+9CIz6ayQOYBHABt1c9coF4Ixo7cBoYnY4rrFxzgNHxrZmDGddFTXNU1q0Dcm0AmEIEVMGDV3uzAaodT+6a7C589rFHP3ng4DvbDp04rrnjsO7+PuSzGSjNUPd81OpVcCZg2yk4jgOlFOquC60VDFMkj7oyKG9oBOCNWv1XXk9uTUprcM6RSqeglYbn+wi8AIoBhmnCsk0IzhBFEVSkITSaY+X4+AQKjo2P7bor3NLVd7B2z94vfveeXd+9fOnCma7vfgs240hHDEYqDTOTguFZyRS7E+/sqWHaLYsC8lWGlRdgHHsbGOiHXliEZIAMgGoIGKZGlDbck6Z1uH2o9wv3/ORfiba9c+AT/M037zwzMW77lRIs00Aml4cpTEQshFZxy17GGTgYDB5Xf9ZJF08AtCO5DUgpwTmDaZtQKp4Bj6QEYzzpxMnjU7BKgmkFUwg4pgkVBqiWSqgtLqJgGtg0NFTtfvjBw+6uPV+pIfvFBSc9Bq152+lTqjgzqaVtQZ4dhzV1CcXDLor1AozFCKW5GdQRp2OQq8WJZEAdwBTioPy2ND4bf70PNQA1IQAzAsqTaBwXSgBzAC5wdXCj5ZT7H3vknN/d/vnZJ768u1yvp3QQIGQMzDBgckDxeLmngoJkGpoDisfHAzpJ5VuahFiW7oelOv2NgJzG0NVFaYBxDmGaENBQUYQo8iG4hmnbSFsWNOcIfR/VxQUoz0NBcNwxvDbcfs99h8N16/7kxK67vnywqzjV8ezTat1Xv2b4jiMxOKxLQ+uhpAvX40j7AFgAEczB1xEUoyortyIKyFcZ4/QRZP/Z3wFPW9BBXDs3BDCVTJcVvTqggTd/9V8eHvnMz1Z/xLCPPab5f989evFTx86ewdzMLKAUnFQa2UwaYRjC8324rodcNodCLocgqZEa+D4M04QQcZ55mHT/tG0bACDfoyHBlbN3tCu6+cRpKQqu78GybOTzeUil4NZdeJ4Pzjls20G8eFNCRRHSjg1TCHjVGhZmZ+BXKugqFHDP+vXlLZs373/20Ud+98T6DX/58aOXfNsQ4L6vHvw3/wb3/v7vo9LbC9QU4EXgFzQck8NXGgdrVSwgHrBul1nfD8JAvNp1BMBCi5/LLUVK4NxFIHwbgFyxRzRlFEHrS0fa83/A9+6q/VQQdJw/fmLL26OjmBqbhplOo7u3D9n2IrxIolKtourVIQwLqbQDzhhkGAJar0jzWz6Z0UCB+OrCeTxuVmpVmKaNTDYDK+XAdeuo1apwpQvBGDLZLATnqNTrGBsdRTGVwqcffhib123aN9HZ91vP7Nz29tGu4hQAYZhmOiy2c51O16oylPWRc/E2poF+BfBMBm5lFGPSg89o6uJWRAH5KsNqFRjnTkCYcbM6AFAszq8UGrB9cK1h4qUX/OkN91/Yt3f34t1DA8GWl1+dazPtx4+fPtkztliCW60hly/AtB0YhokwjACl4HkepIpTUgwh4qRfFS/w5kKAJ7M872cH80FKQpHWaKQjpdIpaA2UKuVmzqJlmYAGojAAAyA4R8oyYQoDgetidmYaNjQ2DQ/LbX39F9L373328H33PHuhZ83LC75Zf2P9JvCDR7Dhm3+E4eee4z0ayFyebEYqKoi3EQfAFsSz4zNItuWP/q24KTVmXxcBzOI2bgj0/YmHoBAaeAvA/x/A/wDgTgAA1wyCC1+bhj+yYfs3Rvo31IdefPFnH376qccPAenxaoXPz07DyeZhZ7LIZNKwNeBHEjWvDgHANsykYlXygMtSVICrF3SS1SFeb8VgmCYiFaFUWgQXHJZpoLOjHVxrhJ6LqfExKD9AxjKxp7Md6+/YtdD503/92VNrh/7kQHnh+fNBqoKjl3nX2Ckne+48lOMEMAwdSQkVBlBJ5SqLA3akoGQdXCuA0wh5K6KAfLUxLahiDswRUOHSLEzj4yllyAFY5rHjzP36k96Rn/iJWb9/zVce23PPyYGuTs7b8p+PDh6U07Ozwq9UIMDgpDOwDROu68Kr+wBDfArOMJZOvYKBCwENjSiKmjnk5NYWd4/jsGwbfhCgWq3GQbLtwLZsaKkQBlF8G85hcA6/XodfrSANYOPaddhx990TbUNDXz5zx7Y/fW1o+Oz0ovAxBmNMQPZ++Um987d+HTbAFnD9qiBrEQ9Wi4gb39DAFePJVwnxwQr5wJJB6pIGfgPxlhYH5BEUfOnBnp/BfHdx6nBP7589vGf3wsNeLdpx/vwu89TJtWPTM6w8MwMnCFDo6EAqnYYIArhuFZHSsISxtHgPy7ogLxsbqcrKKhQ3XoBtmfA8H7V6DUJw2PkccqkUICUWK2VU5+ZgQevOtWuDO/fsVvlde587zcx/csCxTl5sHwTenuWFZ153+s6+Igxd8sKM7UHHFVn4suY/EkDIbUTMhKbt55ZF+7XbjwR0HW15hYUKw7/6b8aFTz6iaj/z6XM7t234P7cV2k9+1nR+4fihd/oOTE5iYXoSViqDXKEI27JhWjakihCGEWQQgRsCwjCaqQ2NmtPNArzLegvRMHHrYYxBao1ypQIuONra2sAAqCiC53sQ4EjZNtKOAx1J1MoVjI1cQtE08em778amO+56bXbT5t/93v13vDFlpEbXHbiU1oPrMReM+Wv/xf+Oju98mUcANwGVB5R3neeRQTxTbiApb/dRvQE3Ob7si3xfrlsvrgwPo94k1NgMivOjYrdpp8/veeTA3Od/7l8//OxTOx7h6ufOFNo+8c7pM5gYH4fvesh3diCVy6GrvR1BECL0Q2i5Mj3lyrxx9gHOKpJbRVxpLPR9mIKjq7MDhuDQMsLC7Ayqi4tQnoe+QgHbe3u8oXXrTh39mZ/984NB9GX9t//eWP2xB4F//H8AqZTSpvC0bQYIRFJDk/akqxXt125mjMWnnriZlM+68noOcCP+PyEZUDcYmBG3vL/GfWpoyLAtBwiT4dBxhDMLbMKq1PyPP36y9LHdvzecd2odhexn73njjR3j8/Ptl8sVY256GvliEdl8HoJzaKnjaipJwxcAUFJCKpU0FqJBY3VggFbxok7B42orUianShkcw4DFgcriPKK6C0NpbMlm0btlywT7oc+dPPvA3j+64GS/fHrRqHvPvixyzzyZzW27j+WFgfX7X4cTeHABfRzQZ3H91CUTcW70BOJcaRq4Yo2UlVqrn8it6V0j4NAE6o4EDz3kKnXeoZWYeeqb86c7hqcLd9x5ZOeGjfX+N/dLO5XZe+b4ibaRWg3TY2PItRfR0d0D00mhGkpIraHU1QF3Ix0MAC3oXG0YoJVGFARIpRzkUikoGWGxtID56RlktMLG/t5ocN368+v37HnN2bL1zfLA4FNzLzx/HgffBuYmgK07gcw2IJ9XyrSUlnTYvdrRfu1mpnWcCK5CQF1jgWSzAc+y1BQNpCMNEWmo6OoBnsm4mU/V9RHlpcZwX4jvfp3pb/8On/2TP9azP/NzI6/v2PavPwn99kOM/Y890zOfOXjsRNfpS6OolSowhAFhGOBgMEWcsiLDCJol6Q2Np44rjuPZyg6ejduQm1wSNFiWDSYYAt+HDEMwreFYFmwhENZdzE1OgkUSw/0DeGjX7knj0Ue++u2HH/itk/n8KbiRhS+dtvBfv6KPn/mdyp3dT+odGx9AuPY+hCKj/EuH8A7iyhaE3DQiCV2PezIEuVwYAIv8n/46oskKXnvq27WZu+768iP14Mi29o5f6ezo/Hl96JB9bmSEl2ZmYRkm0tlCvM6GccikudrytJR3S2MhtzaW9OEUnIMphcCtw63XUC+XwZXEurXD2HXvvXVj/frfq+3Z86fza9bUsydPyq7vfi+3wJgfvXM4xN/4Gxr/4LeArXe1+uWQjwgF5DepSQDbIh+/sHAePcJE/Voz5Ig7fyGoAEgq7NYimOeqYIJdu2FAcj/Rwn4o5yIyJR8v1Mb100xjy59/I59uW6MOP3pv5bUd29+qd7YHu45eeOtRp/2n1xVPPXzkwnmMjI7BtG10dHUil8+hUqsh8FyAMaQzaTDBUa3VAMZgmtde6d1sF/wDv0vkhms2XdVQkYRmDCnbBgeD79YxOzcH5rpYn89j0/C60cL6Td8du/++N47t2fX2xVz2El44BPy35wB3jYLjRAAgfC9l1usGy+bqlw1TngZQWrbMoTUvlBAAX/gCcPwEEEVYmJvCsdmJeMAy4/o+pQvjQKgZ/sW/Yumf+enQvvfu46/cte3f++uHT95r2g9uKbR97PjcbM+F8cuYdxbR0z8Azo24iRDn8djXKH2YBOjXaxZEbl1KaRico6OjHdVSCRfOn4dyXaztKOLOnTs95xMff/bcww//xeWBgX3G/MxUz7PfcvzFqjTBJFvqy0BuMxSQ36T6ADyiQvx0fQZrAZTf5+/pQEHP+O95OzYzAgMjyAPMAvQo49jz4uvc6F5njA708tlNaysHeXqfs2nbW7sH11SHp+7K1p9/ucd//c104Lv5qFbndQAyCiEYgzAMGFwk7Rbj+QFy62ukLJqGgNYMWkqEgQ+EESLXRVpp1d7XV9v0wANu7557v7VY7Pzto1s2Hj3tGBHGzgN/+kUTf/Y8x8N/XaIzDwCQtsOjdFowpVCNwsZiRNpgSOu9+Wb8haRO+dW3YAA4vvSEUQukuti7MXwrO3CUdQ2PD3/840fXbFhXso4f/4zJDreNz845tcVFwDRh2DYsIy4RqxGXhJXAUqdjmh2/5bFlp345Y2BKwSuXALeOjlQKdrG9vPauu84OP/zA2fm9e/9gtL341EkFpI8etowXvmeFvcMucrmQKqTcviggv0l9FsDnER8qj+CGHTKzOUDcDeg1DPJMT2dpvxeh72svqSL2pVRn3n7zRx70T20Z/Nq2zQPvbEgV7l2TKf7k2MWTjxw5ejh9aWIc7V1daO/ugunYqPsevCCAZdlxowwdtwRu1OAFuzJNJW4rvPRs3uWZfoBFoc27vN4v3OgJqGvtXN/vY7IPcuPv4/7f71No3KWOu3CmbQeCA169hunJywhrdXTn27BnyxZ3/X33vTXz8Y//4Strh793xg/cRdtSOHUC+Nu/wPHccQnj8QhOXkNNNR6injzM8s2aZsbJrUCDc4mMrUYiS19+bRTey+NMbe6uPvGpHfse6MxP3CflkU19A3/l7bfe2vv0gQOGNA20dXTCzGTBjaRzJ2eQCknnmGQlAGPNFaZs5SOuwK4cRd9rYPxAY8/7cKPGz2WPf+VDfNiHK+yKB1j5Hl75Dl9p2XRTMoIxFteab1xuCIGgXsPZU6ewvrsbn338MeTWrP/u3PZtf3Jo986R0LGnCpcvF60XX67j5KHQSKVKMpfTerYKSua8fVFAfpPqATAIYBxxKbgbNH+iI0AVAd0OYNI0lAwjOBOzMLxIBjIKolTaH7901o2+8vXFjRt3ja978PHLbt+aw7tS+U9tOntsx0wYWrNzM3DDEIoxZAoFZNvaoDhDtV5HFEXNBkFccIikVjkHklZ2cZMMpVSyiJU3F4XG5Xv1itQbzhgYX1Yy7IrFUnrZvyteaPI/W/bvB/X95b6//72cRrLQa6lo8bLHXHoFjCVVNRo7cBUf/DTeJ845hOAAlqo3XNkZcPnp8SsrPDDOIZLum4JzqCjEwtQE/HoFjjCwKZtH36ZNi3Zf8bWOBx8+WNt935EFRC/MV+anytlifCe+D0xMaGABYEJjZee4a1W2oL0QuTUwAIahwwgI512g5DF0ONK37Iq27cOyq2v+8J57z3p9PY89aovdslS9c6ZaL45PT8KTEqlMFrl8AdlUClJrhKFEEEmoSIIllVciKaGThdOCCwghls3AqqSDcry4mnEOtqwE3ooPktbNC5qL7ZdVdVkxprGVv9a4qDH2sBu1F7qWKydvrjMh06j3zRmL9yNJSia/YpwDsGKcU8m+J96fLHVJjd+H+P4ar15p3TyTkdwRkOSHm6aAwTmUkgh8H57rIgpDpAAUHCe8Z/u2s70bN53jG7aM5obWPllKpZ8/fep0UDp9wsocOZryanVdMJSCZccFHGgUvK1RQH6TqgOoID4Av5HDIE9KzbkAfKXBhECUTSFMsSBKOwGTEfD1r2P6V39VX/ypvzad/cVf/Ua07o7vrhkeOmyd2/A3zx06vM09drS36tYZs0xwLSF9F9xxYFlm3MET0fLHW4rG2NKAr7QCdDyAKgAi2XHEA/GyYJI3BstkgF0W212Zm369se2j2q1cb/L/ug2Rktej2VL1DL10Vfy7jV9eHlRDr6h13HiUK3NSWXJZ44CmeTCzrFIO47x5sKSlhNYKKvAR1Spg9YrKFQvenXdvS6976IFDl3s6/+35dR0vXxbTwt5/ymZGRxb3PlyDEM2n/cHeMUJuFRoQDHBMQEIhZQOMwfI8VJQe+05f71h7X/drf6U9/3j68uX/+czBQ58o76/63sysGTEmIsuCaZpgQiSB47LPJ+PQWsaxdBIwcs6Wcs+TgJAx3bzs6mn1d3vqeumLsWXjZmM8WfnvVWPPDfZBj9abY5qOxzQWX7jyNxuvF8m4qmU8gdE40GkcADTfjOTvwNAcBxs4Z2Aa4ElTHqYVEEWQngcWBsgIgWw6jd6+/okd27d/I+odeOKsFqe5RtUfH8X80YN88dvfVHMjozU8/glpbN8ABOWlN5rctiggJ9dWLAJTk8Df+iXg7Ze5BvjLT/6FmhWW2vXL/zQ48tD2b47dPTz6YCr94F/JpH9ySoX3nJ24zI6dv4gLp06hs78fazZvhikEHNuCUhpRJBGGIUIpwRAvehFCgHOBRtjdqNYSSdlsLsQZb3a7U1LFFQuSHZZIdmgrLf185VXfb0ZIw/JTm9e/m8bObNmNG1k77/LYXMQz0lovVWPAslmbpbtv7JR5MpvDwY1G57/4kRvtuRsHLY2dFgODjCRkFDXbdxuGAdMwYZkmOAOkjFCr1VCr1rC4MI+cJbB3+zZs7+6Y5Wb0Wu3RgX0vPTz80jlj16nJ418I+Ru/JdelPhGZO37mWvtSQm4DGoCCLbLImkVkIoWLhezi1x54+JWd/vTI+qHCMz/Sln907tzIvafn5jovXp7E+MQ47HQG2VwBhbYi7JSDQCq4ngfLMuPPdXJmKYoihKEPKUMwAKZpwDQNGJwjCCOEYQjGWTKexme3lk9cKKmglUIURfHMezJu6utE28sP5luS3/4+RxEGQCsFpeNAWfC4EZNSElFzjNPNRjpx7XcOYRhoNO9RSMZKpaE0ABZPULBksNZaNZ+PaQhYlgkDDDII4NXrqJZKCF0XluBY19eHnevXIb91+7PVYufvX56bPleZnx1hha6aAOL3WQgF09QwTYAzTSMmaaCAnFybZQGuC7z+BnB5AgBYLYpw9pXnYHUN4tLs/aWpjZ2vdezacam4Y+fiutmZmeyhdzY4UnVftu38vOeJyfPnwS0r7vTppGCZJkLGEAQhpJJYnqunATAR70SklM1gUXAOfUUUqxnAmFja4TSvuX5gvvLn95+Rf2U++o3Ns2jMarPmrHfjoRuzVytm15WOdxaMgwsBzllz5yuVhEoOCRozQPFZCA0wDcPkYCw+3coZh5YKXq2CIPAQhSEMcHSmUuixe1VHe27xrru3TWV37nz+TK7jqbFNPa9fMJyZiakLCN98ihmH39Bq596IOylamkluT8wAmIFL/jF4M9+Fd34z0FEMLnJ7XPZ+bLx+56dPd+WHT3aOjpy769TpBzoPHlo3cnGkuKg0It9FvQREngMzlULGsZMyiRpaAVLGwaWUClozCEMAXECBJ6dQOYSxlI4GxIG01Ctn0BljMAyjef3N6lpDyLsuL9JxWqPAUuoO0/EsdvPMH1t25lSvnIVvJgkuqyilpQSDimfDEZ/ZNQ0BwQDluqjU63F1ManQYRroLvYhm05P9W3YOLr2zrsWph566A/PZ1J/Fn37G8yYmOS5rj6dStmoSwvMNAHL1rBtgHPQHAZpoICcvB8q+UJp4iJe/0//FPqrGegf+1T06j/4l+OXN2/7s4dG257v8/xHPpbO/LQQxoPPv/RS+rlX98HJZNDW2QmRV7AzaaRMCyYXkEpB6jigDKWElAoG4+CCQ0E1Z8R1kr+3LFMDXBgwTROccwRBgCiKmoHscmxZIiLD0tVxa+H3F5R/fwH5+8w2v+rONFSSO7r8iTMw8Ct3SSrOg1RKQ0OBMQ6V5Iw3cvI1Q5JfGr+ZUkbQSsG2LDi2BSEEDC4gwxCuV0VlYQ61Wg2MMQz192Pb5s1YNzQ8l+4qvqzajb98abj/+ReG7lzIcRbkJi86+NJvCJz9aoguK4BjUrEucvtiJsCBI/P7cHT/r0MdBRCC6bTDRn/yj/TI9s8vYMu2p+5Lpd58TEYPDHa0/+ymkbFPnh0da7s0PoHJ2TmUowhtHZ0odnXDl/HZRCnjcRIATNOMe0CIOOgMwgBhGMI0TViWnZRRjM+KNSY1lFJgiGfODcOAZRhgy8bNxtF6nMahm2mES69recrbDXblYLvyabz772kNHUlIppoHJYYwwIxlIY7WcWsPxAcrEQDG47GTsyQtCABUsm5Ja3Ad99YQjMHmHDIMUF8sobwwD6Ykivk8tm/ehDu2b4fhpPaV27v+bHztxvMvFtsvnoo8foeGWhNpGYURAj9EFMrm+0zIlSggJx9IPL8KjsATmL7M8PprcjrXU3qlp6OUTu+udty59WJvW/6LfV0dW/4707mT6fDeicWF4tmpaYy7LgzbRr7QhnxbEelUCgoaru+j7nrJLJBM0lQEuIhPMwKIdy5SQWoFyAiRkuBcJCkZrJmqsXyWOZ4VunrsWzH7fJ1A+wd+l+J7/0D3vKJxCE9eh47TTJp53zqeNYtnxwEhDHAhwFg806KSag2NvNPGF6ChVXywYxgcWkUolRdRr1QReT6Y1mhLZ7B53ToM5LNez/p1p6xtW9/ytt9x8GL/mlOjTur4OWNxQuJNiFOLjt5/yoQ766MgQhQ0rK42yHwBtKchtxUGoL0IHDsE/N0/gT77PegxxB/7CByWL/R3fy3Cz5UV/pe/6Z/f9+pl7ytfflb8r78y0Xfv3hfWvPTizo0dxc/Mjk+uu1Aq4/zkFE6Oj8NwHGQLbcjm88im0mBcIJISoZSImuNEXG5Wa40gCNBYdgOw5sJssWxRp4wi1JMF9owxoLk4XjdGzngSBMs6iDb/wUd2wL0irZCt+O/at2fxHLaS8QEJE/EBiBACbPkkhVZQyU5BmPGBSdjY5ygNwQUsw4BhGktFB5SCAKCjCJMjowg9Fx2FAu5buxZDbW1ByjRP1e++540Djz1ycLaz8+BiOnMq4qw8eeBEqL75ghgdG9Xznq9xdhEXDAtBWqCeU4Bt3bg3kNyyKCAn3w+GXJ7DchgOH+G1/o3swqMPh+gojhmqOFaoR9i9676unX1Dj6cXFlznwP57vbfeUOmZmQ5fqRQ8D7WFBQSuDW6aYMJAyrIQyghKyaUgkjEsT7CLF+7w5qy6juRSDvmyuJcD4M1VTsuGcgVckdn9IbwR1/fBg/zk9DLjiOvQsGZIr1Qjn3HZ2p8k8I7zIBuPx+L0FXAkb2HzoIMLDg2OyK3D9T34dRdwXeQNQ+dyuWDNxvWVgW2bp9PDG07rteufrfX2PD+RzZw9K73wol9W9XPPcZz6pmld9E1jnCuUSxHqptYzPkqlU1CVfcCafmBwEDh+HPA8xE3vBSBMQBvv8Y4RcovQABgHDBMoFIFTrwNP/AFQr6y4GYNmW/AON6Pf1yd37dAzT30XM08/u4j/7z98bfuGTW9vvXRhgzU0PNFWrv7Q9gvn8+Kt/d1nz1/IM0OYhpZMunUEUkJYFnSyoN3gDEo3qi2xZuqaauY6xwfz8ZqUOChVSkFGUZJXrWGaBkQyofFeltd6+qh8kFGCJeNgnGqi434JyVdcIWVZl9TGbZNAnYFDMIAbgMEEBGPgSkJLCRVGgFJgWkNojQJjyOQL4ZqBwYWBvff42e3bzmkpn7o8tObJA2vXnpxxXUSXxxh8j+HJp0x84Wk2n82o+ZStISeAegD0F4D71gL2tZvmkdsbBeTkg9IAJKAlGANsO843T8jL82zx6/v5y9v6F48+tvOZdRUc3Oy0b3skn9uTqZV/6vLM7PbDZ8/h5MWLKLsunEwWPX19aO/sgGaAHwRQAEIZIZQhZCTjGQ3DhGEZMJOdSBTFZb+aVpS3WlZ0QF1dgKA598OWVRC4zottXq5X/HfVDfTVF6287P2cpWQcQjRmr5aVMVNJ/rdaOnXcuE0oI0RBEJ925RxCMAiDQzCORnku6HgGyOIcYAamJ2fg16so5vPYuG4t1vX0RrlsblxvHPjW7LZ1335p8+4Lc4XuxU2A137+fKb4zjfEhPtkuf7M6z6eMyP2Ix+P2GCbZl99ReHCPFSBYcT4BmC/CGWagGEA9SowdRlALwADEA4AKzlpQDmT5FanAWEAdgpw0oBpXb2CHJAcUP8U0F2HDuFn/upfxfSFCwYGBgRsKzBVFKoguPDU9p3/ZS6V+ebnHHPoE471uXu3bfv0XLU6cHJkxDo3OorFag3CcVAotqPY3oF0Og0FBjcI4PkeLMuCYQgEYYAgCCCTqiBCibgpkRAQhgAXAoZpxosglVrRlOjKZD+tlo0zS6/4hobkjemTFUuGrvGAy/O9kWR4s2QfwfhS99MgWdS5tLCTQxjxOqW65yGIItiOg4zjwDbjhZqh78Or11ArVxC6LoTWsAAUM2k8tGM7Ng0OzUhuPPXKnj3f3Lf3ngMaqKaBSg7ApqeeSlX/+I+syyeP+xHaQwzuiKN5reLJCC6AVLKdXKuLNrntUUBOvh/LymLHM7TNKxSHrDItn3w6mj//yvzAj/zY/OxDO0Yn+7Nn+hgmcuPj921//e3CQKF9+8Li/IbFwDcW3Tomz5cQMkDYNuyUAyeVgm07UHY8sEZSIfR9gDXSWOIA9Koa2ng/syvf/4zPVfd9rSIF14rOcfWBwbvSS29xfOY0PrJo1M0VhhG/D4xBIwJPahUbgkNwBikjBL4Pv15HFLhxQM6AjCmwva2AznXDHi8Wxuv3PHR8atd9R9I2G1/T3fZWRyZ1+NDx/f7c019BGHrmZmlYOXeKiYWLEmMuMObKyssnUO/OQF5eYJCAntc6QAlA6RovpA6ow8ApCcgpQIaA4bzfd4GQmw/jgJXCrrHT+KGn/ghGKgt/7DQQrOyQXAeQBfS9AGuv1/EPLlzQfwzow5wrADC4gGWl/NAw/ZGurtk3H370WNd9j4/mFsrH+s4e2bj70Ntb+trb+msLi2vnq/XcTL2O6dERaMOAmXKQymSRclLgQiCu4CdgW1Y8Gy7jRaEyinPJ43KxceDKhEiqkzRmGRp5fdeLfm9ucdlcxAG34MmCWAmlkkpchtE8kyqVRBBGsC0LmUwm/u0oRK1Wg++6COt1IIpQ4Bx9hYLqyOd9s63jTL2n/8jMox+bmt287qQq1Y6cMXInaycmFzEzDsOrgbku0m+8rfS5syE/fSZC9xaFQUNDJRMpDPEkC+N0kpBcFwXk5AfXyI0AgNK8BqtrfPULwO+egJDtGPmb/517ZN3w8T6G47u6uv5iyMmv377zzs9F5fnPzFy8tOH4wYMdZy+cV0EUWimtBDgDMw0IHiduKK2hZByUawBKCAhhJOkay4PxK0a6Zl75tfzgo+KKe9DX/PYD0M30lPhp6xUzUnGNYjSb9TRKeFnJDBigk4WwEjKQiHwfke9D+x4MpbTJuTQED1K5fLj23nvTWzauPwev/u3v3rHhCwe29h4qS40uYTs9tYo5/PUvWEf+6Dd1uQ61+Jmf8POffjhiPAXk4hddOXpq+VvwHi+3DMjDwJnDSxcZ9vf1DhFyU2AMsFO4b+wM/sWBfe/rNwDgVwFdij8NEpwjCANUKvMQi3NAdzfeMYwAaRxIZZyDDzkb8zs78js2zi8+4Lj+T05fGrnn6KFD3tkzZ8xquWRp3+cpLmBaFjzfgxeGMC0LhmXBNA1oIy4dG0URVBQ3EJKcJZWsODhYUpXpqqeZpHJcq1slez8f+B/Ide/7WkN784dkUqax7gZJMSlwCEPEZxCEAaUVfN9FGEVwTANpIRAEHrxaDX7NReT7MKFVKuX4/UPDbO3mLXM9PT2n0u19X50udH7ne1uHR891F0IMAPjeW8L48287vQvjdsarhqFp1sMO24/6eqFPnqQZcPJ9oYCc/OAymfj/3/yPwH/+HUCawPQFHgUuO/VP/j8qnL6g8Y9+FVkhUE455ee2rD9d37Juoa1a2be1o3P4biez+c5Nm9fZ9eqD5Xpl6PziAi5MTmJuYRFeFCKVyaDY2Ym2YhF2KoVIa3hBAD8ImrPGy2efl4bCpUtVM8N6OXbtttPvMpZeN4y/YlZcAyvv+5qT8lfXbNEaV+R1xnmjzIh3pCzJs1FRBAXAtEwIgyPwPFQqFdRrVQSeB0NrZB0ba9vbsb67O+osFKbQ2fXazODga2994rGxs/ncxI++8fpU+vgfT5TfPobJmeHUiXLenvDn9NzYad8s5IIgrLAkGf/9vGpCyLWt/JwwBpgOJhen8PZb34F34Cl0t/cIpoVTMo6GXr8RHLjvf1s8fff9R8zS/FSbYb4+OD6+bmd7cc39a4cfqy6W9k7PLeTOTU+ziYsXsFivQwoBJ51BPp9HPpeDnUoh5TjNkolBGCJSEpGUUFrCMMyk/4NeOvhfVuVk+ZrKK0uu3ugJXs2w4vGBK9/AlWdEGz8prcA0ms2BGpVlDM7BoMG0gmAcJuO4PDKCWmkRmZSN9lwOQ8V2bOnZiN5icS6wnJdH77n7laO7dx1/yXHK6+aro1tHZqcGnt2vp4f7zNoD20J1dJ/Ek7+n+a69kRhcp3Xgghk6zi8k5PtEATn5wRnJApUjR4GTx5oXKwClqTHg0NuAUrCFQCS4Gsulqy5QnXPsi5vb501n5509M+25TTUdjeqJ8b29p88a1rGj7XP2eKeKwjbJuRVBIyyV4JbLiJRCqDXAORwnBcOykp0JW7FjaaazJBeyK4Lz5buWa2WZfBg7nsYs97Vi8xWPfI3SYnEzi2SnIjiggTAM4QeNFs0BoBQMwWBwgYwQaC/kYbe1yYyTXki3Fabatm0p2Vu3Tizm8ycL6czz3Uzsry54pYvHx9BxaASjM/uBxVeEe6lbTE0YuqwWwkpXd8iLbQpuBTCulzz/LpcSQpa74nPCAGGg4lYwOnIC6cU5dFgZAByROMC9Hd1sbvff0XMcZRTby+3AWb1u3etIp7vbd+8+ySqVI7nZ6eHhI0d6s8dP5oJydU0ItPkA3DBCdW4OZQ1wI84ZN2wbRpK2YQkRl5HlPFnsmQTAKk79uHKRp2aIm+SA4aNoENSYyFgaoZePPysPDBoaDebQWLgpknFeKvi1Gsq+DxlF4IwhZZtImwaG8zmItC3TjrPYNjAwVdi0aYZv3RrO9/cfCcCfXRgceGOms2N2FIAVAluCCbRfnEx3Xhxj7sJIpF5/SauFUVWd6FCB9KGjAMZQN5gwKCWFfN8oICc3yntOFTCttV2tBpdsc+LrO7bM+Kbxavf69R2fbutee393/92qtvgxG/rxycnJ3uNnz+DMhQuYnl+A5gxOJoN8WxuEbcNggNRxGxyml4LgWPzT8p0Jv8aTY9f74Ypd6bVn4uMLG9kzS6knemmWfPkxwIqFpAyNdJNGybJmcJ5UVDAYIDSgtUIkI+jAR+TW4XseqqUSTM7Q3dmJ4Y0bsX7tsO5s75i0C8VXgnTm5Yt3bH/j7Y3rLh4Hwq2lkvfIkRNB9stfsy69dpJ908kEcsuiNvsh7Vp7zY5ycKSjhWNBBxUKtwm5UbSGIQykUlkwDQSpvORa1BTPAFkVf+ATeQB1246+Nzg4VQf7dlrL5+9AYO3cun7t5sPbducq9c/59frD0/NzuVNnz4ozZ89hdn4ekZRIZTLIF4vIt7XBdmwIw4DScTqLVGpZ6nhcc3vlgskVTxhLUxo36C3B0ri5XGNYXJq0WFYpSykYgsMUHCqZgOFJg6QgDFF36yjPz8P3fDiOjVR7Ebl8FnfcdacaXjM4GsroYNjW9tz00NDbL2zaNHKuvX2RKaXXMBZkm08sHsejwX43fOk54N/9Q43ZSaYAtnDmsNanDmomBDLpx2GlnBv8LpHVjAJy0nKKQUaCxyVThJhICWN2fNPGkWN9nYdsge91zFf6h0cnU2sOHFgTnD2xU3C9LWRIl8IIY7OzmJ6YgISGLyUUGLhhwHJSSKVSsCwLtm3HVVoME5oxRJGMywiyxvzLUiOIeIHQsuY6cS/lZjOO5Rq53k2NnYZOOiklK0x50g1TsKQUIeJGP5wls+BJxZdGKkoYhXDrdbg1F7VqFb7ngSkJxzTRlsuhWChg69AatDspaI7RwLJOiba2hdS6jZPBho3TB3s6J+bzubOa89H5XPbyJOBJAEyI+GmWqxFmFplsExqhbDx3Cr8JuQklx/A64jwCEEUQrgUTs4NrFo7musYjJ3Wi3Q2+NXB+onND/8mezqEzfXx2esio1dZrzjsWfI9N1qooTS5goVyGHwQQjgPLccCFgGXbsO0UTMuC5VjNBeNaASqpex53CdXNDsrLZ9Kb3y2/LPm+sfC88TquumnjiKBxJMDjxZmMs+ZaGUPwZnlHpSRUFMWLVaMI0BoLi4uoVipQMoIBBtswkU2n0ZHLYqhYRL63NzJsZ5Zn86fNrp6zZndPaWbHpstH1vaPRlJNra1UznUFwWXOeQgAmsdlZK8KqxnTUBLwvaWXkdSj1Y2Gbh/BWQSyelFATm4uSmnuuv5IZ3H0jTWDowBeWosptvvsaLbn7rs3dHzi4YeFW3uQl0tbK5cnU/LoUVNdumhrpewgCLKRUrZmLG4OoSWEjCB9Den7CJKoU4FBs3hHEbebxoq20zxZQKniiDm+jF97oL2ybOLK9G+dzJzHFVKklvFMvlRxfVtocDCI5HRwnOcYfzkALEPAtkx4KoxkBC+VSXudvb3+4PC6cHDz5ijX2x0g5byilHw2FUaTlY7ec+eH1k6+056Tk9bVBxC88eTSjkIhE5fgMq6+HSHk5sU0YPl1LHDuv9XTM6oCb7So2IuZ9VvNLalC95r+no2+wTYrph8UnndX4cKFgnHyBHempiwEgekyZqYcJ206jhHF5/HAIh9SR/ClD84FGBPxWKlVMvOMZBH9yoWgcRO3ZPRrtK3H0ix3XBFr5WlC3cwrXDmZwRiglYpL3SKe0OCMIUp+qTFuQie1wRFfn+UctmkCQmhhmr6ZTtfy+Ta3Z2g46N68XhcGB8dYJnswspz9fqbtUD1fnD3ZmZ09lTYCAJCXL6NzdBQiDD/In4EmMMiHjgJyclNqjHZpANW33tDP/f2/X+W//PdO8b//K5NhFH1n88JC210zM507Bge775qY2CCCYJ0RhPeFvre5XK9jurSImdIiFkplzM3MoVytwatWoTVgZHLglh2nhIi4UoFpmiu+LMsEN00IIZqtqJckOximr86rTJ64hIbUccmxKAwRhBF814Xvugg8D2EQxDM8SoEls/O2YSCfyaCQz2GwuwuDQ0PobGvTtuPMRuBng3TmZNDeMSK6+8cur187+mJfx+K8Wyv3jo5V75+aruTqNZcHvmIqjTgxhxCyapnJ2p3nXwAujoM9+NnQjMLJahQuPLtly9GRoYFnhly3sLG3v39zoWP99lppkLu1XhXJPiMKd9dr9c6ZSgWTCwu4PDeL+blZLJYrCMMQUBrMMMANA0wYsJ0UsoU8TNuO00KSvO1GqcHG9/GMOJbS8pLhsdFJWSkFqVSzwVlc0SUO7IUQ8NwQ9XIZYRRAhiFCP0Do+1DJehkhBFK2g0I2i0ImA8cwsGn9WmwYGNBMqXrkpM7Izs6jLF08Vh1cc/byri0zb2bTc5eBmvLDGle6roQR1g0efeR/L0LeAwXk5KbEUmlASgSvvAL9+78H9+J5jSf/0sWWzS4eegjnuroQtbez4pZNuYzy+1hQ72el+svObHV9oeS2DVZK+a7F2VT94vlMZXQk59XqGa/uOlA6Z5t2BxfCCpVGqCR8FSFUCkEUIQg8yHoNVSkhk5zE5ixR48ktO93aDMhZUo8g+VHweAcT77g40oyhzTJhOTZsIWAzDgEAWte0RglaBzKXm0ZHx1Qmkw3SQ0Out3FdbXTd+kWZzU2EtepE3+T0WH+5PhO1d09f6OisjOczKAmApRwEALiU8QwSIWT1a/R/mJpkuHiR4R5fAYik1tGiY9cWOZ81MhlszOaOGkPD7Ze62npqabvdiaJOIwh32m59Tbpa0esvXsr0nz9fqMzPZ+sLi8XI89u0lG2csYwQgknB4SsN1/PhhyEiBshIxYvrl6WzNNJUGv8rqKVa51hZlpYxNOuiG0n/BM4YLMPAYC4Dg+dgM4YUACiNSKlIQ5eEac5bqXSFtxUXeXt7ybBTHrZsql/atKEc5HLzwcGDF9V3nrokK+7FUl//9OV3eoJJAV23bOCTnwTWrrvqbTQcB6liEcKmcqyktSggJzclls0Cnovo3/4bRN/8VhztvvgiMDMDfOlLamH7dixwoeGFZQS8DF48jZ6u57N9jN9TR3r9yETRHj/d1dnd2dF/zz19wvc7mUKOaQyJILwPUTQcRVL6dZdVFkuoVsqstLjIFkuLqFWrrFKpQPoeC8MAUmtwwVmznKHWzXVGccdM1kx/AYuXlTLD0KZpatu2kUmnkclmVbFY1MViO9raCiKTy1WYaUyCixEFNqEZc5XtHI/S6SOaier4QN/8yQ3r5s5DB5UgADrbcXck0TExBWY4EL6PtM6gJiWcMFxakEUIuU0kn/hUSiOb1eAcSM7kLT/DmHbr4bxSU88PDkzN5TKMxaH8l4cBsR3I9m4Y7+7atHmwz/O7DNdby8NwiMtwgEfROqZ0D5MyvVgus5GJCT1fWmRKKea7LnNrNeb7PvM8j/m+DyUbzXiSgFwpREn6CUsauiUz65oLAcPgMAxTm6YJQxhaa60729uxpr9PZ9Jpnc5kWLZQ4GYqNauYuKA5G5dCXJCmeRmGMRLZ6bEwkysdWjMws7+3o1oHgMOHgD/9Y6BSWflWpVLA7/5uHJCXSkmhcgYYBvzJSZQmJhBks0A+f8P/aoRcDwXk5Fagr/m97wP/9rc5vnoCaL9P4e89Cv4T61Uhg+r0/ufrR3/7d2bxv/6ybf30T6X43JzNNEwAWa3UX6Sgcm2RFoV5WNnJkm0tTtrd1flUl1dLydCzZeDZKoxMpSQHlC2gHTCYYAyaM25KyVJhGNdEEVyDM0AIBcYiRBKRZXl+Jl2HMH1uOS7LpD1k2up+ruiNFduCuUK6NmOiFjJWAmO1wDDktsuTi3eMXy5phgBOSkJwhX/374D9+4Ff+zWgvf0jf+MJIatKM3nbAKTQunSyvb0+2tY2baVSKcH5fqZ1RpcrKcN1synOsv2Verat5lncYrrT95xUqZTnpVIGpVJOeV5G+34aUWTKKBKW48DOZiG50n7d5VG5bqpIggkeMcEVOI8YFxE4j2AaPjeMELbta9PylUaQyeWDXLEYhH5YH7Ht2sU1fW49k66aUlXBWD0QosqA+q5LI7UNswt1qVVwneLfHIBAPG+iEAQSv/7rGl/6EuB5S7diDJdmZrCYSmH+//6/gb6+j+BPQMi1UUBObhVXTwBLCbz1PMPBZxkQafz03ToCMP7mYVT/8M/Vxdf2ufhbv+gCWERHx4pftQB0aGAoDawxiyybyxjZWqfjSDclWGQJFdlCKZMxzTm0JZR0wGGCM2ZqxRazGTbZ1sal4BDQGowDnCvNWBRqpvOu6w7Uq3Um4XuW4/nplFu1C/Wqkw9n221cSHFMYGX5xbZSCdt9Hyw5FS0A8AP7OZ56iuF//0cKnd00CU4I+YEZACwpIcIQc6lUeMl1S3jzzRImJ4FCAdi5E+jtgQHAzYTYFCqwnIWsYGZbvZ5x5ufT1txcnvt+Rvh+2gBMJ5vlc2OjmDh5CnYoVE9fv8jt3W4Ky0TkBZHmcUCuOY8U55EyjBCGEUSW5Ssn5VvtneH0ydP+mTffCDJbdrj1u++MzuZs1MTVC+qHxi9jo+9BBgG4kjCxopwtT76WflFKhgMHNA4cAK5YZVoGUDYM4MkngYEBYN26pfx8Qj5CFJCTWxgD0C6BXgAFoK0bbvkyDv6Dvwv94ssMts3gpK5Yzh8zEJ/OtQIwVpfQbj2K3GrVj7waR8i4DMGlBINmDBpcyzhnnANZP2Cn2grsW5s3scAwmCllc+DXgI6E0NsmJ9Vnjk+qtBfCS2cRKalVxMGUYLZlaEtwwMT7aSJBSeGEkBtrfBz4lV9heOMNjs5Oht/7PSl+7Md0BkAqDJjwAsiciSiMorBUKrNSqSIrlSnu+4z5PjMYg3AcHNn3Mp7697+JHj+n9z72I1j/C59jmcFO+OVKXIWFc2jOteYc2jCgDUMr24IOQ4h8UV944Tk8+8/+L+z+W7+MnoceZPz7K8eqcP1xMylGe8X9RhHwH/4DcPYs8Id/CHR2fh8PS8gPhgJysnowBq0lIrcOLHXbea8B/crr33MHwKChGEOY1PVu/L+c5CsnaAgh5KalNeC6AKBRq2msqCr17mOknU6jOjWFA9/8Jg48/RRC3weQw8KJSzj7J99F3yfuRvvOdVBKrywLm7AyWVTKZRz5z7+Jw088gdB1ceFLT2C6LQ/vl34R6PpQg+N3H99dF9d8koR8BKg2GlnNaGQlhJD3J27TEH+977HTchz49ToOPfMMps+c5wCsdK49q4Ioc/nFQ6x04hKYYYBdo7kaEFc5CT0PJ7/5DUyfOM4A8JnRi+ziX34FYaX8YbyuK13zrCkhrcY0HQ0SQgghhBDSMjRDTgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAtRQE4IIYQQQkgLUUBOCCGEEEJIC1FATgghhBBCSAv9v8xhW1HHxtCzAAAAAElFTkSuQmCC"
-DEFAULT_RULES_TEXT = """Images = jpg,jpeg,png
-Videos = mp4,mov,mkv,avi
-Audio = mp3,wav,flac,aac
-Documents = pdf,doc,docx,txt
-"""
-
-
-def load_settings():
-    if CONFIG_PATH.exists():
-        try:
-            return json.loads(CONFIG_PATH.read_text())
-        except Exception:
-            return {}
-    return {}
-
-
-def save_settings(data):
-    try:
-        CONFIG_PATH.write_text(json.dumps(data, indent=2))
-    except Exception as e:
-        print(f"[WARN] Could not save settings: {e}")
-
-
-def parse_rules_text(text: str) -> Optional[Dict[str, List[str]]]:
-    text = text.strip()
-    if not text:
-        return None
-    rules: Dict[str, List[str]] = {}
-    for line in text.splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
-            continue
-        cat, exts = line.split("=", 1)
-        cat = cat.strip()
-        ext_list = [e.strip() for e in exts.split(",") if e.strip()]
-        if ext_list:
-            rules[cat] = ext_list
-    return rules if rules else None
-
-
-
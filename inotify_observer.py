@@ -0,0 +1,276 @@
+import ctypes
+import errno
+import os
+import select
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from watchdog.events import (
+    DirCreatedEvent, DirDeletedEvent, DirModifiedEvent, DirMovedEvent, FileClosedEvent, FileCreatedEvent,
+    FileDeletedEvent, FileModifiedEvent, FileMovedEvent, FileSystemEvent, FileSystemEventHandler,
+)
+from watchdog.observers.api import ObservedWatch
+from watchdog.observers.inotify_c import Inotify, InotifyConstants, inotify_add_watch, inotify_init, inotify_rm_watch
+
+
+# Bytes asked for per read; a fuller queue just takes more reads.
+READ_BUFFER_BYTES = 64 * 1024
+# How long a rename out of a folder waits for its other half before it counts as a delete.
+MOVE_PAIR_SECONDS = 0.1
+
+C = InotifyConstants
+EVENT_MASK = (C.IN_CREATE | C.IN_MODIFY | C.IN_ATTRIB | C.IN_CLOSE_WRITE | C.IN_DELETE
+              | C.IN_MOVED_FROM | C.IN_MOVED_TO | C.IN_DONT_FOLLOW | C.IN_ONLYDIR)
+
+# (watch descriptor, mask, cookie, name) as read from the kernel
+RawEvent = Tuple[int, int, int, bytes]
+Handlers = Set[FileSystemEventHandler]
+
+
+class InotifyObserver:
+    """watchdog's Observer API on one inotify instance for every scheduled folder (Linux only).
+
+    watchdog gives each folder its own inotify instance plus an emitter and a
+    buffer thread; here a folder only adds watch descriptors, and one thread
+    reads the instance and dispatches. on_overflow() is called when the
+    kernel queue overflowed and events were lost.
+    """
+
+    def __init__(self, on_overflow: Optional[Callable[[], None]] = None) -> None:
+        self.on_overflow = on_overflow
+        fd = inotify_init()
+        if fd == -1:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        os.set_inheritable(fd, False)
+        self._fd = fd
+        self._kill_r, self._kill_w = os.pipe()
+        self._lock = threading.Lock()
+        # Set once the reader thread has closed the descriptors
+        self._closed = False
+        self._path_of: Dict[int, str] = {}
+        self._wd_of: Dict[str, int] = {}
+        # Watches that need each descriptor; it is removed from the kernel with the last one
+        self._owners: Dict[int, Set[ObservedWatch]] = {}
+        self._handlers: Dict[ObservedWatch, Handlers] = {}
+        # Renames out of a folder, by cookie, until the rename into the new folder is read
+        self._moved_from: Dict[int, Tuple[str, Handlers]] = {}
+        self._thread = threading.Thread(target=self._run, name="watcher-inotify", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        with self._lock:
+            if not self._closed:
+                os.write(self._kill_w, b"!")
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        if self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+
+    def schedule(self, event_handler: FileSystemEventHandler, path: str, recursive: bool = False) -> ObservedWatch:
+        """Watch path (and its subfolders if recursive); raises OSError if that is not possible."""
+        watch = ObservedWatch(path, recursive=recursive)
+        with self._lock:
+            handlers = self._handlers.get(watch)
+            if handlers is not None:
+                handlers.add(event_handler)
+                return watch
+            try:
+                self._add_tree(str(path), {watch}, top=True)
+            except OSError:
+                # Leave nothing of a half-added tree behind
+                self._release(watch)
+                raise
+            self._handlers[watch] = {event_handler}
+        return watch
+
+    def unschedule(self, watch: ObservedWatch) -> None:
+        with self._lock:
+            self._handlers.pop(watch, None)
+            if not self._closed:
+                self._release(watch)
+
+    def remove_handler_for_watch(self, event_handler: FileSystemEventHandler, watch: ObservedWatch) -> None:
+        """Kept for parity with watchdog; a failed schedule() leaves no handler behind."""
+
+    # Called with self._lock held from here on.
+
+    def _add(self, path: str, owners: Set[ObservedWatch], top: bool = False) -> None:
+        wd = inotify_add_watch(self._fd, os.fsencode(path), EVENT_MASK)
+        if wd == -1:
+            err = ctypes.get_errno()
+            if top or err in (errno.ENOSPC, errno.EMFILE):
+                raise OSError(err, os.strerror(err), path)
+            # A subfolder that vanished or cannot be read
+            return
+        # Adding a folder twice (nested roots) returns the same descriptor
+        if wd not in self._path_of:
+            self._path_of[wd] = path
+            self._wd_of[path] = wd
+        self._owners.setdefault(wd, set()).update(owners)
+
+    def _add_tree(self, path: str, owners: Set[ObservedWatch], top: bool = False) -> None:
+        self._add(path, owners, top)
+        if not any(w.is_recursive for w in owners):
+            return
+        deep = {w for w in owners if w.is_recursive}
+        for folder, dirnames, _ in os.walk(path):
+            for name in dirnames:
+                sub = os.path.join(folder, name)
+                if not os.path.islink(sub):
+                    self._add(sub, deep)
+
+    def _drop(self, wd: int) -> None:
+        path = self._path_of.pop(wd, None)
+        if path is not None and self._wd_of.get(path) == wd:
+            del self._wd_of[path]
+        self._owners.pop(wd, None)
+
+    def _release(self, watch: ObservedWatch) -> None:
+        for wd in [wd for wd, owners in self._owners.items() if watch in owners]:
+            owners = self._owners[wd]
+            owners.discard(watch)
+            if not owners:
+                self._drop(wd)
+                inotify_rm_watch(self._fd, wd)
+
+    def _drop_tree(self, path: str) -> None:
+        prefix = path + os.sep
+        for wd in [wd for p, wd in self._wd_of.items() if p == path or p.startswith(prefix)]:
+            self._drop(wd)
+            inotify_rm_watch(self._fd, wd)
+
+    def _deep_owners(self, wd: int) -> Set[ObservedWatch]:
+        return {w for w in self._owners.get(wd, ()) if w.is_recursive}
+
+    def _handlers_of(self, wd: int) -> Handlers:
+        handlers: Handlers = set()
+        for watch in self._owners.get(wd, ()):
+            handlers |= self._handlers.get(watch, set())
+        return handlers
+
+    def _created(self, wd: int, path: str, is_dir: bool, out: List[Tuple[FileSystemEvent, Handlers]]) -> None:
+        handlers = self._handlers_of(wd)
+        if not is_dir:
+            out.append((FileCreatedEvent(path), handlers))
+            return
+        out.append((DirCreatedEvent(path), handlers))
+        owners = self._deep_owners(wd)
+        if not owners:
+            return
+        try:
+            self._add_tree(path, owners)
+        except OSError as e:
+            print(f"[WARN] Not watching new folder '{path}': {e}")
+            return
+        # Files can land before the new folder's watch exists
+        for folder, dirnames, filenames in os.walk(path):
+            out.extend((DirCreatedEvent(os.path.join(folder, n)), handlers) for n in dirnames)
+            out.extend((FileCreatedEvent(os.path.join(folder, n)), handlers) for n in filenames)
+
+    def _moved(self, wd: int, src: str, dest: str, is_dir: bool, src_handlers: Handlers, out: List[Tuple[FileSystemEvent, Handlers]]) -> None:
+        handlers = self._handlers_of(wd) | src_handlers
+        if not is_dir:
+            out.append((FileMovedEvent(src, dest), handlers))
+            return
+        out.append((DirMovedEvent(src, dest), handlers))
+        # Watch the folder again under its new name, or not at all if nothing there is recursive
+        self._drop_tree(src)
+        owners = self._deep_owners(wd)
+        if not owners:
+            return
+        try:
+            self._add_tree(dest, owners)
+        except OSError as e:
+            print(f"[WARN] Not watching moved folder '{dest}': {e}")
+            return
+        for folder, _, filenames in os.walk(dest):
+            before = src + folder[len(dest):]
+            out.extend((FileMovedEvent(os.path.join(before, n), os.path.join(folder, n)), handlers) for n in filenames)
+
+    def _translate(self, raw: List[RawEvent], final: bool) -> Tuple[List[Tuple[FileSystemEvent, Handlers]], List[RawEvent], bool]:
+        """(events to dispatch, raw events held back for pairing, whether the kernel queue overflowed)."""
+        out: List[Tuple[FileSystemEvent, Handlers]] = []
+        overflow = False
+        moved_to = {cookie for _, mask, cookie, _ in raw if mask & C.IN_MOVED_TO}
+        for i, (wd, mask, cookie, name) in enumerate(raw):
+            if mask & C.IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            if mask & C.IN_MOVED_FROM and cookie not in moved_to and not final:
+                # Hold this and everything after it, in order, until the other half shows up
+                return out, raw[i:], overflow
+            if mask & C.IN_IGNORED:
+                # Folder deleted or unmounted
+                self._drop(wd)
+                continue
+            base = self._path_of.get(wd)
+            if base is None or not name:
+                if mask & C.IN_MOVED_TO:
+                    self._moved_from.pop(cookie, None)
+                continue
+            path = os.path.join(base, os.fsdecode(name))
+            is_dir = bool(mask & C.IN_ISDIR)
+            if mask & C.IN_MOVED_FROM:
+                if cookie in moved_to:
+                    self._moved_from[cookie] = (path, self._handlers_of(wd))
+                else:
+                    # Moved out of every watched folder
+                    out.append((DirDeletedEvent(path) if is_dir else FileDeletedEvent(path), self._handlers_of(wd)))
+                    if is_dir:
+                        self._drop_tree(path)
+            elif mask & C.IN_MOVED_TO:
+                src = self._moved_from.pop(cookie, None)
+                if src is None:
+                    # Moved in from outside
+                    self._created(wd, path, is_dir, out)
+                else:
+                    self._moved(wd, src[0], path, is_dir, src[1], out)
+            elif mask & C.IN_CREATE:
+                self._created(wd, path, is_dir, out)
+            elif mask & C.IN_CLOSE_WRITE:
+                out.append((FileClosedEvent(path), self._handlers_of(wd)))
+            elif mask & (C.IN_MODIFY | C.IN_ATTRIB):
+                out.append((DirModifiedEvent(path) if is_dir else FileModifiedEvent(path), self._handlers_of(wd)))
+            elif mask & C.IN_DELETE:
+                out.append((DirDeletedEvent(path) if is_dir else FileDeletedEvent(path), self._handlers_of(wd)))
+        return out, [], overflow
+
+    def _run(self) -> None:
+        poller = select.poll()
+        poller.register(self._fd, select.POLLIN)
+        poller.register(self._kill_r, select.POLLIN)
+        held: List[RawEvent] = []
+        held_since = 0.0
+        try:
+            while True:
+                timeout = max(0.0, held_since + MOVE_PAIR_SECONDS - time.monotonic()) * 1000 if held else None
+                ready = {fd for fd, _ in poller.poll(timeout)}
+                if self._kill_r in ready:
+                    return
+                raw = held
+                if self._fd in ready:
+                    raw = raw + list(Inotify._parse_event_buffer(os.read(self._fd, READ_BUFFER_BYTES)))
+                final = bool(held) and time.monotonic() - held_since >= MOVE_PAIR_SECONDS
+                with self._lock:
+                    out, rest, overflow = self._translate(raw, final)
+                if rest and rest[0] is not (held[0] if held else None):
+                    held_since = time.monotonic()
+                held = rest
+                for event, handlers in out:
+                    for handler in handlers:
+                        try:
+                            handler.dispatch(event)
+                        except Exception as e:
+                            print(f"[ERROR] Failed to handle {event.event_type} '{event.src_path}': {e}")
+                if overflow and self.on_overflow is not None:
+                    self.on_overflow()
+        finally:
+            with self._lock:
+                self._closed = True
+            os.close(self._fd)
+            os.close(self._kill_r)
+            os.close(self._kill_w)
@@ -0,0 +1,327 @@
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+
+# Journal records, one JSON object per line:
+#   {"seq": 7, "op": "begin", "t": ..., "src": ..., "dest": ..., "size": ..., "rule": ...}
+#   {"seq": 7, "op": "done" | "abort" | "undo"}
+#   {"seq": 7, "op": "checkpoint", "t": ...}
+# A "begin" is durable before its move starts; the closing record is not waited for,
+# so a crash leaves at most the in-flight moves open, and replay() resolves those.
+# Once the file passes JOURNAL_SEGMENT_BYTES it is renamed to a closed segment
+# (journal.<ms>.jsonl, <ms> being when it was closed). The new file starts with a
+# checkpoint carrying the last sequence number, then a copy of the "begin" of every
+# move still open. Replay only reads the current file; undo only reads segments
+# closed after the time it goes back to.
+
+# Size at which the journal moves on to a new file.
+JOURNAL_SEGMENT_BYTES = 8 * 1024 * 1024
+# Closed segments older than this are deleted; moves in them can no longer be undone.
+JOURNAL_RETENTION_SECONDS = 90 * 86400
+
+
+def read_records(path: Path, end: Optional[int] = None) -> Iterator[Dict]:
+    """Stream records from the journal (up to byte offset end); torn lines are skipped."""
+    try:
+        fh = open(path, "rb")
+    except FileNotFoundError:
+        return
+    with fh:
+        read = 0
+        for line in fh:
+            read += len(line)
+            if end is not None and read > end:
+                return
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Last line of a crash
+                continue
+            if isinstance(record, dict):
+                yield record
+
+
+# Appends only need the data and the file length on disk
+_sync = getattr(os, "fdatasync", os.fsync)
+
+
+def _size(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
+
+
+class Journal:
+    """Append-only move journal with group commit: one fsync covers every record queued meanwhile."""
+
+    def __init__(self, path: Path, segment_bytes: int = JOURNAL_SEGMENT_BYTES) -> None:
+        self.path = path
+        # 0 never rotates
+        self.segment_bytes = segment_bytes
+        self._end_torn_line()
+        self._seq = self.replay()
+        self._fh = open(path, "ab")
+        self._cond = threading.Condition()
+        self._pending: list = []
+        # "begin" lines of moves whose closing record is not queued yet
+        self._open: Dict[int, bytes] = {}
+        self._queued = 0
+        self._synced = 0
+        self._closing = False
+        self._rotate_if_full()
+        self._thread = threading.Thread(target=self._run, name="watcher-journal", daemon=True)
+        self._thread.start()
+
+    def _end_torn_line(self) -> None:
+        # A crash mid-write leaves a partial last line; start appends on a fresh one
+        try:
+            with open(self.path, "rb+") as fh:
+                if fh.seek(0, os.SEEK_END) == 0:
+                    return
+                fh.seek(-1, os.SEEK_END)
+                if fh.read(1) != b"\n":
+                    fh.write(b"\n")
+        except FileNotFoundError:
+            pass
+
+    def replay(self) -> int:
+        """Finish or roll back moves left open by a crash; returns the last sequence number."""
+        last = 0
+        open_moves: Dict[int, Dict] = {}
+        for record in read_records(self.path):
+            seq = record.get("seq")
+            if not isinstance(seq, int):
+                continue
+            last = max(last, seq)
+            if record.get("op") == "begin":
+                open_moves[seq] = record
+            else:
+                open_moves.pop(seq, None)
+        if last == 0:
+            # Missing or empty: a crash may have come between closing a segment and starting this file
+            for segment in segment_paths(self.path, 0)[-1:]:
+                last = max((r["seq"] for r in read_records(segment) if isinstance(r.get("seq"), int)), default=0)
+        if not open_moves:
+            return last
+        resolved = []
+        for seq, record in sorted(open_moves.items()):
+            src, dest, size = record.get("src", ""), record.get("dest", ""), record.get("size")
+            src_size, dest_size = _size(src), _size(dest)
+            if src_size is None and dest_size is not None:
+                op = "done"
+            elif src_size is not None and src_size == size and dest_size == size and size:
+                # The copy was complete and durable; only deleting the source was left
+                try:
+                    os.unlink(src)
+                    op = "done"
+                except OSError as e:
+                    print(f"[ERROR] Cannot finish move of '{src}': {e}")
+                    continue
+            elif src_size is not None:
+                if dest_size == 0:
+                    # Still the empty placeholder
+                    try:
+                        os.unlink(dest)
+                    except OSError:
+                        pass
+                op = "abort"
+            else:
+                print(f"[WARN] '{src}' is gone and never reached '{dest}'")
+                op = "abort"
+            print(f"[INFO] Journal: {'finished' if op == 'done' else 'rolled back'} move of '{Path(src).name}'")
+            resolved.append({"seq": seq, "op": op})
+        with open(self.path, "ab") as fh:
+            fh.write(b"".join(self._encode(r) for r in resolved))
+            fh.flush()
+            os.fsync(fh.fileno())
+        return last
+
+    @staticmethod
+    def _encode(record: Dict) -> bytes:
+        return (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+
+    def _append(self, record: Dict, wait: bool) -> None:
+        line = self._encode(record)
+        with self._cond:
+            if record["op"] == "begin":
+                self._open[record["seq"]] = line
+            else:
+                self._open.pop(record["seq"], None)
+            self._pending.append(line)
+            self._queued += 1
+            ticket = self._queued
+            self._cond.notify_all()
+            if wait:
+                while self._synced < ticket and not self._closing:
+                    self._cond.wait()
+
+    def begin(self, src: Path, dest: Path, size: int, rule: str) -> int:
+        """Record an intended move and return once it is on disk."""
+        with self._cond:
+            self._seq += 1
+            seq = self._seq
+        self._append({"seq": seq, "op": "begin", "t": round(time.time(), 3), "src": str(src), "dest": str(dest), "size": size, "rule": rule}, wait=True)
+        return seq
+
+    def finish(self, seq: int, op: str = "done") -> None:
+        """Close a move as done, abort or undo; written with the next batch."""
+        self._append({"seq": seq, "op": op}, wait=False)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closing:
+                    self._cond.wait()
+                if not self._pending and self._closing:
+                    return
+                # Everything queued while the last fsync ran goes out together
+                batch, self._pending = self._pending, []
+                ticket = self._queued
+            try:
+                self._fh.write(b"".join(batch))
+                self._fh.flush()
+                _sync(self._fh.fileno())
+            except OSError as e:
+                print(f"[ERROR] Journal write failed: {e}")
+            with self._cond:
+                self._synced = ticket
+                self._cond.notify_all()
+                self._rotate_if_full()
+
+    def _rotate_if_full(self) -> None:
+        # Called with the lock held, between writes
+        if not self.segment_bytes:
+            return
+        try:
+            if self._fh.tell() < self.segment_bytes:
+                return
+            self._fh.close()
+            closed = time.time()
+            while segment_path(self.path, closed).exists():
+                closed += 0.001
+            os.replace(self.path, segment_path(self.path, closed))
+            self._fh = open(self.path, "ab")
+            # Lines still pending are written to the new file anyway
+            queued = set(self._pending)
+            carried = [line for line in self._open.values() if line not in queued]
+            self._fh.write(self._encode({"seq": self._seq, "op": "checkpoint", "t": round(closed, 3)}) + b"".join(carried))
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
+        except OSError as e:
+            print(f"[ERROR] Journal rotation failed: {e}")
+            if self._fh.closed:
+                self._fh = open(self.path, "ab")
+            return
+        for old in segment_paths(self.path, 0)[:-1]:
+            if closed - segment_closed(old) > JOURNAL_RETENTION_SECONDS:
+                try:
+                    old.unlink()
+                except OSError:
+                    pass
+
+    def close(self) -> None:
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        self._thread.join(timeout=5)
+        try:
+            self._fh.close()
+        except OSError:
+            pass
+
+
+def shard_path(path: Path, index: int) -> Path:
+    """Journal of one worker process in a sharded daemon; each process needs its own writer."""
+    return path.with_name(f"{path.stem}.shard{index}{path.suffix}")
+
+
+def shard_paths(path: Path) -> List[Path]:
+    """Every shard journal written next to path (their closed segments not included)."""
+    shard = re.compile(re.escape(path.stem) + r"\.shard\d+" + re.escape(path.suffix) + "$")
+    return sorted(p for p in path.parent.glob(f"{path.stem}.shard*{path.suffix}") if shard.match(p.name))
+
+
+def segment_path(path: Path, closed: float) -> Path:
+    """Name a journal file gets once it is closed at epoch seconds closed."""
+    return path.with_name(f"{path.stem}.{int(closed * 1000)}{path.suffix}")
+
+
+def segment_closed(segment: Path) -> float:
+    """Epoch seconds at which a closed segment was closed."""
+    return int(segment.stem.rsplit(".", 1)[1]) / 1000
+
+
+def segment_paths(path: Path, since: float) -> List[Path]:
+    """Closed segments of the journal at path closed at or after since, oldest first."""
+    closed = re.compile(re.escape(path.stem) + r"\.\d+" + re.escape(path.suffix) + "$")
+    segments = [p for p in path.parent.glob(f"{path.stem}.*{path.suffix}") if closed.match(p.name)]
+    return sorted((p for p in segments if segment_closed(p) >= since), key=segment_closed)
+
+
+_RELATIVE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smhdw])\s*$", re.IGNORECASE)
+_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def parse_since(text: str) -> float:
+    """Epoch seconds for '30m'/'2h'/'1d' ago, an ISO date/time, or a raw epoch."""
+    m = _RELATIVE.match(text)
+    if m:
+        return time.time() - float(m.group(1)) * _UNIT_SECONDS[m.group(2).lower()]
+    try:
+        return datetime.fromisoformat(text.strip()).timestamp()
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        raise ValueError(f"Cannot read '{text}' as a time; use e.g. 30m, 2h, 1d or 2024-05-01T14:00")
+
+
+def _history(journal: Journal, since: float, end: int) -> Iterator[Dict]:
+    # Segments closed before since hold only moves that began before it
+    for segment in segment_paths(journal.path, since):
+        yield from read_records(segment)
+    yield from read_records(journal.path, end)
+
+
+def undo_since(journal: Journal, since: float, move_back) -> Tuple[int, int]:
+    """Reverse every completed move that began at or after since; returns (undone, failed).
+
+    Streams the journal twice: once for moves undone by an earlier run,
+    once to undo the rest. Only open moves and undone sequence numbers
+    are held in memory. The journal should not rotate meanwhile
+    (segment_bytes=0).
+    """
+    end = os.path.getsize(journal.path) if journal.path.exists() else 0
+    undone: Set[int] = set()
+    for record in _history(journal, since, end):
+        if record.get("op") == "undo" and isinstance(record.get("seq"), int):
+            undone.add(record["seq"])
+    ok = failed = 0
+    begun: Dict[int, Dict] = {}
+    for record in _history(journal, since, end):
+        seq, op = record.get("seq"), record.get("op")
+        if not isinstance(seq, int):
+            continue
+        if op == "begin":
+            if record.get("t", 0) >= since and seq not in undone:
+                begun[seq] = record
+            continue
+        entry = begun.pop(seq, None)
+        if entry is None or op != "done":
+            continue
+        try:
+            move_back(Path(entry["dest"]), Path(entry["src"]))
+            journal.finish(seq, "undo")
+            ok += 1
+        except OSError as e:
+            print(f"[ERROR] Cannot undo '{entry['dest']}': {e}")
+            failed += 1
+    return ok, failed
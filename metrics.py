@@ -0,0 +1,363 @@
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is +Inf.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# Seconds between JSON stats dumps when no interval is configured.
+DEFAULT_STATS_INTERVAL = 60.0
+
+
+class Histogram:
+    """Fixed-bucket histogram; observing is a bisect and two additions."""
+
+    __slots__ = ("counts", "count", "total")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile by interpolating inside its bucket."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = LATENCY_BUCKETS[i - 1] if i else 0.0
+                if i == len(LATENCY_BUCKETS):
+                    # Beyond the last bound there is nothing to interpolate against
+                    return lower
+                return lower + (LATENCY_BUCKETS[i] - lower) * (rank - seen) / n
+            seen += n
+        return LATENCY_BUCKETS[-1]
+
+    def summary(self) -> Dict:
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+class Metrics:
+    """Counters and histograms per root and category, shared by every handler of an Organizer."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self._received: Dict[str, int] = {}
+        self._moved: Dict[Tuple[str, str], int] = {}
+        self._failed: Dict[Tuple[str, str], int] = {}
+        self._bytes: Dict[Tuple[str, str], int] = {}
+        self._wait: Dict[str, Histogram] = {}
+        self._duration: Dict[Tuple[str, str], Histogram] = {}
+        self._latency: Dict[Tuple[str, str], Histogram] = {}
+        # name -> (help, callback); read only when metrics are exported
+        self._gauges: Dict[str, Tuple[str, Callable[[], float]]] = {}
+        # name -> (label, callback returning {label value: {field: value}})
+        self._tables: Dict[str, Tuple[str, Callable[[], Dict[str, Dict[str, float]]]]] = {}
+
+    def gauge(self, name: str, help_text: str, fn: Callable[[], float]) -> None:
+        self._gauges[name] = (help_text, fn)
+
+    def table(self, name: str, label: str, fn: Callable[[], Dict[str, Dict[str, float]]]) -> None:
+        """Export fn()'s rows under name in the JSON stats, and as watcher_<name>_<field>{label=...}."""
+        self._tables[name] = (label, fn)
+
+    def _read_tables(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        values: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for name, (_, fn) in list(self._tables.items()):
+            try:
+                values[name] = fn()
+            except Exception:
+                pass
+        return values
+
+    def received(self, root: str) -> None:
+        with self._lock:
+            self._received[root] = self._received.get(root, 0) + 1
+
+    def ready(self, root: str, wait: float) -> None:
+        with self._lock:
+            hist = self._wait.get(root)
+            if hist is None:
+                hist = self._wait[root] = Histogram()
+            hist.observe(wait)
+
+    def moved(self, root: str, category: str, size: int, duration: float, latency: float) -> None:
+        key = (root, category)
+        with self._lock:
+            self._moved[key] = self._moved.get(key, 0) + 1
+            self._bytes[key] = self._bytes.get(key, 0) + size
+            hist = self._duration.get(key)
+            if hist is None:
+                hist = self._duration[key] = Histogram()
+            hist.observe(duration)
+            hist = self._latency.get(key)
+            if hist is None:
+                hist = self._latency[key] = Histogram()
+            hist.observe(latency)
+
+    def failed(self, root: str, category: str) -> None:
+        key = (root, category)
+        with self._lock:
+            self._failed[key] = self._failed.get(key, 0) + 1
+
+    def _read_gauges(self) -> Dict[str, float]:
+        values: Dict[str, float] = {}
+        for name, (_, fn) in list(self._gauges.items()):
+            try:
+                values[name] = float(fn())
+            except Exception:
+                pass
+        return values
+
+    def snapshot(self) -> Dict:
+        """JSON-ready copy of every metric."""
+        with self._lock:
+            roots: Dict[str, Dict] = {}
+
+            def root_entry(root: str) -> Dict:
+                return roots.setdefault(root, {"received": 0, "readiness_wait": None, "categories": {}})
+
+            def category_entry(key: Tuple[str, str]) -> Dict:
+                cats = root_entry(key[0])["categories"]
+                return cats.setdefault(key[1], {"moved": 0, "failed": 0, "bytes": 0})
+
+            for root, n in self._received.items():
+                root_entry(root)["received"] = n
+            for root, hist in self._wait.items():
+                root_entry(root)["readiness_wait"] = hist.summary()
+            for key, n in self._moved.items():
+                category_entry(key)["moved"] = n
+            for key, n in self._failed.items():
+                category_entry(key)["failed"] = n
+            for key, n in self._bytes.items():
+                category_entry(key)["bytes"] = n
+            for key, hist in self._duration.items():
+                category_entry(key)["move_duration"] = hist.summary()
+            for key, hist in self._latency.items():
+                category_entry(key)["event_to_move"] = hist.summary()
+            totals = {
+                "received": sum(self._received.values()),
+                "moved": sum(self._moved.values()),
+                "failed": sum(self._failed.values()),
+                "bytes": sum(self._bytes.values()),
+            }
+        return {
+            "time": time.time(),
+            "uptime": round(time.time() - self.started, 3),
+            "totals": totals,
+            "gauges": self._read_gauges(),
+            **self._read_tables(),
+            "roots": roots,
+        }
+
+    def prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def labels(root: str, category: Optional[str] = None, extra: str = "") -> str:
+            parts = [f'root="{_escape(root)}"']
+            if category is not None:
+                parts.append(f'category="{_escape(category)}"')
+            if extra:
+                parts.append(extra)
+            return "{" + ",".join(parts) + "}"
+
+        def counter(name: str, help_text: str, values: Dict) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for key, n in values.items():
+                lbl = labels(key) if isinstance(key, str) else labels(*key)
+                lines.append(f"{name}{lbl} {n}")
+
+        def histogram(name: str, help_text: str, values: Dict) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for key, hist in values.items():
+                root, category = (key, None) if isinstance(key, str) else key
+                cumulative = 0
+                for bound, n in zip(LATENCY_BUCKETS, hist.counts):
+                    cumulative += n
+                    le = 'le="%s"' % bound
+                    lines.append(f"{name}_bucket{labels(root, category, le)} {cumulative}")
+                le = 'le="+Inf"'
+                lines.append(f"{name}_bucket{labels(root, category, le)} {hist.count}")
+                lines.append(f"{name}_sum{labels(root, category)} {hist.total}")
+                lines.append(f"{name}_count{labels(root, category)} {hist.count}")
+
+        with self._lock:
+            counter("watcher_files_received_total", "Files picked up from events or a sweep.", self._received)
+            counter("watcher_files_moved_total", "Files moved into a category folder.", self._moved)
+            counter("watcher_move_failures_total", "Moves that failed.", self._failed)
+            counter("watcher_bytes_moved_total", "Bytes moved.", self._bytes)
+            histogram("watcher_readiness_wait_seconds", "Time from pickup until the file stopped changing.", self._wait)
+            histogram("watcher_move_duration_seconds", "Time spent moving a file.", self._duration)
+            histogram("watcher_event_to_move_seconds", "Time from pickup until the file was moved.", self._latency)
+        for name, value in self._read_gauges().items():
+            lines.append(f"# HELP {name} {self._gauges[name][0]}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {value}")
+        for table, rows in self._read_tables().items():
+            label = self._tables[table][0]
+            fields: Dict[str, List[str]] = {}
+            for key, row in rows.items():
+                for field, value in row.items():
+                    fields.setdefault(field, []).append(f'watcher_{table}_{field}{{{label}="{_escape(key)}"}} {value}')
+            for field, samples in fields.items():
+                name = f"watcher_{table}_{field}"
+                lines.append(f"# TYPE {name} {'counter' if field.endswith('_total') else 'gauge'}")
+                lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsServer:
+    """Serves /metrics (Prometheus text) and /stats (JSON) from a background thread."""
+
+    def __init__(self, metrics: Metrics, port: int, host: str = "127.0.0.1") -> None:
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] == "/metrics":
+                    body = metrics.prometheus().encode("utf-8")
+                    ctype = "text/plain; version=0.0.4; charset=utf-8"
+                elif self.path.split("?", 1)[0] == "/stats":
+                    body = json.dumps(metrics.snapshot(), indent=2).encode("utf-8")
+                    ctype = "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args) -> None:
+                # Keep scrapes out of the console log
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self._thread = threading.Thread(target=self.server.serve_forever, name="watcher-metrics", daemon=True)
+        self._thread.start()
+        print(f"[INFO] Metrics at http://{host}:{self.server.server_address[1]}/metrics")
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class StatsDumper:
+    """Writes a JSON snapshot (plus throughput since the last one) to a file every interval."""
+
+    def __init__(self, metrics: Metrics, path: Path, interval: float = DEFAULT_STATS_INTERVAL) -> None:
+        self.metrics = metrics
+        self.path = path
+        self.interval = max(0.1, interval)
+        self._last: Optional[Tuple[float, int]] = None
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="watcher-stats", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopping.wait(self.interval):
+            self.dump()
+
+    def dump(self) -> None:
+        stats = self.metrics.snapshot()
+        now, moved = time.monotonic(), stats["totals"]["moved"]
+        if self._last is not None:
+            elapsed = now - self._last[0]
+            stats["files_per_second"] = round((moved - self._last[1]) / elapsed, 3) if elapsed > 0 else 0.0
+        self._last = (now, moved)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            tmp.write_text(json.dumps(stats, indent=2), encoding="utf-8")
+            # Readers never see a half-written file
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"[ERROR] Failed to write stats to '{self.path}': {e}")
+
+    def stop(self) -> None:
+        self._stopping.set()
+        self._thread.join(timeout=5)
+        self.dump()
+
+
+def merge_snapshots(snapshots: Dict[str, Dict]) -> Dict:
+    """Combine snapshot() dicts from several processes (keyed by shard) into one.
+
+    Roots are disjoint across shards, so they are merged as they are;
+    totals, gauges and table counters are summed.
+    """
+    merged: Dict = {"time": time.time(), "totals": {}, "gauges": {}, "roots": {}}
+    for snap in snapshots.values():
+        for key, value in snap.items():
+            if key in ("totals", "gauges"):
+                for name, n in value.items():
+                    merged[key][name] = merged[key].get(name, 0) + n
+            elif key == "roots":
+                merged["roots"].update(value)
+            elif isinstance(value, dict):
+                # A table: {label value: {field: number}}
+                table = merged.setdefault(key, {})
+                for row_key, row in value.items():
+                    into = table.setdefault(row_key, {})
+                    for field, n in row.items():
+                        # Limits are settings, not counters
+                        into[field] = n if field.startswith("max_") else into.get(field, 0) + n
+    return merged
+
+
+def merge_prometheus(texts: Dict[str, str], label: str = "shard") -> str:
+    """Combine prometheus() output from several processes, tagging every sample with label="<key>"."""
+    families: Dict[str, List[str]] = {}
+    headers: Dict[str, List[str]] = {}
+    for key, text in texts.items():
+        family = ""
+        tag = f'{label}="{_escape(key)}"'
+        for line in text.splitlines():
+            if line.startswith("# "):
+                parts = line.split(" ", 3)
+                if len(parts) >= 3:
+                    family = parts[2]
+                    heads = headers.setdefault(family, [])
+                    if line not in heads:
+                        heads.append(line)
+                    families.setdefault(family, [])
+                continue
+            if not line.strip():
+                continue
+            name, _, rest = line.partition(" ")
+            if "{" in name:
+                name = name.replace("{", "{" + tag + ",", 1)
+            else:
+                name = name + "{" + tag + "}"
+            families.setdefault(family, []).append(f"{name} {rest}")
+    lines: List[str] = []
+    for family, samples in families.items():
+        lines.extend(headers.get(family, []))
+        lines.extend(samples)
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,2342 @@
+import errno
+from collections import OrderedDict
+import fnmatch
+import functools
+import json
+import time
+import shutil
+import heapq
+import queue
+import re
+import signal
+import sys
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+import os
+
+from watchdog.observers import Observer
+from watchdog.observers.api import ObservedWatch
+from watchdog.events import FileSystemEventHandler
+
+from metrics import DEFAULT_STATS_INTERVAL, Metrics, MetricsServer, StatsDumper
+from sniff import ContentSniffer, needs_sniffing
+from dedupe import DEDUPE_ACTIONS, DUPLICATES_FOLDER, Deduplicator, HashIndex
+from journal import Journal, parse_since, shard_paths, undo_since
+from poller import POLL_MAX_SECONDS, POLL_MIN_SECONDS, SnapshotPoller
+
+InotifyObserver = None
+if sys.platform.startswith("linux"):
+    try:
+        from inotify_observer import InotifyObserver
+    except Exception:
+        # A libc without inotify; watchdog picks its own backend
+        pass
+
+
+CONFIG_PATH = Path(__file__).with_name("settings.json")
+
+
+# ------------------------
+# Watcher engine (no GUI imports; the headless CLI only loads this module)
+# ------------------------
+
+DEFAULT_RULES: Dict[str, List[str]] = {
+    "Images":   ["jpg","jpeg","png","gif","bmp","tiff","webp","svg"],
+    "Videos":   ["mp4","mov","mkv","avi","wmv","flv","webm","m4v"],
+    "Audio":    ["mp3","wav","flac","aac","ogg","m4a","wma"],
+    "Documents":["pdf","doc","docx","xls","xlsx","ppt","pptx","txt","rtf"],
+    "Archives": ["zip","rar","7z","tar","gz","bz2"],
+    "Code":     ["py","js","ts","tsx","jsx","java","cs","cpp","c","h","go","rs","rb","php","html","css","json","yaml","yml","xml","sql","sh","ps1","bat"],
+    "Installers":["exe","msi","msix","apk","dmg","pkg"],
+    "Fonts":    ["ttf","otf","woff","woff2"],
+}
+
+# Number of worker threads that move files.
+DEFAULT_WORKERS = 4
+# Upper bound on events waiting for a worker; the observer blocks beyond it.
+MAX_PENDING_JOBS = 10000
+# Seconds a file's size and mtime must stay unchanged before it is considered complete.
+DEFAULT_SETTLE_SECONDS = 1.0
+# Longest gap between stability checks for a file that keeps changing.
+MAX_CHECK_INTERVAL = 5.0
+# Times a file that is still locked (e.g. on Windows) is re-tracked before giving up.
+MAX_LOCK_RETRIES = 40
+# Files fed to the pipeline per step of a startup sweep.
+SWEEP_BATCH = 500
+# Files waiting to settle or for a device slot; past this, new events are dropped and the root is rescanned.
+MAX_BACKLOG_FILES = 50000
+# Events per second for one root above which the kernel queue may overflow unseen; the root is rescanned after.
+STORM_EVENTS_PER_SECOND = 2000
+# Seconds a replaced watch keeps delivering events alongside the new one; duplicates are ignored.
+WATCH_HANDOVER_SECONDS = 2.0
+# Bytes per kernel copy call when a move crosses devices.
+COPY_CHUNK = 8 * 1024 * 1024
+# Bytes that send a queued move one second behind smaller ones, so big files wait but never starve.
+PRIORITY_BYTES_PER_SECOND = 64 * 1024 * 1024
+# Destination stems that collided and remember their next " (n)" counter; least recently used go first.
+NAME_HINTS = 4096
+# Digest cache used when duplicate detection is on.
+HASH_INDEX_PATH = CONFIG_PATH.with_name("hashes.sqlite3")
+# Move journal used unless settings.json or --journal says otherwise.
+JOURNAL_PATH = CONFIG_PATH.with_name("journal.jsonl")
+# Seconds between checks of settings.json when running with --config.
+CONFIG_POLL_SECONDS = 1.0
+# Quiet time before queued settings are written; saves in between are coalesced.
+SAVE_DEBOUNCE_SECONDS = 0.5
+# Suffixes of files still being downloaded; they are organized once renamed to their final name.
+DEFAULT_TEMP_SUFFIXES = (".crdownload", ".part", ".partial", ".download", ".opdownload")
+
+
+def load_config() -> Dict:
+    """Read settings.json, returning an empty dict if it is missing or invalid."""
+    if CONFIG_PATH.exists():
+        try:
+            return json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+        except Exception:
+            pass
+    return {}
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Replace path; a crash leaves the old file or the new one, never half of it."""
+    tmp = path.with_name(f".{path.name}.tmp")
+    with open(tmp, "w", encoding="utf-8") as fh:
+        fh.write(text)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+    _fsync_dir(path.parent)
+
+
+def resolve_workers(value: Optional[object]) -> int:
+    """Coerce a worker count from CLI/settings, falling back to DEFAULT_WORKERS."""
+    try:
+        n = int(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return DEFAULT_WORKERS
+    return max(1, n)
+
+
+def resolve_settle(value: Optional[object]) -> float:
+    """Coerce a settle time from CLI/settings, falling back to DEFAULT_SETTLE_SECONDS."""
+    try:
+        s = float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return DEFAULT_SETTLE_SECONDS
+    return max(0.0, s)
+
+
+def normalize_rules(rules: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    normalized: Dict[str, List[str]] = {}
+    for cat, exts in rules.items():
+        normalized[cat] = [str(e).lower().lstrip(".") for e in exts if e]
+    return normalized
+
+
+class RuleIndex:
+    """Immutable extension -> category index compiled from a rules mapping.
+
+    Lookups try the longest known compound suffix first, so ``tar.gz`` can
+    map to a different category than ``gz``. Classification costs at most
+    ``max_parts`` dict lookups regardless of how many extensions exist.
+    """
+
+    __slots__ = ("_by_ext", "_max_parts", "_categories", "_conflicts", "_tree")
+
+    def __init__(self, rules: Dict[str, List[str]], conditional: Iterable["ConditionalRule"] = ()) -> None:
+        by_ext: Dict[str, str] = {}
+        conflicts: List[Tuple[str, str, str]] = []
+        for cat, exts in normalize_rules(rules).items():
+            for ext in exts:
+                owner = by_ext.setdefault(ext, cat)
+                if owner != cat:
+                    # First category wins, as with the old linear scan
+                    conflicts.append((ext, owner, cat))
+        object.__setattr__(self, "_by_ext", MappingProxyType(by_ext))
+        object.__setattr__(self, "_max_parts", max((e.count(".") + 1 for e in by_ext), default=1))
+        conditional = list(conditional)
+        object.__setattr__(self, "_categories", tuple(dict.fromkeys([*(r.category for r in conditional), *rules.keys()])))
+        object.__setattr__(self, "_conflicts", tuple(conflicts))
+        object.__setattr__(self, "_tree", _RuleTree(conditional) if conditional else None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("RuleIndex is immutable")
+
+    @property
+    def categories(self) -> Tuple[str, ...]:
+        return self._categories
+
+    @property
+    def conflicts(self) -> Tuple[Tuple[str, str, str], ...]:
+        """(extension, kept category, ignored category) for each duplicate extension."""
+        return self._conflicts
+
+    def match(self, filename: str) -> Optional[Tuple[str, str]]:
+        """(matched extension, category) for filename, or None if no extension rule matches."""
+        # Leading dots mark hidden files, not an extension (same as Path.suffix)
+        parts = filename.lower().lstrip(".").split(".")
+        for n in range(min(self._max_parts, len(parts) - 1), 0, -1):
+            ext = ".".join(parts[-n:])
+            cat = self._by_ext.get(ext)
+            if cat is not None:
+                return ext, cat
+        return None
+
+    def classify(self, filename: str) -> Optional[str]:
+        """Category for filename, or None if no extension rule matches."""
+        found = self.match(filename)
+        return found[1] if found is not None else None
+
+    def decide(self, name: str, path: Optional[Path] = None, ext: Optional[str] = None) -> Optional[Tuple[str, str]]:
+        """(category, rule that chose it) for a file, or None if no rule matches.
+
+        Conditional rules come first, in the order written; then extensions.
+        ext replaces the file's own suffix (e.g. when sniffed). path is
+        stat()ed at most once, and only if a size or age condition is reached.
+        """
+        lookup = f"file.{ext}" if ext else name
+        tree = self._tree
+        if tree is not None:
+            facts = _FileFacts(path)
+            for rule in tree.candidates(lookup, name):
+                if rule.holds(name, facts):
+                    return rule.category, rule.label
+        found = self.match(lookup)
+        return (found[1], f"ext:{found[0]}") if found is not None else None
+
+
+class _FileFacts:
+    """stat() of one file, taken on first use and shared by every condition."""
+
+    __slots__ = ("path", "_st", "now")
+
+    def __init__(self, path: Optional[Path]) -> None:
+        self.path = path
+        self._st: Optional[os.stat_result] = None
+        self.now = 0.0
+
+    def stat(self) -> Optional[os.stat_result]:
+        if self._st is None and self.path is not None:
+            try:
+                self._st = os.stat(self.path)
+                self.now = time.time()
+            except OSError:
+                # Gone; no size or age condition holds
+                self.path = None
+        return self._st
+
+
+_COMPARE = {">": float.__gt__, ">=": float.__ge__, "<": float.__lt__, "<=": float.__le__}
+
+
+class ConditionalRule:
+    """A 'Category = exts if condition and ...' line; exts of () means any file ('*')."""
+
+    __slots__ = ("category", "exts", "label", "order", "prefix", "_names", "_checks")
+
+    def __init__(self, category: str, exts: Tuple[str, ...], conditions: Tuple[Tuple[str, str, object], ...], label: str, order: int) -> None:
+        self.category = category
+        self.exts = exts
+        self.label = label
+        self.order = order
+        names = [str(v) for field, _, v in conditions if field == "name"]
+        # Name patterns are checked before anything that needs a stat
+        self._names = tuple(re.compile(fnmatch.translate(os.path.normcase(g))) for g in names)
+        self._checks = tuple((field, _COMPARE[op], float(v)) for field, op, v in conditions if field != "name")  # type: ignore[arg-type]
+        # Literal start every matching name shares ("invoice_" for invoice_*), for the tree
+        self.prefix = max((os.path.normcase(re.split(r"[*?\[]", g, maxsplit=1)[0]) for g in names), key=len, default="")
+
+    def holds(self, name: str, facts: _FileFacts) -> bool:
+        if self._names:
+            name = os.path.normcase(name)
+            if not all(p.match(name) for p in self._names):
+                return False
+        if self._checks:
+            st = facts.stat()
+            if st is None:
+                return False
+            for field, compare, value in self._checks:
+                actual = float(st.st_size) if field == "size" else facts.now - st.st_mtime
+                if not compare(actual, value):
+                    return False
+        return True
+
+
+class _RuleTree:
+    """Conditional rules indexed by extension, then by the literal start of their name pattern.
+
+    A file only meets the rules listed for its extension (or '*') whose
+    name pattern could match its name, so evaluation does not grow with
+    the number of unrelated rules.
+    """
+
+    def __init__(self, rules: List[ConditionalRule]) -> None:
+        anything = [r for r in rules if not r.exts]
+        by_ext: Dict[str, List[ConditionalRule]] = {}
+        for rule in rules:
+            for ext in rule.exts:
+                by_ext.setdefault(ext, []).append(rule)
+        self.max_parts = max((e.count(".") + 1 for e in by_ext), default=1)
+        self._by_ext = {ext: self._node(listed + anything) for ext, listed in by_ext.items()}
+        self._anything = self._node(anything)
+
+    @staticmethod
+    def _node(rules: List[ConditionalRule]) -> Tuple[Dict[int, Dict[str, List[ConditionalRule]]], Tuple[ConditionalRule, ...]]:
+        # ({prefix length: {prefix: rules}}, rules without a prefix)
+        by_prefix: Dict[int, Dict[str, List[ConditionalRule]]] = {}
+        rest: List[ConditionalRule] = []
+        for rule in sorted(set(rules), key=lambda r: r.order):
+            if rule.prefix:
+                by_prefix.setdefault(len(rule.prefix), {}).setdefault(rule.prefix, []).append(rule)
+            else:
+                rest.append(rule)
+        return by_prefix, tuple(rest)
+
+    def candidates(self, lookup: str, name: str) -> Tuple[ConditionalRule, ...]:
+        """Rules that may match, in the order written."""
+        parts = lookup.lower().lstrip(".").split(".")
+        exts = (".".join(parts[-n:]) for n in range(min(self.max_parts, len(parts) - 1), 0, -1))
+        nodes = [self._by_ext[ext] for ext in exts if ext in self._by_ext] or [self._anything]
+        key = os.path.normcase(name)
+        found: List[ConditionalRule] = []
+        for by_prefix, rest in nodes:
+            for length, table in by_prefix.items():
+                found.extend(table.get(key[:length], ()))
+            if len(nodes) == 1 and not found:
+                return rest
+            found.extend(rest)
+        # Several nodes (tar.gz and gz both listed) share their '*' rules
+        return tuple(sorted(set(found), key=lambda r: r.order))
+
+
+def compile_rules(rules: Optional[Dict[str, List[str]]] = None, conditional: Iterable[ConditionalRule] = ()) -> RuleIndex:
+    """Build the lookup index once; report extensions claimed by several categories."""
+    index = RuleIndex(rules or DEFAULT_RULES, conditional)
+    for ext, kept, ignored in index.conflicts:
+        print(f"[WARN] Extension '{ext}' is listed under both '{kept}' and '{ignored}'; using '{kept}'")
+    return index
+
+
+def ensure_directory(path: Path) -> None:
+    path.mkdir(parents=True, exist_ok=True)
+
+
+_NUMBERED_NAME = re.compile(r"^(.*) \((\d+)\)$")
+
+
+def name_counters(names: Iterable[str]) -> Dict[Tuple[str, str], int]:
+    """First " (n)" counter to try for each (stem, suffix), given the names already in a folder."""
+    counters: Dict[Tuple[str, str], int] = {}
+    for name in names:
+        p = Path(name)
+        stem, ext = p.stem, p.suffix
+        m = _NUMBERED_NAME.match(stem)
+        if m:
+            stem, n = m.group(1), int(m.group(2)) + 1
+        else:
+            n = 1
+        if counters.get((stem, ext), 0) < n:
+            counters[(stem, ext)] = n
+    return counters
+
+
+class NameReserver:
+    """Hands out collision-free destination names with few syscalls per claim.
+
+    The bare name is always tried first, so a name freed by deleting a file
+    is reused. Only stems that collided keep a hint of the next free " (n)"
+    counter, learned from one os.scandir of the directory; hints live in an
+    LRU of NAME_HINTS entries. A name is claimed by creating an empty
+    placeholder with O_CREAT | O_EXCL, so parallel workers never pick the
+    same name. The move then replaces the placeholder.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hints: "OrderedDict[Tuple[str, str, str], int]" = OrderedDict()
+
+    @staticmethod
+    def _create(candidate: Path) -> bool:
+        try:
+            fd = os.open(candidate, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return False
+        os.close(fd)
+        return True
+
+    def _seed(self, dest_dir: Path, stem: str, ext: str) -> int:
+        try:
+            with os.scandir(dest_dir) as it:
+                return name_counters(entry.name for entry in it if entry.name.startswith(stem)).get((stem, ext), 1)
+        except FileNotFoundError:
+            return 1
+
+    def claim(self, dest_dir: Path, filename: str) -> Path:
+        """Create and return an empty placeholder at a free name in dest_dir."""
+        stem, ext = Path(filename).stem, Path(filename).suffix
+        key = (str(dest_dir), stem, ext)
+        if self._create(dest_dir / filename):
+            with self._lock:
+                self._hints.pop(key, None)
+            return dest_dir / filename
+        with self._lock:
+            n = self._hints.pop(key, None)
+        if n is None:
+            n = self._seed(dest_dir, stem, ext)
+        while True:
+            candidate = dest_dir / f"{stem} ({n}){ext}"
+            n += 1
+            # Otherwise created behind our back; try the next counter
+            if self._create(candidate):
+                with self._lock:
+                    self._hints[key] = max(n, self._hints.get(key, 0))
+                    self._hints.move_to_end(key)
+                    if len(self._hints) > NAME_HINTS:
+                        self._hints.popitem(last=False)
+                return candidate
+
+    def release(self, placeholder: Path) -> None:
+        """Remove a placeholder whose move did not happen."""
+        try:
+            if placeholder.stat().st_size == 0:
+                placeholder.unlink()
+        except OSError:
+            pass
+
+
+
+# Errors meaning "this copy method does not work for these files", not "the copy failed"
+_COPY_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EBADF, getattr(errno, "EOPNOTSUPP", errno.ENOSYS), getattr(errno, "ENOTSUP", errno.ENOSYS)}
+
+
+def _copy_file_range(fin: int, fout: int, offset: int, count: int) -> int:
+    return os.copy_file_range(fin, fout, count, offset, offset)  # type: ignore[attr-defined]
+
+
+def _sendfile(fin: int, fout: int, offset: int, count: int) -> int:
+    # sendfile writes at the output's file position
+    os.lseek(fout, offset, os.SEEK_SET)
+    return os.sendfile(fout, fin, offset, count)
+
+
+def _read_write(fin: int, fout: int, offset: int, count: int) -> int:
+    os.lseek(fin, offset, os.SEEK_SET)
+    data = os.read(fin, count)
+    os.lseek(fout, offset, os.SEEK_SET)
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fout, view):]
+    return len(data)
+
+
+def _copy_methods() -> List[Callable[[int, int, int, int], int]]:
+    methods: List[Callable[[int, int, int, int], int]] = []
+    if hasattr(os, "copy_file_range"):
+        methods.append(_copy_file_range)
+    if sys.platform.startswith("linux") and hasattr(os, "sendfile"):
+        # Only Linux can sendfile into a regular file
+        methods.append(_sendfile)
+    methods.append(_read_write)
+    return methods
+
+
+def _advise(fd: int, offset: int, length: int, advice_name: str) -> None:
+    advice = getattr(os, advice_name, None)
+    if advice is not None and hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, offset, length, advice)
+        except OSError:
+            pass
+
+
+def _fsync_dir(path: Path) -> None:
+    if os.name != "posix":
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _drop_partials(folder: Path, name: str, keep: Optional[str] = None) -> None:
+    """Delete the resumable partial copies of name in folder, except keep."""
+    pattern = re.compile(re.escape(f".{name}.") + r"\d+-\d+-\d+\.part$")
+    try:
+        with os.scandir(folder) as it:
+            stale = [entry.path for entry in it if entry.name != keep and pattern.match(entry.name)]
+    except OSError:
+        return
+    for path in stale:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+class Mover:
+    """Moves a file onto its claimed placeholder: a rename on the same device, a kernel copy across devices."""
+
+    def __init__(self) -> None:
+        # (root, destination folder) -> same device; a category folder can be a symlink to another disk
+        self._same_device: Dict[Tuple[str, str], bool] = {}
+        # Destination folder -> device; I/O limits are kept per device written to
+        self._device: Dict[str, int] = {}
+
+    def same_device(self, root: Path, dest_dir: Path) -> bool:
+        key = (str(root), str(dest_dir))
+        same = self._same_device.get(key)
+        if same is None:
+            try:
+                same = os.stat(root).st_dev == os.stat(dest_dir).st_dev
+            except OSError:
+                # Let the rename decide
+                same = True
+            self._same_device[key] = same
+        return same
+
+    def device(self, dest_dir: Path) -> int:
+        """Device that files moved into dest_dir are written to."""
+        key = str(dest_dir)
+        device = self._device.get(key)
+        if device is None:
+            try:
+                device = self._device[key] = os.stat(dest_dir).st_dev
+            except OSError:
+                # Not created yet: it will be, next to the file; not cached
+                try:
+                    return os.stat(dest_dir.parent).st_dev
+                except OSError:
+                    return -1
+        return device
+
+    def move(self, root: Path, src: Path, dest: Path, throttle: Optional[Callable[[int], None]] = None) -> None:
+        """Move src onto dest; throttle(n) is called after every n bytes copied across devices."""
+        if self.same_device(root, dest.parent):
+            try:
+                # Replaces the placeholder atomically
+                os.replace(src, dest)
+                return
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # Something was mounted since the last check
+                self._same_device[(str(root), str(dest.parent))] = False
+        if os.path.islink(src):
+            shutil.move(str(src), str(dest))
+            return
+        self.copy_across(src, dest, throttle)
+
+    def copy_across(self, src: Path, dest: Path, throttle: Optional[Callable[[int], None]] = None) -> None:
+        """Copy src next to dest, make it durable, swap it in, then delete src.
+
+        The copy goes to a hidden partial file named after the source's
+        inode, size and mtime, so an interrupted move of the same file
+        resumes where it stopped instead of starting over. Partials of
+        other versions of the file can never resume and are deleted.
+        """
+        try:
+            st = os.stat(src)
+        except FileNotFoundError:
+            _drop_partials(dest.parent, src.name)
+            raise
+        partial = dest.with_name(f".{src.name}.{st.st_ino}-{st.st_size}-{st.st_mtime_ns}.part")
+        _drop_partials(dest.parent, src.name, keep=partial.name)
+        try:
+            self._copy_partial(src, st, partial, throttle)
+        except OSError:
+            try:
+                now = os.stat(src)
+                resumable = (now.st_ino, now.st_size, now.st_mtime_ns) == (st.st_ino, st.st_size, st.st_mtime_ns)
+            except OSError:
+                resumable = False
+            if not resumable:
+                # The source changed or is gone; a retry would copy under another name
+                _drop_partials(dest.parent, src.name)
+            raise
+        shutil.copystat(src, partial)
+        os.replace(partial, dest)
+        # Make the new name durable before the only other copy goes away
+        _fsync_dir(dest.parent)
+        os.unlink(src)
+
+    @staticmethod
+    def _copy_partial(src: Path, st: os.stat_result, partial: Path, throttle: Optional[Callable[[int], None]]) -> None:
+        fin = os.open(src, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            fout = os.open(partial, os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+            try:
+                offset = os.fstat(fout).st_size
+                if offset > st.st_size:
+                    os.ftruncate(fout, 0)
+                    offset = 0
+                _advise(fin, 0, 0, "POSIX_FADV_SEQUENTIAL")
+                methods = _copy_methods()
+                while offset < st.st_size:
+                    count = min(COPY_CHUNK, st.st_size - offset)
+                    try:
+                        sent = methods[0](fin, fout, offset, count)
+                    except OSError as e:
+                        if e.errno in _COPY_UNSUPPORTED and len(methods) > 1:
+                            methods.pop(0)
+                            continue
+                        raise
+                    if sent == 0:
+                        raise OSError(errno.EIO, f"'{src.name}' shrank while it was being copied")
+                    offset += sent
+                    if throttle is not None:
+                        throttle(sent)
+                    if offset % (16 * COPY_CHUNK) < sent:
+                        # Flush the progress made so far, for resuming, and keep it out of the page cache
+                        os.fsync(fout)
+                        _advise(fout, 0, offset, "POSIX_FADV_DONTNEED")
+                        _advise(fin, 0, offset, "POSIX_FADV_DONTNEED")
+                os.fsync(fout)
+                _advise(fout, 0, 0, "POSIX_FADV_DONTNEED")
+                _advise(fin, 0, 0, "POSIX_FADV_DONTNEED")
+            finally:
+                os.close(fout)
+        finally:
+            os.close(fin)
+
+
+class WorkerPool:
+    """Fixed-size pool of threads fed from a bounded job queue."""
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, max_pending: int = MAX_PENDING_JOBS) -> None:
+        self.jobs: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=max_pending)
+        self.threads: List[threading.Thread] = []
+        for i in range(max(1, workers)):
+            t = threading.Thread(target=self._run, name=f"watcher-worker-{i}", daemon=True)
+            t.start()
+            self.threads.append(t)
+
+    def submit(self, fn, *args) -> None:
+        # Blocks the caller when the queue is full so bursts cannot grow memory unbounded.
+        self.jobs.put((fn, args))
+
+    def pending(self) -> int:
+        return self.jobs.qsize()
+
+    def _run(self) -> None:
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            fn, args = job
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"[ERROR] Worker job failed: {e}")
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Let queued jobs finish, then stop the worker threads."""
+        for _ in self.threads:
+            self.jobs.put(None)
+        for t in self.threads:
+            t.join(timeout=timeout)
+
+
+class _DeviceQueue:
+    __slots__ = ("max_moves", "max_rate", "active", "waiting", "tokens", "refilled", "moves", "copied", "throttled")
+
+    def __init__(self) -> None:
+        self.max_moves: Optional[int] = None
+        self.max_rate: Optional[float] = None
+        self.active = 0
+        # (priority, seq, fn, args)
+        self.waiting: List[Tuple[float, int, Callable, tuple]] = []
+        self.tokens = 0.0
+        self.refilled = time.monotonic()
+        self.moves = 0
+        self.copied = 0
+        self.throttled = 0.0
+
+
+class IOScheduler:
+    """Limits moves per device: how many run at once (smallest file first) and bytes/s copied.
+
+    Devices without limits go straight to the worker pool. For a limited
+    device, moves beyond max_moves wait in a heap ordered by arrival time
+    plus a size penalty, and the worker that finishes a move runs the next
+    one for the same device, so waiting never ties up other workers.
+    """
+
+    def __init__(self, pool: WorkerPool) -> None:
+        self.pool = pool
+        self._devices: Dict[int, _DeviceQueue] = {}
+        self._lock = threading.Lock()
+        self._seq = 0
+
+    def set_limits(self, limits: Dict[int, Tuple[Optional[int], Optional[float]]]) -> None:
+        """Replace the (max_moves, max_bytes_per_second) of every device; None means unlimited."""
+        with self._lock:
+            for device, dq in self._devices.items():
+                if device not in limits:
+                    dq.max_moves = dq.max_rate = None
+            for device, (max_moves, max_rate) in limits.items():
+                dq = self._devices.get(device)
+                if dq is None:
+                    dq = self._devices[device] = _DeviceQueue()
+                dq.max_moves = max(1, max_moves) if max_moves is not None else None
+                dq.max_rate = max_rate if max_rate else None
+                dq.tokens = min(dq.tokens, dq.max_rate or 0.0)
+            ready = [(device, self._next(dq)) for device, dq in self._devices.items()]
+        # Raised limits let waiting moves start
+        for device, job in ready:
+            while job is not None:
+                self.pool.submit(self._run, device, job)
+                with self._lock:
+                    job = self._next(self._devices[device])
+
+    def limited(self) -> bool:
+        """Whether any device has a limit; if not, moves need no device."""
+        with self._lock:
+            return any(dq.max_moves is not None or dq.max_rate is not None for dq in self._devices.values())
+
+    def submit(self, device: int, src_path: Path, fn: Callable, *args) -> None:
+        with self._lock:
+            dq = self._devices.get(device)
+            full = dq is not None and dq.max_moves is not None and dq.active >= dq.max_moves
+            if dq is not None and not full:
+                dq.active += 1
+        if dq is None:
+            self.pool.submit(fn, *args)
+            return
+        if not full:
+            self.pool.submit(self._run, device, (fn, args))
+            return
+        try:
+            size = os.stat(src_path).st_size
+        except OSError:
+            size = 0
+        with self._lock:
+            dq = self._devices[device]
+            self._seq += 1
+            heapq.heappush(dq.waiting, (time.monotonic() + size / PRIORITY_BYTES_PER_SECOND, self._seq, fn, args))
+            job = self._next(dq)
+        if job is not None:
+            # A slot freed up meanwhile
+            self.pool.submit(self._run, device, job)
+
+    def _next(self, dq: _DeviceQueue) -> Optional[Tuple[Callable, tuple]]:
+        # Caller holds the lock
+        if dq.waiting and (dq.max_moves is None or dq.active < dq.max_moves):
+            _, _, fn, args = heapq.heappop(dq.waiting)
+            dq.active += 1
+            return fn, args
+        return None
+
+    def _run(self, device: int, job: Tuple[Callable, tuple]) -> None:
+        while job is not None:
+            fn, args = job
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"[ERROR] Worker job failed: {e}")
+            with self._lock:
+                dq = self._devices.get(device)
+                if dq is None:
+                    return
+                dq.active -= 1
+                dq.moves += 1
+                job = self._next(dq)
+
+    def throttle(self, device: int) -> Optional[Callable[[int], None]]:
+        """Callback that accounts for copied bytes and sleeps to keep device under its rate; None if unlimited."""
+        with self._lock:
+            dq = self._devices.get(device)
+            if dq is None or dq.max_rate is None:
+                return None
+        return lambda n: self._consume(dq, n)
+
+    def _consume(self, dq: _DeviceQueue, n: int) -> None:
+        with self._lock:
+            now = time.monotonic()
+            rate = dq.max_rate
+            dq.copied += n
+            if rate is None:
+                return
+            # Token bucket holding at most one second of bytes
+            dq.tokens = min(rate, dq.tokens + (now - dq.refilled) * rate) - n
+            dq.refilled = now
+            delay = -dq.tokens / rate if dq.tokens < 0 else 0.0
+            dq.throttled += delay
+        if delay:
+            time.sleep(delay)
+
+    def waiting(self) -> int:
+        with self._lock:
+            return sum(len(q.waiting) for q in self._devices.values())
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Limits and counters per limited device, keyed by device number."""
+        with self._lock:
+            return {
+                str(device): {
+                    "max_moves": q.max_moves if q.max_moves is not None else -1,
+                    "max_bytes_per_second": q.max_rate if q.max_rate is not None else -1,
+                    "active": q.active,
+                    "waiting": len(q.waiting),
+                    "moves_total": q.moves,
+                    "copied_bytes_total": q.copied,
+                    "throttled_seconds_total": round(q.throttled, 3),
+                }
+                for device, q in self._devices.items()
+            }
+
+
+class _Pending:
+    __slots__ = ("path", "on_ready", "on_gone", "signature", "last_change", "interval", "due", "dirty", "closed")
+
+    def __init__(self, path: Path, on_ready: Callable[[Path], None], now: float, interval: float, on_gone: Optional[Callable[[Path], None]] = None) -> None:
+        self.path = path
+        self.on_ready = on_ready
+        self.on_gone = on_gone
+        self.signature: Optional[Tuple[int, int]] = None
+        self.last_change = now
+        self.interval = interval
+        self.due = now
+        self.dirty = False
+        self.closed = False
+
+
+class ReadinessTracker:
+    """Single thread that releases files once their size and mtime stop changing.
+
+    Pending paths sit in a heap ordered by their next check time. A file is
+    released after its (size, mtime) pair has stayed the same for ``settle``
+    seconds; files that keep changing are re-checked at growing intervals.
+    Modified events only push the quiet window forward (no stat, no new heap
+    entry), and a close-after-write event triggers an immediate check.
+    """
+
+    def __init__(self, settle: float = DEFAULT_SETTLE_SECONDS) -> None:
+        self.settle = settle
+        self._pending: Dict[str, _Pending] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="watcher-readiness", daemon=True)
+        self._thread.start()
+
+    def track(self, path: Path, on_ready: Callable[[Path], None], on_gone: Optional[Callable[[Path], None]] = None) -> bool:
+        """Start tracking path; returns False if it is already pending. on_gone runs if it disappears first."""
+        key = str(path)
+        now = time.monotonic()
+        with self._cond:
+            if self._stopped or key in self._pending:
+                return False
+            entry = _Pending(path, on_ready, now, max(self.settle, 0.05), on_gone)
+            self._pending[key] = entry
+            # Stat right away to record the starting signature
+            self._push(entry, now)
+        return True
+
+    def touch(self, path: Path, closed: bool = False) -> None:
+        """Record a modified/closed event for a pending path."""
+        now = time.monotonic()
+        with self._cond:
+            entry = self._pending.get(str(path))
+            if entry is None:
+                return
+            if closed:
+                entry.closed = True
+                self._push(entry, now)
+            else:
+                entry.dirty = True
+                entry.last_change = now
+
+    def forget(self, path: Path) -> None:
+        """Stop tracking path; its heap entry is skipped when it comes up."""
+        with self._cond:
+            self._pending.pop(str(path), None)
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def stop(self) -> None:
+        """Stop the tracker thread; files still settling are dropped."""
+        with self._cond:
+            self._stopped = True
+            self._pending.clear()
+            self._cond.notify()
+        self._thread.join(timeout=5)
+
+    def _push(self, entry: _Pending, due: float) -> None:
+        entry.due = due
+        self._seq += 1
+        heapq.heappush(self._heap, (due, self._seq, str(entry.path)))
+        if self._heap[0][1] == self._seq:
+            self._cond.notify()
+
+    def _next_due(self) -> Optional[_Pending]:
+        """Wait for the earliest due entry; None once stopped."""
+        with self._cond:
+            while not self._stopped:
+                now = time.monotonic()
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                due, _, key = self._heap[0]
+                if due > now:
+                    self._cond.wait(due - now)
+                    continue
+                heapq.heappop(self._heap)
+                entry = self._pending.get(key)
+                if entry is None or entry.due != due:
+                    # Superseded by a later schedule for the same path
+                    continue
+                if entry.dirty and not entry.closed and now < entry.last_change + self.settle:
+                    # Modified recently: wait out the quiet period without a stat
+                    self._push(entry, entry.last_change + self.settle)
+                    continue
+                return entry
+            return None
+
+    def _run(self) -> None:
+        while True:
+            entry = self._next_due()
+            if entry is None:
+                return
+            if self._check(entry):
+                try:
+                    entry.on_ready(entry.path)
+                except Exception as e:
+                    print(f"[ERROR] Failed to dispatch '{entry.path.name}': {e}")
+
+    def _check(self, entry: _Pending) -> bool:
+        key = str(entry.path)
+        try:
+            st = entry.path.stat()
+            signature: Optional[Tuple[int, int]] = (st.st_size, st.st_mtime_ns)
+        except FileNotFoundError:
+            # Deleted or moved away before it settled
+            with self._cond:
+                if self._pending.get(key) is not entry:
+                    return False
+                del self._pending[key]
+            if entry.on_gone is not None:
+                entry.on_gone(entry.path)
+            return False
+        except OSError:
+            signature = None
+        now = time.monotonic()
+        with self._cond:
+            if self._pending.get(key) is not entry:
+                return False
+            entry.dirty = False
+            # An empty file is often a placeholder (Firefox closes one before writing f.zip.part),
+            # so closing it does not end the wait
+            closed = entry.closed and signature is not None and signature[0] > 0
+            if signature is not None and (closed or (signature == entry.signature and now - entry.last_change >= self.settle)):
+                del self._pending[key]
+                return True
+            if signature != entry.signature:
+                if entry.signature is not None:
+                    # Still being written: back off
+                    entry.interval = min(entry.interval * 1.5, MAX_CHECK_INTERVAL)
+                entry.signature = signature
+                entry.last_change = now
+                self._push(entry, now + max(entry.interval, self.settle))
+            else:
+                self._push(entry, entry.last_change + self.settle)
+        return False
+
+
+class MoveRecord:
+    """Outcome of one move, passed to Organizer listeners from the worker thread."""
+
+    __slots__ = ("root", "src", "dest", "category", "size", "duration", "latency", "error")
+
+    def __init__(self, root: Path, src: Path, dest: Optional[Path], category: str, size: int, duration: float, latency: float, error: Optional[str] = None) -> None:
+        self.root = root
+        self.src = src
+        # None when the move failed
+        self.dest = dest
+        self.category = category
+        self.size = size
+        # Seconds spent moving, and since the file was picked up
+        self.duration = duration
+        self.latency = latency
+        self.error = error
+
+
+MoveListener = Callable[[MoveRecord], None]
+
+
+class CreatedHandler(FileSystemEventHandler):
+    def __init__(self, root: Path, rules: RuleIndex, move_unknown_to: str, quiet: bool = False, pool: Optional[WorkerPool] = None, tracker: Optional[ReadinessTracker] = None, names: Optional[NameReserver] = None, metrics: Optional[Metrics] = None, listeners: Optional[List[MoveListener]] = None, mover: Optional[Mover] = None, sniffer: Optional[ContentSniffer] = None, dedupe: Optional[Deduplicator] = None, journal: Optional[Journal] = None, recursive: bool = False, max_depth: Optional[int] = None, include: Optional[List[str]] = None, exclude: Optional[List[str]] = None, temp_suffixes: Tuple[str, ...] = DEFAULT_TEMP_SUFFIXES, scheduler: Optional["IOScheduler"] = None, max_moves: Optional[int] = None, max_rate: Optional[float] = None, poll: Optional[float] = None) -> None:
+        super().__init__()
+        self.root = root
+        self._prefix = os.path.join(str(root), "")
+        # Devices this root's moves write to, for the I/O limits; category folders normally share the root's
+        self.devices: Set[int] = set()
+        try:
+            self.devices.add(os.stat(root).st_dev)
+        except OSError:
+            pass
+        # Called when a move writes to a device not in devices
+        self.on_new_device: Optional[Callable[["CreatedHandler"], None]] = None
+        self.scheduler = scheduler
+        self.configure(rules, move_unknown_to, quiet, recursive, max_depth, include, exclude, max_moves, max_rate, poll)
+        self.pool = pool
+        self.tracker = tracker
+        self.names = names or NameReserver()
+        self.mover = mover or Mover()
+        # Set to classify extensionless/.bin/.dat files by content
+        self.sniffer = sniffer
+        # Set to check for identical files before moving
+        self.dedupe = dedupe
+        self.journal = journal
+        # Lower-case suffixes of in-progress downloads
+        self.temp_suffixes = temp_suffixes
+        self.metrics = metrics
+        # Shared with the Organizer, so listeners added later are seen here too
+        self.listeners = listeners if listeners is not None else []
+        # Cleared when the root is unwatched so a running sweep stops early
+        self.active = True
+        # Files released by the tracker and not yet moved
+        self._moving: Set[str] = set()
+        self._moving_lock = threading.Lock()
+        # Pickup time of each file in the pipeline, for latency metrics
+        self._offered: Dict[str, float] = {}
+        # In-progress download -> the final name it will be renamed to
+        self._downloads: Dict[str, str] = {}
+        # Called when events were (or may have been) lost, to queue a rescan of the root
+        self.on_overflow: Optional[Callable[["CreatedHandler"], None]] = None
+        self.rescan_queued = False
+        self.dropped = 0
+        self._window = (0.0, 0)
+
+    def configure(self, rules: RuleIndex, move_unknown_to: str, quiet: bool, recursive: bool = False, max_depth: Optional[int] = None, include: Optional[List[str]] = None, exclude: Optional[List[str]] = None, max_moves: Optional[int] = None, max_rate: Optional[float] = None, poll: Optional[float] = None) -> None:
+        """Swap in new settings; moves already running keep the ones they started with."""
+        # Plain attribute assignment, so workers see either the old index or the new one
+        self.move_unknown_to = move_unknown_to
+        self.quiet = quiet
+        self.recursive = recursive
+        self.max_depth = max_depth
+        self.include = tuple(include or ())
+        self.exclude = tuple(exclude or ())
+        # Read by the Organizer, which combines them per device
+        self.max_moves = max_moves
+        self.max_rate = max_rate
+        # Longest wait between polls if the root is polled instead of watched (network shares, FUSE)
+        self.poll = poll
+        self.set_rules(rules)
+
+    def set_rules(self, rules: RuleIndex) -> None:
+        """Swap in a new rule index only; no disk access."""
+        self.rules = rules
+        # Folders we move files into are never entered, so our own moves are ignored
+        # ("Videos/Large" lives in Videos)
+        self._skip_dirs = frozenset(c.replace("\\", "/").split("/")[0].casefold() for c in (*rules.categories, self.move_unknown_to, DUPLICATES_FOLDER))
+
+    def descends(self, name: str, depth: int) -> bool:
+        """Whether files in subfolder name, depth levels below the root, are organized."""
+        if not self.recursive or (self.max_depth is not None and depth > self.max_depth):
+            return False
+        if name.startswith(".") or name.casefold() in self._skip_dirs:
+            return False
+        return not any(fnmatch.fnmatch(name, g) for g in self.exclude)
+
+    def accepts(self, path: str) -> bool:
+        """Whether the file at path is ours to organize; string checks only, no stat."""
+        if not path.startswith(self._prefix):
+            return False
+        parts = path[len(self._prefix):].split(os.sep)
+        for depth, name in enumerate(parts[:-1], 1):
+            if not self.descends(name, depth):
+                return False
+        if self.include or self.exclude:
+            rel = "/".join(parts)
+            if any(fnmatch.fnmatch(parts[-1], g) or fnmatch.fnmatch(rel, g) for g in self.exclude):
+                return False
+            if self.include and not any(fnmatch.fnmatch(parts[-1], g) or fnmatch.fnmatch(rel, g) for g in self.include):
+                return False
+        return True
+
+    def on_created(self, event):
+        if event.is_directory or not self.accepts(event.src_path):
+            return
+        self.offer(Path(event.src_path))
+
+    def is_temp(self, name: str) -> bool:
+        return name.lower().endswith(self.temp_suffixes)
+
+    def offer(self, src_path: Path, settled: bool = False, scanning: bool = False) -> bool:
+        """Start handling a file; False if it is already in the pipeline, still downloading, or dropped.
+
+        A settled file (just renamed from a finished download) skips the readiness check.
+        Event-driven offers (not scanning) are dropped while the backlog is full; the
+        root is rescanned instead, so the file is still picked up.
+        """
+        key = str(src_path)
+        if self.is_temp(src_path.name):
+            self._hold(key)
+            return False
+        if not scanning and self._overflowing():
+            return False
+        if scanning and not os.path.lexists(key):
+            # Listed by a sweep, then moved by a live event before the sweep got to it
+            return False
+        with self._moving_lock:
+            if key in self._moving:
+                return False
+            if self.metrics is not None and key not in self._offered:
+                self._offered[key] = time.monotonic()
+                self.metrics.received(str(self.root))
+        # The caller only registers the file; readiness and the move happen elsewhere.
+        if self.tracker is not None and not settled:
+            return self.tracker.track(src_path, self.submit, self._gone)
+        if self.tracker is not None:
+            self.tracker.forget(src_path)
+        self.submit(src_path)
+        return True
+
+    def _gone(self, src_path: Path) -> None:
+        # Offered from a stale listing (e.g. a sweep) after it was already moved; no event will clear it
+        with self._moving_lock:
+            self._offered.pop(str(src_path), None)
+
+    def backlog(self) -> int:
+        """Files tracked for readiness or waiting for a device slot."""
+        n = self.tracker.pending() if self.tracker is not None else 0
+        return n + (self.scheduler.waiting() if self.scheduler is not None else 0)
+
+    def _overflowing(self) -> bool:
+        # Called for every event, so the rate is a counter per one-second window
+        now = time.monotonic()
+        start, count = self._window
+        if now - start >= 1.0:
+            start, count = now, 0
+        count += 1
+        self._window = (start, count)
+        if self.backlog() >= MAX_BACKLOG_FILES:
+            self.dropped += 1
+            self._overflow()
+            return True
+        if count > STORM_EVENTS_PER_SECOND and self.poll is None:
+            # The kernel drops events silently when its queue fills; check the folder afterwards (a poller drops none)
+            self._overflow()
+        return False
+
+    def _overflow(self) -> None:
+        if not self.rescan_queued and self.on_overflow is not None:
+            self.rescan_queued = True
+            self.on_overflow(self)
+
+    def _hold(self, temp: str) -> None:
+        # Browsers differ in which suffix they add; strip the one that matched
+        name = os.path.basename(temp)
+        lower = name.lower()
+        suffix = next(s for s in self.temp_suffixes if lower.endswith(s))
+        final = os.path.join(os.path.dirname(temp), name[:len(name) - len(suffix)])
+        with self._moving_lock:
+            self._downloads[temp] = final
+        # Firefox creates an empty file under the final name first; leave it for the rename
+        if self.tracker is not None:
+            self.tracker.forget(Path(final))
+
+    def _downloading(self, key: str) -> bool:
+        # Few downloads run at once, so a scan is cheaper than a second index
+        return key in self._downloads.values()
+
+    def on_modified(self, event):
+        if self.tracker is not None and not event.is_directory:
+            self.tracker.touch(Path(event.src_path))
+
+    def on_closed(self, event):
+        if self.tracker is not None and not event.is_directory:
+            self.tracker.touch(Path(event.src_path), closed=True)
+
+    def on_deleted(self, event):
+        # Gone before it was moved; forget its pickup time
+        with self._moving_lock:
+            self._offered.pop(event.src_path, None)
+            final = self._downloads.pop(event.src_path, None)
+        if final is not None and not self._downloading(final) and self.accepts(final):
+            # A cancelled download; organize whatever it left under the final name
+            self.offer(Path(final))
+
+    def on_moved(self, event):
+        with self._moving_lock:
+            self._offered.pop(event.src_path, None)
+            finished = self._downloads.pop(event.src_path, None) is not None
+        if event.is_directory or not self.accepts(event.dest_path):
+            return
+        # A download renamed to its final name is complete; anything else settles as usual
+        self.offer(Path(event.dest_path), settled=finished)
+
+    def submit(self, src_path: Path, attempt: int = 0) -> None:
+        with self._moving_lock:
+            if str(src_path) in self._moving or self._downloading(str(src_path)):
+                return
+            self._moving.add(str(src_path))
+            offered = self._offered.get(str(src_path))
+        if self.metrics is not None and offered is not None and attempt == 0:
+            self.metrics.ready(str(self.root), time.monotonic() - offered)
+        if self.scheduler is not None and self.scheduler.limited():
+            # Limits belong to the device written to, so the destination is decided here
+            decided = self.classify(src_path)
+            device = self._destination_device(src_path.parent / decided[0])
+            self.scheduler.submit(device, src_path, self.process, src_path, attempt, decided)
+        elif self.pool is not None:
+            self.pool.submit(self.process, src_path, attempt)
+        else:
+            self.process(src_path, attempt)
+
+    def classify(self, src_path: Path) -> Tuple[str, str]:
+        """(category, rule that chose it) for a file, e.g. ("Documents", "ext:pdf")."""
+        name = src_path.name
+        sniffer = self.sniffer
+        if sniffer is not None and needs_sniffing(name):
+            ext = sniffer.sniff(src_path)
+            found = self.rules.decide(name, src_path, ext) if ext else None
+            if found is not None:
+                return found[0], f"sniff:{ext}" if found[1].startswith("ext:") else found[1]
+        found = self.rules.decide(name, src_path)
+        if found is not None:
+            return found
+        return self.move_unknown_to, "unknown"
+
+    def _temp_sibling(self, src_path: Path) -> Optional[str]:
+        # A download in progress next to its placeholder, whether or not we saw it start
+        for suffix in self.temp_suffixes:
+            temp = str(src_path) + suffix
+            if os.path.lexists(temp):
+                return temp
+        return None
+
+    def learn_devices(self) -> None:
+        """Record the devices of the top-level category folders that exist, so limits apply from the first move."""
+        for category in (*self.rules.categories, self.move_unknown_to):
+            dest_dir = self.root / category
+            if dest_dir.is_dir():
+                self.devices.add(self.mover.device(dest_dir))
+
+    def _destination_device(self, dest_dir: Path) -> int:
+        device = self.mover.device(dest_dir)
+        if device not in self.devices:
+            self.devices.add(device)
+            if self.on_new_device is not None:
+                self.on_new_device(self)
+        return device
+
+    def process(self, src_path: Path, attempt: int = 0, decided: Optional[Tuple[str, str]] = None) -> None:
+        name = src_path.name
+        temp = self._temp_sibling(src_path)
+        if temp is not None:
+            # Left for the rename that finishes the download (or the delete that cancels it)
+            self._hold(temp)
+            with self._moving_lock:
+                self._moving.discard(str(src_path))
+                self._offered.pop(str(src_path), None)
+            return
+        category, rule = decided or self.classify(src_path)
+        # Nested files are organized inside their own folder
+        dest_dir = src_path.parent / category
+        dest_path: Optional[Path] = None
+        started = time.monotonic()
+        # Read before the move: our own rename's event clears the entry
+        with self._moving_lock:
+            offered = self._offered.get(str(src_path), started)
+        retrying = False
+        dedupe = self.dedupe
+        journal = self.journal
+        seq: Optional[int] = None
+        try:
+            ensure_directory(dest_dir)
+            duplicate = dedupe.find(src_path, dest_dir) if dedupe is not None else None
+            if duplicate is not None:
+                if dedupe.action == "skip":
+                    if not self.quiet:
+                        print(f"[INFO] Skipped duplicate: {name} (same as {category}/{duplicate.name})")
+                    return
+                rule = f"duplicate:{dedupe.action}"
+                if dedupe.action == "move":
+                    category = dedupe.folder
+                    dest_dir = src_path.parent / category
+                    ensure_directory(dest_dir)
+            dest_path = self.names.claim(dest_dir, name)
+            if journal is not None:
+                seq = journal.begin(src_path, dest_path, os.stat(src_path).st_size, rule)
+            if duplicate is not None and dedupe.action == "hardlink":
+                # Share the existing copy's data instead of keeping a second one
+                dedupe.link(duplicate, dest_path)
+                os.unlink(src_path)
+            else:
+                throttle = self.scheduler.throttle(self._destination_device(dest_dir)) if self.scheduler is not None else None
+                self.mover.move(self.root, src_path, dest_path, throttle)
+            moved_to, dest_path = dest_path, None
+            if seq is not None:
+                journal.finish(seq)
+                seq = None
+            if dedupe is not None:
+                if category != dedupe.folder:
+                    dedupe.added(src_path, moved_to)
+                else:
+                    dedupe.index.forget(src_path)
+            self._report(src_path, category, moved_to, started, offered)
+            if not self.quiet:
+                print(f"[INFO] Moved: {name} -> {category}" + (" (duplicate)" if duplicate is not None else ""))
+        except FileNotFoundError:
+            # Removed after it settled; nothing to do
+            pass
+        except PermissionError as e:
+            # Still locked by the writer (Windows); wait for it to settle again
+            if self.tracker is not None and attempt < MAX_LOCK_RETRIES:
+                retrying = True
+                self.tracker.track(src_path, lambda p: self.submit(p, attempt + 1))
+            else:
+                print(f"[ERROR] Failed to move '{name}': {e}")
+                self._report(src_path, category, None, started, offered, str(e))
+        except Exception as e:
+            print(f"[ERROR] Failed to move '{name}': {e}")
+            self._report(src_path, category, None, started, offered, str(e))
+        finally:
+            if seq is not None:
+                journal.finish(seq, "abort")
+            if dest_path is not None:
+                self.names.release(dest_path)
+            with self._moving_lock:
+                self._moving.discard(str(src_path))
+                if not retrying:
+                    self._offered.pop(str(src_path), None)
+
+    def _report(self, src_path: Path, category: str, dest_path: Optional[Path], started: float, offered: float, error: Optional[str] = None) -> None:
+        if self.metrics is None and not self.listeners:
+            return
+        now = time.monotonic()
+        size = 0
+        if dest_path is not None:
+            try:
+                size = dest_path.stat().st_size
+            except OSError:
+                pass
+        if self.metrics is not None:
+            if error is None:
+                self.metrics.moved(str(self.root), category, size, now - started, now - offered)
+            else:
+                self.metrics.failed(str(self.root), category)
+        if self.listeners:
+            record = MoveRecord(self.root, src_path, dest_path, category, size, now - started, now - offered, error)
+            for listener in list(self.listeners):
+                try:
+                    listener(record)
+                except Exception as e:
+                    print(f"[ERROR] Move listener failed: {e}")
+
+
+# Called as progress(root, files_scanned, files_queued, finished) while a sweep runs.
+SweepProgress = Callable[[Path, int, int, bool], None]
+
+
+class EventRouter(FileSystemEventHandler):
+    """The one handler scheduled on the shared observer; forwards events to their root's handler."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Replaced wholesale on change so the observer thread can read it without a lock
+        self._roots: Dict[str, CreatedHandler] = {}
+
+    def add(self, handler: CreatedHandler) -> None:
+        self._roots = {**self._roots, str(handler.root): handler}
+
+    def remove(self, root: Path) -> Optional[CreatedHandler]:
+        roots = dict(self._roots)
+        handler = roots.pop(str(root), None)
+        self._roots = roots
+        return handler
+
+    def get(self, root: Path) -> Optional[CreatedHandler]:
+        return self._roots.get(str(root))
+
+    def handlers(self) -> List[CreatedHandler]:
+        return list(self._roots.values())
+
+    def route(self, path: str) -> Optional[CreatedHandler]:
+        parent = os.path.dirname(path)
+        handler = self._roots.get(parent)
+        if handler is not None:
+            return handler
+        # Only recursive watches report deeper events; find the nearest root above
+        while True:
+            up = os.path.dirname(parent)
+            if up == parent:
+                return None
+            parent = up
+            handler = self._roots.get(parent)
+            if handler is not None:
+                return handler if handler.recursive else None
+
+    def dispatch(self, event) -> None:
+        handler = self.route(event.src_path)
+        if handler is not None:
+            handler.dispatch(event)
+        if event.event_type == "moved":
+            # A rename into another root is that root's new file
+            target = self.route(event.dest_path)
+            if target is not None and target is not handler:
+                target.dispatch(event)
+
+
+class Organizer:
+    """One observer for every watched root, with a shared readiness tracker and worker pool.
+
+    On Linux the observer is an InotifyObserver, so every root shares one
+    inotify instance and one reader thread; elsewhere it is watchdog's.
+
+    Roots can be added and removed while it runs; each keeps its own
+    rules, unknown-target and quiet settings in its CreatedHandler.
+    """
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, settle: float = DEFAULT_SETTLE_SECONDS, sniff: bool = False) -> None:
+        self.pool = WorkerPool(workers)
+        self.scheduler = IOScheduler(self.pool)
+        self.tracker = ReadinessTracker(settle)
+        self.names = NameReserver()
+        self.mover = Mover()
+        # Created up front so its cache survives sniffing being switched off and on
+        self.sniffer = ContentSniffer()
+        self.sniffing = sniff
+        self.temp_suffixes = DEFAULT_TEMP_SUFFIXES
+        # Opened on first use; see set_dedupe
+        self.dedupe: Optional[Deduplicator] = None
+        self._hash_index: Optional[HashIndex] = None
+        # Opened by open_journal
+        self.journal: Optional[Journal] = None
+        self.metrics = Metrics()
+        self.metrics.gauge("watcher_queue_depth", "Files waiting for a worker.", self.pool.pending)
+        self.metrics.gauge("watcher_settling_files", "Files waiting to stop changing.", self.tracker.pending)
+        self.metrics.gauge("watcher_watched_roots", "Folders being watched.", lambda: len(self.router.handlers()))
+        self.metrics.gauge("watcher_device_waiting", "Moves held back by per-device limits.", self.scheduler.waiting)
+        self.metrics.table("device", "device", self.scheduler.snapshot)
+        self.rescans = 0
+        self.metrics.gauge("watcher_dropped_events", "Events dropped because the backlog was full.", lambda: sum(h.dropped for h in self.router.handlers()))
+        self.metrics.gauge("watcher_rescans", "Rescans queued after dropped or possibly lost events.", lambda: self.rescans)
+        self.listeners: List[MoveListener] = []
+        # Metrics server / stats dumper, stopped with the organizer
+        self._exporters: List[Union[MetricsServer, StatsDumper]] = []
+        self.router = EventRouter()
+        self.observer = InotifyObserver(self._kernel_overflow) if InotifyObserver is not None else Observer()
+        self.observer.start()
+        # Started with the first polled root
+        self.poller: Optional[SnapshotPoller] = None
+        # Last rules text seen by apply_settings and its compiled index
+        self._rules: Optional[Tuple[str, RuleIndex]] = None
+        self._missing: Set[str] = set()
+        self._watches: Dict[str, ObservedWatch] = {}
+        self._watch_lock = threading.Lock()
+        self._limits_lock = threading.Lock()
+        self._sweeps: "queue.Queue[Tuple[CreatedHandler, Optional[SweepProgress]]]" = queue.Queue()
+        self._sweep_thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    @property
+    def roots(self) -> List[Path]:
+        return [h.root for h in self.router.handlers()]
+
+    def watch(self, path: Path, rules: Union[RuleIndex, Dict[str, List[str]], None] = None, move_unknown_to: str = "Other", quiet: bool = False, sweep: bool = False, progress: Optional[SweepProgress] = None, recursive: bool = False, max_depth: Optional[int] = None, include: Optional[List[str]] = None, exclude: Optional[List[str]] = None, max_moves: Optional[int] = None, max_rate: Optional[float] = None, poll: Optional[float] = None) -> CreatedHandler:
+        """Add a root to the running observer, or the poller if poll is set (updating its settings in place if already watched)."""
+        root = path.resolve()
+        use_rules = rules if isinstance(rules, RuleIndex) else compile_rules(rules)
+        with self._watch_lock:
+            handler = self.router.get(root)
+            if handler is not None:
+                was_recursive, was_polled = handler.recursive, handler.poll is not None
+                # Keep the existing watch so no events are dropped
+                handler.configure(use_rules, move_unknown_to, quiet, recursive, max_depth, include, exclude, max_moves, max_rate, poll)
+                if poll is not None and was_polled:
+                    # The poller reads the new settings on its next pass
+                    pass
+                elif poll is not None or was_polled:
+                    # Switching between watching and polling: the new one starts before the old one stops
+                    old = self._watches.pop(str(root), None)
+                    self._schedule(handler)
+                    if old is not None:
+                        self._retire(old)
+                    if poll is None and self.poller is not None:
+                        # One last pass covers files that arrived since the previous one
+                        self.poller.remove(root, final=True)
+                elif recursive != was_recursive:
+                    old = self._watches.pop(str(root), None)
+                    self._schedule(handler)
+                    if old is not None:
+                        self._retire(old)
+            else:
+                handler = CreatedHandler(root, use_rules, move_unknown_to, quiet, self.pool, self.tracker, self.names, self.metrics, self.listeners, self.mover, self.sniffer if self.sniffing else None, self.dedupe, self.journal, recursive, max_depth, include, exclude, self.temp_suffixes, self.scheduler, max_moves, max_rate, poll)
+                handler.on_overflow = self.rescan
+                handler.on_new_device = lambda _: self._update_io_limits()
+                self.router.add(handler)
+                if str(root) not in self._watches:
+                    try:
+                        self._schedule(handler)
+                    except Exception:
+                        self.router.remove(root)
+                        raise
+                if poll is not None:
+                    scope = ("recursive" if recursive else "top-level only") + f", polled at least every {poll:g}s"
+                else:
+                    scope = "recursive" if self._watches[str(root)].is_recursive else "top-level only"
+                print(f"[INFO] Watching '{root}' ({scope}). Press Ctrl+C to stop.")
+            handler.learn_devices()
+            self._update_io_limits()
+        if sweep:
+            # Live events are already flowing, so nothing that lands during the sweep is missed
+            self.sweep(handler, progress)
+        return handler
+
+    def _update_io_limits(self) -> None:
+        # A folder's limits apply to every device its moves write to; folders writing
+        # to the same device share its limits, and the strictest setting wins
+        with self._limits_lock:
+            limits: Dict[int, Tuple[Optional[int], Optional[float]]] = {}
+            for handler in self.router.handlers():
+                if handler.max_moves is None and handler.max_rate is None:
+                    continue
+                for device in list(handler.devices):
+                    moves, rate = limits.get(device, (None, None))
+                    if handler.max_moves is not None:
+                        moves = handler.max_moves if moves is None else min(moves, handler.max_moves)
+                    if handler.max_rate is not None:
+                        rate = handler.max_rate if rate is None else min(rate, handler.max_rate)
+                    limits[device] = (moves, rate)
+            self.scheduler.set_limits(limits)
+
+    def _retire(self, watch: ObservedWatch) -> None:
+        """Unschedule a watch that was replaced, once the events it still holds are delivered."""
+        # Unscheduling drops queued events, and inotify holds events back to pair up moves
+
+        def unschedule() -> None:
+            with self._watch_lock:
+                if watch in self._watches.values():
+                    # Scheduled again meanwhile
+                    return
+                try:
+                    self.observer.unschedule(watch)
+                except Exception:
+                    pass
+
+        timer = threading.Timer(WATCH_HANDOVER_SECONDS, unschedule)
+        timer.daemon = True
+        timer.start()
+
+    def _schedule(self, handler: CreatedHandler) -> None:
+        root = str(handler.root)
+        if handler.poll is not None:
+            if self.poller is None:
+                self.poller = SnapshotPoller(self.router.dispatch)
+                self.metrics.table("poll", "root", self.poller.snapshot)
+            self.poller.add(handler)
+            return
+        try:
+            self._watches[root] = self.observer.schedule(self.router, root, recursive=handler.recursive)
+            return
+        except OSError as e:
+            if not handler.recursive or e.errno not in (errno.ENOSPC, errno.EMFILE):
+                raise
+            print(f"[WARN] Out of OS watches for '{root}' ({e}); watching its top level only. "
+                  "On Linux raise fs.inotify.max_user_watches / max_user_instances.")
+        # The observer keeps the handler of a failed schedule; drop it before retrying
+        try:
+            self.observer.remove_handler_for_watch(self.router, ObservedWatch(root, recursive=True))
+        except Exception:
+            pass
+        self._watches[root] = self.observer.schedule(self.router, root, recursive=False)
+
+    def _compiled_rules(self, text: str) -> RuleIndex:
+        rules = self._rules
+        if rules is None or rules[0] != text:
+            rules = self._rules = (text, compile_rules_text(text))
+        return rules[1]
+
+    def set_rules_text(self, text: str) -> None:
+        """Swap new rules into every watched root without touching folders or watches."""
+        rules = self._compiled_rules(text)
+        for handler in self.router.handlers():
+            handler.set_rules(rules)
+
+    def apply_settings(self, settings: Dict, progress: Optional[SweepProgress] = None) -> None:
+        """Bring roots and rules in line with a settings.json dict; unchanged roots keep their watch."""
+        rules = self._compiled_rules(str(settings.get("rules_text", "") or ""))
+        self.set_sniffing(bool(settings.get("sniff_content", False)))
+        self.set_temp_suffixes(settings.get("temp_suffixes"))
+        self.set_dedupe(settings.get("dedupe"), _optional_path(settings.get("dedupe_index")))
+        wanted: Dict[str, Tuple[Path, Dict]] = {}
+        for f in settings.get("folders", []) or []:
+            p = Path(str(f.get("path", ""))).expanduser()
+            if not p.is_dir():
+                if str(p) not in self._missing:
+                    self._missing.add(str(p))
+                    print(f"[WARN] Skipping folder that does not exist: {p}")
+                continue
+            self._missing.discard(str(p))
+            wanted[str(p.resolve())] = (p, f)
+        for root in self.roots:
+            if str(root) not in wanted:
+                self.unwatch(root)
+        watched = {str(r) for r in self.roots}
+        sweep = bool(settings.get("sweep", False))
+        for key, (p, f) in wanted.items():
+            try:
+                # Only newly added roots get a sweep
+                self.watch(p, rules, str(f.get("unknown") or "Other"), bool(f.get("quiet", False)), sweep and key not in watched, progress, **folder_options(f))
+            except OSError as e:
+                print(f"[ERROR] Cannot watch '{p}': {e}")
+
+    def unwatch(self, path: Path) -> bool:
+        """Remove a root from the running observer; moves already queued still finish."""
+        root = path.resolve()
+        with self._watch_lock:
+            handler = self.router.remove(root)
+            watch = self._watches.pop(str(root), None)
+            if handler is not None:
+                handler.active = False
+            if watch is not None:
+                try:
+                    self.observer.unschedule(watch)
+                except Exception:
+                    pass
+            if self.poller is not None:
+                self.poller.remove(root)
+            self._update_io_limits()
+        if handler is not None:
+            print(f"[INFO] Stopped watching '{root}'")
+        return handler is not None
+
+    def unwatch_all(self) -> None:
+        for root in self.roots:
+            self.unwatch(root)
+
+    def _kernel_overflow(self) -> None:
+        # The kernel queue is shared by every watched root, so any of them may have lost events
+        for handler in self.router.handlers():
+            if handler.poll is None:
+                handler._overflow()
+
+    def rescan(self, handler: CreatedHandler) -> None:
+        """Queue one reconciliation sweep of a root whose events were dropped or may have been lost."""
+        self.rescans += 1
+        if not handler.quiet:
+            print(f"[WARN] Event storm in '{handler.root}'; it will be rescanned for files that were missed")
+        self.sweep(handler)
+
+    def sweep(self, handler: CreatedHandler, progress: Optional[SweepProgress] = None) -> None:
+        """Queue a catch-up pass over files already in handler.root."""
+        self._sweeps.put((handler, progress))
+        if self._sweep_thread is None:
+            self._sweep_thread = threading.Thread(target=self._sweep_loop, name="watcher-sweep", daemon=True)
+            self._sweep_thread.start()
+
+    def _sweep_loop(self) -> None:
+        # One thread sweeps roots one after another
+        while not self._stopping.is_set():
+            try:
+                handler, progress = self._sweeps.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            self._sweep_root(handler, progress)
+
+    def _sweep_root(self, handler: CreatedHandler, progress: Optional[SweepProgress]) -> None:
+        root = handler.root
+        # Events lost from here on need another pass; earlier ones are covered by this one
+        handler.rescan_queued = False
+        scanned = queued = 0
+        # Folders still to scan, with their depth below the root
+        pending: List[Tuple[str, int]] = [(str(root), 0)]
+        while pending:
+            folder, depth = pending.pop()
+            try:
+                # scandir streams entries, so memory stays flat however big the folder is
+                with os.scandir(folder) as it:
+                    for entry in it:
+                        if self._stopping.is_set() or not handler.active:
+                            return
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                # Pruned by name, so skipped folders are never listed
+                                if handler.descends(entry.name, depth + 1):
+                                    pending.append((entry.path, depth + 1))
+                                continue
+                            if not entry.is_file(follow_symlinks=False):
+                                continue
+                        except OSError:
+                            continue
+                        if not handler.accepts(entry.path):
+                            continue
+                        scanned += 1
+                        if handler.offer(Path(entry.path), scanning=True):
+                            queued += 1
+                        if scanned % SWEEP_BATCH == 0:
+                            self._report_sweep(handler, progress, scanned, queued, False)
+                            self._wait_for_backlog()
+            except OSError as e:
+                print(f"[ERROR] Sweep of '{folder}' failed: {e}")
+        self._report_sweep(handler, progress, scanned, queued, True)
+
+    def _wait_for_backlog(self) -> None:
+        # Let the pipeline catch up before feeding the next batch
+        while not self._stopping.is_set() and self.tracker.pending() + self.scheduler.waiting() + self.pool.pending() > SWEEP_BATCH:
+            time.sleep(0.05)
+
+    def _report_sweep(self, handler: CreatedHandler, progress: Optional[SweepProgress], scanned: int, queued: int, finished: bool) -> None:
+        if not handler.quiet:
+            state = "done" if finished else "in progress"
+            print(f"[INFO] Sweep '{handler.root}' {state}: {scanned} file(s) scanned, {queued} queued")
+        if progress is not None:
+            try:
+                progress(handler.root, scanned, queued, finished)
+            except Exception:
+                pass
+
+    def set_temp_suffixes(self, suffixes: Union[List[str], str, None]) -> None:
+        """Set the suffixes of in-progress downloads for every root; None restores the defaults."""
+        self.temp_suffixes = resolve_temp_suffixes(suffixes)
+        for handler in self.router.handlers():
+            handler.temp_suffixes = self.temp_suffixes
+
+    def set_sniffing(self, enabled: bool) -> None:
+        """Turn content sniffing of extensionless/.bin/.dat files on or off for every root."""
+        self.sniffing = enabled
+        for handler in self.router.handlers():
+            handler.sniffer = self.sniffer if enabled else None
+
+    def open_journal(self, path: Path = JOURNAL_PATH) -> None:
+        """Record every move in path, after finishing or rolling back moves a crash left open."""
+        if self.journal is not None:
+            return
+        try:
+            self.journal = Journal(path)
+        except OSError as e:
+            print(f"[ERROR] Cannot open journal '{path}': {e}")
+            return
+        for handler in self.router.handlers():
+            handler.journal = self.journal
+
+    def set_dedupe(self, action: Optional[str], index_path: Optional[Path] = None) -> None:
+        """Set the duplicate action ("skip", "hardlink", "move") for every root; None or "off" disables it."""
+        if not action or action == "off":
+            self.dedupe = None
+        elif action not in DEDUPE_ACTIONS:
+            print(f"[ERROR] Unknown dedupe action '{action}'; expected one of {', '.join(DEDUPE_ACTIONS)}")
+            return
+        elif self.dedupe is None or self.dedupe.action != action:
+            if self._hash_index is None:
+                self._hash_index = HashIndex(index_path or HASH_INDEX_PATH)
+            self.dedupe = Deduplicator(self._hash_index, action)
+        for handler in self.router.handlers():
+            handler.dedupe = self.dedupe
+
+    def add_listener(self, listener: MoveListener) -> None:
+        """Call listener(record) after every move; it runs on a worker thread, so keep it short."""
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: MoveListener) -> None:
+        try:
+            self.listeners.remove(listener)
+        except ValueError:
+            pass
+
+    def serve_metrics(self, port: int, host: str = "127.0.0.1") -> None:
+        """Expose /metrics (Prometheus) and /stats (JSON) over HTTP on localhost."""
+        self._exporters.append(MetricsServer(self.metrics, port, host))
+
+    def dump_stats(self, path: Path, interval: float = DEFAULT_STATS_INTERVAL) -> None:
+        """Write a JSON stats snapshot to path every interval seconds."""
+        self._exporters.append(StatsDumper(self.metrics, path, interval))
+
+    def stop(self) -> None:
+        self._stopping.set()
+        try:
+            self.observer.stop()
+        except Exception:
+            pass
+        if self.poller is not None:
+            self.poller.stop()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        try:
+            self.observer.join(timeout=timeout)
+        except Exception:
+            pass
+        if self.poller is not None:
+            self.poller.join(timeout=timeout)
+        if self._sweep_thread is not None:
+            self._sweep_thread.join(timeout=timeout)
+        # Observers are gone, so no new jobs arrive; drain what is queued.
+        self.tracker.stop()
+        self.pool.shutdown(timeout=timeout)
+        for exporter in self._exporters:
+            exporter.stop()
+        self._exporters = []
+        if self._hash_index is not None:
+            self._hash_index.close()
+            self._hash_index = None
+        if self.journal is not None:
+            self.journal.close()
+
+
+class ConfigWatcher:
+    """Re-reads settings.json when it changes (or on reload()) and passes each valid version to on_change."""
+
+    def __init__(self, path: Path, on_change: Callable[[Dict], None], interval: float = CONFIG_POLL_SECONDS) -> None:
+        self.path = path
+        self.on_change = on_change
+        self.interval = interval
+        self._signature = self._stat()
+        self._stopping = threading.Event()
+        self._wake = threading.Event()
+        # A stat per interval instead of a watch: the settings folder may itself be a
+        # watched root, and editors often save by replacing the file.
+        self._thread = threading.Thread(target=self._run, name="watcher-config", daemon=True)
+        self._thread.start()
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = self.path.stat()
+            return (st.st_size, st.st_mtime_ns)
+        except OSError:
+            return None
+
+    def reload(self) -> None:
+        """Apply the file now even if it looks unchanged (e.g. on SIGHUP)."""
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            forced = self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._stopping.is_set():
+                return
+            signature = self._stat()
+            if not forced and signature == self._signature:
+                continue
+            self._signature = signature
+            self._apply()
+
+    def _apply(self) -> None:
+        try:
+            settings = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception as e:
+            # Half-written or broken; keep running with the current settings
+            print(f"[ERROR] Not reloading '{self.path.name}': {e}")
+            return
+        if not isinstance(settings, dict):
+            print(f"[ERROR] Not reloading '{self.path.name}': expected a JSON object")
+            return
+        print(f"[INFO] Reloading '{self.path.name}'")
+        try:
+            self.on_change(settings)
+        except Exception as e:
+            print(f"[ERROR] Reload failed: {e}")
+
+    def stop(self) -> None:
+        self._stopping.set()
+        self._wake.set()
+        self._thread.join(timeout=5)
+
+
+class SettingsWriter:
+    """Saves settings.json from a background thread, writing only the latest of saves that arrive close together."""
+
+    def __init__(self, path: Path = CONFIG_PATH, delay: float = SAVE_DEBOUNCE_SECONDS) -> None:
+        self.path = path
+        self.delay = delay
+        self._cond = threading.Condition()
+        self._text: Optional[str] = None
+        self._due = 0.0
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="watcher-settings", daemon=True)
+        self._thread.start()
+
+    def save(self, data: Dict) -> None:
+        """Queue data to be written; returns at once."""
+        # Serialized here, so the caller may keep changing its dicts
+        text = json.dumps(data, indent=2)
+        with self._cond:
+            self._text = text
+            self._due = time.monotonic() + self.delay
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stopping and (self._text is None or time.monotonic() < self._due):
+                    self._cond.wait(None if self._text is None else self._due - time.monotonic())
+                if self._text is None:
+                    return
+                text, self._text = self._text, None
+            try:
+                _write_atomic(self.path, text)
+            except OSError as e:
+                print(f"[ERROR] Failed to save '{self.path.name}': {e}")
+
+    def stop(self) -> None:
+        """Write what is queued, then end the thread."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        self._thread.join(timeout=5)
+
+
+def start_watcher(path: Path, rules: Optional[Dict[str, List[str]]] = None, move_unknown_to: str = "Other", quiet: bool = False, workers: int = DEFAULT_WORKERS, settle: float = DEFAULT_SETTLE_SECONDS, sweep: bool = False, sniff: bool = False, recursive: bool = False, max_depth: Optional[int] = None, include: Optional[List[str]] = None, exclude: Optional[List[str]] = None) -> Organizer:
+    organizer = Organizer(workers, settle, sniff)
+    organizer.watch(path, rules, move_unknown_to, quiet, sweep, None, recursive, max_depth, include, exclude)
+    return organizer
+
+
+def start_watchers(paths: List[Path], rules: Optional[Dict[str, List[str]]] = None, move_unknown_to: str = "Other", quiet: bool = False, workers: int = DEFAULT_WORKERS, settle: float = DEFAULT_SETTLE_SECONDS, sweep: bool = False, sniff: bool = False, dedupe: Optional[str] = None, dedupe_index: Optional[Path] = None, journal: Optional[Path] = None, recursive: bool = False, max_depth: Optional[int] = None, include: Optional[List[str]] = None, exclude: Optional[List[str]] = None, temp_suffixes: Optional[List[str]] = None, max_moves: Optional[int] = None, max_rate: Optional[float] = None, poll: Optional[float] = None) -> Organizer:
+    organizer = Organizer(workers, settle, sniff)
+    organizer.set_temp_suffixes(temp_suffixes)
+    # Before the watches start, so a sweep already checks for duplicates and is journaled
+    organizer.set_dedupe(dedupe, dedupe_index)
+    if journal is not None:
+        organizer.open_journal(journal)
+    # Compile once; every root shares the same index
+    index = compile_rules(rules)
+    for p in paths:
+        organizer.watch(p, index, move_unknown_to, quiet, sweep, None, recursive, max_depth, include, exclude, max_moves, max_rate, poll)
+    return organizer
+
+
+def parse_rules_text(text: str) -> Dict[str, List[str]]:
+    """Parse rules from JSON or simple DSL ('Category = ext1,ext2'); conditional lines are left out."""
+    text = (text or "").strip()
+    if not text:
+        return {}
+    # Try JSON first
+    if text.startswith("{"):
+        try:
+            obj = json.loads(text)
+            parsed: Dict[str, List[str]] = {}
+            for k, v in obj.items():
+                if isinstance(v, list):
+                    parsed[str(k)] = [str(x).lower().lstrip('.') for x in v]
+            return parsed
+        except Exception:
+            pass
+    # Fallback: DSL lines
+    rules: Dict[str, List[str]] = {}
+    for line in text.splitlines():
+        cat, exts, conditions, error = _parse_rule_line(line)
+        if cat and exts and error is None and not conditions and "*" not in exts:
+            rules[cat] = list(exts)
+    return rules
+
+
+def parse_conditional_rules(text: str) -> List[ConditionalRule]:
+    """The 'Category = exts if ...' and 'Category = *' lines of a DSL text, in order."""
+    if (text or "").strip().startswith("{"):
+        return []
+    rules: List[ConditionalRule] = []
+    for n, line in enumerate((text or "").splitlines(), 1):
+        cat, exts, conditions, error = _parse_rule_line(line)
+        if cat and exts and error is None and (conditions or "*" in exts):
+            rules.append(ConditionalRule(cat, () if "*" in exts else exts, conditions, f"rule:{line.strip()}", n))
+    return rules
+
+
+def compile_rules_text(text: str) -> RuleIndex:
+    """RuleIndex for a rules text: its conditional rules, then its extensions (or the defaults if it has none)."""
+    return compile_rules(parse_rules_text(text) or None, parse_conditional_rules(text))
+
+
+_CONDITION = re.compile(r"^(size|age)\s*(>=|<=|>|<)\s*(.+)$", re.IGNORECASE)
+_NAME_CONDITION = re.compile(r"^name\s+matches\s+(.+)$", re.IGNORECASE)
+_AGE = re.compile(r"^(\d+(?:\.\d+)?)\s*([smhdw])$", re.IGNORECASE)
+_AGE_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def _parse_condition(text: str) -> Tuple[Optional[Tuple[str, str, object]], Optional[str]]:
+    # ((field, op, value), None) or (None, error)
+    m = _NAME_CONDITION.match(text)
+    if m:
+        return ("name", "matches", m.group(1).strip()), None
+    m = _CONDITION.match(text)
+    if not m:
+        return None, f"unknown condition '{text}'; use size, age or name matches"
+    field, op, value = m.group(1).lower(), m.group(2), m.group(3).strip()
+    if field == "size":
+        size = _size_bytes(value)
+        if size is None:
+            return None, f"cannot read '{value}' as a size; use e.g. 500k, 20MB or 2GB"
+        return (field, op, size), None
+    age = _AGE.match(value)
+    if not age:
+        return None, f"cannot read '{value}' as an age; use e.g. 12h, 30d or 2w"
+    return (field, op, float(age.group(1)) * _AGE_SECONDS[age.group(2).lower()]), None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_rule_line(line: str) -> Tuple[str, Tuple[str, ...], Tuple[Tuple[str, str, object], ...], Optional[str]]:
+    # (category, extensions, conditions, error); cached, so re-checking an edited text only parses the changed lines
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return "", (), (), None
+    if "=" not in line:
+        return "", (), (), "expected 'Category = ext1,ext2'"
+    left, right = line.split("=", 1)
+    # Nested categories are allowed ("Videos/Large"); a trailing slash is not a level
+    cat = left.strip().rstrip("/\\").strip()
+    parts = re.split(r"(?:^|\s+)if(?:\s+|$)", right.strip(), maxsplit=1, flags=re.IGNORECASE)
+    exts = tuple(e.strip().lower().lstrip('.') for e in parts[0].split(',') if e.strip())
+    if not cat:
+        return "", exts, (), "missing category name before '='"
+    if not exts:
+        return cat, (), (), f"no extensions listed for '{cat}' (use * for any file)"
+    conditions = []
+    if len(parts) == 2:
+        if not parts[1].strip():
+            return cat, exts, (), "expected a condition after 'if'"
+        for text in re.split(r"\s+and\s+", parts[1].strip(), flags=re.IGNORECASE):
+            condition, error = _parse_condition(text.strip())
+            if condition is None:
+                return cat, exts, (), error
+            conditions.append(condition)
+    return cat, exts, tuple(conditions), None
+
+
+def validate_rules_text(text: str) -> List[Tuple[int, str]]:
+    """(line number, message) for every rule line that parse_rules_text would ignore."""
+    if (text or "").strip().startswith("{"):
+        try:
+            obj = json.loads(text)
+        except ValueError as e:
+            return [(getattr(e, "lineno", 1), str(getattr(e, "msg", e)))]
+        if not isinstance(obj, dict):
+            return [(1, "expected a JSON object of category -> extensions")]
+        return [(1, f"'{k}' must map to a list of extensions") for k, v in obj.items() if not isinstance(v, list)]
+    problems = []
+    for n, line in enumerate((text or "").splitlines(), 1):
+        error = _parse_rule_line(line)[3]
+        if error is not None:
+            problems.append((n, error))
+    return problems
+
+
+SAMPLE_FILES = [
+    "sample.jpg",
+    "clip.mp4",
+    "track.mp3",
+    "report.pdf",
+    "archive.zip",
+    "script.py",
+    "setup.exe",
+    "font.ttf",
+    "unknown.bin",
+]
+
+
+def build_parser():
+    import argparse
+    parser = argparse.ArgumentParser(description="Watcher GUI/CLI")
+    parser.add_argument("--path", action="append", help="Folder to watch (repeat for multiple)")
+    parser.add_argument("--quiet", action="store_true", help="Reduce logs to errors only")
+    parser.add_argument("--unknown", default="Other", help="Folder name for unknown file types")
+    parser.add_argument("--rules", help="JSON text with category->extensions mapping")
+    parser.add_argument("--create-test", action="store_true", help="Create sample files in each folder")
+    parser.add_argument("--workers", type=int, help=f"Worker threads that move files (default: settings.json or {DEFAULT_WORKERS})")
+    parser.add_argument("--sweep", action="store_true", help="Also organize files already in each folder at startup")
+    parser.add_argument("--recursive", action="store_true", help="Also organize files in subfolders, each into category folders next to it")
+    parser.add_argument("--max-depth", type=int, help="With --recursive, how many subfolder levels to descend (default: unlimited)")
+    parser.add_argument("--include", action="append", metavar="GLOB", help="Only organize files whose name or relative path matches (repeatable)")
+    parser.add_argument("--exclude", action="append", metavar="GLOB", help="Skip files and subfolders whose name or relative path matches (repeatable)")
+    parser.add_argument("--max-moves", type=int, metavar="N", help="Moves allowed at once per disk; more wait, smallest file first (default: unlimited)")
+    parser.add_argument("--max-rate", type=_optional_size, metavar="BYTES", help="Bytes per second copied to each disk when a move crosses disks, e.g. 50m (default: unlimited)")
+    parser.add_argument("--poll", type=float, nargs="?", const=POLL_MAX_SECONDS, metavar="SECONDS", help=f"Find new files by polling instead of OS events, for network shares and FUSE mounts; SECONDS is the longest wait between polls (default: {POLL_MAX_SECONDS:g})")
+    parser.add_argument("--temp-suffix", action="append", metavar="SUFFIX", help="Suffix of files still downloading, organized once renamed (repeatable; replaces the default: settings.json temp_suffixes or " + " ".join(DEFAULT_TEMP_SUFFIXES) + ")")
+    parser.add_argument("--settle", type=float, help=f"Seconds a file must stay unchanged before it is moved (default: settings.json or {DEFAULT_SETTLE_SECONDS})")
+    parser.add_argument("--sniff", action="store_true", help="Classify extensionless, .bin and .dat files by their content")
+    parser.add_argument("--dedupe", choices=DEDUPE_ACTIONS, help="What to do with a file identical to one already in its category folder: skip it, hard-link it, or move it to Duplicates (default: settings.json dedupe)")
+    parser.add_argument("--journal", help="Record every move in this JSONL file (default: settings.json journal, else journal.jsonl next to it)")
+    parser.add_argument("--no-journal", action="store_true", help="Do not record moves")
+    parser.add_argument("--plan", metavar="FILE", help="Write the moves organizing each folder (--path, else settings.json folders) would make to FILE as JSONL ('-' for stdout), then exit without moving anything")
+    parser.add_argument("--apply", metavar="PLAN", help="Carry out a plan written by --plan, skipping files changed since it was written, then exit")
+    parser.add_argument("--undo", metavar="SINCE", help="Move files organized since SINCE (e.g. 30m, 2h, 1d or 2024-05-01T14:00) back where they came from, then exit")
+    parser.add_argument("--metrics-port", type=int, help="Serve Prometheus metrics on http://127.0.0.1:PORT/metrics (default: settings.json metrics_port)")
+    parser.add_argument("--stats-file", help="Write a JSON stats snapshot to this file periodically (default: settings.json stats_file)")
+    parser.add_argument("--stats-interval", type=float, help=f"Seconds between JSON stats snapshots (default: settings.json or {DEFAULT_STATS_INTERVAL:g})")
+    parser.add_argument("--config", action="store_true", help="Watch the folders and rules in settings.json and reload them when it changes")
+    parser.add_argument("--shards", type=int, metavar="N", help="Like --config, but spread the folders over N worker processes (0 = one per CPU core)")
+    return parser
+
+
+def resolve_temp_suffixes(value: Union[List[str], str, None]) -> Tuple[str, ...]:
+    """Lower-case, dotted download suffixes from CLI/settings; None gives DEFAULT_TEMP_SUFFIXES."""
+    if value is None:
+        return DEFAULT_TEMP_SUFFIXES
+    return tuple("." + s.lower().lstrip(".") for s in _globs(value) if s.lstrip("."))
+
+
+def _optional_path(value: Optional[object]) -> Optional[Path]:
+    return Path(str(value)).expanduser() if value else None
+
+
+def _optional_int(value: Optional[object]) -> Optional[int]:
+    try:
+        return int(value) if value is not None and value != "" else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _globs(value: Optional[object]) -> List[str]:
+    """Pattern list from settings: a list, or one comma-separated string."""
+    if not value:
+        return []
+    items = value.split(",") if isinstance(value, str) else value
+    return [str(g).strip() for g in items if str(g).strip()]
+
+
+def folder_options(folder: Dict) -> Dict:
+    """Organizer.watch keyword arguments for the subfolder, I/O and backend settings of a settings.json folder entry."""
+    return {
+        "recursive": bool(folder.get("recursive", False)),
+        "max_depth": _optional_int(folder.get("max_depth")),
+        "include": _globs(folder.get("include")),
+        "exclude": _globs(folder.get("exclude")),
+        "max_moves": _optional_int(folder.get("max_concurrent_moves")),
+        "max_rate": _optional_size(folder.get("max_bytes_per_second")),
+        "poll": poll_interval(folder.get("backend"), folder.get("poll_interval")),
+    }
+
+
+def poll_interval(backend: Optional[object], interval: Optional[object] = None) -> Optional[float]:
+    """Longest wait between polls for a "poll" backend; None for native OS events."""
+    if str(backend or "native").lower() != "poll":
+        return None
+    try:
+        seconds = float(interval)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return POLL_MAX_SECONDS
+    return max(POLL_MIN_SECONDS, seconds)
+
+
+_SIZE_UNITS = {"": 1, "b": 1, "k": 1024, "m": 1024 ** 2, "g": 1024 ** 3, "t": 1024 ** 4}
+
+
+def _size_bytes(value: object) -> Optional[float]:
+    """Bytes from a number or a string like '50m', '2GB' or '20mb/s'; None if invalid."""
+    text = str(value).strip().lower().rstrip("b/s")
+    unit = text[-1] if text and text[-1] in _SIZE_UNITS else ""
+    try:
+        size = float(text[:len(text) - len(unit)].strip()) * _SIZE_UNITS[unit]
+    except ValueError:
+        return None
+    return size if size >= 0 else None
+
+
+def _optional_size(value: Optional[object]) -> Optional[float]:
+    """Bytes from a number or a string like '50m'; None if unset, zero or invalid."""
+    if value is None or value == "":
+        return None
+    size = _size_bytes(value)
+    return size if size else None
+
+
+def journal_path(value: Optional[object]) -> Optional[Path]:
+    """Journal file for a settings/CLI value: a path, False/"off" to disable, or None for the default."""
+    if value is False or (isinstance(value, str) and value.lower() in ("off", "false", "none", "")):
+        return None
+    if value is None or value is True:
+        return JOURNAL_PATH
+    return Path(str(value)).expanduser()
+
+
+def _cli_journal(args, config: Dict) -> Optional[Path]:
+    if args.no_journal:
+        return None
+    return journal_path(args.journal if args.journal else config.get("journal"))
+
+
+def undo_moves(path: Path, since: float) -> Tuple[int, int]:
+    """Move files organized at or after since back to where they were; returns (undone, failed)."""
+    names = NameReserver()
+    mover = Mover()
+
+    def move_back(moved: Path, original: Path) -> None:
+        # The original name may have been reused meanwhile; claim a free one next to it
+        target = names.claim(original.parent, original.name)
+        try:
+            mover.move(moved.parent, moved, target)
+        except OSError:
+            names.release(target)
+            raise
+
+    # Undo records stay in the file undo_since is reading
+    journal = Journal(path, segment_bytes=0)
+    try:
+        return undo_since(journal, since, move_back)
+    finally:
+        journal.close()
+
+
+def run_undo(args) -> None:
+    try:
+        since = parse_since(args.undo)
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return
+    path = _cli_journal(args, load_config())
+    # A sharded daemon (--shards) keeps one journal per worker process
+    paths = [p for p in [path] + shard_paths(path) if p.exists()] if path is not None else []
+    if not paths:
+        print(f"[ERROR] No journal to undo from: {path}")
+        return
+    undone = failed = 0
+    for p in paths:
+        ok, bad = undo_moves(p, since)
+        undone += ok
+        failed += bad
+    print(f"[INFO] Undid {undone} move(s); {failed} failed")
+
+
+def start_exporters(organizer: Organizer, port: Optional[object], stats_file: Optional[str], interval: Optional[object] = None) -> None:
+    """Start the metrics endpoint and/or stats dump if configured; failures are logged, not fatal."""
+    if port not in (None, ""):
+        try:
+            organizer.serve_metrics(int(port))  # type: ignore[arg-type]
+        except (TypeError, ValueError, OSError) as e:
+            print(f"[ERROR] Cannot serve metrics on port {port}: {e}")
+    if stats_file:
+        try:
+            every = float(interval) if interval not in (None, "") else DEFAULT_STATS_INTERVAL  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            every = DEFAULT_STATS_INTERVAL
+        organizer.dump_stats(Path(stats_file).expanduser(), every)
+
+
+def _start_cli_exporters(organizer: Organizer, args, config: Dict) -> None:
+    start_exporters(
+        organizer,
+        args.metrics_port if args.metrics_port is not None else config.get("metrics_port"),
+        args.stats_file or config.get("stats_file"),
+        args.stats_interval if args.stats_interval is not None else config.get("stats_interval"),
+    )
+
+
+def cli_rules(args) -> Optional[Dict[str, List[str]]]:
+    """The --rules mapping, or None for the defaults."""
+    if not args.rules:
+        return None
+    try:
+        return json.loads(args.rules)
+    except Exception as e:
+        print(f"[ERROR] Invalid --rules JSON: {e}")
+        return None
+
+
+def cli_overrides(args, settings: Dict) -> Dict:
+    """settings with the command-line flags that override settings.json applied."""
+    if args.sweep:
+        settings = {**settings, "sweep": True}
+    if args.sniff:
+        settings = {**settings, "sniff_content": True}
+    if args.dedupe:
+        settings = {**settings, "dedupe": args.dedupe}
+    if args.temp_suffix:
+        settings = {**settings, "temp_suffixes": args.temp_suffix}
+    return settings
+
+
+def run_config_cli(args) -> None:
+    """Run from settings.json, applying edits to it (or a SIGHUP) without restarting."""
+    config = load_config()
+    workers = resolve_workers(args.workers if args.workers is not None else config.get("workers"))
+    settle = resolve_settle(args.settle if args.settle is not None else config.get("settle_seconds"))
+    organizer = Organizer(workers, settle)
+    journal = _cli_journal(args, config)
+    if journal is not None:
+        organizer.open_journal(journal)
+    _start_cli_exporters(organizer, args, config)
+
+    def apply(settings: Dict) -> None:
+        # workers and settle_seconds only take effect on restart
+        organizer.apply_settings(cli_overrides(args, settings))
+
+    apply(config)
+    watcher = ConfigWatcher(CONFIG_PATH, apply)
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, lambda *_: watcher.reload())
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        watcher.stop()
+        organizer.stop()
+        organizer.join(timeout=5)
+
+
+def run_cli(args) -> None:
+    if getattr(args, "undo", None):
+        run_undo(args)
+        return
+    if getattr(args, "plan", None) or getattr(args, "apply", None):
+        # Imported here: plan builds on this module
+        from plan import run_apply_cli, run_plan_cli
+        run_plan_cli(args) if args.plan else run_apply_cli(args)
+        return
+    if getattr(args, "config", False) or getattr(args, "shards", None) is not None:
+        if args.path:
+            print(f"[ERROR] {'--shards' if args.shards is not None else '--config'} takes its folders from settings.json; drop --path")
+            return
+        if args.shards is not None:
+            # Imported here so the single-process modes never load multiprocessing
+            from shards import run_shards_cli
+            run_shards_cli(args)
+            return
+        run_config_cli(args)
+        return
+    roots: List[Path] = []
+    for p in args.path:
+        rp = Path(p).expanduser()
+        if not rp.exists() or not rp.is_dir():
+            print(f"[ERROR] Path does not exist or is not a directory: {rp}")
+            return
+        roots.append(rp)
+    rules = cli_rules(args)
+    if args.create_test:
+        for root in roots:
+            for name in SAMPLE_FILES:
+                try:
+                    (root / name).write_bytes(b"test")
+                except Exception:
+                    pass
+    config = load_config()
+    workers = resolve_workers(args.workers if args.workers is not None else config.get("workers"))
+    settle = resolve_settle(args.settle if args.settle is not None else config.get("settle_seconds"))
+    sweep = args.sweep or bool(config.get("sweep", False))
+    sniff = args.sniff or bool(config.get("sniff_content", False))
+    dedupe = args.dedupe or config.get("dedupe")
+    organizer = start_watchers(roots, rules, args.unknown, args.quiet, workers, settle, sweep, sniff, dedupe, _optional_path(config.get("dedupe_index")), _cli_journal(args, config),
+                               args.recursive, args.max_depth, args.include, args.exclude, args.temp_suffix or config.get("temp_suffixes"),
+                               args.max_moves, args.max_rate, poll_interval("poll" if args.poll is not None else None, args.poll))
+    _start_cli_exporters(organizer, args, config)
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        organizer.stop()
+        organizer.join(timeout=5)
+
+
+def main() -> None:
+    # Headless entry point: never imports tkinter or the icon
+    parser = build_parser()
+    args = parser.parse_args()
+    if not args.path and not args.config and args.shards is None and not args.undo and not args.plan and not args.apply:
+        parser.error("--path, --config, --shards, --plan, --apply or --undo is required (run gui.py for the GUI)")
+    run_cli(args)
+
+
+if __name__ == "__main__":
+    main()
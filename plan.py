@@ -0,0 +1,271 @@
+import contextlib
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, TextIO, Tuple
+
+from journal import Journal
+from organizer import _NUMBERED_NAME, CreatedHandler, Mover, NameReserver, compile_rules, ensure_directory, name_counters
+from sniff import ContentSniffer
+
+
+# Plan entries read and moved together; the next batch is read once this one is done.
+PLAN_BATCH = 1000
+
+# Plan entries, one JSON object per line:
+#   {"root": ..., "src": ..., "dest": ..., "category": ..., "rule": ..., "size": ..., "mtime_ns": ...}
+# size and mtime_ns are the source as planned; --apply skips a file if either changed.
+
+
+class PlannedNames:
+    """NameReserver.claim for one destination folder, simulated in memory.
+
+    Only names that a later claim could run into are remembered: what is
+    already in the folder, plus planned names of the "stem (n)" form.
+    Other planned names are unique within their source folder, so memory
+    does not grow with the number of files planned.
+    """
+
+    def __init__(self, dest_dir: Path) -> None:
+        try:
+            with os.scandir(dest_dir) as it:
+                self._taken: Set[str] = {entry.name for entry in it}
+        except OSError:
+            self._taken = set()
+        self._next = name_counters(self._taken)
+
+    def claim(self, filename: str) -> str:
+        stem, ext = Path(filename).stem, Path(filename).suffix
+        if filename not in self._taken:
+            # Like NameReserver, the bare name whenever it is free
+            if _NUMBERED_NAME.match(stem):
+                self._taken.add(filename)
+            return filename
+        n = self._next.get((stem, ext), 1)
+        while True:
+            candidate = f"{stem} ({n}){ext}"
+            n += 1
+            if candidate not in self._taken:
+                self._next[(stem, ext)] = n
+                self._taken.add(candidate)
+                return candidate
+
+
+def plan_root(handler: CreatedHandler, out: TextIO) -> Tuple[int, int]:
+    """Write a plan entry for every file handler would organize under its root; returns (planned, renamed).
+
+    Walks one folder at a time with os.scandir, like a sweep, and keeps
+    name state only for the folder being walked.
+    """
+    root = str(handler.root)
+    planned = renamed = 0
+    pending: List[Tuple[str, int]] = [(root, 0)]
+    while pending:
+        folder, depth = pending.pop()
+        names: Dict[str, PlannedNames] = {}
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if handler.descends(entry.name, depth + 1):
+                                pending.append((entry.path, depth + 1))
+                            continue
+                        if not entry.is_file(follow_symlinks=False) or handler.is_temp(entry.name) or not handler.accepts(entry.path):
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    category, rule = handler.classify(Path(entry.path))
+                    dest_names = names.get(category)
+                    if dest_names is None:
+                        dest_names = names[category] = PlannedNames(Path(folder) / category)
+                    dest = dest_names.claim(entry.name)
+                    if dest != entry.name:
+                        renamed += 1
+                    out.write(json.dumps({
+                        "root": root,
+                        "src": entry.path,
+                        "dest": os.path.join(folder, category, dest),
+                        "category": category,
+                        "rule": rule,
+                        "size": st.st_size,
+                        "mtime_ns": st.st_mtime_ns,
+                    }, separators=(",", ":")) + "\n")
+                    planned += 1
+        except OSError as e:
+            print(f"[ERROR] Planning '{folder}' failed: {e}")
+    return planned, renamed
+
+
+def read_plan(fh: TextIO) -> Iterator[Dict]:
+    """Stream the entries of a plan; lines that are not entries are reported and skipped."""
+    for number, line in enumerate(fh, 1):
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+            if isinstance(entry, dict) and all(isinstance(entry.get(k), str) for k in ("root", "src", "dest")):
+                yield entry
+                continue
+        except ValueError:
+            pass
+        print(f"[WARN] Plan line {number} is not a move; skipped")
+
+
+class PlanExecutor:
+    """Carries out plan entries on a thread pool, one batch at a time.
+
+    An entry is skipped if its source changed (size or mtime) or vanished
+    since it was planned, or if something already took its destination.
+    """
+
+    def __init__(self, workers: int, journal: Optional[Journal] = None, quiet: bool = False) -> None:
+        self.workers = max(1, workers)
+        self.journal = journal
+        self.quiet = quiet
+        self.mover = Mover()
+        self.names = NameReserver()
+        self.counts = {"moved": 0, "skipped": 0, "failed": 0}
+
+    def run(self, entries: Iterator[Dict]) -> Tuple[int, int, int]:
+        """Apply every entry; returns (moved, skipped, failed)."""
+        with ThreadPoolExecutor(self.workers, thread_name_prefix="watcher-apply") as pool:
+            batch: List[Dict] = []
+            for entry in entries:
+                batch.append(entry)
+                if len(batch) >= PLAN_BATCH:
+                    self._run_batch(pool, batch)
+                    batch = []
+            if batch:
+                self._run_batch(pool, batch)
+        return self.counts["moved"], self.counts["skipped"], self.counts["failed"]
+
+    def _run_batch(self, pool: ThreadPoolExecutor, batch: List[Dict]) -> None:
+        # Category folders are created once per batch, not once per file
+        for folder in {os.path.dirname(e["dest"]) for e in batch}:
+            try:
+                ensure_directory(Path(folder))
+            except OSError as e:
+                print(f"[ERROR] Cannot create '{folder}': {e}")
+        for outcome in pool.map(self.apply, batch):
+            self.counts[outcome] += 1
+
+    def apply(self, entry: Dict) -> str:
+        """Carry out one entry; returns "moved", "skipped" or "failed"."""
+        src, dest = Path(entry["src"]), Path(entry["dest"])
+        try:
+            st = os.stat(src)
+        except FileNotFoundError:
+            return self._skip(src, "it is gone")
+        except OSError as e:
+            print(f"[ERROR] Cannot check '{src}': {e}")
+            return "failed"
+        if st.st_size != entry.get("size") or st.st_mtime_ns != entry.get("mtime_ns"):
+            return self._skip(src, "it changed since it was planned")
+        try:
+            # Claim the planned name the same way NameReserver does
+            fd = os.open(dest, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return self._skip(src, f"'{dest.name}' already exists")
+        except OSError as e:
+            print(f"[ERROR] Failed to move '{src.name}': {e}")
+            return "failed"
+        os.close(fd)
+        journal = self.journal
+        seq = journal.begin(src, dest, st.st_size, str(entry.get("rule", "plan"))) if journal is not None else None
+        try:
+            self.mover.move(Path(entry["root"]), src, dest)
+        except Exception as e:
+            if seq is not None:
+                journal.finish(seq, "abort")
+            self.names.release(dest)
+            print(f"[ERROR] Failed to move '{src.name}': {e}")
+            return "failed"
+        if seq is not None:
+            journal.finish(seq)
+        if not self.quiet:
+            print(f"[INFO] Moved: {src.name} -> {entry.get('category', dest.parent.name)}")
+        return "moved"
+
+    def _skip(self, src: Path, reason: str) -> str:
+        if not self.quiet:
+            print(f"[WARN] Skipped '{src}': {reason}")
+        return "skipped"
+
+
+def plan_handlers(args, config: Dict) -> List[CreatedHandler]:
+    """One unscheduled handler per folder, set up as --path or settings.json would watch it."""
+    from organizer import cli_rules, compile_rules_text, folder_options, resolve_temp_suffixes
+
+    suffixes = resolve_temp_suffixes(args.temp_suffix or config.get("temp_suffixes"))
+    sniffer = ContentSniffer() if args.sniff or config.get("sniff_content") else None
+    handlers: List[CreatedHandler] = []
+    if args.path:
+        rules = compile_rules(cli_rules(args))
+        for p in args.path:
+            root = Path(p).expanduser()
+            if not root.is_dir():
+                print(f"[ERROR] Path does not exist or is not a directory: {root}")
+                continue
+            handlers.append(CreatedHandler(root.resolve(), rules, args.unknown, args.quiet, sniffer=sniffer, recursive=args.recursive, max_depth=args.max_depth, include=args.include, exclude=args.exclude, temp_suffixes=suffixes))
+        return handlers
+    rules = compile_rules_text(str(config.get("rules_text", "") or ""))
+    for f in config.get("folders", []) or []:
+        root = Path(str(f.get("path", ""))).expanduser()
+        if not root.is_dir():
+            print(f"[WARN] Skipping folder that does not exist: {root}")
+            continue
+        handlers.append(CreatedHandler(root.resolve(), rules, str(f.get("unknown") or "Other"), bool(f.get("quiet", False)), sniffer=sniffer, temp_suffixes=suffixes, **folder_options(f)))
+    return handlers
+
+
+def run_plan_cli(args) -> None:
+    """--plan: write what organizing each folder would do, without touching anything."""
+    from organizer import load_config
+
+    to_stdout = args.plan == "-"
+    out = sys.stdout if to_stdout else None
+    # With the plan on stdout, logs go to stderr
+    with contextlib.redirect_stdout(sys.stderr) if to_stdout else contextlib.nullcontext():
+        handlers = plan_handlers(args, load_config())
+        try:
+            if out is None:
+                out = open(Path(args.plan).expanduser(), "w", encoding="utf-8")
+        except OSError as e:
+            print(f"[ERROR] Cannot write plan: {e}")
+            return
+        total = 0
+        try:
+            for handler in handlers:
+                planned, renamed = plan_root(handler, out)
+                total += planned
+                print(f"[INFO] Planned {planned} move(s) in '{handler.root}'" + (f"; {renamed} renamed to avoid a name already taken" if renamed else ""))
+        finally:
+            if to_stdout:
+                out.flush()
+            else:
+                out.close()
+        print(f"[INFO] {total} move(s) planned; nothing was moved" + ("" if to_stdout else f". Run with --apply {args.plan} to carry them out"))
+
+
+def run_apply_cli(args) -> None:
+    """--apply PLAN: carry out a plan written by --plan."""
+    from organizer import _cli_journal, load_config, resolve_workers
+
+    config = load_config()
+    workers = resolve_workers(args.workers if args.workers is not None else config.get("workers"))
+    path = _cli_journal(args, config)
+    journal = Journal(path) if path is not None else None
+    try:
+        with (sys.stdin if args.apply == "-" else open(Path(args.apply).expanduser(), encoding="utf-8")) as fh:
+            moved, skipped, failed = PlanExecutor(workers, journal, args.quiet).run(read_plan(fh))
+    except OSError as e:
+        print(f"[ERROR] Cannot read plan: {e}")
+        return
+    finally:
+        if journal is not None:
+            journal.close()
+    print(f"[INFO] Applied plan: {moved} moved, {skipped} skipped, {failed} failed")
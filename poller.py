@@ -0,0 +1,237 @@
+import heapq
+import os
+import threading
+import time
+from array import array
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from watchdog.events import FileCreatedEvent, FileDeletedEvent, FileMovedEvent, FileSystemEvent
+
+
+# Shortest wait between polls of a folder, used while changes keep arriving.
+POLL_MIN_SECONDS = 0.5
+# Default longest wait, reached after a run of passes that found nothing.
+POLL_MAX_SECONDS = 10.0
+# Factor the wait grows by after a pass that found nothing.
+POLL_BACKOFF = 1.5
+# A folder mtime this close to the scan that recorded it is not trusted: coarse
+# (1-2s) timestamps on SMB/FAT could hide a change made later in the same tick.
+MTIME_SLACK_NS = 2_000_000_000
+
+
+class DirSnapshot:
+    """One folder as last listed: name -> slot, with inodes in a flat array; plus the folder's own mtime."""
+
+    __slots__ = ("slots", "inodes", "dirs", "mtime_ns", "scanned_ns")
+
+    def __init__(self, path: str, st: os.stat_result) -> None:
+        # Listed after the stat, so a change made during the listing shows up next pass
+        self.mtime_ns = st.st_mtime_ns
+        self.scanned_ns = time.time_ns()
+        self.slots: Dict[str, int] = {}
+        self.inodes = array("Q")
+        self.dirs: Set[str] = set()
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    # d_ino and d_type come with the listing on POSIX: no stat per entry
+                    inode = entry.inode()
+                    if entry.is_dir(follow_symlinks=False):
+                        self.dirs.add(entry.name)
+                        continue
+                except OSError:
+                    continue
+                self.slots[entry.name] = len(self.inodes)
+                self.inodes.append(inode)
+
+    def unchanged(self, st: os.stat_result) -> bool:
+        """Whether the folder's entries can be assumed the same as when it was listed."""
+        return st.st_mtime_ns == self.mtime_ns and self.scanned_ns - self.mtime_ns > MTIME_SLACK_NS
+
+    def inode(self, name: str) -> Optional[int]:
+        slot = self.slots.get(name)
+        return self.inodes[slot] if slot is not None else None
+
+
+def diff(path: str, old: DirSnapshot, new: DirSnapshot) -> List[FileSystemEvent]:
+    """Events turning old into new: renames (same inode), then removals, then new files."""
+    gone = {name: ino for name, ino in ((n, old.inodes[s]) for n, s in old.slots.items()) if new.inode(name) != ino}
+    added = [name for name, slot in new.slots.items() if old.inode(name) != new.inodes[slot]]
+    events: List[FileSystemEvent] = []
+    # Some network and FUSE filesystems report inode 0; those are never paired up
+    by_inode = {ino: name for name, ino in gone.items() if ino}
+    created = []
+    for name in added:
+        ino = new.inode(name)
+        before = by_inode.pop(ino, None) if ino else None
+        if before is not None:
+            del gone[before]
+            events.append(FileMovedEvent(os.path.join(path, before), os.path.join(path, name)))
+        else:
+            created.append(name)
+    events.extend(FileDeletedEvent(os.path.join(path, name)) for name in gone)
+    events.extend(FileCreatedEvent(os.path.join(path, name)) for name in created)
+    return events
+
+
+class _PolledRoot:
+    def __init__(self, handler) -> None:
+        self.handler = handler
+        # Held for a pass; a final pass from remove() may overlap the poll thread
+        self.lock = threading.Lock()
+        self.snapshots: Dict[str, DirSnapshot] = {}
+        self.interval = POLL_MIN_SECONDS
+        # The first pass (taken by add) only records what is there; existing files are the sweep's job
+        self.baseline = True
+        self.passes = 0
+        self.skipped = 0
+
+
+class SnapshotPoller:
+    """Finds new, removed and renamed files by polling, for folders that deliver no OS events.
+
+    Each pass stats every known folder and lists only those whose mtime
+    changed, then diffs the listing against the folder's snapshot. Files
+    are never stat()ed here: the readiness tracker already checks the
+    ones it waits on. Events go to dispatch, the same router the native
+    observer feeds. The wait between passes drops to POLL_MIN_SECONDS when
+    a pass finds changes and grows towards the folder's poll interval
+    while nothing happens.
+    """
+
+    def __init__(self, dispatch: Callable[[FileSystemEvent], None]) -> None:
+        self.dispatch = dispatch
+        self._roots: Dict[str, _PolledRoot] = {}
+        self._due: List[Tuple[float, int, str]] = []
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="watcher-poll", daemon=True)
+        self._thread.start()
+
+    def add(self, handler) -> None:
+        """Start polling handler.root (or pick up its new settings).
+
+        The baseline listing is taken before this returns, so a file created
+        afterwards is reported even if a native watch on the root stops now.
+        """
+        key = str(handler.root)
+        with self._cond:
+            state = self._roots.get(key)
+            if state is not None:
+                state.handler = handler
+                return
+        state = _PolledRoot(handler)
+        try:
+            self._poll(key, state)
+        except Exception as e:
+            print(f"[ERROR] Polling '{key}' failed: {e}")
+        with self._cond:
+            if key in self._roots:
+                # Added twice at once; the first one stands
+                self._roots[key].handler = handler
+                return
+            self._roots[key] = state
+            self._push(key, time.monotonic() + state.interval)
+
+    def remove(self, root, final: bool = False) -> None:
+        """Stop polling root; with final, run one last pass first so nothing since the previous one is missed."""
+        with self._cond:
+            state = self._roots.pop(str(root), None)
+        if final and state is not None:
+            try:
+                with state.lock:
+                    self._poll(str(root), state)
+            except Exception as e:
+                print(f"[ERROR] Polling '{root}' failed: {e}")
+
+    def roots(self) -> int:
+        return len(self._roots)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Per-root poll state, for the metrics table."""
+        with self._cond:
+            return {key: {"interval_seconds": round(s.interval, 3), "folders": len(s.snapshots), "passes_total": s.passes, "skipped_folders_total": s.skipped} for key, s in self._roots.items()}
+
+    def _push(self, key: str, due: float) -> None:
+        self._seq += 1
+        heapq.heappush(self._due, (due, self._seq, key))
+        self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stopping and (not self._due or self._due[0][0] > time.monotonic()):
+                    self._cond.wait(self._due[0][0] - time.monotonic() if self._due else None)
+                if self._stopping:
+                    return
+                _, _, key = heapq.heappop(self._due)
+                state = self._roots.get(key)
+            if state is None:
+                # Removed
+                continue
+            try:
+                with state.lock:
+                    changed = self._poll(key, state)
+            except Exception as e:
+                print(f"[ERROR] Polling '{key}' failed: {e}")
+                changed = False
+            limit = max(POLL_MIN_SECONDS, state.handler.poll or POLL_MAX_SECONDS)
+            state.interval = POLL_MIN_SECONDS if changed else min(limit, state.interval * POLL_BACKOFF)
+            with self._cond:
+                if self._roots.get(key) is state:
+                    self._push(key, time.monotonic() + state.interval)
+
+    def _poll(self, root: str, state: _PolledRoot) -> bool:
+        """One pass over a root; True if anything changed."""
+        handler = state.handler
+        changed = False
+        seen: Set[str] = set()
+        pending: List[Tuple[str, int]] = [(root, 0)]
+        while pending:
+            folder, depth = pending.pop()
+            if not handler.active:
+                return False
+            seen.add(folder)
+            old = state.snapshots.get(folder)
+            try:
+                st = os.stat(folder)
+                if old is not None and old.unchanged(st):
+                    state.skipped += 1
+                    new = old
+                else:
+                    new = DirSnapshot(folder, st)
+            except OSError:
+                if folder == root:
+                    # Share unreachable: keep what we know, or every file would look new once it is back
+                    return False
+                # Removed; forgotten below
+                continue
+            if new is not old:
+                state.snapshots[folder] = new
+                if old is not None:
+                    events = diff(folder, old, new)
+                elif not state.baseline:
+                    # A folder that appeared since the last pass: all its files are new
+                    events = [FileCreatedEvent(os.path.join(folder, name)) for name in new.slots]
+                else:
+                    events = []
+                for event in events:
+                    changed = True
+                    self.dispatch(event)
+            for name in new.dirs:
+                if handler.descends(name, depth + 1):
+                    pending.append((os.path.join(folder, name), depth + 1))
+        for folder in [f for f in state.snapshots if f not in seen]:
+            del state.snapshots[folder]
+        state.baseline = False
+        state.passes += 1
+        return changed
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        self._thread.join(timeout=timeout)
@@ -0,0 +1,355 @@
+import math
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from metrics import DEFAULT_STATS_INTERVAL, MetricsServer, StatsDumper, merge_prometheus, merge_snapshots
+from journal import shard_path
+
+
+# Seconds between stats reports from each worker process.
+SHARD_REPORT_SECONDS = 1.0
+# First wait before restarting a crashed worker; doubled per crash up to RESTART_BACKOFF_MAX.
+RESTART_BACKOFF = 1.0
+RESTART_BACKOFF_MAX = 60.0
+# A worker that ran this long before crashing restarts after RESTART_BACKOFF again.
+RESTART_RESET_SECONDS = 300.0
+# Seconds a worker gets to finish its queued moves on shutdown.
+SHARD_STOP_SECONDS = 10.0
+
+
+def resolve_shards(value: Optional[object]) -> int:
+    """Coerce a shard count; 0 (or nothing) means one per CPU core."""
+    try:
+        n = int(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        n = 0
+    return n if n > 0 else (os.cpu_count() or 1)
+
+
+def folder_key(folder: Dict) -> str:
+    return str(Path(str(folder.get("path", ""))).expanduser())
+
+
+def assign(keys: List[str], shards: int, previous: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """Spread folder keys over shards by count, keeping each where it was unless its shard is over its share.
+
+    Sticky so that a config edit moves as few roots as possible: a moved
+    root is briefly unwatched and has to be swept by its new worker.
+    """
+    previous = previous or {}
+    cap = max(1, math.ceil(len(keys) / shards))
+    result: Dict[str, int] = {}
+    counts = [0] * shards
+    unplaced: List[str] = []
+    for key in keys:
+        shard = previous.get(key)
+        if shard is not None and shard < shards and counts[shard] < cap:
+            result[key] = shard
+            counts[shard] += 1
+        else:
+            unplaced.append(key)
+    for key in unplaced:
+        shard = counts.index(min(counts))
+        result[key] = shard
+        counts[shard] += 1
+    return result
+
+
+class _LogSink:
+    """stdout/stderr of a worker: complete lines go to the supervisor, which prints them."""
+
+    def __init__(self, conn: Connection, lock: threading.Lock) -> None:
+        self._conn = conn
+        self._lock = lock
+        self._buffer = ""
+
+    def write(self, text: str) -> int:
+        with self._lock:
+            self._buffer += text
+            *lines, self._buffer = self._buffer.split("\n")
+            for line in lines:
+                try:
+                    self._conn.send(("log", line))
+                except (OSError, ValueError):
+                    # Supervisor gone; the worker exits on its next poll
+                    pass
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def _shard_main(index: int, conn: Connection, workers: int, settle: float, journal: Optional[str]) -> None:
+    """Worker process: an Organizer for the folders the supervisor sends, reporting stats back."""
+    lock = threading.Lock()
+    sys.stdout = sys.stderr = _LogSink(conn, lock)  # type: ignore[assignment]
+    # Ctrl+C reaches the whole process group; the supervisor decides when workers stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    from organizer import Organizer
+
+    organizer = Organizer(workers, settle)
+    if journal is not None:
+        organizer.open_journal(shard_path(Path(journal), index))
+    next_report = 0.0
+    try:
+        while True:
+            if conn.poll(max(0.0, next_report - time.monotonic())):
+                message = conn.recv()
+                if message[0] == "stop":
+                    break
+                if message[0] == "apply":
+                    _, settings, catch_up = message
+                    before = {str(r) for r in organizer.roots}
+                    organizer.apply_settings(settings)
+                    swept = bool(settings.get("sweep", False))
+                    for key in catch_up:
+                        root = Path(key).expanduser().resolve()
+                        handler = organizer.router.get(root)
+                        # apply_settings already swept roots that are new here when sweep is on
+                        if handler is not None and not (swept and str(root) not in before):
+                            organizer.sweep(handler)
+            if time.monotonic() >= next_report:
+                next_report = time.monotonic() + SHARD_REPORT_SECONDS
+                with lock:
+                    conn.send(("stats", organizer.metrics.snapshot(), organizer.metrics.prometheus()))
+    except (EOFError, OSError):
+        # Supervisor gone
+        pass
+    finally:
+        organizer.stop()
+        organizer.join(timeout=SHARD_STOP_SECONDS)
+
+
+class _Shard:
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.process: Optional[multiprocessing.process.BaseProcess] = None
+        self.conn: Optional[Connection] = None
+        self.started = 0.0
+        self.restarts = 0
+        self.backoff = RESTART_BACKOFF
+        # monotonic time of a pending restart
+        self.restart_at: Optional[float] = None
+        self.snapshot: Optional[Dict] = None
+        self.prometheus = ""
+
+
+class ShardStats:
+    """Metrics-compatible view (snapshot/prometheus) over every worker's last report."""
+
+    def __init__(self, supervisor: "ShardSupervisor") -> None:
+        self.supervisor = supervisor
+
+    def snapshot(self) -> Dict:
+        shards = self.supervisor.shards
+        merged = merge_snapshots({str(s.index): s.snapshot for s in shards if s.snapshot is not None})
+        merged["totals"].setdefault("moved", 0)
+        roots = self.supervisor.assigned()
+        merged["shards"] = {
+            str(s.index): {
+                "pid": s.process.pid if s.process is not None else None,
+                "alive": s.process is not None and s.process.is_alive(),
+                "restarts": s.restarts,
+                "roots": sum(1 for shard in roots.values() if shard == s.index),
+            }
+            for s in shards
+        }
+        return merged
+
+    def prometheus(self) -> str:
+        shards = self.supervisor.shards
+        lines = [merge_prometheus({str(s.index): s.prometheus for s in shards if s.prometheus}).rstrip("\n")]
+        lines.append("# HELP watcher_shard_up Whether the worker process is running.")
+        lines.append("# TYPE watcher_shard_up gauge")
+        for s in shards:
+            lines.append(f'watcher_shard_up{{shard="{s.index}"}} {int(s.process is not None and s.process.is_alive())}')
+        lines.append("# HELP watcher_shard_restarts_total Times the worker process was restarted after it died.")
+        lines.append("# TYPE watcher_shard_restarts_total counter")
+        for s in shards:
+            lines.append(f'watcher_shard_restarts_total{{shard="{s.index}"}} {s.restarts}')
+        return "\n".join(line for line in lines if line) + "\n"
+
+
+class ShardSupervisor:
+    """Runs the folders of settings.json in N worker processes, one Organizer each.
+
+    Restarts a worker that dies (with backoff) and has it sweep its folders
+    for files that arrived meanwhile; rebalances folders when settings
+    change; prints the workers' logs and merges their stats.
+    """
+
+    def __init__(self, shards: int, workers: int, settle: float, journal: Optional[Path] = None) -> None:
+        # spawn, not fork: the supervisor runs threads, and workers start their own observers
+        self._ctx = multiprocessing.get_context("spawn")
+        self.workers = workers
+        self.settle = settle
+        self.journal = journal
+        self.shards = [_Shard(i) for i in range(shards)]
+        self.stats = ShardStats(self)
+        self._settings: Dict = {}
+        self._assignment: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self._stopping = threading.Event()
+        self._exporters: List[object] = []
+        self._pump = threading.Thread(target=self._run_pump, name="watcher-shard-logs", daemon=True)
+
+    def assigned(self) -> Dict[str, int]:
+        return self._assignment
+
+    def start(self, settings: Dict) -> None:
+        with self._lock:
+            for shard in self.shards:
+                self._spawn(shard)
+            self._pump.start()
+            self.apply_settings(settings, initial=True)
+
+    def _spawn(self, shard: _Shard) -> None:
+        ours, theirs = self._ctx.Pipe()
+        journal = str(self.journal) if self.journal is not None else None
+        process = self._ctx.Process(target=_shard_main, args=(shard.index, theirs, self.workers, self.settle, journal), name=f"watcher-shard-{shard.index}", daemon=True)
+        process.start()
+        theirs.close()
+        shard.process, shard.conn = process, ours
+        shard.started = time.monotonic()
+        shard.restart_at = None
+
+    def _settings_for(self, index: int) -> Dict:
+        folders = [f for f in self._settings.get("folders", []) or [] if self._assignment.get(folder_key(f)) == index]
+        return {**self._settings, "folders": folders}
+
+    def _send(self, shard: _Shard, message: Tuple) -> None:
+        try:
+            if shard.conn is not None:
+                shard.conn.send(message)
+        except (OSError, ValueError):
+            # Died; the monitor restarts it with the current settings
+            pass
+
+    def apply_settings(self, settings: Dict, initial: bool = False) -> None:
+        """Rebalance folders over the workers and send each its part of settings."""
+        with self._lock:
+            keys = list(dict.fromkeys(folder_key(f) for f in settings.get("folders", []) or []))
+            old = self._assignment
+            self._settings = settings
+            self._assignment = assign(keys, len(self.shards), old)
+            moved = [k for k, shard in self._assignment.items() if k in old and old[k] != shard]
+            if moved:
+                print(f"[INFO] Rebalanced {len(moved)} folder(s) across {len(self.shards)} shards")
+            catch_up: Dict[int, List[str]] = {}
+            if not initial:
+                for key in moved:
+                    catch_up.setdefault(self._assignment[key], []).append(key)
+            # Shards losing a root unwatch it before the new owner is told to watch it
+            losing = {old[k] for k in moved}
+            for shard in sorted(self.shards, key=lambda s: s.index not in losing):
+                self._send(shard, ("apply", self._settings_for(shard.index), catch_up.get(shard.index, [])))
+
+    def _run_pump(self) -> None:
+        # Reads logs and stats from every worker; a closed pipe means the worker died.
+        # Never takes the lock, so a worker blocked on a full pipe is always drained.
+        while True:
+            conns = {s.conn: s for s in self.shards if s.conn is not None}
+            if not conns:
+                if self._stopping.is_set():
+                    return
+                time.sleep(0.2)
+                continue
+            for conn in wait(list(conns), timeout=0.5):
+                shard = conns[conn]
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    # Only this thread closes pipes; check() respawns once it is gone
+                    shard.conn = None
+                    conn.close()
+                    continue
+                if message[0] == "log":
+                    level, sep, rest = message[1].partition("] ")
+                    print(f"{level}{sep}[shard {shard.index}] {rest}" if sep and level.startswith("[") else f"[shard {shard.index}] {message[1]}")
+                elif message[0] == "stats":
+                    shard.snapshot, shard.prometheus = message[1], message[2]
+
+    def check(self) -> None:
+        """Restart workers that died, once their backoff has passed."""
+        now = time.monotonic()
+        with self._lock:
+            if self._stopping.is_set():
+                return
+            for shard in self.shards:
+                process = shard.process
+                if process is None or process.is_alive():
+                    continue
+                if shard.restart_at is None:
+                    if now - shard.started >= RESTART_RESET_SECONDS:
+                        shard.backoff = RESTART_BACKOFF
+                    print(f"[ERROR] Shard {shard.index} exited with code {process.exitcode}; restarting in {shard.backoff:g}s")
+                    shard.restart_at = now + shard.backoff
+                    shard.backoff = min(RESTART_BACKOFF_MAX, shard.backoff * 2)
+                    shard.snapshot, shard.prometheus = None, ""
+                elif now >= shard.restart_at and shard.conn is None:
+                    shard.restarts += 1
+                    self._spawn(shard)
+                    # Files may have arrived while nobody watched
+                    roots = [k for k, i in self._assignment.items() if i == shard.index]
+                    self._send(shard, ("apply", self._settings_for(shard.index), roots))
+
+    def serve_metrics(self, port: int, host: str = "127.0.0.1") -> None:
+        """Expose the merged /metrics and /stats of every worker."""
+        self._exporters.append(MetricsServer(self.stats, port, host))  # type: ignore[arg-type]
+
+    def dump_stats(self, path: Path, interval: float = DEFAULT_STATS_INTERVAL) -> None:
+        self._exporters.append(StatsDumper(self.stats, path, interval))  # type: ignore[arg-type]
+
+    def stop(self) -> None:
+        """Let every worker finish its queued moves, then end it."""
+        with self._lock:
+            self._stopping.set()
+            for shard in self.shards:
+                self._send(shard, ("stop",))
+        deadline = time.monotonic() + SHARD_STOP_SECONDS + 5
+        for shard in self.shards:
+            if shard.process is None:
+                continue
+            shard.process.join(max(0.1, deadline - time.monotonic()))
+            if shard.process.is_alive():
+                print(f"[WARN] Shard {shard.index} did not stop in time; terminating it")
+                shard.process.terminate()
+                shard.process.join(5)
+        self._pump.join(timeout=5)
+        for exporter in self._exporters:
+            exporter.stop()  # type: ignore[attr-defined]
+        self._exporters = []
+
+
+def run_shards_cli(args) -> None:
+    """--shards: run settings.json across worker processes, reloading it when it changes."""
+    from organizer import CONFIG_PATH, ConfigWatcher, _cli_journal, _start_cli_exporters, cli_overrides, load_config, resolve_settle, resolve_workers
+
+    config = load_config()
+    # workers is per process, so N shards move up to N * workers files at once
+    workers = resolve_workers(args.workers if args.workers is not None else config.get("workers"))
+    settle = resolve_settle(args.settle if args.settle is not None else config.get("settle_seconds"))
+    shards = resolve_shards(args.shards)
+    supervisor = ShardSupervisor(shards, workers, settle, _cli_journal(args, config))
+    print(f"[INFO] Starting {shards} shard(s) with {workers} worker thread(s) each")
+    supervisor.start(cli_overrides(args, config))
+    _start_cli_exporters(supervisor, args, config)
+    watcher = ConfigWatcher(CONFIG_PATH, lambda settings: supervisor.apply_settings(cli_overrides(args, settings)))
+    stopping = threading.Event()
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, lambda *_: watcher.reload())
+    signal.signal(signal.SIGTERM, lambda *_: stopping.set())
+    try:
+        while not stopping.wait(0.5):
+            supervisor.check()
+    except KeyboardInterrupt:
+        pass
+    watcher.stop()
+    supervisor.stop()
@@ -0,0 +1,141 @@
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+# Bytes read from the start of a file; every signature below fits in it.
+SNIFF_BYTES = 4096
+# Suffixes that say nothing about the content ("" is no suffix at all).
+SNIFF_EXTENSIONS = frozenset({"", "bin", "dat"})
+# Results remembered by (device, inode, size, mtime).
+SNIFF_CACHE_SIZE = 8192
+
+# (offset, magic bytes, extension). The extension is mapped onto a category by the rules,
+# so sniffed files land wherever a correctly named file would.
+SIGNATURES: List[Tuple[int, bytes, str]] = [
+    (0, b"%PDF-", "pdf"),
+    (0, b"\x89PNG\r\n\x1a\n", "png"),
+    (0, b"\xff\xd8\xff", "jpg"),
+    (0, b"GIF87a", "gif"),
+    (0, b"GIF89a", "gif"),
+    (0, b"II*\x00", "tiff"),
+    (0, b"MM\x00*", "tiff"),
+    (0, b"BM", "bmp"),
+    (0, b"RIFF", "riff"),
+    (0, b"PK\x03\x04", "zip"),
+    (0, b"Rar!\x1a\x07", "rar"),
+    (0, b"7z\xbc\xaf\x27\x1c", "7z"),
+    (0, b"\x1f\x8b", "gz"),
+    (0, b"BZh", "bz2"),
+    (257, b"ustar", "tar"),
+    (0, b"ID3", "mp3"),
+    (0, b"\xff\xfb", "mp3"),
+    (0, b"\xff\xf3", "mp3"),
+    (0, b"\xff\xf2", "mp3"),
+    (0, b"fLaC", "flac"),
+    (0, b"OggS", "ogg"),
+    (4, b"ftyp", "mp4"),
+    (0, b"\x1aE\xdf\xa3", "mkv"),
+    (0, b"FLV\x01", "flv"),
+    (0, b"MZ", "exe"),
+    (0, b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", "doc"),
+    (0, b"{\\rtf", "rtf"),
+    (0, b"\x00\x01\x00\x00\x00", "ttf"),
+    (0, b"OTTO", "otf"),
+    (0, b"wOFF", "woff"),
+    (0, b"wOF2", "woff2"),
+    (0, b"<?xml", "xml"),
+    (0, b"<svg", "svg"),
+    (0, b"<!DOCTYPE html", "html"),
+    (0, b"<!doctype html", "html"),
+    (0, b"<html", "html"),
+    (0, b"#!", "script"),
+]
+
+# Containers whose real type is decided by what follows the magic bytes
+_RIFF_TYPES = {b"WEBP": "webp", b"WAVE": "wav", b"AVI ": "avi"}
+_FTYP_BRANDS = {b"M4A ": "m4a", b"M4V ": "m4v", b"qt  ": "mov"}
+_ZIP_MEMBERS = ((b"word/", "docx"), (b"xl/", "xlsx"), (b"ppt/", "pptx"), (b"AndroidManifest.xml", "apk"))
+_SCRIPT_TYPES = ((b"python", "py"), (b"bash", "sh"), (b"/sh", "sh"), (b"node", "js"), (b"ruby", "rb"), (b"php", "php"))
+
+
+def _refine(ext: str, head: bytes) -> Optional[str]:
+    if ext == "riff":
+        return _RIFF_TYPES.get(head[8:12])
+    if ext == "mp4":
+        return _FTYP_BRANDS.get(head[8:12], "mp4")
+    if ext == "mkv":
+        return "webm" if b"webm" in head[:64] else "mkv"
+    if ext == "zip":
+        for marker, office in _ZIP_MEMBERS:
+            if marker in head:
+                return office
+        return "zip"
+    if ext == "script":
+        line = head.split(b"\n", 1)[0]
+        for marker, script in _SCRIPT_TYPES:
+            if marker in line:
+                return script
+        return None
+    return ext
+
+
+class ContentSniffer:
+    """Guesses a file's extension from its first bytes; results are cached per file version."""
+
+    def __init__(self, signatures: Optional[List[Tuple[int, bytes, str]]] = None) -> None:
+        # Offset-0 signatures bucketed by first byte, longest first; the rest checked in order
+        self._by_first: Dict[int, List[Tuple[bytes, str]]] = {}
+        self._at_offset: List[Tuple[int, bytes, str]] = []
+        for offset, magic, ext in signatures or SIGNATURES:
+            if offset == 0:
+                self._by_first.setdefault(magic[0], []).append((magic, ext))
+            else:
+                self._at_offset.append((offset, magic, ext))
+        for bucket in self._by_first.values():
+            bucket.sort(key=lambda item: -len(item[0]))
+        self._cache: "OrderedDict[Tuple[int, int, int, int], Optional[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def match(self, head: bytes) -> Optional[str]:
+        """Extension for these leading bytes, or None if nothing matches."""
+        if not head:
+            return None
+        for magic, ext in self._by_first.get(head[0], ()):
+            if head.startswith(magic):
+                return _refine(ext, head)
+        for offset, magic, ext in self._at_offset:
+            if head[offset:offset + len(magic)] == magic:
+                return _refine(ext, head)
+        return None
+
+    def sniff(self, path: Path) -> Optional[str]:
+        """Extension for the file at path; reads at most SNIFF_BYTES, once per file version."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        key = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        try:
+            with open(path, "rb") as fh:
+                head = fh.read(SNIFF_BYTES)
+        except OSError:
+            return None
+        ext = self.match(head)
+        with self._lock:
+            self._cache[key] = ext
+            if len(self._cache) > SNIFF_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return ext
+
+
+def needs_sniffing(filename: str) -> bool:
+    """True for names whose suffix does not tell us the content."""
+    suffix = Path(filename.lstrip(".")).suffix
+    return suffix[1:].lower() in SNIFF_EXTENSIONS
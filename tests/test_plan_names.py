@@ -0,0 +1,36 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from organizer import NameReserver  # noqa: E402
+from plan import PlannedNames  # noqa: E402
+
+
+CASES = [
+    # (names already in the category folder, names claimed in order); a plan
+    # claims each name once, as they come from one source folder
+    ([], ["report.pdf", "c.txt"]),
+    (["report (3).pdf"], ["report.pdf", "report (3).pdf"]),
+    (["c (2).txt"], ["c.txt"]),
+    (["c.txt", "c (2).txt"], ["c.txt", "c (1).txt", "c (3).txt"]),
+    (["a.tar.gz", "a.tar (1).gz"], ["a.tar.gz"]),
+    (["x.jpg", "x (1).jpg", "x (5).jpg"], ["x (1).jpg", "x.jpg", "x (6).jpg"]),
+]
+
+
+def _tree(base: Path, existing):
+    base.mkdir(parents=True)
+    for name in existing:
+        (base / name).write_bytes(b"x")
+    return base
+
+
+def test_planned_names_match_live_claims(tmp_path):
+    for i, (existing, claims) in enumerate(CASES):
+        planned_dir = _tree(tmp_path / f"plan{i}", existing)
+        live_dir = _tree(tmp_path / f"live{i}", existing)
+        planner, reserver = PlannedNames(planned_dir), NameReserver()
+        planned = [planner.claim(name) for name in claims]
+        live = [reserver.claim(live_dir, name).name for name in claims]
+        assert planned == live, (existing, claims)